@@ -9,7 +9,7 @@ const search = createCustomServiceCall(
   },
   async ({ client, input, utils }) => {
     const res = await client.post('/job-descriptions/search/', utils.toApi(input))
-    return utils.fromApi(res.data)
+    return utils.fromApi(res.data.results)
   },
 )
 
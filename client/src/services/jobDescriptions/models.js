@@ -12,7 +12,7 @@ export const jobDescriptionChunkShape = {
   jobDescriptionId: z.string(),
   chunk: z.string(),
   token_count: z.number(),
-  embedding: z.array(z.number()),
+  embedding: z.array(z.number()).optional(),
 }
 
 export const jobDescriptionSearchResultShape = {
@@ -3,4 +3,5 @@
 cd /app
 
 python3 server/manage.py migrate --no-input
+python3 server/manage.py createcachetable
 python3 server/manage.py create_test_data
@@ -0,0 +1,22 @@
+"""
+ASGI config for vector_demonstration project.
+
+It exposes the ASGI callable as a module-level variable named ``application``. Serve it with an ASGI server
+(e.g. uvicorn) to run the async search view on the event loop, see server/README.md.
+
+For more information on this file, see
+https://docs.djangoproject.com/en/3.2/howto/deployment/asgi/
+"""
+
+import os
+
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vector_demonstration.settings")
+
+application = get_asgi_application()
+
+# Load the encoder at boot rather than on the first request. Not in AppConfig.ready(), which management commands run too.
+from vector_demonstration.core.encoders import warm_up  # noqa: E402
+
+warm_up()
@@ -0,0 +1,49 @@
+from asgiref.local import Local
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django_currentuser import middleware as currentuser_middleware
+from whitenoise import middleware as whitenoise_middleware
+
+
+class AsyncCapableMixin:
+    """Lets a sync-only middleware run on the event loop when served through ASGI.
+
+    Django 3.2 runs sync-only middleware, and everything inside it, in a single thread shared by the whole process,
+    so one sync-only middleware is enough to serve async views one request at a time.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response, *args, **kwargs):
+        super().__init__(get_response, *args, **kwargs)
+        if iscoroutinefunction(get_response):
+            # Marks the instance as a coroutine function for the middleware around it, like Django's MiddlewareMixin
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self.get_response):
+            return self.__acall__(request)
+        return super().__call__(request)
+
+    async def __acall__(self, request):
+        return await self.get_response(request)
+
+
+class WhiteNoiseMiddleware(AsyncCapableMixin, whitenoise_middleware.WhiteNoiseMiddleware):
+    async def __acall__(self, request):
+        # Static files are served from the event loop. They are only served from Django itself in development.
+        response = self.process_request(request)
+        if response is None:
+            response = await self.get_response(request)
+        return response
+
+
+# The current user is kept in a context local rather than a thread local: concurrent requests served through ASGI
+# share the event loop's thread but each run in their own context, which sync views run in executor threads inherit
+currentuser_middleware._thread_locals = Local()
+
+
+class ThreadLocalUserMiddleware(AsyncCapableMixin, currentuser_middleware.ThreadLocalUserMiddleware):
+    async def __acall__(self, request):
+        currentuser_middleware._do_set_current_user(lambda self: getattr(request, "user", None))
+        return await self.get_response(request)
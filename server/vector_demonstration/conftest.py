@@ -1,6 +1,34 @@
+from importlib import import_module
+
 import pytest
+from django.core.cache import cache
+from django.db import connection
 
+from vector_demonstration.core.batching import reset_encoder_batcher
+from vector_demonstration.core.caching import get_query_embedding_cache, ranking_flights
+from vector_demonstration.core.metrics import clear_metrics
 from vector_demonstration.core.models import User
+from vector_demonstration.core.search import reset_search_engines
+
+
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup, django_db_blocker):
+    """Tests run without migrations, so create the database objects only migrations define."""
+    search_vector_migration = import_module("vector_demonstration.core.migrations.0010_jobdescription_search_vector")
+    with django_db_blocker.unblock(), connection.cursor() as cursor:
+        cursor.execute(search_vector_migration.CREATE_TRIGGER_SQL)
+
+
+@pytest.fixture(autouse=True)
+def clear_search_caches():
+    """Process-wide search caches must not leak results between tests."""
+    get_query_embedding_cache().clear()
+    ranking_flights.clear()
+    cache.clear()
+    reset_search_engines()
+    # Recreated with the test's settings
+    reset_encoder_batcher()
+    clear_metrics()
 
 
 @pytest.fixture
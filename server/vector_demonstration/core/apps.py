@@ -7,6 +7,10 @@ class CoreConfig(AppConfig):
     def ready(self) -> None:
         # this import is required to register signals after the app is initialized
         # https://docs.djangoproject.com/en/4.1/topics/signals/
-        from vector_demonstration.core.signals import create_auth_token_add_permissions  # noqa
+        from vector_demonstration.core.signals import (  # noqa
+            create_auth_token_add_permissions,
+            invalidate_embeddings,
+            invalidate_search_results,
+        )
 
         return super().ready()
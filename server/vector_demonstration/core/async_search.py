@@ -0,0 +1,131 @@
+"""Search for async views: the event loop only awaits, encoding and database queries run in bounded executors.
+
+Django 3.2's ORM and psycopg2 are synchronous, so database queries (and cache lookups) run in a pool of
+`SEARCH_DATABASE_WORKERS` threads, each keeping its own persistent connection like a request thread would. Queries
+are encoded by the encoder batcher's own workers, see `core/batching.py`, so a burst of slow encodes can't starve
+searches whose embedding is already cached.
+"""
+
+import asyncio
+import contextvars
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
+
+from django.conf import settings
+from django.db import close_old_connections
+
+from .batching import get_encoder_batcher
+from .caching import (
+    compute_ranking,
+    get_cached_search_page,
+    get_query_embedding_cache,
+    get_ranking,
+    get_ranking_key,
+    ranking_flights,
+)
+from .encoders import get_model_id
+from .metrics import get_current_timings, timed
+from .models import JobDescription
+from .search import build_search_results
+from .serializers import JobDescriptionSearchResultsSerializer, SearchResultsFormatSerializer
+
+logger = logging.getLogger(__name__)
+
+_database_executor = None
+_lock = threading.Lock()
+
+
+def get_database_executor():
+    """Created on first use and shared by every request in the process."""
+    global _database_executor
+    with _lock:
+        if _database_executor is None:
+            logger.info("Starting database executor")
+            _database_executor = ThreadPoolExecutor(max_workers=settings.SEARCH_DATABASE_WORKERS, thread_name_prefix="search-database")
+        return _database_executor
+
+
+def shutdown_executors(wait=True):
+    global _database_executor
+    with _lock:
+        executor, _database_executor = _database_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
+
+
+def call_with_connection(func, *args, **kwargs):
+    """Call `func` the way Django handles a request, closing connections that errored or outlived CONN_MAX_AGE.
+
+    Queries are counted in the timings of the request, if instrumented, see `core/metrics.py`.
+    """
+    close_old_connections()
+    timings = get_current_timings()
+    try:
+        with timings.count_queries() if timings is not None else nullcontext():
+            return func(*args, **kwargs)
+    finally:
+        close_old_connections()
+
+
+async def run_in_database_executor(func, *args, **kwargs):
+    # In a copy of the caller's context, like `asyncio.to_thread`, so stages are timed for the current request
+    loop = asyncio.get_running_loop()
+    call = partial(contextvars.copy_context().run, call_with_connection, func, *args, **kwargs)
+    return await loop.run_in_executor(get_database_executor(), call)
+
+
+async def encode_query(query):
+    """Like `JobDescription.encode_query`, without holding a thread while the query waits for its batch."""
+    query_embedding_cache = get_query_embedding_cache()
+    with timed("encode"):
+        embedding = await run_in_database_executor(query_embedding_cache.get, query, get_model_id())
+        if embedding is None:
+            embedding = await asyncio.wrap_future(get_encoder_batcher().submit(query))
+            embedding = await run_in_database_executor(query_embedding_cache.set, query, get_model_id(), embedding)
+    return embedding
+
+
+def get_cached_ranking(search_params):
+    key = get_ranking_key(search_params)
+    return key, get_ranking(key)
+
+
+async def rank(search_params):
+    """Like `caching.get_cached_ranking(search_params, lambda: JobDescription.rank(**search_params))`.
+
+    The query is only encoded when the ranking isn't cached, and only by the first of identical searches in progress.
+    """
+    key, hits = await run_in_database_executor(get_cached_ranking, search_params)
+    if hits is not None:
+        return key, hits
+
+    future, is_leader = ranking_flights.join(key)
+    if not is_leader:
+        return key, await asyncio.wrap_future(future)
+    try:
+        query_embedding = await encode_query(search_params["query"])
+        compute = partial(JobDescription.rank, query_embedding=query_embedding, **search_params)
+        hits = await run_in_database_executor(compute_ranking, key, compute)
+    except BaseException as exc:
+        ranking_flights.finish(key, future, exception=exc)
+        raise
+    ranking_flights.finish(key, future, result=hits)
+    return key, hits
+
+
+def serialize_page(ranking_key, page, offset, page_size, response_format):
+    def serialize():
+        results = build_search_results(page, with_embeddings=SearchResultsFormatSerializer.includes_embeddings(response_format))
+        with timed("serialize"):
+            return JobDescriptionSearchResultsSerializer(results, many=True, context={"response_format": response_format}).data
+
+    response_format_key = SearchResultsFormatSerializer.get_key(response_format)
+    return get_cached_search_page(ranking_key, offset, page_size, serialize, response_format_key=response_format_key)
+
+
+async def get_page(ranking_key, page, offset, page_size, response_format):
+    """The serialized results of a page of hits, see `get_cached_search_page`."""
+    return await run_in_database_executor(serialize_page, ranking_key, page, offset, page_size, response_format)
@@ -0,0 +1,189 @@
+"""Dynamic micro-batching of query encoding.
+
+Concurrent searches each need one query encoded, and the model encodes a batch of queries in little more time
+than a single one. `EncoderBatcher` collects the queries submitted by every thread (and the async search view)
+into batches, and encodes each batch with one model call in the encoder executor.
+"""
+
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial
+
+import django
+from django.conf import settings
+
+from . import encoders
+
+PendingQuery = namedtuple("PendingQuery", ["query", "future", "submitted_at"])
+
+logger = logging.getLogger(__name__)
+
+
+class EncoderBatcher:
+    """Encodes queries submitted concurrently in shared batches.
+
+    A dispatcher thread takes the oldest pending query and waits for a free worker of the executor returned by
+    `create_executor`, then keeps collecting queries until `max_batch_size` are pending or the oldest one has
+    waited `max_wait` seconds, and hands the batch to the worker. While every worker is busy queries keep
+    queueing, so batches grow with load even when `max_wait` is 0.
+    """
+
+    def __init__(self, encode_many, create_executor, workers, max_batch_size, max_wait):
+        self.encode_many = encode_many
+        self.create_executor = create_executor
+        self.executor = None
+        self.workers = workers
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self._queue = None
+        self._workers = None
+        self._lock = threading.Lock()
+        self._dispatcher = None
+        self._pid = None
+        self.batches = 0
+        self.queries = 0
+        self.batch_sizes = Counter()
+        self.queue_delay_seconds = 0.0
+        self.max_queue_delay_seconds = 0.0
+
+    def submit(self, query):
+        """Queue `query` for encoding, returns a future of its embedding."""
+        future = Future()
+        self._ensure_dispatcher()
+        self._queue.put(PendingQuery(query, future, time.monotonic()))
+        return future
+
+    def encode(self, query):
+        return self.submit(query).result()
+
+    def _ensure_dispatcher(self):
+        with self._lock:
+            # Threads don't survive forks, e.g. of a preloaded app into gunicorn workers: the child gets its own
+            # executor, whose workers the inherited one no longer has, and its own queue
+            if self._dispatcher is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self.executor = self.create_executor()
+                self._queue = queue.SimpleQueue()
+                self._workers = threading.BoundedSemaphore(self.workers)
+                self._dispatcher = threading.Thread(target=self._dispatch, name="encoder-batcher", daemon=True)
+                self._dispatcher.start()
+
+    def _dispatch(self):
+        while True:
+            batch = [self._queue.get()]
+            if batch[0] is None:
+                return
+            self._workers.acquire()
+            deadline = batch[0].submitted_at + self.max_wait
+            while len(batch) < self.max_batch_size:
+                try:
+                    pending = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if pending is None:
+                    # Shut down once this batch is handed over
+                    self._queue.put(None)
+                    break
+                batch.append(pending)
+
+            dispatched_at = time.monotonic()
+            try:
+                encoded = self.executor.submit(self.encode_many, [pending.query for pending in batch])
+            except Exception as exc:
+                # The executor was shut down
+                self._workers.release()
+                for pending in batch:
+                    pending.future.set_exception(exc)
+                continue
+            encoded.add_done_callback(partial(self._complete, batch, dispatched_at))
+
+    def _complete(self, batch, dispatched_at, encoded):
+        self._workers.release()
+        try:
+            embeddings = encoded.result()
+        except Exception as exc:
+            for pending in batch:
+                pending.future.set_exception(exc)
+        else:
+            for pending, embedding in zip(batch, embeddings):
+                pending.future.set_result(embedding)
+
+        queue_delays = [dispatched_at - pending.submitted_at for pending in batch]
+        with self._lock:
+            self.batches += 1
+            self.queries += len(batch)
+            self.batch_sizes[len(batch)] += 1
+            self.queue_delay_seconds += sum(queue_delays)
+            self.max_queue_delay_seconds = max(self.max_queue_delay_seconds, *queue_delays)
+        logger.debug(f"Encoded a batch of {len(batch)} queries, queued for up to {max(queue_delays) * 1000:.1f} ms")
+
+    def stats(self):
+        """Batch sizes and queue delays, i.e. the time between submitting a query and its batch being encoded."""
+        with self._lock:
+            return {
+                "batches": self.batches,
+                "queries": self.queries,
+                "batch_sizes": dict(sorted(self.batch_sizes.items())),
+                "mean_batch_size": self.queries / self.batches if self.batches else 0,
+                "mean_queue_delay_ms": self.queue_delay_seconds / self.queries * 1000 if self.queries else 0,
+                "max_queue_delay_ms": self.max_queue_delay_seconds * 1000,
+            }
+
+    def shutdown(self):
+        """Encode the queries already submitted, then stop the dispatcher and the executor."""
+        with self._lock:
+            if self._pid != os.getpid():
+                # Nothing was started in this process
+                return
+            dispatcher, executor = self._dispatcher, self.executor
+        self._queue.put(None)
+        dispatcher.join()
+        executor.shutdown(wait=True)
+
+
+def encode_queries(queries):
+    """One model call for a batch of queries. Module level, so process pools can pickle it."""
+    return encoders.get_model().encode(queries, batch_size=settings.EMBEDDING_BATCH_SIZE, normalize_embeddings=True)
+
+
+def create_encoder_executor():
+    if settings.SEARCH_ENCODER_EXECUTOR == "process":
+        # Each process loads its own copy of the model. Processes are spawned rather than forked, forking while
+        # torch threads are running can deadlock.
+        return ProcessPoolExecutor(
+            max_workers=settings.SEARCH_ENCODER_WORKERS, mp_context=multiprocessing.get_context("spawn"), initializer=django.setup
+        )
+    # The model releases the GIL during inference, so threads encode in parallel
+    return ThreadPoolExecutor(max_workers=settings.SEARCH_ENCODER_WORKERS, thread_name_prefix="search-encoder")
+
+
+_encoder_batcher = None
+_encoder_batcher_lock = threading.Lock()
+
+
+def get_encoder_batcher():
+    global _encoder_batcher
+    with _encoder_batcher_lock:
+        if _encoder_batcher is None:
+            _encoder_batcher = EncoderBatcher(
+                encode_queries,
+                create_encoder_executor,
+                workers=settings.SEARCH_ENCODER_WORKERS,
+                max_batch_size=settings.SEARCH_ENCODER_MAX_BATCH_SIZE,
+                max_wait=settings.SEARCH_ENCODER_MAX_WAIT_MS / 1000,
+            )
+        return _encoder_batcher
+
+
+def reset_encoder_batcher():
+    global _encoder_batcher
+    with _encoder_batcher_lock:
+        batcher, _encoder_batcher = _encoder_batcher, None
+    if batcher is not None:
+        batcher.shutdown()
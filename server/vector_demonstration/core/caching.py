@@ -0,0 +1,330 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import caches
+from django.db.models import F
+
+from .encoders import get_model_id
+
+CORPUS_GENERATION_KEY = "search:corpus-generation"
+EMBEDDINGS_GENERATION_KEY = "search:embeddings-generation"
+
+
+def normalize_query(query):
+    """Collapse whitespace.
+
+    Tokenizers split on whitespace, so queries that only differ in spacing produce the same embedding and can
+    share a cache entry. Case is kept: unlike MiniLM's, the tokenizers of cased models don't lowercase.
+    """
+    return " ".join(query.split())
+
+
+class QueryEmbeddingCache:
+    """Two tier cache of query embeddings keyed by normalized query text and model id.
+
+    The first tier is a bounded in-process LRU with a TTL. The optional second tier is a Django cache
+    (`SEARCH_QUERY_CACHE_ALIAS`) shared between workers, consulted on a local miss.
+    """
+
+    def __init__(self, max_size, ttl, shared_cache_alias=None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.shared_cache_alias = shared_cache_alias
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def shared_cache(self):
+        return caches[self.shared_cache_alias] if self.shared_cache_alias else None
+
+    @staticmethod
+    def get_key(query, model_id):
+        digest = hashlib.sha256(normalize_query(query).encode()).hexdigest()
+        return f"query-embedding:normalized:{model_id}:{digest}"
+
+    def get_or_encode(self, query, model_id, encode):
+        """Return the cached embedding of `query`, calling `encode(query)` only on a miss."""
+        return self.get_or_encode_many([query], model_id, lambda queries: [encode(queries[0])])[0]
+
+    def get_or_encode_many(self, queries, model_id, encode_many):
+        """Return the embeddings of `queries`, encoding every miss with a single `encode_many(missed_queries)` call."""
+        embeddings, missed = {}, {}
+        for query in queries:
+            key = self.get_key(query, model_id)
+            if key in embeddings or key in missed:
+                continue
+            embedding = self.get(query, model_id)
+            if embedding is None:
+                missed[key] = query
+            else:
+                embeddings[key] = embedding
+
+        if missed:
+            for key, embedding in zip(missed, encode_many(list(missed.values()))):
+                embeddings[key] = self.set(missed[key], model_id, embedding)
+        return [embeddings[self.get_key(query, model_id)] for query in queries]
+
+    def get(self, query, model_id):
+        """The cached embedding of `query`, or None on a miss."""
+        key = self.get_key(query, model_id)
+        embedding = self._get_local(key)
+        if embedding is None and self.shared_cache is not None:
+            value = self.shared_cache.get(key)
+            if value is not None:
+                embedding = np.frombuffer(value, dtype=np.float32)
+                with self._lock:
+                    self.shared_hits += 1
+                self._set_local(key, embedding)
+        if embedding is None:
+            with self._lock:
+                self.misses += 1
+        return embedding
+
+    def set(self, query, model_id, embedding):
+        """Cache the embedding of `query`, returns the cached copy."""
+        key = self.get_key(query, model_id)
+        # A copy, so cached rows don't keep the whole batch's array alive
+        embedding = np.array(embedding, dtype=np.float32)
+        self._set_local(key, embedding)
+        if self.shared_cache is not None:
+            self.shared_cache.set(key, embedding.tobytes(), timeout=self.ttl)
+        return embedding
+
+    def _get_local(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, embedding = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return embedding
+
+    def _set_local(self, key, embedding):
+        # Embeddings are shared between requests, so make sure nobody modifies them in place
+        embedding.flags.writeable = False
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, embedding)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self):
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.shared_hits = self.misses = self.evictions = 0
+
+
+_query_embedding_cache = None
+_query_embedding_cache_lock = threading.Lock()
+
+
+def get_query_embedding_cache():
+    global _query_embedding_cache
+    with _query_embedding_cache_lock:
+        if _query_embedding_cache is None:
+            _query_embedding_cache = QueryEmbeddingCache(
+                max_size=settings.SEARCH_QUERY_CACHE_SIZE,
+                ttl=settings.SEARCH_QUERY_CACHE_TTL,
+                shared_cache_alias=settings.SEARCH_QUERY_CACHE_ALIAS,
+            )
+        return _query_embedding_cache
+
+
+def get_generation(key):
+    # Imported here because the models depend on this module
+    from .models import SearchGeneration
+
+    generation = SearchGeneration.objects.filter(key=key).values_list("value", flat=True).first()
+    if generation is None:
+        # Start from the current time rather than 0 so a database reset can't revive results cached under an old generation
+        SearchGeneration.objects.bulk_create([SearchGeneration(key=key, value=int(time.time() * 1000))], ignore_conflicts=True)
+        generation = SearchGeneration.objects.values_list("value", flat=True).get(key=key)
+    return generation
+
+
+def bump_generation(key):
+    """Increment the counter with a single UPDATE, so concurrent bumps can't be lost."""
+    from .models import SearchGeneration
+
+    if not SearchGeneration.objects.filter(key=key).update(value=F("value") + 1):
+        # First bump: create the counter, then bump it
+        get_generation(key)
+        SearchGeneration.objects.filter(key=key).update(value=F("value") + 1)
+
+
+def get_corpus_generation():
+    """A counter that changes whenever job descriptions or their chunks change."""
+    return get_generation(CORPUS_GENERATION_KEY)
+
+
+def get_embeddings_generation():
+    """A counter that only changes when chunks change, the version of the numpy engine's in-memory index."""
+    return get_generation(EMBEDDINGS_GENERATION_KEY)
+
+
+def bump_corpus_generation():
+    bump_generation(CORPUS_GENERATION_KEY)
+
+
+def bump_embeddings_generation():
+    """Chunks changed, and so did the corpus."""
+    bump_generation(EMBEDDINGS_GENERATION_KEY)
+    bump_generation(CORPUS_GENERATION_KEY)
+
+
+class SingleFlight:
+    """Concurrent callers computing the same key share a single computation.
+
+    The first caller of `join` for a key leads: it computes the value and passes it to `finish`. Callers joining
+    before then follow, and wait on the leader's future for its result or exception.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self._lock = threading.Lock()
+        self.leaders = 0
+        self.followers = 0
+
+    def join(self, key):
+        """Return `(future, is_leader)` for the computation of `key` in progress."""
+        with self._lock:
+            future = self._flights.get(key)
+            if future is not None:
+                self.followers += 1
+                return future, False
+            future = self._flights[key] = Future()
+            self.leaders += 1
+            return future, True
+
+    def finish(self, key, future, result=None, exception=None):
+        with self._lock:
+            del self._flights[key]
+        if exception is None:
+            future.set_result(result)
+        else:
+            future.set_exception(exception)
+
+    def run(self, key, compute):
+        future, is_leader = self.join(key)
+        if not is_leader:
+            return future.result()
+        try:
+            result = compute()
+        except BaseException as exc:
+            self.finish(key, future, exception=exc)
+            raise
+        self.finish(key, future, result=result)
+        return result
+
+    def stats(self):
+        with self._lock:
+            return {"in_flight": len(self._flights), "leaders": self.leaders, "followers": self.followers}
+
+    def clear(self):
+        with self._lock:
+            self.leaders = self.followers = 0
+
+
+# Rankings being computed in this process, by ranking key
+ranking_flights = SingleFlight()
+
+
+def get_cached_ranking(search_params, compute):
+    """Return `(key, hits)` for `search_params`, calling `compute()` only if the ranking isn't cached.
+
+    Rankings are keyed by the corpus generation, so a new search never sees a ranking from before the corpus
+    changed. They are kept for `SEARCH_CURSOR_TTL` so that cursors referencing `key` can page through them.
+    Identical searches running concurrently wait for the first one's ranking instead of computing it again.
+    """
+    key = get_ranking_key(search_params)
+    hits = get_ranking(key)
+    if hits is None:
+        hits = ranking_flights.run(key, lambda: compute_ranking(key, compute))
+    return key, hits
+
+
+def compute_ranking(key, compute):
+    """Compute and cache the ranking of `key`.
+
+    With `SEARCH_SINGLE_FLIGHT_SHARED`, workers computing the same ranking also wait for each other: the first to
+    add a lease to the result cache computes the ranking, the others poll the cache for it. If the lease expires
+    first, after `SEARCH_SINGLE_FLIGHT_TIMEOUT` seconds, they compute it themselves.
+    """
+    if not settings.SEARCH_SINGLE_FLIGHT_SHARED:
+        hits = compute()
+        set_ranking(key, hits)
+        return hits
+
+    result_cache = caches[settings.SEARCH_RESULT_CACHE_ALIAS]
+    lease_key = f"{key}:lease"
+    deadline = time.monotonic() + settings.SEARCH_SINGLE_FLIGHT_TIMEOUT
+    while not (has_lease := result_cache.add(lease_key, os.getpid(), timeout=settings.SEARCH_SINGLE_FLIGHT_TIMEOUT)):
+        time.sleep(settings.SEARCH_SINGLE_FLIGHT_POLL_MS / 1000)
+        hits = get_ranking(key)
+        if hits is not None:
+            return hits
+        if time.monotonic() > deadline:
+            break
+    try:
+        # The previous lease holder may have finished between our lookup and taking the lease
+        hits = get_ranking(key)
+        if hits is None:
+            hits = compute()
+            set_ranking(key, hits)
+        return hits
+    finally:
+        if has_lease:
+            result_cache.delete(lease_key)
+
+
+def get_ranking_key(search_params):
+    params = dict(search_params, query=normalize_query(search_params["query"]))
+    digest = hashlib.sha256(json.dumps(params, sort_keys=True, default=str).encode()).hexdigest()
+    return f"search-ranking:{get_model_id()}:{get_corpus_generation()}:{digest}"
+
+
+def get_ranking(key):
+    """The ranking cached under `key` by `get_cached_ranking`, or None once it has expired."""
+    return caches[settings.SEARCH_RESULT_CACHE_ALIAS].get(key)
+
+
+def set_ranking(key, hits):
+    caches[settings.SEARCH_RESULT_CACHE_ALIAS].set(key, hits, timeout=settings.SEARCH_CURSOR_TTL)
+
+
+def get_cached_search_page(ranking_key, offset, page_size, compute, response_format_key=""):
+    """Return the serialized page of a ranking, calling `compute()` only if it isn't cached."""
+    key = f"search-page:{ranking_key}:{offset}:{page_size}:{response_format_key}"
+    result_cache = caches[settings.SEARCH_RESULT_CACHE_ALIAS]
+    results = result_cache.get(key)
+    if results is None:
+        results = compute()
+        result_cache.set(key, results, timeout=settings.SEARCH_RESULT_CACHE_TTL)
+    return results
@@ -0,0 +1,99 @@
+"""Embedding the job descriptions whose chunks are missing or out of date, by any number of concurrent workers.
+
+A job description is pending until it was embedded with the current model and chunker, from its current
+description (see the embedding state fields of `JobDescription`), so runs only embed what changed since the last one.
+
+Workers use the job description table as their work queue: each batch is claimed with `SELECT ... FOR UPDATE SKIP
+LOCKED`, embedded and committed in one transaction. Workers never wait for each other's rows, a worker that finishes
+a batch claims the next pending one, and the batch of a worker that crashes is rolled back and left pending for the
+others (or the next run).
+"""
+
+import logging
+import os
+
+import django
+from django.db import transaction
+from django.db.models import Q
+
+from .encoders import get_model_id
+
+logger = logging.getLogger(__name__)
+
+
+def get_pending_job_descriptions():
+    # Models are imported when used, worker processes import this module before setting Django up
+    from .models import CHUNKER_VERSION, ContentHash, JobDescription
+
+    return (
+        JobDescription.objects.filter(
+            Q(embedded_at__isnull=True)
+            | ~Q(embedding_model_id=get_model_id())
+            | ~Q(embedding_chunker_version=CHUNKER_VERSION)
+            | ~Q(embedding_content_hash=ContentHash("description"))
+        )
+        .only("id", "description")
+        .order_by("id")
+    )
+
+
+def claim_and_embed(batch_size, encode_batch_size=None, after_id=None):
+    """Embed up to `batch_size` pending job descriptions after `after_id`, skipping those claimed by other workers.
+
+    Returns the number of job descriptions embedded, the number of chunks created and the last id claimed, or None
+    when there was nothing left to claim.
+    """
+    from .models import JobDescription
+
+    with transaction.atomic():
+        pending = get_pending_job_descriptions()
+        if after_id is not None:
+            pending = pending.filter(id__gt=after_id)
+        batch = list(pending.select_for_update(skip_locked=True)[:batch_size])
+        if not batch:
+            return None
+        last_id = batch[-1].id
+        # Rows are locked after the statement's snapshot is taken, so another worker may have embedded some of them
+        # in between
+        pending = set(
+            get_pending_job_descriptions().filter(id__in=[job_description.id for job_description in batch]).values_list("id", flat=True)
+        )
+        batch = [job_description for job_description in batch if job_description.id in pending]
+        chunks = JobDescription.embed(batch, batch_size=encode_batch_size)
+    return len(batch), len(chunks), last_id
+
+
+def embed_pending(batch_size, encode_batch_size=None, limit=None, on_batch=None):
+    """Claim and embed batches of pending job descriptions until there are none left, or `limit` were embedded.
+
+    Batches are claimed in id order from where the previous one ended, then once more from the start for the
+    batches other workers rolled back. `on_batch(job_descriptions, chunks)` is called after each batch.
+    Returns the number of job descriptions embedded and chunks created.
+    """
+    embedded, chunks, after_id, wrapped = 0, 0, None, False
+    while limit is None or embedded < limit:
+        claimed = claim_and_embed(batch_size if limit is None else min(batch_size, limit - embedded), encode_batch_size, after_id)
+        if claimed is None:
+            if wrapped or after_id is None:
+                break
+            after_id, wrapped = None, True
+            continue
+        batch_embedded, batch_chunks, after_id = claimed
+        embedded += batch_embedded
+        chunks += batch_chunks
+        if on_batch is not None:
+            on_batch(batch_embedded, batch_chunks)
+    return embedded, chunks
+
+
+def run_worker(progress, torch_threads, batch_size, encode_batch_size, limit):
+    """Entry point of a spawned worker process, reporting `(pid, job descriptions, chunks)` to the `progress` queue.
+
+    The encoder is loaded once per worker, on first use.
+    """
+    import torch
+
+    # Each worker's share of the cores, rather than every worker running as many threads as there are cores
+    torch.set_num_threads(torch_threads)
+    django.setup()
+    embed_pending(batch_size, encode_batch_size, limit, on_batch=lambda *counts: progress.put((os.getpid(), *counts)))
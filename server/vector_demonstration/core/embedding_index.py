@@ -0,0 +1,101 @@
+import logging
+import time
+import uuid
+
+import numpy as np
+
+from . import snapshots
+from .models import JobDescriptionChunk
+from .quantization import quantize_binary, quantize_int8
+
+# Compressed copies of the embedding matrix, built on first use by EmbeddingIndex.get_quantized
+QUANTIZERS = {
+    "half": lambda embeddings: embeddings.astype(np.float16),
+    "int8": quantize_int8,
+    "binary": quantize_binary,
+}
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingIndex:
+    """Every chunk embedding in one contiguous float32 matrix, with parallel arrays of chunk and job ids.
+
+    UUIDs are kept as raw 16 byte rows rather than Python objects. `job_ids` is sorted, so comparing
+    positions in it orders job descriptions the same way Postgres orders their UUIDs.
+    """
+
+    def __init__(self, embeddings, chunk_ids, job_indexes, job_ids, token_counts, version=None):
+        self.embeddings = embeddings  # (chunks, dimensions) float32
+        self.chunk_ids = chunk_ids  # (chunks, 16) uint8
+        self.job_indexes = job_indexes  # (chunks,) int32, position of each chunk's job in `job_ids`
+        self.job_ids = job_ids  # (jobs, 16) uint8
+        self.token_counts = token_counts  # (chunks,) int32, -1 when unknown
+        # The corpus generation or snapshot version the index was loaded from
+        self.version = version
+        self._quantized = {}
+
+    def __len__(self):
+        return len(self.embeddings)
+
+    def get_chunk_id(self, position):
+        return uuid.UUID(bytes=self.chunk_ids[position].tobytes())
+
+    def get_job_id(self, job_index):
+        return uuid.UUID(bytes=self.job_ids[job_index].tobytes())
+
+    def get_quantized(self, quantization):
+        """The embeddings compressed with one of QUANTIZERS, computed once per index."""
+        if quantization not in self._quantized:
+            self._quantized[quantization] = QUANTIZERS[quantization](self.embeddings)
+        return self._quantized[quantization]
+
+    @classmethod
+    def from_database(cls, version=None, batch_size=5000):
+        start_time = time.perf_counter()
+        dimensions = JobDescriptionChunk._meta.get_field("embedding").dimensions
+        # Same order as snapshots, so chunks with equal distances are returned in the same order as the SQL engine
+        rows = JobDescriptionChunk.objects.order_by("job_description_id", "id").values_list(
+            "id", "job_description_id", "token_count", "embedding"
+        )
+
+        chunk_ids, job_uuids, token_counts, batches, batch = [], [], [], [], []
+        for chunk_id, job_uuid, token_count, embedding in rows.iterator(chunk_size=batch_size):
+            chunk_ids.append(chunk_id.bytes)
+            job_uuids.append(job_uuid)
+            token_counts.append(-1 if token_count is None else token_count)
+            batch.append(embedding)
+            if len(batch) == batch_size:
+                batches.append(np.array(batch, dtype=np.float32))
+                batch = []
+        if batch:
+            batches.append(np.array(batch, dtype=np.float32))
+
+        sorted_job_uuids = sorted(set(job_uuids))
+        positions = {job_uuid: position for position, job_uuid in enumerate(sorted_job_uuids)}
+        index = cls(
+            embeddings=np.concatenate(batches) if batches else np.empty((0, dimensions), dtype=np.float32),
+            chunk_ids=as_id_array(chunk_ids),
+            job_indexes=np.fromiter((positions[u] for u in job_uuids), dtype=np.int32, count=len(job_uuids)),
+            job_ids=as_id_array([u.bytes for u in sorted_job_uuids]),
+            token_counts=np.array(token_counts, dtype=np.int32),
+            version=version,
+        )
+        logger.info(f"Loaded {len(index)} chunk embeddings in {time.perf_counter() - start_time:.3f} seconds")
+        return index
+
+    @classmethod
+    def from_snapshot(cls, directory, version):
+        """Memory map a snapshot written by the `export_embedding_snapshot` command."""
+        arrays = snapshots.load_arrays(directory, version)
+        logger.info(f"Mapped {len(arrays['embeddings'])} chunk embeddings from snapshot {version}")
+        return cls(version=version, **arrays)
+
+
+def as_id_array(id_bytes):
+    return np.frombuffer(b"".join(id_bytes), dtype=np.uint8).reshape(-1, 16)
+
+
+def as_id_values(id_array):
+    """View a (n, 16) id array as n 16 byte values, for comparisons with `np.isin`."""
+    return np.ascontiguousarray(id_array).view("V16").ravel()
@@ -0,0 +1,132 @@
+import logging
+import threading
+import time
+
+from django.conf import settings
+from sentence_transformers import SentenceTransformer
+from transformers import AutoTokenizer
+
+from .metrics import record_stage
+
+logger = logging.getLogger(__name__)
+
+
+class EncoderRegistry:
+    """Process-wide cache of sentence encoders and tokenizers.
+
+    Loading `all-MiniLM-L6-v2` takes hundreds of milliseconds and allocates the full set of model
+    weights, so each (name, revision) pair is loaded at most once per process and shared by every
+    thread. Loads of different models do not block each other.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self._entries = {}
+
+    def _get_or_load(self, kind, name, revision, loader):
+        key = (kind, name, revision)
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry["object"]
+
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            # Another thread may have finished loading while we waited for the lock
+            entry = self._entries.get(key)
+            if entry is not None:
+                return entry["object"]
+
+            logger.info(f"Loading {kind} {name}@{revision or 'latest'}")
+            start_time = time.perf_counter()
+            obj = loader()
+            load_seconds = time.perf_counter() - start_time
+            self._entries[key] = {
+                "object": obj,
+                "load_seconds": load_seconds,
+                "memory_bytes": get_memory_bytes(obj),
+            }
+            logger.info(f"Loaded {kind} {name}@{revision or 'latest'} in {load_seconds:.3f} seconds")
+            record_stage("model_load", load_seconds)
+            return obj
+
+    def get_model(self, name=None, revision=None):
+        name = name or settings.EMBEDDING_MODEL_NAME
+        revision = revision or settings.EMBEDDING_MODEL_REVISION
+        return self._get_or_load("model", name, revision, lambda: SentenceTransformer(name, revision=revision))
+
+    def get_tokenizer(self, name=None, revision=None):
+        name = name or settings.EMBEDDING_TOKENIZER_NAME
+        revision = revision or settings.EMBEDDING_MODEL_REVISION
+        return self._get_or_load("tokenizer", name, revision, lambda: AutoTokenizer.from_pretrained(name, revision=revision))
+
+    def warm_up(self):
+        """Eagerly load the default model and tokenizer so the first request doesn't pay for it."""
+        self.get_model()
+        self.get_tokenizer()
+
+    def stats(self):
+        """Load time and approximate memory footprint of everything loaded in this process."""
+        return [
+            {
+                "kind": kind,
+                "name": name,
+                "revision": revision,
+                "load_seconds": entry["load_seconds"],
+                "memory_bytes": entry["memory_bytes"],
+            }
+            for (kind, name, revision), entry in list(self._entries.items())
+        ]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._key_locks.clear()
+
+
+def get_memory_bytes(obj):
+    """Approximate memory held by a torch module's parameters and buffers. Tokenizers report 0."""
+    if not hasattr(obj, "parameters"):
+        return 0
+    tensors = list(obj.parameters()) + list(obj.buffers())
+    return sum(t.nelement() * t.element_size() for t in tensors)
+
+
+def get_model_id():
+    """Identifies the default model's weights, e.g. for cache keys."""
+    return f"{settings.EMBEDDING_MODEL_NAME}@{settings.EMBEDDING_MODEL_REVISION or 'latest'}"
+
+
+registry = EncoderRegistry()
+
+
+def get_model(name=None, revision=None):
+    return registry.get_model(name, revision)
+
+
+def get_tokenizer(name=None, revision=None):
+    return registry.get_tokenizer(name, revision)
+
+
+def warm_up():
+    """Load the default model and tokenizer if `EMBEDDING_WARM_UP` is set, see `wsgi.py` and `asgi.py`.
+
+    Called by the web server's entry points rather than when Django is set up, so management commands (migrate,
+    shell, collectstatic...) don't load the model.
+    """
+    if not settings.EMBEDDING_WARM_UP:
+        return
+    try:
+        registry.warm_up()
+    except Exception:
+        # Don't prevent the app from booting, the encoder will be loaded lazily on first use
+        logger.exception("Failed to warm up the embedding model")
+        return
+
+    for stats in registry.stats():
+        logger.info(
+            f"Warm {stats['kind']} {stats['name']}: loaded in {stats['load_seconds']:.3f}s, "
+            f"{stats['memory_bytes'] / 1024 / 1024:.1f} MiB"
+        )
@@ -0,0 +1,76 @@
+from collections import defaultdict
+
+from django.conf import settings
+from django.contrib.postgres.search import SearchQuery, SearchRank
+from django.db.models import F
+
+from .models import JobDescription
+from .search import SearchHit, get_search_engine
+
+# Text search configuration of `JobDescription.search_vector`, must match the trigger in migration 0010
+TEXT_SEARCH_CONFIG = "english"
+
+# "vector" ranks by embedding similarity only. "hybrid" fuses the vector ranking with a lexical one. "lexical" only
+# considers job descriptions matching the query's words and ranks them by embedding similarity.
+RETRIEVAL_MODES = ["vector", "hybrid", "lexical"]
+
+
+def lexical_search(query, limit, filters=None):
+    """Ids of the `limit` job descriptions whose title, skills and description best match the words of `query`.
+
+    Matches are found through the GIN index on `search_vector` and ranked by cover density (`ts_rank_cd`).
+    The query uses web search syntax: quoted phrases, `or` and `-excluded` words.
+    """
+    search_query = SearchQuery(query, search_type="websearch", config=TEXT_SEARCH_CONFIG)
+    job_descriptions = JobDescription.objects.filter(search_vector=search_query)
+    for field, value in (filters or {}).items():
+        job_descriptions = job_descriptions.filter(**{f"{field}__in" if isinstance(value, (list, tuple)) else field: value})
+    return list(
+        job_descriptions.annotate(rank=SearchRank(F("search_vector"), search_query, cover_density=True))
+        .order_by("-rank", "id")
+        .values_list("id", flat=True)[:limit]
+    )
+
+
+def reciprocal_rank_fusion(rankings, k):
+    """Combine rankings of ids into `(id, score)` pairs, best first.
+
+    Each ranking contributes `1 / (k + rank)` to the score of each of its ids, so ids ranked well by several
+    rankings come first without having to compare their scores.
+    """
+    scores = defaultdict(float)
+    for ranking in rankings:
+        for rank, id_ in enumerate(ranking, start=1):
+            scores[id_] += 1 / (k + rank)
+    return sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+
+
+def hybrid_search(query, query_embedding, limit, retrieval="hybrid", filters=None, **search_options):
+    """Search hits combining lexical matches of `query` with the vector ranking of `query_embedding`.
+
+    The lexical stage is a candidate generator: at most `SEARCH_LEXICAL_CANDIDATES` job descriptions, whose
+    chunks are then the only ones compared with the query embedding. In "hybrid" mode the best `limit` job
+    descriptions by vector search are added, and both rankings are fused. Fused scores are negated reciprocal
+    rank fusion scores, so lower is better like distances.
+    """
+    engine = get_search_engine()
+    lexical_ids = lexical_search(query, settings.SEARCH_LEXICAL_CANDIDATES, filters)
+    lexical_hits = []
+    if lexical_ids:
+        # Always pre-filtered: only the chunks of the lexical candidates are compared
+        candidate_options = dict(search_options, filters={**(filters or {}), "id": lexical_ids}, filter_strategy="prefilter")
+        lexical_hits = engine.search(query_embedding, limit=len(lexical_ids), **candidate_options)
+    if retrieval == "lexical":
+        return lexical_hits[:limit]
+
+    vector_hits = engine.search(query_embedding, limit=limit, filters=filters, **search_options)
+    hits = {hit.job_description_id: hit for hit in [*lexical_hits, *vector_hits]}
+    fused = reciprocal_rank_fusion([lexical_ids, [hit.job_description_id for hit in vector_hits]], settings.SEARCH_RRF_K)
+
+    results = []
+    for job_description_id, score in fused[:limit]:
+        hit = hits.get(job_description_id)
+        # Job descriptions without chunks can still match lexically
+        chunk_ids, chunk_distances = (hit.chunk_ids, hit.chunk_distances) if hit else ([], [])
+        results.append(SearchHit(job_description_id, -score, chunk_ids, chunk_distances))
+    return results
@@ -0,0 +1,70 @@
+import logging
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from vector_demonstration.core.models import JobDescription, JobDescriptionChunk
+
+logger = logging.getLogger(__name__)
+
+METHODS = ["bulk_create", "copy"]
+
+
+class Command(BaseCommand):
+    help = "Compare loading job descriptions and chunks with bulk_create and with COPY, in transactions rolled back after"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--job-descriptions", type=int, default=2000)
+        parser.add_argument("--chunks-per-job-description", type=int, default=5)
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows per INSERT statement of bulk_create")
+
+    def handle(self, *args, **options):
+        logger.info(f"Starting management command {__name__}")
+        self.stdout.write(
+            f"Loading {options['job_descriptions']} job descriptions with {options['chunks_per_job_description']} chunks each, "
+            "including the maintenance of their indexes and triggers:"
+        )
+        for method in METHODS:
+            job_descriptions, chunks = self.make_rows(options["job_descriptions"], options["chunks_per_job_description"])
+            with transaction.atomic():
+                for model, objs in [(JobDescription, job_descriptions), (JobDescriptionChunk, chunks)]:
+                    start_time = time.perf_counter()
+                    if method == "copy":
+                        model.objects.copy_load(objs)
+                    else:
+                        model.objects.bulk_create(objs, batch_size=options["batch_size"])
+                    elapsed = time.perf_counter() - start_time
+                    rate = len(objs) / elapsed if elapsed else 0
+                    self.stdout.write(f"    {method:<12}{model._meta.model_name:<22}{elapsed:8.2f} s  {rate:10.0f} rows/s")
+                transaction.set_rollback(True)
+        logger.info(f"Finished management command {__name__}")
+
+    @staticmethod
+    def make_rows(job_description_count, chunks_per_job_description):
+        """Job descriptions with chunks of realistic sizes, and random normalized embeddings."""
+        rng = np.random.default_rng(0)
+        job_descriptions = [
+            JobDescription(
+                title=f"Job {i}",
+                company="Acme",
+                location="Remote",
+                description="<p>Lorem ipsum dolor sit amet</p>\n" * 100,
+                skills="Singing, welding",
+            )
+            for i in range(job_description_count)
+        ]
+        embeddings = rng.normal(size=(job_description_count * chunks_per_job_description, 384)).astype(np.float32)
+        embeddings /= np.linalg.norm(embeddings, axis=1, keepdims=True)
+        # Compressed embeddings are filled in by the bulk loads
+        chunks = [
+            JobDescriptionChunk(
+                job_description=job_descriptions[index // chunks_per_job_description],
+                chunk="Lorem ipsum dolor sit amet " * 28,
+                token_count=150,
+                embedding=embedding,
+            )
+            for index, embedding in enumerate(embeddings)
+        ]
+        return job_descriptions, chunks
@@ -0,0 +1,62 @@
+import logging
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.renderers import JSONRenderer
+
+from vector_demonstration.core.models import JobDescription
+from vector_demonstration.core.renderers import MessagePackRenderer, ORJSONRenderer
+from vector_demonstration.core.serializers import (
+    JobDescriptionSearchResultsSerializer,
+    JobDescriptionSerializer,
+    SearchResultsFormatSerializer,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Compare the time and size of rendering search and list responses with each renderer"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--query", default=None, help="Defaults to the default query of JobDescription.rank")
+        parser.add_argument("--limit", type=int, default=50)
+        parser.add_argument("--repeat", type=int, default=20, help="Number of times each payload is rendered")
+
+    def handle(self, *args, **options):
+        logger.info(f"Starting management command {__name__}")
+        results = JobDescription.search(options["query"], limit=options["limit"], with_embeddings=True)
+        if not results:
+            raise CommandError("There are no job descriptions to search")
+
+        payloads = {
+            f"search, {len(results)} results": self.serialize_results(results, {}),
+            "search with json embeddings": self.serialize_results(results, {"embedding_format": "json"}),
+            "search with float16 embeddings": self.serialize_results(results, {"embedding_format": "float16"}),
+            "list": JobDescriptionSerializer(JobDescription.objects.all()[: settings.SEARCH_PAGE_SIZE], many=True).data,
+        }
+        for name, payload in payloads.items():
+            self.stdout.write(f"{name}:")
+            for renderer_name, renderer in self.get_renderers().items():
+                timings = []
+                for _ in range(options["repeat"]):
+                    start_time = time.perf_counter()
+                    content = renderer.render(payload, renderer.media_type, {})
+                    timings.append(time.perf_counter() - start_time)
+                self.stdout.write(
+                    f"    {renderer_name:<10}" f"p50 {np.percentile(timings, 50) * 1000:8.2f} ms  " f"{len(content) / 1024:10.1f} KiB"
+                )
+        logger.info(f"Finished management command {__name__}")
+
+    @staticmethod
+    def serialize_results(results, response_format):
+        format_serializer = SearchResultsFormatSerializer(data=response_format)
+        format_serializer.is_valid(raise_exception=True)
+        context = {"response_format": format_serializer.validated_data}
+        return JobDescriptionSearchResultsSerializer(results, many=True, context=context).data
+
+    @staticmethod
+    def get_renderers():
+        return {"json": JSONRenderer(), "orjson": ORJSONRenderer(), "msgpack": MessagePackRenderer()}
@@ -0,0 +1,107 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from vector_demonstration.core.models import JobDescriptionChunk
+
+logger = logging.getLogger(__name__)
+
+OPERATOR_CLASSES = {
+    "l2": "vector_l2_ops",
+    "cosine": "vector_cosine_ops",
+    "inner_product": "vector_ip_ops",
+}
+
+
+INDEX_NAME_SUFFIXES = {
+    "l2": "l2",
+    "cosine": "cosine",
+    "inner_product": "ip",
+}
+
+
+# Column and operator class indexed for quantized search, see JobDescriptionChunk.quantize
+QUANTIZED_COLUMNS = {
+    "half": ("embedding_half", "halfvec_ip_ops"),
+    "binary": ("embedding_binary", "bit_hamming_ops"),
+}
+
+
+def get_index_name(method, metric, quantization=None):
+    if quantization == "binary":
+        return f"jd_chunk_embedding_binary_{method}_hamming"
+    if quantization:
+        return f"jd_chunk_embedding_{quantization}_{method}_ip"
+    return f"jd_chunk_embedding_{method}_{INDEX_NAME_SUFFIXES[metric]}"
+
+
+class Command(BaseCommand):
+    help = "Build an approximate nearest neighbour (HNSW or IVFFlat) index on the job description chunk embeddings"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--method", choices=["hnsw", "ivfflat"], default="hnsw")
+        parser.add_argument(
+            "--metric",
+            choices=list(OPERATOR_CLASSES),
+            default="inner_product",
+            help="Search always scans by inner product, other metrics are only useful for ad-hoc queries",
+        )
+        parser.add_argument("--m", type=int, default=settings.VECTOR_INDEX_HNSW_M, help="HNSW: max connections per layer")
+        parser.add_argument(
+            "--ef-construction",
+            type=int,
+            default=settings.VECTOR_INDEX_HNSW_EF_CONSTRUCTION,
+            help="HNSW: size of the candidate list while building",
+        )
+        parser.add_argument(
+            "--lists",
+            type=int,
+            default=None,
+            help="IVFFlat: number of inverted lists. Defaults to rows / 1000 (or sqrt(rows) above 1M rows)",
+        )
+        parser.add_argument(
+            "--quantization",
+            choices=list(QUANTIZED_COLUMNS),
+            default=None,
+            help="Index a compressed embedding column for quantized search instead (always by inner product or Hamming distance)",
+        )
+        parser.add_argument("--rebuild", action="store_true", help="Drop and rebuild the index if it already exists")
+        parser.add_argument("--concurrently", action="store_true", help="Build without locking the table against writes (slower)")
+
+    def handle(self, *args, **options):
+        logger.info(f"Starting management command {__name__}")
+        method, metric = options["method"], options["metric"]
+        quantization = options["quantization"]
+        index_name = get_index_name(method, metric, quantization)
+        column, operator_class = QUANTIZED_COLUMNS.get(quantization, ("embedding", OPERATOR_CLASSES[metric]))
+        table = JobDescriptionChunk._meta.db_table
+        concurrently = "CONCURRENTLY " if options["concurrently"] else ""
+
+        if method == "hnsw":
+            storage_parameters = f"m = {options['m']}, ef_construction = {options['ef_construction']}"
+        else:
+            # IVFFlat clusters the existing rows, so it should be built after the data is loaded
+            lists = options["lists"] or self.default_lists(JobDescriptionChunk.objects.count())
+            storage_parameters = f"lists = {lists}"
+
+        with connection.cursor() as cursor:
+            if options["rebuild"]:
+                cursor.execute(f"DROP INDEX {concurrently}IF EXISTS {index_name}")
+            self.stdout.write(f"Building {index_name} with ({storage_parameters})...")
+            start_time = time.time()
+            cursor.execute(
+                f"CREATE INDEX {concurrently}IF NOT EXISTS {index_name} ON {table} "
+                f"USING {method} ({column} {operator_class}) WITH ({storage_parameters})"
+            )
+        self.stdout.write(f"    Built in {time.time() - start_time} seconds.")
+        logger.info(f"Finished management command {__name__}")
+
+    @staticmethod
+    def default_lists(row_count):
+        """pgvector's recommendation: rows / 1000 up to 1M rows, sqrt(rows) beyond that."""
+        if row_count > 1_000_000:
+            return int(row_count**0.5)
+        return max(row_count // 1000, 1)
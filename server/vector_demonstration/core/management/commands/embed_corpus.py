@@ -0,0 +1,87 @@
+import logging
+import multiprocessing
+import os
+import queue
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from vector_demonstration.core.embedding import embed_pending, get_pending_job_descriptions, run_worker
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Chunk and embed every job description never embedded, or embedded with another model, chunker or description, "
+        "many job descriptions per model call"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200, help="Job descriptions chunked and encoded together")
+        parser.add_argument(
+            "--encode-batch-size",
+            type=int,
+            default=settings.EMBEDDING_BATCH_SIZE,
+            help="Chunks per forward pass of the model, larger batches are faster on GPUs",
+        )
+        parser.add_argument("--limit", type=int, default=None, help="Stop after embedding this many job descriptions, per worker")
+        parser.add_argument("--workers", type=int, default=1, help="Worker processes, each loading its own copy of the model")
+
+    def handle(self, *args, **options):
+        logger.info(f"Starting management command {__name__}")
+        if options["workers"] < 1:
+            raise CommandError("--workers must be at least 1")
+        total = get_pending_job_descriptions().count()
+        self.stdout.write(f"Embedding {total} job descriptions with {options['workers']} worker(s)...")
+
+        self.start_time = time.perf_counter()
+        self.embedded, self.chunks = 0, 0
+        if options["workers"] == 1:
+            embed_pending(options["batch_size"], options["encode_batch_size"], options["limit"], on_batch=self.report_batch)
+        else:
+            self.run_workers(options)
+
+        elapsed = time.perf_counter() - self.start_time
+        self.stdout.write(
+            f"Embedded {self.embedded} job descriptions into {self.chunks} chunks in {elapsed:.1f} seconds "
+            f"({self.chunks / elapsed if elapsed else 0:.1f} chunks/s)."
+        )
+        logger.info(f"Finished management command {__name__}")
+
+    def report_batch(self, embedded, chunks, worker=None):
+        self.embedded += embedded
+        self.chunks += chunks
+        elapsed = time.perf_counter() - self.start_time
+        prefix = f"[worker {worker}] " if worker else ""
+        self.stdout.write(
+            f"    {prefix}Embedded {self.embedded} job descriptions, {self.chunks} chunks ({self.chunks / elapsed:.1f} chunks/s)"
+        )
+
+    def run_workers(self, options):
+        # Spawned rather than forked: forking a process with torch threads running can deadlock
+        context = multiprocessing.get_context("spawn")
+        progress = context.Queue()
+        torch_threads = max((os.cpu_count() or 1) // options["workers"], 1)
+        args = (progress, torch_threads, options["batch_size"], options["encode_batch_size"], options["limit"])
+        workers = [context.Process(target=run_worker, args=args, name=f"embed-corpus-{i}") for i in range(options["workers"])]
+        for worker in workers:
+            worker.start()
+
+        while any(worker.is_alive() for worker in workers):
+            try:
+                pid, embedded, chunks = progress.get(timeout=1)
+            except queue.Empty:
+                continue
+            self.report_batch(embedded, chunks, worker=pid)
+        # Batches reported just before the workers exited
+        while not progress.empty():
+            pid, embedded, chunks = progress.get()
+            self.report_batch(embedded, chunks, worker=pid)
+
+        for worker in workers:
+            worker.join()
+            if worker.exitcode != 0:
+                # Its current batch was rolled back, and left for the other workers or the next run
+                self.stderr.write(f"Worker {worker.name} exited with code {worker.exitcode}")
@@ -0,0 +1,31 @@
+import logging
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from vector_demonstration.core.snapshots import export_snapshot
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Export the chunk embeddings to a memory-mappable snapshot for the numpy search engine"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--directory", default=settings.SEARCH_SNAPSHOT_DIR, help="Defaults to SEARCH_SNAPSHOT_DIR")
+        parser.add_argument("--batch-size", type=int, default=5000)
+        parser.add_argument("--keep", type=int, default=3, help="Number of snapshot versions to keep")
+
+    def handle(self, *args, **options):
+        logger.info(f"Starting management command {__name__}")
+        if not options["directory"]:
+            raise CommandError("Provide --directory or set SEARCH_SNAPSHOT_DIR")
+
+        start_time = time.time()
+        manifest = export_snapshot(options["directory"], batch_size=options["batch_size"], keep=options["keep"])
+        self.stdout.write(
+            f"Exported {manifest['chunks']} chunks of {manifest['jobs']} job descriptions to snapshot "
+            f"{manifest['version']} in {time.time() - start_time} seconds."
+        )
+        logger.info(f"Finished management command {__name__}")
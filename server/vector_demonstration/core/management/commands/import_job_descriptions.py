@@ -0,0 +1,20 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from vector_demonstration.core.models import JobDescription
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Import job descriptions from the CSV files of data/jobs, streaming rows and inserting them in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--directory", default=None, help="Directory of the CSV files, data/jobs by default")
+        parser.add_argument("--batch-size", type=int, default=1000, help="Rows inserted per transaction")
+
+    def handle(self, *args, **options):
+        logger.info(f"Starting management command {__name__}")
+        JobDescription.import_job_descriptions(directory=options["directory"], batch_size=options["batch_size"], stdout=self.stdout)
+        logger.info(f"Finished management command {__name__}")
@@ -0,0 +1,71 @@
+import logging
+import time
+
+import numpy as np
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from vector_demonstration.core.models import JobDescriptionChunk
+from vector_demonstration.core.search import SEARCH_ENGINES, get_search_engine
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_COLUMNS = {
+    "none": "embedding",
+    "half": "embedding_half",
+    "binary": "embedding_binary",
+}
+
+
+class Command(BaseCommand):
+    help = "Report the storage size, latency and recall of quantized search compared to full precision search"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--engine", choices=list(SEARCH_ENGINES), default=settings.SEARCH_ENGINE)
+        parser.add_argument("--queries", type=int, default=20, help="Number of chunk embeddings sampled as queries")
+        parser.add_argument("--limit", type=int, default=10)
+
+    def handle(self, *args, **options):
+        logger.info(f"Starting management command {__name__}")
+        queries = list(JobDescriptionChunk.objects.order_by("?").values_list("embedding", flat=True)[: options["queries"]])
+        if not queries:
+            raise CommandError("There are no job description chunks to search")
+
+        self.stdout.write("Average stored size per chunk:")
+        for quantization, size in self.get_column_sizes().items():
+            self.stdout.write(f"    {quantization:<8}{size:>8.0f} bytes")
+
+        engine = get_search_engine(options["engine"])
+        limit = options["limit"]
+        # The first search of the numpy engine loads its index, keep that out of the timings
+        engine.search(queries[0], limit=limit)
+        exact = [self.get_job_ids(engine.search(query, limit=limit)) for query in queries]
+
+        self.stdout.write(f"Search with the {options['engine']} engine, {len(queries)} queries, recall@{limit}:")
+        for quantization in [None, *engine.quantizations]:
+            timings, recalls = [], []
+            for query, expected in zip(queries, exact):
+                start_time = time.perf_counter()
+                hits = engine.search(query, limit=limit, quantization=quantization)
+                timings.append(time.perf_counter() - start_time)
+                recalls.append(len(self.get_job_ids(hits) & expected) / len(expected) if expected else 1.0)
+            self.stdout.write(
+                f"    {quantization or 'none':<8}"
+                f"p50 {np.percentile(timings, 50) * 1000:8.2f} ms  "
+                f"p95 {np.percentile(timings, 95) * 1000:8.2f} ms  "
+                f"recall {np.mean(recalls):.3f}"
+            )
+        logger.info(f"Finished management command {__name__}")
+
+    @staticmethod
+    def get_column_sizes():
+        columns = ", ".join(f"avg(pg_column_size({column}))" for column in EMBEDDING_COLUMNS.values())
+        with connection.cursor() as cursor:
+            cursor.execute(f"SELECT {columns} FROM {JobDescriptionChunk._meta.db_table}")
+            row = cursor.fetchone()
+        return {quantization: float(size or 0) for quantization, size in zip(EMBEDDING_COLUMNS, row)}
+
+    @staticmethod
+    def get_job_ids(hits):
+        return {hit.job_description_id for hit in hits}
@@ -0,0 +1,45 @@
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+
+from vector_demonstration.core.models import JobDescriptionChunk
+
+logger = logging.getLogger(__name__)
+
+# `quantize()` also normalizes the embedding itself
+QUANTIZED_FIELDS = ["embedding", "embedding_half", "embedding_binary"]
+
+
+class Command(BaseCommand):
+    help = "Fill in the compressed (half precision and binary) copies of the chunk embeddings"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument(
+            "--all", action="store_true", help="Re-normalize and re-quantize every chunk, not only those missing a compressed copy"
+        )
+
+    def handle(self, *args, **options):
+        logger.info(f"Starting management command {__name__}")
+        chunks = JobDescriptionChunk.objects.only("id", "embedding").order_by("id")
+        if not options["all"]:
+            chunks = chunks.filter(Q(embedding_half__isnull=True) | Q(embedding_binary__isnull=True))
+
+        start_time = time.time()
+        updated, last_id = 0, None
+        while True:
+            # Keyset pagination, so every batch is an index range scan however far along we are
+            batch = list((chunks.filter(id__gt=last_id) if last_id else chunks)[: options["batch_size"]])
+            if not batch:
+                break
+            for chunk in batch:
+                chunk.quantize()
+            JobDescriptionChunk.objects.bulk_update(batch, QUANTIZED_FIELDS)
+            updated += len(batch)
+            last_id = batch[-1].id
+            self.stdout.write(f"    Quantized {updated} chunks...")
+
+        self.stdout.write(f"Quantized {updated} chunk embeddings in {time.time() - start_time} seconds.")
+        logger.info(f"Finished management command {__name__}")
@@ -0,0 +1,200 @@
+"""Per-stage timings of search requests, reported in `Server-Timing` headers and as Prometheus metrics.
+
+Stages are timed with `timed(stage)` wherever the work happens (model loads, encoding, ranking, loading results,
+serialization). Durations are added to the `SearchTimings` of the request in progress, found through a context
+variable, so the search code doesn't need a request to be instrumented. Every duration is also observed by the
+process-wide histograms served by the metrics endpoint, in the Prometheus text format.
+
+Metrics are kept per process: with several workers, each scrape reports the worker that served it.
+"""
+
+import contextvars
+import functools
+import inspect
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.db import connection
+
+DURATION_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+ROW_BUCKETS = (10, 100, 1000, 10000, 100000)
+
+# Order of the stages in Server-Timing headers, and their descriptions
+STAGES = {
+    "model_load": "Model load",
+    "encode": "Query encoding",
+    "rank": "Ranking",
+    "load": "Result loading",
+    "serialize": "Serialization",
+}
+
+_current_timings = contextvars.ContextVar("search_timings", default=None)
+
+
+class Histogram:
+    """A Prometheus histogram with labels, e.g. `Histogram("latency_seconds", "...", ["stage"]).observe(0.1, stage="x")`."""
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DURATION_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        # Label values to (bucket counts, sum, count)
+        self._series = {}
+
+    def observe(self, value, **labels):
+        key = tuple(str(labels[name]) for name in self.labelnames)
+        with self._lock:
+            bucket_counts, total, count = self._series.get(key) or ([0] * len(self.buckets), 0.0, 0)
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    bucket_counts[index] += 1
+            self._series[key] = (bucket_counts, total + value, count + 1)
+
+    def collect(self):
+        """Lines of the text exposition format."""
+        yield f"# HELP {self.name} {self.documentation}"
+        yield f"# TYPE {self.name} histogram"
+        with self._lock:
+            series = sorted((key, (list(bucket_counts), total, count)) for key, (bucket_counts, total, count) in self._series.items())
+        for key, (bucket_counts, total, count) in series:
+            labels = [f'{name}="{escape_label_value(value)}"' for name, value in zip(self.labelnames, key)]
+            for bound, bucket_count in [*zip(self.buckets, bucket_counts), ("+Inf", count)]:
+                bucket_labels = format_labels([*labels, f'le="{bound}"'])
+                yield f"{self.name}_bucket{bucket_labels} {bucket_count}"
+            yield f"{self.name}_sum{format_labels(labels)} {total}"
+            yield f"{self.name}_count{format_labels(labels)} {count}"
+
+    def clear(self):
+        with self._lock:
+            self._series.clear()
+
+
+def format_labels(labels):
+    return "{" + ",".join(labels) + "}" if labels else ""
+
+
+def escape_label_value(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+STAGE_SECONDS = Histogram("search_stage_duration_seconds", "Duration of each stage of a search.", ["stage"])
+REQUEST_SECONDS = Histogram("search_request_duration_seconds", "Duration of search requests, up to rendering.", ["endpoint"])
+REQUEST_QUERIES = Histogram("search_request_db_queries", "Database queries per search request.", ["endpoint"], QUERY_BUCKETS)
+REQUEST_ROWS = Histogram("search_request_db_rows", "Rows fetched from the database per search request.", ["endpoint"], ROW_BUCKETS)
+
+METRICS = [STAGE_SECONDS, REQUEST_SECONDS, REQUEST_QUERIES, REQUEST_ROWS]
+
+
+class SearchTimings:
+    """Stage durations and database queries of one request, recorded while it is the current one."""
+
+    def __init__(self, endpoint):
+        self.endpoint = endpoint
+        self.stages = defaultdict(float)
+        self.queries = 0
+        self.rows = 0
+        self.total_seconds = None
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self._token = _current_timings.set(self)
+        self._start_time = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.total_seconds = time.perf_counter() - self._start_time
+        _current_timings.reset(self._token)
+        REQUEST_SECONDS.observe(self.total_seconds, endpoint=self.endpoint)
+        REQUEST_QUERIES.observe(self.queries, endpoint=self.endpoint)
+        REQUEST_ROWS.observe(self.rows, endpoint=self.endpoint)
+
+    def add_stage(self, stage, seconds):
+        with self._lock:
+            self.stages[stage] += seconds
+
+    def count_queries(self):
+        """Count the queries run, and rows fetched, on this thread's connection while in this context manager."""
+        return connection.execute_wrapper(self._count_query)
+
+    def _count_query(self, execute, sql, params, many, context):
+        result = execute(sql, params, many, context)
+        cursor = context["cursor"]
+        # Statements returning no rows have no description. Server-side cursors don't know their row count.
+        rows = max(cursor.rowcount, 0) if cursor.description is not None else 0
+        with self._lock:
+            self.queries += 1
+            self.rows += rows
+        return result
+
+    def get_header(self):
+        """The `Server-Timing` header value, e.g. `encode;dur=12.3;desc="Query encoding", ..., total;dur=45.6`."""
+        with self._lock:
+            stages = [(stage, self.stages[stage]) for stage in STAGES if stage in self.stages]
+        entries = [f'{stage};dur={seconds * 1000:.1f};desc="{STAGES[stage]}"' for stage, seconds in stages]
+        entries.append(f'db;desc="{self.queries} queries / {self.rows} rows"')
+        total_seconds = self.total_seconds if self.total_seconds is not None else time.perf_counter() - self._start_time
+        entries.append(f"total;dur={total_seconds * 1000:.1f}")
+        return ", ".join(entries)
+
+
+def get_current_timings():
+    return _current_timings.get()
+
+
+@contextmanager
+def timed(stage):
+    """Time a stage of the current request, if any, and observe its duration."""
+    start_time = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - start_time)
+
+
+def record_stage(stage, seconds):
+    STAGE_SECONDS.observe(seconds, stage=stage)
+    timings = get_current_timings()
+    if timings is not None:
+        timings.add_stage(stage, seconds)
+
+
+def instrument(endpoint):
+    """Decorate a view to time it with `SearchTimings` and report the timings in a `Server-Timing` header."""
+
+    def decorator(view):
+        if inspect.iscoroutinefunction(view):
+
+            @functools.wraps(view)
+            async def async_wrapper(*args, **kwargs):
+                # Queries run in the database executor, whose threads count them, see `async_search`
+                with SearchTimings(endpoint) as timings:
+                    response = await view(*args, **kwargs)
+                response["Server-Timing"] = timings.get_header()
+                return response
+
+            return async_wrapper
+
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            with SearchTimings(endpoint) as timings, timings.count_queries():
+                response = view(*args, **kwargs)
+            response["Server-Timing"] = timings.get_header()
+            return response
+
+        return wrapper
+
+    return decorator
+
+
+def render_metrics():
+    return "\n".join(line for metric in METRICS for line in metric.collect()) + "\n"
+
+
+def clear_metrics():
+    for metric in METRICS:
+        metric.clear()
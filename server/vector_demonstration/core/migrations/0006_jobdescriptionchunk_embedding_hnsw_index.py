@@ -0,0 +1,18 @@
+# Generated by Django 3.2.6 on 2026-10-18 10:54
+
+from django.db import migrations
+import pgvector.django.indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_jobdescriptionchunk_token_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobdescriptionchunk',
+            index=pgvector.django.indexes.HnswIndex(ef_construction=64, fields=['embedding'], m=16, name='jd_chunk_embedding_hnsw_l2', opclasses=['vector_l2_ops']),
+        ),
+    ]
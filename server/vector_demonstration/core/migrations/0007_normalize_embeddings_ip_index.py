@@ -0,0 +1,27 @@
+# Generated by Django 3.2.6 on 2026-10-18 11:01
+
+from django.db import migrations
+import pgvector.django.indexes
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_jobdescriptionchunk_embedding_hnsw_index'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='jobdescriptionchunk',
+            name='jd_chunk_embedding_hnsw_l2',
+        ),
+        # Normalize existing embeddings (requires pgvector >= 0.7) before the new index is built
+        migrations.RunSQL(
+            "UPDATE core_jobdescriptionchunk SET embedding = l2_normalize(embedding)",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='jobdescriptionchunk',
+            index=pgvector.django.indexes.HnswIndex(ef_construction=64, fields=['embedding'], m=16, name='jd_chunk_embedding_hnsw_ip', opclasses=['vector_ip_ops']),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 3.2.6 on 2026-10-18 11:07
+
+from django.db import migrations, models
+import pgvector.django.bit
+import pgvector.django.halfvec
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0007_normalize_embeddings_ip_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobdescriptionchunk',
+            name='embedding_binary',
+            field=pgvector.django.bit.BitField(length=384, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobdescriptionchunk',
+            name='embedding_half',
+            field=pgvector.django.halfvec.HalfVectorField(dimensions=384, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobdescriptionchunk',
+            name='embedding_int8',
+            field=models.BinaryField(null=True),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 3.2.6 on 2026-10-18 11:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_jobdescriptionchunk_quantized_embeddings'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobdescription',
+            index=models.Index(fields=['company'], name='jd_company_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobdescription',
+            index=models.Index(fields=['location'], name='jd_location_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='jobdescription',
+            index=models.Index(condition=models.Q(('language', ''), _negated=True), fields=['language'], name='jd_language_idx'),
+        ),
+    ]
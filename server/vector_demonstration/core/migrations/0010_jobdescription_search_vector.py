@@ -0,0 +1,56 @@
+# Generated by Django 3.2.6 on 2026-10-18 11:21
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.db import migrations
+
+# Must match TEXT_SEARCH_CONFIG in core/hybrid.py. The description is HTML, so tags are dropped first.
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english', coalesce({row}title, '')), 'A')
+    || setweight(to_tsvector('english', coalesce({row}skills, '')), 'B')
+    || setweight(to_tsvector('english', regexp_replace(coalesce({row}description, ''), '<[^>]*>', ' ', 'g')), 'C')
+"""
+
+CREATE_TRIGGER_SQL = f"""
+CREATE OR REPLACE FUNCTION core_jobdescription_search_vector_update() RETURNS trigger AS $$
+BEGIN
+    NEW.search_vector := {SEARCH_VECTOR_SQL.format(row="NEW.")};
+    RETURN NEW;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS core_jobdescription_search_vector_update ON core_jobdescription;
+CREATE TRIGGER core_jobdescription_search_vector_update
+    BEFORE INSERT OR UPDATE OF title, skills, description ON core_jobdescription
+    FOR EACH ROW EXECUTE FUNCTION core_jobdescription_search_vector_update();
+"""
+
+DROP_TRIGGER_SQL = """
+DROP TRIGGER IF EXISTS core_jobdescription_search_vector_update ON core_jobdescription;
+DROP FUNCTION IF EXISTS core_jobdescription_search_vector_update();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_jobdescription_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobdescription',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(editable=False, null=True),
+        ),
+        migrations.RunSQL(CREATE_TRIGGER_SQL, reverse_sql=DROP_TRIGGER_SQL),
+        # Backfill before the index is built
+        migrations.RunSQL(
+            f"UPDATE core_jobdescription SET search_vector = {SEARCH_VECTOR_SQL.format(row='')}",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        migrations.AddIndex(
+            model_name='jobdescription',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='jd_search_vector_gin'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 3.2.6 on 2026-10-18 12:05
+
+from django.conf import settings
+from django.db import migrations, models
+
+# Job descriptions embedded before their embedding state was recorded were chunked by chunker version 1, and are
+# assumed to be embedded with the configured model from their current description. Must match ContentHash.
+BACKFILL_SQL = """
+UPDATE core_jobdescription
+SET embedding_model_id = %s,
+    embedding_chunker_version = 1,
+    embedding_content_hash = encode(sha256(convert_to(description, 'UTF8')), 'hex'),
+    embedded_at = now()
+WHERE EXISTS (SELECT 1 FROM core_jobdescriptionchunk WHERE job_description_id = core_jobdescription.id)
+"""
+
+
+def backfill_embedding_state(apps, schema_editor):
+    # Inlined rather than imported from core.encoders, so the migration doesn't change when the encoders do
+    model_id = f"{settings.EMBEDDING_MODEL_NAME}@{settings.EMBEDDING_MODEL_REVISION or 'latest'}"
+    schema_editor.execute(BACKFILL_SQL, [model_id])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_jobdescription_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='jobdescription',
+            name='embedded_at',
+            field=models.DateTimeField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobdescription',
+            name='embedding_chunker_version',
+            field=models.PositiveSmallIntegerField(editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='jobdescription',
+            name='embedding_content_hash',
+            field=models.CharField(blank=True, editable=False, max_length=64),
+        ),
+        migrations.AddField(
+            model_name='jobdescription',
+            name='embedding_model_id',
+            field=models.CharField(blank=True, editable=False, max_length=255),
+        ),
+        migrations.RunPython(backfill_embedding_state, migrations.RunPython.noop),
+    ]
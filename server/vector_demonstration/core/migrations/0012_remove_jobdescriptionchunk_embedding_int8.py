@@ -0,0 +1,17 @@
+# Generated by Django 3.2.6 on 2026-10-18 12:36
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_jobdescription_embedding_state'),
+    ]
+
+    operations = [
+        migrations.RemoveField(
+            model_name='jobdescriptionchunk',
+            name='embedding_int8',
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 3.2.6 on 2026-10-18 12:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_remove_jobdescriptionchunk_embedding_int8'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchGeneration',
+            fields=[
+                ('key', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('value', models.BigIntegerField()),
+            ],
+        ),
+    ]
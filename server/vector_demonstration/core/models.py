@@ -1,21 +1,32 @@
 import csv
 import glob
+import hashlib
 import html
+import itertools
 import logging
 import os
 import re
+import sys
 import time
 
+import numpy as np
 from django.conf import settings
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 from django.contrib.auth.tokens import default_token_generator
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVectorField
+from django.db import models, transaction
+from django.utils import timezone
 from langdetect import detect
 from langdetect.lang_detect_exception import LangDetectException
-from pgvector.django import L2Distance, VectorField
-from sentence_transformers import SentenceTransformer
-from transformers import AutoTokenizer
+from pgvector.django import BitField, HalfVectorField, HnswIndex, VectorField
 from vector_demonstration.common.models import AbstractBaseModel
+from vector_demonstration.core import encoders
+from vector_demonstration.core.batching import get_encoder_batcher
+from vector_demonstration.core.bulk_loading import copy_load
+from vector_demonstration.core.caching import bump_corpus_generation, bump_embeddings_generation, get_query_embedding_cache
+from vector_demonstration.core.metrics import timed
+from vector_demonstration.core.quantization import to_bit_string
 from vector_demonstration.utils.sites import get_site_url
 
 logger = logging.getLogger(__name__)
@@ -86,6 +97,87 @@ class User(AbstractUser, AbstractBaseModel):
         ordering = ["email"]
 
 
+class SearchCorpusQuerySet(models.QuerySet):
+    """Invalidates cached search results on bulk writes, which bypass the model signals, and normalizes the
+    embeddings of bulk created chunks, which bypass `save()`."""
+
+    def prepare(self, objs):
+        objs = list(objs)
+        if self.model is JobDescriptionChunk:
+            for obj in objs:
+                obj.quantize()
+        return objs
+
+    def bump_generation(self, chunks_changed=None):
+        if chunks_changed is None:
+            chunks_changed = self.model is JobDescriptionChunk
+        transaction.on_commit(bump_embeddings_generation if chunks_changed else bump_corpus_generation, using=self.db)
+
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(self.prepare(objs), *args, **kwargs)
+        self.bump_generation()
+        return objs
+
+    def update(self, **kwargs):
+        rows = super().update(**kwargs)
+        self.bump_generation()
+        return rows
+
+    def delete(self):
+        deleted = super().delete()
+        # Deleting job descriptions also deletes their chunks
+        self.bump_generation(chunks_changed=True)
+        return deleted
+
+    def copy_load(self, objs):
+        """Like `bulk_create`, with `COPY`, see `core/bulk_loading.py`. Existing rows with the same ids are updated."""
+        objs = copy_load(self.model, self.prepare(objs), using=self.db)
+        self.bump_generation()
+        return objs
+
+    def bulk_load(self, objs, batch_size=None):
+        """`copy_load` or `bulk_create`, according to the `BULK_LOAD_METHOD` setting."""
+        if settings.BULK_LOAD_METHOD == "copy":
+            return self.copy_load(objs)
+        return self.bulk_create(objs, batch_size=batch_size)
+
+
+# Version of `JobDescription.get_chunks`. Bump it when chunking changes, so `embed_corpus` re-embeds every job
+# description.
+CHUNKER_VERSION = 1
+
+EMBEDDING_STATE_FIELDS = ["embedding_model_id", "embedding_chunker_version", "embedding_content_hash", "embedded_at"]
+
+
+def strip_html_tags(text):
+    tag_re = re.compile(r"(<!--.*?-->|<[^>]*>)")
+    no_tags = tag_re.sub("", text)
+    return html.escape(no_tags)
+
+
+class SearchGeneration(models.Model):
+    """Counters of changes to the search corpus, which cached search results are keyed by, see core/caching.py.
+
+    Kept in the database rather than the cache, since `incr` isn't atomic with every cache backend.
+    """
+
+    key = models.CharField(max_length=64, primary_key=True)
+    value = models.BigIntegerField()
+
+    def __str__(self):
+        return f"{self.key}: {self.value}"
+
+
+class ContentHash(models.Func):
+    """SHA-256 of a text expression, like `JobDescription.get_content_hash`.
+
+    With Postgres' built-in sha256(), Django's SHA256 function requires the pgcrypto extension.
+    """
+
+    template = "encode(sha256(convert_to(%(expressions)s, 'UTF8')), 'hex')"
+    output_field = models.CharField()
+
+
 class JobDescription(AbstractBaseModel):
     title = models.CharField(max_length=255)
     company = models.CharField(max_length=255)
@@ -93,46 +185,67 @@ class JobDescription(AbstractBaseModel):
     description = models.TextField(blank=True)
     skills = models.TextField(blank=True)
     language = models.CharField(max_length=255, blank=True)
+    # Weighted title, skills and description words for lexical search.
+    # Maintained by a database trigger (see migration 0010), so bulk inserts and raw updates keep it current.
+    search_vector = SearchVectorField(null=True, editable=False)
+    # What the current chunks were embedded from, see `embed()`. Job descriptions whose model, chunker or description
+    # changed since are re-embedded by the `embed_corpus` command.
+    embedding_model_id = models.CharField(max_length=255, blank=True, editable=False)
+    embedding_chunker_version = models.PositiveSmallIntegerField(null=True, editable=False)
+    embedding_content_hash = models.CharField(max_length=64, blank=True, editable=False)
+    embedded_at = models.DateTimeField(null=True, editable=False)
+
+    objects = SearchCorpusQuerySet.as_manager()
 
     def __str__(self):
         return self.title
 
     @classmethod
-    def import_job_descriptions(cls):
-        def get_jobs_csv():
-            """Find all the CSV files in the jobs directory and return them as a generator"""
-            data_directory = os.path.join(settings.BASE_DIR, "..", "..", "data", "jobs")
-            csv_paths = glob.glob(f"{data_directory}/*.csv")
-            for csv_path in csv_paths:
-                with open(csv_path, "r") as f:
-                    yield f
-
-        for csvfile in get_jobs_csv():
-            print(f"Loading {csvfile.name}...")
-            start_time = time.time()
-
-            csvreader = csv.DictReader(csvfile, delimiter=",")
-
-            job_descriptions = []
-            for row in csvreader:
-                # try:
-                #     language = detect(row["description"])
-                # except LangDetectException:
-                #     language = ""
-                job_descriptions.append(
-                    cls(
-                        title=row["title"],
-                        company=row["company"],
-                        location=row["location"],
-                        description=row["description"],
-                        skills=row["skills"],
-                        # language=language,
-                    )
-                )
-
-            cls.objects.bulk_create(job_descriptions)
-
-            print(f"    Loaded in {time.time() - start_time} seconds.")
+    def import_job_descriptions(cls, directory=None, batch_size=1000, stdout=None):
+        """Import the CSV files of `directory`, `data/jobs` by default.
+
+        Rows are read lazily and inserted `batch_size` at a time, each batch in its own transaction, so memory use is
+        bounded by the batch size however large the files are.
+        """
+        directory = directory or os.path.join(settings.BASE_DIR, "..", "..", "data", "jobs")
+        stdout = stdout or sys.stdout
+
+        for csv_path in sorted(glob.glob(os.path.join(directory, "*.csv"))):
+            stdout.write(f"Loading {csv_path}...\n")
+            start_time = time.perf_counter()
+            imported = 0
+
+            # Descriptions are HTML spanning several lines, which the csv module only reads right without newline translation
+            with open(csv_path, newline="", encoding="utf-8") as csvfile:
+                rows = csv.DictReader(csvfile, delimiter=",")
+                for batch in iter(lambda: list(itertools.islice(rows, batch_size)), []):
+                    # try:
+                    #     language = detect(row["description"])
+                    # except LangDetectException:
+                    #     language = ""
+                    job_descriptions = [
+                        cls(
+                            title=row["title"],
+                            company=row["company"],
+                            location=row["location"],
+                            description=row["description"],
+                            skills=row["skills"],
+                            # language=language,
+                        )
+                        for row in batch
+                    ]
+                    with transaction.atomic():
+                        cls.objects.bulk_load(job_descriptions)
+                    imported += len(job_descriptions)
+                    elapsed = time.perf_counter() - start_time
+                    stdout.write(f"    Imported {imported} job descriptions ({imported / elapsed:.0f}/s)...\n")
+
+            elapsed = time.perf_counter() - start_time
+            megabytes = os.path.getsize(csv_path) / 1024 / 1024
+            stdout.write(
+                f"    Loaded {imported} job descriptions in {elapsed:.2f} seconds "
+                f"({imported / elapsed if elapsed else 0:.0f} job descriptions/s, {megabytes / elapsed if elapsed else 0:.1f} MiB/s).\n"
+            )
 
     @classmethod
     def detect_languages(cls):
@@ -156,73 +269,128 @@ class JobDescription(AbstractBaseModel):
             job_description.language = language
             job_description.save()
 
+    def get_content_hash(self):
+        """SHA-256 of the raw description, the same as the `ContentHash` of the description computed by Postgres."""
+        return hashlib.sha256(self.description.encode()).hexdigest()
+
+    def get_chunks(self, chunk_size=750):
+        """Naive chunking of the description, without HTML tags.
+
+        `chunk_size` is the number of characters per chunk.
+        """
+        content = strip_html_tags(self.description).replace("\n", " ")
+        while content:
+            chunk, content = content[:chunk_size], content[chunk_size:]
+            yield chunk
+
     def generate_embeddings(self):
-        def strip_html_tags(text):
-            tag_re = re.compile(r"(<!--.*?-->|<[^>]*>)")
-            no_tags = tag_re.sub("", text)
-            return html.escape(no_tags)
-
-        def get_chunks(jd_content, chunk_size=750):
-            """Naive chunking of job description.
-
-            `chunk_size` is the number of characters per chunk.
-            """
-            chunk_size = chunk_size
-            content = strip_html_tags(jd_content).replace("\n", " ")
-            while content:
-                chunk, content = content[:chunk_size], content[chunk_size:]
-                yield chunk
-
-        # 1. Set up the embedding model
-        model = SentenceTransformer("all-MiniLM-L6-v2")
-        tokenizer = AutoTokenizer.from_pretrained("sentence-transformers/all-MiniLM-L6-v2")
-
-        # 2. Chunk the job description into sentences
-        chunk_embeddings = ((c, tokenizer.tokenize(c), model.encode(c)) for c in get_chunks(self.description))
-
-        # 3. Save the embeddings information for each chunk
-        jd_chunks = []
-        for chunk_content, chunk_tokens, chunk_embedding in chunk_embeddings:
-            jd_chunks.append(
-                JobDescriptionChunk(
-                    job_description=self,
-                    chunk=chunk_content,
-                    token_count=len(chunk_tokens),
-                    embedding=chunk_embedding,
-                )
-            )
+        return JobDescription.embed([self])
+
+    @classmethod
+    def embed(cls, job_descriptions, batch_size=None):
+        """Chunk `job_descriptions` and replace their chunks with the new ones and their embeddings. Returns the chunks.
 
-        JobDescriptionChunk.objects.bulk_create(jd_chunks)
+        The chunks of every job description are tokenized with one tokenizer call and encoded with one model call,
+        `batch_size` (`EMBEDDING_BATCH_SIZE` by default) chunks per forward pass, so embedding many job descriptions
+        together keeps the model busy with full batches.
+        """
+        # 1. Chunk every job description
+        chunks = [
+            JobDescriptionChunk(job_description=job_description, chunk=chunk)
+            for job_description in job_descriptions
+            for chunk in job_description.get_chunks()
+        ]
+
+        # 2. Count tokens and encode the chunks, each in one call for the whole batch.
+        #    Embeddings are L2-normalized so inner product, cosine and L2 distance all rank chunks the same way
+        if chunks:
+            texts = [chunk.chunk for chunk in chunks]
+            token_ids = encoders.get_tokenizer()(texts, add_special_tokens=False)["input_ids"]
+            embeddings = encoders.get_model().encode(
+                texts, batch_size=batch_size or settings.EMBEDDING_BATCH_SIZE, normalize_embeddings=True
+            )
+            for chunk, chunk_token_ids, embedding in zip(chunks, token_ids, embeddings):
+                chunk.token_count = len(chunk_token_ids)
+                chunk.embedding = embedding
+
+        # 3. Replace the chunks, and record what they were embedded from
+        embedded_at = timezone.now()
+        for job_description in job_descriptions:
+            job_description.embedding_model_id = encoders.get_model_id()
+            job_description.embedding_chunker_version = CHUNKER_VERSION
+            job_description.embedding_content_hash = job_description.get_content_hash()
+            job_description.embedded_at = embedded_at
+        with transaction.atomic(using=cls.objects.db):
+            JobDescriptionChunk.objects.filter(job_description__in=job_descriptions).delete()
+            cls.objects.bulk_update(job_descriptions, EMBEDDING_STATE_FIELDS)
+            return JobDescriptionChunk.objects.bulk_load(chunks, batch_size=1000)
 
     @classmethod
-    def search(cls, query=None):
+    def rank(cls, query=None, limit=50, retrieval="vector", query_embedding=None, **search_options):
+        """The top `limit` job descriptions for `query` as search hits, without loading them.
+
+        `query_embedding` skips encoding `query` when its embedding was already computed, see `encode_query`.
+        """
+        # Imported here because the search modules depend on these models
+        from vector_demonstration.core.hybrid import hybrid_search
+        from vector_demonstration.core.search import get_search_engine
+
         query = (
             query
             or "The student would prefer a job in the arts. They have a background in choir and theater. Major: Music. Minor: Theater. Graduating Year: 2022"
         )
-        # > expected result: list of Job Descriptions in descending order of relevance
-        model = SentenceTransformer("all-MiniLM-L6-v2")
-        query_embedding = model.encode(query)
+        # > expected result: the top `limit` Job Descriptions in descending order of relevance
+        if query_embedding is None:
+            with timed("encode"):
+                query_embedding = cls.encode_query(query)
+
+        with timed("rank"):
+            if retrieval != "vector":
+                return hybrid_search(query, query_embedding, limit=limit, retrieval=retrieval, **search_options)
+            return get_search_engine().search(query_embedding, limit=limit, **search_options)
+
+    @staticmethod
+    def encode_query(query):
+        # Repeated queries are served from the cache without running the model, and queries encoded concurrently
+        # by other requests share the same model call
+        return get_query_embedding_cache().get_or_encode(query, encoders.get_model_id(), get_encoder_batcher().encode)
 
-        jd_chunks = JobDescriptionChunk.objects.annotate(distance=L2Distance("embedding", query_embedding)).order_by("distance")
+    @classmethod
+    def search(cls, query=None, limit=50, with_embeddings=False, **search_options):
+        """Ranked `JobDescriptionSearchResult`s, with the chunk embeddings deferred unless `with_embeddings`."""
+        from vector_demonstration.core.search import build_search_results
 
-        unique_jds = {}
-        for chunk in jd_chunks:
-            if chunk.job_description.id not in unique_jds:
-                unique_jds[chunk.job_description.id] = {
-                    "job_description": chunk.job_description,
-                    "chunks": [chunk],
-                }
-            else:
-                unique_jds[chunk.job_description.id]["chunks"].append(chunk)
+        return build_search_results(cls.rank(query, limit=limit, **search_options), with_embeddings=with_embeddings)
 
-        results = []
-        for k, v in unique_jds.items():
-            score = sum([c.distance for c in v["chunks"]]) / len(v["chunks"])
-            job_description = v["job_description"]
-            results.append(JobDescriptionSearchResult(score, job_description, v["chunks"]))
+    @classmethod
+    def rank_many(cls, queries, limit=50, **search_options):
+        """Like `rank` for a batch of queries, encoded together and ranked with one search engine call."""
+        from vector_demonstration.core.search import get_search_engine
+
+        with timed("encode"):
+            query_embeddings = get_query_embedding_cache().get_or_encode_many(
+                queries,
+                encoders.get_model_id(),
+                lambda qs: encoders.get_model().encode(qs, batch_size=settings.EMBEDDING_BATCH_SIZE, normalize_embeddings=True),
+            )
+        with timed("rank"):
+            return get_search_engine().search_many(query_embeddings, limit=limit, **search_options)
+
+    @classmethod
+    def search_many(cls, queries, limit=50, with_embeddings=False, **search_options):
+        from vector_demonstration.core.search import build_search_results_many
 
-        return sorted(results, key=lambda r: r.score)
+        return build_search_results_many(cls.rank_many(queries, limit=limit, **search_options), with_embeddings=with_embeddings)
+
+    class Meta:
+        # Search filters, see `FILTER_FIELDS` in core/search.py. Language is blank until `detect_languages`
+        # runs, so only job descriptions with a detected language are indexed.
+        indexes = [
+            models.Index(name="jd_company_idx", fields=["company"]),
+            models.Index(name="jd_location_idx", fields=["location"]),
+            models.Index(name="jd_language_idx", fields=["language"], condition=~models.Q(language="")),
+            GinIndex(name="jd_search_vector_gin", fields=["search_vector"]),
+        ]
 
 
 class JobDescriptionChunk(AbstractBaseModel):
@@ -230,10 +398,54 @@ class JobDescriptionChunk(AbstractBaseModel):
     chunk = models.TextField()
     token_count = models.IntegerField(null=True)
     embedding = VectorField(dimensions=384)
+    # Compressed copies of `embedding` for quantized search, see `quantize()`
+    embedding_half = HalfVectorField(dimensions=384, null=True)
+    embedding_binary = BitField(length=384, null=True)
+
+    objects = SearchCorpusQuerySet.as_manager()
 
     def __str__(self):
         return f"{self.job_description.title} - {self.chunk[:50]}"
 
+    def save(self, *args, **kwargs):
+        self.quantize()
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        # Not with a post_delete receiver, which would disable fast deletes, see core/signals.py
+        deleted = super().delete(*args, **kwargs)
+        transaction.on_commit(bump_embeddings_generation, using=self._state.db)
+        return deleted
+
+    def quantize(self):
+        """L2-normalize `embedding` and fill in its half precision and binary copies.
+
+        Search ranks by inner product and derives the cosine and L2 distances from it, which only holds for unit
+        vectors, see `METRICS` in core/search.py.
+        """
+        if self.embedding is None:
+            return
+        embedding = np.asarray(self.embedding, dtype=np.float32)
+        norm = np.linalg.norm(embedding)
+        if norm > 0:
+            embedding = embedding / norm
+        self.embedding = embedding
+        self.embedding_half = embedding
+        self.embedding_binary = to_bit_string(embedding)
+
+    class Meta:
+        # ANN index used by search, which always scans by inner product.
+        # See the `build_vector_index` command for other index types and parameters.
+        indexes = [
+            HnswIndex(
+                name="jd_chunk_embedding_hnsw_ip",
+                fields=["embedding"],
+                m=16,
+                ef_construction=64,
+                opclasses=["vector_ip_ops"],
+            ),
+        ]
+
 
 class JobDescriptionSearchResult:
     def __init__(self, score, job_description, chunks):
@@ -1,4 +1,11 @@
-from rest_framework.pagination import PageNumberPagination
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core import signing
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
 
 
 class PageNumberPagination(PageNumberPagination):
@@ -9,3 +16,70 @@ class PageNumberPagination(PageNumberPagination):
 
     page_size_query_param = "page_size"
     page_size = 25
+
+
+class SearchCursorPagination(BasePagination):
+    """Pages through a ranking cached by ``get_cached_ranking`` without searching again.
+
+    The first page is returned by the search itself, along with a ``next`` URL whose opaque ``cursor``
+    references the cached ranking, the offset and the page size. Following it serves the next page from the
+    same ranking, so paging costs one query for the page's job descriptions and one for their chunks.
+    Cursors are signed, and expire after ``SEARCH_CURSOR_TTL`` seconds along with the ranking they reference.
+    """
+
+    cursor_query_param = "cursor"
+    page_size_query_param = "page_size"
+    invalid_cursor_message = "Invalid or expired cursor, repeat the search to get a new one."
+    salt = "search-cursor"
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return settings.SEARCH_PAGE_SIZE
+        return min(max(page_size, 1), settings.SEARCH_MAX_PAGE_SIZE)
+
+    def decode_cursor(self, request):
+        """Return the ``(ranking_key, offset, page_size)`` referenced by the request's cursor."""
+        try:
+            cursor = signing.loads(request.query_params[self.cursor_query_param], salt=self.salt, max_age=settings.SEARCH_CURSOR_TTL)
+            return cursor["ranking"], int(cursor["offset"]), int(cursor["page_size"])
+        except (KeyError, ValueError, TypeError, signing.BadSignature):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, offset):
+        cursor = signing.dumps({"ranking": self.ranking_key, "offset": offset, "page_size": self.page_size}, salt=self.salt, compress=True)
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def paginate_ranking(self, hits, ranking_key, request, offset=0, page_size=None):
+        """Return the hits of the requested page of a ranking."""
+        self.ranking_key = ranking_key
+        self.count = len(hits)
+        self.offset = offset
+        self.page_size = page_size or self.get_page_size(request)
+        url = request.build_absolute_uri()
+        self.base_url = remove_query_param(remove_query_param(url, self.cursor_query_param), self.page_size_query_param)
+        return hits[offset : offset + self.page_size]
+
+    def get_next_link(self):
+        if self.offset + self.page_size >= self.count:
+            return None
+        return self.encode_cursor(self.offset + self.page_size)
+
+    def get_previous_link(self):
+        if self.offset <= 0:
+            return None
+        return self.encode_cursor(max(self.offset - self.page_size, 0))
+
+    def get_paginated_data(self, data):
+        return OrderedDict(
+            [
+                ("count", self.count),
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+                ("results", data),
+            ]
+        )
+
+    def get_paginated_response(self, data):
+        return Response(self.get_paginated_data(data))
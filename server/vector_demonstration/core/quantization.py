@@ -0,0 +1,40 @@
+import numpy as np
+from pgvector import Bit
+
+# Embeddings are L2-normalized, so every component is within [-1, 1] and a fixed scale loses little precision
+INT8_SCALE = 127
+
+# Number of set bits in every possible byte, for Hamming distances between packed bit vectors
+POPCOUNT = np.array([bin(byte).count("1") for byte in range(256)], dtype=np.uint8)
+
+
+def quantize_int8(embeddings):
+    """Scalar quantization, 1 byte per dimension instead of 4."""
+    return np.clip(np.rint(np.asarray(embeddings, dtype=np.float32) * INT8_SCALE), -INT8_SCALE, INT8_SCALE).astype(np.int8)
+
+
+def quantize_binary(embeddings):
+    """Sign bits packed 8 per byte, 1 bit per dimension instead of 32. Matches pgvector's `binary_quantize`."""
+    return np.packbits(np.asarray(embeddings) > 0, axis=-1)
+
+
+def to_bit_string(embedding):
+    """Sign bits of a single embedding, as stored in a pgvector `bit` column."""
+    return Bit(np.asarray(embedding) > 0).to_text()
+
+
+def hamming_distances(packed_embeddings, packed_query):
+    return POPCOUNT[np.bitwise_xor(packed_embeddings, packed_query)].sum(axis=1, dtype=np.int32)
+
+
+def blockwise_negative_inner_products(embeddings, query_embedding, block_size=65536):
+    """Negative inner products of compressed (e.g. int8) `embeddings` with a float32 query.
+
+    Rows are converted to float32 a block at a time, so only the compressed matrix needs to be read from memory.
+    """
+    query_embedding = np.asarray(query_embedding, dtype=np.float32)
+    result = np.empty(len(embeddings), dtype=np.float32)
+    for start in range(0, len(embeddings), block_size):
+        block = embeddings[start : start + block_size].astype(np.float32)
+        result[start : start + block_size] = -(block @ query_embedding)
+    return result
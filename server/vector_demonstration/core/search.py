@@ -0,0 +1,571 @@
+import copy
+import hashlib
+import json
+import threading
+import time
+from collections import namedtuple
+from functools import partial
+from math import ceil
+
+import numpy as np
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection, transaction
+from pgvector.django import VectorField
+
+from . import snapshots
+from .caching import get_corpus_generation, get_embeddings_generation
+from .embedding_index import EmbeddingIndex, as_id_array, as_id_values
+from .metrics import timed
+from .models import JobDescription, JobDescriptionChunk, JobDescriptionSearchResult
+from .quantization import INT8_SCALE, blockwise_negative_inner_products, hamming_distances, quantize_binary
+
+# How a job's score is derived from the distances of its matching chunks. Lower is better.
+# "softmin" is a smooth minimum, -temperature * log(sum(exp(-distance / temperature))): close to "min" at low
+# temperatures, it also rewards jobs with several good chunks as the temperature rises. Distances are at most
+# 2 in absolute value, so exp() can't overflow down to the minimum temperature the API accepts (0.01).
+# "token_weighted_mean" weighs each chunk by its token count, so a posting's short trailing chunk counts less than
+# a full one. Chunks with an unknown token count are left out, and jobs without any fall back to "mean".
+AGGREGATIONS = {
+    "mean": "avg(distance)",
+    "min": "min(distance)",
+    "top_n_mean": "avg(distance) FILTER (WHERE chunk_rank <= %(top_n)s)",
+    "softmin": "-%(temperature)s * ln(sum(exp(-distance / %(temperature)s)))",
+    "token_weighted_mean": "coalesce(sum(distance * token_count) / nullif(sum(token_count), 0), avg(distance))",
+}
+
+# Distance of a chunk from the query, derived from their negative inner product. Embeddings are L2-normalized,
+# so all three rank chunks identically and can be served by the same inner product index.
+METRICS = {
+    "inner_product": "negative_inner_product",
+    "cosine": "1 + negative_inner_product",
+    "l2": "sqrt(greatest(2 + 2 * negative_inner_product, 0))",
+}
+
+# NumPy equivalents of METRICS and AGGREGATIONS, see NumpySearchEngine
+NUMPY_METRICS = {
+    "inner_product": lambda negative_inner_product: negative_inner_product,
+    "cosine": lambda negative_inner_product: 1 + negative_inner_product,
+    "l2": lambda negative_inner_product: np.sqrt(np.maximum(2 + 2 * negative_inner_product, 0)),
+}
+
+# Each takes the candidates' distances, their CandidateGroups and the search's AggregationOptions
+NUMPY_AGGREGATIONS = {
+    "mean": lambda distances, groups, options: np.bincount(groups.inverse, weights=distances) / groups.counts,
+    "min": lambda distances, groups, options: np.minimum.reduceat(distances[groups.order], groups.starts),
+    "top_n_mean": lambda distances, groups, options: (
+        np.bincount(groups.inverse, weights=np.where(groups.ranks < options.top_n, distances, 0)) / np.minimum(groups.counts, options.top_n)
+    ),
+    "softmin": lambda distances, groups, options: (
+        # In float64 like Postgres, exp() of float32 distances overflows from a temperature of about 0.02
+        -options.temperature
+        * np.log(np.bincount(groups.inverse, weights=np.exp(-distances.astype(np.float64) / options.temperature)))
+    ),
+    "token_weighted_mean": lambda distances, groups, options: token_weighted_mean(distances, groups),
+}
+
+# Coarse distance of a chunk from the query over one of its compressed embeddings, see JobDescriptionChunk.quantize
+QUANTIZED_DISTANCES = {
+    "half": "embedding_half <#> {query}::halfvec",
+    "binary": "embedding_binary <~> binary_quantize({query})",
+}
+
+# Chunk columns only loaded into search results when their embeddings are requested, see build_search_results_many
+EMBEDDING_FIELDS = ["embedding", "embedding_half", "embedding_binary"]
+
+# NumPy equivalents of QUANTIZED_DISTANCES, over the compressed matrices of EmbeddingIndex.get_quantized
+NUMPY_QUANTIZED_DISTANCES = {
+    "half": lambda embeddings, query_embedding: blockwise_negative_inner_products(embeddings, query_embedding),
+    "int8": lambda embeddings, query_embedding: blockwise_negative_inner_products(embeddings, query_embedding * INT8_SCALE),
+    "binary": lambda embeddings, query_embedding: hamming_distances(embeddings, quantize_binary(query_embedding)),
+}
+
+# JobDescription fields search results can be restricted to, by exact match. Search engines also accept "id"
+# and lists of values, matching any of them.
+FILTER_FIELDS = ["company", "location", "language"]
+
+# How filtered searches are planned: "prefilter" scans every chunk of the matching job descriptions exactly,
+# "postfilter" scans the nearest chunks through the ANN index and drops those that don't match.
+# "auto" picks one from the estimated share of job descriptions that match, see `SEARCH_PREFILTER_SELECTIVITY`.
+FILTER_STRATEGIES = ["auto", "prefilter", "postfilter"]
+
+# Largest (chunks, queries) matrix of inner products the numpy engine computes at once, 128 MB of float32
+MAX_PRODUCT_SIZE = 2**25
+
+# Post-filtering scans at most this many times more chunks than it needs, however narrow the filter
+MAX_OVERFETCH = 100
+
+# pgvector's maximum `hnsw.ef_search`. Without iterative scans, an HNSW scan returns at most `ef_search` chunks.
+MAX_EF_SEARCH = 1000
+
+# Candidates grouped by job description, see NumpySearchEngine.rank
+CandidateGroups = namedtuple("CandidateGroups", ["inverse", "counts", "order", "starts", "ranks", "token_counts"])
+
+AggregationOptions = namedtuple("AggregationOptions", ["top_n", "temperature"])
+
+SearchHit = namedtuple("SearchHit", ["job_description_id", "score", "chunk_ids", "chunk_distances"])
+
+
+class PgvectorSearchEngine:
+    """Ranks job descriptions inside Postgres.
+
+    The nearest `candidates` chunks are selected first, so the amount of work per query is bounded
+    regardless of corpus size. Those chunks are then grouped by job description, scored, ordered and
+    limited in the same statement, and only the top `limit` jobs (with their best chunks) are returned.
+
+    Chunks are always found by inner product, the cheapest operator for normalized vectors, and the
+    requested metric is computed from it. An HNSW scan only returns `ef_search` chunks at a time, so index
+    scans are iterative (see `SEARCH_ITERATIVE_SCAN`) and go on until every candidate is found. Without
+    iterative scans, `ef_search` is raised to the number of chunks needed and candidates are capped at
+    `MAX_EF_SEARCH`.
+
+    With a `quantization`, a pool of `SEARCH_RERANK_POOL_FACTOR` times as many chunks is first found by
+    scanning the compressed embeddings, and the candidates are the nearest chunks of that pool by exact
+    inner product.
+
+    `filters` are pushed into the chunk scan. Narrow filters are applied first, through the B-tree indexes
+    on job descriptions, and only the chunks of matching job descriptions are ranked. Broad filters are
+    applied to the nearest chunks found through the ANN index, over-fetched in proportion to the share of
+    job descriptions filtered out.
+
+    `search_many` ranks a batch of queries with the same statement, one lateral subquery per query, in a
+    single round trip.
+    """
+
+    quantizations = list(QUANTIZED_DISTANCES)
+
+    sql = """
+        WITH candidates AS (
+            SELECT id, job_description_id, token_count, embedding <#> {query} AS negative_inner_product
+            FROM {chunks}
+            ORDER BY embedding <#> {query}
+            LIMIT %(candidates)s
+        ), distances AS (
+            SELECT id, job_description_id, token_count, {distance} AS distance
+            FROM candidates
+        ), ranked AS (
+            SELECT
+                id,
+                job_description_id,
+                token_count,
+                distance,
+                row_number() OVER (PARTITION BY job_description_id ORDER BY distance, id) AS chunk_rank
+            FROM distances
+        )
+        SELECT
+            job_description_id,
+            {aggregation} AS score,
+            (array_agg(id ORDER BY distance, id))[1:%(chunks_per_result)s] AS chunk_ids,
+            (array_agg(distance ORDER BY distance, id))[1:%(chunks_per_result)s] AS chunk_distances
+        FROM ranked
+        GROUP BY job_description_id
+        ORDER BY score, job_description_id
+        LIMIT %(limit)s
+    """
+
+    # Nearest chunks by a quantized distance, re-ranked in place of the whole table
+    pool_sql = """(
+        SELECT *
+        FROM {chunks}
+        ORDER BY {quantized_distance}
+        LIMIT %(pool)s
+    ) AS pool"""
+
+    filter_sql = "job_description_id IN (SELECT id FROM {job_description_table} WHERE {conditions})"
+
+    # OFFSET 0 keeps Postgres from flattening the subquery and scanning the ANN index with the filter applied
+    # afterwards, which would return fewer than `candidates` chunks for narrow filters.
+    prefilter_sql = """(
+        SELECT *
+        FROM {chunks}
+        WHERE {filter}
+        OFFSET 0
+    ) AS filtered"""
+
+    postfilter_sql = """(
+        SELECT *
+        FROM {chunks}
+        ORDER BY embedding <#> {query}
+        LIMIT %(filter_pool)s
+    ) AS nearest
+    WHERE {filter}"""
+
+    # One ranking per query embedding, in the order of the queries
+    batch_sql = """
+        SELECT queries.query_index, ranking.*
+        FROM unnest(%(queries)s::vector[]) WITH ORDINALITY AS queries(embedding, query_index)
+        CROSS JOIN LATERAL ({ranking_sql}) AS ranking
+        ORDER BY queries.query_index, ranking.score, ranking.job_description_id
+    """
+
+    def search(self, query_embedding, limit, **search_options):
+        sql, params, index_params = self.get_ranking_sql("%(query)s::vector", limit, **search_options)
+        params["query"] = VectorField().get_prep_value(query_embedding)
+        with transaction.atomic(), connection.cursor() as cursor:
+            self.set_index_params(cursor, *index_params)
+            cursor.execute(sql, params)
+            return [SearchHit(*row) for row in cursor.fetchall()]
+
+    def search_many(self, query_embeddings, limit, **search_options):
+        """Rank job descriptions for each of `query_embeddings` with a single statement."""
+        ranking_sql, params, index_params = self.get_ranking_sql("queries.embedding", limit, **search_options)
+        params["queries"] = [VectorField().get_prep_value(query_embedding) for query_embedding in query_embeddings]
+        hits = [[] for _ in query_embeddings]
+        with transaction.atomic(), connection.cursor() as cursor:
+            self.set_index_params(cursor, *index_params)
+            cursor.execute(self.batch_sql.format(ranking_sql=ranking_sql), params)
+            for query_index, *row in cursor.fetchall():
+                hits[query_index - 1].append(SearchHit(*row))
+        return hits
+
+    @staticmethod
+    def set_index_params(cursor, ef_search, probes, iterative_scan):
+        # ANN index scan parameters, scoped to this transaction. Higher values trade latency for recall.
+        index_params = {"hnsw.ef_search": ef_search, "ivfflat.probes": probes}
+        if iterative_scan:
+            # Scans continue past `ef_search` and `probes` until the LIMIT is met, in nearly distance order
+            index_params.update({"hnsw.iterative_scan": "relaxed_order", "ivfflat.iterative_scan": "relaxed_order"})
+        cursor.execute(
+            "SELECT " + ", ".join("set_config(%s, %s, true)" for _ in index_params),
+            [str(value) for item in index_params.items() for value in item],
+        )
+
+    def get_ranking_sql(
+        self,
+        query,
+        limit,
+        aggregation="mean",
+        top_n=3,
+        temperature=None,
+        metric=None,
+        chunks_per_result=None,
+        ef_search=None,
+        probes=None,
+        quantization=None,
+        filters=None,
+        filter_strategy="auto",
+    ):
+        """The ranking statement for the query embedding `query` (an SQL expression), its parameters and the
+        `(ef_search, probes, iterative_scan)` to scan the ANN index with."""
+        metric = metric or settings.SEARCH_DISTANCE_METRIC
+        chunks_per_result = chunks_per_result or settings.SEARCH_CHUNKS_PER_RESULT
+        ef_search = ef_search or settings.SEARCH_HNSW_EF_SEARCH
+        probes = probes or settings.SEARCH_IVFFLAT_PROBES
+        iterative_scan = settings.SEARCH_ITERATIVE_SCAN
+        candidates = max(settings.SEARCH_CANDIDATE_CHUNKS, limit * chunks_per_result)
+        if not iterative_scan:
+            candidates = min(candidates, MAX_EF_SEARCH)
+        params = {
+            "candidates": candidates,
+            "pool": candidates * settings.SEARCH_RERANK_POOL_FACTOR,
+            "chunks_per_result": chunks_per_result,
+            "limit": limit,
+            "top_n": top_n,
+            "temperature": temperature or settings.SEARCH_SOFTMIN_TEMPERATURE,
+        }
+        chunks = JobDescriptionChunk._meta.db_table
+
+        filters = {field: value for field, value in (filters or {}).items() if value is not None}
+        if filters:
+            params.update({f"filter_{field}": value for field, value in filters.items()})
+            conditions = " AND ".join(get_filter_condition(field, value, f"%(filter_{field})s") for field, value in filters.items())
+            filter_sql = self.filter_sql.format(job_description_table=JobDescription._meta.db_table, conditions=conditions)
+            # Pre-filtering ranks every matching chunk whatever their share, so explicit prefilters (e.g. the lexical
+            # matches of hybrid search) don't pay for an estimate
+            selectivity = self.estimate_selectivity(filters) if filter_strategy != "prefilter" else None
+            if filter_strategy == "auto":
+                filter_strategy = "prefilter" if selectivity <= settings.SEARCH_PREFILTER_SELECTIVITY else "postfilter"
+            if filter_strategy == "prefilter":
+                chunks = self.prefilter_sql.format(chunks=chunks, filter=filter_sql)
+            else:
+                # Enough of the nearest chunks that `candidates` of them are expected to pass the filter
+                params["filter_pool"] = ceil(candidates / max(selectivity, 1 / MAX_OVERFETCH))
+                params["pool"] = params["filter_pool"] * settings.SEARCH_RERANK_POOL_FACTOR
+
+        if not iterative_scan:
+            # The index scan has to return every chunk of the outermost pool at once
+            for pool in ["pool", "filter_pool"]:
+                if pool in params:
+                    params[pool] = min(params[pool], MAX_EF_SEARCH)
+            scanned = params["pool"] if quantization else params.get("filter_pool", candidates)
+            ef_search = min(max(ef_search, scanned), MAX_EF_SEARCH)
+
+        if quantization:
+            quantized_distance = QUANTIZED_DISTANCES[quantization].format(query=query)
+            chunks = self.pool_sql.format(chunks=chunks, quantized_distance=quantized_distance)
+        if filters and filter_strategy == "postfilter":
+            chunks = self.postfilter_sql.format(chunks=chunks, filter=filter_sql, query=query)
+        sql = self.sql.format(
+            query=query,
+            chunks=chunks,
+            distance=METRICS[metric],
+            aggregation=AGGREGATIONS[aggregation],
+        )
+        return sql, params, (ef_search, probes, iterative_scan)
+
+    @staticmethod
+    def estimate_selectivity(filters):
+        """Share of job descriptions matching `filters`, from the planner's statistics rather than counting them.
+
+        Estimates are cached per corpus generation, so repeated filters cost no extra query.
+        """
+        digest = hashlib.sha256(json.dumps(filters, sort_keys=True, default=str).encode()).hexdigest()
+        key = f"search-filter-selectivity:{get_corpus_generation()}:{digest}"
+        selectivity = cache.get(key)
+        if selectivity is None:
+            table = JobDescription._meta.db_table
+            conditions = " AND ".join(get_filter_condition(field, value, "%s") for field, value in filters.items())
+            with connection.cursor() as cursor:
+                cursor.execute(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table} WHERE {conditions}", list(filters.values()))
+                matching = cursor.fetchone()[0][0]["Plan"]["Plan Rows"]
+                cursor.execute(f"EXPLAIN (FORMAT JSON) SELECT 1 FROM {table}")
+                total = cursor.fetchone()[0][0]["Plan"]["Plan Rows"]
+            selectivity = min(matching / max(total, 1), 1.0)
+            cache.set(key, selectivity, timeout=settings.SEARCH_RESULT_CACHE_TTL)
+        return selectivity
+
+
+class NumpySearchEngine:
+    """Exact search over an in-memory copy of every chunk embedding.
+
+    A query costs one matrix-vector product and a partial sort, with no database round trip until the
+    results are loaded. The copy is reloaded whenever chunks change, not on edits to job descriptions alone, at
+    most `SEARCH_NUMPY_VERSION_CHECK_SECONDS` later.
+    Suitable for corpora that fit in RAM: each worker holds `chunks * 384 * 4` bytes of embeddings.
+
+    With `SEARCH_SNAPSHOT_DIR` set, the embeddings are memory mapped from the current snapshot instead,
+    shared by every worker, and reloaded when a new snapshot is exported.
+
+    With a `quantization`, the full scan runs over a compressed copy of the embeddings (2, 4 or 32 times
+    less memory traffic) and only a pool of `SEARCH_RERANK_POOL_FACTOR` times as many chunks as needed
+    is re-ranked against the float32 embeddings.
+    """
+
+    quantizations = list(NUMPY_QUANTIZED_DISTANCES)
+
+    def __init__(self):
+        self._index = None
+        self._checked_at = None
+        self._lock = threading.Lock()
+
+    def get_index(self):
+        # Checking the version takes a database query (or reading the snapshot directory), so queries within
+        # `SEARCH_NUMPY_VERSION_CHECK_SECONDS` of the last check are served from the current index
+        now = time.monotonic()
+        if self._index is not None and now - self._checked_at < settings.SEARCH_NUMPY_VERSION_CHECK_SECONDS:
+            return self._index
+        version = self.get_current_version()
+        if self._index is None or self._index.version != version:
+            with self._lock:
+                if self._index is None or self._index.version != version:
+                    self._index = self.load_index(version)
+        self._checked_at = now
+        return self._index
+
+    def get_current_version(self):
+        if settings.SEARCH_SNAPSHOT_DIR:
+            # Snapshot mode serves the latest exported snapshot rather than following the database
+            version = snapshots.get_current_version(settings.SEARCH_SNAPSHOT_DIR)
+            if version is None:
+                raise ImproperlyConfigured(f"No embedding snapshot in {settings.SEARCH_SNAPSHOT_DIR}, run export_embedding_snapshot")
+            return version
+        # Not the corpus generation: edits to job descriptions alone don't change the index
+        return get_embeddings_generation()
+
+    def load_index(self, version):
+        if settings.SEARCH_SNAPSHOT_DIR:
+            return EmbeddingIndex.from_snapshot(settings.SEARCH_SNAPSHOT_DIR, version)
+        return EmbeddingIndex.from_database(version)
+
+    def search(self, query_embedding, limit, **search_options):
+        return self.search_many([query_embedding], limit, **search_options)[0]
+
+    def search_many(
+        self,
+        query_embeddings,
+        limit,
+        aggregation="mean",
+        top_n=3,
+        temperature=None,
+        metric=None,
+        chunks_per_result=None,
+        quantization=None,
+        filters=None,
+        **index_options,
+    ):
+        """Rank job descriptions for each of `query_embeddings`, with one matrix product for the whole batch."""
+        metric = metric or settings.SEARCH_DISTANCE_METRIC
+        chunks_per_result = chunks_per_result or settings.SEARCH_CHUNKS_PER_RESULT
+        index = self.get_index()
+        # Positions of the chunks to search, all of them unless filtered
+        positions = self.get_filtered_positions(index, filters)
+        candidates = min(
+            max(settings.SEARCH_CANDIDATE_CHUNKS, limit * chunks_per_result), len(index) if positions is None else len(positions)
+        )
+        if not candidates:
+            return [[] for _ in query_embeddings]
+        query_embeddings = np.asarray(query_embeddings, dtype=np.float32)
+
+        rank = partial(
+            self.rank,
+            index,
+            candidates=candidates,
+            limit=limit,
+            aggregation=aggregation,
+            aggregation_options=AggregationOptions(top_n, temperature or settings.SEARCH_SOFTMIN_TEMPERATURE),
+            metric=metric,
+            chunks_per_result=chunks_per_result,
+        )
+
+        if quantization:
+            # Coarse scan of the compressed embeddings, exact inner products for the pool only
+            quantized = index.get_quantized(quantization)
+            if positions is not None:
+                quantized = quantized[positions]
+            pool_size = min(candidates * settings.SEARCH_RERANK_POOL_FACTOR, len(quantized))
+            hits = []
+            for query_embedding in query_embeddings:
+                quantized_distances = NUMPY_QUANTIZED_DISTANCES[quantization](quantized, query_embedding)
+                pool = np.sort(np.argpartition(quantized_distances, pool_size - 1)[:pool_size])
+                pool = pool if positions is None else positions[pool]
+                hits.append(rank(-(index.embeddings[pool] @ query_embedding), pool))
+            return hits
+
+        embeddings = index.embeddings if positions is None else index.embeddings[positions]
+        # As many queries per matrix product as fit in MAX_PRODUCT_SIZE
+        queries_per_product = max(MAX_PRODUCT_SIZE // len(embeddings), 1)
+        hits = []
+        for start in range(0, len(query_embeddings), queries_per_product):
+            # (chunks, queries), one column per query
+            negative_inner_products = -(embeddings @ query_embeddings[start : start + queries_per_product].T)
+            hits.extend(rank(negative_inner_products[:, column], positions) for column in range(negative_inner_products.shape[1]))
+        return hits
+
+    @staticmethod
+    def rank(index, negative_inner_products, positions, *, candidates, limit, aggregation, aggregation_options, metric, chunks_per_result):
+        """Search hits from the negative inner products of the query with the chunks at `positions` (all if None)."""
+        # 1. Nearest chunks, ordered by distance.
+        # Sorted by position first, so chunks at equal distances stay ordered by id like in the SQL engine
+        nearest = np.sort(np.argpartition(negative_inner_products, candidates - 1)[:candidates])
+        nearest = nearest[np.argsort(negative_inner_products[nearest], kind="stable")]
+        distances = NUMPY_METRICS[metric](negative_inner_products[nearest])
+        if positions is not None:
+            nearest = positions[nearest]
+
+        # 2. Group the candidates by job description and rank them within each job
+        job_indexes, inverse = np.unique(index.job_indexes[nearest], return_inverse=True)
+        counts = np.bincount(inverse)
+        order = np.argsort(inverse, kind="stable")
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        ranks = np.empty(len(nearest), dtype=np.int64)
+        ranks[order] = np.arange(len(nearest)) - np.repeat(starts, counts)
+        groups = CandidateGroups(inverse, counts, order, starts, ranks, index.token_counts[nearest])
+
+        # 3. Score each job, ties broken by job description id like the SQL engine
+        scores = NUMPY_AGGREGATIONS[aggregation](distances, groups, aggregation_options)
+        top = np.lexsort((job_indexes, scores))[:limit]
+
+        hits = []
+        for group in top:
+            best = order[starts[group] : starts[group] + min(counts[group], chunks_per_result)]
+            hits.append(
+                SearchHit(
+                    job_description_id=index.get_job_id(job_indexes[group]),
+                    score=float(scores[group]),
+                    chunk_ids=[index.get_chunk_id(position) for position in nearest[best]],
+                    chunk_distances=distances[best].tolist(),
+                )
+            )
+        return hits
+
+    @staticmethod
+    def get_filtered_positions(index, filters):
+        """Positions of the chunks whose job description matches `filters`, or None without filters.
+
+        Every chunk of the matching job descriptions is then searched exactly, the in-memory equivalent of
+        pre-filtering.
+        """
+        filters = {
+            f"{field}__in" if isinstance(value, (list, tuple)) else field: value
+            for field, value in (filters or {}).items()
+            if value is not None
+        }
+        if not filters:
+            return None
+        job_ids = as_id_array([job_id.bytes for job_id in JobDescription.objects.filter(**filters).values_list("id", flat=True)])
+        # Compare the 16 byte ids as single values rather than row by row
+        matching_jobs = np.flatnonzero(np.isin(as_id_values(index.job_ids), as_id_values(job_ids)))
+        return np.flatnonzero(np.isin(index.job_indexes, matching_jobs))
+
+
+def token_weighted_mean(distances, groups):
+    # Unknown token counts are -1
+    weights = np.maximum(groups.token_counts, 0)
+    total_weights = np.bincount(groups.inverse, weights=weights, minlength=len(groups.counts))
+    weighted_means = np.bincount(groups.inverse, weights=distances * weights) / np.maximum(total_weights, 1)
+    means = np.bincount(groups.inverse, weights=distances) / groups.counts
+    return np.where(total_weights > 0, weighted_means, means)
+
+
+def get_filter_condition(field, value, placeholder):
+    """SQL condition on a JobDescription column, matching any of the values when `value` is a list."""
+    if isinstance(value, (list, tuple)):
+        return f"{field} = ANY({placeholder})"
+    return f"{field} = {placeholder}"
+
+
+SEARCH_ENGINES = {
+    "pgvector": PgvectorSearchEngine,
+    "numpy": NumpySearchEngine,
+}
+
+_search_engines = {}
+
+
+def get_search_engine(name=None):
+    """Engines are shared by every request in the process, so in-memory engines only load once."""
+    name = name or settings.SEARCH_ENGINE
+    if name not in _search_engines:
+        _search_engines.setdefault(name, SEARCH_ENGINES[name]())
+    return _search_engines[name]
+
+
+def reset_search_engines():
+    _search_engines.clear()
+
+
+def build_search_results(hits, with_embeddings=False):
+    return build_search_results_many([hits], with_embeddings=with_embeddings)[0]
+
+
+def build_search_results_many(hit_lists, with_embeddings=False):
+    """Load the job descriptions and chunks referenced by lists of hits with one query each.
+
+    Hits may come from a cached ranking, so job descriptions and chunks deleted since are left out. Unless
+    `with_embeddings`, the embedding columns of chunks are deferred: they are most of a chunk row's size.
+    """
+    chunk_queryset = JobDescriptionChunk.objects.all()
+    if not with_embeddings:
+        chunk_queryset = chunk_queryset.defer(*EMBEDDING_FIELDS)
+    with timed("load"):
+        job_descriptions = JobDescription.objects.in_bulk([hit.job_description_id for hits in hit_lists for hit in hits])
+        chunks = chunk_queryset.in_bulk([chunk_id for hits in hit_lists for hit in hits for chunk_id in hit.chunk_ids])
+
+    result_lists = []
+    for hits in hit_lists:
+        results = []
+        for hit in hits:
+            if hit.job_description_id not in job_descriptions:
+                continue
+            hit_chunks = []
+            for chunk_id, distance in zip(hit.chunk_ids, hit.chunk_distances):
+                chunk = chunks.get(chunk_id)
+                if chunk is not None:
+                    # Chunks can be shared between lists, so each result gets its own copy with its own distance
+                    chunk = copy.copy(chunk)
+                    chunk.distance = distance
+                    hit_chunks.append(chunk)
+            results.append(JobDescriptionSearchResult(hit.score, job_descriptions[hit.job_description_id], hit_chunks))
+        result_lists.append(results)
+    return result_lists
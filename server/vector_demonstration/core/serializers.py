@@ -1,9 +1,26 @@
+import base64
+
+import numpy as np
+from django.conf import settings
 from django.contrib.auth import login
 from django.contrib.auth.password_validation import validate_password
 from rest_framework import serializers
 from rest_framework.authtoken.models import Token
 
-from .models import JobDescription, JobDescriptionChunk, User
+from .hybrid import RETRIEVAL_MODES
+from .models import JobDescription, JobDescriptionChunk, JobDescriptionSearchResult, User
+from .search import (
+    AGGREGATIONS,
+    FILTER_FIELDS,
+    FILTER_STRATEGIES,
+    METRICS,
+    NUMPY_QUANTIZED_DISTANCES,
+    QUANTIZED_DISTANCES,
+    get_search_engine,
+)
+
+# Chunk embeddings are left out of search results unless requested, see `EmbeddingField`
+EMBEDDING_FORMATS = ["none", "json", "float16"]
 
 
 class UserSerializer(serializers.ModelSerializer):
@@ -70,7 +87,17 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         return User.objects.create_user(**validated_data)
 
 
-class JobDescriptionSerializer(serializers.ModelSerializer):
+class DynamicFieldsMixin:
+    """Takes a `fields` argument restricting the serialized fields to a subset of `Meta.fields`."""
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for field_name in set(self.fields) - set(fields):
+                self.fields.pop(field_name)
+
+
+class JobDescriptionSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = JobDescription
         fields = (
@@ -84,7 +111,28 @@ class JobDescriptionSerializer(serializers.ModelSerializer):
         )
 
 
-class JobDescriptionChunkSerializer(serializers.ModelSerializer):
+class EmbeddingField(serializers.Field):
+    """An embedding as a JSON array of numbers ("json"), or as base64 encoded little-endian float16 ("float16").
+
+    float16 keeps about 3 significant digits, plenty to compare normalized embeddings, in 684 characters for 384
+    dimensions instead of about 7 KB of JSON.
+    """
+
+    def __init__(self, embedding_format="json", **kwargs):
+        self.embedding_format = embedding_format
+        kwargs["read_only"] = True
+        super().__init__(**kwargs)
+
+    def to_representation(self, value):
+        if self.embedding_format == "float16":
+            return base64.b64encode(np.asarray(value, dtype="<f2").tobytes()).decode("ascii")
+        # Renderers serialize arrays themselves, orjson without converting them to lists of Python floats first
+        return np.asarray(value, dtype=np.float32)
+
+
+class JobDescriptionChunkSerializer(DynamicFieldsMixin, serializers.ModelSerializer):
+    embedding = EmbeddingField()
+
     class Meta:
         model = JobDescriptionChunk
         fields = (
@@ -97,9 +145,103 @@ class JobDescriptionChunkSerializer(serializers.ModelSerializer):
 
 class JobDescriptionQuerySerializer(serializers.Serializer):
     query = serializers.CharField(required=True)
+    limit = serializers.IntegerField(required=False, default=50, min_value=1, max_value=settings.SEARCH_MAX_LIMIT)
+    aggregation = serializers.ChoiceField(required=False, default="mean", choices=list(AGGREGATIONS))
+    top_n = serializers.IntegerField(required=False, default=3, min_value=1)
+    # Of the "softmin" aggregation, SEARCH_SOFTMIN_TEMPERATURE by default
+    temperature = serializers.FloatField(required=False, min_value=0.01, max_value=100)
+    metric = serializers.ChoiceField(required=False, default=settings.SEARCH_DISTANCE_METRIC, choices=list(METRICS))
+    # Per-query ANN index tuning, higher values give better recall at the cost of latency
+    ef_search = serializers.IntegerField(required=False, min_value=1, max_value=1000)
+    probes = serializers.IntegerField(required=False, min_value=1)
+    # Scan a compressed copy of the embeddings first, then re-rank exactly. Availability depends on the search engine.
+    quantization = serializers.ChoiceField(required=False, choices=sorted({*QUANTIZED_DISTANCES, *NUMPY_QUANTIZED_DISTANCES}))
+    # Restrict results to job descriptions with these exact values, applied within the search itself
+    company = serializers.CharField(required=False)
+    location = serializers.CharField(required=False)
+    language = serializers.CharField(required=False)
+    filter_strategy = serializers.ChoiceField(required=False, default="auto", choices=FILTER_STRATEGIES)
+    # Combine vector search with full-text search of titles, skills and descriptions
+    retrieval = serializers.ChoiceField(required=False, default="vector", choices=RETRIEVAL_MODES)
+
+    def validate_quantization(self, value):
+        quantizations = get_search_engine().quantizations
+        if value not in quantizations:
+            raise serializers.ValidationError(f"The current search engine supports {', '.join(quantizations)}.")
+        return value
+
+    def validate(self, data):
+        """Collect the filters, so they are passed to the search engine together."""
+        filters = {field: data.pop(field) for field in FILTER_FIELDS if field in data}
+        if filters:
+            data["filters"] = filters
+        else:
+            # Irrelevant without filters, and would otherwise split the ranking cache
+            data.pop("filter_strategy")
+        return data
+
+
+class JobDescriptionBatchQuerySerializer(JobDescriptionQuerySerializer):
+    """Several queries searched with the same options."""
+
+    query = None
+    retrieval = None
+    queries = serializers.ListField(
+        child=serializers.CharField(), required=True, min_length=1, max_length=settings.SEARCH_MAX_BATCH_QUERIES
+    )
+
+
+class SearchResultsFormatSerializer(serializers.Serializer):
+    """The shape of search results, taken from the query parameters so `next` and `previous` links keep it.
+
+    e.g. `?fields=id,title,company&max_chunks=1&embedding_format=float16`
+    """
+
+    fields = serializers.CharField(required=False)
+    max_chunks = serializers.IntegerField(required=False, default=settings.SEARCH_CHUNKS_PER_RESULT, min_value=0)
+    embedding_format = serializers.ChoiceField(required=False, default="none", choices=EMBEDDING_FORMATS)
+
+    def validate_fields(self, value):
+        fields = [field.strip() for field in value.split(",") if field.strip()]
+        unknown_fields = set(fields) - set(JobDescriptionSerializer.Meta.fields)
+        if unknown_fields:
+            raise serializers.ValidationError(f"Unknown fields {', '.join(sorted(unknown_fields))}.")
+        return fields
+
+    @staticmethod
+    def get_key(response_format):
+        """Identifies the format in cache keys of serialized results."""
+        fields = ",".join(response_format.get("fields") or ["*"])
+        return f"{fields}:{response_format['max_chunks']}:{response_format['embedding_format']}"
+
+    @staticmethod
+    def includes_embeddings(response_format):
+        """Whether results in this format include chunk embeddings, which otherwise needn't be loaded."""
+        return response_format.get("max_chunks") != 0 and response_format.get("embedding_format", "none") != "none"
 
 
 class JobDescriptionSearchResultsSerializer(serializers.Serializer):
+    """Pass a format validated by `SearchResultsFormatSerializer` as the `response_format` context to choose the
+    fields of job descriptions, the number of chunks per result and whether chunk embeddings are included."""
+
     score = serializers.FloatField(required=True)
     job_description = JobDescriptionSerializer(required=True)
-    chunks = JobDescriptionChunkSerializer(required=True, many=True)
+    chunks = JobDescriptionChunkSerializer(required=True, many=True, fields=["job_description_id", "chunk", "token_count"])
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        response_format = self.context.get("response_format", {})
+        self.max_chunks = response_format.get("max_chunks")
+        if response_format.get("fields") is not None:
+            self.fields["job_description"] = JobDescriptionSerializer(fields=response_format["fields"])
+        if self.max_chunks == 0:
+            self.fields.pop("chunks")
+        elif SearchResultsFormatSerializer.includes_embeddings(response_format):
+            chunk_serializer = JobDescriptionChunkSerializer(many=True)
+            chunk_serializer.child.fields["embedding"] = EmbeddingField(response_format["embedding_format"])
+            self.fields["chunks"] = chunk_serializer
+
+    def to_representation(self, instance):
+        if self.max_chunks:
+            instance = JobDescriptionSearchResult(instance.score, instance.job_description, instance.chunks[: self.max_chunks])
+        return super().to_representation(instance)
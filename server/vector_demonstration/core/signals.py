@@ -1,11 +1,28 @@
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from rest_framework.authtoken.models import Token
 
-from vector_demonstration.core.models import User
+from vector_demonstration.core.caching import bump_corpus_generation, bump_embeddings_generation
+from vector_demonstration.core.models import JobDescription, JobDescriptionChunk, User
 
 
 @receiver(post_save, sender=User)
 def create_auth_token_add_permissions(sender, instance, created, **kwargs):
     if created:
         Token.objects.create(user=instance)
+
+
+# Chunk deletes are handled by `SearchCorpusQuerySet.delete` and `JobDescriptionChunk.delete` instead: a delete
+# receiver would stop Django from deleting chunks (and the chunks of deleted job descriptions) with a single query.
+@receiver(post_save, sender=JobDescription)
+def invalidate_search_results(sender, instance, using, **kwargs):
+    # Bumped after commit so a concurrent search can't cache results computed from the old rows under the new generation
+    transaction.on_commit(bump_corpus_generation, using=using)
+
+
+# Deleting a job description also deletes its chunks
+@receiver(post_delete, sender=JobDescription)
+@receiver(post_save, sender=JobDescriptionChunk)
+def invalidate_embeddings(sender, instance, using, **kwargs):
+    transaction.on_commit(bump_embeddings_generation, using=using)
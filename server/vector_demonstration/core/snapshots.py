@@ -0,0 +1,143 @@
+"""Versioned on-disk snapshots of the chunk embeddings, for fast boot of in-memory search.
+
+A snapshot directory looks like::
+
+    <directory>/CURRENT                  name of the version to serve
+    <directory>/<version>/manifest.json
+    <directory>/<version>/embeddings.npy     (chunks, dimensions) float32
+    <directory>/<version>/chunk_ids.npy      (chunks, 16) uint8
+    <directory>/<version>/job_indexes.npy    (chunks,) int32
+    <directory>/<version>/job_ids.npy        (jobs, 16) uint8, sorted
+    <directory>/<version>/token_counts.npy   (chunks,) int32, -1 when unknown
+
+The arrays are plain `.npy` files opened with `mmap_mode="r"`, so opening a snapshot is near-instant and every
+worker mapping the same version shares the same physical pages through the page cache.
+"""
+
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from django.db import connection, transaction
+from django.utils import timezone
+
+from .encoders import get_model_id
+from .models import JobDescriptionChunk
+
+FORMAT_VERSION = 1
+CURRENT_FILENAME = "CURRENT"
+MANIFEST_FILENAME = "manifest.json"
+
+
+def get_current_version(directory):
+    try:
+        with open(os.path.join(directory, CURRENT_FILENAME)) as f:
+            return f.read().strip() or None
+    except FileNotFoundError:
+        return None
+
+
+def read_manifest(directory, version):
+    with open(os.path.join(directory, version, MANIFEST_FILENAME)) as f:
+        return json.load(f)
+
+
+def load_arrays(directory, version):
+    """Memory map the arrays of a snapshot version after checking its manifest."""
+    manifest = read_manifest(directory, version)
+    if manifest["format_version"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format {manifest['format_version']} in {version}")
+    if manifest["model_id"] != get_model_id():
+        raise ValueError(f"Snapshot {version} was embedded with {manifest['model_id']}, expected {get_model_id()}")
+
+    path = os.path.join(directory, version)
+    return {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r") for name in manifest["arrays"]}
+
+
+def export_snapshot(directory, batch_size=5000, keep=3):
+    """Write every chunk embedding to a new snapshot version and make it current. Returns the manifest."""
+    os.makedirs(directory, exist_ok=True)
+    created_at = timezone.now()
+    version = created_at.strftime("%Y%m%dT%H%M%S%f")
+    dimensions = JobDescriptionChunk._meta.get_field("embedding").dimensions
+
+    # Written to a temporary directory first, so readers never see a partial snapshot
+    tmp_path = tempfile.mkdtemp(prefix=f".{version}-", dir=directory)
+    try:
+        in_transaction = connection.in_atomic_block
+        with transaction.atomic():
+            if not in_transaction:
+                # A consistent view of the table between counting and reading the rows
+                with connection.cursor() as cursor:
+                    cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+            count = JobDescriptionChunk.objects.count()
+            arrays = {
+                "embeddings": open_array(tmp_path, "embeddings", (count, dimensions), np.float32),
+                "chunk_ids": open_array(tmp_path, "chunk_ids", (count, 16), np.uint8),
+                "job_indexes": open_array(tmp_path, "job_indexes", (count,), np.int32),
+                "token_counts": open_array(tmp_path, "token_counts", (count,), np.int32),
+            }
+            # Ordered by job, so job ids come out sorted and can be numbered as they are read
+            rows = JobDescriptionChunk.objects.order_by("job_description_id", "id").values_list(
+                "id", "job_description_id", "token_count", "embedding"
+            )
+            job_ids = []
+            for position, (chunk_id, job_id, token_count, embedding) in enumerate(rows.iterator(chunk_size=batch_size)):
+                if not job_ids or job_ids[-1] != job_id.bytes:
+                    job_ids.append(job_id.bytes)
+                arrays["embeddings"][position] = embedding
+                arrays["chunk_ids"][position] = np.frombuffer(chunk_id.bytes, dtype=np.uint8)
+                arrays["job_indexes"][position] = len(job_ids) - 1
+                arrays["token_counts"][position] = -1 if token_count is None else token_count
+
+        for array in arrays.values():
+            array.flush()
+        np.save(os.path.join(tmp_path, "job_ids.npy"), np.frombuffer(b"".join(job_ids), dtype=np.uint8).reshape(-1, 16))
+
+        manifest = {
+            "format_version": FORMAT_VERSION,
+            "version": version,
+            "created_at": created_at.isoformat(),
+            "model_id": get_model_id(),
+            "dimensions": dimensions,
+            "chunks": count,
+            "jobs": len(job_ids),
+            "arrays": [*arrays, "job_ids"],
+        }
+        with open(os.path.join(tmp_path, MANIFEST_FILENAME), "w") as f:
+            json.dump(manifest, f, indent=2)
+
+        os.rename(tmp_path, os.path.join(directory, version))
+    except BaseException:
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+
+    set_current_version(directory, version)
+    remove_old_versions(directory, keep)
+    return manifest
+
+
+def open_array(path, name, shape, dtype):
+    return np.lib.format.open_memmap(os.path.join(path, f"{name}.npy"), mode="w+", dtype=dtype, shape=shape)
+
+
+def set_current_version(directory, version):
+    tmp_file = os.path.join(directory, f".{CURRENT_FILENAME}.tmp")
+    with open(tmp_file, "w") as f:
+        f.write(version)
+    os.replace(tmp_file, os.path.join(directory, CURRENT_FILENAME))
+
+
+def remove_old_versions(directory, keep):
+    """Delete all but the `keep` newest versions. Workers still mapping a deleted version keep working."""
+    current = get_current_version(directory)
+    versions = sorted(
+        name
+        for name in os.listdir(directory)
+        if not name.startswith(".") and os.path.isfile(os.path.join(directory, name, MANIFEST_FILENAME))
+    )
+    for version in versions[:-keep] if keep else versions:
+        if version != current:
+            shutil.rmtree(os.path.join(directory, version), ignore_errors=True)
@@ -1,14 +1,52 @@
+import asyncio
+import base64
+import datetime
+import hashlib
+import json
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
+from urllib.parse import urlencode
 
+import msgpack
+import numpy as np
 import pytest
+from asgiref.sync import iscoroutinefunction, sync_to_async
 from django.contrib.auth import authenticate
-from django.test import Client, override_settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, transaction
+from django.db.models.deletion import Collector
+from django.test import AsyncClient, Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django_currentuser.middleware import get_current_user
 from pytest_factoryboy import register
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
+from vector_demonstration.common.middleware import ThreadLocalUserMiddleware
 
+from .async_search import shutdown_executors
+from .batching import EncoderBatcher
+from .caching import (
+    QueryEmbeddingCache,
+    bump_corpus_generation,
+    get_cached_ranking,
+    get_corpus_generation,
+    get_ranking_key,
+    ranking_flights,
+)
+from .embedding import embed_pending
+from .encoders import EncoderRegistry, warm_up
 from .factories import UserFactory
-from .models import User
+from .hybrid import lexical_search, reciprocal_rank_fusion
+from .models import CHUNKER_VERSION, JobDescription, JobDescriptionChunk, User
+from .renderers import MessagePackRenderer, ORJSONRenderer
+from .search import PgvectorSearchEngine, get_search_engine
 from .serializers import UserLoginSerializer
+from .snapshots import get_current_version, read_manifest
 from .views import PreviewTemplateView
 
 JSON_RQST_HEADERS = dict(
@@ -19,6 +57,38 @@ JSON_RQST_HEADERS = dict(
 register(UserFactory)
 
 
+def make_embedding(*values):
+    """A 384 dimension embedding starting with `values`, zero padded."""
+    embedding = np.zeros(384, dtype=np.float32)
+    embedding[: len(values)] = values
+    return embedding
+
+
+def make_unit_embedding(similarity):
+    """A normalized embedding whose inner product with `make_embedding(1.0)` is `similarity`."""
+    return make_embedding(similarity, (1 - similarity**2) ** 0.5)
+
+
+def mock_model(embedding):
+    """A mocked model encoding every query to `embedding`."""
+    return mock.Mock(encode=mock.Mock(side_effect=lambda queries, **kwargs: np.array([embedding] * len(queries))))
+
+
+@pytest.fixture
+def job_descriptions(db):
+    """Three job descriptions with chunks at the given similarities to the query `make_embedding(1.0)`."""
+    chunk_similarities = {"Singer": [0.9, 0.1], "Actor": [0.6, 0.6], "Welder": [-0.5]}
+    job_descriptions = {}
+    for title, similarities in chunk_similarities.items():
+        job_description = JobDescription.objects.create(title=title, company="Acme", location="Remote")
+        for similarity in similarities:
+            JobDescriptionChunk.objects.create(
+                job_description=job_description, chunk=f"{title} {similarity}", embedding=make_unit_embedding(similarity)
+            )
+        job_descriptions[title] = job_description
+    return job_descriptions
+
+
 @pytest.fixture
 def test_user():
     user = UserFactory()
@@ -139,3 +209,1162 @@ class TestPreviewTemplateView:
         assert context["key"] == 0
         assert context["parent"] == {"child": 1, "other_child": 2, "multi_nested": {"child": 3}}
         assert context["parent_field"] == 4
+
+
+class TestEncoderRegistry:
+    def test_model_is_loaded_once_across_threads(self):
+        registry = EncoderRegistry()
+        with mock.patch("vector_demonstration.core.encoders.SentenceTransformer") as mocked_model:
+            threads = [threading.Thread(target=registry.get_model) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            assert registry.get_model() is mocked_model.return_value
+        assert mocked_model.call_count == 1
+
+    def test_models_are_keyed_by_name_and_revision(self):
+        registry = EncoderRegistry()
+        with mock.patch("vector_demonstration.core.encoders.SentenceTransformer") as mocked_model:
+            registry.get_model("model-a", "v1")
+            registry.get_model("model-a", "v2")
+            registry.get_model("model-a", "v1")
+        assert mocked_model.call_count == 2
+        assert [s["revision"] for s in registry.stats()] == ["v1", "v2"]
+
+    def test_stats(self):
+        registry = EncoderRegistry()
+        with mock.patch("vector_demonstration.core.encoders.AutoTokenizer"):
+            registry.get_tokenizer("tokenizer-a")
+        stats = registry.stats()
+        assert stats[0]["kind"] == "tokenizer"
+        assert stats[0]["name"] == "tokenizer-a"
+        assert stats[0]["load_seconds"] >= 0
+        assert stats[0]["memory_bytes"] == 0
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_warm_up(self, enabled, settings):
+        settings.EMBEDDING_WARM_UP = enabled
+        with mock.patch("vector_demonstration.core.encoders.registry") as registry:
+            registry.stats.return_value = []
+            warm_up()
+        assert registry.warm_up.called == enabled
+
+    def test_management_commands_dont_warm_up(self, settings):
+        settings.EMBEDDING_WARM_UP = True
+        with mock.patch("vector_demonstration.core.encoders.registry") as registry:
+            call_command("check", stdout=mock.Mock())
+        registry.warm_up.assert_not_called()
+
+
+@pytest.mark.django_db
+class TestSearchEngines:
+    @pytest.fixture(params=["pgvector", "numpy"])
+    def engine(self, request):
+        return get_search_engine(request.param)
+
+    @pytest.mark.parametrize(
+        "aggregation,expected_titles,expected_scores",
+        [
+            ("mean", ["Actor", "Singer", "Welder"], [-0.6, -0.5, 0.5]),
+            ("min", ["Singer", "Actor", "Welder"], [-0.9, -0.6, 0.5]),
+            ("top_n_mean", ["Singer", "Actor", "Welder"], [-0.9, -0.6, 0.5]),
+            # Without token counts, like "mean"
+            ("token_weighted_mean", ["Actor", "Singer", "Welder"], [-0.6, -0.5, 0.5]),
+        ],
+    )
+    def test_aggregations(self, engine, job_descriptions, aggregation, expected_titles, expected_scores):
+        hits = engine.search(make_embedding(1.0), limit=10, aggregation=aggregation, top_n=1, metric="inner_product")
+        titles = [JobDescription.objects.get(id=hit.job_description_id).title for hit in hits]
+        assert titles == expected_titles
+        assert [hit.score for hit in hits] == pytest.approx(expected_scores)
+
+    @pytest.mark.parametrize(
+        "temperature,expected_titles,expected_scores",
+        [
+            # Close to the best chunk
+            (0.1, ["Singer", "Actor", "Welder"], [-0.9 - 0.1 * np.log(1 + np.exp(-8)), -0.6 - 0.1 * np.log(2), 0.5]),
+            # Two good chunks beat one better and one poor chunk
+            (1, ["Actor", "Singer", "Welder"], [-0.6 - np.log(2), -np.log(np.exp(0.9) + np.exp(0.1)), 0.5]),
+        ],
+    )
+    def test_softmin_aggregation(self, engine, job_descriptions, temperature, expected_titles, expected_scores):
+        hits = engine.search(make_embedding(1.0), limit=10, aggregation="softmin", temperature=temperature, metric="inner_product")
+        titles = [JobDescription.objects.get(id=hit.job_description_id).title for hit in hits]
+        assert titles == expected_titles
+        assert [hit.score for hit in hits] == pytest.approx(expected_scores, abs=1e-6)
+
+    def test_token_weighted_mean_aggregation(self, engine, job_descriptions):
+        JobDescriptionChunk.objects.filter(chunk="Singer 0.9").update(token_count=100)
+        JobDescriptionChunk.objects.filter(chunk="Singer 0.1").update(token_count=10)
+        hits = engine.search(make_embedding(1.0), limit=10, aggregation="token_weighted_mean", metric="inner_product")
+        assert hits[0].job_description_id == job_descriptions["Singer"].id
+        assert [hit.score for hit in hits] == pytest.approx([-(0.9 * 100 + 0.1 * 10) / 110, -0.6, 0.5])
+
+    @pytest.mark.parametrize(
+        "metric,expected_distances",
+        [
+            ("inner_product", [-0.9, -0.1]),
+            ("cosine", [0.1, 0.9]),
+            ("l2", [0.2**0.5, 1.8**0.5]),
+        ],
+    )
+    def test_metrics(self, engine, job_descriptions, metric, expected_distances):
+        hits = engine.search(make_embedding(1.0), limit=1, aggregation="min", metric=metric)
+        assert hits[0].job_description_id == job_descriptions["Singer"].id
+        assert hits[0].chunk_distances == pytest.approx(expected_distances, abs=1e-6)
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda chunk: chunk.save(),
+            lambda chunk: JobDescriptionChunk.objects.bulk_create([chunk]),
+            lambda chunk: JobDescriptionChunk.objects.copy_load([chunk]),
+        ],
+    )
+    def test_embeddings_are_normalized(self, engine, write):
+        job_description = JobDescription.objects.create(title="Singer")
+        write(JobDescriptionChunk(job_description=job_description, chunk="Sings", embedding=make_embedding(3.0, 4.0)))
+
+        stored = np.asarray(JobDescriptionChunk.objects.get().embedding, dtype=np.float32)
+        assert np.linalg.norm(stored) == pytest.approx(1.0)
+        for metric, expected_distance in [("cosine", 0.4), ("l2", 0.8**0.5)]:
+            hits = engine.search(make_embedding(1.0), limit=1, metric=metric)
+            assert hits[0].chunk_distances == pytest.approx([expected_distance], abs=1e-6)
+
+    def test_limit_and_best_chunks(self, engine, job_descriptions):
+        hits = engine.search(make_embedding(1.0), limit=1, chunks_per_result=1)
+        assert len(hits) == 1
+        assert hits[0].job_description_id == job_descriptions["Actor"].id
+        assert len(hits[0].chunk_ids) == 1
+
+    def test_search_query_count(self, job_descriptions, django_assert_num_queries):
+        model = mock_model(make_embedding(1.0))
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=model):
+            # Index parameters, one ranking query, one for the job descriptions and one for their chunks.
+            # The remaining two are the savepoint and release within the test's transaction.
+            with django_assert_num_queries(6):
+                results = JobDescription.search(query="Music", limit=2, metric="cosine")
+        assert [r.job_description.title for r in results] == ["Actor", "Singer"]
+        assert [c.distance for c in results[1].chunks] == pytest.approx([0.1, 0.9])
+        model.encode.assert_called_once_with(["Music"], batch_size=32, normalize_embeddings=True)
+
+    def test_numpy_engine_reloads_when_corpus_changes(self, job_descriptions, django_capture_on_commit_callbacks):
+        engine = get_search_engine("numpy")
+        assert len(engine.search(make_embedding(1.0), limit=10)) == 3
+
+        with django_capture_on_commit_callbacks(execute=True):
+            job_descriptions["Welder"].delete()
+        assert len(engine.search(make_embedding(1.0), limit=10)) == 2
+
+    def test_numpy_engine_keeps_index_when_only_job_descriptions_change(self, job_descriptions, django_capture_on_commit_callbacks):
+        engine = get_search_engine("numpy")
+        index = engine.get_index()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            job_descriptions["Welder"].save()
+            JobDescription.objects.update(company="Initech")
+        assert engine.get_index() is index
+
+        with django_capture_on_commit_callbacks(execute=True):
+            JobDescriptionChunk.objects.create(job_description=job_descriptions["Welder"], chunk="Welds", embedding=make_embedding(1.0))
+        assert engine.get_index() is not index
+
+    def test_numpy_engine_checks_for_changes_periodically(
+        self, job_descriptions, settings, django_assert_num_queries, django_capture_on_commit_callbacks
+    ):
+        settings.SEARCH_NUMPY_VERSION_CHECK_SECONDS = 60
+        engine = get_search_engine("numpy")
+        index = engine.get_index()
+        with django_capture_on_commit_callbacks(execute=True):
+            job_descriptions["Welder"].delete()
+
+        # Searches within the interval don't query the embeddings generation
+        with django_assert_num_queries(0):
+            assert engine.get_index() is index
+
+        with mock.patch("vector_demonstration.core.search.time.monotonic", return_value=time.monotonic() + 61):
+            assert engine.get_index() is not index
+
+    @pytest.mark.parametrize("with_embeddings", [False, True])
+    def test_chunk_embeddings_are_only_loaded_when_requested(self, job_descriptions, with_embeddings):
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=mock_model(make_embedding(1.0))):
+            results = JobDescription.search(query="Music", limit=2, with_embeddings=with_embeddings)
+        deferred_fields = results[0].chunks[0].get_deferred_fields()
+        assert deferred_fields == (set() if with_embeddings else {"embedding", "embedding_half", "embedding_binary"})
+
+    def test_search_engine_setting(self, job_descriptions, settings):
+        settings.SEARCH_ENGINE = "numpy"
+        model = mock_model(make_embedding(1.0))
+        with (
+            mock.patch("vector_demonstration.core.encoders.get_model", return_value=model),
+            mock.patch("vector_demonstration.core.search.PgvectorSearchEngine.search") as mocked_pgvector_search,
+        ):
+            results = JobDescription.search(query="Music", limit=2)
+        assert not mocked_pgvector_search.called
+        assert [r.job_description.title for r in results] == ["Actor", "Singer"]
+
+    def test_search_endpoint(self, job_descriptions, client):
+        model = mock_model(make_embedding(1.0))
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=model):
+            response = client.post(
+                "/api/job-descriptions/search/", {"query": "Music", "limit": 2, "aggregation": "min"}, **JSON_RQST_HEADERS
+            )
+        assert response.status_code == 200
+        assert [r["job_description"]["title"] for r in response.json()["results"]] == ["Singer", "Actor"]
+
+
+class TestEncoderBatcher:
+    def create_batcher(self, encode_many, **options):
+        options = {"workers": 1, "max_batch_size": 4, "max_wait": 0, **options}
+        return EncoderBatcher(encode_many, lambda: ThreadPoolExecutor(max_workers=options["workers"]), **options)
+
+    def test_concurrent_queries_are_encoded_together(self):
+        encode_many = mock.Mock(side_effect=lambda queries: [make_embedding(len(query)) for query in queries])
+        batcher = self.create_batcher(encode_many, max_wait=5)
+        futures = [batcher.submit(query) for query in ["a", "bb", "ccc", "dddd", "eeeee"]]
+        embeddings = [future.result(timeout=10) for future in futures]
+        batcher.shutdown()
+
+        assert [embedding[0] for embedding in embeddings] == [1, 2, 3, 4, 5]
+        # The first four fill a batch, the last waits for the next one
+        assert [call.args[0] for call in encode_many.call_args_list] == [["a", "bb", "ccc", "dddd"], ["eeeee"]]
+        stats = batcher.stats()
+        assert stats["batches"] == 2
+        assert stats["batch_sizes"] == {1: 1, 4: 1}
+        assert stats["mean_batch_size"] == 2.5
+        assert stats["max_queue_delay_ms"] > 0
+
+    def test_queries_queue_while_the_encoder_is_busy(self):
+        encoding = threading.Event()
+        release = threading.Event()
+
+        def encode_many(queries):
+            encoding.set()
+            release.wait(timeout=10)
+            return [make_embedding(1.0)] * len(queries)
+
+        encode_many = mock.Mock(side_effect=encode_many)
+        batcher = self.create_batcher(encode_many)
+        futures = [batcher.submit("first")]
+        assert encoding.wait(timeout=10)
+        futures += [batcher.submit(query) for query in ["second", "third"]]
+        release.set()
+        for future in futures:
+            future.result(timeout=10)
+        batcher.shutdown()
+        assert [call.args[0] for call in encode_many.call_args_list] == [["first"], ["second", "third"]]
+
+    def test_forked_processes_get_their_own_executor(self):
+        encode_many = mock.Mock(side_effect=lambda queries: [make_embedding(1.0)] * len(queries))
+        batcher = self.create_batcher(encode_many)
+        batcher.encode("parent")
+        parent_executor, parent_queue = batcher.executor, batcher._queue
+
+        # The workers of the parent's executor don't exist in a forked child
+        with mock.patch("vector_demonstration.core.batching.os.getpid", return_value=os.getpid() + 1):
+            assert batcher.submit("child").result(timeout=10)[0] == 1.0
+            assert batcher.executor is not parent_executor
+            batcher.shutdown()
+        # Stops the parent's dispatcher
+        parent_queue.put(None)
+        parent_executor.shutdown()
+        assert [call.args[0] for call in encode_many.call_args_list] == [["parent"], ["child"]]
+
+    def test_errors_are_raised_to_every_query(self):
+        batcher = self.create_batcher(mock.Mock(side_effect=RuntimeError("Out of memory")), max_wait=5, max_batch_size=2)
+        futures = [batcher.submit(query) for query in ["a", "b"]]
+        for future in futures:
+            with pytest.raises(RuntimeError):
+                future.result(timeout=10)
+        batcher.shutdown()
+
+
+@pytest.mark.django_db
+class TestBatchSearch:
+    queries = {"Music": make_embedding(1.0), "Welding": make_embedding(-1.0), "Acting": make_embedding(0.6, 0.8)}
+
+    @pytest.mark.parametrize("engine_name", ["pgvector", "numpy"])
+    @pytest.mark.parametrize("search_options", [{}, {"aggregation": "min", "metric": "l2"}, {"filters": {"title": ["Actor", "Welder"]}}])
+    def test_search_many_matches_search(self, job_descriptions, engine_name, search_options):
+        engine = get_search_engine(engine_name)
+        query_embeddings = list(self.queries.values())
+        expected_hits = [engine.search(query_embedding, limit=2, **search_options) for query_embedding in query_embeddings]
+        assert engine.search_many(query_embeddings, limit=2, **search_options) == expected_hits
+
+    def test_batch_search_endpoint(self, job_descriptions, client, django_assert_num_queries):
+        model = mock.Mock(encode=mock.Mock(return_value=np.array(list(self.queries.values()))))
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=model):
+            # Index parameters, one ranking query for all queries, one for the job descriptions and one for their chunks.
+            # The remaining two are the savepoint and release within the test's transaction.
+            with django_assert_num_queries(6):
+                response = client.post(
+                    "/api/job-descriptions/batch-search/",
+                    {"queries": list(self.queries), "limit": 1, "aggregation": "min"},
+                    **JSON_RQST_HEADERS,
+                )
+        assert response.status_code == 200
+        assert [(r["query"], [hit["job_description"]["title"] for hit in r["results"]]) for r in response.json()] == [
+            ("Music", ["Singer"]),
+            ("Welding", ["Welder"]),
+            ("Acting", ["Actor"]),
+        ]
+        model.encode.assert_called_once_with(list(self.queries), batch_size=32, normalize_embeddings=True)
+
+    def test_cached_query_embeddings_are_not_encoded_again(self, db):
+        model = mock.Mock(encode=mock.Mock(side_effect=lambda queries, **kwargs: np.zeros((len(queries), 384))))
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=model):
+            JobDescription.rank_many(["Music", "Acting"])
+            JobDescription.rank_many([" Music", "Welding", "Welding"])
+        assert [call.args[0] for call in model.encode.call_args_list] == [["Music", "Acting"], ["Welding"]]
+
+
+@pytest.mark.django_db
+class TestVectorIndexes:
+    def get_index_definition(self, name):
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT indexdef FROM pg_indexes WHERE indexname = %s", [name])
+            row = cursor.fetchone()
+        return row[0] if row else None
+
+    def test_default_hnsw_index(self):
+        assert "USING hnsw (embedding vector_ip_ops)" in self.get_index_definition("jd_chunk_embedding_hnsw_ip")
+
+    @pytest.mark.parametrize(
+        "options,index_name,expected_definition",
+        [
+            ({"metric": "cosine", "m": 8, "ef_construction": 32}, "jd_chunk_embedding_hnsw_cosine", "m='8', ef_construction='32'"),
+            ({"method": "ivfflat", "metric": "inner_product", "lists": 4}, "jd_chunk_embedding_ivfflat_ip", "lists='4'"),
+            ({"quantization": "half"}, "jd_chunk_embedding_half_hnsw_ip", "(embedding_half halfvec_ip_ops)"),
+            ({"quantization": "binary"}, "jd_chunk_embedding_binary_hnsw_hamming", "(embedding_binary bit_hamming_ops)"),
+        ],
+    )
+    def test_build_vector_index(self, options, index_name, expected_definition):
+        call_command("build_vector_index", stdout=mock.Mock(), **options)
+        assert expected_definition in self.get_index_definition(index_name)
+
+    def test_search_with_index_parameters(self, job_descriptions):
+        hits = PgvectorSearchEngine().search(make_embedding(1.0), limit=10, ef_search=10, probes=2)
+        assert len(hits) == 3
+
+    @pytest.mark.parametrize("iterative_scan", [True, False])
+    def test_index_scans_return_more_than_ef_search_chunks(self, iterative_scan, settings):
+        settings.SEARCH_ITERATIVE_SCAN = iterative_scan
+        embeddings = np.random.default_rng(0).normal(size=(60, 384)).astype(np.float32)
+        job_descriptions = JobDescription.objects.bulk_create([JobDescription(title=f"Job {i}") for i in range(60)])
+        JobDescriptionChunk.objects.bulk_create(
+            [
+                JobDescriptionChunk(job_description=job_description, chunk="chunk", embedding=embedding / np.linalg.norm(embedding))
+                for job_description, embedding in zip(job_descriptions, embeddings)
+            ]
+        )
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+            hits = PgvectorSearchEngine().search(make_embedding(1.0), limit=50, ef_search=10)
+        assert len(hits) == 50
+
+
+class TestQueryEmbeddingCache:
+    def test_equivalent_queries_are_encoded_once(self):
+        cache = QueryEmbeddingCache(max_size=10, ttl=60)
+        encode = mock.Mock(return_value=make_embedding(1.0))
+        first = cache.get_or_encode("Music  and Theater", "model@v1", encode)
+        second = cache.get_or_encode(" Music and\tTheater", "model@v1", encode)
+        assert encode.call_count == 1
+        assert np.array_equal(first, second)
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_case_is_kept(self):
+        # Cased models embed "Apple" and "apple" differently
+        cache = QueryEmbeddingCache(max_size=10, ttl=60)
+        encode = mock.Mock(return_value=make_embedding(1.0))
+        cache.get_or_encode("Apple", "model@v1", encode)
+        cache.get_or_encode("apple", "model@v1", encode)
+        assert encode.call_count == 2
+
+    def test_keyed_by_model(self):
+        cache = QueryEmbeddingCache(max_size=10, ttl=60)
+        encode = mock.Mock(return_value=make_embedding(1.0))
+        cache.get_or_encode("music", "model@v1", encode)
+        cache.get_or_encode("music", "model@v2", encode)
+        assert encode.call_count == 2
+
+    def test_lru_eviction(self):
+        cache = QueryEmbeddingCache(max_size=2, ttl=60)
+        encode = mock.Mock(return_value=make_embedding(1.0))
+        for query in ["a", "b", "a", "c", "a", "b"]:
+            cache.get_or_encode(query, "model", encode)
+        # "b" was the least recently used when "c" was added
+        assert encode.call_count == 4
+        assert cache.stats()["evictions"] == 2
+
+    def test_ttl(self):
+        cache = QueryEmbeddingCache(max_size=10, ttl=60)
+        encode = mock.Mock(return_value=make_embedding(1.0))
+        with mock.patch("vector_demonstration.core.caching.time.monotonic", side_effect=[0, 30, 100, 100]):
+            cache.get_or_encode("music", "model", encode)
+            cache.get_or_encode("music", "model", encode)
+            cache.get_or_encode("music", "model", encode)
+        assert encode.call_count == 2
+
+    def test_shared_tier(self):
+        encode = mock.Mock(return_value=make_embedding(1.0, 2.0))
+        QueryEmbeddingCache(max_size=10, ttl=60, shared_cache_alias="default").get_or_encode("music", "model", encode)
+        other_worker_cache = QueryEmbeddingCache(max_size=10, ttl=60, shared_cache_alias="default")
+        embedding = other_worker_cache.get_or_encode("music", "model", encode)
+        assert encode.call_count == 1
+        assert np.array_equal(embedding, make_embedding(1.0, 2.0))
+        assert other_worker_cache.stats()["shared_hits"] == 1
+
+
+@pytest.mark.django_db
+class TestSearchResultCache:
+    url = "/api/job-descriptions/search/"
+
+    @pytest.fixture
+    def mocked_engine(self):
+        model = mock_model(make_embedding(0.0))
+        with (
+            mock.patch("vector_demonstration.core.encoders.get_model", return_value=model),
+            mock.patch("vector_demonstration.core.search.PgvectorSearchEngine.search", autospec=True, return_value=[]) as mocked_search,
+        ):
+            yield mocked_search
+
+    def test_repeated_search_is_cached(self, client, mocked_engine):
+        for query in ["Music", "  Music "]:
+            response = client.post(self.url, {"query": query}, **JSON_RQST_HEADERS)
+            assert response.status_code == 200
+        assert mocked_engine.call_count == 1
+
+        client.post(self.url, {"query": "Music", "limit": 5}, **JSON_RQST_HEADERS)
+        assert mocked_engine.call_count == 2
+
+    def test_corpus_changes_invalidate_results(self, client, mocked_engine, django_capture_on_commit_callbacks):
+        client.post(self.url, {"query": "Music"}, **JSON_RQST_HEADERS)
+
+        with django_capture_on_commit_callbacks(execute=True):
+            job_description = JobDescription.objects.create(title="Singer", company="Acme", location="Remote")
+        client.post(self.url, {"query": "Music"}, **JSON_RQST_HEADERS)
+        assert mocked_engine.call_count == 2
+
+        with django_capture_on_commit_callbacks(execute=True):
+            JobDescriptionChunk.objects.bulk_create(
+                [JobDescriptionChunk(job_description=job_description, chunk="Singer", embedding=make_embedding(1.0))]
+            )
+        client.post(self.url, {"query": "Music"}, **JSON_RQST_HEADERS)
+        assert mocked_engine.call_count == 3
+
+    def test_identical_searches_in_flight_are_computed_once(self):
+        computing = threading.Event()
+        release = threading.Event()
+
+        def compute():
+            computing.set()
+            release.wait(timeout=10)
+            return ["hits"]
+
+        compute = mock.Mock(side_effect=compute)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(get_cached_ranking({"query": "Music"}, compute))) for _ in range(4)]
+        threads[0].start()
+        assert computing.wait(timeout=10)
+        for thread in threads[1:]:
+            thread.start()
+        while ranking_flights.stats()["followers"] < 3:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert compute.call_count == 1
+        assert [hits for _, hits in results] == [["hits"]] * 4
+
+    def test_errors_are_shared_by_identical_searches(self):
+        future, _ = ranking_flights.join("key")
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            follower = executor.submit(ranking_flights.run, "key", mock.Mock())
+            while ranking_flights.stats()["followers"] < 1:
+                time.sleep(0.01)
+            ranking_flights.finish("key", future, exception=RuntimeError("Timeout"))
+            with pytest.raises(RuntimeError):
+                follower.result(timeout=10)
+
+    def test_workers_wait_for_the_lease_holder(self, settings):
+        settings.SEARCH_SINGLE_FLIGHT_SHARED = True
+        settings.SEARCH_SINGLE_FLIGHT_POLL_MS = 10
+        key = get_ranking_key({"query": "Music"})
+        # Another worker is computing the ranking
+        cache.add(f"{key}:lease", 1)
+        threading.Timer(0.1, lambda: cache.set(key, ["their hits"])).start()
+        compute = mock.Mock(return_value=["our hits"])
+        assert get_cached_ranking({"query": "Music"}, compute) == (key, ["their hits"])
+        assert not compute.called
+
+    def test_expired_lease(self, settings):
+        settings.SEARCH_SINGLE_FLIGHT_SHARED = True
+        settings.SEARCH_SINGLE_FLIGHT_POLL_MS = 10
+        settings.SEARCH_SINGLE_FLIGHT_TIMEOUT = 0
+        key = get_ranking_key({"query": "Music"})
+        cache.add(f"{key}:lease", 1)
+        assert get_cached_ranking({"query": "Music"}, lambda: ["our hits"]) == (key, ["our hits"])
+        # The lease of the other worker is left alone
+        assert cache.get(f"{key}:lease") == 1
+
+    @pytest.mark.parametrize(
+        "write",
+        [
+            lambda jd: JobDescription.objects.filter(id=jd.id).update(title="Welder"),
+            lambda jd: jd.save(),
+            lambda jd: jd.delete(),
+            lambda jd: JobDescription.objects.all().delete(),
+            lambda jd: jd.chunks.get().delete(),
+            lambda jd: JobDescriptionChunk.objects.all().delete(),
+        ],
+    )
+    def test_corpus_generation_is_bumped(self, write, django_capture_on_commit_callbacks):
+        job_description = JobDescription.objects.create(title="Singer", company="Acme", location="Remote")
+        JobDescriptionChunk.objects.create(job_description=job_description, chunk="Sings", embedding=make_embedding(1.0))
+        generation = get_corpus_generation()
+        with django_capture_on_commit_callbacks(execute=True):
+            write(job_description)
+        assert get_corpus_generation() > generation
+
+    def test_chunks_are_fast_deleted(self, job_descriptions, django_capture_on_commit_callbacks):
+        assert Collector(using="default").can_fast_delete(JobDescriptionChunk.objects.all())
+        with CaptureQueriesContext(connection) as queries, django_capture_on_commit_callbacks() as callbacks:
+            JobDescriptionChunk.objects.filter(job_description=job_descriptions["Singer"]).delete()
+        assert [query["sql"].split()[0] for query in queries] == ["DELETE"]
+        assert len(callbacks) == 1
+
+    @pytest.mark.django_db(transaction=True)
+    def test_concurrent_bumps_are_not_lost(self):
+        generation = get_corpus_generation()
+        start = threading.Barrier(8)
+
+        def bump():
+            # Like workers committing batches at the same time
+            start.wait(5)
+            for _ in range(20):
+                bump_corpus_generation()
+            connection.close()
+
+        threads = [threading.Thread(target=bump) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert get_corpus_generation() == generation + 160
+
+
+@pytest.mark.django_db
+class TestFilteredSearch:
+    @pytest.fixture
+    def job_descriptions(self, job_descriptions):
+        JobDescription.objects.filter(title="Welder").update(company="Forge", language="de")
+        return job_descriptions
+
+    @pytest.mark.parametrize("engine_name", ["pgvector", "numpy"])
+    @pytest.mark.parametrize("filter_strategy", ["prefilter", "postfilter"])
+    @pytest.mark.parametrize(
+        "filters,expected_titles",
+        [
+            ({"company": "Forge"}, ["Welder"]),
+            ({"company": "Acme", "location": "Remote"}, ["Actor", "Singer"]),
+            ({"company": "Acme", "language": "de"}, []),
+        ],
+    )
+    def test_filters(self, job_descriptions, engine_name, filter_strategy, filters, expected_titles):
+        hits = get_search_engine(engine_name).search(make_embedding(1.0), limit=10, filters=filters, filter_strategy=filter_strategy)
+        assert [JobDescription.objects.get(id=hit.job_description_id).title for hit in hits] == expected_titles
+
+    @pytest.mark.parametrize("selectivity,expected_strategy_sql", [(0.01, "OFFSET 0"), (0.5, "AS nearest")])
+    def test_strategy_is_picked_by_selectivity(self, job_descriptions, settings, selectivity, expected_strategy_sql):
+        settings.SEARCH_PREFILTER_SELECTIVITY = 0.1
+        with (
+            mock.patch.object(PgvectorSearchEngine, "estimate_selectivity", return_value=selectivity),
+            CaptureQueriesContext(connection) as queries,
+        ):
+            hits = PgvectorSearchEngine().search(make_embedding(1.0), limit=10, filters={"company": "Forge"})
+        assert len(hits) == 1
+        ranking_sql = next(query["sql"] for query in queries if "WITH candidates" in query["sql"])
+        assert expected_strategy_sql in ranking_sql
+
+    @pytest.mark.parametrize("filter_strategy,estimated", [("auto", True), ("postfilter", True), ("prefilter", False)])
+    def test_selectivity_is_only_estimated_when_needed(self, job_descriptions, filter_strategy, estimated):
+        with mock.patch.object(PgvectorSearchEngine, "estimate_selectivity", return_value=0.5) as estimate_selectivity:
+            PgvectorSearchEngine().search(make_embedding(1.0), limit=10, filters={"company": "Forge"}, filter_strategy=filter_strategy)
+        assert estimate_selectivity.called == estimated
+
+    def test_estimate_selectivity(self, job_descriptions, django_assert_num_queries):
+        selectivity = PgvectorSearchEngine.estimate_selectivity({"company": "Forge"})
+        assert 0 < selectivity <= 1
+        # Only the corpus generation is read
+        with django_assert_num_queries(1):
+            assert PgvectorSearchEngine.estimate_selectivity({"company": "Forge"}) == selectivity
+
+    def test_search_endpoint_filters(self, job_descriptions, client):
+        model = mock_model(make_embedding(1.0))
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=model):
+            response = client.post(
+                "/api/job-descriptions/search/", {"query": "Music", "company": "Acme", "language": ""}, **JSON_RQST_HEADERS
+            )
+        assert response.status_code == 400
+
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=model):
+            response = client.post("/api/job-descriptions/search/", {"query": "Music", "company": "Acme"}, **JSON_RQST_HEADERS)
+        assert [r["job_description"]["title"] for r in response.json()["results"]] == ["Actor", "Singer"]
+
+
+@pytest.mark.django_db
+class TestHybridSearch:
+    def test_search_vector_is_maintained(self, db):
+        JobDescription.objects.bulk_create(
+            [JobDescription(title="Welder", company="Forge", location="Remote", description="<b>Arc</b> welding")]
+        )
+        assert len(lexical_search("arc", limit=10)) == 1
+        assert lexical_search("b", limit=10) == []
+
+        JobDescription.objects.update(skills="Soldering")
+        assert len(lexical_search("soldering", limit=10)) == 1
+
+    def test_lexical_ranking(self, job_descriptions):
+        JobDescription.objects.filter(title="Actor").update(skills="Welder")
+        assert lexical_search("welder", limit=10) == [job_descriptions["Welder"].id, job_descriptions["Actor"].id]
+        assert lexical_search("welder", limit=10, filters={"title": "Actor"}) == [job_descriptions["Actor"].id]
+
+    def test_reciprocal_rank_fusion(self):
+        fused = reciprocal_rank_fusion([["a", "b"], ["b", "c"]], k=60)
+        assert [id_ for id_, _ in fused] == ["b", "a", "c"]
+        assert fused[0][1] == pytest.approx(1 / 62 + 1 / 61)
+
+    @pytest.mark.parametrize("engine_name", ["pgvector", "numpy"])
+    @pytest.mark.parametrize(
+        "retrieval,expected_titles",
+        [("vector", ["Actor", "Singer", "Welder"]), ("hybrid", ["Welder", "Actor", "Singer"]), ("lexical", ["Welder"])],
+    )
+    def test_retrieval_modes(self, job_descriptions, settings, engine_name, retrieval, expected_titles):
+        settings.SEARCH_ENGINE = engine_name
+        model = mock_model(make_embedding(1.0))
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=model):
+            results = JobDescription.search(query="welder", limit=10, retrieval=retrieval)
+        assert [r.job_description.title for r in results] == expected_titles
+        # Lexical matches come with their best chunks like any other result
+        assert [c.chunk for c in results[expected_titles.index("Welder")].chunks] == ["Welder -0.5"]
+
+
+@pytest.mark.django_db
+class TestSearchPaging:
+    url = "/api/job-descriptions/search/"
+
+    @pytest.fixture
+    def model(self):
+        model = mock_model(make_embedding(1.0))
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=model):
+            yield model
+
+    def get_titles(self, response):
+        return [r["job_description"]["title"] for r in response.json()["results"]]
+
+    def test_pages_are_served_from_the_ranking(self, client, job_descriptions, model, django_assert_num_queries):
+        response = client.post(f"{self.url}?page_size=2", {"query": "Music"}, **JSON_RQST_HEADERS)
+        assert response.status_code == 200
+        assert response.json()["count"] == 3
+        assert response.json()["previous"] is None
+        assert self.get_titles(response) == ["Actor", "Singer"]
+
+        with mock.patch("vector_demonstration.core.search.PgvectorSearchEngine.search") as mocked_search:
+            # One query for the job descriptions of the page and one for their chunks
+            with django_assert_num_queries(2):
+                response = client.get(response.json()["next"])
+        assert not mocked_search.called
+        assert self.get_titles(response) == ["Welder"]
+        assert response.json()["next"] is None
+
+        response = client.get(response.json()["previous"])
+        assert self.get_titles(response) == ["Actor", "Singer"]
+        assert model.encode.call_count == 1
+
+    def test_page_size_is_bounded(self, client, job_descriptions, model, settings):
+        settings.SEARCH_MAX_PAGE_SIZE = 1
+        response = client.post(f"{self.url}?page_size=50", {"query": "Music"}, **JSON_RQST_HEADERS)
+        assert len(response.json()["results"]) == 1
+
+    def test_invalid_cursor(self, client):
+        response = client.get(self.url, {"cursor": "not-a-cursor"})
+        assert response.status_code == 404
+
+    def test_expired_ranking(self, client, job_descriptions, model):
+        response = client.post(f"{self.url}?page_size=1", {"query": "Music"}, **JSON_RQST_HEADERS)
+        cache.clear()
+        response = client.get(response.json()["next"])
+        assert response.status_code == 404
+
+    def test_deleted_job_descriptions_are_skipped(self, client, job_descriptions, model):
+        response = client.post(f"{self.url}?page_size=1", {"query": "Music"}, **JSON_RQST_HEADERS)
+        job_descriptions["Singer"].delete()
+        response = client.get(response.json()["next"])
+        assert response.status_code == 200
+        assert response.json()["results"] == []
+
+
+@pytest.mark.django_db
+class TestSearchResultsFormat:
+    url = "/api/job-descriptions/search/"
+
+    @pytest.fixture(autouse=True)
+    def model(self):
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=mock_model(make_embedding(1.0))):
+            yield
+
+    def search(self, client, url=None, **params):
+        return client.post(f"{url or self.url}?{urlencode(params)}", {"query": "Music", "aggregation": "min"}, **JSON_RQST_HEADERS)
+
+    def test_embeddings_are_omitted_by_default(self, client, job_descriptions):
+        results = self.search(client).json()["results"]
+        assert set(results[0]["job_description"]) == {"id", "title", "company", "location", "description", "skills", "language"}
+        assert [len(r["chunks"]) for r in results] == [2, 2, 1]
+        assert set(results[0]["chunks"][0]) == {"job_description_id", "chunk", "token_count"}
+
+    def test_selected_fields(self, client, job_descriptions):
+        response = self.search(client, fields="id,title", max_chunks=1, page_size=1)
+        results = response.json()["results"]
+        assert results[0]["job_description"] == {"id": str(job_descriptions["Singer"].id), "title": "Singer"}
+        assert [c["chunk"] for c in results[0]["chunks"]] == ["Singer 0.9"]
+
+        # The format is kept when paging
+        next_url = response.json()["next"]
+        assert "fields=id%2Ctitle" in next_url
+        results = client.get(next_url).json()["results"]
+        assert set(results[0]["job_description"]) == {"id", "title"}
+        assert len(results[0]["chunks"]) == 1
+
+        # Pages in different formats are cached separately
+        results = self.search(client, max_chunks=0, page_size=1).json()["results"]
+        assert "chunks" not in results[0]
+        assert "description" in results[0]["job_description"]
+
+    @pytest.mark.parametrize("embedding_format", ["json", "float16"])
+    def test_embedding_formats(self, client, job_descriptions, embedding_format):
+        chunk = self.search(client, embedding_format=embedding_format).json()["results"][0]["chunks"][0]
+        if embedding_format == "float16":
+            embedding = np.frombuffer(base64.b64decode(chunk["embedding"]), dtype="<f2")
+        else:
+            embedding = np.array(chunk["embedding"])
+        assert embedding == pytest.approx(make_unit_embedding(0.9), abs=1e-3)
+
+    @pytest.mark.parametrize("params", [{"fields": "title,embedding"}, {"max_chunks": -1}, {"embedding_format": "float64"}])
+    def test_invalid_format(self, client, params):
+        assert self.search(client, **params).status_code == 400
+
+
+class TestRenderers:
+    data = {
+        "id": uuid.UUID(int=1),
+        "created": datetime.datetime(2024, 1, 2, 3, 4, 5),
+        "score": np.float32(0.5),
+        "embedding": np.array([0.25, -1.0], dtype=np.float32),
+        "skills": ["Singing"],
+        "description": "Pronounced \u201csinger\u201d",
+    }
+
+    def test_orjson_matches_json(self):
+        content = ORJSONRenderer().render(self.data)
+        assert json.loads(content) == json.loads(JSONRenderer().render(self.data))
+        assert ORJSONRenderer().render(self.data, "application/json; indent=4").startswith(b'{\n  "id"')
+
+    def test_msgpack_matches_json(self):
+        content = MessagePackRenderer().render(self.data)
+        assert msgpack.unpackb(content) == json.loads(JSONRenderer().render(self.data))
+
+    @mock.patch("vector_demonstration.core.encoders.get_model", return_value=mock_model(make_embedding(1.0)))
+    @pytest.mark.parametrize("accept", ["application/json", "application/msgpack"])
+    def test_search_negotiates_renderer(self, _, client, job_descriptions, accept):
+        response = client.post(
+            "/api/job-descriptions/search/?embedding_format=json", {"query": "Music"}, **{**JSON_RQST_HEADERS, "HTTP_ACCEPT": accept}
+        )
+        assert response.status_code == 200
+        assert response["Content-Type"] == accept
+        assert accept == "application/msgpack" or response.json()["count"] == 3
+
+
+class TestThreadLocalUserMiddleware:
+    def test_sync_requests(self):
+        middleware = ThreadLocalUserMiddleware(lambda request: get_current_user())
+        assert middleware(mock.Mock(user="Alice")) == "Alice"
+
+    def test_concurrent_async_requests_each_see_their_user(self):
+        async def get_response(request):
+            await asyncio.sleep(0.01)
+            # Like a sync view, run in an executor thread
+            return await sync_to_async(get_current_user)()
+
+        middleware = ThreadLocalUserMiddleware(get_response)
+        assert iscoroutinefunction(middleware)
+
+        async def call_concurrently():
+            return await asyncio.gather(*(middleware(mock.Mock(user=user)) for user in ["Alice", "Bob"]))
+
+        assert asyncio.run(call_concurrently()) == ["Alice", "Bob"]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestAsyncSearch:
+    url = "/api/job-descriptions/async-search/"
+
+    @pytest.fixture(autouse=True)
+    def executors(self):
+        yield
+        # Executor threads keep their own connections, which must be closed before the test database is flushed
+        shutdown_executors()
+
+    @pytest.fixture
+    def model(self):
+        model = mock_model(make_embedding(1.0))
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=model):
+            yield model
+
+    def post(self, query, url=None):
+        return asyncio.run(AsyncClient().post(url or self.url, {"query": query}, content_type="application/json"))
+
+    def get_titles(self, response):
+        return [r["job_description"]["title"] for r in response.json()["results"]]
+
+    def test_matches_search(self, client, job_descriptions, model):
+        response = self.post("Music", url=f"{self.url}?page_size=2")
+        assert response.status_code == 200
+        assert response.json()["count"] == 3
+        assert self.get_titles(response) == ["Actor", "Singer"]
+        assert response.json()["next"].startswith(f"http://testserver{self.url}?cursor=")
+
+        next_response = asyncio.run(AsyncClient().get(response.json()["next"]))
+        assert self.get_titles(next_response) == ["Welder"]
+
+        # Rankings are shared with the sync view
+        sync_response = client.post("/api/job-descriptions/search/?page_size=2", {"query": "Music"}, **JSON_RQST_HEADERS)
+        assert sync_response.json()["results"] == response.json()["results"]
+        assert model.encode.call_count == 1
+
+    def test_concurrent_searches_are_encoded_together(self, job_descriptions, settings):
+        settings.SEARCH_ENCODER_MAX_BATCH_SIZE = 2
+        # Long enough for both searches to reach the batcher, the batch is dispatched as soon as it is full
+        settings.SEARCH_ENCODER_MAX_WAIT_MS = 5000
+
+        async def search_concurrently():
+            client = AsyncClient()
+            return await asyncio.gather(
+                *(
+                    client.post(self.url, {"query": query, "limit": 1, "aggregation": "min"}, content_type="application/json")
+                    for query in ["Music", "Welding"]
+                )
+            )
+
+        embeddings = {"Music": make_embedding(1.0), "Welding": make_embedding(-1.0)}
+        model = mock.Mock(encode=mock.Mock(side_effect=lambda queries, **kwargs: np.array([embeddings[q] for q in queries])))
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=model):
+            responses = asyncio.run(search_concurrently())
+        assert model.encode.call_count == 1
+        assert sorted(model.encode.call_args.args[0]) == ["Music", "Welding"]
+        assert [self.get_titles(response) for response in responses] == [["Singer"], ["Welder"]]
+
+    def test_server_timing(self, job_descriptions, model):
+        response = self.post("Music")
+        entries = [entry.split(";")[0] for entry in response["Server-Timing"].split(", ")]
+        assert entries == ["encode", "rank", "load", "serialize", "db", "total"]
+        # Counted in the database executor's threads
+        assert 'db;desc="5 queries / 13 rows"' in response["Server-Timing"]
+
+    def test_errors(self, db):
+        response = self.post("")
+        assert response.status_code == 400
+        assert "query" in response.json()
+
+        response = asyncio.run(AsyncClient().get(self.url, {"cursor": "not-a-cursor"}))
+        assert response.status_code == 404
+        assert asyncio.run(AsyncClient().delete(self.url)).status_code == 405
+
+
+class TestSearchMetrics:
+    @pytest.fixture(autouse=True)
+    def model(self):
+        with mock.patch("vector_demonstration.core.encoders.get_model", return_value=mock_model(make_embedding(1.0))):
+            yield
+
+    def get_server_timing(self, response):
+        """Server-Timing entries by name, e.g. {"encode": {"dur": "1.2", "desc": '"Query encoding"'}}."""
+        entries = {}
+        for entry in response["Server-Timing"].split(", "):
+            name, *params = entry.split(";")
+            entries[name] = dict(param.split("=", 1) for param in params)
+        return entries
+
+    def test_server_timing(self, client, job_descriptions):
+        response = client.post("/api/job-descriptions/search/?page_size=2", {"query": "Music"}, **JSON_RQST_HEADERS)
+        timing = self.get_server_timing(response)
+        assert list(timing) == ["encode", "rank", "load", "serialize", "db", "total"]
+        assert float(timing["total"]["dur"]) >= float(timing["rank"]["dur"])
+        # The corpus generation (1 row), index parameters, ranking (3 rows), the first page's job descriptions (2) and chunks (4),
+        # and the savepoint and release within the test's transaction
+        assert timing["db"]["desc"] == '"7 queries / 11 rows"'
+
+        # Paging only loads and serializes a page of the cached ranking
+        response = client.get(response.json()["next"])
+        assert list(self.get_server_timing(response)) == ["load", "serialize", "db", "total"]
+
+    def test_metrics_endpoint(self, client, job_descriptions, settings):
+        client.post("/api/job-descriptions/search/", {"query": "Music"}, **JSON_RQST_HEADERS)
+        client.post("/api/job-descriptions/batch-search/", {"queries": ["Music", "Welding"]}, **JSON_RQST_HEADERS)
+
+        response = client.get("/api/metrics/")
+        assert response["Content-Type"].startswith("text/plain; version=0.0.4")
+        lines = response.content.decode().splitlines()
+        assert "# TYPE search_stage_duration_seconds histogram" in lines
+        assert 'search_stage_duration_seconds_count{stage="encode"} 2' in lines
+        assert 'search_request_duration_seconds_bucket{endpoint="batch_search",le="+Inf"} 1' in lines
+        assert 'search_request_db_queries_count{endpoint="search"} 1' in lines
+        assert 'search_request_db_rows_sum{endpoint="search"} 13.0' in lines
+
+        settings.METRICS_BEARER_TOKEN = "secret"
+        assert client.get("/api/metrics/").status_code == 401
+        assert client.get("/api/metrics/", HTTP_AUTHORIZATION="Bearer secret").status_code == 200
+
+
+@pytest.mark.django_db
+class TestCopyLoad:
+    def test_rows_are_copied(self):
+        job_description = JobDescription(title="Singer", company="Acme", location="Austin, TX", description="<p>Sing</p>")
+        embedding = np.random.default_rng(0).normal(size=384)
+        embedding = (embedding / np.linalg.norm(embedding)).astype(np.float32)
+        chunk = JobDescriptionChunk(job_description=job_description, chunk="Sing", token_count=1, embedding=embedding)
+        chunk.quantize()
+
+        with CaptureQueriesContext(connection) as queries:
+            JobDescription.objects.copy_load([job_description])
+            JobDescriptionChunk.objects.copy_load([chunk])
+
+        assert [query["sql"].split()[0] for query in queries] == ["CREATE", "COPY", "INSERT", "DROP"] * 2
+        assert not job_description._state.adding
+        copied = JobDescriptionChunk.objects.select_related("job_description").get()
+        assert copied.job_description.location == "Austin, TX"
+        assert copied.job_description.embedded_at is None
+        assert copied.datetime_created == chunk.datetime_created
+        assert (copied.chunk, copied.token_count) == ("Sing", 1)
+        np.testing.assert_array_equal(np.asarray(copied.embedding, dtype=np.float32), chunk.embedding)
+        np.testing.assert_array_equal(np.asarray(copied.embedding_half, dtype=np.float16), chunk.embedding.astype(np.float16))
+        assert copied.embedding_binary == chunk.embedding_binary
+
+    def test_existing_rows_are_updated(self):
+        job_description = JobDescription.objects.create(title="Singer")
+        datetime_created = job_description.datetime_created
+        job_description.title = "Lead singer"
+
+        JobDescription.objects.copy_load([job_description, JobDescription(title="Welder")])
+
+        assert sorted(JobDescription.objects.values_list("title", flat=True)) == ["Lead singer", "Welder"]
+        assert JobDescription.objects.get(id=job_description.id).datetime_created == datetime_created
+
+    def test_corpus_generation_is_bumped(self, django_capture_on_commit_callbacks):
+        generation = get_corpus_generation()
+        with django_capture_on_commit_callbacks(execute=True):
+            JobDescription.objects.copy_load([JobDescription(title="Singer")])
+        assert get_corpus_generation() == generation + 1
+
+    @pytest.mark.parametrize("method", ["copy", "bulk_create"])
+    def test_bulk_load(self, method, settings):
+        settings.BULK_LOAD_METHOD = method
+        with CaptureQueriesContext(connection) as queries:
+            JobDescription.objects.bulk_load([JobDescription(title="Singer"), JobDescription(title="Welder")])
+        assert JobDescription.objects.count() == 2
+        assert any(query["sql"].startswith("CREATE TEMPORARY TABLE") for query in queries) == (method == "copy")
+
+
+@pytest.mark.django_db
+def test_import_job_descriptions(tmp_path):
+    header = ",title,company,location,link,description,skills\n"
+    rows = [f'{i},Singer {i},Acme,"Austin, TX",https://example.com,"<p>Sing</p>\n<p>Line {i}</p>",Singing\n' for i in range(3)]
+    (tmp_path / "Singer.csv").write_text(header + "".join(rows))
+    (tmp_path / "Welder.csv").write_text(header + '0,Welder,Acme,Remote,https://example.com,"<p>Weld</p>",Welding\n')
+    stdout = mock.Mock()
+
+    with CaptureQueriesContext(connection) as queries:
+        call_command("import_job_descriptions", directory=str(tmp_path), batch_size=2, stdout=stdout)
+
+    # Two batches for the first file, one for the second
+    assert len([query for query in queries if query["sql"].startswith("INSERT")]) == 3
+    assert JobDescription.objects.count() == 4
+    job_description = JobDescription.objects.get(title="Singer 2")
+    assert (job_description.location, job_description.description) == ("Austin, TX", "<p>Sing</p>\n<p>Line 2</p>")
+    assert "Loaded 3 job descriptions" in stdout.write.call_args_list[3].args[0]
+
+
+@pytest.mark.django_db
+class TestEmbedCorpus:
+    @pytest.fixture
+    def model(self):
+        model = mock_model(make_unit_embedding(0.5))
+        tokenizer = mock.Mock(side_effect=lambda texts, **kwargs: {"input_ids": [text.split() for text in texts]})
+        with (
+            mock.patch("vector_demonstration.core.encoders.get_model", return_value=model),
+            mock.patch("vector_demonstration.core.encoders.get_tokenizer", return_value=tokenizer),
+        ):
+            yield model
+
+    def test_embed_corpus(self, model):
+        short = JobDescription.objects.create(title="Pianist", description="<p>Plays the <b>piano</b></p>")
+        long = JobDescription.objects.create(title="Drummer", description="drums " * 200)
+        empty = JobDescription.objects.create(title="Mime", description="")
+
+        call_command("embed_corpus", batch_size=3, encode_batch_size=64, stdout=mock.Mock())
+
+        assert JobDescriptionChunk.objects.count() == 1 + 2
+        chunk = JobDescriptionChunk.objects.get(job_description=short)
+        assert (chunk.chunk, chunk.token_count) == ("Plays the piano", 3)
+        assert chunk.embedding_half is not None
+        assert [len(c.chunk) for c in long.chunks.order_by("-token_count")] == [750, 450]
+        assert not empty.chunks.exists()
+        # The chunks of every job description in the batch are encoded together
+        model.encode.assert_called_once()
+        assert len(model.encode.call_args.args[0]) == 3
+        assert model.encode.call_args.kwargs == {"batch_size": 64, "normalize_embeddings": True}
+
+        short.refresh_from_db()
+        assert short.embedding_model_id == "all-MiniLM-L6-v2@latest"
+        assert short.embedding_chunker_version == CHUNKER_VERSION
+        assert short.embedding_content_hash == hashlib.sha256(short.description.encode()).hexdigest()
+        assert short.embedded_at is not None
+        # Including those without chunks
+        assert JobDescription.objects.filter(embedded_at__isnull=True).count() == 0
+
+    def test_only_changes_are_embedded(self, model, settings):
+        short = JobDescription.objects.create(title="Pianist", description="Plays the piano")
+        JobDescription.objects.create(title="Drummer", description="Plays the drums")
+        call_command("embed_corpus", stdout=mock.Mock())
+        assert model.encode.call_count == 1
+
+        call_command("embed_corpus", stdout=mock.Mock())
+        assert model.encode.call_count == 1
+
+        # Changed descriptions are re-embedded, their old chunks replaced
+        JobDescription.objects.filter(id=short.id).update(description="Plays the grand piano")
+        call_command("embed_corpus", stdout=mock.Mock())
+        assert model.encode.call_args.args[0] == ["Plays the grand piano"]
+        assert [c.chunk for c in short.chunks.all()] == ["Plays the grand piano"]
+
+        # Everything is re-embedded with another model
+        settings.EMBEDDING_MODEL_REVISION = "v2"
+        call_command("embed_corpus", stdout=mock.Mock())
+        assert sorted(model.encode.call_args.args[0]) == ["Plays the drums", "Plays the grand piano"]
+        assert JobDescriptionChunk.objects.count() == 2
+
+    @pytest.mark.django_db(transaction=True)
+    def test_claimed_job_descriptions_are_skipped(self, model):
+        claimed = JobDescription.objects.create(title="Pianist", description="piano")
+        pending = JobDescription.objects.create(title="Drummer", description="drums")
+        locked, release = threading.Event(), threading.Event()
+
+        def claim():
+            # Like another worker embedding a batch
+            with transaction.atomic():
+                JobDescription.objects.select_for_update().get(id=claimed.id)
+                locked.set()
+                release.wait(5)
+            connection.close()
+
+        worker = threading.Thread(target=claim)
+        worker.start()
+        locked.wait(5)
+        try:
+            assert embed_pending(batch_size=10) == (1, 1)
+        finally:
+            release.set()
+            worker.join()
+        assert pending.chunks.exists()
+        assert not claimed.chunks.exists()
+
+        # Had the other worker crashed, its batch is left for the next run
+        assert embed_pending(batch_size=10) == (1, 1)
+        assert claimed.chunks.exists()
+
+
+@pytest.mark.django_db
+class TestEmbeddingSnapshots:
+    def test_export_snapshot(self, job_descriptions, tmp_path):
+        call_command("export_embedding_snapshot", directory=str(tmp_path), stdout=mock.Mock())
+        version = get_current_version(tmp_path)
+        manifest = read_manifest(tmp_path, version)
+        assert manifest["chunks"] == 5
+        assert manifest["jobs"] == 3
+        assert manifest["dimensions"] == 384
+
+        embeddings = np.load(tmp_path / version / "embeddings.npy")
+        assert embeddings.shape == (5, 384)
+        assert embeddings.dtype == np.float32
+
+    def test_numpy_engine_serves_snapshot(self, job_descriptions, tmp_path, settings):
+        call_command("export_embedding_snapshot", directory=str(tmp_path), stdout=mock.Mock())
+        expected_hits = get_search_engine("pgvector").search(make_embedding(1.0), limit=10)
+
+        settings.SEARCH_SNAPSHOT_DIR = str(tmp_path)
+        engine = get_search_engine("numpy")
+        with mock.patch("vector_demonstration.core.embedding_index.EmbeddingIndex.from_database") as mocked_from_database:
+            hits = engine.search(make_embedding(1.0), limit=10)
+        assert not mocked_from_database.called
+        assert isinstance(engine.get_index().embeddings, np.memmap)
+        assert [hit.job_description_id for hit in hits] == [hit.job_description_id for hit in expected_hits]
+        assert [hit.chunk_ids for hit in hits] == [hit.chunk_ids for hit in expected_hits]
+
+    def test_new_snapshot_is_picked_up(self, job_descriptions, tmp_path, settings):
+        settings.SEARCH_SNAPSHOT_DIR = str(tmp_path)
+        call_command("export_embedding_snapshot", stdout=mock.Mock())
+        engine = get_search_engine("numpy")
+        assert len(engine.search(make_embedding(1.0), limit=10)) == 3
+
+        job_descriptions["Welder"].delete()
+        # Still serving the snapshot until a new one is exported
+        assert len(engine.search(make_embedding(1.0), limit=10)) == 3
+        call_command("export_embedding_snapshot", keep=1, stdout=mock.Mock())
+        assert len(engine.search(make_embedding(1.0), limit=10)) == 2
+        assert len([p for p in tmp_path.iterdir() if p.is_dir()]) == 1
+
+
+@pytest.mark.django_db
+class TestQuantizedSearch:
+    def test_chunks_are_quantized_on_save(self, job_descriptions):
+        chunk = JobDescriptionChunk.objects.get(chunk="Singer 0.9")
+        assert chunk.embedding_binary == "11" + "0" * 382
+        assert chunk.embedding_half[0] == pytest.approx(0.9, abs=1e-3)
+
+    @pytest.mark.parametrize(
+        "engine_name,quantization",
+        [("pgvector", "half"), ("pgvector", "binary"), ("numpy", "half"), ("numpy", "int8"), ("numpy", "binary")],
+    )
+    def test_results_are_reranked_exactly(self, job_descriptions, engine_name, quantization):
+        engine = get_search_engine(engine_name)
+        expected_hits = engine.search(make_embedding(1.0), limit=10, metric="inner_product")
+        hits = engine.search(make_embedding(1.0), limit=10, metric="inner_product", quantization=quantization)
+        assert hits == expected_hits
+
+    def test_numpy_rerank_pool(self, job_descriptions, settings):
+        settings.SEARCH_CANDIDATE_CHUNKS = 1
+        settings.SEARCH_RERANK_POOL_FACTOR = 2
+        hits = get_search_engine("numpy").search(make_embedding(1.0), limit=1, chunks_per_result=1, quantization="int8")
+        assert hits[0].job_description_id == job_descriptions["Singer"].id
+        assert hits[0].chunk_distances == pytest.approx([0.1], abs=1e-6)
+
+    def test_unsupported_quantization_is_rejected(self, client):
+        response = client.post("/api/job-descriptions/search/", {"query": "Music", "quantization": "int8"}, **JSON_RQST_HEADERS)
+        assert response.status_code == 400
+        assert "quantization" in response.json()
+
+    def test_quantize_embeddings_command(self, job_descriptions):
+        JobDescriptionChunk.objects.update(embedding_half=None, embedding_binary=None)
+        call_command("quantize_embeddings", batch_size=2, stdout=mock.Mock())
+        assert not JobDescriptionChunk.objects.filter(embedding_half__isnull=True).exists()
+        assert not JobDescriptionChunk.objects.filter(embedding_binary__isnull=True).exists()
+
+    def test_quantization_report_command(self, job_descriptions):
+        stdout = mock.Mock()
+        call_command("quantization_report", engine="numpy", queries=2, stdout=stdout)
+        output = "".join(call.args[0] for call in stdout.write.call_args_list)
+        assert "recall 1.000" in output
+        for quantization in ["none", "half", "int8", "binary"]:
+            assert quantization in output
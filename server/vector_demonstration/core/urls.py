@@ -13,6 +13,9 @@ router.register("users", core_views.UserViewSet)
 router.register("job-descriptions", core_views.JobDescriptionViewSet)
 
 urlpatterns = [
+    # Before the router, which would take "async-search" for a job description id
+    path("api/job-descriptions/async-search/", core_views.search_async),
+    path("api/metrics/", core_views.metrics),
     path("api/", include(router.urls)),
     path("api/login/", core_views.UserLoginView.as_view()),
     path(r"api/logout/", rest_auth_views.LogoutView.as_view()),
@@ -6,9 +6,10 @@ from django.conf import settings
 from django.contrib.auth import authenticate
 from django.contrib.auth.tokens import default_token_generator
 from django.db import transaction
-from django.http import Http404
+from django.http import Http404, HttpResponse, HttpResponseNotAllowed
 from django.shortcuts import render
 from django.template import TemplateDoesNotExist
+from django.utils.crypto import constant_time_compare
 from rest_framework import generics, mixins, permissions, status, views, viewsets
 from rest_framework.decorators import (
     action,
@@ -16,16 +17,25 @@ from rest_framework.decorators import (
     authentication_classes,
     permission_classes,
 )
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import APIException, NotAcceptable, NotFound, ValidationError
+from rest_framework.request import Request
 from rest_framework.response import Response
+from rest_framework.settings import api_settings
 from vector_demonstration.utils.emails import send_html_email
 
+from . import async_search
+from .caching import get_cached_ranking, get_cached_search_page, get_ranking
+from .metrics import instrument, render_metrics, timed
 from .models import JobDescription, User
+from .pagination import SearchCursorPagination
 from .permissions import CreateOnlyPermissions
+from .search import build_search_results
 from .serializers import (
+    JobDescriptionBatchQuerySerializer,
     JobDescriptionQuerySerializer,
     JobDescriptionSearchResultsSerializer,
     JobDescriptionSerializer,
+    SearchResultsFormatSerializer,
     UserLoginSerializer,
     UserRegistrationSerializer,
     UserSerializer,
@@ -197,17 +207,138 @@ class JobDescriptionViewSet(
     serializer_class = JobDescriptionSerializer
     permission_classes = ()
 
-    @action(detail=False, methods=["post"])
+    @action(detail=False, methods=["get", "post"])
+    @instrument("search")
     def search(self, request):
-        # Validate Query Input
-        query_serializer = JobDescriptionQuerySerializer(data=request.data)
+        """
+        POST a query to rank job descriptions and get the first page of results. GET the `next` or
+        `previous` link of a response to page through the same ranking without searching again.
+        """
+        paginator = SearchCursorPagination()
+        response_format = self.get_search_results_format(request)
+        if request.method == "GET":
+            ranking_key, offset, page_size = paginator.decode_cursor(request)
+            hits = get_ranking(ranking_key)
+            if hits is None:
+                raise NotFound(paginator.invalid_cursor_message)
+        else:
+            # Validate Query Input
+            query_serializer = JobDescriptionQuerySerializer(data=request.data)
+            query_serializer.is_valid(raise_exception=True)
+            search_params = query_serializer.validated_data
+
+            # Only the top `limit` results are ranked, and the ranking is shared by identical searches
+            ranking_key, hits = get_cached_ranking(search_params, lambda: JobDescription.rank(**search_params))
+            offset, page_size = 0, None
+
+        page = paginator.paginate_ranking(hits, ranking_key, request, offset=offset, page_size=page_size)
+
+        def serialize_page():
+            results = build_search_results(page, with_embeddings=SearchResultsFormatSerializer.includes_embeddings(response_format))
+            with timed("serialize"):
+                return JobDescriptionSearchResultsSerializer(results, many=True, context={"response_format": response_format}).data
+
+        results = get_cached_search_page(
+            ranking_key,
+            paginator.offset,
+            paginator.page_size,
+            serialize_page,
+            response_format_key=SearchResultsFormatSerializer.get_key(response_format),
+        )
+        return paginator.get_paginated_response(results)
+
+    @action(detail=False, methods=["post"], url_path="batch-search")
+    @instrument("batch_search")
+    def batch_search(self, request):
+        """
+        Search for several queries at once. Queries are encoded together and ranked in a single
+        database round trip, and the top `limit` results are returned for each of them.
+        """
+        response_format = self.get_search_results_format(request)
+        query_serializer = JobDescriptionBatchQuerySerializer(data=request.data)
         query_serializer.is_valid(raise_exception=True)
-        query = query_serializer.validated_data["query"]
-
-        # Perform search
-        search_results = JobDescription.search(query=query)
+        search_params = dict(query_serializer.validated_data)
+        queries = search_params.pop("queries")
+
+        with_embeddings = SearchResultsFormatSerializer.includes_embeddings(response_format)
+        result_lists = JobDescription.search_many(queries, with_embeddings=with_embeddings, **search_params)
+        context = {"response_format": response_format}
+        with timed("serialize"):
+            data = [
+                {"query": query, "results": JobDescriptionSearchResultsSerializer(results, many=True, context=context).data}
+                for query, results in zip(queries, result_lists)
+            ]
+        return Response(data)
 
-        # Serialize results top 50 results
-        results_serialized = JobDescriptionSearchResultsSerializer(search_results[:50], many=True)
-
-        return Response(results_serialized.data)
+    @staticmethod
+    def get_search_results_format(request):
+        """
+        Validate the `fields`, `max_chunks` and `embedding_format` query parameters shaping search results.
+        """
+        format_serializer = SearchResultsFormatSerializer(data=request.query_params)
+        format_serializer.is_valid(raise_exception=True)
+        return format_serializer.validated_data
+
+
+@instrument("async_search")
+async def search_async(request):
+    """
+    Same as `JobDescriptionViewSet.search`, for ASGI servers: the search runs in executors while the event loop
+    serves other requests, so one worker process handles many searches at once. See `core/async_search.py`.
+
+    A plain Django view, DRF views can't be async. Its `next` and `previous` links page through this endpoint.
+    """
+    if request.method not in ("GET", "POST"):
+        return HttpResponseNotAllowed(["GET", "POST"])
+    request = Request(request, parsers=[parser() for parser in api_settings.DEFAULT_PARSER_CLASSES])
+    paginator = SearchCursorPagination()
+    try:
+        response_format = JobDescriptionViewSet.get_search_results_format(request)
+        if request.method == "GET":
+            ranking_key, offset, page_size = paginator.decode_cursor(request)
+            hits = await async_search.run_in_database_executor(get_ranking, ranking_key)
+            if hits is None:
+                raise NotFound(paginator.invalid_cursor_message)
+        else:
+            query_serializer = JobDescriptionQuerySerializer(data=request.data)
+            query_serializer.is_valid(raise_exception=True)
+            ranking_key, hits = await async_search.rank(query_serializer.validated_data)
+            offset, page_size = 0, None
+    except APIException as exc:
+        detail = exc.detail if isinstance(exc, ValidationError) else {"detail": exc.detail}
+        return render_response(request, detail, status=exc.status_code)
+
+    page = paginator.paginate_ranking(hits, ranking_key, request, offset=offset, page_size=page_size)
+    results = await async_search.get_page(ranking_key, page, paginator.offset, paginator.page_size, response_format)
+    return render_response(request, paginator.get_paginated_data(results))
+
+
+def render_response(request, data, status=200):
+    """
+    Render `data` with the renderer negotiated from the `Accept` header, like DRF does for its views.
+    """
+    renderers = [renderer() for renderer in api_settings.DEFAULT_RENDERER_CLASSES]
+    try:
+        renderer, media_type = api_settings.DEFAULT_CONTENT_NEGOTIATION_CLASS().select_renderer(request, renderers)
+    except NotAcceptable as exc:
+        renderer, media_type = renderers[0], renderers[0].media_type
+        data, status = {"detail": exc.detail}, exc.status_code
+    content_type = f"{media_type}; charset={renderer.charset}" if renderer.charset else media_type
+    return HttpResponse(renderer.render(data, media_type, {}), status=status, content_type=content_type)
+
+
+def metrics(request):
+    """
+    Search metrics of this process in the Prometheus text format, see `core/metrics.py`. Requires
+    `Authorization: Bearer <METRICS_BEARER_TOKEN>` when that setting is set.
+    """
+    if settings.METRICS_BEARER_TOKEN and not constant_time_compare(
+        request.headers.get("Authorization", ""), f"Bearer {settings.METRICS_BEARER_TOKEN}"
+    ):
+        return HttpResponse(status=status.HTTP_401_UNAUTHORIZED)
+    return HttpResponse(render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+# Django 3.2's `csrf_exempt` decorator would turn the view into a sync one. Like the DRF views, this one doesn't
+# use session authentication, so it has nothing to protect.
+search_async.csrf_exempt = True
@@ -64,8 +64,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "whitenoise.middleware.WhiteNoiseMiddleware",
-    "django_currentuser.middleware.ThreadLocalUserMiddleware",
+    "vector_demonstration.common.middleware.WhiteNoiseMiddleware",
+    "vector_demonstration.common.middleware.ThreadLocalUserMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "corsheaders.middleware.CorsMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -103,6 +103,7 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = "vector_demonstration.wsgi.application"
+ASGI_APPLICATION = "vector_demonstration.asgi.application"
 
 # Database
 """There are two ways to specifiy the database connection
@@ -164,8 +165,10 @@ REST_FRAMEWORK = {
         "rest_framework.authentication.TokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
+    # orjson replaces the stdlib JSON renderer, and MessagePack is served on request, see core/renderers.py
     "DEFAULT_RENDERER_CLASSES": [
-        "rest_framework.renderers.JSONRenderer",
+        "vector_demonstration.core.renderers.ORJSONRenderer",
+        "vector_demonstration.core.renderers.MessagePackRenderer",
     ],
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend",
@@ -176,6 +179,100 @@ REST_FRAMEWORK = {
     "DEFAULT_VERSION": "1.0",
     "EXCEPTION_HANDLER": "rest_framework.views.exception_handler",
 }
+#
+# Caching
+#
+# Search results and paging cursors live in the default cache, which every worker and management command must
+# share. It defaults to a table of the database, created by `manage.py createcachetable`. Memcached or Redis are
+# faster alternatives. The counters that invalidate them are kept in the database, see `SearchGeneration`.
+CACHES = {
+    "default": {
+        "BACKEND": config("CACHE_BACKEND", default="django.core.cache.backends.db.DatabaseCache"),
+        "LOCATION": config("CACHE_LOCATION", default="django_cache"),
+        "OPTIONS": {"MAX_ENTRIES": config("CACHE_MAX_ENTRIES", default=10000, cast=int)},
+    }
+}
+
+#
+# Embedding & Search Configuration
+#
+EMBEDDING_MODEL_NAME = config("EMBEDDING_MODEL_NAME", default="all-MiniLM-L6-v2")
+EMBEDDING_TOKENIZER_NAME = config("EMBEDDING_TOKENIZER_NAME", default="sentence-transformers/all-MiniLM-L6-v2")
+# Pin a Hugging Face revision (commit hash or tag) so every worker loads the same weights
+EMBEDDING_MODEL_REVISION = config("EMBEDDING_MODEL_REVISION", default=None)
+# Load the encoder when the app starts instead of on the first search request
+EMBEDDING_WARM_UP = config("EMBEDDING_WARM_UP", default=True, cast=bool)
+# Number of texts encoded per forward pass when encoding a batch of queries
+EMBEDDING_BATCH_SIZE = config("EMBEDDING_BATCH_SIZE", default=32, cast=int)
+# How imports and embedding runs insert rows: "copy" streams them with COPY, "bulk_create" uses INSERT statements
+BULK_LOAD_METHOD = config("BULK_LOAD_METHOD", default="copy")
+# "pgvector" searches in Postgres, "numpy" keeps every embedding in memory for exact search without database scans
+SEARCH_ENGINE = config("SEARCH_ENGINE", default="pgvector")
+# Directory of snapshots written by `export_embedding_snapshot`. When set, the numpy engine memory maps the current
+# snapshot instead of loading embeddings from the database.
+SEARCH_SNAPSHOT_DIR = config("SEARCH_SNAPSHOT_DIR", default="")
+# How often the numpy engine checks whether its embeddings changed, rather than on every query
+SEARCH_NUMPY_VERSION_CHECK_SECONDS = config("SEARCH_NUMPY_VERSION_CHECK_SECONDS", default=5.0, cast=float)
+# Number of nearest chunks considered per query before grouping them by job description
+SEARCH_CANDIDATE_CHUNKS = config("SEARCH_CANDIDATE_CHUNKS", default=1000, cast=int)
+# Temperature of the "softmin" aggregation: low values score jobs by their best chunk, higher values also reward
+# jobs with several good chunks
+SEARCH_SOFTMIN_TEMPERATURE = config("SEARCH_SOFTMIN_TEMPERATURE", default=0.05, cast=float)
+# Number of best-matching chunks returned with each job description
+SEARCH_CHUNKS_PER_RESULT = config("SEARCH_CHUNKS_PER_RESULT", default=5, cast=int)
+# Maximum depth of a ranking, i.e. the number of results that can be paged through
+SEARCH_MAX_LIMIT = config("SEARCH_MAX_LIMIT", default=500, cast=int)
+# Maximum number of queries in one batch search request
+SEARCH_MAX_BATCH_QUERIES = config("SEARCH_MAX_BATCH_QUERIES", default=100, cast=int)
+# "cosine", "inner_product" or "l2". Embeddings are normalized, so all three produce the same ranking of chunks.
+SEARCH_DISTANCE_METRIC = config("SEARCH_DISTANCE_METRIC", default="cosine")
+# Approximate nearest neighbour index build and query parameters, see server/README.md
+VECTOR_INDEX_HNSW_M = config("VECTOR_INDEX_HNSW_M", default=16, cast=int)
+VECTOR_INDEX_HNSW_EF_CONSTRUCTION = config("VECTOR_INDEX_HNSW_EF_CONSTRUCTION", default=64, cast=int)
+SEARCH_HNSW_EF_SEARCH = config("SEARCH_HNSW_EF_SEARCH", default=100, cast=int)
+SEARCH_IVFFLAT_PROBES = config("SEARCH_IVFFLAT_PROBES", default=10, cast=int)
+# Iterative index scans (pgvector 0.8+) return as many candidates as a search needs, whatever `ef_search`. Disable
+# them on older versions, where `ef_search` is raised to the candidates needed and candidates are capped at 1000,
+# so rankings deeper than about 1000 / SEARCH_CHUNKS_PER_RESULT jobs may come up short of SEARCH_MAX_LIMIT.
+SEARCH_ITERATIVE_SCAN = config("SEARCH_ITERATIVE_SCAN", default=True, cast=bool)
+# Quantized search scans a compressed copy of the embeddings for `SEARCH_RERANK_POOL_FACTOR` times as many chunks as
+# it needs, then re-ranks that pool against the full precision embeddings
+SEARCH_RERANK_POOL_FACTOR = config("SEARCH_RERANK_POOL_FACTOR", default=4, cast=int)
+# Filtered searches rank every chunk of the matching job descriptions when at most this share of them match,
+# and otherwise filter the nearest chunks found through the ANN index
+SEARCH_PREFILTER_SELECTIVITY = config("SEARCH_PREFILTER_SELECTIVITY", default=0.1, cast=float)
+# Hybrid search: number of lexical matches whose chunks are ranked, and the reciprocal rank fusion constant
+SEARCH_LEXICAL_CANDIDATES = config("SEARCH_LEXICAL_CANDIDATES", default=200, cast=int)
+SEARCH_RRF_K = config("SEARCH_RRF_K", default=60, cast=int)
+# Query embedding cache. Set SEARCH_QUERY_CACHE_ALIAS to a CACHES alias to share embeddings between workers.
+SEARCH_QUERY_CACHE_SIZE = config("SEARCH_QUERY_CACHE_SIZE", default=1024, cast=int)
+SEARCH_QUERY_CACHE_TTL = config("SEARCH_QUERY_CACHE_TTL", default=60 * 60, cast=int)
+SEARCH_QUERY_CACHE_ALIAS = config("SEARCH_QUERY_CACHE_ALIAS", default=None)
+# Serialized search results, invalidated whenever the corpus changes
+SEARCH_RESULT_CACHE_ALIAS = config("SEARCH_RESULT_CACHE_ALIAS", default="default")
+SEARCH_RESULT_CACHE_TTL = config("SEARCH_RESULT_CACHE_TTL", default=10 * 60, cast=int)
+# Search results are paged with a cursor referencing the cached ranking, valid for SEARCH_CURSOR_TTL seconds
+SEARCH_PAGE_SIZE = config("SEARCH_PAGE_SIZE", default=25, cast=int)
+SEARCH_MAX_PAGE_SIZE = config("SEARCH_MAX_PAGE_SIZE", default=100, cast=int)
+SEARCH_CURSOR_TTL = config("SEARCH_CURSOR_TTL", default=30 * 60, cast=int)
+# Identical searches in progress in a worker wait for the first one's ranking. With SEARCH_SINGLE_FLIGHT_SHARED, workers
+# also wait for each other through a lease in the result cache, polled every SEARCH_SINGLE_FLIGHT_POLL_MS for up to
+# SEARCH_SINGLE_FLIGHT_TIMEOUT seconds.
+SEARCH_SINGLE_FLIGHT_SHARED = config("SEARCH_SINGLE_FLIGHT_SHARED", default=False, cast=bool)
+SEARCH_SINGLE_FLIGHT_POLL_MS = config("SEARCH_SINGLE_FLIGHT_POLL_MS", default=50, cast=int)
+SEARCH_SINGLE_FLIGHT_TIMEOUT = config("SEARCH_SINGLE_FLIGHT_TIMEOUT", default=10, cast=int)
+# Queries searched concurrently are encoded together: a batch is dispatched once SEARCH_ENCODER_MAX_BATCH_SIZE queries
+# are waiting or the oldest has waited SEARCH_ENCODER_MAX_WAIT_MS. Batches are encoded by SEARCH_ENCODER_WORKERS
+# threads, or processes each loading the model with SEARCH_ENCODER_EXECUTOR="process".
+SEARCH_ENCODER_MAX_BATCH_SIZE = config("SEARCH_ENCODER_MAX_BATCH_SIZE", default=32, cast=int)
+SEARCH_ENCODER_MAX_WAIT_MS = config("SEARCH_ENCODER_MAX_WAIT_MS", default=2, cast=float)
+SEARCH_ENCODER_EXECUTOR = config("SEARCH_ENCODER_EXECUTOR", default="thread")
+SEARCH_ENCODER_WORKERS = config("SEARCH_ENCODER_WORKERS", default=2, cast=int)
+# Async search runs database queries in SEARCH_DATABASE_WORKERS threads holding one connection each
+SEARCH_DATABASE_WORKERS = config("SEARCH_DATABASE_WORKERS", default=8, cast=int)
+# Required as `Authorization: Bearer <token>` to read search metrics at /api/metrics/, open to all when empty
+METRICS_BEARER_TOKEN = config("METRICS_BEARER_TOKEN", default="")
+
 #
 # Static files (CSS, JavaScript, Images)
 #
@@ -222,7 +319,7 @@ if ENABLE_EMAILS:
     EMAIL_HOST_PASSWORD = config("SMTP_PASSWORD")
     EMAIL_ALLOWED_DOMAINS = config("SMTP_VALID_TESTING_DOMAINS")
     EMAIL_USE_TLS = True
-    
+
 else:
     EMAIL_BACKEND = "django.core.mail.backends.console.EmailBackend"
 
@@ -4,6 +4,11 @@ from vector_demonstration.settings import *  # noqa
 
 MEDIA_URL = "/media/"
 DEFAULT_FILE_STORAGE = "django.core.files.storage.FileSystemStorage"
+EMBEDDING_WARM_UP = False
+# Tests expect the numpy engine to follow writes immediately
+SEARCH_NUMPY_VERSION_CHECK_SECONDS = 0
+# Tests run in one process, and the cache is cleared between tests without database access
+CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
 
 if config("CI", False):
     DATABASES = {
@@ -14,3 +14,8 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "vector_demonstration.settings")
 
 application = get_wsgi_application()
+
+# Load the encoder at boot rather than on the first request. Not in AppConfig.ready(), which management commands run too.
+from vector_demonstration.core.encoders import warm_up  # noqa: E402
+
+warm_up()
@@ -0,0 +1,110 @@
+/*!
+ * ReDoc - OpenAPI/Swagger-generated API Reference Documentation
+ * -------------------------------------------------------------
+ *   Version: "2.0.0-rc.40"
+ *   Repo: https://github.com/Redocly/redoc
+ */
+!function(e,t){"object"==typeof exports&&"object"==typeof module?module.exports=t(require("null"),function(){try{return require("esprima")}catch(e){}}()):"function"==typeof define&&define.amd?define(["null","esprima"],t):"object"==typeof exports?exports.Redoc=t(require("null"),function(){try{return require("esprima")}catch(e){}}()):e.Redoc=t(e.null,e.esprima)}(this,(function(e,t){return function(e){var t={};function n(r){if(t[r])return t[r].exports;var o=t[r]={i:r,l:!1,exports:{}};return e[r].call(o.exports,o,o.exports,n),o.l=!0,o.exports}return n.m=e,n.c=t,n.d=function(e,t,r){n.o(e,t)||Object.defineProperty(e,t,{enumerable:!0,get:r})},n.r=function(e){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},n.t=function(e,t){if(1&t&&(e=n(e)),8&t)return e;if(4&t&&"object"==typeof e&&e&&e.__esModule)return e;var r=Object.create(null);if(n.r(r),Object.defineProperty(r,"default",{enumerable:!0,value:e}),2&t&&"string"!=typeof e)for(var o in e)n.d(r,o,function(t){return e[t]}.bind(null,o));return r},n.n=function(e){var t=e&&e.__esModule?function(){return e.default}:function(){return e};return n.d(t,"a",t),t},n.o=function(e,t){return Object.prototype.hasOwnProperty.call(e,t)},n.p="",n(n.s=159)}([function(e,t,n){"use strict";e.exports=n(223)},function(e,t,n){"use strict";n.r(t),n.d(t,"__extends",(function(){return o})),n.d(t,"__assign",(function(){return i})),n.d(t,"__rest",(function(){return a})),n.d(t,"__decorate",(function(){return s})),n.d(t,"__param",(function(){return l})),n.d(t,"__metadata",(function(){return c})),n.d(t,"__awaiter",(function(){return u})),n.d(t,"__generator",(function(){return p})),n.d(t,"__createBinding",(function(){return f})),n.d(t,"__exportStar",(function(){return d})),n.d(t,"__values",(function(){return h})),n.d(t,"__read",(function(){return m})),n.d(t,"__spread",(function(){return g})),n.d(t,"__spreadArrays",(function(){return y})),n.d(t,"__await",(function(){return v})),n.d(t,"__asyncGenerator",(function(){return b})),n.d(t,"__asyncDelegator",(function(){return x})),n.d(t,"__asyncValues",(function(){return w})),n.d(t,"__makeTemplateObject",(function(){return k})),n.d(t,"__importStar",(function(){return E})),n.d(t,"__importDefault",(function(){return _})),n.d(t,"__classPrivateFieldGet",(function(){return S})),n.d(t,"__classPrivateFieldSet",(function(){return T}));
+/*! *****************************************************************************
+Copyright (c) Microsoft Corporation.
+
+Permission to use, copy, modify, and/or distribute this software for any
+purpose with or without fee is hereby granted.
+
+THE SOFTWARE IS PROVIDED "AS IS" AND THE AUTHOR DISCLAIMS ALL WARRANTIES WITH
+REGARD TO THIS SOFTWARE INCLUDING ALL IMPLIED WARRANTIES OF MERCHANTABILITY
+AND FITNESS. IN NO EVENT SHALL THE AUTHOR BE LIABLE FOR ANY SPECIAL, DIRECT,
+INDIRECT, OR CONSEQUENTIAL DAMAGES OR ANY DAMAGES WHATSOEVER RESULTING FROM
+LOSS OF USE, DATA OR PROFITS, WHETHER IN AN ACTION OF CONTRACT, NEGLIGENCE OR
+OTHER TORTIOUS ACTION, ARISING OUT OF OR IN CONNECTION WITH THE USE OR
+PERFORMANCE OF THIS SOFTWARE.
+***************************************************************************** */
+var r=function(e,t){return(r=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(e,t){e.__proto__=t}||function(e,t){for(var n in t)t.hasOwnProperty(n)&&(e[n]=t[n])})(e,t)};function o(e,t){function n(){this.constructor=e}r(e,t),e.prototype=null===t?Object.create(t):(n.prototype=t.prototype,new n)}var i=function(){return(i=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++)for(var o in t=arguments[n])Object.prototype.hasOwnProperty.call(t,o)&&(e[o]=t[o]);return e}).apply(this,arguments)};function a(e,t){var n={};for(var r in e)Object.prototype.hasOwnProperty.call(e,r)&&t.indexOf(r)<0&&(n[r]=e[r]);if(null!=e&&"function"==typeof Object.getOwnPropertySymbols){var o=0;for(r=Object.getOwnPropertySymbols(e);o<r.length;o++)t.indexOf(r[o])<0&&Object.prototype.propertyIsEnumerable.call(e,r[o])&&(n[r[o]]=e[r[o]])}return n}function s(e,t,n,r){var o,i=arguments.length,a=i<3?t:null===r?r=Object.getOwnPropertyDescriptor(t,n):r;if("object"==typeof Reflect&&"function"==typeof Reflect.decorate)a=Reflect.decorate(e,t,n,r);else for(var s=e.length-1;s>=0;s--)(o=e[s])&&(a=(i<3?o(a):i>3?o(t,n,a):o(t,n))||a);return i>3&&a&&Object.defineProperty(t,n,a),a}function l(e,t){return function(n,r){t(n,r,e)}}function c(e,t){if("object"==typeof Reflect&&"function"==typeof Reflect.metadata)return Reflect.metadata(e,t)}function u(e,t,n,r){return new(n||(n=Promise))((function(o,i){function a(e){try{l(r.next(e))}catch(e){i(e)}}function s(e){try{l(r.throw(e))}catch(e){i(e)}}function l(e){var t;e.done?o(e.value):(t=e.value,t instanceof n?t:new n((function(e){e(t)}))).then(a,s)}l((r=r.apply(e,t||[])).next())}))}function p(e,t){var n,r,o,i,a={label:0,sent:function(){if(1&o[0])throw o[1];return o[1]},trys:[],ops:[]};return i={next:s(0),throw:s(1),return:s(2)},"function"==typeof Symbol&&(i[Symbol.iterator]=function(){return this}),i;function s(i){return function(s){return function(i){if(n)throw new TypeError("Generator is already executing.");for(;a;)try{if(n=1,r&&(o=2&i[0]?r.return:i[0]?r.throw||((o=r.return)&&o.call(r),0):r.next)&&!(o=o.call(r,i[1])).done)return o;switch(r=0,o&&(i=[2&i[0],o.value]),i[0]){case 0:case 1:o=i;break;case 4:return a.label++,{value:i[1],done:!1};case 5:a.label++,r=i[1],i=[0];continue;case 7:i=a.ops.pop(),a.trys.pop();continue;default:if(!(o=a.trys,(o=o.length>0&&o[o.length-1])||6!==i[0]&&2!==i[0])){a=0;continue}if(3===i[0]&&(!o||i[1]>o[0]&&i[1]<o[3])){a.label=i[1];break}if(6===i[0]&&a.label<o[1]){a.label=o[1],o=i;break}if(o&&a.label<o[2]){a.label=o[2],a.ops.push(i);break}o[2]&&a.ops.pop(),a.trys.pop();continue}i=t.call(e,a)}catch(e){i=[6,e],r=0}finally{n=o=0}if(5&i[0])throw i[1];return{value:i[0]?i[1]:void 0,done:!0}}([i,s])}}}var f=Object.create?function(e,t,n,r){void 0===r&&(r=n),Object.defineProperty(e,r,{enumerable:!0,get:function(){return t[n]}})}:function(e,t,n,r){void 0===r&&(r=n),e[r]=t[n]};function d(e,t){for(var n in e)"default"===n||t.hasOwnProperty(n)||f(t,e,n)}function h(e){var t="function"==typeof Symbol&&Symbol.iterator,n=t&&e[t],r=0;if(n)return n.call(e);if(e&&"number"==typeof e.length)return{next:function(){return e&&r>=e.length&&(e=void 0),{value:e&&e[r++],done:!e}}};throw new TypeError(t?"Object is not iterable.":"Symbol.iterator is not defined.")}function m(e,t){var n="function"==typeof Symbol&&e[Symbol.iterator];if(!n)return e;var r,o,i=n.call(e),a=[];try{for(;(void 0===t||t-- >0)&&!(r=i.next()).done;)a.push(r.value)}catch(e){o={error:e}}finally{try{r&&!r.done&&(n=i.return)&&n.call(i)}finally{if(o)throw o.error}}return a}function g(){for(var e=[],t=0;t<arguments.length;t++)e=e.concat(m(arguments[t]));return e}function y(){for(var e=0,t=0,n=arguments.length;t<n;t++)e+=arguments[t].length;var r=Array(e),o=0;for(t=0;t<n;t++)for(var i=arguments[t],a=0,s=i.length;a<s;a++,o++)r[o]=i[a];return r}function v(e){return this instanceof v?(this.v=e,this):new v(e)}function b(e,t,n){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var r,o=n.apply(e,t||[]),i=[];return r={},a("next"),a("throw"),a("return"),r[Symbol.asyncIterator]=function(){return this},r;function a(e){o[e]&&(r[e]=function(t){return new Promise((function(n,r){i.push([e,t,n,r])>1||s(e,t)}))})}function s(e,t){try{(n=o[e](t)).value instanceof v?Promise.resolve(n.value.v).then(l,c):u(i[0][2],n)}catch(e){u(i[0][3],e)}var n}function l(e){s("next",e)}function c(e){s("throw",e)}function u(e,t){e(t),i.shift(),i.length&&s(i[0][0],i[0][1])}}function x(e){var t,n;return t={},r("next"),r("throw",(function(e){throw e})),r("return"),t[Symbol.iterator]=function(){return this},t;function r(r,o){t[r]=e[r]?function(t){return(n=!n)?{value:v(e[r](t)),done:"return"===r}:o?o(t):t}:o}}function w(e){if(!Symbol.asyncIterator)throw new TypeError("Symbol.asyncIterator is not defined.");var t,n=e[Symbol.asyncIterator];return n?n.call(e):(e=h(e),t={},r("next"),r("throw"),r("return"),t[Symbol.asyncIterator]=function(){return this},t);function r(n){t[n]=e[n]&&function(t){return new Promise((function(r,o){(function(e,t,n,r){Promise.resolve(r).then((function(t){e({value:t,done:n})}),t)})(r,o,(t=e[n](t)).done,t.value)}))}}}function k(e,t){return Object.defineProperty?Object.defineProperty(e,"raw",{value:t}):e.raw=t,e}var O=Object.create?function(e,t){Object.defineProperty(e,"default",{enumerable:!0,value:t})}:function(e,t){e.default=t};function E(e){if(e&&e.__esModule)return e;var t={};if(null!=e)for(var n in e)Object.hasOwnProperty.call(e,n)&&f(t,e,n);return O(t,e),t}function _(e){return e&&e.__esModule?e:{default:e}}function S(e,t){if(!t.has(e))throw new TypeError("attempted to get private field on non-instance");return t.get(e)}function T(e,t,n){if(!t.has(e))throw new TypeError("attempted to set private field on non-instance");return t.set(e,n),n}},function(e,t,n){"use strict";(function(e,r){n.d(t,"a",(function(){return _})),n.d(t,"b",(function(){return Fe})),n.d(t,"c",(function(){return be})),n.d(t,"d",(function(){return fe})),n.d(t,"e",(function(){return pe})),n.d(t,"f",(function(){return Ge})),n.d(t,"g",(function(){return te})),n.d(t,"h",(function(){return nt})),n.d(t,"i",(function(){return j})),n.d(t,"j",(function(){return at})),n.d(t,"k",(function(){return Ct})),n.d(t,"l",(function(){return Nt})),n.d(t,"m",(function(){return qt})),n.d(t,"n",(function(){return Q})),n.d(t,"o",(function(){return pt})),n.d(t,"p",(function(){return Qe})),n.d(t,"q",(function(){return qe})),n.d(t,"r",(function(){return dt})),n.d(t,"s",(function(){return le}));
+/*! *****************************************************************************
+Copyright (c) Microsoft Corporation. All rights reserved.
+Licensed under the Apache License, Version 2.0 (the "License"); you may not use
+this file except in compliance with the License. You may obtain a copy of the
+License at http://www.apache.org/licenses/LICENSE-2.0
+
+THIS CODE IS PROVIDED ON AN *AS IS* BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, EITHER EXPRESS OR IMPLIED, INCLUDING WITHOUT LIMITATION ANY IMPLIED
+WARRANTIES OR CONDITIONS OF TITLE, FITNESS FOR A PARTICULAR PURPOSE,
+MERCHANTABLITY OR NON-INFRINGEMENT.
+
+See the Apache Version 2.0 License for specific language governing permissions
+and limitations under the License.
+***************************************************************************** */
+var o=function(e,t){return(o=Object.setPrototypeOf||{__proto__:[]}instanceof Array&&function(e,t){e.__proto__=t}||function(e,t){for(var n in t)t.hasOwnProperty(n)&&(e[n]=t[n])})(e,t)};var i=function(){return(i=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++)for(var o in t=arguments[n])Object.prototype.hasOwnProperty.call(t,o)&&(e[o]=t[o]);return e}).apply(this,arguments)};function a(e){var t="function"==typeof Symbol&&e[Symbol.iterator],n=0;return t?t.call(e):{next:function(){return e&&n>=e.length&&(e=void 0),{value:e&&e[n++],done:!e}}}}function s(e,t){var n="function"==typeof Symbol&&e[Symbol.iterator];if(!n)return e;var r,o,i=n.call(e),a=[];try{for(;(void 0===t||t-- >0)&&!(r=i.next()).done;)a.push(r.value)}catch(e){o={error:e}}finally{try{r&&!r.done&&(n=i.return)&&n.call(i)}finally{if(o)throw o.error}}return a}function l(){for(var e=[],t=0;t<arguments.length;t++)e=e.concat(s(arguments[t]));return e}var c=[];Object.freeze(c);var u={};function p(){return++Ce.mobxGuid}function f(e){throw d(!1,e),"X"}function d(e,t){if(!e)throw new Error("[mobx] "+(t||"An invariant failed, however the error is obfuscated because this is a production build."))}Object.freeze(u);function h(e){var t=!1;return function(){if(!t)return t=!0,e.apply(this,arguments)}}var m=function(){};function g(e){return null!==e&&"object"==typeof e}function y(e){if(null===e||"object"!=typeof e)return!1;var t=Object.getPrototypeOf(e);return t===Object.prototype||null===t}function v(e,t,n){Object.defineProperty(e,t,{enumerable:!1,writable:!0,configurable:!0,value:n})}function b(e,t){var n="isMobX"+e;return t.prototype[n]=!0,function(e){return g(e)&&!0===e[n]}}function x(e){return e instanceof Map}function w(e){return e instanceof Set}function k(e){var t=new Set;for(var n in e)t.add(n);return Object.getOwnPropertySymbols(e).forEach((function(n){Object.getOwnPropertyDescriptor(e,n).enumerable&&t.add(n)})),Array.from(t)}function O(e){return e&&e.toString?e.toString():new String(e).toString()}function E(e){return null===e?null:"object"==typeof e?""+e:e}var _=Symbol("mobx administration"),S=function(){function e(e){void 0===e&&(e="Atom@"+p()),this.name=e,this.isPendingUnobservation=!1,this.isBeingObserved=!1,this.observers=new Set,this.diffValue=0,this.lastAccessedBy=0,this.lowestObserverState=K.NOT_TRACKING}return e.prototype.onBecomeObserved=function(){this.onBecomeObservedListeners&&this.onBecomeObservedListeners.forEach((function(e){return e()}))},e.prototype.onBecomeUnobserved=function(){this.onBecomeUnobservedListeners&&this.onBecomeUnobservedListeners.forEach((function(e){return e()}))},e.prototype.reportObserved=function(){return Me(this)},e.prototype.reportChanged=function(){Ne(),function(e){if(e.lowestObserverState===K.STALE)return;e.lowestObserverState=K.STALE,e.observers.forEach((function(t){t.dependenciesState===K.UP_TO_DATE&&(t.isTracing!==J.NONE&&De(t,e),t.onBecomeStale()),t.dependenciesState=K.STALE}))}(this),Le()},e.prototype.toString=function(){return this.name},e}(),T=b("Atom",S);function j(e,t,n){void 0===t&&(t=m),void 0===n&&(n=m);var r,o=new S(e);return t!==m&&tt("onBecomeObserved",o,t,r),n!==m&&et(o,n),o}var A={identity:function(e,t){return e===t},structural:function(e,t){return Gt(e,t)},default:function(e,t){return Object.is(e,t)},shallow:function(e,t){return Gt(e,t,1)}},C=Symbol("mobx did run lazy initializers"),I=Symbol("mobx pending decorators"),P={},R={};function N(e,t){var n=t?P:R;return n[e]||(n[e]={configurable:!0,enumerable:t,get:function(){return L(this),this[e]},set:function(t){L(this),this[e]=t}})}function L(e){var t,n;if(!0!==e[C]){var r=e[I];if(r){v(e,C,!0);var o=l(Object.getOwnPropertySymbols(r),Object.keys(r));try{for(var i=a(o),s=i.next();!s.done;s=i.next()){var c=r[s.value];c.propertyCreator(e,c.prop,c.descriptor,c.decoratorTarget,c.decoratorArguments)}}catch(e){t={error:e}}finally{try{s&&!s.done&&(n=i.return)&&n.call(i)}finally{if(t)throw t.error}}}}}function M(e,t){return function(){var n,r=function(r,o,a,s){if(!0===s)return t(r,o,a,r,n),null;if(!Object.prototype.hasOwnProperty.call(r,I)){var l=r[I];v(r,I,i({},l))}return r[I][o]={prop:o,propertyCreator:t,descriptor:a,decoratorTarget:r,decoratorArguments:n},N(o,e)};return D(arguments)?(n=c,r.apply(null,arguments)):(n=Array.prototype.slice.call(arguments),r)}}function D(e){return(2===e.length||3===e.length)&&("string"==typeof e[1]||"symbol"==typeof e[1])||4===e.length&&!0===e[3]}function F(e,t,n){return ut(e)?e:Array.isArray(e)?Q.array(e,{name:n}):y(e)?Q.object(e,void 0,{name:n}):x(e)?Q.map(e,{name:n}):w(e)?Q.set(e,{name:n}):e}function z(e){return e}function U(t){d(t);var n=M(!0,(function(e,n,r,o,i){var a=r?r.initializer?r.initializer.call(e):r.value:void 0;zt(e).addObservableProp(n,a,t)})),r=(void 0!==e&&e.env,n);return r.enhancer=t,r}var B={deep:!0,name:void 0,defaultDecorator:void 0,proxy:!0};function $(e){return null==e?B:"string"==typeof e?{name:e,deep:!0,proxy:!0}:e}Object.freeze(B);var W=U(F),q=U((function(e,t,n){return null==e||qt(e)||Ct(e)||Nt(e)||Dt(e)?e:Array.isArray(e)?Q.array(e,{name:n,deep:!1}):y(e)?Q.object(e,void 0,{name:n,deep:!1}):x(e)?Q.map(e,{name:n,deep:!1}):w(e)?Q.set(e,{name:n,deep:!1}):f(!1)})),H=U(z),V=U((function(e,t,n){return Gt(e,t)?t:e}));function Y(e){return e.defaultDecorator?e.defaultDecorator.enhancer:!1===e.deep?z:F}var G={box:function(e,t){arguments.length>2&&X("box");var n=$(t);return new ke(e,Y(n),n.name,!0,n.equals)},array:function(e,t){arguments.length>2&&X("array");var n=$(t);return _t(e,Y(n),n.name)},map:function(e,t){arguments.length>2&&X("map");var n=$(t);return new Rt(e,Y(n),n.name)},set:function(e,t){arguments.length>2&&X("set");var n=$(t);return new Mt(e,Y(n),n.name)},object:function(e,t,n){"string"==typeof arguments[1]&&X("object");var r=$(n);if(!1===r.proxy)return rt({},e,t,r);var o=ot(r),i=rt({},void 0,void 0,r),a=yt(i);return it(a,e,t,o),a},ref:H,shallow:q,deep:W,struct:V},Q=function(e,t,n){if("string"==typeof arguments[1]||"symbol"==typeof arguments[1])return W.apply(null,arguments);if(ut(e))return e;var r=y(e)?Q.object(e,t,n):Array.isArray(e)?Q.array(e,t):x(e)?Q.map(e,t):w(e)?Q.set(e,t):e;if(r!==e)return r;f(!1)};function X(e){f("Expected one or two arguments to observable."+e+". Did you accidentally try to use observable."+e+" as decorator?")}Object.keys(G).forEach((function(e){return Q[e]=G[e]}));var K,J,Z=M(!1,(function(e,t,n,r,o){var a=n.get,s=n.set,l=o[0]||{};zt(e).addComputedProp(e,t,i({get:a,set:s,context:e},l))})),ee=Z({equals:A.structural}),te=function(e,t,n){if("string"==typeof t)return Z.apply(null,arguments);if(null!==e&&"object"==typeof e&&1===arguments.length)return Z.apply(null,arguments);var r="object"==typeof t?t:{};return r.get=e,r.set="function"==typeof t?t:r.set,r.name=r.name||e.name||"",new Oe(r)};te.struct=ee,function(e){e[e.NOT_TRACKING=-1]="NOT_TRACKING",e[e.UP_TO_DATE=0]="UP_TO_DATE",e[e.POSSIBLY_STALE=1]="POSSIBLY_STALE",e[e.STALE=2]="STALE"}(K||(K={})),function(e){e[e.NONE=0]="NONE",e[e.LOG=1]="LOG",e[e.BREAK=2]="BREAK"}(J||(J={}));var ne=function(e){this.cause=e};function re(e){return e instanceof ne}function oe(e){switch(e.dependenciesState){case K.UP_TO_DATE:return!1;case K.NOT_TRACKING:case K.STALE:return!0;case K.POSSIBLY_STALE:for(var t=pe(!0),n=ce(),r=e.observing,o=r.length,i=0;i<o;i++){var a=r[i];if(Ee(a)){if(Ce.disableErrorBoundaries)a.get();else try{a.get()}catch(e){return ue(n),fe(t),!0}if(e.dependenciesState===K.STALE)return ue(n),fe(t),!0}}return de(e),ue(n),fe(t),!1}}function ie(e){var t=e.observers.size>0;Ce.computationDepth>0&&t&&f(!1),Ce.allowStateChanges||!t&&"strict"!==Ce.enforceActions||f(!1)}function ae(e,t,n){var r=pe(!0);de(e),e.newObserving=new Array(e.observing.length+100),e.unboundDepsCount=0,e.runId=++Ce.runId;var o,i=Ce.trackingDerivation;if(Ce.trackingDerivation=e,!0===Ce.disableErrorBoundaries)o=t.call(n);else try{o=t.call(n)}catch(e){o=new ne(e)}return Ce.trackingDerivation=i,function(e){for(var t=e.observing,n=e.observing=e.newObserving,r=K.UP_TO_DATE,o=0,i=e.unboundDepsCount,a=0;a<i;a++){0===(s=n[a]).diffValue&&(s.diffValue=1,o!==a&&(n[o]=s),o++),s.dependenciesState>r&&(r=s.dependenciesState)}n.length=o,e.newObserving=null,i=t.length;for(;i--;){0===(s=t[i]).diffValue&&Pe(s,e),s.diffValue=0}for(;o--;){var s;1===(s=n[o]).diffValue&&(s.diffValue=0,Ie(s,e))}r!==K.UP_TO_DATE&&(e.dependenciesState=r,e.onBecomeStale())}(e),fe(r),o}function se(e){var t=e.observing;e.observing=[];for(var n=t.length;n--;)Pe(t[n],e);e.dependenciesState=K.NOT_TRACKING}function le(e){var t=ce();try{return e()}finally{ue(t)}}function ce(){var e=Ce.trackingDerivation;return Ce.trackingDerivation=null,e}function ue(e){Ce.trackingDerivation=e}function pe(e){var t=Ce.allowStateReads;return Ce.allowStateReads=e,t}function fe(e){Ce.allowStateReads=e}function de(e){if(e.dependenciesState!==K.UP_TO_DATE){e.dependenciesState=K.UP_TO_DATE;for(var t=e.observing,n=t.length;n--;)t[n].lowestObserverState=K.UP_TO_DATE}}var he=0,me=1,ge=Object.getOwnPropertyDescriptor((function(){}),"name");ge&&ge.configurable;function ye(e,t,n){var r=function(){return ve(e,t,n||this,arguments)};return r.isMobxAction=!0,r}function ve(e,t,n,r){var o=function(e,t,n){var r=0;var o=ce();Ne();var i=xe(!0),a=pe(!0),s={prevDerivation:o,prevAllowStateChanges:i,prevAllowStateReads:a,notifySpy:!1,startTime:r,actionId:me++,parentActionId:he};return he=s.actionId,s}();try{return t.apply(n,r)}catch(e){throw o.error=e,e}finally{!function(e){he!==e.actionId&&f("invalid action stack. did you forget to finish an action?");he=e.parentActionId,void 0!==e.error&&(Ce.suppressReactionErrors=!0);we(e.prevAllowStateChanges),fe(e.prevAllowStateReads),Le(),ue(e.prevDerivation),e.notifySpy&&!1;Ce.suppressReactionErrors=!1}(o)}}function be(e,t){var n,r=xe(e);try{n=t()}finally{we(r)}return n}function xe(e){var t=Ce.allowStateChanges;return Ce.allowStateChanges=e,t}function we(e){Ce.allowStateChanges=e}var ke=function(e){function t(t,n,r,o,i){void 0===r&&(r="ObservableValue@"+p()),void 0===o&&(o=!0),void 0===i&&(i=A.default);var a=e.call(this,r)||this;return a.enhancer=n,a.name=r,a.equals=i,a.hasUnreportedChange=!1,a.value=n(t,void 0,r),a}return function(e,t){function n(){this.constructor=e}o(e,t),e.prototype=null===t?Object.create(t):(n.prototype=t.prototype,new n)}(t,e),t.prototype.dehanceValue=function(e){return void 0!==this.dehancer?this.dehancer(e):e},t.prototype.set=function(e){this.value;if((e=this.prepareNewValue(e))!==Ce.UNCHANGED){0,this.setNewValue(e)}},t.prototype.prepareNewValue=function(e){if(ie(this),vt(this)){var t=xt(this,{object:this,type:"update",newValue:e});if(!t)return Ce.UNCHANGED;e=t.newValue}return e=this.enhancer(e,this.value,this.name),this.equals(this.value,e)?Ce.UNCHANGED:e},t.prototype.setNewValue=function(e){var t=this.value;this.value=e,this.reportChanged(),wt(this)&&Ot(this,{type:"update",object:this,newValue:e,oldValue:t})},t.prototype.get=function(){return this.reportObserved(),this.dehanceValue(this.value)},t.prototype.intercept=function(e){return bt(this,e)},t.prototype.observe=function(e,t){return t&&e({object:this,type:"update",newValue:this.value,oldValue:void 0}),kt(this,e)},t.prototype.toJSON=function(){return this.get()},t.prototype.toString=function(){return this.name+"["+this.value+"]"},t.prototype.valueOf=function(){return E(this.get())},t.prototype[Symbol.toPrimitive]=function(){return this.valueOf()},t}(S),Oe=(b("ObservableValue",ke),function(){function e(e){this.dependenciesState=K.NOT_TRACKING,this.observing=[],this.newObserving=null,this.isBeingObserved=!1,this.isPendingUnobservation=!1,this.observers=new Set,this.diffValue=0,this.runId=0,this.lastAccessedBy=0,this.lowestObserverState=K.UP_TO_DATE,this.unboundDepsCount=0,this.__mapid="#"+p(),this.value=new ne(null),this.isComputing=!1,this.isRunningSetter=!1,this.isTracing=J.NONE,d(e.get,"missing option for computed: get"),this.derivation=e.get,this.name=e.name||"ComputedValue@"+p(),e.set&&(this.setter=ye(this.name+"-setter",e.set)),this.equals=e.equals||(e.compareStructural||e.struct?A.structural:A.default),this.scope=e.context,this.requiresReaction=!!e.requiresReaction,this.keepAlive=!!e.keepAlive}return e.prototype.onBecomeStale=function(){!function(e){if(e.lowestObserverState!==K.UP_TO_DATE)return;e.lowestObserverState=K.POSSIBLY_STALE,e.observers.forEach((function(t){t.dependenciesState===K.UP_TO_DATE&&(t.dependenciesState=K.POSSIBLY_STALE,t.isTracing!==J.NONE&&De(t,e),t.onBecomeStale())}))}(this)},e.prototype.onBecomeObserved=function(){this.onBecomeObservedListeners&&this.onBecomeObservedListeners.forEach((function(e){return e()}))},e.prototype.onBecomeUnobserved=function(){this.onBecomeUnobservedListeners&&this.onBecomeUnobservedListeners.forEach((function(e){return e()}))},e.prototype.get=function(){this.isComputing&&f("Cycle detected in computation "+this.name+": "+this.derivation),0!==Ce.inBatch||0!==this.observers.size||this.keepAlive?(Me(this),oe(this)&&this.trackAndCompute()&&function(e){if(e.lowestObserverState===K.STALE)return;e.lowestObserverState=K.STALE,e.observers.forEach((function(t){t.dependenciesState===K.POSSIBLY_STALE?t.dependenciesState=K.STALE:t.dependenciesState===K.UP_TO_DATE&&(e.lowestObserverState=K.UP_TO_DATE)}))}(this)):oe(this)&&(this.warnAboutUntrackedRead(),Ne(),this.value=this.computeValue(!1),Le());var e=this.value;if(re(e))throw e.cause;return e},e.prototype.peek=function(){var e=this.computeValue(!1);if(re(e))throw e.cause;return e},e.prototype.set=function(e){if(this.setter){d(!this.isRunningSetter,"The setter of computed value '"+this.name+"' is trying to update itself. Did you intend to update an _observable_ value, instead of the computed property?"),this.isRunningSetter=!0;try{this.setter.call(this.scope,e)}finally{this.isRunningSetter=!1}}else d(!1,!1)},e.prototype.trackAndCompute=function(){var e=this.value,t=this.dependenciesState===K.NOT_TRACKING,n=this.computeValue(!0),r=t||re(e)||re(n)||!this.equals(e,n);return r&&(this.value=n),r},e.prototype.computeValue=function(e){var t;if(this.isComputing=!0,Ce.computationDepth++,e)t=ae(this,this.derivation,this.scope);else if(!0===Ce.disableErrorBoundaries)t=this.derivation.call(this.scope);else try{t=this.derivation.call(this.scope)}catch(e){t=new ne(e)}return Ce.computationDepth--,this.isComputing=!1,t},e.prototype.suspend=function(){this.keepAlive||(se(this),this.value=void 0)},e.prototype.observe=function(e,t){var n=this,r=!0,o=void 0;return Ke((function(){var i=n.get();if(!r||t){var a=ce();e({type:"update",object:n,newValue:i,oldValue:o}),ue(a)}r=!1,o=i}))},e.prototype.warnAboutUntrackedRead=function(){},e.prototype.toJSON=function(){return this.get()},e.prototype.toString=function(){return this.name+"["+this.derivation.toString()+"]"},e.prototype.valueOf=function(){return E(this.get())},e.prototype[Symbol.toPrimitive]=function(){return this.valueOf()},e}()),Ee=b("ComputedValue",Oe),_e=function(){this.version=5,this.UNCHANGED={},this.trackingDerivation=null,this.computationDepth=0,this.runId=0,this.mobxGuid=0,this.inBatch=0,this.pendingUnobservations=[],this.pendingReactions=[],this.isRunningReactions=!1,this.allowStateChanges=!0,this.allowStateReads=!0,this.enforceActions=!1,this.spyListeners=[],this.globalReactionErrorHandlers=[],this.computedRequiresReaction=!1,this.reactionRequiresObservable=!1,this.observableRequiresReaction=!1,this.computedConfigurable=!1,this.disableErrorBoundaries=!1,this.suppressReactionErrors=!1},Se={};function Te(){return"undefined"!=typeof window?window:void 0!==r?r:"undefined"!=typeof self?self:Se}var je=!0,Ae=!1,Ce=function(){var e=Te();return e.__mobxInstanceCount>0&&!e.__mobxGlobals&&(je=!1),e.__mobxGlobals&&e.__mobxGlobals.version!==(new _e).version&&(je=!1),je?e.__mobxGlobals?(e.__mobxInstanceCount+=1,e.__mobxGlobals.UNCHANGED||(e.__mobxGlobals.UNCHANGED={}),e.__mobxGlobals):(e.__mobxInstanceCount=1,e.__mobxGlobals=new _e):(setTimeout((function(){Ae||f("There are multiple, different versions of MobX active. Make sure MobX is loaded only once or use `configure({ isolateGlobalState: true })`")}),1),new _e)}();function Ie(e,t){e.observers.add(t),e.lowestObserverState>t.dependenciesState&&(e.lowestObserverState=t.dependenciesState)}function Pe(e,t){e.observers.delete(t),0===e.observers.size&&Re(e)}function Re(e){!1===e.isPendingUnobservation&&(e.isPendingUnobservation=!0,Ce.pendingUnobservations.push(e))}function Ne(){Ce.inBatch++}function Le(){if(0==--Ce.inBatch){Ue();for(var e=Ce.pendingUnobservations,t=0;t<e.length;t++){var n=e[t];n.isPendingUnobservation=!1,0===n.observers.size&&(n.isBeingObserved&&(n.isBeingObserved=!1,n.onBecomeUnobserved()),n instanceof Oe&&n.suspend())}Ce.pendingUnobservations=[]}}function Me(e){var t=Ce.trackingDerivation;return null!==t?(t.runId!==e.lastAccessedBy&&(e.lastAccessedBy=t.runId,t.newObserving[t.unboundDepsCount++]=e,e.isBeingObserved||(e.isBeingObserved=!0,e.onBecomeObserved())),!0):(0===e.observers.size&&Ce.inBatch>0&&Re(e),!1)}function De(e,t){if(console.log("[mobx.trace] '"+e.name+"' is invalidated due to a change in: '"+t.name+"'"),e.isTracing===J.BREAK){var n=[];!function e(t,n,r){if(n.length>=1e3)return void n.push("(and many more)");n.push(""+new Array(r).join("\t")+t.name),t.dependencies&&t.dependencies.forEach((function(t){return e(t,n,r+1)}))}(at(e),n,1),new Function("debugger;\n/*\nTracing '"+e.name+"'\n\nYou are entering this break point because derivation '"+e.name+"' is being traced and '"+t.name+"' is now forcing it to update.\nJust follow the stacktrace you should now see in the devtools to see precisely what piece of your code is causing this update\nThe stackframe you are looking for is at least ~6-8 stack-frames up.\n\n"+(e instanceof Oe?e.derivation.toString().replace(/[*]\//g,"/"):"")+"\n\nThe dependencies for this derivation are:\n\n"+n.join("\n")+"\n*/\n    ")()}}var Fe=function(){function e(e,t,n,r){void 0===e&&(e="Reaction@"+p()),void 0===r&&(r=!1),this.name=e,this.onInvalidate=t,this.errorHandler=n,this.requiresObservable=r,this.observing=[],this.newObserving=[],this.dependenciesState=K.NOT_TRACKING,this.diffValue=0,this.runId=0,this.unboundDepsCount=0,this.__mapid="#"+p(),this.isDisposed=!1,this._isScheduled=!1,this._isTrackPending=!1,this._isRunning=!1,this.isTracing=J.NONE}return e.prototype.onBecomeStale=function(){this.schedule()},e.prototype.schedule=function(){this._isScheduled||(this._isScheduled=!0,Ce.pendingReactions.push(this),Ue())},e.prototype.isScheduled=function(){return this._isScheduled},e.prototype.runReaction=function(){if(!this.isDisposed){if(Ne(),this._isScheduled=!1,oe(this)){this._isTrackPending=!0;try{this.onInvalidate(),this._isTrackPending}catch(e){this.reportExceptionInDerivation(e)}}Le()}},e.prototype.track=function(e){if(!this.isDisposed){Ne();0,this._isRunning=!0;var t=ae(this,e,void 0);this._isRunning=!1,this._isTrackPending=!1,this.isDisposed&&se(this),re(t)&&this.reportExceptionInDerivation(t.cause),Le()}},e.prototype.reportExceptionInDerivation=function(e){var t=this;if(this.errorHandler)this.errorHandler(e,this);else{if(Ce.disableErrorBoundaries)throw e;var n="[mobx] Encountered an uncaught exception that was thrown by a reaction or observer component, in: '"+this+"'";Ce.suppressReactionErrors?console.warn("[mobx] (error in reaction '"+this.name+"' suppressed, fix error of causing action below)"):console.error(n,e),Ce.globalReactionErrorHandlers.forEach((function(n){return n(e,t)}))}},e.prototype.dispose=function(){this.isDisposed||(this.isDisposed=!0,this._isRunning||(Ne(),se(this),Le()))},e.prototype.getDisposer=function(){var e=this.dispose.bind(this);return e[_]=this,e},e.prototype.toString=function(){return"Reaction["+this.name+"]"},e.prototype.trace=function(e){void 0===e&&(e=!1),function(){for(var e=[],t=0;t<arguments.length;t++)e[t]=arguments[t];var n=!1;"boolean"==typeof e[e.length-1]&&(n=e.pop());var r=ft(e);if(!r)return f(!1);r.isTracing===J.NONE&&console.log("[mobx.trace] '"+r.name+"' tracing enabled");r.isTracing=n?J.BREAK:J.LOG}(this,e)},e}();var ze=function(e){return e()};function Ue(){Ce.inBatch>0||Ce.isRunningReactions||ze(Be)}function Be(){Ce.isRunningReactions=!0;for(var e=Ce.pendingReactions,t=0;e.length>0;){100==++t&&(console.error("Reaction doesn't converge to a stable state after 100 iterations. Probably there is a cycle in the reactive function: "+e[0]),e.splice(0));for(var n=e.splice(0),r=0,o=n.length;r<o;r++)n[r].runReaction()}Ce.isRunningReactions=!1}var $e=b("Reaction",Fe);function We(e){var t=ze;ze=function(n){return e((function(){return t(n)}))}}function qe(e){return console.warn("[mobx.spy] Is a no-op in production builds"),function(){}}function He(){f(!1)}function Ve(e){return function(t,n,r){if(r){if(r.value)return{value:ye(e,r.value),enumerable:!1,configurable:!0,writable:!0};var o=r.initializer;return{enumerable:!1,configurable:!0,writable:!0,initializer:function(){return ye(e,o.call(this))}}}return Ye(e).apply(this,arguments)}}function Ye(e){return function(t,n,r){Object.defineProperty(t,n,{configurable:!0,enumerable:!1,get:function(){},set:function(t){v(this,n,Ge(e,t))}})}}var Ge=function(e,t,n,r){return 1===arguments.length&&"function"==typeof e?ye(e.name||"<unnamed action>",e):2===arguments.length&&"function"==typeof t?ye(e,t):1===arguments.length&&"string"==typeof e?Ve(e):!0!==r?Ve(t).apply(null,arguments):void v(e,t,ye(e.name||t,n.value,this))};function Qe(e,t){"string"==typeof e||e.name;return ve(0,"function"==typeof e?e:t,this,void 0)}function Xe(e,t,n){v(e,t,ye(t,n.bind(e)))}function Ke(e,t){void 0===t&&(t=u);var n,r=t&&t.name||e.name||"Autorun@"+p();if(!t.scheduler&&!t.delay)n=new Fe(r,(function(){this.track(a)}),t.onError,t.requiresObservable);else{var o=Ze(t),i=!1;n=new Fe(r,(function(){i||(i=!0,o((function(){i=!1,n.isDisposed||n.track(a)})))}),t.onError,t.requiresObservable)}function a(){e(n)}return n.schedule(),n.getDisposer()}Ge.bound=function(e,t,n,r){return!0===r?(Xe(e,t,n.value),null):n?{configurable:!0,enumerable:!1,get:function(){return Xe(this,t,n.value||n.initializer.call(this)),this[t]},set:He}:{enumerable:!1,configurable:!0,set:function(e){Xe(this,t,e)},get:function(){}}};var Je=function(e){return e()};function Ze(e){return e.scheduler?e.scheduler:e.delay?function(t){return setTimeout(t,e.delay)}:Je}function et(e,t,n){return tt("onBecomeUnobserved",e,t,n)}function tt(e,t,n,r){var o="function"==typeof r?Ht(t,n):Ht(t),i="function"==typeof r?r:n,a=e+"Listeners";return o[a]?o[a].add(i):o[a]=new Set([i]),"function"!=typeof o[e]?f(!1):function(){var e=o[a];e&&(e.delete(i),0===e.size&&delete o[a])}}function nt(e){var t=e.enforceActions,n=e.computedRequiresReaction,r=e.computedConfigurable,o=e.disableErrorBoundaries,i=e.reactionScheduler,a=e.reactionRequiresObservable,s=e.observableRequiresReaction;if(!0===e.isolateGlobalState&&((Ce.pendingReactions.length||Ce.inBatch||Ce.isRunningReactions)&&f("isolateGlobalState should be called before MobX is running any reactions"),Ae=!0,je&&(0==--Te().__mobxInstanceCount&&(Te().__mobxGlobals=void 0),Ce=new _e)),void 0!==t){var l=void 0;switch(t){case!0:case"observed":l=!0;break;case!1:case"never":l=!1;break;case"strict":case"always":l="strict";break;default:f("Invalid value for 'enforceActions': '"+t+"', expected 'never', 'always' or 'observed'")}Ce.enforceActions=l,Ce.allowStateChanges=!0!==l&&"strict"!==l}void 0!==n&&(Ce.computedRequiresReaction=!!n),void 0!==a&&(Ce.reactionRequiresObservable=!!a),void 0!==s&&(Ce.observableRequiresReaction=!!s,Ce.allowStateReads=!Ce.observableRequiresReaction),void 0!==r&&(Ce.computedConfigurable=!!r),void 0!==o&&(!0===o&&console.warn("WARNING: Debug feature only. MobX will NOT recover from errors when `disableErrorBoundaries` is enabled."),Ce.disableErrorBoundaries=!!o),i&&We(i)}function rt(e,t,n,r){var o=ot(r=$(r));return L(e),zt(e,r.name,o.enhancer),t&&it(e,t,n,o),e}function ot(e){return e.defaultDecorator||(!1===e.deep?H:W)}function it(e,t,n,r){var o,i;Ne();try{var s=k(t);try{for(var l=a(s),c=l.next();!c.done;c=l.next()){var u=c.value,p=Object.getOwnPropertyDescriptor(t,u);0;var f=(n&&u in n?n[u]:p.get?Z:r)(e,u,p,!0);f&&Object.defineProperty(e,u,f)}}catch(e){o={error:e}}finally{try{c&&!c.done&&(i=l.return)&&i.call(l)}finally{if(o)throw o.error}}}finally{Le()}}function at(e,t){return st(Ht(e,t))}function st(e){var t,n,r={name:e.name};return e.observing&&e.observing.length>0&&(r.dependencies=(t=e.observing,n=[],t.forEach((function(e){-1===n.indexOf(e)&&n.push(e)})),n).map(st)),r}function lt(){this.message="FLOW_CANCELLED"}function ct(e,t){return null!=e&&(void 0!==t?!!qt(e)&&e[_].values.has(t):qt(e)||!!e[_]||T(e)||$e(e)||Ee(e))}function ut(e){return 1!==arguments.length&&f(!1),ct(e)}function pt(e,t,n,r){return"function"==typeof n?function(e,t,n,r){return Vt(e,t).observe(n,r)}(e,t,n,r):function(e,t,n){return Vt(e).observe(t,n)}(e,t,n)}lt.prototype=Object.create(Error.prototype);function ft(e){switch(e.length){case 0:return Ce.trackingDerivation;case 1:return Ht(e[0]);case 2:return Ht(e[0],e[1])}}function dt(e,t){void 0===t&&(t=void 0),Ne();try{return e.apply(t)}finally{Le()}}function ht(e){return e[_]}function mt(e){return"string"==typeof e||"number"==typeof e||"symbol"==typeof e}var gt={has:function(e,t){if(t===_||"constructor"===t||t===C)return!0;var n=ht(e);return mt(t)?n.has(t):t in e},get:function(e,t){if(t===_||"constructor"===t||t===C)return e[t];var n=ht(e),r=n.values.get(t);if(r instanceof S){var o=r.get();return void 0===o&&n.has(t),o}return mt(t)&&n.has(t),e[t]},set:function(e,t,n){return!!mt(t)&&(function e(t,n,r){if(2!==arguments.length||Dt(t))if(qt(t)){var o=t[_],i=o.values.get(n);i?o.write(n,r):o.addObservableProp(n,r,o.defaultEnhancer)}else if(Nt(t))t.set(n,r);else if(Dt(t))t.add(n);else{if(!Ct(t))return f(!1);"number"!=typeof n&&(n=parseInt(n,10)),d(n>=0,"Not a valid index: '"+n+"'"),Ne(),n>=t.length&&(t.length=n+1),t[n]=r,Le()}else{Ne();var a=n;try{for(var s in a)e(t,s,a[s])}finally{Le()}}}(e,t,n),!0)},deleteProperty:function(e,t){return!!mt(t)&&(ht(e).remove(t),!0)},ownKeys:function(e){return ht(e).keysAtom.reportObserved(),Reflect.ownKeys(e)},preventExtensions:function(e){return f("Dynamic observable objects cannot be frozen"),!1}};function yt(e){var t=new Proxy(e,gt);return e[_].proxy=t,t}function vt(e){return void 0!==e.interceptors&&e.interceptors.length>0}function bt(e,t){var n=e.interceptors||(e.interceptors=[]);return n.push(t),h((function(){var e=n.indexOf(t);-1!==e&&n.splice(e,1)}))}function xt(e,t){var n=ce();try{for(var r=l(e.interceptors||[]),o=0,i=r.length;o<i&&(d(!(t=r[o](t))||t.type,"Intercept handlers should return nothing or a change object"),t);o++);return t}finally{ue(n)}}function wt(e){return void 0!==e.changeListeners&&e.changeListeners.length>0}function kt(e,t){var n=e.changeListeners||(e.changeListeners=[]);return n.push(t),h((function(){var e=n.indexOf(t);-1!==e&&n.splice(e,1)}))}function Ot(e,t){var n=ce(),r=e.changeListeners;if(r){for(var o=0,i=(r=r.slice()).length;o<i;o++)r[o](t);ue(n)}}var Et={get:function(e,t){return t===_?e[_]:"length"===t?e[_].getArrayLength():"number"==typeof t?Tt.get.call(e,t):"string"!=typeof t||isNaN(t)?Tt.hasOwnProperty(t)?Tt[t]:e[t]:Tt.get.call(e,parseInt(t))},set:function(e,t,n){return"length"===t&&e[_].setArrayLength(n),"number"==typeof t&&Tt.set.call(e,t,n),"symbol"==typeof t||isNaN(t)?e[t]=n:Tt.set.call(e,parseInt(t),n),!0},preventExtensions:function(e){return f("Observable arrays cannot be frozen"),!1}};function _t(e,t,n,r){void 0===n&&(n="ObservableArray@"+p()),void 0===r&&(r=!1);var o,i,a,s=new St(n,t,r);o=s.values,i=_,a=s,Object.defineProperty(o,i,{enumerable:!1,writable:!1,configurable:!0,value:a});var l=new Proxy(s.values,Et);if(s.proxy=l,e&&e.length){var c=xe(!0);s.spliceWithArray(0,0,e),we(c)}return l}var St=function(){function e(e,t,n){this.owned=n,this.values=[],this.proxy=void 0,this.lastKnownLength=0,this.atom=new S(e||"ObservableArray@"+p()),this.enhancer=function(n,r){return t(n,r,e+"[..]")}}return e.prototype.dehanceValue=function(e){return void 0!==this.dehancer?this.dehancer(e):e},e.prototype.dehanceValues=function(e){return void 0!==this.dehancer&&e.length>0?e.map(this.dehancer):e},e.prototype.intercept=function(e){return bt(this,e)},e.prototype.observe=function(e,t){return void 0===t&&(t=!1),t&&e({object:this.proxy,type:"splice",index:0,added:this.values.slice(),addedCount:this.values.length,removed:[],removedCount:0}),kt(this,e)},e.prototype.getArrayLength=function(){return this.atom.reportObserved(),this.values.length},e.prototype.setArrayLength=function(e){if("number"!=typeof e||e<0)throw new Error("[mobx.array] Out of range: "+e);var t=this.values.length;if(e!==t)if(e>t){for(var n=new Array(e-t),r=0;r<e-t;r++)n[r]=void 0;this.spliceWithArray(t,0,n)}else this.spliceWithArray(e,t-e)},e.prototype.updateArrayLength=function(e,t){if(e!==this.lastKnownLength)throw new Error("[mobx] Modification exception: the internal structure of an observable array was changed.");this.lastKnownLength+=t},e.prototype.spliceWithArray=function(e,t,n){var r=this;ie(this.atom);var o=this.values.length;if(void 0===e?e=0:e>o?e=o:e<0&&(e=Math.max(0,o+e)),t=1===arguments.length?o-e:null==t?0:Math.max(0,Math.min(t,o-e)),void 0===n&&(n=c),vt(this)){var i=xt(this,{object:this.proxy,type:"splice",index:e,removedCount:t,added:n});if(!i)return c;t=i.removedCount,n=i.added}n=0===n.length?n:n.map((function(e){return r.enhancer(e,void 0)}));var a=this.spliceItemsIntoValues(e,t,n);return 0===t&&0===n.length||this.notifyArraySplice(e,n,a),this.dehanceValues(a)},e.prototype.spliceItemsIntoValues=function(e,t,n){var r;if(n.length<1e4)return(r=this.values).splice.apply(r,l([e,t],n));var o=this.values.slice(e,e+t);return this.values=this.values.slice(0,e).concat(n,this.values.slice(e+t)),o},e.prototype.notifyArrayChildUpdate=function(e,t,n){var r=!this.owned&&!1,o=wt(this),i=o||r?{object:this.proxy,type:"update",index:e,newValue:t,oldValue:n}:null;this.atom.reportChanged(),o&&Ot(this,i)},e.prototype.notifyArraySplice=function(e,t,n){var r=!this.owned&&!1,o=wt(this),i=o||r?{object:this.proxy,type:"splice",index:e,removed:n,added:t,removedCount:n.length,addedCount:t.length}:null;this.atom.reportChanged(),o&&Ot(this,i)},e}(),Tt={intercept:function(e){return this[_].intercept(e)},observe:function(e,t){return void 0===t&&(t=!1),this[_].observe(e,t)},clear:function(){return this.splice(0)},replace:function(e){var t=this[_];return t.spliceWithArray(0,t.values.length,e)},toJS:function(){return this.slice()},toJSON:function(){return this.toJS()},splice:function(e,t){for(var n=[],r=2;r<arguments.length;r++)n[r-2]=arguments[r];var o=this[_];switch(arguments.length){case 0:return[];case 1:return o.spliceWithArray(e);case 2:return o.spliceWithArray(e,t)}return o.spliceWithArray(e,t,n)},spliceWithArray:function(e,t,n){return this[_].spliceWithArray(e,t,n)},push:function(){for(var e=[],t=0;t<arguments.length;t++)e[t]=arguments[t];var n=this[_];return n.spliceWithArray(n.values.length,0,e),n.values.length},pop:function(){return this.splice(Math.max(this[_].values.length-1,0),1)[0]},shift:function(){return this.splice(0,1)[0]},unshift:function(){for(var e=[],t=0;t<arguments.length;t++)e[t]=arguments[t];var n=this[_];return n.spliceWithArray(0,0,e),n.values.length},reverse:function(){var e=this.slice();return e.reverse.apply(e,arguments)},sort:function(e){var t=this.slice();return t.sort.apply(t,arguments)},remove:function(e){var t=this[_],n=t.dehanceValues(t.values).indexOf(e);return n>-1&&(this.splice(n,1),!0)},get:function(e){var t=this[_];if(t){if(e<t.values.length)return t.atom.reportObserved(),t.dehanceValue(t.values[e]);console.warn("[mobx.array] Attempt to read an array index ("+e+") that is out of bounds ("+t.values.length+"). Please check length first. Out of bound indices will not be tracked by MobX")}},set:function(e,t){var n=this[_],r=n.values;if(e<r.length){ie(n.atom);var o=r[e];if(vt(n)){var i=xt(n,{type:"update",object:n.proxy,index:e,newValue:t});if(!i)return;t=i.newValue}(t=n.enhancer(t,o))!==o&&(r[e]=t,n.notifyArrayChildUpdate(e,t,o))}else{if(e!==r.length)throw new Error("[mobx.array] Index out of bounds, "+e+" is larger than "+r.length);n.spliceWithArray(e,0,[t])}}};["concat","every","filter","forEach","indexOf","join","lastIndexOf","map","reduce","reduceRight","slice","some","toString","toLocaleString"].forEach((function(e){Tt[e]=function(){var t=this[_];t.atom.reportObserved();var n=t.dehanceValues(t.values);return n[e].apply(n,arguments)}}));var jt,At=b("ObservableArrayAdministration",St);function Ct(e){return g(e)&&At(e[_])}var It,Pt={},Rt=function(){function e(e,t,n){if(void 0===t&&(t=F),void 0===n&&(n="ObservableMap@"+p()),this.enhancer=t,this.name=n,this[jt]=Pt,this._keysAtom=j(this.name+".keys()"),this[Symbol.toStringTag]="Map","function"!=typeof Map)throw new Error("mobx.map requires Map polyfill for the current browser. Check babel-polyfill or core-js/es6/map.js");this._data=new Map,this._hasMap=new Map,this.merge(e)}return e.prototype._has=function(e){return this._data.has(e)},e.prototype.has=function(e){var t=this;if(!Ce.trackingDerivation)return this._has(e);var n=this._hasMap.get(e);if(!n){var r=n=new ke(this._has(e),z,this.name+"."+O(e)+"?",!1);this._hasMap.set(e,r),et(r,(function(){return t._hasMap.delete(e)}))}return n.get()},e.prototype.set=function(e,t){var n=this._has(e);if(vt(this)){var r=xt(this,{type:n?"update":"add",object:this,newValue:t,name:e});if(!r)return this;t=r.newValue}return n?this._updateValue(e,t):this._addValue(e,t),this},e.prototype.delete=function(e){var t=this;if(vt(this)&&!(r=xt(this,{type:"delete",object:this,name:e})))return!1;if(this._has(e)){var n=wt(this),r=n?{type:"delete",object:this,oldValue:this._data.get(e).value,name:e}:null;return dt((function(){t._keysAtom.reportChanged(),t._updateHasMapEntry(e,!1),t._data.get(e).setNewValue(void 0),t._data.delete(e)})),n&&Ot(this,r),!0}return!1},e.prototype._updateHasMapEntry=function(e,t){var n=this._hasMap.get(e);n&&n.setNewValue(t)},e.prototype._updateValue=function(e,t){var n=this._data.get(e);if((t=n.prepareNewValue(t))!==Ce.UNCHANGED){var r=wt(this),o=r?{type:"update",object:this,oldValue:n.value,name:e,newValue:t}:null;0,n.setNewValue(t),r&&Ot(this,o)}},e.prototype._addValue=function(e,t){var n=this;ie(this._keysAtom),dt((function(){var r=new ke(t,n.enhancer,n.name+"."+O(e),!1);n._data.set(e,r),t=r.value,n._updateHasMapEntry(e,!0),n._keysAtom.reportChanged()}));var r=wt(this),o=r?{type:"add",object:this,name:e,newValue:t}:null;r&&Ot(this,o)},e.prototype.get=function(e){return this.has(e)?this.dehanceValue(this._data.get(e).get()):this.dehanceValue(void 0)},e.prototype.dehanceValue=function(e){return void 0!==this.dehancer?this.dehancer(e):e},e.prototype.keys=function(){return this._keysAtom.reportObserved(),this._data.keys()},e.prototype.values=function(){var e=this,t=0,n=Array.from(this.keys());return Kt({next:function(){return t<n.length?{value:e.get(n[t++]),done:!1}:{done:!0}}})},e.prototype.entries=function(){var e=this,t=0,n=Array.from(this.keys());return Kt({next:function(){if(t<n.length){var r=n[t++];return{value:[r,e.get(r)],done:!1}}return{done:!0}}})},e.prototype[(jt=_,Symbol.iterator)]=function(){return this.entries()},e.prototype.forEach=function(e,t){var n,r;try{for(var o=a(this),i=o.next();!i.done;i=o.next()){var l=s(i.value,2),c=l[0],u=l[1];e.call(t,u,c,this)}}catch(e){n={error:e}}finally{try{i&&!i.done&&(r=o.return)&&r.call(o)}finally{if(n)throw n.error}}},e.prototype.merge=function(e){var t=this;return Nt(e)&&(e=e.toJS()),dt((function(){y(e)?k(e).forEach((function(n){return t.set(n,e[n])})):Array.isArray(e)?e.forEach((function(e){var n=s(e,2),r=n[0],o=n[1];return t.set(r,o)})):x(e)?(e.constructor!==Map&&f("Cannot initialize from classes that inherit from Map: "+e.constructor.name),e.forEach((function(e,n){return t.set(n,e)}))):null!=e&&f("Cannot initialize map from "+e)})),this},e.prototype.clear=function(){var e=this;dt((function(){le((function(){var t,n;try{for(var r=a(e.keys()),o=r.next();!o.done;o=r.next()){var i=o.value;e.delete(i)}}catch(e){t={error:e}}finally{try{o&&!o.done&&(n=r.return)&&n.call(r)}finally{if(t)throw t.error}}}))}))},e.prototype.replace=function(e){var t=this;return dt((function(){var n,r=y(n=e)?Object.keys(n):Array.isArray(n)?n.map((function(e){return s(e,1)[0]})):x(n)||Nt(n)?Array.from(n.keys()):f("Cannot get keys from '"+n+"'");Array.from(t.keys()).filter((function(e){return-1===r.indexOf(e)})).forEach((function(e){return t.delete(e)})),t.merge(e)})),this},Object.defineProperty(e.prototype,"size",{get:function(){return this._keysAtom.reportObserved(),this._data.size},enumerable:!0,configurable:!0}),e.prototype.toPOJO=function(){var e,t,n={};try{for(var r=a(this),o=r.next();!o.done;o=r.next()){var i=s(o.value,2),l=i[0],c=i[1];n["symbol"==typeof l?l:O(l)]=c}}catch(t){e={error:t}}finally{try{o&&!o.done&&(t=r.return)&&t.call(r)}finally{if(e)throw e.error}}return n},e.prototype.toJS=function(){return new Map(this)},e.prototype.toJSON=function(){return this.toPOJO()},e.prototype.toString=function(){var e=this;return this.name+"[{ "+Array.from(this.keys()).map((function(t){return O(t)+": "+e.get(t)})).join(", ")+" }]"},e.prototype.observe=function(e,t){return kt(this,e)},e.prototype.intercept=function(e){return bt(this,e)},e}(),Nt=b("ObservableMap",Rt),Lt={},Mt=function(){function e(e,t,n){if(void 0===t&&(t=F),void 0===n&&(n="ObservableSet@"+p()),this.name=n,this[It]=Lt,this._data=new Set,this._atom=j(this.name),this[Symbol.toStringTag]="Set","function"!=typeof Set)throw new Error("mobx.set requires Set polyfill for the current browser. Check babel-polyfill or core-js/es6/set.js");this.enhancer=function(e,r){return t(e,r,n)},e&&this.replace(e)}return e.prototype.dehanceValue=function(e){return void 0!==this.dehancer?this.dehancer(e):e},e.prototype.clear=function(){var e=this;dt((function(){le((function(){var t,n;try{for(var r=a(e._data.values()),o=r.next();!o.done;o=r.next()){var i=o.value;e.delete(i)}}catch(e){t={error:e}}finally{try{o&&!o.done&&(n=r.return)&&n.call(r)}finally{if(t)throw t.error}}}))}))},e.prototype.forEach=function(e,t){var n,r;try{for(var o=a(this),i=o.next();!i.done;i=o.next()){var s=i.value;e.call(t,s,s,this)}}catch(e){n={error:e}}finally{try{i&&!i.done&&(r=o.return)&&r.call(o)}finally{if(n)throw n.error}}},Object.defineProperty(e.prototype,"size",{get:function(){return this._atom.reportObserved(),this._data.size},enumerable:!0,configurable:!0}),e.prototype.add=function(e){var t=this;if((ie(this._atom),vt(this))&&!(r=xt(this,{type:"add",object:this,newValue:e})))return this;if(!this.has(e)){dt((function(){t._data.add(t.enhancer(e,void 0)),t._atom.reportChanged()}));var n=wt(this),r=n?{type:"add",object:this,newValue:e}:null;0,n&&Ot(this,r)}return this},e.prototype.delete=function(e){var t=this;if(vt(this)&&!(r=xt(this,{type:"delete",object:this,oldValue:e})))return!1;if(this.has(e)){var n=wt(this),r=n?{type:"delete",object:this,oldValue:e}:null;return dt((function(){t._atom.reportChanged(),t._data.delete(e)})),n&&Ot(this,r),!0}return!1},e.prototype.has=function(e){return this._atom.reportObserved(),this._data.has(this.dehanceValue(e))},e.prototype.entries=function(){var e=0,t=Array.from(this.keys()),n=Array.from(this.values());return Kt({next:function(){var r=e;return e+=1,r<n.length?{value:[t[r],n[r]],done:!1}:{done:!0}}})},e.prototype.keys=function(){return this.values()},e.prototype.values=function(){this._atom.reportObserved();var e=this,t=0,n=Array.from(this._data.values());return Kt({next:function(){return t<n.length?{value:e.dehanceValue(n[t++]),done:!1}:{done:!0}}})},e.prototype.replace=function(e){var t=this;return Dt(e)&&(e=e.toJS()),dt((function(){Array.isArray(e)||w(e)?(t.clear(),e.forEach((function(e){return t.add(e)}))):null!=e&&f("Cannot initialize set from "+e)})),this},e.prototype.observe=function(e,t){return kt(this,e)},e.prototype.intercept=function(e){return bt(this,e)},e.prototype.toJS=function(){return new Set(this)},e.prototype.toString=function(){return this.name+"[ "+Array.from(this).join(", ")+" ]"},e.prototype[(It=_,Symbol.iterator)]=function(){return this.values()},e}(),Dt=b("ObservableSet",Mt),Ft=function(){function e(e,t,n,r){void 0===t&&(t=new Map),this.target=e,this.values=t,this.name=n,this.defaultEnhancer=r,this.keysAtom=new S(n+".keys")}return e.prototype.read=function(e){return this.values.get(e).get()},e.prototype.write=function(e,t){var n=this.target,r=this.values.get(e);if(r instanceof Oe)r.set(t);else{if(vt(this)){if(!(i=xt(this,{type:"update",object:this.proxy||n,name:e,newValue:t})))return;t=i.newValue}if((t=r.prepareNewValue(t))!==Ce.UNCHANGED){var o=wt(this),i=o?{type:"update",object:this.proxy||n,oldValue:r.value,name:e,newValue:t}:null;0,r.setNewValue(t),o&&Ot(this,i)}}},e.prototype.has=function(e){var t=this.pendingKeys||(this.pendingKeys=new Map),n=t.get(e);if(n)return n.get();var r=!!this.values.get(e);return n=new ke(r,z,this.name+"."+O(e)+"?",!1),t.set(e,n),n.get()},e.prototype.addObservableProp=function(e,t,n){void 0===n&&(n=this.defaultEnhancer);var r=this.target;if(vt(this)){var o=xt(this,{object:this.proxy||r,name:e,type:"add",newValue:t});if(!o)return;t=o.newValue}var i=new ke(t,n,this.name+"."+O(e),!1);this.values.set(e,i),t=i.value,Object.defineProperty(r,e,function(e){return Ut[e]||(Ut[e]={configurable:!0,enumerable:!0,get:function(){return this[_].read(e)},set:function(t){this[_].write(e,t)}})}(e)),this.notifyPropertyAddition(e,t)},e.prototype.addComputedProp=function(e,t,n){var r,o,i,a=this.target;n.name=n.name||this.name+"."+O(t),this.values.set(t,new Oe(n)),(e===a||(r=e,o=t,!(i=Object.getOwnPropertyDescriptor(r,o))||!1!==i.configurable&&!1!==i.writable))&&Object.defineProperty(e,t,function(e){return Bt[e]||(Bt[e]={configurable:Ce.computedConfigurable,enumerable:!1,get:function(){return $t(this).read(e)},set:function(t){$t(this).write(e,t)}})}(t))},e.prototype.remove=function(e){if(this.values.has(e)){var t=this.target;if(vt(this))if(!(a=xt(this,{object:this.proxy||t,name:e,type:"remove"})))return;try{Ne();var n=wt(this),r=this.values.get(e),o=r&&r.get();if(r&&r.set(void 0),this.keysAtom.reportChanged(),this.values.delete(e),this.pendingKeys){var i=this.pendingKeys.get(e);i&&i.set(!1)}delete this.target[e];var a=n?{type:"remove",object:this.proxy||t,oldValue:o,name:e}:null;0,n&&Ot(this,a)}finally{Le()}}},e.prototype.illegalAccess=function(e,t){console.warn("Property '"+t+"' of '"+e+"' was accessed through the prototype chain. Use 'decorate' instead to declare the prop or access it statically through it's owner")},e.prototype.observe=function(e,t){return kt(this,e)},e.prototype.intercept=function(e){return bt(this,e)},e.prototype.notifyPropertyAddition=function(e,t){var n=wt(this),r=n?{type:"add",object:this.proxy||this.target,name:e,newValue:t}:null;if(n&&Ot(this,r),this.pendingKeys){var o=this.pendingKeys.get(e);o&&o.set(!0)}this.keysAtom.reportChanged()},e.prototype.getKeys=function(){var e,t;this.keysAtom.reportObserved();var n=[];try{for(var r=a(this.values),o=r.next();!o.done;o=r.next()){var i=s(o.value,2),l=i[0];i[1]instanceof ke&&n.push(l)}}catch(t){e={error:t}}finally{try{o&&!o.done&&(t=r.return)&&t.call(r)}finally{if(e)throw e.error}}return n},e}();function zt(e,t,n){if(void 0===t&&(t=""),void 0===n&&(n=F),Object.prototype.hasOwnProperty.call(e,_))return e[_];y(e)||(t=(e.constructor.name||"ObservableObject")+"@"+p()),t||(t="ObservableObject@"+p());var r=new Ft(e,new Map,O(t),n);return v(e,_,r),r}var Ut=Object.create(null),Bt=Object.create(null);function $t(e){var t=e[_];return t||(L(e),e[_])}var Wt=b("ObservableObjectAdministration",Ft);function qt(e){return!!g(e)&&(L(e),Wt(e[_]))}function Ht(e,t){if("object"==typeof e&&null!==e){if(Ct(e))return void 0!==t&&f(!1),e[_].atom;if(Dt(e))return e[_];if(Nt(e)){var n=e;return void 0===t?n._keysAtom:((r=n._data.get(t)||n._hasMap.get(t))||f(!1),r)}var r;if(L(e),t&&!e[_]&&e[t],qt(e))return t?((r=e[_].values.get(t))||f(!1),r):f(!1);if(T(e)||Ee(e)||$e(e))return e}else if("function"==typeof e&&$e(e[_]))return e[_];return f(!1)}function Vt(e,t){return e||f("Expecting some object"),void 0!==t?Vt(Ht(e,t)):T(e)||Ee(e)||$e(e)||Nt(e)||Dt(e)?e:(L(e),e[_]?e[_]:void f(!1))}var Yt=Object.prototype.toString;function Gt(e,t,n){return void 0===n&&(n=-1),function e(t,n,r,o,i){if(t===n)return 0!==t||1/t==1/n;if(null==t||null==n)return!1;if(t!=t)return n!=n;var a=typeof t;if("function"!==a&&"object"!==a&&"object"!=typeof n)return!1;var s=Yt.call(t);if(s!==Yt.call(n))return!1;switch(s){case"[object RegExp]":case"[object String]":return""+t==""+n;case"[object Number]":return+t!=+t?+n!=+n:0==+t?1/+t==1/n:+t==+n;case"[object Date]":case"[object Boolean]":return+t==+n;case"[object Symbol]":return"undefined"!=typeof Symbol&&Symbol.valueOf.call(t)===Symbol.valueOf.call(n);case"[object Map]":case"[object Set]":r>=0&&r++}t=Qt(t),n=Qt(n);var l="[object Array]"===s;if(!l){if("object"!=typeof t||"object"!=typeof n)return!1;var c=t.constructor,u=n.constructor;if(c!==u&&!("function"==typeof c&&c instanceof c&&"function"==typeof u&&u instanceof u)&&"constructor"in t&&"constructor"in n)return!1}if(0===r)return!1;r<0&&(r=-1);i=i||[];var p=(o=o||[]).length;for(;p--;)if(o[p]===t)return i[p]===n;if(o.push(t),i.push(n),l){if((p=t.length)!==n.length)return!1;for(;p--;)if(!e(t[p],n[p],r-1,o,i))return!1}else{var f=Object.keys(t),d=void 0;if(p=f.length,Object.keys(n).length!==p)return!1;for(;p--;)if(d=f[p],!Xt(n,d)||!e(t[d],n[d],r-1,o,i))return!1}return o.pop(),i.pop(),!0}(e,t,n)}function Qt(e){return Ct(e)?e.slice():x(e)||Nt(e)||w(e)||Dt(e)?Array.from(e.entries()):e}function Xt(e,t){return Object.prototype.hasOwnProperty.call(e,t)}function Kt(e){return e[Symbol.iterator]=Jt,e}function Jt(){return this}if("undefined"==typeof Proxy||"undefined"==typeof Symbol)throw new Error("[mobx] MobX 5+ requires Proxy and Symbol objects. If your environment doesn't support Symbol or Proxy objects, please downgrade to MobX 4. For React Native Android, consider upgrading JSCore.");"object"==typeof __MOBX_DEVTOOLS_GLOBAL_HOOK__&&__MOBX_DEVTOOLS_GLOBAL_HOOK__.injectMobx({spy:qe,extras:{getDebugName:function(e,t){return(void 0!==t?Ht(e,t):qt(e)||Nt(e)||Dt(e)?Vt(e):Ht(e)).name}},$mobx:_})}).call(this,n(14),n(5))},function(e,t,n){(function(t){var n=function(e){return e&&e.Math==Math&&e};e.exports=n("object"==typeof globalThis&&globalThis)||n("object"==typeof window&&window)||n("object"==typeof self&&self)||n("object"==typeof t&&t)||Function("return this")()}).call(this,n(5))},function(e,t,n){var r=n(3),o=n(69),i=n(11),a=n(52),s=n(72),l=n(102),c=o("wks"),u=r.Symbol,p=l?u:u&&u.withoutSetter||a;e.exports=function(e){return i(c,e)||(s&&i(u,e)?c[e]=u[e]:c[e]=p("Symbol."+e)),c[e]}},function(e,t){var n;n=function(){return this}();try{n=n||new Function("return this")()}catch(e){"object"==typeof window&&(n=window)}e.exports=n},function(e,t,n){"use strict";var r=n(56),o=["kind","resolve","construct","instanceOf","predicate","represent","defaultStyle","styleAliases"],i=["scalar","sequence","mapping"];e.exports=function(e,t){var n,a;if(t=t||{},Object.keys(t).forEach((function(t){if(-1===o.indexOf(t))throw new r('Unknown option "'+t+'" is met in definition of "'+e+'" YAML type.')})),this.tag=e,this.kind=t.kind||null,this.resolve=t.resolve||function(){return!0},this.construct=t.construct||function(e){return e},this.instanceOf=t.instanceOf||null,this.predicate=t.predicate||null,this.represent=t.represent||null,this.defaultStyle=t.defaultStyle||null,this.styleAliases=(n=t.styleAliases||null,a={},null!==n&&Object.keys(n).forEach((function(e){n[e].forEach((function(t){a[String(t)]=e}))})),a),-1===i.indexOf(this.kind))throw new r('Unknown kind "'+this.kind+'" is specified for "'+e+'" YAML type.')}},function(e,t,n){"use strict";(function(e){n.d(t,"a",(function(){return w})),n.d(t,"b",(function(){return s})),n.d(t,"c",(function(){return b}));var r=n(2),o=n(0),i=n.n(o);if(!o.useState)throw new Error("mobx-react-lite requires React with Hooks support");if(!r.q)throw new Error("mobx-react-lite requires mobx at least version 4 to be available");var a=!1;function s(){return a}function l(){return(l=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function c(){var e=Object(o.useState)(0)[1];return Object(o.useCallback)((function(){e((function(e){return e+1}))}),[])}function u(e){return Object(r.j)(e)}var p,f=1e4,d=new Set;function h(){void 0===p&&(p=setTimeout(m,1e4))}function m(){p=void 0;var e=Date.now();d.forEach((function(t){var n=t.current;n&&e>=n.cleanAt&&(n.reaction.dispose(),t.current=null,d.delete(t))})),d.size>0&&h()}var g={};function y(e){return"observer"+e}function v(e,t,n){if(void 0===t&&(t="observed"),void 0===n&&(n=g),s())return e();var o,a=(n.useForceUpdate||c)(),l=i.a.useRef(null);if(!l.current){var p=new r.b(y(t),(function(){m.mounted?a():(p.dispose(),l.current=null)})),m=function(e){return{cleanAt:Date.now()+f,reaction:e}}(p);l.current=m,o=l,d.add(o),h()}var v,b,x=l.current.reaction;if(i.a.useDebugValue(x,u),i.a.useEffect((function(){var e;return e=l,d.delete(e),l.current?l.current.mounted=!0:(l.current={reaction:new r.b(y(t),(function(){a()})),cleanAt:1/0},a()),function(){l.current.reaction.dispose(),l.current=null}}),[]),x.track((function(){try{v=e()}catch(e){b=e}})),b)throw b;return v}function b(e,t){if(s())return e;var n,r,i,a=l({forwardRef:!1},t),c=e.displayName||e.name,u=function(t,n){return v((function(){return e(t,n)}),c)};return u.displayName=c,n=a.forwardRef?Object(o.memo)(Object(o.forwardRef)(u)):Object(o.memo)(u),r=e,i=n,Object.keys(r).forEach((function(e){x[e]||Object.defineProperty(i,e,Object.getOwnPropertyDescriptor(r,e))})),n.displayName=c,n}var x={$$typeof:!0,render:!0,compare:!0,type:!0};function w(e){var t=e.children,n=e.render,r=t||n;return"function"!=typeof r?null:v(r)}function k(e,t,n,r,o){var i="children"===t?"render":"children",a="function"==typeof e[t],s="function"==typeof e[i];return a&&s?new Error("MobX Observer: Do not use children and render in the same time in`"+n):a||s?null:new Error("Invalid prop `"+o+"` of type `"+typeof e[t]+"` supplied to `"+n+"`, expected `function`.")}w.propTypes={children:k,render:k},w.displayName="Observer"}).call(this,n(5))},function(e,t){e.exports=function(e){try{return!!e()}catch(e){return!0}}},function(e,t){e.exports=function(e){return"object"==typeof e?null!==e:"function"==typeof e}},function(e,t,n){"use strict";var r=n(229),o=n(231);function i(){this.protocol=null,this.slashes=null,this.auth=null,this.host=null,this.port=null,this.hostname=null,this.hash=null,this.search=null,this.query=null,this.pathname=null,this.path=null,this.href=null}t.parse=b,t.resolve=function(e,t){return b(e,!1,!0).resolve(t)},t.resolveObject=function(e,t){return e?b(e,!1,!0).resolveObject(t):t},t.format=function(e){o.isString(e)&&(e=b(e));return e instanceof i?e.format():i.prototype.format.call(e)},t.Url=i;var a=/^([a-z0-9.+-]+:)/i,s=/:[0-9]*$/,l=/^(\/\/?(?!\/)[^\?\s]*)(\?[^\s]*)?$/,c=["{","}","|","\\","^","`"].concat(["<",">",'"',"`"," ","\r","\n","\t"]),u=["'"].concat(c),p=["%","/","?",";","#"].concat(u),f=["/","?","#"],d=/^[+a-z0-9A-Z_-]{0,63}$/,h=/^([+a-z0-9A-Z_-]{0,63})(.*)$/,m={javascript:!0,"javascript:":!0},g={javascript:!0,"javascript:":!0},y={http:!0,https:!0,ftp:!0,gopher:!0,file:!0,"http:":!0,"https:":!0,"ftp:":!0,"gopher:":!0,"file:":!0},v=n(232);function b(e,t,n){if(e&&o.isObject(e)&&e instanceof i)return e;var r=new i;return r.parse(e,t,n),r}i.prototype.parse=function(e,t,n){if(!o.isString(e))throw new TypeError("Parameter 'url' must be a string, not "+typeof e);var i=e.indexOf("?"),s=-1!==i&&i<e.indexOf("#")?"?":"#",c=e.split(s);c[0]=c[0].replace(/\\/g,"/");var b=e=c.join(s);if(b=b.trim(),!n&&1===e.split("#").length){var x=l.exec(b);if(x)return this.path=b,this.href=b,this.pathname=x[1],x[2]?(this.search=x[2],this.query=t?v.parse(this.search.substr(1)):this.search.substr(1)):t&&(this.search="",this.query={}),this}var w=a.exec(b);if(w){var k=(w=w[0]).toLowerCase();this.protocol=k,b=b.substr(w.length)}if(n||w||b.match(/^\/\/[^@\/]+@[^@\/]+/)){var O="//"===b.substr(0,2);!O||w&&g[w]||(b=b.substr(2),this.slashes=!0)}if(!g[w]&&(O||w&&!y[w])){for(var E,_,S=-1,T=0;T<f.length;T++){-1!==(j=b.indexOf(f[T]))&&(-1===S||j<S)&&(S=j)}-1!==(_=-1===S?b.lastIndexOf("@"):b.lastIndexOf("@",S))&&(E=b.slice(0,_),b=b.slice(_+1),this.auth=decodeURIComponent(E)),S=-1;for(T=0;T<p.length;T++){var j;-1!==(j=b.indexOf(p[T]))&&(-1===S||j<S)&&(S=j)}-1===S&&(S=b.length),this.host=b.slice(0,S),b=b.slice(S),this.parseHost(),this.hostname=this.hostname||"";var A="["===this.hostname[0]&&"]"===this.hostname[this.hostname.length-1];if(!A)for(var C=this.hostname.split(/\./),I=(T=0,C.length);T<I;T++){var P=C[T];if(P&&!P.match(d)){for(var R="",N=0,L=P.length;N<L;N++)P.charCodeAt(N)>127?R+="x":R+=P[N];if(!R.match(d)){var M=C.slice(0,T),D=C.slice(T+1),F=P.match(h);F&&(M.push(F[1]),D.unshift(F[2])),D.length&&(b="/"+D.join(".")+b),this.hostname=M.join(".");break}}}this.hostname.length>255?this.hostname="":this.hostname=this.hostname.toLowerCase(),A||(this.hostname=r.toASCII(this.hostname));var z=this.port?":"+this.port:"",U=this.hostname||"";this.host=U+z,this.href+=this.host,A&&(this.hostname=this.hostname.substr(1,this.hostname.length-2),"/"!==b[0]&&(b="/"+b))}if(!m[k])for(T=0,I=u.length;T<I;T++){var B=u[T];if(-1!==b.indexOf(B)){var $=encodeURIComponent(B);$===B&&($=escape(B)),b=b.split(B).join($)}}var W=b.indexOf("#");-1!==W&&(this.hash=b.substr(W),b=b.slice(0,W));var q=b.indexOf("?");if(-1!==q?(this.search=b.substr(q),this.query=b.substr(q+1),t&&(this.query=v.parse(this.query)),b=b.slice(0,q)):t&&(this.search="",this.query={}),b&&(this.pathname=b),y[k]&&this.hostname&&!this.pathname&&(this.pathname="/"),this.pathname||this.search){z=this.pathname||"";var H=this.search||"";this.path=z+H}return this.href=this.format(),this},i.prototype.format=function(){var e=this.auth||"";e&&(e=(e=encodeURIComponent(e)).replace(/%3A/i,":"),e+="@");var t=this.protocol||"",n=this.pathname||"",r=this.hash||"",i=!1,a="";this.host?i=e+this.host:this.hostname&&(i=e+(-1===this.hostname.indexOf(":")?this.hostname:"["+this.hostname+"]"),this.port&&(i+=":"+this.port)),this.query&&o.isObject(this.query)&&Object.keys(this.query).length&&(a=v.stringify(this.query));var s=this.search||a&&"?"+a||"";return t&&":"!==t.substr(-1)&&(t+=":"),this.slashes||(!t||y[t])&&!1!==i?(i="//"+(i||""),n&&"/"!==n.charAt(0)&&(n="/"+n)):i||(i=""),r&&"#"!==r.charAt(0)&&(r="#"+r),s&&"?"!==s.charAt(0)&&(s="?"+s),t+i+(n=n.replace(/[?#]/g,(function(e){return encodeURIComponent(e)})))+(s=s.replace("#","%23"))+r},i.prototype.resolve=function(e){return this.resolveObject(b(e,!1,!0)).format()},i.prototype.resolveObject=function(e){if(o.isString(e)){var t=new i;t.parse(e,!1,!0),e=t}for(var n=new i,r=Object.keys(this),a=0;a<r.length;a++){var s=r[a];n[s]=this[s]}if(n.hash=e.hash,""===e.href)return n.href=n.format(),n;if(e.slashes&&!e.protocol){for(var l=Object.keys(e),c=0;c<l.length;c++){var u=l[c];"protocol"!==u&&(n[u]=e[u])}return y[n.protocol]&&n.hostname&&!n.pathname&&(n.path=n.pathname="/"),n.href=n.format(),n}if(e.protocol&&e.protocol!==n.protocol){if(!y[e.protocol]){for(var p=Object.keys(e),f=0;f<p.length;f++){var d=p[f];n[d]=e[d]}return n.href=n.format(),n}if(n.protocol=e.protocol,e.host||g[e.protocol])n.pathname=e.pathname;else{for(var h=(e.pathname||"").split("/");h.length&&!(e.host=h.shift()););e.host||(e.host=""),e.hostname||(e.hostname=""),""!==h[0]&&h.unshift(""),h.length<2&&h.unshift(""),n.pathname=h.join("/")}if(n.search=e.search,n.query=e.query,n.host=e.host||"",n.auth=e.auth,n.hostname=e.hostname||e.host,n.port=e.port,n.pathname||n.search){var m=n.pathname||"",v=n.search||"";n.path=m+v}return n.slashes=n.slashes||e.slashes,n.href=n.format(),n}var b=n.pathname&&"/"===n.pathname.charAt(0),x=e.host||e.pathname&&"/"===e.pathname.charAt(0),w=x||b||n.host&&e.pathname,k=w,O=n.pathname&&n.pathname.split("/")||[],E=(h=e.pathname&&e.pathname.split("/")||[],n.protocol&&!y[n.protocol]);if(E&&(n.hostname="",n.port=null,n.host&&(""===O[0]?O[0]=n.host:O.unshift(n.host)),n.host="",e.protocol&&(e.hostname=null,e.port=null,e.host&&(""===h[0]?h[0]=e.host:h.unshift(e.host)),e.host=null),w=w&&(""===h[0]||""===O[0])),x)n.host=e.host||""===e.host?e.host:n.host,n.hostname=e.hostname||""===e.hostname?e.hostname:n.hostname,n.search=e.search,n.query=e.query,O=h;else if(h.length)O||(O=[]),O.pop(),O=O.concat(h),n.search=e.search,n.query=e.query;else if(!o.isNullOrUndefined(e.search)){if(E)n.hostname=n.host=O.shift(),(A=!!(n.host&&n.host.indexOf("@")>0)&&n.host.split("@"))&&(n.auth=A.shift(),n.host=n.hostname=A.shift());return n.search=e.search,n.query=e.query,o.isNull(n.pathname)&&o.isNull(n.search)||(n.path=(n.pathname?n.pathname:"")+(n.search?n.search:"")),n.href=n.format(),n}if(!O.length)return n.pathname=null,n.search?n.path="/"+n.search:n.path=null,n.href=n.format(),n;for(var _=O.slice(-1)[0],S=(n.host||e.host||O.length>1)&&("."===_||".."===_)||""===_,T=0,j=O.length;j>=0;j--)"."===(_=O[j])?O.splice(j,1):".."===_?(O.splice(j,1),T++):T&&(O.splice(j,1),T--);if(!w&&!k)for(;T--;T)O.unshift("..");!w||""===O[0]||O[0]&&"/"===O[0].charAt(0)||O.unshift(""),S&&"/"!==O.join("/").substr(-1)&&O.push("");var A,C=""===O[0]||O[0]&&"/"===O[0].charAt(0);E&&(n.hostname=n.host=C?"":O.length?O.shift():"",(A=!!(n.host&&n.host.indexOf("@")>0)&&n.host.split("@"))&&(n.auth=A.shift(),n.host=n.hostname=A.shift()));return(w=w||n.host&&O.length)&&!C&&O.unshift(""),O.length?n.pathname=O.join("/"):(n.pathname=null,n.path=null),o.isNull(n.pathname)&&o.isNull(n.search)||(n.path=(n.pathname?n.pathname:"")+(n.search?n.search:"")),n.auth=e.auth||n.auth,n.slashes=n.slashes||e.slashes,n.href=n.format(),n},i.prototype.parseHost=function(){var e=this.host,t=s.exec(e);t&&(":"!==(t=t[0])&&(this.port=t.substr(1)),e=e.substr(0,e.length-t.length)),e&&(this.hostname=e)}},function(e,t){var n={}.hasOwnProperty;e.exports=function(e,t){return n.call(e,t)}},function(e,t,n){var r=n(35),o=n(11),i=n(128),a=n(16).f;e.exports=function(e){var t=r.Symbol||(r.Symbol={});o(t,e)||a(t,e,{value:i.f(e)})}},function(e,t,n){"use strict";n.r(t),function(e){n.d(t,"ServerStyleSheet",(function(){return Me})),n.d(t,"StyleSheetConsumer",(function(){return X})),n.d(t,"StyleSheetContext",(function(){return Q})),n.d(t,"StyleSheetManager",(function(){return ne})),n.d(t,"ThemeConsumer",(function(){return Te})),n.d(t,"ThemeContext",(function(){return Se})),n.d(t,"ThemeProvider",(function(){return je})),n.d(t,"__PRIVATE__",(function(){return ze})),n.d(t,"createGlobalStyle",(function(){return Ne})),n.d(t,"css",(function(){return ue})),n.d(t,"isStyledComponent",(function(){return x})),n.d(t,"keyframes",(function(){return Le})),n.d(t,"useTheme",(function(){return Fe})),n.d(t,"version",(function(){return Ue})),n.d(t,"withTheme",(function(){return De}));var r=n(64),o=n(0),i=n.n(o),a=n(151),s=n.n(a),l=n(152),c=n(153),u=n(99),p=n(95),f=n.n(p);function d(){return(d=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}var h=function(e,t){for(var n=[e[0]],r=0,o=t.length;r<o;r+=1)n.push(t[r],e[r+1]);return n},m=function(e){return null!==e&&"object"==typeof e&&"[object Object]"===(e.toString?e.toString():Object.prototype.toString.call(e))&&!Object(r.typeOf)(e)},g=Object.freeze([]),y=Object.freeze({});function v(e){return"function"==typeof e}function b(e){return e.displayName||e.name||"Component"}function x(e){return e&&"string"==typeof e.styledComponentId}var w=void 0!==e&&(e.env.REACT_APP_SC_ATTR||e.env.SC_ATTR)||"data-styled",k="undefined"!=typeof window&&"HTMLElement"in window,O="boolean"==typeof SC_DISABLE_SPEEDY&&SC_DISABLE_SPEEDY||void 0!==e&&(e.env.REACT_APP_SC_DISABLE_SPEEDY||e.env.SC_DISABLE_SPEEDY)||!1,E={},_=function(){return n.nc};function S(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];throw new Error("An error occurred. See https://github.com/styled-components/styled-components/blob/master/packages/styled-components/src/utils/errors.md#"+e+" for more information."+(n.length>0?" Additional arguments: "+n.join(", "):""))}var T=function(e){var t=document.head,n=e||t,r=document.createElement("style"),o=function(e){for(var t=e.childNodes,n=t.length;n>=0;n--){var r=t[n];if(r&&1===r.nodeType&&r.hasAttribute(w))return r}}(n),i=void 0!==o?o.nextSibling:null;r.setAttribute(w,"active"),r.setAttribute("data-styled-version","5.1.1");var a=_();return a&&r.setAttribute("nonce",a),n.insertBefore(r,i),r},j=function(){function e(e){var t=this.element=T(e);t.appendChild(document.createTextNode("")),this.sheet=function(e){if(e.sheet)return e.sheet;for(var t=document.styleSheets,n=0,r=t.length;n<r;n++){var o=t[n];if(o.ownerNode===e)return o}S(17)}(t),this.length=0}var t=e.prototype;return t.insertRule=function(e,t){try{return this.sheet.insertRule(t,e),this.length++,!0}catch(e){return!1}},t.deleteRule=function(e){this.sheet.deleteRule(e),this.length--},t.getRule=function(e){var t=this.sheet.cssRules[e];return void 0!==t&&"string"==typeof t.cssText?t.cssText:""},e}(),A=function(){function e(e){var t=this.element=T(e);this.nodes=t.childNodes,this.length=0}var t=e.prototype;return t.insertRule=function(e,t){if(e<=this.length&&e>=0){var n=document.createTextNode(t),r=this.nodes[e];return this.element.insertBefore(n,r||null),this.length++,!0}return!1},t.deleteRule=function(e){this.element.removeChild(this.nodes[e]),this.length--},t.getRule=function(e){return e<this.length?this.nodes[e].textContent:""},e}(),C=function(){function e(e){this.rules=[],this.length=0}var t=e.prototype;return t.insertRule=function(e,t){return e<=this.length&&(this.rules.splice(e,0,t),this.length++,!0)},t.deleteRule=function(e){this.rules.splice(e,1),this.length--},t.getRule=function(e){return e<this.length?this.rules[e]:""},e}(),I=function(){function e(e){this.groupSizes=new Uint32Array(512),this.length=512,this.tag=e}var t=e.prototype;return t.indexOfGroup=function(e){for(var t=0,n=0;n<e;n++)t+=this.groupSizes[n];return t},t.insertRules=function(e,t){if(e>=this.groupSizes.length){for(var n=this.groupSizes,r=n.length,o=r;e>=o;)(o<<=1)<0&&S(16,""+e);this.groupSizes=new Uint32Array(o),this.groupSizes.set(n),this.length=o;for(var i=r;i<o;i++)this.groupSizes[i]=0}for(var a=this.indexOfGroup(e+1),s=0,l=t.length;s<l;s++)this.tag.insertRule(a,t[s])&&(this.groupSizes[e]++,a++)},t.clearGroup=function(e){if(e<this.length){var t=this.groupSizes[e],n=this.indexOfGroup(e),r=n+t;this.groupSizes[e]=0;for(var o=n;o<r;o++)this.tag.deleteRule(n)}},t.getGroup=function(e){var t="";if(e>=this.length||0===this.groupSizes[e])return t;for(var n=this.groupSizes[e],r=this.indexOfGroup(e),o=r+n,i=r;i<o;i++)t+=this.tag.getRule(i)+"/*!sc*/\n";return t},e}(),P=new Map,R=new Map,N=1,L=function(e){if(P.has(e))return P.get(e);var t=N++;return P.set(e,t),R.set(t,e),t},M=function(e){return R.get(e)},D=function(e,t){t>=N&&(N=t+1),P.set(e,t),R.set(t,e)},F="style["+w+'][data-styled-version="5.1.1"]',z=new RegExp("^"+w+'\\.g(\\d+)\\[id="([\\w\\d-]+)"\\].*?"([^"]*)'),U=function(e,t,n){for(var r,o=n.split(","),i=0,a=o.length;i<a;i++)(r=o[i])&&e.registerName(t,r)},B=function(e,t){for(var n=t.innerHTML.split("/*!sc*/\n"),r=[],o=0,i=n.length;o<i;o++){var a=n[o].trim();if(a){var s=a.match(z);if(s){var l=0|parseInt(s[1],10),c=s[2];0!==l&&(D(c,l),U(e,c,s[3]),e.getTag().insertRules(l,r)),r.length=0}else r.push(a)}}},$=k,W={isServer:!k,useCSSOMInjection:!O},q=function(){function e(e,t,n){void 0===e&&(e=W),void 0===t&&(t={}),this.options=d({},W,{},e),this.gs=t,this.names=new Map(n),!this.options.isServer&&k&&$&&($=!1,function(e){for(var t=document.querySelectorAll(F),n=0,r=t.length;n<r;n++){var o=t[n];o&&"active"!==o.getAttribute(w)&&(B(e,o),o.parentNode&&o.parentNode.removeChild(o))}}(this))}e.registerId=function(e){return L(e)};var t=e.prototype;return t.reconstructWithOptions=function(t){return new e(d({},this.options,{},t),this.gs,this.names)},t.allocateGSInstance=function(e){return this.gs[e]=(this.gs[e]||0)+1},t.getTag=function(){return this.tag||(this.tag=(t=this.options,n=t.isServer,r=t.useCSSOMInjection,o=t.target,e=n?new C(o):r?new j(o):new A(o),new I(e)));var e,t,n,r,o},t.hasNameForId=function(e,t){return this.names.has(e)&&this.names.get(e).has(t)},t.registerName=function(e,t){if(L(e),this.names.has(e))this.names.get(e).add(t);else{var n=new Set;n.add(t),this.names.set(e,n)}},t.insertRules=function(e,t,n){this.registerName(e,t),this.getTag().insertRules(L(e),n)},t.clearNames=function(e){this.names.has(e)&&this.names.get(e).clear()},t.clearRules=function(e){this.getTag().clearGroup(L(e)),this.clearNames(e)},t.clearTag=function(){this.tag=void 0},t.toString=function(){return function(e){for(var t=e.getTag(),n=t.length,r="",o=0;o<n;o++){var i=M(o);if(void 0!==i){var a=e.names.get(i),s=t.getGroup(o);if(void 0!==a&&0!==s.length){var l=w+".g"+o+'[id="'+i+'"]',c="";void 0!==a&&a.forEach((function(e){e.length>0&&(c+=e+",")})),r+=""+s+l+'{content:"'+c+'"}/*!sc*/\n'}}}return r}(this)},e}(),H=function(e,t){for(var n=t.length;n;)e=33*e^t.charCodeAt(--n);return e},V=function(e){return H(5381,e)};var Y=/^\s*\/\/.*$/gm;function G(e){var t,n,r,o=void 0===e?y:e,i=o.options,a=void 0===i?y:i,s=o.plugins,c=void 0===s?g:s,u=new l.a(a),p=[],f=function(e){function t(t){if(t)try{e(t+"}")}catch(e){}}return function(n,r,o,i,a,s,l,c,u,p){switch(n){case 1:if(0===u&&64===r.charCodeAt(0))return e(r+";"),"";break;case 2:if(0===c)return r+"/*|*/";break;case 3:switch(c){case 102:case 112:return e(o[0]+r),"";default:return r+(0===p?"/*|*/":"")}case-2:r.split("/*|*/}").forEach(t)}}}((function(e){p.push(e)})),d=function(e,r,o){return r>0&&-1!==o.slice(0,r).indexOf(n)&&o.slice(r-n.length,r)!==n?"."+t:e};function h(e,o,i,a){void 0===a&&(a="&");var s=e.replace(Y,""),l=o&&i?i+" "+o+" { "+s+" }":s;return t=a,n=o,r=new RegExp("\\"+n+"\\b","g"),u(i||!o?"":o,l)}return u.use([].concat(c,[function(e,t,o){2===e&&o.length&&o[0].lastIndexOf(n)>0&&(o[0]=o[0].replace(r,d))},f,function(e){if(-2===e){var t=p;return p=[],t}}])),h.hash=c.length?c.reduce((function(e,t){return t.name||S(15),H(e,t.name)}),5381).toString():"",h}var Q=i.a.createContext(),X=Q.Consumer,K=i.a.createContext(),J=(K.Consumer,new q),Z=G();function ee(){return Object(o.useContext)(Q)||J}function te(){return Object(o.useContext)(K)||Z}function ne(e){var t=Object(o.useState)(e.stylisPlugins),n=t[0],r=t[1],a=ee(),l=Object(o.useMemo)((function(){var t=a;return e.sheet?t=e.sheet:e.target&&(t=t.reconstructWithOptions({target:e.target})),e.disableCSSOMInjection&&(t=t.reconstructWithOptions({useCSSOMInjection:!1})),t}),[e.disableCSSOMInjection,e.sheet,e.target]),c=Object(o.useMemo)((function(){return G({options:{prefix:!e.disableVendorPrefixes},plugins:n})}),[e.disableVendorPrefixes,n]);return Object(o.useEffect)((function(){s()(n,e.stylisPlugins)||r(e.stylisPlugins)}),[e.stylisPlugins]),i.a.createElement(Q.Provider,{value:l},i.a.createElement(K.Provider,{value:c},e.children))}var re=function(){function e(e,t){var n=this;this.inject=function(e){e.hasNameForId(n.id,n.name)||e.insertRules(n.id,n.name,Z.apply(void 0,n.stringifyArgs))},this.toString=function(){return S(12,String(n.name))},this.name=e,this.id="sc-keyframes-"+e,this.stringifyArgs=t}return e.prototype.getName=function(){return this.name},e}(),oe=/([A-Z])/g,ie=/^ms-/;function ae(e){return e.replace(oe,"-$1").toLowerCase().replace(ie,"-ms-")}var se=function(e){return null==e||!1===e||""===e},le=function e(t,n){var r=[];return Object.keys(t).forEach((function(n){if(!se(t[n])){if(m(t[n]))return r.push.apply(r,e(t[n],n)),r;if(v(t[n]))return r.push(ae(n)+":",t[n],";"),r;r.push(ae(n)+": "+(o=n,(null==(i=t[n])||"boolean"==typeof i||""===i?"":"number"!=typeof i||0===i||o in c.a?String(i).trim():i+"px")+";"))}var o,i;return r})),n?[n+" {"].concat(r,["}"]):r};function ce(e,t,n){if(Array.isArray(e)){for(var r,o=[],i=0,a=e.length;i<a;i+=1)""!==(r=ce(e[i],t,n))&&(Array.isArray(r)?o.push.apply(o,r):o.push(r));return o}return se(e)?"":x(e)?"."+e.styledComponentId:v(e)?"function"!=typeof(s=e)||s.prototype&&s.prototype.isReactComponent||!t?e:ce(e(t),t,n):e instanceof re?n?(e.inject(n),e.getName()):e:m(e)?le(e):e.toString();var s}function ue(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return v(e)||m(e)?ce(h(g,[e].concat(n))):0===n.length&&1===e.length&&"string"==typeof e[0]?e:ce(h(e,n))}var pe=function(e){return"function"==typeof e||"object"==typeof e&&null!==e&&!Array.isArray(e)},fe=function(e){return"__proto__"!==e&&"constructor"!==e&&"prototype"!==e};function de(e,t,n){var r=e[n];pe(t)&&pe(r)?he(r,t):e[n]=t}function he(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];for(var o=0,i=n;o<i.length;o++){var a=i[o];if(pe(a))for(var s in a)fe(s)&&de(e,a[s],s)}return e}var me=/(a)(d)/gi,ge=function(e){return String.fromCharCode(e+(e>25?39:97))};function ye(e){var t,n="";for(t=Math.abs(e);t>52;t=t/52|0)n=ge(t%52)+n;return(ge(t%52)+n).replace(me,"$1-$2")}function ve(e){for(var t=0;t<e.length;t+=1){var n=e[t];if(v(n)&&!x(n))return!1}return!0}var be=function(){function e(e,t){this.rules=e,this.staticRulesId="",this.isStatic=ve(e),this.componentId=t,this.baseHash=V(t),q.registerId(t)}return e.prototype.generateAndInjectStyles=function(e,t,n){var r=this.componentId;if(this.isStatic&&!n.hash){if(this.staticRulesId&&t.hasNameForId(r,this.staticRulesId))return this.staticRulesId;var o=ce(this.rules,e,t).join(""),i=ye(H(this.baseHash,o.length)>>>0);if(!t.hasNameForId(r,i)){var a=n(o,"."+i,void 0,r);t.insertRules(r,i,a)}return this.staticRulesId=i,i}for(var s=this.rules.length,l=H(this.baseHash,n.hash),c="",u=0;u<s;u++){var p=this.rules[u];if("string"==typeof p)c+=p;else{var f=ce(p,e,t),d=Array.isArray(f)?f.join(""):f;l=H(l,d+u),c+=d}}var h=ye(l>>>0);if(!t.hasNameForId(r,h)){var m=n(c,"."+h,void 0,r);t.insertRules(r,h,m)}return h},e}(),xe=(new Set,function(e,t,n){return void 0===n&&(n=y),e.theme!==n.theme&&e.theme||t||n.theme}),we=/[!"#$%&'()*+,./:;<=>?@[\\\]^`{|}~-]+/g,ke=/(^-|-$)/g;function Oe(e){return e.replace(we,"-").replace(ke,"")}function Ee(e){return"string"==typeof e&&!0}var _e=function(e){return ye(V(e)>>>0)};var Se=i.a.createContext(),Te=Se.Consumer;function je(e){var t=Object(o.useContext)(Se),n=Object(o.useMemo)((function(){return function(e,t){return e?v(e)?e(t):Array.isArray(e)||"object"!=typeof e?S(8):t?d({},t,{},e):e:S(14)}(e.theme,t)}),[e.theme,t]);return e.children?i.a.createElement(Se.Provider,{value:n},e.children):null}var Ae={};function Ce(e,t,n){var r=e.attrs,i=e.componentStyle,a=e.defaultProps,s=e.foldedComponentIds,l=e.shouldForwardProp,c=e.styledComponentId,p=e.target;Object(o.useDebugValue)(c);var f=function(e,t,n){void 0===e&&(e=y);var r=d({},t,{theme:e}),o={};return n.forEach((function(e){var t,n,i,a=e;for(t in v(a)&&(a=a(r)),a)r[t]=o[t]="className"===t?(n=o[t],i=a[t],n&&i?n+" "+i:n||i):a[t]})),[r,o]}(xe(t,Object(o.useContext)(Se),a)||y,t,r),h=f[0],m=f[1],g=function(e,t,n,r){var i=ee(),a=te(),s=e.isStatic&&!t?e.generateAndInjectStyles(y,i,a):e.generateAndInjectStyles(n,i,a);return Object(o.useDebugValue)(s),s}(i,r.length>0,h),b=n,x=m.$as||t.$as||m.as||t.as||p,w=Ee(x),k=m!==t?d({},t,{},m):t,O=l||w&&u.a,E={};for(var _ in k)"$"!==_[0]&&"as"!==_&&("forwardedAs"===_?E.as=k[_]:O&&!O(_,u.a)||(E[_]=k[_]));return t.style&&m.style!==t.style&&(E.style=d({},t.style,{},m.style)),E.className=Array.prototype.concat(s,c,g!==c?g:null,t.className,m.className).filter(Boolean).join(" "),E.ref=b,Object(o.createElement)(x,E)}function Ie(e,t,n){var r=x(e),o=!Ee(e),a=t.displayName,s=void 0===a?function(e){return Ee(e)?"styled."+e:"Styled("+b(e)+")"}(e):a,l=t.componentId,c=void 0===l?function(e,t){var n="string"!=typeof e?"sc":Oe(e);Ae[n]=(Ae[n]||0)+1;var r=n+"-"+_e(n+Ae[n]);return t?t+"-"+r:r}(t.displayName,t.parentComponentId):l,u=t.attrs,p=void 0===u?g:u,h=t.displayName&&t.componentId?Oe(t.displayName)+"-"+t.componentId:t.componentId||c,m=r&&e.attrs?Array.prototype.concat(e.attrs,p).filter(Boolean):p,y=t.shouldForwardProp;r&&e.shouldForwardProp&&(y=y?function(n,r){return e.shouldForwardProp(n,r)&&t.shouldForwardProp(n,r)}:e.shouldForwardProp);var v,w=new be(r?e.componentStyle.rules.concat(n):n,h),k=function(e,t){return Ce(v,e,t)};return k.displayName=s,(v=i.a.forwardRef(k)).attrs=m,v.componentStyle=w,v.displayName=s,v.shouldForwardProp=y,v.foldedComponentIds=r?Array.prototype.concat(e.foldedComponentIds,e.styledComponentId):g,v.styledComponentId=h,v.target=r?e.target:e,v.withComponent=function(e){var r=t.componentId,o=function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(t,["componentId"]),i=r&&r+"-"+(Ee(e)?e:Oe(b(e)));return Ie(e,d({},o,{attrs:m,componentId:i}),n)},Object.defineProperty(v,"defaultProps",{get:function(){return this._foldedDefaultProps},set:function(t){this._foldedDefaultProps=r?he({},e.defaultProps,t):t}}),v.toString=function(){return"."+v.styledComponentId},o&&f()(v,e,{attrs:!0,componentStyle:!0,displayName:!0,foldedComponentIds:!0,shouldForwardProp:!0,self:!0,styledComponentId:!0,target:!0,withComponent:!0}),v}var Pe=function(e){return function e(t,n,o){if(void 0===o&&(o=y),!Object(r.isValidElementType)(n))return S(1,String(n));var i=function(){return t(n,o,ue.apply(void 0,arguments))};return i.withConfig=function(r){return e(t,n,d({},o,{},r))},i.attrs=function(r){return e(t,n,d({},o,{attrs:Array.prototype.concat(o.attrs,r).filter(Boolean)}))},i}(Ie,e)};["a","abbr","address","area","article","aside","audio","b","base","bdi","bdo","big","blockquote","body","br","button","canvas","caption","cite","code","col","colgroup","data","datalist","dd","del","details","dfn","dialog","div","dl","dt","em","embed","fieldset","figcaption","figure","footer","form","h1","h2","h3","h4","h5","h6","head","header","hgroup","hr","html","i","iframe","img","input","ins","kbd","keygen","label","legend","li","link","main","map","mark","marquee","menu","menuitem","meta","meter","nav","noscript","object","ol","optgroup","option","output","p","param","picture","pre","progress","q","rp","rt","ruby","s","samp","script","section","select","small","source","span","strong","style","sub","summary","sup","table","tbody","td","textarea","tfoot","th","thead","time","title","tr","track","u","ul","var","video","wbr","circle","clipPath","defs","ellipse","foreignObject","g","image","line","linearGradient","marker","mask","path","pattern","polygon","polyline","radialGradient","rect","stop","svg","text","tspan"].forEach((function(e){Pe[e]=Pe(e)}));var Re=function(){function e(e,t){this.rules=e,this.componentId=t,this.isStatic=ve(e)}var t=e.prototype;return t.createStyles=function(e,t,n,r){var o=r(ce(this.rules,t,n).join(""),""),i=this.componentId+e;n.insertRules(i,i,o)},t.removeStyles=function(e,t){t.clearRules(this.componentId+e)},t.renderStyles=function(e,t,n,r){q.registerId(this.componentId+e),this.removeStyles(e,n),this.createStyles(e,t,n,r)},e}();function Ne(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];var a=ue.apply(void 0,[e].concat(n)),s="sc-global-"+_e(JSON.stringify(a)),l=new Re(a,s);function c(e){var t=ee(),n=te(),r=Object(o.useContext)(Se),i=Object(o.useRef)(null);null===i.current&&(i.current=t.allocateGSInstance(s));var a=i.current;if(l.isStatic)l.renderStyles(a,E,t,n);else{var u=d({},e,{theme:xe(e,r,c.defaultProps)});l.renderStyles(a,u,t,n)}return Object(o.useEffect)((function(){return function(){return l.removeStyles(a,t)}}),g),null}return i.a.memo(c)}function Le(e){for(var t=arguments.length,n=new Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];var o=ue.apply(void 0,[e].concat(n)).join(""),i=_e(o);return new re(i,[o,i,"@keyframes"])}var Me=function(){function e(){var e=this;this._emitSheetCSS=function(){var t=e.instance.toString(),n=_();return"<style "+[n&&'nonce="'+n+'"',w+'="true"','data-styled-version="5.1.1"'].filter(Boolean).join(" ")+">"+t+"</style>"},this.getStyleTags=function(){return e.sealed?S(2):e._emitSheetCSS()},this.getStyleElement=function(){var t;if(e.sealed)return S(2);var n=((t={})[w]="",t["data-styled-version"]="5.1.1",t.dangerouslySetInnerHTML={__html:e.instance.toString()},t),r=_();return r&&(n.nonce=r),[i.a.createElement("style",d({},n,{key:"sc-0-0"}))]},this.seal=function(){e.sealed=!0},this.instance=new q({isServer:!0}),this.sealed=!1}var t=e.prototype;return t.collectStyles=function(e){return this.sealed?S(2):i.a.createElement(ne,{sheet:this.instance},e)},t.interleaveWithNodeStream=function(e){return S(3)},e}(),De=function(e){var t=i.a.forwardRef((function(t,n){var r=Object(o.useContext)(Se),a=e.defaultProps,s=xe(t,r,a);return i.a.createElement(e,d({},t,{theme:s,ref:n}))}));return f()(t,e),t.displayName="WithTheme("+b(e)+")",t},Fe=function(){return Object(o.useContext)(Se)},ze={StyleSheet:q,masterSheet:J},Ue="5.1.1";t.default=Pe}.call(this,n(14))},function(e,t){var n,r,o=e.exports={};function i(){throw new Error("setTimeout has not been defined")}function a(){throw new Error("clearTimeout has not been defined")}function s(e){if(n===setTimeout)return setTimeout(e,0);if((n===i||!n)&&setTimeout)return n=setTimeout,setTimeout(e,0);try{return n(e,0)}catch(t){try{return n.call(null,e,0)}catch(t){return n.call(this,e,0)}}}!function(){try{n="function"==typeof setTimeout?setTimeout:i}catch(e){n=i}try{r="function"==typeof clearTimeout?clearTimeout:a}catch(e){r=a}}();var l,c=[],u=!1,p=-1;function f(){u&&l&&(u=!1,l.length?c=l.concat(c):p=-1,c.length&&d())}function d(){if(!u){var e=s(f);u=!0;for(var t=c.length;t;){for(l=c,c=[];++p<t;)l&&l[p].run();p=-1,t=c.length}l=null,u=!1,function(e){if(r===clearTimeout)return clearTimeout(e);if((r===a||!r)&&clearTimeout)return r=clearTimeout,clearTimeout(e);try{r(e)}catch(t){try{return r.call(null,e)}catch(t){return r.call(this,e)}}}(e)}}function h(e,t){this.fun=e,this.array=t}function m(){}o.nextTick=function(e){var t=new Array(arguments.length-1);if(arguments.length>1)for(var n=1;n<arguments.length;n++)t[n-1]=arguments[n];c.push(new h(e,t)),1!==c.length||u||s(d)},h.prototype.run=function(){this.fun.apply(null,this.array)},o.title="browser",o.browser=!0,o.env={},o.argv=[],o.version="",o.versions={},o.on=m,o.addListener=m,o.once=m,o.off=m,o.removeListener=m,o.removeAllListeners=m,o.emit=m,o.prependListener=m,o.prependOnceListener=m,o.listeners=function(e){return[]},o.binding=function(e){throw new Error("process.binding is not supported")},o.cwd=function(){return"/"},o.chdir=function(e){throw new Error("process.chdir is not supported")},o.umask=function(){return 0}},function(e,t,n){"use strict";(function(e){
+/*!
+ * The buffer module from node.js, for the browser.
+ *
+ * @author   Feross Aboukhadijeh <http://feross.org>
+ * @license  MIT
+ */
+var r=n(236),o=n(237),i=n(130);function a(){return l.TYPED_ARRAY_SUPPORT?2147483647:1073741823}function s(e,t){if(a()<t)throw new RangeError("Invalid typed array length");return l.TYPED_ARRAY_SUPPORT?(e=new Uint8Array(t)).__proto__=l.prototype:(null===e&&(e=new l(t)),e.length=t),e}function l(e,t,n){if(!(l.TYPED_ARRAY_SUPPORT||this instanceof l))return new l(e,t,n);if("number"==typeof e){if("string"==typeof t)throw new Error("If encoding is specified then the first argument must be a string");return p(this,e)}return c(this,e,t,n)}function c(e,t,n,r){if("number"==typeof t)throw new TypeError('"value" argument must not be a number');return"undefined"!=typeof ArrayBuffer&&t instanceof ArrayBuffer?function(e,t,n,r){if(t.byteLength,n<0||t.byteLength<n)throw new RangeError("'offset' is out of bounds");if(t.byteLength<n+(r||0))throw new RangeError("'length' is out of bounds");t=void 0===n&&void 0===r?new Uint8Array(t):void 0===r?new Uint8Array(t,n):new Uint8Array(t,n,r);l.TYPED_ARRAY_SUPPORT?(e=t).__proto__=l.prototype:e=f(e,t);return e}(e,t,n,r):"string"==typeof t?function(e,t,n){"string"==typeof n&&""!==n||(n="utf8");if(!l.isEncoding(n))throw new TypeError('"encoding" must be a valid string encoding');var r=0|h(t,n),o=(e=s(e,r)).write(t,n);o!==r&&(e=e.slice(0,o));return e}(e,t,n):function(e,t){if(l.isBuffer(t)){var n=0|d(t.length);return 0===(e=s(e,n)).length||t.copy(e,0,0,n),e}if(t){if("undefined"!=typeof ArrayBuffer&&t.buffer instanceof ArrayBuffer||"length"in t)return"number"!=typeof t.length||(r=t.length)!=r?s(e,0):f(e,t);if("Buffer"===t.type&&i(t.data))return f(e,t.data)}var r;throw new TypeError("First argument must be a string, Buffer, ArrayBuffer, Array, or array-like object.")}(e,t)}function u(e){if("number"!=typeof e)throw new TypeError('"size" argument must be a number');if(e<0)throw new RangeError('"size" argument must not be negative')}function p(e,t){if(u(t),e=s(e,t<0?0:0|d(t)),!l.TYPED_ARRAY_SUPPORT)for(var n=0;n<t;++n)e[n]=0;return e}function f(e,t){var n=t.length<0?0:0|d(t.length);e=s(e,n);for(var r=0;r<n;r+=1)e[r]=255&t[r];return e}function d(e){if(e>=a())throw new RangeError("Attempt to allocate Buffer larger than maximum size: 0x"+a().toString(16)+" bytes");return 0|e}function h(e,t){if(l.isBuffer(e))return e.length;if("undefined"!=typeof ArrayBuffer&&"function"==typeof ArrayBuffer.isView&&(ArrayBuffer.isView(e)||e instanceof ArrayBuffer))return e.byteLength;"string"!=typeof e&&(e=""+e);var n=e.length;if(0===n)return 0;for(var r=!1;;)switch(t){case"ascii":case"latin1":case"binary":return n;case"utf8":case"utf-8":case void 0:return U(e).length;case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return 2*n;case"hex":return n>>>1;case"base64":return B(e).length;default:if(r)return U(e).length;t=(""+t).toLowerCase(),r=!0}}function m(e,t,n){var r=!1;if((void 0===t||t<0)&&(t=0),t>this.length)return"";if((void 0===n||n>this.length)&&(n=this.length),n<=0)return"";if((n>>>=0)<=(t>>>=0))return"";for(e||(e="utf8");;)switch(e){case"hex":return A(this,t,n);case"utf8":case"utf-8":return S(this,t,n);case"ascii":return T(this,t,n);case"latin1":case"binary":return j(this,t,n);case"base64":return _(this,t,n);case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return C(this,t,n);default:if(r)throw new TypeError("Unknown encoding: "+e);e=(e+"").toLowerCase(),r=!0}}function g(e,t,n){var r=e[t];e[t]=e[n],e[n]=r}function y(e,t,n,r,o){if(0===e.length)return-1;if("string"==typeof n?(r=n,n=0):n>2147483647?n=2147483647:n<-2147483648&&(n=-2147483648),n=+n,isNaN(n)&&(n=o?0:e.length-1),n<0&&(n=e.length+n),n>=e.length){if(o)return-1;n=e.length-1}else if(n<0){if(!o)return-1;n=0}if("string"==typeof t&&(t=l.from(t,r)),l.isBuffer(t))return 0===t.length?-1:v(e,t,n,r,o);if("number"==typeof t)return t&=255,l.TYPED_ARRAY_SUPPORT&&"function"==typeof Uint8Array.prototype.indexOf?o?Uint8Array.prototype.indexOf.call(e,t,n):Uint8Array.prototype.lastIndexOf.call(e,t,n):v(e,[t],n,r,o);throw new TypeError("val must be string, number or Buffer")}function v(e,t,n,r,o){var i,a=1,s=e.length,l=t.length;if(void 0!==r&&("ucs2"===(r=String(r).toLowerCase())||"ucs-2"===r||"utf16le"===r||"utf-16le"===r)){if(e.length<2||t.length<2)return-1;a=2,s/=2,l/=2,n/=2}function c(e,t){return 1===a?e[t]:e.readUInt16BE(t*a)}if(o){var u=-1;for(i=n;i<s;i++)if(c(e,i)===c(t,-1===u?0:i-u)){if(-1===u&&(u=i),i-u+1===l)return u*a}else-1!==u&&(i-=i-u),u=-1}else for(n+l>s&&(n=s-l),i=n;i>=0;i--){for(var p=!0,f=0;f<l;f++)if(c(e,i+f)!==c(t,f)){p=!1;break}if(p)return i}return-1}function b(e,t,n,r){n=Number(n)||0;var o=e.length-n;r?(r=Number(r))>o&&(r=o):r=o;var i=t.length;if(i%2!=0)throw new TypeError("Invalid hex string");r>i/2&&(r=i/2);for(var a=0;a<r;++a){var s=parseInt(t.substr(2*a,2),16);if(isNaN(s))return a;e[n+a]=s}return a}function x(e,t,n,r){return $(U(t,e.length-n),e,n,r)}function w(e,t,n,r){return $(function(e){for(var t=[],n=0;n<e.length;++n)t.push(255&e.charCodeAt(n));return t}(t),e,n,r)}function k(e,t,n,r){return w(e,t,n,r)}function O(e,t,n,r){return $(B(t),e,n,r)}function E(e,t,n,r){return $(function(e,t){for(var n,r,o,i=[],a=0;a<e.length&&!((t-=2)<0);++a)n=e.charCodeAt(a),r=n>>8,o=n%256,i.push(o),i.push(r);return i}(t,e.length-n),e,n,r)}function _(e,t,n){return 0===t&&n===e.length?r.fromByteArray(e):r.fromByteArray(e.slice(t,n))}function S(e,t,n){n=Math.min(e.length,n);for(var r=[],o=t;o<n;){var i,a,s,l,c=e[o],u=null,p=c>239?4:c>223?3:c>191?2:1;if(o+p<=n)switch(p){case 1:c<128&&(u=c);break;case 2:128==(192&(i=e[o+1]))&&(l=(31&c)<<6|63&i)>127&&(u=l);break;case 3:i=e[o+1],a=e[o+2],128==(192&i)&&128==(192&a)&&(l=(15&c)<<12|(63&i)<<6|63&a)>2047&&(l<55296||l>57343)&&(u=l);break;case 4:i=e[o+1],a=e[o+2],s=e[o+3],128==(192&i)&&128==(192&a)&&128==(192&s)&&(l=(15&c)<<18|(63&i)<<12|(63&a)<<6|63&s)>65535&&l<1114112&&(u=l)}null===u?(u=65533,p=1):u>65535&&(u-=65536,r.push(u>>>10&1023|55296),u=56320|1023&u),r.push(u),o+=p}return function(e){var t=e.length;if(t<=4096)return String.fromCharCode.apply(String,e);var n="",r=0;for(;r<t;)n+=String.fromCharCode.apply(String,e.slice(r,r+=4096));return n}(r)}t.Buffer=l,t.SlowBuffer=function(e){+e!=e&&(e=0);return l.alloc(+e)},t.INSPECT_MAX_BYTES=50,l.TYPED_ARRAY_SUPPORT=void 0!==e.TYPED_ARRAY_SUPPORT?e.TYPED_ARRAY_SUPPORT:function(){try{var e=new Uint8Array(1);return e.__proto__={__proto__:Uint8Array.prototype,foo:function(){return 42}},42===e.foo()&&"function"==typeof e.subarray&&0===e.subarray(1,1).byteLength}catch(e){return!1}}(),t.kMaxLength=a(),l.poolSize=8192,l._augment=function(e){return e.__proto__=l.prototype,e},l.from=function(e,t,n){return c(null,e,t,n)},l.TYPED_ARRAY_SUPPORT&&(l.prototype.__proto__=Uint8Array.prototype,l.__proto__=Uint8Array,"undefined"!=typeof Symbol&&Symbol.species&&l[Symbol.species]===l&&Object.defineProperty(l,Symbol.species,{value:null,configurable:!0})),l.alloc=function(e,t,n){return function(e,t,n,r){return u(t),t<=0?s(e,t):void 0!==n?"string"==typeof r?s(e,t).fill(n,r):s(e,t).fill(n):s(e,t)}(null,e,t,n)},l.allocUnsafe=function(e){return p(null,e)},l.allocUnsafeSlow=function(e){return p(null,e)},l.isBuffer=function(e){return!(null==e||!e._isBuffer)},l.compare=function(e,t){if(!l.isBuffer(e)||!l.isBuffer(t))throw new TypeError("Arguments must be Buffers");if(e===t)return 0;for(var n=e.length,r=t.length,o=0,i=Math.min(n,r);o<i;++o)if(e[o]!==t[o]){n=e[o],r=t[o];break}return n<r?-1:r<n?1:0},l.isEncoding=function(e){switch(String(e).toLowerCase()){case"hex":case"utf8":case"utf-8":case"ascii":case"latin1":case"binary":case"base64":case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return!0;default:return!1}},l.concat=function(e,t){if(!i(e))throw new TypeError('"list" argument must be an Array of Buffers');if(0===e.length)return l.alloc(0);var n;if(void 0===t)for(t=0,n=0;n<e.length;++n)t+=e[n].length;var r=l.allocUnsafe(t),o=0;for(n=0;n<e.length;++n){var a=e[n];if(!l.isBuffer(a))throw new TypeError('"list" argument must be an Array of Buffers');a.copy(r,o),o+=a.length}return r},l.byteLength=h,l.prototype._isBuffer=!0,l.prototype.swap16=function(){var e=this.length;if(e%2!=0)throw new RangeError("Buffer size must be a multiple of 16-bits");for(var t=0;t<e;t+=2)g(this,t,t+1);return this},l.prototype.swap32=function(){var e=this.length;if(e%4!=0)throw new RangeError("Buffer size must be a multiple of 32-bits");for(var t=0;t<e;t+=4)g(this,t,t+3),g(this,t+1,t+2);return this},l.prototype.swap64=function(){var e=this.length;if(e%8!=0)throw new RangeError("Buffer size must be a multiple of 64-bits");for(var t=0;t<e;t+=8)g(this,t,t+7),g(this,t+1,t+6),g(this,t+2,t+5),g(this,t+3,t+4);return this},l.prototype.toString=function(){var e=0|this.length;return 0===e?"":0===arguments.length?S(this,0,e):m.apply(this,arguments)},l.prototype.equals=function(e){if(!l.isBuffer(e))throw new TypeError("Argument must be a Buffer");return this===e||0===l.compare(this,e)},l.prototype.inspect=function(){var e="",n=t.INSPECT_MAX_BYTES;return this.length>0&&(e=this.toString("hex",0,n).match(/.{2}/g).join(" "),this.length>n&&(e+=" ... ")),"<Buffer "+e+">"},l.prototype.compare=function(e,t,n,r,o){if(!l.isBuffer(e))throw new TypeError("Argument must be a Buffer");if(void 0===t&&(t=0),void 0===n&&(n=e?e.length:0),void 0===r&&(r=0),void 0===o&&(o=this.length),t<0||n>e.length||r<0||o>this.length)throw new RangeError("out of range index");if(r>=o&&t>=n)return 0;if(r>=o)return-1;if(t>=n)return 1;if(this===e)return 0;for(var i=(o>>>=0)-(r>>>=0),a=(n>>>=0)-(t>>>=0),s=Math.min(i,a),c=this.slice(r,o),u=e.slice(t,n),p=0;p<s;++p)if(c[p]!==u[p]){i=c[p],a=u[p];break}return i<a?-1:a<i?1:0},l.prototype.includes=function(e,t,n){return-1!==this.indexOf(e,t,n)},l.prototype.indexOf=function(e,t,n){return y(this,e,t,n,!0)},l.prototype.lastIndexOf=function(e,t,n){return y(this,e,t,n,!1)},l.prototype.write=function(e,t,n,r){if(void 0===t)r="utf8",n=this.length,t=0;else if(void 0===n&&"string"==typeof t)r=t,n=this.length,t=0;else{if(!isFinite(t))throw new Error("Buffer.write(string, encoding, offset[, length]) is no longer supported");t|=0,isFinite(n)?(n|=0,void 0===r&&(r="utf8")):(r=n,n=void 0)}var o=this.length-t;if((void 0===n||n>o)&&(n=o),e.length>0&&(n<0||t<0)||t>this.length)throw new RangeError("Attempt to write outside buffer bounds");r||(r="utf8");for(var i=!1;;)switch(r){case"hex":return b(this,e,t,n);case"utf8":case"utf-8":return x(this,e,t,n);case"ascii":return w(this,e,t,n);case"latin1":case"binary":return k(this,e,t,n);case"base64":return O(this,e,t,n);case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return E(this,e,t,n);default:if(i)throw new TypeError("Unknown encoding: "+r);r=(""+r).toLowerCase(),i=!0}},l.prototype.toJSON=function(){return{type:"Buffer",data:Array.prototype.slice.call(this._arr||this,0)}};function T(e,t,n){var r="";n=Math.min(e.length,n);for(var o=t;o<n;++o)r+=String.fromCharCode(127&e[o]);return r}function j(e,t,n){var r="";n=Math.min(e.length,n);for(var o=t;o<n;++o)r+=String.fromCharCode(e[o]);return r}function A(e,t,n){var r=e.length;(!t||t<0)&&(t=0),(!n||n<0||n>r)&&(n=r);for(var o="",i=t;i<n;++i)o+=z(e[i]);return o}function C(e,t,n){for(var r=e.slice(t,n),o="",i=0;i<r.length;i+=2)o+=String.fromCharCode(r[i]+256*r[i+1]);return o}function I(e,t,n){if(e%1!=0||e<0)throw new RangeError("offset is not uint");if(e+t>n)throw new RangeError("Trying to access beyond buffer length")}function P(e,t,n,r,o,i){if(!l.isBuffer(e))throw new TypeError('"buffer" argument must be a Buffer instance');if(t>o||t<i)throw new RangeError('"value" argument is out of bounds');if(n+r>e.length)throw new RangeError("Index out of range")}function R(e,t,n,r){t<0&&(t=65535+t+1);for(var o=0,i=Math.min(e.length-n,2);o<i;++o)e[n+o]=(t&255<<8*(r?o:1-o))>>>8*(r?o:1-o)}function N(e,t,n,r){t<0&&(t=4294967295+t+1);for(var o=0,i=Math.min(e.length-n,4);o<i;++o)e[n+o]=t>>>8*(r?o:3-o)&255}function L(e,t,n,r,o,i){if(n+r>e.length)throw new RangeError("Index out of range");if(n<0)throw new RangeError("Index out of range")}function M(e,t,n,r,i){return i||L(e,0,n,4),o.write(e,t,n,r,23,4),n+4}function D(e,t,n,r,i){return i||L(e,0,n,8),o.write(e,t,n,r,52,8),n+8}l.prototype.slice=function(e,t){var n,r=this.length;if((e=~~e)<0?(e+=r)<0&&(e=0):e>r&&(e=r),(t=void 0===t?r:~~t)<0?(t+=r)<0&&(t=0):t>r&&(t=r),t<e&&(t=e),l.TYPED_ARRAY_SUPPORT)(n=this.subarray(e,t)).__proto__=l.prototype;else{var o=t-e;n=new l(o,void 0);for(var i=0;i<o;++i)n[i]=this[i+e]}return n},l.prototype.readUIntLE=function(e,t,n){e|=0,t|=0,n||I(e,t,this.length);for(var r=this[e],o=1,i=0;++i<t&&(o*=256);)r+=this[e+i]*o;return r},l.prototype.readUIntBE=function(e,t,n){e|=0,t|=0,n||I(e,t,this.length);for(var r=this[e+--t],o=1;t>0&&(o*=256);)r+=this[e+--t]*o;return r},l.prototype.readUInt8=function(e,t){return t||I(e,1,this.length),this[e]},l.prototype.readUInt16LE=function(e,t){return t||I(e,2,this.length),this[e]|this[e+1]<<8},l.prototype.readUInt16BE=function(e,t){return t||I(e,2,this.length),this[e]<<8|this[e+1]},l.prototype.readUInt32LE=function(e,t){return t||I(e,4,this.length),(this[e]|this[e+1]<<8|this[e+2]<<16)+16777216*this[e+3]},l.prototype.readUInt32BE=function(e,t){return t||I(e,4,this.length),16777216*this[e]+(this[e+1]<<16|this[e+2]<<8|this[e+3])},l.prototype.readIntLE=function(e,t,n){e|=0,t|=0,n||I(e,t,this.length);for(var r=this[e],o=1,i=0;++i<t&&(o*=256);)r+=this[e+i]*o;return r>=(o*=128)&&(r-=Math.pow(2,8*t)),r},l.prototype.readIntBE=function(e,t,n){e|=0,t|=0,n||I(e,t,this.length);for(var r=t,o=1,i=this[e+--r];r>0&&(o*=256);)i+=this[e+--r]*o;return i>=(o*=128)&&(i-=Math.pow(2,8*t)),i},l.prototype.readInt8=function(e,t){return t||I(e,1,this.length),128&this[e]?-1*(255-this[e]+1):this[e]},l.prototype.readInt16LE=function(e,t){t||I(e,2,this.length);var n=this[e]|this[e+1]<<8;return 32768&n?4294901760|n:n},l.prototype.readInt16BE=function(e,t){t||I(e,2,this.length);var n=this[e+1]|this[e]<<8;return 32768&n?4294901760|n:n},l.prototype.readInt32LE=function(e,t){return t||I(e,4,this.length),this[e]|this[e+1]<<8|this[e+2]<<16|this[e+3]<<24},l.prototype.readInt32BE=function(e,t){return t||I(e,4,this.length),this[e]<<24|this[e+1]<<16|this[e+2]<<8|this[e+3]},l.prototype.readFloatLE=function(e,t){return t||I(e,4,this.length),o.read(this,e,!0,23,4)},l.prototype.readFloatBE=function(e,t){return t||I(e,4,this.length),o.read(this,e,!1,23,4)},l.prototype.readDoubleLE=function(e,t){return t||I(e,8,this.length),o.read(this,e,!0,52,8)},l.prototype.readDoubleBE=function(e,t){return t||I(e,8,this.length),o.read(this,e,!1,52,8)},l.prototype.writeUIntLE=function(e,t,n,r){(e=+e,t|=0,n|=0,r)||P(this,e,t,n,Math.pow(2,8*n)-1,0);var o=1,i=0;for(this[t]=255&e;++i<n&&(o*=256);)this[t+i]=e/o&255;return t+n},l.prototype.writeUIntBE=function(e,t,n,r){(e=+e,t|=0,n|=0,r)||P(this,e,t,n,Math.pow(2,8*n)-1,0);var o=n-1,i=1;for(this[t+o]=255&e;--o>=0&&(i*=256);)this[t+o]=e/i&255;return t+n},l.prototype.writeUInt8=function(e,t,n){return e=+e,t|=0,n||P(this,e,t,1,255,0),l.TYPED_ARRAY_SUPPORT||(e=Math.floor(e)),this[t]=255&e,t+1},l.prototype.writeUInt16LE=function(e,t,n){return e=+e,t|=0,n||P(this,e,t,2,65535,0),l.TYPED_ARRAY_SUPPORT?(this[t]=255&e,this[t+1]=e>>>8):R(this,e,t,!0),t+2},l.prototype.writeUInt16BE=function(e,t,n){return e=+e,t|=0,n||P(this,e,t,2,65535,0),l.TYPED_ARRAY_SUPPORT?(this[t]=e>>>8,this[t+1]=255&e):R(this,e,t,!1),t+2},l.prototype.writeUInt32LE=function(e,t,n){return e=+e,t|=0,n||P(this,e,t,4,4294967295,0),l.TYPED_ARRAY_SUPPORT?(this[t+3]=e>>>24,this[t+2]=e>>>16,this[t+1]=e>>>8,this[t]=255&e):N(this,e,t,!0),t+4},l.prototype.writeUInt32BE=function(e,t,n){return e=+e,t|=0,n||P(this,e,t,4,4294967295,0),l.TYPED_ARRAY_SUPPORT?(this[t]=e>>>24,this[t+1]=e>>>16,this[t+2]=e>>>8,this[t+3]=255&e):N(this,e,t,!1),t+4},l.prototype.writeIntLE=function(e,t,n,r){if(e=+e,t|=0,!r){var o=Math.pow(2,8*n-1);P(this,e,t,n,o-1,-o)}var i=0,a=1,s=0;for(this[t]=255&e;++i<n&&(a*=256);)e<0&&0===s&&0!==this[t+i-1]&&(s=1),this[t+i]=(e/a>>0)-s&255;return t+n},l.prototype.writeIntBE=function(e,t,n,r){if(e=+e,t|=0,!r){var o=Math.pow(2,8*n-1);P(this,e,t,n,o-1,-o)}var i=n-1,a=1,s=0;for(this[t+i]=255&e;--i>=0&&(a*=256);)e<0&&0===s&&0!==this[t+i+1]&&(s=1),this[t+i]=(e/a>>0)-s&255;return t+n},l.prototype.writeInt8=function(e,t,n){return e=+e,t|=0,n||P(this,e,t,1,127,-128),l.TYPED_ARRAY_SUPPORT||(e=Math.floor(e)),e<0&&(e=255+e+1),this[t]=255&e,t+1},l.prototype.writeInt16LE=function(e,t,n){return e=+e,t|=0,n||P(this,e,t,2,32767,-32768),l.TYPED_ARRAY_SUPPORT?(this[t]=255&e,this[t+1]=e>>>8):R(this,e,t,!0),t+2},l.prototype.writeInt16BE=function(e,t,n){return e=+e,t|=0,n||P(this,e,t,2,32767,-32768),l.TYPED_ARRAY_SUPPORT?(this[t]=e>>>8,this[t+1]=255&e):R(this,e,t,!1),t+2},l.prototype.writeInt32LE=function(e,t,n){return e=+e,t|=0,n||P(this,e,t,4,2147483647,-2147483648),l.TYPED_ARRAY_SUPPORT?(this[t]=255&e,this[t+1]=e>>>8,this[t+2]=e>>>16,this[t+3]=e>>>24):N(this,e,t,!0),t+4},l.prototype.writeInt32BE=function(e,t,n){return e=+e,t|=0,n||P(this,e,t,4,2147483647,-2147483648),e<0&&(e=4294967295+e+1),l.TYPED_ARRAY_SUPPORT?(this[t]=e>>>24,this[t+1]=e>>>16,this[t+2]=e>>>8,this[t+3]=255&e):N(this,e,t,!1),t+4},l.prototype.writeFloatLE=function(e,t,n){return M(this,e,t,!0,n)},l.prototype.writeFloatBE=function(e,t,n){return M(this,e,t,!1,n)},l.prototype.writeDoubleLE=function(e,t,n){return D(this,e,t,!0,n)},l.prototype.writeDoubleBE=function(e,t,n){return D(this,e,t,!1,n)},l.prototype.copy=function(e,t,n,r){if(n||(n=0),r||0===r||(r=this.length),t>=e.length&&(t=e.length),t||(t=0),r>0&&r<n&&(r=n),r===n)return 0;if(0===e.length||0===this.length)return 0;if(t<0)throw new RangeError("targetStart out of bounds");if(n<0||n>=this.length)throw new RangeError("sourceStart out of bounds");if(r<0)throw new RangeError("sourceEnd out of bounds");r>this.length&&(r=this.length),e.length-t<r-n&&(r=e.length-t+n);var o,i=r-n;if(this===e&&n<t&&t<r)for(o=i-1;o>=0;--o)e[o+t]=this[o+n];else if(i<1e3||!l.TYPED_ARRAY_SUPPORT)for(o=0;o<i;++o)e[o+t]=this[o+n];else Uint8Array.prototype.set.call(e,this.subarray(n,n+i),t);return i},l.prototype.fill=function(e,t,n,r){if("string"==typeof e){if("string"==typeof t?(r=t,t=0,n=this.length):"string"==typeof n&&(r=n,n=this.length),1===e.length){var o=e.charCodeAt(0);o<256&&(e=o)}if(void 0!==r&&"string"!=typeof r)throw new TypeError("encoding must be a string");if("string"==typeof r&&!l.isEncoding(r))throw new TypeError("Unknown encoding: "+r)}else"number"==typeof e&&(e&=255);if(t<0||this.length<t||this.length<n)throw new RangeError("Out of range index");if(n<=t)return this;var i;if(t>>>=0,n=void 0===n?this.length:n>>>0,e||(e=0),"number"==typeof e)for(i=t;i<n;++i)this[i]=e;else{var a=l.isBuffer(e)?e:U(new l(e,r).toString()),s=a.length;for(i=0;i<n-t;++i)this[i+t]=a[i%s]}return this};var F=/[^+\/0-9A-Za-z-_]/g;function z(e){return e<16?"0"+e.toString(16):e.toString(16)}function U(e,t){var n;t=t||1/0;for(var r=e.length,o=null,i=[],a=0;a<r;++a){if((n=e.charCodeAt(a))>55295&&n<57344){if(!o){if(n>56319){(t-=3)>-1&&i.push(239,191,189);continue}if(a+1===r){(t-=3)>-1&&i.push(239,191,189);continue}o=n;continue}if(n<56320){(t-=3)>-1&&i.push(239,191,189),o=n;continue}n=65536+(o-55296<<10|n-56320)}else o&&(t-=3)>-1&&i.push(239,191,189);if(o=null,n<128){if((t-=1)<0)break;i.push(n)}else if(n<2048){if((t-=2)<0)break;i.push(n>>6|192,63&n|128)}else if(n<65536){if((t-=3)<0)break;i.push(n>>12|224,n>>6&63|128,63&n|128)}else{if(!(n<1114112))throw new Error("Invalid code point");if((t-=4)<0)break;i.push(n>>18|240,n>>12&63|128,n>>6&63|128,63&n|128)}}return i}function B(e){return r.toByteArray(function(e){if((e=function(e){return e.trim?e.trim():e.replace(/^\s+|\s+$/g,"")}(e).replace(F,"")).length<2)return"";for(;e.length%4!=0;)e+="=";return e}(e))}function $(e,t,n,r){for(var o=0;o<r&&!(o+n>=t.length||o>=e.length);++o)t[o+n]=e[o];return o}}).call(this,n(5))},function(e,t,n){var r=n(18),o=n(101),i=n(19),a=n(51),s=Object.defineProperty;t.f=r?s:function(e,t,n){if(i(e),t=a(t,!0),i(n),o)try{return s(e,t,n)}catch(e){}if("get"in n||"set"in n)throw TypeError("Accessors not supported");return"value"in n&&(e[t]=n.value),e}},function(e,t,n){var r=n(3),o=n(33).f,i=n(23),a=n(24),s=n(70),l=n(105),c=n(81);e.exports=function(e,t){var n,u,p,f,d,h=e.target,m=e.global,g=e.stat;if(n=m?r:g?r[h]||s(h,{}):(r[h]||{}).prototype)for(u in t){if(f=t[u],p=e.noTargetGet?(d=o(n,u))&&d.value:n[u],!c(m?u:h+(g?".":"#")+u,e.forced)&&void 0!==p){if(typeof f==typeof p)continue;l(f,p)}(e.sham||p&&p.sham)&&i(f,"sham",!0),a(n,u,f,e)}}},function(e,t,n){var r=n(8);e.exports=!r((function(){return 7!=Object.defineProperty({},1,{get:function(){return 7}})[1]}))},function(e,t,n){var r=n(9);e.exports=function(e){if(!r(e))throw TypeError(String(e)+" is not an object");return e}},function(e,t,n){e.exports=n(227)()},function(e,t,n){"use strict";var r=n(292);function o(e,t,n){if(3===arguments.length)return o.set(e,t,n);if(2===arguments.length)return o.get(e,t);var r=o.bind(o,e);for(var i in o)o.hasOwnProperty(i)&&(r[i]=o[i].bind(r,e));return r}e.exports=o,o.get=function(e,t){for(var n=Array.isArray(t)?t:o.parse(t),r=0;r<n.length;++r){var i=n[r];if("object"!=typeof e||!(i in e))throw new Error("Invalid reference token: "+i);e=e[i]}return e},o.set=function(e,t,n){for(var r=Array.isArray(t)?t:o.parse(t),i=r[0],a=0;a<r.length-1;++a){var s=r[a];"-"===s&&Array.isArray(e)&&(s=e.length),i=r[a+1],s in e||(i.match(/^(\d+|-)$/)?e[s]=[]:e[s]={}),e=e[s]}return"-"===i&&Array.isArray(e)&&(i=e.length),e[i]=n,this},o.remove=function(e,t){var n=Array.isArray(t)?t:o.parse(t),r=n[n.length-1];if(void 0===r)throw new Error('Invalid JSON pointer for remove: "'+t+'"');var i=o.get(e,n.slice(0,-1));if(Array.isArray(i)){var a=+r;if(""===r&&isNaN(a))throw new Error('Invalid array index: "'+r+'"');Array.prototype.splice.call(i,a,1)}else delete i[r]},o.dict=function(e,t){var n={};return o.walk(e,(function(e,t){n[t]=e}),t),n},o.walk=function(e,t,n){var i=[];n=n||function(e){var t=Object.prototype.toString.call(e);return"[object Object]"===t||"[object Array]"===t},function e(a){r(a,(function(r,a){i.push(String(a)),n(r)?e(r):t(r,o.compile(i)),i.pop()}))}(e)},o.has=function(e,t){try{o.get(e,t)}catch(e){return!1}return!0},o.escape=function(e){return e.toString().replace(/~/g,"~0").replace(/\//g,"~1")},o.unescape=function(e){return e.replace(/~1/g,"/").replace(/~0/g,"~")},o.parse=function(e){if(""===e)return[];if("/"!==e.charAt(0))throw new Error("Invalid JSON pointer: "+e);return e.substring(1).split(/\//).map(o.unescape)},o.compile=function(e){return 0===e.length?"":"/"+e.map(o.escape).join("/")}},function(e,t){e.exports=!1},function(e,t,n){var r=n(18),o=n(16),i=n(40);e.exports=r?function(e,t,n){return o.f(e,t,i(1,n))}:function(e,t,n){return e[t]=n,e}},function(e,t,n){var r=n(3),o=n(23),i=n(11),a=n(70),s=n(73),l=n(32),c=l.get,u=l.enforce,p=String(String).split("String");(e.exports=function(e,t,n,s){var l=!!s&&!!s.unsafe,c=!!s&&!!s.enumerable,f=!!s&&!!s.noTargetGet;"function"==typeof n&&("string"!=typeof t||i(n,"name")||o(n,"name",t),u(n).source=p.join("string"==typeof t?t:"")),e!==r?(l?!f&&e[t]&&(c=!0):delete e[t],c?e[t]=n:o(e,t,n)):c?e[t]=n:a(t,n)})(Function.prototype,"toString",(function(){return"function"==typeof this&&c(this).source||s(this)}))},function(e,t,n){"use strict";(function(r){var o=/^win/.test(r.platform),i=/\//g,a=/^(\w{2,}):\/\//i,s=e.exports,l=[/\?/g,"%3F",/\#/g,"%23"],c=[/\%23/g,"#",/\%24/g,"$",/\%26/g,"&",/\%2C/g,",",/\%40/g,"@"];t.parse=n(10).parse,t.resolve=n(10).resolve,t.cwd=function(){return r.browser?location.href:r.cwd()+"/"},t.getProtocol=function(e){var t=a.exec(e);if(t)return t[1].toLowerCase()},t.getExtension=function(e){var t=e.lastIndexOf(".");return t>=0?e.substr(t).toLowerCase():""},t.getHash=function(e){var t=e.indexOf("#");return t>=0?e.substr(t):"#"},t.stripHash=function(e){var t=e.indexOf("#");return t>=0&&(e=e.substr(0,t)),e},t.isHttp=function(e){var t=s.getProtocol(e);return"http"===t||"https"===t||void 0===t&&r.browser},t.isFileSystemPath=function(e){if(r.browser)return!1;var t=s.getProtocol(e);return void 0===t||"file"===t},t.fromFileSystemPath=function(e){o&&(e=e.replace(/\\/g,"/")),e=encodeURI(e);for(var t=0;t<l.length;t+=2)e=e.replace(l[t],l[t+1]);return e},t.toFileSystemPath=function(e,t){e=decodeURI(e);for(var n=0;n<c.length;n+=2)e=e.replace(c[n],c[n+1]);var r="file://"===e.substr(0,7).toLowerCase();return r&&(e="/"===e[7]?e.substr(8):e.substr(7),o&&"/"===e[1]&&(e=e[0]+":"+e.substr(1)),t?e="file:///"+e:(r=!1,e=o?e:"/"+e)),o&&!r&&":\\"===(e=e.replace(i,"\\")).substr(1,2)&&(e=e[0].toUpperCase()+e.substr(1)),e}}).call(this,n(14))},function(e,t,n){var r,o,i;o=[t],void 0===(i="function"==typeof(r=function(e){"use strict";e.__esModule=!0;var t={},n=Object.prototype.hasOwnProperty,r=function(e){var r=arguments.length<=1||void 0===arguments[1]?t:arguments[1],o=r.cache||{};return function(){for(var t=arguments.length,i=Array(t),a=0;a<t;a++)i[a]=arguments[a];var s=String(i[0]);return!1===r.caseSensitive&&(s=s.toLowerCase()),n.call(o,s)?o[s]:o[s]=e.apply(this,i)}},o=function(e,t){if("function"==typeof t){var n=e;e=t,t=n}var r=t&&t.delay||t||0,o=void 0,i=void 0,a=void 0;return function(){for(var t=arguments.length,n=Array(t),s=0;s<t;s++)n[s]=arguments[s];o=n,i=this,a||(a=setTimeout((function(){e.apply(i,o),o=i=a=null}),r))}},i=function(e,t,n){var r=n.value;return{configurable:!0,get:function(){var e=r.bind(this);return Object.defineProperty(this,t,{value:e,configurable:!0,writable:!0}),e}}},a=c(r),s=c(o),l=c((function(e,t){return e.bind(t)}),(function(){return i}));function c(e,t){var n,r=(t=t||e.decorate||(n=e,function(e){return"function"==typeof e?n(e):function(t,r,o){o.value=n(o.value,e,t,r,o)}}))();return function(){for(var n=arguments.length,o=Array(n),i=0;i<n;i++)o[i]=arguments[i];var a=o.length;return(a<2?t:a>2?r:e).apply(void 0,o)}}e.memoize=a,e.debounce=s,e.bind=l,e.default={memoize:a,debounce:s,bind:l}})?r.apply(t,o):r)||(e.exports=i)},function(e,t){var n={}.toString;e.exports=function(e){return n.call(e).slice(8,-1)}},function(e,t,n){var r=n(35),o=n(3),i=function(e){return"function"==typeof e?e:void 0};e.exports=function(e,t){return arguments.length<2?i(r[e])||i(o[e]):r[e]&&r[e][t]||o[e]&&o[e][t]}},function(e,t,n){var r=n(16).f,o=n(11),i=n(4)("toStringTag");e.exports=function(e,t,n){e&&!o(e=n?e:e.prototype,i)&&r(e,i,{configurable:!0,value:t})}},function(e,t,n){"use strict";var r=n(262),o=Array.prototype.slice,i=["name","message","stack"],a=["name","message","description","number","code","fileName","lineNumber","columnNumber","sourceURL","line","column","stack"];function s(t){return function(n,r,i,a){var s=[],p="";"string"==typeof n?(s=o.call(arguments),n=r=void 0):"string"==typeof r?(s=o.call(arguments,1),r=void 0):"string"==typeof i&&(s=o.call(arguments,2)),s.length>0&&(p=e.exports.formatter.apply(null,s)),n&&n.message&&(p+=(p?" \n":"")+n.message);var f=new t(p);return l(f,n),c(f),u(f,r),f}}function l(e,t){!function(e,t){!function(e){if(!m)return!1;var t=Object.getOwnPropertyDescriptor(e,"stack");if(!t)return!1;return"function"==typeof t.get}(e)?e.stack=t?d(e.stack,t.stack):h(e.stack):t?function(e,t){var n=Object.getOwnPropertyDescriptor(e,"stack");Object.defineProperty(e,"stack",{get:function(){return d(n.get.apply(e),t.stack)},enumerable:!1,configurable:!0})}(e,t):(n=e,r=Object.getOwnPropertyDescriptor(n,"stack"),Object.defineProperty(n,"stack",{get:function(){return h(r.get.apply(n))},enumerable:!1,configurable:!0}));var n,r}(e,t),u(e,t)}function c(e){e.toJSON=p,e.inspect=f}function u(e,t){if(t&&"object"==typeof t)for(var n=Object.keys(t),r=0;r<n.length;r++){var o=n[r];if(!(i.indexOf(o)>=0))try{e[o]=t[o]}catch(e){}}}function p(){var e={},t=Object.keys(this);t=t.concat(a);for(var n=0;n<t.length;n++){var r=t[n],o=this[r],i=typeof o;"undefined"!==i&&"function"!==i&&(e[r]=o)}return e}function f(){return JSON.stringify(this,null,2).replace(/\\n/g,"\n")}function d(e,t){return(e=h(e))&&t?e+"\n\n"+t:e||t}function h(e){if(e){var t=e.split("\n");if(t.length<2)return e;for(var n=0;n<t.length;n++){if(t[n].indexOf("onoFactory")>=0)return t.splice(n,1),t.join("\n")}return e}}e.exports=s(Error),e.exports.error=s(Error),e.exports.eval=s(EvalError),e.exports.range=s(RangeError),e.exports.reference=s(ReferenceError),e.exports.syntax=s(SyntaxError),e.exports.type=s(TypeError),e.exports.uri=s(URIError),e.exports.formatter=r;var m=!(!Object.getOwnPropertyDescriptor||!Object.defineProperty||"undefined"!=typeof navigator&&/Android/.test(navigator.userAgent))},function(e,t){"function"==typeof Object.create?e.exports=function(e,t){t&&(e.super_=t,e.prototype=Object.create(t.prototype,{constructor:{value:e,enumerable:!1,writable:!0,configurable:!0}}))}:e.exports=function(e,t){if(t){e.super_=t;var n=function(){};n.prototype=t.prototype,e.prototype=new n,e.prototype.constructor=e}}},function(e,t,n){var r,o,i,a=n(162),s=n(3),l=n(9),c=n(23),u=n(11),p=n(53),f=n(41),d=s.WeakMap;if(a){var h=new d,m=h.get,g=h.has,y=h.set;r=function(e,t){return y.call(h,e,t),t},o=function(e){return m.call(h,e)||{}},i=function(e){return g.call(h,e)}}else{var v=p("state");f[v]=!0,r=function(e,t){return c(e,v,t),t},o=function(e){return u(e,v)?e[v]:{}},i=function(e){return u(e,v)}}e.exports={set:r,get:o,has:i,enforce:function(e){return i(e)?o(e):r(e,{})},getterFor:function(e){return function(t){var n;if(!l(t)||(n=o(t)).type!==e)throw TypeError("Incompatible receiver, "+e+" required");return n}}}},function(e,t,n){var r=n(18),o=n(76),i=n(40),a=n(34),s=n(51),l=n(11),c=n(101),u=Object.getOwnPropertyDescriptor;t.f=r?u:function(e,t){if(e=a(e),t=s(t,!0),c)try{return u(e,t)}catch(e){}if(l(e,t))return i(!o.f.call(e,t),e[t])}},function(e,t,n){var r=n(77),o=n(42);e.exports=function(e){return r(o(e))}},function(e,t,n){var r=n(3);e.exports=r},function(e,t,n){var r=n(74),o=Math.min;e.exports=function(e){return e>0?o(r(e),9007199254740991):0}},function(e,t,n){"use strict";var r=n(47),o=n(56),i=n(6);function a(e,t,n){var r=[];return e.include.forEach((function(e){n=a(e,t,n)})),e[t].forEach((function(e){n.forEach((function(t,n){t.tag===e.tag&&t.kind===e.kind&&r.push(n)})),n.push(e)})),n.filter((function(e,t){return-1===r.indexOf(t)}))}function s(e){this.include=e.include||[],this.implicit=e.implicit||[],this.explicit=e.explicit||[],this.implicit.forEach((function(e){if(e.loadKind&&"scalar"!==e.loadKind)throw new o("There is a non-scalar type in the implicit list of a schema. Implicit resolving of such types is not supported.")})),this.compiledImplicit=a(this,"implicit",[]),this.compiledExplicit=a(this,"explicit",[]),this.compiledTypeMap=function(){var e,t,n={scalar:{},sequence:{},mapping:{},fallback:{}};function r(e){n[e.kind][e.tag]=n.fallback[e.tag]=e}for(e=0,t=arguments.length;e<t;e+=1)arguments[e].forEach(r);return n}(this.compiledImplicit,this.compiledExplicit)}s.DEFAULT=null,s.create=function(){var e,t;switch(arguments.length){case 1:e=s.DEFAULT,t=arguments[0];break;case 2:e=arguments[0],t=arguments[1];break;default:throw new o("Wrong number of arguments for Schema.create function")}if(e=r.toArray(e),t=r.toArray(t),!e.every((function(e){return e instanceof s})))throw new o("Specified list of super schemas (or a single Schema object) contains a non-Schema object.");if(!t.every((function(e){return e instanceof i})))throw new o("Specified list of YAML types (or a single Type object) contains a non-Type object.");return new s({include:e,explicit:t})},e.exports=s},function(e,t,n){"use strict";var r=n(58),o=Object.keys||function(e){var t=[];for(var n in e)t.push(n);return t};e.exports=p;var i=Object.create(n(48));i.inherits=n(31);var a=n(138),s=n(142);i.inherits(p,a);for(var l=o(s.prototype),c=0;c<l.length;c++){var u=l[c];p.prototype[u]||(p.prototype[u]=s.prototype[u])}function p(e){if(!(this instanceof p))return new p(e);a.call(this,e),s.call(this,e),e&&!1===e.readable&&(this.readable=!1),e&&!1===e.writable&&(this.writable=!1),this.allowHalfOpen=!0,e&&!1===e.allowHalfOpen&&(this.allowHalfOpen=!1),this.once("end",f)}function f(){this.allowHalfOpen||this._writableState.ended||r.nextTick(d,this)}function d(e){e.end()}Object.defineProperty(p.prototype,"writableHighWaterMark",{enumerable:!1,get:function(){return this._writableState.highWaterMark}}),Object.defineProperty(p.prototype,"destroyed",{get:function(){return void 0!==this._readableState&&void 0!==this._writableState&&(this._readableState.destroyed&&this._writableState.destroyed)},set:function(e){void 0!==this._readableState&&void 0!==this._writableState&&(this._readableState.destroyed=e,this._writableState.destroyed=e)}}),p.prototype._destroy=function(e,t){this.push(null),this.end(),r.nextTick(t,e)}},function(e,t,n){(function(t){var n=function(e){var t=/\blang(?:uage)?-([\w-]+)\b/i,n=0,r={manual:e.Prism&&e.Prism.manual,disableWorkerMessageHandler:e.Prism&&e.Prism.disableWorkerMessageHandler,util:{encode:function e(t){return t instanceof o?new o(t.type,e(t.content),t.alias):Array.isArray(t)?t.map(e):t.replace(/&/g,"&amp;").replace(/</g,"&lt;").replace(/\u00a0/g," ")},type:function(e){return Object.prototype.toString.call(e).slice(8,-1)},objId:function(e){return e.__id||Object.defineProperty(e,"__id",{value:++n}),e.__id},clone:function e(t,n){var o,i,a=r.util.type(t);switch(n=n||{},a){case"Object":if(i=r.util.objId(t),n[i])return n[i];for(var s in o={},n[i]=o,t)t.hasOwnProperty(s)&&(o[s]=e(t[s],n));return o;case"Array":return i=r.util.objId(t),n[i]?n[i]:(o=[],n[i]=o,t.forEach((function(t,r){o[r]=e(t,n)})),o);default:return t}},getLanguage:function(e){for(;e&&!t.test(e.className);)e=e.parentElement;return e?(e.className.match(t)||[,"none"])[1].toLowerCase():"none"},currentScript:function(){if("undefined"==typeof document)return null;if("currentScript"in document)return document.currentScript;try{throw new Error}catch(r){var e=(/at [^(\r\n]*\((.*):.+:.+\)$/i.exec(r.stack)||[])[1];if(e){var t=document.getElementsByTagName("script");for(var n in t)if(t[n].src==e)return t[n]}return null}}},languages:{extend:function(e,t){var n=r.util.clone(r.languages[e]);for(var o in t)n[o]=t[o];return n},insertBefore:function(e,t,n,o){var i=(o=o||r.languages)[e],a={};for(var s in i)if(i.hasOwnProperty(s)){if(s==t)for(var l in n)n.hasOwnProperty(l)&&(a[l]=n[l]);n.hasOwnProperty(s)||(a[s]=i[s])}var c=o[e];return o[e]=a,r.languages.DFS(r.languages,(function(t,n){n===c&&t!=e&&(this[t]=a)})),a},DFS:function e(t,n,o,i){i=i||{};var a=r.util.objId;for(var s in t)if(t.hasOwnProperty(s)){n.call(t,s,t[s],o||s);var l=t[s],c=r.util.type(l);"Object"!==c||i[a(l)]?"Array"!==c||i[a(l)]||(i[a(l)]=!0,e(l,n,s,i)):(i[a(l)]=!0,e(l,n,null,i))}}},plugins:{},highlightAll:function(e,t){r.highlightAllUnder(document,e,t)},highlightAllUnder:function(e,t,n){var o={callback:n,container:e,selector:'code[class*="language-"], [class*="language-"] code, code[class*="lang-"], [class*="lang-"] code'};r.hooks.run("before-highlightall",o),o.elements=Array.prototype.slice.apply(o.container.querySelectorAll(o.selector)),r.hooks.run("before-all-elements-highlight",o);for(var i,a=0;i=o.elements[a++];)r.highlightElement(i,!0===t,o.callback)},highlightElement:function(n,o,i){var a=r.util.getLanguage(n),s=r.languages[a];n.className=n.className.replace(t,"").replace(/\s+/g," ")+" language-"+a;var l=n.parentNode;l&&"pre"===l.nodeName.toLowerCase()&&(l.className=l.className.replace(t,"").replace(/\s+/g," ")+" language-"+a);var c={element:n,language:a,grammar:s,code:n.textContent};function u(e){c.highlightedCode=e,r.hooks.run("before-insert",c),c.element.innerHTML=c.highlightedCode,r.hooks.run("after-highlight",c),r.hooks.run("complete",c),i&&i.call(c.element)}if(r.hooks.run("before-sanity-check",c),!c.code)return r.hooks.run("complete",c),void(i&&i.call(c.element));if(r.hooks.run("before-highlight",c),c.grammar)if(o&&e.Worker){var p=new Worker(r.filename);p.onmessage=function(e){u(e.data)},p.postMessage(JSON.stringify({language:c.language,code:c.code,immediateClose:!0}))}else u(r.highlight(c.code,c.grammar,c.language));else u(r.util.encode(c.code))},highlight:function(e,t,n){var i={code:e,grammar:t,language:n};return r.hooks.run("before-tokenize",i),i.tokens=r.tokenize(i.code,i.grammar),r.hooks.run("after-tokenize",i),o.stringify(r.util.encode(i.tokens),i.language)},tokenize:function(e,t){var n=t.rest;if(n){for(var l in n)t[l]=n[l];delete t.rest}var c=new i;return a(c,c.head,e),function e(t,n,i,l,c,u,p){for(var f in i)if(i.hasOwnProperty(f)&&i[f]){var d=i[f];d=Array.isArray(d)?d:[d];for(var h=0;h<d.length;++h){if(p&&p==f+","+h)return;var m=d[h],g=m.inside,y=!!m.lookbehind,v=!!m.greedy,b=0,x=m.alias;if(v&&!m.pattern.global){var w=m.pattern.toString().match(/[imsuy]*$/)[0];m.pattern=RegExp(m.pattern.source,w+"g")}m=m.pattern||m;for(var k=l.next,O=c;k!==n.tail;O+=k.value.length,k=k.next){var E=k.value;if(n.length>t.length)return;if(!(E instanceof o)){var _=1;if(v&&k!=n.tail.prev){if(m.lastIndex=O,!(C=m.exec(t)))break;var S=C.index+(y&&C[1]?C[1].length:0),T=C.index+C[0].length,j=O;for(j+=k.value.length;S>=j;)k=k.next,j+=k.value.length;if(j-=k.value.length,O=j,k.value instanceof o)continue;for(var A=k;A!==n.tail&&(j<T||"string"==typeof A.value&&!A.prev.value.greedy);A=A.next)_++,j+=A.value.length;_--,E=t.slice(O,j),C.index-=O}else{m.lastIndex=0;var C=m.exec(E)}if(C){y&&(b=C[1]?C[1].length:0);S=C.index+b,C=C[0].slice(b),T=S+C.length;var I=E.slice(0,S),P=E.slice(T),R=k.prev;I&&(R=a(n,R,I),O+=I.length),s(n,R,_);var N=new o(f,g?r.tokenize(C,g):C,x,C,v);if(k=a(n,R,N),P&&a(n,k,P),_>1&&e(t,n,i,k.prev,O,!0,f+","+h),u)break}else if(u)break}}}}}(e,c,t,c.head,0),function(e){var t=[],n=e.head.next;for(;n!==e.tail;)t.push(n.value),n=n.next;return t}(c)},hooks:{all:{},add:function(e,t){var n=r.hooks.all;n[e]=n[e]||[],n[e].push(t)},run:function(e,t){var n=r.hooks.all[e];if(n&&n.length)for(var o,i=0;o=n[i++];)o(t)}},Token:o};function o(e,t,n,r,o){this.type=e,this.content=t,this.alias=n,this.length=0|(r||"").length,this.greedy=!!o}function i(){var e={value:null,prev:null,next:null},t={value:null,prev:e,next:null};e.next=t,this.head=e,this.tail=t,this.length=0}function a(e,t,n){var r=t.next,o={value:n,prev:t,next:r};return t.next=o,r.prev=o,e.length++,o}function s(e,t,n){for(var r=t.next,o=0;o<n&&r!==e.tail;o++)r=r.next;t.next=r,r.prev=t,e.length-=o}if(e.Prism=r,o.stringify=function e(t,n){if("string"==typeof t)return t;if(Array.isArray(t)){var o="";return t.forEach((function(t){o+=e(t,n)})),o}var i={type:t.type,content:e(t.content,n),tag:"span",classes:["token",t.type],attributes:{},language:n},a=t.alias;a&&(Array.isArray(a)?Array.prototype.push.apply(i.classes,a):i.classes.push(a)),r.hooks.run("wrap",i);var s="";for(var l in i.attributes)s+=" "+l+'="'+(i.attributes[l]||"").replace(/"/g,"&quot;")+'"';return"<"+i.tag+' class="'+i.classes.join(" ")+'"'+s+">"+i.content+"</"+i.tag+">"},!e.document)return e.addEventListener?(r.disableWorkerMessageHandler||e.addEventListener("message",(function(t){var n=JSON.parse(t.data),o=n.language,i=n.code,a=n.immediateClose;e.postMessage(r.highlight(i,r.languages[o],o)),a&&e.close()}),!1),r):r;var l=r.util.currentScript();function c(){r.manual||r.highlightAll()}if(l&&(r.filename=l.src,l.hasAttribute("data-manual")&&(r.manual=!0)),!r.manual){var u=document.readyState;"loading"===u||"interactive"===u&&l&&l.defer?document.addEventListener("DOMContentLoaded",c):window.requestAnimationFrame?window.requestAnimationFrame(c):window.setTimeout(c,16)}return r}("undefined"!=typeof window?window:"undefined"!=typeof WorkerGlobalScope&&self instanceof WorkerGlobalScope?self:{});e.exports&&(e.exports=n),void 0!==t&&(t.Prism=n),n.languages.markup={comment:/<!--[\s\S]*?-->/,prolog:/<\?[\s\S]+?\?>/,doctype:{pattern:/<!DOCTYPE(?:[^>"'[\]]|"[^"]*"|'[^']*')+(?:\[(?:(?!<!--)[^"'\]]|"[^"]*"|'[^']*'|<!--[\s\S]*?-->)*\]\s*)?>/i,greedy:!0},cdata:/<!\[CDATA\[[\s\S]*?]]>/i,tag:{pattern:/<\/?(?!\d)[^\s>\/=$<%]+(?:\s(?:\s*[^\s>\/=]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s'">=]+(?=[\s>]))|(?=[\s/>])))+)?\s*\/?>/i,greedy:!0,inside:{tag:{pattern:/^<\/?[^\s>\/]+/i,inside:{punctuation:/^<\/?/,namespace:/^[^\s>\/:]+:/}},"attr-value":{pattern:/=\s*(?:"[^"]*"|'[^']*'|[^\s'">=]+)/i,inside:{punctuation:[/^=/,{pattern:/^(\s*)["']|["']$/,lookbehind:!0}]}},punctuation:/\/?>/,"attr-name":{pattern:/[^\s>\/]+/,inside:{namespace:/^[^\s>\/:]+:/}}}},entity:/&#?[\da-z]{1,8};/i},n.languages.markup.tag.inside["attr-value"].inside.entity=n.languages.markup.entity,n.hooks.add("wrap",(function(e){"entity"===e.type&&(e.attributes.title=e.content.replace(/&amp;/,"&"))})),Object.defineProperty(n.languages.markup.tag,"addInlined",{value:function(e,t){var r={};r["language-"+t]={pattern:/(^<!\[CDATA\[)[\s\S]+?(?=\]\]>$)/i,lookbehind:!0,inside:n.languages[t]},r.cdata=/^<!\[CDATA\[|\]\]>$/i;var o={"included-cdata":{pattern:/<!\[CDATA\[[\s\S]*?\]\]>/i,inside:r}};o["language-"+t]={pattern:/[\s\S]+/,inside:n.languages[t]};var i={};i[e]={pattern:RegExp(/(<__[\s\S]*?>)(?:<!\[CDATA\[[\s\S]*?\]\]>\s*|[\s\S])*?(?=<\/__>)/.source.replace(/__/g,(function(){return e})),"i"),lookbehind:!0,greedy:!0,inside:o},n.languages.insertBefore("markup","cdata",i)}}),n.languages.xml=n.languages.extend("markup",{}),n.languages.html=n.languages.markup,n.languages.mathml=n.languages.markup,n.languages.svg=n.languages.markup,function(e){var t=/("|')(?:\\(?:\r\n|[\s\S])|(?!\1)[^\\\r\n])*\1/;e.languages.css={comment:/\/\*[\s\S]*?\*\//,atrule:{pattern:/@[\w-]+[\s\S]*?(?:;|(?=\s*\{))/,inside:{rule:/^@[\w-]+/,"selector-function-argument":{pattern:/(\bselector\s*\((?!\s*\))\s*)(?:[^()]|\((?:[^()]|\([^()]*\))*\))+?(?=\s*\))/,lookbehind:!0,alias:"selector"}}},url:{pattern:RegExp("url\\((?:"+t.source+"|[^\n\r()]*)\\)","i"),greedy:!0,inside:{function:/^url/i,punctuation:/^\(|\)$/}},selector:RegExp("[^{}\\s](?:[^{};\"']|"+t.source+")*?(?=\\s*\\{)"),string:{pattern:t,greedy:!0},property:/[-_a-z\xA0-\uFFFF][-\w\xA0-\uFFFF]*(?=\s*:)/i,important:/!important\b/i,function:/[-a-z0-9]+(?=\()/i,punctuation:/[(){};:,]/},e.languages.css.atrule.inside.rest=e.languages.css;var n=e.languages.markup;n&&(n.tag.addInlined("style","css"),e.languages.insertBefore("inside","attr-value",{"style-attr":{pattern:/\s*style=("|')(?:\\[\s\S]|(?!\1)[^\\])*\1/i,inside:{"attr-name":{pattern:/^\s*style/i,inside:n.tag.inside},punctuation:/^\s*=\s*['"]|['"]\s*$/,"attr-value":{pattern:/.+/i,inside:e.languages.css}},alias:"language-css"}},n.tag))}(n),n.languages.clike={comment:[{pattern:/(^|[^\\])\/\*[\s\S]*?(?:\*\/|$)/,lookbehind:!0},{pattern:/(^|[^\\:])\/\/.*/,lookbehind:!0,greedy:!0}],string:{pattern:/(["'])(?:\\(?:\r\n|[\s\S])|(?!\1)[^\\\r\n])*\1/,greedy:!0},"class-name":{pattern:/(\b(?:class|interface|extends|implements|trait|instanceof|new)\s+|\bcatch\s+\()[\w.\\]+/i,lookbehind:!0,inside:{punctuation:/[.\\]/}},keyword:/\b(?:if|else|while|do|for|return|in|instanceof|function|new|try|throw|catch|finally|null|break|continue)\b/,boolean:/\b(?:true|false)\b/,function:/\w+(?=\()/,number:/\b0x[\da-f]+\b|(?:\b\d+\.?\d*|\B\.\d+)(?:e[+-]?\d+)?/i,operator:/[<>]=?|[!=]=?=?|--?|\+\+?|&&?|\|\|?|[?*/~^%]/,punctuation:/[{}[\];(),.:]/},n.languages.javascript=n.languages.extend("clike",{"class-name":[n.languages.clike["class-name"],{pattern:/(^|[^$\w\xA0-\uFFFF])[_$A-Z\xA0-\uFFFF][$\w\xA0-\uFFFF]*(?=\.(?:prototype|constructor))/,lookbehind:!0}],keyword:[{pattern:/((?:^|})\s*)(?:catch|finally)\b/,lookbehind:!0},{pattern:/(^|[^.]|\.\.\.\s*)\b(?:as|async(?=\s*(?:function\b|\(|[$\w\xA0-\uFFFF]|$))|await|break|case|class|const|continue|debugger|default|delete|do|else|enum|export|extends|for|from|function|get|if|implements|import|in|instanceof|interface|let|new|null|of|package|private|protected|public|return|set|static|super|switch|this|throw|try|typeof|undefined|var|void|while|with|yield)\b/,lookbehind:!0}],number:/\b(?:(?:0[xX](?:[\dA-Fa-f](?:_[\dA-Fa-f])?)+|0[bB](?:[01](?:_[01])?)+|0[oO](?:[0-7](?:_[0-7])?)+)n?|(?:\d(?:_\d)?)+n|NaN|Infinity)\b|(?:\b(?:\d(?:_\d)?)+\.?(?:\d(?:_\d)?)*|\B\.(?:\d(?:_\d)?)+)(?:[Ee][+-]?(?:\d(?:_\d)?)+)?/,function:/#?[_$a-zA-Z\xA0-\uFFFF][$\w\xA0-\uFFFF]*(?=\s*(?:\.\s*(?:apply|bind|call)\s*)?\()/,operator:/--|\+\+|\*\*=?|=>|&&|\|\||[!=]==|<<=?|>>>?=?|[-+*/%&|^!=<>]=?|\.{3}|\?[.?]?|[~:]/}),n.languages.javascript["class-name"][0].pattern=/(\b(?:class|interface|extends|implements|instanceof|new)\s+)[\w.\\]+/,n.languages.insertBefore("javascript","keyword",{regex:{pattern:/((?:^|[^$\w\xA0-\uFFFF."'\])\s])\s*)\/(?:\[(?:[^\]\\\r\n]|\\.)*]|\\.|[^/\\\[\r\n])+\/[gimyus]{0,6}(?=(?:\s|\/\*[\s\S]*?\*\/)*(?:$|[\r\n,.;:})\]]|\/\/))/,lookbehind:!0,greedy:!0},"function-variable":{pattern:/#?[_$a-zA-Z\xA0-\uFFFF][$\w\xA0-\uFFFF]*(?=\s*[=:]\s*(?:async\s*)?(?:\bfunction\b|(?:\((?:[^()]|\([^()]*\))*\)|[_$a-zA-Z\xA0-\uFFFF][$\w\xA0-\uFFFF]*)\s*=>))/,alias:"function"},parameter:[{pattern:/(function(?:\s+[_$A-Za-z\xA0-\uFFFF][$\w\xA0-\uFFFF]*)?\s*\(\s*)(?!\s)(?:[^()]|\([^()]*\))+?(?=\s*\))/,lookbehind:!0,inside:n.languages.javascript},{pattern:/[_$a-z\xA0-\uFFFF][$\w\xA0-\uFFFF]*(?=\s*=>)/i,inside:n.languages.javascript},{pattern:/(\(\s*)(?!\s)(?:[^()]|\([^()]*\))+?(?=\s*\)\s*=>)/,lookbehind:!0,inside:n.languages.javascript},{pattern:/((?:\b|\s|^)(?!(?:as|async|await|break|case|catch|class|const|continue|debugger|default|delete|do|else|enum|export|extends|finally|for|from|function|get|if|implements|import|in|instanceof|interface|let|new|null|of|package|private|protected|public|return|set|static|super|switch|this|throw|try|typeof|undefined|var|void|while|with|yield)(?![$\w\xA0-\uFFFF]))(?:[_$A-Za-z\xA0-\uFFFF][$\w\xA0-\uFFFF]*\s*)\(\s*)(?!\s)(?:[^()]|\([^()]*\))+?(?=\s*\)\s*\{)/,lookbehind:!0,inside:n.languages.javascript}],constant:/\b[A-Z](?:[A-Z_]|\dx?)*\b/}),n.languages.insertBefore("javascript","string",{"template-string":{pattern:/`(?:\\[\s\S]|\${(?:[^{}]|{(?:[^{}]|{[^}]*})*})+}|(?!\${)[^\\`])*`/,greedy:!0,inside:{"template-punctuation":{pattern:/^`|`$/,alias:"string"},interpolation:{pattern:/((?:^|[^\\])(?:\\{2})*)\${(?:[^{}]|{(?:[^{}]|{[^}]*})*})+}/,lookbehind:!0,inside:{"interpolation-punctuation":{pattern:/^\${|}$/,alias:"punctuation"},rest:n.languages.javascript}},string:/[\s\S]+/}}}),n.languages.markup&&n.languages.markup.tag.addInlined("script","javascript"),n.languages.js=n.languages.javascript,"undefined"!=typeof self&&self.Prism&&self.document&&document.querySelector&&(self.Prism.fileHighlight=function(e){e=e||document;var t={js:"javascript",py:"python",rb:"ruby",ps1:"powershell",psm1:"powershell",sh:"bash",bat:"batch",h:"c",tex:"latex"};Array.prototype.slice.call(e.querySelectorAll("pre[data-src]")).forEach((function(e){if(!e.hasAttribute("data-src-loaded")){for(var r,o=e.getAttribute("data-src"),i=e,a=/\blang(?:uage)?-([\w-]+)\b/i;i&&!a.test(i.className);)i=i.parentNode;if(i&&(r=(e.className.match(a)||[,""])[1]),!r){var s=(o.match(/\.(\w+)$/)||[,""])[1];r=t[s]||s}var l=document.createElement("code");l.className="language-"+r,e.textContent="",l.textContent="Loading…",e.appendChild(l);var c=new XMLHttpRequest;c.open("GET",o,!0),c.onreadystatechange=function(){4==c.readyState&&(c.status<400&&c.responseText?(l.textContent=c.responseText,n.highlightElement(l),e.setAttribute("data-src-loaded","")):c.status>=400?l.textContent="✖ Error "+c.status+" while fetching file: "+c.statusText:l.textContent="✖ Error: File does not exist or is empty")},c.send(null)}}))},document.addEventListener("DOMContentLoaded",(function(){self.Prism.fileHighlight()})))}).call(this,n(5))},function(e,t){e.exports=function(e,t){return{enumerable:!(1&e),configurable:!(2&e),writable:!(4&e),value:t}}},function(e,t){e.exports={}},function(e,t){e.exports=function(e){if(null==e)throw TypeError("Can't call method on "+e);return e}},function(e,t,n){var r=n(42);e.exports=function(e){return Object(r(e))}},function(e,t){e.exports={}},function(e,t){e.exports=function(e){if("function"!=typeof e)throw TypeError(String(e)+" is not a function");return e}},function(e,t,n){var r=n(45);e.exports=function(e,t,n){if(r(e),void 0===t)return e;switch(n){case 0:return function(){return e.call(t)};case 1:return function(n){return e.call(t,n)};case 2:return function(n,r){return e.call(t,n,r)};case 3:return function(n,r,o){return e.call(t,n,r,o)}}return function(){return e.apply(t,arguments)}}},function(e,t,n){"use strict";function r(e){return null==e}e.exports.isNothing=r,e.exports.isObject=function(e){return"object"==typeof e&&null!==e},e.exports.toArray=function(e){return Array.isArray(e)?e:r(e)?[]:[e]},e.exports.repeat=function(e,t){var n,r="";for(n=0;n<t;n+=1)r+=e;return r},e.exports.isNegativeZero=function(e){return 0===e&&Number.NEGATIVE_INFINITY===1/e},e.exports.extend=function(e,t){var n,r,o,i;if(t)for(n=0,r=(i=Object.keys(t)).length;n<r;n+=1)e[o=i[n]]=t[o];return e}},function(e,t,n){(function(e){function n(e){return Object.prototype.toString.call(e)}t.isArray=function(e){return Array.isArray?Array.isArray(e):"[object Array]"===n(e)},t.isBoolean=function(e){return"boolean"==typeof e},t.isNull=function(e){return null===e},t.isNullOrUndefined=function(e){return null==e},t.isNumber=function(e){return"number"==typeof e},t.isString=function(e){return"string"==typeof e},t.isSymbol=function(e){return"symbol"==typeof e},t.isUndefined=function(e){return void 0===e},t.isRegExp=function(e){return"[object RegExp]"===n(e)},t.isObject=function(e){return"object"==typeof e&&null!==e},t.isDate=function(e){return"[object Date]"===n(e)},t.isError=function(e){return"[object Error]"===n(e)||e instanceof Error},t.isFunction=function(e){return"function"==typeof e},t.isPrimitive=function(e){return null===e||"boolean"==typeof e||"number"==typeof e||"string"==typeof e||"symbol"==typeof e||void 0===e},t.isBuffer=e.isBuffer}).call(this,n(15).Buffer)},function(e,t,n){(function(e){function n(e,t){for(var n=0,r=e.length-1;r>=0;r--){var o=e[r];"."===o?e.splice(r,1):".."===o?(e.splice(r,1),n++):n&&(e.splice(r,1),n--)}if(t)for(;n--;n)e.unshift("..");return e}function r(e,t){if(e.filter)return e.filter(t);for(var n=[],r=0;r<e.length;r++)t(e[r],r,e)&&n.push(e[r]);return n}t.resolve=function(){for(var t="",o=!1,i=arguments.length-1;i>=-1&&!o;i--){var a=i>=0?arguments[i]:e.cwd();if("string"!=typeof a)throw new TypeError("Arguments to path.resolve must be strings");a&&(t=a+"/"+t,o="/"===a.charAt(0))}return(o?"/":"")+(t=n(r(t.split("/"),(function(e){return!!e})),!o).join("/"))||"."},t.normalize=function(e){var i=t.isAbsolute(e),a="/"===o(e,-1);return(e=n(r(e.split("/"),(function(e){return!!e})),!i).join("/"))||i||(e="."),e&&a&&(e+="/"),(i?"/":"")+e},t.isAbsolute=function(e){return"/"===e.charAt(0)},t.join=function(){var e=Array.prototype.slice.call(arguments,0);return t.normalize(r(e,(function(e,t){if("string"!=typeof e)throw new TypeError("Arguments to path.join must be strings");return e})).join("/"))},t.relative=function(e,n){function r(e){for(var t=0;t<e.length&&""===e[t];t++);for(var n=e.length-1;n>=0&&""===e[n];n--);return t>n?[]:e.slice(t,n-t+1)}e=t.resolve(e).substr(1),n=t.resolve(n).substr(1);for(var o=r(e.split("/")),i=r(n.split("/")),a=Math.min(o.length,i.length),s=a,l=0;l<a;l++)if(o[l]!==i[l]){s=l;break}var c=[];for(l=s;l<o.length;l++)c.push("..");return(c=c.concat(i.slice(s))).join("/")},t.sep="/",t.delimiter=":",t.dirname=function(e){if("string"!=typeof e&&(e+=""),0===e.length)return".";for(var t=e.charCodeAt(0),n=47===t,r=-1,o=!0,i=e.length-1;i>=1;--i)if(47===(t=e.charCodeAt(i))){if(!o){r=i;break}}else o=!1;return-1===r?n?"/":".":n&&1===r?"/":e.slice(0,r)},t.basename=function(e,t){var n=function(e){"string"!=typeof e&&(e+="");var t,n=0,r=-1,o=!0;for(t=e.length-1;t>=0;--t)if(47===e.charCodeAt(t)){if(!o){n=t+1;break}}else-1===r&&(o=!1,r=t+1);return-1===r?"":e.slice(n,r)}(e);return t&&n.substr(-1*t.length)===t&&(n=n.substr(0,n.length-t.length)),n},t.extname=function(e){"string"!=typeof e&&(e+="");for(var t=-1,n=0,r=-1,o=!0,i=0,a=e.length-1;a>=0;--a){var s=e.charCodeAt(a);if(47!==s)-1===r&&(o=!1,r=a+1),46===s?-1===t?t=a:1!==i&&(i=1):-1!==t&&(i=-1);else if(!o){n=a+1;break}}return-1===t||-1===r||0===i||1===i&&t===r-1&&t===n+1?"":e.slice(t,r)};var o="b"==="ab".substr(-1)?function(e,t,n){return e.substr(t,n)}:function(e,t,n){return t<0&&(t=e.length+t),e.substr(t,n)}}).call(this,n(14))},function(e,t,n){(function(t){!function(t){"use strict";var n={newline:/^\n+/,code:/^( {4}[^\n]+\n*)+/,fences:/^ {0,3}(`{3,}|~{3,})([^`~\n]*)\n(?:|([\s\S]*?)\n)(?: {0,3}\1[~`]* *(?:\n+|$)|$)/,hr:/^ {0,3}((?:- *){3,}|(?:_ *){3,}|(?:\* *){3,})(?:\n+|$)/,heading:/^ {0,3}(#{1,6}) +([^\n]*?)(?: +#+)? *(?:\n+|$)/,blockquote:/^( {0,3}> ?(paragraph|[^\n]*)(?:\n|$))+/,list:/^( {0,3})(bull) [\s\S]+?(?:hr|def|\n{2,}(?! )(?!\1bull )\n*|\s*$)/,html:"^ {0,3}(?:<(script|pre|style)[\\s>][\\s\\S]*?(?:</\\1>[^\\n]*\\n+|$)|comment[^\\n]*(\\n+|$)|<\\?[\\s\\S]*?\\?>\\n*|<![A-Z][\\s\\S]*?>\\n*|<!\\[CDATA\\[[\\s\\S]*?\\]\\]>\\n*|</?(tag)(?: +|\\n|/?>)[\\s\\S]*?(?:\\n{2,}|$)|<(?!script|pre|style)([a-z][\\w-]*)(?:attribute)*? */?>(?=[ \\t]*(?:\\n|$))[\\s\\S]*?(?:\\n{2,}|$)|</(?!script|pre|style)[a-z][\\w-]*\\s*>(?=[ \\t]*(?:\\n|$))[\\s\\S]*?(?:\\n{2,}|$))",def:/^ {0,3}\[(label)\]: *\n? *<?([^\s>]+)>?(?:(?: +\n? *| *\n *)(title))? *(?:\n+|$)/,nptable:g,table:g,lheading:/^([^\n]+)\n {0,3}(=+|-+) *(?:\n+|$)/,_paragraph:/^([^\n]+(?:\n(?!hr|heading|lheading|blockquote|fences|list|html)[^\n]+)*)/,text:/^[^\n]+/};function r(e){this.tokens=[],this.tokens.links=Object.create(null),this.options=e||k.defaults,this.rules=n.normal,this.options.pedantic?this.rules=n.pedantic:this.options.gfm&&(this.rules=n.gfm)}n._label=/(?!\s*\])(?:\\[\[\]]|[^\[\]])+/,n._title=/(?:"(?:\\"?|[^"\\])*"|'[^'\n]*(?:\n[^'\n]+)*\n?'|\([^()]*\))/,n.def=f(n.def).replace("label",n._label).replace("title",n._title).getRegex(),n.bullet=/(?:[*+-]|\d{1,9}\.)/,n.item=/^( *)(bull) ?[^\n]*(?:\n(?!\1bull ?)[^\n]*)*/,n.item=f(n.item,"gm").replace(/bull/g,n.bullet).getRegex(),n.list=f(n.list).replace(/bull/g,n.bullet).replace("hr","\\n+(?=\\1?(?:(?:- *){3,}|(?:_ *){3,}|(?:\\* *){3,})(?:\\n+|$))").replace("def","\\n+(?="+n.def.source+")").getRegex(),n._tag="address|article|aside|base|basefont|blockquote|body|caption|center|col|colgroup|dd|details|dialog|dir|div|dl|dt|fieldset|figcaption|figure|footer|form|frame|frameset|h[1-6]|head|header|hr|html|iframe|legend|li|link|main|menu|menuitem|meta|nav|noframes|ol|optgroup|option|p|param|section|source|summary|table|tbody|td|tfoot|th|thead|title|tr|track|ul",n._comment=/<!--(?!-?>)[\s\S]*?-->/,n.html=f(n.html,"i").replace("comment",n._comment).replace("tag",n._tag).replace("attribute",/ +[a-zA-Z:_][\w.:-]*(?: *= *"[^"\n]*"| *= *'[^'\n]*'| *= *[^\s"'=<>`]+)?/).getRegex(),n.paragraph=f(n._paragraph).replace("hr",n.hr).replace("heading"," {0,3}#{1,6} +").replace("|lheading","").replace("blockquote"," {0,3}>").replace("fences"," {0,3}(?:`{3,}|~{3,})[^`\\n]*\\n").replace("list"," {0,3}(?:[*+-]|1[.)]) ").replace("html","</?(?:tag)(?: +|\\n|/?>)|<(?:script|pre|style|!--)").replace("tag",n._tag).getRegex(),n.blockquote=f(n.blockquote).replace("paragraph",n.paragraph).getRegex(),n.normal=y({},n),n.gfm=y({},n.normal,{nptable:/^ *([^|\n ].*\|.*)\n *([-:]+ *\|[-| :]*)(?:\n((?:.*[^>\n ].*(?:\n|$))*)\n*|$)/,table:/^ *\|(.+)\n *\|?( *[-:]+[-| :]*)(?:\n((?: *[^>\n ].*(?:\n|$))*)\n*|$)/}),n.pedantic=y({},n.normal,{html:f("^ *(?:comment *(?:\\n|\\s*$)|<(tag)[\\s\\S]+?</\\1> *(?:\\n{2,}|\\s*$)|<tag(?:\"[^\"]*\"|'[^']*'|\\s[^'\"/>\\s]*)*?/?> *(?:\\n{2,}|\\s*$))").replace("comment",n._comment).replace(/tag/g,"(?!(?:a|em|strong|small|s|cite|q|dfn|abbr|data|time|code|var|samp|kbd|sub|sup|i|b|u|mark|ruby|rt|rp|bdi|bdo|span|br|wbr|ins|del|img)\\b)\\w+(?!:|[^\\w\\s@]*@)\\b").getRegex(),def:/^ *\[([^\]]+)\]: *<?([^\s>]+)>?(?: +(["(][^\n]+[")]))? *(?:\n+|$)/,heading:/^ *(#{1,6}) *([^\n]+?) *(?:#+ *)?(?:\n+|$)/,fences:g,paragraph:f(n.normal._paragraph).replace("hr",n.hr).replace("heading"," *#{1,6} *[^\n]").replace("lheading",n.lheading).replace("blockquote"," {0,3}>").replace("|fences","").replace("|list","").replace("|html","").getRegex()}),r.rules=n,r.lex=function(e,t){return new r(t).lex(e)},r.prototype.lex=function(e){return e=e.replace(/\r\n|\r/g,"\n").replace(/\t/g,"    ").replace(/\u00a0/g," ").replace(/\u2424/g,"\n"),this.token(e,!0)},r.prototype.token=function(e,t){var r,o,i,a,s,l,c,p,f,d,h,m,g,y,x,w;for(e=e.replace(/^ +$/gm,"");e;)if((i=this.rules.newline.exec(e))&&(e=e.substring(i[0].length),i[0].length>1&&this.tokens.push({type:"space"})),i=this.rules.code.exec(e)){var k=this.tokens[this.tokens.length-1];e=e.substring(i[0].length),k&&"paragraph"===k.type?k.text+="\n"+i[0].trimRight():(i=i[0].replace(/^ {4}/gm,""),this.tokens.push({type:"code",codeBlockStyle:"indented",text:this.options.pedantic?i:b(i,"\n")}))}else if(i=this.rules.fences.exec(e))e=e.substring(i[0].length),this.tokens.push({type:"code",lang:i[2]?i[2].trim():i[2],text:i[3]||""});else if(i=this.rules.heading.exec(e))e=e.substring(i[0].length),this.tokens.push({type:"heading",depth:i[1].length,text:i[2]});else if((i=this.rules.nptable.exec(e))&&(l={type:"table",header:v(i[1].replace(/^ *| *\| *$/g,"")),align:i[2].replace(/^ *|\| *$/g,"").split(/ *\| */),cells:i[3]?i[3].replace(/\n$/,"").split("\n"):[]}).header.length===l.align.length){for(e=e.substring(i[0].length),h=0;h<l.align.length;h++)/^ *-+: *$/.test(l.align[h])?l.align[h]="right":/^ *:-+: *$/.test(l.align[h])?l.align[h]="center":/^ *:-+ *$/.test(l.align[h])?l.align[h]="left":l.align[h]=null;for(h=0;h<l.cells.length;h++)l.cells[h]=v(l.cells[h],l.header.length);this.tokens.push(l)}else if(i=this.rules.hr.exec(e))e=e.substring(i[0].length),this.tokens.push({type:"hr"});else if(i=this.rules.blockquote.exec(e))e=e.substring(i[0].length),this.tokens.push({type:"blockquote_start"}),i=i[0].replace(/^ *> ?/gm,""),this.token(i,t),this.tokens.push({type:"blockquote_end"});else if(i=this.rules.list.exec(e)){for(e=e.substring(i[0].length),c={type:"list_start",ordered:y=(a=i[2]).length>1,start:y?+a:"",loose:!1},this.tokens.push(c),p=[],r=!1,g=(i=i[0].match(this.rules.item)).length,h=0;h<g;h++)d=(l=i[h]).length,~(l=l.replace(/^ *([*+-]|\d+\.) */,"")).indexOf("\n ")&&(d-=l.length,l=this.options.pedantic?l.replace(/^ {1,4}/gm,""):l.replace(new RegExp("^ {1,"+d+"}","gm"),"")),h!==g-1&&(s=n.bullet.exec(i[h+1])[0],(a.length>1?1===s.length:s.length>1||this.options.smartLists&&s!==a)&&(e=i.slice(h+1).join("\n")+e,h=g-1)),o=r||/\n\n(?!\s*$)/.test(l),h!==g-1&&(r="\n"===l.charAt(l.length-1),o||(o=r)),o&&(c.loose=!0),w=void 0,(x=/^\[[ xX]\] /.test(l))&&(w=" "!==l[1],l=l.replace(/^\[[ xX]\] +/,"")),f={type:"list_item_start",task:x,checked:w,loose:o},p.push(f),this.tokens.push(f),this.token(l,!1),this.tokens.push({type:"list_item_end"});if(c.loose)for(g=p.length,h=0;h<g;h++)p[h].loose=!0;this.tokens.push({type:"list_end"})}else if(i=this.rules.html.exec(e))e=e.substring(i[0].length),this.tokens.push({type:this.options.sanitize?"paragraph":"html",pre:!this.options.sanitizer&&("pre"===i[1]||"script"===i[1]||"style"===i[1]),text:this.options.sanitize?this.options.sanitizer?this.options.sanitizer(i[0]):u(i[0]):i[0]});else if(t&&(i=this.rules.def.exec(e)))e=e.substring(i[0].length),i[3]&&(i[3]=i[3].substring(1,i[3].length-1)),m=i[1].toLowerCase().replace(/\s+/g," "),this.tokens.links[m]||(this.tokens.links[m]={href:i[2],title:i[3]});else if((i=this.rules.table.exec(e))&&(l={type:"table",header:v(i[1].replace(/^ *| *\| *$/g,"")),align:i[2].replace(/^ *|\| *$/g,"").split(/ *\| */),cells:i[3]?i[3].replace(/\n$/,"").split("\n"):[]}).header.length===l.align.length){for(e=e.substring(i[0].length),h=0;h<l.align.length;h++)/^ *-+: *$/.test(l.align[h])?l.align[h]="right":/^ *:-+: *$/.test(l.align[h])?l.align[h]="center":/^ *:-+ *$/.test(l.align[h])?l.align[h]="left":l.align[h]=null;for(h=0;h<l.cells.length;h++)l.cells[h]=v(l.cells[h].replace(/^ *\| *| *\| *$/g,""),l.header.length);this.tokens.push(l)}else if(i=this.rules.lheading.exec(e))e=e.substring(i[0].length),this.tokens.push({type:"heading",depth:"="===i[2].charAt(0)?1:2,text:i[1]});else if(t&&(i=this.rules.paragraph.exec(e)))e=e.substring(i[0].length),this.tokens.push({type:"paragraph",text:"\n"===i[1].charAt(i[1].length-1)?i[1].slice(0,-1):i[1]});else if(i=this.rules.text.exec(e))e=e.substring(i[0].length),this.tokens.push({type:"text",text:i[0]});else if(e)throw new Error("Infinite loop on byte: "+e.charCodeAt(0));return this.tokens};var o={escape:/^\\([!"#$%&'()*+,\-./:;<=>?@\[\]\\^_`{|}~])/,autolink:/^<(scheme:[^\s\x00-\x1f<>]*|email)>/,url:g,tag:"^comment|^</[a-zA-Z][\\w:-]*\\s*>|^<[a-zA-Z][\\w-]*(?:attribute)*?\\s*/?>|^<\\?[\\s\\S]*?\\?>|^<![a-zA-Z]+\\s[\\s\\S]*?>|^<!\\[CDATA\\[[\\s\\S]*?\\]\\]>",link:/^!?\[(label)\]\(\s*(href)(?:\s+(title))?\s*\)/,reflink:/^!?\[(label)\]\[(?!\s*\])((?:\\[\[\]]?|[^\[\]\\])+)\]/,nolink:/^!?\[(?!\s*\])((?:\[[^\[\]]*\]|\\[\[\]]|[^\[\]])*)\](?:\[\])?/,strong:/^__([^\s_])__(?!_)|^\*\*([^\s*])\*\*(?!\*)|^__([^\s][\s\S]*?[^\s])__(?!_)|^\*\*([^\s][\s\S]*?[^\s])\*\*(?!\*)/,em:/^_([^\s_])_(?!_)|^\*([^\s*<\[])\*(?!\*)|^_([^\s<][\s\S]*?[^\s_])_(?!_|[^\spunctuation])|^_([^\s_<][\s\S]*?[^\s])_(?!_|[^\spunctuation])|^\*([^\s<"][\s\S]*?[^\s\*])\*(?!\*|[^\spunctuation])|^\*([^\s*"<\[][\s\S]*?[^\s])\*(?!\*)/,code:/^(`+)([^`]|[^`][\s\S]*?[^`])\1(?!`)/,br:/^( {2,}|\\)\n(?!\s*$)/,del:g,text:/^(`+|[^`])(?:[\s\S]*?(?:(?=[\\<!\[`*]|\b_|$)|[^ ](?= {2,}\n))|(?= {2,}\n))/};function i(e,t){if(this.options=t||k.defaults,this.links=e,this.rules=o.normal,this.renderer=this.options.renderer||new a,this.renderer.options=this.options,!this.links)throw new Error("Tokens array requires a `links` property.");this.options.pedantic?this.rules=o.pedantic:this.options.gfm&&(this.options.breaks?this.rules=o.breaks:this.rules=o.gfm)}function a(e){this.options=e||k.defaults}function s(){}function l(e){this.tokens=[],this.token=null,this.options=e||k.defaults,this.options.renderer=this.options.renderer||new a,this.renderer=this.options.renderer,this.renderer.options=this.options,this.slugger=new c}function c(){this.seen={}}function u(e,t){if(t){if(u.escapeTest.test(e))return e.replace(u.escapeReplace,(function(e){return u.replacements[e]}))}else if(u.escapeTestNoEncode.test(e))return e.replace(u.escapeReplaceNoEncode,(function(e){return u.replacements[e]}));return e}function p(e){return e.replace(/&(#(?:\d+)|(?:#x[0-9A-Fa-f]+)|(?:\w+));?/gi,(function(e,t){return"colon"===(t=t.toLowerCase())?":":"#"===t.charAt(0)?"x"===t.charAt(1)?String.fromCharCode(parseInt(t.substring(2),16)):String.fromCharCode(+t.substring(1)):""}))}function f(e,t){return e=e.source||e,t=t||"",{replace:function(t,n){return n=(n=n.source||n).replace(/(^|[^\[])\^/g,"$1"),e=e.replace(t,n),this},getRegex:function(){return new RegExp(e,t)}}}function d(e,t,n){if(e){try{var r=decodeURIComponent(p(n)).replace(/[^\w:]/g,"").toLowerCase()}catch(e){return null}if(0===r.indexOf("javascript:")||0===r.indexOf("vbscript:")||0===r.indexOf("data:"))return null}t&&!m.test(n)&&(n=function(e,t){h[" "+e]||(/^[^:]+:\/*[^/]*$/.test(e)?h[" "+e]=e+"/":h[" "+e]=b(e,"/",!0));return e=h[" "+e],"//"===t.slice(0,2)?e.replace(/:[\s\S]*/,":")+t:"/"===t.charAt(0)?e.replace(/(:\/*[^/]*)[\s\S]*/,"$1")+t:e+t}(t,n));try{n=encodeURI(n).replace(/%25/g,"%")}catch(e){return null}return n}o._punctuation="!\"#$%&'()*+,\\-./:;<=>?@\\[^_{|}~",o.em=f(o.em).replace(/punctuation/g,o._punctuation).getRegex(),o._escapes=/\\([!"#$%&'()*+,\-./:;<=>?@\[\]\\^_`{|}~])/g,o._scheme=/[a-zA-Z][a-zA-Z0-9+.-]{1,31}/,o._email=/[a-zA-Z0-9.!#$%&'*+/=?^_`{|}~-]+(@)[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?(?:\.[a-zA-Z0-9](?:[a-zA-Z0-9-]{0,61}[a-zA-Z0-9])?)+(?![-_])/,o.autolink=f(o.autolink).replace("scheme",o._scheme).replace("email",o._email).getRegex(),o._attribute=/\s+[a-zA-Z:_][\w.:-]*(?:\s*=\s*"[^"]*"|\s*=\s*'[^']*'|\s*=\s*[^\s"'=<>`]+)?/,o.tag=f(o.tag).replace("comment",n._comment).replace("attribute",o._attribute).getRegex(),o._label=/(?:\[[^\[\]]*\]|\\.|`[^`]*`|[^\[\]\\`])*?/,o._href=/<(?:\\[<>]?|[^\s<>\\])*>|[^\s\x00-\x1f]*/,o._title=/"(?:\\"?|[^"\\])*"|'(?:\\'?|[^'\\])*'|\((?:\\\)?|[^)\\])*\)/,o.link=f(o.link).replace("label",o._label).replace("href",o._href).replace("title",o._title).getRegex(),o.reflink=f(o.reflink).replace("label",o._label).getRegex(),o.normal=y({},o),o.pedantic=y({},o.normal,{strong:/^__(?=\S)([\s\S]*?\S)__(?!_)|^\*\*(?=\S)([\s\S]*?\S)\*\*(?!\*)/,em:/^_(?=\S)([\s\S]*?\S)_(?!_)|^\*(?=\S)([\s\S]*?\S)\*(?!\*)/,link:f(/^!?\[(label)\]\((.*?)\)/).replace("label",o._label).getRegex(),reflink:f(/^!?\[(label)\]\s*\[([^\]]*)\]/).replace("label",o._label).getRegex()}),o.gfm=y({},o.normal,{escape:f(o.escape).replace("])","~|])").getRegex(),_extended_email:/[A-Za-z0-9._+-]+(@)[a-zA-Z0-9-_]+(?:\.[a-zA-Z0-9-_]*[a-zA-Z0-9])+(?![-_])/,url:/^((?:ftp|https?):\/\/|www\.)(?:[a-zA-Z0-9\-]+\.?)+[^\s<]*|^email/,_backpedal:/(?:[^?!.,:;*_~()&]+|\([^)]*\)|&(?![a-zA-Z0-9]+;$)|[?!.,:;*_~)]+(?!$))+/,del:/^~+(?=\S)([\s\S]*?\S)~+/,text:/^(`+|[^`])(?:[\s\S]*?(?:(?=[\\<!\[`*~]|\b_|https?:\/\/|ftp:\/\/|www\.|$)|[^ ](?= {2,}\n)|[^a-zA-Z0-9.!#$%&'*+\/=?_`{\|}~-](?=[a-zA-Z0-9.!#$%&'*+\/=?_`{\|}~-]+@))|(?= {2,}\n|[a-zA-Z0-9.!#$%&'*+\/=?_`{\|}~-]+@))/}),o.gfm.url=f(o.gfm.url,"i").replace("email",o.gfm._extended_email).getRegex(),o.breaks=y({},o.gfm,{br:f(o.br).replace("{2,}","*").getRegex(),text:f(o.gfm.text).replace("\\b_","\\b_| {2,}\\n").replace(/\{2,\}/g,"*").getRegex()}),i.rules=o,i.output=function(e,t,n){return new i(t,n).output(e)},i.prototype.output=function(e){for(var t,n,r,o,a,s,l="";e;)if(a=this.rules.escape.exec(e))e=e.substring(a[0].length),l+=u(a[1]);else if(a=this.rules.tag.exec(e))!this.inLink&&/^<a /i.test(a[0])?this.inLink=!0:this.inLink&&/^<\/a>/i.test(a[0])&&(this.inLink=!1),!this.inRawBlock&&/^<(pre|code|kbd|script)(\s|>)/i.test(a[0])?this.inRawBlock=!0:this.inRawBlock&&/^<\/(pre|code|kbd|script)(\s|>)/i.test(a[0])&&(this.inRawBlock=!1),e=e.substring(a[0].length),l+=this.options.sanitize?this.options.sanitizer?this.options.sanitizer(a[0]):u(a[0]):a[0];else if(a=this.rules.link.exec(e)){var c=x(a[2],"()");if(c>-1){var p=4+a[1].length+c;a[2]=a[2].substring(0,c),a[0]=a[0].substring(0,p).trim(),a[3]=""}e=e.substring(a[0].length),this.inLink=!0,r=a[2],this.options.pedantic?(t=/^([^'"]*[^\s])\s+(['"])(.*)\2/.exec(r))?(r=t[1],o=t[3]):o="":o=a[3]?a[3].slice(1,-1):"",r=r.trim().replace(/^<([\s\S]*)>$/,"$1"),l+=this.outputLink(a,{href:i.escapes(r),title:i.escapes(o)}),this.inLink=!1}else if((a=this.rules.reflink.exec(e))||(a=this.rules.nolink.exec(e))){if(e=e.substring(a[0].length),t=(a[2]||a[1]).replace(/\s+/g," "),!(t=this.links[t.toLowerCase()])||!t.href){l+=a[0].charAt(0),e=a[0].substring(1)+e;continue}this.inLink=!0,l+=this.outputLink(a,t),this.inLink=!1}else if(a=this.rules.strong.exec(e))e=e.substring(a[0].length),l+=this.renderer.strong(this.output(a[4]||a[3]||a[2]||a[1]));else if(a=this.rules.em.exec(e))e=e.substring(a[0].length),l+=this.renderer.em(this.output(a[6]||a[5]||a[4]||a[3]||a[2]||a[1]));else if(a=this.rules.code.exec(e))e=e.substring(a[0].length),l+=this.renderer.codespan(u(a[2].trim(),!0));else if(a=this.rules.br.exec(e))e=e.substring(a[0].length),l+=this.renderer.br();else if(a=this.rules.del.exec(e))e=e.substring(a[0].length),l+=this.renderer.del(this.output(a[1]));else if(a=this.rules.autolink.exec(e))e=e.substring(a[0].length),r="@"===a[2]?"mailto:"+(n=u(this.mangle(a[1]))):n=u(a[1]),l+=this.renderer.link(r,null,n);else if(this.inLink||!(a=this.rules.url.exec(e))){if(a=this.rules.text.exec(e))e=e.substring(a[0].length),this.inRawBlock?l+=this.renderer.text(this.options.sanitize?this.options.sanitizer?this.options.sanitizer(a[0]):u(a[0]):a[0]):l+=this.renderer.text(u(this.smartypants(a[0])));else if(e)throw new Error("Infinite loop on byte: "+e.charCodeAt(0))}else{if("@"===a[2])r="mailto:"+(n=u(a[0]));else{do{s=a[0],a[0]=this.rules._backpedal.exec(a[0])[0]}while(s!==a[0]);n=u(a[0]),r="www."===a[1]?"http://"+n:n}e=e.substring(a[0].length),l+=this.renderer.link(r,null,n)}return l},i.escapes=function(e){return e?e.replace(i.rules._escapes,"$1"):e},i.prototype.outputLink=function(e,t){var n=t.href,r=t.title?u(t.title):null;return"!"!==e[0].charAt(0)?this.renderer.link(n,r,this.output(e[1])):this.renderer.image(n,r,u(e[1]))},i.prototype.smartypants=function(e){return this.options.smartypants?e.replace(/---/g,"—").replace(/--/g,"–").replace(/(^|[-\u2014/(\[{"\s])'/g,"$1‘").replace(/'/g,"’").replace(/(^|[-\u2014/(\[{\u2018\s])"/g,"$1“").replace(/"/g,"”").replace(/\.{3}/g,"…"):e},i.prototype.mangle=function(e){if(!this.options.mangle)return e;for(var t,n="",r=e.length,o=0;o<r;o++)t=e.charCodeAt(o),Math.random()>.5&&(t="x"+t.toString(16)),n+="&#"+t+";";return n},a.prototype.code=function(e,t,n){var r=(t||"").match(/\S*/)[0];if(this.options.highlight){var o=this.options.highlight(e,r);null!=o&&o!==e&&(n=!0,e=o)}return r?'<pre><code class="'+this.options.langPrefix+u(r,!0)+'">'+(n?e:u(e,!0))+"</code></pre>\n":"<pre><code>"+(n?e:u(e,!0))+"</code></pre>"},a.prototype.blockquote=function(e){return"<blockquote>\n"+e+"</blockquote>\n"},a.prototype.html=function(e){return e},a.prototype.heading=function(e,t,n,r){return this.options.headerIds?"<h"+t+' id="'+this.options.headerPrefix+r.slug(n)+'">'+e+"</h"+t+">\n":"<h"+t+">"+e+"</h"+t+">\n"},a.prototype.hr=function(){return this.options.xhtml?"<hr/>\n":"<hr>\n"},a.prototype.list=function(e,t,n){var r=t?"ol":"ul";return"<"+r+(t&&1!==n?' start="'+n+'"':"")+">\n"+e+"</"+r+">\n"},a.prototype.listitem=function(e){return"<li>"+e+"</li>\n"},a.prototype.checkbox=function(e){return"<input "+(e?'checked="" ':"")+'disabled="" type="checkbox"'+(this.options.xhtml?" /":"")+"> "},a.prototype.paragraph=function(e){return"<p>"+e+"</p>\n"},a.prototype.table=function(e,t){return t&&(t="<tbody>"+t+"</tbody>"),"<table>\n<thead>\n"+e+"</thead>\n"+t+"</table>\n"},a.prototype.tablerow=function(e){return"<tr>\n"+e+"</tr>\n"},a.prototype.tablecell=function(e,t){var n=t.header?"th":"td";return(t.align?"<"+n+' align="'+t.align+'">':"<"+n+">")+e+"</"+n+">\n"},a.prototype.strong=function(e){return"<strong>"+e+"</strong>"},a.prototype.em=function(e){return"<em>"+e+"</em>"},a.prototype.codespan=function(e){return"<code>"+e+"</code>"},a.prototype.br=function(){return this.options.xhtml?"<br/>":"<br>"},a.prototype.del=function(e){return"<del>"+e+"</del>"},a.prototype.link=function(e,t,n){if(null===(e=d(this.options.sanitize,this.options.baseUrl,e)))return n;var r='<a href="'+u(e)+'"';return t&&(r+=' title="'+t+'"'),r+=">"+n+"</a>"},a.prototype.image=function(e,t,n){if(null===(e=d(this.options.sanitize,this.options.baseUrl,e)))return n;var r='<img src="'+e+'" alt="'+n+'"';return t&&(r+=' title="'+t+'"'),r+=this.options.xhtml?"/>":">"},a.prototype.text=function(e){return e},s.prototype.strong=s.prototype.em=s.prototype.codespan=s.prototype.del=s.prototype.text=function(e){return e},s.prototype.link=s.prototype.image=function(e,t,n){return""+n},s.prototype.br=function(){return""},l.parse=function(e,t){return new l(t).parse(e)},l.prototype.parse=function(e){this.inline=new i(e.links,this.options),this.inlineText=new i(e.links,y({},this.options,{renderer:new s})),this.tokens=e.reverse();for(var t="";this.next();)t+=this.tok();return t},l.prototype.next=function(){return this.token=this.tokens.pop(),this.token},l.prototype.peek=function(){return this.tokens[this.tokens.length-1]||0},l.prototype.parseText=function(){for(var e=this.token.text;"text"===this.peek().type;)e+="\n"+this.next().text;return this.inline.output(e)},l.prototype.tok=function(){switch(this.token.type){case"space":return"";case"hr":return this.renderer.hr();case"heading":return this.renderer.heading(this.inline.output(this.token.text),this.token.depth,p(this.inlineText.output(this.token.text)),this.slugger);case"code":return this.renderer.code(this.token.text,this.token.lang,this.token.escaped);case"table":var e,t,n,r,o="",i="";for(n="",e=0;e<this.token.header.length;e++)n+=this.renderer.tablecell(this.inline.output(this.token.header[e]),{header:!0,align:this.token.align[e]});for(o+=this.renderer.tablerow(n),e=0;e<this.token.cells.length;e++){for(t=this.token.cells[e],n="",r=0;r<t.length;r++)n+=this.renderer.tablecell(this.inline.output(t[r]),{header:!1,align:this.token.align[r]});i+=this.renderer.tablerow(n)}return this.renderer.table(o,i);case"blockquote_start":for(i="";"blockquote_end"!==this.next().type;)i+=this.tok();return this.renderer.blockquote(i);case"list_start":i="";for(var a=this.token.ordered,s=this.token.start;"list_end"!==this.next().type;)i+=this.tok();return this.renderer.list(i,a,s);case"list_item_start":i="";var l=this.token.loose,c=this.token.checked,u=this.token.task;for(this.token.task&&(i+=this.renderer.checkbox(c));"list_item_end"!==this.next().type;)i+=l||"text"!==this.token.type?this.tok():this.parseText();return this.renderer.listitem(i,u,c);case"html":return this.renderer.html(this.token.text);case"paragraph":return this.renderer.paragraph(this.inline.output(this.token.text));case"text":return this.renderer.paragraph(this.parseText());default:var f='Token with "'+this.token.type+'" type was not found.';if(!this.options.silent)throw new Error(f);console.log(f)}},c.prototype.slug=function(e){var t=e.toLowerCase().trim().replace(/[\u2000-\u206F\u2E00-\u2E7F\\'!"#$%&()*+,./:;<=>?@[\]^`{|}~]/g,"").replace(/\s/g,"-");if(this.seen.hasOwnProperty(t)){var n=t;do{this.seen[n]++,t=n+"-"+this.seen[n]}while(this.seen.hasOwnProperty(t))}return this.seen[t]=0,t},u.escapeTest=/[&<>"']/,u.escapeReplace=/[&<>"']/g,u.replacements={"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#39;"},u.escapeTestNoEncode=/[<>"']|&(?!#?\w+;)/,u.escapeReplaceNoEncode=/[<>"']|&(?!#?\w+;)/g;var h={},m=/^$|^[a-z][a-z0-9+.-]*:|^[?#]/i;function g(){}function y(e){for(var t,n,r=1;r<arguments.length;r++)for(n in t=arguments[r])Object.prototype.hasOwnProperty.call(t,n)&&(e[n]=t[n]);return e}function v(e,t){var n=e.replace(/\|/g,(function(e,t,n){for(var r=!1,o=t;--o>=0&&"\\"===n[o];)r=!r;return r?"|":" |"})).split(/ \|/),r=0;if(n.length>t)n.splice(t);else for(;n.length<t;)n.push("");for(;r<n.length;r++)n[r]=n[r].trim().replace(/\\\|/g,"|");return n}function b(e,t,n){if(0===e.length)return"";for(var r=0;r<e.length;){var o=e.charAt(e.length-r-1);if(o!==t||n){if(o===t||!n)break;r++}else r++}return e.substr(0,e.length-r)}function x(e,t){if(-1===e.indexOf(t[1]))return-1;for(var n=0,r=0;r<e.length;r++)if("\\"===e[r])r++;else if(e[r]===t[0])n++;else if(e[r]===t[1]&&--n<0)return r;return-1}function w(e){e&&e.sanitize&&!e.silent&&console.warn("marked(): sanitize and sanitizer parameters are deprecated since version 0.7.0, should not be used and will be removed in the future. Read more here: https://marked.js.org/#/USING_ADVANCED.md#options")}function k(e,t,n){if(null==e)throw new Error("marked(): input parameter is undefined or null");if("string"!=typeof e)throw new Error("marked(): input parameter is of type "+Object.prototype.toString.call(e)+", string expected");if(n||"function"==typeof t){n||(n=t,t=null),w(t=y({},k.defaults,t||{}));var o,i,a=t.highlight,s=0;try{o=r.lex(e,t)}catch(e){return n(e)}i=o.length;var c=function(e){if(e)return t.highlight=a,n(e);var r;try{r=l.parse(o,t)}catch(t){e=t}return t.highlight=a,e?n(e):n(null,r)};if(!a||a.length<3)return c();if(delete t.highlight,!i)return c();for(;s<o.length;s++)!function(e){"code"!==e.type?--i||c():a(e.text,e.lang,(function(t,n){return t?c(t):null==n||n===e.text?--i||c():(e.text=n,e.escaped=!0,void(--i||c()))}))}(o[s])}else try{return t&&(t=y({},k.defaults,t)),w(t),l.parse(r.lex(e,t),t)}catch(e){if(e.message+="\nPlease report this to https://github.com/markedjs/marked.",(t||k.defaults).silent)return"<p>An error occurred:</p><pre>"+u(e.message+"",!0)+"</pre>";throw e}}g.exec=g,k.options=k.setOptions=function(e){return y(k.defaults,e),k},k.getDefaults=function(){return{baseUrl:null,breaks:!1,gfm:!0,headerIds:!0,headerPrefix:"",highlight:null,langPrefix:"language-",mangle:!0,pedantic:!1,renderer:new a,sanitize:!1,sanitizer:null,silent:!1,smartLists:!1,smartypants:!1,xhtml:!1}},k.defaults=k.getDefaults(),k.Parser=l,k.parser=l.parse,k.Renderer=a,k.TextRenderer=s,k.Lexer=r,k.lexer=r.lex,k.InlineLexer=i,k.inlineLexer=i.output,k.Slugger=c,k.parse=k,e.exports=k}(this||"undefined"!=typeof window&&window)}).call(this,n(5))},function(e,t,n){var r=n(9);e.exports=function(e,t){if(!r(e))return e;var n,o;if(t&&"function"==typeof(n=e.toString)&&!r(o=n.call(e)))return o;if("function"==typeof(n=e.valueOf)&&!r(o=n.call(e)))return o;if(!t&&"function"==typeof(n=e.toString)&&!r(o=n.call(e)))return o;throw TypeError("Can't convert object to primitive value")}},function(e,t){var n=0,r=Math.random();e.exports=function(e){return"Symbol("+String(void 0===e?"":e)+")_"+(++n+r).toString(36)}},function(e,t,n){var r=n(69),o=n(52),i=r("keys");e.exports=function(e){return i[e]||(i[e]=o(e))}},function(e,t,n){var r,o=n(19),i=n(170),a=n(79),s=n(41),l=n(109),c=n(71),u=n(53),p=u("IE_PROTO"),f=function(){},d=function(e){return"<script>"+e+"<\/script>"},h=function(){try{r=document.domain&&new ActiveXObject("htmlfile")}catch(e){}var e,t;h=r?function(e){e.write(d("")),e.close();var t=e.parentWindow.Object;return e=null,t}(r):((t=c("iframe")).style.display="none",l.appendChild(t),t.src=String("javascript:"),(e=t.contentWindow.document).open(),e.write(d("document.F=Object")),e.close(),e.F);for(var n=a.length;n--;)delete h.prototype[a[n]];return h()};s[p]=!0,e.exports=Object.create||function(e,t){var n;return null!==e?(f.prototype=o(e),n=new f,f.prototype=null,n[p]=e):n=h(),void 0===t?n:i(n,t)}},function(e,t,n){var r=n(19),o=n(175),i=n(36),a=n(46),s=n(176),l=n(177),c=function(e,t){this.stopped=e,this.result=t};(e.exports=function(e,t,n,u,p){var f,d,h,m,g,y,v,b=a(t,n,u?2:1);if(p)f=e;else{if("function"!=typeof(d=s(e)))throw TypeError("Target is not iterable");if(o(d)){for(h=0,m=i(e.length);m>h;h++)if((g=u?b(r(v=e[h])[0],v[1]):b(e[h]))&&g instanceof c)return g;return new c(!1)}f=d.call(e)}for(y=f.next;!(v=y.call(f)).done;)if("object"==typeof(g=l(f,b,v.value,u))&&g&&g instanceof c)return g;return new c(!1)}).stop=function(e){return new c(!0,e)}},function(e,t,n){"use strict";function r(e,t){Error.call(this),this.name="YAMLException",this.reason=e,this.mark=t,this.message=(this.reason||"(unknown reason)")+(this.mark?" "+this.mark.toString():""),Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=(new Error).stack||""}r.prototype=Object.create(Error.prototype),r.prototype.constructor=r,r.prototype.toString=function(e){var t=this.name+": ";return t+=this.reason||"(unknown reason)",!e&&this.mark&&(t+=" "+this.mark.toString()),t},e.exports=r},function(e,t,n){"use strict";var r=n(37);e.exports=new r({include:[n(133)],implicit:[n(251),n(252)],explicit:[n(253),n(254),n(255),n(256)]})},function(e,t,n){"use strict";(function(t){void 0===t||!t.version||0===t.version.indexOf("v0.")||0===t.version.indexOf("v1.")&&0!==t.version.indexOf("v1.8.")?e.exports={nextTick:function(e,n,r,o){if("function"!=typeof e)throw new TypeError('"callback" argument must be a function');var i,a,s=arguments.length;switch(s){case 0:case 1:return t.nextTick(e);case 2:return t.nextTick((function(){e.call(null,n)}));case 3:return t.nextTick((function(){e.call(null,n,r)}));case 4:return t.nextTick((function(){e.call(null,n,r,o)}));default:for(i=new Array(s-1),a=0;a<i.length;)i[a++]=arguments[a];return t.nextTick((function(){e.apply(null,i)}))}}}:e.exports=t}).call(this,n(14))},function(e,t,n){var r=n(15),o=r.Buffer;function i(e,t){for(var n in e)t[n]=e[n]}function a(e,t,n){return o(e,t,n)}o.from&&o.alloc&&o.allocUnsafe&&o.allocUnsafeSlow?e.exports=r:(i(r,t),t.Buffer=a),i(o,a),a.from=function(e,t,n){if("number"==typeof e)throw new TypeError("Argument must not be a number");return o(e,t,n)},a.alloc=function(e,t,n){if("number"!=typeof e)throw new TypeError("Argument must be a number");var r=o(e);return void 0!==t?"string"==typeof n?r.fill(t,n):r.fill(t):r.fill(0),r},a.allocUnsafe=function(e){if("number"!=typeof e)throw new TypeError("Argument must be a number");return o(e)},a.allocUnsafeSlow=function(e){if("number"!=typeof e)throw new TypeError("Argument must be a number");return r.SlowBuffer(e)}},function(e,t,n){"use strict";e.exports=o;var r=n(91);function o(){this.path=void 0,this.value=void 0,this.$refs=void 0,this.pathType=void 0}o.prototype.exists=function(e,t){try{return this.resolve(e,t),!0}catch(e){return!1}},o.prototype.get=function(e,t){return this.resolve(e,t).value},o.prototype.resolve=function(e,t,n){return new r(this,e,n).resolve(this.value,t)},o.prototype.set=function(e,t){var n=new r(this,e);this.value=n.set(this.value,t)},o.is$Ref=function(e){return e&&"object"==typeof e&&"string"==typeof e.$ref&&e.$ref.length>0},o.isExternal$Ref=function(e){return o.is$Ref(e)&&"#"!==e.$ref[0]},o.isAllowed$Ref=function(e,t){if(o.is$Ref(e)){if("#/"===e.$ref.substr(0,2)||"#"===e.$ref)return!0;if("#"!==e.$ref[0]&&(!t||t.resolve.external))return!0}},o.isExtended$Ref=function(e){return o.is$Ref(e)&&Object.keys(e).length>1},o.dereference=function(e,t){if(t&&"object"==typeof t&&o.isExtended$Ref(e)){var n={};return Object.keys(e).forEach((function(t){"$ref"!==t&&(n[t]=e[t])})),Object.keys(t).forEach((function(e){e in n||(n[e]=t[e])})),n}return t}},function(t,n){t.exports=e},function(e,t,n){"use strict";function r(e){return e.replace(/\~1/g,"/").replace(/~0/g,"~")}e.exports={jptr:function(e,t,n){if(void 0===e)return!1;if(!t||"string"!=typeof t||"#"===t)return void 0!==n?n:e;if(t.indexOf("#")>=0){var o=t.split("#");if(o[0])return!1;t=o[1],t=decodeURIComponent(t.slice(1).split("+").join(" "))}t.startsWith("/")&&(t=t.slice(1));for(var i=t.split("/"),a=0;a<i.length;a++){i[a]=r(i[a]);var s=void 0!==n&&a==i.length-1,l=parseInt(i[a],10);if(!Array.isArray(e)||isNaN(l)||l.toString()!==i[a]?l=Array.isArray(e)&&"-"===i[a]?-2:-1:i[a]=a>0?i[a-1]:"",-1!=l||e.hasOwnProperty(i[a]))if(l>=0)s&&(e[l]=n),e=e[l];else{if(-2===l)return s?(Array.isArray(e)&&e.push(n),n):void 0;s&&(e[i[a]]=n),e=e[i[a]]}else{if(void 0===n||"object"!=typeof e||Array.isArray(e))return!1;e[i[a]]=s?n:"0"===i[a+1]||"-"===i[a+1]?[]:{},e=e[i[a]]}}return e},jpescape:function(e){return e.replace(/\~/g,"~0").replace(/\//g,"~1")},jpunescape:r}},function(e,t,n){"use strict";var r=n(1);e.exports={nop:function(e){return e},clone:function(e){return JSON.parse(JSON.stringify(e))},shallowClone:function(e){var t={};for(var n in e)e.hasOwnProperty(n)&&(t[n]=e[n]);return t},deepClone:function e(t){var n=Array.isArray(t)?[]:{};for(var r in t)(t.hasOwnProperty(r)||Array.isArray(t))&&(n[r]="object"==typeof t[r]?e(t[r]):t[r]);return n},fastClone:function(e){return Object.assign({},e)},circularClone:function e(t,n){if(n||(n=new WeakMap),Object(t)!==t||t instanceof Function)return t;if(n.has(t))return n.get(t);try{var o=new t.constructor}catch(e){o=Object.create(Object.getPrototypeOf(t))}return n.set(t,o),Object.assign.apply(Object,r.__spreadArrays([o],Object.keys(t).map((function(r){var o;return(o={})[r]=e(t[r],n),o}))))}}},function(e,t,n){"use strict";e.exports=n(235)},function(e,t,n){"use strict";var r=Object.prototype.hasOwnProperty,o="~";function i(){}function a(e,t,n){this.fn=e,this.context=t,this.once=n||!1}function s(e,t,n,r,i){if("function"!=typeof n)throw new TypeError("The listener must be a function");var s=new a(n,r||e,i),l=o?o+t:t;return e._events[l]?e._events[l].fn?e._events[l]=[e._events[l],s]:e._events[l].push(s):(e._events[l]=s,e._eventsCount++),e}function l(e,t){0==--e._eventsCount?e._events=new i:delete e._events[t]}function c(){this._events=new i,this._eventsCount=0}Object.create&&(i.prototype=Object.create(null),(new i).__proto__||(o=!1)),c.prototype.eventNames=function(){var e,t,n=[];if(0===this._eventsCount)return n;for(t in e=this._events)r.call(e,t)&&n.push(o?t.slice(1):t);return Object.getOwnPropertySymbols?n.concat(Object.getOwnPropertySymbols(e)):n},c.prototype.listeners=function(e){var t=o?o+e:e,n=this._events[t];if(!n)return[];if(n.fn)return[n.fn];for(var r=0,i=n.length,a=new Array(i);r<i;r++)a[r]=n[r].fn;return a},c.prototype.listenerCount=function(e){var t=o?o+e:e,n=this._events[t];return n?n.fn?1:n.length:0},c.prototype.emit=function(e,t,n,r,i,a){var s=o?o+e:e;if(!this._events[s])return!1;var l,c,u=this._events[s],p=arguments.length;if(u.fn){switch(u.once&&this.removeListener(e,u.fn,void 0,!0),p){case 1:return u.fn.call(u.context),!0;case 2:return u.fn.call(u.context,t),!0;case 3:return u.fn.call(u.context,t,n),!0;case 4:return u.fn.call(u.context,t,n,r),!0;case 5:return u.fn.call(u.context,t,n,r,i),!0;case 6:return u.fn.call(u.context,t,n,r,i,a),!0}for(c=1,l=new Array(p-1);c<p;c++)l[c-1]=arguments[c];u.fn.apply(u.context,l)}else{var f,d=u.length;for(c=0;c<d;c++)switch(u[c].once&&this.removeListener(e,u[c].fn,void 0,!0),p){case 1:u[c].fn.call(u[c].context);break;case 2:u[c].fn.call(u[c].context,t);break;case 3:u[c].fn.call(u[c].context,t,n);break;case 4:u[c].fn.call(u[c].context,t,n,r);break;default:if(!l)for(f=1,l=new Array(p-1);f<p;f++)l[f-1]=arguments[f];u[c].fn.apply(u[c].context,l)}}return!0},c.prototype.on=function(e,t,n){return s(this,e,t,n,!1)},c.prototype.once=function(e,t,n){return s(this,e,t,n,!0)},c.prototype.removeListener=function(e,t,n,r){var i=o?o+e:e;if(!this._events[i])return this;if(!t)return l(this,i),this;var a=this._events[i];if(a.fn)a.fn!==t||r&&!a.once||n&&a.context!==n||l(this,i);else{for(var s=0,c=[],u=a.length;s<u;s++)(a[s].fn!==t||r&&!a[s].once||n&&a[s].context!==n)&&c.push(a[s]);c.length?this._events[i]=1===c.length?c[0]:c:l(this,i)}return this},c.prototype.removeAllListeners=function(e){var t;return e?(t=o?o+e:e,this._events[t]&&l(this,t)):(this._events=new i,this._eventsCount=0),this},c.prototype.off=c.prototype.removeListener,c.prototype.addListener=c.prototype.on,c.prefixed=o,c.EventEmitter=c,e.exports=c},function(e,t,n){e.exports=function(){function e(){}return e.prototype.encodeReserved=function(e){return e.split(/(%[0-9A-Fa-f]{2})/g).map((function(e){return/%[0-9A-Fa-f]/.test(e)||(e=encodeURI(e).replace(/%5B/g,"[").replace(/%5D/g,"]")),e})).join("")},e.prototype.encodeUnreserved=function(e){return encodeURIComponent(e).replace(/[!'()*]/g,(function(e){return"%"+e.charCodeAt(0).toString(16).toUpperCase()}))},e.prototype.encodeValue=function(e,t,n){return t="+"===e||"#"===e?this.encodeReserved(t):this.encodeUnreserved(t),n?this.encodeUnreserved(n)+"="+t:t},e.prototype.isDefined=function(e){return null!=e},e.prototype.isKeyOperator=function(e){return";"===e||"&"===e||"?"===e},e.prototype.getValues=function(e,t,n,r){var o=e[n],i=[];if(this.isDefined(o)&&""!==o)if("string"==typeof o||"number"==typeof o||"boolean"==typeof o)o=o.toString(),r&&"*"!==r&&(o=o.substring(0,parseInt(r,10))),i.push(this.encodeValue(t,o,this.isKeyOperator(t)?n:null));else if("*"===r)Array.isArray(o)?o.filter(this.isDefined).forEach((function(e){i.push(this.encodeValue(t,e,this.isKeyOperator(t)?n:null))}),this):Object.keys(o).forEach((function(e){this.isDefined(o[e])&&i.push(this.encodeValue(t,o[e],e))}),this);else{var a=[];Array.isArray(o)?o.filter(this.isDefined).forEach((function(e){a.push(this.encodeValue(t,e))}),this):Object.keys(o).forEach((function(e){this.isDefined(o[e])&&(a.push(this.encodeUnreserved(e)),a.push(this.encodeValue(t,o[e].toString())))}),this),this.isKeyOperator(t)?i.push(this.encodeUnreserved(n)+"="+a.join(",")):0!==a.length&&i.push(a.join(","))}else";"===t?this.isDefined(o)&&i.push(this.encodeUnreserved(n)):""!==o||"&"!==t&&"?"!==t?""===o&&i.push(""):i.push(this.encodeUnreserved(n)+"=");return i},e.prototype.parse=function(e){var t=this,n=["+","#",".","/",";","?","&"];return{expand:function(r){return e.replace(/\{([^\{\}]+)\}|([^\{\}]+)/g,(function(e,o,i){if(o){var a=null,s=[];if(-1!==n.indexOf(o.charAt(0))&&(a=o.charAt(0),o=o.substr(1)),o.split(/,/g).forEach((function(e){var n=/([^:\*]*)(?::(\d+)|(\*))?/.exec(e);s.push.apply(s,t.getValues(r,a,n[1],n[2]||n[3]))})),a&&"+"!==a){var l=",";return"?"===a?l="&":"#"!==a&&(l=a),(0!==s.length?a:"")+s.join(l)}return s.join(",")}return t.encodeReserved(i)}))}}},new e}()},function(e,t,n){var r=n(68),o=n(24),i=n(163);r||o(Object.prototype,"toString",i,{unsafe:!0})},function(e,t,n){var r={};r[n(4)("toStringTag")]="z",e.exports="[object z]"===String(r)},function(e,t,n){var r=n(22),o=n(100);(e.exports=function(e,t){return o[e]||(o[e]=void 0!==t?t:{})})("versions",[]).push({version:"3.6.5",mode:r?"pure":"global",copyright:"© 2020 Denis Pushkarev (zloirock.ru)"})},function(e,t,n){var r=n(3),o=n(23);e.exports=function(e,t){try{o(r,e,t)}catch(n){r[e]=t}return t}},function(e,t,n){var r=n(3),o=n(9),i=r.document,a=o(i)&&o(i.createElement);e.exports=function(e){return a?i.createElement(e):{}}},function(e,t,n){var r=n(8);e.exports=!!Object.getOwnPropertySymbols&&!r((function(){return!String(Symbol())}))},function(e,t,n){var r=n(100),o=Function.toString;"function"!=typeof r.inspectSource&&(r.inspectSource=function(e){return o.call(e)}),e.exports=r.inspectSource},function(e,t){var n=Math.ceil,r=Math.floor;e.exports=function(e){return isNaN(e=+e)?0:(e>0?r:n)(e)}},function(e,t,n){"use strict";var r=n(17),o=n(168),i=n(108),a=n(110),s=n(29),l=n(23),c=n(24),u=n(4),p=n(22),f=n(44),d=n(107),h=d.IteratorPrototype,m=d.BUGGY_SAFARI_ITERATORS,g=u("iterator"),y=function(){return this};e.exports=function(e,t,n,u,d,v,b){o(n,t,u);var x,w,k,O=function(e){if(e===d&&j)return j;if(!m&&e in S)return S[e];switch(e){case"keys":case"values":case"entries":return function(){return new n(this,e)}}return function(){return new n(this)}},E=t+" Iterator",_=!1,S=e.prototype,T=S[g]||S["@@iterator"]||d&&S[d],j=!m&&T||O(d),A="Array"==t&&S.entries||T;if(A&&(x=i(A.call(new e)),h!==Object.prototype&&x.next&&(p||i(x)===h||(a?a(x,h):"function"!=typeof x[g]&&l(x,g,y)),s(x,E,!0,!0),p&&(f[E]=y))),"values"==d&&T&&"values"!==T.name&&(_=!0,j=function(){return T.call(this)}),p&&!b||S[g]===j||l(S,g,j),f[t]=j,d)if(w={values:O("values"),keys:v?j:O("keys"),entries:O("entries")},b)for(k in w)(m||_||!(k in S))&&c(S,k,w[k]);else r({target:t,proto:!0,forced:m||_},w);return w}},function(e,t,n){"use strict";var r={}.propertyIsEnumerable,o=Object.getOwnPropertyDescriptor,i=o&&!r.call({1:2},1);t.f=i?function(e){var t=o(this,e);return!!t&&t.enumerable}:r},function(e,t,n){var r=n(8),o=n(27),i="".split;e.exports=r((function(){return!Object("z").propertyIsEnumerable(0)}))?function(e){return"String"==o(e)?i.call(e,""):Object(e)}:Object},function(e,t,n){var r=n(106),o=n(79).concat("length","prototype");t.f=Object.getOwnPropertyNames||function(e){return r(e,o)}},function(e,t){e.exports=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"]},function(e,t){t.f=Object.getOwnPropertySymbols},function(e,t,n){var r=n(8),o=/#|\.prototype\./,i=function(e,t){var n=s[a(e)];return n==c||n!=l&&("function"==typeof t?r(t):!!t)},a=i.normalize=function(e){return String(e).replace(o,".").toLowerCase()},s=i.data={},l=i.NATIVE="N",c=i.POLYFILL="P";e.exports=i},function(e,t,n){var r=n(106),o=n(79);e.exports=Object.keys||function(e){return r(e,o)}},function(e,t){e.exports=function(e,t,n){if(!(e instanceof t))throw TypeError("Incorrect "+(n?n+" ":"")+"invocation");return e}},function(e,t,n){"use strict";var r=n(45),o=function(e){var t,n;this.promise=new e((function(e,r){if(void 0!==t||void 0!==n)throw TypeError("Bad Promise constructor");t=e,n=r})),this.resolve=r(t),this.reject=r(n)};e.exports.f=function(e){return new o(e)}},function(e,t,n){var r,o,i=n(3),a=n(120),s=i.process,l=s&&s.versions,c=l&&l.v8;c?o=(r=c.split("."))[0]+r[1]:a&&(!(r=a.match(/Edge\/(\d+)/))||r[1]>=74)&&(r=a.match(/Chrome\/(\d+)/))&&(o=r[1]),e.exports=o&&+o},function(e,t,n){var r=n(27);e.exports=Array.isArray||function(e){return"Array"==r(e)}},function(e,t,n){var r=n(3),o=n(46),i=Function.call;e.exports=function(e,t,n){return o(i,r[e].prototype[t],n)}},function(e,t,n){"use strict";var r=n(37);e.exports=new r({explicit:[n(244),n(245),n(246)]})},function(e,t,n){"use strict";var r=n(37);e.exports=r.DEFAULT=new r({include:[n(57)],explicit:[n(257),n(258),n(259)]})},function(e,t,n){(function(e){var r=n(268),o=n(136),i=n(277),a=n(278),s=n(10),l=t;l.request=function(t,n){t="string"==typeof t?s.parse(t):i(t);var o=-1===e.location.protocol.search(/^https?:$/)?"http:":"",a=t.protocol||o,l=t.hostname||t.host,c=t.port,u=t.path||"/";l&&-1!==l.indexOf(":")&&(l="["+l+"]"),t.url=(l?a+"//"+l:"")+(c?":"+c:"")+u,t.method=(t.method||"GET").toUpperCase(),t.headers=t.headers||{};var p=new r(t);return n&&p.on("response",n),p},l.get=function(e,t){var n=l.request(e,t);return n.end(),n},l.ClientRequest=r,l.IncomingMessage=o.IncomingMessage,l.Agent=function(){},l.Agent.defaultMaxSockets=4,l.globalAgent=new l.Agent,l.STATUS_CODES=a,l.METHODS=["CHECKOUT","CONNECT","COPY","DELETE","GET","HEAD","LOCK","M-SEARCH","MERGE","MKACTIVITY","MKCOL","MOVE","NOTIFY","OPTIONS","PATCH","POST","PROPFIND","PROPPATCH","PURGE","PUT","REPORT","SEARCH","SUBSCRIBE","TRACE","UNLOCK","UNSUBSCRIBE"]}).call(this,n(5))},function(e,t,n){"use strict";e.exports=u;var r=n(60),o=n(25),i=n(30),a=/\//g,s=/~/g,l=/~1/g,c=/~0/g;function u(e,t,n){this.$ref=e,this.path=t,this.originalPath=n||t,this.value=void 0,this.circular=!1,this.indirections=0}function p(e,t){if(r.isAllowed$Ref(e.value,t)){var n=o.resolve(e.path,e.value.$ref);if(n!==e.path){var i=e.$ref.$refs._resolve(n,t);return e.indirections+=i.indirections+1,r.isExtended$Ref(e.value)?(e.value=r.dereference(e.value,i.value),!1):(e.$ref=i.$ref,e.path=i.path,e.value=i.value,!0)}e.circular=!0}}function f(e,t,n){if(!e.value||"object"!=typeof e.value)throw i.syntax('Error assigning $ref pointer "%s". \nCannot set "%s" of a non-object.',e.path,t);return"-"===t&&Array.isArray(e.value)?e.value.push(n):e.value[t]=n,n}u.prototype.resolve=function(e,t){var n=u.parse(this.path);this.value=e;for(var r=0;r<n.length;r++){p(this,t)&&(this.path=u.join(this.path,n.slice(r)));var o=n[r];if(void 0===this.value[o])throw i.syntax('Error resolving $ref pointer "%s". \nToken "%s" does not exist.',this.originalPath,o);this.value=this.value[o]}return p(this,t),this},u.prototype.set=function(e,t,n){var r,o=u.parse(this.path);if(0===o.length)return this.value=t,t;this.value=e;for(var i=0;i<o.length-1;i++)p(this,n),r=o[i],this.value&&void 0!==this.value[r]?this.value=this.value[r]:this.value=f(this,r,{});return p(this,n),f(this,r=o[o.length-1],t),e},u.parse=function(e){var t=o.getHash(e).substr(1);if(!t)return[];t=t.split("/");for(var n=0;n<t.length;n++)t[n]=decodeURIComponent(t[n].replace(l,"/").replace(c,"~"));if(""!==t[0])throw i.syntax('Invalid $ref pointer "%s". Pointers must begin with "#/"',t);return t.slice(1)},u.join=function(e,t){-1===e.indexOf("#")&&(e+="#"),t=Array.isArray(t)?t:[t];for(var n=0;n<t.length;n++){var r=t[n];e+="/"+encodeURIComponent(r.replace(s,"~0").replace(a,"~1"))}return e}},function(e,t,n){"use strict";e.exports={isRef:function(e,t){return"$ref"===t&&!!e&&"string"==typeof e[t]}}},function(e,t,n){"use strict";var r=n(62).jpescape;e.exports={recurse:function e(t,n,o){if(n||(n={depth:0}),n.depth||(n=Object.assign({},{path:"#",depth:0,pkey:"",parent:{},payload:{},seen:new WeakMap,identity:!1,identityDetection:!1},n)),"object"==typeof t){var i=n.path;for(var a in t){if(n.key=a,n.path=n.path+"/"+encodeURIComponent(r(a)),n.identityPath=n.seen.get(t[a]),n.identity=void 0!==n.identityPath,t.hasOwnProperty(a)&&o(t,a,n),"object"==typeof t[a]&&!n.identity){n.identityDetection&&!Array.isArray(t[a])&&null!==t[a]&&n.seen.set(t[a],n.path);var s={};s.parent=t,s.path=n.path,s.depth=n.depth?n.depth+1:1,s.pkey=a,s.payload=n.payload,s.seen=n.seen,s.identity=!1,s.identityDetection=n.identityDetection,e(t[a],s,o)}n.path=i}}}}},function(e,t,n){"use strict";!function e(){if("undefined"!=typeof __REACT_DEVTOOLS_GLOBAL_HOOK__&&"function"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE){0;try{__REACT_DEVTOOLS_GLOBAL_HOOK__.checkDCE(e)}catch(e){console.error(e)}}}(),e.exports=n(224)},function(e,t,n){"use strict";var r=n(64),o={childContextTypes:!0,contextType:!0,contextTypes:!0,defaultProps:!0,displayName:!0,getDefaultProps:!0,getDerivedStateFromError:!0,getDerivedStateFromProps:!0,mixins:!0,propTypes:!0,type:!0},i={name:!0,length:!0,prototype:!0,caller:!0,callee:!0,arguments:!0,arity:!0},a={$$typeof:!0,compare:!0,defaultProps:!0,displayName:!0,propTypes:!0,type:!0},s={};function l(e){return r.isMemo(e)?a:s[e.$$typeof]||o}s[r.ForwardRef]={$$typeof:!0,render:!0,defaultProps:!0,displayName:!0,propTypes:!0},s[r.Memo]=a;var c=Object.defineProperty,u=Object.getOwnPropertyNames,p=Object.getOwnPropertySymbols,f=Object.getOwnPropertyDescriptor,d=Object.getPrototypeOf,h=Object.prototype;e.exports=function e(t,n,r){if("string"!=typeof n){if(h){var o=d(n);o&&o!==h&&e(t,o,r)}var a=u(n);p&&(a=a.concat(p(n)));for(var s=l(t),m=l(n),g=0;g<a.length;++g){var y=a[g];if(!(i[y]||r&&r[y]||m&&m[y]||s&&s[y])){var v=f(n,y);try{c(t,y,v)}catch(e){}}}}return t}},function(e,t,n){
+/*!***************************************************
+* mark.js v8.11.1
+* https://markjs.io/
+* Copyright (c) 2014–2018, Julian Kühnel
+* Released under the MIT license https://git.io/vwTVl
+*****************************************************/
+e.exports=function(){"use strict";var e="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e},t=function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")},n=function(){function e(e,t){for(var n=0;n<t.length;n++){var r=t[n];r.enumerable=r.enumerable||!1,r.configurable=!0,"value"in r&&(r.writable=!0),Object.defineProperty(e,r.key,r)}}return function(t,n,r){return n&&e(t.prototype,n),r&&e(t,r),t}}(),r=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},o=function(){function e(n){var r=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],o=arguments.length>2&&void 0!==arguments[2]?arguments[2]:[],i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:5e3;t(this,e),this.ctx=n,this.iframes=r,this.exclude=o,this.iframesTimeout=i}return n(e,[{key:"getContexts",value:function(){var e=[];return(void 0!==this.ctx&&this.ctx?NodeList.prototype.isPrototypeOf(this.ctx)?Array.prototype.slice.call(this.ctx):Array.isArray(this.ctx)?this.ctx:"string"==typeof this.ctx?Array.prototype.slice.call(document.querySelectorAll(this.ctx)):[this.ctx]:[]).forEach((function(t){var n=e.filter((function(e){return e.contains(t)})).length>0;-1!==e.indexOf(t)||n||e.push(t)})),e}},{key:"getIframeContents",value:function(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:function(){},r=void 0;try{var o=e.contentWindow;if(r=o.document,!o||!r)throw new Error("iframe inaccessible")}catch(e){n()}r&&t(r)}},{key:"isIframeBlank",value:function(e){var t="about:blank",n=e.getAttribute("src").trim();return e.contentWindow.location.href===t&&n!==t&&n}},{key:"observeIframeLoad",value:function(e,t,n){var r=this,o=!1,i=null,a=function a(){if(!o){o=!0,clearTimeout(i);try{r.isIframeBlank(e)||(e.removeEventListener("load",a),r.getIframeContents(e,t,n))}catch(e){n()}}};e.addEventListener("load",a),i=setTimeout(a,this.iframesTimeout)}},{key:"onIframeReady",value:function(e,t,n){try{"complete"===e.contentWindow.document.readyState?this.isIframeBlank(e)?this.observeIframeLoad(e,t,n):this.getIframeContents(e,t,n):this.observeIframeLoad(e,t,n)}catch(e){n()}}},{key:"waitForIframes",value:function(e,t){var n=this,r=0;this.forEachIframe(e,(function(){return!0}),(function(e){r++,n.waitForIframes(e.querySelector("html"),(function(){--r||t()}))}),(function(e){e||t()}))}},{key:"forEachIframe",value:function(t,n,r){var o=this,i=arguments.length>3&&void 0!==arguments[3]?arguments[3]:function(){},a=t.querySelectorAll("iframe"),s=a.length,l=0;a=Array.prototype.slice.call(a);var c=function(){--s<=0&&i(l)};s||c(),a.forEach((function(t){e.matches(t,o.exclude)?c():o.onIframeReady(t,(function(e){n(t)&&(l++,r(e)),c()}),c)}))}},{key:"createIterator",value:function(e,t,n){return document.createNodeIterator(e,t,n,!1)}},{key:"createInstanceOnIframe",value:function(t){return new e(t.querySelector("html"),this.iframes)}},{key:"compareNodeIframe",value:function(e,t,n){if(e.compareDocumentPosition(n)&Node.DOCUMENT_POSITION_PRECEDING){if(null===t)return!0;if(t.compareDocumentPosition(n)&Node.DOCUMENT_POSITION_FOLLOWING)return!0}return!1}},{key:"getIteratorNode",value:function(e){var t=e.previousNode();return{prevNode:t,node:(null===t||e.nextNode())&&e.nextNode()}}},{key:"checkIframeFilter",value:function(e,t,n,r){var o=!1,i=!1;return r.forEach((function(e,t){e.val===n&&(o=t,i=e.handled)})),this.compareNodeIframe(e,t,n)?(!1!==o||i?!1===o||i||(r[o].handled=!0):r.push({val:n,handled:!0}),!0):(!1===o&&r.push({val:n,handled:!1}),!1)}},{key:"handleOpenIframes",value:function(e,t,n,r){var o=this;e.forEach((function(e){e.handled||o.getIframeContents(e.val,(function(e){o.createInstanceOnIframe(e).forEachNode(t,n,r)}))}))}},{key:"iterateThroughNodes",value:function(e,t,n,r,o){for(var i,a=this,s=this.createIterator(t,e,r),l=[],c=[],u=void 0,p=void 0;i=void 0,i=a.getIteratorNode(s),p=i.prevNode,u=i.node;)this.iframes&&this.forEachIframe(t,(function(e){return a.checkIframeFilter(u,p,e,l)}),(function(t){a.createInstanceOnIframe(t).forEachNode(e,(function(e){return c.push(e)}),r)})),c.push(u);c.forEach((function(e){n(e)})),this.iframes&&this.handleOpenIframes(l,e,n,r),o()}},{key:"forEachNode",value:function(e,t,n){var r=this,o=arguments.length>3&&void 0!==arguments[3]?arguments[3]:function(){},i=this.getContexts(),a=i.length;a||o(),i.forEach((function(i){var s=function(){r.iterateThroughNodes(e,i,t,n,(function(){--a<=0&&o()}))};r.iframes?r.waitForIframes(i,s):s()}))}}],[{key:"matches",value:function(e,t){var n="string"==typeof t?[t]:t,r=e.matches||e.matchesSelector||e.msMatchesSelector||e.mozMatchesSelector||e.oMatchesSelector||e.webkitMatchesSelector;if(r){var o=!1;return n.every((function(t){return!r.call(e,t)||(o=!0,!1)})),o}return!1}}]),e}(),i=function(){function i(e){t(this,i),this.ctx=e,this.ie=!1;var n=window.navigator.userAgent;(n.indexOf("MSIE")>-1||n.indexOf("Trident")>-1)&&(this.ie=!0)}return n(i,[{key:"log",value:function(t){var n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"debug",r=this.opt.log;this.opt.debug&&"object"===(void 0===r?"undefined":e(r))&&"function"==typeof r[n]&&r[n]("mark.js: "+t)}},{key:"escapeStr",value:function(e){return e.replace(/[\-\[\]\/\{\}\(\)\*\+\?\.\\\^\$\|]/g,"\\$&")}},{key:"createRegExp",value:function(e){return"disabled"!==this.opt.wildcards&&(e=this.setupWildcardsRegExp(e)),e=this.escapeStr(e),Object.keys(this.opt.synonyms).length&&(e=this.createSynonymsRegExp(e)),(this.opt.ignoreJoiners||this.opt.ignorePunctuation.length)&&(e=this.setupIgnoreJoinersRegExp(e)),this.opt.diacritics&&(e=this.createDiacriticsRegExp(e)),e=this.createMergedBlanksRegExp(e),(this.opt.ignoreJoiners||this.opt.ignorePunctuation.length)&&(e=this.createJoinersRegExp(e)),"disabled"!==this.opt.wildcards&&(e=this.createWildcardsRegExp(e)),e=this.createAccuracyRegExp(e)}},{key:"createSynonymsRegExp",value:function(e){var t=this.opt.synonyms,n=this.opt.caseSensitive?"":"i",r=this.opt.ignoreJoiners||this.opt.ignorePunctuation.length?"\0":"";for(var o in t)if(t.hasOwnProperty(o)){var i=t[o],a="disabled"!==this.opt.wildcards?this.setupWildcardsRegExp(o):this.escapeStr(o),s="disabled"!==this.opt.wildcards?this.setupWildcardsRegExp(i):this.escapeStr(i);""!==a&&""!==s&&(e=e.replace(new RegExp("("+this.escapeStr(a)+"|"+this.escapeStr(s)+")","gm"+n),r+"("+this.processSynomyms(a)+"|"+this.processSynomyms(s)+")"+r))}return e}},{key:"processSynomyms",value:function(e){return(this.opt.ignoreJoiners||this.opt.ignorePunctuation.length)&&(e=this.setupIgnoreJoinersRegExp(e)),e}},{key:"setupWildcardsRegExp",value:function(e){return(e=e.replace(/(?:\\)*\?/g,(function(e){return"\\"===e.charAt(0)?"?":""}))).replace(/(?:\\)*\*/g,(function(e){return"\\"===e.charAt(0)?"*":""}))}},{key:"createWildcardsRegExp",value:function(e){var t="withSpaces"===this.opt.wildcards;return e.replace(/\u0001/g,t?"[\\S\\s]?":"\\S?").replace(/\u0002/g,t?"[\\S\\s]*?":"\\S*")}},{key:"setupIgnoreJoinersRegExp",value:function(e){return e.replace(/[^(|)\\]/g,(function(e,t,n){var r=n.charAt(t+1);return/[(|)\\]/.test(r)||""===r?e:e+"\0"}))}},{key:"createJoinersRegExp",value:function(e){var t=[],n=this.opt.ignorePunctuation;return Array.isArray(n)&&n.length&&t.push(this.escapeStr(n.join(""))),this.opt.ignoreJoiners&&t.push("\\u00ad\\u200b\\u200c\\u200d"),t.length?e.split(/\u0000+/).join("["+t.join("")+"]*"):e}},{key:"createDiacriticsRegExp",value:function(e){var t=this.opt.caseSensitive?"":"i",n=this.opt.caseSensitive?["aàáảãạăằắẳẵặâầấẩẫậäåāą","AÀÁẢÃẠĂẰẮẲẴẶÂẦẤẨẪẬÄÅĀĄ","cçćč","CÇĆČ","dđď","DĐĎ","eèéẻẽẹêềếểễệëěēę","EÈÉẺẼẸÊỀẾỂỄỆËĚĒĘ","iìíỉĩịîïī","IÌÍỈĨỊÎÏĪ","lł","LŁ","nñňń","NÑŇŃ","oòóỏõọôồốổỗộơởỡớờợöøō","OÒÓỎÕỌÔỒỐỔỖỘƠỞỠỚỜỢÖØŌ","rř","RŘ","sšśșş","SŠŚȘŞ","tťțţ","TŤȚŢ","uùúủũụưừứửữựûüůū","UÙÚỦŨỤƯỪỨỬỮỰÛÜŮŪ","yýỳỷỹỵÿ","YÝỲỶỸỴŸ","zžżź","ZŽŻŹ"]:["aàáảãạăằắẳẵặâầấẩẫậäåāąAÀÁẢÃẠĂẰẮẲẴẶÂẦẤẨẪẬÄÅĀĄ","cçćčCÇĆČ","dđďDĐĎ","eèéẻẽẹêềếểễệëěēęEÈÉẺẼẸÊỀẾỂỄỆËĚĒĘ","iìíỉĩịîïīIÌÍỈĨỊÎÏĪ","lłLŁ","nñňńNÑŇŃ","oòóỏõọôồốổỗộơởỡớờợöøōOÒÓỎÕỌÔỒỐỔỖỘƠỞỠỚỜỢÖØŌ","rřRŘ","sšśșşSŠŚȘŞ","tťțţTŤȚŢ","uùúủũụưừứửữựûüůūUÙÚỦŨỤƯỪỨỬỮỰÛÜŮŪ","yýỳỷỹỵÿYÝỲỶỸỴŸ","zžżźZŽŻŹ"],r=[];return e.split("").forEach((function(o){n.every((function(n){if(-1!==n.indexOf(o)){if(r.indexOf(n)>-1)return!1;e=e.replace(new RegExp("["+n+"]","gm"+t),"["+n+"]"),r.push(n)}return!0}))})),e}},{key:"createMergedBlanksRegExp",value:function(e){return e.replace(/[\s]+/gim,"[\\s]+")}},{key:"createAccuracyRegExp",value:function(e){var t=this,n=this.opt.accuracy,r="string"==typeof n?n:n.value,o="string"==typeof n?[]:n.limiters,i="";switch(o.forEach((function(e){i+="|"+t.escapeStr(e)})),r){case"partially":default:return"()("+e+")";case"complementary":return"()([^"+(i="\\s"+(i||this.escapeStr("!\"#$%&'()*+,-./:;<=>?@[\\]^_`{|}~¡¿")))+"]*"+e+"[^"+i+"]*)";case"exactly":return"(^|\\s"+i+")("+e+")(?=$|\\s"+i+")"}}},{key:"getSeparatedKeywords",value:function(e){var t=this,n=[];return e.forEach((function(e){t.opt.separateWordSearch?e.split(" ").forEach((function(e){e.trim()&&-1===n.indexOf(e)&&n.push(e)})):e.trim()&&-1===n.indexOf(e)&&n.push(e)})),{keywords:n.sort((function(e,t){return t.length-e.length})),length:n.length}}},{key:"isNumeric",value:function(e){return Number(parseFloat(e))==e}},{key:"checkRanges",value:function(e){var t=this;if(!Array.isArray(e)||"[object Object]"!==Object.prototype.toString.call(e[0]))return this.log("markRanges() will only accept an array of objects"),this.opt.noMatch(e),[];var n=[],r=0;return e.sort((function(e,t){return e.start-t.start})).forEach((function(e){var o=t.callNoMatchOnInvalidRanges(e,r),i=o.start,a=o.end;o.valid&&(e.start=i,e.length=a-i,n.push(e),r=a)})),n}},{key:"callNoMatchOnInvalidRanges",value:function(e,t){var n=void 0,r=void 0,o=!1;return e&&void 0!==e.start?(r=(n=parseInt(e.start,10))+parseInt(e.length,10),this.isNumeric(e.start)&&this.isNumeric(e.length)&&r-t>0&&r-n>0?o=!0:(this.log("Ignoring invalid or overlapping range: "+JSON.stringify(e)),this.opt.noMatch(e))):(this.log("Ignoring invalid range: "+JSON.stringify(e)),this.opt.noMatch(e)),{start:n,end:r,valid:o}}},{key:"checkWhitespaceRanges",value:function(e,t,n){var r=void 0,o=!0,i=n.length,a=t-i,s=parseInt(e.start,10)-a;return(r=(s=s>i?i:s)+parseInt(e.length,10))>i&&(r=i,this.log("End range automatically set to the max value of "+i)),s<0||r-s<0||s>i||r>i?(o=!1,this.log("Invalid range: "+JSON.stringify(e)),this.opt.noMatch(e)):""===n.substring(s,r).replace(/\s+/g,"")&&(o=!1,this.log("Skipping whitespace only range: "+JSON.stringify(e)),this.opt.noMatch(e)),{start:s,end:r,valid:o}}},{key:"getTextNodes",value:function(e){var t=this,n="",r=[];this.iterator.forEachNode(NodeFilter.SHOW_TEXT,(function(e){r.push({start:n.length,end:(n+=e.textContent).length,node:e})}),(function(e){return t.matchesExclude(e.parentNode)?NodeFilter.FILTER_REJECT:NodeFilter.FILTER_ACCEPT}),(function(){e({value:n,nodes:r})}))}},{key:"matchesExclude",value:function(e){return o.matches(e,this.opt.exclude.concat(["script","style","title","head","html"]))}},{key:"wrapRangeInTextNode",value:function(e,t,n){var r=this.opt.element?this.opt.element:"mark",o=e.splitText(t),i=o.splitText(n-t),a=document.createElement(r);return a.setAttribute("data-markjs","true"),this.opt.className&&a.setAttribute("class",this.opt.className),a.textContent=o.textContent,o.parentNode.replaceChild(a,o),i}},{key:"wrapRangeInMappedTextNode",value:function(e,t,n,r,o){var i=this;e.nodes.every((function(a,s){var l=e.nodes[s+1];if(void 0===l||l.start>t){if(!r(a.node))return!1;var c=t-a.start,u=(n>a.end?a.end:n)-a.start,p=e.value.substr(0,a.start),f=e.value.substr(u+a.start);if(a.node=i.wrapRangeInTextNode(a.node,c,u),e.value=p+f,e.nodes.forEach((function(t,n){n>=s&&(e.nodes[n].start>0&&n!==s&&(e.nodes[n].start-=u),e.nodes[n].end-=u)})),n-=u,o(a.node.previousSibling,a.start),!(n>a.end))return!1;t=a.end}return!0}))}},{key:"wrapMatches",value:function(e,t,n,r,o){var i=this,a=0===t?0:t+1;this.getTextNodes((function(t){t.nodes.forEach((function(t){t=t.node;for(var o=void 0;null!==(o=e.exec(t.textContent))&&""!==o[a];)if(n(o[a],t)){var s=o.index;if(0!==a)for(var l=1;l<a;l++)s+=o[l].length;t=i.wrapRangeInTextNode(t,s,s+o[a].length),r(t.previousSibling),e.lastIndex=0}})),o()}))}},{key:"wrapMatchesAcrossElements",value:function(e,t,n,r,o){var i=this,a=0===t?0:t+1;this.getTextNodes((function(t){for(var s=void 0;null!==(s=e.exec(t.value))&&""!==s[a];){var l=s.index;if(0!==a)for(var c=1;c<a;c++)l+=s[c].length;var u=l+s[a].length;i.wrapRangeInMappedTextNode(t,l,u,(function(e){return n(s[a],e)}),(function(t,n){e.lastIndex=n,r(t)}))}o()}))}},{key:"wrapRangeFromIndex",value:function(e,t,n,r){var o=this;this.getTextNodes((function(i){var a=i.value.length;e.forEach((function(e,r){var s=o.checkWhitespaceRanges(e,a,i.value),l=s.start,c=s.end;s.valid&&o.wrapRangeInMappedTextNode(i,l,c,(function(n){return t(n,e,i.value.substring(l,c),r)}),(function(t){n(t,e)}))})),r()}))}},{key:"unwrapMatches",value:function(e){for(var t=e.parentNode,n=document.createDocumentFragment();e.firstChild;)n.appendChild(e.removeChild(e.firstChild));t.replaceChild(n,e),this.ie?this.normalizeTextNode(t):t.normalize()}},{key:"normalizeTextNode",value:function(e){if(e){if(3===e.nodeType)for(;e.nextSibling&&3===e.nextSibling.nodeType;)e.nodeValue+=e.nextSibling.nodeValue,e.parentNode.removeChild(e.nextSibling);else this.normalizeTextNode(e.firstChild);this.normalizeTextNode(e.nextSibling)}}},{key:"markRegExp",value:function(e,t){var n=this;this.opt=t,this.log('Searching with expression "'+e+'"');var r=0,o="wrapMatches";this.opt.acrossElements&&(o="wrapMatchesAcrossElements"),this[o](e,this.opt.ignoreGroups,(function(e,t){return n.opt.filter(t,e,r)}),(function(e){r++,n.opt.each(e)}),(function(){0===r&&n.opt.noMatch(e),n.opt.done(r)}))}},{key:"mark",value:function(e,t){var n=this;this.opt=t;var r=0,o="wrapMatches",i=this.getSeparatedKeywords("string"==typeof e?[e]:e),a=i.keywords,s=i.length,l=this.opt.caseSensitive?"":"i";this.opt.acrossElements&&(o="wrapMatchesAcrossElements"),0===s?this.opt.done(r):function e(t){var i=new RegExp(n.createRegExp(t),"gm"+l),c=0;n.log('Searching with expression "'+i+'"'),n[o](i,1,(function(e,o){return n.opt.filter(o,t,r,c)}),(function(e){c++,r++,n.opt.each(e)}),(function(){0===c&&n.opt.noMatch(t),a[s-1]===t?n.opt.done(r):e(a[a.indexOf(t)+1])}))}(a[0])}},{key:"markRanges",value:function(e,t){var n=this;this.opt=t;var r=0,o=this.checkRanges(e);o&&o.length?(this.log("Starting to mark with the following ranges: "+JSON.stringify(o)),this.wrapRangeFromIndex(o,(function(e,t,r,o){return n.opt.filter(e,t,r,o)}),(function(e,t){r++,n.opt.each(e,t)}),(function(){n.opt.done(r)}))):this.opt.done(r)}},{key:"unmark",value:function(e){var t=this;this.opt=e;var n=this.opt.element?this.opt.element:"*";n+="[data-markjs]",this.opt.className&&(n+="."+this.opt.className),this.log('Removal selector "'+n+'"'),this.iterator.forEachNode(NodeFilter.SHOW_ELEMENT,(function(e){t.unwrapMatches(e)}),(function(e){var r=o.matches(e,n),i=t.matchesExclude(e);return!r||i?NodeFilter.FILTER_REJECT:NodeFilter.FILTER_ACCEPT}),this.opt.done)}},{key:"opt",set:function(e){this._opt=r({},{element:"",className:"",exclude:[],iframes:!1,iframesTimeout:5e3,separateWordSearch:!0,diacritics:!0,synonyms:{},accuracy:"partially",acrossElements:!1,caseSensitive:!1,ignoreJoiners:!1,ignoreGroups:0,ignorePunctuation:[],wildcards:"disabled",each:function(){},noMatch:function(){},filter:function(){return!0},done:function(){},debug:!1,log:window.console},e)},get:function(){return this._opt}},{key:"iterator",get:function(){return new o(this.ctx,this.opt.iframes,this.opt.exclude,this.opt.iframesTimeout)}}]),i}();return function(e){var t=this,n=new i(e);return this.mark=function(e,r){return n.mark(e,r),t},this.markRegExp=function(e,r){return n.markRegExp(e,r),t},this.markRanges=function(e,r){return n.markRanges(e,r),t},this.unmark=function(e){return n.unmark(e),t},this}}()},function(e,t,n){e.exports=function e(t,n,r){function o(a,s){if(!n[a]){if(!t[a]){if(i)return i(a,!0);var l=new Error("Cannot find module '"+a+"'");throw l.code="MODULE_NOT_FOUND",l}var c=n[a]={exports:{}};t[a][0].call(c.exports,(function(e){return o(t[a][1][e]||e)}),c,c.exports,e,t,n,r)}return n[a].exports}for(var i=!1,a=0;a<r.length;a++)o(r[a]);return o}({1:[function(e,t,n){var r=Object.prototype.hasOwnProperty,o=Object.prototype.toString;t.exports=function(e,t,n){if("[object Function]"!==o.call(t))throw new TypeError("iterator must be a function");var i=e.length;if(i===+i)for(var a=0;a<i;a++)t.call(n,e[a],a,e);else for(var s in e)r.call(e,s)&&t.call(n,e[s],s,e)}},{}],2:[function(e,t,n){"use strict";var r=e("foreach");function o(e,t,n){if(3===arguments.length)return o.set(e,t,n);if(2===arguments.length)return o.get(e,t);var r=o.bind(o,e);for(var i in o)o.hasOwnProperty(i)&&(r[i]=o[i].bind(r,e));return r}t.exports=o,o.get=function(e,t){for(var n=Array.isArray(t)?t:o.parse(t),r=0;r<n.length;++r){var i=n[r];if("object"!=typeof e||!(i in e))throw new Error("Invalid reference token: "+i);e=e[i]}return e},o.set=function(e,t,n){for(var r=Array.isArray(t)?t:o.parse(t),i=r[0],a=0;a<r.length-1;++a){var s=r[a];"-"===s&&Array.isArray(e)&&(s=e.length),i=r[a+1],s in e||(i.match(/^(\d+|-)$/)?e[s]=[]:e[s]={}),e=e[s]}return"-"===i&&Array.isArray(e)&&(i=e.length),e[i]=n,this},o.remove=function(e,t){var n=Array.isArray(t)?t:o.parse(t),r=n[n.length-1];if(void 0===r)throw new Error('Invalid JSON pointer for remove: "'+t+'"');var i=o.get(e,n.slice(0,-1));if(Array.isArray(i)){var a=+r;if(""===r&&isNaN(a))throw new Error('Invalid array index: "'+r+'"');Array.prototype.splice.call(i,a,1)}else delete i[r]},o.dict=function(e,t){var n={};return o.walk(e,(function(e,t){n[t]=e}),t),n},o.walk=function(e,t,n){var i=[];n=n||function(e){var t=Object.prototype.toString.call(e);return"[object Object]"===t||"[object Array]"===t},function e(a){r(a,(function(r,a){i.push(String(a)),n(r)?e(r):t(r,o.compile(i)),i.pop()}))}(e)},o.has=function(e,t){try{o.get(e,t)}catch(e){return!1}return!0},o.escape=function(e){return e.toString().replace(/~/g,"~0").replace(/\//g,"~1")},o.unescape=function(e){return e.replace(/~1/g,"/").replace(/~0/g,"~")},o.parse=function(e){if(""===e)return[];if("/"!==e.charAt(0))throw new Error("Invalid JSON pointer: "+e);return e.substring(1).split(/\//).map(o.unescape)},o.compile=function(e){return 0===e.length?"":"/"+e.map(o.escape).join("/")}},{foreach:1}],3:[function(e,t,n){"use strict";Object.defineProperty(n,"__esModule",{value:!0}),n.allOfSample=function(e,t,n,i){var s=(0,r.traverse)(e,n,i),c=[],u=!0,p=!1,f=void 0;try{for(var d,h=t[Symbol.iterator]();!(u=(d=h.next()).done);u=!0){var m=d.value,g=(0,r.traverse)(a({type:y},m),n,i),y=g.type,v=g.readOnly,b=g.writeOnly,x=g.value;s.type&&y&&y!==s.type&&(console.warn("allOf: schemas with different types can't be merged"),s.type=y),s.type=s.type||y,s.readOnly=s.readOnly||v,s.writeOnly=s.writeOnly||b,null!=x&&c.push(x)}}catch(e){p=!0,f=e}finally{try{u||null==h.return||h.return()}finally{if(p)throw f}}if("object"===s.type)return s.value=o.mergeDeep.apply(void 0,[s.value||{}].concat(function(e){if(Array.isArray(e)){for(var t=0,n=new Array(e.length);t<e.length;t++)n[t]=e[t];return n}}(w=c.filter((function(e){return"object"===l(e)})))||function(e){if(Symbol.iterator in Object(e)||"[object Arguments]"===Object.prototype.toString.call(e))return Array.from(e)}(w)||function(){throw new TypeError("Invalid attempt to spread non-iterable instance")}())),s;"array"===s.type&&(n.quiet||console.warn('OpenAPI Sampler: found allOf with "array" type. Result may be incorrect'));var w,k=c[c.length-1];return s.value=null!=k?k:s.value,s};var r=e("./traverse"),o=e("./utils");function i(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function a(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?i(n,!0).forEach((function(t){s(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):i(n).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function s(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function l(e){return(l="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}},{"./traverse":12,"./utils":13}],4:[function(e,t,n){"use strict";Object.defineProperty(n,"__esModule",{value:!0}),n.inferType=function(e){if(void 0!==e.type)return e.type;for(var t=Object.keys(r),n=0;n<t.length;n++){var o=t[n],i=r[o];if(void 0!==e[o])return i}return null};var r={multipleOf:"number",maximum:"number",exclusiveMaximum:"number",minimum:"number",exclusiveMinimum:"number",maxLength:"string",minLength:"string",pattern:"string",items:"array",maxItems:"array",minItems:"array",uniqueItems:"array",additionalItems:"array",maxProperties:"object",minProperties:"object",required:"object",additionalProperties:"object",properties:"object",patternProperties:"object",dependencies:"object"}},{}],5:[function(e,t,n){"use strict";Object.defineProperty(n,"__esModule",{value:!0}),n.sample=function(e,t,n){var o=Object.assign({},s,t);return(0,r.clearCache)(),(0,r.traverse)(e,o,n).value},n._registerSampler=l,Object.defineProperty(n,"inferType",{enumerable:!0,get:function(){return i.inferType}}),n._samplers=void 0;var r=e("./traverse"),o=e("./samplers/index"),i=e("./infer"),a={};n._samplers=a;var s={skipReadOnly:!1};function l(e,t){a[e]=t}l("array",o.sampleArray),l("boolean",o.sampleBoolean),l("integer",o.sampleNumber),l("number",o.sampleNumber),l("object",o.sampleObject),l("string",o.sampleString)},{"./infer":4,"./samplers/index":8,"./traverse":12}],6:[function(e,t,n){"use strict";Object.defineProperty(n,"__esModule",{value:!0}),n.sampleArray=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=arguments.length>2?arguments[2]:void 0,o=e.minItems||1;Array.isArray(e.items)&&(o=Math.max(o,e.items.length));var i=function(t){return Array.isArray(e.items)?e.items[t]||{}:e.items||{}},a=[];if(!e.items)return a;for(var s=0;s<o;s++){var l=i(s),c=(0,r.traverse)(l,t,n),u=c.value;a.push(u)}return a};var r=e("../traverse")},{"../traverse":12}],7:[function(e,t,n){"use strict";Object.defineProperty(n,"__esModule",{value:!0}),n.sampleBoolean=function(e){return!0}},{}],8:[function(e,t,n){"use strict";Object.defineProperty(n,"__esModule",{value:!0}),Object.defineProperty(n,"sampleArray",{enumerable:!0,get:function(){return r.sampleArray}}),Object.defineProperty(n,"sampleBoolean",{enumerable:!0,get:function(){return o.sampleBoolean}}),Object.defineProperty(n,"sampleNumber",{enumerable:!0,get:function(){return i.sampleNumber}}),Object.defineProperty(n,"sampleObject",{enumerable:!0,get:function(){return a.sampleObject}}),Object.defineProperty(n,"sampleString",{enumerable:!0,get:function(){return s.sampleString}});var r=e("./array"),o=e("./boolean"),i=e("./number"),a=e("./object"),s=e("./string")},{"./array":6,"./boolean":7,"./number":9,"./object":10,"./string":11}],9:[function(e,t,n){"use strict";Object.defineProperty(n,"__esModule",{value:!0}),n.sampleNumber=function(e){var t;return e.maximum&&e.minimum?(t=e.exclusiveMinimum?Math.floor(e.minimum)+1:e.minimum,(e.exclusiveMaximum&&t>=e.maximum||!e.exclusiveMaximum&&t>e.maximum)&&(t=(e.maximum+e.minimum)/2),t):e.minimum?e.exclusiveMinimum?Math.floor(e.minimum)+1:e.minimum:e.maximum?e.exclusiveMaximum?e.maximum>0?0:Math.floor(e.maximum)-1:e.maximum>0?0:e.maximum:0}},{}],10:[function(e,t,n){"use strict";Object.defineProperty(n,"__esModule",{value:!0}),n.sampleObject=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=arguments.length>2?arguments[2]:void 0,i={};if(e&&"object"===o(e.properties)){var a=Array.isArray(e.required)?e.required:[],s=a.reduce((function(e,t){return e[t]=!0,e}),{});Object.keys(e.properties).forEach((function(o){if(!t.skipNonRequired||s.hasOwnProperty(o)){var a=(0,r.traverse)(e.properties[o],t,n,{propertyName:o});t.skipReadOnly&&a.readOnly||t.skipWriteOnly&&a.writeOnly||(i[o]=a.value)}}))}return e&&"object"===o(e.additionalProperties)&&(i.property1=(0,r.traverse)(e.additionalProperties,t,n).value,i.property2=(0,r.traverse)(e.additionalProperties,t,n).value),i};var r=e("../traverse");function o(e){return(o="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}},{"../traverse":12}],11:[function(e,t,n){"use strict";Object.defineProperty(n,"__esModule",{value:!0}),n.sampleString=function(e,t,n,r){var o=e.format||"default",s=a[o]||i,l=r&&r.propertyName;return s(0|e.minLength,e.maxLength,l)};var r=e("../utils");function o(e,t,n){var o=(0,r.toRFCDateTime)(new Date("2019-08-24T14:15:22.123Z"),n,!1);return o.length<e&&console.warn("Using minLength = ".concat(e,' is incorrect with format "date-time"')),t&&o.length>t&&console.warn("Using maxLength = ".concat(t,' is incorrect with format "date-time"')),o}function i(e,t){var n=(0,r.ensureMinLength)("string",e);return t&&n.length>t&&(n=n.substring(0,t)),n}var a={email:function(){return"user@example.com"},password:function(e,t){var n="pa$$word";return e>n.length&&(n+="_",n+=(0,r.ensureMinLength)("qwerty!@#$%^123456",e-n.length).substring(0,e-n.length)),n},"date-time":function(e,t){return o(e,t)},date:function(e,t){return o(e,t,!0)},ipv4:function(){return"192.168.0.1"},ipv6:function(){return"2001:0db8:85a3:0000:0000:8a2e:0370:7334"},hostname:function(){return"example.com"},uri:function(){return"http://example.com"},uuid:function(e,t,n){return(0,r.uuid)(n||"id")},default:i}},{"../utils":13}],12:[function(e,t,n){"use strict";Object.defineProperty(n,"__esModule",{value:!0}),n.clearCache=function(){u={}},n.traverse=function e(t,n,r,p){if(t.$ref){if(!r)throw new Error("Your schema contains $ref. You must provide full specification in the third parameter.");var f=decodeURIComponent(t.$ref);f.startsWith("#")&&(f=f.substring(1));var d,h=s.default.get(r,f);if(!0!==u[f])u[f]=!0,d=e(h,n,r),u[f]=!1;else{var m=(0,a.inferType)(h);d={value:"object"===m?{}:"array"===m?[]:void 0}}return d}if(void 0!==t.example)return{value:t.example,readOnly:t.readOnly,writeOnly:t.writeOnly,type:t.type};if(void 0!==t.allOf)return(0,i.allOfSample)(function(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?l(n,!0).forEach((function(t){c(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):l(n).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}({},t,{allOf:void 0}),t.allOf,n,r);if(t.oneOf&&t.oneOf.length)return t.anyOf&&(n.quiet||console.warn("oneOf and anyOf are not supported on the same level. Skipping anyOf")),e(t.oneOf[0],n,r);if(t.anyOf&&t.anyOf.length)return e(t.anyOf[0],n,r);var g=null,y=null;if(void 0!==t.default)g=t.default;else if(void 0!==t.const)g=t.const;else if(void 0!==t.enum&&t.enum.length)g=t.enum[0];else if(void 0!==t.examples&&t.examples.length)g=t.examples[0];else{(y=t.type)||(y=(0,a.inferType)(t));var v=o._samplers[y];v&&(g=v(t,n,r,p))}return{value:g,readOnly:t.readOnly,writeOnly:t.writeOnly,type:y}};var r,o=e("./openapi-sampler"),i=e("./allOf"),a=e("./infer"),s=(r=e("json-pointer"))&&r.__esModule?r:{default:r};function l(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function c(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}var u={}},{"./allOf":3,"./infer":4,"./openapi-sampler":5,"json-pointer":2}],13:[function(e,t,n){"use strict";function r(e){return(r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e})(e)}function o(e){return e<10?"0"+e:e}Object.defineProperty(n,"__esModule",{value:!0}),n.toRFCDateTime=function(e,t,n){var r=e.getUTCFullYear()+"-"+o(e.getUTCMonth()+1)+"-"+o(e.getUTCDate());return t||(r+="T"+o(e.getUTCHours())+":"+o(e.getUTCMinutes())+":"+o(e.getUTCSeconds())+(n?"."+(e.getUTCMilliseconds()/1e3).toFixed(3).slice(2,5):"")+"Z"),r},n.ensureMinLength=function(e,t){return t>e.length?e.repeat(Math.trunc(t/e.length)+1).substring(0,t):e},n.mergeDeep=function e(){for(var t=function(e){return e&&"object"===r(e)},n=arguments.length,o=new Array(n),i=0;i<n;i++)o[i]=arguments[i];return o.reduce((function(n,r){return Object.keys(r).forEach((function(o){var i=n[o],a=r[o];t(i)&&t(a)?n[o]=e(i,a):n[o]=a})),n}),Array.isArray(o[o.length-1])?[]:{})},n.uuid=function(e){var t,n,r,o,i=function(e){var t=0;if(0==e.length)return t;for(var n=0;n<e.length;n++){var r=e.charCodeAt(n);t=(t<<5)-t+r,t&=t}return t}(e),a=(t=i,n=i,r=i,o=i,function(){var e=(t|=0)-((n|=0)<<27|n>>>5)|0;return t=n^((r|=0)<<17|r>>>15),n=r+(o|=0)|0,r=o+e|0,((o=t+e|0)>>>0)/4294967296});return"xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx".replace(/[xy]/g,(function(e){var t=16*a()%16|0;return("x"==e?t:3&t|8).toString(16)}))}},{}]},{},[5])(5)},function(e,t,n){(t=n(313)(!1)).push([e.i,"/*\n * Container style\n */\n.ps {\n  overflow: hidden !important;\n  overflow-anchor: none;\n  -ms-overflow-style: none;\n  touch-action: auto;\n  -ms-touch-action: auto;\n}\n\n/*\n * Scrollbar rail styles\n */\n.ps__rail-x {\n  display: none;\n  opacity: 0;\n  transition: background-color .2s linear, opacity .2s linear;\n  -webkit-transition: background-color .2s linear, opacity .2s linear;\n  height: 15px;\n  /* there must be 'bottom' or 'top' for ps__rail-x */\n  bottom: 0px;\n  /* please don't change 'position' */\n  position: absolute;\n}\n\n.ps__rail-y {\n  display: none;\n  opacity: 0;\n  transition: background-color .2s linear, opacity .2s linear;\n  -webkit-transition: background-color .2s linear, opacity .2s linear;\n  width: 15px;\n  /* there must be 'right' or 'left' for ps__rail-y */\n  right: 0;\n  /* please don't change 'position' */\n  position: absolute;\n}\n\n.ps--active-x > .ps__rail-x,\n.ps--active-y > .ps__rail-y {\n  display: block;\n  background-color: transparent;\n}\n\n.ps:hover > .ps__rail-x,\n.ps:hover > .ps__rail-y,\n.ps--focus > .ps__rail-x,\n.ps--focus > .ps__rail-y,\n.ps--scrolling-x > .ps__rail-x,\n.ps--scrolling-y > .ps__rail-y {\n  opacity: 0.6;\n}\n\n.ps .ps__rail-x:hover,\n.ps .ps__rail-y:hover,\n.ps .ps__rail-x:focus,\n.ps .ps__rail-y:focus,\n.ps .ps__rail-x.ps--clicking,\n.ps .ps__rail-y.ps--clicking {\n  background-color: #eee;\n  opacity: 0.9;\n}\n\n/*\n * Scrollbar thumb styles\n */\n.ps__thumb-x {\n  background-color: #aaa;\n  border-radius: 6px;\n  transition: background-color .2s linear, height .2s ease-in-out;\n  -webkit-transition: background-color .2s linear, height .2s ease-in-out;\n  height: 6px;\n  /* there must be 'bottom' for ps__thumb-x */\n  bottom: 2px;\n  /* please don't change 'position' */\n  position: absolute;\n}\n\n.ps__thumb-y {\n  background-color: #aaa;\n  border-radius: 6px;\n  transition: background-color .2s linear, width .2s ease-in-out;\n  -webkit-transition: background-color .2s linear, width .2s ease-in-out;\n  width: 6px;\n  /* there must be 'right' for ps__thumb-y */\n  right: 2px;\n  /* please don't change 'position' */\n  position: absolute;\n}\n\n.ps__rail-x:hover > .ps__thumb-x,\n.ps__rail-x:focus > .ps__thumb-x,\n.ps__rail-x.ps--clicking .ps__thumb-x {\n  background-color: #999;\n  height: 11px;\n}\n\n.ps__rail-y:hover > .ps__thumb-y,\n.ps__rail-y:focus > .ps__thumb-y,\n.ps__rail-y.ps--clicking .ps__thumb-y {\n  background-color: #999;\n  width: 11px;\n}\n\n/* MS supports */\n@supports (-ms-overflow-style: none) {\n  .ps {\n    overflow: auto !important;\n  }\n}\n\n@media screen and (-ms-high-contrast: active), (-ms-high-contrast: none) {\n  .ps {\n    overflow: auto !important;\n  }\n}\n",""]),e.exports=t},function(e,t,n){"use strict";var r=/^((children|dangerouslySetInnerHTML|key|ref|autoFocus|defaultValue|defaultChecked|innerHTML|suppressContentEditableWarning|suppressHydrationWarning|valueLink|accept|acceptCharset|accessKey|action|allow|allowUserMedia|allowPaymentRequest|allowFullScreen|allowTransparency|alt|async|autoComplete|autoPlay|capture|cellPadding|cellSpacing|challenge|charSet|checked|cite|classID|className|cols|colSpan|content|contentEditable|contextMenu|controls|controlsList|coords|crossOrigin|data|dateTime|decoding|default|defer|dir|disabled|disablePictureInPicture|download|draggable|encType|form|formAction|formEncType|formMethod|formNoValidate|formTarget|frameBorder|headers|height|hidden|high|href|hrefLang|htmlFor|httpEquiv|id|inputMode|integrity|is|keyParams|keyType|kind|label|lang|list|loading|loop|low|marginHeight|marginWidth|max|maxLength|media|mediaGroup|method|min|minLength|multiple|muted|name|nonce|noValidate|open|optimum|pattern|placeholder|playsInline|poster|preload|profile|radioGroup|readOnly|referrerPolicy|rel|required|reversed|role|rows|rowSpan|sandbox|scope|scoped|scrolling|seamless|selected|shape|size|sizes|slot|span|spellCheck|src|srcDoc|srcLang|srcSet|start|step|style|summary|tabIndex|target|title|type|useMap|value|width|wmode|wrap|about|datatype|inlist|prefix|property|resource|typeof|vocab|autoCapitalize|autoCorrect|autoSave|color|inert|itemProp|itemScope|itemType|itemID|itemRef|on|results|security|unselectable|accentHeight|accumulate|additive|alignmentBaseline|allowReorder|alphabetic|amplitude|arabicForm|ascent|attributeName|attributeType|autoReverse|azimuth|baseFrequency|baselineShift|baseProfile|bbox|begin|bias|by|calcMode|capHeight|clip|clipPathUnits|clipPath|clipRule|colorInterpolation|colorInterpolationFilters|colorProfile|colorRendering|contentScriptType|contentStyleType|cursor|cx|cy|d|decelerate|descent|diffuseConstant|direction|display|divisor|dominantBaseline|dur|dx|dy|edgeMode|elevation|enableBackground|end|exponent|externalResourcesRequired|fill|fillOpacity|fillRule|filter|filterRes|filterUnits|floodColor|floodOpacity|focusable|fontFamily|fontSize|fontSizeAdjust|fontStretch|fontStyle|fontVariant|fontWeight|format|from|fr|fx|fy|g1|g2|glyphName|glyphOrientationHorizontal|glyphOrientationVertical|glyphRef|gradientTransform|gradientUnits|hanging|horizAdvX|horizOriginX|ideographic|imageRendering|in|in2|intercept|k|k1|k2|k3|k4|kernelMatrix|kernelUnitLength|kerning|keyPoints|keySplines|keyTimes|lengthAdjust|letterSpacing|lightingColor|limitingConeAngle|local|markerEnd|markerMid|markerStart|markerHeight|markerUnits|markerWidth|mask|maskContentUnits|maskUnits|mathematical|mode|numOctaves|offset|opacity|operator|order|orient|orientation|origin|overflow|overlinePosition|overlineThickness|panose1|paintOrder|pathLength|patternContentUnits|patternTransform|patternUnits|pointerEvents|points|pointsAtX|pointsAtY|pointsAtZ|preserveAlpha|preserveAspectRatio|primitiveUnits|r|radius|refX|refY|renderingIntent|repeatCount|repeatDur|requiredExtensions|requiredFeatures|restart|result|rotate|rx|ry|scale|seed|shapeRendering|slope|spacing|specularConstant|specularExponent|speed|spreadMethod|startOffset|stdDeviation|stemh|stemv|stitchTiles|stopColor|stopOpacity|strikethroughPosition|strikethroughThickness|string|stroke|strokeDasharray|strokeDashoffset|strokeLinecap|strokeLinejoin|strokeMiterlimit|strokeOpacity|strokeWidth|surfaceScale|systemLanguage|tableValues|targetX|targetY|textAnchor|textDecoration|textRendering|textLength|to|transform|u1|u2|underlinePosition|underlineThickness|unicode|unicodeBidi|unicodeRange|unitsPerEm|vAlphabetic|vHanging|vIdeographic|vMathematical|values|vectorEffect|version|vertAdvY|vertOriginX|vertOriginY|viewBox|viewTarget|visibility|widths|wordSpacing|writingMode|x|xHeight|x1|x2|xChannelSelector|xlinkActuate|xlinkArcrole|xlinkHref|xlinkRole|xlinkShow|xlinkTitle|xlinkType|xmlBase|xmlns|xmlnsXlink|xmlLang|xmlSpace|y|y1|y2|yChannelSelector|z|zoomAndPan|for|class|autofocus)|(([Dd][Aa][Tt][Aa]|[Aa][Rr][Ii][Aa]|x)-.*))$/,o=function(e){var t={};return function(n){return void 0===t[n]&&(t[n]=e(n)),t[n]}}((function(e){return r.test(e)||111===e.charCodeAt(0)&&110===e.charCodeAt(1)&&e.charCodeAt(2)<91}));t.a=o},function(e,t,n){var r=n(3),o=n(70),i=r["__core-js_shared__"]||o("__core-js_shared__",{});e.exports=i},function(e,t,n){var r=n(18),o=n(8),i=n(71);e.exports=!r&&!o((function(){return 7!=Object.defineProperty(i("div"),"a",{get:function(){return 7}}).a}))},function(e,t,n){var r=n(72);e.exports=r&&!Symbol.sham&&"symbol"==typeof Symbol.iterator},function(e,t,n){var r=n(68),o=n(27),i=n(4)("toStringTag"),a="Arguments"==o(function(){return arguments}());e.exports=r?o:function(e){var t,n,r;return void 0===e?"Undefined":null===e?"Null":"string"==typeof(n=function(e,t){try{return e[t]}catch(e){}}(t=Object(e),i))?n:a?o(t):"Object"==(r=o(t))&&"function"==typeof t.callee?"Arguments":r}},function(e,t,n){"use strict";var r=n(164).charAt,o=n(32),i=n(75),a=o.set,s=o.getterFor("String Iterator");i(String,"String",(function(e){a(this,{type:"String Iterator",string:String(e),index:0})}),(function(){var e,t=s(this),n=t.string,o=t.index;return o>=n.length?{value:void 0,done:!0}:(e=r(n,o),t.index+=e.length,{value:e,done:!1})}))},function(e,t,n){var r=n(11),o=n(165),i=n(33),a=n(16);e.exports=function(e,t){for(var n=o(t),s=a.f,l=i.f,c=0;c<n.length;c++){var u=n[c];r(e,u)||s(e,u,l(t,u))}}},function(e,t,n){var r=n(11),o=n(34),i=n(166).indexOf,a=n(41);e.exports=function(e,t){var n,s=o(e),l=0,c=[];for(n in s)!r(a,n)&&r(s,n)&&c.push(n);for(;t.length>l;)r(s,n=t[l++])&&(~i(c,n)||c.push(n));return c}},function(e,t,n){"use strict";var r,o,i,a=n(108),s=n(23),l=n(11),c=n(4),u=n(22),p=c("iterator"),f=!1;[].keys&&("next"in(i=[].keys())?(o=a(a(i)))!==Object.prototype&&(r=o):f=!0),null==r&&(r={}),u||l(r,p)||s(r,p,(function(){return this})),e.exports={IteratorPrototype:r,BUGGY_SAFARI_ITERATORS:f}},function(e,t,n){var r=n(11),o=n(43),i=n(53),a=n(169),s=i("IE_PROTO"),l=Object.prototype;e.exports=a?Object.getPrototypeOf:function(e){return e=o(e),r(e,s)?e[s]:"function"==typeof e.constructor&&e instanceof e.constructor?e.constructor.prototype:e instanceof Object?l:null}},function(e,t,n){var r=n(28);e.exports=r("document","documentElement")},function(e,t,n){var r=n(19),o=n(171);e.exports=Object.setPrototypeOf||("__proto__"in{}?function(){var e,t=!1,n={};try{(e=Object.getOwnPropertyDescriptor(Object.prototype,"__proto__").set).call(n,[]),t=n instanceof Array}catch(e){}return function(n,i){return r(n),o(i),t?e.call(n,i):n.__proto__=i,n}}():void 0)},function(e,t,n){var r=n(3),o=n(172),i=n(173),a=n(23),s=n(4),l=s("iterator"),c=s("toStringTag"),u=i.values;for(var p in o){var f=r[p],d=f&&f.prototype;if(d){if(d[l]!==u)try{a(d,l,u)}catch(e){d[l]=u}if(d[c]||a(d,c,p),o[p])for(var h in i)if(d[h]!==i[h])try{a(d,h,i[h])}catch(e){d[h]=i[h]}}}},function(e,t,n){var r=n(4),o=n(54),i=n(16),a=r("unscopables"),s=Array.prototype;null==s[a]&&i.f(s,a,{configurable:!0,value:o(null)}),e.exports=function(e){s[a][e]=!0}},function(e,t,n){var r=n(3);e.exports=r.Promise},function(e,t,n){var r=n(24);e.exports=function(e,t,n){for(var o in t)r(e,o,t[o],n);return e}},function(e,t,n){"use strict";var r=n(28),o=n(16),i=n(4),a=n(18),s=i("species");e.exports=function(e){var t=r(e),n=o.f;a&&t&&!t[s]&&n(t,s,{configurable:!0,get:function(){return this}})}},function(e,t,n){var r=n(4)("iterator"),o=!1;try{var i=0,a={next:function(){return{done:!!i++}},return:function(){o=!0}};a[r]=function(){return this},Array.from(a,(function(){throw 2}))}catch(e){}e.exports=function(e,t){if(!t&&!o)return!1;var n=!1;try{var i={};i[r]=function(){return{next:function(){return{done:n=!0}}}},e(i)}catch(e){}return n}},function(e,t,n){var r=n(19),o=n(45),i=n(4)("species");e.exports=function(e,t){var n,a=r(e).constructor;return void 0===a||null==(n=r(a)[i])?t:o(n)}},function(e,t,n){var r,o,i,a=n(3),s=n(8),l=n(27),c=n(46),u=n(109),p=n(71),f=n(119),d=a.location,h=a.setImmediate,m=a.clearImmediate,g=a.process,y=a.MessageChannel,v=a.Dispatch,b=0,x={},w=function(e){if(x.hasOwnProperty(e)){var t=x[e];delete x[e],t()}},k=function(e){return function(){w(e)}},O=function(e){w(e.data)},E=function(e){a.postMessage(e+"",d.protocol+"//"+d.host)};h&&m||(h=function(e){for(var t=[],n=1;arguments.length>n;)t.push(arguments[n++]);return x[++b]=function(){("function"==typeof e?e:Function(e)).apply(void 0,t)},r(b),b},m=function(e){delete x[e]},"process"==l(g)?r=function(e){g.nextTick(k(e))}:v&&v.now?r=function(e){v.now(k(e))}:y&&!f?(i=(o=new y).port2,o.port1.onmessage=O,r=c(i.postMessage,i,1)):!a.addEventListener||"function"!=typeof postMessage||a.importScripts||s(E)||"file:"===d.protocol?r="onreadystatechange"in p("script")?function(e){u.appendChild(p("script")).onreadystatechange=function(){u.removeChild(this),w(e)}}:function(e){setTimeout(k(e),0)}:(r=E,a.addEventListener("message",O,!1))),e.exports={set:h,clear:m}},function(e,t,n){var r=n(120);e.exports=/(iphone|ipod|ipad).*applewebkit/i.test(r)},function(e,t,n){var r=n(28);e.exports=r("navigator","userAgent")||""},function(e,t,n){var r=n(19),o=n(9),i=n(84);e.exports=function(e,t){if(r(e),o(t)&&t.constructor===e)return t;var n=i.f(e);return(0,n.resolve)(t),n.promise}},function(e,t){e.exports=function(e){try{return{error:!1,value:e()}}catch(e){return{error:!0,value:e}}}},function(e,t,n){var r=n(46),o=n(77),i=n(43),a=n(36),s=n(124),l=[].push,c=function(e){var t=1==e,n=2==e,c=3==e,u=4==e,p=6==e,f=5==e||p;return function(d,h,m,g){for(var y,v,b=i(d),x=o(b),w=r(h,m,3),k=a(x.length),O=0,E=g||s,_=t?E(d,k):n?E(d,0):void 0;k>O;O++)if((f||O in x)&&(v=w(y=x[O],O,b),e))if(t)_[O]=v;else if(v)switch(e){case 3:return!0;case 5:return y;case 6:return O;case 2:l.call(_,y)}else if(u)return!1;return p?-1:c||u?u:_}};e.exports={forEach:c(0),map:c(1),filter:c(2),some:c(3),every:c(4),find:c(5),findIndex:c(6)}},function(e,t,n){var r=n(9),o=n(86),i=n(4)("species");e.exports=function(e,t){var n;return o(e)&&("function"!=typeof(n=e.constructor)||n!==Array&&!o(n.prototype)?r(n)&&null===(n=n[i])&&(n=void 0):n=void 0),new(void 0===n?Array:n)(0===t?0:t)}},function(e,t,n){var r=n(190);e.exports=function(e){if(r(e))throw TypeError("The method doesn't accept regular expressions");return e}},function(e,t,n){var r=n(4)("match");e.exports=function(e){var t=/./;try{"/./"[e](t)}catch(n){try{return t[r]=!1,"/./"[e](t)}catch(e){}}return!1}},function(e,t,n){var r=n(41),o=n(9),i=n(11),a=n(16).f,s=n(52),l=n(196),c=s("meta"),u=0,p=Object.isExtensible||function(){return!0},f=function(e){a(e,c,{value:{objectID:"O"+ ++u,weakData:{}}})},d=e.exports={REQUIRED:!1,fastKey:function(e,t){if(!o(e))return"symbol"==typeof e?e:("string"==typeof e?"S":"P")+e;if(!i(e,c)){if(!p(e))return"F";if(!t)return"E";f(e)}return e[c].objectID},getWeakData:function(e,t){if(!i(e,c)){if(!p(e))return!0;if(!t)return!1;f(e)}return e[c].weakData},onFreeze:function(e){return l&&d.REQUIRED&&p(e)&&!i(e,c)&&f(e),e}};r[c]=!0},function(e,t,n){var r=n(4);t.f=r},function(e,t,n){"use strict";
+/*
+object-assign
+(c) Sindre Sorhus
+@license MIT
+*/var r=Object.getOwnPropertySymbols,o=Object.prototype.hasOwnProperty,i=Object.prototype.propertyIsEnumerable;function a(e){if(null==e)throw new TypeError("Object.assign cannot be called with null or undefined");return Object(e)}e.exports=function(){try{if(!Object.assign)return!1;var e=new String("abc");if(e[5]="de","5"===Object.getOwnPropertyNames(e)[0])return!1;for(var t={},n=0;n<10;n++)t["_"+String.fromCharCode(n)]=n;if("0123456789"!==Object.getOwnPropertyNames(t).map((function(e){return t[e]})).join(""))return!1;var r={};return"abcdefghijklmnopqrst".split("").forEach((function(e){r[e]=e})),"abcdefghijklmnopqrst"===Object.keys(Object.assign({},r)).join("")}catch(e){return!1}}()?Object.assign:function(e,t){for(var n,s,l=a(e),c=1;c<arguments.length;c++){for(var u in n=Object(arguments[c]))o.call(n,u)&&(l[u]=n[u]);if(r){s=r(n);for(var p=0;p<s.length;p++)i.call(n,s[p])&&(l[s[p]]=n[s[p]])}}return l}},function(e,t){var n={}.toString;e.exports=Array.isArray||function(e){return"[object Array]"==n.call(e)}},function(e,t,n){"use strict";var r=n(238),o=n(239),i=n(263),a=n(264),s=n(265),l=n(267);function c(e){u(this,c.defaults),u(this,e)}function u(e,t){if(p(t))for(var n=Object.keys(t),r=0;r<n.length;r++){var o=n[r],i=t[o],a=e[o];p(i)?e[o]=u(a||{},i):void 0!==i&&(e[o]=i)}return e}function p(e){return e&&"object"==typeof e&&!Array.isArray(e)&&!(e instanceof RegExp)&&!(e instanceof Date)}e.exports=c,c.defaults={parse:{json:r,yaml:o,text:i,binary:a},resolve:{file:s,http:l,external:!0},dereference:{circular:!0}}},function(e,t,n){"use strict";var r=n(240),o=n(30);e.exports={parse:function(e,t){try{return r.safeLoad(e)}catch(e){throw e instanceof Error?e:o(e,e.message)}},stringify:function(e,t,n){try{var i=("string"==typeof n?n.length:n)||2;return r.safeDump(e,{indent:i})}catch(e){throw e instanceof Error?e:o(e,e.message)}}}},function(e,t,n){"use strict";var r=n(37);e.exports=new r({include:[n(134)]})},function(e,t,n){"use strict";var r=n(37);e.exports=new r({include:[n(88)],implicit:[n(247),n(248),n(249),n(250)]})},function(e,t,n){(function(e){t.fetch=s(e.fetch)&&s(e.ReadableStream),t.writableStream=s(e.WritableStream),t.abortController=s(e.AbortController),t.blobConstructor=!1;try{new Blob([new ArrayBuffer(1)]),t.blobConstructor=!0}catch(e){}var n;function r(){if(void 0!==n)return n;if(e.XMLHttpRequest){n=new e.XMLHttpRequest;try{n.open("GET",e.XDomainRequest?"/":"https://example.com")}catch(e){n=null}}else n=null;return n}function o(e){var t=r();if(!t)return!1;try{return t.responseType=e,t.responseType===e}catch(e){}return!1}var i=void 0!==e.ArrayBuffer,a=i&&s(e.ArrayBuffer.prototype.slice);function s(e){return"function"==typeof e}t.arraybuffer=t.fetch||i&&o("arraybuffer"),t.msstream=!t.fetch&&a&&o("ms-stream"),t.mozchunkedarraybuffer=!t.fetch&&i&&o("moz-chunked-arraybuffer"),t.overrideMimeType=t.fetch||!!r()&&s(r().overrideMimeType),t.vbArray=s(e.VBArray),n=null}).call(this,n(5))},function(e,t,n){(function(e,r,o){var i=n(135),a=n(31),s=n(137),l=t.readyStates={UNSENT:0,OPENED:1,HEADERS_RECEIVED:2,LOADING:3,DONE:4},c=t.IncomingMessage=function(t,n,a,l){var c=this;if(s.Readable.call(c),c._mode=a,c.headers={},c.rawHeaders=[],c.trailers={},c.rawTrailers=[],c.on("end",(function(){e.nextTick((function(){c.emit("close")}))})),"fetch"===a){if(c._fetchResponse=n,c.url=n.url,c.statusCode=n.status,c.statusMessage=n.statusText,n.headers.forEach((function(e,t){c.headers[t.toLowerCase()]=e,c.rawHeaders.push(t,e)})),i.writableStream){var u=new WritableStream({write:function(e){return new Promise((function(t,n){c._destroyed?n():c.push(new r(e))?t():c._resumeFetch=t}))},close:function(){o.clearTimeout(l),c._destroyed||c.push(null)},abort:function(e){c._destroyed||c.emit("error",e)}});try{return void n.body.pipeTo(u).catch((function(e){o.clearTimeout(l),c._destroyed||c.emit("error",e)}))}catch(e){}}var p=n.body.getReader();!function e(){p.read().then((function(t){if(!c._destroyed){if(t.done)return o.clearTimeout(l),void c.push(null);c.push(new r(t.value)),e()}})).catch((function(e){o.clearTimeout(l),c._destroyed||c.emit("error",e)}))}()}else{if(c._xhr=t,c._pos=0,c.url=t.responseURL,c.statusCode=t.status,c.statusMessage=t.statusText,t.getAllResponseHeaders().split(/\r?\n/).forEach((function(e){var t=e.match(/^([^:]+):\s*(.*)/);if(t){var n=t[1].toLowerCase();"set-cookie"===n?(void 0===c.headers[n]&&(c.headers[n]=[]),c.headers[n].push(t[2])):void 0!==c.headers[n]?c.headers[n]+=", "+t[2]:c.headers[n]=t[2],c.rawHeaders.push(t[1],t[2])}})),c._charset="x-user-defined",!i.overrideMimeType){var f=c.rawHeaders["mime-type"];if(f){var d=f.match(/;\s*charset=([^;])(;|$)/);d&&(c._charset=d[1].toLowerCase())}c._charset||(c._charset="utf-8")}}};a(c,s.Readable),c.prototype._read=function(){var e=this._resumeFetch;e&&(this._resumeFetch=null,e())},c.prototype._onXHRProgress=function(){var e=this,t=e._xhr,n=null;switch(e._mode){case"text:vbarray":if(t.readyState!==l.DONE)break;try{n=new o.VBArray(t.responseBody).toArray()}catch(e){}if(null!==n){e.push(new r(n));break}case"text":try{n=t.responseText}catch(t){e._mode="text:vbarray";break}if(n.length>e._pos){var i=n.substr(e._pos);if("x-user-defined"===e._charset){for(var a=new r(i.length),s=0;s<i.length;s++)a[s]=255&i.charCodeAt(s);e.push(a)}else e.push(i,e._charset);e._pos=n.length}break;case"arraybuffer":if(t.readyState!==l.DONE||!t.response)break;n=t.response,e.push(new r(new Uint8Array(n)));break;case"moz-chunked-arraybuffer":if(n=t.response,t.readyState!==l.LOADING||!n)break;e.push(new r(new Uint8Array(n)));break;case"ms-stream":if(n=t.response,t.readyState!==l.LOADING)break;var c=new o.MSStreamReader;c.onprogress=function(){c.result.byteLength>e._pos&&(e.push(new r(new Uint8Array(c.result.slice(e._pos)))),e._pos=c.result.byteLength)},c.onload=function(){e.push(null)},c.readAsArrayBuffer(n)}e._xhr.readyState===l.DONE&&"ms-stream"!==e._mode&&e.push(null)}}).call(this,n(14),n(15).Buffer,n(5))},function(e,t,n){(t=e.exports=n(138)).Stream=t,t.Readable=t,t.Writable=n(142),t.Duplex=n(38),t.Transform=n(144),t.PassThrough=n(275)},function(e,t,n){"use strict";(function(t,r){var o=n(58);e.exports=b;var i,a=n(130);b.ReadableState=v;n(139).EventEmitter;var s=function(e,t){return e.listeners(t).length},l=n(140),c=n(59).Buffer,u=t.Uint8Array||function(){};var p=Object.create(n(48));p.inherits=n(31);var f=n(269),d=void 0;d=f&&f.debuglog?f.debuglog("stream"):function(){};var h,m=n(270),g=n(141);p.inherits(b,l);var y=["error","close","destroy","pause","resume"];function v(e,t){e=e||{};var r=t instanceof(i=i||n(38));this.objectMode=!!e.objectMode,r&&(this.objectMode=this.objectMode||!!e.readableObjectMode);var o=e.highWaterMark,a=e.readableHighWaterMark,s=this.objectMode?16:16384;this.highWaterMark=o||0===o?o:r&&(a||0===a)?a:s,this.highWaterMark=Math.floor(this.highWaterMark),this.buffer=new m,this.length=0,this.pipes=null,this.pipesCount=0,this.flowing=null,this.ended=!1,this.endEmitted=!1,this.reading=!1,this.sync=!0,this.needReadable=!1,this.emittedReadable=!1,this.readableListening=!1,this.resumeScheduled=!1,this.destroyed=!1,this.defaultEncoding=e.defaultEncoding||"utf8",this.awaitDrain=0,this.readingMore=!1,this.decoder=null,this.encoding=null,e.encoding&&(h||(h=n(143).StringDecoder),this.decoder=new h(e.encoding),this.encoding=e.encoding)}function b(e){if(i=i||n(38),!(this instanceof b))return new b(e);this._readableState=new v(e,this),this.readable=!0,e&&("function"==typeof e.read&&(this._read=e.read),"function"==typeof e.destroy&&(this._destroy=e.destroy)),l.call(this)}function x(e,t,n,r,o){var i,a=e._readableState;null===t?(a.reading=!1,function(e,t){if(t.ended)return;if(t.decoder){var n=t.decoder.end();n&&n.length&&(t.buffer.push(n),t.length+=t.objectMode?1:n.length)}t.ended=!0,O(e)}(e,a)):(o||(i=function(e,t){var n;r=t,c.isBuffer(r)||r instanceof u||"string"==typeof t||void 0===t||e.objectMode||(n=new TypeError("Invalid non-string/buffer chunk"));var r;return n}(a,t)),i?e.emit("error",i):a.objectMode||t&&t.length>0?("string"==typeof t||a.objectMode||Object.getPrototypeOf(t)===c.prototype||(t=function(e){return c.from(e)}(t)),r?a.endEmitted?e.emit("error",new Error("stream.unshift() after end event")):w(e,a,t,!0):a.ended?e.emit("error",new Error("stream.push() after EOF")):(a.reading=!1,a.decoder&&!n?(t=a.decoder.write(t),a.objectMode||0!==t.length?w(e,a,t,!1):_(e,a)):w(e,a,t,!1))):r||(a.reading=!1));return function(e){return!e.ended&&(e.needReadable||e.length<e.highWaterMark||0===e.length)}(a)}function w(e,t,n,r){t.flowing&&0===t.length&&!t.sync?(e.emit("data",n),e.read(0)):(t.length+=t.objectMode?1:n.length,r?t.buffer.unshift(n):t.buffer.push(n),t.needReadable&&O(e)),_(e,t)}Object.defineProperty(b.prototype,"destroyed",{get:function(){return void 0!==this._readableState&&this._readableState.destroyed},set:function(e){this._readableState&&(this._readableState.destroyed=e)}}),b.prototype.destroy=g.destroy,b.prototype._undestroy=g.undestroy,b.prototype._destroy=function(e,t){this.push(null),t(e)},b.prototype.push=function(e,t){var n,r=this._readableState;return r.objectMode?n=!0:"string"==typeof e&&((t=t||r.defaultEncoding)!==r.encoding&&(e=c.from(e,t),t=""),n=!0),x(this,e,t,!1,n)},b.prototype.unshift=function(e){return x(this,e,null,!0,!1)},b.prototype.isPaused=function(){return!1===this._readableState.flowing},b.prototype.setEncoding=function(e){return h||(h=n(143).StringDecoder),this._readableState.decoder=new h(e),this._readableState.encoding=e,this};function k(e,t){return e<=0||0===t.length&&t.ended?0:t.objectMode?1:e!=e?t.flowing&&t.length?t.buffer.head.data.length:t.length:(e>t.highWaterMark&&(t.highWaterMark=function(e){return e>=8388608?e=8388608:(e--,e|=e>>>1,e|=e>>>2,e|=e>>>4,e|=e>>>8,e|=e>>>16,e++),e}(e)),e<=t.length?e:t.ended?t.length:(t.needReadable=!0,0))}function O(e){var t=e._readableState;t.needReadable=!1,t.emittedReadable||(d("emitReadable",t.flowing),t.emittedReadable=!0,t.sync?o.nextTick(E,e):E(e))}function E(e){d("emit readable"),e.emit("readable"),A(e)}function _(e,t){t.readingMore||(t.readingMore=!0,o.nextTick(S,e,t))}function S(e,t){for(var n=t.length;!t.reading&&!t.flowing&&!t.ended&&t.length<t.highWaterMark&&(d("maybeReadMore read 0"),e.read(0),n!==t.length);)n=t.length;t.readingMore=!1}function T(e){d("readable nexttick read 0"),e.read(0)}function j(e,t){t.reading||(d("resume read 0"),e.read(0)),t.resumeScheduled=!1,t.awaitDrain=0,e.emit("resume"),A(e),t.flowing&&!t.reading&&e.read(0)}function A(e){var t=e._readableState;for(d("flow",t.flowing);t.flowing&&null!==e.read(););}function C(e,t){return 0===t.length?null:(t.objectMode?n=t.buffer.shift():!e||e>=t.length?(n=t.decoder?t.buffer.join(""):1===t.buffer.length?t.buffer.head.data:t.buffer.concat(t.length),t.buffer.clear()):n=function(e,t,n){var r;e<t.head.data.length?(r=t.head.data.slice(0,e),t.head.data=t.head.data.slice(e)):r=e===t.head.data.length?t.shift():n?function(e,t){var n=t.head,r=1,o=n.data;e-=o.length;for(;n=n.next;){var i=n.data,a=e>i.length?i.length:e;if(a===i.length?o+=i:o+=i.slice(0,e),0===(e-=a)){a===i.length?(++r,n.next?t.head=n.next:t.head=t.tail=null):(t.head=n,n.data=i.slice(a));break}++r}return t.length-=r,o}(e,t):function(e,t){var n=c.allocUnsafe(e),r=t.head,o=1;r.data.copy(n),e-=r.data.length;for(;r=r.next;){var i=r.data,a=e>i.length?i.length:e;if(i.copy(n,n.length-e,0,a),0===(e-=a)){a===i.length?(++o,r.next?t.head=r.next:t.head=t.tail=null):(t.head=r,r.data=i.slice(a));break}++o}return t.length-=o,n}(e,t);return r}(e,t.buffer,t.decoder),n);var n}function I(e){var t=e._readableState;if(t.length>0)throw new Error('"endReadable()" called on non-empty stream');t.endEmitted||(t.ended=!0,o.nextTick(P,t,e))}function P(e,t){e.endEmitted||0!==e.length||(e.endEmitted=!0,t.readable=!1,t.emit("end"))}function R(e,t){for(var n=0,r=e.length;n<r;n++)if(e[n]===t)return n;return-1}b.prototype.read=function(e){d("read",e),e=parseInt(e,10);var t=this._readableState,n=e;if(0!==e&&(t.emittedReadable=!1),0===e&&t.needReadable&&(t.length>=t.highWaterMark||t.ended))return d("read: emitReadable",t.length,t.ended),0===t.length&&t.ended?I(this):O(this),null;if(0===(e=k(e,t))&&t.ended)return 0===t.length&&I(this),null;var r,o=t.needReadable;return d("need readable",o),(0===t.length||t.length-e<t.highWaterMark)&&d("length less than watermark",o=!0),t.ended||t.reading?d("reading or ended",o=!1):o&&(d("do read"),t.reading=!0,t.sync=!0,0===t.length&&(t.needReadable=!0),this._read(t.highWaterMark),t.sync=!1,t.reading||(e=k(n,t))),null===(r=e>0?C(e,t):null)?(t.needReadable=!0,e=0):t.length-=e,0===t.length&&(t.ended||(t.needReadable=!0),n!==e&&t.ended&&I(this)),null!==r&&this.emit("data",r),r},b.prototype._read=function(e){this.emit("error",new Error("_read() is not implemented"))},b.prototype.pipe=function(e,t){var n=this,i=this._readableState;switch(i.pipesCount){case 0:i.pipes=e;break;case 1:i.pipes=[i.pipes,e];break;default:i.pipes.push(e)}i.pipesCount+=1,d("pipe count=%d opts=%j",i.pipesCount,t);var l=(!t||!1!==t.end)&&e!==r.stdout&&e!==r.stderr?u:b;function c(t,r){d("onunpipe"),t===n&&r&&!1===r.hasUnpiped&&(r.hasUnpiped=!0,d("cleanup"),e.removeListener("close",y),e.removeListener("finish",v),e.removeListener("drain",p),e.removeListener("error",g),e.removeListener("unpipe",c),n.removeListener("end",u),n.removeListener("end",b),n.removeListener("data",m),f=!0,!i.awaitDrain||e._writableState&&!e._writableState.needDrain||p())}function u(){d("onend"),e.end()}i.endEmitted?o.nextTick(l):n.once("end",l),e.on("unpipe",c);var p=function(e){return function(){var t=e._readableState;d("pipeOnDrain",t.awaitDrain),t.awaitDrain&&t.awaitDrain--,0===t.awaitDrain&&s(e,"data")&&(t.flowing=!0,A(e))}}(n);e.on("drain",p);var f=!1;var h=!1;function m(t){d("ondata"),h=!1,!1!==e.write(t)||h||((1===i.pipesCount&&i.pipes===e||i.pipesCount>1&&-1!==R(i.pipes,e))&&!f&&(d("false write response, pause",n._readableState.awaitDrain),n._readableState.awaitDrain++,h=!0),n.pause())}function g(t){d("onerror",t),b(),e.removeListener("error",g),0===s(e,"error")&&e.emit("error",t)}function y(){e.removeListener("finish",v),b()}function v(){d("onfinish"),e.removeListener("close",y),b()}function b(){d("unpipe"),n.unpipe(e)}return n.on("data",m),function(e,t,n){if("function"==typeof e.prependListener)return e.prependListener(t,n);e._events&&e._events[t]?a(e._events[t])?e._events[t].unshift(n):e._events[t]=[n,e._events[t]]:e.on(t,n)}(e,"error",g),e.once("close",y),e.once("finish",v),e.emit("pipe",n),i.flowing||(d("pipe resume"),n.resume()),e},b.prototype.unpipe=function(e){var t=this._readableState,n={hasUnpiped:!1};if(0===t.pipesCount)return this;if(1===t.pipesCount)return e&&e!==t.pipes||(e||(e=t.pipes),t.pipes=null,t.pipesCount=0,t.flowing=!1,e&&e.emit("unpipe",this,n)),this;if(!e){var r=t.pipes,o=t.pipesCount;t.pipes=null,t.pipesCount=0,t.flowing=!1;for(var i=0;i<o;i++)r[i].emit("unpipe",this,n);return this}var a=R(t.pipes,e);return-1===a||(t.pipes.splice(a,1),t.pipesCount-=1,1===t.pipesCount&&(t.pipes=t.pipes[0]),e.emit("unpipe",this,n)),this},b.prototype.on=function(e,t){var n=l.prototype.on.call(this,e,t);if("data"===e)!1!==this._readableState.flowing&&this.resume();else if("readable"===e){var r=this._readableState;r.endEmitted||r.readableListening||(r.readableListening=r.needReadable=!0,r.emittedReadable=!1,r.reading?r.length&&O(this):o.nextTick(T,this))}return n},b.prototype.addListener=b.prototype.on,b.prototype.resume=function(){var e=this._readableState;return e.flowing||(d("resume"),e.flowing=!0,function(e,t){t.resumeScheduled||(t.resumeScheduled=!0,o.nextTick(j,e,t))}(this,e)),this},b.prototype.pause=function(){return d("call pause flowing=%j",this._readableState.flowing),!1!==this._readableState.flowing&&(d("pause"),this._readableState.flowing=!1,this.emit("pause")),this},b.prototype.wrap=function(e){var t=this,n=this._readableState,r=!1;for(var o in e.on("end",(function(){if(d("wrapped end"),n.decoder&&!n.ended){var e=n.decoder.end();e&&e.length&&t.push(e)}t.push(null)})),e.on("data",(function(o){(d("wrapped data"),n.decoder&&(o=n.decoder.write(o)),n.objectMode&&null==o)||(n.objectMode||o&&o.length)&&(t.push(o)||(r=!0,e.pause()))})),e)void 0===this[o]&&"function"==typeof e[o]&&(this[o]=function(t){return function(){return e[t].apply(e,arguments)}}(o));for(var i=0;i<y.length;i++)e.on(y[i],this.emit.bind(this,y[i]));return this._read=function(t){d("wrapped _read",t),r&&(r=!1,e.resume())},this},Object.defineProperty(b.prototype,"readableHighWaterMark",{enumerable:!1,get:function(){return this._readableState.highWaterMark}}),b._fromList=C}).call(this,n(5),n(14))},function(e,t,n){"use strict";var r,o="object"==typeof Reflect?Reflect:null,i=o&&"function"==typeof o.apply?o.apply:function(e,t,n){return Function.prototype.apply.call(e,t,n)};r=o&&"function"==typeof o.ownKeys?o.ownKeys:Object.getOwnPropertySymbols?function(e){return Object.getOwnPropertyNames(e).concat(Object.getOwnPropertySymbols(e))}:function(e){return Object.getOwnPropertyNames(e)};var a=Number.isNaN||function(e){return e!=e};function s(){s.init.call(this)}e.exports=s,e.exports.once=function(e,t){return new Promise((function(n,r){function o(){void 0!==i&&e.removeListener("error",i),n([].slice.call(arguments))}var i;"error"!==t&&(i=function(n){e.removeListener(t,o),r(n)},e.once("error",i)),e.once(t,o)}))},s.EventEmitter=s,s.prototype._events=void 0,s.prototype._eventsCount=0,s.prototype._maxListeners=void 0;var l=10;function c(e){if("function"!=typeof e)throw new TypeError('The "listener" argument must be of type Function. Received type '+typeof e)}function u(e){return void 0===e._maxListeners?s.defaultMaxListeners:e._maxListeners}function p(e,t,n,r){var o,i,a,s;if(c(n),void 0===(i=e._events)?(i=e._events=Object.create(null),e._eventsCount=0):(void 0!==i.newListener&&(e.emit("newListener",t,n.listener?n.listener:n),i=e._events),a=i[t]),void 0===a)a=i[t]=n,++e._eventsCount;else if("function"==typeof a?a=i[t]=r?[n,a]:[a,n]:r?a.unshift(n):a.push(n),(o=u(e))>0&&a.length>o&&!a.warned){a.warned=!0;var l=new Error("Possible EventEmitter memory leak detected. "+a.length+" "+String(t)+" listeners added. Use emitter.setMaxListeners() to increase limit");l.name="MaxListenersExceededWarning",l.emitter=e,l.type=t,l.count=a.length,s=l,console&&console.warn&&console.warn(s)}return e}function f(){if(!this.fired)return this.target.removeListener(this.type,this.wrapFn),this.fired=!0,0===arguments.length?this.listener.call(this.target):this.listener.apply(this.target,arguments)}function d(e,t,n){var r={fired:!1,wrapFn:void 0,target:e,type:t,listener:n},o=f.bind(r);return o.listener=n,r.wrapFn=o,o}function h(e,t,n){var r=e._events;if(void 0===r)return[];var o=r[t];return void 0===o?[]:"function"==typeof o?n?[o.listener||o]:[o]:n?function(e){for(var t=new Array(e.length),n=0;n<t.length;++n)t[n]=e[n].listener||e[n];return t}(o):g(o,o.length)}function m(e){var t=this._events;if(void 0!==t){var n=t[e];if("function"==typeof n)return 1;if(void 0!==n)return n.length}return 0}function g(e,t){for(var n=new Array(t),r=0;r<t;++r)n[r]=e[r];return n}Object.defineProperty(s,"defaultMaxListeners",{enumerable:!0,get:function(){return l},set:function(e){if("number"!=typeof e||e<0||a(e))throw new RangeError('The value of "defaultMaxListeners" is out of range. It must be a non-negative number. Received '+e+".");l=e}}),s.init=function(){void 0!==this._events&&this._events!==Object.getPrototypeOf(this)._events||(this._events=Object.create(null),this._eventsCount=0),this._maxListeners=this._maxListeners||void 0},s.prototype.setMaxListeners=function(e){if("number"!=typeof e||e<0||a(e))throw new RangeError('The value of "n" is out of range. It must be a non-negative number. Received '+e+".");return this._maxListeners=e,this},s.prototype.getMaxListeners=function(){return u(this)},s.prototype.emit=function(e){for(var t=[],n=1;n<arguments.length;n++)t.push(arguments[n]);var r="error"===e,o=this._events;if(void 0!==o)r=r&&void 0===o.error;else if(!r)return!1;if(r){var a;if(t.length>0&&(a=t[0]),a instanceof Error)throw a;var s=new Error("Unhandled error."+(a?" ("+a.message+")":""));throw s.context=a,s}var l=o[e];if(void 0===l)return!1;if("function"==typeof l)i(l,this,t);else{var c=l.length,u=g(l,c);for(n=0;n<c;++n)i(u[n],this,t)}return!0},s.prototype.addListener=function(e,t){return p(this,e,t,!1)},s.prototype.on=s.prototype.addListener,s.prototype.prependListener=function(e,t){return p(this,e,t,!0)},s.prototype.once=function(e,t){return c(t),this.on(e,d(this,e,t)),this},s.prototype.prependOnceListener=function(e,t){return c(t),this.prependListener(e,d(this,e,t)),this},s.prototype.removeListener=function(e,t){var n,r,o,i,a;if(c(t),void 0===(r=this._events))return this;if(void 0===(n=r[e]))return this;if(n===t||n.listener===t)0==--this._eventsCount?this._events=Object.create(null):(delete r[e],r.removeListener&&this.emit("removeListener",e,n.listener||t));else if("function"!=typeof n){for(o=-1,i=n.length-1;i>=0;i--)if(n[i]===t||n[i].listener===t){a=n[i].listener,o=i;break}if(o<0)return this;0===o?n.shift():function(e,t){for(;t+1<e.length;t++)e[t]=e[t+1];e.pop()}(n,o),1===n.length&&(r[e]=n[0]),void 0!==r.removeListener&&this.emit("removeListener",e,a||t)}return this},s.prototype.off=s.prototype.removeListener,s.prototype.removeAllListeners=function(e){var t,n,r;if(void 0===(n=this._events))return this;if(void 0===n.removeListener)return 0===arguments.length?(this._events=Object.create(null),this._eventsCount=0):void 0!==n[e]&&(0==--this._eventsCount?this._events=Object.create(null):delete n[e]),this;if(0===arguments.length){var o,i=Object.keys(n);for(r=0;r<i.length;++r)"removeListener"!==(o=i[r])&&this.removeAllListeners(o);return this.removeAllListeners("removeListener"),this._events=Object.create(null),this._eventsCount=0,this}if("function"==typeof(t=n[e]))this.removeListener(e,t);else if(void 0!==t)for(r=t.length-1;r>=0;r--)this.removeListener(e,t[r]);return this},s.prototype.listeners=function(e){return h(this,e,!0)},s.prototype.rawListeners=function(e){return h(this,e,!1)},s.listenerCount=function(e,t){return"function"==typeof e.listenerCount?e.listenerCount(t):m.call(e,t)},s.prototype.listenerCount=m,s.prototype.eventNames=function(){return this._eventsCount>0?r(this._events):[]}},function(e,t,n){e.exports=n(139).EventEmitter},function(e,t,n){"use strict";var r=n(58);function o(e,t){e.emit("error",t)}e.exports={destroy:function(e,t){var n=this,i=this._readableState&&this._readableState.destroyed,a=this._writableState&&this._writableState.destroyed;return i||a?(t?t(e):!e||this._writableState&&this._writableState.errorEmitted||r.nextTick(o,this,e),this):(this._readableState&&(this._readableState.destroyed=!0),this._writableState&&(this._writableState.destroyed=!0),this._destroy(e||null,(function(e){!t&&e?(r.nextTick(o,n,e),n._writableState&&(n._writableState.errorEmitted=!0)):t&&t(e)})),this)},undestroy:function(){this._readableState&&(this._readableState.destroyed=!1,this._readableState.reading=!1,this._readableState.ended=!1,this._readableState.endEmitted=!1),this._writableState&&(this._writableState.destroyed=!1,this._writableState.ended=!1,this._writableState.ending=!1,this._writableState.finished=!1,this._writableState.errorEmitted=!1)}}},function(e,t,n){"use strict";(function(t,r,o){var i=n(58);function a(e){var t=this;this.next=null,this.entry=null,this.finish=function(){!function(e,t,n){var r=e.entry;e.entry=null;for(;r;){var o=r.callback;t.pendingcb--,o(n),r=r.next}t.corkedRequestsFree?t.corkedRequestsFree.next=e:t.corkedRequestsFree=e}(t,e)}}e.exports=v;var s,l=!t.browser&&["v0.10","v0.9."].indexOf(t.version.slice(0,5))>-1?r:i.nextTick;v.WritableState=y;var c=Object.create(n(48));c.inherits=n(31);var u={deprecate:n(274)},p=n(140),f=n(59).Buffer,d=o.Uint8Array||function(){};var h,m=n(141);function g(){}function y(e,t){s=s||n(38),e=e||{};var r=t instanceof s;this.objectMode=!!e.objectMode,r&&(this.objectMode=this.objectMode||!!e.writableObjectMode);var o=e.highWaterMark,c=e.writableHighWaterMark,u=this.objectMode?16:16384;this.highWaterMark=o||0===o?o:r&&(c||0===c)?c:u,this.highWaterMark=Math.floor(this.highWaterMark),this.finalCalled=!1,this.needDrain=!1,this.ending=!1,this.ended=!1,this.finished=!1,this.destroyed=!1;var p=!1===e.decodeStrings;this.decodeStrings=!p,this.defaultEncoding=e.defaultEncoding||"utf8",this.length=0,this.writing=!1,this.corked=0,this.sync=!0,this.bufferProcessing=!1,this.onwrite=function(e){!function(e,t){var n=e._writableState,r=n.sync,o=n.writecb;if(function(e){e.writing=!1,e.writecb=null,e.length-=e.writelen,e.writelen=0}(n),t)!function(e,t,n,r,o){--t.pendingcb,n?(i.nextTick(o,r),i.nextTick(E,e,t),e._writableState.errorEmitted=!0,e.emit("error",r)):(o(r),e._writableState.errorEmitted=!0,e.emit("error",r),E(e,t))}(e,n,r,t,o);else{var a=k(n);a||n.corked||n.bufferProcessing||!n.bufferedRequest||w(e,n),r?l(x,e,n,a,o):x(e,n,a,o)}}(t,e)},this.writecb=null,this.writelen=0,this.bufferedRequest=null,this.lastBufferedRequest=null,this.pendingcb=0,this.prefinished=!1,this.errorEmitted=!1,this.bufferedRequestCount=0,this.corkedRequestsFree=new a(this)}function v(e){if(s=s||n(38),!(h.call(v,this)||this instanceof s))return new v(e);this._writableState=new y(e,this),this.writable=!0,e&&("function"==typeof e.write&&(this._write=e.write),"function"==typeof e.writev&&(this._writev=e.writev),"function"==typeof e.destroy&&(this._destroy=e.destroy),"function"==typeof e.final&&(this._final=e.final)),p.call(this)}function b(e,t,n,r,o,i,a){t.writelen=r,t.writecb=a,t.writing=!0,t.sync=!0,n?e._writev(o,t.onwrite):e._write(o,i,t.onwrite),t.sync=!1}function x(e,t,n,r){n||function(e,t){0===t.length&&t.needDrain&&(t.needDrain=!1,e.emit("drain"))}(e,t),t.pendingcb--,r(),E(e,t)}function w(e,t){t.bufferProcessing=!0;var n=t.bufferedRequest;if(e._writev&&n&&n.next){var r=t.bufferedRequestCount,o=new Array(r),i=t.corkedRequestsFree;i.entry=n;for(var s=0,l=!0;n;)o[s]=n,n.isBuf||(l=!1),n=n.next,s+=1;o.allBuffers=l,b(e,t,!0,t.length,o,"",i.finish),t.pendingcb++,t.lastBufferedRequest=null,i.next?(t.corkedRequestsFree=i.next,i.next=null):t.corkedRequestsFree=new a(t),t.bufferedRequestCount=0}else{for(;n;){var c=n.chunk,u=n.encoding,p=n.callback;if(b(e,t,!1,t.objectMode?1:c.length,c,u,p),n=n.next,t.bufferedRequestCount--,t.writing)break}null===n&&(t.lastBufferedRequest=null)}t.bufferedRequest=n,t.bufferProcessing=!1}function k(e){return e.ending&&0===e.length&&null===e.bufferedRequest&&!e.finished&&!e.writing}function O(e,t){e._final((function(n){t.pendingcb--,n&&e.emit("error",n),t.prefinished=!0,e.emit("prefinish"),E(e,t)}))}function E(e,t){var n=k(t);return n&&(!function(e,t){t.prefinished||t.finalCalled||("function"==typeof e._final?(t.pendingcb++,t.finalCalled=!0,i.nextTick(O,e,t)):(t.prefinished=!0,e.emit("prefinish")))}(e,t),0===t.pendingcb&&(t.finished=!0,e.emit("finish"))),n}c.inherits(v,p),y.prototype.getBuffer=function(){for(var e=this.bufferedRequest,t=[];e;)t.push(e),e=e.next;return t},function(){try{Object.defineProperty(y.prototype,"buffer",{get:u.deprecate((function(){return this.getBuffer()}),"_writableState.buffer is deprecated. Use _writableState.getBuffer instead.","DEP0003")})}catch(e){}}(),"function"==typeof Symbol&&Symbol.hasInstance&&"function"==typeof Function.prototype[Symbol.hasInstance]?(h=Function.prototype[Symbol.hasInstance],Object.defineProperty(v,Symbol.hasInstance,{value:function(e){return!!h.call(this,e)||this===v&&(e&&e._writableState instanceof y)}})):h=function(e){return e instanceof this},v.prototype.pipe=function(){this.emit("error",new Error("Cannot pipe, not readable"))},v.prototype.write=function(e,t,n){var r,o=this._writableState,a=!1,s=!o.objectMode&&(r=e,f.isBuffer(r)||r instanceof d);return s&&!f.isBuffer(e)&&(e=function(e){return f.from(e)}(e)),"function"==typeof t&&(n=t,t=null),s?t="buffer":t||(t=o.defaultEncoding),"function"!=typeof n&&(n=g),o.ended?function(e,t){var n=new Error("write after end");e.emit("error",n),i.nextTick(t,n)}(this,n):(s||function(e,t,n,r){var o=!0,a=!1;return null===n?a=new TypeError("May not write null values to stream"):"string"==typeof n||void 0===n||t.objectMode||(a=new TypeError("Invalid non-string/buffer chunk")),a&&(e.emit("error",a),i.nextTick(r,a),o=!1),o}(this,o,e,n))&&(o.pendingcb++,a=function(e,t,n,r,o,i){if(!n){var a=function(e,t,n){e.objectMode||!1===e.decodeStrings||"string"!=typeof t||(t=f.from(t,n));return t}(t,r,o);r!==a&&(n=!0,o="buffer",r=a)}var s=t.objectMode?1:r.length;t.length+=s;var l=t.length<t.highWaterMark;l||(t.needDrain=!0);if(t.writing||t.corked){var c=t.lastBufferedRequest;t.lastBufferedRequest={chunk:r,encoding:o,isBuf:n,callback:i,next:null},c?c.next=t.lastBufferedRequest:t.bufferedRequest=t.lastBufferedRequest,t.bufferedRequestCount+=1}else b(e,t,!1,s,r,o,i);return l}(this,o,s,e,t,n)),a},v.prototype.cork=function(){this._writableState.corked++},v.prototype.uncork=function(){var e=this._writableState;e.corked&&(e.corked--,e.writing||e.corked||e.finished||e.bufferProcessing||!e.bufferedRequest||w(this,e))},v.prototype.setDefaultEncoding=function(e){if("string"==typeof e&&(e=e.toLowerCase()),!(["hex","utf8","utf-8","ascii","binary","base64","ucs2","ucs-2","utf16le","utf-16le","raw"].indexOf((e+"").toLowerCase())>-1))throw new TypeError("Unknown encoding: "+e);return this._writableState.defaultEncoding=e,this},Object.defineProperty(v.prototype,"writableHighWaterMark",{enumerable:!1,get:function(){return this._writableState.highWaterMark}}),v.prototype._write=function(e,t,n){n(new Error("_write() is not implemented"))},v.prototype._writev=null,v.prototype.end=function(e,t,n){var r=this._writableState;"function"==typeof e?(n=e,e=null,t=null):"function"==typeof t&&(n=t,t=null),null!=e&&this.write(e,t),r.corked&&(r.corked=1,this.uncork()),r.ending||r.finished||function(e,t,n){t.ending=!0,E(e,t),n&&(t.finished?i.nextTick(n):e.once("finish",n));t.ended=!0,e.writable=!1}(this,r,n)},Object.defineProperty(v.prototype,"destroyed",{get:function(){return void 0!==this._writableState&&this._writableState.destroyed},set:function(e){this._writableState&&(this._writableState.destroyed=e)}}),v.prototype.destroy=m.destroy,v.prototype._undestroy=m.undestroy,v.prototype._destroy=function(e,t){this.end(),t(e)}}).call(this,n(14),n(272).setImmediate,n(5))},function(e,t,n){"use strict";var r=n(59).Buffer,o=r.isEncoding||function(e){switch((e=""+e)&&e.toLowerCase()){case"hex":case"utf8":case"utf-8":case"ascii":case"binary":case"base64":case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":case"raw":return!0;default:return!1}};function i(e){var t;switch(this.encoding=function(e){var t=function(e){if(!e)return"utf8";for(var t;;)switch(e){case"utf8":case"utf-8":return"utf8";case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return"utf16le";case"latin1":case"binary":return"latin1";case"base64":case"ascii":case"hex":return e;default:if(t)return;e=(""+e).toLowerCase(),t=!0}}(e);if("string"!=typeof t&&(r.isEncoding===o||!o(e)))throw new Error("Unknown encoding: "+e);return t||e}(e),this.encoding){case"utf16le":this.text=l,this.end=c,t=4;break;case"utf8":this.fillLast=s,t=4;break;case"base64":this.text=u,this.end=p,t=3;break;default:return this.write=f,void(this.end=d)}this.lastNeed=0,this.lastTotal=0,this.lastChar=r.allocUnsafe(t)}function a(e){return e<=127?0:e>>5==6?2:e>>4==14?3:e>>3==30?4:e>>6==2?-1:-2}function s(e){var t=this.lastTotal-this.lastNeed,n=function(e,t,n){if(128!=(192&t[0]))return e.lastNeed=0,"�";if(e.lastNeed>1&&t.length>1){if(128!=(192&t[1]))return e.lastNeed=1,"�";if(e.lastNeed>2&&t.length>2&&128!=(192&t[2]))return e.lastNeed=2,"�"}}(this,e);return void 0!==n?n:this.lastNeed<=e.length?(e.copy(this.lastChar,t,0,this.lastNeed),this.lastChar.toString(this.encoding,0,this.lastTotal)):(e.copy(this.lastChar,t,0,e.length),void(this.lastNeed-=e.length))}function l(e,t){if((e.length-t)%2==0){var n=e.toString("utf16le",t);if(n){var r=n.charCodeAt(n.length-1);if(r>=55296&&r<=56319)return this.lastNeed=2,this.lastTotal=4,this.lastChar[0]=e[e.length-2],this.lastChar[1]=e[e.length-1],n.slice(0,-1)}return n}return this.lastNeed=1,this.lastTotal=2,this.lastChar[0]=e[e.length-1],e.toString("utf16le",t,e.length-1)}function c(e){var t=e&&e.length?this.write(e):"";if(this.lastNeed){var n=this.lastTotal-this.lastNeed;return t+this.lastChar.toString("utf16le",0,n)}return t}function u(e,t){var n=(e.length-t)%3;return 0===n?e.toString("base64",t):(this.lastNeed=3-n,this.lastTotal=3,1===n?this.lastChar[0]=e[e.length-1]:(this.lastChar[0]=e[e.length-2],this.lastChar[1]=e[e.length-1]),e.toString("base64",t,e.length-n))}function p(e){var t=e&&e.length?this.write(e):"";return this.lastNeed?t+this.lastChar.toString("base64",0,3-this.lastNeed):t}function f(e){return e.toString(this.encoding)}function d(e){return e&&e.length?this.write(e):""}t.StringDecoder=i,i.prototype.write=function(e){if(0===e.length)return"";var t,n;if(this.lastNeed){if(void 0===(t=this.fillLast(e)))return"";n=this.lastNeed,this.lastNeed=0}else n=0;return n<e.length?t?t+this.text(e,n):this.text(e,n):t||""},i.prototype.end=function(e){var t=e&&e.length?this.write(e):"";return this.lastNeed?t+"�":t},i.prototype.text=function(e,t){var n=function(e,t,n){var r=t.length-1;if(r<n)return 0;var o=a(t[r]);if(o>=0)return o>0&&(e.lastNeed=o-1),o;if(--r<n||-2===o)return 0;if((o=a(t[r]))>=0)return o>0&&(e.lastNeed=o-2),o;if(--r<n||-2===o)return 0;if((o=a(t[r]))>=0)return o>0&&(2===o?o=0:e.lastNeed=o-3),o;return 0}(this,e,t);if(!this.lastNeed)return e.toString("utf8",t);this.lastTotal=n;var r=e.length-(n-this.lastNeed);return e.copy(this.lastChar,0,r),e.toString("utf8",t,r)},i.prototype.fillLast=function(e){if(this.lastNeed<=e.length)return e.copy(this.lastChar,this.lastTotal-this.lastNeed,0,this.lastNeed),this.lastChar.toString(this.encoding,0,this.lastTotal);e.copy(this.lastChar,this.lastTotal-this.lastNeed,0,e.length),this.lastNeed-=e.length}},function(e,t,n){"use strict";e.exports=a;var r=n(38),o=Object.create(n(48));function i(e,t){var n=this._transformState;n.transforming=!1;var r=n.writecb;if(!r)return this.emit("error",new Error("write callback called multiple times"));n.writechunk=null,n.writecb=null,null!=t&&this.push(t),r(e);var o=this._readableState;o.reading=!1,(o.needReadable||o.length<o.highWaterMark)&&this._read(o.highWaterMark)}function a(e){if(!(this instanceof a))return new a(e);r.call(this,e),this._transformState={afterTransform:i.bind(this),needTransform:!1,transforming:!1,writecb:null,writechunk:null,writeencoding:null},this._readableState.needReadable=!0,this._readableState.sync=!1,e&&("function"==typeof e.transform&&(this._transform=e.transform),"function"==typeof e.flush&&(this._flush=e.flush)),this.on("prefinish",s)}function s(){var e=this;"function"==typeof this._flush?this._flush((function(t,n){l(e,t,n)})):l(this,null,null)}function l(e,t,n){if(t)return e.emit("error",t);if(null!=n&&e.push(n),e._writableState.length)throw new Error("Calling transform done when ws.length != 0");if(e._transformState.transforming)throw new Error("Calling transform done when still transforming");return e.push(null)}o.inherits=n(31),o.inherits(a,r),a.prototype.push=function(e,t){return this._transformState.needTransform=!1,r.prototype.push.call(this,e,t)},a.prototype._transform=function(e,t,n){throw new Error("_transform() is not implemented")},a.prototype._write=function(e,t,n){var r=this._transformState;if(r.writecb=n,r.writechunk=e,r.writeencoding=t,!r.transforming){var o=this._readableState;(r.needTransform||o.needReadable||o.length<o.highWaterMark)&&this._read(o.highWaterMark)}},a.prototype._read=function(e){var t=this._transformState;null!==t.writechunk&&t.writecb&&!t.transforming?(t.transforming=!0,this._transform(t.writechunk,t.writeencoding,t.afterTransform)):t.needTransform=!0},a.prototype._destroy=function(e,t){var n=this;r.prototype._destroy.call(this,e,(function(e){t(e),n.emit("close")}))}},function(e,t,n){"use strict";(function(t){var r=n(30),o=n(25),i=n(281);e.exports=function(e,n,a){try{e=o.stripHash(e);var s=n._add(e),l={url:e,extension:o.getExtension(e)};return function(e,t){return new Promise((function(n,o){var a=i.all(t.resolve);a=i.filter(a,"canRead",e),i.sort(a),i.run(a,"read",e).then(n,(function(t){!t||t instanceof SyntaxError?o(r.syntax('Unable to resolve $ref pointer "%s"',e.url)):o(t)}))}))}(l,a).then((function(e){return s.pathType=e.plugin.name,l.data=e.result,function(e,n){return new Promise((function(o,a){var s=i.all(n.parse),l=i.filter(s,"canParse",e),c=l.length>0?l:s;i.sort(c),i.run(c,"parse",e).then((function(n){!n.plugin.allowEmpty&&(i=n.result,void 0===i||"object"==typeof i&&0===Object.keys(i).length||"string"==typeof i&&0===i.trim().length||t.isBuffer(i)&&0===i.length)?a(r.syntax('Error parsing "%s" as %s. \nParsed value is empty',e.url,n.plugin.name)):o(n);var i}),(function(t){t?(t=t instanceof Error?t:new Error(t),a(r.syntax(t,"Error parsing %s",e.url))):a(r.syntax("Unable to parse %s",e.url))}))}))}(l,a)})).then((function(e){return s.value=e.result,e.result}))}catch(e){return Promise.reject(e)}}}).call(this,n(15).Buffer)},function(e,t,n){"use strict";(function(t,n){var r=t.process&&n.nextTick||t.setImmediate||function(e){setTimeout(e,0)};e.exports=function(e,t){return e?void t.then((function(t){r((function(){e(null,t)}))}),(function(t){r((function(){e(t)}))})):t}}).call(this,n(5),n(14))},function(e,t){},function(e,t,n){"use strict";(function(t){var r=n(288),o=t.env.NODE_DISABLE_COLORS?{red:"",yellow:"",green:"",normal:""}:{red:"[31m",yellow:"[33;1m",green:"[32m",normal:"[0m"};function i(e){for(var t=[],n=function(e){t.find((function(t,n,o){return function(e,t){function n(e,t){return r.stringify(e)===r.stringify(Object.assign({},e,t))}return n(e,t)&&n(t,e)}(t,e)}))||t.push(e)},o=0,i=e;o<i.length;o++){n(i[o])}return t}String.prototype.toCamelCase=function(){return this.toLowerCase().replace(/[-_ \/\.](.)/g,(function(e,t){return t.toUpperCase()}))};function a(e){var t=(e=e.replace("[]","Array")).split("/");return t[0]=t[0].replace(/[^A-Za-z0-9_\-\.]+|\s+/gm,"_"),t.join("/")}e.exports={colour:o,uniqueOnly:function(e,t,n){return n.indexOf(e)===t},hasDuplicates:function(e){return new Set(e).size!==e.length},allSame:function(e){return new Set(e).size<=1},distinctArray:function(e){return e.length===i(e).length},firstDupe:function(e){return e.find((function(t,n,r){return e.indexOf(t)<n}))},hash:function(e){var t=0;if(0===e.length)return t;for(var n=0;n<e.length;n++)t=(t<<5)-t+e.charCodeAt(n),t|=0;return t},parameterTypeProperties:["format","minimum","maximum","exclusiveMinimum","exclusiveMaximum","minLength","maxLength","multipleOf","minItems","maxItems","uniqueItems","minProperties","maxProperties","additionalProperties","pattern","enum","default"],arrayProperties:["items","minItems","maxItems","uniqueItems"],httpMethods:["get","post","put","delete","patch","head","options","trace"],sanitise:a,sanitiseAll:function(e){return a(e.split("/").join("_"))}}}).call(this,n(14))},function(e,t){e.exports=function(){}},function(e,t,n){var r;r=function(){var e=JSON.parse('{"$":"dollar","%":"percent","&":"and","<":"less",">":"greater","|":"or","¢":"cent","£":"pound","¤":"currency","¥":"yen","©":"(c)","ª":"a","®":"(r)","º":"o","À":"A","Á":"A","Â":"A","Ã":"A","Ä":"A","Å":"A","Æ":"AE","Ç":"C","È":"E","É":"E","Ê":"E","Ë":"E","Ì":"I","Í":"I","Î":"I","Ï":"I","Ð":"D","Ñ":"N","Ò":"O","Ó":"O","Ô":"O","Õ":"O","Ö":"O","Ø":"O","Ù":"U","Ú":"U","Û":"U","Ü":"U","Ý":"Y","Þ":"TH","ß":"ss","à":"a","á":"a","â":"a","ã":"a","ä":"a","å":"a","æ":"ae","ç":"c","è":"e","é":"e","ê":"e","ë":"e","ì":"i","í":"i","î":"i","ï":"i","ð":"d","ñ":"n","ò":"o","ó":"o","ô":"o","õ":"o","ö":"o","ø":"o","ù":"u","ú":"u","û":"u","ü":"u","ý":"y","þ":"th","ÿ":"y","Ā":"A","ā":"a","Ă":"A","ă":"a","Ą":"A","ą":"a","Ć":"C","ć":"c","Č":"C","č":"c","Ď":"D","ď":"d","Đ":"DJ","đ":"dj","Ē":"E","ē":"e","Ė":"E","ė":"e","Ę":"e","ę":"e","Ě":"E","ě":"e","Ğ":"G","ğ":"g","Ģ":"G","ģ":"g","Ĩ":"I","ĩ":"i","Ī":"i","ī":"i","Į":"I","į":"i","İ":"I","ı":"i","Ķ":"k","ķ":"k","Ļ":"L","ļ":"l","Ľ":"L","ľ":"l","Ł":"L","ł":"l","Ń":"N","ń":"n","Ņ":"N","ņ":"n","Ň":"N","ň":"n","Ō":"O","ō":"o","Ő":"O","ő":"o","Œ":"OE","œ":"oe","Ŕ":"R","ŕ":"r","Ř":"R","ř":"r","Ś":"S","ś":"s","Ş":"S","ş":"s","Š":"S","š":"s","Ţ":"T","ţ":"t","Ť":"T","ť":"t","Ũ":"U","ũ":"u","Ū":"u","ū":"u","Ů":"U","ů":"u","Ű":"U","ű":"u","Ų":"U","ų":"u","Ŵ":"W","ŵ":"w","Ŷ":"Y","ŷ":"y","Ÿ":"Y","Ź":"Z","ź":"z","Ż":"Z","ż":"z","Ž":"Z","ž":"z","ƒ":"f","Ơ":"O","ơ":"o","Ư":"U","ư":"u","ǈ":"LJ","ǉ":"lj","ǋ":"NJ","ǌ":"nj","Ș":"S","ș":"s","Ț":"T","ț":"t","˚":"o","Ά":"A","Έ":"E","Ή":"H","Ί":"I","Ό":"O","Ύ":"Y","Ώ":"W","ΐ":"i","Α":"A","Β":"B","Γ":"G","Δ":"D","Ε":"E","Ζ":"Z","Η":"H","Θ":"8","Ι":"I","Κ":"K","Λ":"L","Μ":"M","Ν":"N","Ξ":"3","Ο":"O","Π":"P","Ρ":"R","Σ":"S","Τ":"T","Υ":"Y","Φ":"F","Χ":"X","Ψ":"PS","Ω":"W","Ϊ":"I","Ϋ":"Y","ά":"a","έ":"e","ή":"h","ί":"i","ΰ":"y","α":"a","β":"b","γ":"g","δ":"d","ε":"e","ζ":"z","η":"h","θ":"8","ι":"i","κ":"k","λ":"l","μ":"m","ν":"n","ξ":"3","ο":"o","π":"p","ρ":"r","ς":"s","σ":"s","τ":"t","υ":"y","φ":"f","χ":"x","ψ":"ps","ω":"w","ϊ":"i","ϋ":"y","ό":"o","ύ":"y","ώ":"w","Ё":"Yo","Ђ":"DJ","Є":"Ye","І":"I","Ї":"Yi","Ј":"J","Љ":"LJ","Њ":"NJ","Ћ":"C","Џ":"DZ","А":"A","Б":"B","В":"V","Г":"G","Д":"D","Е":"E","Ж":"Zh","З":"Z","И":"I","Й":"J","К":"K","Л":"L","М":"M","Н":"N","О":"O","П":"P","Р":"R","С":"S","Т":"T","У":"U","Ф":"F","Х":"H","Ц":"C","Ч":"Ch","Ш":"Sh","Щ":"Sh","Ъ":"U","Ы":"Y","Ь":"","Э":"E","Ю":"Yu","Я":"Ya","а":"a","б":"b","в":"v","г":"g","д":"d","е":"e","ж":"zh","з":"z","и":"i","й":"j","к":"k","л":"l","м":"m","н":"n","о":"o","п":"p","р":"r","с":"s","т":"t","у":"u","ф":"f","х":"h","ц":"c","ч":"ch","ш":"sh","щ":"sh","ъ":"u","ы":"y","ь":"","э":"e","ю":"yu","я":"ya","ё":"yo","ђ":"dj","є":"ye","і":"i","ї":"yi","ј":"j","љ":"lj","њ":"nj","ћ":"c","ѝ":"u","џ":"dz","Ґ":"G","ґ":"g","Ғ":"GH","ғ":"gh","Қ":"KH","қ":"kh","Ң":"NG","ң":"ng","Ү":"UE","ү":"ue","Ұ":"U","ұ":"u","Һ":"H","һ":"h","Ә":"AE","ә":"ae","Ө":"OE","ө":"oe","฿":"baht","ა":"a","ბ":"b","გ":"g","დ":"d","ე":"e","ვ":"v","ზ":"z","თ":"t","ი":"i","კ":"k","ლ":"l","მ":"m","ნ":"n","ო":"o","პ":"p","ჟ":"zh","რ":"r","ს":"s","ტ":"t","უ":"u","ფ":"f","ქ":"k","ღ":"gh","ყ":"q","შ":"sh","ჩ":"ch","ც":"ts","ძ":"dz","წ":"ts","ჭ":"ch","ხ":"kh","ჯ":"j","ჰ":"h","Ẁ":"W","ẁ":"w","Ẃ":"W","ẃ":"w","Ẅ":"W","ẅ":"w","ẞ":"SS","Ạ":"A","ạ":"a","Ả":"A","ả":"a","Ấ":"A","ấ":"a","Ầ":"A","ầ":"a","Ẩ":"A","ẩ":"a","Ẫ":"A","ẫ":"a","Ậ":"A","ậ":"a","Ắ":"A","ắ":"a","Ằ":"A","ằ":"a","Ẳ":"A","ẳ":"a","Ẵ":"A","ẵ":"a","Ặ":"A","ặ":"a","Ẹ":"E","ẹ":"e","Ẻ":"E","ẻ":"e","Ẽ":"E","ẽ":"e","Ế":"E","ế":"e","Ề":"E","ề":"e","Ể":"E","ể":"e","Ễ":"E","ễ":"e","Ệ":"E","ệ":"e","Ỉ":"I","ỉ":"i","Ị":"I","ị":"i","Ọ":"O","ọ":"o","Ỏ":"O","ỏ":"o","Ố":"O","ố":"o","Ồ":"O","ồ":"o","Ổ":"O","ổ":"o","Ỗ":"O","ỗ":"o","Ộ":"O","ộ":"o","Ớ":"O","ớ":"o","Ờ":"O","ờ":"o","Ở":"O","ở":"o","Ỡ":"O","ỡ":"o","Ợ":"O","ợ":"o","Ụ":"U","ụ":"u","Ủ":"U","ủ":"u","Ứ":"U","ứ":"u","Ừ":"U","ừ":"u","Ử":"U","ử":"u","Ữ":"U","ữ":"u","Ự":"U","ự":"u","Ỳ":"Y","ỳ":"y","Ỵ":"Y","ỵ":"y","Ỷ":"Y","ỷ":"y","Ỹ":"Y","ỹ":"y","‘":"\'","’":"\'","“":"\\"","”":"\\"","†":"+","•":"*","…":"...","₠":"ecu","₢":"cruzeiro","₣":"french franc","₤":"lira","₥":"mill","₦":"naira","₧":"peseta","₨":"rupee","₩":"won","₪":"new shequel","₫":"dong","€":"euro","₭":"kip","₮":"tugrik","₯":"drachma","₰":"penny","₱":"peso","₲":"guarani","₳":"austral","₴":"hryvnia","₵":"cedi","₸":"kazakhstani tenge","₹":"indian rupee","₺":"turkish lira","₽":"russian ruble","₿":"bitcoin","℠":"sm","™":"tm","∂":"d","∆":"delta","∑":"sum","∞":"infinity","♥":"love","元":"yuan","円":"yen","﷼":"rial"}'),t=JSON.parse('{"vi":{"Đ":"D","đ":"d"}}');function n(n,r){if("string"!=typeof n)throw new Error("slugify: string argument expected");var o=t[(r="string"==typeof r?{replacement:r}:r||{}).locale]||{},i=void 0===r.replacement?"-":r.replacement,a=n.split("").reduce((function(t,n){return t+(o[n]||e[n]||n).replace(r.remove||/[^\w\s$*_+~.()'"!\-:@]+/g,"")}),"").trim().replace(new RegExp("[\\s"+i+"]+","g"),i);return r.lower&&(a=a.toLowerCase()),r.strict&&(a=a.replace(new RegExp("[^a-zA-Z0-9"+i+"]","g"),"").replace(new RegExp("[\\s"+i+"]+","g"),i)),a}return n.extend=function(t){for(var n in t)e[n]=t[n]},n},e.exports=r(),e.exports.default=r()},function(e,t){e.exports=function(e,t,n,r){var o=n?n.call(r,e,t):void 0;if(void 0!==o)return!!o;if(e===t)return!0;if("object"!=typeof e||!e||"object"!=typeof t||!t)return!1;var i=Object.keys(e),a=Object.keys(t);if(i.length!==a.length)return!1;for(var s=Object.prototype.hasOwnProperty.bind(t),l=0;l<i.length;l++){var c=i[l];if(!s(c))return!1;var u=e[c],p=t[c];if(!1===(o=n?n.call(r,u,p,c):void 0)||void 0===o&&u!==p)return!1}return!0}},function(e,t,n){"use strict";t.a=function(e){function t(e,t,r){var o=t.trim().split(h);t=o;var i=o.length,a=e.length;switch(a){case 0:case 1:var s=0;for(e=0===a?"":e[0]+" ";s<i;++s)t[s]=n(e,t[s],r).trim();break;default:var l=s=0;for(t=[];s<i;++s)for(var c=0;c<a;++c)t[l++]=n(e[c]+" ",o[s],r).trim()}return t}function n(e,t,n){var r=t.charCodeAt(0);switch(33>r&&(r=(t=t.trim()).charCodeAt(0)),r){case 38:return t.replace(m,"$1"+e.trim());case 58:return e.trim()+t.replace(m,"$1"+e.trim());default:if(0<1*n&&0<t.indexOf("\f"))return t.replace(m,(58===e.charCodeAt(0)?"":"$1")+e.trim())}return e+t}function r(e,t,n,i){var a=e+";",s=2*t+3*n+4*i;if(944===s){e=a.indexOf(":",9)+1;var l=a.substring(e,a.length-1).trim();return l=a.substring(0,e).trim()+l+";",1===A||2===A&&o(l,1)?"-webkit-"+l+l:l}if(0===A||2===A&&!o(a,1))return a;switch(s){case 1015:return 97===a.charCodeAt(10)?"-webkit-"+a+a:a;case 951:return 116===a.charCodeAt(3)?"-webkit-"+a+a:a;case 963:return 110===a.charCodeAt(5)?"-webkit-"+a+a:a;case 1009:if(100!==a.charCodeAt(4))break;case 969:case 942:return"-webkit-"+a+a;case 978:return"-webkit-"+a+"-moz-"+a+a;case 1019:case 983:return"-webkit-"+a+"-moz-"+a+"-ms-"+a+a;case 883:if(45===a.charCodeAt(8))return"-webkit-"+a+a;if(0<a.indexOf("image-set(",11))return a.replace(_,"$1-webkit-$2")+a;break;case 932:if(45===a.charCodeAt(4))switch(a.charCodeAt(5)){case 103:return"-webkit-box-"+a.replace("-grow","")+"-webkit-"+a+"-ms-"+a.replace("grow","positive")+a;case 115:return"-webkit-"+a+"-ms-"+a.replace("shrink","negative")+a;case 98:return"-webkit-"+a+"-ms-"+a.replace("basis","preferred-size")+a}return"-webkit-"+a+"-ms-"+a+a;case 964:return"-webkit-"+a+"-ms-flex-"+a+a;case 1023:if(99!==a.charCodeAt(8))break;return"-webkit-box-pack"+(l=a.substring(a.indexOf(":",15)).replace("flex-","").replace("space-between","justify"))+"-webkit-"+a+"-ms-flex-pack"+l+a;case 1005:return f.test(a)?a.replace(p,":-webkit-")+a.replace(p,":-moz-")+a:a;case 1e3:switch(t=(l=a.substring(13).trim()).indexOf("-")+1,l.charCodeAt(0)+l.charCodeAt(t)){case 226:l=a.replace(b,"tb");break;case 232:l=a.replace(b,"tb-rl");break;case 220:l=a.replace(b,"lr");break;default:return a}return"-webkit-"+a+"-ms-"+l+a;case 1017:if(-1===a.indexOf("sticky",9))break;case 975:switch(t=(a=e).length-10,s=(l=(33===a.charCodeAt(t)?a.substring(0,t):a).substring(e.indexOf(":",7)+1).trim()).charCodeAt(0)+(0|l.charCodeAt(7))){case 203:if(111>l.charCodeAt(8))break;case 115:a=a.replace(l,"-webkit-"+l)+";"+a;break;case 207:case 102:a=a.replace(l,"-webkit-"+(102<s?"inline-":"")+"box")+";"+a.replace(l,"-webkit-"+l)+";"+a.replace(l,"-ms-"+l+"box")+";"+a}return a+";";case 938:if(45===a.charCodeAt(5))switch(a.charCodeAt(6)){case 105:return l=a.replace("-items",""),"-webkit-"+a+"-webkit-box-"+l+"-ms-flex-"+l+a;case 115:return"-webkit-"+a+"-ms-flex-item-"+a.replace(k,"")+a;default:return"-webkit-"+a+"-ms-flex-line-pack"+a.replace("align-content","").replace(k,"")+a}break;case 973:case 989:if(45!==a.charCodeAt(3)||122===a.charCodeAt(4))break;case 931:case 953:if(!0===E.test(e))return 115===(l=e.substring(e.indexOf(":")+1)).charCodeAt(0)?r(e.replace("stretch","fill-available"),t,n,i).replace(":fill-available",":stretch"):a.replace(l,"-webkit-"+l)+a.replace(l,"-moz-"+l.replace("fill-",""))+a;break;case 962:if(a="-webkit-"+a+(102===a.charCodeAt(5)?"-ms-"+a:"")+a,211===n+i&&105===a.charCodeAt(13)&&0<a.indexOf("transform",10))return a.substring(0,a.indexOf(";",27)+1).replace(d,"$1-webkit-$2")+a}return a}function o(e,t){var n=e.indexOf(1===t?":":"{"),r=e.substring(0,3!==t?n:10);return n=e.substring(n+1,e.length-1),R(2!==t?r:r.replace(O,"$1"),n,t)}function i(e,t){var n=r(t,t.charCodeAt(0),t.charCodeAt(1),t.charCodeAt(2));return n!==t+";"?n.replace(w," or ($1)").substring(4):"("+t+")"}function a(e,t,n,r,o,i,a,s,c,u){for(var p,f=0,d=t;f<P;++f)switch(p=I[f].call(l,e,d,n,r,o,i,a,s,c,u)){case void 0:case!1:case!0:case null:break;default:d=p}if(d!==t)return d}function s(e){return void 0!==(e=e.prefix)&&(R=null,e?"function"!=typeof e?A=1:(A=2,R=e):A=0),s}function l(e,n){var s=e;if(33>s.charCodeAt(0)&&(s=s.trim()),s=[s],0<P){var l=a(-1,n,s,s,T,S,0,0,0,0);void 0!==l&&"string"==typeof l&&(n=l)}var p=function e(n,s,l,p,f){for(var d,h,m,b,w,k=0,O=0,E=0,_=0,I=0,R=0,L=m=d=0,M=0,D=0,F=0,z=0,U=l.length,B=U-1,$="",W="",q="",H="";M<U;){if(h=l.charCodeAt(M),M===B&&0!==O+_+E+k&&(0!==O&&(h=47===O?10:47),_=E=k=0,U++,B++),0===O+_+E+k){if(M===B&&(0<D&&($=$.replace(u,"")),0<$.trim().length)){switch(h){case 32:case 9:case 59:case 13:case 10:break;default:$+=l.charAt(M)}h=59}switch(h){case 123:for(d=($=$.trim()).charCodeAt(0),m=1,z=++M;M<U;){switch(h=l.charCodeAt(M)){case 123:m++;break;case 125:m--;break;case 47:switch(h=l.charCodeAt(M+1)){case 42:case 47:e:{for(L=M+1;L<B;++L)switch(l.charCodeAt(L)){case 47:if(42===h&&42===l.charCodeAt(L-1)&&M+2!==L){M=L+1;break e}break;case 10:if(47===h){M=L+1;break e}}M=L}}break;case 91:h++;case 40:h++;case 34:case 39:for(;M++<B&&l.charCodeAt(M)!==h;);}if(0===m)break;M++}switch(m=l.substring(z,M),0===d&&(d=($=$.replace(c,"").trim()).charCodeAt(0)),d){case 64:switch(0<D&&($=$.replace(u,"")),h=$.charCodeAt(1)){case 100:case 109:case 115:case 45:D=s;break;default:D=C}if(z=(m=e(s,D,m,h,f+1)).length,0<P&&(w=a(3,m,D=t(C,$,F),s,T,S,z,h,f,p),$=D.join(""),void 0!==w&&0===(z=(m=w.trim()).length)&&(h=0,m="")),0<z)switch(h){case 115:$=$.replace(x,i);case 100:case 109:case 45:m=$+"{"+m+"}";break;case 107:m=($=$.replace(g,"$1 $2"))+"{"+m+"}",m=1===A||2===A&&o("@"+m,3)?"@-webkit-"+m+"@"+m:"@"+m;break;default:m=$+m,112===p&&(W+=m,m="")}else m="";break;default:m=e(s,t(s,$,F),m,p,f+1)}q+=m,m=F=D=L=d=0,$="",h=l.charCodeAt(++M);break;case 125:case 59:if(1<(z=($=(0<D?$.replace(u,""):$).trim()).length))switch(0===L&&(d=$.charCodeAt(0),45===d||96<d&&123>d)&&(z=($=$.replace(" ",":")).length),0<P&&void 0!==(w=a(1,$,s,n,T,S,W.length,p,f,p))&&0===(z=($=w.trim()).length)&&($="\0\0"),d=$.charCodeAt(0),h=$.charCodeAt(1),d){case 0:break;case 64:if(105===h||99===h){H+=$+l.charAt(M);break}default:58!==$.charCodeAt(z-1)&&(W+=r($,d,h,$.charCodeAt(2)))}F=D=L=d=0,$="",h=l.charCodeAt(++M)}}switch(h){case 13:case 10:47===O?O=0:0===1+d&&107!==p&&0<$.length&&(D=1,$+="\0"),0<P*N&&a(0,$,s,n,T,S,W.length,p,f,p),S=1,T++;break;case 59:case 125:if(0===O+_+E+k){S++;break}default:switch(S++,b=l.charAt(M),h){case 9:case 32:if(0===_+k+O)switch(I){case 44:case 58:case 9:case 32:b="";break;default:32!==h&&(b=" ")}break;case 0:b="\\0";break;case 12:b="\\f";break;case 11:b="\\v";break;case 38:0===_+O+k&&(D=F=1,b="\f"+b);break;case 108:if(0===_+O+k+j&&0<L)switch(M-L){case 2:112===I&&58===l.charCodeAt(M-3)&&(j=I);case 8:111===R&&(j=R)}break;case 58:0===_+O+k&&(L=M);break;case 44:0===O+E+_+k&&(D=1,b+="\r");break;case 34:case 39:0===O&&(_=_===h?0:0===_?h:_);break;case 91:0===_+O+E&&k++;break;case 93:0===_+O+E&&k--;break;case 41:0===_+O+k&&E--;break;case 40:if(0===_+O+k){if(0===d)switch(2*I+3*R){case 533:break;default:d=1}E++}break;case 64:0===O+E+_+k+L+m&&(m=1);break;case 42:case 47:if(!(0<_+k+E))switch(O){case 0:switch(2*h+3*l.charCodeAt(M+1)){case 235:O=47;break;case 220:z=M,O=42}break;case 42:47===h&&42===I&&z+2!==M&&(33===l.charCodeAt(z+2)&&(W+=l.substring(z,M+1)),b="",O=0)}}0===O&&($+=b)}R=I,I=h,M++}if(0<(z=W.length)){if(D=s,0<P&&(void 0!==(w=a(2,W,D,n,T,S,z,p,f,p))&&0===(W=w).length))return H+W+q;if(W=D.join(",")+"{"+W+"}",0!=A*j){switch(2!==A||o(W,2)||(j=0),j){case 111:W=W.replace(v,":-moz-$1")+W;break;case 112:W=W.replace(y,"::-webkit-input-$1")+W.replace(y,"::-moz-$1")+W.replace(y,":-ms-input-$1")+W}j=0}}return H+W+q}(C,s,n,0,0);return 0<P&&(void 0!==(l=a(-2,p,s,s,T,S,p.length,0,0,0))&&(p=l)),"",j=0,S=T=1,p}var c=/^\0+/g,u=/[\0\r\f]/g,p=/: */g,f=/zoo|gra/,d=/([,: ])(transform)/g,h=/,\r+?/g,m=/([\t\r\n ])*\f?&/g,g=/@(k\w+)\s*(\S*)\s*/,y=/::(place)/g,v=/:(read-only)/g,b=/[svh]\w+-[tblr]{2}/,x=/\(\s*(.*)\s*\)/g,w=/([\s\S]*?);/g,k=/-self|flex-/g,O=/[^]*?(:[rp][el]a[\w-]+)[^]*/,E=/stretch|:\s*\w+\-(?:conte|avail)/,_=/([^-])(image-set\()/,S=1,T=1,j=0,A=1,C=[],I=[],P=0,R=null,N=0;return l.use=function e(t){switch(t){case void 0:case null:P=I.length=0;break;default:if("function"==typeof t)I[P++]=t;else if("object"==typeof t)for(var n=0,r=t.length;n<r;++n)e(t[n]);else N=0|!!t}return e},l.set=s,void 0!==e&&s(e),l}},function(e,t,n){"use strict";t.a={animationIterationCount:1,borderImageOutset:1,borderImageSlice:1,borderImageWidth:1,boxFlex:1,boxFlexGroup:1,boxOrdinalGroup:1,columnCount:1,columns:1,flex:1,flexGrow:1,flexPositive:1,flexShrink:1,flexNegative:1,flexOrder:1,gridRow:1,gridRowEnd:1,gridRowSpan:1,gridRowStart:1,gridColumn:1,gridColumnEnd:1,gridColumnSpan:1,gridColumnStart:1,msGridRow:1,msGridRowSpan:1,msGridColumn:1,msGridColumnSpan:1,fontWeight:1,lineHeight:1,opacity:1,order:1,orphans:1,tabSize:1,widows:1,zIndex:1,zoom:1,WebkitLineClamp:1,fillOpacity:1,floodOpacity:1,stopOpacity:1,strokeDasharray:1,strokeDashoffset:1,strokeMiterlimit:1,strokeOpacity:1,strokeWidth:1}},function(e,t,n){"use strict";(function(t){n(131);var r=n(280),o=n(145),i=n(282),a=n(283),s=n(284),l=n(285),c=n(25),u=n(146),p=n(30);function f(){this.schema=null,this.$refs=new r}e.exports=f,e.exports.YAML=n(132),f.parse=function(e,t,n,r){var o=this,i=new o;return i.parse.apply(i,arguments)},f.prototype.parse=function(e,n,a,s){var l,f=i(arguments);if(!f.path&&!f.schema){var d=p("Expected a file path, URL, or object. Got %s",f.path||f.schema);return u(f.callback,Promise.reject(d))}this.schema=null,this.$refs=new r;var h="http";if(c.isFileSystemPath(f.path)&&(f.path=c.fromFileSystemPath(f.path),h="file"),f.path=c.resolve(c.cwd(),f.path),f.schema&&"object"==typeof f.schema){var m=this.$refs._add(f.path);m.value=f.schema,m.pathType=h,l=Promise.resolve(f.schema)}else l=o(f.path,this.$refs,f.options);var g=this;return l.then((function(e){if(!e||"object"!=typeof e||t.isBuffer(e))throw p.syntax('"%s" is not a valid JSON Schema',g.$refs._root$Ref.path||e);return g.schema=e,u(f.callback,Promise.resolve(g.schema))})).catch((function(e){return u(f.callback,Promise.reject(e))}))},f.resolve=function(e,t,n,r){var o=this,i=new o;return i.resolve.apply(i,arguments)},f.prototype.resolve=function(e,t,n,r){var o=this,s=i(arguments);return this.parse(s.path,s.schema,s.options).then((function(){return a(o,s.options)})).then((function(){return u(s.callback,Promise.resolve(o.$refs))})).catch((function(e){return u(s.callback,Promise.reject(e))}))},f.bundle=function(e,t,n,r){var o=this,i=new o;return i.bundle.apply(i,arguments)},f.prototype.bundle=function(e,t,n,r){var o=this,a=i(arguments);return this.resolve(a.path,a.schema,a.options).then((function(){return s(o,a.options),u(a.callback,Promise.resolve(o.schema))})).catch((function(e){return u(a.callback,Promise.reject(e))}))},f.dereference=function(e,t,n,r){var o=this,i=new o;return i.dereference.apply(i,arguments)},f.prototype.dereference=function(e,t,n,r){var o=this,a=i(arguments);return this.resolve(a.path,a.schema,a.options).then((function(){return l(o,a.options),u(a.callback,Promise.resolve(o.schema))})).catch((function(e){return u(a.callback,Promise.reject(e))}))}}).call(this,n(15).Buffer)},function(e,t,n){"use strict";var r,o=n(1),i=n(147),a=n(10),s=(n(49),n(146)),l=n(61),c=n(61),u=n(62),p=u.jptr,f=n(92).isRef,d=n(63).clone,h=n(63).circularClone,m=n(93).recurse,g=n(286),y=n(289),v=n(148),b=n(290).statusCodes,x=n(291).version,w=function(e){function t(t){var n=e.call(this,t)||this;return n.name="S2OError",n}return o.__extends(t,e),t}(Error);function k(e,t){var n=new w(e);if(n.options=t,!t.promise)throw n;t.promise.reject(n)}function O(e,t,n){n.warnOnly?t[n.warnProperty||"x-s2o-warning"]=e:k(e,n)}function E(e,t){y.walkSchema(e,{},{},(function(e,n,r){!function(e,t){if(e["x-required"]&&Array.isArray(e["x-required"])&&(e.required||(e.required=[]),e.required=e.required.concat(e["x-required"]),delete e["x-required"]),e["x-anyOf"]&&(e.anyOf=e["x-anyOf"],delete e["x-anyOf"]),e["x-oneOf"]&&(e.oneOf=e["x-oneOf"],delete e["x-oneOf"]),e["x-not"]&&(e.not=e["x-not"],delete e["x-not"]),"boolean"==typeof e["x-nullable"]&&(e.nullable=e["x-nullable"],delete e["x-nullable"]),"object"==typeof e["x-discriminator"]&&"string"==typeof e["x-discriminator"].propertyName)for(var n in e.discriminator=e["x-discriminator"],delete e["x-discriminator"],e.discriminator.mapping){var r=e.discriminator.mapping[n];r.startsWith("#/definitions/")&&(e.discriminator.mapping[n]=r.replace("#/definitions/","#/components/schemas/"))}}(e),function(e,t,n){if(e.nullable&&n.patches++,e.discriminator&&"string"==typeof e.discriminator&&(e.discriminator={propertyName:e.discriminator}),e.items&&Array.isArray(e.items)&&(0===e.items.length?e.items={}:1===e.items.length?e.items=e.items[0]:e.items={anyOf:e.items}),e.type&&Array.isArray(e.type))if(n.patch){if(n.patches++,0===e.type.length)delete e.type;else{e.oneOf||(e.oneOf=[]);for(var r=0,o=e.type;r<o.length;r++){var i=o[r],a={};if("null"===i)e.nullable=!0;else{a.type=i;for(var s=0,l=v.arrayProperties;s<l.length;s++){var c=l[s];void 0!==e.prop&&(a[c]=e[c],delete e[c])}}a.type&&e.oneOf.push(a)}delete e.type,0===e.oneOf.length?delete e.oneOf:e.oneOf.length<2&&(e.type=e.oneOf[0].type,Object.keys(e.oneOf[0]).length>1&&O("Lost properties from oneOf",e,n),delete e.oneOf)}e.type&&Array.isArray(e.type)&&1===e.type.length&&(e.type=e.type[0])}else k("(Patchable) schema type must not be an array",n);e.type&&"null"===e.type&&(delete e.type,e.nullable=!0),"array"!==e.type||e.items||(e.items={}),"boolean"==typeof e.required&&(e.required&&e.name&&(void 0===t.required&&(t.required=[]),Array.isArray(t.required)&&t.required.push(e.name)),delete e.required),e.xml&&"string"==typeof e.xml.namespace&&(e.xml.namespace||delete e.xml.namespace)}(e,n,t)}))}function _(e,t,n){var o=n.payload.options;if(f(e,t)){if(e[t].startsWith("#/components/"));else if("#/consumes"===e[t])delete e[t],n.parent[n.pkey]=d(o.openapi.consumes);else if("#/produces"===e[t])delete e[t],n.parent[n.pkey]=d(o.openapi.produces);else if(e[t].startsWith("#/definitions/")){var i=e[t].replace("#/definitions/","").split("/"),a=u.jpunescape(i[0]);(w=r.schemas[decodeURIComponent(a)])?i[0]=w:O("Could not resolve reference "+e[t],e,o),e[t]="#/components/schemas/"+i.join("/")}else if(e[t].startsWith("#/parameters/"))e[t]="#/components/parameters/"+v.sanitise(e[t].replace("#/parameters/",""));else if(e[t].startsWith("#/responses/"))e[t]="#/components/responses/"+v.sanitise(e[t].replace("#/responses/",""));else if(e[t].startsWith("#")){var s=d(u.jptr(o.openapi,e[t]));if(!1===s)O("direct $ref not found "+e[t],e,o);else if(o.refmap[e[t]])e[t]=o.refmap[e[t]];else{var l=e[t],c="schemas",p=(l=(l=(l=(l=l.replace("/properties/headers/","")).replace("/properties/responses/","")).replace("/properties/parameters/","")).replace("/properties/schemas/","")).lastIndexOf("/schema");if("schemas"===(c=l.indexOf("/headers/")>p?"headers":l.indexOf("/responses/")>p?"responses":l.indexOf("/example")>p?"examples":l.indexOf("/x-")>p?"extensions":l.indexOf("/parameters/")>p?"parameters":"schemas")&&E(s,o),"responses"!==c&&"extensions"!==c){var h=c.substr(0,c.length-1);"parameter"===h&&s.name&&s.name===v.sanitise(s.name)&&(h=encodeURIComponent(s.name));var m=1;for(e["x-miro"]&&(h=function(e){return e=e.indexOf("#")>=0?e.split("#")[1].split("/").pop():e.split("/").pop().split(".")[0],encodeURIComponent(v.sanitise(e))}(e["x-miro"]),m="");u.jptr(o.openapi,"#/components/"+c+"/"+h+m);)m=""===m?2:++m;var g="#/components/"+c+"/"+h+m,y="";"examples"===c&&(s={value:s},y="/value"),u.jptr(o.openapi,g,s),o.refmap[e[t]]=g+y,e[t]=g+y}}}if(delete e["x-miro"],Object.keys(e).length>1){var b=e[t],x=n.path.indexOf("/schema")>=0;"preserve"===o.refSiblings||(x&&"allOf"===o.refSiblings?(delete e.$ref,n.parent[n.pkey]={allOf:[{$ref:b},e]}):n.parent[n.pkey]={$ref:b})}}if("x-ms-odata"===t&&"string"==typeof e[t]&&e[t].startsWith("#/")){var w;i=e[t].replace("#/definitions/","").replace("#/components/schemas/","").split("/");(w=r.schemas[decodeURIComponent(i[0])])?i[0]=w:O("Could not resolve reference "+e[t],e,o),e[t]="#/components/schemas/"+i.join("/")}}function S(e){for(var t in e)for(var n in e[t]){var r=v.sanitise(n);n!=r&&(e[t][r]=e[t][n],delete e[t][n])}}function T(e,t){if("basic"===e.type&&(e.type="http",e.scheme="basic"),"oauth2"===e.type){var n={},r=e.flow;"application"===e.flow&&(r="clientCredentials"),"accessCode"===e.flow&&(r="authorizationCode"),void 0!==e.authorizationUrl&&(n.authorizationUrl=e.authorizationUrl.split("?")[0].trim()||"/"),"string"==typeof e.tokenUrl&&(n.tokenUrl=e.tokenUrl.split("?")[0].trim()||"/"),n.scopes=e.scopes||{},e.flows={},e.flows[r]=n,delete e.flow,delete e.authorizationUrl,delete e.tokenUrl,delete e.scopes,void 0!==e.name&&(t.patch?(t.patches++,delete e.name):k("(Patchable) oauth2 securitySchemes should not have name property",t))}}function j(e){return e&&!e["x-s2o-delete"]}function A(e,t){if(e.$ref)e.$ref=e.$ref.replace("#/responses/","#/components/responses/");else{e.type&&!e.schema&&(e.schema={}),e.type&&(e.schema.type=e.type),e.items&&"array"!==e.items.type&&(e.items.collectionFormat!==e.collectionFormat&&O("Nested collectionFormats are not supported",e,t),delete e.items.collectionFormat),"array"===e.type?("ssv"===e.collectionFormat?O("collectionFormat:ssv is no longer supported for headers",e,t):"pipes"===e.collectionFormat?O("collectionFormat:pipes is no longer supported for headers",e,t):"multi"===e.collectionFormat?e.explode=!0:"tsv"===e.collectionFormat?(O("collectionFormat:tsv is no longer supported",e,t),e["x-collectionFormat"]="tsv"):e.style="simple",delete e.collectionFormat):e.collectionFormat&&(t.patch?(t.patches++,delete e.collectionFormat):k("(Patchable) collectionFormat is only applicable to header.type array",t)),delete e.type;for(var n=0,r=v.parameterTypeProperties;n<r.length;n++){void 0!==e[a=r[n]]&&(e.schema[a]=e[a],delete e[a])}for(var o=0,i=v.arrayProperties;o<i.length;o++){var a;void 0!==e[a=i[o]]&&(e.schema[a]=e[a],delete e[a])}}}function C(e,t){if(e.$ref.indexOf("#/parameters/")>=0){var n=e.$ref.split("#/parameters/");e.$ref=n[0]+"#/components/parameters/"+v.sanitise(n[1])}e.$ref.indexOf("#/definitions/")>=0&&O("Definition used as parameter",e,t)}function I(e,t,n,r,o,i,a){var s,l={},c=!0;if(t&&t.consumes&&"string"==typeof t.consumes){if(!a.patch)return k("(Patchable) operation.consumes must be an array",a);a.patches++,t.consumes=[t.consumes]}Array.isArray(i.consumes)||delete i.consumes;var u=((t?t.consumes:null)||i.consumes||[]).filter(v.uniqueOnly);if(e&&e.$ref&&"string"==typeof e.$ref){C(e,a);var f=decodeURIComponent(e.$ref.replace("#/components/parameters/","")),h=!1;if((j=i.components.parameters[f])&&!j["x-s2o-delete"]||!e.$ref.startsWith("#/")||(e["x-s2o-delete"]=!0,h=!0),h){var g=e.$ref,y=p(i,e.$ref);!y&&g.startsWith("#/")?O("Could not resolve reference "+g,e,a):y&&(e=y)}}if(e&&(e.name||e.in)){"boolean"==typeof e["x-deprecated"]&&(e.deprecated=e["x-deprecated"],delete e["x-deprecated"]),void 0!==e["x-example"]&&(e.example=e["x-example"],delete e["x-example"]),"body"==e.in||e.type||(a.patch?(a.patches++,e.type="string"):k("(Patchable) parameter.type is mandatory for non-body parameters",a)),e.type&&"object"==typeof e.type&&e.type.$ref&&(e.type=p(i,e.type.$ref)),"file"===e.type&&(e["x-s2o-originalType"]=e.type,s=e.type),e.description&&"object"==typeof e.description&&e.description.$ref&&(e.description=p(i,e.description.$ref)),null===e.description&&delete e.description;var b=e.collectionFormat;if("array"!==e.type||b||(b="csv"),b&&("array"!=e.type&&(a.patch?(a.patches++,delete e.collectionFormat):k("(Patchable) collectionFormat is only applicable to param.type array",a)),"csv"!==b||"query"!==e.in&&"cookie"!==e.in||(e.style="form",e.explode=!1),"csv"!==b||"path"!==e.in&&"header"!==e.in||(e.style="simple"),"ssv"===b&&("query"===e.in?e.style="spaceDelimited":O("collectionFormat:ssv is no longer supported except for in:query parameters",e,a)),"pipes"===b&&("query"===e.in?e.style="pipeDelimited":O("collectionFormat:pipes is no longer supported except for in:query parameters",e,a)),"multi"===b&&(e.explode=!0),"tsv"===b&&(O("collectionFormat:tsv is no longer supported",e,a),e["x-collectionFormat"]="tsv"),delete e.collectionFormat),e.type&&"object"!=e.type&&"body"!=e.type&&"formData"!=e.in)if(e.items&&e.schema)O("parameter has array,items and schema",e,a);else{e.schema&&a.patches++,e.schema&&"object"==typeof e.schema||(e.schema={}),e.schema.type=e.type,e.items&&(e.schema.items=e.items,delete e.items,m(e.schema.items,null,(function(t,n,r){"collectionFormat"===n&&"string"==typeof t[n]&&(b&&t[n]!==b&&O("Nested collectionFormats are not supported",e,a),delete t[n])})));for(var x=0,w=v.parameterTypeProperties;x<w.length;x++){var _=w[x];void 0!==e[_]&&(e.schema[_]=e[_]),delete e[_]}}e.schema&&E(e.schema,a),e["x-ms-skip-url-encoding"]&&"query"===e.in&&(e.allowReserved=!0,delete e["x-ms-skip-url-encoding"])}if(e&&"formData"===e.in){c=!1,l.content={};var S="application/x-www-form-urlencoded";if(u.length&&u.indexOf("multipart/form-data")>=0&&(S="multipart/form-data"),l.content[S]={},e.schema)l.content[S].schema=e.schema,e.schema.$ref&&(l["x-s2o-name"]=decodeURIComponent(e.schema.$ref.replace("#/components/schemas/","")));else{l.content[S].schema={},l.content[S].schema.type="object",l.content[S].schema.properties={},l.content[S].schema.properties[e.name]={};var T=l.content[S].schema,j=l.content[S].schema.properties[e.name];e.description&&(j.description=e.description),e.example&&(j.example=e.example),e.type&&(j.type=e.type);for(var A=0,I=v.parameterTypeProperties;A<I.length;A++){_=I[A];void 0!==e[_]&&(j[_]=e[_])}!0===e.required&&(T.required||(T.required=[]),T.required.push(e.name),l.required=!0),void 0!==e.default&&(j.default=e.default),j.properties&&(j.properties=e.properties),e.allOf&&(j.allOf=e.allOf),"array"===e.type&&e.items&&(j.items=e.items,j.items.collectionFormat&&delete j.items.collectionFormat),"file"!==s&&"file"!==e["x-s2o-originalType"]||(j.type="string",j.format="binary"),P(e,j)}}else e&&"file"===e.type&&(e.required&&(l.required=e.required),l.content={},l.content["application/octet-stream"]={},l.content["application/octet-stream"].schema={},l.content["application/octet-stream"].schema.type="string",l.content["application/octet-stream"].schema.format="binary",P(e,l));if(e&&"body"===e.in){l.content={},e.name&&(l["x-s2o-name"]=(t&&t.operationId?v.sanitiseAll(t.operationId):"")+("_"+e.name).toCamelCase()),e.description&&(l.description=e.description),e.required&&(l.required=e.required),t&&a.rbname&&e.name&&(t[a.rbname]=e.name),e.schema&&e.schema.$ref?l["x-s2o-name"]=decodeURIComponent(e.schema.$ref.replace("#/components/schemas/","")):e.schema&&"array"===e.schema.type&&e.schema.items&&e.schema.items.$ref&&(l["x-s2o-name"]=decodeURIComponent(e.schema.items.$ref.replace("#/components/schemas/",""))+"Array"),u.length||u.push("application/json");for(var R=0,N=u;R<N.length;R++){var L=N[R];l.content[L]={},l.content[L].schema=d(e.schema||{}),E(l.content[L].schema,a)}P(e,l)}Object.keys(l).length>0&&(e["x-s2o-delete"]=!0,t&&(t.requestBody&&c?(t.requestBody["x-s2o-overloaded"]=!0,O("Operation "+(t.operationId||o)+" has multiple requestBodies",t,a)):(t.requestBody||(t=n[r]=function(e,t){for(var n={},r=0,o=Object.keys(e);r<o.length;r++){var i=o[r];n[i]=e[i],"parameters"===i&&(n.requestBody={},t.rbname&&(n[t.rbname]=""))}return n.requestBody={},n}(t,a)),t.requestBody.content&&t.requestBody.content["multipart/form-data"]&&t.requestBody.content["multipart/form-data"].schema&&t.requestBody.content["multipart/form-data"].schema.properties&&l.content["multipart/form-data"]&&l.content["multipart/form-data"].schema&&l.content["multipart/form-data"].schema.properties?(t.requestBody.content["multipart/form-data"].schema.properties=Object.assign(t.requestBody.content["multipart/form-data"].schema.properties,l.content["multipart/form-data"].schema.properties),t.requestBody.content["multipart/form-data"].schema.required=(t.requestBody.content["multipart/form-data"].schema.required||[]).concat(l.content["multipart/form-data"].schema.required||[]),t.requestBody.content["multipart/form-data"].schema.required.length||delete t.requestBody.content["multipart/form-data"].schema.required):t.requestBody.content&&t.requestBody.content["application/x-www-form-urlencoded"]&&t.requestBody.content["application/x-www-form-urlencoded"].schema&&t.requestBody.content["application/x-www-form-urlencoded"].schema.properties&&l.content["application/x-www-form-urlencoded"]&&l.content["application/x-www-form-urlencoded"].schema&&l.content["application/x-www-form-urlencoded"].schema.properties?(t.requestBody.content["application/x-www-form-urlencoded"].schema.properties=Object.assign(t.requestBody.content["application/x-www-form-urlencoded"].schema.properties,l.content["application/x-www-form-urlencoded"].schema.properties),t.requestBody.content["application/x-www-form-urlencoded"].schema.required=(t.requestBody.content["application/x-www-form-urlencoded"].schema.required||[]).concat(l.content["application/x-www-form-urlencoded"].schema.required||[]),t.requestBody.content["application/x-www-form-urlencoded"].schema.required.length||delete t.requestBody.content["application/x-www-form-urlencoded"].schema.required):(t.requestBody=Object.assign(t.requestBody,l),t.requestBody["x-s2o-name"]||(t.requestBody.schema&&t.requestBody.schema.$ref?t.requestBody["x-s2o-name"]=decodeURIComponent(t.requestBody.schema.$ref.replace("#/components/schemas/","")).split("/").join(""):t.operationId&&(t.requestBody["x-s2o-name"]=v.sanitiseAll(t.operationId)))))));if(e&&!e["x-s2o-delete"]){delete e.type;for(var M=0,D=v.parameterTypeProperties;M<D.length;M++){_=D[M];delete e[_]}"path"!==e.in||void 0!==e.required&&!0===e.required||(a.patch?(a.patches++,e.required=!0):k("(Patchable) path parameters must be required:true ["+e.name+" in "+o+"]",a))}return t}function P(e,t){for(var n in e)n.startsWith("x-")&&!n.startsWith("x-s2o")&&(t[n]=e[n])}function R(e,t,n,r,o){if(!e)return!1;if(e.$ref&&"string"==typeof e.$ref)e.$ref.indexOf("#/definitions/")>=0?O("definition used as response: "+e.$ref,e,o):e.$ref.startsWith("#/responses/")&&(e.$ref="#/components/responses/"+v.sanitise(decodeURIComponent(e.$ref.replace("#/responses/",""))));else{if((void 0===e.description||null===e.description||""===e.description&&o.patch)&&(o.patch?"object"!=typeof e||Array.isArray(e)||(o.patches++,e.description=b[e]||""):k("(Patchable) response.description is mandatory",o)),void 0!==e.schema){if(E(e.schema,o),e.schema.$ref&&"string"==typeof e.schema.$ref&&e.schema.$ref.startsWith("#/responses/")&&(e.schema.$ref="#/components/responses/"+v.sanitise(decodeURIComponent(e.schema.$ref.replace("#/responses/","")))),n&&n.produces&&"string"==typeof n.produces){if(!o.patch)return k("(Patchable) operation.produces must be an array",o);o.patches++,n.produces=[n.produces]}r.produces&&!Array.isArray(r.produces)&&delete r.produces;var i=((n?n.produces:null)||r.produces||[]).filter(v.uniqueOnly);i.length||i.push("*/*"),e.content={};for(var a=0,s=i;a<s.length;a++){var l=s[a];if(e.content[l]={},e.content[l].schema=d(e.schema),e.examples&&e.examples[l]){var c={};c.value=e.examples[l],e.content[l].examples={},e.content[l].examples.response=c,delete e.examples[l]}"file"===e.content[l].schema.type&&(e.content[l].schema={type:"string",format:"binary"})}delete e.schema}for(var l in e.examples)e.content||(e.content={}),e.content[l]||(e.content[l]={}),e.content[l].examples={},e.content[l].examples.response={},e.content[l].examples.response.value=e.examples[l];if(delete e.examples,e.headers)for(var u in e.headers)"status code"===u.toLowerCase()?o.patch?(o.patches++,delete e.headers[u]):k('(Patchable) "Status Code" is not a valid header',o):A(e.headers[u],o)}}function N(e,t,n,r,o){for(var i in e){var s=e[i];for(var l in s&&s["x-trace"]&&"object"==typeof s["x-trace"]&&(s.trace=s["x-trace"],delete s["x-trace"]),s&&s["x-summary"]&&"string"==typeof s["x-summary"]&&(s.summary=s["x-summary"],delete s["x-summary"]),s&&s["x-description"]&&"string"==typeof s["x-description"]&&(s.description=s["x-description"],delete s["x-description"]),s&&s["x-servers"]&&Array.isArray(s["x-servers"])&&(s.servers=s["x-servers"],delete s["x-servers"]),s)if(v.httpMethods.indexOf(l)>=0||"x-amazon-apigateway-any-method"===l){var c=s[l];if(c&&c.parameters&&Array.isArray(c.parameters)){if(s.parameters)for(var f=function(e){"string"==typeof e.$ref&&(C(e,n),e=p(o,e.$ref)),c.parameters.find((function(t,n,r){return t.name===e.name&&t.in===e.in}))||"formData"!==e.in&&"body"!==e.in&&"file"!==e.type||(c=I(e,c,s,l,i,o,n),n.rbname&&""===c[n.rbname]&&delete c[n.rbname])},h=0,m=s.parameters;h<m.length;h++){f(b=m[h])}for(var g=0,y=c.parameters;g<y.length;g++){var b=y[g];c=I(b,c,s,l,l+":"+i,o,n)}n.rbname&&""===c[n.rbname]&&delete c[n.rbname],n.debug||c.parameters&&(c.parameters=c.parameters.filter(j))}if(c&&c.security&&S(c.security),"object"==typeof c){if(!c.responses){var x={description:"Default response"};c.responses={default:x}}for(var w in c.responses){R(c.responses[w],0,c,o,n)}}if(c&&c["x-servers"]&&Array.isArray(c["x-servers"]))c.servers=c["x-servers"],delete c["x-servers"];else if(c&&c.schemes&&c.schemes.length)for(var k=0,O=c.schemes;k<O.length;k++){var E=O[k];if((!o.schemes||o.schemes.indexOf(E)<0)&&(c.servers||(c.servers=[]),Array.isArray(o.servers)))for(var _=0,T=o.servers;_<T.length;_++){var A=T[_],P=d(A),N=a.parse(P.url);N.protocol=E,P.url=N.format(),c.servers.push(P)}}if(n.debug&&(c["x-s2o-consumes"]=c.consumes||[],c["x-s2o-produces"]=c.produces||[]),c){if(delete c.consumes,delete c.produces,delete c.schemes,c["x-ms-examples"]){for(var L in c["x-ms-examples"]){var M=c["x-ms-examples"][L],D=v.sanitiseAll(L);if(M.parameters)for(var F in M.parameters)for(var z=M.parameters[F],U=0,B=(c.parameters||[]).concat(s.parameters||[]);U<B.length;U++){(b=B[U]).$ref&&(b=u.jptr(o,b.$ref)),b.name!==F||b.example||(b.examples||(b.examples={}),b.examples[L]={value:z})}if(M.responses)for(var w in M.responses){if(M.responses[w].headers)for(var $ in M.responses[w].headers){z=M.responses[w].headers[$];for(var W in c.responses[w].headers){if(W===$)c.responses[w].headers[W].example=z}}if(M.responses[w].body&&(o.components.examples[D]={value:d(M.responses[w].body)},c.responses[w]&&c.responses[w].content))for(var q in c.responses[w].content){var H=c.responses[w].content[q];H.examples||(H.examples={}),H.examples[L]={$ref:"#/components/examples/"+D}}}}delete c["x-ms-examples"]}if(c.parameters&&0===c.parameters.length&&delete c.parameters,c.requestBody){var V=c.operationId?v.sanitiseAll(c.operationId):v.sanitiseAll(l+i).toCamelCase(),Y=v.sanitise(c.requestBody["x-s2o-name"]||V||"");delete c.requestBody["x-s2o-name"];var G=JSON.stringify(c.requestBody),Q=v.hash(G);if(!r[Q]){var X={};X.name=Y,X.body=c.requestBody,X.refs=[],r[Q]=X}var K="#/"+t+"/"+encodeURIComponent(u.jpescape(i))+"/"+l+"/requestBody";r[Q].refs.push(K)}}}if(s&&s.parameters){for(var J in s.parameters){I(b=s.parameters[J],null,s,null,i,o,n)}!n.debug&&Array.isArray(s.parameters)&&(s.parameters=s.parameters.filter(j))}}}function L(e,t){var n={};for(var o in r={schemas:{}},e.security&&S(e.security),e.components.securitySchemes){o!=(l=v.sanitise(o))&&(e.components.securitySchemes[l]&&k("Duplicate sanitised securityScheme name "+l,t),e.components.securitySchemes[l]=e.components.securitySchemes[o],delete e.components.securitySchemes[o]),T(e.components.securitySchemes[l],t)}for(var o in e.components.schemas){var i="";if(o!=(l=v.sanitiseAll(o))){for(;e.components.schemas[l+i];)i=i?++i:2;e.components.schemas[l+i]=e.components.schemas[o],delete e.components.schemas[o]}r.schemas[o]=l+i,E(e.components.schemas[l+i],t)}for(var a in t.refmap={},m(e,{payload:{options:t}},_),function(e,t){for(var n in t.refmap)u.jptr(e,n,{$ref:t.refmap[n]})}(e,t),e.components.parameters){a!=(l=v.sanitise(a))&&(e.components.parameters[l]&&k("Duplicate sanitised parameter name "+l,t),e.components.parameters[l]=e.components.parameters[a],delete e.components.parameters[a]),I(e.components.parameters[l],null,null,null,l,e,t)}for(var s in e.components.responses){var l;s!=(l=v.sanitise(s))&&(e.components.responses[l]&&k("Duplicate sanitised response name "+l,t),e.components.responses[l]=e.components.responses[s],delete e.components.responses[s]);var c=e.components.responses[l];if(R(c,0,null,e,t),c.headers)for(var p in c.headers)"status code"===p.toLowerCase()?t.patch?(t.patches++,delete c.headers[p]):k('(Patchable) "Status Code" is not a valid header',t):A(c.headers[p],t)}for(var s in e.components.requestBodies){var f=e.components.requestBodies[s],h=JSON.stringify(f),g=v.hash(h);(w={}).name=s,w.body=f,w.refs=[],n[g]=w}if(N(e.paths,"paths",t,n,e),e["x-ms-paths"]&&N(e["x-ms-paths"],"x-ms-paths",t,n,e),!t.debug)for(var a in e.components.parameters){e.components.parameters[a]["x-s2o-delete"]&&delete e.components.parameters[a]}t.debug&&(e["x-s2o-consumes"]=e.consumes||[],e["x-s2o-produces"]=e.produces||[]),delete e.consumes,delete e.produces,delete e.schemes;var y=[];if(e.components.requestBodies={},!t.resolveInternal){var b=1;for(var x in n){var w;if((w=n[x]).refs.length>1){i="";for(w.name||(w.name="requestBody",i=b++);y.indexOf(w.name+i)>=0;)i=i?++i:2;for(var s in w.name=w.name+i,y.push(w.name),e.components.requestBodies[w.name]=d(w.body),w.refs){var O={};O.$ref="#/components/requestBodies/"+w.name,u.jptr(e,w.refs[s],O)}}}}return e.components.responses&&0===Object.keys(e.components.responses).length&&delete e.components.responses,e.components.parameters&&0===Object.keys(e.components.parameters).length&&delete e.components.parameters,e.components.examples&&0===Object.keys(e.components.examples).length&&delete e.components.examples,e.components.requestBodies&&0===Object.keys(e.components.requestBodies).length&&delete e.components.requestBodies,e.components.securitySchemes&&0===Object.keys(e.components.securitySchemes).length&&delete e.components.securitySchemes,e.components.headers&&0===Object.keys(e.components.headers).length&&delete e.components.headers,e.components.schemas&&0===Object.keys(e.components.schemas).length&&delete e.components.schemas,e.components&&0===Object.keys(e.components).length&&delete e.components,e}function M(e){return e&&e.url&&"string"==typeof e.url?(e.url=e.url.split("{{").join("{"),e.url=e.url.split("}}").join("}"),e.url.replace(/\{(.+?)\}/g,(function(t,n){e.variables||(e.variables={}),e.variables[n]={default:"unknown"}})),e):e}function D(e,t,n){if(void 0===e.info||null===e.info){if(!t.patch)return n(new w("(Patchable) info object is mandatory"));t.patches++,e.info={version:"",title:""}}if("object"!=typeof e.info||Array.isArray(e.info))return n(new w("info must be an object"));if(void 0===e.info.title||null===e.info.title){if(!t.patch)return n(new w("(Patchable) info.title cannot be null"));t.patches++,e.info.title=""}if(void 0===e.info.version||null===e.info.version){if(!t.patch)return n(new w("(Patchable) info.version cannot be null"));t.patches++,e.info.version=""}if("string"!=typeof e.info.version){if(!t.patch)return n(new w("(Patchable) info.version must be a string"));t.patches++,e.info.version=e.info.version.toString()}if(void 0!==e.info.logo){if(!t.patch)return n(new w("(Patchable) info should not have logo property"));t.patches++,e.info["x-logo"]=e.info.logo,delete e.info.logo}if(void 0!==e.info.termsOfService){if(null===e.info.termsOfService){if(!t.patch)return n(new w("(Patchable) info.termsOfService cannot be null"));t.patches++,e.info.termsOfService=""}if(a.URL&&t.whatwg)try{a.URL.parse(e.info.termsOfService)}catch(r){if(!t.patch)return n(new w("(Patchable) info.termsOfService must be a URL"));t.patches++,delete e.info.termsOfService}}}function F(e,t,n){if(void 0===e.paths){if(!t.patch)return n(new w("(Patchable) paths object is mandatory"));t.patches++,e.paths={}}}function z(e,t,n){return s(n,new Promise((function(n,r){if(e||(e={}),t.original=e,t.text||(t.text=c.stringify(e)),t.externals=[],t.externalRefs={},t.rewriteRefs=!0,t.preserveMiro=!0,t.promise={},t.promise.resolve=n,t.promise.reject=r,t.patches=0,t.cache||(t.cache={}),t.source&&(t.cache[t.source]=t.original),function(e,t){var n=new WeakSet;m(e,{identityDetection:!0},(function(e,r,o){"object"==typeof e[r]&&null!==e[r]&&(n.has(e[r])?t.anchors?e[r]=d(e[r]):k("YAML anchor or merge key at "+o.path,t):n.add(e[r]))}))}(e,t),e.openapi&&"string"==typeof e.openapi&&e.openapi.startsWith("3."))return t.openapi=h(e),D(t.openapi,t,r),F(t.openapi,t,r),void g.optionalResolve(t).then((function(){return t.direct?n(t.openapi):n(t)})).catch((function(e){console.warn(e),r(e)}));if(!e.swagger||"2.0"!=e.swagger)return r(new w("Unsupported swagger/OpenAPI version: "+(e.openapi?e.openapi:e.swagger)));var o=t.openapi={};if(o.openapi="string"==typeof t.targetVersion&&t.targetVersion.startsWith("3.")?t.targetVersion:"3.0.0",t.origin){o["x-origin"]||(o["x-origin"]=[]);var i={};i.url=t.source||t.origin,i.format="swagger",i.version=e.swagger,i.converter={},i.converter.url="https://github.com/mermade/oas-kit",i.converter.version=x,o["x-origin"].push(i)}if(delete(o=Object.assign(o,h(e))).swagger,m(o,{},(function(e,t,n){null===e[t]&&!t.startsWith("x-")&&"default"!==t&&n.path.indexOf("/example")<0&&delete e[t]})),e.host)for(var a=0,s=Array.isArray(e.schemes)?e.schemes:[""];a<s.length;a++){var l=s[a];(u={}).url=(l?l+":":"")+"//"+e.host+(e.basePath?e.basePath:""),M(u),o.servers||(o.servers=[]),o.servers.push(u)}else if(e.basePath){var u;(u={}).url=e.basePath,M(u),o.servers||(o.servers=[]),o.servers.push(u)}if(delete o.host,delete o.basePath,o["x-servers"]&&Array.isArray(o["x-servers"])&&(o.servers=o["x-servers"],delete o["x-servers"]),e["x-ms-parameterized-host"]){var f=e["x-ms-parameterized-host"],y={};for(var v in y.url=f.hostTemplate+(e.basePath?e.basePath:""),y.variables={},f.parameters){var b=f.parameters[v];b.$ref&&(b=d(p(o,b.$ref))),v.startsWith("x-")||(delete b.required,delete b.type,delete b.in,void 0===b.default&&(b.enum?b.default=b.enum[0]:b.default=""),y.variables[b.name]=b,delete b.name)}o.servers||(o.servers=[]),!1===f.useSchemePrefix?o.servers.push(y):e.schemes.forEach((function(e){o.servers.push(Object.assign({},y,{url:e+"://"+y.url}))})),delete o["x-ms-parameterized-host"]}D(o,t,r),F(o,t,r),"string"==typeof o.consumes&&(o.consumes=[o.consumes]),"string"==typeof o.produces&&(o.produces=[o.produces]),o.components={},o["x-callbacks"]&&(o.components.callbacks=o["x-callbacks"],delete o["x-callbacks"]),o.components.examples={},o.components.headers={},o["x-links"]&&(o.components.links=o["x-links"],delete o["x-links"]),o.components.parameters=o.parameters||{},o.components.responses=o.responses||{},o.components.requestBodies={},o.components.securitySchemes=o.securityDefinitions||{},o.components.schemas=o.definitions||{},delete o.definitions,delete o.responses,delete o.parameters,delete o.securityDefinitions,g.optionalResolve(t).then((function(){L(t.openapi,t),t.direct?n(t.openapi):n(t)})).catch((function(e){console.warn(e),r(e)}))})))}function U(e,t,n){return s(n,new Promise((function(n,r){var o=null,i=null;try{o=JSON.parse(e),t.text=JSON.stringify(o,null,2)}catch(n){i=n;try{o=c.parse(e,{schema:"core",prettyErrors:!0}),t.sourceYaml=!0,t.text=e}catch(e){i=e}}o?z(o,t).then((function(e){return n(e)})).catch((function(e){return r(e)})):r(new w(i?i.message:"Could not parse string"))})))}e.exports={S2OError:w,targetVersion:"3.0.0",convert:z,convertObj:z,convertUrl:function(e,t,n){return s(n,new Promise((function(n,r){t.origin=!0,t.source||(t.source=e),t.verbose&&console.warn("GET "+e),t.fetch||(t.fetch=l);var o=Object.assign({},t.fetchOptions,{agent:t.agent});t.fetch(e,o).then((function(t){if(200!==t.status)throw new w("Received status code "+t.status+": "+e);return t.text()})).then((function(e){U(e,t).then((function(e){return n(e)})).catch((function(e){return r(e)}))})).catch((function(e){r(e)}))})))},convertStr:U,convertFile:function(e,t,n){return s(n,new Promise((function(n,r){i.readFile(e,t.encoding||"utf8",(function(o,i){o?r(o):(t.sourceFile=e,U(i,t).then((function(e){return n(e)})).catch((function(e){return r(e)})))}))})))},convertStream:function(e,t,n){return s(n,new Promise((function(n,r){var o="";e.on("data",(function(e){o+=e})).on("end",(function(){U(o,t).then((function(e){return n(e)})).catch((function(e){return r(e)}))}))})))}}},function(e,t,n){"use strict";function r(e,t){if(e.length!==t.length)return!1;for(var n=0;n<e.length;n++)if(e[n]!==t[n])return!1;return!0}e.exports=function(e,t){var n;void 0===t&&(t=r);var o,i=[],a=!1;return function(){for(var r=[],s=0;s<arguments.length;s++)r[s]=arguments[s];return a&&n===this&&t(r,i)||(o=e.apply(this,r),a=!0,n=this,i=r),o}}},function(e,t,n){
+/*! @license DOMPurify | (c) Cure53 and other contributors | Released under the Apache license 2.0 and Mozilla Public License 2.0 | github.com/cure53/DOMPurify/blob/2.0.8/LICENSE */
+e.exports=function(){"use strict";var e=Object.hasOwnProperty,t=Object.setPrototypeOf,n=Object.isFrozen,r=Object.keys,o=Object.freeze,i=Object.seal,a="undefined"!=typeof Reflect&&Reflect,s=a.apply,l=a.construct;s||(s=function(e,t,n){return e.apply(t,n)}),o||(o=function(e){return e}),i||(i=function(e){return e}),l||(l=function(e,t){return new(Function.prototype.bind.apply(e,[null].concat(function(e){if(Array.isArray(e)){for(var t=0,n=Array(e.length);t<e.length;t++)n[t]=e[t];return n}return Array.from(e)}(t))))});var c=O(Array.prototype.forEach),u=O(Array.prototype.indexOf),p=O(Array.prototype.join),f=O(Array.prototype.pop),d=O(Array.prototype.push),h=O(Array.prototype.slice),m=O(String.prototype.toLowerCase),g=O(String.prototype.match),y=O(String.prototype.replace),v=O(String.prototype.indexOf),b=O(String.prototype.trim),x=O(RegExp.prototype.test),w=E(RegExp),k=E(TypeError);function O(e){return function(t){for(var n=arguments.length,r=Array(n>1?n-1:0),o=1;o<n;o++)r[o-1]=arguments[o];return s(e,t,r)}}function E(e){return function(){for(var t=arguments.length,n=Array(t),r=0;r<t;r++)n[r]=arguments[r];return l(e,n)}}function _(e,r){t&&t(e,null);for(var o=r.length;o--;){var i=r[o];if("string"==typeof i){var a=m(i);a!==i&&(n(r)||(r[o]=a),i=a)}e[i]=!0}return e}function S(t){var n={},r=void 0;for(r in t)s(e,t,[r])&&(n[r]=t[r]);return n}var T=o(["a","abbr","acronym","address","area","article","aside","audio","b","bdi","bdo","big","blink","blockquote","body","br","button","canvas","caption","center","cite","code","col","colgroup","content","data","datalist","dd","decorator","del","details","dfn","dir","div","dl","dt","element","em","fieldset","figcaption","figure","font","footer","form","h1","h2","h3","h4","h5","h6","head","header","hgroup","hr","html","i","img","input","ins","kbd","label","legend","li","main","map","mark","marquee","menu","menuitem","meter","nav","nobr","ol","optgroup","option","output","p","picture","pre","progress","q","rp","rt","ruby","s","samp","section","select","shadow","small","source","spacer","span","strike","strong","style","sub","summary","sup","table","tbody","td","template","textarea","tfoot","th","thead","time","tr","track","tt","u","ul","var","video","wbr"]),j=o(["svg","a","altglyph","altglyphdef","altglyphitem","animatecolor","animatemotion","animatetransform","audio","canvas","circle","clippath","defs","desc","ellipse","filter","font","g","glyph","glyphref","hkern","image","line","lineargradient","marker","mask","metadata","mpath","path","pattern","polygon","polyline","radialgradient","rect","stop","style","switch","symbol","text","textpath","title","tref","tspan","video","view","vkern"]),A=o(["feBlend","feColorMatrix","feComponentTransfer","feComposite","feConvolveMatrix","feDiffuseLighting","feDisplacementMap","feDistantLight","feFlood","feFuncA","feFuncB","feFuncG","feFuncR","feGaussianBlur","feMerge","feMergeNode","feMorphology","feOffset","fePointLight","feSpecularLighting","feSpotLight","feTile","feTurbulence"]),C=o(["math","menclose","merror","mfenced","mfrac","mglyph","mi","mlabeledtr","mmultiscripts","mn","mo","mover","mpadded","mphantom","mroot","mrow","ms","mspace","msqrt","mstyle","msub","msup","msubsup","mtable","mtd","mtext","mtr","munder","munderover"]),I=o(["#text"]),P=o(["accept","action","align","alt","autocapitalize","autocomplete","autopictureinpicture","autoplay","background","bgcolor","border","capture","cellpadding","cellspacing","checked","cite","class","clear","color","cols","colspan","controls","controlslist","coords","crossorigin","datetime","decoding","default","dir","disabled","disablepictureinpicture","disableremoteplayback","download","draggable","enctype","enterkeyhint","face","for","headers","height","hidden","high","href","hreflang","id","inputmode","integrity","ismap","kind","label","lang","list","loading","loop","low","max","maxlength","media","method","min","minlength","multiple","muted","name","noshade","novalidate","nowrap","open","optimum","pattern","placeholder","playsinline","poster","preload","pubdate","radiogroup","readonly","rel","required","rev","reversed","role","rows","rowspan","spellcheck","scope","selected","shape","size","sizes","span","srclang","start","src","srcset","step","style","summary","tabindex","title","translate","type","usemap","valign","value","width","xmlns"]),R=o(["accent-height","accumulate","additive","alignment-baseline","ascent","attributename","attributetype","azimuth","basefrequency","baseline-shift","begin","bias","by","class","clip","clip-path","clip-rule","color","color-interpolation","color-interpolation-filters","color-profile","color-rendering","cx","cy","d","dx","dy","diffuseconstant","direction","display","divisor","dur","edgemode","elevation","end","fill","fill-opacity","fill-rule","filter","filterunits","flood-color","flood-opacity","font-family","font-size","font-size-adjust","font-stretch","font-style","font-variant","font-weight","fx","fy","g1","g2","glyph-name","glyphref","gradientunits","gradienttransform","height","href","id","image-rendering","in","in2","k","k1","k2","k3","k4","kerning","keypoints","keysplines","keytimes","lang","lengthadjust","letter-spacing","kernelmatrix","kernelunitlength","lighting-color","local","marker-end","marker-mid","marker-start","markerheight","markerunits","markerwidth","maskcontentunits","maskunits","max","mask","media","method","mode","min","name","numoctaves","offset","operator","opacity","order","orient","orientation","origin","overflow","paint-order","path","pathlength","patterncontentunits","patterntransform","patternunits","points","preservealpha","preserveaspectratio","primitiveunits","r","rx","ry","radius","refx","refy","repeatcount","repeatdur","restart","result","rotate","scale","seed","shape-rendering","specularconstant","specularexponent","spreadmethod","startoffset","stddeviation","stitchtiles","stop-color","stop-opacity","stroke-dasharray","stroke-dashoffset","stroke-linecap","stroke-linejoin","stroke-miterlimit","stroke-opacity","stroke","stroke-width","style","surfacescale","tabindex","targetx","targety","transform","text-anchor","text-decoration","text-rendering","textlength","type","u1","u2","unicode","values","viewbox","visibility","version","vert-adv-y","vert-origin-x","vert-origin-y","width","word-spacing","wrap","writing-mode","xchannelselector","ychannelselector","x","x1","x2","xmlns","y","y1","y2","z","zoomandpan"]),N=o(["accent","accentunder","align","bevelled","close","columnsalign","columnlines","columnspan","denomalign","depth","dir","display","displaystyle","encoding","fence","frame","height","href","id","largeop","length","linethickness","lspace","lquote","mathbackground","mathcolor","mathsize","mathvariant","maxsize","minsize","movablelimits","notation","numalign","open","rowalign","rowlines","rowspacing","rowspan","rspace","rquote","scriptlevel","scriptminsize","scriptsizemultiplier","selection","separator","separators","stretchy","subscriptshift","supscriptshift","symmetric","voffset","width","xmlns"]),L=o(["xlink:href","xml:id","xlink:title","xml:space","xmlns:xlink"]),M=i(/\{\{[\s\S]*|[\s\S]*\}\}/gm),D=i(/<%[\s\S]*|[\s\S]*%>/gm),F=i(/^data-[\-\w.\u00B7-\uFFFF]/),z=i(/^aria-[\-\w]+$/),U=i(/^(?:(?:(?:f|ht)tps?|mailto|tel|callto|cid|xmpp):|[^a-z]|[a-z+.\-]+(?:[^a-z+.\-:]|$))/i),B=i(/^(?:\w+script|data):/i),$=i(/[\u0000-\u0020\u00A0\u1680\u180E\u2000-\u2029\u205f\u3000]/g),W="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e};function q(e){if(Array.isArray(e)){for(var t=0,n=Array(e.length);t<e.length;t++)n[t]=e[t];return n}return Array.from(e)}var H=function(){return"undefined"==typeof window?null:window},V=function(e,t){if("object"!==(void 0===e?"undefined":W(e))||"function"!=typeof e.createPolicy)return null;var n=null;t.currentScript&&t.currentScript.hasAttribute("data-tt-policy-suffix")&&(n=t.currentScript.getAttribute("data-tt-policy-suffix"));var r="dompurify"+(n?"#"+n:"");try{return e.createPolicy(r,{createHTML:function(e){return e}})}catch(e){return console.warn("TrustedTypes policy "+r+" could not be created."),null}};return function e(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:H(),n=function(t){return e(t)};if(n.version="2.0.12",n.removed=[],!t||!t.document||9!==t.document.nodeType)return n.isSupported=!1,n;var i=t.document,a=!1,s=t.document,l=t.DocumentFragment,O=t.HTMLTemplateElement,E=t.Node,Y=t.NodeFilter,G=t.NamedNodeMap,Q=void 0===G?t.NamedNodeMap||t.MozNamedAttrMap:G,X=t.Text,K=t.Comment,J=t.DOMParser,Z=t.trustedTypes;if("function"==typeof O){var ee=s.createElement("template");ee.content&&ee.content.ownerDocument&&(s=ee.content.ownerDocument)}var te=V(Z,i),ne=te&&Ne?te.createHTML(""):"",re=s,oe=re.implementation,ie=re.createNodeIterator,ae=re.getElementsByTagName,se=re.createDocumentFragment,le=i.importNode,ce={};n.isSupported=oe&&void 0!==oe.createHTMLDocument&&9!==s.documentMode;var ue=M,pe=D,fe=F,de=z,he=B,me=$,ge=U,ye=null,ve=_({},[].concat(q(T),q(j),q(A),q(C),q(I))),be=null,xe=_({},[].concat(q(P),q(R),q(N),q(L))),we=null,ke=null,Oe=!0,Ee=!0,_e=!1,Se=!1,Te=!1,je=!1,Ae=!1,Ce=!1,Ie=!1,Pe=!1,Re=!1,Ne=!1,Le=!0,Me=!0,De=!1,Fe={},ze=_({},["annotation-xml","audio","colgroup","desc","foreignobject","head","iframe","math","mi","mn","mo","ms","mtext","noembed","noframes","plaintext","script","style","svg","template","thead","title","video","xmp"]),Ue=null,Be=_({},["audio","video","img","source","image","track"]),$e=null,We=_({},["alt","class","for","id","label","name","pattern","placeholder","summary","title","value","style","xmlns"]),qe=null,He=s.createElement("form"),Ve=function(e){qe&&qe===e||(e&&"object"===(void 0===e?"undefined":W(e))||(e={}),ye="ALLOWED_TAGS"in e?_({},e.ALLOWED_TAGS):ve,be="ALLOWED_ATTR"in e?_({},e.ALLOWED_ATTR):xe,$e="ADD_URI_SAFE_ATTR"in e?_(S(We),e.ADD_URI_SAFE_ATTR):We,Ue="ADD_DATA_URI_TAGS"in e?_(S(Be),e.ADD_DATA_URI_TAGS):Be,we="FORBID_TAGS"in e?_({},e.FORBID_TAGS):{},ke="FORBID_ATTR"in e?_({},e.FORBID_ATTR):{},Fe="USE_PROFILES"in e&&e.USE_PROFILES,Oe=!1!==e.ALLOW_ARIA_ATTR,Ee=!1!==e.ALLOW_DATA_ATTR,_e=e.ALLOW_UNKNOWN_PROTOCOLS||!1,Se=e.SAFE_FOR_JQUERY||!1,Te=e.SAFE_FOR_TEMPLATES||!1,je=e.WHOLE_DOCUMENT||!1,Ie=e.RETURN_DOM||!1,Pe=e.RETURN_DOM_FRAGMENT||!1,Re=e.RETURN_DOM_IMPORT||!1,Ne=e.RETURN_TRUSTED_TYPE||!1,Ce=e.FORCE_BODY||!1,Le=!1!==e.SANITIZE_DOM,Me=!1!==e.KEEP_CONTENT,De=e.IN_PLACE||!1,ge=e.ALLOWED_URI_REGEXP||ge,Te&&(Ee=!1),Pe&&(Ie=!0),Fe&&(ye=_({},[].concat(q(I))),be=[],!0===Fe.html&&(_(ye,T),_(be,P)),!0===Fe.svg&&(_(ye,j),_(be,R),_(be,L)),!0===Fe.svgFilters&&(_(ye,A),_(be,R),_(be,L)),!0===Fe.mathMl&&(_(ye,C),_(be,N),_(be,L))),e.ADD_TAGS&&(ye===ve&&(ye=S(ye)),_(ye,e.ADD_TAGS)),e.ADD_ATTR&&(be===xe&&(be=S(be)),_(be,e.ADD_ATTR)),e.ADD_URI_SAFE_ATTR&&_($e,e.ADD_URI_SAFE_ATTR),Me&&(ye["#text"]=!0),je&&_(ye,["html","head","body"]),ye.table&&(_(ye,["tbody"]),delete we.tbody),o&&o(e),qe=e)},Ye=function(e){d(n.removed,{element:e});try{e.parentNode.removeChild(e)}catch(t){e.outerHTML=ne}},Ge=function(e,t){try{d(n.removed,{attribute:t.getAttributeNode(e),from:t})}catch(e){d(n.removed,{attribute:null,from:t})}t.removeAttribute(e)},Qe=function(e){var t=void 0,n=void 0;if(Ce)e="<remove></remove>"+e;else{var r=g(e,/^[\r\n\t ]+/);n=r&&r[0]}var o=te?te.createHTML(e):e;try{t=(new J).parseFromString(o,"text/html")}catch(e){}if(a&&_(we,["title"]),!t||!t.documentElement){var i=(t=oe.createHTMLDocument("")).body;i.parentNode.removeChild(i.parentNode.firstElementChild),i.outerHTML=o}return e&&n&&t.body.insertBefore(s.createTextNode(n),t.body.childNodes[0]||null),ae.call(t,je?"html":"body")[0]};n.isSupported&&function(){try{var e=Qe("<x/><title>&lt;/title&gt;&lt;img&gt;");x(/<\/title/,e.querySelector("title").innerHTML)&&(a=!0)}catch(e){}}();var Xe=function(e){return ie.call(e.ownerDocument||e,e,Y.SHOW_ELEMENT|Y.SHOW_COMMENT|Y.SHOW_TEXT,(function(){return Y.FILTER_ACCEPT}),!1)},Ke=function(e){return!(e instanceof X||e instanceof K||"string"==typeof e.nodeName&&"string"==typeof e.textContent&&"function"==typeof e.removeChild&&e.attributes instanceof Q&&"function"==typeof e.removeAttribute&&"function"==typeof e.setAttribute&&"string"==typeof e.namespaceURI)},Je=function(e){return"object"===(void 0===E?"undefined":W(E))?e instanceof E:e&&"object"===(void 0===e?"undefined":W(e))&&"number"==typeof e.nodeType&&"string"==typeof e.nodeName},Ze=function(e,t,r){ce[e]&&c(ce[e],(function(e){e.call(n,t,r,qe)}))},et=function(e){var t=void 0;if(Ze("beforeSanitizeElements",e,null),Ke(e))return Ye(e),!0;var r=m(e.nodeName);if(Ze("uponSanitizeElement",e,{tagName:r,allowedTags:ye}),("svg"===r||"math"===r)&&0!==e.querySelectorAll("p, br").length)return Ye(e),!0;if(!ye[r]||we[r]){if(Me&&!ze[r]&&"function"==typeof e.insertAdjacentHTML)try{var o=e.innerHTML;e.insertAdjacentHTML("AfterEnd",te?te.createHTML(o):o)}catch(e){}return Ye(e),!0}return"noscript"===r&&x(/<\/noscript/i,e.innerHTML)||"noembed"===r&&x(/<\/noembed/i,e.innerHTML)?(Ye(e),!0):(!Se||e.firstElementChild||e.content&&e.content.firstElementChild||!x(/</g,e.textContent)||(d(n.removed,{element:e.cloneNode()}),e.innerHTML?e.innerHTML=y(e.innerHTML,/</g,"&lt;"):e.innerHTML=y(e.textContent,/</g,"&lt;")),Te&&3===e.nodeType&&(t=e.textContent,t=y(t,ue," "),t=y(t,pe," "),e.textContent!==t&&(d(n.removed,{element:e.cloneNode()}),e.textContent=t)),Ze("afterSanitizeElements",e,null),!1)},tt=function(e,t,n){if(Le&&("id"===t||"name"===t)&&(n in s||n in He))return!1;if(Ee&&x(fe,t));else if(Oe&&x(de,t));else{if(!be[t]||ke[t])return!1;if($e[t]);else if(x(ge,y(n,me,"")));else if("src"!==t&&"xlink:href"!==t&&"href"!==t||"script"===e||0!==v(n,"data:")||!Ue[e])if(_e&&!x(he,y(n,me,"")));else if(n)return!1}return!0},nt=function(e){var t=void 0,o=void 0,i=void 0,a=void 0,s=void 0;Ze("beforeSanitizeAttributes",e,null);var l=e.attributes;if(l){var c={attrName:"",attrValue:"",keepAttr:!0,allowedAttributes:be};for(s=l.length;s--;){var d=t=l[s],g=d.name,v=d.namespaceURI;if(o=b(t.value),i=m(g),c.attrName=i,c.attrValue=o,c.keepAttr=!0,c.forceKeepAttr=void 0,Ze("uponSanitizeAttribute",e,c),o=c.attrValue,!c.forceKeepAttr){if("name"===i&&"IMG"===e.nodeName&&l.id)a=l.id,l=h(l,[]),Ge("id",e),Ge(g,e),u(l,a)>s&&e.setAttribute("id",a.value);else{if("INPUT"===e.nodeName&&"type"===i&&"file"===o&&c.keepAttr&&(be[i]||!ke[i]))continue;"id"===g&&e.setAttribute(g,""),Ge(g,e)}if(c.keepAttr)if(Se&&x(/\/>/i,o))Ge(g,e);else if(x(/svg|math/i,e.namespaceURI)&&x(w("</("+p(r(ze),"|")+")","i"),o))Ge(g,e);else{Te&&(o=y(o,ue," "),o=y(o,pe," "));var k=e.nodeName.toLowerCase();if(tt(k,i,o))try{v?e.setAttributeNS(v,g,o):e.setAttribute(g,o),f(n.removed)}catch(e){}}}}Ze("afterSanitizeAttributes",e,null)}},rt=function e(t){var n=void 0,r=Xe(t);for(Ze("beforeSanitizeShadowDOM",t,null);n=r.nextNode();)Ze("uponSanitizeShadowNode",n,null),et(n)||(n.content instanceof l&&e(n.content),nt(n));Ze("afterSanitizeShadowDOM",t,null)};return n.sanitize=function(e,r){var o=void 0,a=void 0,s=void 0,c=void 0,u=void 0;if(e||(e="\x3c!--\x3e"),"string"!=typeof e&&!Je(e)){if("function"!=typeof e.toString)throw k("toString is not a function");if("string"!=typeof(e=e.toString()))throw k("dirty is not a string, aborting")}if(!n.isSupported){if("object"===W(t.toStaticHTML)||"function"==typeof t.toStaticHTML){if("string"==typeof e)return t.toStaticHTML(e);if(Je(e))return t.toStaticHTML(e.outerHTML)}return e}if(Ae||Ve(r),n.removed=[],"string"==typeof e&&(De=!1),De);else if(e instanceof E)1===(a=(o=Qe("\x3c!--\x3e")).ownerDocument.importNode(e,!0)).nodeType&&"BODY"===a.nodeName||"HTML"===a.nodeName?o=a:o.appendChild(a);else{if(!Ie&&!Te&&!je&&-1===e.indexOf("<"))return te&&Ne?te.createHTML(e):e;if(!(o=Qe(e)))return Ie?null:ne}o&&Ce&&Ye(o.firstChild);for(var p=Xe(De?e:o);s=p.nextNode();)3===s.nodeType&&s===c||et(s)||(s.content instanceof l&&rt(s.content),nt(s),c=s);if(c=null,De)return e;if(Ie){if(Pe)for(u=se.call(o.ownerDocument);o.firstChild;)u.appendChild(o.firstChild);else u=o;return Re&&(u=le.call(i,u,!0)),u}var f=je?o.outerHTML:o.innerHTML;return Te&&(f=y(f,ue," "),f=y(f,pe," ")),te&&Ne?te.createHTML(f):f},n.setConfig=function(e){Ve(e),Ae=!0},n.clearConfig=function(){qe=null,Ae=!1},n.isValidAttribute=function(e,t,n){qe||Ve({});var r=m(e),o=m(t);return tt(r,o,n)},n.addHook=function(e,t){"function"==typeof t&&(ce[e]=ce[e]||[],d(ce[e],t))},n.removeHook=function(e){ce[e]&&f(ce[e])},n.removeHooks=function(e){ce[e]&&(ce[e]=[])},n.removeAllHooks=function(){ce={}},n}()}()},function(e,t,n){var r;
+/*!
+  Copyright (c) 2017 Jed Watson.
+  Licensed under the MIT License (MIT), see
+  http://jedwatson.github.io/classnames
+*/!function(){"use strict";var n={}.hasOwnProperty;function o(){for(var e=[],t=0;t<arguments.length;t++){var r=arguments[t];if(r){var i=typeof r;if("string"===i||"number"===i)e.push(r);else if(Array.isArray(r)&&r.length){var a=o.apply(null,r);a&&e.push(a)}else if("object"===i)for(var s in r)n.call(r,s)&&r[s]&&e.push(s)}}return e.join(" ")}e.exports?(o.default=o,e.exports=o):void 0===(r=function(){return o}.apply(t,[]))||(e.exports=r)}()},function(e,t,n){n(160),e.exports=n(317)},function(e,t,n){"use strict";n.r(t);n(161),n(182),n(185),n(188),n(191),n(193),n(199),n(221),n(222)},function(e,t,n){n(67),n(104),n(111),n(174),n(180),n(181);var r=n(35);e.exports=r.Promise},function(e,t,n){var r=n(3),o=n(73),i=r.WeakMap;e.exports="function"==typeof i&&/native code/.test(o(i))},function(e,t,n){"use strict";var r=n(68),o=n(103);e.exports=r?{}.toString:function(){return"[object "+o(this)+"]"}},function(e,t,n){var r=n(74),o=n(42),i=function(e){return function(t,n){var i,a,s=String(o(t)),l=r(n),c=s.length;return l<0||l>=c?e?"":void 0:(i=s.charCodeAt(l))<55296||i>56319||l+1===c||(a=s.charCodeAt(l+1))<56320||a>57343?e?s.charAt(l):i:e?s.slice(l,l+2):a-56320+(i-55296<<10)+65536}};e.exports={codeAt:i(!1),charAt:i(!0)}},function(e,t,n){var r=n(28),o=n(78),i=n(80),a=n(19);e.exports=r("Reflect","ownKeys")||function(e){var t=o.f(a(e)),n=i.f;return n?t.concat(n(e)):t}},function(e,t,n){var r=n(34),o=n(36),i=n(167),a=function(e){return function(t,n,a){var s,l=r(t),c=o(l.length),u=i(a,c);if(e&&n!=n){for(;c>u;)if((s=l[u++])!=s)return!0}else for(;c>u;u++)if((e||u in l)&&l[u]===n)return e||u||0;return!e&&-1}};e.exports={includes:a(!0),indexOf:a(!1)}},function(e,t,n){var r=n(74),o=Math.max,i=Math.min;e.exports=function(e,t){var n=r(e);return n<0?o(n+t,0):i(n,t)}},function(e,t,n){"use strict";var r=n(107).IteratorPrototype,o=n(54),i=n(40),a=n(29),s=n(44),l=function(){return this};e.exports=function(e,t,n){var c=t+" Iterator";return e.prototype=o(r,{next:i(1,n)}),a(e,c,!1,!0),s[c]=l,e}},function(e,t,n){var r=n(8);e.exports=!r((function(){function e(){}return e.prototype.constructor=null,Object.getPrototypeOf(new e)!==e.prototype}))},function(e,t,n){var r=n(18),o=n(16),i=n(19),a=n(82);e.exports=r?Object.defineProperties:function(e,t){i(e);for(var n,r=a(t),s=r.length,l=0;s>l;)o.f(e,n=r[l++],t[n]);return e}},function(e,t,n){var r=n(9);e.exports=function(e){if(!r(e)&&null!==e)throw TypeError("Can't set "+String(e)+" as a prototype");return e}},function(e,t){e.exports={CSSRuleList:0,CSSStyleDeclaration:0,CSSValueList:0,ClientRectList:0,DOMRectList:0,DOMStringList:0,DOMTokenList:1,DataTransferItemList:0,FileList:0,HTMLAllCollection:0,HTMLCollection:0,HTMLFormElement:0,HTMLSelectElement:0,MediaList:0,MimeTypeArray:0,NamedNodeMap:0,NodeList:1,PaintRequestList:0,Plugin:0,PluginArray:0,SVGLengthList:0,SVGNumberList:0,SVGPathSegList:0,SVGPointList:0,SVGStringList:0,SVGTransformList:0,SourceBufferList:0,StyleSheetList:0,TextTrackCueList:0,TextTrackList:0,TouchList:0}},function(e,t,n){"use strict";var r=n(34),o=n(112),i=n(44),a=n(32),s=n(75),l=a.set,c=a.getterFor("Array Iterator");e.exports=s(Array,"Array",(function(e,t){l(this,{type:"Array Iterator",target:r(e),index:0,kind:t})}),(function(){var e=c(this),t=e.target,n=e.kind,r=e.index++;return!t||r>=t.length?(e.target=void 0,{value:void 0,done:!0}):"keys"==n?{value:r,done:!1}:"values"==n?{value:t[r],done:!1}:{value:[r,t[r]],done:!1}}),"values"),i.Arguments=i.Array,o("keys"),o("values"),o("entries")},function(e,t,n){"use strict";var r,o,i,a,s=n(17),l=n(22),c=n(3),u=n(28),p=n(113),f=n(24),d=n(114),h=n(29),m=n(115),g=n(9),y=n(45),v=n(83),b=n(27),x=n(73),w=n(55),k=n(116),O=n(117),E=n(118).set,_=n(178),S=n(121),T=n(179),j=n(84),A=n(122),C=n(32),I=n(81),P=n(4),R=n(85),N=P("species"),L="Promise",M=C.get,D=C.set,F=C.getterFor(L),z=p,U=c.TypeError,B=c.document,$=c.process,W=u("fetch"),q=j.f,H=q,V="process"==b($),Y=!!(B&&B.createEvent&&c.dispatchEvent),G=I(L,(function(){if(!(x(z)!==String(z))){if(66===R)return!0;if(!V&&"function"!=typeof PromiseRejectionEvent)return!0}if(l&&!z.prototype.finally)return!0;if(R>=51&&/native code/.test(z))return!1;var e=z.resolve(1),t=function(e){e((function(){}),(function(){}))};return(e.constructor={})[N]=t,!(e.then((function(){}))instanceof t)})),Q=G||!k((function(e){z.all(e).catch((function(){}))})),X=function(e){var t;return!(!g(e)||"function"!=typeof(t=e.then))&&t},K=function(e,t,n){if(!t.notified){t.notified=!0;var r=t.reactions;_((function(){for(var o=t.value,i=1==t.state,a=0;r.length>a;){var s,l,c,u=r[a++],p=i?u.ok:u.fail,f=u.resolve,d=u.reject,h=u.domain;try{p?(i||(2===t.rejection&&te(e,t),t.rejection=1),!0===p?s=o:(h&&h.enter(),s=p(o),h&&(h.exit(),c=!0)),s===u.promise?d(U("Promise-chain cycle")):(l=X(s))?l.call(s,f,d):f(s)):d(o)}catch(e){h&&!c&&h.exit(),d(e)}}t.reactions=[],t.notified=!1,n&&!t.rejection&&Z(e,t)}))}},J=function(e,t,n){var r,o;Y?((r=B.createEvent("Event")).promise=t,r.reason=n,r.initEvent(e,!1,!0),c.dispatchEvent(r)):r={promise:t,reason:n},(o=c["on"+e])?o(r):"unhandledrejection"===e&&T("Unhandled promise rejection",n)},Z=function(e,t){E.call(c,(function(){var n,r=t.value;if(ee(t)&&(n=A((function(){V?$.emit("unhandledRejection",r,e):J("unhandledrejection",e,r)})),t.rejection=V||ee(t)?2:1,n.error))throw n.value}))},ee=function(e){return 1!==e.rejection&&!e.parent},te=function(e,t){E.call(c,(function(){V?$.emit("rejectionHandled",e):J("rejectionhandled",e,t.value)}))},ne=function(e,t,n,r){return function(o){e(t,n,o,r)}},re=function(e,t,n,r){t.done||(t.done=!0,r&&(t=r),t.value=n,t.state=2,K(e,t,!0))},oe=function(e,t,n,r){if(!t.done){t.done=!0,r&&(t=r);try{if(e===n)throw U("Promise can't be resolved itself");var o=X(n);o?_((function(){var r={done:!1};try{o.call(n,ne(oe,e,r,t),ne(re,e,r,t))}catch(n){re(e,r,n,t)}})):(t.value=n,t.state=1,K(e,t,!1))}catch(n){re(e,{done:!1},n,t)}}};G&&(z=function(e){v(this,z,L),y(e),r.call(this);var t=M(this);try{e(ne(oe,this,t),ne(re,this,t))}catch(e){re(this,t,e)}},(r=function(e){D(this,{type:L,done:!1,notified:!1,parent:!1,reactions:[],rejection:!1,state:0,value:void 0})}).prototype=d(z.prototype,{then:function(e,t){var n=F(this),r=q(O(this,z));return r.ok="function"!=typeof e||e,r.fail="function"==typeof t&&t,r.domain=V?$.domain:void 0,n.parent=!0,n.reactions.push(r),0!=n.state&&K(this,n,!1),r.promise},catch:function(e){return this.then(void 0,e)}}),o=function(){var e=new r,t=M(e);this.promise=e,this.resolve=ne(oe,e,t),this.reject=ne(re,e,t)},j.f=q=function(e){return e===z||e===i?new o(e):H(e)},l||"function"!=typeof p||(a=p.prototype.then,f(p.prototype,"then",(function(e,t){var n=this;return new z((function(e,t){a.call(n,e,t)})).then(e,t)}),{unsafe:!0}),"function"==typeof W&&s({global:!0,enumerable:!0,forced:!0},{fetch:function(e){return S(z,W.apply(c,arguments))}}))),s({global:!0,wrap:!0,forced:G},{Promise:z}),h(z,L,!1,!0),m(L),i=u(L),s({target:L,stat:!0,forced:G},{reject:function(e){var t=q(this);return t.reject.call(void 0,e),t.promise}}),s({target:L,stat:!0,forced:l||G},{resolve:function(e){return S(l&&this===i?z:this,e)}}),s({target:L,stat:!0,forced:Q},{all:function(e){var t=this,n=q(t),r=n.resolve,o=n.reject,i=A((function(){var n=y(t.resolve),i=[],a=0,s=1;w(e,(function(e){var l=a++,c=!1;i.push(void 0),s++,n.call(t,e).then((function(e){c||(c=!0,i[l]=e,--s||r(i))}),o)})),--s||r(i)}));return i.error&&o(i.value),n.promise},race:function(e){var t=this,n=q(t),r=n.reject,o=A((function(){var o=y(t.resolve);w(e,(function(e){o.call(t,e).then(n.resolve,r)}))}));return o.error&&r(o.value),n.promise}})},function(e,t,n){var r=n(4),o=n(44),i=r("iterator"),a=Array.prototype;e.exports=function(e){return void 0!==e&&(o.Array===e||a[i]===e)}},function(e,t,n){var r=n(103),o=n(44),i=n(4)("iterator");e.exports=function(e){if(null!=e)return e[i]||e["@@iterator"]||o[r(e)]}},function(e,t,n){var r=n(19);e.exports=function(e,t,n,o){try{return o?t(r(n)[0],n[1]):t(n)}catch(t){var i=e.return;throw void 0!==i&&r(i.call(e)),t}}},function(e,t,n){var r,o,i,a,s,l,c,u,p=n(3),f=n(33).f,d=n(27),h=n(118).set,m=n(119),g=p.MutationObserver||p.WebKitMutationObserver,y=p.process,v=p.Promise,b="process"==d(y),x=f(p,"queueMicrotask"),w=x&&x.value;w||(r=function(){var e,t;for(b&&(e=y.domain)&&e.exit();o;){t=o.fn,o=o.next;try{t()}catch(e){throw o?a():i=void 0,e}}i=void 0,e&&e.enter()},b?a=function(){y.nextTick(r)}:g&&!m?(s=!0,l=document.createTextNode(""),new g(r).observe(l,{characterData:!0}),a=function(){l.data=s=!s}):v&&v.resolve?(c=v.resolve(void 0),u=c.then,a=function(){u.call(c,r)}):a=function(){h.call(p,r)}),e.exports=w||function(e){var t={fn:e,next:void 0};i&&(i.next=t),o||(o=t,a()),i=t}},function(e,t,n){var r=n(3);e.exports=function(e,t){var n=r.console;n&&n.error&&(1===arguments.length?n.error(e):n.error(e,t))}},function(e,t,n){"use strict";var r=n(17),o=n(45),i=n(84),a=n(122),s=n(55);r({target:"Promise",stat:!0},{allSettled:function(e){var t=this,n=i.f(t),r=n.resolve,l=n.reject,c=a((function(){var n=o(t.resolve),i=[],a=0,l=1;s(e,(function(e){var o=a++,s=!1;i.push(void 0),l++,n.call(t,e).then((function(e){s||(s=!0,i[o]={status:"fulfilled",value:e},--l||r(i))}),(function(e){s||(s=!0,i[o]={status:"rejected",reason:e},--l||r(i))}))})),--l||r(i)}));return c.error&&l(c.value),n.promise}})},function(e,t,n){"use strict";var r=n(17),o=n(22),i=n(113),a=n(8),s=n(28),l=n(117),c=n(121),u=n(24);r({target:"Promise",proto:!0,real:!0,forced:!!i&&a((function(){i.prototype.finally.call({then:function(){}},(function(){}))}))},{finally:function(e){var t=l(this,s("Promise")),n="function"==typeof e;return this.then(n?function(n){return c(t,e()).then((function(){return n}))}:e,n?function(n){return c(t,e()).then((function(){throw n}))}:e)}}),o||"function"!=typeof i||i.prototype.finally||u(i.prototype,"finally",s("Promise").prototype.finally)},function(e,t,n){n(183);var r=n(87);e.exports=r("Array","find")},function(e,t,n){"use strict";var r=n(17),o=n(123).find,i=n(112),a=n(184),s=!0,l=a("find");"find"in[]&&Array(1).find((function(){s=!1})),r({target:"Array",proto:!0,forced:s||!l},{find:function(e){return o(this,e,arguments.length>1?arguments[1]:void 0)}}),i("find")},function(e,t,n){var r=n(18),o=n(8),i=n(11),a=Object.defineProperty,s={},l=function(e){throw e};e.exports=function(e,t){if(i(s,e))return s[e];t||(t={});var n=[][e],c=!!i(t,"ACCESSORS")&&t.ACCESSORS,u=i(t,0)?t[0]:l,p=i(t,1)?t[1]:void 0;return s[e]=!!n&&!o((function(){if(c&&!r)return!0;var e={length:-1};c?a(e,1,{enumerable:!0,get:l}):e[1]=1,n.call(e,u,p)}))}},function(e,t,n){n(186);var r=n(35);e.exports=r.Object.assign},function(e,t,n){var r=n(17),o=n(187);r({target:"Object",stat:!0,forced:Object.assign!==o},{assign:o})},function(e,t,n){"use strict";var r=n(18),o=n(8),i=n(82),a=n(80),s=n(76),l=n(43),c=n(77),u=Object.assign,p=Object.defineProperty;e.exports=!u||o((function(){if(r&&1!==u({b:1},u(p({},"a",{enumerable:!0,get:function(){p(this,"b",{value:3,enumerable:!1})}}),{b:2})).b)return!0;var e={},t={},n=Symbol();return e[n]=7,"abcdefghijklmnopqrst".split("").forEach((function(e){t[e]=e})),7!=u({},e)[n]||"abcdefghijklmnopqrst"!=i(u({},t)).join("")}))?function(e,t){for(var n=l(e),o=arguments.length,u=1,p=a.f,f=s.f;o>u;)for(var d,h=c(arguments[u++]),m=p?i(h).concat(p(h)):i(h),g=m.length,y=0;g>y;)d=m[y++],r&&!f.call(h,d)||(n[d]=h[d]);return n}:u},function(e,t,n){n(189);var r=n(87);e.exports=r("String","endsWith")},function(e,t,n){"use strict";var r,o=n(17),i=n(33).f,a=n(36),s=n(125),l=n(42),c=n(126),u=n(22),p="".endsWith,f=Math.min,d=c("endsWith");o({target:"String",proto:!0,forced:!!(u||d||(r=i(String.prototype,"endsWith"),!r||r.writable))&&!d},{endsWith:function(e){var t=String(l(this));s(e);var n=arguments.length>1?arguments[1]:void 0,r=a(t.length),o=void 0===n?r:f(a(n),r),i=String(e);return p?p.call(t,i,o):t.slice(o-i.length,o)===i}})},function(e,t,n){var r=n(9),o=n(27),i=n(4)("match");e.exports=function(e){var t;return r(e)&&(void 0!==(t=e[i])?!!t:"RegExp"==o(e))}},function(e,t,n){n(192);var r=n(87);e.exports=r("String","startsWith")},function(e,t,n){"use strict";var r,o=n(17),i=n(33).f,a=n(36),s=n(125),l=n(42),c=n(126),u=n(22),p="".startsWith,f=Math.min,d=c("startsWith");o({target:"String",proto:!0,forced:!!(u||d||(r=i(String.prototype,"startsWith"),!r||r.writable))&&!d},{startsWith:function(e){var t=String(l(this));s(e);var n=a(f(arguments.length>1?arguments[1]:void 0,t.length)),r=String(e);return p?p.call(t,r,n):t.slice(n,n+r.length)===r}})},function(e,t,n){n(194),n(67),n(104),n(111);var r=n(35);e.exports=r.Map},function(e,t,n){"use strict";var r=n(195),o=n(198);e.exports=r("Map",(function(e){return function(){return e(this,arguments.length?arguments[0]:void 0)}}),o)},function(e,t,n){"use strict";var r=n(17),o=n(3),i=n(81),a=n(24),s=n(127),l=n(55),c=n(83),u=n(9),p=n(8),f=n(116),d=n(29),h=n(197);e.exports=function(e,t,n){var m=-1!==e.indexOf("Map"),g=-1!==e.indexOf("Weak"),y=m?"set":"add",v=o[e],b=v&&v.prototype,x=v,w={},k=function(e){var t=b[e];a(b,e,"add"==e?function(e){return t.call(this,0===e?0:e),this}:"delete"==e?function(e){return!(g&&!u(e))&&t.call(this,0===e?0:e)}:"get"==e?function(e){return g&&!u(e)?void 0:t.call(this,0===e?0:e)}:"has"==e?function(e){return!(g&&!u(e))&&t.call(this,0===e?0:e)}:function(e,n){return t.call(this,0===e?0:e,n),this})};if(i(e,"function"!=typeof v||!(g||b.forEach&&!p((function(){(new v).entries().next()})))))x=n.getConstructor(t,e,m,y),s.REQUIRED=!0;else if(i(e,!0)){var O=new x,E=O[y](g?{}:-0,1)!=O,_=p((function(){O.has(1)})),S=f((function(e){new v(e)})),T=!g&&p((function(){for(var e=new v,t=5;t--;)e[y](t,t);return!e.has(-0)}));S||((x=t((function(t,n){c(t,x,e);var r=h(new v,t,x);return null!=n&&l(n,r[y],r,m),r}))).prototype=b,b.constructor=x),(_||T)&&(k("delete"),k("has"),m&&k("get")),(T||E)&&k(y),g&&b.clear&&delete b.clear}return w[e]=x,r({global:!0,forced:x!=v},w),d(x,e),g||n.setStrong(x,e,m),x}},function(e,t,n){var r=n(8);e.exports=!r((function(){return Object.isExtensible(Object.preventExtensions({}))}))},function(e,t,n){var r=n(9),o=n(110);e.exports=function(e,t,n){var i,a;return o&&"function"==typeof(i=t.constructor)&&i!==n&&r(a=i.prototype)&&a!==n.prototype&&o(e,a),e}},function(e,t,n){"use strict";var r=n(16).f,o=n(54),i=n(114),a=n(46),s=n(83),l=n(55),c=n(75),u=n(115),p=n(18),f=n(127).fastKey,d=n(32),h=d.set,m=d.getterFor;e.exports={getConstructor:function(e,t,n,c){var u=e((function(e,r){s(e,u,t),h(e,{type:t,index:o(null),first:void 0,last:void 0,size:0}),p||(e.size=0),null!=r&&l(r,e[c],e,n)})),d=m(t),g=function(e,t,n){var r,o,i=d(e),a=y(e,t);return a?a.value=n:(i.last=a={index:o=f(t,!0),key:t,value:n,previous:r=i.last,next:void 0,removed:!1},i.first||(i.first=a),r&&(r.next=a),p?i.size++:e.size++,"F"!==o&&(i.index[o]=a)),e},y=function(e,t){var n,r=d(e),o=f(t);if("F"!==o)return r.index[o];for(n=r.first;n;n=n.next)if(n.key==t)return n};return i(u.prototype,{clear:function(){for(var e=d(this),t=e.index,n=e.first;n;)n.removed=!0,n.previous&&(n.previous=n.previous.next=void 0),delete t[n.index],n=n.next;e.first=e.last=void 0,p?e.size=0:this.size=0},delete:function(e){var t=d(this),n=y(this,e);if(n){var r=n.next,o=n.previous;delete t.index[n.index],n.removed=!0,o&&(o.next=r),r&&(r.previous=o),t.first==n&&(t.first=r),t.last==n&&(t.last=o),p?t.size--:this.size--}return!!n},forEach:function(e){for(var t,n=d(this),r=a(e,arguments.length>1?arguments[1]:void 0,3);t=t?t.next:n.first;)for(r(t.value,t.key,this);t&&t.removed;)t=t.previous},has:function(e){return!!y(this,e)}}),i(u.prototype,n?{get:function(e){var t=y(this,e);return t&&t.value},set:function(e,t){return g(this,0===e?0:e,t)}}:{add:function(e){return g(this,e=0===e?0:e,e)}}),p&&r(u.prototype,"size",{get:function(){return d(this).size}}),u},setStrong:function(e,t,n){var r=t+" Iterator",o=m(t),i=m(r);c(e,t,(function(e,t){h(this,{type:r,target:e,state:o(e),kind:t,last:void 0})}),(function(){for(var e=i(this),t=e.kind,n=e.last;n&&n.removed;)n=n.previous;return e.target&&(e.last=n=n?n.next:e.state.first)?"keys"==t?{value:n.key,done:!1}:"values"==t?{value:n.value,done:!1}:{value:[n.key,n.value],done:!1}:(e.target=void 0,{value:void 0,done:!0})}),n?"entries":"values",!n,!0),u(t)}}},function(e,t,n){n(200),n(67),n(203),n(205),n(206),n(207),n(208),n(209),n(210),n(211),n(212),n(213),n(214),n(215),n(216),n(217),n(218),n(219),n(220);var r=n(35);e.exports=r.Symbol},function(e,t,n){"use strict";var r=n(17),o=n(8),i=n(86),a=n(9),s=n(43),l=n(36),c=n(201),u=n(124),p=n(202),f=n(4),d=n(85),h=f("isConcatSpreadable"),m=d>=51||!o((function(){var e=[];return e[h]=!1,e.concat()[0]!==e})),g=p("concat"),y=function(e){if(!a(e))return!1;var t=e[h];return void 0!==t?!!t:i(e)};r({target:"Array",proto:!0,forced:!m||!g},{concat:function(e){var t,n,r,o,i,a=s(this),p=u(a,0),f=0;for(t=-1,r=arguments.length;t<r;t++)if(y(i=-1===t?a:arguments[t])){if(f+(o=l(i.length))>9007199254740991)throw TypeError("Maximum allowed index exceeded");for(n=0;n<o;n++,f++)n in i&&c(p,f,i[n])}else{if(f>=9007199254740991)throw TypeError("Maximum allowed index exceeded");c(p,f++,i)}return p.length=f,p}})},function(e,t,n){"use strict";var r=n(51),o=n(16),i=n(40);e.exports=function(e,t,n){var a=r(t);a in e?o.f(e,a,i(0,n)):e[a]=n}},function(e,t,n){var r=n(8),o=n(4),i=n(85),a=o("species");e.exports=function(e){return i>=51||!r((function(){var t=[];return(t.constructor={})[a]=function(){return{foo:1}},1!==t[e](Boolean).foo}))}},function(e,t,n){"use strict";var r=n(17),o=n(3),i=n(28),a=n(22),s=n(18),l=n(72),c=n(102),u=n(8),p=n(11),f=n(86),d=n(9),h=n(19),m=n(43),g=n(34),y=n(51),v=n(40),b=n(54),x=n(82),w=n(78),k=n(204),O=n(80),E=n(33),_=n(16),S=n(76),T=n(23),j=n(24),A=n(69),C=n(53),I=n(41),P=n(52),R=n(4),N=n(128),L=n(12),M=n(29),D=n(32),F=n(123).forEach,z=C("hidden"),U=R("toPrimitive"),B=D.set,$=D.getterFor("Symbol"),W=Object.prototype,q=o.Symbol,H=i("JSON","stringify"),V=E.f,Y=_.f,G=k.f,Q=S.f,X=A("symbols"),K=A("op-symbols"),J=A("string-to-symbol-registry"),Z=A("symbol-to-string-registry"),ee=A("wks"),te=o.QObject,ne=!te||!te.prototype||!te.prototype.findChild,re=s&&u((function(){return 7!=b(Y({},"a",{get:function(){return Y(this,"a",{value:7}).a}})).a}))?function(e,t,n){var r=V(W,t);r&&delete W[t],Y(e,t,n),r&&e!==W&&Y(W,t,r)}:Y,oe=function(e,t){var n=X[e]=b(q.prototype);return B(n,{type:"Symbol",tag:e,description:t}),s||(n.description=t),n},ie=c?function(e){return"symbol"==typeof e}:function(e){return Object(e)instanceof q},ae=function(e,t,n){e===W&&ae(K,t,n),h(e);var r=y(t,!0);return h(n),p(X,r)?(n.enumerable?(p(e,z)&&e[z][r]&&(e[z][r]=!1),n=b(n,{enumerable:v(0,!1)})):(p(e,z)||Y(e,z,v(1,{})),e[z][r]=!0),re(e,r,n)):Y(e,r,n)},se=function(e,t){h(e);var n=g(t),r=x(n).concat(pe(n));return F(r,(function(t){s&&!le.call(n,t)||ae(e,t,n[t])})),e},le=function(e){var t=y(e,!0),n=Q.call(this,t);return!(this===W&&p(X,t)&&!p(K,t))&&(!(n||!p(this,t)||!p(X,t)||p(this,z)&&this[z][t])||n)},ce=function(e,t){var n=g(e),r=y(t,!0);if(n!==W||!p(X,r)||p(K,r)){var o=V(n,r);return!o||!p(X,r)||p(n,z)&&n[z][r]||(o.enumerable=!0),o}},ue=function(e){var t=G(g(e)),n=[];return F(t,(function(e){p(X,e)||p(I,e)||n.push(e)})),n},pe=function(e){var t=e===W,n=G(t?K:g(e)),r=[];return F(n,(function(e){!p(X,e)||t&&!p(W,e)||r.push(X[e])})),r};(l||(j((q=function(){if(this instanceof q)throw TypeError("Symbol is not a constructor");var e=arguments.length&&void 0!==arguments[0]?String(arguments[0]):void 0,t=P(e),n=function(e){this===W&&n.call(K,e),p(this,z)&&p(this[z],t)&&(this[z][t]=!1),re(this,t,v(1,e))};return s&&ne&&re(W,t,{configurable:!0,set:n}),oe(t,e)}).prototype,"toString",(function(){return $(this).tag})),j(q,"withoutSetter",(function(e){return oe(P(e),e)})),S.f=le,_.f=ae,E.f=ce,w.f=k.f=ue,O.f=pe,N.f=function(e){return oe(R(e),e)},s&&(Y(q.prototype,"description",{configurable:!0,get:function(){return $(this).description}}),a||j(W,"propertyIsEnumerable",le,{unsafe:!0}))),r({global:!0,wrap:!0,forced:!l,sham:!l},{Symbol:q}),F(x(ee),(function(e){L(e)})),r({target:"Symbol",stat:!0,forced:!l},{for:function(e){var t=String(e);if(p(J,t))return J[t];var n=q(t);return J[t]=n,Z[n]=t,n},keyFor:function(e){if(!ie(e))throw TypeError(e+" is not a symbol");if(p(Z,e))return Z[e]},useSetter:function(){ne=!0},useSimple:function(){ne=!1}}),r({target:"Object",stat:!0,forced:!l,sham:!s},{create:function(e,t){return void 0===t?b(e):se(b(e),t)},defineProperty:ae,defineProperties:se,getOwnPropertyDescriptor:ce}),r({target:"Object",stat:!0,forced:!l},{getOwnPropertyNames:ue,getOwnPropertySymbols:pe}),r({target:"Object",stat:!0,forced:u((function(){O.f(1)}))},{getOwnPropertySymbols:function(e){return O.f(m(e))}}),H)&&r({target:"JSON",stat:!0,forced:!l||u((function(){var e=q();return"[null]"!=H([e])||"{}"!=H({a:e})||"{}"!=H(Object(e))}))},{stringify:function(e,t,n){for(var r,o=[e],i=1;arguments.length>i;)o.push(arguments[i++]);if(r=t,(d(t)||void 0!==e)&&!ie(e))return f(t)||(t=function(e,t){if("function"==typeof r&&(t=r.call(this,e,t)),!ie(t))return t}),o[1]=t,H.apply(null,o)}});q.prototype[U]||T(q.prototype,U,q.prototype.valueOf),M(q,"Symbol"),I[z]=!0},function(e,t,n){var r=n(34),o=n(78).f,i={}.toString,a="object"==typeof window&&window&&Object.getOwnPropertyNames?Object.getOwnPropertyNames(window):[];e.exports.f=function(e){return a&&"[object Window]"==i.call(e)?function(e){try{return o(e)}catch(e){return a.slice()}}(e):o(r(e))}},function(e,t,n){n(12)("asyncIterator")},function(e,t,n){"use strict";var r=n(17),o=n(18),i=n(3),a=n(11),s=n(9),l=n(16).f,c=n(105),u=i.Symbol;if(o&&"function"==typeof u&&(!("description"in u.prototype)||void 0!==u().description)){var p={},f=function(){var e=arguments.length<1||void 0===arguments[0]?void 0:String(arguments[0]),t=this instanceof f?new u(e):void 0===e?u():u(e);return""===e&&(p[t]=!0),t};c(f,u);var d=f.prototype=u.prototype;d.constructor=f;var h=d.toString,m="Symbol(test)"==String(u("test")),g=/^Symbol\((.*)\)[^)]+$/;l(d,"description",{configurable:!0,get:function(){var e=s(this)?this.valueOf():this,t=h.call(e);if(a(p,e))return"";var n=m?t.slice(7,-1):t.replace(g,"$1");return""===n?void 0:n}}),r({global:!0,forced:!0},{Symbol:f})}},function(e,t,n){n(12)("hasInstance")},function(e,t,n){n(12)("isConcatSpreadable")},function(e,t,n){n(12)("iterator")},function(e,t,n){n(12)("match")},function(e,t,n){n(12)("matchAll")},function(e,t,n){n(12)("replace")},function(e,t,n){n(12)("search")},function(e,t,n){n(12)("species")},function(e,t,n){n(12)("split")},function(e,t,n){n(12)("toPrimitive")},function(e,t,n){n(12)("toStringTag")},function(e,t,n){n(12)("unscopables")},function(e,t,n){n(29)(Math,"Math",!0)},function(e,t,n){var r=n(3);n(29)(r.JSON,"JSON",!0)},function(e,t){self.fetch||(self.fetch=function(e,t){return t=t||{},new Promise((function(n,r){var o=new XMLHttpRequest,i=[],a=[],s={},l=function(){return{ok:2==(o.status/100|0),statusText:o.statusText,status:o.status,url:o.responseURL,text:function(){return Promise.resolve(o.responseText)},json:function(){return Promise.resolve(JSON.parse(o.responseText))},blob:function(){return Promise.resolve(new Blob([o.response]))},clone:l,headers:{keys:function(){return i},entries:function(){return a},get:function(e){return s[e.toLowerCase()]},has:function(e){return e.toLowerCase()in s}}}};for(var c in o.open(t.method||"get",e,!0),o.onload=function(){o.getAllResponseHeaders().replace(/^(.*?):[^\S\n]*([\s\S]*?)$/gm,(function(e,t,n){i.push(t=t.toLowerCase()),a.push([t,n]),s[t]=s[t]?s[t]+","+n:n})),n(l())},o.onerror=r,o.withCredentials="include"==t.credentials,t.headers)o.setRequestHeader(c,t.headers[c]);o.send(t.body||null)}))})},function(e,t,n){(function(e){!function(e){var t=function(){try{return!!Symbol.iterator}catch(e){return!1}}(),n=function(e){var n={next:function(){var t=e.shift();return{done:void 0===t,value:t}}};return t&&(n[Symbol.iterator]=function(){return n}),n},r=function(e){return encodeURIComponent(e).replace(/%20/g,"+")},o=function(e){return decodeURIComponent(String(e).replace(/\+/g," "))};(function(){try{var t=e.URLSearchParams;return"a=1"===new t("?a=1").toString()&&"function"==typeof t.prototype.set&&"function"==typeof t.prototype.entries}catch(e){return!1}})()||function(){var o=function(e){Object.defineProperty(this,"_entries",{writable:!0,value:{}});var t=typeof e;if("undefined"===t);else if("string"===t)""!==e&&this._fromString(e);else if(e instanceof o){var n=this;e.forEach((function(e,t){n.append(t,e)}))}else{if(null===e||"object"!==t)throw new TypeError("Unsupported input's type for URLSearchParams");if("[object Array]"===Object.prototype.toString.call(e))for(var r=0;r<e.length;r++){var i=e[r];if("[object Array]"!==Object.prototype.toString.call(i)&&2===i.length)throw new TypeError("Expected [string, any] as entry at index "+r+" of URLSearchParams's input");this.append(i[0],i[1])}else for(var a in e)e.hasOwnProperty(a)&&this.append(a,e[a])}},i=o.prototype;i.append=function(e,t){e in this._entries?this._entries[e].push(String(t)):this._entries[e]=[String(t)]},i.delete=function(e){delete this._entries[e]},i.get=function(e){return e in this._entries?this._entries[e][0]:null},i.getAll=function(e){return e in this._entries?this._entries[e].slice(0):[]},i.has=function(e){return e in this._entries},i.set=function(e,t){this._entries[e]=[String(t)]},i.forEach=function(e,t){var n;for(var r in this._entries)if(this._entries.hasOwnProperty(r)){n=this._entries[r];for(var o=0;o<n.length;o++)e.call(t,n[o],r,this)}},i.keys=function(){var e=[];return this.forEach((function(t,n){e.push(n)})),n(e)},i.values=function(){var e=[];return this.forEach((function(t){e.push(t)})),n(e)},i.entries=function(){var e=[];return this.forEach((function(t,n){e.push([n,t])})),n(e)},t&&(i[Symbol.iterator]=i.entries),i.toString=function(){var e=[];return this.forEach((function(t,n){e.push(r(n)+"="+r(t))})),e.join("&")},e.URLSearchParams=o}();var i=e.URLSearchParams.prototype;"function"!=typeof i.sort&&(i.sort=function(){var e=this,t=[];this.forEach((function(n,r){t.push([r,n]),e._entries||e.delete(r)})),t.sort((function(e,t){return e[0]<t[0]?-1:e[0]>t[0]?1:0})),e._entries&&(e._entries={});for(var n=0;n<t.length;n++)this.append(t[n][0],t[n][1])}),"function"!=typeof i._fromString&&Object.defineProperty(i,"_fromString",{enumerable:!1,configurable:!1,writable:!1,value:function(e){if(this._entries)this._entries={};else{var t=[];this.forEach((function(e,n){t.push(n)}));for(var n=0;n<t.length;n++)this.delete(t[n])}var r,i=(e=e.replace(/^\?/,"")).split("&");for(n=0;n<i.length;n++)r=i[n].split("="),this.append(o(r[0]),r.length>1?o(r[1]):"")}})}(void 0!==e?e:"undefined"!=typeof window?window:"undefined"!=typeof self?self:this),function(e){if(function(){try{var t=new e.URL("b","http://a");return t.pathname="c d","http://a/c%20d"===t.href&&t.searchParams}catch(e){return!1}}()||function(){var t=e.URL,n=function(t,n){"string"!=typeof t&&(t=String(t));var r,o=document;if(n&&(void 0===e.location||n!==e.location.href)){(r=(o=document.implementation.createHTMLDocument("")).createElement("base")).href=n,o.head.appendChild(r);try{if(0!==r.href.indexOf(n))throw new Error(r.href)}catch(e){throw new Error("URL unable to set base "+n+" due to "+e)}}var i=o.createElement("a");i.href=t,r&&(o.body.appendChild(i),i.href=i.href);var a=o.createElement("input");if(a.type="url",a.value=t,":"===i.protocol||!/:/.test(i.href)||!a.checkValidity()&&!n)throw new TypeError("Invalid URL");Object.defineProperty(this,"_anchorElement",{value:i});var s=new e.URLSearchParams(this.search),l=!0,c=!0,u=this;["append","delete","set"].forEach((function(e){var t=s[e];s[e]=function(){t.apply(s,arguments),l&&(c=!1,u.search=s.toString(),c=!0)}})),Object.defineProperty(this,"searchParams",{value:s,enumerable:!0});var p=void 0;Object.defineProperty(this,"_updateSearchParams",{enumerable:!1,configurable:!1,writable:!1,value:function(){this.search!==p&&(p=this.search,c&&(l=!1,this.searchParams._fromString(this.search),l=!0))}})},r=n.prototype;["hash","host","hostname","port","protocol"].forEach((function(e){!function(e){Object.defineProperty(r,e,{get:function(){return this._anchorElement[e]},set:function(t){this._anchorElement[e]=t},enumerable:!0})}(e)})),Object.defineProperty(r,"search",{get:function(){return this._anchorElement.search},set:function(e){this._anchorElement.search=e,this._updateSearchParams()},enumerable:!0}),Object.defineProperties(r,{toString:{get:function(){var e=this;return function(){return e.href}}},href:{get:function(){return this._anchorElement.href.replace(/\?$/,"")},set:function(e){this._anchorElement.href=e,this._updateSearchParams()},enumerable:!0},pathname:{get:function(){return this._anchorElement.pathname.replace(/(^\/?)/,"/")},set:function(e){this._anchorElement.pathname=e},enumerable:!0},origin:{get:function(){var e={"http:":80,"https:":443,"ftp:":21}[this._anchorElement.protocol],t=this._anchorElement.port!=e&&""!==this._anchorElement.port;return this._anchorElement.protocol+"//"+this._anchorElement.hostname+(t?":"+this._anchorElement.port:"")},enumerable:!0},password:{get:function(){return""},set:function(e){},enumerable:!0},username:{get:function(){return""},set:function(e){},enumerable:!0}}),n.createObjectURL=function(e){return t.createObjectURL.apply(t,arguments)},n.revokeObjectURL=function(e){return t.revokeObjectURL.apply(t,arguments)},e.URL=n}(),void 0!==e.location&&!("origin"in e.location)){var t=function(){return e.location.protocol+"//"+e.location.hostname+(e.location.port?":"+e.location.port:"")};try{Object.defineProperty(e.location,"origin",{get:t,enumerable:!0})}catch(n){setInterval((function(){e.location.origin=t()}),100)}}}(void 0!==e?e:"undefined"!=typeof window?window:"undefined"!=typeof self?self:this)}).call(this,n(5))},function(e,t,n){"use strict";
+/** @license React v16.13.1
+ * react.production.min.js
+ *
+ * Copyright (c) Facebook, Inc. and its affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */var r=n(129),o="function"==typeof Symbol&&Symbol.for,i=o?Symbol.for("react.element"):60103,a=o?Symbol.for("react.portal"):60106,s=o?Symbol.for("react.fragment"):60107,l=o?Symbol.for("react.strict_mode"):60108,c=o?Symbol.for("react.profiler"):60114,u=o?Symbol.for("react.provider"):60109,p=o?Symbol.for("react.context"):60110,f=o?Symbol.for("react.forward_ref"):60112,d=o?Symbol.for("react.suspense"):60113,h=o?Symbol.for("react.memo"):60115,m=o?Symbol.for("react.lazy"):60116,g="function"==typeof Symbol&&Symbol.iterator;function y(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}var v={isMounted:function(){return!1},enqueueForceUpdate:function(){},enqueueReplaceState:function(){},enqueueSetState:function(){}},b={};function x(e,t,n){this.props=e,this.context=t,this.refs=b,this.updater=n||v}function w(){}function k(e,t,n){this.props=e,this.context=t,this.refs=b,this.updater=n||v}x.prototype.isReactComponent={},x.prototype.setState=function(e,t){if("object"!=typeof e&&"function"!=typeof e&&null!=e)throw Error(y(85));this.updater.enqueueSetState(this,e,t,"setState")},x.prototype.forceUpdate=function(e){this.updater.enqueueForceUpdate(this,e,"forceUpdate")},w.prototype=x.prototype;var O=k.prototype=new w;O.constructor=k,r(O,x.prototype),O.isPureReactComponent=!0;var E={current:null},_=Object.prototype.hasOwnProperty,S={key:!0,ref:!0,__self:!0,__source:!0};function T(e,t,n){var r,o={},a=null,s=null;if(null!=t)for(r in void 0!==t.ref&&(s=t.ref),void 0!==t.key&&(a=""+t.key),t)_.call(t,r)&&!S.hasOwnProperty(r)&&(o[r]=t[r]);var l=arguments.length-2;if(1===l)o.children=n;else if(1<l){for(var c=Array(l),u=0;u<l;u++)c[u]=arguments[u+2];o.children=c}if(e&&e.defaultProps)for(r in l=e.defaultProps)void 0===o[r]&&(o[r]=l[r]);return{$$typeof:i,type:e,key:a,ref:s,props:o,_owner:E.current}}function j(e){return"object"==typeof e&&null!==e&&e.$$typeof===i}var A=/\/+/g,C=[];function I(e,t,n,r){if(C.length){var o=C.pop();return o.result=e,o.keyPrefix=t,o.func=n,o.context=r,o.count=0,o}return{result:e,keyPrefix:t,func:n,context:r,count:0}}function P(e){e.result=null,e.keyPrefix=null,e.func=null,e.context=null,e.count=0,10>C.length&&C.push(e)}function R(e,t,n){return null==e?0:function e(t,n,r,o){var s=typeof t;"undefined"!==s&&"boolean"!==s||(t=null);var l=!1;if(null===t)l=!0;else switch(s){case"string":case"number":l=!0;break;case"object":switch(t.$$typeof){case i:case a:l=!0}}if(l)return r(o,t,""===n?"."+N(t,0):n),1;if(l=0,n=""===n?".":n+":",Array.isArray(t))for(var c=0;c<t.length;c++){var u=n+N(s=t[c],c);l+=e(s,u,r,o)}else if(null===t||"object"!=typeof t?u=null:u="function"==typeof(u=g&&t[g]||t["@@iterator"])?u:null,"function"==typeof u)for(t=u.call(t),c=0;!(s=t.next()).done;)l+=e(s=s.value,u=n+N(s,c++),r,o);else if("object"===s)throw r=""+t,Error(y(31,"[object Object]"===r?"object with keys {"+Object.keys(t).join(", ")+"}":r,""));return l}(e,"",t,n)}function N(e,t){return"object"==typeof e&&null!==e&&null!=e.key?function(e){var t={"=":"=0",":":"=2"};return"$"+(""+e).replace(/[=:]/g,(function(e){return t[e]}))}(e.key):t.toString(36)}function L(e,t){e.func.call(e.context,t,e.count++)}function M(e,t,n){var r=e.result,o=e.keyPrefix;e=e.func.call(e.context,t,e.count++),Array.isArray(e)?D(e,r,n,(function(e){return e})):null!=e&&(j(e)&&(e=function(e,t){return{$$typeof:i,type:e.type,key:t,ref:e.ref,props:e.props,_owner:e._owner}}(e,o+(!e.key||t&&t.key===e.key?"":(""+e.key).replace(A,"$&/")+"/")+n)),r.push(e))}function D(e,t,n,r,o){var i="";null!=n&&(i=(""+n).replace(A,"$&/")+"/"),R(e,M,t=I(t,i,r,o)),P(t)}var F={current:null};function z(){var e=F.current;if(null===e)throw Error(y(321));return e}var U={ReactCurrentDispatcher:F,ReactCurrentBatchConfig:{suspense:null},ReactCurrentOwner:E,IsSomeRendererActing:{current:!1},assign:r};t.Children={map:function(e,t,n){if(null==e)return e;var r=[];return D(e,r,null,t,n),r},forEach:function(e,t,n){if(null==e)return e;R(e,L,t=I(null,null,t,n)),P(t)},count:function(e){return R(e,(function(){return null}),null)},toArray:function(e){var t=[];return D(e,t,null,(function(e){return e})),t},only:function(e){if(!j(e))throw Error(y(143));return e}},t.Component=x,t.Fragment=s,t.Profiler=c,t.PureComponent=k,t.StrictMode=l,t.Suspense=d,t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=U,t.cloneElement=function(e,t,n){if(null==e)throw Error(y(267,e));var o=r({},e.props),a=e.key,s=e.ref,l=e._owner;if(null!=t){if(void 0!==t.ref&&(s=t.ref,l=E.current),void 0!==t.key&&(a=""+t.key),e.type&&e.type.defaultProps)var c=e.type.defaultProps;for(u in t)_.call(t,u)&&!S.hasOwnProperty(u)&&(o[u]=void 0===t[u]&&void 0!==c?c[u]:t[u])}var u=arguments.length-2;if(1===u)o.children=n;else if(1<u){c=Array(u);for(var p=0;p<u;p++)c[p]=arguments[p+2];o.children=c}return{$$typeof:i,type:e.type,key:a,ref:s,props:o,_owner:l}},t.createContext=function(e,t){return void 0===t&&(t=null),(e={$$typeof:p,_calculateChangedBits:t,_currentValue:e,_currentValue2:e,_threadCount:0,Provider:null,Consumer:null}).Provider={$$typeof:u,_context:e},e.Consumer=e},t.createElement=T,t.createFactory=function(e){var t=T.bind(null,e);return t.type=e,t},t.createRef=function(){return{current:null}},t.forwardRef=function(e){return{$$typeof:f,render:e}},t.isValidElement=j,t.lazy=function(e){return{$$typeof:m,_ctor:e,_status:-1,_result:null}},t.memo=function(e,t){return{$$typeof:h,type:e,compare:void 0===t?null:t}},t.useCallback=function(e,t){return z().useCallback(e,t)},t.useContext=function(e,t){return z().useContext(e,t)},t.useDebugValue=function(){},t.useEffect=function(e,t){return z().useEffect(e,t)},t.useImperativeHandle=function(e,t,n){return z().useImperativeHandle(e,t,n)},t.useLayoutEffect=function(e,t){return z().useLayoutEffect(e,t)},t.useMemo=function(e,t){return z().useMemo(e,t)},t.useReducer=function(e,t,n){return z().useReducer(e,t,n)},t.useRef=function(e){return z().useRef(e)},t.useState=function(e){return z().useState(e)},t.version="16.13.1"},function(e,t,n){"use strict";
+/** @license React v16.13.1
+ * react-dom.production.min.js
+ *
+ * Copyright (c) Facebook, Inc. and its affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */var r=n(0),o=n(129),i=n(225);function a(e){for(var t="https://reactjs.org/docs/error-decoder.html?invariant="+e,n=1;n<arguments.length;n++)t+="&args[]="+encodeURIComponent(arguments[n]);return"Minified React error #"+e+"; visit "+t+" for the full message or use the non-minified dev environment for full errors and additional helpful warnings."}if(!r)throw Error(a(227));function s(e,t,n,r,o,i,a,s,l){var c=Array.prototype.slice.call(arguments,3);try{t.apply(n,c)}catch(e){this.onError(e)}}var l=!1,c=null,u=!1,p=null,f={onError:function(e){l=!0,c=e}};function d(e,t,n,r,o,i,a,u,p){l=!1,c=null,s.apply(f,arguments)}var h=null,m=null,g=null;function y(e,t,n){var r=e.type||"unknown-event";e.currentTarget=g(n),function(e,t,n,r,o,i,s,f,h){if(d.apply(this,arguments),l){if(!l)throw Error(a(198));var m=c;l=!1,c=null,u||(u=!0,p=m)}}(r,t,void 0,e),e.currentTarget=null}var v=null,b={};function x(){if(v)for(var e in b){var t=b[e],n=v.indexOf(e);if(!(-1<n))throw Error(a(96,e));if(!k[n]){if(!t.extractEvents)throw Error(a(97,e));for(var r in k[n]=t,n=t.eventTypes){var o=void 0,i=n[r],s=t,l=r;if(O.hasOwnProperty(l))throw Error(a(99,l));O[l]=i;var c=i.phasedRegistrationNames;if(c){for(o in c)c.hasOwnProperty(o)&&w(c[o],s,l);o=!0}else i.registrationName?(w(i.registrationName,s,l),o=!0):o=!1;if(!o)throw Error(a(98,r,e))}}}}function w(e,t,n){if(E[e])throw Error(a(100,e));E[e]=t,_[e]=t.eventTypes[n].dependencies}var k=[],O={},E={},_={};function S(e){var t,n=!1;for(t in e)if(e.hasOwnProperty(t)){var r=e[t];if(!b.hasOwnProperty(t)||b[t]!==r){if(b[t])throw Error(a(102,t));b[t]=r,n=!0}}n&&x()}var T=!("undefined"==typeof window||void 0===window.document||void 0===window.document.createElement),j=null,A=null,C=null;function I(e){if(e=m(e)){if("function"!=typeof j)throw Error(a(280));var t=e.stateNode;t&&(t=h(t),j(e.stateNode,e.type,t))}}function P(e){A?C?C.push(e):C=[e]:A=e}function R(){if(A){var e=A,t=C;if(C=A=null,I(e),t)for(e=0;e<t.length;e++)I(t[e])}}function N(e,t){return e(t)}function L(e,t,n,r,o){return e(t,n,r,o)}function M(){}var D=N,F=!1,z=!1;function U(){null===A&&null===C||(M(),R())}function B(e,t,n){if(z)return e(t,n);z=!0;try{return D(e,t,n)}finally{z=!1,U()}}var $=/^[:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD][:A-Z_a-z\u00C0-\u00D6\u00D8-\u00F6\u00F8-\u02FF\u0370-\u037D\u037F-\u1FFF\u200C-\u200D\u2070-\u218F\u2C00-\u2FEF\u3001-\uD7FF\uF900-\uFDCF\uFDF0-\uFFFD\-.0-9\u00B7\u0300-\u036F\u203F-\u2040]*$/,W=Object.prototype.hasOwnProperty,q={},H={};function V(e,t,n,r,o,i){this.acceptsBooleans=2===t||3===t||4===t,this.attributeName=r,this.attributeNamespace=o,this.mustUseProperty=n,this.propertyName=e,this.type=t,this.sanitizeURL=i}var Y={};"children dangerouslySetInnerHTML defaultValue defaultChecked innerHTML suppressContentEditableWarning suppressHydrationWarning style".split(" ").forEach((function(e){Y[e]=new V(e,0,!1,e,null,!1)})),[["acceptCharset","accept-charset"],["className","class"],["htmlFor","for"],["httpEquiv","http-equiv"]].forEach((function(e){var t=e[0];Y[t]=new V(t,1,!1,e[1],null,!1)})),["contentEditable","draggable","spellCheck","value"].forEach((function(e){Y[e]=new V(e,2,!1,e.toLowerCase(),null,!1)})),["autoReverse","externalResourcesRequired","focusable","preserveAlpha"].forEach((function(e){Y[e]=new V(e,2,!1,e,null,!1)})),"allowFullScreen async autoFocus autoPlay controls default defer disabled disablePictureInPicture formNoValidate hidden loop noModule noValidate open playsInline readOnly required reversed scoped seamless itemScope".split(" ").forEach((function(e){Y[e]=new V(e,3,!1,e.toLowerCase(),null,!1)})),["checked","multiple","muted","selected"].forEach((function(e){Y[e]=new V(e,3,!0,e,null,!1)})),["capture","download"].forEach((function(e){Y[e]=new V(e,4,!1,e,null,!1)})),["cols","rows","size","span"].forEach((function(e){Y[e]=new V(e,6,!1,e,null,!1)})),["rowSpan","start"].forEach((function(e){Y[e]=new V(e,5,!1,e.toLowerCase(),null,!1)}));var G=/[\-:]([a-z])/g;function Q(e){return e[1].toUpperCase()}"accent-height alignment-baseline arabic-form baseline-shift cap-height clip-path clip-rule color-interpolation color-interpolation-filters color-profile color-rendering dominant-baseline enable-background fill-opacity fill-rule flood-color flood-opacity font-family font-size font-size-adjust font-stretch font-style font-variant font-weight glyph-name glyph-orientation-horizontal glyph-orientation-vertical horiz-adv-x horiz-origin-x image-rendering letter-spacing lighting-color marker-end marker-mid marker-start overline-position overline-thickness paint-order panose-1 pointer-events rendering-intent shape-rendering stop-color stop-opacity strikethrough-position strikethrough-thickness stroke-dasharray stroke-dashoffset stroke-linecap stroke-linejoin stroke-miterlimit stroke-opacity stroke-width text-anchor text-decoration text-rendering underline-position underline-thickness unicode-bidi unicode-range units-per-em v-alphabetic v-hanging v-ideographic v-mathematical vector-effect vert-adv-y vert-origin-x vert-origin-y word-spacing writing-mode xmlns:xlink x-height".split(" ").forEach((function(e){var t=e.replace(G,Q);Y[t]=new V(t,1,!1,e,null,!1)})),"xlink:actuate xlink:arcrole xlink:role xlink:show xlink:title xlink:type".split(" ").forEach((function(e){var t=e.replace(G,Q);Y[t]=new V(t,1,!1,e,"http://www.w3.org/1999/xlink",!1)})),["xml:base","xml:lang","xml:space"].forEach((function(e){var t=e.replace(G,Q);Y[t]=new V(t,1,!1,e,"http://www.w3.org/XML/1998/namespace",!1)})),["tabIndex","crossOrigin"].forEach((function(e){Y[e]=new V(e,1,!1,e.toLowerCase(),null,!1)})),Y.xlinkHref=new V("xlinkHref",1,!1,"xlink:href","http://www.w3.org/1999/xlink",!0),["src","href","action","formAction"].forEach((function(e){Y[e]=new V(e,1,!1,e.toLowerCase(),null,!0)}));var X=r.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED;function K(e,t,n,r){var o=Y.hasOwnProperty(t)?Y[t]:null;(null!==o?0===o.type:!r&&(2<t.length&&("o"===t[0]||"O"===t[0])&&("n"===t[1]||"N"===t[1])))||(function(e,t,n,r){if(null==t||function(e,t,n,r){if(null!==n&&0===n.type)return!1;switch(typeof t){case"function":case"symbol":return!0;case"boolean":return!r&&(null!==n?!n.acceptsBooleans:"data-"!==(e=e.toLowerCase().slice(0,5))&&"aria-"!==e);default:return!1}}(e,t,n,r))return!0;if(r)return!1;if(null!==n)switch(n.type){case 3:return!t;case 4:return!1===t;case 5:return isNaN(t);case 6:return isNaN(t)||1>t}return!1}(t,n,o,r)&&(n=null),r||null===o?function(e){return!!W.call(H,e)||!W.call(q,e)&&($.test(e)?H[e]=!0:(q[e]=!0,!1))}(t)&&(null===n?e.removeAttribute(t):e.setAttribute(t,""+n)):o.mustUseProperty?e[o.propertyName]=null===n?3!==o.type&&"":n:(t=o.attributeName,r=o.attributeNamespace,null===n?e.removeAttribute(t):(n=3===(o=o.type)||4===o&&!0===n?"":""+n,r?e.setAttributeNS(r,t,n):e.setAttribute(t,n))))}X.hasOwnProperty("ReactCurrentDispatcher")||(X.ReactCurrentDispatcher={current:null}),X.hasOwnProperty("ReactCurrentBatchConfig")||(X.ReactCurrentBatchConfig={suspense:null});var J=/^(.*)[\\\/]/,Z="function"==typeof Symbol&&Symbol.for,ee=Z?Symbol.for("react.element"):60103,te=Z?Symbol.for("react.portal"):60106,ne=Z?Symbol.for("react.fragment"):60107,re=Z?Symbol.for("react.strict_mode"):60108,oe=Z?Symbol.for("react.profiler"):60114,ie=Z?Symbol.for("react.provider"):60109,ae=Z?Symbol.for("react.context"):60110,se=Z?Symbol.for("react.concurrent_mode"):60111,le=Z?Symbol.for("react.forward_ref"):60112,ce=Z?Symbol.for("react.suspense"):60113,ue=Z?Symbol.for("react.suspense_list"):60120,pe=Z?Symbol.for("react.memo"):60115,fe=Z?Symbol.for("react.lazy"):60116,de=Z?Symbol.for("react.block"):60121,he="function"==typeof Symbol&&Symbol.iterator;function me(e){return null===e||"object"!=typeof e?null:"function"==typeof(e=he&&e[he]||e["@@iterator"])?e:null}function ge(e){if(null==e)return null;if("function"==typeof e)return e.displayName||e.name||null;if("string"==typeof e)return e;switch(e){case ne:return"Fragment";case te:return"Portal";case oe:return"Profiler";case re:return"StrictMode";case ce:return"Suspense";case ue:return"SuspenseList"}if("object"==typeof e)switch(e.$$typeof){case ae:return"Context.Consumer";case ie:return"Context.Provider";case le:var t=e.render;return t=t.displayName||t.name||"",e.displayName||(""!==t?"ForwardRef("+t+")":"ForwardRef");case pe:return ge(e.type);case de:return ge(e.render);case fe:if(e=1===e._status?e._result:null)return ge(e)}return null}function ye(e){var t="";do{e:switch(e.tag){case 3:case 4:case 6:case 7:case 10:case 9:var n="";break e;default:var r=e._debugOwner,o=e._debugSource,i=ge(e.type);n=null,r&&(n=ge(r.type)),r=i,i="",o?i=" (at "+o.fileName.replace(J,"")+":"+o.lineNumber+")":n&&(i=" (created by "+n+")"),n="\n    in "+(r||"Unknown")+i}t+=n,e=e.return}while(e);return t}function ve(e){switch(typeof e){case"boolean":case"number":case"object":case"string":case"undefined":return e;default:return""}}function be(e){var t=e.type;return(e=e.nodeName)&&"input"===e.toLowerCase()&&("checkbox"===t||"radio"===t)}function xe(e){e._valueTracker||(e._valueTracker=function(e){var t=be(e)?"checked":"value",n=Object.getOwnPropertyDescriptor(e.constructor.prototype,t),r=""+e[t];if(!e.hasOwnProperty(t)&&void 0!==n&&"function"==typeof n.get&&"function"==typeof n.set){var o=n.get,i=n.set;return Object.defineProperty(e,t,{configurable:!0,get:function(){return o.call(this)},set:function(e){r=""+e,i.call(this,e)}}),Object.defineProperty(e,t,{enumerable:n.enumerable}),{getValue:function(){return r},setValue:function(e){r=""+e},stopTracking:function(){e._valueTracker=null,delete e[t]}}}}(e))}function we(e){if(!e)return!1;var t=e._valueTracker;if(!t)return!0;var n=t.getValue(),r="";return e&&(r=be(e)?e.checked?"true":"false":e.value),(e=r)!==n&&(t.setValue(e),!0)}function ke(e,t){var n=t.checked;return o({},t,{defaultChecked:void 0,defaultValue:void 0,value:void 0,checked:null!=n?n:e._wrapperState.initialChecked})}function Oe(e,t){var n=null==t.defaultValue?"":t.defaultValue,r=null!=t.checked?t.checked:t.defaultChecked;n=ve(null!=t.value?t.value:n),e._wrapperState={initialChecked:r,initialValue:n,controlled:"checkbox"===t.type||"radio"===t.type?null!=t.checked:null!=t.value}}function Ee(e,t){null!=(t=t.checked)&&K(e,"checked",t,!1)}function _e(e,t){Ee(e,t);var n=ve(t.value),r=t.type;if(null!=n)"number"===r?(0===n&&""===e.value||e.value!=n)&&(e.value=""+n):e.value!==""+n&&(e.value=""+n);else if("submit"===r||"reset"===r)return void e.removeAttribute("value");t.hasOwnProperty("value")?Te(e,t.type,n):t.hasOwnProperty("defaultValue")&&Te(e,t.type,ve(t.defaultValue)),null==t.checked&&null!=t.defaultChecked&&(e.defaultChecked=!!t.defaultChecked)}function Se(e,t,n){if(t.hasOwnProperty("value")||t.hasOwnProperty("defaultValue")){var r=t.type;if(!("submit"!==r&&"reset"!==r||void 0!==t.value&&null!==t.value))return;t=""+e._wrapperState.initialValue,n||t===e.value||(e.value=t),e.defaultValue=t}""!==(n=e.name)&&(e.name=""),e.defaultChecked=!!e._wrapperState.initialChecked,""!==n&&(e.name=n)}function Te(e,t,n){"number"===t&&e.ownerDocument.activeElement===e||(null==n?e.defaultValue=""+e._wrapperState.initialValue:e.defaultValue!==""+n&&(e.defaultValue=""+n))}function je(e,t){return e=o({children:void 0},t),(t=function(e){var t="";return r.Children.forEach(e,(function(e){null!=e&&(t+=e)})),t}(t.children))&&(e.children=t),e}function Ae(e,t,n,r){if(e=e.options,t){t={};for(var o=0;o<n.length;o++)t["$"+n[o]]=!0;for(n=0;n<e.length;n++)o=t.hasOwnProperty("$"+e[n].value),e[n].selected!==o&&(e[n].selected=o),o&&r&&(e[n].defaultSelected=!0)}else{for(n=""+ve(n),t=null,o=0;o<e.length;o++){if(e[o].value===n)return e[o].selected=!0,void(r&&(e[o].defaultSelected=!0));null!==t||e[o].disabled||(t=e[o])}null!==t&&(t.selected=!0)}}function Ce(e,t){if(null!=t.dangerouslySetInnerHTML)throw Error(a(91));return o({},t,{value:void 0,defaultValue:void 0,children:""+e._wrapperState.initialValue})}function Ie(e,t){var n=t.value;if(null==n){if(n=t.children,t=t.defaultValue,null!=n){if(null!=t)throw Error(a(92));if(Array.isArray(n)){if(!(1>=n.length))throw Error(a(93));n=n[0]}t=n}null==t&&(t=""),n=t}e._wrapperState={initialValue:ve(n)}}function Pe(e,t){var n=ve(t.value),r=ve(t.defaultValue);null!=n&&((n=""+n)!==e.value&&(e.value=n),null==t.defaultValue&&e.defaultValue!==n&&(e.defaultValue=n)),null!=r&&(e.defaultValue=""+r)}function Re(e){var t=e.textContent;t===e._wrapperState.initialValue&&""!==t&&null!==t&&(e.value=t)}var Ne="http://www.w3.org/1999/xhtml",Le="http://www.w3.org/2000/svg";function Me(e){switch(e){case"svg":return"http://www.w3.org/2000/svg";case"math":return"http://www.w3.org/1998/Math/MathML";default:return"http://www.w3.org/1999/xhtml"}}function De(e,t){return null==e||"http://www.w3.org/1999/xhtml"===e?Me(t):"http://www.w3.org/2000/svg"===e&&"foreignObject"===t?"http://www.w3.org/1999/xhtml":e}var Fe,ze=function(e){return"undefined"!=typeof MSApp&&MSApp.execUnsafeLocalFunction?function(t,n,r,o){MSApp.execUnsafeLocalFunction((function(){return e(t,n)}))}:e}((function(e,t){if(e.namespaceURI!==Le||"innerHTML"in e)e.innerHTML=t;else{for((Fe=Fe||document.createElement("div")).innerHTML="<svg>"+t.valueOf().toString()+"</svg>",t=Fe.firstChild;e.firstChild;)e.removeChild(e.firstChild);for(;t.firstChild;)e.appendChild(t.firstChild)}}));function Ue(e,t){if(t){var n=e.firstChild;if(n&&n===e.lastChild&&3===n.nodeType)return void(n.nodeValue=t)}e.textContent=t}function Be(e,t){var n={};return n[e.toLowerCase()]=t.toLowerCase(),n["Webkit"+e]="webkit"+t,n["Moz"+e]="moz"+t,n}var $e={animationend:Be("Animation","AnimationEnd"),animationiteration:Be("Animation","AnimationIteration"),animationstart:Be("Animation","AnimationStart"),transitionend:Be("Transition","TransitionEnd")},We={},qe={};function He(e){if(We[e])return We[e];if(!$e[e])return e;var t,n=$e[e];for(t in n)if(n.hasOwnProperty(t)&&t in qe)return We[e]=n[t];return e}T&&(qe=document.createElement("div").style,"AnimationEvent"in window||(delete $e.animationend.animation,delete $e.animationiteration.animation,delete $e.animationstart.animation),"TransitionEvent"in window||delete $e.transitionend.transition);var Ve=He("animationend"),Ye=He("animationiteration"),Ge=He("animationstart"),Qe=He("transitionend"),Xe="abort canplay canplaythrough durationchange emptied encrypted ended error loadeddata loadedmetadata loadstart pause play playing progress ratechange seeked seeking stalled suspend timeupdate volumechange waiting".split(" "),Ke=new("function"==typeof WeakMap?WeakMap:Map);function Je(e){var t=Ke.get(e);return void 0===t&&(t=new Map,Ke.set(e,t)),t}function Ze(e){var t=e,n=e;if(e.alternate)for(;t.return;)t=t.return;else{e=t;do{0!=(1026&(t=e).effectTag)&&(n=t.return),e=t.return}while(e)}return 3===t.tag?n:null}function et(e){if(13===e.tag){var t=e.memoizedState;if(null===t&&(null!==(e=e.alternate)&&(t=e.memoizedState)),null!==t)return t.dehydrated}return null}function tt(e){if(Ze(e)!==e)throw Error(a(188))}function nt(e){if(!(e=function(e){var t=e.alternate;if(!t){if(null===(t=Ze(e)))throw Error(a(188));return t!==e?null:e}for(var n=e,r=t;;){var o=n.return;if(null===o)break;var i=o.alternate;if(null===i){if(null!==(r=o.return)){n=r;continue}break}if(o.child===i.child){for(i=o.child;i;){if(i===n)return tt(o),e;if(i===r)return tt(o),t;i=i.sibling}throw Error(a(188))}if(n.return!==r.return)n=o,r=i;else{for(var s=!1,l=o.child;l;){if(l===n){s=!0,n=o,r=i;break}if(l===r){s=!0,r=o,n=i;break}l=l.sibling}if(!s){for(l=i.child;l;){if(l===n){s=!0,n=i,r=o;break}if(l===r){s=!0,r=i,n=o;break}l=l.sibling}if(!s)throw Error(a(189))}}if(n.alternate!==r)throw Error(a(190))}if(3!==n.tag)throw Error(a(188));return n.stateNode.current===n?e:t}(e)))return null;for(var t=e;;){if(5===t.tag||6===t.tag)return t;if(t.child)t.child.return=t,t=t.child;else{if(t===e)break;for(;!t.sibling;){if(!t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}}return null}function rt(e,t){if(null==t)throw Error(a(30));return null==e?t:Array.isArray(e)?Array.isArray(t)?(e.push.apply(e,t),e):(e.push(t),e):Array.isArray(t)?[e].concat(t):[e,t]}function ot(e,t,n){Array.isArray(e)?e.forEach(t,n):e&&t.call(n,e)}var it=null;function at(e){if(e){var t=e._dispatchListeners,n=e._dispatchInstances;if(Array.isArray(t))for(var r=0;r<t.length&&!e.isPropagationStopped();r++)y(e,t[r],n[r]);else t&&y(e,t,n);e._dispatchListeners=null,e._dispatchInstances=null,e.isPersistent()||e.constructor.release(e)}}function st(e){if(null!==e&&(it=rt(it,e)),e=it,it=null,e){if(ot(e,at),it)throw Error(a(95));if(u)throw e=p,u=!1,p=null,e}}function lt(e){return(e=e.target||e.srcElement||window).correspondingUseElement&&(e=e.correspondingUseElement),3===e.nodeType?e.parentNode:e}function ct(e){if(!T)return!1;var t=(e="on"+e)in document;return t||((t=document.createElement("div")).setAttribute(e,"return;"),t="function"==typeof t[e]),t}var ut=[];function pt(e){e.topLevelType=null,e.nativeEvent=null,e.targetInst=null,e.ancestors.length=0,10>ut.length&&ut.push(e)}function ft(e,t,n,r){if(ut.length){var o=ut.pop();return o.topLevelType=e,o.eventSystemFlags=r,o.nativeEvent=t,o.targetInst=n,o}return{topLevelType:e,eventSystemFlags:r,nativeEvent:t,targetInst:n,ancestors:[]}}function dt(e){var t=e.targetInst,n=t;do{if(!n){e.ancestors.push(n);break}var r=n;if(3===r.tag)r=r.stateNode.containerInfo;else{for(;r.return;)r=r.return;r=3!==r.tag?null:r.stateNode.containerInfo}if(!r)break;5!==(t=n.tag)&&6!==t||e.ancestors.push(n),n=Tn(r)}while(n);for(n=0;n<e.ancestors.length;n++){t=e.ancestors[n];var o=lt(e.nativeEvent);r=e.topLevelType;var i=e.nativeEvent,a=e.eventSystemFlags;0===n&&(a|=64);for(var s=null,l=0;l<k.length;l++){var c=k[l];c&&(c=c.extractEvents(r,t,i,o,a))&&(s=rt(s,c))}st(s)}}function ht(e,t,n){if(!n.has(e)){switch(e){case"scroll":Gt(t,"scroll",!0);break;case"focus":case"blur":Gt(t,"focus",!0),Gt(t,"blur",!0),n.set("blur",null),n.set("focus",null);break;case"cancel":case"close":ct(e)&&Gt(t,e,!0);break;case"invalid":case"submit":case"reset":break;default:-1===Xe.indexOf(e)&&Yt(e,t)}n.set(e,null)}}var mt,gt,yt,vt=!1,bt=[],xt=null,wt=null,kt=null,Ot=new Map,Et=new Map,_t=[],St="mousedown mouseup touchcancel touchend touchstart auxclick dblclick pointercancel pointerdown pointerup dragend dragstart drop compositionend compositionstart keydown keypress keyup input textInput close cancel copy cut paste click change contextmenu reset submit".split(" "),Tt="focus blur dragenter dragleave mouseover mouseout pointerover pointerout gotpointercapture lostpointercapture".split(" ");function jt(e,t,n,r,o){return{blockedOn:e,topLevelType:t,eventSystemFlags:32|n,nativeEvent:o,container:r}}function At(e,t){switch(e){case"focus":case"blur":xt=null;break;case"dragenter":case"dragleave":wt=null;break;case"mouseover":case"mouseout":kt=null;break;case"pointerover":case"pointerout":Ot.delete(t.pointerId);break;case"gotpointercapture":case"lostpointercapture":Et.delete(t.pointerId)}}function Ct(e,t,n,r,o,i){return null===e||e.nativeEvent!==i?(e=jt(t,n,r,o,i),null!==t&&(null!==(t=jn(t))&&gt(t)),e):(e.eventSystemFlags|=r,e)}function It(e){var t=Tn(e.target);if(null!==t){var n=Ze(t);if(null!==n)if(13===(t=n.tag)){if(null!==(t=et(n)))return e.blockedOn=t,void i.unstable_runWithPriority(e.priority,(function(){yt(n)}))}else if(3===t&&n.stateNode.hydrate)return void(e.blockedOn=3===n.tag?n.stateNode.containerInfo:null)}e.blockedOn=null}function Pt(e){if(null!==e.blockedOn)return!1;var t=Jt(e.topLevelType,e.eventSystemFlags,e.container,e.nativeEvent);if(null!==t){var n=jn(t);return null!==n&&gt(n),e.blockedOn=t,!1}return!0}function Rt(e,t,n){Pt(e)&&n.delete(t)}function Nt(){for(vt=!1;0<bt.length;){var e=bt[0];if(null!==e.blockedOn){null!==(e=jn(e.blockedOn))&&mt(e);break}var t=Jt(e.topLevelType,e.eventSystemFlags,e.container,e.nativeEvent);null!==t?e.blockedOn=t:bt.shift()}null!==xt&&Pt(xt)&&(xt=null),null!==wt&&Pt(wt)&&(wt=null),null!==kt&&Pt(kt)&&(kt=null),Ot.forEach(Rt),Et.forEach(Rt)}function Lt(e,t){e.blockedOn===t&&(e.blockedOn=null,vt||(vt=!0,i.unstable_scheduleCallback(i.unstable_NormalPriority,Nt)))}function Mt(e){function t(t){return Lt(t,e)}if(0<bt.length){Lt(bt[0],e);for(var n=1;n<bt.length;n++){var r=bt[n];r.blockedOn===e&&(r.blockedOn=null)}}for(null!==xt&&Lt(xt,e),null!==wt&&Lt(wt,e),null!==kt&&Lt(kt,e),Ot.forEach(t),Et.forEach(t),n=0;n<_t.length;n++)(r=_t[n]).blockedOn===e&&(r.blockedOn=null);for(;0<_t.length&&null===(n=_t[0]).blockedOn;)It(n),null===n.blockedOn&&_t.shift()}var Dt={},Ft=new Map,zt=new Map,Ut=["abort","abort",Ve,"animationEnd",Ye,"animationIteration",Ge,"animationStart","canplay","canPlay","canplaythrough","canPlayThrough","durationchange","durationChange","emptied","emptied","encrypted","encrypted","ended","ended","error","error","gotpointercapture","gotPointerCapture","load","load","loadeddata","loadedData","loadedmetadata","loadedMetadata","loadstart","loadStart","lostpointercapture","lostPointerCapture","playing","playing","progress","progress","seeking","seeking","stalled","stalled","suspend","suspend","timeupdate","timeUpdate",Qe,"transitionEnd","waiting","waiting"];function Bt(e,t){for(var n=0;n<e.length;n+=2){var r=e[n],o=e[n+1],i="on"+(o[0].toUpperCase()+o.slice(1));i={phasedRegistrationNames:{bubbled:i,captured:i+"Capture"},dependencies:[r],eventPriority:t},zt.set(r,t),Ft.set(r,i),Dt[o]=i}}Bt("blur blur cancel cancel click click close close contextmenu contextMenu copy copy cut cut auxclick auxClick dblclick doubleClick dragend dragEnd dragstart dragStart drop drop focus focus input input invalid invalid keydown keyDown keypress keyPress keyup keyUp mousedown mouseDown mouseup mouseUp paste paste pause pause play play pointercancel pointerCancel pointerdown pointerDown pointerup pointerUp ratechange rateChange reset reset seeked seeked submit submit touchcancel touchCancel touchend touchEnd touchstart touchStart volumechange volumeChange".split(" "),0),Bt("drag drag dragenter dragEnter dragexit dragExit dragleave dragLeave dragover dragOver mousemove mouseMove mouseout mouseOut mouseover mouseOver pointermove pointerMove pointerout pointerOut pointerover pointerOver scroll scroll toggle toggle touchmove touchMove wheel wheel".split(" "),1),Bt(Ut,2);for(var $t="change selectionchange textInput compositionstart compositionend compositionupdate".split(" "),Wt=0;Wt<$t.length;Wt++)zt.set($t[Wt],0);var qt=i.unstable_UserBlockingPriority,Ht=i.unstable_runWithPriority,Vt=!0;function Yt(e,t){Gt(t,e,!1)}function Gt(e,t,n){var r=zt.get(t);switch(void 0===r?2:r){case 0:r=Qt.bind(null,t,1,e);break;case 1:r=Xt.bind(null,t,1,e);break;default:r=Kt.bind(null,t,1,e)}n?e.addEventListener(t,r,!0):e.addEventListener(t,r,!1)}function Qt(e,t,n,r){F||M();var o=Kt,i=F;F=!0;try{L(o,e,t,n,r)}finally{(F=i)||U()}}function Xt(e,t,n,r){Ht(qt,Kt.bind(null,e,t,n,r))}function Kt(e,t,n,r){if(Vt)if(0<bt.length&&-1<St.indexOf(e))e=jt(null,e,t,n,r),bt.push(e);else{var o=Jt(e,t,n,r);if(null===o)At(e,r);else if(-1<St.indexOf(e))e=jt(o,e,t,n,r),bt.push(e);else if(!function(e,t,n,r,o){switch(t){case"focus":return xt=Ct(xt,e,t,n,r,o),!0;case"dragenter":return wt=Ct(wt,e,t,n,r,o),!0;case"mouseover":return kt=Ct(kt,e,t,n,r,o),!0;case"pointerover":var i=o.pointerId;return Ot.set(i,Ct(Ot.get(i)||null,e,t,n,r,o)),!0;case"gotpointercapture":return i=o.pointerId,Et.set(i,Ct(Et.get(i)||null,e,t,n,r,o)),!0}return!1}(o,e,t,n,r)){At(e,r),e=ft(e,r,null,t);try{B(dt,e)}finally{pt(e)}}}}function Jt(e,t,n,r){if(null!==(n=Tn(n=lt(r)))){var o=Ze(n);if(null===o)n=null;else{var i=o.tag;if(13===i){if(null!==(n=et(o)))return n;n=null}else if(3===i){if(o.stateNode.hydrate)return 3===o.tag?o.stateNode.containerInfo:null;n=null}else o!==n&&(n=null)}}e=ft(e,r,n,t);try{B(dt,e)}finally{pt(e)}return null}var Zt={animationIterationCount:!0,borderImageOutset:!0,borderImageSlice:!0,borderImageWidth:!0,boxFlex:!0,boxFlexGroup:!0,boxOrdinalGroup:!0,columnCount:!0,columns:!0,flex:!0,flexGrow:!0,flexPositive:!0,flexShrink:!0,flexNegative:!0,flexOrder:!0,gridArea:!0,gridRow:!0,gridRowEnd:!0,gridRowSpan:!0,gridRowStart:!0,gridColumn:!0,gridColumnEnd:!0,gridColumnSpan:!0,gridColumnStart:!0,fontWeight:!0,lineClamp:!0,lineHeight:!0,opacity:!0,order:!0,orphans:!0,tabSize:!0,widows:!0,zIndex:!0,zoom:!0,fillOpacity:!0,floodOpacity:!0,stopOpacity:!0,strokeDasharray:!0,strokeDashoffset:!0,strokeMiterlimit:!0,strokeOpacity:!0,strokeWidth:!0},en=["Webkit","ms","Moz","O"];function tn(e,t,n){return null==t||"boolean"==typeof t||""===t?"":n||"number"!=typeof t||0===t||Zt.hasOwnProperty(e)&&Zt[e]?(""+t).trim():t+"px"}function nn(e,t){for(var n in e=e.style,t)if(t.hasOwnProperty(n)){var r=0===n.indexOf("--"),o=tn(n,t[n],r);"float"===n&&(n="cssFloat"),r?e.setProperty(n,o):e[n]=o}}Object.keys(Zt).forEach((function(e){en.forEach((function(t){t=t+e.charAt(0).toUpperCase()+e.substring(1),Zt[t]=Zt[e]}))}));var rn=o({menuitem:!0},{area:!0,base:!0,br:!0,col:!0,embed:!0,hr:!0,img:!0,input:!0,keygen:!0,link:!0,meta:!0,param:!0,source:!0,track:!0,wbr:!0});function on(e,t){if(t){if(rn[e]&&(null!=t.children||null!=t.dangerouslySetInnerHTML))throw Error(a(137,e,""));if(null!=t.dangerouslySetInnerHTML){if(null!=t.children)throw Error(a(60));if("object"!=typeof t.dangerouslySetInnerHTML||!("__html"in t.dangerouslySetInnerHTML))throw Error(a(61))}if(null!=t.style&&"object"!=typeof t.style)throw Error(a(62,""))}}function an(e,t){if(-1===e.indexOf("-"))return"string"==typeof t.is;switch(e){case"annotation-xml":case"color-profile":case"font-face":case"font-face-src":case"font-face-uri":case"font-face-format":case"font-face-name":case"missing-glyph":return!1;default:return!0}}var sn=Ne;function ln(e,t){var n=Je(e=9===e.nodeType||11===e.nodeType?e:e.ownerDocument);t=_[t];for(var r=0;r<t.length;r++)ht(t[r],e,n)}function cn(){}function un(e){if(void 0===(e=e||("undefined"!=typeof document?document:void 0)))return null;try{return e.activeElement||e.body}catch(t){return e.body}}function pn(e){for(;e&&e.firstChild;)e=e.firstChild;return e}function fn(e,t){var n,r=pn(e);for(e=0;r;){if(3===r.nodeType){if(n=e+r.textContent.length,e<=t&&n>=t)return{node:r,offset:t-e};e=n}e:{for(;r;){if(r.nextSibling){r=r.nextSibling;break e}r=r.parentNode}r=void 0}r=pn(r)}}function dn(){for(var e=window,t=un();t instanceof e.HTMLIFrameElement;){try{var n="string"==typeof t.contentWindow.location.href}catch(e){n=!1}if(!n)break;t=un((e=t.contentWindow).document)}return t}function hn(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return t&&("input"===t&&("text"===e.type||"search"===e.type||"tel"===e.type||"url"===e.type||"password"===e.type)||"textarea"===t||"true"===e.contentEditable)}var mn=null,gn=null;function yn(e,t){switch(e){case"button":case"input":case"select":case"textarea":return!!t.autoFocus}return!1}function vn(e,t){return"textarea"===e||"option"===e||"noscript"===e||"string"==typeof t.children||"number"==typeof t.children||"object"==typeof t.dangerouslySetInnerHTML&&null!==t.dangerouslySetInnerHTML&&null!=t.dangerouslySetInnerHTML.__html}var bn="function"==typeof setTimeout?setTimeout:void 0,xn="function"==typeof clearTimeout?clearTimeout:void 0;function wn(e){for(;null!=e;e=e.nextSibling){var t=e.nodeType;if(1===t||3===t)break}return e}function kn(e){e=e.previousSibling;for(var t=0;e;){if(8===e.nodeType){var n=e.data;if("$"===n||"$!"===n||"$?"===n){if(0===t)return e;t--}else"/$"===n&&t++}e=e.previousSibling}return null}var On=Math.random().toString(36).slice(2),En="__reactInternalInstance$"+On,_n="__reactEventHandlers$"+On,Sn="__reactContainere$"+On;function Tn(e){var t=e[En];if(t)return t;for(var n=e.parentNode;n;){if(t=n[Sn]||n[En]){if(n=t.alternate,null!==t.child||null!==n&&null!==n.child)for(e=kn(e);null!==e;){if(n=e[En])return n;e=kn(e)}return t}n=(e=n).parentNode}return null}function jn(e){return!(e=e[En]||e[Sn])||5!==e.tag&&6!==e.tag&&13!==e.tag&&3!==e.tag?null:e}function An(e){if(5===e.tag||6===e.tag)return e.stateNode;throw Error(a(33))}function Cn(e){return e[_n]||null}function In(e){do{e=e.return}while(e&&5!==e.tag);return e||null}function Pn(e,t){var n=e.stateNode;if(!n)return null;var r=h(n);if(!r)return null;n=r[t];e:switch(t){case"onClick":case"onClickCapture":case"onDoubleClick":case"onDoubleClickCapture":case"onMouseDown":case"onMouseDownCapture":case"onMouseMove":case"onMouseMoveCapture":case"onMouseUp":case"onMouseUpCapture":case"onMouseEnter":(r=!r.disabled)||(r=!("button"===(e=e.type)||"input"===e||"select"===e||"textarea"===e)),e=!r;break e;default:e=!1}if(e)return null;if(n&&"function"!=typeof n)throw Error(a(231,t,typeof n));return n}function Rn(e,t,n){(t=Pn(e,n.dispatchConfig.phasedRegistrationNames[t]))&&(n._dispatchListeners=rt(n._dispatchListeners,t),n._dispatchInstances=rt(n._dispatchInstances,e))}function Nn(e){if(e&&e.dispatchConfig.phasedRegistrationNames){for(var t=e._targetInst,n=[];t;)n.push(t),t=In(t);for(t=n.length;0<t--;)Rn(n[t],"captured",e);for(t=0;t<n.length;t++)Rn(n[t],"bubbled",e)}}function Ln(e,t,n){e&&n&&n.dispatchConfig.registrationName&&(t=Pn(e,n.dispatchConfig.registrationName))&&(n._dispatchListeners=rt(n._dispatchListeners,t),n._dispatchInstances=rt(n._dispatchInstances,e))}function Mn(e){e&&e.dispatchConfig.registrationName&&Ln(e._targetInst,null,e)}function Dn(e){ot(e,Nn)}var Fn=null,zn=null,Un=null;function Bn(){if(Un)return Un;var e,t,n=zn,r=n.length,o="value"in Fn?Fn.value:Fn.textContent,i=o.length;for(e=0;e<r&&n[e]===o[e];e++);var a=r-e;for(t=1;t<=a&&n[r-t]===o[i-t];t++);return Un=o.slice(e,1<t?1-t:void 0)}function $n(){return!0}function Wn(){return!1}function qn(e,t,n,r){for(var o in this.dispatchConfig=e,this._targetInst=t,this.nativeEvent=n,e=this.constructor.Interface)e.hasOwnProperty(o)&&((t=e[o])?this[o]=t(n):"target"===o?this.target=r:this[o]=n[o]);return this.isDefaultPrevented=(null!=n.defaultPrevented?n.defaultPrevented:!1===n.returnValue)?$n:Wn,this.isPropagationStopped=Wn,this}function Hn(e,t,n,r){if(this.eventPool.length){var o=this.eventPool.pop();return this.call(o,e,t,n,r),o}return new this(e,t,n,r)}function Vn(e){if(!(e instanceof this))throw Error(a(279));e.destructor(),10>this.eventPool.length&&this.eventPool.push(e)}function Yn(e){e.eventPool=[],e.getPooled=Hn,e.release=Vn}o(qn.prototype,{preventDefault:function(){this.defaultPrevented=!0;var e=this.nativeEvent;e&&(e.preventDefault?e.preventDefault():"unknown"!=typeof e.returnValue&&(e.returnValue=!1),this.isDefaultPrevented=$n)},stopPropagation:function(){var e=this.nativeEvent;e&&(e.stopPropagation?e.stopPropagation():"unknown"!=typeof e.cancelBubble&&(e.cancelBubble=!0),this.isPropagationStopped=$n)},persist:function(){this.isPersistent=$n},isPersistent:Wn,destructor:function(){var e,t=this.constructor.Interface;for(e in t)this[e]=null;this.nativeEvent=this._targetInst=this.dispatchConfig=null,this.isPropagationStopped=this.isDefaultPrevented=Wn,this._dispatchInstances=this._dispatchListeners=null}}),qn.Interface={type:null,target:null,currentTarget:function(){return null},eventPhase:null,bubbles:null,cancelable:null,timeStamp:function(e){return e.timeStamp||Date.now()},defaultPrevented:null,isTrusted:null},qn.extend=function(e){function t(){}function n(){return r.apply(this,arguments)}var r=this;t.prototype=r.prototype;var i=new t;return o(i,n.prototype),n.prototype=i,n.prototype.constructor=n,n.Interface=o({},r.Interface,e),n.extend=r.extend,Yn(n),n},Yn(qn);var Gn=qn.extend({data:null}),Qn=qn.extend({data:null}),Xn=[9,13,27,32],Kn=T&&"CompositionEvent"in window,Jn=null;T&&"documentMode"in document&&(Jn=document.documentMode);var Zn=T&&"TextEvent"in window&&!Jn,er=T&&(!Kn||Jn&&8<Jn&&11>=Jn),tr=String.fromCharCode(32),nr={beforeInput:{phasedRegistrationNames:{bubbled:"onBeforeInput",captured:"onBeforeInputCapture"},dependencies:["compositionend","keypress","textInput","paste"]},compositionEnd:{phasedRegistrationNames:{bubbled:"onCompositionEnd",captured:"onCompositionEndCapture"},dependencies:"blur compositionend keydown keypress keyup mousedown".split(" ")},compositionStart:{phasedRegistrationNames:{bubbled:"onCompositionStart",captured:"onCompositionStartCapture"},dependencies:"blur compositionstart keydown keypress keyup mousedown".split(" ")},compositionUpdate:{phasedRegistrationNames:{bubbled:"onCompositionUpdate",captured:"onCompositionUpdateCapture"},dependencies:"blur compositionupdate keydown keypress keyup mousedown".split(" ")}},rr=!1;function or(e,t){switch(e){case"keyup":return-1!==Xn.indexOf(t.keyCode);case"keydown":return 229!==t.keyCode;case"keypress":case"mousedown":case"blur":return!0;default:return!1}}function ir(e){return"object"==typeof(e=e.detail)&&"data"in e?e.data:null}var ar=!1;var sr={eventTypes:nr,extractEvents:function(e,t,n,r){var o;if(Kn)e:{switch(e){case"compositionstart":var i=nr.compositionStart;break e;case"compositionend":i=nr.compositionEnd;break e;case"compositionupdate":i=nr.compositionUpdate;break e}i=void 0}else ar?or(e,n)&&(i=nr.compositionEnd):"keydown"===e&&229===n.keyCode&&(i=nr.compositionStart);return i?(er&&"ko"!==n.locale&&(ar||i!==nr.compositionStart?i===nr.compositionEnd&&ar&&(o=Bn()):(zn="value"in(Fn=r)?Fn.value:Fn.textContent,ar=!0)),i=Gn.getPooled(i,t,n,r),o?i.data=o:null!==(o=ir(n))&&(i.data=o),Dn(i),o=i):o=null,(e=Zn?function(e,t){switch(e){case"compositionend":return ir(t);case"keypress":return 32!==t.which?null:(rr=!0,tr);case"textInput":return(e=t.data)===tr&&rr?null:e;default:return null}}(e,n):function(e,t){if(ar)return"compositionend"===e||!Kn&&or(e,t)?(e=Bn(),Un=zn=Fn=null,ar=!1,e):null;switch(e){case"paste":return null;case"keypress":if(!(t.ctrlKey||t.altKey||t.metaKey)||t.ctrlKey&&t.altKey){if(t.char&&1<t.char.length)return t.char;if(t.which)return String.fromCharCode(t.which)}return null;case"compositionend":return er&&"ko"!==t.locale?null:t.data;default:return null}}(e,n))?((t=Qn.getPooled(nr.beforeInput,t,n,r)).data=e,Dn(t)):t=null,null===o?t:null===t?o:[o,t]}},lr={color:!0,date:!0,datetime:!0,"datetime-local":!0,email:!0,month:!0,number:!0,password:!0,range:!0,search:!0,tel:!0,text:!0,time:!0,url:!0,week:!0};function cr(e){var t=e&&e.nodeName&&e.nodeName.toLowerCase();return"input"===t?!!lr[e.type]:"textarea"===t}var ur={change:{phasedRegistrationNames:{bubbled:"onChange",captured:"onChangeCapture"},dependencies:"blur change click focus input keydown keyup selectionchange".split(" ")}};function pr(e,t,n){return(e=qn.getPooled(ur.change,e,t,n)).type="change",P(n),Dn(e),e}var fr=null,dr=null;function hr(e){st(e)}function mr(e){if(we(An(e)))return e}function gr(e,t){if("change"===e)return t}var yr=!1;function vr(){fr&&(fr.detachEvent("onpropertychange",br),dr=fr=null)}function br(e){if("value"===e.propertyName&&mr(dr))if(e=pr(dr,e,lt(e)),F)st(e);else{F=!0;try{N(hr,e)}finally{F=!1,U()}}}function xr(e,t,n){"focus"===e?(vr(),dr=n,(fr=t).attachEvent("onpropertychange",br)):"blur"===e&&vr()}function wr(e){if("selectionchange"===e||"keyup"===e||"keydown"===e)return mr(dr)}function kr(e,t){if("click"===e)return mr(t)}function Or(e,t){if("input"===e||"change"===e)return mr(t)}T&&(yr=ct("input")&&(!document.documentMode||9<document.documentMode));var Er={eventTypes:ur,_isInputEventSupported:yr,extractEvents:function(e,t,n,r){var o=t?An(t):window,i=o.nodeName&&o.nodeName.toLowerCase();if("select"===i||"input"===i&&"file"===o.type)var a=gr;else if(cr(o))if(yr)a=Or;else{a=wr;var s=xr}else(i=o.nodeName)&&"input"===i.toLowerCase()&&("checkbox"===o.type||"radio"===o.type)&&(a=kr);if(a&&(a=a(e,t)))return pr(a,n,r);s&&s(e,o,t),"blur"===e&&(e=o._wrapperState)&&e.controlled&&"number"===o.type&&Te(o,"number",o.value)}},_r=qn.extend({view:null,detail:null}),Sr={Alt:"altKey",Control:"ctrlKey",Meta:"metaKey",Shift:"shiftKey"};function Tr(e){var t=this.nativeEvent;return t.getModifierState?t.getModifierState(e):!!(e=Sr[e])&&!!t[e]}function jr(){return Tr}var Ar=0,Cr=0,Ir=!1,Pr=!1,Rr=_r.extend({screenX:null,screenY:null,clientX:null,clientY:null,pageX:null,pageY:null,ctrlKey:null,shiftKey:null,altKey:null,metaKey:null,getModifierState:jr,button:null,buttons:null,relatedTarget:function(e){return e.relatedTarget||(e.fromElement===e.srcElement?e.toElement:e.fromElement)},movementX:function(e){if("movementX"in e)return e.movementX;var t=Ar;return Ar=e.screenX,Ir?"mousemove"===e.type?e.screenX-t:0:(Ir=!0,0)},movementY:function(e){if("movementY"in e)return e.movementY;var t=Cr;return Cr=e.screenY,Pr?"mousemove"===e.type?e.screenY-t:0:(Pr=!0,0)}}),Nr=Rr.extend({pointerId:null,width:null,height:null,pressure:null,tangentialPressure:null,tiltX:null,tiltY:null,twist:null,pointerType:null,isPrimary:null}),Lr={mouseEnter:{registrationName:"onMouseEnter",dependencies:["mouseout","mouseover"]},mouseLeave:{registrationName:"onMouseLeave",dependencies:["mouseout","mouseover"]},pointerEnter:{registrationName:"onPointerEnter",dependencies:["pointerout","pointerover"]},pointerLeave:{registrationName:"onPointerLeave",dependencies:["pointerout","pointerover"]}},Mr={eventTypes:Lr,extractEvents:function(e,t,n,r,o){var i="mouseover"===e||"pointerover"===e,a="mouseout"===e||"pointerout"===e;if(i&&0==(32&o)&&(n.relatedTarget||n.fromElement)||!a&&!i)return null;(i=r.window===r?r:(i=r.ownerDocument)?i.defaultView||i.parentWindow:window,a)?(a=t,null!==(t=(t=n.relatedTarget||n.toElement)?Tn(t):null)&&(t!==Ze(t)||5!==t.tag&&6!==t.tag)&&(t=null)):a=null;if(a===t)return null;if("mouseout"===e||"mouseover"===e)var s=Rr,l=Lr.mouseLeave,c=Lr.mouseEnter,u="mouse";else"pointerout"!==e&&"pointerover"!==e||(s=Nr,l=Lr.pointerLeave,c=Lr.pointerEnter,u="pointer");if(e=null==a?i:An(a),i=null==t?i:An(t),(l=s.getPooled(l,a,n,r)).type=u+"leave",l.target=e,l.relatedTarget=i,(n=s.getPooled(c,t,n,r)).type=u+"enter",n.target=i,n.relatedTarget=e,u=t,(r=a)&&u)e:{for(c=u,a=0,e=s=r;e;e=In(e))a++;for(e=0,t=c;t;t=In(t))e++;for(;0<a-e;)s=In(s),a--;for(;0<e-a;)c=In(c),e--;for(;a--;){if(s===c||s===c.alternate)break e;s=In(s),c=In(c)}s=null}else s=null;for(c=s,s=[];r&&r!==c&&(null===(a=r.alternate)||a!==c);)s.push(r),r=In(r);for(r=[];u&&u!==c&&(null===(a=u.alternate)||a!==c);)r.push(u),u=In(u);for(u=0;u<s.length;u++)Ln(s[u],"bubbled",l);for(u=r.length;0<u--;)Ln(r[u],"captured",n);return 0==(64&o)?[l]:[l,n]}};var Dr="function"==typeof Object.is?Object.is:function(e,t){return e===t&&(0!==e||1/e==1/t)||e!=e&&t!=t},Fr=Object.prototype.hasOwnProperty;function zr(e,t){if(Dr(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(r=0;r<n.length;r++)if(!Fr.call(t,n[r])||!Dr(e[n[r]],t[n[r]]))return!1;return!0}var Ur=T&&"documentMode"in document&&11>=document.documentMode,Br={select:{phasedRegistrationNames:{bubbled:"onSelect",captured:"onSelectCapture"},dependencies:"blur contextmenu dragend focus keydown keyup mousedown mouseup selectionchange".split(" ")}},$r=null,Wr=null,qr=null,Hr=!1;function Vr(e,t){var n=t.window===t?t.document:9===t.nodeType?t:t.ownerDocument;return Hr||null==$r||$r!==un(n)?null:("selectionStart"in(n=$r)&&hn(n)?n={start:n.selectionStart,end:n.selectionEnd}:n={anchorNode:(n=(n.ownerDocument&&n.ownerDocument.defaultView||window).getSelection()).anchorNode,anchorOffset:n.anchorOffset,focusNode:n.focusNode,focusOffset:n.focusOffset},qr&&zr(qr,n)?null:(qr=n,(e=qn.getPooled(Br.select,Wr,e,t)).type="select",e.target=$r,Dn(e),e))}var Yr={eventTypes:Br,extractEvents:function(e,t,n,r,o,i){if(!(i=!(o=i||(r.window===r?r.document:9===r.nodeType?r:r.ownerDocument)))){e:{o=Je(o),i=_.onSelect;for(var a=0;a<i.length;a++)if(!o.has(i[a])){o=!1;break e}o=!0}i=!o}if(i)return null;switch(o=t?An(t):window,e){case"focus":(cr(o)||"true"===o.contentEditable)&&($r=o,Wr=t,qr=null);break;case"blur":qr=Wr=$r=null;break;case"mousedown":Hr=!0;break;case"contextmenu":case"mouseup":case"dragend":return Hr=!1,Vr(n,r);case"selectionchange":if(Ur)break;case"keydown":case"keyup":return Vr(n,r)}return null}},Gr=qn.extend({animationName:null,elapsedTime:null,pseudoElement:null}),Qr=qn.extend({clipboardData:function(e){return"clipboardData"in e?e.clipboardData:window.clipboardData}}),Xr=_r.extend({relatedTarget:null});function Kr(e){var t=e.keyCode;return"charCode"in e?0===(e=e.charCode)&&13===t&&(e=13):e=t,10===e&&(e=13),32<=e||13===e?e:0}var Jr={Esc:"Escape",Spacebar:" ",Left:"ArrowLeft",Up:"ArrowUp",Right:"ArrowRight",Down:"ArrowDown",Del:"Delete",Win:"OS",Menu:"ContextMenu",Apps:"ContextMenu",Scroll:"ScrollLock",MozPrintableKey:"Unidentified"},Zr={8:"Backspace",9:"Tab",12:"Clear",13:"Enter",16:"Shift",17:"Control",18:"Alt",19:"Pause",20:"CapsLock",27:"Escape",32:" ",33:"PageUp",34:"PageDown",35:"End",36:"Home",37:"ArrowLeft",38:"ArrowUp",39:"ArrowRight",40:"ArrowDown",45:"Insert",46:"Delete",112:"F1",113:"F2",114:"F3",115:"F4",116:"F5",117:"F6",118:"F7",119:"F8",120:"F9",121:"F10",122:"F11",123:"F12",144:"NumLock",145:"ScrollLock",224:"Meta"},eo=_r.extend({key:function(e){if(e.key){var t=Jr[e.key]||e.key;if("Unidentified"!==t)return t}return"keypress"===e.type?13===(e=Kr(e))?"Enter":String.fromCharCode(e):"keydown"===e.type||"keyup"===e.type?Zr[e.keyCode]||"Unidentified":""},location:null,ctrlKey:null,shiftKey:null,altKey:null,metaKey:null,repeat:null,locale:null,getModifierState:jr,charCode:function(e){return"keypress"===e.type?Kr(e):0},keyCode:function(e){return"keydown"===e.type||"keyup"===e.type?e.keyCode:0},which:function(e){return"keypress"===e.type?Kr(e):"keydown"===e.type||"keyup"===e.type?e.keyCode:0}}),to=Rr.extend({dataTransfer:null}),no=_r.extend({touches:null,targetTouches:null,changedTouches:null,altKey:null,metaKey:null,ctrlKey:null,shiftKey:null,getModifierState:jr}),ro=qn.extend({propertyName:null,elapsedTime:null,pseudoElement:null}),oo=Rr.extend({deltaX:function(e){return"deltaX"in e?e.deltaX:"wheelDeltaX"in e?-e.wheelDeltaX:0},deltaY:function(e){return"deltaY"in e?e.deltaY:"wheelDeltaY"in e?-e.wheelDeltaY:"wheelDelta"in e?-e.wheelDelta:0},deltaZ:null,deltaMode:null}),io={eventTypes:Dt,extractEvents:function(e,t,n,r){var o=Ft.get(e);if(!o)return null;switch(e){case"keypress":if(0===Kr(n))return null;case"keydown":case"keyup":e=eo;break;case"blur":case"focus":e=Xr;break;case"click":if(2===n.button)return null;case"auxclick":case"dblclick":case"mousedown":case"mousemove":case"mouseup":case"mouseout":case"mouseover":case"contextmenu":e=Rr;break;case"drag":case"dragend":case"dragenter":case"dragexit":case"dragleave":case"dragover":case"dragstart":case"drop":e=to;break;case"touchcancel":case"touchend":case"touchmove":case"touchstart":e=no;break;case Ve:case Ye:case Ge:e=Gr;break;case Qe:e=ro;break;case"scroll":e=_r;break;case"wheel":e=oo;break;case"copy":case"cut":case"paste":e=Qr;break;case"gotpointercapture":case"lostpointercapture":case"pointercancel":case"pointerdown":case"pointermove":case"pointerout":case"pointerover":case"pointerup":e=Nr;break;default:e=qn}return Dn(t=e.getPooled(o,t,n,r)),t}};if(v)throw Error(a(101));v=Array.prototype.slice.call("ResponderEventPlugin SimpleEventPlugin EnterLeaveEventPlugin ChangeEventPlugin SelectEventPlugin BeforeInputEventPlugin".split(" ")),x(),h=Cn,m=jn,g=An,S({SimpleEventPlugin:io,EnterLeaveEventPlugin:Mr,ChangeEventPlugin:Er,SelectEventPlugin:Yr,BeforeInputEventPlugin:sr});var ao=[],so=-1;function lo(e){0>so||(e.current=ao[so],ao[so]=null,so--)}function co(e,t){so++,ao[so]=e.current,e.current=t}var uo={},po={current:uo},fo={current:!1},ho=uo;function mo(e,t){var n=e.type.contextTypes;if(!n)return uo;var r=e.stateNode;if(r&&r.__reactInternalMemoizedUnmaskedChildContext===t)return r.__reactInternalMemoizedMaskedChildContext;var o,i={};for(o in n)i[o]=t[o];return r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=t,e.__reactInternalMemoizedMaskedChildContext=i),i}function go(e){return null!=(e=e.childContextTypes)}function yo(){lo(fo),lo(po)}function vo(e,t,n){if(po.current!==uo)throw Error(a(168));co(po,t),co(fo,n)}function bo(e,t,n){var r=e.stateNode;if(e=t.childContextTypes,"function"!=typeof r.getChildContext)return n;for(var i in r=r.getChildContext())if(!(i in e))throw Error(a(108,ge(t)||"Unknown",i));return o({},n,{},r)}function xo(e){return e=(e=e.stateNode)&&e.__reactInternalMemoizedMergedChildContext||uo,ho=po.current,co(po,e),co(fo,fo.current),!0}function wo(e,t,n){var r=e.stateNode;if(!r)throw Error(a(169));n?(e=bo(e,t,ho),r.__reactInternalMemoizedMergedChildContext=e,lo(fo),lo(po),co(po,e)):lo(fo),co(fo,n)}var ko=i.unstable_runWithPriority,Oo=i.unstable_scheduleCallback,Eo=i.unstable_cancelCallback,_o=i.unstable_requestPaint,So=i.unstable_now,To=i.unstable_getCurrentPriorityLevel,jo=i.unstable_ImmediatePriority,Ao=i.unstable_UserBlockingPriority,Co=i.unstable_NormalPriority,Io=i.unstable_LowPriority,Po=i.unstable_IdlePriority,Ro={},No=i.unstable_shouldYield,Lo=void 0!==_o?_o:function(){},Mo=null,Do=null,Fo=!1,zo=So(),Uo=1e4>zo?So:function(){return So()-zo};function Bo(){switch(To()){case jo:return 99;case Ao:return 98;case Co:return 97;case Io:return 96;case Po:return 95;default:throw Error(a(332))}}function $o(e){switch(e){case 99:return jo;case 98:return Ao;case 97:return Co;case 96:return Io;case 95:return Po;default:throw Error(a(332))}}function Wo(e,t){return e=$o(e),ko(e,t)}function qo(e,t,n){return e=$o(e),Oo(e,t,n)}function Ho(e){return null===Mo?(Mo=[e],Do=Oo(jo,Yo)):Mo.push(e),Ro}function Vo(){if(null!==Do){var e=Do;Do=null,Eo(e)}Yo()}function Yo(){if(!Fo&&null!==Mo){Fo=!0;var e=0;try{var t=Mo;Wo(99,(function(){for(;e<t.length;e++){var n=t[e];do{n=n(!0)}while(null!==n)}})),Mo=null}catch(t){throw null!==Mo&&(Mo=Mo.slice(e+1)),Oo(jo,Vo),t}finally{Fo=!1}}}function Go(e,t,n){return 1073741821-(1+((1073741821-e+t/10)/(n/=10)|0))*n}function Qo(e,t){if(e&&e.defaultProps)for(var n in t=o({},t),e=e.defaultProps)void 0===t[n]&&(t[n]=e[n]);return t}var Xo={current:null},Ko=null,Jo=null,Zo=null;function ei(){Zo=Jo=Ko=null}function ti(e){var t=Xo.current;lo(Xo),e.type._context._currentValue=t}function ni(e,t){for(;null!==e;){var n=e.alternate;if(e.childExpirationTime<t)e.childExpirationTime=t,null!==n&&n.childExpirationTime<t&&(n.childExpirationTime=t);else{if(!(null!==n&&n.childExpirationTime<t))break;n.childExpirationTime=t}e=e.return}}function ri(e,t){Ko=e,Zo=Jo=null,null!==(e=e.dependencies)&&null!==e.firstContext&&(e.expirationTime>=t&&(Ca=!0),e.firstContext=null)}function oi(e,t){if(Zo!==e&&!1!==t&&0!==t)if("number"==typeof t&&1073741823!==t||(Zo=e,t=1073741823),t={context:e,observedBits:t,next:null},null===Jo){if(null===Ko)throw Error(a(308));Jo=t,Ko.dependencies={expirationTime:0,firstContext:t,responders:null}}else Jo=Jo.next=t;return e._currentValue}var ii=!1;function ai(e){e.updateQueue={baseState:e.memoizedState,baseQueue:null,shared:{pending:null},effects:null}}function si(e,t){e=e.updateQueue,t.updateQueue===e&&(t.updateQueue={baseState:e.baseState,baseQueue:e.baseQueue,shared:e.shared,effects:e.effects})}function li(e,t){return(e={expirationTime:e,suspenseConfig:t,tag:0,payload:null,callback:null,next:null}).next=e}function ci(e,t){if(null!==(e=e.updateQueue)){var n=(e=e.shared).pending;null===n?t.next=t:(t.next=n.next,n.next=t),e.pending=t}}function ui(e,t){var n=e.alternate;null!==n&&si(n,e),null===(n=(e=e.updateQueue).baseQueue)?(e.baseQueue=t.next=t,t.next=t):(t.next=n.next,n.next=t)}function pi(e,t,n,r){var i=e.updateQueue;ii=!1;var a=i.baseQueue,s=i.shared.pending;if(null!==s){if(null!==a){var l=a.next;a.next=s.next,s.next=l}a=s,i.shared.pending=null,null!==(l=e.alternate)&&(null!==(l=l.updateQueue)&&(l.baseQueue=s))}if(null!==a){l=a.next;var c=i.baseState,u=0,p=null,f=null,d=null;if(null!==l)for(var h=l;;){if((s=h.expirationTime)<r){var m={expirationTime:h.expirationTime,suspenseConfig:h.suspenseConfig,tag:h.tag,payload:h.payload,callback:h.callback,next:null};null===d?(f=d=m,p=c):d=d.next=m,s>u&&(u=s)}else{null!==d&&(d=d.next={expirationTime:1073741823,suspenseConfig:h.suspenseConfig,tag:h.tag,payload:h.payload,callback:h.callback,next:null}),il(s,h.suspenseConfig);e:{var g=e,y=h;switch(s=t,m=n,y.tag){case 1:if("function"==typeof(g=y.payload)){c=g.call(m,c,s);break e}c=g;break e;case 3:g.effectTag=-4097&g.effectTag|64;case 0:if(null==(s="function"==typeof(g=y.payload)?g.call(m,c,s):g))break e;c=o({},c,s);break e;case 2:ii=!0}}null!==h.callback&&(e.effectTag|=32,null===(s=i.effects)?i.effects=[h]:s.push(h))}if(null===(h=h.next)||h===l){if(null===(s=i.shared.pending))break;h=a.next=s.next,s.next=l,i.baseQueue=a=s,i.shared.pending=null}}null===d?p=c:d.next=f,i.baseState=p,i.baseQueue=d,al(u),e.expirationTime=u,e.memoizedState=c}}function fi(e,t,n){if(e=t.effects,t.effects=null,null!==e)for(t=0;t<e.length;t++){var r=e[t],o=r.callback;if(null!==o){if(r.callback=null,r=o,o=n,"function"!=typeof r)throw Error(a(191,r));r.call(o)}}}var di=X.ReactCurrentBatchConfig,hi=(new r.Component).refs;function mi(e,t,n,r){n=null==(n=n(r,t=e.memoizedState))?t:o({},t,n),e.memoizedState=n,0===e.expirationTime&&(e.updateQueue.baseState=n)}var gi={isMounted:function(e){return!!(e=e._reactInternalFiber)&&Ze(e)===e},enqueueSetState:function(e,t,n){e=e._reactInternalFiber;var r=Vs(),o=di.suspense;(o=li(r=Ys(r,e,o),o)).payload=t,null!=n&&(o.callback=n),ci(e,o),Gs(e,r)},enqueueReplaceState:function(e,t,n){e=e._reactInternalFiber;var r=Vs(),o=di.suspense;(o=li(r=Ys(r,e,o),o)).tag=1,o.payload=t,null!=n&&(o.callback=n),ci(e,o),Gs(e,r)},enqueueForceUpdate:function(e,t){e=e._reactInternalFiber;var n=Vs(),r=di.suspense;(r=li(n=Ys(n,e,r),r)).tag=2,null!=t&&(r.callback=t),ci(e,r),Gs(e,n)}};function yi(e,t,n,r,o,i,a){return"function"==typeof(e=e.stateNode).shouldComponentUpdate?e.shouldComponentUpdate(r,i,a):!t.prototype||!t.prototype.isPureReactComponent||(!zr(n,r)||!zr(o,i))}function vi(e,t,n){var r=!1,o=uo,i=t.contextType;return"object"==typeof i&&null!==i?i=oi(i):(o=go(t)?ho:po.current,i=(r=null!=(r=t.contextTypes))?mo(e,o):uo),t=new t(n,i),e.memoizedState=null!==t.state&&void 0!==t.state?t.state:null,t.updater=gi,e.stateNode=t,t._reactInternalFiber=e,r&&((e=e.stateNode).__reactInternalMemoizedUnmaskedChildContext=o,e.__reactInternalMemoizedMaskedChildContext=i),t}function bi(e,t,n,r){e=t.state,"function"==typeof t.componentWillReceiveProps&&t.componentWillReceiveProps(n,r),"function"==typeof t.UNSAFE_componentWillReceiveProps&&t.UNSAFE_componentWillReceiveProps(n,r),t.state!==e&&gi.enqueueReplaceState(t,t.state,null)}function xi(e,t,n,r){var o=e.stateNode;o.props=n,o.state=e.memoizedState,o.refs=hi,ai(e);var i=t.contextType;"object"==typeof i&&null!==i?o.context=oi(i):(i=go(t)?ho:po.current,o.context=mo(e,i)),pi(e,n,o,r),o.state=e.memoizedState,"function"==typeof(i=t.getDerivedStateFromProps)&&(mi(e,t,i,n),o.state=e.memoizedState),"function"==typeof t.getDerivedStateFromProps||"function"==typeof o.getSnapshotBeforeUpdate||"function"!=typeof o.UNSAFE_componentWillMount&&"function"!=typeof o.componentWillMount||(t=o.state,"function"==typeof o.componentWillMount&&o.componentWillMount(),"function"==typeof o.UNSAFE_componentWillMount&&o.UNSAFE_componentWillMount(),t!==o.state&&gi.enqueueReplaceState(o,o.state,null),pi(e,n,o,r),o.state=e.memoizedState),"function"==typeof o.componentDidMount&&(e.effectTag|=4)}var wi=Array.isArray;function ki(e,t,n){if(null!==(e=n.ref)&&"function"!=typeof e&&"object"!=typeof e){if(n._owner){if(n=n._owner){if(1!==n.tag)throw Error(a(309));var r=n.stateNode}if(!r)throw Error(a(147,e));var o=""+e;return null!==t&&null!==t.ref&&"function"==typeof t.ref&&t.ref._stringRef===o?t.ref:((t=function(e){var t=r.refs;t===hi&&(t=r.refs={}),null===e?delete t[o]:t[o]=e})._stringRef=o,t)}if("string"!=typeof e)throw Error(a(284));if(!n._owner)throw Error(a(290,e))}return e}function Oi(e,t){if("textarea"!==e.type)throw Error(a(31,"[object Object]"===Object.prototype.toString.call(t)?"object with keys {"+Object.keys(t).join(", ")+"}":t,""))}function Ei(e){function t(t,n){if(e){var r=t.lastEffect;null!==r?(r.nextEffect=n,t.lastEffect=n):t.firstEffect=t.lastEffect=n,n.nextEffect=null,n.effectTag=8}}function n(n,r){if(!e)return null;for(;null!==r;)t(n,r),r=r.sibling;return null}function r(e,t){for(e=new Map;null!==t;)null!==t.key?e.set(t.key,t):e.set(t.index,t),t=t.sibling;return e}function o(e,t){return(e=Sl(e,t)).index=0,e.sibling=null,e}function i(t,n,r){return t.index=r,e?null!==(r=t.alternate)?(r=r.index)<n?(t.effectTag=2,n):r:(t.effectTag=2,n):n}function s(t){return e&&null===t.alternate&&(t.effectTag=2),t}function l(e,t,n,r){return null===t||6!==t.tag?((t=Al(n,e.mode,r)).return=e,t):((t=o(t,n)).return=e,t)}function c(e,t,n,r){return null!==t&&t.elementType===n.type?((r=o(t,n.props)).ref=ki(e,t,n),r.return=e,r):((r=Tl(n.type,n.key,n.props,null,e.mode,r)).ref=ki(e,t,n),r.return=e,r)}function u(e,t,n,r){return null===t||4!==t.tag||t.stateNode.containerInfo!==n.containerInfo||t.stateNode.implementation!==n.implementation?((t=Cl(n,e.mode,r)).return=e,t):((t=o(t,n.children||[])).return=e,t)}function p(e,t,n,r,i){return null===t||7!==t.tag?((t=jl(n,e.mode,r,i)).return=e,t):((t=o(t,n)).return=e,t)}function f(e,t,n){if("string"==typeof t||"number"==typeof t)return(t=Al(""+t,e.mode,n)).return=e,t;if("object"==typeof t&&null!==t){switch(t.$$typeof){case ee:return(n=Tl(t.type,t.key,t.props,null,e.mode,n)).ref=ki(e,null,t),n.return=e,n;case te:return(t=Cl(t,e.mode,n)).return=e,t}if(wi(t)||me(t))return(t=jl(t,e.mode,n,null)).return=e,t;Oi(e,t)}return null}function d(e,t,n,r){var o=null!==t?t.key:null;if("string"==typeof n||"number"==typeof n)return null!==o?null:l(e,t,""+n,r);if("object"==typeof n&&null!==n){switch(n.$$typeof){case ee:return n.key===o?n.type===ne?p(e,t,n.props.children,r,o):c(e,t,n,r):null;case te:return n.key===o?u(e,t,n,r):null}if(wi(n)||me(n))return null!==o?null:p(e,t,n,r,null);Oi(e,n)}return null}function h(e,t,n,r,o){if("string"==typeof r||"number"==typeof r)return l(t,e=e.get(n)||null,""+r,o);if("object"==typeof r&&null!==r){switch(r.$$typeof){case ee:return e=e.get(null===r.key?n:r.key)||null,r.type===ne?p(t,e,r.props.children,o,r.key):c(t,e,r,o);case te:return u(t,e=e.get(null===r.key?n:r.key)||null,r,o)}if(wi(r)||me(r))return p(t,e=e.get(n)||null,r,o,null);Oi(t,r)}return null}function m(o,a,s,l){for(var c=null,u=null,p=a,m=a=0,g=null;null!==p&&m<s.length;m++){p.index>m?(g=p,p=null):g=p.sibling;var y=d(o,p,s[m],l);if(null===y){null===p&&(p=g);break}e&&p&&null===y.alternate&&t(o,p),a=i(y,a,m),null===u?c=y:u.sibling=y,u=y,p=g}if(m===s.length)return n(o,p),c;if(null===p){for(;m<s.length;m++)null!==(p=f(o,s[m],l))&&(a=i(p,a,m),null===u?c=p:u.sibling=p,u=p);return c}for(p=r(o,p);m<s.length;m++)null!==(g=h(p,o,m,s[m],l))&&(e&&null!==g.alternate&&p.delete(null===g.key?m:g.key),a=i(g,a,m),null===u?c=g:u.sibling=g,u=g);return e&&p.forEach((function(e){return t(o,e)})),c}function g(o,s,l,c){var u=me(l);if("function"!=typeof u)throw Error(a(150));if(null==(l=u.call(l)))throw Error(a(151));for(var p=u=null,m=s,g=s=0,y=null,v=l.next();null!==m&&!v.done;g++,v=l.next()){m.index>g?(y=m,m=null):y=m.sibling;var b=d(o,m,v.value,c);if(null===b){null===m&&(m=y);break}e&&m&&null===b.alternate&&t(o,m),s=i(b,s,g),null===p?u=b:p.sibling=b,p=b,m=y}if(v.done)return n(o,m),u;if(null===m){for(;!v.done;g++,v=l.next())null!==(v=f(o,v.value,c))&&(s=i(v,s,g),null===p?u=v:p.sibling=v,p=v);return u}for(m=r(o,m);!v.done;g++,v=l.next())null!==(v=h(m,o,g,v.value,c))&&(e&&null!==v.alternate&&m.delete(null===v.key?g:v.key),s=i(v,s,g),null===p?u=v:p.sibling=v,p=v);return e&&m.forEach((function(e){return t(o,e)})),u}return function(e,r,i,l){var c="object"==typeof i&&null!==i&&i.type===ne&&null===i.key;c&&(i=i.props.children);var u="object"==typeof i&&null!==i;if(u)switch(i.$$typeof){case ee:e:{for(u=i.key,c=r;null!==c;){if(c.key===u){switch(c.tag){case 7:if(i.type===ne){n(e,c.sibling),(r=o(c,i.props.children)).return=e,e=r;break e}break;default:if(c.elementType===i.type){n(e,c.sibling),(r=o(c,i.props)).ref=ki(e,c,i),r.return=e,e=r;break e}}n(e,c);break}t(e,c),c=c.sibling}i.type===ne?((r=jl(i.props.children,e.mode,l,i.key)).return=e,e=r):((l=Tl(i.type,i.key,i.props,null,e.mode,l)).ref=ki(e,r,i),l.return=e,e=l)}return s(e);case te:e:{for(c=i.key;null!==r;){if(r.key===c){if(4===r.tag&&r.stateNode.containerInfo===i.containerInfo&&r.stateNode.implementation===i.implementation){n(e,r.sibling),(r=o(r,i.children||[])).return=e,e=r;break e}n(e,r);break}t(e,r),r=r.sibling}(r=Cl(i,e.mode,l)).return=e,e=r}return s(e)}if("string"==typeof i||"number"==typeof i)return i=""+i,null!==r&&6===r.tag?(n(e,r.sibling),(r=o(r,i)).return=e,e=r):(n(e,r),(r=Al(i,e.mode,l)).return=e,e=r),s(e);if(wi(i))return m(e,r,i,l);if(me(i))return g(e,r,i,l);if(u&&Oi(e,i),void 0===i&&!c)switch(e.tag){case 1:case 0:throw e=e.type,Error(a(152,e.displayName||e.name||"Component"))}return n(e,r)}}var _i=Ei(!0),Si=Ei(!1),Ti={},ji={current:Ti},Ai={current:Ti},Ci={current:Ti};function Ii(e){if(e===Ti)throw Error(a(174));return e}function Pi(e,t){switch(co(Ci,t),co(Ai,e),co(ji,Ti),e=t.nodeType){case 9:case 11:t=(t=t.documentElement)?t.namespaceURI:De(null,"");break;default:t=De(t=(e=8===e?t.parentNode:t).namespaceURI||null,e=e.tagName)}lo(ji),co(ji,t)}function Ri(){lo(ji),lo(Ai),lo(Ci)}function Ni(e){Ii(Ci.current);var t=Ii(ji.current),n=De(t,e.type);t!==n&&(co(Ai,e),co(ji,n))}function Li(e){Ai.current===e&&(lo(ji),lo(Ai))}var Mi={current:0};function Di(e){for(var t=e;null!==t;){if(13===t.tag){var n=t.memoizedState;if(null!==n&&(null===(n=n.dehydrated)||"$?"===n.data||"$!"===n.data))return t}else if(19===t.tag&&void 0!==t.memoizedProps.revealOrder){if(0!=(64&t.effectTag))return t}else if(null!==t.child){t.child.return=t,t=t.child;continue}if(t===e)break;for(;null===t.sibling;){if(null===t.return||t.return===e)return null;t=t.return}t.sibling.return=t.return,t=t.sibling}return null}function Fi(e,t){return{responder:e,props:t}}var zi=X.ReactCurrentDispatcher,Ui=X.ReactCurrentBatchConfig,Bi=0,$i=null,Wi=null,qi=null,Hi=!1;function Vi(){throw Error(a(321))}function Yi(e,t){if(null===t)return!1;for(var n=0;n<t.length&&n<e.length;n++)if(!Dr(e[n],t[n]))return!1;return!0}function Gi(e,t,n,r,o,i){if(Bi=i,$i=t,t.memoizedState=null,t.updateQueue=null,t.expirationTime=0,zi.current=null===e||null===e.memoizedState?ya:va,e=n(r,o),t.expirationTime===Bi){i=0;do{if(t.expirationTime=0,!(25>i))throw Error(a(301));i+=1,qi=Wi=null,t.updateQueue=null,zi.current=ba,e=n(r,o)}while(t.expirationTime===Bi)}if(zi.current=ga,t=null!==Wi&&null!==Wi.next,Bi=0,qi=Wi=$i=null,Hi=!1,t)throw Error(a(300));return e}function Qi(){var e={memoizedState:null,baseState:null,baseQueue:null,queue:null,next:null};return null===qi?$i.memoizedState=qi=e:qi=qi.next=e,qi}function Xi(){if(null===Wi){var e=$i.alternate;e=null!==e?e.memoizedState:null}else e=Wi.next;var t=null===qi?$i.memoizedState:qi.next;if(null!==t)qi=t,Wi=e;else{if(null===e)throw Error(a(310));e={memoizedState:(Wi=e).memoizedState,baseState:Wi.baseState,baseQueue:Wi.baseQueue,queue:Wi.queue,next:null},null===qi?$i.memoizedState=qi=e:qi=qi.next=e}return qi}function Ki(e,t){return"function"==typeof t?t(e):t}function Ji(e){var t=Xi(),n=t.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=e;var r=Wi,o=r.baseQueue,i=n.pending;if(null!==i){if(null!==o){var s=o.next;o.next=i.next,i.next=s}r.baseQueue=o=i,n.pending=null}if(null!==o){o=o.next,r=r.baseState;var l=s=i=null,c=o;do{var u=c.expirationTime;if(u<Bi){var p={expirationTime:c.expirationTime,suspenseConfig:c.suspenseConfig,action:c.action,eagerReducer:c.eagerReducer,eagerState:c.eagerState,next:null};null===l?(s=l=p,i=r):l=l.next=p,u>$i.expirationTime&&($i.expirationTime=u,al(u))}else null!==l&&(l=l.next={expirationTime:1073741823,suspenseConfig:c.suspenseConfig,action:c.action,eagerReducer:c.eagerReducer,eagerState:c.eagerState,next:null}),il(u,c.suspenseConfig),r=c.eagerReducer===e?c.eagerState:e(r,c.action);c=c.next}while(null!==c&&c!==o);null===l?i=r:l.next=s,Dr(r,t.memoizedState)||(Ca=!0),t.memoizedState=r,t.baseState=i,t.baseQueue=l,n.lastRenderedState=r}return[t.memoizedState,n.dispatch]}function Zi(e){var t=Xi(),n=t.queue;if(null===n)throw Error(a(311));n.lastRenderedReducer=e;var r=n.dispatch,o=n.pending,i=t.memoizedState;if(null!==o){n.pending=null;var s=o=o.next;do{i=e(i,s.action),s=s.next}while(s!==o);Dr(i,t.memoizedState)||(Ca=!0),t.memoizedState=i,null===t.baseQueue&&(t.baseState=i),n.lastRenderedState=i}return[i,r]}function ea(e){var t=Qi();return"function"==typeof e&&(e=e()),t.memoizedState=t.baseState=e,e=(e=t.queue={pending:null,dispatch:null,lastRenderedReducer:Ki,lastRenderedState:e}).dispatch=ma.bind(null,$i,e),[t.memoizedState,e]}function ta(e,t,n,r){return e={tag:e,create:t,destroy:n,deps:r,next:null},null===(t=$i.updateQueue)?(t={lastEffect:null},$i.updateQueue=t,t.lastEffect=e.next=e):null===(n=t.lastEffect)?t.lastEffect=e.next=e:(r=n.next,n.next=e,e.next=r,t.lastEffect=e),e}function na(){return Xi().memoizedState}function ra(e,t,n,r){var o=Qi();$i.effectTag|=e,o.memoizedState=ta(1|t,n,void 0,void 0===r?null:r)}function oa(e,t,n,r){var o=Xi();r=void 0===r?null:r;var i=void 0;if(null!==Wi){var a=Wi.memoizedState;if(i=a.destroy,null!==r&&Yi(r,a.deps))return void ta(t,n,i,r)}$i.effectTag|=e,o.memoizedState=ta(1|t,n,i,r)}function ia(e,t){return ra(516,4,e,t)}function aa(e,t){return oa(516,4,e,t)}function sa(e,t){return oa(4,2,e,t)}function la(e,t){return"function"==typeof t?(e=e(),t(e),function(){t(null)}):null!=t?(e=e(),t.current=e,function(){t.current=null}):void 0}function ca(e,t,n){return n=null!=n?n.concat([e]):null,oa(4,2,la.bind(null,t,e),n)}function ua(){}function pa(e,t){return Qi().memoizedState=[e,void 0===t?null:t],e}function fa(e,t){var n=Xi();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&Yi(t,r[1])?r[0]:(n.memoizedState=[e,t],e)}function da(e,t){var n=Xi();t=void 0===t?null:t;var r=n.memoizedState;return null!==r&&null!==t&&Yi(t,r[1])?r[0]:(e=e(),n.memoizedState=[e,t],e)}function ha(e,t,n){var r=Bo();Wo(98>r?98:r,(function(){e(!0)})),Wo(97<r?97:r,(function(){var r=Ui.suspense;Ui.suspense=void 0===t?null:t;try{e(!1),n()}finally{Ui.suspense=r}}))}function ma(e,t,n){var r=Vs(),o=di.suspense;o={expirationTime:r=Ys(r,e,o),suspenseConfig:o,action:n,eagerReducer:null,eagerState:null,next:null};var i=t.pending;if(null===i?o.next=o:(o.next=i.next,i.next=o),t.pending=o,i=e.alternate,e===$i||null!==i&&i===$i)Hi=!0,o.expirationTime=Bi,$i.expirationTime=Bi;else{if(0===e.expirationTime&&(null===i||0===i.expirationTime)&&null!==(i=t.lastRenderedReducer))try{var a=t.lastRenderedState,s=i(a,n);if(o.eagerReducer=i,o.eagerState=s,Dr(s,a))return}catch(e){}Gs(e,r)}}var ga={readContext:oi,useCallback:Vi,useContext:Vi,useEffect:Vi,useImperativeHandle:Vi,useLayoutEffect:Vi,useMemo:Vi,useReducer:Vi,useRef:Vi,useState:Vi,useDebugValue:Vi,useResponder:Vi,useDeferredValue:Vi,useTransition:Vi},ya={readContext:oi,useCallback:pa,useContext:oi,useEffect:ia,useImperativeHandle:function(e,t,n){return n=null!=n?n.concat([e]):null,ra(4,2,la.bind(null,t,e),n)},useLayoutEffect:function(e,t){return ra(4,2,e,t)},useMemo:function(e,t){var n=Qi();return t=void 0===t?null:t,e=e(),n.memoizedState=[e,t],e},useReducer:function(e,t,n){var r=Qi();return t=void 0!==n?n(t):t,r.memoizedState=r.baseState=t,e=(e=r.queue={pending:null,dispatch:null,lastRenderedReducer:e,lastRenderedState:t}).dispatch=ma.bind(null,$i,e),[r.memoizedState,e]},useRef:function(e){return e={current:e},Qi().memoizedState=e},useState:ea,useDebugValue:ua,useResponder:Fi,useDeferredValue:function(e,t){var n=ea(e),r=n[0],o=n[1];return ia((function(){var n=Ui.suspense;Ui.suspense=void 0===t?null:t;try{o(e)}finally{Ui.suspense=n}}),[e,t]),r},useTransition:function(e){var t=ea(!1),n=t[0];return t=t[1],[pa(ha.bind(null,t,e),[t,e]),n]}},va={readContext:oi,useCallback:fa,useContext:oi,useEffect:aa,useImperativeHandle:ca,useLayoutEffect:sa,useMemo:da,useReducer:Ji,useRef:na,useState:function(){return Ji(Ki)},useDebugValue:ua,useResponder:Fi,useDeferredValue:function(e,t){var n=Ji(Ki),r=n[0],o=n[1];return aa((function(){var n=Ui.suspense;Ui.suspense=void 0===t?null:t;try{o(e)}finally{Ui.suspense=n}}),[e,t]),r},useTransition:function(e){var t=Ji(Ki),n=t[0];return t=t[1],[fa(ha.bind(null,t,e),[t,e]),n]}},ba={readContext:oi,useCallback:fa,useContext:oi,useEffect:aa,useImperativeHandle:ca,useLayoutEffect:sa,useMemo:da,useReducer:Zi,useRef:na,useState:function(){return Zi(Ki)},useDebugValue:ua,useResponder:Fi,useDeferredValue:function(e,t){var n=Zi(Ki),r=n[0],o=n[1];return aa((function(){var n=Ui.suspense;Ui.suspense=void 0===t?null:t;try{o(e)}finally{Ui.suspense=n}}),[e,t]),r},useTransition:function(e){var t=Zi(Ki),n=t[0];return t=t[1],[fa(ha.bind(null,t,e),[t,e]),n]}},xa=null,wa=null,ka=!1;function Oa(e,t){var n=El(5,null,null,0);n.elementType="DELETED",n.type="DELETED",n.stateNode=t,n.return=e,n.effectTag=8,null!==e.lastEffect?(e.lastEffect.nextEffect=n,e.lastEffect=n):e.firstEffect=e.lastEffect=n}function Ea(e,t){switch(e.tag){case 5:var n=e.type;return null!==(t=1!==t.nodeType||n.toLowerCase()!==t.nodeName.toLowerCase()?null:t)&&(e.stateNode=t,!0);case 6:return null!==(t=""===e.pendingProps||3!==t.nodeType?null:t)&&(e.stateNode=t,!0);case 13:default:return!1}}function _a(e){if(ka){var t=wa;if(t){var n=t;if(!Ea(e,t)){if(!(t=wn(n.nextSibling))||!Ea(e,t))return e.effectTag=-1025&e.effectTag|2,ka=!1,void(xa=e);Oa(xa,n)}xa=e,wa=wn(t.firstChild)}else e.effectTag=-1025&e.effectTag|2,ka=!1,xa=e}}function Sa(e){for(e=e.return;null!==e&&5!==e.tag&&3!==e.tag&&13!==e.tag;)e=e.return;xa=e}function Ta(e){if(e!==xa)return!1;if(!ka)return Sa(e),ka=!0,!1;var t=e.type;if(5!==e.tag||"head"!==t&&"body"!==t&&!vn(t,e.memoizedProps))for(t=wa;t;)Oa(e,t),t=wn(t.nextSibling);if(Sa(e),13===e.tag){if(!(e=null!==(e=e.memoizedState)?e.dehydrated:null))throw Error(a(317));e:{for(e=e.nextSibling,t=0;e;){if(8===e.nodeType){var n=e.data;if("/$"===n){if(0===t){wa=wn(e.nextSibling);break e}t--}else"$"!==n&&"$!"!==n&&"$?"!==n||t++}e=e.nextSibling}wa=null}}else wa=xa?wn(e.stateNode.nextSibling):null;return!0}function ja(){wa=xa=null,ka=!1}var Aa=X.ReactCurrentOwner,Ca=!1;function Ia(e,t,n,r){t.child=null===e?Si(t,null,n,r):_i(t,e.child,n,r)}function Pa(e,t,n,r,o){n=n.render;var i=t.ref;return ri(t,o),r=Gi(e,t,n,r,i,o),null===e||Ca?(t.effectTag|=1,Ia(e,t,r,o),t.child):(t.updateQueue=e.updateQueue,t.effectTag&=-517,e.expirationTime<=o&&(e.expirationTime=0),Ga(e,t,o))}function Ra(e,t,n,r,o,i){if(null===e){var a=n.type;return"function"!=typeof a||_l(a)||void 0!==a.defaultProps||null!==n.compare||void 0!==n.defaultProps?((e=Tl(n.type,null,r,null,t.mode,i)).ref=t.ref,e.return=t,t.child=e):(t.tag=15,t.type=a,Na(e,t,a,r,o,i))}return a=e.child,o<i&&(o=a.memoizedProps,(n=null!==(n=n.compare)?n:zr)(o,r)&&e.ref===t.ref)?Ga(e,t,i):(t.effectTag|=1,(e=Sl(a,r)).ref=t.ref,e.return=t,t.child=e)}function Na(e,t,n,r,o,i){return null!==e&&zr(e.memoizedProps,r)&&e.ref===t.ref&&(Ca=!1,o<i)?(t.expirationTime=e.expirationTime,Ga(e,t,i)):Ma(e,t,n,r,i)}function La(e,t){var n=t.ref;(null===e&&null!==n||null!==e&&e.ref!==n)&&(t.effectTag|=128)}function Ma(e,t,n,r,o){var i=go(n)?ho:po.current;return i=mo(t,i),ri(t,o),n=Gi(e,t,n,r,i,o),null===e||Ca?(t.effectTag|=1,Ia(e,t,n,o),t.child):(t.updateQueue=e.updateQueue,t.effectTag&=-517,e.expirationTime<=o&&(e.expirationTime=0),Ga(e,t,o))}function Da(e,t,n,r,o){if(go(n)){var i=!0;xo(t)}else i=!1;if(ri(t,o),null===t.stateNode)null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),vi(t,n,r),xi(t,n,r,o),r=!0;else if(null===e){var a=t.stateNode,s=t.memoizedProps;a.props=s;var l=a.context,c=n.contextType;"object"==typeof c&&null!==c?c=oi(c):c=mo(t,c=go(n)?ho:po.current);var u=n.getDerivedStateFromProps,p="function"==typeof u||"function"==typeof a.getSnapshotBeforeUpdate;p||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(s!==r||l!==c)&&bi(t,a,r,c),ii=!1;var f=t.memoizedState;a.state=f,pi(t,r,a,o),l=t.memoizedState,s!==r||f!==l||fo.current||ii?("function"==typeof u&&(mi(t,n,u,r),l=t.memoizedState),(s=ii||yi(t,n,s,r,f,l,c))?(p||"function"!=typeof a.UNSAFE_componentWillMount&&"function"!=typeof a.componentWillMount||("function"==typeof a.componentWillMount&&a.componentWillMount(),"function"==typeof a.UNSAFE_componentWillMount&&a.UNSAFE_componentWillMount()),"function"==typeof a.componentDidMount&&(t.effectTag|=4)):("function"==typeof a.componentDidMount&&(t.effectTag|=4),t.memoizedProps=r,t.memoizedState=l),a.props=r,a.state=l,a.context=c,r=s):("function"==typeof a.componentDidMount&&(t.effectTag|=4),r=!1)}else a=t.stateNode,si(e,t),s=t.memoizedProps,a.props=t.type===t.elementType?s:Qo(t.type,s),l=a.context,"object"==typeof(c=n.contextType)&&null!==c?c=oi(c):c=mo(t,c=go(n)?ho:po.current),(p="function"==typeof(u=n.getDerivedStateFromProps)||"function"==typeof a.getSnapshotBeforeUpdate)||"function"!=typeof a.UNSAFE_componentWillReceiveProps&&"function"!=typeof a.componentWillReceiveProps||(s!==r||l!==c)&&bi(t,a,r,c),ii=!1,l=t.memoizedState,a.state=l,pi(t,r,a,o),f=t.memoizedState,s!==r||l!==f||fo.current||ii?("function"==typeof u&&(mi(t,n,u,r),f=t.memoizedState),(u=ii||yi(t,n,s,r,l,f,c))?(p||"function"!=typeof a.UNSAFE_componentWillUpdate&&"function"!=typeof a.componentWillUpdate||("function"==typeof a.componentWillUpdate&&a.componentWillUpdate(r,f,c),"function"==typeof a.UNSAFE_componentWillUpdate&&a.UNSAFE_componentWillUpdate(r,f,c)),"function"==typeof a.componentDidUpdate&&(t.effectTag|=4),"function"==typeof a.getSnapshotBeforeUpdate&&(t.effectTag|=256)):("function"!=typeof a.componentDidUpdate||s===e.memoizedProps&&l===e.memoizedState||(t.effectTag|=4),"function"!=typeof a.getSnapshotBeforeUpdate||s===e.memoizedProps&&l===e.memoizedState||(t.effectTag|=256),t.memoizedProps=r,t.memoizedState=f),a.props=r,a.state=f,a.context=c,r=u):("function"!=typeof a.componentDidUpdate||s===e.memoizedProps&&l===e.memoizedState||(t.effectTag|=4),"function"!=typeof a.getSnapshotBeforeUpdate||s===e.memoizedProps&&l===e.memoizedState||(t.effectTag|=256),r=!1);return Fa(e,t,n,r,i,o)}function Fa(e,t,n,r,o,i){La(e,t);var a=0!=(64&t.effectTag);if(!r&&!a)return o&&wo(t,n,!1),Ga(e,t,i);r=t.stateNode,Aa.current=t;var s=a&&"function"!=typeof n.getDerivedStateFromError?null:r.render();return t.effectTag|=1,null!==e&&a?(t.child=_i(t,e.child,null,i),t.child=_i(t,null,s,i)):Ia(e,t,s,i),t.memoizedState=r.state,o&&wo(t,n,!0),t.child}function za(e){var t=e.stateNode;t.pendingContext?vo(0,t.pendingContext,t.pendingContext!==t.context):t.context&&vo(0,t.context,!1),Pi(e,t.containerInfo)}var Ua,Ba,$a,Wa={dehydrated:null,retryTime:0};function qa(e,t,n){var r,o=t.mode,i=t.pendingProps,a=Mi.current,s=!1;if((r=0!=(64&t.effectTag))||(r=0!=(2&a)&&(null===e||null!==e.memoizedState)),r?(s=!0,t.effectTag&=-65):null!==e&&null===e.memoizedState||void 0===i.fallback||!0===i.unstable_avoidThisFallback||(a|=1),co(Mi,1&a),null===e){if(void 0!==i.fallback&&_a(t),s){if(s=i.fallback,(i=jl(null,o,0,null)).return=t,0==(2&t.mode))for(e=null!==t.memoizedState?t.child.child:t.child,i.child=e;null!==e;)e.return=i,e=e.sibling;return(n=jl(s,o,n,null)).return=t,i.sibling=n,t.memoizedState=Wa,t.child=i,n}return o=i.children,t.memoizedState=null,t.child=Si(t,null,o,n)}if(null!==e.memoizedState){if(o=(e=e.child).sibling,s){if(i=i.fallback,(n=Sl(e,e.pendingProps)).return=t,0==(2&t.mode)&&(s=null!==t.memoizedState?t.child.child:t.child)!==e.child)for(n.child=s;null!==s;)s.return=n,s=s.sibling;return(o=Sl(o,i)).return=t,n.sibling=o,n.childExpirationTime=0,t.memoizedState=Wa,t.child=n,o}return n=_i(t,e.child,i.children,n),t.memoizedState=null,t.child=n}if(e=e.child,s){if(s=i.fallback,(i=jl(null,o,0,null)).return=t,i.child=e,null!==e&&(e.return=i),0==(2&t.mode))for(e=null!==t.memoizedState?t.child.child:t.child,i.child=e;null!==e;)e.return=i,e=e.sibling;return(n=jl(s,o,n,null)).return=t,i.sibling=n,n.effectTag|=2,i.childExpirationTime=0,t.memoizedState=Wa,t.child=i,n}return t.memoizedState=null,t.child=_i(t,e,i.children,n)}function Ha(e,t){e.expirationTime<t&&(e.expirationTime=t);var n=e.alternate;null!==n&&n.expirationTime<t&&(n.expirationTime=t),ni(e.return,t)}function Va(e,t,n,r,o,i){var a=e.memoizedState;null===a?e.memoizedState={isBackwards:t,rendering:null,renderingStartTime:0,last:r,tail:n,tailExpiration:0,tailMode:o,lastEffect:i}:(a.isBackwards=t,a.rendering=null,a.renderingStartTime=0,a.last=r,a.tail=n,a.tailExpiration=0,a.tailMode=o,a.lastEffect=i)}function Ya(e,t,n){var r=t.pendingProps,o=r.revealOrder,i=r.tail;if(Ia(e,t,r.children,n),0!=(2&(r=Mi.current)))r=1&r|2,t.effectTag|=64;else{if(null!==e&&0!=(64&e.effectTag))e:for(e=t.child;null!==e;){if(13===e.tag)null!==e.memoizedState&&Ha(e,n);else if(19===e.tag)Ha(e,n);else if(null!==e.child){e.child.return=e,e=e.child;continue}if(e===t)break e;for(;null===e.sibling;){if(null===e.return||e.return===t)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}r&=1}if(co(Mi,r),0==(2&t.mode))t.memoizedState=null;else switch(o){case"forwards":for(n=t.child,o=null;null!==n;)null!==(e=n.alternate)&&null===Di(e)&&(o=n),n=n.sibling;null===(n=o)?(o=t.child,t.child=null):(o=n.sibling,n.sibling=null),Va(t,!1,o,n,i,t.lastEffect);break;case"backwards":for(n=null,o=t.child,t.child=null;null!==o;){if(null!==(e=o.alternate)&&null===Di(e)){t.child=o;break}e=o.sibling,o.sibling=n,n=o,o=e}Va(t,!0,n,null,i,t.lastEffect);break;case"together":Va(t,!1,null,null,void 0,t.lastEffect);break;default:t.memoizedState=null}return t.child}function Ga(e,t,n){null!==e&&(t.dependencies=e.dependencies);var r=t.expirationTime;if(0!==r&&al(r),t.childExpirationTime<n)return null;if(null!==e&&t.child!==e.child)throw Error(a(153));if(null!==t.child){for(n=Sl(e=t.child,e.pendingProps),t.child=n,n.return=t;null!==e.sibling;)e=e.sibling,(n=n.sibling=Sl(e,e.pendingProps)).return=t;n.sibling=null}return t.child}function Qa(e,t){switch(e.tailMode){case"hidden":t=e.tail;for(var n=null;null!==t;)null!==t.alternate&&(n=t),t=t.sibling;null===n?e.tail=null:n.sibling=null;break;case"collapsed":n=e.tail;for(var r=null;null!==n;)null!==n.alternate&&(r=n),n=n.sibling;null===r?t||null===e.tail?e.tail=null:e.tail.sibling=null:r.sibling=null}}function Xa(e,t,n){var r=t.pendingProps;switch(t.tag){case 2:case 16:case 15:case 0:case 11:case 7:case 8:case 12:case 9:case 14:return null;case 1:return go(t.type)&&yo(),null;case 3:return Ri(),lo(fo),lo(po),(n=t.stateNode).pendingContext&&(n.context=n.pendingContext,n.pendingContext=null),null!==e&&null!==e.child||!Ta(t)||(t.effectTag|=4),null;case 5:Li(t),n=Ii(Ci.current);var i=t.type;if(null!==e&&null!=t.stateNode)Ba(e,t,i,r,n),e.ref!==t.ref&&(t.effectTag|=128);else{if(!r){if(null===t.stateNode)throw Error(a(166));return null}if(e=Ii(ji.current),Ta(t)){r=t.stateNode,i=t.type;var s=t.memoizedProps;switch(r[En]=t,r[_n]=s,i){case"iframe":case"object":case"embed":Yt("load",r);break;case"video":case"audio":for(e=0;e<Xe.length;e++)Yt(Xe[e],r);break;case"source":Yt("error",r);break;case"img":case"image":case"link":Yt("error",r),Yt("load",r);break;case"form":Yt("reset",r),Yt("submit",r);break;case"details":Yt("toggle",r);break;case"input":Oe(r,s),Yt("invalid",r),ln(n,"onChange");break;case"select":r._wrapperState={wasMultiple:!!s.multiple},Yt("invalid",r),ln(n,"onChange");break;case"textarea":Ie(r,s),Yt("invalid",r),ln(n,"onChange")}for(var l in on(i,s),e=null,s)if(s.hasOwnProperty(l)){var c=s[l];"children"===l?"string"==typeof c?r.textContent!==c&&(e=["children",c]):"number"==typeof c&&r.textContent!==""+c&&(e=["children",""+c]):E.hasOwnProperty(l)&&null!=c&&ln(n,l)}switch(i){case"input":xe(r),Se(r,s,!0);break;case"textarea":xe(r),Re(r);break;case"select":case"option":break;default:"function"==typeof s.onClick&&(r.onclick=cn)}n=e,t.updateQueue=n,null!==n&&(t.effectTag|=4)}else{switch(l=9===n.nodeType?n:n.ownerDocument,e===sn&&(e=Me(i)),e===sn?"script"===i?((e=l.createElement("div")).innerHTML="<script><\/script>",e=e.removeChild(e.firstChild)):"string"==typeof r.is?e=l.createElement(i,{is:r.is}):(e=l.createElement(i),"select"===i&&(l=e,r.multiple?l.multiple=!0:r.size&&(l.size=r.size))):e=l.createElementNS(e,i),e[En]=t,e[_n]=r,Ua(e,t),t.stateNode=e,l=an(i,r),i){case"iframe":case"object":case"embed":Yt("load",e),c=r;break;case"video":case"audio":for(c=0;c<Xe.length;c++)Yt(Xe[c],e);c=r;break;case"source":Yt("error",e),c=r;break;case"img":case"image":case"link":Yt("error",e),Yt("load",e),c=r;break;case"form":Yt("reset",e),Yt("submit",e),c=r;break;case"details":Yt("toggle",e),c=r;break;case"input":Oe(e,r),c=ke(e,r),Yt("invalid",e),ln(n,"onChange");break;case"option":c=je(e,r);break;case"select":e._wrapperState={wasMultiple:!!r.multiple},c=o({},r,{value:void 0}),Yt("invalid",e),ln(n,"onChange");break;case"textarea":Ie(e,r),c=Ce(e,r),Yt("invalid",e),ln(n,"onChange");break;default:c=r}on(i,c);var u=c;for(s in u)if(u.hasOwnProperty(s)){var p=u[s];"style"===s?nn(e,p):"dangerouslySetInnerHTML"===s?null!=(p=p?p.__html:void 0)&&ze(e,p):"children"===s?"string"==typeof p?("textarea"!==i||""!==p)&&Ue(e,p):"number"==typeof p&&Ue(e,""+p):"suppressContentEditableWarning"!==s&&"suppressHydrationWarning"!==s&&"autoFocus"!==s&&(E.hasOwnProperty(s)?null!=p&&ln(n,s):null!=p&&K(e,s,p,l))}switch(i){case"input":xe(e),Se(e,r,!1);break;case"textarea":xe(e),Re(e);break;case"option":null!=r.value&&e.setAttribute("value",""+ve(r.value));break;case"select":e.multiple=!!r.multiple,null!=(n=r.value)?Ae(e,!!r.multiple,n,!1):null!=r.defaultValue&&Ae(e,!!r.multiple,r.defaultValue,!0);break;default:"function"==typeof c.onClick&&(e.onclick=cn)}yn(i,r)&&(t.effectTag|=4)}null!==t.ref&&(t.effectTag|=128)}return null;case 6:if(e&&null!=t.stateNode)$a(0,t,e.memoizedProps,r);else{if("string"!=typeof r&&null===t.stateNode)throw Error(a(166));n=Ii(Ci.current),Ii(ji.current),Ta(t)?(n=t.stateNode,r=t.memoizedProps,n[En]=t,n.nodeValue!==r&&(t.effectTag|=4)):((n=(9===n.nodeType?n:n.ownerDocument).createTextNode(r))[En]=t,t.stateNode=n)}return null;case 13:return lo(Mi),r=t.memoizedState,0!=(64&t.effectTag)?(t.expirationTime=n,t):(n=null!==r,r=!1,null===e?void 0!==t.memoizedProps.fallback&&Ta(t):(r=null!==(i=e.memoizedState),n||null===i||null!==(i=e.child.sibling)&&(null!==(s=t.firstEffect)?(t.firstEffect=i,i.nextEffect=s):(t.firstEffect=t.lastEffect=i,i.nextEffect=null),i.effectTag=8)),n&&!r&&0!=(2&t.mode)&&(null===e&&!0!==t.memoizedProps.unstable_avoidThisFallback||0!=(1&Mi.current)?Ts===xs&&(Ts=ws):(Ts!==xs&&Ts!==ws||(Ts=ks),0!==Ps&&null!==Es&&(Rl(Es,Ss),Nl(Es,Ps)))),(n||r)&&(t.effectTag|=4),null);case 4:return Ri(),null;case 10:return ti(t),null;case 17:return go(t.type)&&yo(),null;case 19:if(lo(Mi),null===(r=t.memoizedState))return null;if(i=0!=(64&t.effectTag),null===(s=r.rendering)){if(i)Qa(r,!1);else if(Ts!==xs||null!==e&&0!=(64&e.effectTag))for(s=t.child;null!==s;){if(null!==(e=Di(s))){for(t.effectTag|=64,Qa(r,!1),null!==(i=e.updateQueue)&&(t.updateQueue=i,t.effectTag|=4),null===r.lastEffect&&(t.firstEffect=null),t.lastEffect=r.lastEffect,r=t.child;null!==r;)s=n,(i=r).effectTag&=2,i.nextEffect=null,i.firstEffect=null,i.lastEffect=null,null===(e=i.alternate)?(i.childExpirationTime=0,i.expirationTime=s,i.child=null,i.memoizedProps=null,i.memoizedState=null,i.updateQueue=null,i.dependencies=null):(i.childExpirationTime=e.childExpirationTime,i.expirationTime=e.expirationTime,i.child=e.child,i.memoizedProps=e.memoizedProps,i.memoizedState=e.memoizedState,i.updateQueue=e.updateQueue,s=e.dependencies,i.dependencies=null===s?null:{expirationTime:s.expirationTime,firstContext:s.firstContext,responders:s.responders}),r=r.sibling;return co(Mi,1&Mi.current|2),t.child}s=s.sibling}}else{if(!i)if(null!==(e=Di(s))){if(t.effectTag|=64,i=!0,null!==(n=e.updateQueue)&&(t.updateQueue=n,t.effectTag|=4),Qa(r,!0),null===r.tail&&"hidden"===r.tailMode&&!s.alternate)return null!==(t=t.lastEffect=r.lastEffect)&&(t.nextEffect=null),null}else 2*Uo()-r.renderingStartTime>r.tailExpiration&&1<n&&(t.effectTag|=64,i=!0,Qa(r,!1),t.expirationTime=t.childExpirationTime=n-1);r.isBackwards?(s.sibling=t.child,t.child=s):(null!==(n=r.last)?n.sibling=s:t.child=s,r.last=s)}return null!==r.tail?(0===r.tailExpiration&&(r.tailExpiration=Uo()+500),n=r.tail,r.rendering=n,r.tail=n.sibling,r.lastEffect=t.lastEffect,r.renderingStartTime=Uo(),n.sibling=null,t=Mi.current,co(Mi,i?1&t|2:1&t),n):null}throw Error(a(156,t.tag))}function Ka(e){switch(e.tag){case 1:go(e.type)&&yo();var t=e.effectTag;return 4096&t?(e.effectTag=-4097&t|64,e):null;case 3:if(Ri(),lo(fo),lo(po),0!=(64&(t=e.effectTag)))throw Error(a(285));return e.effectTag=-4097&t|64,e;case 5:return Li(e),null;case 13:return lo(Mi),4096&(t=e.effectTag)?(e.effectTag=-4097&t|64,e):null;case 19:return lo(Mi),null;case 4:return Ri(),null;case 10:return ti(e),null;default:return null}}function Ja(e,t){return{value:e,source:t,stack:ye(t)}}Ua=function(e,t){for(var n=t.child;null!==n;){if(5===n.tag||6===n.tag)e.appendChild(n.stateNode);else if(4!==n.tag&&null!==n.child){n.child.return=n,n=n.child;continue}if(n===t)break;for(;null===n.sibling;){if(null===n.return||n.return===t)return;n=n.return}n.sibling.return=n.return,n=n.sibling}},Ba=function(e,t,n,r,i){var a=e.memoizedProps;if(a!==r){var s,l,c=t.stateNode;switch(Ii(ji.current),e=null,n){case"input":a=ke(c,a),r=ke(c,r),e=[];break;case"option":a=je(c,a),r=je(c,r),e=[];break;case"select":a=o({},a,{value:void 0}),r=o({},r,{value:void 0}),e=[];break;case"textarea":a=Ce(c,a),r=Ce(c,r),e=[];break;default:"function"!=typeof a.onClick&&"function"==typeof r.onClick&&(c.onclick=cn)}for(s in on(n,r),n=null,a)if(!r.hasOwnProperty(s)&&a.hasOwnProperty(s)&&null!=a[s])if("style"===s)for(l in c=a[s])c.hasOwnProperty(l)&&(n||(n={}),n[l]="");else"dangerouslySetInnerHTML"!==s&&"children"!==s&&"suppressContentEditableWarning"!==s&&"suppressHydrationWarning"!==s&&"autoFocus"!==s&&(E.hasOwnProperty(s)?e||(e=[]):(e=e||[]).push(s,null));for(s in r){var u=r[s];if(c=null!=a?a[s]:void 0,r.hasOwnProperty(s)&&u!==c&&(null!=u||null!=c))if("style"===s)if(c){for(l in c)!c.hasOwnProperty(l)||u&&u.hasOwnProperty(l)||(n||(n={}),n[l]="");for(l in u)u.hasOwnProperty(l)&&c[l]!==u[l]&&(n||(n={}),n[l]=u[l])}else n||(e||(e=[]),e.push(s,n)),n=u;else"dangerouslySetInnerHTML"===s?(u=u?u.__html:void 0,c=c?c.__html:void 0,null!=u&&c!==u&&(e=e||[]).push(s,u)):"children"===s?c===u||"string"!=typeof u&&"number"!=typeof u||(e=e||[]).push(s,""+u):"suppressContentEditableWarning"!==s&&"suppressHydrationWarning"!==s&&(E.hasOwnProperty(s)?(null!=u&&ln(i,s),e||c===u||(e=[])):(e=e||[]).push(s,u))}n&&(e=e||[]).push("style",n),i=e,(t.updateQueue=i)&&(t.effectTag|=4)}},$a=function(e,t,n,r){n!==r&&(t.effectTag|=4)};var Za="function"==typeof WeakSet?WeakSet:Set;function es(e,t){var n=t.source,r=t.stack;null===r&&null!==n&&(r=ye(n)),null!==n&&ge(n.type),t=t.value,null!==e&&1===e.tag&&ge(e.type);try{console.error(t)}catch(e){setTimeout((function(){throw e}))}}function ts(e){var t=e.ref;if(null!==t)if("function"==typeof t)try{t(null)}catch(t){vl(e,t)}else t.current=null}function ns(e,t){switch(t.tag){case 0:case 11:case 15:case 22:return;case 1:if(256&t.effectTag&&null!==e){var n=e.memoizedProps,r=e.memoizedState;t=(e=t.stateNode).getSnapshotBeforeUpdate(t.elementType===t.type?n:Qo(t.type,n),r),e.__reactInternalSnapshotBeforeUpdate=t}return;case 3:case 5:case 6:case 4:case 17:return}throw Error(a(163))}function rs(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.destroy;n.destroy=void 0,void 0!==r&&r()}n=n.next}while(n!==t)}}function os(e,t){if(null!==(t=null!==(t=t.updateQueue)?t.lastEffect:null)){var n=t=t.next;do{if((n.tag&e)===e){var r=n.create;n.destroy=r()}n=n.next}while(n!==t)}}function is(e,t,n){switch(n.tag){case 0:case 11:case 15:case 22:return void os(3,n);case 1:if(e=n.stateNode,4&n.effectTag)if(null===t)e.componentDidMount();else{var r=n.elementType===n.type?t.memoizedProps:Qo(n.type,t.memoizedProps);e.componentDidUpdate(r,t.memoizedState,e.__reactInternalSnapshotBeforeUpdate)}return void(null!==(t=n.updateQueue)&&fi(n,t,e));case 3:if(null!==(t=n.updateQueue)){if(e=null,null!==n.child)switch(n.child.tag){case 5:e=n.child.stateNode;break;case 1:e=n.child.stateNode}fi(n,t,e)}return;case 5:return e=n.stateNode,void(null===t&&4&n.effectTag&&yn(n.type,n.memoizedProps)&&e.focus());case 6:case 4:case 12:return;case 13:return void(null===n.memoizedState&&(n=n.alternate,null!==n&&(n=n.memoizedState,null!==n&&(n=n.dehydrated,null!==n&&Mt(n)))));case 19:case 17:case 20:case 21:return}throw Error(a(163))}function as(e,t,n){switch("function"==typeof kl&&kl(t),t.tag){case 0:case 11:case 14:case 15:case 22:if(null!==(e=t.updateQueue)&&null!==(e=e.lastEffect)){var r=e.next;Wo(97<n?97:n,(function(){var e=r;do{var n=e.destroy;if(void 0!==n){var o=t;try{n()}catch(e){vl(o,e)}}e=e.next}while(e!==r)}))}break;case 1:ts(t),"function"==typeof(n=t.stateNode).componentWillUnmount&&function(e,t){try{t.props=e.memoizedProps,t.state=e.memoizedState,t.componentWillUnmount()}catch(t){vl(e,t)}}(t,n);break;case 5:ts(t);break;case 4:us(e,t,n)}}function ss(e){var t=e.alternate;e.return=null,e.child=null,e.memoizedState=null,e.updateQueue=null,e.dependencies=null,e.alternate=null,e.firstEffect=null,e.lastEffect=null,e.pendingProps=null,e.memoizedProps=null,e.stateNode=null,null!==t&&ss(t)}function ls(e){return 5===e.tag||3===e.tag||4===e.tag}function cs(e){e:{for(var t=e.return;null!==t;){if(ls(t)){var n=t;break e}t=t.return}throw Error(a(160))}switch(t=n.stateNode,n.tag){case 5:var r=!1;break;case 3:case 4:t=t.containerInfo,r=!0;break;default:throw Error(a(161))}16&n.effectTag&&(Ue(t,""),n.effectTag&=-17);e:t:for(n=e;;){for(;null===n.sibling;){if(null===n.return||ls(n.return)){n=null;break e}n=n.return}for(n.sibling.return=n.return,n=n.sibling;5!==n.tag&&6!==n.tag&&18!==n.tag;){if(2&n.effectTag)continue t;if(null===n.child||4===n.tag)continue t;n.child.return=n,n=n.child}if(!(2&n.effectTag)){n=n.stateNode;break e}}r?function e(t,n,r){var o=t.tag,i=5===o||6===o;if(i)t=i?t.stateNode:t.stateNode.instance,n?8===r.nodeType?r.parentNode.insertBefore(t,n):r.insertBefore(t,n):(8===r.nodeType?(n=r.parentNode).insertBefore(t,r):(n=r).appendChild(t),null!==(r=r._reactRootContainer)&&void 0!==r||null!==n.onclick||(n.onclick=cn));else if(4!==o&&null!==(t=t.child))for(e(t,n,r),t=t.sibling;null!==t;)e(t,n,r),t=t.sibling}(e,n,t):function e(t,n,r){var o=t.tag,i=5===o||6===o;if(i)t=i?t.stateNode:t.stateNode.instance,n?r.insertBefore(t,n):r.appendChild(t);else if(4!==o&&null!==(t=t.child))for(e(t,n,r),t=t.sibling;null!==t;)e(t,n,r),t=t.sibling}(e,n,t)}function us(e,t,n){for(var r,o,i=t,s=!1;;){if(!s){s=i.return;e:for(;;){if(null===s)throw Error(a(160));switch(r=s.stateNode,s.tag){case 5:o=!1;break e;case 3:case 4:r=r.containerInfo,o=!0;break e}s=s.return}s=!0}if(5===i.tag||6===i.tag){e:for(var l=e,c=i,u=n,p=c;;)if(as(l,p,u),null!==p.child&&4!==p.tag)p.child.return=p,p=p.child;else{if(p===c)break e;for(;null===p.sibling;){if(null===p.return||p.return===c)break e;p=p.return}p.sibling.return=p.return,p=p.sibling}o?(l=r,c=i.stateNode,8===l.nodeType?l.parentNode.removeChild(c):l.removeChild(c)):r.removeChild(i.stateNode)}else if(4===i.tag){if(null!==i.child){r=i.stateNode.containerInfo,o=!0,i.child.return=i,i=i.child;continue}}else if(as(e,i,n),null!==i.child){i.child.return=i,i=i.child;continue}if(i===t)break;for(;null===i.sibling;){if(null===i.return||i.return===t)return;4===(i=i.return).tag&&(s=!1)}i.sibling.return=i.return,i=i.sibling}}function ps(e,t){switch(t.tag){case 0:case 11:case 14:case 15:case 22:return void rs(3,t);case 1:return;case 5:var n=t.stateNode;if(null!=n){var r=t.memoizedProps,o=null!==e?e.memoizedProps:r;e=t.type;var i=t.updateQueue;if(t.updateQueue=null,null!==i){for(n[_n]=r,"input"===e&&"radio"===r.type&&null!=r.name&&Ee(n,r),an(e,o),t=an(e,r),o=0;o<i.length;o+=2){var s=i[o],l=i[o+1];"style"===s?nn(n,l):"dangerouslySetInnerHTML"===s?ze(n,l):"children"===s?Ue(n,l):K(n,s,l,t)}switch(e){case"input":_e(n,r);break;case"textarea":Pe(n,r);break;case"select":t=n._wrapperState.wasMultiple,n._wrapperState.wasMultiple=!!r.multiple,null!=(e=r.value)?Ae(n,!!r.multiple,e,!1):t!==!!r.multiple&&(null!=r.defaultValue?Ae(n,!!r.multiple,r.defaultValue,!0):Ae(n,!!r.multiple,r.multiple?[]:"",!1))}}}return;case 6:if(null===t.stateNode)throw Error(a(162));return void(t.stateNode.nodeValue=t.memoizedProps);case 3:return void((t=t.stateNode).hydrate&&(t.hydrate=!1,Mt(t.containerInfo)));case 12:return;case 13:if(n=t,null===t.memoizedState?r=!1:(r=!0,n=t.child,Ns=Uo()),null!==n)e:for(e=n;;){if(5===e.tag)i=e.stateNode,r?"function"==typeof(i=i.style).setProperty?i.setProperty("display","none","important"):i.display="none":(i=e.stateNode,o=null!=(o=e.memoizedProps.style)&&o.hasOwnProperty("display")?o.display:null,i.style.display=tn("display",o));else if(6===e.tag)e.stateNode.nodeValue=r?"":e.memoizedProps;else{if(13===e.tag&&null!==e.memoizedState&&null===e.memoizedState.dehydrated){(i=e.child.sibling).return=e,e=i;continue}if(null!==e.child){e.child.return=e,e=e.child;continue}}if(e===n)break;for(;null===e.sibling;){if(null===e.return||e.return===n)break e;e=e.return}e.sibling.return=e.return,e=e.sibling}return void fs(t);case 19:return void fs(t);case 17:return}throw Error(a(163))}function fs(e){var t=e.updateQueue;if(null!==t){e.updateQueue=null;var n=e.stateNode;null===n&&(n=e.stateNode=new Za),t.forEach((function(t){var r=xl.bind(null,e,t);n.has(t)||(n.add(t),t.then(r,r))}))}}var ds="function"==typeof WeakMap?WeakMap:Map;function hs(e,t,n){(n=li(n,null)).tag=3,n.payload={element:null};var r=t.value;return n.callback=function(){Ms||(Ms=!0,Ds=r),es(e,t)},n}function ms(e,t,n){(n=li(n,null)).tag=3;var r=e.type.getDerivedStateFromError;if("function"==typeof r){var o=t.value;n.payload=function(){return es(e,t),r(o)}}var i=e.stateNode;return null!==i&&"function"==typeof i.componentDidCatch&&(n.callback=function(){"function"!=typeof r&&(null===Fs?Fs=new Set([this]):Fs.add(this),es(e,t));var n=t.stack;this.componentDidCatch(t.value,{componentStack:null!==n?n:""})}),n}var gs,ys=Math.ceil,vs=X.ReactCurrentDispatcher,bs=X.ReactCurrentOwner,xs=0,ws=3,ks=4,Os=0,Es=null,_s=null,Ss=0,Ts=xs,js=null,As=1073741823,Cs=1073741823,Is=null,Ps=0,Rs=!1,Ns=0,Ls=null,Ms=!1,Ds=null,Fs=null,zs=!1,Us=null,Bs=90,$s=null,Ws=0,qs=null,Hs=0;function Vs(){return 0!=(48&Os)?1073741821-(Uo()/10|0):0!==Hs?Hs:Hs=1073741821-(Uo()/10|0)}function Ys(e,t,n){if(0==(2&(t=t.mode)))return 1073741823;var r=Bo();if(0==(4&t))return 99===r?1073741823:1073741822;if(0!=(16&Os))return Ss;if(null!==n)e=Go(e,0|n.timeoutMs||5e3,250);else switch(r){case 99:e=1073741823;break;case 98:e=Go(e,150,100);break;case 97:case 96:e=Go(e,5e3,250);break;case 95:e=2;break;default:throw Error(a(326))}return null!==Es&&e===Ss&&--e,e}function Gs(e,t){if(50<Ws)throw Ws=0,qs=null,Error(a(185));if(null!==(e=Qs(e,t))){var n=Bo();1073741823===t?0!=(8&Os)&&0==(48&Os)?Zs(e):(Ks(e),0===Os&&Vo()):Ks(e),0==(4&Os)||98!==n&&99!==n||(null===$s?$s=new Map([[e,t]]):(void 0===(n=$s.get(e))||n>t)&&$s.set(e,t))}}function Qs(e,t){e.expirationTime<t&&(e.expirationTime=t);var n=e.alternate;null!==n&&n.expirationTime<t&&(n.expirationTime=t);var r=e.return,o=null;if(null===r&&3===e.tag)o=e.stateNode;else for(;null!==r;){if(n=r.alternate,r.childExpirationTime<t&&(r.childExpirationTime=t),null!==n&&n.childExpirationTime<t&&(n.childExpirationTime=t),null===r.return&&3===r.tag){o=r.stateNode;break}r=r.return}return null!==o&&(Es===o&&(al(t),Ts===ks&&Rl(o,Ss)),Nl(o,t)),o}function Xs(e){var t=e.lastExpiredTime;if(0!==t)return t;if(!Pl(e,t=e.firstPendingTime))return t;var n=e.lastPingedTime;return 2>=(e=n>(e=e.nextKnownPendingLevel)?n:e)&&t!==e?0:e}function Ks(e){if(0!==e.lastExpiredTime)e.callbackExpirationTime=1073741823,e.callbackPriority=99,e.callbackNode=Ho(Zs.bind(null,e));else{var t=Xs(e),n=e.callbackNode;if(0===t)null!==n&&(e.callbackNode=null,e.callbackExpirationTime=0,e.callbackPriority=90);else{var r=Vs();if(1073741823===t?r=99:1===t||2===t?r=95:r=0>=(r=10*(1073741821-t)-10*(1073741821-r))?99:250>=r?98:5250>=r?97:95,null!==n){var o=e.callbackPriority;if(e.callbackExpirationTime===t&&o>=r)return;n!==Ro&&Eo(n)}e.callbackExpirationTime=t,e.callbackPriority=r,t=1073741823===t?Ho(Zs.bind(null,e)):qo(r,Js.bind(null,e),{timeout:10*(1073741821-t)-Uo()}),e.callbackNode=t}}}function Js(e,t){if(Hs=0,t)return Ll(e,t=Vs()),Ks(e),null;var n=Xs(e);if(0!==n){if(t=e.callbackNode,0!=(48&Os))throw Error(a(327));if(ml(),e===Es&&n===Ss||nl(e,n),null!==_s){var r=Os;Os|=16;for(var o=ol();;)try{ll();break}catch(t){rl(e,t)}if(ei(),Os=r,vs.current=o,1===Ts)throw t=js,nl(e,n),Rl(e,n),Ks(e),t;if(null===_s)switch(o=e.finishedWork=e.current.alternate,e.finishedExpirationTime=n,r=Ts,Es=null,r){case xs:case 1:throw Error(a(345));case 2:Ll(e,2<n?2:n);break;case ws:if(Rl(e,n),n===(r=e.lastSuspendedTime)&&(e.nextKnownPendingLevel=pl(o)),1073741823===As&&10<(o=Ns+500-Uo())){if(Rs){var i=e.lastPingedTime;if(0===i||i>=n){e.lastPingedTime=n,nl(e,n);break}}if(0!==(i=Xs(e))&&i!==n)break;if(0!==r&&r!==n){e.lastPingedTime=r;break}e.timeoutHandle=bn(fl.bind(null,e),o);break}fl(e);break;case ks:if(Rl(e,n),n===(r=e.lastSuspendedTime)&&(e.nextKnownPendingLevel=pl(o)),Rs&&(0===(o=e.lastPingedTime)||o>=n)){e.lastPingedTime=n,nl(e,n);break}if(0!==(o=Xs(e))&&o!==n)break;if(0!==r&&r!==n){e.lastPingedTime=r;break}if(1073741823!==Cs?r=10*(1073741821-Cs)-Uo():1073741823===As?r=0:(r=10*(1073741821-As)-5e3,0>(r=(o=Uo())-r)&&(r=0),(n=10*(1073741821-n)-o)<(r=(120>r?120:480>r?480:1080>r?1080:1920>r?1920:3e3>r?3e3:4320>r?4320:1960*ys(r/1960))-r)&&(r=n)),10<r){e.timeoutHandle=bn(fl.bind(null,e),r);break}fl(e);break;case 5:if(1073741823!==As&&null!==Is){i=As;var s=Is;if(0>=(r=0|s.busyMinDurationMs)?r=0:(o=0|s.busyDelayMs,r=(i=Uo()-(10*(1073741821-i)-(0|s.timeoutMs||5e3)))<=o?0:o+r-i),10<r){Rl(e,n),e.timeoutHandle=bn(fl.bind(null,e),r);break}}fl(e);break;default:throw Error(a(329))}if(Ks(e),e.callbackNode===t)return Js.bind(null,e)}}return null}function Zs(e){var t=e.lastExpiredTime;if(t=0!==t?t:1073741823,0!=(48&Os))throw Error(a(327));if(ml(),e===Es&&t===Ss||nl(e,t),null!==_s){var n=Os;Os|=16;for(var r=ol();;)try{sl();break}catch(t){rl(e,t)}if(ei(),Os=n,vs.current=r,1===Ts)throw n=js,nl(e,t),Rl(e,t),Ks(e),n;if(null!==_s)throw Error(a(261));e.finishedWork=e.current.alternate,e.finishedExpirationTime=t,Es=null,fl(e),Ks(e)}return null}function el(e,t){var n=Os;Os|=1;try{return e(t)}finally{0===(Os=n)&&Vo()}}function tl(e,t){var n=Os;Os&=-2,Os|=8;try{return e(t)}finally{0===(Os=n)&&Vo()}}function nl(e,t){e.finishedWork=null,e.finishedExpirationTime=0;var n=e.timeoutHandle;if(-1!==n&&(e.timeoutHandle=-1,xn(n)),null!==_s)for(n=_s.return;null!==n;){var r=n;switch(r.tag){case 1:null!=(r=r.type.childContextTypes)&&yo();break;case 3:Ri(),lo(fo),lo(po);break;case 5:Li(r);break;case 4:Ri();break;case 13:case 19:lo(Mi);break;case 10:ti(r)}n=n.return}Es=e,_s=Sl(e.current,null),Ss=t,Ts=xs,js=null,Cs=As=1073741823,Is=null,Ps=0,Rs=!1}function rl(e,t){for(;;){try{if(ei(),zi.current=ga,Hi)for(var n=$i.memoizedState;null!==n;){var r=n.queue;null!==r&&(r.pending=null),n=n.next}if(Bi=0,qi=Wi=$i=null,Hi=!1,null===_s||null===_s.return)return Ts=1,js=t,_s=null;e:{var o=e,i=_s.return,a=_s,s=t;if(t=Ss,a.effectTag|=2048,a.firstEffect=a.lastEffect=null,null!==s&&"object"==typeof s&&"function"==typeof s.then){var l=s;if(0==(2&a.mode)){var c=a.alternate;c?(a.updateQueue=c.updateQueue,a.memoizedState=c.memoizedState,a.expirationTime=c.expirationTime):(a.updateQueue=null,a.memoizedState=null)}var u=0!=(1&Mi.current),p=i;do{var f;if(f=13===p.tag){var d=p.memoizedState;if(null!==d)f=null!==d.dehydrated;else{var h=p.memoizedProps;f=void 0!==h.fallback&&(!0!==h.unstable_avoidThisFallback||!u)}}if(f){var m=p.updateQueue;if(null===m){var g=new Set;g.add(l),p.updateQueue=g}else m.add(l);if(0==(2&p.mode)){if(p.effectTag|=64,a.effectTag&=-2981,1===a.tag)if(null===a.alternate)a.tag=17;else{var y=li(1073741823,null);y.tag=2,ci(a,y)}a.expirationTime=1073741823;break e}s=void 0,a=t;var v=o.pingCache;if(null===v?(v=o.pingCache=new ds,s=new Set,v.set(l,s)):void 0===(s=v.get(l))&&(s=new Set,v.set(l,s)),!s.has(a)){s.add(a);var b=bl.bind(null,o,l,a);l.then(b,b)}p.effectTag|=4096,p.expirationTime=t;break e}p=p.return}while(null!==p);s=Error((ge(a.type)||"A React component")+" suspended while rendering, but no fallback UI was specified.\n\nAdd a <Suspense fallback=...> component higher in the tree to provide a loading indicator or placeholder to display."+ye(a))}5!==Ts&&(Ts=2),s=Ja(s,a),p=i;do{switch(p.tag){case 3:l=s,p.effectTag|=4096,p.expirationTime=t,ui(p,hs(p,l,t));break e;case 1:l=s;var x=p.type,w=p.stateNode;if(0==(64&p.effectTag)&&("function"==typeof x.getDerivedStateFromError||null!==w&&"function"==typeof w.componentDidCatch&&(null===Fs||!Fs.has(w)))){p.effectTag|=4096,p.expirationTime=t,ui(p,ms(p,l,t));break e}}p=p.return}while(null!==p)}_s=ul(_s)}catch(e){t=e;continue}break}}function ol(){var e=vs.current;return vs.current=ga,null===e?ga:e}function il(e,t){e<As&&2<e&&(As=e),null!==t&&e<Cs&&2<e&&(Cs=e,Is=t)}function al(e){e>Ps&&(Ps=e)}function sl(){for(;null!==_s;)_s=cl(_s)}function ll(){for(;null!==_s&&!No();)_s=cl(_s)}function cl(e){var t=gs(e.alternate,e,Ss);return e.memoizedProps=e.pendingProps,null===t&&(t=ul(e)),bs.current=null,t}function ul(e){_s=e;do{var t=_s.alternate;if(e=_s.return,0==(2048&_s.effectTag)){if(t=Xa(t,_s,Ss),1===Ss||1!==_s.childExpirationTime){for(var n=0,r=_s.child;null!==r;){var o=r.expirationTime,i=r.childExpirationTime;o>n&&(n=o),i>n&&(n=i),r=r.sibling}_s.childExpirationTime=n}if(null!==t)return t;null!==e&&0==(2048&e.effectTag)&&(null===e.firstEffect&&(e.firstEffect=_s.firstEffect),null!==_s.lastEffect&&(null!==e.lastEffect&&(e.lastEffect.nextEffect=_s.firstEffect),e.lastEffect=_s.lastEffect),1<_s.effectTag&&(null!==e.lastEffect?e.lastEffect.nextEffect=_s:e.firstEffect=_s,e.lastEffect=_s))}else{if(null!==(t=Ka(_s)))return t.effectTag&=2047,t;null!==e&&(e.firstEffect=e.lastEffect=null,e.effectTag|=2048)}if(null!==(t=_s.sibling))return t;_s=e}while(null!==_s);return Ts===xs&&(Ts=5),null}function pl(e){var t=e.expirationTime;return t>(e=e.childExpirationTime)?t:e}function fl(e){var t=Bo();return Wo(99,dl.bind(null,e,t)),null}function dl(e,t){do{ml()}while(null!==Us);if(0!=(48&Os))throw Error(a(327));var n=e.finishedWork,r=e.finishedExpirationTime;if(null===n)return null;if(e.finishedWork=null,e.finishedExpirationTime=0,n===e.current)throw Error(a(177));e.callbackNode=null,e.callbackExpirationTime=0,e.callbackPriority=90,e.nextKnownPendingLevel=0;var o=pl(n);if(e.firstPendingTime=o,r<=e.lastSuspendedTime?e.firstSuspendedTime=e.lastSuspendedTime=e.nextKnownPendingLevel=0:r<=e.firstSuspendedTime&&(e.firstSuspendedTime=r-1),r<=e.lastPingedTime&&(e.lastPingedTime=0),r<=e.lastExpiredTime&&(e.lastExpiredTime=0),e===Es&&(_s=Es=null,Ss=0),1<n.effectTag?null!==n.lastEffect?(n.lastEffect.nextEffect=n,o=n.firstEffect):o=n:o=n.firstEffect,null!==o){var i=Os;Os|=32,bs.current=null,mn=Vt;var s=dn();if(hn(s)){if("selectionStart"in s)var l={start:s.selectionStart,end:s.selectionEnd};else e:{var c=(l=(l=s.ownerDocument)&&l.defaultView||window).getSelection&&l.getSelection();if(c&&0!==c.rangeCount){l=c.anchorNode;var u=c.anchorOffset,p=c.focusNode;c=c.focusOffset;try{l.nodeType,p.nodeType}catch(e){l=null;break e}var f=0,d=-1,h=-1,m=0,g=0,y=s,v=null;t:for(;;){for(var b;y!==l||0!==u&&3!==y.nodeType||(d=f+u),y!==p||0!==c&&3!==y.nodeType||(h=f+c),3===y.nodeType&&(f+=y.nodeValue.length),null!==(b=y.firstChild);)v=y,y=b;for(;;){if(y===s)break t;if(v===l&&++m===u&&(d=f),v===p&&++g===c&&(h=f),null!==(b=y.nextSibling))break;v=(y=v).parentNode}y=b}l=-1===d||-1===h?null:{start:d,end:h}}else l=null}l=l||{start:0,end:0}}else l=null;gn={activeElementDetached:null,focusedElem:s,selectionRange:l},Vt=!1,Ls=o;do{try{hl()}catch(e){if(null===Ls)throw Error(a(330));vl(Ls,e),Ls=Ls.nextEffect}}while(null!==Ls);Ls=o;do{try{for(s=e,l=t;null!==Ls;){var x=Ls.effectTag;if(16&x&&Ue(Ls.stateNode,""),128&x){var w=Ls.alternate;if(null!==w){var k=w.ref;null!==k&&("function"==typeof k?k(null):k.current=null)}}switch(1038&x){case 2:cs(Ls),Ls.effectTag&=-3;break;case 6:cs(Ls),Ls.effectTag&=-3,ps(Ls.alternate,Ls);break;case 1024:Ls.effectTag&=-1025;break;case 1028:Ls.effectTag&=-1025,ps(Ls.alternate,Ls);break;case 4:ps(Ls.alternate,Ls);break;case 8:us(s,u=Ls,l),ss(u)}Ls=Ls.nextEffect}}catch(e){if(null===Ls)throw Error(a(330));vl(Ls,e),Ls=Ls.nextEffect}}while(null!==Ls);if(k=gn,w=dn(),x=k.focusedElem,l=k.selectionRange,w!==x&&x&&x.ownerDocument&&function e(t,n){return!(!t||!n)&&(t===n||(!t||3!==t.nodeType)&&(n&&3===n.nodeType?e(t,n.parentNode):"contains"in t?t.contains(n):!!t.compareDocumentPosition&&!!(16&t.compareDocumentPosition(n))))}(x.ownerDocument.documentElement,x)){null!==l&&hn(x)&&(w=l.start,void 0===(k=l.end)&&(k=w),"selectionStart"in x?(x.selectionStart=w,x.selectionEnd=Math.min(k,x.value.length)):(k=(w=x.ownerDocument||document)&&w.defaultView||window).getSelection&&(k=k.getSelection(),u=x.textContent.length,s=Math.min(l.start,u),l=void 0===l.end?s:Math.min(l.end,u),!k.extend&&s>l&&(u=l,l=s,s=u),u=fn(x,s),p=fn(x,l),u&&p&&(1!==k.rangeCount||k.anchorNode!==u.node||k.anchorOffset!==u.offset||k.focusNode!==p.node||k.focusOffset!==p.offset)&&((w=w.createRange()).setStart(u.node,u.offset),k.removeAllRanges(),s>l?(k.addRange(w),k.extend(p.node,p.offset)):(w.setEnd(p.node,p.offset),k.addRange(w))))),w=[];for(k=x;k=k.parentNode;)1===k.nodeType&&w.push({element:k,left:k.scrollLeft,top:k.scrollTop});for("function"==typeof x.focus&&x.focus(),x=0;x<w.length;x++)(k=w[x]).element.scrollLeft=k.left,k.element.scrollTop=k.top}Vt=!!mn,gn=mn=null,e.current=n,Ls=o;do{try{for(x=e;null!==Ls;){var O=Ls.effectTag;if(36&O&&is(x,Ls.alternate,Ls),128&O){w=void 0;var E=Ls.ref;if(null!==E){var _=Ls.stateNode;switch(Ls.tag){case 5:w=_;break;default:w=_}"function"==typeof E?E(w):E.current=w}}Ls=Ls.nextEffect}}catch(e){if(null===Ls)throw Error(a(330));vl(Ls,e),Ls=Ls.nextEffect}}while(null!==Ls);Ls=null,Lo(),Os=i}else e.current=n;if(zs)zs=!1,Us=e,Bs=t;else for(Ls=o;null!==Ls;)t=Ls.nextEffect,Ls.nextEffect=null,Ls=t;if(0===(t=e.firstPendingTime)&&(Fs=null),1073741823===t?e===qs?Ws++:(Ws=0,qs=e):Ws=0,"function"==typeof wl&&wl(n.stateNode,r),Ks(e),Ms)throw Ms=!1,e=Ds,Ds=null,e;return 0!=(8&Os)||Vo(),null}function hl(){for(;null!==Ls;){var e=Ls.effectTag;0!=(256&e)&&ns(Ls.alternate,Ls),0==(512&e)||zs||(zs=!0,qo(97,(function(){return ml(),null}))),Ls=Ls.nextEffect}}function ml(){if(90!==Bs){var e=97<Bs?97:Bs;return Bs=90,Wo(e,gl)}}function gl(){if(null===Us)return!1;var e=Us;if(Us=null,0!=(48&Os))throw Error(a(331));var t=Os;for(Os|=32,e=e.current.firstEffect;null!==e;){try{var n=e;if(0!=(512&n.effectTag))switch(n.tag){case 0:case 11:case 15:case 22:rs(5,n),os(5,n)}}catch(t){if(null===e)throw Error(a(330));vl(e,t)}n=e.nextEffect,e.nextEffect=null,e=n}return Os=t,Vo(),!0}function yl(e,t,n){ci(e,t=hs(e,t=Ja(n,t),1073741823)),null!==(e=Qs(e,1073741823))&&Ks(e)}function vl(e,t){if(3===e.tag)yl(e,e,t);else for(var n=e.return;null!==n;){if(3===n.tag){yl(n,e,t);break}if(1===n.tag){var r=n.stateNode;if("function"==typeof n.type.getDerivedStateFromError||"function"==typeof r.componentDidCatch&&(null===Fs||!Fs.has(r))){ci(n,e=ms(n,e=Ja(t,e),1073741823)),null!==(n=Qs(n,1073741823))&&Ks(n);break}}n=n.return}}function bl(e,t,n){var r=e.pingCache;null!==r&&r.delete(t),Es===e&&Ss===n?Ts===ks||Ts===ws&&1073741823===As&&Uo()-Ns<500?nl(e,Ss):Rs=!0:Pl(e,n)&&(0!==(t=e.lastPingedTime)&&t<n||(e.lastPingedTime=n,Ks(e)))}function xl(e,t){var n=e.stateNode;null!==n&&n.delete(t),0===(t=0)&&(t=Ys(t=Vs(),e,null)),null!==(e=Qs(e,t))&&Ks(e)}gs=function(e,t,n){var r=t.expirationTime;if(null!==e){var o=t.pendingProps;if(e.memoizedProps!==o||fo.current)Ca=!0;else{if(r<n){switch(Ca=!1,t.tag){case 3:za(t),ja();break;case 5:if(Ni(t),4&t.mode&&1!==n&&o.hidden)return t.expirationTime=t.childExpirationTime=1,null;break;case 1:go(t.type)&&xo(t);break;case 4:Pi(t,t.stateNode.containerInfo);break;case 10:r=t.memoizedProps.value,o=t.type._context,co(Xo,o._currentValue),o._currentValue=r;break;case 13:if(null!==t.memoizedState)return 0!==(r=t.child.childExpirationTime)&&r>=n?qa(e,t,n):(co(Mi,1&Mi.current),null!==(t=Ga(e,t,n))?t.sibling:null);co(Mi,1&Mi.current);break;case 19:if(r=t.childExpirationTime>=n,0!=(64&e.effectTag)){if(r)return Ya(e,t,n);t.effectTag|=64}if(null!==(o=t.memoizedState)&&(o.rendering=null,o.tail=null),co(Mi,Mi.current),!r)return null}return Ga(e,t,n)}Ca=!1}}else Ca=!1;switch(t.expirationTime=0,t.tag){case 2:if(r=t.type,null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),e=t.pendingProps,o=mo(t,po.current),ri(t,n),o=Gi(null,t,r,e,o,n),t.effectTag|=1,"object"==typeof o&&null!==o&&"function"==typeof o.render&&void 0===o.$$typeof){if(t.tag=1,t.memoizedState=null,t.updateQueue=null,go(r)){var i=!0;xo(t)}else i=!1;t.memoizedState=null!==o.state&&void 0!==o.state?o.state:null,ai(t);var s=r.getDerivedStateFromProps;"function"==typeof s&&mi(t,r,s,e),o.updater=gi,t.stateNode=o,o._reactInternalFiber=t,xi(t,r,e,n),t=Fa(null,t,r,!0,i,n)}else t.tag=0,Ia(null,t,o,n),t=t.child;return t;case 16:e:{if(o=t.elementType,null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),e=t.pendingProps,function(e){if(-1===e._status){e._status=0;var t=e._ctor;t=t(),e._result=t,t.then((function(t){0===e._status&&(t=t.default,e._status=1,e._result=t)}),(function(t){0===e._status&&(e._status=2,e._result=t)}))}}(o),1!==o._status)throw o._result;switch(o=o._result,t.type=o,i=t.tag=function(e){if("function"==typeof e)return _l(e)?1:0;if(null!=e){if((e=e.$$typeof)===le)return 11;if(e===pe)return 14}return 2}(o),e=Qo(o,e),i){case 0:t=Ma(null,t,o,e,n);break e;case 1:t=Da(null,t,o,e,n);break e;case 11:t=Pa(null,t,o,e,n);break e;case 14:t=Ra(null,t,o,Qo(o.type,e),r,n);break e}throw Error(a(306,o,""))}return t;case 0:return r=t.type,o=t.pendingProps,Ma(e,t,r,o=t.elementType===r?o:Qo(r,o),n);case 1:return r=t.type,o=t.pendingProps,Da(e,t,r,o=t.elementType===r?o:Qo(r,o),n);case 3:if(za(t),r=t.updateQueue,null===e||null===r)throw Error(a(282));if(r=t.pendingProps,o=null!==(o=t.memoizedState)?o.element:null,si(e,t),pi(t,r,null,n),(r=t.memoizedState.element)===o)ja(),t=Ga(e,t,n);else{if((o=t.stateNode.hydrate)&&(wa=wn(t.stateNode.containerInfo.firstChild),xa=t,o=ka=!0),o)for(n=Si(t,null,r,n),t.child=n;n;)n.effectTag=-3&n.effectTag|1024,n=n.sibling;else Ia(e,t,r,n),ja();t=t.child}return t;case 5:return Ni(t),null===e&&_a(t),r=t.type,o=t.pendingProps,i=null!==e?e.memoizedProps:null,s=o.children,vn(r,o)?s=null:null!==i&&vn(r,i)&&(t.effectTag|=16),La(e,t),4&t.mode&&1!==n&&o.hidden?(t.expirationTime=t.childExpirationTime=1,t=null):(Ia(e,t,s,n),t=t.child),t;case 6:return null===e&&_a(t),null;case 13:return qa(e,t,n);case 4:return Pi(t,t.stateNode.containerInfo),r=t.pendingProps,null===e?t.child=_i(t,null,r,n):Ia(e,t,r,n),t.child;case 11:return r=t.type,o=t.pendingProps,Pa(e,t,r,o=t.elementType===r?o:Qo(r,o),n);case 7:return Ia(e,t,t.pendingProps,n),t.child;case 8:case 12:return Ia(e,t,t.pendingProps.children,n),t.child;case 10:e:{r=t.type._context,o=t.pendingProps,s=t.memoizedProps,i=o.value;var l=t.type._context;if(co(Xo,l._currentValue),l._currentValue=i,null!==s)if(l=s.value,0===(i=Dr(l,i)?0:0|("function"==typeof r._calculateChangedBits?r._calculateChangedBits(l,i):1073741823))){if(s.children===o.children&&!fo.current){t=Ga(e,t,n);break e}}else for(null!==(l=t.child)&&(l.return=t);null!==l;){var c=l.dependencies;if(null!==c){s=l.child;for(var u=c.firstContext;null!==u;){if(u.context===r&&0!=(u.observedBits&i)){1===l.tag&&((u=li(n,null)).tag=2,ci(l,u)),l.expirationTime<n&&(l.expirationTime=n),null!==(u=l.alternate)&&u.expirationTime<n&&(u.expirationTime=n),ni(l.return,n),c.expirationTime<n&&(c.expirationTime=n);break}u=u.next}}else s=10===l.tag&&l.type===t.type?null:l.child;if(null!==s)s.return=l;else for(s=l;null!==s;){if(s===t){s=null;break}if(null!==(l=s.sibling)){l.return=s.return,s=l;break}s=s.return}l=s}Ia(e,t,o.children,n),t=t.child}return t;case 9:return o=t.type,r=(i=t.pendingProps).children,ri(t,n),r=r(o=oi(o,i.unstable_observedBits)),t.effectTag|=1,Ia(e,t,r,n),t.child;case 14:return i=Qo(o=t.type,t.pendingProps),Ra(e,t,o,i=Qo(o.type,i),r,n);case 15:return Na(e,t,t.type,t.pendingProps,r,n);case 17:return r=t.type,o=t.pendingProps,o=t.elementType===r?o:Qo(r,o),null!==e&&(e.alternate=null,t.alternate=null,t.effectTag|=2),t.tag=1,go(r)?(e=!0,xo(t)):e=!1,ri(t,n),vi(t,r,o),xi(t,r,o,n),Fa(null,t,r,!0,e,n);case 19:return Ya(e,t,n)}throw Error(a(156,t.tag))};var wl=null,kl=null;function Ol(e,t,n,r){this.tag=e,this.key=n,this.sibling=this.child=this.return=this.stateNode=this.type=this.elementType=null,this.index=0,this.ref=null,this.pendingProps=t,this.dependencies=this.memoizedState=this.updateQueue=this.memoizedProps=null,this.mode=r,this.effectTag=0,this.lastEffect=this.firstEffect=this.nextEffect=null,this.childExpirationTime=this.expirationTime=0,this.alternate=null}function El(e,t,n,r){return new Ol(e,t,n,r)}function _l(e){return!(!(e=e.prototype)||!e.isReactComponent)}function Sl(e,t){var n=e.alternate;return null===n?((n=El(e.tag,t,e.key,e.mode)).elementType=e.elementType,n.type=e.type,n.stateNode=e.stateNode,n.alternate=e,e.alternate=n):(n.pendingProps=t,n.effectTag=0,n.nextEffect=null,n.firstEffect=null,n.lastEffect=null),n.childExpirationTime=e.childExpirationTime,n.expirationTime=e.expirationTime,n.child=e.child,n.memoizedProps=e.memoizedProps,n.memoizedState=e.memoizedState,n.updateQueue=e.updateQueue,t=e.dependencies,n.dependencies=null===t?null:{expirationTime:t.expirationTime,firstContext:t.firstContext,responders:t.responders},n.sibling=e.sibling,n.index=e.index,n.ref=e.ref,n}function Tl(e,t,n,r,o,i){var s=2;if(r=e,"function"==typeof e)_l(e)&&(s=1);else if("string"==typeof e)s=5;else e:switch(e){case ne:return jl(n.children,o,i,t);case se:s=8,o|=7;break;case re:s=8,o|=1;break;case oe:return(e=El(12,n,t,8|o)).elementType=oe,e.type=oe,e.expirationTime=i,e;case ce:return(e=El(13,n,t,o)).type=ce,e.elementType=ce,e.expirationTime=i,e;case ue:return(e=El(19,n,t,o)).elementType=ue,e.expirationTime=i,e;default:if("object"==typeof e&&null!==e)switch(e.$$typeof){case ie:s=10;break e;case ae:s=9;break e;case le:s=11;break e;case pe:s=14;break e;case fe:s=16,r=null;break e;case de:s=22;break e}throw Error(a(130,null==e?e:typeof e,""))}return(t=El(s,n,t,o)).elementType=e,t.type=r,t.expirationTime=i,t}function jl(e,t,n,r){return(e=El(7,e,r,t)).expirationTime=n,e}function Al(e,t,n){return(e=El(6,e,null,t)).expirationTime=n,e}function Cl(e,t,n){return(t=El(4,null!==e.children?e.children:[],e.key,t)).expirationTime=n,t.stateNode={containerInfo:e.containerInfo,pendingChildren:null,implementation:e.implementation},t}function Il(e,t,n){this.tag=t,this.current=null,this.containerInfo=e,this.pingCache=this.pendingChildren=null,this.finishedExpirationTime=0,this.finishedWork=null,this.timeoutHandle=-1,this.pendingContext=this.context=null,this.hydrate=n,this.callbackNode=null,this.callbackPriority=90,this.lastExpiredTime=this.lastPingedTime=this.nextKnownPendingLevel=this.lastSuspendedTime=this.firstSuspendedTime=this.firstPendingTime=0}function Pl(e,t){var n=e.firstSuspendedTime;return e=e.lastSuspendedTime,0!==n&&n>=t&&e<=t}function Rl(e,t){var n=e.firstSuspendedTime,r=e.lastSuspendedTime;n<t&&(e.firstSuspendedTime=t),(r>t||0===n)&&(e.lastSuspendedTime=t),t<=e.lastPingedTime&&(e.lastPingedTime=0),t<=e.lastExpiredTime&&(e.lastExpiredTime=0)}function Nl(e,t){t>e.firstPendingTime&&(e.firstPendingTime=t);var n=e.firstSuspendedTime;0!==n&&(t>=n?e.firstSuspendedTime=e.lastSuspendedTime=e.nextKnownPendingLevel=0:t>=e.lastSuspendedTime&&(e.lastSuspendedTime=t+1),t>e.nextKnownPendingLevel&&(e.nextKnownPendingLevel=t))}function Ll(e,t){var n=e.lastExpiredTime;(0===n||n>t)&&(e.lastExpiredTime=t)}function Ml(e,t,n,r){var o=t.current,i=Vs(),s=di.suspense;i=Ys(i,o,s);e:if(n){t:{if(Ze(n=n._reactInternalFiber)!==n||1!==n.tag)throw Error(a(170));var l=n;do{switch(l.tag){case 3:l=l.stateNode.context;break t;case 1:if(go(l.type)){l=l.stateNode.__reactInternalMemoizedMergedChildContext;break t}}l=l.return}while(null!==l);throw Error(a(171))}if(1===n.tag){var c=n.type;if(go(c)){n=bo(n,c,l);break e}}n=l}else n=uo;return null===t.context?t.context=n:t.pendingContext=n,(t=li(i,s)).payload={element:e},null!==(r=void 0===r?null:r)&&(t.callback=r),ci(o,t),Gs(o,i),i}function Dl(e){if(!(e=e.current).child)return null;switch(e.child.tag){case 5:default:return e.child.stateNode}}function Fl(e,t){null!==(e=e.memoizedState)&&null!==e.dehydrated&&e.retryTime<t&&(e.retryTime=t)}function zl(e,t){Fl(e,t),(e=e.alternate)&&Fl(e,t)}function Ul(e,t,n){var r=new Il(e,t,n=null!=n&&!0===n.hydrate),o=El(3,null,null,2===t?7:1===t?3:0);r.current=o,o.stateNode=r,ai(o),e[Sn]=r.current,n&&0!==t&&function(e,t){var n=Je(t);St.forEach((function(e){ht(e,t,n)})),Tt.forEach((function(e){ht(e,t,n)}))}(0,9===e.nodeType?e:e.ownerDocument),this._internalRoot=r}function Bl(e){return!(!e||1!==e.nodeType&&9!==e.nodeType&&11!==e.nodeType&&(8!==e.nodeType||" react-mount-point-unstable "!==e.nodeValue))}function $l(e,t,n,r,o){var i=n._reactRootContainer;if(i){var a=i._internalRoot;if("function"==typeof o){var s=o;o=function(){var e=Dl(a);s.call(e)}}Ml(t,a,e,o)}else{if(i=n._reactRootContainer=function(e,t){if(t||(t=!(!(t=e?9===e.nodeType?e.documentElement:e.firstChild:null)||1!==t.nodeType||!t.hasAttribute("data-reactroot"))),!t)for(var n;n=e.lastChild;)e.removeChild(n);return new Ul(e,0,t?{hydrate:!0}:void 0)}(n,r),a=i._internalRoot,"function"==typeof o){var l=o;o=function(){var e=Dl(a);l.call(e)}}tl((function(){Ml(t,a,e,o)}))}return Dl(a)}function Wl(e,t,n){var r=3<arguments.length&&void 0!==arguments[3]?arguments[3]:null;return{$$typeof:te,key:null==r?null:""+r,children:e,containerInfo:t,implementation:n}}function ql(e,t){var n=2<arguments.length&&void 0!==arguments[2]?arguments[2]:null;if(!Bl(t))throw Error(a(200));return Wl(e,t,null,n)}Ul.prototype.render=function(e){Ml(e,this._internalRoot,null,null)},Ul.prototype.unmount=function(){var e=this._internalRoot,t=e.containerInfo;Ml(null,e,null,(function(){t[Sn]=null}))},mt=function(e){if(13===e.tag){var t=Go(Vs(),150,100);Gs(e,t),zl(e,t)}},gt=function(e){13===e.tag&&(Gs(e,3),zl(e,3))},yt=function(e){if(13===e.tag){var t=Vs();Gs(e,t=Ys(t,e,null)),zl(e,t)}},j=function(e,t,n){switch(t){case"input":if(_e(e,n),t=n.name,"radio"===n.type&&null!=t){for(n=e;n.parentNode;)n=n.parentNode;for(n=n.querySelectorAll("input[name="+JSON.stringify(""+t)+'][type="radio"]'),t=0;t<n.length;t++){var r=n[t];if(r!==e&&r.form===e.form){var o=Cn(r);if(!o)throw Error(a(90));we(r),_e(r,o)}}}break;case"textarea":Pe(e,n);break;case"select":null!=(t=n.value)&&Ae(e,!!n.multiple,t,!1)}},N=el,L=function(e,t,n,r,o){var i=Os;Os|=4;try{return Wo(98,e.bind(null,t,n,r,o))}finally{0===(Os=i)&&Vo()}},M=function(){0==(49&Os)&&(function(){if(null!==$s){var e=$s;$s=null,e.forEach((function(e,t){Ll(t,e),Ks(t)})),Vo()}}(),ml())},D=function(e,t){var n=Os;Os|=2;try{return e(t)}finally{0===(Os=n)&&Vo()}};var Hl,Vl,Yl={Events:[jn,An,Cn,S,O,Dn,function(e){ot(e,Mn)},P,R,Kt,st,ml,{current:!1}]};Vl=(Hl={findFiberByHostInstance:Tn,bundleType:0,version:"16.13.1",rendererPackageName:"react-dom"}).findFiberByHostInstance,function(e){if("undefined"==typeof __REACT_DEVTOOLS_GLOBAL_HOOK__)return!1;var t=__REACT_DEVTOOLS_GLOBAL_HOOK__;if(t.isDisabled||!t.supportsFiber)return!0;try{var n=t.inject(e);wl=function(e){try{t.onCommitFiberRoot(n,e,void 0,64==(64&e.current.effectTag))}catch(e){}},kl=function(e){try{t.onCommitFiberUnmount(n,e)}catch(e){}}}catch(e){}}(o({},Hl,{overrideHookState:null,overrideProps:null,setSuspenseHandler:null,scheduleUpdate:null,currentDispatcherRef:X.ReactCurrentDispatcher,findHostInstanceByFiber:function(e){return null===(e=nt(e))?null:e.stateNode},findFiberByHostInstance:function(e){return Vl?Vl(e):null},findHostInstancesForRefresh:null,scheduleRefresh:null,scheduleRoot:null,setRefreshHandler:null,getCurrentFiber:null})),t.__SECRET_INTERNALS_DO_NOT_USE_OR_YOU_WILL_BE_FIRED=Yl,t.createPortal=ql,t.findDOMNode=function(e){if(null==e)return null;if(1===e.nodeType)return e;var t=e._reactInternalFiber;if(void 0===t){if("function"==typeof e.render)throw Error(a(188));throw Error(a(268,Object.keys(e)))}return e=null===(e=nt(t))?null:e.stateNode},t.flushSync=function(e,t){if(0!=(48&Os))throw Error(a(187));var n=Os;Os|=1;try{return Wo(99,e.bind(null,t))}finally{Os=n,Vo()}},t.hydrate=function(e,t,n){if(!Bl(t))throw Error(a(200));return $l(null,e,t,!0,n)},t.render=function(e,t,n){if(!Bl(t))throw Error(a(200));return $l(null,e,t,!1,n)},t.unmountComponentAtNode=function(e){if(!Bl(e))throw Error(a(40));return!!e._reactRootContainer&&(tl((function(){$l(null,null,e,!1,(function(){e._reactRootContainer=null,e[Sn]=null}))})),!0)},t.unstable_batchedUpdates=el,t.unstable_createPortal=function(e,t){return ql(e,t,2<arguments.length&&void 0!==arguments[2]?arguments[2]:null)},t.unstable_renderSubtreeIntoContainer=function(e,t,n,r){if(!Bl(n))throw Error(a(200));if(null==e||void 0===e._reactInternalFiber)throw Error(a(38));return $l(e,t,n,!1,r)},t.version="16.13.1"},function(e,t,n){"use strict";e.exports=n(226)},function(e,t,n){"use strict";
+/** @license React v0.19.1
+ * scheduler.production.min.js
+ *
+ * Copyright (c) Facebook, Inc. and its affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */var r,o,i,a,s;if("undefined"==typeof window||"function"!=typeof MessageChannel){var l=null,c=null,u=function(){if(null!==l)try{var e=t.unstable_now();l(!0,e),l=null}catch(e){throw setTimeout(u,0),e}},p=Date.now();t.unstable_now=function(){return Date.now()-p},r=function(e){null!==l?setTimeout(r,0,e):(l=e,setTimeout(u,0))},o=function(e,t){c=setTimeout(e,t)},i=function(){clearTimeout(c)},a=function(){return!1},s=t.unstable_forceFrameRate=function(){}}else{var f=window.performance,d=window.Date,h=window.setTimeout,m=window.clearTimeout;if("undefined"!=typeof console){var g=window.cancelAnimationFrame;"function"!=typeof window.requestAnimationFrame&&console.error("This browser doesn't support requestAnimationFrame. Make sure that you load a polyfill in older browsers. https://fb.me/react-polyfills"),"function"!=typeof g&&console.error("This browser doesn't support cancelAnimationFrame. Make sure that you load a polyfill in older browsers. https://fb.me/react-polyfills")}if("object"==typeof f&&"function"==typeof f.now)t.unstable_now=function(){return f.now()};else{var y=d.now();t.unstable_now=function(){return d.now()-y}}var v=!1,b=null,x=-1,w=5,k=0;a=function(){return t.unstable_now()>=k},s=function(){},t.unstable_forceFrameRate=function(e){0>e||125<e?console.error("forceFrameRate takes a positive int between 0 and 125, forcing framerates higher than 125 fps is not unsupported"):w=0<e?Math.floor(1e3/e):5};var O=new MessageChannel,E=O.port2;O.port1.onmessage=function(){if(null!==b){var e=t.unstable_now();k=e+w;try{b(!0,e)?E.postMessage(null):(v=!1,b=null)}catch(e){throw E.postMessage(null),e}}else v=!1},r=function(e){b=e,v||(v=!0,E.postMessage(null))},o=function(e,n){x=h((function(){e(t.unstable_now())}),n)},i=function(){m(x),x=-1}}function _(e,t){var n=e.length;e.push(t);e:for(;;){var r=n-1>>>1,o=e[r];if(!(void 0!==o&&0<j(o,t)))break e;e[r]=t,e[n]=o,n=r}}function S(e){return void 0===(e=e[0])?null:e}function T(e){var t=e[0];if(void 0!==t){var n=e.pop();if(n!==t){e[0]=n;e:for(var r=0,o=e.length;r<o;){var i=2*(r+1)-1,a=e[i],s=i+1,l=e[s];if(void 0!==a&&0>j(a,n))void 0!==l&&0>j(l,a)?(e[r]=l,e[s]=n,r=s):(e[r]=a,e[i]=n,r=i);else{if(!(void 0!==l&&0>j(l,n)))break e;e[r]=l,e[s]=n,r=s}}}return t}return null}function j(e,t){var n=e.sortIndex-t.sortIndex;return 0!==n?n:e.id-t.id}var A=[],C=[],I=1,P=null,R=3,N=!1,L=!1,M=!1;function D(e){for(var t=S(C);null!==t;){if(null===t.callback)T(C);else{if(!(t.startTime<=e))break;T(C),t.sortIndex=t.expirationTime,_(A,t)}t=S(C)}}function F(e){if(M=!1,D(e),!L)if(null!==S(A))L=!0,r(z);else{var t=S(C);null!==t&&o(F,t.startTime-e)}}function z(e,n){L=!1,M&&(M=!1,i()),N=!0;var r=R;try{for(D(n),P=S(A);null!==P&&(!(P.expirationTime>n)||e&&!a());){var s=P.callback;if(null!==s){P.callback=null,R=P.priorityLevel;var l=s(P.expirationTime<=n);n=t.unstable_now(),"function"==typeof l?P.callback=l:P===S(A)&&T(A),D(n)}else T(A);P=S(A)}if(null!==P)var c=!0;else{var u=S(C);null!==u&&o(F,u.startTime-n),c=!1}return c}finally{P=null,R=r,N=!1}}function U(e){switch(e){case 1:return-1;case 2:return 250;case 5:return 1073741823;case 4:return 1e4;default:return 5e3}}var B=s;t.unstable_IdlePriority=5,t.unstable_ImmediatePriority=1,t.unstable_LowPriority=4,t.unstable_NormalPriority=3,t.unstable_Profiling=null,t.unstable_UserBlockingPriority=2,t.unstable_cancelCallback=function(e){e.callback=null},t.unstable_continueExecution=function(){L||N||(L=!0,r(z))},t.unstable_getCurrentPriorityLevel=function(){return R},t.unstable_getFirstCallbackNode=function(){return S(A)},t.unstable_next=function(e){switch(R){case 1:case 2:case 3:var t=3;break;default:t=R}var n=R;R=t;try{return e()}finally{R=n}},t.unstable_pauseExecution=function(){},t.unstable_requestPaint=B,t.unstable_runWithPriority=function(e,t){switch(e){case 1:case 2:case 3:case 4:case 5:break;default:e=3}var n=R;R=e;try{return t()}finally{R=n}},t.unstable_scheduleCallback=function(e,n,a){var s=t.unstable_now();if("object"==typeof a&&null!==a){var l=a.delay;l="number"==typeof l&&0<l?s+l:s,a="number"==typeof a.timeout?a.timeout:U(e)}else a=U(e),l=s;return e={id:I++,callback:n,priorityLevel:e,startTime:l,expirationTime:a=l+a,sortIndex:-1},l>s?(e.sortIndex=l,_(C,e),null===S(A)&&e===S(C)&&(M?i():M=!0,o(F,l-s))):(e.sortIndex=a,_(A,e),L||N||(L=!0,r(z))),e},t.unstable_shouldYield=function(){var e=t.unstable_now();D(e);var n=S(A);return n!==P&&null!==P&&null!==n&&null!==n.callback&&n.startTime<=e&&n.expirationTime<P.expirationTime||a()},t.unstable_wrapCallback=function(e){var t=R;return function(){var n=R;R=t;try{return e.apply(this,arguments)}finally{R=n}}}},function(e,t,n){"use strict";var r=n(228);function o(){}function i(){}i.resetWarningCache=o,e.exports=function(){function e(e,t,n,o,i,a){if(a!==r){var s=new Error("Calling PropTypes validators directly is not supported by the `prop-types` package. Use PropTypes.checkPropTypes() to call them. Read more at http://fb.me/use-check-prop-types");throw s.name="Invariant Violation",s}}function t(){return e}e.isRequired=e;var n={array:e,bool:e,func:e,number:e,object:e,string:e,symbol:e,any:e,arrayOf:t,element:e,elementType:e,instanceOf:t,node:e,objectOf:t,oneOf:t,oneOfType:t,shape:t,exact:t,checkPropTypes:i,resetWarningCache:o};return n.PropTypes=n,n}},function(e,t,n){"use strict";e.exports="SECRET_DO_NOT_PASS_THIS_OR_YOU_WILL_BE_FIRED"},function(e,t,n){(function(e,r){var o;/*! https://mths.be/punycode v1.4.1 by @mathias */!function(i){t&&t.nodeType,e&&e.nodeType;var a="object"==typeof r&&r;a.global!==a&&a.window!==a&&a.self;var s,l=2147483647,c=/^xn--/,u=/[^\x20-\x7E]/,p=/[\x2E\u3002\uFF0E\uFF61]/g,f={overflow:"Overflow: input needs wider integers to process","not-basic":"Illegal input >= 0x80 (not a basic code point)","invalid-input":"Invalid input"},d=Math.floor,h=String.fromCharCode;function m(e){throw new RangeError(f[e])}function g(e,t){for(var n=e.length,r=[];n--;)r[n]=t(e[n]);return r}function y(e,t){var n=e.split("@"),r="";return n.length>1&&(r=n[0]+"@",e=n[1]),r+g((e=e.replace(p,".")).split("."),t).join(".")}function v(e){for(var t,n,r=[],o=0,i=e.length;o<i;)(t=e.charCodeAt(o++))>=55296&&t<=56319&&o<i?56320==(64512&(n=e.charCodeAt(o++)))?r.push(((1023&t)<<10)+(1023&n)+65536):(r.push(t),o--):r.push(t);return r}function b(e){return g(e,(function(e){var t="";return e>65535&&(t+=h((e-=65536)>>>10&1023|55296),e=56320|1023&e),t+=h(e)})).join("")}function x(e,t){return e+22+75*(e<26)-((0!=t)<<5)}function w(e,t,n){var r=0;for(e=n?d(e/700):e>>1,e+=d(e/t);e>455;r+=36)e=d(e/35);return d(r+36*e/(e+38))}function k(e){var t,n,r,o,i,a,s,c,u,p,f,h=[],g=e.length,y=0,v=128,x=72;for((n=e.lastIndexOf("-"))<0&&(n=0),r=0;r<n;++r)e.charCodeAt(r)>=128&&m("not-basic"),h.push(e.charCodeAt(r));for(o=n>0?n+1:0;o<g;){for(i=y,a=1,s=36;o>=g&&m("invalid-input"),((c=(f=e.charCodeAt(o++))-48<10?f-22:f-65<26?f-65:f-97<26?f-97:36)>=36||c>d((l-y)/a))&&m("overflow"),y+=c*a,!(c<(u=s<=x?1:s>=x+26?26:s-x));s+=36)a>d(l/(p=36-u))&&m("overflow"),a*=p;x=w(y-i,t=h.length+1,0==i),d(y/t)>l-v&&m("overflow"),v+=d(y/t),y%=t,h.splice(y++,0,v)}return b(h)}function O(e){var t,n,r,o,i,a,s,c,u,p,f,g,y,b,k,O=[];for(g=(e=v(e)).length,t=128,n=0,i=72,a=0;a<g;++a)(f=e[a])<128&&O.push(h(f));for(r=o=O.length,o&&O.push("-");r<g;){for(s=l,a=0;a<g;++a)(f=e[a])>=t&&f<s&&(s=f);for(s-t>d((l-n)/(y=r+1))&&m("overflow"),n+=(s-t)*y,t=s,a=0;a<g;++a)if((f=e[a])<t&&++n>l&&m("overflow"),f==t){for(c=n,u=36;!(c<(p=u<=i?1:u>=i+26?26:u-i));u+=36)k=c-p,b=36-p,O.push(h(x(p+k%b,0))),c=d(k/b);O.push(h(x(c,0))),i=w(n,y,r==o),n=0,++r}++n,++t}return O.join("")}s={version:"1.4.1",ucs2:{decode:v,encode:b},decode:k,encode:O,toASCII:function(e){return y(e,(function(e){return u.test(e)?"xn--"+O(e):e}))},toUnicode:function(e){return y(e,(function(e){return c.test(e)?k(e.slice(4).toLowerCase()):e}))}},void 0===(o=function(){return s}.call(t,n,t,e))||(e.exports=o)}()}).call(this,n(230)(e),n(5))},function(e,t){e.exports=function(e){return e.webpackPolyfill||(e.deprecate=function(){},e.paths=[],e.children||(e.children=[]),Object.defineProperty(e,"loaded",{enumerable:!0,get:function(){return e.l}}),Object.defineProperty(e,"id",{enumerable:!0,get:function(){return e.i}}),e.webpackPolyfill=1),e}},function(e,t,n){"use strict";e.exports={isString:function(e){return"string"==typeof e},isObject:function(e){return"object"==typeof e&&null!==e},isNull:function(e){return null===e},isNullOrUndefined:function(e){return null==e}}},function(e,t,n){"use strict";t.decode=t.parse=n(233),t.encode=t.stringify=n(234)},function(e,t,n){"use strict";function r(e,t){return Object.prototype.hasOwnProperty.call(e,t)}e.exports=function(e,t,n,i){t=t||"&",n=n||"=";var a={};if("string"!=typeof e||0===e.length)return a;var s=/\+/g;e=e.split(t);var l=1e3;i&&"number"==typeof i.maxKeys&&(l=i.maxKeys);var c=e.length;l>0&&c>l&&(c=l);for(var u=0;u<c;++u){var p,f,d,h,m=e[u].replace(s,"%20"),g=m.indexOf(n);g>=0?(p=m.substr(0,g),f=m.substr(g+1)):(p=m,f=""),d=decodeURIComponent(p),h=decodeURIComponent(f),r(a,d)?o(a[d])?a[d].push(h):a[d]=[a[d],h]:a[d]=h}return a};var o=Array.isArray||function(e){return"[object Array]"===Object.prototype.toString.call(e)}},function(e,t,n){"use strict";var r=function(e){switch(typeof e){case"string":return e;case"boolean":return e?"true":"false";case"number":return isFinite(e)?e:"";default:return""}};e.exports=function(e,t,n,s){return t=t||"&",n=n||"=",null===e&&(e=void 0),"object"==typeof e?i(a(e),(function(a){var s=encodeURIComponent(r(a))+n;return o(e[a])?i(e[a],(function(e){return s+encodeURIComponent(r(e))})).join(t):s+encodeURIComponent(r(e[a]))})).join(t):s?encodeURIComponent(r(s))+n+encodeURIComponent(r(e)):""};var o=Array.isArray||function(e){return"[object Array]"===Object.prototype.toString.call(e)};function i(e,t){if(e.map)return e.map(t);for(var n=[],r=0;r<e.length;r++)n.push(t(e[r],r));return n}var a=Object.keys||function(e){var t=[];for(var n in e)Object.prototype.hasOwnProperty.call(e,n)&&t.push(n);return t}},function(e,t,n){"use strict";
+/** @license React v16.13.0
+ * react-is.production.min.js
+ *
+ * Copyright (c) Facebook, Inc. and its affiliates.
+ *
+ * This source code is licensed under the MIT license found in the
+ * LICENSE file in the root directory of this source tree.
+ */var r="function"==typeof Symbol&&Symbol.for,o=r?Symbol.for("react.element"):60103,i=r?Symbol.for("react.portal"):60106,a=r?Symbol.for("react.fragment"):60107,s=r?Symbol.for("react.strict_mode"):60108,l=r?Symbol.for("react.profiler"):60114,c=r?Symbol.for("react.provider"):60109,u=r?Symbol.for("react.context"):60110,p=r?Symbol.for("react.async_mode"):60111,f=r?Symbol.for("react.concurrent_mode"):60111,d=r?Symbol.for("react.forward_ref"):60112,h=r?Symbol.for("react.suspense"):60113,m=r?Symbol.for("react.suspense_list"):60120,g=r?Symbol.for("react.memo"):60115,y=r?Symbol.for("react.lazy"):60116,v=r?Symbol.for("react.block"):60121,b=r?Symbol.for("react.fundamental"):60117,x=r?Symbol.for("react.responder"):60118,w=r?Symbol.for("react.scope"):60119;function k(e){if("object"==typeof e&&null!==e){var t=e.$$typeof;switch(t){case o:switch(e=e.type){case p:case f:case a:case l:case s:case h:return e;default:switch(e=e&&e.$$typeof){case u:case d:case y:case g:case c:return e;default:return t}}case i:return t}}}function O(e){return k(e)===f}t.AsyncMode=p,t.ConcurrentMode=f,t.ContextConsumer=u,t.ContextProvider=c,t.Element=o,t.ForwardRef=d,t.Fragment=a,t.Lazy=y,t.Memo=g,t.Portal=i,t.Profiler=l,t.StrictMode=s,t.Suspense=h,t.isAsyncMode=function(e){return O(e)||k(e)===p},t.isConcurrentMode=O,t.isContextConsumer=function(e){return k(e)===u},t.isContextProvider=function(e){return k(e)===c},t.isElement=function(e){return"object"==typeof e&&null!==e&&e.$$typeof===o},t.isForwardRef=function(e){return k(e)===d},t.isFragment=function(e){return k(e)===a},t.isLazy=function(e){return k(e)===y},t.isMemo=function(e){return k(e)===g},t.isPortal=function(e){return k(e)===i},t.isProfiler=function(e){return k(e)===l},t.isStrictMode=function(e){return k(e)===s},t.isSuspense=function(e){return k(e)===h},t.isValidElementType=function(e){return"string"==typeof e||"function"==typeof e||e===a||e===f||e===l||e===s||e===h||e===m||"object"==typeof e&&null!==e&&(e.$$typeof===y||e.$$typeof===g||e.$$typeof===c||e.$$typeof===u||e.$$typeof===d||e.$$typeof===b||e.$$typeof===x||e.$$typeof===w||e.$$typeof===v)},t.typeOf=k},function(e,t,n){"use strict";t.byteLength=function(e){var t=c(e),n=t[0],r=t[1];return 3*(n+r)/4-r},t.toByteArray=function(e){var t,n,r=c(e),a=r[0],s=r[1],l=new i(function(e,t,n){return 3*(t+n)/4-n}(0,a,s)),u=0,p=s>0?a-4:a;for(n=0;n<p;n+=4)t=o[e.charCodeAt(n)]<<18|o[e.charCodeAt(n+1)]<<12|o[e.charCodeAt(n+2)]<<6|o[e.charCodeAt(n+3)],l[u++]=t>>16&255,l[u++]=t>>8&255,l[u++]=255&t;2===s&&(t=o[e.charCodeAt(n)]<<2|o[e.charCodeAt(n+1)]>>4,l[u++]=255&t);1===s&&(t=o[e.charCodeAt(n)]<<10|o[e.charCodeAt(n+1)]<<4|o[e.charCodeAt(n+2)]>>2,l[u++]=t>>8&255,l[u++]=255&t);return l},t.fromByteArray=function(e){for(var t,n=e.length,o=n%3,i=[],a=0,s=n-o;a<s;a+=16383)i.push(u(e,a,a+16383>s?s:a+16383));1===o?(t=e[n-1],i.push(r[t>>2]+r[t<<4&63]+"==")):2===o&&(t=(e[n-2]<<8)+e[n-1],i.push(r[t>>10]+r[t>>4&63]+r[t<<2&63]+"="));return i.join("")};for(var r=[],o=[],i="undefined"!=typeof Uint8Array?Uint8Array:Array,a="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/",s=0,l=a.length;s<l;++s)r[s]=a[s],o[a.charCodeAt(s)]=s;function c(e){var t=e.length;if(t%4>0)throw new Error("Invalid string. Length must be a multiple of 4");var n=e.indexOf("=");return-1===n&&(n=t),[n,n===t?0:4-n%4]}function u(e,t,n){for(var o,i,a=[],s=t;s<n;s+=3)o=(e[s]<<16&16711680)+(e[s+1]<<8&65280)+(255&e[s+2]),a.push(r[(i=o)>>18&63]+r[i>>12&63]+r[i>>6&63]+r[63&i]);return a.join("")}o["-".charCodeAt(0)]=62,o["_".charCodeAt(0)]=63},function(e,t){t.read=function(e,t,n,r,o){var i,a,s=8*o-r-1,l=(1<<s)-1,c=l>>1,u=-7,p=n?o-1:0,f=n?-1:1,d=e[t+p];for(p+=f,i=d&(1<<-u)-1,d>>=-u,u+=s;u>0;i=256*i+e[t+p],p+=f,u-=8);for(a=i&(1<<-u)-1,i>>=-u,u+=r;u>0;a=256*a+e[t+p],p+=f,u-=8);if(0===i)i=1-c;else{if(i===l)return a?NaN:1/0*(d?-1:1);a+=Math.pow(2,r),i-=c}return(d?-1:1)*a*Math.pow(2,i-r)},t.write=function(e,t,n,r,o,i){var a,s,l,c=8*i-o-1,u=(1<<c)-1,p=u>>1,f=23===o?Math.pow(2,-24)-Math.pow(2,-77):0,d=r?0:i-1,h=r?1:-1,m=t<0||0===t&&1/t<0?1:0;for(t=Math.abs(t),isNaN(t)||t===1/0?(s=isNaN(t)?1:0,a=u):(a=Math.floor(Math.log(t)/Math.LN2),t*(l=Math.pow(2,-a))<1&&(a--,l*=2),(t+=a+p>=1?f/l:f*Math.pow(2,1-p))*l>=2&&(a++,l/=2),a+p>=u?(s=0,a=u):a+p>=1?(s=(t*l-1)*Math.pow(2,o),a+=p):(s=t*Math.pow(2,p-1)*Math.pow(2,o),a=0));o>=8;e[n+d]=255&s,d+=h,s/=256,o-=8);for(a=a<<o|s,c+=o;c>0;e[n+d]=255&a,d+=h,a/=256,c-=8);e[n+d-h]|=128*m}},function(e,t,n){"use strict";(function(t){e.exports={order:100,allowEmpty:!0,canParse:".json",parse:function(e){return new Promise((function(n,r){var o=e.data;t.isBuffer(o)&&(o=o.toString()),"string"==typeof o?0===o.trim().length?n(void 0):n(JSON.parse(o)):n(o)}))}}}).call(this,n(15).Buffer)},function(e,t,n){"use strict";(function(t){var r=n(132);e.exports={order:200,allowEmpty:!0,canParse:[".yaml",".yml",".json"],parse:function(e){return new Promise((function(n,o){var i=e.data;t.isBuffer(i)&&(i=i.toString()),n("string"==typeof i?r.parse(i):i)}))}}}).call(this,n(15).Buffer)},function(e,t,n){"use strict";var r=n(241);e.exports=r},function(e,t,n){"use strict";var r=n(242),o=n(261);function i(e){return function(){throw new Error("Function "+e+" is deprecated and cannot be used.")}}e.exports.Type=n(6),e.exports.Schema=n(37),e.exports.FAILSAFE_SCHEMA=n(88),e.exports.JSON_SCHEMA=n(134),e.exports.CORE_SCHEMA=n(133),e.exports.DEFAULT_SAFE_SCHEMA=n(57),e.exports.DEFAULT_FULL_SCHEMA=n(89),e.exports.load=r.load,e.exports.loadAll=r.loadAll,e.exports.safeLoad=r.safeLoad,e.exports.safeLoadAll=r.safeLoadAll,e.exports.dump=o.dump,e.exports.safeDump=o.safeDump,e.exports.YAMLException=n(56),e.exports.MINIMAL_SCHEMA=n(88),e.exports.SAFE_SCHEMA=n(57),e.exports.DEFAULT_SCHEMA=n(89),e.exports.scan=i("scan"),e.exports.parse=i("parse"),e.exports.compose=i("compose"),e.exports.addConstructor=i("addConstructor")},function(e,t,n){"use strict";var r=n(47),o=n(56),i=n(243),a=n(57),s=n(89),l=Object.prototype.hasOwnProperty,c=/[\x00-\x08\x0B\x0C\x0E-\x1F\x7F-\x84\x86-\x9F\uFFFE\uFFFF]|[\uD800-\uDBFF](?![\uDC00-\uDFFF])|(?:[^\uD800-\uDBFF]|^)[\uDC00-\uDFFF]/,u=/[\x85\u2028\u2029]/,p=/[,\[\]\{\}]/,f=/^(?:!|!!|![a-z\-]+!)$/i,d=/^(?:!|[^,\[\]\{\}])(?:%[0-9a-f]{2}|[0-9a-z\-#;\/\?:@&=\+\$,_\.!~\*'\(\)\[\]])*$/i;function h(e){return Object.prototype.toString.call(e)}function m(e){return 10===e||13===e}function g(e){return 9===e||32===e}function y(e){return 9===e||32===e||10===e||13===e}function v(e){return 44===e||91===e||93===e||123===e||125===e}function b(e){var t;return 48<=e&&e<=57?e-48:97<=(t=32|e)&&t<=102?t-97+10:-1}function x(e){return 48===e?"\0":97===e?"":98===e?"\b":116===e||9===e?"\t":110===e?"\n":118===e?"\v":102===e?"\f":114===e?"\r":101===e?"":32===e?" ":34===e?'"':47===e?"/":92===e?"\\":78===e?"":95===e?" ":76===e?"\u2028":80===e?"\u2029":""}function w(e){return e<=65535?String.fromCharCode(e):String.fromCharCode(55296+(e-65536>>10),56320+(e-65536&1023))}for(var k=new Array(256),O=new Array(256),E=0;E<256;E++)k[E]=x(E)?1:0,O[E]=x(E);function _(e,t){this.input=e,this.filename=t.filename||null,this.schema=t.schema||s,this.onWarning=t.onWarning||null,this.legacy=t.legacy||!1,this.json=t.json||!1,this.listener=t.listener||null,this.implicitTypes=this.schema.compiledImplicit,this.typeMap=this.schema.compiledTypeMap,this.length=e.length,this.position=0,this.line=0,this.lineStart=0,this.lineIndent=0,this.documents=[]}function S(e,t){return new o(t,new i(e.filename,e.input,e.position,e.line,e.position-e.lineStart))}function T(e,t){throw S(e,t)}function j(e,t){e.onWarning&&e.onWarning.call(null,S(e,t))}var A={YAML:function(e,t,n){var r,o,i;null!==e.version&&T(e,"duplication of %YAML directive"),1!==n.length&&T(e,"YAML directive accepts exactly one argument"),null===(r=/^([0-9]+)\.([0-9]+)$/.exec(n[0]))&&T(e,"ill-formed argument of the YAML directive"),o=parseInt(r[1],10),i=parseInt(r[2],10),1!==o&&T(e,"unacceptable YAML version of the document"),e.version=n[0],e.checkLineBreaks=i<2,1!==i&&2!==i&&j(e,"unsupported YAML version of the document")},TAG:function(e,t,n){var r,o;2!==n.length&&T(e,"TAG directive accepts exactly two arguments"),r=n[0],o=n[1],f.test(r)||T(e,"ill-formed tag handle (first argument) of the TAG directive"),l.call(e.tagMap,r)&&T(e,'there is a previously declared suffix for "'+r+'" tag handle'),d.test(o)||T(e,"ill-formed tag prefix (second argument) of the TAG directive"),e.tagMap[r]=o}};function C(e,t,n,r){var o,i,a,s;if(t<n){if(s=e.input.slice(t,n),r)for(o=0,i=s.length;o<i;o+=1)9===(a=s.charCodeAt(o))||32<=a&&a<=1114111||T(e,"expected valid JSON character");else c.test(s)&&T(e,"the stream contains non-printable characters");e.result+=s}}function I(e,t,n,o){var i,a,s,c;for(r.isObject(n)||T(e,"cannot merge mappings; the provided source object is unacceptable"),s=0,c=(i=Object.keys(n)).length;s<c;s+=1)a=i[s],l.call(t,a)||(t[a]=n[a],o[a]=!0)}function P(e,t,n,r,o,i,a,s){var c,u;if(Array.isArray(o))for(c=0,u=(o=Array.prototype.slice.call(o)).length;c<u;c+=1)Array.isArray(o[c])&&T(e,"nested arrays are not supported inside keys"),"object"==typeof o&&"[object Object]"===h(o[c])&&(o[c]="[object Object]");if("object"==typeof o&&"[object Object]"===h(o)&&(o="[object Object]"),o=String(o),null===t&&(t={}),"tag:yaml.org,2002:merge"===r)if(Array.isArray(i))for(c=0,u=i.length;c<u;c+=1)I(e,t,i[c],n);else I(e,t,i,n);else e.json||l.call(n,o)||!l.call(t,o)||(e.line=a||e.line,e.position=s||e.position,T(e,"duplicated mapping key")),t[o]=i,delete n[o];return t}function R(e){var t;10===(t=e.input.charCodeAt(e.position))?e.position++:13===t?(e.position++,10===e.input.charCodeAt(e.position)&&e.position++):T(e,"a line break is expected"),e.line+=1,e.lineStart=e.position}function N(e,t,n){for(var r=0,o=e.input.charCodeAt(e.position);0!==o;){for(;g(o);)o=e.input.charCodeAt(++e.position);if(t&&35===o)do{o=e.input.charCodeAt(++e.position)}while(10!==o&&13!==o&&0!==o);if(!m(o))break;for(R(e),o=e.input.charCodeAt(e.position),r++,e.lineIndent=0;32===o;)e.lineIndent++,o=e.input.charCodeAt(++e.position)}return-1!==n&&0!==r&&e.lineIndent<n&&j(e,"deficient indentation"),r}function L(e){var t,n=e.position;return!(45!==(t=e.input.charCodeAt(n))&&46!==t||t!==e.input.charCodeAt(n+1)||t!==e.input.charCodeAt(n+2)||(n+=3,0!==(t=e.input.charCodeAt(n))&&!y(t)))}function M(e,t){1===t?e.result+=" ":t>1&&(e.result+=r.repeat("\n",t-1))}function D(e,t){var n,r,o=e.tag,i=e.anchor,a=[],s=!1;for(null!==e.anchor&&(e.anchorMap[e.anchor]=a),r=e.input.charCodeAt(e.position);0!==r&&45===r&&y(e.input.charCodeAt(e.position+1));)if(s=!0,e.position++,N(e,!0,-1)&&e.lineIndent<=t)a.push(null),r=e.input.charCodeAt(e.position);else if(n=e.line,U(e,t,3,!1,!0),a.push(e.result),N(e,!0,-1),r=e.input.charCodeAt(e.position),(e.line===n||e.lineIndent>t)&&0!==r)T(e,"bad indentation of a sequence entry");else if(e.lineIndent<t)break;return!!s&&(e.tag=o,e.anchor=i,e.kind="sequence",e.result=a,!0)}function F(e){var t,n,r,o,i=!1,a=!1;if(33!==(o=e.input.charCodeAt(e.position)))return!1;if(null!==e.tag&&T(e,"duplication of a tag property"),60===(o=e.input.charCodeAt(++e.position))?(i=!0,o=e.input.charCodeAt(++e.position)):33===o?(a=!0,n="!!",o=e.input.charCodeAt(++e.position)):n="!",t=e.position,i){do{o=e.input.charCodeAt(++e.position)}while(0!==o&&62!==o);e.position<e.length?(r=e.input.slice(t,e.position),o=e.input.charCodeAt(++e.position)):T(e,"unexpected end of the stream within a verbatim tag")}else{for(;0!==o&&!y(o);)33===o&&(a?T(e,"tag suffix cannot contain exclamation marks"):(n=e.input.slice(t-1,e.position+1),f.test(n)||T(e,"named tag handle cannot contain such characters"),a=!0,t=e.position+1)),o=e.input.charCodeAt(++e.position);r=e.input.slice(t,e.position),p.test(r)&&T(e,"tag suffix cannot contain flow indicator characters")}return r&&!d.test(r)&&T(e,"tag name cannot contain such characters: "+r),i?e.tag=r:l.call(e.tagMap,n)?e.tag=e.tagMap[n]+r:"!"===n?e.tag="!"+r:"!!"===n?e.tag="tag:yaml.org,2002:"+r:T(e,'undeclared tag handle "'+n+'"'),!0}function z(e){var t,n;if(38!==(n=e.input.charCodeAt(e.position)))return!1;for(null!==e.anchor&&T(e,"duplication of an anchor property"),n=e.input.charCodeAt(++e.position),t=e.position;0!==n&&!y(n)&&!v(n);)n=e.input.charCodeAt(++e.position);return e.position===t&&T(e,"name of an anchor node must contain at least one character"),e.anchor=e.input.slice(t,e.position),!0}function U(e,t,n,o,i){var a,s,c,u,p,f,d,h,x=1,E=!1,_=!1;if(null!==e.listener&&e.listener("open",e),e.tag=null,e.anchor=null,e.kind=null,e.result=null,a=s=c=4===n||3===n,o&&N(e,!0,-1)&&(E=!0,e.lineIndent>t?x=1:e.lineIndent===t?x=0:e.lineIndent<t&&(x=-1)),1===x)for(;F(e)||z(e);)N(e,!0,-1)?(E=!0,c=a,e.lineIndent>t?x=1:e.lineIndent===t?x=0:e.lineIndent<t&&(x=-1)):c=!1;if(c&&(c=E||i),1!==x&&4!==n||(d=1===n||2===n?t:t+1,h=e.position-e.lineStart,1===x?c&&(D(e,h)||function(e,t,n){var r,o,i,a,s,l=e.tag,c=e.anchor,u={},p={},f=null,d=null,h=null,m=!1,v=!1;for(null!==e.anchor&&(e.anchorMap[e.anchor]=u),s=e.input.charCodeAt(e.position);0!==s;){if(r=e.input.charCodeAt(e.position+1),i=e.line,a=e.position,63!==s&&58!==s||!y(r)){if(!U(e,n,2,!1,!0))break;if(e.line===i){for(s=e.input.charCodeAt(e.position);g(s);)s=e.input.charCodeAt(++e.position);if(58===s)y(s=e.input.charCodeAt(++e.position))||T(e,"a whitespace character is expected after the key-value separator within a block mapping"),m&&(P(e,u,p,f,d,null),f=d=h=null),v=!0,m=!1,o=!1,f=e.tag,d=e.result;else{if(!v)return e.tag=l,e.anchor=c,!0;T(e,"can not read an implicit mapping pair; a colon is missed")}}else{if(!v)return e.tag=l,e.anchor=c,!0;T(e,"can not read a block mapping entry; a multiline key may not be an implicit key")}}else 63===s?(m&&(P(e,u,p,f,d,null),f=d=h=null),v=!0,m=!0,o=!0):m?(m=!1,o=!0):T(e,"incomplete explicit mapping pair; a key node is missed; or followed by a non-tabulated empty line"),e.position+=1,s=r;if((e.line===i||e.lineIndent>t)&&(U(e,t,4,!0,o)&&(m?d=e.result:h=e.result),m||(P(e,u,p,f,d,h,i,a),f=d=h=null),N(e,!0,-1),s=e.input.charCodeAt(e.position)),e.lineIndent>t&&0!==s)T(e,"bad indentation of a mapping entry");else if(e.lineIndent<t)break}return m&&P(e,u,p,f,d,null),v&&(e.tag=l,e.anchor=c,e.kind="mapping",e.result=u),v}(e,h,d))||function(e,t){var n,r,o,i,a,s,l,c,u,p,f=!0,d=e.tag,h=e.anchor,m={};if(91===(p=e.input.charCodeAt(e.position)))o=93,s=!1,r=[];else{if(123!==p)return!1;o=125,s=!0,r={}}for(null!==e.anchor&&(e.anchorMap[e.anchor]=r),p=e.input.charCodeAt(++e.position);0!==p;){if(N(e,!0,t),(p=e.input.charCodeAt(e.position))===o)return e.position++,e.tag=d,e.anchor=h,e.kind=s?"mapping":"sequence",e.result=r,!0;f||T(e,"missed comma between flow collection entries"),u=null,i=a=!1,63===p&&y(e.input.charCodeAt(e.position+1))&&(i=a=!0,e.position++,N(e,!0,t)),n=e.line,U(e,t,1,!1,!0),c=e.tag,l=e.result,N(e,!0,t),p=e.input.charCodeAt(e.position),!a&&e.line!==n||58!==p||(i=!0,p=e.input.charCodeAt(++e.position),N(e,!0,t),U(e,t,1,!1,!0),u=e.result),s?P(e,r,m,c,l,u):i?r.push(P(e,null,m,c,l,u)):r.push(l),N(e,!0,t),44===(p=e.input.charCodeAt(e.position))?(f=!0,p=e.input.charCodeAt(++e.position)):f=!1}T(e,"unexpected end of the stream within a flow collection")}(e,d)?_=!0:(s&&function(e,t){var n,o,i,a,s,l=1,c=!1,u=!1,p=t,f=0,d=!1;if(124===(a=e.input.charCodeAt(e.position)))o=!1;else{if(62!==a)return!1;o=!0}for(e.kind="scalar",e.result="";0!==a;)if(43===(a=e.input.charCodeAt(++e.position))||45===a)1===l?l=43===a?3:2:T(e,"repeat of a chomping mode identifier");else{if(!((i=48<=(s=a)&&s<=57?s-48:-1)>=0))break;0===i?T(e,"bad explicit indentation width of a block scalar; it cannot be less than one"):u?T(e,"repeat of an indentation width identifier"):(p=t+i-1,u=!0)}if(g(a)){do{a=e.input.charCodeAt(++e.position)}while(g(a));if(35===a)do{a=e.input.charCodeAt(++e.position)}while(!m(a)&&0!==a)}for(;0!==a;){for(R(e),e.lineIndent=0,a=e.input.charCodeAt(e.position);(!u||e.lineIndent<p)&&32===a;)e.lineIndent++,a=e.input.charCodeAt(++e.position);if(!u&&e.lineIndent>p&&(p=e.lineIndent),m(a))f++;else{if(e.lineIndent<p){3===l?e.result+=r.repeat("\n",c?1+f:f):1===l&&c&&(e.result+="\n");break}for(o?g(a)?(d=!0,e.result+=r.repeat("\n",c?1+f:f)):d?(d=!1,e.result+=r.repeat("\n",f+1)):0===f?c&&(e.result+=" "):e.result+=r.repeat("\n",f):e.result+=r.repeat("\n",c?1+f:f),c=!0,u=!0,f=0,n=e.position;!m(a)&&0!==a;)a=e.input.charCodeAt(++e.position);C(e,n,e.position,!1)}}return!0}(e,d)||function(e,t){var n,r,o;if(39!==(n=e.input.charCodeAt(e.position)))return!1;for(e.kind="scalar",e.result="",e.position++,r=o=e.position;0!==(n=e.input.charCodeAt(e.position));)if(39===n){if(C(e,r,e.position,!0),39!==(n=e.input.charCodeAt(++e.position)))return!0;r=e.position,e.position++,o=e.position}else m(n)?(C(e,r,o,!0),M(e,N(e,!1,t)),r=o=e.position):e.position===e.lineStart&&L(e)?T(e,"unexpected end of the document within a single quoted scalar"):(e.position++,o=e.position);T(e,"unexpected end of the stream within a single quoted scalar")}(e,d)||function(e,t){var n,r,o,i,a,s,l;if(34!==(s=e.input.charCodeAt(e.position)))return!1;for(e.kind="scalar",e.result="",e.position++,n=r=e.position;0!==(s=e.input.charCodeAt(e.position));){if(34===s)return C(e,n,e.position,!0),e.position++,!0;if(92===s){if(C(e,n,e.position,!0),m(s=e.input.charCodeAt(++e.position)))N(e,!1,t);else if(s<256&&k[s])e.result+=O[s],e.position++;else if((a=120===(l=s)?2:117===l?4:85===l?8:0)>0){for(o=a,i=0;o>0;o--)(a=b(s=e.input.charCodeAt(++e.position)))>=0?i=(i<<4)+a:T(e,"expected hexadecimal character");e.result+=w(i),e.position++}else T(e,"unknown escape sequence");n=r=e.position}else m(s)?(C(e,n,r,!0),M(e,N(e,!1,t)),n=r=e.position):e.position===e.lineStart&&L(e)?T(e,"unexpected end of the document within a double quoted scalar"):(e.position++,r=e.position)}T(e,"unexpected end of the stream within a double quoted scalar")}(e,d)?_=!0:!function(e){var t,n,r;if(42!==(r=e.input.charCodeAt(e.position)))return!1;for(r=e.input.charCodeAt(++e.position),t=e.position;0!==r&&!y(r)&&!v(r);)r=e.input.charCodeAt(++e.position);return e.position===t&&T(e,"name of an alias node must contain at least one character"),n=e.input.slice(t,e.position),e.anchorMap.hasOwnProperty(n)||T(e,'unidentified alias "'+n+'"'),e.result=e.anchorMap[n],N(e,!0,-1),!0}(e)?function(e,t,n){var r,o,i,a,s,l,c,u,p=e.kind,f=e.result;if(y(u=e.input.charCodeAt(e.position))||v(u)||35===u||38===u||42===u||33===u||124===u||62===u||39===u||34===u||37===u||64===u||96===u)return!1;if((63===u||45===u)&&(y(r=e.input.charCodeAt(e.position+1))||n&&v(r)))return!1;for(e.kind="scalar",e.result="",o=i=e.position,a=!1;0!==u;){if(58===u){if(y(r=e.input.charCodeAt(e.position+1))||n&&v(r))break}else if(35===u){if(y(e.input.charCodeAt(e.position-1)))break}else{if(e.position===e.lineStart&&L(e)||n&&v(u))break;if(m(u)){if(s=e.line,l=e.lineStart,c=e.lineIndent,N(e,!1,-1),e.lineIndent>=t){a=!0,u=e.input.charCodeAt(e.position);continue}e.position=i,e.line=s,e.lineStart=l,e.lineIndent=c;break}}a&&(C(e,o,i,!1),M(e,e.line-s),o=i=e.position,a=!1),g(u)||(i=e.position+1),u=e.input.charCodeAt(++e.position)}return C(e,o,i,!1),!!e.result||(e.kind=p,e.result=f,!1)}(e,d,1===n)&&(_=!0,null===e.tag&&(e.tag="?")):(_=!0,null===e.tag&&null===e.anchor||T(e,"alias node should not have any properties")),null!==e.anchor&&(e.anchorMap[e.anchor]=e.result)):0===x&&(_=c&&D(e,h))),null!==e.tag&&"!"!==e.tag)if("?"===e.tag){for(u=0,p=e.implicitTypes.length;u<p;u+=1)if((f=e.implicitTypes[u]).resolve(e.result)){e.result=f.construct(e.result),e.tag=f.tag,null!==e.anchor&&(e.anchorMap[e.anchor]=e.result);break}}else l.call(e.typeMap[e.kind||"fallback"],e.tag)?(f=e.typeMap[e.kind||"fallback"][e.tag],null!==e.result&&f.kind!==e.kind&&T(e,"unacceptable node kind for !<"+e.tag+'> tag; it should be "'+f.kind+'", not "'+e.kind+'"'),f.resolve(e.result)?(e.result=f.construct(e.result),null!==e.anchor&&(e.anchorMap[e.anchor]=e.result)):T(e,"cannot resolve a node with !<"+e.tag+"> explicit tag")):T(e,"unknown tag !<"+e.tag+">");return null!==e.listener&&e.listener("close",e),null!==e.tag||null!==e.anchor||_}function B(e){var t,n,r,o,i=e.position,a=!1;for(e.version=null,e.checkLineBreaks=e.legacy,e.tagMap={},e.anchorMap={};0!==(o=e.input.charCodeAt(e.position))&&(N(e,!0,-1),o=e.input.charCodeAt(e.position),!(e.lineIndent>0||37!==o));){for(a=!0,o=e.input.charCodeAt(++e.position),t=e.position;0!==o&&!y(o);)o=e.input.charCodeAt(++e.position);for(r=[],(n=e.input.slice(t,e.position)).length<1&&T(e,"directive name must not be less than one character in length");0!==o;){for(;g(o);)o=e.input.charCodeAt(++e.position);if(35===o){do{o=e.input.charCodeAt(++e.position)}while(0!==o&&!m(o));break}if(m(o))break;for(t=e.position;0!==o&&!y(o);)o=e.input.charCodeAt(++e.position);r.push(e.input.slice(t,e.position))}0!==o&&R(e),l.call(A,n)?A[n](e,n,r):j(e,'unknown document directive "'+n+'"')}N(e,!0,-1),0===e.lineIndent&&45===e.input.charCodeAt(e.position)&&45===e.input.charCodeAt(e.position+1)&&45===e.input.charCodeAt(e.position+2)?(e.position+=3,N(e,!0,-1)):a&&T(e,"directives end mark is expected"),U(e,e.lineIndent-1,4,!1,!0),N(e,!0,-1),e.checkLineBreaks&&u.test(e.input.slice(i,e.position))&&j(e,"non-ASCII line breaks are interpreted as content"),e.documents.push(e.result),e.position===e.lineStart&&L(e)?46===e.input.charCodeAt(e.position)&&(e.position+=3,N(e,!0,-1)):e.position<e.length-1&&T(e,"end of the stream or a document separator is expected")}function $(e,t){t=t||{},0!==(e=String(e)).length&&(10!==e.charCodeAt(e.length-1)&&13!==e.charCodeAt(e.length-1)&&(e+="\n"),65279===e.charCodeAt(0)&&(e=e.slice(1)));var n=new _(e,t);for(n.input+="\0";32===n.input.charCodeAt(n.position);)n.lineIndent+=1,n.position+=1;for(;n.position<n.length-1;)B(n);return n.documents}function W(e,t,n){var r,o,i=$(e,n);if("function"!=typeof t)return i;for(r=0,o=i.length;r<o;r+=1)t(i[r])}function q(e,t){var n=$(e,t);if(0!==n.length){if(1===n.length)return n[0];throw new o("expected a single document in the stream, but found more")}}e.exports.loadAll=W,e.exports.load=q,e.exports.safeLoadAll=function(e,t,n){if("function"!=typeof t)return W(e,r.extend({schema:a},n));W(e,t,r.extend({schema:a},n))},e.exports.safeLoad=function(e,t){return q(e,r.extend({schema:a},t))}},function(e,t,n){"use strict";var r=n(47);function o(e,t,n,r,o){this.name=e,this.buffer=t,this.position=n,this.line=r,this.column=o}o.prototype.getSnippet=function(e,t){var n,o,i,a,s;if(!this.buffer)return null;for(e=e||4,t=t||75,n="",o=this.position;o>0&&-1==="\0\r\n\u2028\u2029".indexOf(this.buffer.charAt(o-1));)if(o-=1,this.position-o>t/2-1){n=" ... ",o+=5;break}for(i="",a=this.position;a<this.buffer.length&&-1==="\0\r\n\u2028\u2029".indexOf(this.buffer.charAt(a));)if((a+=1)-this.position>t/2-1){i=" ... ",a-=5;break}return s=this.buffer.slice(o,a),r.repeat(" ",e)+n+s+i+"\n"+r.repeat(" ",e+this.position-o+n.length)+"^"},o.prototype.toString=function(e){var t,n="";return this.name&&(n+='in "'+this.name+'" '),n+="at line "+(this.line+1)+", column "+(this.column+1),e||(t=this.getSnippet())&&(n+=":\n"+t),n},e.exports=o},function(e,t,n){"use strict";var r=n(6);e.exports=new r("tag:yaml.org,2002:str",{kind:"scalar",construct:function(e){return null!==e?e:""}})},function(e,t,n){"use strict";var r=n(6);e.exports=new r("tag:yaml.org,2002:seq",{kind:"sequence",construct:function(e){return null!==e?e:[]}})},function(e,t,n){"use strict";var r=n(6);e.exports=new r("tag:yaml.org,2002:map",{kind:"mapping",construct:function(e){return null!==e?e:{}}})},function(e,t,n){"use strict";var r=n(6);e.exports=new r("tag:yaml.org,2002:null",{kind:"scalar",resolve:function(e){if(null===e)return!0;var t=e.length;return 1===t&&"~"===e||4===t&&("null"===e||"Null"===e||"NULL"===e)},construct:function(){return null},predicate:function(e){return null===e},represent:{canonical:function(){return"~"},lowercase:function(){return"null"},uppercase:function(){return"NULL"},camelcase:function(){return"Null"}},defaultStyle:"lowercase"})},function(e,t,n){"use strict";var r=n(6);e.exports=new r("tag:yaml.org,2002:bool",{kind:"scalar",resolve:function(e){if(null===e)return!1;var t=e.length;return 4===t&&("true"===e||"True"===e||"TRUE"===e)||5===t&&("false"===e||"False"===e||"FALSE"===e)},construct:function(e){return"true"===e||"True"===e||"TRUE"===e},predicate:function(e){return"[object Boolean]"===Object.prototype.toString.call(e)},represent:{lowercase:function(e){return e?"true":"false"},uppercase:function(e){return e?"TRUE":"FALSE"},camelcase:function(e){return e?"True":"False"}},defaultStyle:"lowercase"})},function(e,t,n){"use strict";var r=n(47),o=n(6);function i(e){return 48<=e&&e<=55}function a(e){return 48<=e&&e<=57}e.exports=new o("tag:yaml.org,2002:int",{kind:"scalar",resolve:function(e){if(null===e)return!1;var t,n,r=e.length,o=0,s=!1;if(!r)return!1;if("-"!==(t=e[o])&&"+"!==t||(t=e[++o]),"0"===t){if(o+1===r)return!0;if("b"===(t=e[++o])){for(o++;o<r;o++)if("_"!==(t=e[o])){if("0"!==t&&"1"!==t)return!1;s=!0}return s&&"_"!==t}if("x"===t){for(o++;o<r;o++)if("_"!==(t=e[o])){if(!(48<=(n=e.charCodeAt(o))&&n<=57||65<=n&&n<=70||97<=n&&n<=102))return!1;s=!0}return s&&"_"!==t}for(;o<r;o++)if("_"!==(t=e[o])){if(!i(e.charCodeAt(o)))return!1;s=!0}return s&&"_"!==t}if("_"===t)return!1;for(;o<r;o++)if("_"!==(t=e[o])){if(":"===t)break;if(!a(e.charCodeAt(o)))return!1;s=!0}return!(!s||"_"===t)&&(":"!==t||/^(:[0-5]?[0-9])+$/.test(e.slice(o)))},construct:function(e){var t,n,r=e,o=1,i=[];return-1!==r.indexOf("_")&&(r=r.replace(/_/g,"")),"-"!==(t=r[0])&&"+"!==t||("-"===t&&(o=-1),t=(r=r.slice(1))[0]),"0"===r?0:"0"===t?"b"===r[1]?o*parseInt(r.slice(2),2):"x"===r[1]?o*parseInt(r,16):o*parseInt(r,8):-1!==r.indexOf(":")?(r.split(":").forEach((function(e){i.unshift(parseInt(e,10))})),r=0,n=1,i.forEach((function(e){r+=e*n,n*=60})),o*r):o*parseInt(r,10)},predicate:function(e){return"[object Number]"===Object.prototype.toString.call(e)&&e%1==0&&!r.isNegativeZero(e)},represent:{binary:function(e){return e>=0?"0b"+e.toString(2):"-0b"+e.toString(2).slice(1)},octal:function(e){return e>=0?"0"+e.toString(8):"-0"+e.toString(8).slice(1)},decimal:function(e){return e.toString(10)},hexadecimal:function(e){return e>=0?"0x"+e.toString(16).toUpperCase():"-0x"+e.toString(16).toUpperCase().slice(1)}},defaultStyle:"decimal",styleAliases:{binary:[2,"bin"],octal:[8,"oct"],decimal:[10,"dec"],hexadecimal:[16,"hex"]}})},function(e,t,n){"use strict";var r=n(47),o=n(6),i=new RegExp("^(?:[-+]?(?:0|[1-9][0-9_]*)(?:\\.[0-9_]*)?(?:[eE][-+]?[0-9]+)?|\\.[0-9_]+(?:[eE][-+]?[0-9]+)?|[-+]?[0-9][0-9_]*(?::[0-5]?[0-9])+\\.[0-9_]*|[-+]?\\.(?:inf|Inf|INF)|\\.(?:nan|NaN|NAN))$");var a=/^[-+]?[0-9]+e/;e.exports=new o("tag:yaml.org,2002:float",{kind:"scalar",resolve:function(e){return null!==e&&!(!i.test(e)||"_"===e[e.length-1])},construct:function(e){var t,n,r,o;return n="-"===(t=e.replace(/_/g,"").toLowerCase())[0]?-1:1,o=[],"+-".indexOf(t[0])>=0&&(t=t.slice(1)),".inf"===t?1===n?Number.POSITIVE_INFINITY:Number.NEGATIVE_INFINITY:".nan"===t?NaN:t.indexOf(":")>=0?(t.split(":").forEach((function(e){o.unshift(parseFloat(e,10))})),t=0,r=1,o.forEach((function(e){t+=e*r,r*=60})),n*t):n*parseFloat(t,10)},predicate:function(e){return"[object Number]"===Object.prototype.toString.call(e)&&(e%1!=0||r.isNegativeZero(e))},represent:function(e,t){var n;if(isNaN(e))switch(t){case"lowercase":return".nan";case"uppercase":return".NAN";case"camelcase":return".NaN"}else if(Number.POSITIVE_INFINITY===e)switch(t){case"lowercase":return".inf";case"uppercase":return".INF";case"camelcase":return".Inf"}else if(Number.NEGATIVE_INFINITY===e)switch(t){case"lowercase":return"-.inf";case"uppercase":return"-.INF";case"camelcase":return"-.Inf"}else if(r.isNegativeZero(e))return"-0.0";return n=e.toString(10),a.test(n)?n.replace("e",".e"):n},defaultStyle:"lowercase"})},function(e,t,n){"use strict";var r=n(6),o=new RegExp("^([0-9][0-9][0-9][0-9])-([0-9][0-9])-([0-9][0-9])$"),i=new RegExp("^([0-9][0-9][0-9][0-9])-([0-9][0-9]?)-([0-9][0-9]?)(?:[Tt]|[ \\t]+)([0-9][0-9]?):([0-9][0-9]):([0-9][0-9])(?:\\.([0-9]*))?(?:[ \\t]*(Z|([-+])([0-9][0-9]?)(?::([0-9][0-9]))?))?$");e.exports=new r("tag:yaml.org,2002:timestamp",{kind:"scalar",resolve:function(e){return null!==e&&(null!==o.exec(e)||null!==i.exec(e))},construct:function(e){var t,n,r,a,s,l,c,u,p=0,f=null;if(null===(t=o.exec(e))&&(t=i.exec(e)),null===t)throw new Error("Date resolve error");if(n=+t[1],r=+t[2]-1,a=+t[3],!t[4])return new Date(Date.UTC(n,r,a));if(s=+t[4],l=+t[5],c=+t[6],t[7]){for(p=t[7].slice(0,3);p.length<3;)p+="0";p=+p}return t[9]&&(f=6e4*(60*+t[10]+ +(t[11]||0)),"-"===t[9]&&(f=-f)),u=new Date(Date.UTC(n,r,a,s,l,c,p)),f&&u.setTime(u.getTime()-f),u},instanceOf:Date,represent:function(e){return e.toISOString()}})},function(e,t,n){"use strict";var r=n(6);e.exports=new r("tag:yaml.org,2002:merge",{kind:"scalar",resolve:function(e){return"<<"===e||null===e}})},function(e,t,n){"use strict";var r;try{r=n(15).Buffer}catch(e){}var o=n(6),i="ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=\n\r";e.exports=new o("tag:yaml.org,2002:binary",{kind:"scalar",resolve:function(e){if(null===e)return!1;var t,n,r=0,o=e.length,a=i;for(n=0;n<o;n++)if(!((t=a.indexOf(e.charAt(n)))>64)){if(t<0)return!1;r+=6}return r%8==0},construct:function(e){var t,n,o=e.replace(/[\r\n=]/g,""),a=o.length,s=i,l=0,c=[];for(t=0;t<a;t++)t%4==0&&t&&(c.push(l>>16&255),c.push(l>>8&255),c.push(255&l)),l=l<<6|s.indexOf(o.charAt(t));return 0===(n=a%4*6)?(c.push(l>>16&255),c.push(l>>8&255),c.push(255&l)):18===n?(c.push(l>>10&255),c.push(l>>2&255)):12===n&&c.push(l>>4&255),r?r.from?r.from(c):new r(c):c},predicate:function(e){return r&&r.isBuffer(e)},represent:function(e){var t,n,r="",o=0,a=e.length,s=i;for(t=0;t<a;t++)t%3==0&&t&&(r+=s[o>>18&63],r+=s[o>>12&63],r+=s[o>>6&63],r+=s[63&o]),o=(o<<8)+e[t];return 0===(n=a%3)?(r+=s[o>>18&63],r+=s[o>>12&63],r+=s[o>>6&63],r+=s[63&o]):2===n?(r+=s[o>>10&63],r+=s[o>>4&63],r+=s[o<<2&63],r+=s[64]):1===n&&(r+=s[o>>2&63],r+=s[o<<4&63],r+=s[64],r+=s[64]),r}})},function(e,t,n){"use strict";var r=n(6),o=Object.prototype.hasOwnProperty,i=Object.prototype.toString;e.exports=new r("tag:yaml.org,2002:omap",{kind:"sequence",resolve:function(e){if(null===e)return!0;var t,n,r,a,s,l=[],c=e;for(t=0,n=c.length;t<n;t+=1){if(r=c[t],s=!1,"[object Object]"!==i.call(r))return!1;for(a in r)if(o.call(r,a)){if(s)return!1;s=!0}if(!s)return!1;if(-1!==l.indexOf(a))return!1;l.push(a)}return!0},construct:function(e){return null!==e?e:[]}})},function(e,t,n){"use strict";var r=n(6),o=Object.prototype.toString;e.exports=new r("tag:yaml.org,2002:pairs",{kind:"sequence",resolve:function(e){if(null===e)return!0;var t,n,r,i,a,s=e;for(a=new Array(s.length),t=0,n=s.length;t<n;t+=1){if(r=s[t],"[object Object]"!==o.call(r))return!1;if(1!==(i=Object.keys(r)).length)return!1;a[t]=[i[0],r[i[0]]]}return!0},construct:function(e){if(null===e)return[];var t,n,r,o,i,a=e;for(i=new Array(a.length),t=0,n=a.length;t<n;t+=1)r=a[t],o=Object.keys(r),i[t]=[o[0],r[o[0]]];return i}})},function(e,t,n){"use strict";var r=n(6),o=Object.prototype.hasOwnProperty;e.exports=new r("tag:yaml.org,2002:set",{kind:"mapping",resolve:function(e){if(null===e)return!0;var t,n=e;for(t in n)if(o.call(n,t)&&null!==n[t])return!1;return!0},construct:function(e){return null!==e?e:{}}})},function(e,t,n){"use strict";var r=n(6);e.exports=new r("tag:yaml.org,2002:js/undefined",{kind:"scalar",resolve:function(){return!0},construct:function(){},predicate:function(e){return void 0===e},represent:function(){return""}})},function(e,t,n){"use strict";var r=n(6);e.exports=new r("tag:yaml.org,2002:js/regexp",{kind:"scalar",resolve:function(e){if(null===e)return!1;if(0===e.length)return!1;var t=e,n=/\/([gim]*)$/.exec(e),r="";if("/"===t[0]){if(n&&(r=n[1]),r.length>3)return!1;if("/"!==t[t.length-r.length-1])return!1}return!0},construct:function(e){var t=e,n=/\/([gim]*)$/.exec(e),r="";return"/"===t[0]&&(n&&(r=n[1]),t=t.slice(1,t.length-r.length-1)),new RegExp(t,r)},predicate:function(e){return"[object RegExp]"===Object.prototype.toString.call(e)},represent:function(e){var t="/"+e.source+"/";return e.global&&(t+="g"),e.multiline&&(t+="m"),e.ignoreCase&&(t+="i"),t}})},function(e,t,n){"use strict";var r;try{r=n(260)}catch(e){"undefined"!=typeof window&&(r=window.esprima)}var o=n(6);e.exports=new o("tag:yaml.org,2002:js/function",{kind:"scalar",resolve:function(e){if(null===e)return!1;try{var t="("+e+")",n=r.parse(t,{range:!0});return"Program"===n.type&&1===n.body.length&&"ExpressionStatement"===n.body[0].type&&("ArrowFunctionExpression"===n.body[0].expression.type||"FunctionExpression"===n.body[0].expression.type)}catch(e){return!1}},construct:function(e){var t,n="("+e+")",o=r.parse(n,{range:!0}),i=[];if("Program"!==o.type||1!==o.body.length||"ExpressionStatement"!==o.body[0].type||"ArrowFunctionExpression"!==o.body[0].expression.type&&"FunctionExpression"!==o.body[0].expression.type)throw new Error("Failed to resolve function");return o.body[0].expression.params.forEach((function(e){i.push(e.name)})),t=o.body[0].expression.body.range,"BlockStatement"===o.body[0].expression.body.type?new Function(i,n.slice(t[0]+1,t[1]-1)):new Function(i,"return "+n.slice(t[0],t[1]))},predicate:function(e){return"[object Function]"===Object.prototype.toString.call(e)},represent:function(e){return e.toString()}})},function(e,n){if(void 0===t){var r=new Error("Cannot find module 'esprima'");throw r.code="MODULE_NOT_FOUND",r}e.exports=t},function(e,t){e.exports=function(){}},function(e,t){e.exports=function(e){var t=/(%?)(%([jds]))/g,n=Array.prototype.slice.call(arguments,1);return n.length&&(e=e.replace(t,(function(e,t,r,o){var i=n.shift();switch(o){case"s":i=""+i;break;case"d":i=Number(i);break;case"j":i=JSON.stringify(i)}return t?(n.unshift(i),e):i}))),n.length&&(e+=" "+n.join(" ")),""+(e=e.replace(/%{2,2}/g,"%"))}},function(e,t,n){"use strict";(function(t){var n=/\.(txt|htm|html|md|xml|js|min|map|css|scss|less|svg)$/i;e.exports={order:300,allowEmpty:!0,encoding:"utf8",canParse:function(e){return("string"==typeof e.data||t.isBuffer(e.data))&&n.test(e.url)},parse:function(e){if("string"==typeof e.data)return e.data;if(t.isBuffer(e.data))return e.data.toString(this.encoding);throw new Error("data is not text")}}}).call(this,n(15).Buffer)},function(e,t,n){"use strict";(function(t){var n=/\.(jpeg|jpg|gif|png|bmp|ico)$/i;e.exports={order:400,allowEmpty:!0,canParse:function(e){return t.isBuffer(e.data)&&n.test(e.url)},parse:function(e){return t.isBuffer(e.data)?e.data:new t(e.data)}}}).call(this,n(15).Buffer)},function(e,t,n){"use strict";var r=n(266),o=n(30),i=n(25);e.exports={order:100,canRead:function(e){return i.isFileSystemPath(e.url)},read:function(e){return new Promise((function(t,n){var a;try{a=i.toFileSystemPath(e.url)}catch(t){n(o.uri(t,"Malformed URI: %s",e.url))}try{r.readFile(a,(function(e,r){e?n(o(e,'Error opening file "%s"',a)):t(r)}))}catch(e){n(o(e,'Error opening file "%s"',a))}}))}}},function(e,t){},function(e,t,n){"use strict";(function(t,r){var o=n(90),i=n(279),a=n(30),s=n(25);e.exports={order:200,headers:null,timeout:5e3,redirects:5,withCredentials:!1,canRead:function(e){return s.isHttp(e.url)},read:function(e){var n=s.parse(e.url);return t.browser&&!n.protocol&&(n.protocol=s.parse(location.href).protocol),function e(t,n,l){return new Promise((function(c,u){t=s.parse(t),(l=l||[]).push(t.href),function(e,t){return new Promise((function(n,a){var s=("https:"===e.protocol?i:o).get({hostname:e.hostname,port:e.port,path:e.path,auth:e.auth,protocol:e.protocol,headers:t.headers||{},withCredentials:t.withCredentials});"function"==typeof s.setTimeout&&s.setTimeout(t.timeout),s.on("timeout",(function(){s.abort()})),s.on("error",a),s.once("response",(function(e){e.body=new r(0),e.on("data",(function(t){e.body=r.concat([e.body,new r(t)])})),e.on("error",a),e.on("end",(function(){n(e)}))}))}))}(t,n).then((function(o){if(o.statusCode>=400)throw a({status:o.statusCode},"HTTP ERROR %d",o.statusCode);if(o.statusCode>=300)if(l.length>n.redirects)u(a({status:o.statusCode},"Error downloading %s. \nToo many redirects: \n  %s",l[0],l.join(" \n  ")));else{if(!o.headers.location)throw a({status:o.statusCode},"HTTP %d redirect with no location header",o.statusCode);var i=s.resolve(t,o.headers.location);e(i,n,l).then(c,u)}else c(o.body||new r(0))})).catch((function(e){u(a(e,"Error downloading",t.href))}))}))}(n,this)}}}).call(this,n(14),n(15).Buffer)},function(e,t,n){(function(t,r,o){var i=n(135),a=n(31),s=n(136),l=n(137),c=n(276),u=s.IncomingMessage,p=s.readyStates;var f=e.exports=function(e){var n,r=this;l.Writable.call(r),r._opts=e,r._body=[],r._headers={},e.auth&&r.setHeader("Authorization","Basic "+new t(e.auth).toString("base64")),Object.keys(e.headers).forEach((function(t){r.setHeader(t,e.headers[t])}));var o=!0;if("disable-fetch"===e.mode||"requestTimeout"in e&&!i.abortController)o=!1,n=!0;else if("prefer-streaming"===e.mode)n=!1;else if("allow-wrong-content-type"===e.mode)n=!i.overrideMimeType;else{if(e.mode&&"default"!==e.mode&&"prefer-fast"!==e.mode)throw new Error("Invalid value for opts.mode");n=!0}r._mode=function(e,t){return i.fetch&&t?"fetch":i.mozchunkedarraybuffer?"moz-chunked-arraybuffer":i.msstream?"ms-stream":i.arraybuffer&&e?"arraybuffer":i.vbArray&&e?"text:vbarray":"text"}(n,o),r._fetchTimer=null,r.on("finish",(function(){r._onFinish()}))};a(f,l.Writable),f.prototype.setHeader=function(e,t){var n=e.toLowerCase();-1===d.indexOf(n)&&(this._headers[n]={name:e,value:t})},f.prototype.getHeader=function(e){var t=this._headers[e.toLowerCase()];return t?t.value:null},f.prototype.removeHeader=function(e){delete this._headers[e.toLowerCase()]},f.prototype._onFinish=function(){var e=this;if(!e._destroyed){var n=e._opts,a=e._headers,s=null;"GET"!==n.method&&"HEAD"!==n.method&&(s=i.arraybuffer?c(t.concat(e._body)):i.blobConstructor?new r.Blob(e._body.map((function(e){return c(e)})),{type:(a["content-type"]||{}).value||""}):t.concat(e._body).toString());var l=[];if(Object.keys(a).forEach((function(e){var t=a[e].name,n=a[e].value;Array.isArray(n)?n.forEach((function(e){l.push([t,e])})):l.push([t,n])})),"fetch"===e._mode){var u=null;if(i.abortController){var f=new AbortController;u=f.signal,e._fetchAbortController=f,"requestTimeout"in n&&0!==n.requestTimeout&&(e._fetchTimer=r.setTimeout((function(){e.emit("requestTimeout"),e._fetchAbortController&&e._fetchAbortController.abort()}),n.requestTimeout))}r.fetch(e._opts.url,{method:e._opts.method,headers:l,body:s||void 0,mode:"cors",credentials:n.withCredentials?"include":"same-origin",signal:u}).then((function(t){e._fetchResponse=t,e._connect()}),(function(t){r.clearTimeout(e._fetchTimer),e._destroyed||e.emit("error",t)}))}else{var d=e._xhr=new r.XMLHttpRequest;try{d.open(e._opts.method,e._opts.url,!0)}catch(t){return void o.nextTick((function(){e.emit("error",t)}))}"responseType"in d&&(d.responseType=e._mode.split(":")[0]),"withCredentials"in d&&(d.withCredentials=!!n.withCredentials),"text"===e._mode&&"overrideMimeType"in d&&d.overrideMimeType("text/plain; charset=x-user-defined"),"requestTimeout"in n&&(d.timeout=n.requestTimeout,d.ontimeout=function(){e.emit("requestTimeout")}),l.forEach((function(e){d.setRequestHeader(e[0],e[1])})),e._response=null,d.onreadystatechange=function(){switch(d.readyState){case p.LOADING:case p.DONE:e._onXHRProgress()}},"moz-chunked-arraybuffer"===e._mode&&(d.onprogress=function(){e._onXHRProgress()}),d.onerror=function(){e._destroyed||e.emit("error",new Error("XHR error"))};try{d.send(s)}catch(t){return void o.nextTick((function(){e.emit("error",t)}))}}}},f.prototype._onXHRProgress=function(){(function(e){try{var t=e.status;return null!==t&&0!==t}catch(e){return!1}})(this._xhr)&&!this._destroyed&&(this._response||this._connect(),this._response._onXHRProgress())},f.prototype._connect=function(){var e=this;e._destroyed||(e._response=new u(e._xhr,e._fetchResponse,e._mode,e._fetchTimer),e._response.on("error",(function(t){e.emit("error",t)})),e.emit("response",e._response))},f.prototype._write=function(e,t,n){this._body.push(e),n()},f.prototype.abort=f.prototype.destroy=function(){this._destroyed=!0,r.clearTimeout(this._fetchTimer),this._response&&(this._response._destroyed=!0),this._xhr?this._xhr.abort():this._fetchAbortController&&this._fetchAbortController.abort()},f.prototype.end=function(e,t,n){"function"==typeof e&&(n=e,e=void 0),l.Writable.prototype.end.call(this,e,t,n)},f.prototype.flushHeaders=function(){},f.prototype.setTimeout=function(){},f.prototype.setNoDelay=function(){},f.prototype.setSocketKeepAlive=function(){};var d=["accept-charset","accept-encoding","access-control-request-headers","access-control-request-method","connection","content-length","cookie","cookie2","date","dnt","expect","host","keep-alive","origin","referer","te","trailer","transfer-encoding","upgrade","via"]}).call(this,n(15).Buffer,n(5),n(14))},function(e,t){},function(e,t,n){"use strict";var r=n(59).Buffer,o=n(271);e.exports=function(){function e(){!function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}(this,e),this.head=null,this.tail=null,this.length=0}return e.prototype.push=function(e){var t={data:e,next:null};this.length>0?this.tail.next=t:this.head=t,this.tail=t,++this.length},e.prototype.unshift=function(e){var t={data:e,next:this.head};0===this.length&&(this.tail=t),this.head=t,++this.length},e.prototype.shift=function(){if(0!==this.length){var e=this.head.data;return 1===this.length?this.head=this.tail=null:this.head=this.head.next,--this.length,e}},e.prototype.clear=function(){this.head=this.tail=null,this.length=0},e.prototype.join=function(e){if(0===this.length)return"";for(var t=this.head,n=""+t.data;t=t.next;)n+=e+t.data;return n},e.prototype.concat=function(e){if(0===this.length)return r.alloc(0);if(1===this.length)return this.head.data;for(var t,n,o,i=r.allocUnsafe(e>>>0),a=this.head,s=0;a;)t=a.data,n=i,o=s,t.copy(n,o),s+=a.data.length,a=a.next;return i},e}(),o&&o.inspect&&o.inspect.custom&&(e.exports.prototype[o.inspect.custom]=function(){var e=o.inspect({length:this.length});return this.constructor.name+" "+e})},function(e,t){},function(e,t,n){(function(e){var r=void 0!==e&&e||"undefined"!=typeof self&&self||window,o=Function.prototype.apply;function i(e,t){this._id=e,this._clearFn=t}t.setTimeout=function(){return new i(o.call(setTimeout,r,arguments),clearTimeout)},t.setInterval=function(){return new i(o.call(setInterval,r,arguments),clearInterval)},t.clearTimeout=t.clearInterval=function(e){e&&e.close()},i.prototype.unref=i.prototype.ref=function(){},i.prototype.close=function(){this._clearFn.call(r,this._id)},t.enroll=function(e,t){clearTimeout(e._idleTimeoutId),e._idleTimeout=t},t.unenroll=function(e){clearTimeout(e._idleTimeoutId),e._idleTimeout=-1},t._unrefActive=t.active=function(e){clearTimeout(e._idleTimeoutId);var t=e._idleTimeout;t>=0&&(e._idleTimeoutId=setTimeout((function(){e._onTimeout&&e._onTimeout()}),t))},n(273),t.setImmediate="undefined"!=typeof self&&self.setImmediate||void 0!==e&&e.setImmediate||this&&this.setImmediate,t.clearImmediate="undefined"!=typeof self&&self.clearImmediate||void 0!==e&&e.clearImmediate||this&&this.clearImmediate}).call(this,n(5))},function(e,t,n){(function(e,t){!function(e,n){"use strict";if(!e.setImmediate){var r,o,i,a,s,l=1,c={},u=!1,p=e.document,f=Object.getPrototypeOf&&Object.getPrototypeOf(e);f=f&&f.setTimeout?f:e,"[object process]"==={}.toString.call(e.process)?r=function(e){t.nextTick((function(){h(e)}))}:!function(){if(e.postMessage&&!e.importScripts){var t=!0,n=e.onmessage;return e.onmessage=function(){t=!1},e.postMessage("","*"),e.onmessage=n,t}}()?e.MessageChannel?((i=new MessageChannel).port1.onmessage=function(e){h(e.data)},r=function(e){i.port2.postMessage(e)}):p&&"onreadystatechange"in p.createElement("script")?(o=p.documentElement,r=function(e){var t=p.createElement("script");t.onreadystatechange=function(){h(e),t.onreadystatechange=null,o.removeChild(t),t=null},o.appendChild(t)}):r=function(e){setTimeout(h,0,e)}:(a="setImmediate$"+Math.random()+"$",s=function(t){t.source===e&&"string"==typeof t.data&&0===t.data.indexOf(a)&&h(+t.data.slice(a.length))},e.addEventListener?e.addEventListener("message",s,!1):e.attachEvent("onmessage",s),r=function(t){e.postMessage(a+t,"*")}),f.setImmediate=function(e){"function"!=typeof e&&(e=new Function(""+e));for(var t=new Array(arguments.length-1),n=0;n<t.length;n++)t[n]=arguments[n+1];var o={callback:e,args:t};return c[l]=o,r(l),l++},f.clearImmediate=d}function d(e){delete c[e]}function h(e){if(u)setTimeout(h,0,e);else{var t=c[e];if(t){u=!0;try{!function(e){var t=e.callback,n=e.args;switch(n.length){case 0:t();break;case 1:t(n[0]);break;case 2:t(n[0],n[1]);break;case 3:t(n[0],n[1],n[2]);break;default:t.apply(void 0,n)}}(t)}finally{d(e),u=!1}}}}}("undefined"==typeof self?void 0===e?this:e:self)}).call(this,n(5),n(14))},function(e,t,n){(function(t){function n(e){try{if(!t.localStorage)return!1}catch(e){return!1}var n=t.localStorage[e];return null!=n&&"true"===String(n).toLowerCase()}e.exports=function(e,t){if(n("noDeprecation"))return e;var r=!1;return function(){if(!r){if(n("throwDeprecation"))throw new Error(t);n("traceDeprecation")?console.trace(t):console.warn(t),r=!0}return e.apply(this,arguments)}}}).call(this,n(5))},function(e,t,n){"use strict";e.exports=i;var r=n(144),o=Object.create(n(48));function i(e){if(!(this instanceof i))return new i(e);r.call(this,e)}o.inherits=n(31),o.inherits(i,r),i.prototype._transform=function(e,t,n){n(null,e)}},function(e,t,n){var r=n(15).Buffer;e.exports=function(e){if(e instanceof Uint8Array){if(0===e.byteOffset&&e.byteLength===e.buffer.byteLength)return e.buffer;if("function"==typeof e.buffer.slice)return e.buffer.slice(e.byteOffset,e.byteOffset+e.byteLength)}if(r.isBuffer(e)){for(var t=new Uint8Array(e.length),n=e.length,o=0;o<n;o++)t[o]=e[o];return t.buffer}throw new Error("Argument must be a Buffer")}},function(e,t){e.exports=function(){for(var e={},t=0;t<arguments.length;t++){var r=arguments[t];for(var o in r)n.call(r,o)&&(e[o]=r[o])}return e};var n=Object.prototype.hasOwnProperty},function(e,t){e.exports={100:"Continue",101:"Switching Protocols",102:"Processing",200:"OK",201:"Created",202:"Accepted",203:"Non-Authoritative Information",204:"No Content",205:"Reset Content",206:"Partial Content",207:"Multi-Status",208:"Already Reported",226:"IM Used",300:"Multiple Choices",301:"Moved Permanently",302:"Found",303:"See Other",304:"Not Modified",305:"Use Proxy",307:"Temporary Redirect",308:"Permanent Redirect",400:"Bad Request",401:"Unauthorized",402:"Payment Required",403:"Forbidden",404:"Not Found",405:"Method Not Allowed",406:"Not Acceptable",407:"Proxy Authentication Required",408:"Request Timeout",409:"Conflict",410:"Gone",411:"Length Required",412:"Precondition Failed",413:"Payload Too Large",414:"URI Too Long",415:"Unsupported Media Type",416:"Range Not Satisfiable",417:"Expectation Failed",418:"I'm a teapot",421:"Misdirected Request",422:"Unprocessable Entity",423:"Locked",424:"Failed Dependency",425:"Unordered Collection",426:"Upgrade Required",428:"Precondition Required",429:"Too Many Requests",431:"Request Header Fields Too Large",451:"Unavailable For Legal Reasons",500:"Internal Server Error",501:"Not Implemented",502:"Bad Gateway",503:"Service Unavailable",504:"Gateway Timeout",505:"HTTP Version Not Supported",506:"Variant Also Negotiates",507:"Insufficient Storage",508:"Loop Detected",509:"Bandwidth Limit Exceeded",510:"Not Extended",511:"Network Authentication Required"}},function(e,t,n){var r=n(90),o=n(10),i=e.exports;for(var a in r)r.hasOwnProperty(a)&&(i[a]=r[a]);function s(e){if("string"==typeof e&&(e=o.parse(e)),e.protocol||(e.protocol="https:"),"https:"!==e.protocol)throw new Error('Protocol "'+e.protocol+'" not supported. Expected "https:"');return e}i.request=function(e,t){return e=s(e),r.request.call(this,e,t)},i.get=function(e,t){return e=s(e),r.get.call(this,e,t)}},function(e,t,n){"use strict";var r=n(30),o=n(60),i=n(25);function a(){this.circular=!1,this._$refs={},this._root$Ref=null}function s(e,t){var n=Object.keys(e);return(t=Array.isArray(t[0])?t[0]:Array.prototype.slice.call(t)).length>0&&t[0]&&(n=n.filter((function(n){return-1!==t.indexOf(e[n].pathType)}))),n.map((function(t){return{encoded:t,decoded:"file"===e[t].pathType?i.toFileSystemPath(t,!0):t}}))}e.exports=a,a.prototype.paths=function(e){var t=s(this._$refs,arguments);return t.map((function(e){return e.decoded}))},a.prototype.values=function(e){var t=this._$refs,n=s(t,arguments);return n.reduce((function(e,n){return e[n.decoded]=t[n.encoded].value,e}),{})},a.prototype.toJSON=a.prototype.values,a.prototype.exists=function(e,t){try{return this._resolve(e,t),!0}catch(e){return!1}},a.prototype.get=function(e,t){return this._resolve(e,t).value},a.prototype.set=function(e,t){var n=i.resolve(this._root$Ref.path,e),o=i.stripHash(n),a=this._$refs[o];if(!a)throw r('Error resolving $ref pointer "%s". \n"%s" not found.',e,o);a.set(n,t)},a.prototype._add=function(e){var t=i.stripHash(e),n=new o;return n.path=t,n.$refs=this,this._$refs[t]=n,this._root$Ref=this._root$Ref||n,n},a.prototype._resolve=function(e,t){var n=i.resolve(this._root$Ref.path,e),o=i.stripHash(n),a=this._$refs[o];if(!a)throw r('Error resolving $ref pointer "%s". \n"%s" not found.',e,o);return a.resolve(n,t,e)},a.prototype._get$Ref=function(e){e=i.resolve(this._root$Ref.path,e);var t=i.stripHash(e);return this._$refs[t]}},function(e,t,n){"use strict";function r(e,t,n,r){var o=e[t];if("function"==typeof o)return o.apply(e,[n,r]);if(!r){if(o instanceof RegExp)return o.test(n.url);if("string"==typeof o)return o===n.extension;if(Array.isArray(o))return-1!==o.indexOf(n.extension)}return o}t.all=function(e){return Object.keys(e).filter((function(t){return"object"==typeof e[t]})).map((function(t){return e[t].name=t,e[t]}))},t.filter=function(e,t,n){return e.filter((function(e){return!!r(e,t,n)}))},t.sort=function(e){return e.forEach((function(e){e.order=e.order||Number.MAX_SAFE_INTEGER})),e.sort((function(e,t){return e.order-t.order}))},t.run=function(e,t,n){var o,i,a=0;return new Promise((function(s,l){function c(){if(!(o=e[a++]))return l(i);try{var s=r(o,t,n,u);s&&"function"==typeof s.then?s.then(p,f):void 0!==s&&p(s)}catch(e){f(e)}}function u(e,t){e?f(e):p(t)}function p(e){s({plugin:o,result:e})}function f(e){i=e,c()}c()}))}},function(e,t,n){"use strict";var r=n(131);e.exports=function(e){var t,n,o,i;"function"==typeof(e=Array.prototype.slice.call(e))[e.length-1]&&(i=e.pop());"string"==typeof e[0]?(t=e[0],"object"==typeof e[2]?(n=e[1],o=e[2]):(n=void 0,o=e[1])):(t="",n=e[0],o=e[1]);o instanceof r||(o=new r(o));return{path:t,schema:n,options:o,callback:i}}},function(e,t,n){"use strict";var r=n(60),o=n(91),i=n(145),a=n(25);function s(e,t,n,i){var a=[];return e&&"object"==typeof e&&(r.isExternal$Ref(e)?a.push(l(e,t,n,i)):Object.keys(e).forEach((function(c){var u=o.join(t,c),p=e[c];r.isExternal$Ref(p)?a.push(l(p,u,n,i)):a=a.concat(s(p,u,n,i))}))),a}function l(e,t,n,r){var o=a.resolve(t,e.$ref),l=a.stripHash(o);return(e=n._$refs[l])?Promise.resolve(e.value):i(o,n,r).then((function(e){var t=s(e,l+"#",n,r);return Promise.all(t)}))}e.exports=function(e,t){if(!t.resolve.external)return Promise.resolve();try{var n=s(e.schema,e.$refs._root$Ref.path+"#",e.$refs,t);return Promise.all(n)}catch(e){return Promise.reject(e)}}},function(e,t,n){"use strict";var r=n(60),o=n(91),i=n(25);function a(e,t,n,i,l,c,u,p){var f=null===t?e:e[t];f&&"object"==typeof f&&(r.isAllowed$Ref(f)?s(e,t,n,i,l,c,u,p):Object.keys(f).sort((function(e,t){return"definitions"===e?-1:"definitions"===t?1:e.length-t.length})).forEach((function(e){var t=o.join(n,e),d=o.join(i,e),h=f[e];r.isAllowed$Ref(h)?s(f,e,n,d,l,c,u,p):a(f,e,t,d,l,c,u,p)})))}function s(e,t,n,s,l,c,u,p){var f=null===t?e:e[t],d=i.resolve(n,f.$ref),h=u._resolve(d,p),m=o.parse(s).length,g=i.stripHash(h.path),y=i.getHash(h.path),v=g!==u._root$Ref.path,b=r.isExtended$Ref(f);l+=h.indirections;var x=function(e,t,n){for(var r=0;r<e.length;r++){var o=e[r];if(o.parent===t&&o.key===n)return o}}(c,e,t);if(x){if(!(m<x.depth||l<x.indirections))return;!function(e,t){var n=e.indexOf(t);e.splice(n,1)}(c,x)}c.push({$ref:f,parent:e,key:t,pathFromRoot:s,depth:m,file:g,hash:y,value:h.value,circular:h.circular,extended:b,external:v,indirections:l}),a(h.value,null,h.path,s,l+1,c,u,p)}e.exports=function(e,t){var n=[];a(e,"schema",e.$refs._root$Ref.path+"#","#",0,n,e.$refs,t),function(e){var t,n,i;e.sort((function(e,t){if(e.file!==t.file)return e.file<t.file?-1:1;if(e.hash!==t.hash)return e.hash<t.hash?-1:1;if(e.circular!==t.circular)return e.circular?-1:1;if(e.extended!==t.extended)return e.extended?1:-1;if(e.indirections!==t.indirections)return e.indirections-t.indirections;if(e.depth!==t.depth)return e.depth-t.depth;var n=e.pathFromRoot.lastIndexOf("/definitions"),r=t.pathFromRoot.lastIndexOf("/definitions");return n!==r?r-n:e.pathFromRoot.length-t.pathFromRoot.length})),e.forEach((function(e){e.external?e.file===t&&e.hash===n?e.$ref.$ref=i:e.file===t&&0===e.hash.indexOf(n+"/")?e.$ref.$ref=o.join(i,o.parse(e.hash.replace(n,"#"))):(t=e.file,n=e.hash,i=e.pathFromRoot,e.$ref=e.parent[e.key]=r.dereference(e.$ref,e.value),e.circular&&(e.$ref.$ref=e.pathFromRoot)):e.$ref.$ref=e.hash}))}(n)}},function(e,t){e.exports=function(){}},function(e,t,n){"use strict";var r=n(1),o=n(147),i=n(49),a=n(10),s=n(61),l=n(61),c=n(62).jptr,u=n(93).recurse,p=n(63).clone,f=n(287).dereference,d=n(92).isRef,h=n(148);function m(e,t,n,r,o,i){for(var s=i.externalRefs[n+r].paths[0],l=a.parse(o),f={},m=1;m;)m=0,u(e,{identityDetection:!0},(function(e,n,r){if(d(e,n))if(e[n].startsWith("#"))if(f[e[n]]||e.$fixed){if(!e.$fixed){var u=(s+"/"+f[e[n]]).split("/#/").join("/");r.parent[r.pkey]={$ref:u,"x-miro":e[n],$fixed:!0},i.verbose>1&&console.warn("Replacing with",u),m++}}else{var g=p(c(t,e[n]));if(i.verbose>1&&console.warn((!1===g?h.colour.red:h.colour.green)+"Fragment resolution",e[n],h.colour.normal),!1===g){if(r.parent[r.pkey]={},i.fatal){var y=new Error("Fragment $ref resolution failed "+e[n]);if(!i.promise)throw y;i.promise.reject(y)}}else m++,r.parent[r.pkey]=g,f[e[n]]=r.path.replace("/%24ref","")}else if(l.protocol){u=a.resolve(o,e[n]).toString();i.verbose>1&&console.warn(h.colour.yellow+"Rewriting external url ref",e[n],"as",u,h.colour.normal),e["x-miro"]=e[n],e[n]=u}else if(!e["x-miro"]){u=a.resolve(o,e[n]).toString();i.verbose>1&&console.warn(h.colour.yellow+"Rewriting external ref",e[n],"as",u,h.colour.normal),e["x-miro"]=e[n],e[n]=u}}));return u(e,{},(function(e,t,n){d(e,t)&&void 0!==e.$fixed&&delete e.$fixed})),i.verbose>1&&console.warn("Finished fragment resolution"),e}function g(e,t){if(!t.filters||!t.filters.length)return e;for(var n=0,r=t.filters;n<r.length;n++){e=(0,r[n])(e,t)}return e}function y(e,t,n,r){var s=a.parse(n.source),u=n.source.split("\\").join("/").split("/");u.pop()||u.pop();var f="",d=t.split("#");d.length>1&&(f="#"+d[1],t=d[0]),u=u.join("/");var h,y,v,b,x,w=a.parse(t),k=(h=w.protocol,y=s.protocol,h&&h.length>2?h:y&&y.length>2?y:"file:");if(v="file:"===k?i.resolve(u?u+"/":"",t):a.resolve(u?u+"/":"",t),n.cache[v]){n.verbose&&console.warn("CACHED",v,f);var O=p(n.cache[v]),E=n.externalRef=O;if(f&&!1===(E=c(E,f))&&(E={},n.fatal)){var _=new Error("Cached $ref resolution failed "+v+f);if(!n.promise)throw _;n.promise.reject(_)}return E=g(E=m(E,O,t,f,v,n),n),r(p(E),v,n),Promise.resolve(E)}if(n.verbose&&console.warn("GET",v,f),n.handlers&&n.handlers[k])return n.handlers[k](u,t,f,n).then((function(e){return n.externalRef=e,e=g(e,n),n.cache[v]=e,r(e,v,n),e})).catch((function(e){throw n.verbose&&console.warn(e),e}));if(k&&k.startsWith("http")){var S=Object.assign({},n.fetchOptions,{agent:n.agent});return n.fetch(v,S).then((function(e){if(200!==e.status)throw new Error("Received status code "+e.status+": "+v);return e.text()})).then((function(e){try{var o=l.parse(e,{schema:"core",prettyErrors:!0});if(e=n.externalRef=o,n.cache[v]=p(e),f&&!1===(e=c(e,f))&&(e={},n.fatal)){var i=new Error("Remote $ref resolution failed "+v+f);if(!n.promise)throw i;n.promise.reject(i)}e=g(e=m(e,o,t,f,v,n),n)}catch(i){if(n.verbose&&console.warn(i),!n.promise||!n.fatal)throw i;n.promise.reject(i)}return r(e,v,n),e})).catch((function(e){if(n.verbose&&console.warn(e),n.cache[v]={},!n.promise||!n.fatal)throw e;n.promise.reject(e)}))}return(b=v,x=n.encoding||"utf8",new Promise((function(e,t){o.readFile(b,x,(function(n,r){n?t(n):e(r)}))}))).then((function(e){try{var o=l.parse(e,{schema:"core",prettyErrors:!0});if(e=n.externalRef=o,n.cache[v]=p(e),f&&!1===(e=c(e,f))&&(e={},n.fatal)){var i=new Error("File $ref resolution failed "+v+f);if(!n.promise)throw i;n.promise.reject(i)}e=g(e=m(e,o,t,f,v,n),n)}catch(i){if(n.verbose&&console.warn(i),!n.promise||!n.fatal)throw i;n.promise.reject(i)}return r(e,v,n),e})).catch((function(e){if(n.verbose&&console.warn(e),!n.promise||!n.fatal)throw e;n.promise.reject(e)}))}function v(e){return new Promise((function(t,n){(function(e){return new Promise((function(t,n){function r(t,n,r){if(t[n]&&d(t[n],"$ref")){var i=t[n].$ref;if(!i.startsWith("#")){var a="";if(!o[i]){var s=Object.keys(o).find((function(e,t,n){return i.startsWith(e+"/")}));s&&(e.verbose&&console.warn("Found potential subschema at",s),a=(a="/"+(i.split("#")[1]||"").replace(s.split("#")[1]||"")).split("/undefined").join(""),i=s)}if(o[i]||(o[i]={resolved:!1,paths:[],extras:{},description:t[n].description}),o[i].resolved)if(e.rewriteRefs){var l=o[i].resolvedAt;e.verbose>1&&console.warn("Rewriting ref",i,l),t[n]["x-miro"]=i,t[n].$ref=l+a}else t[n]=p(o[i].data);else o[i].paths.push(r.path),o[i].extras[r.path]=a}}}var o=e.externalRefs;if(e.resolver.depth>0&&e.source===e.resolver.base)return t(o);u(e.openapi.definitions,{identityDetection:!0,path:"#/definitions"},r),u(e.openapi.components,{identityDetection:!0,path:"#/components"},r),u(e.openapi,{identityDetection:!0},r),t(o)}))})(e).then((function(t){var n=function(n){if(!t[n].resolved){var o=e.resolver.depth;o>0&&o++,e.resolver.actions[o].push((function(){return y(e.openapi,n,e,(function(e,o,i){if(!t[n].resolved){var a={};a.context=t[n],a.$ref=n,a.original=p(e),a.updated=e,a.source=o,i.externals.push(a),t[n].resolved=!0}var s=Object.assign({},i,{source:"",resolver:{actions:i.resolver.actions,depth:i.resolver.actions.length-1,base:i.resolver.base}});i.patch&&t[n].description&&!e.description&&"object"==typeof e&&(e.description=t[n].description),t[n].data=e;for(var l,u=(l=t[n].paths,r.__spreadArrays(new Set(l))),f=0,d=u=u.sort((function(e,t){var n=e.startsWith("#/components/")||e.startsWith("#/definitions/"),r=t.startsWith("#/components/")||t.startsWith("#/definitions/");return n&&!r?-1:r&&!n?1:0}));f<d.length;f++){var h=d[f];if(t[n].resolvedAt&&h!==t[n].resolvedAt&&h.indexOf("x-ms-examples/")<0)i.verbose>1&&console.warn("Creating pointer to data at",h),c(i.openapi,h,{$ref:t[n].resolvedAt+t[n].extras[h],"x-miro":n+t[n].extras[h]});else{t[n].resolvedAt?i.verbose>1&&console.warn("Avoiding circular reference"):(t[n].resolvedAt=h,i.verbose>1&&console.warn("Creating initial clone of data at",h));var m=p(e);c(i.openapi,h,m)}}0===i.resolver.actions[s.resolver.depth].length&&i.resolver.actions[s.resolver.depth].push((function(){return v(s)}))}))}))}};for(var o in t)n(o)})).catch((function(t){e.verbose&&console.warn(t),n(t)}));var o={options:e};o.actions=e.resolver.actions[e.resolver.depth],t(o)}))}function b(e,t,n){e.resolver.actions.push([]),v(e).then((function(r){var o;(o=r.actions,o.reduce((function(e,t){return e.then((function(e){return t().then(Array.prototype.concat.bind(e))}))}),Promise.resolve([]))).then((function(){if(e.resolver.depth>=e.resolver.actions.length)return console.warn("Ran off the end of resolver actions"),t(!0);e.resolver.depth++,e.resolver.actions[e.resolver.depth].length?setTimeout((function(){b(r.options,t,n)}),0):(e.verbose>1&&console.warn(h.colour.yellow+"Finished external resolution!",h.colour.normal),e.resolveInternal&&(e.verbose>1&&console.warn(h.colour.yellow+"Starting internal resolution!",h.colour.normal),e.openapi=f(e.openapi,e.original,{verbose:e.verbose-1}),e.verbose>1&&console.warn(h.colour.yellow+"Finished internal resolution!",h.colour.normal)),u(e.openapi,{},(function(t,n,r){d(t,n)&&(e.preserveMiro||delete t["x-miro"])})),t(e))})).catch((function(t){e.verbose&&console.warn(t),n(t)}))})).catch((function(t){e.verbose&&console.warn(t),n(t)}))}function x(e){if(e.cache||(e.cache={}),e.fetch||(e.fetch=s),e.source){var t=a.parse(e.source);(!t.protocol||t.protocol.length<=2)&&(e.source=i.resolve(e.source))}e.externals||(e.externals=[]),e.externalRefs||(e.externalRefs={}),e.rewriteRefs=!0,e.resolver={},e.resolver.depth=0,e.resolver.base=e.source,e.resolver.actions=[[]]}e.exports={optionalResolve:function(e){return x(e),new Promise((function(t,n){e.resolve?b(e,t,n):t(e)}))},resolve:function(e,t,n){return n||(n={}),n.openapi=e,n.source=t,n.resolve=!0,x(n),new Promise((function(e,t){b(n,e,t)}))}}},function(e,t,n){"use strict";var r=n(93).recurse,o=n(63).shallowClone,i=n(62).jptr,a=n(92).isRef;e.exports={dereference:function e(t,n,s){s||(s={}),s.cache||(s.cache={}),s.state||(s.state={}),s.state.identityDetection=!0,s.depth=s.depth?s.depth+1:1;var l=s.depth>1?t:o(t),c={data:l},u=s.depth>1?n:o(n);s.master||(s.master=l);for(var p=function(e){return e&&e.verbose?{warn:function(){var e=Array.prototype.slice.call(arguments);console.warn.apply(console,e)}}:{warn:function(){}}}(s),f=1;f>0;)f=0,r(c,s.state,(function(t,n,r){if(a(t,n)){var o,l=t[n];if(f++,s.cache[l])if((o=s.cache[l]).resolved)p.warn("Patching %s for %s",l,o.path),r.parent[r.pkey]=o.data,s.$ref&&"object"==typeof r.parent[r.pkey]&&(r.parent[r.pkey][s.$ref]=l);else{if(l===o.path)throw new Error("Tight circle at "+o.path);p.warn("Unresolved ref"),r.parent[r.pkey]=i(o.source,o.path),!1===r.parent[r.pkey]&&(r.parent[r.pkey]=i(o.source,o.key)),s.$ref&&"object"==typeof r.parent[r.pkey]&&(r.parent[s.$ref]=l)}else(o={}).path=r.path.split("/$ref")[0],o.key=l,p.warn("Dereffing %s at %s",l,o.path),o.source=u,o.data=i(o.source,o.key),!1===o.data&&(o.data=i(s.master,o.key),o.source=s.master),!1===o.data&&p.warn("Missing $ref target",o.key),s.cache[l]=o,o.data=r.parent[r.pkey]=e(i(o.source,o.key),o.source,s),s.$ref&&"object"==typeof r.parent[r.pkey]&&(r.parent[r.pkey][s.$ref]=l),o.resolved=!0}}));return c.data}}},function(e,t){e.exports=o,o.default=o,o.stable=a,o.stableStringify=a;var n=[],r=[];function o(e,t,o){var i;for(!function e(t,o,i,a){var s;if("object"==typeof t&&null!==t){for(s=0;s<i.length;s++)if(i[s]===t){var l=Object.getOwnPropertyDescriptor(a,o);return void(void 0!==l.get?l.configurable?(Object.defineProperty(a,o,{value:"[Circular]"}),n.push([a,o,t,l])):r.push([t,o]):(a[o]="[Circular]",n.push([a,o,t])))}if(i.push(t),Array.isArray(t))for(s=0;s<t.length;s++)e(t[s],s,i,t);else{var c=Object.keys(t);for(s=0;s<c.length;s++){var u=c[s];e(t[u],u,i,t)}}i.pop()}}(e,"",[],void 0),i=0===r.length?JSON.stringify(e,t,o):JSON.stringify(e,s(t),o);0!==n.length;){var a=n.pop();4===a.length?Object.defineProperty(a[0],a[1],a[3]):a[0][a[1]]=a[2]}return i}function i(e,t){return e<t?-1:e>t?1:0}function a(e,t,o){var a,l=function e(t,o,a,s){var l;if("object"==typeof t&&null!==t){for(l=0;l<a.length;l++)if(a[l]===t){var c=Object.getOwnPropertyDescriptor(s,o);return void(void 0!==c.get?c.configurable?(Object.defineProperty(s,o,{value:"[Circular]"}),n.push([s,o,t,c])):r.push([t,o]):(s[o]="[Circular]",n.push([s,o,t])))}if("function"==typeof t.toJSON)return;if(a.push(t),Array.isArray(t))for(l=0;l<t.length;l++)e(t[l],l,a,t);else{var u={},p=Object.keys(t).sort(i);for(l=0;l<p.length;l++){var f=p[l];e(t[f],f,a,t),u[f]=t[f]}if(void 0===s)return u;n.push([s,o,t]),s[o]=u}a.pop()}}(e,"",[],void 0)||e;for(a=0===r.length?JSON.stringify(l,t,o):JSON.stringify(l,s(t),o);0!==n.length;){var c=n.pop();4===c.length?Object.defineProperty(c[0],c[1],c[3]):c[0][c[1]]=c[2]}return a}function s(e){return e=void 0!==e?e:function(e,t){return t},function(t,n){if(r.length>0)for(var o=0;o<r.length;o++){var i=r[o];if(i[1]===t&&i[0]===n){n="[Circular]",r.splice(o,1);break}}return e.call(this,t,n)}}},function(e,t,n){"use strict";function r(){return{depth:0,seen:new WeakMap,top:!0,combine:!1,allowRefSiblings:!1}}e.exports={getDefaultState:r,walkSchema:function e(t,n,o,i){if(void 0===o.depth&&(o=r()),null==t)return t;if(void 0!==t.$ref){var a={$ref:t.$ref};return o.allowRefSiblings&&t.description&&(a.description=t.description),i(a,n,o),a}if(o.combine&&(t.allOf&&Array.isArray(t.allOf)&&1===t.allOf.length&&delete(t=Object.assign({},t.allOf[0],t)).allOf,t.anyOf&&Array.isArray(t.anyOf)&&1===t.anyOf.length&&delete(t=Object.assign({},t.anyOf[0],t)).anyOf,t.oneOf&&Array.isArray(t.oneOf)&&1===t.oneOf.length&&delete(t=Object.assign({},t.oneOf[0],t)).oneOf),i(t,n,o),o.seen.has(t))return t;if("object"==typeof t&&null!==t&&o.seen.set(t,!0),o.top=!1,o.depth++,void 0!==t.items&&(o.property="items",e(t.items,t,o,i)),t.additionalItems&&"object"==typeof t.additionalItems&&(o.property="additionalItems",e(t.additionalItems,t,o,i)),t.additionalProperties&&"object"==typeof t.additionalProperties&&(o.property="additionalProperties",e(t.additionalProperties,t,o,i)),t.properties)for(var s in t.properties){var l=t.properties[s];o.property="properties/"+s,e(l,t,o,i)}if(t.patternProperties)for(var s in t.patternProperties){l=t.patternProperties[s];o.property="patternProperties/"+s,e(l,t,o,i)}if(t.allOf)for(var c in t.allOf){l=t.allOf[c];o.property="allOf/"+c,e(l,t,o,i)}if(t.anyOf)for(var c in t.anyOf){l=t.anyOf[c];o.property="anyOf/"+c,e(l,t,o,i)}if(t.oneOf)for(var c in t.oneOf){l=t.oneOf[c];o.property="oneOf/"+c,e(l,t,o,i)}return t.not&&(o.property="not",e(t.not,t,o,i)),o.depth--,t}}},function(e,t,n){"use strict";var r=n(90);e.exports={statusCodes:Object.assign({},{default:"Default response","1XX":"Informational",103:"Early hints","2XX":"Successful","3XX":"Redirection","4XX":"Client Error","5XX":"Server Error","7XX":"Developer Error"},r.STATUS_CODES)}},function(e){e.exports=JSON.parse('{"name":"swagger2openapi","version":"6.2.1","description":"Convert Swagger 2.0 definitions to OpenApi 3.0 and validate","main":"index.js","bin":{"swagger2openapi":"./swagger2openapi.js","oas-validate":"./oas-validate.js","boast":"./boast.js"},"funding":"https://github.com/Mermade/oas-kit?sponsor=1","scripts":{"test":"mocha"},"browserify":{"transform":[["babelify",{"presets":["es2015"]}]]},"repository":{"url":"https://github.com/Mermade/oas-kit.git","type":"git"},"bugs":{"url":"https://github.com/mermade/oas-kit/issues"},"author":"Mike Ralphson <mike.ralphson@gmail.com>","license":"BSD-3-Clause","dependencies":{"better-ajv-errors":"^0.6.1","call-me-maybe":"^1.0.1","node-fetch-h2":"^2.3.0","node-readfiles":"^0.2.0","oas-kit-common":"^1.0.8","oas-resolver":"^2.4.1","oas-schema-walker":"^1.1.4","oas-validator":"^4.0.6","reftools":"^1.1.3","yaml":"^1.8.3","yargs":"^15.3.1"},"keywords":["swagger","openapi","openapi2","openapi3","converter","conversion","validator","validation","resolver","lint","linter"],"gitHead":"13dc6d5989c198cc88e63969fa681f7296f064e6","_resolved":"https://registry.npmjs.org/swagger2openapi/-/swagger2openapi-6.2.1.tgz","_integrity":"sha512-CY3miXK2YZ0rjvGkVBzJps8ohDR7zGmbFhCVynAGlxIKbLvBuD99aS2ikZcvSo09uVOKcb5FspmvF/PKWdYV1Q==","_from":"swagger2openapi@6.2.1"}')},function(e,t){var n=Object.prototype.hasOwnProperty,r=Object.prototype.toString;e.exports=function(e,t,o){if("[object Function]"!==r.call(t))throw new TypeError("iterator must be a function");var i=e.length;if(i===+i)for(var a=0;a<i;a++)t.call(o,e[a],a,e);else for(var s in e)n.call(e,s)&&t.call(o,e[s],s,e)}},function(e,t){!function(e){var t="\\b(?:BASH|BASHOPTS|BASH_ALIASES|BASH_ARGC|BASH_ARGV|BASH_CMDS|BASH_COMPLETION_COMPAT_DIR|BASH_LINENO|BASH_REMATCH|BASH_SOURCE|BASH_VERSINFO|BASH_VERSION|COLORTERM|COLUMNS|COMP_WORDBREAKS|DBUS_SESSION_BUS_ADDRESS|DEFAULTS_PATH|DESKTOP_SESSION|DIRSTACK|DISPLAY|EUID|GDMSESSION|GDM_LANG|GNOME_KEYRING_CONTROL|GNOME_KEYRING_PID|GPG_AGENT_INFO|GROUPS|HISTCONTROL|HISTFILE|HISTFILESIZE|HISTSIZE|HOME|HOSTNAME|HOSTTYPE|IFS|INSTANCE|JOB|LANG|LANGUAGE|LC_ADDRESS|LC_ALL|LC_IDENTIFICATION|LC_MEASUREMENT|LC_MONETARY|LC_NAME|LC_NUMERIC|LC_PAPER|LC_TELEPHONE|LC_TIME|LESSCLOSE|LESSOPEN|LINES|LOGNAME|LS_COLORS|MACHTYPE|MAILCHECK|MANDATORY_PATH|NO_AT_BRIDGE|OLDPWD|OPTERR|OPTIND|ORBIT_SOCKETDIR|OSTYPE|PAPERSIZE|PATH|PIPESTATUS|PPID|PS1|PS2|PS3|PS4|PWD|RANDOM|REPLY|SECONDS|SELINUX_INIT|SESSION|SESSIONTYPE|SESSION_MANAGER|SHELL|SHELLOPTS|SHLVL|SSH_AUTH_SOCK|TERM|UID|UPSTART_EVENTS|UPSTART_INSTANCE|UPSTART_JOB|UPSTART_SESSION|USER|WINDOWID|XAUTHORITY|XDG_CONFIG_DIRS|XDG_CURRENT_DESKTOP|XDG_DATA_DIRS|XDG_GREETER_DATA_DIR|XDG_MENU_PREFIX|XDG_RUNTIME_DIR|XDG_SEAT|XDG_SEAT_PATH|XDG_SESSION_DESKTOP|XDG_SESSION_ID|XDG_SESSION_PATH|XDG_SESSION_TYPE|XDG_VTNR|XMODIFIERS)\\b",n={environment:{pattern:RegExp("\\$"+t),alias:"constant"},variable:[{pattern:/\$?\(\([\s\S]+?\)\)/,greedy:!0,inside:{variable:[{pattern:/(^\$\(\([\s\S]+)\)\)/,lookbehind:!0},/^\$\(\(/],number:/\b0x[\dA-Fa-f]+\b|(?:\b\d+\.?\d*|\B\.\d+)(?:[Ee]-?\d+)?/,operator:/--?|-=|\+\+?|\+=|!=?|~|\*\*?|\*=|\/=?|%=?|<<=?|>>=?|<=?|>=?|==?|&&?|&=|\^=?|\|\|?|\|=|\?|:/,punctuation:/\(\(?|\)\)?|,|;/}},{pattern:/\$\((?:\([^)]+\)|[^()])+\)|`[^`]+`/,greedy:!0,inside:{variable:/^\$\(|^`|\)$|`$/}},{pattern:/\$\{[^}]+\}/,greedy:!0,inside:{operator:/:[-=?+]?|[!\/]|##?|%%?|\^\^?|,,?/,punctuation:/[\[\]]/,environment:{pattern:RegExp("(\\{)"+t),lookbehind:!0,alias:"constant"}}},/\$(?:\w+|[#?*!@$])/],entity:/\\(?:[abceEfnrtv\\"]|O?[0-7]{1,3}|x[0-9a-fA-F]{1,2}|u[0-9a-fA-F]{4}|U[0-9a-fA-F]{8})/};e.languages.bash={shebang:{pattern:/^#!\s*\/.*/,alias:"important"},comment:{pattern:/(^|[^"{\\$])#.*/,lookbehind:!0},"function-name":[{pattern:/(\bfunction\s+)\w+(?=(?:\s*\(?:\s*\))?\s*\{)/,lookbehind:!0,alias:"function"},{pattern:/\b\w+(?=\s*\(\s*\)\s*\{)/,alias:"function"}],"for-or-select":{pattern:/(\b(?:for|select)\s+)\w+(?=\s+in\s)/,alias:"variable",lookbehind:!0},"assign-left":{pattern:/(^|[\s;|&]|[<>]\()\w+(?=\+?=)/,inside:{environment:{pattern:RegExp("(^|[\\s;|&]|[<>]\\()"+t),lookbehind:!0,alias:"constant"}},alias:"variable",lookbehind:!0},string:[{pattern:/((?:^|[^<])<<-?\s*)(\w+?)\s*(?:\r?\n|\r)[\s\S]*?(?:\r?\n|\r)\2/,lookbehind:!0,greedy:!0,inside:n},{pattern:/((?:^|[^<])<<-?\s*)(["'])(\w+)\2\s*(?:\r?\n|\r)[\s\S]*?(?:\r?\n|\r)\3/,lookbehind:!0,greedy:!0},{pattern:/(^|[^\\](?:\\\\)*)(["'])(?:\\[\s\S]|\$\([^)]+\)|`[^`]+`|(?!\2)[^\\])*\2/,lookbehind:!0,greedy:!0,inside:n}],environment:{pattern:RegExp("\\$?"+t),alias:"constant"},variable:n.variable,function:{pattern:/(^|[\s;|&]|[<>]\()(?:add|apropos|apt|aptitude|apt-cache|apt-get|aspell|automysqlbackup|awk|basename|bash|bc|bconsole|bg|bzip2|cal|cat|cfdisk|chgrp|chkconfig|chmod|chown|chroot|cksum|clear|cmp|column|comm|cp|cron|crontab|csplit|curl|cut|date|dc|dd|ddrescue|debootstrap|df|diff|diff3|dig|dir|dircolors|dirname|dirs|dmesg|du|egrep|eject|env|ethtool|expand|expect|expr|fdformat|fdisk|fg|fgrep|file|find|fmt|fold|format|free|fsck|ftp|fuser|gawk|git|gparted|grep|groupadd|groupdel|groupmod|groups|grub-mkconfig|gzip|halt|head|hg|history|host|hostname|htop|iconv|id|ifconfig|ifdown|ifup|import|install|ip|jobs|join|kill|killall|less|link|ln|locate|logname|logrotate|look|lpc|lpr|lprint|lprintd|lprintq|lprm|ls|lsof|lynx|make|man|mc|mdadm|mkconfig|mkdir|mke2fs|mkfifo|mkfs|mkisofs|mknod|mkswap|mmv|more|most|mount|mtools|mtr|mutt|mv|nano|nc|netstat|nice|nl|nohup|notify-send|npm|nslookup|op|open|parted|passwd|paste|pathchk|ping|pkill|pnpm|popd|pr|printcap|printenv|ps|pushd|pv|quota|quotacheck|quotactl|ram|rar|rcp|reboot|remsync|rename|renice|rev|rm|rmdir|rpm|rsync|scp|screen|sdiff|sed|sendmail|seq|service|sftp|sh|shellcheck|shuf|shutdown|sleep|slocate|sort|split|ssh|stat|strace|su|sudo|sum|suspend|swapon|sync|tac|tail|tar|tee|time|timeout|top|touch|tr|traceroute|tsort|tty|umount|uname|unexpand|uniq|units|unrar|unshar|unzip|update-grub|uptime|useradd|userdel|usermod|users|uudecode|uuencode|v|vdir|vi|vim|virsh|vmstat|wait|watch|wc|wget|whereis|which|who|whoami|write|xargs|xdg-open|yarn|yes|zenity|zip|zsh|zypper)(?=$|[)\s;|&])/,lookbehind:!0},keyword:{pattern:/(^|[\s;|&]|[<>]\()(?:if|then|else|elif|fi|for|while|in|case|esac|function|select|do|done|until)(?=$|[)\s;|&])/,lookbehind:!0},builtin:{pattern:/(^|[\s;|&]|[<>]\()(?:\.|:|break|cd|continue|eval|exec|exit|export|getopts|hash|pwd|readonly|return|shift|test|times|trap|umask|unset|alias|bind|builtin|caller|command|declare|echo|enable|help|let|local|logout|mapfile|printf|read|readarray|source|type|typeset|ulimit|unalias|set|shopt)(?=$|[)\s;|&])/,lookbehind:!0,alias:"class-name"},boolean:{pattern:/(^|[\s;|&]|[<>]\()(?:true|false)(?=$|[)\s;|&])/,lookbehind:!0},"file-descriptor":{pattern:/\B&\d\b/,alias:"important"},operator:{pattern:/\d?<>|>\||\+=|==?|!=?|=~|<<[<-]?|[&\d]?>>|\d?[<>]&?|&[>&]?|\|[&|]?|<=?|>=?/,inside:{"file-descriptor":{pattern:/^\d/,alias:"important"}}},punctuation:/\$?\(\(?|\)\)?|\.\.|[{}[\];\\]/,number:{pattern:/(^|\s)(?:[1-9]\d*|0)(?:[.,]\d+)?\b/,lookbehind:!0}};for(var r=["comment","function-name","for-or-select","assign-left","string","environment","function","keyword","builtin","boolean","file-descriptor","operator","punctuation","number"],o=n.variable[1].inside,i=0;i<r.length;i++)o[r[i]]=e.languages.bash[r[i]];e.languages.shell=e.languages.bash}(Prism)},function(e,t){Prism.languages.c=Prism.languages.extend("clike",{comment:{pattern:/\/\/(?:[^\r\n\\]|\\(?:\r\n?|\n|(?![\r\n])))*|\/\*[\s\S]*?(?:\*\/|$)/,greedy:!0},"class-name":{pattern:/(\b(?:enum|struct)\s+(?:__attribute__\s*\(\([\s\S]*?\)\)\s*)?)\w+/,lookbehind:!0},keyword:/\b(?:__attribute__|_Alignas|_Alignof|_Atomic|_Bool|_Complex|_Generic|_Imaginary|_Noreturn|_Static_assert|_Thread_local|asm|typeof|inline|auto|break|case|char|const|continue|default|do|double|else|enum|extern|float|for|goto|if|int|long|register|return|short|signed|sizeof|static|struct|switch|typedef|union|unsigned|void|volatile|while)\b/,function:/[a-z_]\w*(?=\s*\()/i,operator:/>>=?|<<=?|->|([-+&|:])\1|[?:~]|[-+*/%&|^!=<>]=?/,number:/(?:\b0x(?:[\da-f]+\.?[\da-f]*|\.[\da-f]+)(?:p[+-]?\d+)?|(?:\b\d+\.?\d*|\B\.\d+)(?:e[+-]?\d+)?)[ful]*/i}),Prism.languages.insertBefore("c","string",{macro:{pattern:/(^\s*)#\s*[a-z]+(?:[^\r\n\\]|\\(?:\r\n|[\s\S]))*/im,lookbehind:!0,alias:"property",inside:{string:{pattern:/(#\s*include\s*)(?:<.+?>|("|')(?:\\?.)+?\2)/,lookbehind:!0},directive:{pattern:/(#\s*)\b(?:define|defined|elif|else|endif|error|ifdef|ifndef|if|import|include|line|pragma|undef|using)\b/,lookbehind:!0,alias:"keyword"}}},constant:/\b(?:__FILE__|__LINE__|__DATE__|__TIME__|__TIMESTAMP__|__func__|EOF|NULL|SEEK_CUR|SEEK_END|SEEK_SET|stdin|stdout|stderr)\b/}),delete Prism.languages.c.boolean},function(e,t){Prism.languages.clike={comment:[{pattern:/(^|[^\\])\/\*[\s\S]*?(?:\*\/|$)/,lookbehind:!0},{pattern:/(^|[^\\:])\/\/.*/,lookbehind:!0,greedy:!0}],string:{pattern:/(["'])(?:\\(?:\r\n|[\s\S])|(?!\1)[^\\\r\n])*\1/,greedy:!0},"class-name":{pattern:/(\b(?:class|interface|extends|implements|trait|instanceof|new)\s+|\bcatch\s+\()[\w.\\]+/i,lookbehind:!0,inside:{punctuation:/[.\\]/}},keyword:/\b(?:if|else|while|do|for|return|in|instanceof|function|new|try|throw|catch|finally|null|break|continue)\b/,boolean:/\b(?:true|false)\b/,function:/\w+(?=\()/,number:/\b0x[\da-f]+\b|(?:\b\d+\.?\d*|\B\.\d+)(?:e[+-]?\d+)?/i,operator:/[<>]=?|[!=]=?=?|--?|\+\+?|&&?|\|\|?|[?*/~^%]/,punctuation:/[{}[\];(),.:]/}},function(e,t){!function(e){var t=/#(?!\{).+/,n={pattern:/#\{[^}]+\}/,alias:"variable"};e.languages.coffeescript=e.languages.extend("javascript",{comment:t,string:[{pattern:/'(?:\\[\s\S]|[^\\'])*'/,greedy:!0},{pattern:/"(?:\\[\s\S]|[^\\"])*"/,greedy:!0,inside:{interpolation:n}}],keyword:/\b(?:and|break|by|catch|class|continue|debugger|delete|do|each|else|extend|extends|false|finally|for|if|in|instanceof|is|isnt|let|loop|namespace|new|no|not|null|of|off|on|or|own|return|super|switch|then|this|throw|true|try|typeof|undefined|unless|until|when|while|window|with|yes|yield)\b/,"class-member":{pattern:/@(?!\d)\w+/,alias:"variable"}}),e.languages.insertBefore("coffeescript","comment",{"multiline-comment":{pattern:/###[\s\S]+?###/,alias:"comment"},"block-regex":{pattern:/\/{3}[\s\S]*?\/{3}/,alias:"regex",inside:{comment:t,interpolation:n}}}),e.languages.insertBefore("coffeescript","string",{"inline-javascript":{pattern:/`(?:\\[\s\S]|[^\\`])*`/,inside:{delimiter:{pattern:/^`|`$/,alias:"punctuation"},rest:e.languages.javascript}},"multiline-string":[{pattern:/'''[\s\S]*?'''/,greedy:!0,alias:"string"},{pattern:/"""[\s\S]*?"""/,greedy:!0,alias:"string",inside:{interpolation:n}}]}),e.languages.insertBefore("coffeescript","keyword",{property:/(?!\d)\w+(?=\s*:(?!:))/}),delete e.languages.coffeescript["template-string"],e.languages.coffee=e.languages.coffeescript}(Prism)},function(e,t){Prism.languages.cpp=Prism.languages.extend("c",{"class-name":{pattern:/(\b(?:class|enum|struct)\s+)\w+/,lookbehind:!0},keyword:/\b(?:alignas|alignof|asm|auto|bool|break|case|catch|char|char8_t|char16_t|char32_t|class|compl|concept|const|consteval|constexpr|constinit|const_cast|continue|co_await|co_return|co_yield|decltype|default|delete|do|double|dynamic_cast|else|enum|explicit|export|extern|float|for|friend|goto|if|inline|int|int8_t|int16_t|int32_t|int64_t|uint8_t|uint16_t|uint32_t|uint64_t|long|mutable|namespace|new|noexcept|nullptr|operator|private|protected|public|register|reinterpret_cast|requires|return|short|signed|sizeof|static|static_assert|static_cast|struct|switch|template|this|thread_local|throw|try|typedef|typeid|typename|union|unsigned|using|virtual|void|volatile|wchar_t|while)\b/,number:{pattern:/(?:\b0b[01']+|\b0x(?:[\da-f']+\.?[\da-f']*|\.[\da-f']+)(?:p[+-]?[\d']+)?|(?:\b[\d']+\.?[\d']*|\B\.[\d']+)(?:e[+-]?[\d']+)?)[ful]*/i,greedy:!0},operator:/>>=?|<<=?|->|([-+&|:])\1|[?:~]|[-+*/%&|^!=<>]=?|\b(?:and|and_eq|bitand|bitor|not|not_eq|or|or_eq|xor|xor_eq)\b/,boolean:/\b(?:true|false)\b/}),Prism.languages.insertBefore("cpp","string",{"raw-string":{pattern:/R"([^()\\ ]{0,16})\([\s\S]*?\)\1"/,alias:"string",greedy:!0}})},function(e,t){!function(e){function t(e,t){return e.replace(/<<(\d+)>>/g,(function(e,n){return"(?:"+t[+n]+")"}))}function n(e,n,r){return RegExp(t(e,n),r||"")}function r(e,t){for(var n=0;n<t;n++)e=e.replace(/<<self>>/g,(function(){return"(?:"+e+")"}));return e.replace(/<<self>>/g,"[^\\s\\S]")}var o="bool byte char decimal double dynamic float int long object sbyte short string uint ulong ushort var void",i="class enum interface struct",a="add alias ascending async await by descending from get global group into join let nameof notnull on orderby partial remove select set unmanaged value when where where",s="abstract as base break case catch checked const continue default delegate do else event explicit extern finally fixed for foreach goto if implicit in internal is lock namespace new null operator out override params private protected public readonly ref return sealed sizeof stackalloc static switch this throw try typeof unchecked unsafe using virtual volatile while yield";function l(e){return"\\b(?:"+e.trim().replace(/ /g,"|")+")\\b"}var c=l(i),u=RegExp(l(o+" "+i+" "+a+" "+s)),p=l(i+" "+a+" "+s),f=l(o+" "+i+" "+s),d=r(/<(?:[^<>;=+\-*/%&|^]|<<self>>)*>/.source,2),h=r(/\((?:[^()]|<<self>>)*\)/.source,2),m=/@?\b[A-Za-z_]\w*\b/.source,g=t(/<<0>>(?:\s*<<1>>)?/.source,[m,d]),y=t(/(?!<<0>>)<<1>>(?:\s*\.\s*<<1>>)*/.source,[p,g]),v=/\[\s*(?:,\s*)*\]/.source,b=t(/[^,()<>[\];=+\-*/%&|^]|<<0>>|<<1>>|<<2>>/.source,[d,h,v]),x=t(/\(<<0>>+(?:,<<0>>+)+\)/.source,[b]),w=t(/(?:<<0>>|<<1>>)(?:\s*(?:\?\s*)?<<2>>)*(?:\s*\?)?/.source,[x,y,v]),k={keyword:u,punctuation:/[<>()?,.:[\]]/},O=/'(?:[^\r\n'\\]|\\.|\\[Uux][\da-fA-F]{1,8})'/.source,E=/"(?:\\.|[^\\"\r\n])*"/.source,_=/@"(?:""|\\[\s\S]|[^\\"])*"(?!")/.source;e.languages.csharp=e.languages.extend("clike",{string:[{pattern:n(/(^|[^$\\])<<0>>/.source,[_]),lookbehind:!0,greedy:!0},{pattern:n(/(^|[^@$\\])<<0>>/.source,[E]),lookbehind:!0,greedy:!0},{pattern:RegExp(O),greedy:!0,alias:"character"}],"class-name":[{pattern:n(/(\busing\s+static\s+)<<0>>(?=\s*;)/.source,[y]),lookbehind:!0,inside:k},{pattern:n(/(\busing\s+<<0>>\s*=\s*)<<1>>(?=\s*;)/.source,[m,w]),lookbehind:!0,inside:k},{pattern:n(/(\busing\s+)<<0>>(?=\s*=)/.source,[m]),lookbehind:!0},{pattern:n(/(\b<<0>>\s+)<<1>>/.source,[c,g]),lookbehind:!0,inside:k},{pattern:n(/(\bcatch\s*\(\s*)<<0>>/.source,[y]),lookbehind:!0,inside:k},{pattern:n(/(\bwhere\s+)<<0>>/.source,[m]),lookbehind:!0},{pattern:n(/(\b(?:is|as)\s+)<<0>>/.source,[w]),lookbehind:!0,inside:k},{pattern:n(/\b<<0>>(?=\s+(?!<<1>>)<<2>>(?:\s*[=,;:{)\]]|\s+in))/.source,[w,f,m]),inside:k}],keyword:u,number:/(?:\b0(?:x[\da-f_]*[\da-f]|b[01_]*[01])|(?:\B\.\d+(?:_+\d+)*|\b\d+(?:_+\d+)*(?:\.\d+(?:_+\d+)*)?)(?:e[-+]?\d+(?:_+\d+)*)?)(?:ul|lu|[dflmu])?\b/i,operator:/>>=?|<<=?|[-=]>|([-+&|])\1|~|\?\?=?|[-+*/%&|^!=<>]=?/,punctuation:/\?\.?|::|[{}[\];(),.:]/}),e.languages.insertBefore("csharp","number",{range:{pattern:/\.\./,alias:"operator"}}),e.languages.insertBefore("csharp","punctuation",{"named-parameter":{pattern:n(/([(,]\s*)<<0>>(?=\s*:)/.source,[m]),lookbehind:!0,alias:"punctuation"}}),e.languages.insertBefore("csharp","class-name",{namespace:{pattern:n(/(\b(?:namespace|using)\s+)<<0>>(?:\s*\.\s*<<0>>)*(?=\s*[;{])/.source,[m]),lookbehind:!0,inside:{punctuation:/\./}},"type-expression":{pattern:n(/(\b(?:default|typeof|sizeof)\s*\(\s*)(?:[^()\s]|\s(?!\s*\))|<<0>>)*(?=\s*\))/.source,[h]),lookbehind:!0,alias:"class-name",inside:k},"return-type":{pattern:n(/<<0>>(?=\s+(?:<<1>>\s*(?:=>|[({]|\.\s*this\s*\[)|this\s*\[))/.source,[w,y]),inside:k,alias:"class-name"},"constructor-invocation":{pattern:n(/(\bnew\s+)<<0>>(?=\s*[[({])/.source,[w]),lookbehind:!0,inside:k,alias:"class-name"},"generic-method":{pattern:n(/<<0>>\s*<<1>>(?=\s*\()/.source,[m,d]),inside:{function:n(/^<<0>>/.source,[m]),generic:{pattern:RegExp(d),alias:"class-name",inside:k}}},"type-list":{pattern:n(/\b((?:<<0>>\s+<<1>>|where\s+<<2>>)\s*:\s*)(?:<<3>>|<<4>>)(?:\s*,\s*(?:<<3>>|<<4>>))*(?=\s*(?:where|[{;]|=>|$))/.source,[c,g,m,w,u.source]),lookbehind:!0,inside:{keyword:u,"class-name":{pattern:RegExp(w),greedy:!0,inside:k},punctuation:/,/}},preprocessor:{pattern:/(^\s*)#.*/m,lookbehind:!0,alias:"property",inside:{directive:{pattern:/(\s*#)\b(?:define|elif|else|endif|endregion|error|if|line|pragma|region|undef|warning)\b/,lookbehind:!0,alias:"keyword"}}}});var S=E+"|"+O,T=t(/\/(?![*/])|\/\/[^\r\n]*[\r\n]|\/\*[\s\S]*?\*\/|<<0>>/.source,[S]),j=r(t(/[^"'/()]|<<0>>|\(<<self>>*\)/.source,[T]),2),A=/\b(?:assembly|event|field|method|module|param|property|return|type)\b/.source,C=t(/<<0>>(?:\s*\(<<1>>*\))?/.source,[y,j]);e.languages.insertBefore("csharp","class-name",{attribute:{pattern:n(/((?:^|[^\s\w>)?])\s*\[\s*)(?:<<0>>\s*:\s*)?<<1>>(?:\s*,\s*<<1>>)*(?=\s*\])/.source,[A,C]),lookbehind:!0,greedy:!0,inside:{target:{pattern:n(/^<<0>>(?=\s*:)/.source,[A]),alias:"keyword"},"attribute-arguments":{pattern:n(/\(<<0>>*\)/.source,[j]),inside:e.languages.csharp},"class-name":{pattern:RegExp(y),inside:{punctuation:/\./}},punctuation:/[:,]/}}});var I=/:[^}\r\n]+/.source,P=r(t(/[^"'/()]|<<0>>|\(<<self>>*\)/.source,[T]),2),R=t(/\{(?!\{)(?:(?![}:])<<0>>)*<<1>>?\}/.source,[P,I]),N=r(t(/[^"'/()]|\/(?!\*)|\/\*.*?\*\/|<<0>>|\(<<self>>*\)/.source,[S]),2),L=t(/\{(?!\{)(?:(?![}:])<<0>>)*<<1>>?\}/.source,[N,I]);function M(t,r){return{interpolation:{pattern:n(/([^{](?:\{\{)*)<<0>>/.source,[t]),lookbehind:!0,inside:{"format-string":{pattern:n(/(^\{(?:(?![}:])<<0>>)*)<<1>>(?=\}$)/.source,[r,I]),lookbehind:!0,inside:{punctuation:/^:/}},punctuation:/^\{|\}$/,expression:{pattern:/[\s\S]+/,alias:"language-csharp",inside:e.languages.csharp}}},string:/[\s\S]+/}}e.languages.insertBefore("csharp","string",{"interpolation-string":[{pattern:n(/(^|[^\\])(?:\$@|@\$)"(?:""|\\[\s\S]|\{\{|<<0>>|[^\\{"])*"/.source,[R]),lookbehind:!0,greedy:!0,inside:M(R,P)},{pattern:n(/(^|[^@\\])\$"(?:\\.|\{\{|<<0>>|[^\\"{])*"/.source,[L]),lookbehind:!0,greedy:!0,inside:M(L,N)}]})}(Prism),Prism.languages.dotnet=Prism.languages.cs=Prism.languages.csharp},function(e,t){Prism.languages.go=Prism.languages.extend("clike",{keyword:/\b(?:break|case|chan|const|continue|default|defer|else|fallthrough|for|func|go(?:to)?|if|import|interface|map|package|range|return|select|struct|switch|type|var)\b/,builtin:/\b(?:bool|byte|complex(?:64|128)|error|float(?:32|64)|rune|string|u?int(?:8|16|32|64)?|uintptr|append|cap|close|complex|copy|delete|imag|len|make|new|panic|print(?:ln)?|real|recover)\b/,boolean:/\b(?:_|iota|nil|true|false)\b/,operator:/[*\/%^!=]=?|\+[=+]?|-[=-]?|\|[=|]?|&(?:=|&|\^=?)?|>(?:>=?|=)?|<(?:<=?|=|-)?|:=|\.\.\./,number:/(?:\b0x[a-f\d]+|(?:\b\d+\.?\d*|\B\.\d+)(?:e[-+]?\d+)?)i?/i,string:{pattern:/(["'`])(?:\\[\s\S]|(?!\1)[^\\])*\1/,greedy:!0}}),delete Prism.languages.go["class-name"]},function(e,t){!function(e){e.languages.http={"request-line":{pattern:/^(?:POST|GET|PUT|DELETE|OPTIONS|PATCH|TRACE|CONNECT)\s(?:https?:\/\/|\/)\S+\sHTTP\/[0-9.]+/m,inside:{property:/^(?:POST|GET|PUT|DELETE|OPTIONS|PATCH|TRACE|CONNECT)\b/,"attr-name":/:\w+/}},"response-status":{pattern:/^HTTP\/1.[01] \d+.*/m,inside:{property:{pattern:/(^HTTP\/1.[01] )\d+.*/i,lookbehind:!0}}},"header-name":{pattern:/^[\w-]+:(?=.)/m,alias:"keyword"}};var t,n=e.languages,r={"application/javascript":n.javascript,"application/json":n.json||n.javascript,"application/xml":n.xml,"text/xml":n.xml,"text/html":n.html,"text/css":n.css},o={"application/json":!0,"application/xml":!0};function i(e){var t=e.replace(/^[a-z]+\//,"");return"(?:"+e+"|"+("\\w+/(?:[\\w.-]+\\+)+"+t+"(?![+\\w.-])")+")"}for(var a in r)if(r[a]){t=t||{};var s=o[a]?i(a):a;t[a.replace(/\//g,"-")]={pattern:RegExp("(content-type:\\s*"+s+"[\\s\\S]*?)(?:\\r?\\n|\\r){2}[\\s\\S]*","i"),lookbehind:!0,inside:r[a]}}t&&e.languages.insertBefore("http","header-name",t)}(Prism)},function(e,t){!function(e){var t=/\b(?:abstract|assert|boolean|break|byte|case|catch|char|class|const|continue|default|do|double|else|enum|exports|extends|final|finally|float|for|goto|if|implements|import|instanceof|int|interface|long|module|native|new|null|open|opens|package|private|protected|provides|public|record|requires|return|short|static|strictfp|super|switch|synchronized|this|throw|throws|to|transient|transitive|try|uses|var|void|volatile|while|with|yield)\b/,n=/\b[A-Z](?:\w*[a-z]\w*)?\b/;e.languages.java=e.languages.extend("clike",{"class-name":[n,/\b[A-Z]\w*(?=\s+\w+\s*[;,=())])/],keyword:t,function:[e.languages.clike.function,{pattern:/(\:\:)[a-z_]\w*/,lookbehind:!0}],number:/\b0b[01][01_]*L?\b|\b0x[\da-f_]*\.?[\da-f_p+-]+\b|(?:\b\d[\d_]*\.?[\d_]*|\B\.\d[\d_]*)(?:e[+-]?\d[\d_]*)?[dfl]?/i,operator:{pattern:/(^|[^.])(?:<<=?|>>>?=?|->|--|\+\+|&&|\|\||::|[?:~]|[-+*/%&|^!=<>]=?)/m,lookbehind:!0}}),e.languages.insertBefore("java","string",{"triple-quoted-string":{pattern:/"""[ \t]*[\r\n](?:(?:"|"")?(?:\\.|[^"\\]))*"""/,greedy:!0,alias:"string"}}),e.languages.insertBefore("java","class-name",{annotation:{alias:"punctuation",pattern:/(^|[^.])@\w+/,lookbehind:!0},namespace:{pattern:/(\b(?:exports|import(?:\s+static)?|module|open|opens|package|provides|requires|to|transitive|uses|with)\s+)[a-z]\w*(?:\.[a-z]\w*)+/,lookbehind:!0,inside:{punctuation:/\./}},generics:{pattern:/<(?:[\w\s,.&?]|<(?:[\w\s,.&?]|<(?:[\w\s,.&?]|<[\w\s,.&?]*>)*>)*>)*>/,inside:{"class-name":n,keyword:t,punctuation:/[<>(),.:]/,operator:/[?&|]/}}})}(Prism)},function(e,t){Prism.languages.lua={comment:/^#!.+|--(?:\[(=*)\[[\s\S]*?\]\1\]|.*)/m,string:{pattern:/(["'])(?:(?!\1)[^\\\r\n]|\\z(?:\r\n|\s)|\\(?:\r\n|[\s\S]))*\1|\[(=*)\[[\s\S]*?\]\2\]/,greedy:!0},number:/\b0x[a-f\d]+\.?[a-f\d]*(?:p[+-]?\d+)?\b|\b\d+(?:\.\B|\.?\d*(?:e[+-]?\d+)?\b)|\B\.\d+(?:e[+-]?\d+)?\b/i,keyword:/\b(?:and|break|do|else|elseif|end|false|for|function|goto|if|in|local|nil|not|or|repeat|return|then|true|until|while)\b/,function:/(?!\d)\w+(?=\s*(?:[({]))/,operator:[/[-+*%^&|#]|\/\/?|<[<=]?|>[>=]?|[=~]=?/,{pattern:/(^|[^.])\.\.(?!\.)/,lookbehind:!0}],punctuation:/[\[\](){},;]|\.+|:+/}},function(e,t){!function(e){function t(e,t){return"___"+e.toUpperCase()+t+"___"}Object.defineProperties(e.languages["markup-templating"]={},{buildPlaceholders:{value:function(n,r,o,i){if(n.language===r){var a=n.tokenStack=[];n.code=n.code.replace(o,(function(e){if("function"==typeof i&&!i(e))return e;for(var o,s=a.length;-1!==n.code.indexOf(o=t(r,s));)++s;return a[s]=e,o})),n.grammar=e.languages.markup}}},tokenizePlaceholders:{value:function(n,r){if(n.language===r&&n.tokenStack){n.grammar=e.languages[r];var o=0,i=Object.keys(n.tokenStack);!function a(s){for(var l=0;l<s.length&&!(o>=i.length);l++){var c=s[l];if("string"==typeof c||c.content&&"string"==typeof c.content){var u=i[o],p=n.tokenStack[u],f="string"==typeof c?c:c.content,d=t(r,u),h=f.indexOf(d);if(h>-1){++o;var m=f.substring(0,h),g=new e.Token(r,e.tokenize(p,n.grammar),"language-"+r,p),y=f.substring(h+d.length),v=[];m&&v.push.apply(v,a([m])),v.push(g),y&&v.push.apply(v,a([y])),"string"==typeof c?s.splice.apply(s,[l,1].concat(v)):c.content=v}}else c.content&&a(c.content)}return s}(n.tokens)}}}})}(Prism)},function(e,t){Prism.languages.markup={comment:/<!--[\s\S]*?-->/,prolog:/<\?[\s\S]+?\?>/,doctype:{pattern:/<!DOCTYPE(?:[^>"'[\]]|"[^"]*"|'[^']*')+(?:\[(?:(?!<!--)[^"'\]]|"[^"]*"|'[^']*'|<!--[\s\S]*?-->)*\]\s*)?>/i,greedy:!0},cdata:/<!\[CDATA\[[\s\S]*?]]>/i,tag:{pattern:/<\/?(?!\d)[^\s>\/=$<%]+(?:\s(?:\s*[^\s>\/=]+(?:\s*=\s*(?:"[^"]*"|'[^']*'|[^\s'">=]+(?=[\s>]))|(?=[\s/>])))+)?\s*\/?>/i,greedy:!0,inside:{tag:{pattern:/^<\/?[^\s>\/]+/i,inside:{punctuation:/^<\/?/,namespace:/^[^\s>\/:]+:/}},"attr-value":{pattern:/=\s*(?:"[^"]*"|'[^']*'|[^\s'">=]+)/i,inside:{punctuation:[/^=/,{pattern:/^(\s*)["']|["']$/,lookbehind:!0}]}},punctuation:/\/?>/,"attr-name":{pattern:/[^\s>\/]+/,inside:{namespace:/^[^\s>\/:]+:/}}}},entity:/&#?[\da-z]{1,8};/i},Prism.languages.markup.tag.inside["attr-value"].inside.entity=Prism.languages.markup.entity,Prism.hooks.add("wrap",(function(e){"entity"===e.type&&(e.attributes.title=e.content.replace(/&amp;/,"&"))})),Object.defineProperty(Prism.languages.markup.tag,"addInlined",{value:function(e,t){var n={};n["language-"+t]={pattern:/(^<!\[CDATA\[)[\s\S]+?(?=\]\]>$)/i,lookbehind:!0,inside:Prism.languages[t]},n.cdata=/^<!\[CDATA\[|\]\]>$/i;var r={"included-cdata":{pattern:/<!\[CDATA\[[\s\S]*?\]\]>/i,inside:n}};r["language-"+t]={pattern:/[\s\S]+/,inside:Prism.languages[t]};var o={};o[e]={pattern:RegExp(/(<__[\s\S]*?>)(?:<!\[CDATA\[[\s\S]*?\]\]>\s*|[\s\S])*?(?=<\/__>)/.source.replace(/__/g,(function(){return e})),"i"),lookbehind:!0,greedy:!0,inside:r},Prism.languages.insertBefore("markup","cdata",o)}}),Prism.languages.xml=Prism.languages.extend("markup",{}),Prism.languages.html=Prism.languages.markup,Prism.languages.mathml=Prism.languages.markup,Prism.languages.svg=Prism.languages.markup},function(e,t){Prism.languages.objectivec=Prism.languages.extend("c",{keyword:/\b(?:asm|typeof|inline|auto|break|case|char|const|continue|default|do|double|else|enum|extern|float|for|goto|if|int|long|register|return|short|signed|sizeof|static|struct|switch|typedef|union|unsigned|void|volatile|while|in|self|super)\b|(?:@interface|@end|@implementation|@protocol|@class|@public|@protected|@private|@property|@try|@catch|@finally|@throw|@synthesize|@dynamic|@selector)\b/,string:/("|')(?:\\(?:\r\n|[\s\S])|(?!\1)[^\\\r\n])*\1|@"(?:\\(?:\r\n|[\s\S])|[^"\\\r\n])*"/,operator:/-[->]?|\+\+?|!=?|<<?=?|>>?=?|==?|&&?|\|\|?|[~^%?*\/@]/}),delete Prism.languages.objectivec["class-name"]},function(e,t){Prism.languages.perl={comment:[{pattern:/(^\s*)=\w+[\s\S]*?=cut.*/m,lookbehind:!0},{pattern:/(^|[^\\$])#.*/,lookbehind:!0}],string:[{pattern:/\b(?:q|qq|qx|qw)\s*([^a-zA-Z0-9\s{(\[<])(?:(?!\1)[^\\]|\\[\s\S])*\1/,greedy:!0},{pattern:/\b(?:q|qq|qx|qw)\s+([a-zA-Z0-9])(?:(?!\1)[^\\]|\\[\s\S])*\1/,greedy:!0},{pattern:/\b(?:q|qq|qx|qw)\s*\((?:[^()\\]|\\[\s\S])*\)/,greedy:!0},{pattern:/\b(?:q|qq|qx|qw)\s*\{(?:[^{}\\]|\\[\s\S])*\}/,greedy:!0},{pattern:/\b(?:q|qq|qx|qw)\s*\[(?:[^[\]\\]|\\[\s\S])*\]/,greedy:!0},{pattern:/\b(?:q|qq|qx|qw)\s*<(?:[^<>\\]|\\[\s\S])*>/,greedy:!0},{pattern:/("|`)(?:(?!\1)[^\\]|\\[\s\S])*\1/,greedy:!0},{pattern:/'(?:[^'\\\r\n]|\\.)*'/,greedy:!0}],regex:[{pattern:/\b(?:m|qr)\s*([^a-zA-Z0-9\s{(\[<])(?:(?!\1)[^\\]|\\[\s\S])*\1[msixpodualngc]*/,greedy:!0},{pattern:/\b(?:m|qr)\s+([a-zA-Z0-9])(?:(?!\1)[^\\]|\\[\s\S])*\1[msixpodualngc]*/,greedy:!0},{pattern:/\b(?:m|qr)\s*\((?:[^()\\]|\\[\s\S])*\)[msixpodualngc]*/,greedy:!0},{pattern:/\b(?:m|qr)\s*\{(?:[^{}\\]|\\[\s\S])*\}[msixpodualngc]*/,greedy:!0},{pattern:/\b(?:m|qr)\s*\[(?:[^[\]\\]|\\[\s\S])*\][msixpodualngc]*/,greedy:!0},{pattern:/\b(?:m|qr)\s*<(?:[^<>\\]|\\[\s\S])*>[msixpodualngc]*/,greedy:!0},{pattern:/(^|[^-]\b)(?:s|tr|y)\s*([^a-zA-Z0-9\s{(\[<])(?:(?!\2)[^\\]|\\[\s\S])*\2(?:(?!\2)[^\\]|\\[\s\S])*\2[msixpodualngcer]*/,lookbehind:!0,greedy:!0},{pattern:/(^|[^-]\b)(?:s|tr|y)\s+([a-zA-Z0-9])(?:(?!\2)[^\\]|\\[\s\S])*\2(?:(?!\2)[^\\]|\\[\s\S])*\2[msixpodualngcer]*/,lookbehind:!0,greedy:!0},{pattern:/(^|[^-]\b)(?:s|tr|y)\s*\((?:[^()\\]|\\[\s\S])*\)\s*\((?:[^()\\]|\\[\s\S])*\)[msixpodualngcer]*/,lookbehind:!0,greedy:!0},{pattern:/(^|[^-]\b)(?:s|tr|y)\s*\{(?:[^{}\\]|\\[\s\S])*\}\s*\{(?:[^{}\\]|\\[\s\S])*\}[msixpodualngcer]*/,lookbehind:!0,greedy:!0},{pattern:/(^|[^-]\b)(?:s|tr|y)\s*\[(?:[^[\]\\]|\\[\s\S])*\]\s*\[(?:[^[\]\\]|\\[\s\S])*\][msixpodualngcer]*/,lookbehind:!0,greedy:!0},{pattern:/(^|[^-]\b)(?:s|tr|y)\s*<(?:[^<>\\]|\\[\s\S])*>\s*<(?:[^<>\\]|\\[\s\S])*>[msixpodualngcer]*/,lookbehind:!0,greedy:!0},{pattern:/\/(?:[^\/\\\r\n]|\\.)*\/[msixpodualngc]*(?=\s*(?:$|[\r\n,.;})&|\-+*~<>!?^]|(?:lt|gt|le|ge|eq|ne|cmp|not|and|or|xor|x)\b))/,greedy:!0}],variable:[/[&*$@%]\{\^[A-Z]+\}/,/[&*$@%]\^[A-Z_]/,/[&*$@%]#?(?=\{)/,/[&*$@%]#?(?:(?:::)*'?(?!\d)[\w$]+)+(?:::)*/i,/[&*$@%]\d+/,/(?!%=)[$@%][!"#$%&'()*+,\-.\/:;<=>?@[\\\]^_`{|}~]/],filehandle:{pattern:/<(?![<=])\S*>|\b_\b/,alias:"symbol"},vstring:{pattern:/v\d+(?:\.\d+)*|\d+(?:\.\d+){2,}/,alias:"string"},function:{pattern:/sub [a-z0-9_]+/i,inside:{keyword:/sub/}},keyword:/\b(?:any|break|continue|default|delete|die|do|else|elsif|eval|for|foreach|given|goto|if|last|local|my|next|our|package|print|redo|require|return|say|state|sub|switch|undef|unless|until|use|when|while)\b/,number:/\b(?:0x[\dA-Fa-f](?:_?[\dA-Fa-f])*|0b[01](?:_?[01])*|(?:\d(?:_?\d)*)?\.?\d(?:_?\d)*(?:[Ee][+-]?\d+)?)\b/,operator:/-[rwxoRWXOezsfdlpSbctugkTBMAC]\b|\+[+=]?|-[-=>]?|\*\*?=?|\/\/?=?|=[=~>]?|~[~=]?|\|\|?=?|&&?=?|<(?:=>?|<=?)?|>>?=?|![~=]?|[%^]=?|\.(?:=|\.\.?)?|[\\?]|\bx(?:=|\b)|\b(?:lt|gt|le|ge|eq|ne|cmp|not|and|or|xor)\b/,punctuation:/[{}[\];(),:]/}},function(e,t){!function(e){e.languages.php=e.languages.extend("clike",{keyword:/\b(?:__halt_compiler|abstract|and|array|as|break|callable|case|catch|class|clone|const|continue|declare|default|die|do|echo|else|elseif|empty|enddeclare|endfor|endforeach|endif|endswitch|endwhile|eval|exit|extends|final|finally|for|foreach|function|global|goto|if|implements|include|include_once|instanceof|insteadof|interface|isset|list|namespace|new|or|parent|print|private|protected|public|require|require_once|return|static|switch|throw|trait|try|unset|use|var|while|xor|yield)\b/i,boolean:{pattern:/\b(?:false|true)\b/i,alias:"constant"},constant:[/\b[A-Z_][A-Z0-9_]*\b/,/\b(?:null)\b/i],comment:{pattern:/(^|[^\\])(?:\/\*[\s\S]*?\*\/|\/\/.*)/,lookbehind:!0}}),e.languages.insertBefore("php","string",{"shell-comment":{pattern:/(^|[^\\])#.*/,lookbehind:!0,alias:"comment"}}),e.languages.insertBefore("php","comment",{delimiter:{pattern:/\?>$|^<\?(?:php(?=\s)|=)?/i,alias:"important"}}),e.languages.insertBefore("php","keyword",{variable:/\$+(?:\w+\b|(?={))/i,package:{pattern:/(\\|namespace\s+|use\s+)[\w\\]+/,lookbehind:!0,inside:{punctuation:/\\/}}}),e.languages.insertBefore("php","operator",{property:{pattern:/(->)[\w]+/,lookbehind:!0}});var t={pattern:/{\$(?:{(?:{[^{}]+}|[^{}]+)}|[^{}])+}|(^|[^\\{])\$+(?:\w+(?:\[.+?]|->\w+)*)/,lookbehind:!0,inside:e.languages.php};e.languages.insertBefore("php","string",{"nowdoc-string":{pattern:/<<<'([^']+)'(?:\r\n?|\n)(?:.*(?:\r\n?|\n))*?\1;/,greedy:!0,alias:"string",inside:{delimiter:{pattern:/^<<<'[^']+'|[a-z_]\w*;$/i,alias:"symbol",inside:{punctuation:/^<<<'?|[';]$/}}}},"heredoc-string":{pattern:/<<<(?:"([^"]+)"(?:\r\n?|\n)(?:.*(?:\r\n?|\n))*?\1;|([a-z_]\w*)(?:\r\n?|\n)(?:.*(?:\r\n?|\n))*?\2;)/i,greedy:!0,alias:"string",inside:{delimiter:{pattern:/^<<<(?:"[^"]+"|[a-z_]\w*)|[a-z_]\w*;$/i,alias:"symbol",inside:{punctuation:/^<<<"?|[";]$/}},interpolation:t}},"single-quoted-string":{pattern:/'(?:\\[\s\S]|[^\\'])*'/,greedy:!0,alias:"string"},"double-quoted-string":{pattern:/"(?:\\[\s\S]|[^\\"])*"/,greedy:!0,alias:"string",inside:{interpolation:t}}}),delete e.languages.php.string,e.hooks.add("before-tokenize",(function(t){if(/<\?/.test(t.code)){e.languages["markup-templating"].buildPlaceholders(t,"php",/<\?(?:[^"'/#]|\/(?![*/])|("|')(?:\\[\s\S]|(?!\1)[^\\])*\1|(?:\/\/|#)(?:[^?\n\r]|\?(?!>))*(?=$|\?>|[\r\n])|\/\*[\s\S]*?(?:\*\/|$))*?(?:\?>|$)/gi)}})),e.hooks.add("after-tokenize",(function(t){e.languages["markup-templating"].tokenizePlaceholders(t,"php")}))}(Prism)},function(e,t){Prism.languages.python={comment:{pattern:/(^|[^\\])#.*/,lookbehind:!0},"string-interpolation":{pattern:/(?:f|rf|fr)(?:("""|''')[\s\S]+?\1|("|')(?:\\.|(?!\2)[^\\\r\n])*\2)/i,greedy:!0,inside:{interpolation:{pattern:/((?:^|[^{])(?:{{)*){(?!{)(?:[^{}]|{(?!{)(?:[^{}]|{(?!{)(?:[^{}])+})+})+}/,lookbehind:!0,inside:{"format-spec":{pattern:/(:)[^:(){}]+(?=}$)/,lookbehind:!0},"conversion-option":{pattern:/![sra](?=[:}]$)/,alias:"punctuation"},rest:null}},string:/[\s\S]+/}},"triple-quoted-string":{pattern:/(?:[rub]|rb|br)?("""|''')[\s\S]+?\1/i,greedy:!0,alias:"string"},string:{pattern:/(?:[rub]|rb|br)?("|')(?:\\.|(?!\1)[^\\\r\n])*\1/i,greedy:!0},function:{pattern:/((?:^|\s)def[ \t]+)[a-zA-Z_]\w*(?=\s*\()/g,lookbehind:!0},"class-name":{pattern:/(\bclass\s+)\w+/i,lookbehind:!0},decorator:{pattern:/(^\s*)@\w+(?:\.\w+)*/im,lookbehind:!0,alias:["annotation","punctuation"],inside:{punctuation:/\./}},keyword:/\b(?:and|as|assert|async|await|break|class|continue|def|del|elif|else|except|exec|finally|for|from|global|if|import|in|is|lambda|nonlocal|not|or|pass|print|raise|return|try|while|with|yield)\b/,builtin:/\b(?:__import__|abs|all|any|apply|ascii|basestring|bin|bool|buffer|bytearray|bytes|callable|chr|classmethod|cmp|coerce|compile|complex|delattr|dict|dir|divmod|enumerate|eval|execfile|file|filter|float|format|frozenset|getattr|globals|hasattr|hash|help|hex|id|input|int|intern|isinstance|issubclass|iter|len|list|locals|long|map|max|memoryview|min|next|object|oct|open|ord|pow|property|range|raw_input|reduce|reload|repr|reversed|round|set|setattr|slice|sorted|staticmethod|str|sum|super|tuple|type|unichr|unicode|vars|xrange|zip)\b/,boolean:/\b(?:True|False|None)\b/,number:/(?:\b(?=\d)|\B(?=\.))(?:0[bo])?(?:(?:\d|0x[\da-f])[\da-f]*\.?\d*|\.\d+)(?:e[+-]?\d+)?j?\b/i,operator:/[-+%=]=?|!=|\*\*?=?|\/\/?=?|<[<=>]?|>[=>]?|[&|^~]/,punctuation:/[{}[\];(),.:]/},Prism.languages.python["string-interpolation"].inside.interpolation.inside.rest=Prism.languages.python,Prism.languages.py=Prism.languages.python},function(e,t){!function(e){e.languages.ruby=e.languages.extend("clike",{comment:[/#.*/,{pattern:/^=begin\s[\s\S]*?^=end/m,greedy:!0}],"class-name":{pattern:/(\b(?:class)\s+|\bcatch\s+\()[\w.\\]+/i,lookbehind:!0,inside:{punctuation:/[.\\]/}},keyword:/\b(?:alias|and|BEGIN|begin|break|case|class|def|define_method|defined|do|each|else|elsif|END|end|ensure|extend|for|if|in|include|module|new|next|nil|not|or|prepend|protected|private|public|raise|redo|require|rescue|retry|return|self|super|then|throw|undef|unless|until|when|while|yield)\b/});var t={pattern:/#\{[^}]+\}/,inside:{delimiter:{pattern:/^#\{|\}$/,alias:"tag"},rest:e.languages.ruby}};delete e.languages.ruby.function,e.languages.insertBefore("ruby","keyword",{regex:[{pattern:/%r([^a-zA-Z0-9\s{(\[<])(?:(?!\1)[^\\]|\\[\s\S])*\1[gim]{0,3}/,greedy:!0,inside:{interpolation:t}},{pattern:/%r\((?:[^()\\]|\\[\s\S])*\)[gim]{0,3}/,greedy:!0,inside:{interpolation:t}},{pattern:/%r\{(?:[^#{}\\]|#(?:\{[^}]+\})?|\\[\s\S])*\}[gim]{0,3}/,greedy:!0,inside:{interpolation:t}},{pattern:/%r\[(?:[^\[\]\\]|\\[\s\S])*\][gim]{0,3}/,greedy:!0,inside:{interpolation:t}},{pattern:/%r<(?:[^<>\\]|\\[\s\S])*>[gim]{0,3}/,greedy:!0,inside:{interpolation:t}},{pattern:/(^|[^/])\/(?!\/)(?:\[[^\r\n\]]+\]|\\.|[^[/\\\r\n])+\/[gim]{0,3}(?=\s*(?:$|[\r\n,.;})]))/,lookbehind:!0,greedy:!0}],variable:/[@$]+[a-zA-Z_]\w*(?:[?!]|\b)/,symbol:{pattern:/(^|[^:]):[a-zA-Z_]\w*(?:[?!]|\b)/,lookbehind:!0},"method-definition":{pattern:/(\bdef\s+)[\w.]+/,lookbehind:!0,inside:{function:/\w+$/,rest:e.languages.ruby}}}),e.languages.insertBefore("ruby","number",{builtin:/\b(?:Array|Bignum|Binding|Class|Continuation|Dir|Exception|FalseClass|File|Stat|Fixnum|Float|Hash|Integer|IO|MatchData|Method|Module|NilClass|Numeric|Object|Proc|Range|Regexp|String|Struct|TMS|Symbol|ThreadGroup|Thread|Time|TrueClass)\b/,constant:/\b[A-Z]\w*(?:[?!]|\b)/}),e.languages.ruby.string=[{pattern:/%[qQiIwWxs]?([^a-zA-Z0-9\s{(\[<])(?:(?!\1)[^\\]|\\[\s\S])*\1/,greedy:!0,inside:{interpolation:t}},{pattern:/%[qQiIwWxs]?\((?:[^()\\]|\\[\s\S])*\)/,greedy:!0,inside:{interpolation:t}},{pattern:/%[qQiIwWxs]?\{(?:[^#{}\\]|#(?:\{[^}]+\})?|\\[\s\S])*\}/,greedy:!0,inside:{interpolation:t}},{pattern:/%[qQiIwWxs]?\[(?:[^\[\]\\]|\\[\s\S])*\]/,greedy:!0,inside:{interpolation:t}},{pattern:/%[qQiIwWxs]?<(?:[^<>\\]|\\[\s\S])*>/,greedy:!0,inside:{interpolation:t}},{pattern:/("|')(?:#\{[^}]+\}|\\(?:\r\n|[\s\S])|(?!\1)[^\\\r\n])*\1/,greedy:!0,inside:{interpolation:t}}],e.languages.rb=e.languages.ruby}(Prism)},function(e,t){Prism.languages.scala=Prism.languages.extend("java",{keyword:/<-|=>|\b(?:abstract|case|catch|class|def|do|else|extends|final|finally|for|forSome|if|implicit|import|lazy|match|new|null|object|override|package|private|protected|return|sealed|self|super|this|throw|trait|try|type|val|var|while|with|yield)\b/,"triple-quoted-string":{pattern:/"""[\s\S]*?"""/,greedy:!0,alias:"string"},string:{pattern:/("|')(?:\\.|(?!\1)[^\\\r\n])*\1/,greedy:!0},builtin:/\b(?:String|Int|Long|Short|Byte|Boolean|Double|Float|Char|Any|AnyRef|AnyVal|Unit|Nothing)\b/,number:/\b0x[\da-f]*\.?[\da-f]+|(?:\b\d+\.?\d*|\B\.\d+)(?:e\d+)?[dfl]?/i,symbol:/'[^\d\s\\]\w*/}),delete Prism.languages.scala["class-name"],delete Prism.languages.scala.function},function(e,t){Prism.languages.sql={comment:{pattern:/(^|[^\\])(?:\/\*[\s\S]*?\*\/|(?:--|\/\/|#).*)/,lookbehind:!0},variable:[{pattern:/@(["'`])(?:\\[\s\S]|(?!\1)[^\\])+\1/,greedy:!0},/@[\w.$]+/],string:{pattern:/(^|[^@\\])("|')(?:\\[\s\S]|(?!\2)[^\\]|\2\2)*\2/,greedy:!0,lookbehind:!0},function:/\b(?:AVG|COUNT|FIRST|FORMAT|LAST|LCASE|LEN|MAX|MID|MIN|MOD|NOW|ROUND|SUM|UCASE)(?=\s*\()/i,keyword:/\b(?:ACTION|ADD|AFTER|ALGORITHM|ALL|ALTER|ANALYZE|ANY|APPLY|AS|ASC|AUTHORIZATION|AUTO_INCREMENT|BACKUP|BDB|BEGIN|BERKELEYDB|BIGINT|BINARY|BIT|BLOB|BOOL|BOOLEAN|BREAK|BROWSE|BTREE|BULK|BY|CALL|CASCADED?|CASE|CHAIN|CHAR(?:ACTER|SET)?|CHECK(?:POINT)?|CLOSE|CLUSTERED|COALESCE|COLLATE|COLUMNS?|COMMENT|COMMIT(?:TED)?|COMPUTE|CONNECT|CONSISTENT|CONSTRAINT|CONTAINS(?:TABLE)?|CONTINUE|CONVERT|CREATE|CROSS|CURRENT(?:_DATE|_TIME|_TIMESTAMP|_USER)?|CURSOR|CYCLE|DATA(?:BASES?)?|DATE(?:TIME)?|DAY|DBCC|DEALLOCATE|DEC|DECIMAL|DECLARE|DEFAULT|DEFINER|DELAYED|DELETE|DELIMITERS?|DENY|DESC|DESCRIBE|DETERMINISTIC|DISABLE|DISCARD|DISK|DISTINCT|DISTINCTROW|DISTRIBUTED|DO|DOUBLE|DROP|DUMMY|DUMP(?:FILE)?|DUPLICATE|ELSE(?:IF)?|ENABLE|ENCLOSED|END|ENGINE|ENUM|ERRLVL|ERRORS|ESCAPED?|EXCEPT|EXEC(?:UTE)?|EXISTS|EXIT|EXPLAIN|EXTENDED|FETCH|FIELDS|FILE|FILLFACTOR|FIRST|FIXED|FLOAT|FOLLOWING|FOR(?: EACH ROW)?|FORCE|FOREIGN|FREETEXT(?:TABLE)?|FROM|FULL|FUNCTION|GEOMETRY(?:COLLECTION)?|GLOBAL|GOTO|GRANT|GROUP|HANDLER|HASH|HAVING|HOLDLOCK|HOUR|IDENTITY(?:_INSERT|COL)?|IF|IGNORE|IMPORT|INDEX|INFILE|INNER|INNODB|INOUT|INSERT|INT|INTEGER|INTERSECT|INTERVAL|INTO|INVOKER|ISOLATION|ITERATE|JOIN|KEYS?|KILL|LANGUAGE|LAST|LEAVE|LEFT|LEVEL|LIMIT|LINENO|LINES|LINESTRING|LOAD|LOCAL|LOCK|LONG(?:BLOB|TEXT)|LOOP|MATCH(?:ED)?|MEDIUM(?:BLOB|INT|TEXT)|MERGE|MIDDLEINT|MINUTE|MODE|MODIFIES|MODIFY|MONTH|MULTI(?:LINESTRING|POINT|POLYGON)|NATIONAL|NATURAL|NCHAR|NEXT|NO|NONCLUSTERED|NULLIF|NUMERIC|OFF?|OFFSETS?|ON|OPEN(?:DATASOURCE|QUERY|ROWSET)?|OPTIMIZE|OPTION(?:ALLY)?|ORDER|OUT(?:ER|FILE)?|OVER|PARTIAL|PARTITION|PERCENT|PIVOT|PLAN|POINT|POLYGON|PRECEDING|PRECISION|PREPARE|PREV|PRIMARY|PRINT|PRIVILEGES|PROC(?:EDURE)?|PUBLIC|PURGE|QUICK|RAISERROR|READS?|REAL|RECONFIGURE|REFERENCES|RELEASE|RENAME|REPEAT(?:ABLE)?|REPLACE|REPLICATION|REQUIRE|RESIGNAL|RESTORE|RESTRICT|RETURNS?|REVOKE|RIGHT|ROLLBACK|ROUTINE|ROW(?:COUNT|GUIDCOL|S)?|RTREE|RULE|SAVE(?:POINT)?|SCHEMA|SECOND|SELECT|SERIAL(?:IZABLE)?|SESSION(?:_USER)?|SET(?:USER)?|SHARE|SHOW|SHUTDOWN|SIMPLE|SMALLINT|SNAPSHOT|SOME|SONAME|SQL|START(?:ING)?|STATISTICS|STATUS|STRIPED|SYSTEM_USER|TABLES?|TABLESPACE|TEMP(?:ORARY|TABLE)?|TERMINATED|TEXT(?:SIZE)?|THEN|TIME(?:STAMP)?|TINY(?:BLOB|INT|TEXT)|TOP?|TRAN(?:SACTIONS?)?|TRIGGER|TRUNCATE|TSEQUAL|TYPES?|UNBOUNDED|UNCOMMITTED|UNDEFINED|UNION|UNIQUE|UNLOCK|UNPIVOT|UNSIGNED|UPDATE(?:TEXT)?|USAGE|USE|USER|USING|VALUES?|VAR(?:BINARY|CHAR|CHARACTER|YING)|VIEW|WAITFOR|WARNINGS|WHEN|WHERE|WHILE|WITH(?: ROLLUP|IN)?|WORK|WRITE(?:TEXT)?|YEAR)\b/i,boolean:/\b(?:TRUE|FALSE|NULL)\b/i,number:/\b0x[\da-f]+\b|\b\d+\.?\d*|\B\.\d+\b/i,operator:/[-+*\/=%^~]|&&?|\|\|?|!=?|<(?:=>?|<|>)?|>[>=]?|\b(?:AND|BETWEEN|IN|LIKE|NOT|OR|IS|DIV|REGEXP|RLIKE|SOUNDS LIKE|XOR)\b/i,punctuation:/[;[\]()`,.]/}},function(e,t){Prism.languages.swift=Prism.languages.extend("clike",{string:{pattern:/("|')(?:\\(?:\((?:[^()]|\([^)]+\))+\)|\r\n|[\s\S])|(?!\1)[^\\\r\n])*\1/,greedy:!0,inside:{interpolation:{pattern:/\\\((?:[^()]|\([^)]+\))+\)/,inside:{delimiter:{pattern:/^\\\(|\)$/,alias:"variable"}}}}},keyword:/\b(?:as|associativity|break|case|catch|class|continue|convenience|default|defer|deinit|didSet|do|dynamic(?:Type)?|else|enum|extension|fallthrough|final|for|func|get|guard|if|import|in|infix|init|inout|internal|is|lazy|left|let|mutating|new|none|nonmutating|operator|optional|override|postfix|precedence|prefix|private|protocol|public|repeat|required|rethrows|return|right|safe|self|Self|set|static|struct|subscript|super|switch|throws?|try|Type|typealias|unowned|unsafe|var|weak|where|while|willSet|__(?:COLUMN__|FILE__|FUNCTION__|LINE__))\b/,number:/\b(?:[\d_]+(?:\.[\de_]+)?|0x[a-f0-9_]+(?:\.[a-f0-9p_]+)?|0b[01_]+|0o[0-7_]+)\b/i,constant:/\b(?:nil|[A-Z_]{2,}|k[A-Z][A-Za-z_]+)\b/,atrule:/@\b(?:IB(?:Outlet|Designable|Action|Inspectable)|class_protocol|exported|noreturn|NS(?:Copying|Managed)|objc|UIApplicationMain|auto_closure)\b/,builtin:/\b(?:[A-Z]\S+|abs|advance|alignof(?:Value)?|assert|contains|count(?:Elements)?|debugPrint(?:ln)?|distance|drop(?:First|Last)|dump|enumerate|equal|filter|find|first|getVaList|indices|isEmpty|join|last|lexicographicalCompare|map|max(?:Element)?|min(?:Element)?|numericCast|overlaps|partition|print(?:ln)?|reduce|reflect|reverse|sizeof(?:Value)?|sort(?:ed)?|split|startsWith|stride(?:of(?:Value)?)?|suffix|swap|toDebugString|toString|transcode|underestimateCount|unsafeBitCast|with(?:ExtendedLifetime|Unsafe(?:MutablePointers?|Pointers?)|VaList))\b/}),Prism.languages.swift.string.inside.interpolation.inside.rest=Prism.languages.swift},function(e,t,n){"use strict";e.exports=function(e){var t=[];return t.toString=function(){return this.map((function(t){var n=function(e,t){var n=e[1]||"",r=e[3];if(!r)return n;if(t&&"function"==typeof btoa){var o=(a=r,s=btoa(unescape(encodeURIComponent(JSON.stringify(a)))),l="sourceMappingURL=data:application/json;charset=utf-8;base64,".concat(s),"/*# ".concat(l," */")),i=r.sources.map((function(e){return"/*# sourceURL=".concat(r.sourceRoot||"").concat(e," */")}));return[n].concat(i).concat([o]).join("\n")}var a,s,l;return[n].join("\n")}(t,e);return t[2]?"@media ".concat(t[2]," {").concat(n,"}"):n})).join("")},t.i=function(e,n,r){"string"==typeof e&&(e=[[null,e,""]]);var o={};if(r)for(var i=0;i<this.length;i++){var a=this[i][0];null!=a&&(o[a]=!0)}for(var s=0;s<e.length;s++){var l=[].concat(e[s]);r&&o[l[0]]||(n&&(l[2]?l[2]="".concat(n," and ").concat(l[2]):l[2]=n),t.push(l))}},t}},function(e,t,n){var r=n(315),o=["add","done","toJS","load","dispose","search"];e.exports=function(){var e=new Worker(URL.createObjectURL(new Blob(['/*!\n * ReDoc - OpenAPI/Swagger-generated API Reference Documentation\n * -------------------------------------------------------------\n *   Version: "2.0.0-rc.40"\n *   Repo: https://github.com/Redocly/redoc\n */!function(e){var t={};function r(n){if(t[n])return t[n].exports;var i=t[n]={i:n,l:!1,exports:{}};return e[n].call(i.exports,i,i.exports,r),i.l=!0,i.exports}r.m=e,r.c=t,r.d=function(e,t,n){r.o(e,t)||Object.defineProperty(e,t,{enumerable:!0,get:n})},r.r=function(e){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},r.t=function(e,t){if(1&t&&(e=r(e)),8&t)return e;if(4&t&&"object"==typeof e&&e&&e.__esModule)return e;var n=Object.create(null);if(r.r(n),Object.defineProperty(n,"default",{enumerable:!0,value:e}),2&t&&"string"!=typeof e)for(var i in e)r.d(n,i,function(t){return e[t]}.bind(null,i));return n},r.n=function(e){var t=e&&e.__esModule?function(){return e.default}:function(){return e};return r.d(t,"a",t),t},r.o=function(e,t){return Object.prototype.hasOwnProperty.call(e,t)},r.p="",r(r.s=97)}([function(e,t,r){(function(t){var r=function(e){return e&&e.Math==Math&&e};e.exports=r("object"==typeof globalThis&&globalThis)||r("object"==typeof window&&window)||r("object"==typeof self&&self)||r("object"==typeof t&&t)||Function("return this")()}).call(this,r(59))},function(e,t,r){var n=r(0),i=r(32),o=r(3),s=r(36),u=r(37),a=r(60),c=i("wks"),l=n.Symbol,f=a?l:l&&l.withoutSetter||s;e.exports=function(e){return o(c,e)||(u&&o(l,e)?c[e]=l[e]:c[e]=f("Symbol."+e)),c[e]}},function(e,t,r){var n=r(7);e.exports=function(e){if(!n(e))throw TypeError(String(e)+" is not an object");return e}},function(e,t){var r={}.hasOwnProperty;e.exports=function(e,t){return r.call(e,t)}},function(e,t,r){var n,i;\n/**\n * lunr - http://lunrjs.com - A bit like Solr, but much smaller and not as bright - 2.3.8\n * Copyright (C) 2019 Oliver Nightingale\n * @license MIT\n */!function(){var o,s,u,a,c,l,f,p,h,d,y,v,m,g,x,w,b,S,P,O,k,E,L,T,Q,j,I=function(e){var t=new I.Builder;return t.pipeline.add(I.trimmer,I.stopWordFilter,I.stemmer),t.searchPipeline.add(I.stemmer),e.call(t,t),t.build()};I.version="2.3.8"\n/*!\n * lunr.utils\n * Copyright (C) 2019 Oliver Nightingale\n */,I.utils={},I.utils.warn=(o=this,function(e){o.console&&console.warn&&console.warn(e)}),I.utils.asString=function(e){return null==e?"":e.toString()},I.utils.clone=function(e){if(null==e)return e;for(var t=Object.create(null),r=Object.keys(e),n=0;n<r.length;n++){var i=r[n],o=e[i];if(Array.isArray(o))t[i]=o.slice();else{if("string"!=typeof o&&"number"!=typeof o&&"boolean"!=typeof o)throw new TypeError("clone is not deep and does not support nested objects");t[i]=o}}return t},I.FieldRef=function(e,t,r){this.docRef=e,this.fieldName=t,this._stringValue=r},I.FieldRef.joiner="/",I.FieldRef.fromString=function(e){var t=e.indexOf(I.FieldRef.joiner);if(-1===t)throw"malformed field ref string";var r=e.slice(0,t),n=e.slice(t+1);return new I.FieldRef(n,r,e)},I.FieldRef.prototype.toString=function(){return null==this._stringValue&&(this._stringValue=this.fieldName+I.FieldRef.joiner+this.docRef),this._stringValue}\n/*!\n * lunr.Set\n * Copyright (C) 2019 Oliver Nightingale\n */,I.Set=function(e){if(this.elements=Object.create(null),e){this.length=e.length;for(var t=0;t<this.length;t++)this.elements[e[t]]=!0}else this.length=0},I.Set.complete={intersect:function(e){return e},union:function(e){return e},contains:function(){return!0}},I.Set.empty={intersect:function(){return this},union:function(e){return e},contains:function(){return!1}},I.Set.prototype.contains=function(e){return!!this.elements[e]},I.Set.prototype.intersect=function(e){var t,r,n,i=[];if(e===I.Set.complete)return this;if(e===I.Set.empty)return e;this.length<e.length?(t=this,r=e):(t=e,r=this),n=Object.keys(t.elements);for(var o=0;o<n.length;o++){var s=n[o];s in r.elements&&i.push(s)}return new I.Set(i)},I.Set.prototype.union=function(e){return e===I.Set.complete?I.Set.complete:e===I.Set.empty?this:new I.Set(Object.keys(this.elements).concat(Object.keys(e.elements)))},I.idf=function(e,t){var r=0;for(var n in e)"_index"!=n&&(r+=Object.keys(e[n]).length);var i=(t-r+.5)/(r+.5);return Math.log(1+Math.abs(i))},I.Token=function(e,t){this.str=e||"",this.metadata=t||{}},I.Token.prototype.toString=function(){return this.str},I.Token.prototype.update=function(e){return this.str=e(this.str,this.metadata),this},I.Token.prototype.clone=function(e){return e=e||function(e){return e},new I.Token(e(this.str,this.metadata),this.metadata)}\n/*!\n * lunr.tokenizer\n * Copyright (C) 2019 Oliver Nightingale\n */,I.tokenizer=function(e,t){if(null==e||null==e)return[];if(Array.isArray(e))return e.map((function(e){return new I.Token(I.utils.asString(e).toLowerCase(),I.utils.clone(t))}));for(var r=e.toString().toLowerCase(),n=r.length,i=[],o=0,s=0;o<=n;o++){var u=o-s;if(r.charAt(o).match(I.tokenizer.separator)||o==n){if(u>0){var a=I.utils.clone(t)||{};a.position=[s,u],a.index=i.length,i.push(new I.Token(r.slice(s,o),a))}s=o+1}}return i},I.tokenizer.separator=/[\\s\\-]+/\n/*!\n * lunr.Pipeline\n * Copyright (C) 2019 Oliver Nightingale\n */,I.Pipeline=function(){this._stack=[]},I.Pipeline.registeredFunctions=Object.create(null),I.Pipeline.registerFunction=function(e,t){t in this.registeredFunctions&&I.utils.warn("Overwriting existing registered function: "+t),e.label=t,I.Pipeline.registeredFunctions[e.label]=e},I.Pipeline.warnIfFunctionNotRegistered=function(e){e.label&&e.label in this.registeredFunctions||I.utils.warn("Function is not registered with pipeline. This may cause problems when serialising the index.\\n",e)},I.Pipeline.load=function(e){var t=new I.Pipeline;return e.forEach((function(e){var r=I.Pipeline.registeredFunctions[e];if(!r)throw new Error("Cannot load unregistered function: "+e);t.add(r)})),t},I.Pipeline.prototype.add=function(){var e=Array.prototype.slice.call(arguments);e.forEach((function(e){I.Pipeline.warnIfFunctionNotRegistered(e),this._stack.push(e)}),this)},I.Pipeline.prototype.after=function(e,t){I.Pipeline.warnIfFunctionNotRegistered(t);var r=this._stack.indexOf(e);if(-1==r)throw new Error("Cannot find existingFn");r+=1,this._stack.splice(r,0,t)},I.Pipeline.prototype.before=function(e,t){I.Pipeline.warnIfFunctionNotRegistered(t);var r=this._stack.indexOf(e);if(-1==r)throw new Error("Cannot find existingFn");this._stack.splice(r,0,t)},I.Pipeline.prototype.remove=function(e){var t=this._stack.indexOf(e);-1!=t&&this._stack.splice(t,1)},I.Pipeline.prototype.run=function(e){for(var t=this._stack.length,r=0;r<t;r++){for(var n=this._stack[r],i=[],o=0;o<e.length;o++){var s=n(e[o],o,e);if(null!=s&&""!==s)if(Array.isArray(s))for(var u=0;u<s.length;u++)i.push(s[u]);else i.push(s)}e=i}return e},I.Pipeline.prototype.runString=function(e,t){var r=new I.Token(e,t);return this.run([r]).map((function(e){return e.toString()}))},I.Pipeline.prototype.reset=function(){this._stack=[]},I.Pipeline.prototype.toJSON=function(){return this._stack.map((function(e){return I.Pipeline.warnIfFunctionNotRegistered(e),e.label}))}\n/*!\n * lunr.Vector\n * Copyright (C) 2019 Oliver Nightingale\n */,I.Vector=function(e){this._magnitude=0,this.elements=e||[]},I.Vector.prototype.positionForIndex=function(e){if(0==this.elements.length)return 0;for(var t=0,r=this.elements.length/2,n=r-t,i=Math.floor(n/2),o=this.elements[2*i];n>1&&(o<e&&(t=i),o>e&&(r=i),o!=e);)n=r-t,i=t+Math.floor(n/2),o=this.elements[2*i];return o==e||o>e?2*i:o<e?2*(i+1):void 0},I.Vector.prototype.insert=function(e,t){this.upsert(e,t,(function(){throw"duplicate index"}))},I.Vector.prototype.upsert=function(e,t,r){this._magnitude=0;var n=this.positionForIndex(e);this.elements[n]==e?this.elements[n+1]=r(this.elements[n+1],t):this.elements.splice(n,0,e,t)},I.Vector.prototype.magnitude=function(){if(this._magnitude)return this._magnitude;for(var e=0,t=this.elements.length,r=1;r<t;r+=2){var n=this.elements[r];e+=n*n}return this._magnitude=Math.sqrt(e)},I.Vector.prototype.dot=function(e){for(var t=0,r=this.elements,n=e.elements,i=r.length,o=n.length,s=0,u=0,a=0,c=0;a<i&&c<o;)(s=r[a])<(u=n[c])?a+=2:s>u?c+=2:s==u&&(t+=r[a+1]*n[c+1],a+=2,c+=2);return t},I.Vector.prototype.similarity=function(e){return this.dot(e)/this.magnitude()||0},I.Vector.prototype.toArray=function(){for(var e=new Array(this.elements.length/2),t=1,r=0;t<this.elements.length;t+=2,r++)e[r]=this.elements[t];return e},I.Vector.prototype.toJSON=function(){return this.elements}\n/*!\n * lunr.stemmer\n * Copyright (C) 2019 Oliver Nightingale\n * Includes code from - http://tartarus.org/~martin/PorterStemmer/js.txt\n */,I.stemmer=(s={ational:"ate",tional:"tion",enci:"ence",anci:"ance",izer:"ize",bli:"ble",alli:"al",entli:"ent",eli:"e",ousli:"ous",ization:"ize",ation:"ate",ator:"ate",alism:"al",iveness:"ive",fulness:"ful",ousness:"ous",aliti:"al",iviti:"ive",biliti:"ble",logi:"log"},u={icate:"ic",ative:"",alize:"al",iciti:"ic",ical:"ic",ful:"",ness:""},a="[aeiouy]",c="[^aeiou][^aeiouy]*",l=new RegExp("^([^aeiou][^aeiouy]*)?[aeiouy][aeiou]*[^aeiou][^aeiouy]*"),f=new RegExp("^([^aeiou][^aeiouy]*)?[aeiouy][aeiou]*[^aeiou][^aeiouy]*[aeiouy][aeiou]*[^aeiou][^aeiouy]*"),p=new RegExp("^([^aeiou][^aeiouy]*)?[aeiouy][aeiou]*[^aeiou][^aeiouy]*([aeiouy][aeiou]*)?$"),h=new RegExp("^([^aeiou][^aeiouy]*)?[aeiouy]"),d=/^(.+?)(ss|i)es$/,y=/^(.+?)([^s])s$/,v=/^(.+?)eed$/,m=/^(.+?)(ed|ing)$/,g=/.$/,x=/(at|bl|iz)$/,w=new RegExp("([^aeiouylsz])\\\\1$"),b=new RegExp("^"+c+a+"[^aeiouwxy]$"),S=/^(.+?[^aeiou])y$/,P=/^(.+?)(ational|tional|enci|anci|izer|bli|alli|entli|eli|ousli|ization|ation|ator|alism|iveness|fulness|ousness|aliti|iviti|biliti|logi)$/,O=/^(.+?)(icate|ative|alize|iciti|ical|ful|ness)$/,k=/^(.+?)(al|ance|ence|er|ic|able|ible|ant|ement|ment|ent|ou|ism|ate|iti|ous|ive|ize)$/,E=/^(.+?)(s|t)(ion)$/,L=/^(.+?)e$/,T=/ll$/,Q=new RegExp("^"+c+a+"[^aeiouwxy]$"),j=function(e){var t,r,n,i,o,a,c;if(e.length<3)return e;if("y"==(n=e.substr(0,1))&&(e=n.toUpperCase()+e.substr(1)),o=y,(i=d).test(e)?e=e.replace(i,"$1$2"):o.test(e)&&(e=e.replace(o,"$1$2")),o=m,(i=v).test(e)){var j=i.exec(e);(i=l).test(j[1])&&(i=g,e=e.replace(i,""))}else o.test(e)&&(t=(j=o.exec(e))[1],(o=h).test(t)&&(a=w,c=b,(o=x).test(e=t)?e+="e":a.test(e)?(i=g,e=e.replace(i,"")):c.test(e)&&(e+="e")));return(i=S).test(e)&&(e=(t=(j=i.exec(e))[1])+"i"),(i=P).test(e)&&(t=(j=i.exec(e))[1],r=j[2],(i=l).test(t)&&(e=t+s[r])),(i=O).test(e)&&(t=(j=i.exec(e))[1],r=j[2],(i=l).test(t)&&(e=t+u[r])),o=E,(i=k).test(e)?(t=(j=i.exec(e))[1],(i=f).test(t)&&(e=t)):o.test(e)&&(t=(j=o.exec(e))[1]+j[2],(o=f).test(t)&&(e=t)),(i=L).test(e)&&(t=(j=i.exec(e))[1],o=p,a=Q,((i=f).test(t)||o.test(t)&&!a.test(t))&&(e=t)),o=f,(i=T).test(e)&&o.test(e)&&(i=g,e=e.replace(i,"")),"y"==n&&(e=n.toLowerCase()+e.substr(1)),e},function(e){return e.update(j)}),I.Pipeline.registerFunction(I.stemmer,"stemmer")\n/*!\n * lunr.stopWordFilter\n * Copyright (C) 2019 Oliver Nightingale\n */,I.generateStopWordFilter=function(e){var t=e.reduce((function(e,t){return e[t]=t,e}),{});return function(e){if(e&&t[e.toString()]!==e.toString())return e}},I.stopWordFilter=I.generateStopWordFilter(["a","able","about","across","after","all","almost","also","am","among","an","and","any","are","as","at","be","because","been","but","by","can","cannot","could","dear","did","do","does","either","else","ever","every","for","from","get","got","had","has","have","he","her","hers","him","his","how","however","i","if","in","into","is","it","its","just","least","let","like","likely","may","me","might","most","must","my","neither","no","nor","not","of","off","often","on","only","or","other","our","own","rather","said","say","says","she","should","since","so","some","than","that","the","their","them","then","there","these","they","this","tis","to","too","twas","us","wants","was","we","were","what","when","where","which","while","who","whom","why","will","with","would","yet","you","your"]),I.Pipeline.registerFunction(I.stopWordFilter,"stopWordFilter")\n/*!\n * lunr.trimmer\n * Copyright (C) 2019 Oliver Nightingale\n */,I.trimmer=function(e){return e.update((function(e){return e.replace(/^\\W+/,"").replace(/\\W+$/,"")}))},I.Pipeline.registerFunction(I.trimmer,"trimmer")\n/*!\n * lunr.TokenSet\n * Copyright (C) 2019 Oliver Nightingale\n */,I.TokenSet=function(){this.final=!1,this.edges={},this.id=I.TokenSet._nextId,I.TokenSet._nextId+=1},I.TokenSet._nextId=1,I.TokenSet.fromArray=function(e){for(var t=new I.TokenSet.Builder,r=0,n=e.length;r<n;r++)t.insert(e[r]);return t.finish(),t.root},I.TokenSet.fromClause=function(e){return"editDistance"in e?I.TokenSet.fromFuzzyString(e.term,e.editDistance):I.TokenSet.fromString(e.term)},I.TokenSet.fromFuzzyString=function(e,t){for(var r=new I.TokenSet,n=[{node:r,editsRemaining:t,str:e}];n.length;){var i=n.pop();if(i.str.length>0){var o,s=i.str.charAt(0);s in i.node.edges?o=i.node.edges[s]:(o=new I.TokenSet,i.node.edges[s]=o),1==i.str.length&&(o.final=!0),n.push({node:o,editsRemaining:i.editsRemaining,str:i.str.slice(1)})}if(0!=i.editsRemaining){if("*"in i.node.edges)var u=i.node.edges["*"];else{u=new I.TokenSet;i.node.edges["*"]=u}if(0==i.str.length&&(u.final=!0),n.push({node:u,editsRemaining:i.editsRemaining-1,str:i.str}),i.str.length>1&&n.push({node:i.node,editsRemaining:i.editsRemaining-1,str:i.str.slice(1)}),1==i.str.length&&(i.node.final=!0),i.str.length>=1){if("*"in i.node.edges)var a=i.node.edges["*"];else{a=new I.TokenSet;i.node.edges["*"]=a}1==i.str.length&&(a.final=!0),n.push({node:a,editsRemaining:i.editsRemaining-1,str:i.str.slice(1)})}if(i.str.length>1){var c,l=i.str.charAt(0),f=i.str.charAt(1);f in i.node.edges?c=i.node.edges[f]:(c=new I.TokenSet,i.node.edges[f]=c),1==i.str.length&&(c.final=!0),n.push({node:c,editsRemaining:i.editsRemaining-1,str:l+i.str.slice(2)})}}}return r},I.TokenSet.fromString=function(e){for(var t=new I.TokenSet,r=t,n=0,i=e.length;n<i;n++){var o=e[n],s=n==i-1;if("*"==o)t.edges[o]=t,t.final=s;else{var u=new I.TokenSet;u.final=s,t.edges[o]=u,t=u}}return r},I.TokenSet.prototype.toArray=function(){for(var e=[],t=[{prefix:"",node:this}];t.length;){var r=t.pop(),n=Object.keys(r.node.edges),i=n.length;r.node.final&&(r.prefix.charAt(0),e.push(r.prefix));for(var o=0;o<i;o++){var s=n[o];t.push({prefix:r.prefix.concat(s),node:r.node.edges[s]})}}return e},I.TokenSet.prototype.toString=function(){if(this._str)return this._str;for(var e=this.final?"1":"0",t=Object.keys(this.edges).sort(),r=t.length,n=0;n<r;n++){var i=t[n];e=e+i+this.edges[i].id}return e},I.TokenSet.prototype.intersect=function(e){for(var t=new I.TokenSet,r=void 0,n=[{qNode:e,output:t,node:this}];n.length;){r=n.pop();for(var i=Object.keys(r.qNode.edges),o=i.length,s=Object.keys(r.node.edges),u=s.length,a=0;a<o;a++)for(var c=i[a],l=0;l<u;l++){var f=s[l];if(f==c||"*"==c){var p=r.node.edges[f],h=r.qNode.edges[c],d=p.final&&h.final,y=void 0;f in r.output.edges?(y=r.output.edges[f]).final=y.final||d:((y=new I.TokenSet).final=d,r.output.edges[f]=y),n.push({qNode:h,output:y,node:p})}}}return t},I.TokenSet.Builder=function(){this.previousWord="",this.root=new I.TokenSet,this.uncheckedNodes=[],this.minimizedNodes={}},I.TokenSet.Builder.prototype.insert=function(e){var t,r=0;if(e<this.previousWord)throw new Error("Out of order word insertion");for(var n=0;n<e.length&&n<this.previousWord.length&&e[n]==this.previousWord[n];n++)r++;this.minimize(r),t=0==this.uncheckedNodes.length?this.root:this.uncheckedNodes[this.uncheckedNodes.length-1].child;for(n=r;n<e.length;n++){var i=new I.TokenSet,o=e[n];t.edges[o]=i,this.uncheckedNodes.push({parent:t,char:o,child:i}),t=i}t.final=!0,this.previousWord=e},I.TokenSet.Builder.prototype.finish=function(){this.minimize(0)},I.TokenSet.Builder.prototype.minimize=function(e){for(var t=this.uncheckedNodes.length-1;t>=e;t--){var r=this.uncheckedNodes[t],n=r.child.toString();n in this.minimizedNodes?r.parent.edges[r.char]=this.minimizedNodes[n]:(r.child._str=n,this.minimizedNodes[n]=r.child),this.uncheckedNodes.pop()}}\n/*!\n * lunr.Index\n * Copyright (C) 2019 Oliver Nightingale\n */,I.Index=function(e){this.invertedIndex=e.invertedIndex,this.fieldVectors=e.fieldVectors,this.tokenSet=e.tokenSet,this.fields=e.fields,this.pipeline=e.pipeline},I.Index.prototype.search=function(e){return this.query((function(t){new I.QueryParser(e,t).parse()}))},I.Index.prototype.query=function(e){for(var t=new I.Query(this.fields),r=Object.create(null),n=Object.create(null),i=Object.create(null),o=Object.create(null),s=Object.create(null),u=0;u<this.fields.length;u++)n[this.fields[u]]=new I.Vector;e.call(t,t);for(u=0;u<t.clauses.length;u++){var a=t.clauses[u],c=null,l=I.Set.complete;c=a.usePipeline?this.pipeline.runString(a.term,{fields:a.fields}):[a.term];for(var f=0;f<c.length;f++){var p=c[f];a.term=p;var h=I.TokenSet.fromClause(a),d=this.tokenSet.intersect(h).toArray();if(0===d.length&&a.presence===I.Query.presence.REQUIRED){for(var y=0;y<a.fields.length;y++){o[R=a.fields[y]]=I.Set.empty}break}for(var v=0;v<d.length;v++){var m=d[v],g=this.invertedIndex[m],x=g._index;for(y=0;y<a.fields.length;y++){var w=g[R=a.fields[y]],b=Object.keys(w),S=m+"/"+R,P=new I.Set(b);if(a.presence==I.Query.presence.REQUIRED&&(l=l.union(P),void 0===o[R]&&(o[R]=I.Set.complete)),a.presence!=I.Query.presence.PROHIBITED){if(n[R].upsert(x,a.boost,(function(e,t){return e+t})),!i[S]){for(var O=0;O<b.length;O++){var k,E=b[O],L=new I.FieldRef(E,R),T=w[E];void 0===(k=r[L])?r[L]=new I.MatchData(m,R,T):k.add(m,R,T)}i[S]=!0}}else void 0===s[R]&&(s[R]=I.Set.empty),s[R]=s[R].union(P)}}}if(a.presence===I.Query.presence.REQUIRED)for(y=0;y<a.fields.length;y++){o[R=a.fields[y]]=o[R].intersect(l)}}var Q=I.Set.complete,j=I.Set.empty;for(u=0;u<this.fields.length;u++){var R;o[R=this.fields[u]]&&(Q=Q.intersect(o[R])),s[R]&&(j=j.union(s[R]))}var _=Object.keys(r),F=[],C=Object.create(null);if(t.isNegated()){_=Object.keys(this.fieldVectors);for(u=0;u<_.length;u++){L=_[u];var N=I.FieldRef.fromString(L);r[L]=new I.MatchData}}for(u=0;u<_.length;u++){var A=(N=I.FieldRef.fromString(_[u])).docRef;if(Q.contains(A)&&!j.contains(A)){var D,M=this.fieldVectors[N],B=n[N.fieldName].similarity(M);if(void 0!==(D=C[A]))D.score+=B,D.matchData.combine(r[N]);else{var V={ref:A,score:B,matchData:r[N]};C[A]=V,F.push(V)}}}return F.sort((function(e,t){return t.score-e.score}))},I.Index.prototype.toJSON=function(){var e=Object.keys(this.invertedIndex).sort().map((function(e){return[e,this.invertedIndex[e]]}),this),t=Object.keys(this.fieldVectors).map((function(e){return[e,this.fieldVectors[e].toJSON()]}),this);return{version:I.version,fields:this.fields,fieldVectors:t,invertedIndex:e,pipeline:this.pipeline.toJSON()}},I.Index.load=function(e){var t={},r={},n=e.fieldVectors,i=Object.create(null),o=e.invertedIndex,s=new I.TokenSet.Builder,u=I.Pipeline.load(e.pipeline);e.version!=I.version&&I.utils.warn("Version mismatch when loading serialised index. Current version of lunr \'"+I.version+"\' does not match serialized index \'"+e.version+"\'");for(var a=0;a<n.length;a++){var c=(f=n[a])[0],l=f[1];r[c]=new I.Vector(l)}for(a=0;a<o.length;a++){var f,p=(f=o[a])[0],h=f[1];s.insert(p),i[p]=h}return s.finish(),t.fields=e.fields,t.fieldVectors=r,t.invertedIndex=i,t.tokenSet=s.root,t.pipeline=u,new I.Index(t)}\n/*!\n * lunr.Builder\n * Copyright (C) 2019 Oliver Nightingale\n */,I.Builder=function(){this._ref="id",this._fields=Object.create(null),this._documents=Object.create(null),this.invertedIndex=Object.create(null),this.fieldTermFrequencies={},this.fieldLengths={},this.tokenizer=I.tokenizer,this.pipeline=new I.Pipeline,this.searchPipeline=new I.Pipeline,this.documentCount=0,this._b=.75,this._k1=1.2,this.termIndex=0,this.metadataWhitelist=[]},I.Builder.prototype.ref=function(e){this._ref=e},I.Builder.prototype.field=function(e,t){if(/\\//.test(e))throw new RangeError("Field \'"+e+"\' contains illegal character \'/\'");this._fields[e]=t||{}},I.Builder.prototype.b=function(e){this._b=e<0?0:e>1?1:e},I.Builder.prototype.k1=function(e){this._k1=e},I.Builder.prototype.add=function(e,t){var r=e[this._ref],n=Object.keys(this._fields);this._documents[r]=t||{},this.documentCount+=1;for(var i=0;i<n.length;i++){var o=n[i],s=this._fields[o].extractor,u=s?s(e):e[o],a=this.tokenizer(u,{fields:[o]}),c=this.pipeline.run(a),l=new I.FieldRef(r,o),f=Object.create(null);this.fieldTermFrequencies[l]=f,this.fieldLengths[l]=0,this.fieldLengths[l]+=c.length;for(var p=0;p<c.length;p++){var h=c[p];if(null==f[h]&&(f[h]=0),f[h]+=1,null==this.invertedIndex[h]){var d=Object.create(null);d._index=this.termIndex,this.termIndex+=1;for(var y=0;y<n.length;y++)d[n[y]]=Object.create(null);this.invertedIndex[h]=d}null==this.invertedIndex[h][o][r]&&(this.invertedIndex[h][o][r]=Object.create(null));for(var v=0;v<this.metadataWhitelist.length;v++){var m=this.metadataWhitelist[v],g=h.metadata[m];null==this.invertedIndex[h][o][r][m]&&(this.invertedIndex[h][o][r][m]=[]),this.invertedIndex[h][o][r][m].push(g)}}}},I.Builder.prototype.calculateAverageFieldLengths=function(){for(var e=Object.keys(this.fieldLengths),t=e.length,r={},n={},i=0;i<t;i++){var o=I.FieldRef.fromString(e[i]),s=o.fieldName;n[s]||(n[s]=0),n[s]+=1,r[s]||(r[s]=0),r[s]+=this.fieldLengths[o]}var u=Object.keys(this._fields);for(i=0;i<u.length;i++){var a=u[i];r[a]=r[a]/n[a]}this.averageFieldLength=r},I.Builder.prototype.createFieldVectors=function(){for(var e={},t=Object.keys(this.fieldTermFrequencies),r=t.length,n=Object.create(null),i=0;i<r;i++){for(var o=I.FieldRef.fromString(t[i]),s=o.fieldName,u=this.fieldLengths[o],a=new I.Vector,c=this.fieldTermFrequencies[o],l=Object.keys(c),f=l.length,p=this._fields[s].boost||1,h=this._documents[o.docRef].boost||1,d=0;d<f;d++){var y,v,m,g=l[d],x=c[g],w=this.invertedIndex[g]._index;void 0===n[g]?(y=I.idf(this.invertedIndex[g],this.documentCount),n[g]=y):y=n[g],v=y*((this._k1+1)*x)/(this._k1*(1-this._b+this._b*(u/this.averageFieldLength[s]))+x),v*=p,v*=h,m=Math.round(1e3*v)/1e3,a.insert(w,m)}e[o]=a}this.fieldVectors=e},I.Builder.prototype.createTokenSet=function(){this.tokenSet=I.TokenSet.fromArray(Object.keys(this.invertedIndex).sort())},I.Builder.prototype.build=function(){return this.calculateAverageFieldLengths(),this.createFieldVectors(),this.createTokenSet(),new I.Index({invertedIndex:this.invertedIndex,fieldVectors:this.fieldVectors,tokenSet:this.tokenSet,fields:Object.keys(this._fields),pipeline:this.searchPipeline})},I.Builder.prototype.use=function(e){var t=Array.prototype.slice.call(arguments,1);t.unshift(this),e.apply(this,t)},I.MatchData=function(e,t,r){for(var n=Object.create(null),i=Object.keys(r||{}),o=0;o<i.length;o++){var s=i[o];n[s]=r[s].slice()}this.metadata=Object.create(null),void 0!==e&&(this.metadata[e]=Object.create(null),this.metadata[e][t]=n)},I.MatchData.prototype.combine=function(e){for(var t=Object.keys(e.metadata),r=0;r<t.length;r++){var n=t[r],i=Object.keys(e.metadata[n]);null==this.metadata[n]&&(this.metadata[n]=Object.create(null));for(var o=0;o<i.length;o++){var s=i[o],u=Object.keys(e.metadata[n][s]);null==this.metadata[n][s]&&(this.metadata[n][s]=Object.create(null));for(var a=0;a<u.length;a++){var c=u[a];null==this.metadata[n][s][c]?this.metadata[n][s][c]=e.metadata[n][s][c]:this.metadata[n][s][c]=this.metadata[n][s][c].concat(e.metadata[n][s][c])}}}},I.MatchData.prototype.add=function(e,t,r){if(!(e in this.metadata))return this.metadata[e]=Object.create(null),void(this.metadata[e][t]=r);if(t in this.metadata[e])for(var n=Object.keys(r),i=0;i<n.length;i++){var o=n[i];o in this.metadata[e][t]?this.metadata[e][t][o]=this.metadata[e][t][o].concat(r[o]):this.metadata[e][t][o]=r[o]}else this.metadata[e][t]=r},I.Query=function(e){this.clauses=[],this.allFields=e},I.Query.wildcard=new String("*"),I.Query.wildcard.NONE=0,I.Query.wildcard.LEADING=1,I.Query.wildcard.TRAILING=2,I.Query.presence={OPTIONAL:1,REQUIRED:2,PROHIBITED:3},I.Query.prototype.clause=function(e){return"fields"in e||(e.fields=this.allFields),"boost"in e||(e.boost=1),"usePipeline"in e||(e.usePipeline=!0),"wildcard"in e||(e.wildcard=I.Query.wildcard.NONE),e.wildcard&I.Query.wildcard.LEADING&&e.term.charAt(0)!=I.Query.wildcard&&(e.term="*"+e.term),e.wildcard&I.Query.wildcard.TRAILING&&e.term.slice(-1)!=I.Query.wildcard&&(e.term=e.term+"*"),"presence"in e||(e.presence=I.Query.presence.OPTIONAL),this.clauses.push(e),this},I.Query.prototype.isNegated=function(){for(var e=0;e<this.clauses.length;e++)if(this.clauses[e].presence!=I.Query.presence.PROHIBITED)return!1;return!0},I.Query.prototype.term=function(e,t){if(Array.isArray(e))return e.forEach((function(e){this.term(e,I.utils.clone(t))}),this),this;var r=t||{};return r.term=e.toString(),this.clause(r),this},I.QueryParseError=function(e,t,r){this.name="QueryParseError",this.message=e,this.start=t,this.end=r},I.QueryParseError.prototype=new Error,I.QueryLexer=function(e){this.lexemes=[],this.str=e,this.length=e.length,this.pos=0,this.start=0,this.escapeCharPositions=[]},I.QueryLexer.prototype.run=function(){for(var e=I.QueryLexer.lexText;e;)e=e(this)},I.QueryLexer.prototype.sliceString=function(){for(var e=[],t=this.start,r=this.pos,n=0;n<this.escapeCharPositions.length;n++)r=this.escapeCharPositions[n],e.push(this.str.slice(t,r)),t=r+1;return e.push(this.str.slice(t,this.pos)),this.escapeCharPositions.length=0,e.join("")},I.QueryLexer.prototype.emit=function(e){this.lexemes.push({type:e,str:this.sliceString(),start:this.start,end:this.pos}),this.start=this.pos},I.QueryLexer.prototype.escapeCharacter=function(){this.escapeCharPositions.push(this.pos-1),this.pos+=1},I.QueryLexer.prototype.next=function(){if(this.pos>=this.length)return I.QueryLexer.EOS;var e=this.str.charAt(this.pos);return this.pos+=1,e},I.QueryLexer.prototype.width=function(){return this.pos-this.start},I.QueryLexer.prototype.ignore=function(){this.start==this.pos&&(this.pos+=1),this.start=this.pos},I.QueryLexer.prototype.backup=function(){this.pos-=1},I.QueryLexer.prototype.acceptDigitRun=function(){var e,t;do{t=(e=this.next()).charCodeAt(0)}while(t>47&&t<58);e!=I.QueryLexer.EOS&&this.backup()},I.QueryLexer.prototype.more=function(){return this.pos<this.length},I.QueryLexer.EOS="EOS",I.QueryLexer.FIELD="FIELD",I.QueryLexer.TERM="TERM",I.QueryLexer.EDIT_DISTANCE="EDIT_DISTANCE",I.QueryLexer.BOOST="BOOST",I.QueryLexer.PRESENCE="PRESENCE",I.QueryLexer.lexField=function(e){return e.backup(),e.emit(I.QueryLexer.FIELD),e.ignore(),I.QueryLexer.lexText},I.QueryLexer.lexTerm=function(e){if(e.width()>1&&(e.backup(),e.emit(I.QueryLexer.TERM)),e.ignore(),e.more())return I.QueryLexer.lexText},I.QueryLexer.lexEditDistance=function(e){return e.ignore(),e.acceptDigitRun(),e.emit(I.QueryLexer.EDIT_DISTANCE),I.QueryLexer.lexText},I.QueryLexer.lexBoost=function(e){return e.ignore(),e.acceptDigitRun(),e.emit(I.QueryLexer.BOOST),I.QueryLexer.lexText},I.QueryLexer.lexEOS=function(e){e.width()>0&&e.emit(I.QueryLexer.TERM)},I.QueryLexer.termSeparator=I.tokenizer.separator,I.QueryLexer.lexText=function(e){for(;;){var t=e.next();if(t==I.QueryLexer.EOS)return I.QueryLexer.lexEOS;if(92!=t.charCodeAt(0)){if(":"==t)return I.QueryLexer.lexField;if("~"==t)return e.backup(),e.width()>0&&e.emit(I.QueryLexer.TERM),I.QueryLexer.lexEditDistance;if("^"==t)return e.backup(),e.width()>0&&e.emit(I.QueryLexer.TERM),I.QueryLexer.lexBoost;if("+"==t&&1===e.width())return e.emit(I.QueryLexer.PRESENCE),I.QueryLexer.lexText;if("-"==t&&1===e.width())return e.emit(I.QueryLexer.PRESENCE),I.QueryLexer.lexText;if(t.match(I.QueryLexer.termSeparator))return I.QueryLexer.lexTerm}else e.escapeCharacter()}},I.QueryParser=function(e,t){this.lexer=new I.QueryLexer(e),this.query=t,this.currentClause={},this.lexemeIdx=0},I.QueryParser.prototype.parse=function(){this.lexer.run(),this.lexemes=this.lexer.lexemes;for(var e=I.QueryParser.parseClause;e;)e=e(this);return this.query},I.QueryParser.prototype.peekLexeme=function(){return this.lexemes[this.lexemeIdx]},I.QueryParser.prototype.consumeLexeme=function(){var e=this.peekLexeme();return this.lexemeIdx+=1,e},I.QueryParser.prototype.nextClause=function(){var e=this.currentClause;this.query.clause(e),this.currentClause={}},I.QueryParser.parseClause=function(e){var t=e.peekLexeme();if(null!=t)switch(t.type){case I.QueryLexer.PRESENCE:return I.QueryParser.parsePresence;case I.QueryLexer.FIELD:return I.QueryParser.parseField;case I.QueryLexer.TERM:return I.QueryParser.parseTerm;default:var r="expected either a field or a term, found "+t.type;throw t.str.length>=1&&(r+=" with value \'"+t.str+"\'"),new I.QueryParseError(r,t.start,t.end)}},I.QueryParser.parsePresence=function(e){var t=e.consumeLexeme();if(null!=t){switch(t.str){case"-":e.currentClause.presence=I.Query.presence.PROHIBITED;break;case"+":e.currentClause.presence=I.Query.presence.REQUIRED;break;default:var r="unrecognised presence operator\'"+t.str+"\'";throw new I.QueryParseError(r,t.start,t.end)}var n=e.peekLexeme();if(null==n){r="expecting term or field, found nothing";throw new I.QueryParseError(r,t.start,t.end)}switch(n.type){case I.QueryLexer.FIELD:return I.QueryParser.parseField;case I.QueryLexer.TERM:return I.QueryParser.parseTerm;default:r="expecting term or field, found \'"+n.type+"\'";throw new I.QueryParseError(r,n.start,n.end)}}},I.QueryParser.parseField=function(e){var t=e.consumeLexeme();if(null!=t){if(-1==e.query.allFields.indexOf(t.str)){var r=e.query.allFields.map((function(e){return"\'"+e+"\'"})).join(", "),n="unrecognised field \'"+t.str+"\', possible fields: "+r;throw new I.QueryParseError(n,t.start,t.end)}e.currentClause.fields=[t.str];var i=e.peekLexeme();if(null==i){n="expecting term, found nothing";throw new I.QueryParseError(n,t.start,t.end)}switch(i.type){case I.QueryLexer.TERM:return I.QueryParser.parseTerm;default:n="expecting term, found \'"+i.type+"\'";throw new I.QueryParseError(n,i.start,i.end)}}},I.QueryParser.parseTerm=function(e){var t=e.consumeLexeme();if(null!=t){e.currentClause.term=t.str.toLowerCase(),-1!=t.str.indexOf("*")&&(e.currentClause.usePipeline=!1);var r=e.peekLexeme();if(null!=r)switch(r.type){case I.QueryLexer.TERM:return e.nextClause(),I.QueryParser.parseTerm;case I.QueryLexer.FIELD:return e.nextClause(),I.QueryParser.parseField;case I.QueryLexer.EDIT_DISTANCE:return I.QueryParser.parseEditDistance;case I.QueryLexer.BOOST:return I.QueryParser.parseBoost;case I.QueryLexer.PRESENCE:return e.nextClause(),I.QueryParser.parsePresence;default:var n="Unexpected lexeme type \'"+r.type+"\'";throw new I.QueryParseError(n,r.start,r.end)}else e.nextClause()}},I.QueryParser.parseEditDistance=function(e){var t=e.consumeLexeme();if(null!=t){var r=parseInt(t.str,10);if(isNaN(r)){var n="edit distance must be numeric";throw new I.QueryParseError(n,t.start,t.end)}e.currentClause.editDistance=r;var i=e.peekLexeme();if(null!=i)switch(i.type){case I.QueryLexer.TERM:return e.nextClause(),I.QueryParser.parseTerm;case I.QueryLexer.FIELD:return e.nextClause(),I.QueryParser.parseField;case I.QueryLexer.EDIT_DISTANCE:return I.QueryParser.parseEditDistance;case I.QueryLexer.BOOST:return I.QueryParser.parseBoost;case I.QueryLexer.PRESENCE:return e.nextClause(),I.QueryParser.parsePresence;default:n="Unexpected lexeme type \'"+i.type+"\'";throw new I.QueryParseError(n,i.start,i.end)}else e.nextClause()}},I.QueryParser.parseBoost=function(e){var t=e.consumeLexeme();if(null!=t){var r=parseInt(t.str,10);if(isNaN(r)){var n="boost must be numeric";throw new I.QueryParseError(n,t.start,t.end)}e.currentClause.boost=r;var i=e.peekLexeme();if(null!=i)switch(i.type){case I.QueryLexer.TERM:return e.nextClause(),I.QueryParser.parseTerm;case I.QueryLexer.FIELD:return e.nextClause(),I.QueryParser.parseField;case I.QueryLexer.EDIT_DISTANCE:return I.QueryParser.parseEditDistance;case I.QueryLexer.BOOST:return I.QueryParser.parseBoost;case I.QueryLexer.PRESENCE:return e.nextClause(),I.QueryParser.parsePresence;default:n="Unexpected lexeme type \'"+i.type+"\'";throw new I.QueryParseError(n,i.start,i.end)}else e.nextClause()}},void 0===(i="function"==typeof(n=function(){return I})?n.call(t,r,t,e):n)||(e.exports=i)}()},function(e,t){e.exports=function(e){try{return!!e()}catch(e){return!0}}},function(e,t,r){var n=r(8),i=r(9),o=r(22);e.exports=n?function(e,t,r){return i.f(e,t,o(1,r))}:function(e,t,r){return e[t]=r,e}},function(e,t){e.exports=function(e){return"object"==typeof e?null!==e:"function"==typeof e}},function(e,t,r){var n=r(5);e.exports=!n((function(){return 7!=Object.defineProperty({},1,{get:function(){return 7}})[1]}))},function(e,t,r){var n=r(8),i=r(34),o=r(2),s=r(35),u=Object.defineProperty;t.f=n?u:function(e,t,r){if(o(e),t=s(t,!0),o(r),i)try{return u(e,t,r)}catch(e){}if("get"in r||"set"in r)throw TypeError("Accessors not supported");return"value"in r&&(e[t]=r.value),e}},function(e,t,r){var n=r(0),i=r(6),o=r(3),s=r(20),u=r(23),a=r(16),c=a.get,l=a.enforce,f=String(String).split("String");(e.exports=function(e,t,r,u){var a=!!u&&!!u.unsafe,c=!!u&&!!u.enumerable,p=!!u&&!!u.noTargetGet;"function"==typeof r&&("string"!=typeof t||o(r,"name")||i(r,"name",t),l(r).source=f.join("string"==typeof t?t:"")),e!==n?(a?!p&&e[t]&&(c=!0):delete e[t],c?e[t]=r:i(e,t,r)):c?e[t]=r:s(t,r)})(Function.prototype,"toString",(function(){return"function"==typeof this&&c(this).source||u(this)}))},function(e,t,r){var n=r(40),i=r(0),o=function(e){return"function"==typeof e?e:void 0};e.exports=function(e,t){return arguments.length<2?o(n[e])||o(i[e]):n[e]&&n[e][t]||i[e]&&i[e][t]}},function(e,t){e.exports=!1},function(e,t){var r={}.toString;e.exports=function(e){return r.call(e).slice(8,-1)}},function(e,t){e.exports={}},function(e,t){e.exports=function(e){if("function"!=typeof e)throw TypeError(String(e)+" is not a function");return e}},function(e,t,r){var n,i,o,s=r(61),u=r(0),a=r(7),c=r(6),l=r(3),f=r(24),p=r(25),h=u.WeakMap;if(s){var d=new h,y=d.get,v=d.has,m=d.set;n=function(e,t){return m.call(d,e,t),t},i=function(e){return y.call(d,e)||{}},o=function(e){return v.call(d,e)}}else{var g=f("state");p[g]=!0,n=function(e,t){return c(e,g,t),t},i=function(e){return l(e,g)?e[g]:{}},o=function(e){return l(e,g)}}e.exports={set:n,get:i,has:o,enforce:function(e){return o(e)?i(e):n(e,{})},getterFor:function(e){return function(t){var r;if(!a(t)||(r=i(t)).type!==e)throw TypeError("Incompatible receiver, "+e+" required");return r}}}},function(e,t,r){var n=r(0),i=r(28).f,o=r(6),s=r(10),u=r(20),a=r(67),c=r(43);e.exports=function(e,t){var r,l,f,p,h,d=e.target,y=e.global,v=e.stat;if(r=y?n:v?n[d]||u(d,{}):(n[d]||{}).prototype)for(l in t){if(p=t[l],f=e.noTargetGet?(h=i(r,l))&&h.value:r[l],!c(y?l:d+(v?".":"#")+l,e.forced)&&void 0!==f){if(typeof p==typeof f)continue;a(p,f)}(e.sham||f&&f.sham)&&o(p,"sham",!0),s(r,l,p,e)}}},function(e,t,r){var n=r(66),i=r(27);e.exports=function(e){return n(i(e))}},function(e,t,r){var n={};n[r(1)("toStringTag")]="z",e.exports="[object z]"===String(n)},function(e,t,r){var n=r(0),i=r(6);e.exports=function(e,t){try{i(n,e,t)}catch(r){n[e]=t}return t}},function(e,t,r){var n=r(0),i=r(7),o=n.document,s=i(o)&&i(o.createElement);e.exports=function(e){return s?o.createElement(e):{}}},function(e,t){e.exports=function(e,t){return{enumerable:!(1&e),configurable:!(2&e),writable:!(4&e),value:t}}},function(e,t,r){var n=r(33),i=Function.toString;"function"!=typeof n.inspectSource&&(n.inspectSource=function(e){return i.call(e)}),e.exports=n.inspectSource},function(e,t,r){var n=r(32),i=r(36),o=n("keys");e.exports=function(e){return o[e]||(o[e]=i(e))}},function(e,t){e.exports={}},function(e,t){var r=Math.ceil,n=Math.floor;e.exports=function(e){return isNaN(e=+e)?0:(e>0?n:r)(e)}},function(e,t){e.exports=function(e){if(null==e)throw TypeError("Can\'t call method on "+e);return e}},function(e,t,r){var n=r(8),i=r(65),o=r(22),s=r(18),u=r(35),a=r(3),c=r(34),l=Object.getOwnPropertyDescriptor;t.f=n?l:function(e,t){if(e=s(e),t=u(t,!0),c)try{return l(e,t)}catch(e){}if(a(e,t))return o(!i.f.call(e,t),e[t])}},function(e,t){e.exports=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"]},function(e,t,r){var n=r(9).f,i=r(3),o=r(1)("toStringTag");e.exports=function(e,t,r){e&&!i(e=r?e:e.prototype,o)&&n(e,o,{configurable:!0,value:t})}},function(e,t,r){"use strict";var n=r(15),i=function(e){var t,r;this.promise=new e((function(e,n){if(void 0!==t||void 0!==r)throw TypeError("Bad Promise constructor");t=e,r=n})),this.resolve=n(t),this.reject=n(r)};e.exports.f=function(e){return new i(e)}},function(e,t,r){var n=r(12),i=r(33);(e.exports=function(e,t){return i[e]||(i[e]=void 0!==t?t:{})})("versions",[]).push({version:"3.6.5",mode:n?"pure":"global",copyright:"© 2020 Denis Pushkarev (zloirock.ru)"})},function(e,t,r){var n=r(0),i=r(20),o=n["__core-js_shared__"]||i("__core-js_shared__",{});e.exports=o},function(e,t,r){var n=r(8),i=r(5),o=r(21);e.exports=!n&&!i((function(){return 7!=Object.defineProperty(o("div"),"a",{get:function(){return 7}}).a}))},function(e,t,r){var n=r(7);e.exports=function(e,t){if(!n(e))return e;var r,i;if(t&&"function"==typeof(r=e.toString)&&!n(i=r.call(e)))return i;if("function"==typeof(r=e.valueOf)&&!n(i=r.call(e)))return i;if(!t&&"function"==typeof(r=e.toString)&&!n(i=r.call(e)))return i;throw TypeError("Can\'t convert object to primitive value")}},function(e,t){var r=0,n=Math.random();e.exports=function(e){return"Symbol("+String(void 0===e?"":e)+")_"+(++r+n).toString(36)}},function(e,t,r){var n=r(5);e.exports=!!Object.getOwnPropertySymbols&&!n((function(){return!String(Symbol())}))},function(e,t,r){var n=r(19),i=r(13),o=r(1)("toStringTag"),s="Arguments"==i(function(){return arguments}());e.exports=n?i:function(e){var t,r,n;return void 0===e?"Undefined":null===e?"Null":"string"==typeof(r=function(e,t){try{return e[t]}catch(e){}}(t=Object(e),o))?r:s?i(t):"Object"==(n=i(t))&&"function"==typeof t.callee?"Arguments":n}},function(e,t,r){"use strict";var n=r(17),i=r(73),o=r(45),s=r(78),u=r(30),a=r(6),c=r(10),l=r(1),f=r(12),p=r(14),h=r(44),d=h.IteratorPrototype,y=h.BUGGY_SAFARI_ITERATORS,v=l("iterator"),m=function(){return this};e.exports=function(e,t,r,l,h,g,x){i(r,t,l);var w,b,S,P=function(e){if(e===h&&T)return T;if(!y&&e in E)return E[e];switch(e){case"keys":case"values":case"entries":return function(){return new r(this,e)}}return function(){return new r(this)}},O=t+" Iterator",k=!1,E=e.prototype,L=E[v]||E["@@iterator"]||h&&E[h],T=!y&&L||P(h),Q="Array"==t&&E.entries||L;if(Q&&(w=o(Q.call(new e)),d!==Object.prototype&&w.next&&(f||o(w)===d||(s?s(w,d):"function"!=typeof w[v]&&a(w,v,m)),u(w,O,!0,!0),f&&(p[O]=m))),"values"==h&&L&&"values"!==L.name&&(k=!0,T=function(){return L.call(this)}),f&&!x||E[v]===T||a(E,v,T),p[t]=T,h)if(b={values:P("values"),keys:g?T:P("keys"),entries:P("entries")},x)for(S in b)(y||k||!(S in E))&&c(E,S,b[S]);else n({target:t,proto:!0,forced:y||k},b);return b}},function(e,t,r){var n=r(0);e.exports=n},function(e,t,r){var n=r(3),i=r(18),o=r(70).indexOf,s=r(25);e.exports=function(e,t){var r,u=i(e),a=0,c=[];for(r in u)!n(s,r)&&n(u,r)&&c.push(r);for(;t.length>a;)n(u,r=t[a++])&&(~o(c,r)||c.push(r));return c}},function(e,t,r){var n=r(26),i=Math.min;e.exports=function(e){return e>0?i(n(e),9007199254740991):0}},function(e,t,r){var n=r(5),i=/#|\\.prototype\\./,o=function(e,t){var r=u[s(e)];return r==c||r!=a&&("function"==typeof t?n(t):!!t)},s=o.normalize=function(e){return String(e).replace(i,".").toLowerCase()},u=o.data={},a=o.NATIVE="N",c=o.POLYFILL="P";e.exports=o},function(e,t,r){"use strict";var n,i,o,s=r(45),u=r(6),a=r(3),c=r(1),l=r(12),f=c("iterator"),p=!1;[].keys&&("next"in(o=[].keys())?(i=s(s(o)))!==Object.prototype&&(n=i):p=!0),null==n&&(n={}),l||a(n,f)||u(n,f,(function(){return this})),e.exports={IteratorPrototype:n,BUGGY_SAFARI_ITERATORS:p}},function(e,t,r){var n=r(3),i=r(74),o=r(24),s=r(75),u=o("IE_PROTO"),a=Object.prototype;e.exports=s?Object.getPrototypeOf:function(e){return e=i(e),n(e,u)?e[u]:"function"==typeof e.constructor&&e instanceof e.constructor?e.constructor.prototype:e instanceof Object?a:null}},function(e,t,r){var n,i=r(2),o=r(76),s=r(29),u=r(25),a=r(47),c=r(21),l=r(24),f=l("IE_PROTO"),p=function(){},h=function(e){return"<script>"+e+"<\\/script>"},d=function(){try{n=document.domain&&new ActiveXObject("htmlfile")}catch(e){}var e,t;d=n?function(e){e.write(h("")),e.close();var t=e.parentWindow.Object;return e=null,t}(n):((t=c("iframe")).style.display="none",a.appendChild(t),t.src=String("javascript:"),(e=t.contentWindow.document).open(),e.write(h("document.F=Object")),e.close(),e.F);for(var r=s.length;r--;)delete d.prototype[s[r]];return d()};u[f]=!0,e.exports=Object.create||function(e,t){var r;return null!==e?(p.prototype=i(e),r=new p,p.prototype=null,r[f]=e):r=d(),void 0===t?r:o(r,t)}},function(e,t,r){var n=r(11);e.exports=n("document","documentElement")},function(e,t,r){var n=r(0);e.exports=n.Promise},function(e,t,r){var n=r(2),i=r(88),o=r(42),s=r(50),u=r(89),a=r(90),c=function(e,t){this.stopped=e,this.result=t};(e.exports=function(e,t,r,l,f){var p,h,d,y,v,m,g,x=s(t,r,l?2:1);if(f)p=e;else{if("function"!=typeof(h=u(e)))throw TypeError("Target is not iterable");if(i(h)){for(d=0,y=o(e.length);y>d;d++)if((v=l?x(n(g=e[d])[0],g[1]):x(e[d]))&&v instanceof c)return v;return new c(!1)}p=h.call(e)}for(m=p.next;!(g=m.call(p)).done;)if("object"==typeof(v=a(p,x,g.value,l))&&v&&v instanceof c)return v;return new c(!1)}).stop=function(e){return new c(!0,e)}},function(e,t,r){var n=r(15);e.exports=function(e,t,r){if(n(e),void 0===t)return e;switch(r){case 0:return function(){return e.call(t)};case 1:return function(r){return e.call(t,r)};case 2:return function(r,n){return e.call(t,r,n)};case 3:return function(r,n,i){return e.call(t,r,n,i)}}return function(){return e.apply(t,arguments)}}},function(e,t,r){var n=r(2),i=r(15),o=r(1)("species");e.exports=function(e,t){var r,s=n(e).constructor;return void 0===s||null==(r=n(s)[o])?t:i(r)}},function(e,t,r){var n,i,o,s=r(0),u=r(5),a=r(13),c=r(50),l=r(47),f=r(21),p=r(53),h=s.location,d=s.setImmediate,y=s.clearImmediate,v=s.process,m=s.MessageChannel,g=s.Dispatch,x=0,w={},b=function(e){if(w.hasOwnProperty(e)){var t=w[e];delete w[e],t()}},S=function(e){return function(){b(e)}},P=function(e){b(e.data)},O=function(e){s.postMessage(e+"",h.protocol+"//"+h.host)};d&&y||(d=function(e){for(var t=[],r=1;arguments.length>r;)t.push(arguments[r++]);return w[++x]=function(){("function"==typeof e?e:Function(e)).apply(void 0,t)},n(x),x},y=function(e){delete w[e]},"process"==a(v)?n=function(e){v.nextTick(S(e))}:g&&g.now?n=function(e){g.now(S(e))}:m&&!p?(o=(i=new m).port2,i.port1.onmessage=P,n=c(o.postMessage,o,1)):!s.addEventListener||"function"!=typeof postMessage||s.importScripts||u(O)||"file:"===h.protocol?n="onreadystatechange"in f("script")?function(e){l.appendChild(f("script")).onreadystatechange=function(){l.removeChild(this),b(e)}}:function(e){setTimeout(S(e),0)}:(n=O,s.addEventListener("message",P,!1))),e.exports={set:d,clear:y}},function(e,t,r){var n=r(54);e.exports=/(iphone|ipod|ipad).*applewebkit/i.test(n)},function(e,t,r){var n=r(11);e.exports=n("navigator","userAgent")||""},function(e,t,r){var n=r(2),i=r(7),o=r(31);e.exports=function(e,t){if(n(e),i(t)&&t.constructor===e)return t;var r=o.f(e);return(0,r.resolve)(t),r.promise}},function(e,t){e.exports=function(e){try{return{error:!1,value:e()}}catch(e){return{error:!0,value:e}}}},function(e,t,r){r(58),r(63),r(80),r(84),r(95),r(96);var n=r(40);e.exports=n.Promise},function(e,t,r){var n=r(19),i=r(10),o=r(62);n||i(Object.prototype,"toString",o,{unsafe:!0})},function(e,t){var r;r=function(){return this}();try{r=r||new Function("return this")()}catch(e){"object"==typeof window&&(r=window)}e.exports=r},function(e,t,r){var n=r(37);e.exports=n&&!Symbol.sham&&"symbol"==typeof Symbol.iterator},function(e,t,r){var n=r(0),i=r(23),o=n.WeakMap;e.exports="function"==typeof o&&/native code/.test(i(o))},function(e,t,r){"use strict";var n=r(19),i=r(38);e.exports=n?{}.toString:function(){return"[object "+i(this)+"]"}},function(e,t,r){"use strict";var n=r(64).charAt,i=r(16),o=r(39),s=i.set,u=i.getterFor("String Iterator");o(String,"String",(function(e){s(this,{type:"String Iterator",string:String(e),index:0})}),(function(){var e,t=u(this),r=t.string,i=t.index;return i>=r.length?{value:void 0,done:!0}:(e=n(r,i),t.index+=e.length,{value:e,done:!1})}))},function(e,t,r){var n=r(26),i=r(27),o=function(e){return function(t,r){var o,s,u=String(i(t)),a=n(r),c=u.length;return a<0||a>=c?e?"":void 0:(o=u.charCodeAt(a))<55296||o>56319||a+1===c||(s=u.charCodeAt(a+1))<56320||s>57343?e?u.charAt(a):o:e?u.slice(a,a+2):s-56320+(o-55296<<10)+65536}};e.exports={codeAt:o(!1),charAt:o(!0)}},function(e,t,r){"use strict";var n={}.propertyIsEnumerable,i=Object.getOwnPropertyDescriptor,o=i&&!n.call({1:2},1);t.f=o?function(e){var t=i(this,e);return!!t&&t.enumerable}:n},function(e,t,r){var n=r(5),i=r(13),o="".split;e.exports=n((function(){return!Object("z").propertyIsEnumerable(0)}))?function(e){return"String"==i(e)?o.call(e,""):Object(e)}:Object},function(e,t,r){var n=r(3),i=r(68),o=r(28),s=r(9);e.exports=function(e,t){for(var r=i(t),u=s.f,a=o.f,c=0;c<r.length;c++){var l=r[c];n(e,l)||u(e,l,a(t,l))}}},function(e,t,r){var n=r(11),i=r(69),o=r(72),s=r(2);e.exports=n("Reflect","ownKeys")||function(e){var t=i.f(s(e)),r=o.f;return r?t.concat(r(e)):t}},function(e,t,r){var n=r(41),i=r(29).concat("length","prototype");t.f=Object.getOwnPropertyNames||function(e){return n(e,i)}},function(e,t,r){var n=r(18),i=r(42),o=r(71),s=function(e){return function(t,r,s){var u,a=n(t),c=i(a.length),l=o(s,c);if(e&&r!=r){for(;c>l;)if((u=a[l++])!=u)return!0}else for(;c>l;l++)if((e||l in a)&&a[l]===r)return e||l||0;return!e&&-1}};e.exports={includes:s(!0),indexOf:s(!1)}},function(e,t,r){var n=r(26),i=Math.max,o=Math.min;e.exports=function(e,t){var r=n(e);return r<0?i(r+t,0):o(r,t)}},function(e,t){t.f=Object.getOwnPropertySymbols},function(e,t,r){"use strict";var n=r(44).IteratorPrototype,i=r(46),o=r(22),s=r(30),u=r(14),a=function(){return this};e.exports=function(e,t,r){var c=t+" Iterator";return e.prototype=i(n,{next:o(1,r)}),s(e,c,!1,!0),u[c]=a,e}},function(e,t,r){var n=r(27);e.exports=function(e){return Object(n(e))}},function(e,t,r){var n=r(5);e.exports=!n((function(){function e(){}return e.prototype.constructor=null,Object.getPrototypeOf(new e)!==e.prototype}))},function(e,t,r){var n=r(8),i=r(9),o=r(2),s=r(77);e.exports=n?Object.defineProperties:function(e,t){o(e);for(var r,n=s(t),u=n.length,a=0;u>a;)i.f(e,r=n[a++],t[r]);return e}},function(e,t,r){var n=r(41),i=r(29);e.exports=Object.keys||function(e){return n(e,i)}},function(e,t,r){var n=r(2),i=r(79);e.exports=Object.setPrototypeOf||("__proto__"in{}?function(){var e,t=!1,r={};try{(e=Object.getOwnPropertyDescriptor(Object.prototype,"__proto__").set).call(r,[]),t=r instanceof Array}catch(e){}return function(r,o){return n(r),i(o),t?e.call(r,o):r.__proto__=o,r}}():void 0)},function(e,t,r){var n=r(7);e.exports=function(e){if(!n(e)&&null!==e)throw TypeError("Can\'t set "+String(e)+" as a prototype");return e}},function(e,t,r){var n=r(0),i=r(81),o=r(82),s=r(6),u=r(1),a=u("iterator"),c=u("toStringTag"),l=o.values;for(var f in i){var p=n[f],h=p&&p.prototype;if(h){if(h[a]!==l)try{s(h,a,l)}catch(e){h[a]=l}if(h[c]||s(h,c,f),i[f])for(var d in o)if(h[d]!==o[d])try{s(h,d,o[d])}catch(e){h[d]=o[d]}}}},function(e,t){e.exports={CSSRuleList:0,CSSStyleDeclaration:0,CSSValueList:0,ClientRectList:0,DOMRectList:0,DOMStringList:0,DOMTokenList:1,DataTransferItemList:0,FileList:0,HTMLAllCollection:0,HTMLCollection:0,HTMLFormElement:0,HTMLSelectElement:0,MediaList:0,MimeTypeArray:0,NamedNodeMap:0,NodeList:1,PaintRequestList:0,Plugin:0,PluginArray:0,SVGLengthList:0,SVGNumberList:0,SVGPathSegList:0,SVGPointList:0,SVGStringList:0,SVGTransformList:0,SourceBufferList:0,StyleSheetList:0,TextTrackCueList:0,TextTrackList:0,TouchList:0}},function(e,t,r){"use strict";var n=r(18),i=r(83),o=r(14),s=r(16),u=r(39),a=s.set,c=s.getterFor("Array Iterator");e.exports=u(Array,"Array",(function(e,t){a(this,{type:"Array Iterator",target:n(e),index:0,kind:t})}),(function(){var e=c(this),t=e.target,r=e.kind,n=e.index++;return!t||n>=t.length?(e.target=void 0,{value:void 0,done:!0}):"keys"==r?{value:n,done:!1}:"values"==r?{value:t[n],done:!1}:{value:[n,t[n]],done:!1}}),"values"),o.Arguments=o.Array,i("keys"),i("values"),i("entries")},function(e,t,r){var n=r(1),i=r(46),o=r(9),s=n("unscopables"),u=Array.prototype;null==u[s]&&o.f(u,s,{configurable:!0,value:i(null)}),e.exports=function(e){u[s][e]=!0}},function(e,t,r){"use strict";var n,i,o,s,u=r(17),a=r(12),c=r(0),l=r(11),f=r(48),p=r(10),h=r(85),d=r(30),y=r(86),v=r(7),m=r(15),g=r(87),x=r(13),w=r(23),b=r(49),S=r(91),P=r(51),O=r(52).set,k=r(92),E=r(55),L=r(93),T=r(31),Q=r(56),j=r(16),I=r(43),R=r(1),_=r(94),F=R("species"),C="Promise",N=j.get,A=j.set,D=j.getterFor(C),M=f,B=c.TypeError,V=c.document,z=c.process,W=l("fetch"),$=T.f,q=$,G="process"==x(z),U=!!(V&&V.createEvent&&c.dispatchEvent),H=I(C,(function(){if(!(w(M)!==String(M))){if(66===_)return!0;if(!G&&"function"!=typeof PromiseRejectionEvent)return!0}if(a&&!M.prototype.finally)return!0;if(_>=51&&/native code/.test(M))return!1;var e=M.resolve(1),t=function(e){e((function(){}),(function(){}))};return(e.constructor={})[F]=t,!(e.then((function(){}))instanceof t)})),J=H||!S((function(e){M.all(e).catch((function(){}))})),Y=function(e){var t;return!(!v(e)||"function"!=typeof(t=e.then))&&t},K=function(e,t,r){if(!t.notified){t.notified=!0;var n=t.reactions;k((function(){for(var i=t.value,o=1==t.state,s=0;n.length>s;){var u,a,c,l=n[s++],f=o?l.ok:l.fail,p=l.resolve,h=l.reject,d=l.domain;try{f?(o||(2===t.rejection&&te(e,t),t.rejection=1),!0===f?u=i:(d&&d.enter(),u=f(i),d&&(d.exit(),c=!0)),u===l.promise?h(B("Promise-chain cycle")):(a=Y(u))?a.call(u,p,h):p(u)):h(i)}catch(e){d&&!c&&d.exit(),h(e)}}t.reactions=[],t.notified=!1,r&&!t.rejection&&Z(e,t)}))}},X=function(e,t,r){var n,i;U?((n=V.createEvent("Event")).promise=t,n.reason=r,n.initEvent(e,!1,!0),c.dispatchEvent(n)):n={promise:t,reason:r},(i=c["on"+e])?i(n):"unhandledrejection"===e&&L("Unhandled promise rejection",r)},Z=function(e,t){O.call(c,(function(){var r,n=t.value;if(ee(t)&&(r=Q((function(){G?z.emit("unhandledRejection",n,e):X("unhandledrejection",e,n)})),t.rejection=G||ee(t)?2:1,r.error))throw r.value}))},ee=function(e){return 1!==e.rejection&&!e.parent},te=function(e,t){O.call(c,(function(){G?z.emit("rejectionHandled",e):X("rejectionhandled",e,t.value)}))},re=function(e,t,r,n){return function(i){e(t,r,i,n)}},ne=function(e,t,r,n){t.done||(t.done=!0,n&&(t=n),t.value=r,t.state=2,K(e,t,!0))},ie=function(e,t,r,n){if(!t.done){t.done=!0,n&&(t=n);try{if(e===r)throw B("Promise can\'t be resolved itself");var i=Y(r);i?k((function(){var n={done:!1};try{i.call(r,re(ie,e,n,t),re(ne,e,n,t))}catch(r){ne(e,n,r,t)}})):(t.value=r,t.state=1,K(e,t,!1))}catch(r){ne(e,{done:!1},r,t)}}};H&&(M=function(e){g(this,M,C),m(e),n.call(this);var t=N(this);try{e(re(ie,this,t),re(ne,this,t))}catch(e){ne(this,t,e)}},(n=function(e){A(this,{type:C,done:!1,notified:!1,parent:!1,reactions:[],rejection:!1,state:0,value:void 0})}).prototype=h(M.prototype,{then:function(e,t){var r=D(this),n=$(P(this,M));return n.ok="function"!=typeof e||e,n.fail="function"==typeof t&&t,n.domain=G?z.domain:void 0,r.parent=!0,r.reactions.push(n),0!=r.state&&K(this,r,!1),n.promise},catch:function(e){return this.then(void 0,e)}}),i=function(){var e=new n,t=N(e);this.promise=e,this.resolve=re(ie,e,t),this.reject=re(ne,e,t)},T.f=$=function(e){return e===M||e===o?new i(e):q(e)},a||"function"!=typeof f||(s=f.prototype.then,p(f.prototype,"then",(function(e,t){var r=this;return new M((function(e,t){s.call(r,e,t)})).then(e,t)}),{unsafe:!0}),"function"==typeof W&&u({global:!0,enumerable:!0,forced:!0},{fetch:function(e){return E(M,W.apply(c,arguments))}}))),u({global:!0,wrap:!0,forced:H},{Promise:M}),d(M,C,!1,!0),y(C),o=l(C),u({target:C,stat:!0,forced:H},{reject:function(e){var t=$(this);return t.reject.call(void 0,e),t.promise}}),u({target:C,stat:!0,forced:a||H},{resolve:function(e){return E(a&&this===o?M:this,e)}}),u({target:C,stat:!0,forced:J},{all:function(e){var t=this,r=$(t),n=r.resolve,i=r.reject,o=Q((function(){var r=m(t.resolve),o=[],s=0,u=1;b(e,(function(e){var a=s++,c=!1;o.push(void 0),u++,r.call(t,e).then((function(e){c||(c=!0,o[a]=e,--u||n(o))}),i)})),--u||n(o)}));return o.error&&i(o.value),r.promise},race:function(e){var t=this,r=$(t),n=r.reject,i=Q((function(){var i=m(t.resolve);b(e,(function(e){i.call(t,e).then(r.resolve,n)}))}));return i.error&&n(i.value),r.promise}})},function(e,t,r){var n=r(10);e.exports=function(e,t,r){for(var i in t)n(e,i,t[i],r);return e}},function(e,t,r){"use strict";var n=r(11),i=r(9),o=r(1),s=r(8),u=o("species");e.exports=function(e){var t=n(e),r=i.f;s&&t&&!t[u]&&r(t,u,{configurable:!0,get:function(){return this}})}},function(e,t){e.exports=function(e,t,r){if(!(e instanceof t))throw TypeError("Incorrect "+(r?r+" ":"")+"invocation");return e}},function(e,t,r){var n=r(1),i=r(14),o=n("iterator"),s=Array.prototype;e.exports=function(e){return void 0!==e&&(i.Array===e||s[o]===e)}},function(e,t,r){var n=r(38),i=r(14),o=r(1)("iterator");e.exports=function(e){if(null!=e)return e[o]||e["@@iterator"]||i[n(e)]}},function(e,t,r){var n=r(2);e.exports=function(e,t,r,i){try{return i?t(n(r)[0],r[1]):t(r)}catch(t){var o=e.return;throw void 0!==o&&n(o.call(e)),t}}},function(e,t,r){var n=r(1)("iterator"),i=!1;try{var o=0,s={next:function(){return{done:!!o++}},return:function(){i=!0}};s[n]=function(){return this},Array.from(s,(function(){throw 2}))}catch(e){}e.exports=function(e,t){if(!t&&!i)return!1;var r=!1;try{var o={};o[n]=function(){return{next:function(){return{done:r=!0}}}},e(o)}catch(e){}return r}},function(e,t,r){var n,i,o,s,u,a,c,l,f=r(0),p=r(28).f,h=r(13),d=r(52).set,y=r(53),v=f.MutationObserver||f.WebKitMutationObserver,m=f.process,g=f.Promise,x="process"==h(m),w=p(f,"queueMicrotask"),b=w&&w.value;b||(n=function(){var e,t;for(x&&(e=m.domain)&&e.exit();i;){t=i.fn,i=i.next;try{t()}catch(e){throw i?s():o=void 0,e}}o=void 0,e&&e.enter()},x?s=function(){m.nextTick(n)}:v&&!y?(u=!0,a=document.createTextNode(""),new v(n).observe(a,{characterData:!0}),s=function(){a.data=u=!u}):g&&g.resolve?(c=g.resolve(void 0),l=c.then,s=function(){l.call(c,n)}):s=function(){d.call(f,n)}),e.exports=b||function(e){var t={fn:e,next:void 0};o&&(o.next=t),i||(i=t,s()),o=t}},function(e,t,r){var n=r(0);e.exports=function(e,t){var r=n.console;r&&r.error&&(1===arguments.length?r.error(e):r.error(e,t))}},function(e,t,r){var n,i,o=r(0),s=r(54),u=o.process,a=u&&u.versions,c=a&&a.v8;c?i=(n=c.split("."))[0]+n[1]:s&&(!(n=s.match(/Edge\\/(\\d+)/))||n[1]>=74)&&(n=s.match(/Chrome\\/(\\d+)/))&&(i=n[1]),e.exports=i&&+i},function(e,t,r){"use strict";var n=r(17),i=r(15),o=r(31),s=r(56),u=r(49);n({target:"Promise",stat:!0},{allSettled:function(e){var t=this,r=o.f(t),n=r.resolve,a=r.reject,c=s((function(){var r=i(t.resolve),o=[],s=0,a=1;u(e,(function(e){var i=s++,u=!1;o.push(void 0),a++,r.call(t,e).then((function(e){u||(u=!0,o[i]={status:"fulfilled",value:e},--a||n(o))}),(function(e){u||(u=!0,o[i]={status:"rejected",reason:e},--a||n(o))}))})),--a||n(o)}));return c.error&&a(c.value),r.promise}})},function(e,t,r){"use strict";var n=r(17),i=r(12),o=r(48),s=r(5),u=r(11),a=r(51),c=r(55),l=r(10);n({target:"Promise",proto:!0,real:!0,forced:!!o&&s((function(){o.prototype.finally.call({then:function(){}},(function(){}))}))},{finally:function(e){var t=a(this,u("Promise")),r="function"==typeof e;return this.then(r?function(r){return c(t,e()).then((function(){return r}))}:e,r?function(r){return c(t,e()).then((function(){throw r}))}:e)}}),i||"function"!=typeof o||o.prototype.finally||l(o.prototype,"finally",u("Promise").prototype.finally)},function(e,t,r){"use strict";r.r(t),r.d(t,"add",(function(){return p})),r.d(t,"done",(function(){return h})),r.d(t,"toJS",(function(){return d})),r.d(t,"load",(function(){return y})),r.d(t,"dispose",(function(){return v})),r.d(t,"search",(function(){return m}));function n(e,t,r,n){return new(r||(r=Promise))((function(i,o){function s(e){try{a(n.next(e))}catch(e){o(e)}}function u(e){try{a(n.throw(e))}catch(e){o(e)}}function a(e){var t;e.done?i(e.value):(t=e.value,t instanceof r?t:new r((function(e){e(t)}))).then(s,u)}a((n=n.apply(e,t||[])).next())}))}function i(e,t){var r,n,i,o,s={label:0,sent:function(){if(1&i[0])throw i[1];return i[1]},trys:[],ops:[]};return o={next:u(0),throw:u(1),return:u(2)},"function"==typeof Symbol&&(o[Symbol.iterator]=function(){return this}),o;function u(o){return function(u){return function(o){if(r)throw new TypeError("Generator is already executing.");for(;s;)try{if(r=1,n&&(i=2&o[0]?n.return:o[0]?n.throw||((i=n.return)&&i.call(n),0):n.next)&&!(i=i.call(n,o[1])).done)return i;switch(n=0,i&&(o=[2&o[0],i.value]),o[0]){case 0:case 1:i=o;break;case 4:return s.label++,{value:o[1],done:!1};case 5:s.label++,n=o[1],o=[0];continue;case 7:o=s.ops.pop(),s.trys.pop();continue;default:if(!(i=s.trys,(i=i.length>0&&i[i.length-1])||6!==o[0]&&2!==o[0])){s=0;continue}if(3===o[0]&&(!i||o[1]>i[0]&&o[1]<i[3])){s.label=o[1];break}if(6===o[0]&&s.label<i[1]){s.label=i[1],i=o;break}if(i&&s.label<i[2]){s.label=i[2],s.ops.push(o);break}i[2]&&s.ops.pop(),s.trys.pop();continue}o=t.call(e,s)}catch(e){o=[6,e],n=0}finally{r=i=0}if(5&o[0])throw o[1];return{value:o[0]?o[1]:void 0,done:!0}}([o,u])}}}Object.create;Object.create;var o=r(4);try{r(57)}catch(e){}var s,u,a,c=function(){this.add=p,this.done=h,this.search=m,this.toJS=d,this.load=y,this.dispose=v},l=(t.default=c,[]);function f(){(s=new o.Builder).field("title"),s.field("description"),s.ref("ref"),s.pipeline.add(o.trimmer,o.stopWordFilter,o.stemmer),a=new Promise((function(e){u=e}))}o.tokenizer.separator=/\\s+/,f();function p(e,t,r){var n=l.push(r)-1,i={title:e.toLowerCase(),description:t.toLowerCase(),ref:n};s.add(i)}function h(){return n(this,void 0,void 0,(function(){return i(this,(function(e){return u(s.build()),[2]}))}))}function d(){return n(this,void 0,void 0,(function(){var e;return i(this,(function(t){switch(t.label){case 0:return e={store:l},[4,a];case 1:return[2,(e.index=t.sent().toJSON(),e)]}}))}))}function y(e){return n(this,void 0,void 0,(function(){return i(this,(function(t){return l=e.store,u(o.Index.load(e.index)),[2]}))}))}function v(){return n(this,void 0,void 0,(function(){return i(this,(function(e){return l=[],f(),[2]}))}))}function m(e,t){return void 0===t&&(t=0),n(this,void 0,void 0,(function(){var r;return i(this,(function(n){switch(n.label){case 0:return 0===e.trim().length?[2,[]]:[4,a];case 1:return r=n.sent().query((function(t){e.trim().toLowerCase().split(/\\s+/).forEach((function(e){var r=function(e){return"*"+o.stemmer(new o.Token(e,{}))+"*"}(e);t.term(r,{})}))})),t>0&&(r=r.slice(0,t)),[2,r.map((function(e){return{meta:l[e.ref],score:e.score}}))]}}))}))}addEventListener("message",(function(e){var r,n=e.data,i=n.type,o=n.method,s=n.id,u=n.params;"RPC"===i&&o&&((r=t[o])?Promise.resolve().then((function(){return r.apply(t,u)})):Promise.reject("No such method")).then((function(e){postMessage({type:"RPC",id:s,result:e})})).catch((function(e){var t={message:e};e.stack&&(t.message=e.message,t.stack=e.stack,t.name=e.name),postMessage({type:"RPC",id:s,error:t})}))})),postMessage({type:"RPC",method:"ready"})}]);\n//# sourceMappingURL=bb9670ec22c4c3f0a9d7.worker.js.map'])),{name:"[hash].worker.js"});return r(e,o),e}},function(e,t){e.exports=function(e,t){var n=0,r={};e.addEventListener("message",(function(t){var n=t.data;if("RPC"===n.type)if(n.id){var o=r[n.id];o&&(delete r[n.id],n.error?o[1](Object.assign(Error(n.error.message),n.error)):o[0](n.result))}else{var i=document.createEvent("Event");i.initEvent(n.method,!1,!1),i.data=n.params,e.dispatchEvent(i)}})),t.forEach((function(t){e[t]=function(){var o=arguments;return new Promise((function(i,a){var s=++n;r[s]=[i,a],e.postMessage({type:"RPC",id:s,method:t,params:[].slice.call(o)})}))}}))}},function(e,t){
+/*!
+ * Stickyfill -- `position: sticky` polyfill
+ * v. 1.1.1 | https://github.com/wilddeer/stickyfill
+ * Copyright Oleg Korsunsky | http://wd.dizaina.net/
+ *
+ * MIT License
+ */
+e.exports=function(e,t){e||(e=document),t||(t=window);var n,r,o=[],i=!1,a=e.documentElement,s=function(){},l="hidden",c="visibilitychange";void 0!==e.webkitHidden&&(l="webkitHidden",c="webkitvisibilitychange"),t.getComputedStyle||d();for(var u=["","-webkit-","-moz-","-ms-"],p=document.createElement("div"),f=u.length-1;f>=0;f--){try{p.style.position=u[f]+"sticky"}catch(e){}""!=p.style.position&&d()}function d(){C=L=I=P=R=N=s}function h(e){return parseFloat(e)||0}function m(){n={top:t.pageYOffset,left:t.pageXOffset}}function g(){if(t.pageXOffset!=n.left)return m(),void I();t.pageYOffset!=n.top&&(m(),v())}function y(e){setTimeout((function(){t.pageYOffset!=n.top&&(n.top=t.pageYOffset,v())}),0)}function v(){for(var e=o.length-1;e>=0;e--)b(o[e])}function b(e){if(e.inited){var t=n.top<=e.limit.start?0:n.top>=e.limit.end?2:1;e.mode!=t&&function(e,t){var n=e.node.style;switch(t){case 0:n.position="absolute",n.left=e.offset.left+"px",n.right=e.offset.right+"px",n.top=e.offset.top+"px",n.bottom="auto",n.width="auto",n.marginLeft=0,n.marginRight=0,n.marginTop=0;break;case 1:n.position="fixed",n.left=e.box.left+"px",n.right=e.box.right+"px",n.top=e.css.top,n.bottom="auto",n.width="auto",n.marginLeft=0,n.marginRight=0,n.marginTop=0;break;case 2:n.position="absolute",n.left=e.offset.left+"px",n.right=e.offset.right+"px",n.top="auto",n.bottom=0,n.width="auto",n.marginLeft=0,n.marginRight=0}e.mode=t}(e,t)}}function x(e){isNaN(parseFloat(e.computed.top))||e.isCell||(e.inited=!0,e.clone||function(e){e.clone=document.createElement("div");var t=e.node.nextSibling||e.node,n=e.clone.style;n.height=e.height+"px",n.width=e.width+"px",n.marginTop=e.computed.marginTop,n.marginBottom=e.computed.marginBottom,n.marginLeft=e.computed.marginLeft,n.marginRight=e.computed.marginRight,n.padding=n.border=n.borderSpacing=0,n.fontSize="1em",n.position="static",n.cssFloat=e.computed.cssFloat,e.node.parentNode.insertBefore(e.clone,t)}(e),"absolute"!=e.parent.computed.position&&"relative"!=e.parent.computed.position&&(e.parent.node.style.position="relative"),b(e),e.parent.height=e.parent.node.offsetHeight,e.docOffsetTop=_(e.clone))}function w(e){var t=!0;e.clone&&function(e){e.clone.parentNode.removeChild(e.clone),e.clone=void 0}(e),function(e,t){for(key in t)t.hasOwnProperty(key)&&(e[key]=t[key])}(e.node.style,e.css);for(var n=o.length-1;n>=0;n--)if(o[n].node!==e.node&&o[n].parent.node===e.parent.node){t=!1;break}t&&(e.parent.node.style.position=e.parent.css.position),e.mode=-1}function k(){for(var e=o.length-1;e>=0;e--)x(o[e])}function O(){for(var e=o.length-1;e>=0;e--)w(o[e])}function E(e){var t=getComputedStyle(e),n=e.parentNode,r=getComputedStyle(n),o=e.style.position;e.style.position="relative";var i={top:t.top,marginTop:t.marginTop,marginBottom:t.marginBottom,marginLeft:t.marginLeft,marginRight:t.marginRight,cssFloat:t.cssFloat},s={top:h(t.top),marginBottom:h(t.marginBottom),paddingLeft:h(t.paddingLeft),paddingRight:h(t.paddingRight),borderLeftWidth:h(t.borderLeftWidth),borderRightWidth:h(t.borderRightWidth)};e.style.position=o;var l={position:e.style.position,top:e.style.top,bottom:e.style.bottom,left:e.style.left,right:e.style.right,width:e.style.width,marginTop:e.style.marginTop,marginLeft:e.style.marginLeft,marginRight:e.style.marginRight},c=S(e),u=S(n),p={node:n,css:{position:n.style.position},computed:{position:r.position},numeric:{borderLeftWidth:h(r.borderLeftWidth),borderRightWidth:h(r.borderRightWidth),borderTopWidth:h(r.borderTopWidth),borderBottomWidth:h(r.borderBottomWidth)}};return{node:e,box:{left:c.win.left,right:a.clientWidth-c.win.right},offset:{top:c.win.top-u.win.top-p.numeric.borderTopWidth,left:c.win.left-u.win.left-p.numeric.borderLeftWidth,right:-c.win.right+u.win.right-p.numeric.borderRightWidth},css:l,isCell:"table-cell"==t.display,computed:i,numeric:s,width:c.win.right-c.win.left,height:c.win.bottom-c.win.top,mode:-1,inited:!1,parent:p,limit:{start:c.doc.top-s.top,end:u.doc.top+n.offsetHeight-p.numeric.borderBottomWidth-e.offsetHeight-s.top-s.marginBottom}}}function _(e){for(var t=0;e;)t+=e.offsetTop,e=e.offsetParent;return t}function S(e){var n=e.getBoundingClientRect();return{doc:{top:n.top+t.pageYOffset,left:n.left+t.pageXOffset},win:n}}function T(){r=setInterval((function(){!function(){for(var e=o.length-1;e>=0;e--)if(o[e].inited){var t=Math.abs(_(o[e].clone)-o[e].docOffsetTop),n=Math.abs(o[e].parent.node.offsetHeight-o[e].parent.height);if(t>=2||n>=2)return!1}return!0}()&&I()}),500)}function j(){clearInterval(r)}function A(){i&&(document[l]?j():T())}function C(){i||(m(),k(),t.addEventListener("scroll",g),t.addEventListener("wheel",y),t.addEventListener("resize",I),t.addEventListener("orientationchange",I),e.addEventListener(c,A),T(),i=!0)}function I(){if(i){O();for(var e=o.length-1;e>=0;e--)o[e]=E(o[e].node);k()}}function P(){t.removeEventListener("scroll",g),t.removeEventListener("wheel",y),t.removeEventListener("resize",I),t.removeEventListener("orientationchange",I),e.removeEventListener(c,A),j(),i=!1}function R(){P(),O()}function N(){for(R();o.length;)o.pop()}function L(e){for(var t=o.length-1;t>=0;t--)if(o[t].node===e)return;var n=E(e);o.push(n),i?x(n):C()}return m(),{stickies:o,add:L,remove:function(e){for(var t=o.length-1;t>=0;t--)o[t].node===e&&(w(o[t]),o.splice(t,1))},init:C,rebuild:I,pause:P,stop:R,kill:N}}},function(e,t,n){"use strict";n.r(t),n.d(t,"Redoc",(function(){return pp})),n.d(t,"AppStore",(function(){return vl})),n.d(t,"version",(function(){return dp})),n.d(t,"revision",(function(){return hp})),n.d(t,"init",(function(){return gp})),n.d(t,"hydrate",(function(){return yp}));var r={};n.r(r),n.d(r,"default",(function(){return wi}));var o=n(1),i=n(0),a=n.n(i),s=n(94),l=n(20);function c(){return(c=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function u(e){return(u=Object.setPrototypeOf?Object.getPrototypeOf:function(e){return e.__proto__||Object.getPrototypeOf(e)})(e)}function p(e,t){return(p=Object.setPrototypeOf||function(e,t){return e.__proto__=t,e})(e,t)}function f(){if("undefined"==typeof Reflect||!Reflect.construct)return!1;if(Reflect.construct.sham)return!1;if("function"==typeof Proxy)return!0;try{return Date.prototype.toString.call(Reflect.construct(Date,[],(function(){}))),!0}catch(e){return!1}}function d(e,t,n){return(d=f()?Reflect.construct:function(e,t,n){var r=[null];r.push.apply(r,t);var o=new(Function.bind.apply(e,r));return n&&p(o,n.prototype),o}).apply(null,arguments)}function h(e){var t="function"==typeof Map?new Map:void 0;return(h=function(e){if(null===e||(n=e,-1===Function.toString.call(n).indexOf("[native code]")))return e;var n;if("function"!=typeof e)throw new TypeError("Super expression must either be null or a function");if(void 0!==t){if(t.has(e))return t.get(e);t.set(e,r)}function r(){return d(e,arguments,u(this).constructor)}return r.prototype=Object.create(e.prototype,{constructor:{value:r,enumerable:!1,writable:!0,configurable:!0}}),p(r,e)})(e)}var m=function(e){var t,n;function r(t){return function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}(e.call(this,"An error occurred. See https://github.com/styled-components/polished/blob/master/src/internalHelpers/errors.md#"+t+" for more information.")||this)}return n=e,(t=r).prototype=Object.create(n.prototype),t.prototype.constructor=t,t.__proto__=n,r}(h(Error));function g(e){return Math.round(255*e)}function y(e,t,n){return g(e)+","+g(t)+","+g(n)}function v(e,t,n,r){if(void 0===r&&(r=y),0===t)return r(n,n,n);var o=(e%360+360)%360/60,i=(1-Math.abs(2*n-1))*t,a=i*(1-Math.abs(o%2-1)),s=0,l=0,c=0;o>=0&&o<1?(s=i,l=a):o>=1&&o<2?(s=a,l=i):o>=2&&o<3?(l=i,c=a):o>=3&&o<4?(l=a,c=i):o>=4&&o<5?(s=a,c=i):o>=5&&o<6&&(s=i,c=a);var u=n-i/2;return r(s+u,l+u,c+u)}var b={aliceblue:"f0f8ff",antiquewhite:"faebd7",aqua:"00ffff",aquamarine:"7fffd4",azure:"f0ffff",beige:"f5f5dc",bisque:"ffe4c4",black:"000",blanchedalmond:"ffebcd",blue:"0000ff",blueviolet:"8a2be2",brown:"a52a2a",burlywood:"deb887",cadetblue:"5f9ea0",chartreuse:"7fff00",chocolate:"d2691e",coral:"ff7f50",cornflowerblue:"6495ed",cornsilk:"fff8dc",crimson:"dc143c",cyan:"00ffff",darkblue:"00008b",darkcyan:"008b8b",darkgoldenrod:"b8860b",darkgray:"a9a9a9",darkgreen:"006400",darkgrey:"a9a9a9",darkkhaki:"bdb76b",darkmagenta:"8b008b",darkolivegreen:"556b2f",darkorange:"ff8c00",darkorchid:"9932cc",darkred:"8b0000",darksalmon:"e9967a",darkseagreen:"8fbc8f",darkslateblue:"483d8b",darkslategray:"2f4f4f",darkslategrey:"2f4f4f",darkturquoise:"00ced1",darkviolet:"9400d3",deeppink:"ff1493",deepskyblue:"00bfff",dimgray:"696969",dimgrey:"696969",dodgerblue:"1e90ff",firebrick:"b22222",floralwhite:"fffaf0",forestgreen:"228b22",fuchsia:"ff00ff",gainsboro:"dcdcdc",ghostwhite:"f8f8ff",gold:"ffd700",goldenrod:"daa520",gray:"808080",green:"008000",greenyellow:"adff2f",grey:"808080",honeydew:"f0fff0",hotpink:"ff69b4",indianred:"cd5c5c",indigo:"4b0082",ivory:"fffff0",khaki:"f0e68c",lavender:"e6e6fa",lavenderblush:"fff0f5",lawngreen:"7cfc00",lemonchiffon:"fffacd",lightblue:"add8e6",lightcoral:"f08080",lightcyan:"e0ffff",lightgoldenrodyellow:"fafad2",lightgray:"d3d3d3",lightgreen:"90ee90",lightgrey:"d3d3d3",lightpink:"ffb6c1",lightsalmon:"ffa07a",lightseagreen:"20b2aa",lightskyblue:"87cefa",lightslategray:"789",lightslategrey:"789",lightsteelblue:"b0c4de",lightyellow:"ffffe0",lime:"0f0",limegreen:"32cd32",linen:"faf0e6",magenta:"f0f",maroon:"800000",mediumaquamarine:"66cdaa",mediumblue:"0000cd",mediumorchid:"ba55d3",mediumpurple:"9370db",mediumseagreen:"3cb371",mediumslateblue:"7b68ee",mediumspringgreen:"00fa9a",mediumturquoise:"48d1cc",mediumvioletred:"c71585",midnightblue:"191970",mintcream:"f5fffa",mistyrose:"ffe4e1",moccasin:"ffe4b5",navajowhite:"ffdead",navy:"000080",oldlace:"fdf5e6",olive:"808000",olivedrab:"6b8e23",orange:"ffa500",orangered:"ff4500",orchid:"da70d6",palegoldenrod:"eee8aa",palegreen:"98fb98",paleturquoise:"afeeee",palevioletred:"db7093",papayawhip:"ffefd5",peachpuff:"ffdab9",peru:"cd853f",pink:"ffc0cb",plum:"dda0dd",powderblue:"b0e0e6",purple:"800080",rebeccapurple:"639",red:"f00",rosybrown:"bc8f8f",royalblue:"4169e1",saddlebrown:"8b4513",salmon:"fa8072",sandybrown:"f4a460",seagreen:"2e8b57",seashell:"fff5ee",sienna:"a0522d",silver:"c0c0c0",skyblue:"87ceeb",slateblue:"6a5acd",slategray:"708090",slategrey:"708090",snow:"fffafa",springgreen:"00ff7f",steelblue:"4682b4",tan:"d2b48c",teal:"008080",thistle:"d8bfd8",tomato:"ff6347",turquoise:"40e0d0",violet:"ee82ee",wheat:"f5deb3",white:"fff",whitesmoke:"f5f5f5",yellow:"ff0",yellowgreen:"9acd32"};var x=/^#[a-fA-F0-9]{6}$/,w=/^#[a-fA-F0-9]{8}$/,k=/^#[a-fA-F0-9]{3}$/,O=/^#[a-fA-F0-9]{4}$/,E=/^rgb\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*\)$/i,_=/^rgba\(\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*(\d{1,3})\s*,\s*([-+]?[0-9]*[.]?[0-9]+)\s*\)$/i,S=/^hsl\(\s*(\d{0,3}[.]?[0-9]+)\s*,\s*(\d{1,3}[.]?[0-9]?)%\s*,\s*(\d{1,3}[.]?[0-9]?)%\s*\)$/i,T=/^hsla\(\s*(\d{0,3}[.]?[0-9]+)\s*,\s*(\d{1,3}[.]?[0-9]?)%\s*,\s*(\d{1,3}[.]?[0-9]?)%\s*,\s*([-+]?[0-9]*[.]?[0-9]+)\s*\)$/i;function j(e){if("string"!=typeof e)throw new m(3);var t=function(e){if("string"!=typeof e)return e;var t=e.toLowerCase();return b[t]?"#"+b[t]:e}(e);if(t.match(x))return{red:parseInt(""+t[1]+t[2],16),green:parseInt(""+t[3]+t[4],16),blue:parseInt(""+t[5]+t[6],16)};if(t.match(w)){var n=parseFloat((parseInt(""+t[7]+t[8],16)/255).toFixed(2));return{red:parseInt(""+t[1]+t[2],16),green:parseInt(""+t[3]+t[4],16),blue:parseInt(""+t[5]+t[6],16),alpha:n}}if(t.match(k))return{red:parseInt(""+t[1]+t[1],16),green:parseInt(""+t[2]+t[2],16),blue:parseInt(""+t[3]+t[3],16)};if(t.match(O)){var r=parseFloat((parseInt(""+t[4]+t[4],16)/255).toFixed(2));return{red:parseInt(""+t[1]+t[1],16),green:parseInt(""+t[2]+t[2],16),blue:parseInt(""+t[3]+t[3],16),alpha:r}}var o=E.exec(t);if(o)return{red:parseInt(""+o[1],10),green:parseInt(""+o[2],10),blue:parseInt(""+o[3],10)};var i=_.exec(t);if(i)return{red:parseInt(""+i[1],10),green:parseInt(""+i[2],10),blue:parseInt(""+i[3],10),alpha:parseFloat(""+i[4])};var a=S.exec(t);if(a){var s="rgb("+v(parseInt(""+a[1],10),parseInt(""+a[2],10)/100,parseInt(""+a[3],10)/100)+")",l=E.exec(s);if(!l)throw new m(4,t,s);return{red:parseInt(""+l[1],10),green:parseInt(""+l[2],10),blue:parseInt(""+l[3],10)}}var c=T.exec(t);if(c){var u="rgb("+v(parseInt(""+c[1],10),parseInt(""+c[2],10)/100,parseInt(""+c[3],10)/100)+")",p=E.exec(u);if(!p)throw new m(4,t,u);return{red:parseInt(""+p[1],10),green:parseInt(""+p[2],10),blue:parseInt(""+p[3],10),alpha:parseFloat(""+c[4])}}throw new m(5)}function A(e){return function(e){var t,n=e.red/255,r=e.green/255,o=e.blue/255,i=Math.max(n,r,o),a=Math.min(n,r,o),s=(i+a)/2;if(i===a)return void 0!==e.alpha?{hue:0,saturation:0,lightness:s,alpha:e.alpha}:{hue:0,saturation:0,lightness:s};var l=i-a,c=s>.5?l/(2-i-a):l/(i+a);switch(i){case n:t=(r-o)/l+(r<o?6:0);break;case r:t=(o-n)/l+2;break;default:t=(n-r)/l+4}return t*=60,void 0!==e.alpha?{hue:t,saturation:c,lightness:s,alpha:e.alpha}:{hue:t,saturation:c,lightness:s}}(j(e))}var C=function(e){return 7===e.length&&e[1]===e[2]&&e[3]===e[4]&&e[5]===e[6]?"#"+e[1]+e[3]+e[5]:e};function I(e){var t=e.toString(16);return 1===t.length?"0"+t:t}function P(e){return I(Math.round(255*e))}function R(e,t,n){return C("#"+P(e)+P(t)+P(n))}function N(e,t,n){return v(e,t,n,R)}function L(e,t,n){if("number"==typeof e&&"number"==typeof t&&"number"==typeof n)return N(e,t,n);if("object"==typeof e&&void 0===t&&void 0===n)return N(e.hue,e.saturation,e.lightness);throw new m(1)}function M(e,t,n,r){if("number"==typeof e&&"number"==typeof t&&"number"==typeof n&&"number"==typeof r)return r>=1?N(e,t,n):"rgba("+v(e,t,n)+","+r+")";if("object"==typeof e&&void 0===t&&void 0===n&&void 0===r)return e.alpha>=1?N(e.hue,e.saturation,e.lightness):"rgba("+v(e.hue,e.saturation,e.lightness)+","+e.alpha+")";throw new m(2)}function D(e,t,n){if("number"==typeof e&&"number"==typeof t&&"number"==typeof n)return C("#"+I(e)+I(t)+I(n));if("object"==typeof e&&void 0===t&&void 0===n)return C("#"+I(e.red)+I(e.green)+I(e.blue));throw new m(6)}function F(e,t,n,r){if("string"==typeof e&&"number"==typeof t){var o=j(e);return"rgba("+o.red+","+o.green+","+o.blue+","+t+")"}if("number"==typeof e&&"number"==typeof t&&"number"==typeof n&&"number"==typeof r)return r>=1?D(e,t,n):"rgba("+e+","+t+","+n+","+r+")";if("object"==typeof e&&void 0===t&&void 0===n&&void 0===r)return e.alpha>=1?D(e.red,e.green,e.blue):"rgba("+e.red+","+e.green+","+e.blue+","+e.alpha+")";throw new m(7)}function z(e){if("object"!=typeof e)throw new m(8);if(function(e){return"number"==typeof e.red&&"number"==typeof e.green&&"number"==typeof e.blue&&"number"==typeof e.alpha}(e))return F(e);if(function(e){return"number"==typeof e.red&&"number"==typeof e.green&&"number"==typeof e.blue&&("number"!=typeof e.alpha||void 0===e.alpha)}(e))return D(e);if(function(e){return"number"==typeof e.hue&&"number"==typeof e.saturation&&"number"==typeof e.lightness&&"number"==typeof e.alpha}(e))return M(e);if(function(e){return"number"==typeof e.hue&&"number"==typeof e.saturation&&"number"==typeof e.lightness&&("number"!=typeof e.alpha||void 0===e.alpha)}(e))return L(e);throw new m(8)}function U(e){return function e(t,n,r){return function(){var o=r.concat(Array.prototype.slice.call(arguments));return o.length>=n?t.apply(this,o):e(t,n,o)}}(e,e.length,[])}function B(e,t,n){return Math.max(e,Math.min(t,n))}function $(e,t){if("transparent"===t)return t;var n=A(t);return z(c({},n,{lightness:B(0,1,n.lightness-parseFloat(e))}))}var W=U($);function q(e,t){if("transparent"===t)return t;var n=A(t);return z(c({},n,{saturation:B(0,1,n.saturation-parseFloat(e))}))}var H=U(q);function V(e){if("transparent"===e)return 0;var t=j(e),n=Object.keys(t).map((function(e){var n=t[e]/255;return n<=.03928?n/12.92:Math.pow((n+.055)/1.055,2.4)})),r=n[0],o=n[1],i=n[2];return parseFloat((.2126*r+.7152*o+.0722*i).toFixed(3))}function Y(e,t){var n=V(e),r=V(t);return parseFloat((n>r?(n+.05)/(r+.05):(r+.05)/(n+.05)).toFixed(2))}function G(e,t){if("transparent"===t)return t;var n=A(t);return z(c({},n,{lightness:B(0,1,n.lightness+parseFloat(e))}))}var Q=U(G);function X(e,t,n,r){void 0===t&&(t="#000"),void 0===n&&(n="#fff"),void 0===r&&(r=!1);var o=V(e)>.179,i=o?t:n;return!r||Y(e,i)>=4.5?i:o?"#000":"#fff"}function K(e,t){if("transparent"===t)return t;var n=j(t);return F(c({},n,{alpha:B(0,1,(100*("number"==typeof n.alpha?n.alpha:1)-100*parseFloat(e))/100)}))}var J=U(K);var Z={spacing:{unit:5,sectionHorizontal:function(e){return 8*e.spacing.unit},sectionVertical:function(e){return 8*e.spacing.unit}},breakpoints:{small:"50rem",medium:"75rem",large:"105rem"},colors:{tonalOffset:.3,primary:{main:"#32329f",light:function(e){var t=e.colors;return Q(t.tonalOffset,t.primary.main)},dark:function(e){var t=e.colors;return W(t.tonalOffset,t.primary.main)},contrastText:function(e){return X(e.colors.primary.main)}},success:{main:"#1d8127",light:function(e){var t=e.colors;return Q(2*t.tonalOffset,t.success.main)},dark:function(e){var t=e.colors;return W(t.tonalOffset,t.success.main)},contrastText:function(e){return X(e.colors.success.main)}},warning:{main:"#ffa500",light:function(e){var t=e.colors;return Q(t.tonalOffset,t.warning.main)},dark:function(e){var t=e.colors;return W(t.tonalOffset,t.warning.main)},contrastText:"#ffffff"},error:{main:"#d41f1c",light:function(e){var t=e.colors;return Q(t.tonalOffset,t.error.main)},dark:function(e){var t=e.colors;return W(t.tonalOffset,t.error.main)},contrastText:function(e){return X(e.colors.error.main)}},gray:{50:"#FAFAFA",100:"#F5F5F5"},text:{primary:"#333333",secondary:function(e){var t=e.colors;return Q(t.tonalOffset,t.text.primary)}},border:{dark:"rgba(0,0,0, 0.1)",light:"#ffffff"},responses:{success:{color:function(e){return e.colors.success.main},backgroundColor:function(e){var t=e.colors;return J(.93,t.success.main)}},error:{color:function(e){return e.colors.error.main},backgroundColor:function(e){var t=e.colors;return J(.93,t.error.main)}},redirect:{color:function(e){return e.colors.warning.main},backgroundColor:function(e){var t=e.colors;return J(.9,t.responses.redirect.color)}},info:{color:"#87ceeb",backgroundColor:function(e){var t=e.colors;return J(.9,t.responses.info.color)}}},http:{get:"#6bbd5b",post:"#248fb2",put:"#9b708b",options:"#d3ca12",patch:"#e09d43",delete:"#e27a7a",basic:"#999",link:"#31bbb6",head:"#c167e4"}},schema:{linesColor:function(e){return Q(e.colors.tonalOffset,H(e.colors.tonalOffset,e.colors.primary.main))},defaultDetailsWidth:"75%",typeNameColor:function(e){return e.colors.text.secondary},typeTitleColor:function(e){return e.schema.typeNameColor},requireLabelColor:function(e){return e.colors.error.main},labelsTextSize:"0.9em",nestingSpacing:"1em",nestedBackground:"#fafafa",arrow:{size:"1.1em",color:function(e){return e.colors.text.secondary}}},typography:{fontSize:"14px",lineHeight:"1.5em",fontWeightRegular:"400",fontWeightBold:"600",fontWeightLight:"300",fontFamily:"Roboto, sans-serif",smoothing:"antialiased",optimizeSpeed:!0,headings:{fontFamily:"Montserrat, sans-serif",fontWeight:"400",lineHeight:"1.6em"},code:{fontSize:"13px",fontFamily:"Courier, monospace",lineHeight:function(e){return e.typography.lineHeight},fontWeight:function(e){return e.typography.fontWeightRegular},color:"#e53935",backgroundColor:"rgba(38, 50, 56, 0.05)",wrap:!1},links:{color:function(e){return e.colors.primary.main},visited:function(e){return e.typography.links.color},hover:function(e){var t=e.typography;return Q(.2,t.links.color)}}},sidebar:{width:"260px",backgroundColor:"#fafafa",textColor:"#333333",activeTextColor:function(e){return e.sidebar.textColor!==Z.sidebar.textColor?e.sidebar.textColor:e.colors.primary.main},groupItems:{textTransform:"uppercase"},level1Items:{textTransform:"none"},arrow:{size:"1.5em",color:function(e){return e.sidebar.textColor}}},logo:{maxHeight:function(e){return e.sidebar.width},maxWidth:function(e){return e.sidebar.width},gutter:"2px"},rightPanel:{backgroundColor:"#263238",width:"40%",textColor:"#ffffff"},codeBlock:{backgroundColor:function(e){var t=e.rightPanel;return W(.1,t.backgroundColor)}}},ee=Z;var te="undefined"!=typeof window&&"HTMLElement"in window;function ne(e){return"undefined"!=typeof document?document.querySelector(e):null}"undefined"==typeof Element||Element.prototype.scrollIntoViewIfNeeded||(Element.prototype.scrollIntoViewIfNeeded=function(e){e=0===arguments.length||!!e;var t=this.parentNode,n=window.getComputedStyle(t,void 0),r=parseInt(n.getPropertyValue("border-top-width"),10),o=parseInt(n.getPropertyValue("border-left-width"),10),i=this.offsetTop-t.offsetTop<t.scrollTop,a=this.offsetTop-t.offsetTop+this.clientHeight-r>t.scrollTop+t.clientHeight,s=this.offsetLeft-t.offsetLeft<t.scrollLeft,l=this.offsetLeft-t.offsetLeft+this.clientWidth-o>t.scrollLeft+t.clientWidth,c=i&&!a;(i||a)&&e&&(t.scrollTop=this.offsetTop-t.offsetTop-t.clientHeight/2-r+this.clientHeight/2),(s||l)&&e&&(t.scrollLeft=this.offsetLeft-t.offsetLeft-t.clientWidth/2-o+this.clientWidth/2),(i||a||s||l)&&!e&&this.scrollIntoView(c)});var re=n(150),oe=n.n(re),ie=n(10);function ae(e,t){for(var n=[],r=0;r<e.length-1;r++)n.push(t(e[r],!1));return 0!==e.length&&n.push(t(e[e.length-1],!0)),n}function se(e){return e.endsWith("/")?e.substring(0,e.length-1):e}function le(e){return!isNaN(parseFloat(e))&&isFinite(e)}var ce=function(e){for(var t=[],n=1;n<arguments.length;n++)t[n-1]=arguments[n];if(!t.length)return e;var r=t.shift();return void 0===r?e:(ue(e)&&ue(r)&&Object.keys(r).forEach((function(t){ue(r[t])?(e[t]||(e[t]={}),ce(e[t],r[t])):e[t]=r[t]})),ce.apply(void 0,Object(o.__spreadArrays)([e],t)))},ue=function(e){return function(e){return null!==e&&"object"==typeof e}(e)&&!Array.isArray(e)};function pe(e){return oe()(e)||e.toString().toLowerCase().replace(/\s+/g,"-").replace(/&/g,"-and-").replace(/\--+/g,"-").replace(/^-+/,"").replace(/-+$/,"")}function fe(e){return"undefined"==typeof URL?new(n(10).URL)(e):new URL(e)}var de={enum:"Enum",enumSingleValue:"Value",enumArray:"Items",default:"Default",deprecated:"Deprecated",example:"Example",nullable:"Nullable",recursive:"Recursive",arrayOf:"Array of ",webhook:"Event"};function he(e,t){var n=de[e];return void 0!==t?n[t]:n}function me(e,t){return void 0===e?t||!1:"string"==typeof e?"false"!==e:e}var ge,ye=function(){function e(t,n){var r,i,a,s;void 0===n&&(n={});var l,c,u,p,f,d,h=(t=Object(o.__assign)(Object(o.__assign)({},n),t)).theme&&t.theme.extensionsHook;(null===(r=t.theme)||void 0===r?void 0:r.menu)&&!(null===(i=t.theme)||void 0===i?void 0:i.sidebar)&&(console.warn('Theme setting "menu" is deprecated. Rename to "sidebar"'),t.theme.sidebar=t.theme.menu),(null===(a=t.theme)||void 0===a?void 0:a.codeSample)&&!(null===(s=t.theme)||void 0===s?void 0:s.codeBlock)&&(console.warn('Theme setting "codeSample" is deprecated. Rename to "codeBlock"'),t.theme.codeBlock=t.theme.codeSample),this.theme=(l=ce({},ee,Object(o.__assign)(Object(o.__assign)({},t.theme),{extensionsHook:void 0})),c={},u=0,(p=function(e,t){Object.keys(e).forEach((function(n){var r=(t?t+".":"")+n,o=e[n];"function"==typeof o?Object.defineProperty(e,n,{get:function(){if(!c[r]){if(++u>1e3)throw new Error("Theme probably contains circular dependency at "+r+": "+o.toString());c[r]=o(l)}return c[r]},enumerable:!0}):"object"==typeof o&&p(o,r)}))})(l,""),JSON.parse(JSON.stringify(l))),this.theme.extensionsHook=h,f=t.labels,Object.assign(de,f),this.scrollYOffset=e.normalizeScrollYOffset(t.scrollYOffset),this.hideHostname=e.normalizeHideHostname(t.hideHostname),this.expandResponses=e.normalizeExpandResponses(t.expandResponses),this.requiredPropsFirst=me(t.requiredPropsFirst),this.sortPropsAlphabetically=me(t.sortPropsAlphabetically),this.sortEnumValuesAlphabetically=me(t.sortEnumValuesAlphabetically),this.noAutoAuth=me(t.noAutoAuth),this.nativeScrollbars=me(t.nativeScrollbars),this.pathInMiddlePanel=me(t.pathInMiddlePanel),this.untrustedSpec=me(t.untrustedSpec),this.hideDownloadButton=me(t.hideDownloadButton),this.disableSearch=me(t.disableSearch),this.onlyRequiredInSamples=me(t.onlyRequiredInSamples),this.showExtensions=e.normalizeShowExtensions(t.showExtensions),this.hideSingleRequestSampleTab=me(t.hideSingleRequestSampleTab),this.menuToggle=me(t.menuToggle,!0),this.jsonSampleExpandLevel=e.normalizeJsonSampleExpandLevel(t.jsonSampleExpandLevel),this.enumSkipQuotes=me(t.enumSkipQuotes),this.hideSchemaTitles=me(t.hideSchemaTitles),this.simpleOneOfTypeLabel=me(t.simpleOneOfTypeLabel),this.payloadSampleIdx=e.normalizePayloadSampleIdx(t.payloadSampleIdx),this.expandSingleSchemaField=me(t.expandSingleSchemaField),this.unstable_ignoreMimeParameters=me(t.unstable_ignoreMimeParameters),this.allowedMdComponents=t.allowedMdComponents||{},this.expandDefaultServerVariables=me(t.expandDefaultServerVariables),this.maxDisplayedEnumValues="string"==typeof(d=t.maxDisplayedEnumValues)?parseInt(d,10):"number"==typeof d?d:void 0}return e.normalizeExpandResponses=function(e){if("all"===e)return"all";if("string"==typeof e){var t={};return e.split(",").forEach((function(e){t[e.trim()]=!0})),t}return void 0!==e&&console.warn('expandResponses must be a string but received value "'+e+'" of type '+typeof e),{}},e.normalizeHideHostname=function(e){return!!e},e.normalizeScrollYOffset=function(e){if("string"==typeof e&&!le(e)){var t=ne(e);t||console.warn("scrollYOffset value is a selector to non-existing element. Using offset 0 by default");var n=t&&t.getBoundingClientRect().bottom||0;return function(){return n}}return"number"==typeof e||le(e)?function(){return"number"==typeof e?e:parseFloat(e)}:"function"==typeof e?function(){var t=e();return"number"!=typeof t&&console.warn('scrollYOffset should return number but returned value "'+t+'" of type '+typeof t),t}:(void 0!==e&&console.warn("Wrong value for scrollYOffset ReDoc option: should be string, number or function"),function(){return 0})},e.normalizeShowExtensions=function(e){if(void 0===e)return!1;if(""===e)return!0;if("string"!=typeof e)return e;switch(e){case"true":return!0;case"false":return!1;default:return e.split(",").map((function(e){return e.trim()}))}},e.normalizePayloadSampleIdx=function(e){return"number"==typeof e?Math.max(0,e):"string"==typeof e&&isFinite(e)?parseInt(e,10):0},e.normalizeJsonSampleExpandLevel=function(e){return"all"===e?1/0:isNaN(Number(e))?2:Math.ceil(Number(e))},e}(),ve=n(13),be=ve,xe=be.default,we=be.css,ke=be.createGlobalStyle,Oe=be.keyframes,Ee=be.ThemeProvider,_e=function(e,t){return function(){for(var n=[],r=0;r<arguments.length;r++)n[r]=arguments[r];return we(ge||(ge=Object(o.__makeTemplateObject)(["\n      @media "," screen and (max-width: ",") {\n        ",";\n      }\n    "],["\n      @media "," screen and (max-width: ",") {\n        ",";\n      }\n    "])),t?"print, ":"",(function(t){return t.theme.breakpoints[e]}),we.apply(void 0,n))}},Se=xe;function Te(e){return function(t){if(t.theme.extensionsHook)return t.theme.extensionsHook(e,t)}}var je,Ae,Ce,Ie,Pe=Se.div(je||(je=Object(o.__makeTemplateObject)(["\n  padding: 20px;\n  color: red;\n"],["\n  padding: 20px;\n  color: red;\n"]))),Re=function(e){function t(t){var n=e.call(this,t)||this;return n.state={error:void 0},n}return Object(o.__extends)(t,e),t.prototype.componentDidCatch=function(e){return this.setState({error:e}),!1},t.prototype.render=function(){return this.state.error?i.createElement(Pe,null,i.createElement("h1",null,"Something went wrong..."),i.createElement("small",null," ",this.state.error.message," "),i.createElement("p",null,i.createElement("details",null,i.createElement("summary",null,"Stack trace"),i.createElement("pre",null,this.state.error.stack))),i.createElement("small",null," ReDoc Version: ","2.0.0-rc.40")," ",i.createElement("br",null),i.createElement("small",null," Commit: ","17b9873")):i.Children.only(this.props.children)},t}(i.Component),Ne=Oe(Ae||(Ae=Object(o.__makeTemplateObject)(["\n  0% {\n    transform: rotate(0deg); }\n  100% {\n    transform: rotate(360deg);\n  }\n"],["\n  0% {\n    transform: rotate(0deg); }\n  100% {\n    transform: rotate(360deg);\n  }\n"]))),Le=Se((function(e){return i.createElement("svg",{className:e.className,version:"1.1",width:"512",height:"512",viewBox:"0 0 512 512"},i.createElement("path",{d:"M275.682 147.999c0 10.864-8.837 19.661-19.682 19.661v0c-10.875 0-19.681-8.796-19.681-19.661v-96.635c0-10.885 8.806-19.661 19.681-19.661v0c10.844 0 19.682 8.776 19.682 19.661v96.635z"}),i.createElement("path",{d:"M275.682 460.615c0 10.865-8.837 19.682-19.682 19.682v0c-10.875 0-19.681-8.817-19.681-19.682v-96.604c0-10.885 8.806-19.681 19.681-19.681v0c10.844 0 19.682 8.796 19.682 19.682v96.604z"}),i.createElement("path",{d:"M147.978 236.339c10.885 0 19.681 8.755 19.681 19.641v0c0 10.885-8.796 19.702-19.681 19.702h-96.624c-10.864 0-19.661-8.817-19.661-19.702v0c0-10.885 8.796-19.641 19.661-19.641h96.624z"}),i.createElement("path",{d:"M460.615 236.339c10.865 0 19.682 8.755 19.682 19.641v0c0 10.885-8.817 19.702-19.682 19.702h-96.584c-10.885 0-19.722-8.817-19.722-19.702v0c0-10.885 8.837-19.641 19.722-19.641h96.584z"}),i.createElement("path",{d:"M193.546 165.703c7.69 7.66 7.68 20.142 0 27.822v0c-7.701 7.701-20.162 7.701-27.853 0.020l-68.311-68.322c-7.68-7.701-7.68-20.142 0-27.863v0c7.68-7.68 20.121-7.68 27.822 0l68.342 68.342z"}),i.createElement("path",{d:"M414.597 386.775c7.7 7.68 7.7 20.163 0.021 27.863v0c-7.7 7.659-20.142 7.659-27.843-0.062l-68.311-68.26c-7.68-7.7-7.68-20.204 0-27.863v0c7.68-7.7 20.163-7.7 27.842 0l68.291 68.322z"}),i.createElement("path",{d:"M165.694 318.464c7.69-7.7 20.153-7.7 27.853 0v0c7.68 7.659 7.69 20.163 0 27.863l-68.342 68.322c-7.67 7.659-20.142 7.659-27.822-0.062v0c-7.68-7.68-7.68-20.122 0-27.801l68.311-68.322z"}),i.createElement("path",{d:"M386.775 97.362c7.7-7.68 20.142-7.68 27.822 0v0c7.7 7.68 7.7 20.183 0.021 27.863l-68.322 68.311c-7.68 7.68-20.163 7.68-27.843-0.020v0c-7.68-7.68-7.68-20.162 0-27.822l68.322-68.332z"}))}))(Ce||(Ce=Object(o.__makeTemplateObject)(["\n  animation: 2s "," linear infinite;\n  width: 50px;\n  height: 50px;\n  content: '';\n  display: inline-block;\n  margin-left: -25px;\n\n  path {\n    fill: ",";\n  }\n"],["\n  animation: 2s "," linear infinite;\n  width: 50px;\n  height: 50px;\n  content: '';\n  display: inline-block;\n  margin-left: -25px;\n\n  path {\n    fill: ",";\n  }\n"])),Ne,(function(e){return e.color})),Me=Se.div(Ie||(Ie=Object(o.__makeTemplateObject)(["\n  font-family: helvetica, sans;\n  width: 100%;\n  text-align: center;\n  font-size: 25px;\n  margin: 30px 0 20px 0;\n  color: ",";\n"],["\n  font-family: helvetica, sans;\n  width: 100%;\n  text-align: center;\n  font-size: 25px;\n  margin: 30px 0 20px 0;\n  color: ",";\n"])),(function(e){return e.color})),De=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){return i.createElement("div",{style:{textAlign:"center"}},i.createElement(Me,{color:this.props.color},"Loading ..."),i.createElement(Le,{color:this.props.color}))},t}(i.PureComponent),Fe=i.createContext(new ye({})),ze=Fe.Provider,Ue=Fe.Consumer,Be=n(2),$e=n(154),We=n(155);function qe(e){return Object(o.__awaiter)(this,void 0,void 0,(function(){var t;return Object(o.__generator)(this,(function(n){switch(n.label){case 0:return[4,(new $e).bundle(e,{resolve:{http:{withCredentials:!1}}})];case 1:return void 0!==(t=n.sent()).swagger?[2,He(t)]:[2,t]}}))}))}function He(e){return console.warn("[ReDoc Compatibility mode]: Converting OpenAPI 2.0 to OpenAPI 3.0"),new Promise((function(t,n){return Object(We.convertObj)(e,{patch:!0,warnOnly:!0,text:"{}",anchors:!0},(function(e,r){if(e)return n(e);t(r&&r.openapi)}))}))}var Ve=n(26),Ye=n(65),Ge=n(21),Qe=Ge.parse,Xe=function(){function e(){}return e.baseName=function(t,n){void 0===n&&(n=1);var r=e.parse(t);return r[r.length-n]},e.dirName=function(t,n){void 0===n&&(n=1);var r=e.parse(t);return Ge.compile(r.slice(0,r.length-n))},e.relative=function(t,n){var r=e.parse(t);return e.parse(n).slice(r.length)},e.parse=function(e){var t=e;return"#"===t.charAt(0)&&(t=t.substring(1)),Qe(t)},e.join=function(t,n){var r=e.parse(t).concat(n);return Ge.compile(r)},e.get=function(e,t){return Ge.get(e,t)},e.compile=function(e){return Ge.compile(e)},e.escape=function(e){return Ge.escape(e)},e}();Ge.parse=Xe.parse,Object.assign(Xe,Ge);var Ke=n(49),Je=n(66);function Ze(e){return"string"==typeof e&&/\dxx/i.test(e)}function et(e,t){if(void 0===t&&(t=!1),"default"===e)return t?"error":"success";var n="string"==typeof e?parseInt(e,10):e;if(Ze(e)&&(n*=100),n<100||n>599)throw new Error("invalid HTTP code");var r="success";return n>=300&&n<400?r="redirect":n>=400?r="error":n<200&&(r="info"),r}var tt={get:!0,post:!0,put:!0,head:!0,patch:!0,delete:!0,options:!0};function nt(e){return e in tt}var rt={multipleOf:"number",maximum:"number",exclusiveMaximum:"number",minimum:"number",exclusiveMinimum:"number",maxLength:"string",minLength:"string",pattern:"string",items:"array",maxItems:"array",minItems:"array",uniqueItems:"array",maxProperties:"object",minProperties:"object",required:"object",additionalProperties:"object",properties:"object"};function ot(e){return-1!==e.search(/json/i)}function it(e,t,n){return Array.isArray(e)?e.map((function(e){return e.toString()})).join(n):"object"==typeof e?Object.keys(e).map((function(t){return""+t+n+e[t]})).join(n):t+"="+e.toString()}function at(e,t){return Array.isArray(e)?(console.warn("deepObject style cannot be used with array value:"+e.toString()),""):"object"==typeof e?Object.keys(e).map((function(n){return t+"["+n+"]="+e[n]})).join("&"):(console.warn("deepObject style cannot be used with non-object value:"+e.toString()),"")}function st(e,t,n){var r,o=t?"*":"";return Je.parse("{?__redoc_param_name__"+o+"}").expand((r={},r.__redoc_param_name__=n,r)).substring(1).replace(/__redoc_param_name__/g,e)}function lt(e,t){return ot(t)?JSON.stringify(e):(console.warn("Parameter serialization as "+t+" is not supported"),"")}function ct(e,t){var n=e.name,r=e.style,o=e.explode,i=void 0!==o&&o,a=e.serializationMime;if(a)switch(e.in){case"path":case"header":return lt(t,a);case"cookie":case"query":return n+"="+lt(t,a);default:return console.warn("Unexpected parameter location: "+e.in),""}if(!r)return console.warn("Missing style attribute or content for parameter "+n),"";switch(e.in){case"path":return function(e,t,n,r){var o,i=n?"*":"",a="";return"label"===t?a=".":"matrix"===t&&(a=";"),Je.parse("{"+a+"__redoc_param_name__"+i+"}").expand((o={},o.__redoc_param_name__=r,o)).replace(/__redoc_param_name__/g,e)}(n,r,i,t);case"query":return function(e,t,n,r){switch(t){case"form":return st(e,n,r);case"spaceDelimited":return Array.isArray(r)?n?st(e,n,r):e+"="+r.join("%20"):(console.warn("The style spaceDelimited is only applicable to arrays"),"");case"pipeDelimited":return Array.isArray(r)?n?st(e,n,r):e+"="+r.join("|"):(console.warn("The style pipeDelimited is only applicable to arrays"),"");case"deepObject":return!n||Array.isArray(r)||"object"!=typeof r?(console.warn("The style deepObject is only applicable for objects with explode=true"),""):at(r,e);default:return console.warn("Unexpected style for query: "+t),""}}(n,r,i,t);case"header":return function(e,t,n){var r;switch(e){case"simple":var o=t?"*":"",i="__redoc_param_name__",a=Je.parse("{"+i+o+"}");return decodeURIComponent(a.expand(((r={})[i]=n,r)));default:return console.warn("Unexpected style for header: "+e),""}}(r,i,t);case"cookie":return function(e,t,n,r){switch(t){case"form":return st(e,n,r);default:return console.warn("Unexpected style for cookie: "+t),""}}(n,r,i,t);default:return console.warn("Unexpected parameter location: "+e.in),""}}function ut(e){return/^#\/components\/schemas\/[^\/]+$/.test(e||"")}function pt(e,t,n){var r;return void 0!==t&&void 0!==n?r=t===n?t+" "+e:"[ "+t+" .. "+n+" ] "+e:void 0!==n?r="<= "+n+" "+e:void 0!==t&&(r=1===t?"non-empty":">= "+t+" "+e),r}function ft(e){var t=[],n=pt("characters",e.minLength,e.maxLength);void 0!==n&&t.push(n);var r=pt("items",e.minItems,e.maxItems);void 0!==r&&t.push(r);var o,i=function(e){if(void 0!==e){var t=e.toString(10);return/^0\.0*1$/.test(t)?"decimal places <= "+t.split(".")[1].length:"multiple of "+t}}(e.multipleOf);return void 0!==i&&t.push(i),void 0!==e.minimum&&void 0!==e.maximum?(o=e.exclusiveMinimum?"( ":"[ ",o+=e.minimum,o+=" .. ",o+=e.maximum,o+=e.exclusiveMaximum?" )":" ]"):void 0!==e.maximum?(o=e.exclusiveMaximum?"< ":"<= ",o+=e.maximum):void 0!==e.minimum&&(o=e.exclusiveMinimum?"> ":">= ",o+=e.minimum),void 0!==o&&t.push(o),t}function dt(e,t){void 0===t&&(t=[]);var n=[],r=[],i=[];return e.forEach((function(e){e.required?t.includes(e.name)?r.push(e):i.push(e):n.push(e)})),r.sort((function(e,n){return t.indexOf(e.name)-t.indexOf(n.name)})),Object(o.__spreadArrays)(r,i,n)}function ht(e,t){return Object(o.__spreadArrays)(e).sort((function(e,n){return e[t].localeCompare(n[t])}))}function mt(e,t){var n=void 0===e?function(e){try{var t=fe(e);return t.search="",t.toString()}catch(t){return e}}(function(){if(!te)return"";var e=window.location.href;return e.endsWith(".html")?Object(Ke.dirname)(e):e}()):Object(Ke.dirname)(e);function r(e){return function(e,t){var n;if(t.startsWith("//"))n=""+(Object(ie.parse)(e).protocol||"https:")+t;else if(function(e){return/(?:^[a-z][a-z0-9+.-]*:|\/\/)/i.test(e)}(t))n=t;else if(t.startsWith("/")){var r=Object(ie.parse)(e);n=Object(ie.format)(Object(o.__assign)(Object(o.__assign)({},r),{pathname:t}))}else n=se(e)+"/"+t;return se(n)}(n,e)}return 0===t.length&&(t=[{url:"/"}]),t.map((function(e){return Object(o.__assign)(Object(o.__assign)({},e),{url:r(e.url),description:e.description||""})}))}var gt="section/Authentication/";var yt=function(e){return{delete:"del",options:"opts"}[e]||e};function vt(e,t){return Object.keys(e).filter((function(e){return!0===t?e.startsWith("x-")&&!function(e){return e in{"x-circular-ref":!0,"x-code-samples":!0,"x-codeSamples":!0,"x-displayName":!0,"x-examples":!0,"x-ignoredHeaderParameters":!0,"x-logo":!0,"x-nullable":!0,"x-servers":!0,"x-tagGroups":!0,"x-traitTag":!0,"x-additionalPropertiesName":!0,"x-explicitMappingOnly":!0}}(e):e.startsWith("x-")&&t.indexOf(e)>-1})).reduce((function(t,n){return t[n]=e[n],t}),{})}var bt=n(39);n(293),n(294),n(295),n(296),n(297),n(298),n(299),n(300),n(301),n(302),n(303),n(304),n(305),n(306),n(307),n(308),n(309),n(310),n(311),n(312);function xt(e,t){void 0===t&&(t="clike"),t=t.toLowerCase();var n=bt.languages[t];return n||(n=bt.languages[function(e){return{json:"js","c++":"cpp","c#":"csharp","objective-c":"objectivec",shell:"bash",viml:"vim"}[e]||"clike"}(t)]),bt.highlight(e,n,t)}function wt(e){return function(t,n,r){var o,i,a,s,l,c,u,p;r.value=(o=r.value,i=e,c=null,u=0,p=function(){u=(new Date).getTime(),c=null,l=o.apply(a,s),c||(a=s=null)},function(){var e=(new Date).getTime(),t=i-(e-u);return a=this,s=arguments,t<=0||t>i?(c&&(clearTimeout(c),c=null),u=e,l=o.apply(a,s),c||(a=s=null)):c||(c=setTimeout(p,t)),l})}}function kt(e){0}function Ot(e){0}bt.languages.insertBefore("javascript","string",{"property string":{pattern:/([{,]\s*)"(?:\\.|[^\\"\r\n])*"(?=\s*:)/i,lookbehind:!0}},void 0),bt.languages.insertBefore("javascript","punctuation",{property:{pattern:/([{,]\s*)[a-z]\w*(?=\s*:)/i,lookbehind:!0}},void 0);var Et={};function _t(e,t,n){if("function"==typeof n.value)return function(e,t,n){if(!n.value||n.value.length>0)throw new Error("@memoize decorator can only be applied to methods of zero arguments");var r="_memoized_"+t,i=n.value;return e[r]=Et,Object(o.__assign)(Object(o.__assign)({},n),{value:function(){return this[r]===Et&&(this[r]=i.call(this)),this[r]}})}(e,t,n);if("function"==typeof n.get)return function(e,t,n){var r="_memoized_"+t,i=n.get;return e[r]=Et,Object(o.__assign)(Object(o.__assign)({},n),{get:function(){return this[r]===Et&&(this[r]=i.call(this)),this[r]}})}(e,t,n);throw new Error("@memoize decorator can be applied to methods or getters, got "+String(n.value)+" instead")}var St="hashchange",Tt=new(function(){function e(){var e=this;this.emit=function(){e._emiter.emit(St,e.currentId)},this._emiter=new Ye.EventEmitter,this.bind()}return Object.defineProperty(e.prototype,"currentId",{get:function(){return te?decodeURIComponent(window.location.hash.substring(1)):""},enumerable:!1,configurable:!0}),e.prototype.linkForId=function(e){return e?"#"+e:""},e.prototype.subscribe=function(e){var t=this._emiter.addListener(St,e);return function(){return t.removeListener(St,e)}},e.prototype.bind=function(){te&&window.addEventListener("hashchange",this.emit,!1)},e.prototype.dispose=function(){te&&window.removeEventListener("hashchange",this.emit)},e.prototype.replace=function(e,t){void 0===t&&(t=!1),te&&null!=e&&e!==this.currentId&&(t?window.history.replaceState(null,"",window.location.href.split("#")[0]+this.linkForId(e)):(window.history.pushState(null,"",window.location.href.split("#")[0]+this.linkForId(e)),this.emit()))},Object(o.__decorate)([Ve.bind,Ve.debounce],e.prototype,"replace",null),e}());var jt=n(96),At=function(){function e(){this.map=new Map,this.prevTerm=""}return e.prototype.add=function(e){this.map.set(e,new jt(e))},e.prototype.delete=function(e){this.map.delete(e)},e.prototype.addOnly=function(e){var t=this;this.map.forEach((function(n,r){-1===e.indexOf(r)&&(n.unmark(),t.map.delete(r))}));for(var n=0,r=e;n<r.length;n++){var o=r[n];this.map.has(o)||this.map.set(o,new jt(o))}},e.prototype.clearAll=function(){this.unmark(),this.map.clear()},e.prototype.mark=function(e){var t=this;(e||this.prevTerm)&&(this.map.forEach((function(n){n.unmark(),n.mark(e||t.prevTerm)})),this.prevTerm=e||this.prevTerm)},e.prototype.unmark=function(){this.map.forEach((function(e){return e.unmark()})),this.prevTerm=""},e}(),Ct=n(50),It=new Ct.Renderer;Ct.setOptions({renderer:It,highlight:function(e,t){return xt(e,t)}});var Pt="(?:^ {0,3}\x3c!-- ReDoc-Inject:\\s+?<({component}).*?/?>\\s+?--\x3e\\s*$|(?:^ {0,3}<({component})([\\s\\S]*?)>([\\s\\S]*?)</\\2>|^ {0,3}<({component})([\\s\\S]*?)(?:/>|\\n{2,})))";var Rt=function(){function e(e){var t=this;this.options=e,this.headings=[],this.headingRule=function(e,n,r,o){return 1===n?t.currentTopHeading=t.saveHeading(e,n):2===n&&t.saveHeading(e,n,t.currentTopHeading&&t.currentTopHeading.items,t.currentTopHeading&&t.currentTopHeading.id),t.originalHeadingRule(e,n,r,o)},this.headingEnhanceRenderer=new Ct.Renderer,this.originalHeadingRule=this.headingEnhanceRenderer.heading.bind(this.headingEnhanceRenderer),this.headingEnhanceRenderer.heading=this.headingRule}return e.containsComponent=function(e,t){return new RegExp(Pt.replace(/{component}/g,t),"gmi").test(e)},e.getTextBeforeHading=function(e,t){var n=e.search(new RegExp("^##?\\s+"+t,"m"));return n>-1?e.substring(0,n):e},e.prototype.saveHeading=function(e,t,n,r){void 0===n&&(n=this.headings),e=e.replace(/&#(\d+);/g,(function(e,t){return String.fromCharCode(parseInt(t,10))})).replace(/&amp;/g,"&");var o={id:r?r+"/"+pe(e):"section/"+pe(e),name:e,level:t,items:[]};return n.push(o),o},e.prototype.flattenHeadings=function(e){if(void 0===e)return[];for(var t=[],n=0,r=e;n<r.length;n++){var o=r[n];t.push(o),t.push.apply(t,this.flattenHeadings(o.items))}return t},e.prototype.attachHeadingsDescriptions=function(e){var t=function(e){return new RegExp("##?\\s+"+e.name.replace(/[-\/\\^$*+?.()|[\]{}]/g,"\\$&"))},n=this.flattenHeadings(this.headings);if(!(n.length<1)){for(var r=n[0],o=t(r),i=e.search(o),a=1;a<n.length;a++){var s=n[a],l=t(s),c=e.substr(i+1).search(l)+i+1;r.description=e.substring(i,c).replace(o,"").trim(),r=s,o=l,i=c}r.description=e.substring(i).replace(o,"").trim()}},e.prototype.renderMd=function(e,t){void 0===t&&(t=!1);var n=t?{renderer:this.headingEnhanceRenderer}:void 0;return Ct(e.toString(),n)},e.prototype.extractHeadings=function(e){this.renderMd(e,!0),this.attachHeadingsDescriptions(e);var t=this.headings;return this.headings=[],t},e.prototype.renderMdWithComponents=function(e){var t=this.options&&this.options.allowedMdComponents;if(!t||0===Object.keys(t).length)return[this.renderMd(e)];for(var n=Object.keys(t).join("|"),r=new RegExp(Pt.replace(/{component}/g,n),"mig"),i=[],a=[],s=r.exec(e),l=0;s;){i.push(e.substring(l,s.index)),l=r.lastIndex;var c=t[s[1]||s[2]||s[5]],u=s[3]||s[6],p=s[4];c&&a.push({component:c.component,propsSelector:c.propsSelector,props:Object(o.__assign)(Object(o.__assign)(Object(o.__assign)({},Nt(u)),c.props),{children:p})}),s=r.exec(e)}i.push(e.substring(l));for(var f=[],d=0;d<i.length;d++){var h=i[d];h&&f.push(this.renderMd(h)),a[d]&&f.push(a[d])}return f},e}();function Nt(e){if(!e)return{};for(var t,n=/([\w-]+)\s*=\s*(?:{([^}]+?)}|"([^"]+?)")/gim,r={};null!==(t=n.exec(e));)if(t[3])r[t[1]]=t[3];else if(t[2]){var o=void 0;try{o=JSON.parse(t[2])}catch(e){}r[t[1]]=o}return r}var Lt=function(){function e(e){this.parser=e,Object.assign(this,e.spec.info),this.description=e.spec.info.description||"";var t=this.description.search(/^##?\s+/m);t>-1&&(this.description=this.description.substring(0,t)),this.downloadLink=this.getDownloadLink(),this.downloadFileName=this.getDownloadFileName()}return e.prototype.getDownloadLink=function(){if(this.parser.specUrl)return this.parser.specUrl;if(te&&window.Blob&&window.URL&&window.URL.createObjectURL){var e=new Blob([JSON.stringify(this.parser.spec,null,2)],{type:"application/json"});return window.URL.createObjectURL(e)}},e.prototype.getDownloadFileName=function(){if(!this.parser.specUrl)return"swagger.json"},e}(),Mt=function(e,t){var n=t.spec.components&&t.spec.components.securitySchemes||{};this.schemes=Object.keys(e||{}).map((function(r){var i=t.deref(n[r]),a=e[r]||[];if(i)return Object(o.__assign)(Object(o.__assign)({},i),{id:r,sectionId:gt+r,scopes:a});console.warn("Non existing security scheme referenced: "+r+". Skipping")})).filter((function(e){return void 0!==e}))},Dt=function(){function e(e,t,n,r,i){this.operations=[],this.name=t;var a=e.deref(n);e.exitRef(n);for(var s=0,l=Object.keys(a);s<l.length;s++)for(var c=l[s],u=a[c],p=0,f=Object.keys(u).filter(nt);p<f.length;p++){var d=f[p],h=u[d],m=new mn(e,Object(o.__assign)(Object(o.__assign)({},h),{pathName:c,pointer:Xe.compile([r,t,c,d]),httpVerb:d,pathParameters:u.parameters||[],pathServers:u.servers}),void 0,i,!0);this.operations.push(m)}}return e.prototype.toggle=function(){this.expanded=!this.expanded},Object(o.__decorate)([Be.n],e.prototype,"expanded",void 0),Object(o.__decorate)([Be.f],e.prototype,"toggle",null),e}(),Ft=function(){function e(e,t,n,r,o){void 0===o&&(o=!1),this.options=r,this.typePrefix="",this.isCircular=!1,this.activeOneOf=0,this.pointer=t.$ref||n||"",this.rawSchema=e.deref(t),this.schema=e.mergeAllOf(this.rawSchema,this.pointer,o),this.init(e,o),e.exitRef(t),e.exitParents(this.schema),r.showExtensions&&(this.extensions=vt(this.schema,r.showExtensions))}return e.prototype.activateOneOf=function(e){this.activeOneOf=e},e.prototype.init=function(t,n){var r=this,i=this.schema;if(this.isCircular=i["x-circular-ref"],this.title=i.title||ut(this.pointer)&&Xe.baseName(this.pointer)||"",this.description=i.description||"",this.type=i.type||function(e){if(void 0!==e.type)return e.type;for(var t=0,n=Object.keys(rt);t<n.length;t++){var r=n[t],o=rt[r];if(void 0!==e[r])return o}return"any"}(i),this.format=i.format,this.nullable=!!i.nullable,this.enum=i.enum||[],this.example=i.example,this.deprecated=!!i.deprecated,this.pattern=i.pattern,this.externalDocs=i.externalDocs,this.constraints=ft(i),this.displayType=this.type,this.displayFormat=this.format,this.isPrimitive=function(e,t){return void 0===t&&(t=e.type),void 0===e.oneOf&&void 0===e.anyOf&&("object"===t?void 0!==e.properties?0===Object.keys(e.properties).length:void 0===e.additionalProperties:"array"!==t||void 0===e.items)}(i,this.type),this.default=i.default,this.readOnly=!!i.readOnly,this.writeOnly=!!i.writeOnly,!this.isCircular)if(n||void 0===zt(i)){if(n&&Array.isArray(i.oneOf)&&i.oneOf.find((function(e){return e.$ref===r.pointer}))&&delete i.oneOf,void 0!==i.oneOf)return this.initOneOf(i.oneOf,t),this.oneOfType="One of",void(void 0!==i.anyOf&&console.warn("oneOf and anyOf are not supported on the same level. Skipping anyOf at "+this.pointer));if(void 0!==i.anyOf)return this.initOneOf(i.anyOf,t),void(this.oneOfType="Any of");"object"===this.type?this.fields=function(e,t,n,r){var i=t.properties||{},a=t.additionalProperties,s=t.default||{},l=Object.keys(i||[]).map((function(a){var l=i[a];l||(console.warn('Field "'+a+'" is invalid, skipping.\n Field must be an object but got '+typeof l+' at "'+n+'"'),l={});var c=void 0!==t.required&&t.required.indexOf(a)>-1;return new Bt(e,{name:a,required:c,schema:Object(o.__assign)(Object(o.__assign)({},l),{default:void 0===l.default?s[a]:l.default})},n+"/properties/"+a,r)}));r.sortPropsAlphabetically&&(l=ht(l,"name"));r.requiredPropsFirst&&(l=dt(l,r.sortPropsAlphabetically?void 0:t.required));"object"!=typeof a&&!0!==a||l.push(new Bt(e,{name:("object"==typeof a&&a["x-additionalPropertiesName"]||"property name").concat("*"),required:!1,schema:!0===a?{}:a,kind:"additionalProperties"},n+"/additionalProperties",r));return l}(t,i,this.pointer,this.options):"array"===this.type&&i.items&&(this.items=new e(t,i.items,this.pointer+"/items",this.options),this.displayType=this.items.displayType.split(" or ").map((function(e){return e.replace(/^(string|object|number|integer|array|boolean)s?( ?.*)/,"$1s$2")})).join(" or "),this.displayFormat=this.items.format,this.typePrefix=this.items.typePrefix+he("arrayOf"),this.title=this.title||this.items.title,this.isPrimitive=this.items.isPrimitive,void 0===this.example&&void 0!==this.items.example&&(this.example=[this.items.example]),this.items.isPrimitive&&(this.enum=this.items.enum)),this.enum.length&&this.options.sortEnumValuesAlphabetically&&this.enum.sort()}else this.initDiscriminator(i,t)},e.prototype.initOneOf=function(t,n){var r,i,a=this;if(this.oneOf=t.map((function(t,r){var i=n.deref(t),s=n.mergeAllOf(i,a.pointer+"/oneOf/"+r),l=ut(t.$ref)&&!s.title?Xe.baseName(t.$ref):s.title,c=new e(n,Object(o.__assign)(Object(o.__assign)({},s),{title:l,allOf:[Object(o.__assign)(Object(o.__assign)({},a.schema),{oneOf:void 0,anyOf:void 0})]}),a.pointer+"/oneOf/"+r,a.options);return n.exitRef(t),n.exitParents(s),c})),this.options.simpleOneOfTypeLabel){var s=(r=this,i=new Set,function e(t){for(var n=0,r=t.oneOf||[];n<r.length;n++){var o=r[n];o.oneOf?e(o):o.type&&i.add(o.type)}}(r),Array.from(i.values()));this.displayType=s.join(" or ")}else this.displayType=this.oneOf.map((function(e){var t=e.typePrefix+(e.title?e.title+" ("+e.displayType+")":e.displayType);return t.indexOf(" or ")>-1&&(t="("+t+")"),t})).join(" or ")},e.prototype.initDiscriminator=function(t,n){var r=this,i=zt(t);this.discriminatorProp=i.propertyName;var a=n.findDerived(Object(o.__spreadArrays)(t.parentRefs||[],[this.pointer]));if(t.oneOf)for(var s=0,l=t.oneOf;s<l.length;s++){var c=l[s];if(void 0!==c.$ref){var u=Xe.baseName(c.$ref);a[c.$ref]=u}}var p=i.mapping||{},f=i["x-explicitMappingOnly"]||!1;0===Object.keys(p).length&&(f=!1);var d={};for(var h in p){var m=p[h];Array.isArray(d[m])?d[m].push(h):d[m]=[h]}for(var g=f?Object(o.__assign)({},d):Object(o.__assign)(Object(o.__assign)({},a),d),y=[],v=0,b=Object.keys(g);v<b.length;v++){var x=g[m=b[v]];if(Array.isArray(x))for(var w=0,k=x;w<k.length;w++){var O=k[w];y.push({$ref:m,name:O})}else y.push({$ref:m,name:x})}var E=Object.keys(p);0!==E.length&&(y=y.sort((function(e,t){var n=E.indexOf(e.name),r=E.indexOf(t.name);return n<0&&r<0?e.name.localeCompare(t.name):n<0?1:r<0?-1:n-r}))),this.oneOf=y.map((function(t){var o=t.$ref,i=t.name,a=new e(n,n.byRef(o),o,r.options,!0);return a.title=i,a}))},Object(o.__decorate)([Be.n],e.prototype,"activeOneOf",void 0),Object(o.__decorate)([Be.f],e.prototype,"activateOneOf",null),e}();function zt(e){return e.discriminator||e["x-discriminator"]}var Ut={path:{style:"simple",explode:!1},query:{style:"form",explode:!0},header:{style:"simple",explode:!1},cookie:{style:"form",explode:!0}},Bt=function(){function e(e,t,n,r){var o,i,a,s,l=e.deref(t);this.kind=t.kind||"field",this.name=t.name||l.name,this.in=l.in,this.required=!!l.required;var c=l.schema,u="";!c&&l.in&&l.content&&(u=Object.keys(l.content)[0],c=l.content[u]&&l.content[u].schema),this.schema=new Ft(e,c||{},n,r),this.description=void 0===l.description?this.schema.description||"":l.description,this.example=l.example||this.schema.example,u?this.serializationMime=u:l.style?this.style=l.style:this.in&&(this.style=null!==(i=null===(o=Ut[this.in])||void 0===o?void 0:o.style)&&void 0!==i?i:"form"),void 0===l.explode&&this.in?this.explode=null===(s=null===(a=Ut[this.in])||void 0===a?void 0:a.explode)||void 0===s||s:this.explode=!!l.explode,this.deprecated=void 0===l.deprecated?!!this.schema.deprecated:l.deprecated,e.exitRef(t),r.showExtensions&&(this.extensions=vt(l,r.showExtensions))}return e.prototype.toggle=function(){this.expanded=!this.expanded},Object(o.__decorate)([Be.n],e.prototype,"expanded",void 0),Object(o.__decorate)([Be.f],e.prototype,"toggle",null),e}(),$t=n(97),Wt={},qt=function(){function e(e,t,n,r){this.mime=n;var o=e.deref(t);this.value=o.value,this.summary=o.summary,this.description=o.description,o.externalValue&&(this.externalValueUrl=Object(ie.resolve)(e.specUrl||"",o.externalValue)),e.exitRef(t),"application/x-www-form-urlencoded"===n&&this.value&&"object"==typeof this.value&&(this.value=function(e,t){if(void 0===t&&(t={}),Array.isArray(e))throw new Error("Payload must have fields: "+e.toString());return Object.keys(e).map((function(n){var r=e[n],o=t[n]||{},i=o.style,a=void 0===i?"form":i,s=o.explode,l=void 0===s||s;switch(a){case"form":return st(n,l,r);case"spaceDelimited":return it(r,n,"%20");case"pipeDelimited":return it(r,n,"|");case"deepObject":return at(r,n);default:return console.warn("Incorrect or unsupported encoding style: "+a),""}})).join("&")}(this.value,r))}return e.prototype.getExternalValue=function(e){return this.externalValueUrl?(Wt[this.externalValueUrl]||(Wt[this.externalValueUrl]=fetch(this.externalValueUrl).then((function(t){return t.text().then((function(n){if(!t.ok)return Promise.reject(new Error(n));if(!ot(e))return n;try{return JSON.parse(n)}catch(e){return n}}))}))),Wt[this.externalValueUrl]):Promise.resolve(void 0)},e}(),Ht=function(){function e(e,t,n,r,o){this.name=t,this.isRequestType=n,this.schema=r.schema&&new Ft(e,r.schema,"",o),this.onlyRequiredInSamples=o.onlyRequiredInSamples,void 0!==r.examples?this.examples=function(e,t){var n={};for(var r in e)e.hasOwnProperty(r)&&(n[r]=t(e[r],r,e));return n}(r.examples,(function(n){return new qt(e,n,t,r.encoding)})):void 0!==r.example?this.examples={default:new qt(e,{value:e.shalowDeref(r.example)},t,r.encoding)}:ot(t)&&this.generateExample(e,r)}return e.prototype.generateExample=function(e,t){var n={skipReadOnly:this.isRequestType,skipNonRequired:this.isRequestType&&this.onlyRequiredInSamples,skipWriteOnly:!this.isRequestType};if(this.schema&&this.schema.oneOf){this.examples={};for(var r=0,o=this.schema.oneOf;r<o.length;r++){var i=o[r],a=$t.sample(i.rawSchema,n,e.spec);this.schema.discriminatorProp&&"object"==typeof a&&a&&(a[this.schema.discriminatorProp]=i.title),this.examples[i.title]=new qt(e,{value:a},this.name,t.encoding)}}else this.schema&&(this.examples={default:new qt(e,{value:$t.sample(t.schema,n,e.spec)},this.name,t.encoding)})},e}(),Vt=function(){function e(e,t,n,r){var i,a;this.isRequestType=n,this.activeMimeIdx=0,r.unstable_ignoreMimeParameters&&(i=t,a={},Object.keys(i).forEach((function(e){var t=i[e],n=e.split(";")[0].trim();a[n]?a[n]=Object(o.__assign)(Object(o.__assign)({},a[n]),t):a[n]=t})),t=a),this.mediaTypes=Object.keys(t).map((function(o){var i=t[o];return e.resetVisited(),new Ht(e,o,n,i,r)}))}return e.prototype.activate=function(e){this.activeMimeIdx=e},Object.defineProperty(e.prototype,"active",{get:function(){return this.mediaTypes[this.activeMimeIdx]},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"hasSample",{get:function(){return this.mediaTypes.filter((function(e){return!!e.examples})).length>0},enumerable:!1,configurable:!0}),Object(o.__decorate)([Be.n],e.prototype,"activeMimeIdx",void 0),Object(o.__decorate)([Be.f],e.prototype,"activate",null),Object(o.__decorate)([Be.g],e.prototype,"active",null),e}(),Yt=function(e,t,n){var r=e.deref(t);this.description=r.description||"",this.required=!!r.required,e.exitRef(t),void 0!==r.content&&(this.content=new Vt(e,r.content,!0,n))},Gt=function(){function e(e,t,n,r,i){this.headers=[],this.expanded="all"===i.expandResponses||i.expandResponses[t];var a=e.deref(r);e.exitRef(r),this.code=t,void 0!==a.content&&(this.content=new Vt(e,a.content,!1,i)),void 0!==a["x-summary"]?(this.summary=a["x-summary"],this.description=a.description||""):(this.summary=a.description||"",this.description=""),this.type=et(t,n);var s=a.headers;void 0!==s&&(this.headers=Object.keys(s).map((function(t){var n=s[t];return new Bt(e,Object(o.__assign)(Object(o.__assign)({},n),{name:t}),"",i)})))}return e.prototype.toggle=function(){this.expanded=!this.expanded},Object(o.__decorate)([Be.n],e.prototype,"expanded",void 0),Object(o.__decorate)([Be.f],e.prototype,"toggle",null),e}();function Qt(e){return"payload"===e.lang&&e.requestBodyContent}var Xt,Kt,Jt,Zt,en,tn,nn,rn,on,an,sn,ln,cn,un,pn,fn,dn,hn=!1,mn=function(){function e(e,t,n,r,o){var i;void 0===o&&(o=!1),this.parser=e,this.operationSpec=t,this.options=r,this.type="operation",this.items=[],this.ready=!0,this.active=!1,this.expanded=!1,this.pointer=t.pointer,this.description=t.description,this.parent=n,this.externalDocs=t.externalDocs,this.deprecated=!!t.deprecated,this.httpVerb=t.httpVerb,this.deprecated=!!t.deprecated,this.operationId=t.operationId,this.path=t.pathName,this.isCallback=o,this.isWebhook=!!t.isWebhook,this.name=(i=t).summary||i.operationId||i.description&&i.description.substring(0,50)||"<no summary>",this.isCallback?(this.security=(t.security||[]).map((function(t){return new Mt(t,e)})),this.servers=mt("",t.servers||t.pathServers||[])):(this.id=void 0!==t.operationId?"operation/"+t.operationId:void 0!==n?n.id+this.pointer:this.pointer,this.security=(t.security||e.spec.security||[]).map((function(t){return new Mt(t,e)})),this.servers=mt(e.specUrl,t.servers||t.pathServers||e.spec.servers||[])),r.showExtensions&&(this.extensions=vt(t,r.showExtensions))}return e.prototype.activate=function(){this.active=!0},e.prototype.deactivate=function(){this.active=!1},e.prototype.toggle=function(){this.expanded=!this.expanded},e.prototype.expand=function(){this.parent&&this.parent.expand()},e.prototype.collapse=function(){},Object.defineProperty(e.prototype,"requestBody",{get:function(){return this.operationSpec.requestBody&&new Yt(this.parser,this.operationSpec.requestBody,this.options)},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"codeSamples",{get:function(){var e=this.operationSpec["x-codeSamples"]||this.operationSpec["x-code-samples"]||[];this.operationSpec["x-code-samples"]&&!hn&&(hn=!0,console.warn('"x-code-samples" is deprecated. Use "x-codeSamples" instead'));var t=this.requestBody&&this.requestBody.content;if(t&&t.hasSample){var n=Math.min(e.length,this.options.payloadSampleIdx);e=Object(o.__spreadArrays)(e.slice(0,n),[{lang:"payload",label:"Payload",source:"",requestBodyContent:t}],e.slice(n))}return e},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"parameters",{get:function(){var e=this,t=function(e,t,n){void 0===t&&(t=[]),void 0===n&&(n=[]);var r={};return n.forEach((function(t){t=e.shalowDeref(t),r[t.name+"_"+t.in]=!0})),(t=t.filter((function(t){return t=e.shalowDeref(t),!r[t.name+"_"+t.in]}))).concat(n)}(this.parser,this.operationSpec.pathParameters,this.operationSpec.parameters).map((function(t){return new Bt(e.parser,t,e.pointer,e.options)}));return this.options.sortPropsAlphabetically?ht(t,"name"):this.options.requiredPropsFirst?dt(t):t},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"responses",{get:function(){var e=this,t=!1;return Object.keys(this.operationSpec.responses||[]).filter((function(e){return"default"===e||("success"===et(e)&&(t=!0),"default"===(n=e)||le(n)||Ze(n));var n})).map((function(n){return new Gt(e.parser,n,t,e.operationSpec.responses[n],e.options)}))},enumerable:!1,configurable:!0}),Object.defineProperty(e.prototype,"callbacks",{get:function(){var e=this;return Object.keys(this.operationSpec.callbacks||[]).map((function(t){return new Dt(e.parser,t,e.operationSpec.callbacks[t],e.pointer,e.options)}))},enumerable:!1,configurable:!0}),Object(o.__decorate)([Be.n],e.prototype,"ready",void 0),Object(o.__decorate)([Be.n],e.prototype,"active",void 0),Object(o.__decorate)([Be.n],e.prototype,"expanded",void 0),Object(o.__decorate)([Be.f],e.prototype,"activate",null),Object(o.__decorate)([Be.f],e.prototype,"deactivate",null),Object(o.__decorate)([Be.f],e.prototype,"toggle",null),Object(o.__decorate)([_t],e.prototype,"requestBody",null),Object(o.__decorate)([_t],e.prototype,"codeSamples",null),Object(o.__decorate)([_t],e.prototype,"parameters",null),Object(o.__decorate)([_t],e.prototype,"responses",null),Object(o.__decorate)([_t],e.prototype,"callbacks",null),e}(),gn=Se.div(Kt||(Kt=Object(o.__makeTemplateObject)(["\n  width: calc(100% - ",");\n  padding: 0 ","px;\n\n  ",";\n"],["\n  width: calc(100% - ",");\n  padding: 0 ","px;\n\n  ",";\n"])),(function(e){return e.theme.rightPanel.width}),(function(e){return e.theme.spacing.sectionHorizontal}),(function(e){var t=e.compact,n=e.theme;return _e("medium",!0)(Xt||(Xt=Object(o.__makeTemplateObject)(["\n    width: 100%;\n    padding: ",";\n  "],["\n    width: 100%;\n    padding: ",";\n  "])),(t?0:n.spacing.sectionVertical)+"px "+n.spacing.sectionHorizontal+"px")})),yn=Se.div.attrs((function(e){var t;return(t={})[Di]=e.id,t}))(Zt||(Zt=Object(o.__makeTemplateObject)(["\n  padding: ","px 0;\n\n  &:last-child {\n    min-height: calc(100vh + 1px);\n  }\n\n  & > &:last-child {\n    min-height: initial;\n  }\n\n  ","\n  ","\n"],["\n  padding: ","px 0;\n\n  &:last-child {\n    min-height: calc(100vh + 1px);\n  }\n\n  & > &:last-child {\n    min-height: initial;\n  }\n\n  ","\n  ","\n"])),(function(e){return e.theme.spacing.sectionVertical}),_e("medium",!0)(Jt||(Jt=Object(o.__makeTemplateObject)(["\n    padding: 0;\n  "],["\n    padding: 0;\n  "]))),(function(e){return e.underlined?"\n    position: relative;\n\n    &:not(:last-of-type):after {\n      position: absolute;\n      bottom: 0;\n      width: 100%;\n      display: block;\n      content: '';\n      border-bottom: 1px solid rgba(0, 0, 0, 0.2);\n    }\n  ":""})),vn=Se.div(tn||(tn=Object(o.__makeTemplateObject)(["\n  width: ",";\n  color: ",";\n  background-color: ",";\n  padding: 0 ","px;\n\n  ",";\n"],["\n  width: ",";\n  color: ",";\n  background-color: ",";\n  padding: 0 ","px;\n\n  ",";\n"])),(function(e){return e.theme.rightPanel.width}),(function(e){return e.theme.rightPanel.textColor}),(function(e){return e.theme.rightPanel.backgroundColor}),(function(e){return e.theme.spacing.sectionHorizontal}),_e("medium",!0)(en||(en=Object(o.__makeTemplateObject)(["\n    width: 100%;\n    padding: ",";\n  "],["\n    width: 100%;\n    padding: ",";\n  "])),(function(e){return e.theme.spacing.sectionVertical+"px "+e.theme.spacing.sectionHorizontal+"px"}))),bn=Se(vn)(nn||(nn=Object(o.__makeTemplateObject)(["\n  background-color: ",";\n"],["\n  background-color: ",";\n"])),(function(e){return e.theme.rightPanel.backgroundColor})),xn=Se.div(on||(on=Object(o.__makeTemplateObject)(["\n  display: flex;\n  width: 100%;\n  padding: 0;\n\n  ",";\n"],["\n  display: flex;\n  width: 100%;\n  padding: 0;\n\n  ",";\n"])),_e("medium",!0)(rn||(rn=Object(o.__makeTemplateObject)(["\n    flex-direction: column;\n  "],["\n    flex-direction: column;\n  "])))),wn={1:"1.85714em",2:"1.57143em",3:"1.27em"},kn=function(e){return we(an||(an=Object(o.__makeTemplateObject)(["\n  font-family: ",";\n  font-weight: ",";\n  font-size: ",";\n  line-height: ",";\n"],["\n  font-family: ",";\n  font-weight: ",";\n  font-size: ",";\n  line-height: ",";\n"])),(function(e){return e.theme.typography.headings.fontFamily}),(function(e){return e.theme.typography.headings.fontWeight}),wn[e],(function(e){return e.theme.typography.headings.lineHeight}))},On=Se.h1(sn||(sn=Object(o.__makeTemplateObject)(["\n  ",";\n  color: ",";\n\n  ",";\n"],["\n  ",";\n  color: ",";\n\n  ",";\n"])),kn(1),(function(e){return e.theme.colors.primary.main}),Te("H1")),En=Se.h2(ln||(ln=Object(o.__makeTemplateObject)(["\n  ",";\n  color: black;\n\n  ",";\n"],["\n  ",";\n  color: black;\n\n  ",";\n"])),kn(2),Te("H2")),_n=(Se.h2(cn||(cn=Object(o.__makeTemplateObject)(["\n  ",";\n  color: black;\n\n  ",";\n"],["\n  ",";\n  color: black;\n\n  ",";\n"])),kn(3),Te("H3")),Se.h3(un||(un=Object(o.__makeTemplateObject)(["\n  color: ",";\n\n  ",";\n"],["\n  color: ",";\n\n  ",";\n"])),(function(e){return e.theme.rightPanel.textColor}),Te("RightPanelHeader"))),Sn=Se.h5(pn||(pn=Object(o.__makeTemplateObject)(["\n  border-bottom: 1px solid rgba(38, 50, 56, 0.3);\n  margin: 1em 0 1em 0;\n  color: rgba(38, 50, 56, 0.5);\n  font-weight: normal;\n  text-transform: uppercase;\n  font-size: 0.929em;\n  line-height: 20px;\n\n  ",";\n"],["\n  border-bottom: 1px solid rgba(38, 50, 56, 0.3);\n  margin: 1em 0 1em 0;\n  color: rgba(38, 50, 56, 0.5);\n  font-weight: normal;\n  text-transform: uppercase;\n  font-size: 0.929em;\n  line-height: 20px;\n\n  ",";\n"])),Te("UnderlinedHeader")),Tn=n(156),jn=Object(i.createContext)(void 0),An=jn.Provider,Cn=jn.Consumer,In=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.state={loading:!0,resolvedSpec:null},t}return Object(o.__extends)(t,e),t.getDerivedStateFromProps=function(e,t){return e.specUrl!==t.prevSpecUrl||e.spec!==t.prevSpec?{loading:!0,resolvedSpec:null,prevSpec:e.spec,prevSpecUrl:e.specUrl}:null},t.prototype.makeStore=function(e,t,n){if(e)try{return new vl(e,t,n)}catch(e){throw this.props.onLoaded&&this.props.onLoaded(e),e}},t.prototype.componentDidMount=function(){this.load()},t.prototype.componentDidUpdate=function(){null===this.state.resolvedSpec?this.load():!this.state.loading&&this.props.onLoaded&&this.props.onLoaded()},t.prototype.load=function(){return Object(o.__awaiter)(this,void 0,void 0,(function(){var e,t,n,r,i;return Object(o.__generator)(this,(function(o){switch(o.label){case 0:e=this.props,t=e.specUrl,n=e.spec,o.label=1;case 1:return o.trys.push([1,3,,4]),[4,qe(n||t)];case 2:return r=o.sent(),this.setState({resolvedSpec:r,loading:!1}),[3,4];case 3:return i=o.sent(),this.props.onLoaded&&this.props.onLoaded(i),this.setState({error:i}),[3,4];case 4:return[2]}}))}))},t.prototype.render=function(){if(this.state.error)throw this.state.error;var e=this.props,t=e.specUrl,n=e.options,r=this.state,o=r.loading,i=r.resolvedSpec;return this.props.children({loading:o,store:this.makeStore(i,t,n)})},Object(o.__decorate)([Tn],t.prototype,"makeStore",null),t}(i.Component),Pn=function(e){return we(fn||(fn=Object(o.__makeTemplateObject)(["\n  "," {\n    cursor: pointer;\n    margin-left: -20px;\n    padding: 0;\n    line-height: 1;\n    width: 20px;\n    display: inline-block;\n    outline: 0;\n  }\n  ",":before {\n    content: '';\n    width: 15px;\n    height: 15px;\n    background-size: contain;\n    background-image: url('data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHZlcnNpb249IjEuMSIgeD0iMCIgeT0iMCIgd2lkdGg9IjUxMiIgaGVpZ2h0PSI1MTIiIHZpZXdCb3g9IjAgMCA1MTIgNTEyIiBlbmFibGUtYmFja2dyb3VuZD0ibmV3IDAgMCA1MTIgNTEyIiB4bWw6c3BhY2U9InByZXNlcnZlIj48cGF0aCBmaWxsPSIjMDEwMTAxIiBkPSJNNDU5LjcgMjMzLjRsLTkwLjUgOTAuNWMtNTAgNTAtMTMxIDUwLTE4MSAwIC03LjktNy44LTE0LTE2LjctMTkuNC0yNS44bDQyLjEtNDIuMWMyLTIgNC41LTMuMiA2LjgtNC41IDIuOSA5LjkgOCAxOS4zIDE1LjggMjcuMiAyNSAyNSA2NS42IDI0LjkgOTAuNSAwbDkwLjUtOTAuNWMyNS0yNSAyNS02NS42IDAtOTAuNSAtMjQuOS0yNS02NS41LTI1LTkwLjUgMGwtMzIuMiAzMi4yYy0yNi4xLTEwLjItNTQuMi0xMi45LTgxLjYtOC45bDY4LjYtNjguNmM1MC01MCAxMzEtNTAgMTgxIDBDNTA5LjYgMTAyLjMgNTA5LjYgMTgzLjQgNDU5LjcgMjMzLjR6TTIyMC4zIDM4Mi4ybC0zMi4yIDMyLjJjLTI1IDI0LjktNjUuNiAyNC45LTkwLjUgMCAtMjUtMjUtMjUtNjUuNiAwLTkwLjVsOTAuNS05MC41YzI1LTI1IDY1LjUtMjUgOTAuNSAwIDcuOCA3LjggMTIuOSAxNy4yIDE1LjggMjcuMSAyLjQtMS40IDQuOC0yLjUgNi44LTQuNWw0Mi4xLTQyYy01LjQtOS4yLTExLjYtMTgtMTkuNC0yNS44IC01MC01MC0xMzEtNTAtMTgxIDBsLTkwLjUgOTAuNWMtNTAgNTAtNTAgMTMxIDAgMTgxIDUwIDUwIDEzMSA1MCAxODEgMGw2OC42LTY4LjZDMjc0LjYgMzk1LjEgMjQ2LjQgMzkyLjMgMjIwLjMgMzgyLjJ6Ii8+PC9zdmc+Cg==');\n    opacity: 0.5;\n    visibility: hidden;\n    display: inline-block;\n    vertical-align: middle;\n  }\n\n  h1:hover > ","::before, h2:hover > ","::before, ",":hover::before {\n    visibility: visible;\n  }\n"],["\n  "," {\n    cursor: pointer;\n    margin-left: -20px;\n    padding: 0;\n    line-height: 1;\n    width: 20px;\n    display: inline-block;\n    outline: 0;\n  }\n  ",":before {\n    content: '';\n    width: 15px;\n    height: 15px;\n    background-size: contain;\n    background-image: url('data:image/svg+xml;base64,PHN2ZyB4bWxucz0iaHR0cDovL3d3dy53My5vcmcvMjAwMC9zdmciIHZlcnNpb249IjEuMSIgeD0iMCIgeT0iMCIgd2lkdGg9IjUxMiIgaGVpZ2h0PSI1MTIiIHZpZXdCb3g9IjAgMCA1MTIgNTEyIiBlbmFibGUtYmFja2dyb3VuZD0ibmV3IDAgMCA1MTIgNTEyIiB4bWw6c3BhY2U9InByZXNlcnZlIj48cGF0aCBmaWxsPSIjMDEwMTAxIiBkPSJNNDU5LjcgMjMzLjRsLTkwLjUgOTAuNWMtNTAgNTAtMTMxIDUwLTE4MSAwIC03LjktNy44LTE0LTE2LjctMTkuNC0yNS44bDQyLjEtNDIuMWMyLTIgNC41LTMuMiA2LjgtNC41IDIuOSA5LjkgOCAxOS4zIDE1LjggMjcuMiAyNSAyNSA2NS42IDI0LjkgOTAuNSAwbDkwLjUtOTAuNWMyNS0yNSAyNS02NS42IDAtOTAuNSAtMjQuOS0yNS02NS41LTI1LTkwLjUgMGwtMzIuMiAzMi4yYy0yNi4xLTEwLjItNTQuMi0xMi45LTgxLjYtOC45bDY4LjYtNjguNmM1MC01MCAxMzEtNTAgMTgxIDBDNTA5LjYgMTAyLjMgNTA5LjYgMTgzLjQgNDU5LjcgMjMzLjR6TTIyMC4zIDM4Mi4ybC0zMi4yIDMyLjJjLTI1IDI0LjktNjUuNiAyNC45LTkwLjUgMCAtMjUtMjUtMjUtNjUuNiAwLTkwLjVsOTAuNS05MC41YzI1LTI1IDY1LjUtMjUgOTAuNSAwIDcuOCA3LjggMTIuOSAxNy4yIDE1LjggMjcuMSAyLjQtMS40IDQuOC0yLjUgNi44LTQuNWw0Mi4xLTQyYy01LjQtOS4yLTExLjYtMTgtMTkuNC0yNS44IC01MC01MC0xMzEtNTAtMTgxIDBsLTkwLjUgOTAuNWMtNTAgNTAtNTAgMTMxIDAgMTgxIDUwIDUwIDEzMSA1MCAxODEgMGw2OC42LTY4LjZDMjc0LjYgMzk1LjEgMjQ2LjQgMzkyLjMgMjIwLjMgMzgyLjJ6Ii8+PC9zdmc+Cg==');\n    opacity: 0.5;\n    visibility: hidden;\n    display: inline-block;\n    vertical-align: middle;\n  }\n\n  h1:hover > ","::before, h2:hover > ","::before, ",":hover::before {\n    visibility: visible;\n  }\n"])),e,e,e,e,e)},Rn=function(e){return!!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)},Nn=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.navigate=function(e,n){n.defaultPrevented||0!==n.button||Rn(n)||(n.preventDefault(),e.replace(t.props.to))},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this;return i.createElement(Cn,null,(function(t){return i.createElement("a",{className:e.props.className,href:t.menu.history.linkForId(e.props.to),onClick:e.navigate.bind(e,t.menu.history)},e.props.children)}))},t}(i.Component),Ln=Se(Nn)(dn||(dn=Object(o.__makeTemplateObject)(["\n  ",";\n"],["\n  ",";\n"])),Pn("&"));function Mn(e){return i.createElement(Ln,{to:e.to})}var Dn,Fn,zn,Un,Bn,$n,Wn,qn,Hn,Vn,Yn,Gn,Qn,Xn,Kn,Jn,Zn,er,tr,nr={left:"90deg",right:"-90deg",up:"-180deg",down:"0"},rr=Se(function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){return i.createElement("svg",{className:this.props.className,style:this.props.style,version:"1.1",viewBox:"0 0 24 24",x:"0",xmlns:"http://www.w3.org/2000/svg",y:"0","aria-hidden":"true"},i.createElement("polygon",{points:"17.3 8.3 12 13.6 6.7 8.3 5.3 9.7 12 16.4 18.7 9.7 "}))},t}(i.PureComponent))(Dn||(Dn=Object(o.__makeTemplateObject)(["\n  height: ",";\n  width: ",";\n  vertical-align: middle;\n  float: ",";\n  transition: transform 0.2s ease-out;\n  transform: rotateZ(",");\n\n  polygon {\n    fill: ",";\n  }\n"],["\n  height: ",";\n  width: ",";\n  vertical-align: middle;\n  float: ",";\n  transition: transform 0.2s ease-out;\n  transform: rotateZ(",");\n\n  polygon {\n    fill: ",";\n  }\n"])),(function(e){return e.size||"18px"}),(function(e){return e.size||"18px"}),(function(e){return e.float||""}),(function(e){return nr[e.direction||"down"]}),(function(e){return e.color&&e.theme.colors[e.color]&&e.theme.colors[e.color].main||e.color})),or=Se.span(Fn||(Fn=Object(o.__makeTemplateObject)(["\n  display: inline-block;\n  padding: 2px 8px;\n  margin: 0;\n  background-color: ",";\n  color: ",";\n  font-size: ",";\n  vertical-align: middle;\n  line-height: 1.6;\n  border-radius: 4px;\n  font-weight: ",";\n  font-size: 12px;\n  + span[type] {\n    margin-left: 4px;\n  }\n"],["\n  display: inline-block;\n  padding: 2px 8px;\n  margin: 0;\n  background-color: ",";\n  color: ",";\n  font-size: ",";\n  vertical-align: middle;\n  line-height: 1.6;\n  border-radius: 4px;\n  font-weight: ",";\n  font-size: 12px;\n  + span[type] {\n    margin-left: 4px;\n  }\n"])),(function(e){return e.theme.colors[e.type].main}),(function(e){return e.theme.colors[e.type].contrastText}),(function(e){return e.theme.typography.code.fontSize}),(function(e){return e.theme.typography.fontWeightBold})),ir=we(zn||(zn=Object(o.__makeTemplateObject)(["\n  text-decoration: line-through;\n  color: #bdccd3;\n"],["\n  text-decoration: line-through;\n  color: #bdccd3;\n"]))),ar=Se.caption(Un||(Un=Object(o.__makeTemplateObject)(["\n  text-align: right;\n  font-size: 0.9em;\n  font-weight: normal;\n  color: ",";\n"],["\n  text-align: right;\n  font-size: 0.9em;\n  font-weight: normal;\n  color: ",";\n"])),(function(e){return e.theme.colors.text.secondary})),sr=Se.td(Bn||(Bn=Object(o.__makeTemplateObject)(["\n  border-left: 1px solid ",";\n  box-sizing: border-box;\n  position: relative;\n  padding: 10px 10px 10px 0;\n\n  tr:first-of-type > &,\n  tr.last > & {\n    border-left-width: 0;\n    background-position: top left;\n    background-repeat: no-repeat;\n    background-size: 1px 100%;\n  }\n\n  tr:first-of-type > & {\n    background-image: linear-gradient(\n      to bottom,\n      transparent 0%,\n      transparent 22px,\n      "," 22px,\n      "," 100%\n    );\n  }\n\n  tr.last > & {\n    background-image: linear-gradient(\n      to bottom,\n      "," 0%,\n      "," 22px,\n      transparent 22px,\n      transparent 100%\n    );\n  }\n\n  tr.last + tr > & {\n    border-left-color: transparent;\n  }\n\n  tr.last:first-child > & {\n    background: none;\n    border-left-color: transparent;\n  }\n"],["\n  border-left: 1px solid ",";\n  box-sizing: border-box;\n  position: relative;\n  padding: 10px 10px 10px 0;\n\n  tr:first-of-type > &,\n  tr.last > & {\n    border-left-width: 0;\n    background-position: top left;\n    background-repeat: no-repeat;\n    background-size: 1px 100%;\n  }\n\n  tr:first-of-type > & {\n    background-image: linear-gradient(\n      to bottom,\n      transparent 0%,\n      transparent 22px,\n      "," 22px,\n      "," 100%\n    );\n  }\n\n  tr.last > & {\n    background-image: linear-gradient(\n      to bottom,\n      "," 0%,\n      "," 22px,\n      transparent 22px,\n      transparent 100%\n    );\n  }\n\n  tr.last + tr > & {\n    border-left-color: transparent;\n  }\n\n  tr.last:first-child > & {\n    background: none;\n    border-left-color: transparent;\n  }\n"])),(function(e){return e.theme.schema.linesColor}),(function(e){return e.theme.schema.linesColor}),(function(e){return e.theme.schema.linesColor}),(function(e){return e.theme.schema.linesColor}),(function(e){return e.theme.schema.linesColor})),lr=Se(sr)($n||($n=Object(o.__makeTemplateObject)(["\n  padding: 0;\n"],["\n  padding: 0;\n"]))),cr=Se(sr)(Wn||(Wn=Object(o.__makeTemplateObject)(["\n  vertical-align: top;\n  line-height: 20px;\n  white-space: nowrap;\n  font-size: 13px;\n  font-family: ",";\n\n  &.deprecated {\n    ",";\n  }\n\n  ",";\n\n  ",";\n"],["\n  vertical-align: top;\n  line-height: 20px;\n  white-space: nowrap;\n  font-size: 13px;\n  font-family: ",";\n\n  &.deprecated {\n    ",";\n  }\n\n  ",";\n\n  ",";\n"])),(function(e){return e.theme.typography.code.fontFamily}),ir,(function(e){return"field"!==e.kind?"font-style: italic":""}),Te("PropertyNameCell")),ur=Se.td(qn||(qn=Object(o.__makeTemplateObject)(["\n  border-bottom: 1px solid #9fb4be;\n  padding: 10px 0;\n  width: ",";\n  box-sizing: border-box;\n\n  tr.expanded & {\n    border-bottom: none;\n  }\n"],["\n  border-bottom: 1px solid #9fb4be;\n  padding: 10px 0;\n  width: ",";\n  box-sizing: border-box;\n\n  tr.expanded & {\n    border-bottom: none;\n  }\n"])),(function(e){return e.theme.schema.defaultDetailsWidth})),pr=Se.span(Hn||(Hn=Object(o.__makeTemplateObject)(["\n  color: ",";\n  font-family: ",";\n  margin-right: 10px;\n\n  &::before {\n    content: '';\n    display: inline-block;\n    vertical-align: middle;\n    width: 10px;\n    height: 1px;\n    background: ",";\n  }\n\n  &::after {\n    content: '';\n    display: inline-block;\n    vertical-align: middle;\n    width: 1px;\n    background: ",";\n    height: 7px;\n  }\n"],["\n  color: ",";\n  font-family: ",";\n  margin-right: 10px;\n\n  &::before {\n    content: '';\n    display: inline-block;\n    vertical-align: middle;\n    width: 10px;\n    height: 1px;\n    background: ",";\n  }\n\n  &::after {\n    content: '';\n    display: inline-block;\n    vertical-align: middle;\n    width: 1px;\n    background: ",";\n    height: 7px;\n  }\n"])),(function(e){return e.theme.schema.linesColor}),(function(e){return e.theme.typography.code.fontFamily}),(function(e){return e.theme.schema.linesColor}),(function(e){return e.theme.schema.linesColor})),fr=Se.div(Vn||(Vn=Object(o.__makeTemplateObject)(["\n  padding: ",";\n"],["\n  padding: ",";\n"])),(function(e){return e.theme.schema.nestingSpacing})),dr=Se.table(Yn||(Yn=Object(o.__makeTemplateObject)(["\n  border-collapse: separate;\n  border-radius: 3px;\n  font-size: ",";\n\n  border-spacing: 0;\n  width: 100%;\n\n  > tr {\n    vertical-align: middle;\n  }\n\n  &\n    ",",\n    &\n    ","\n    ","\n    ",",\n    &\n    ","\n    ","\n    ","\n    ","\n    "," {\n    margin: ",";\n    margin-right: 0;\n    background: ",";\n  }\n\n  &\n    ","\n    ",",\n    &\n    ","\n    ","\n    ","\n    ",",\n    &\n    ","\n    ","\n    ","\n    ","\n    ","\n    "," {\n    background: #ffffff;\n  }\n"],["\n  border-collapse: separate;\n  border-radius: 3px;\n  font-size: ",";\n\n  border-spacing: 0;\n  width: 100%;\n\n  > tr {\n    vertical-align: middle;\n  }\n\n  &\n    ",",\n    &\n    ","\n    ","\n    ",",\n    &\n    ","\n    ","\n    ","\n    ","\n    "," {\n    margin: ",";\n    margin-right: 0;\n    background: ",";\n  }\n\n  &\n    ","\n    ",",\n    &\n    ","\n    ","\n    ","\n    ",",\n    &\n    ","\n    ","\n    ","\n    ","\n    ","\n    "," {\n    background: #ffffff;\n  }\n"])),(function(e){return e.theme.typography.fontSize}),fr,fr,fr,fr,fr,fr,fr,fr,fr,(function(e){return e.theme.schema.nestingSpacing}),(function(e){return e.theme.schema.nestedBackground}),fr,fr,fr,fr,fr,fr,fr,fr,fr,fr,fr,fr),hr=Se.div(Gn||(Gn=Object(o.__makeTemplateObject)(["\n  margin: 0 0 3px 0;\n  display: inline-block;\n"],["\n  margin: 0 0 3px 0;\n  display: inline-block;\n"]))),mr=Se.span(Qn||(Qn=Object(o.__makeTemplateObject)(["\n  font-size: 0.9em;\n  margin-right: 10px;\n  color: ",";\n  font-family: ",";\n}\n"],["\n  font-size: 0.9em;\n  margin-right: 10px;\n  color: ",";\n  font-family: ",";\n}\n"])),(function(e){return e.theme.colors.primary.main}),(function(e){return e.theme.typography.headings.fontFamily})),gr=Se.button(Xn||(Xn=Object(o.__makeTemplateObject)(["\n  display: inline-block;\n  margin-right: 10px;\n  margin-bottom: 5px;\n  font-size: 0.8em;\n  cursor: pointer;\n  border: 1px solid ",";\n  padding: 2px 10px;\n  line-height: 1.5em;\n  outline: none;\n  &:focus {\n    box-shadow: 0 0 0 1px ",";\n  }\n\n  ","\n"],["\n  display: inline-block;\n  margin-right: 10px;\n  margin-bottom: 5px;\n  font-size: 0.8em;\n  cursor: pointer;\n  border: 1px solid ",";\n  padding: 2px 10px;\n  line-height: 1.5em;\n  outline: none;\n  &:focus {\n    box-shadow: 0 0 0 1px ",";\n  }\n\n  ","\n"])),(function(e){return e.theme.colors.primary.main}),(function(e){return e.theme.colors.primary.main}),(function(e){return e.active?"\n      color: white;\n      background-color: "+e.theme.colors.primary.main+";\n      &:focus {\n        box-shadow: none;\n        background-color: "+W(.15,e.theme.colors.primary.main)+";\n      }\n      ":"\n        color: "+e.theme.colors.primary.main+";\n        background-color: white;\n      "})),yr=Se.div(Kn||(Kn=Object(o.__makeTemplateObject)(["\n  font-size: 0.9em;\n  font-family: ",";\n  &::after {\n    content: ' [';\n  }\n"],["\n  font-size: 0.9em;\n  font-family: ",";\n  &::after {\n    content: ' [';\n  }\n"])),(function(e){return e.theme.typography.code.fontFamily})),vr=Se.div(Jn||(Jn=Object(o.__makeTemplateObject)(["\n  font-size: 0.9em;\n  font-family: ",";\n  &::after {\n    content: ']';\n  }\n"],["\n  font-size: 0.9em;\n  font-family: ",";\n  &::after {\n    content: ']';\n  }\n"])),(function(e){return e.theme.typography.code.fontFamily})),br=function(){return(br=Object.assign||function(e){for(var t,n=1,r=arguments.length;n<r;n++)for(var o in t=arguments[n])Object.prototype.hasOwnProperty.call(t,o)&&(e[o]=t[o]);return e}).apply(this,arguments)};(tr=Zn||(Zn={})).Arrow="Arrow",tr.DropdownSelector="DropdownSelector",tr.DropdownWrapper="DropdownWrapper",tr.SelectorSearch="SelectorSearch",tr.SelectedValue="SelectedValue",tr.Placeholder="Placeholder",tr.GroupContainer="GroupContainer",tr.GroupDivider="GroupDivider",tr.GroupHeading="GroupHeading",tr.OptionContainer="OptionContainer",tr.OptionItem="OptionItem",function(e){e[e.DOWN_ARROW=40]="DOWN_ARROW",e[e.ENTER=13]="ENTER",e[e.ESCAPE=27]="ESCAPE",e[e.PAGE_DOWN=34]="PAGE_DOWN",e[e.PAGE_UP=33]="PAGE_UP",e[e.TAB=9]="TAB",e[e.UP_ARROW=38]="UP_ARROW",e[e.SPACE=32]="SPACE"}(er||(er={}));var xr=[er.ESCAPE,er.UP_ARROW,er.DOWN_ARROW,er.PAGE_UP,er.PAGE_DOWN],wr="#808080",kr="#7C7C7C",Or="#6e6d6d",Er="#CECECE",_r="#e0e0e0",Sr="#f5f5f5",Tr="#ededed",jr="#0080bc";function Ar(e){return void 0!==e.groupOptions}var Cr=function(e,t){return Ar(t)?e.concat(t.groupOptions):e.concat(t)},Ir=function(e,t){return br(br({},e),{groupOptions:e.groupOptions.filter((function(e){return e.value.toLowerCase().includes(t)}))})};function Pr(){for(var e=[],t=0;t<arguments.length;t++)e[t]=arguments[t];return e.filter(Boolean).map((function(e){return"string"==typeof e?e:e?Object.keys(e).filter((function(t){return e[t]})).join(" "):""})).join(" ")}var Rr=ve.default.div((function(e){var t=e.width,n=e.height,r=e.disabled,o=e.open,i=e.dropdownFocused;return{backgroundColor:r?Er:Sr,border:"2px solid "+(o||i?jr:kr),borderRadius:"7",cursor:r?"not-allowed":"pointer",display:"flex",flexDirection:"column",fontSize:"1em",height:n,position:"relative",width:t,"&:hover":{border:"2px solid "+(o||i?jr:Or)},"&:disabled":{backgroundColor:Tr,cursor:"unset"}}})),Nr=ve.default.div((function(e){var t=e.searchable;return{alignItems:"center",boxSizing:"border-box",cursor:e.open&&t?"text":"inherit",display:"flex",height:"32px",padding:"0 11px",position:"relative",width:"100%",input:{backgroundColor:"inherit",border:"none",fontSize:"inherit",height:"30px",outline:"none",width:"100%"}}})),Lr=ve.default.span((function(){return{bottom:0,left:"11px",position:"absolute",right:"25px",top:0}})),Mr={bottom:0,left:"11px",lineHeight:"30px",overflow:"hidden",position:"absolute",right:"25px",textOverflow:"ellipsis",top:0,whiteSpace:"nowrap"},Dr=ve.default.span((function(e){return br({textAlign:e.centerText?"center":"left",color:e.value&&!e.open?"black":wr},Mr)})),Fr=ve.default.span((function(e){var t=e.centerText;return br({color:wr,textAlign:t?"center":"left"},Mr)})),zr=ve.default.div((function(){return{alignItems:"center",bottom:0,color:wr,display:"flex",position:"absolute",right:"10px",top:0}})),Ur=ve.default.span((function(e){var t=e.openUp,n=e.maxContentHeight,r=e.open;return{backgroundColor:"#ffffff",border:"2px solid "+Or,borderRadius:"4px",bottom:t?"105%":void 0,boxShadow:"0px "+(t?"-4px":"4px")+" 4px rgba(0, 0, 0, 0.25)",boxSizing:"border-box",color:"black",display:r?"block":"none",left:"0",listStyleType:"none",margin:"0",maxHeight:n||"175px",overflowX:"hidden",overflowY:"auto",padding:"2px 0",position:"absolute",top:t?void 0:"100%",width:"100%",zIndex:9999,".dropdown-selector-content--empty":{alignItems:"center",color:wr,display:"flex",flexDirection:"column",justifyContent:"center",padding:"4px 0"},"&::-webkit-scrollbar":{width:"5px"},"&::-webkit-scrollbar-track":{background:"#ddd"},"&::-webkit-scrollbar-thumb":{background:"#666"}}})),Br=ve.default.div((function(){return{padding:"1em 0 0 0"}})),$r=ve.default.div((function(){return{color:"grey",display:"flex",flexDirection:"row",fontSize:"0.9em",padding:"0 10px 3px 5px"}})),Wr=ve.default.div((function(){return{borderBottom:"1px solid "+kr,margin:"auto",paddingTop:10,width:"85%"}})),qr=ve.default.div((function(e){var t=e.selected,n=e.focused,r=Sr,o="inherit";return n&&t?(r=kr,o=Sr):n?r=_r:t&&(r=Er),{backgroundColor:r,border:"none",color:o,cursor:"pointer",fontSize:"0.95em",overflow:"hidden",padding:"5px 10px",textOverflow:"ellipsis",whiteSpace:"nowrap",width:"100%",display:"flex",alignItems:"center","&:hover":{backgroundColor:t?kr:Er,color:t?Sr:void 0},".option-icon":{paddingRight:"5px"}}})),Hr=Object(i.memo)((function(e){var t=e.onOptionClicked,n=e.option,r=e.optionClass,o=e.itemRenderer,a=e.index,s=e.selected,l=e.focused,c=Object(i.useCallback)((function(e){e.stopPropagation(),t(n,!0)}),[t,n]),u=Object(i.createElement)(i.Fragment,null,n.iconClass&&Object(i.createElement)("i",{className:n.iconClass+" dropdown-option-icon"}),n.value);return o&&(u=o(e,a)),Object(i.createElement)(qr,{"aria-label":n.ariaLabel,"aria-selected":s,className:Pr("dropdown-option",r,{selected:s,focused:l}),onClick:c,title:n.title,selected:s,focused:l},u)})),Vr=function(e){var t=e.children,n=e.className,r=e.dim,o=void 0===r?24:r;return Object(i.createElement)("svg",{xmlns:"http://www.w3.org/2000/svg",width:o,height:o,viewBox:"0 0 24 24",fill:"none",stroke:"currentColor",strokeWidth:"2",strokeLinecap:"round",strokeLinejoin:"round",className:"feather "+n},t)},Yr=function(){return Object(i.createElement)(Vr,{className:"feather-inbox"},Object(i.createElement)("polyline",{points:"22 12 16 12 14 15 10 15 8 12 2 12"}),Object(i.createElement)("path",{d:"M5.45 5.11L2 12v6a2 2 0 0 0 2 2h16a2 2 0 0 0 2-2v-6l-3.45-6.89A2 2 0 0 0 16.76 4H7.24a2 2 0 0 0-1.79 1.11z"}))},Gr=function(){return Object(i.createElement)(Vr,{className:"feather-chevron-down",dim:16},Object(i.createElement)("polyline",{points:"6 9 12 15 18 9"}))},Qr=function(){return Object(i.createElement)(Vr,{className:"feather-search",dim:16},Object(i.createElement)("circle",{cx:"11",cy:"11",r:"8"}),Object(i.createElement)("line",{x1:"21",y1:"21",x2:"16.65",y2:"16.65"}))};function Xr(e){var t=e.selectedOption,n=e.options,r=e.focusedIndex,o=e.onOptionClicked,a=e.optionItemRenderer;if(e.empty)return Object(i.createElement)("div",{className:"dropdown-selector-content--empty"},Object(i.createElement)(Yr,null),"No data");var s=a?function(e,t){return a(e,t)}:void 0,l=0,c=n.map((function(e){if(Ar(e)){var n=e.groupOptions,a=e.label,c=n.map((function(e){var n=e.value===t,a=l===r;return l+=1,Object(i.createElement)(Hr,{key:e.value,optionClass:e.className,onOptionClicked:o,option:e,itemRenderer:s,index:l-1,selected:n,focused:a})}));return c.length?Object(i.createElement)(Br,{key:e.label},Object(i.createElement)($r,null,Object(i.createElement)("span",null,a.toUpperCase()," |  "),Object(i.createElement)("span",null,n.length)),c,Object(i.createElement)(Wr,null)):null}var u=e.value,p=e.className,f=l===r;return Object(i.createElement)(Hr,{key:u,optionClass:p,onOptionClicked:o,option:e,itemRenderer:s,index:(l+=1)-1,selected:u===t,focused:f})}));return Object(i.createElement)(i.Fragment,null,c)}var Kr={height:0,width:0,overflow:"hidden"},Jr=function(e,t,n){var r=e.map((function(e,r){return Object(i.createElement)("div",{role:"option",id:n+"_list_"+r,key:n+"_list_"+r,"aria-selected":r===t,"aria-label":e.value})}));return Object(i.createElement)("div",{role:"listbox",id:n+"_list",style:Kr},r)},Zr=function(e,t){var n=e.options,r=e.searchable,o=e.onChange,a=e.disabled,s=e.ariaDescribedBy,l=e.ariaLabel,c=e.ariaLabelledBy,u=e.value,p=e.defaultOpen,f=Object(i.useState)(0),d=f[0],h=f[1],m=Object(i.useState)(p),g=m[0],y=m[1],v=Object(i.useRef)(null),b=Object(i.useRef)(null),x=Object(i.useRef)(null),w=Object(i.useState)(!1),k=w[0],O=w[1],E=function(e,t,n){var r=Object(i.useState)(""),o=r[0],a=r[1],s=Object(i.useMemo)((function(){return n&&o.trim()?function(e,t){for(var n=[],r=t.toLowerCase(),o=0,i=e;o<i.length;o++){var a=i[o];if(Ar(a)){var s=Ir(a,r);s.groupOptions.length>=0&&n.push(s)}else a.value.toLowerCase().includes(r)&&n.push(a)}return n}(t,o):t}),[t,o]),l=Object(i.useCallback)((function(t,n){void 0===n&&(n=!0),a(t),n&&e(0)}),[e,a]);return{searchTerm:o,setSearchTerm:l,filteredOptions:s}}(h,n,r),_=E.searchTerm,S=E.setSearchTerm,T=E.filteredOptions,j=Object(i.useMemo)((function(){return T.reduce(Cr,[])}),[T]),A=Object(i.useMemo)((function(){return j.map((function(e){return e.value})).indexOf(u)}),[j,u]),C=Object(i.useCallback)((function(e){void 0===e&&(e=!1),S("",!1),y(!1),e&&b.current&&b.current.focus()}),[b.current,S,y]),I=Object(i.useCallback)((function(){h(A>0?A:0),y(!0)}),[y,h,A]),P=Object(i.useCallback)((function(e,t){void 0===t&&(t=!1),e&&(o(e),S("",!1)),t&&C(!0)}),[o,C,S]);!function(e,t){var n=function(n){t.current&&!t.current.contains(n.target)&&e()};Object(i.useEffect)((function(){return document.addEventListener("mouseup",n,!1),document.addEventListener("touchend",n,!1),function(){document.removeEventListener("mouseup",n),document.removeEventListener("touchend",n)}}),[])}(C,v),function(e,t){Object(i.useEffect)((function(){if(t.current&&e>=0){var n=t.current.getElementsByClassName("dropdown-option"),r=n&&n.length?n[e]:null;if(r&&r.getBoundingClientRect){var o=r.getBoundingClientRect().height,i=t.current.getBoundingClientRect().height,a=t.current.scrollTop,s=r.offsetTop<=a;r.offsetTop>=a&&r.offsetTop+o<=a+i||(s?t.current.scrollTo({top:r.offsetTop}):t.current.scrollTo({top:r.offsetTop-i+o+8}))}}}),[e])}(d,x);var R=Object(i.useMemo)((function(){return{"aria-hidden":a,"aria-expanded":g,"aria-haspopup":"listbox","aria-activedescendant":t+"_list_"+d,"aria-controls":t+"_list","aria-label":l,"aria-labelledby":c,"aria-describedby":s}}),[a,g,t,d,l,c,s]);return{focusedIndex:d,setFocusedIndex:h,open:g,setOpen:y,searchTerm:_,setSearchTerm:S,dropdownFocused:k,setDropdownFocused:O,setValue:P,filteredOptions:T,openDropdown:I,closeDropdown:C,flattenedOptions:j,container:v,inputRef:b,listWrapper:x,ariaProps:R,ariaList:Jr(j,A,t)}},eo=0,to=function(e){var t,n=e.arrowRenderer,r=e.contentClassName,o=e.className,a=e.disabled,s=e.hideArrow,l=e.id,c=e.optionItemRenderer,u=e.pageKeyTraverseSize,p=e.placeholder,f=e.searchable,d=e.value,h=e.selectedValueClassName,m=Object(i.useMemo)((function(){return t||(e=eo,eo+=1,"react_dropdown_aria_"+e);var e}),[t=l]),g=Zr(e,m),y=g.open,v=g.dropdownFocused,b=g.focusedIndex,x=g.setFocusedIndex,w=g.setDropdownFocused,k=g.setValue,O=g.openDropdown,E=g.closeDropdown,_=g.searchTerm,S=g.setSearchTerm,T=g.filteredOptions,j=g.flattenedOptions,A=g.container,C=g.inputRef,I=g.listWrapper,P=g.ariaProps,R=g.ariaList,N=Object(i.useCallback)((function(){C.current&&C.current.focus()}),[C.current]),L=Object(i.useCallback)((function(){N(),a||y&&f||(y?E(!0):O())}),[y,a,f,E,O]),M=Object(i.useCallback)((function(e){switch(e){case er.UP_ARROW:x((function(e){return 0===e?j.length-1:e-1}));break;case er.DOWN_ARROW:x((function(e){return(e+1)%j.length}));break;case er.PAGE_UP:x((function(e){return e-u<0&&0!==e?0:e-u<0?j.length-1:e-u}));break;case er.PAGE_DOWN:x((function(e){return e===j.length-1?0:e+u>j.length-1?j.length-1:(e+u)%j.length}));break;case er.ESCAPE:E(!0)}}),[x,j,u,E]),D=Object(i.useCallback)((function(e){var t=e.keyCode;-1!==xr.indexOf(t)?(e.preventDefault(),e.stopPropagation(),M(t)):t!==er.ENTER&&(t!==er.SPACE||f)||y?t!==er.TAB||f?(t===er.TAB||t===er.ENTER)&&j.length>0&&b>=0&&y&&(e.stopPropagation(),e.preventDefault(),k(j[b],!0)):E():(e.preventDefault(),O())}),[j,k,b,y,M,O,f,E]),F=Object(i.useCallback)((function(e){S(e.target.value)}),[S]),z=Object(i.useCallback)((function(){return w(!0)}),[w]),U=Object(i.useCallback)((function(){return w(!1)}),[w]),B=Object(i.useMemo)((function(){if(s)return null;if(n)return Object(i.createElement)(zr,{className:"dropdown-arrow"},n(y));var e=y&&f;return Object(i.createElement)(zr,{className:"dropdown-arrow"},e&&Object(i.createElement)(Qr,null),!e&&Object(i.createElement)(Gr,null))}),[y,n,f,s]);return Object(i.createElement)(Rr,{ref:A,onFocus:N,onClick:L,role:"button",width:e.width,height:e.height,disabled:a,open:y,dropdownFocused:v,className:Pr("dropdown",o)},Object(i.createElement)(Nr,{className:"dropdown-selector",open:y,searchable:e.searchable},Object(i.createElement)(Lr,{className:"dropdown-selector-search"},Object(i.createElement)("input",br({id:m,ref:C,value:_,onChange:F,onKeyDown:D,onFocus:z,onBlur:U,readOnly:!y||!f,disabled:a,autoComplete:"off",role:"combobox"},P))),!d&&!_&&Object(i.createElement)(Fr,{className:"dropdown-selector-placeholder",centerText:e.centerText},p),d&&!_&&Object(i.createElement)(Dr,{className:Pr("dropdown-selector-value",h),centerText:e.centerText,value:d,open:y},d),B),R,Object(i.createElement)(Ur,{maxContentHeight:e.maxContentHeight,openUp:e.openUp,open:y,className:Pr("dropdown-selector-content",r),ref:I},Object(i.createElement)(Xr,{selectedOption:d,options:T,focusedIndex:b,onOptionClicked:k,optionItemRenderer:c,empty:0===j.length})))};to.defaultProps={ariaDescribedBy:null,ariaLabel:null,ariaLabelledBy:null,arrowRenderer:void 0,centerText:!1,className:void 0,contentClassName:null,defaultOpen:!1,disabled:!1,height:null,hideArrow:!1,id:null,maxContentHeight:150,openUp:!1,optionItemRenderer:void 0,pageKeyTraverseSize:10,placeholder:"Select ...",searchable:!1,selectedValueClassName:null,style:{},value:void 0,width:null};var no,ro,oo,io=Se(to)(no||(no=Object(o.__makeTemplateObject)(["\n  && {\n    box-sizing: border-box;\n    min-width: 100px;\n    outline: none;\n    display: inline-block;\n    border-radius: 2px;\n    border: 1px solid rgba(38, 50, 56, 0.5);\n    vertical-align: bottom;\n    padding: 2px 0px 2px 6px;\n    position: relative;\n    width: auto;\n    background: white;\n    color: #263238;\n    font-family: ",";\n    font-size: 0.929em;\n    line-height: 1.5em;\n    cursor: pointer;\n    transition: border 0.25s ease, color 0.25s ease, box-shadow 0.25s ease;\n    &:hover,\n    &:focus-within {\n      border: 1px solid ",";\n      color: ",";\n      box-shadow: 0px 0px 0px 1px ",";\n    }\n    .dropdown-selector {\n      display: inline-flex;\n      padding: 0;\n      height: auto;\n      padding-right: 20px;\n      position: relative;\n      margin-bottom: 5px;\n    }\n    .dropdown-selector-value {\n      font-family: ",";\n      position: relative;\n      font-size: 0.929em;\n      width: 100%;\n      line-height: 1;\n      vertical-align: middle;\n      color: #263238;\n      left: 0;\n      transition: color 0.25s ease, text-shadow 0.25s ease;\n    }\n    .dropdown-arrow {\n      position: absolute;\n      right: 3px;\n      top: 50%;\n      transform: translateY(-50%);\n      border-color: "," transparent transparent;\n      border-style: solid;\n      border-width: 0.35em 0.35em 0;\n      width: 0;\n      svg {\n        display: none;\n      }\n    }\n\n    .dropdown-selector-content {\n      position: absolute;\n      margin-top: 2px;\n      left: -2px;\n      right: 0;\n\n      z-index: 10;\n      min-width: 100px;\n\n      background: white;\n      border: 1px solid rgba(38, 50, 56, 0.2);\n      box-shadow: 0px 2px 4px 0px rgba(34, 36, 38, 0.12), 0px 2px 10px 0px rgba(34, 36, 38, 0.08);\n\n      max-height: 220px;\n      overflow: auto;\n    }\n\n    .dropdown-option {\n      font-size: 0.9em;\n      color: #263238;\n      cursor: pointer;\n      padding: 0.4em;\n      background-color: #ffffff;\n\n      &[aria-selected='true'] {\n        background-color: rgba(0, 0, 0, 0.05);\n      }\n\n      &:hover {\n        background-color: rgba(38, 50, 56, 0.12);\n      }\n    }\n    input {\n      cursor: pointer;\n      height: 1px;\n    }\n  }\n"],["\n  && {\n    box-sizing: border-box;\n    min-width: 100px;\n    outline: none;\n    display: inline-block;\n    border-radius: 2px;\n    border: 1px solid rgba(38, 50, 56, 0.5);\n    vertical-align: bottom;\n    padding: 2px 0px 2px 6px;\n    position: relative;\n    width: auto;\n    background: white;\n    color: #263238;\n    font-family: ",";\n    font-size: 0.929em;\n    line-height: 1.5em;\n    cursor: pointer;\n    transition: border 0.25s ease, color 0.25s ease, box-shadow 0.25s ease;\n    &:hover,\n    &:focus-within {\n      border: 1px solid ",";\n      color: ",";\n      box-shadow: 0px 0px 0px 1px ",";\n    }\n    .dropdown-selector {\n      display: inline-flex;\n      padding: 0;\n      height: auto;\n      padding-right: 20px;\n      position: relative;\n      margin-bottom: 5px;\n    }\n    .dropdown-selector-value {\n      font-family: ",";\n      position: relative;\n      font-size: 0.929em;\n      width: 100%;\n      line-height: 1;\n      vertical-align: middle;\n      color: #263238;\n      left: 0;\n      transition: color 0.25s ease, text-shadow 0.25s ease;\n    }\n    .dropdown-arrow {\n      position: absolute;\n      right: 3px;\n      top: 50%;\n      transform: translateY(-50%);\n      border-color: "," transparent transparent;\n      border-style: solid;\n      border-width: 0.35em 0.35em 0;\n      width: 0;\n      svg {\n        display: none;\n      }\n    }\n\n    .dropdown-selector-content {\n      position: absolute;\n      margin-top: 2px;\n      left: -2px;\n      right: 0;\n\n      z-index: 10;\n      min-width: 100px;\n\n      background: white;\n      border: 1px solid rgba(38, 50, 56, 0.2);\n      box-shadow: 0px 2px 4px 0px rgba(34, 36, 38, 0.12), 0px 2px 10px 0px rgba(34, 36, 38, 0.08);\n\n      max-height: 220px;\n      overflow: auto;\n    }\n\n    .dropdown-option {\n      font-size: 0.9em;\n      color: #263238;\n      cursor: pointer;\n      padding: 0.4em;\n      background-color: #ffffff;\n\n      &[aria-selected='true'] {\n        background-color: rgba(0, 0, 0, 0.05);\n      }\n\n      &:hover {\n        background-color: rgba(38, 50, 56, 0.12);\n      }\n    }\n    input {\n      cursor: pointer;\n      height: 1px;\n    }\n  }\n"])),(function(e){return e.theme.typography.headings.fontFamily}),(function(e){return e.theme.colors.primary.main}),(function(e){return e.theme.colors.primary.main}),(function(e){return e.theme.colors.primary.main}),(function(e){return e.theme.typography.headings.fontFamily}),(function(e){return e.theme.colors.primary.main})),ao=Se(io)(ro||(ro=Object(o.__makeTemplateObject)(["\n  && {\n    margin-left: 10px;\n    text-transform: none;\n    font-size: 0.969em;\n\n    font-size: 1em;\n    border: none;\n    padding: 0 1.2em 0 0;\n    background: transparent;\n\n    &:hover,\n    &:focus-within {\n      border: none;\n      box-shadow: none;\n      .dropdown-selector-value {\n        color: ",";\n        text-shadow: 0px 0px 0px ",";\n      }\n    }\n  }\n"],["\n  && {\n    margin-left: 10px;\n    text-transform: none;\n    font-size: 0.969em;\n\n    font-size: 1em;\n    border: none;\n    padding: 0 1.2em 0 0;\n    background: transparent;\n\n    &:hover,\n    &:focus-within {\n      border: none;\n      box-shadow: none;\n      .dropdown-selector-value {\n        color: ",";\n        text-shadow: 0px 0px 0px ",";\n      }\n    }\n  }\n"])),(function(e){return e.theme.colors.primary.main}),(function(e){return e.theme.colors.primary.main})),so=Se.span(oo||(oo=Object(o.__makeTemplateObject)(["\n  margin-left: 10px;\n  text-transform: none;\n  font-size: 0.929em;\n  color: black;\n"],["\n  margin-left: 10px;\n  text-transform: none;\n  font-size: 0.929em;\n  color: black;\n"])));function lo(e){return function(t){return!!t.type&&t.type.tabsRole===e}}var co=lo("Tab"),uo=lo("TabList"),po=lo("TabPanel");function fo(e,t){var n=Object.keys(e);if(Object.getOwnPropertySymbols){var r=Object.getOwnPropertySymbols(e);t&&(r=r.filter((function(t){return Object.getOwnPropertyDescriptor(e,t).enumerable}))),n.push.apply(n,r)}return n}function ho(e){for(var t=1;t<arguments.length;t++){var n=null!=arguments[t]?arguments[t]:{};t%2?fo(Object(n),!0).forEach((function(t){mo(e,t,n[t])})):Object.getOwnPropertyDescriptors?Object.defineProperties(e,Object.getOwnPropertyDescriptors(n)):fo(Object(n)).forEach((function(t){Object.defineProperty(e,t,Object.getOwnPropertyDescriptor(n,t))}))}return e}function mo(e,t,n){return t in e?Object.defineProperty(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}function go(e,t){return i.Children.map(e,(function(e){return null===e?null:function(e){return co(e)||uo(e)||po(e)}(e)?t(e):e.props&&e.props.children&&"object"==typeof e.props.children?Object(i.cloneElement)(e,ho(ho({},e.props),{},{children:go(e.props.children,t)})):e}))}function yo(e,t){return i.Children.forEach(e,(function(e){null!==e&&(co(e)||po(e)?t(e):e.props&&e.props.children&&"object"==typeof e.props.children&&(uo(e)&&t(e),yo(e.props.children,t)))}))}function vo(e){var t,n,r="";if("string"==typeof e||"number"==typeof e)r+=e;else if("object"==typeof e)if(Array.isArray(e))for(t=0;t<e.length;t++)e[t]&&(n=vo(e[t]))&&(r&&(r+=" "),r+=n);else for(t in e)e[t]&&(r&&(r+=" "),r+=t);return r}var bo,xo=function(){for(var e,t,n=0,r="";n<arguments.length;)(e=arguments[n++])&&(t=vo(e))&&(r&&(r+=" "),r+=t);return r},wo=0;function ko(){return"react-tabs-"+wo++}function Oo(e){var t=0;return yo(e,(function(e){co(e)&&t++})),t}function Eo(){return(Eo=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}function _o(e){return e&&"getAttribute"in e}function So(e){return _o(e)&&"tab"===e.getAttribute("role")}function To(e){return _o(e)&&"true"===e.getAttribute("aria-disabled")}try{bo=!("undefined"==typeof window||!window.document||!window.document.activeElement)}catch(tr){bo=!1}var jo=function(e){var t,n;function r(){for(var t,n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];return(t=e.call.apply(e,[this].concat(r))||this).tabNodes=[],t.handleKeyDown=function(e){var n=t.props.direction;if(t.isTabFromContainer(e.target)){var r=t.props.selectedIndex,o=!1,i=!1;32!==e.keyCode&&13!==e.keyCode||(o=!0,i=!1,t.handleClick(e)),37===e.keyCode||38===e.keyCode?(r="rtl"===n?t.getNextTab(r):t.getPrevTab(r),o=!0,i=!0):39===e.keyCode||40===e.keyCode?(r="rtl"===n?t.getPrevTab(r):t.getNextTab(r),o=!0,i=!0):35===e.keyCode?(r=t.getLastTab(),o=!0,i=!0):36===e.keyCode&&(r=t.getFirstTab(),o=!0,i=!0),o&&e.preventDefault(),i&&t.setSelected(r,e)}},t.handleClick=function(e){var n=e.target;do{if(t.isTabFromContainer(n)){if(To(n))return;var r=[].slice.call(n.parentNode.children).filter(So).indexOf(n);return void t.setSelected(r,e)}}while(null!=(n=n.parentNode))},t}n=e,(t=r).prototype=Object.create(n.prototype),t.prototype.constructor=t,t.__proto__=n;var o=r.prototype;return o.setSelected=function(e,t){if(!(e<0||e>=this.getTabsCount())){var n=this.props;(0,n.onSelect)(e,n.selectedIndex,t)}},o.getNextTab=function(e){for(var t=this.getTabsCount(),n=e+1;n<t;n++)if(!To(this.getTab(n)))return n;for(var r=0;r<e;r++)if(!To(this.getTab(r)))return r;return e},o.getPrevTab=function(e){for(var t=e;t--;)if(!To(this.getTab(t)))return t;for(t=this.getTabsCount();t-- >e;)if(!To(this.getTab(t)))return t;return e},o.getFirstTab=function(){for(var e=this.getTabsCount(),t=0;t<e;t++)if(!To(this.getTab(t)))return t;return null},o.getLastTab=function(){for(var e=this.getTabsCount();e--;)if(!To(this.getTab(e)))return e;return null},o.getTabsCount=function(){return Oo(this.props.children)},o.getPanelsCount=function(){return function(e){var t=0;return yo(e,(function(e){po(e)&&t++})),t}(this.props.children)},o.getTab=function(e){return this.tabNodes["tabs-"+e]},o.getChildren=function(){var e=this,t=0,n=this.props,r=n.children,o=n.disabledTabClassName,s=n.focus,l=n.forceRenderTabPanel,c=n.selectedIndex,u=n.selectedTabClassName,p=n.selectedTabPanelClassName;this.tabIds=this.tabIds||[],this.panelIds=this.panelIds||[];for(var f=this.tabIds.length-this.getTabsCount();f++<0;)this.tabIds.push(ko()),this.panelIds.push(ko());return go(r,(function(n){var r=n;if(uo(n)){var f=0,d=!1;bo&&(d=a.a.Children.toArray(n.props.children).filter(co).some((function(t,n){return document.activeElement===e.getTab(n)}))),r=Object(i.cloneElement)(n,{children:go(n.props.children,(function(t){var n="tabs-"+f,r=c===f,a={tabRef:function(t){e.tabNodes[n]=t},id:e.tabIds[f],panelId:e.panelIds[f],selected:r,focus:r&&(s||d)};return u&&(a.selectedClassName=u),o&&(a.disabledClassName=o),f++,Object(i.cloneElement)(t,a)}))})}else if(po(n)){var h={id:e.panelIds[t],tabId:e.tabIds[t],selected:c===t};l&&(h.forceRender=l),p&&(h.selectedClassName=p),t++,r=Object(i.cloneElement)(n,h)}return r}))},o.isTabFromContainer=function(e){if(!So(e))return!1;var t=e.parentElement;do{if(t===this.node)return!0;if(t.getAttribute("data-tabs"))break;t=t.parentElement}while(t);return!1},o.render=function(){var e=this,t=this.props,n=(t.children,t.className),r=(t.disabledTabClassName,t.domRef),o=(t.focus,t.forceRenderTabPanel,t.onSelect,t.selectedIndex,t.selectedTabClassName,t.selectedTabPanelClassName,function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(t,["children","className","disabledTabClassName","domRef","focus","forceRenderTabPanel","onSelect","selectedIndex","selectedTabClassName","selectedTabPanelClassName"]));return a.a.createElement("div",Eo({},o,{className:xo(n),onClick:this.handleClick,onKeyDown:this.handleKeyDown,ref:function(t){e.node=t,r&&r(t)},"data-tabs":!0}),this.getChildren())},r}(i.Component);jo.defaultProps={className:"react-tabs",focus:!1},jo.propTypes={};var Ao=function(e){var t,n;function r(t){var n;return(n=e.call(this,t)||this).handleSelected=function(e,t,r){var o=n.props.onSelect,i=n.state.mode;if("function"!=typeof o||!1!==o(e,t,r)){var a={focus:"keydown"===r.type};1===i&&(a.selectedIndex=e),n.setState(a)}},n.state=r.copyPropsToState(n.props,{},t.defaultFocus),n}return n=e,(t=r).prototype=Object.create(n.prototype),t.prototype.constructor=t,t.__proto__=n,r.getDerivedStateFromProps=function(e,t){return r.copyPropsToState(e,t)},r.getModeFromProps=function(e){return null===e.selectedIndex?1:0},r.copyPropsToState=function(e,t,n){void 0===n&&(n=!1);var o={focus:n,mode:r.getModeFromProps(e)};if(1===o.mode){var i=Oo(e.children)-1,a=null;a=null!=t.selectedIndex?Math.min(t.selectedIndex,i):e.defaultIndex||0,o.selectedIndex=a}return o},r.prototype.render=function(){var e=this.props,t=e.children,n=(e.defaultIndex,e.defaultFocus,function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(e,["children","defaultIndex","defaultFocus"])),r=this.state,o=r.focus,i=r.selectedIndex;return n.focus=o,n.onSelect=this.handleSelected,null!=i&&(n.selectedIndex=i),a.a.createElement(jo,n,t)},r}(i.Component);function Co(){return(Co=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}Ao.defaultProps={defaultFocus:!1,forceRenderTabPanel:!1,selectedIndex:null,defaultIndex:null},Ao.propTypes={},Ao.tabsRole="Tabs";var Io=function(e){var t,n;function r(){return e.apply(this,arguments)||this}return n=e,(t=r).prototype=Object.create(n.prototype),t.prototype.constructor=t,t.__proto__=n,r.prototype.render=function(){var e=this.props,t=e.children,n=e.className,r=function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(e,["children","className"]);return a.a.createElement("ul",Co({},r,{className:xo(n),role:"tablist"}),t)},r}(i.Component);function Po(){return(Po=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}Io.defaultProps={className:"react-tabs__tab-list"},Io.propTypes={},Io.tabsRole="TabList";var Ro=function(e){var t,n;function r(){return e.apply(this,arguments)||this}n=e,(t=r).prototype=Object.create(n.prototype),t.prototype.constructor=t,t.__proto__=n;var o=r.prototype;return o.componentDidMount=function(){this.checkFocus()},o.componentDidUpdate=function(){this.checkFocus()},o.checkFocus=function(){var e=this.props,t=e.selected,n=e.focus;t&&n&&this.node.focus()},o.render=function(){var e,t=this,n=this.props,r=n.children,o=n.className,i=n.disabled,s=n.disabledClassName,l=(n.focus,n.id),c=n.panelId,u=n.selected,p=n.selectedClassName,f=n.tabIndex,d=n.tabRef,h=function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(n,["children","className","disabled","disabledClassName","focus","id","panelId","selected","selectedClassName","tabIndex","tabRef"]);return a.a.createElement("li",Po({},h,{className:xo(o,(e={},e[p]=u,e[s]=i,e)),ref:function(e){t.node=e,d&&d(e)},role:"tab",id:l,"aria-selected":u?"true":"false","aria-disabled":i?"true":"false","aria-controls":c,tabIndex:f||(u?"0":null)}),r)},r}(i.Component);function No(){return(No=Object.assign||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e}).apply(this,arguments)}Ro.defaultProps={className:"react-tabs__tab",disabledClassName:"react-tabs__tab--disabled",focus:!1,id:null,panelId:null,selected:!1,selectedClassName:"react-tabs__tab--selected"},Ro.propTypes={},Ro.tabsRole="Tab";var Lo=function(e){var t,n;function r(){return e.apply(this,arguments)||this}return n=e,(t=r).prototype=Object.create(n.prototype),t.prototype.constructor=t,t.__proto__=n,r.prototype.render=function(){var e,t=this.props,n=t.children,r=t.className,o=t.forceRender,i=t.id,s=t.selected,l=t.selectedClassName,c=t.tabId,u=function(e,t){if(null==e)return{};var n,r,o={},i=Object.keys(e);for(r=0;r<i.length;r++)n=i[r],t.indexOf(n)>=0||(o[n]=e[n]);return o}(t,["children","className","forceRender","id","selected","selectedClassName","tabId"]);return a.a.createElement("div",No({},u,{className:xo(r,(e={},e[l]=s,e)),role:"tabpanel",id:i,"aria-labelledby":c}),o||s?n:null)},r}(i.Component);Lo.defaultProps={className:"react-tabs__tab-panel",forceRender:!1,selectedClassName:"react-tabs__tab-panel--selected"},Lo.propTypes={},Lo.tabsRole="TabPanel";var Mo,Do,Fo,zo,Uo,Bo,$o=Se(Ao)(Mo||(Mo=Object(o.__makeTemplateObject)(["\n  > ul {\n    list-style: none;\n    padding: 0;\n    margin: 0;\n    margin: 0 -5px;\n\n    > li {\n      padding: 5px 10px;\n      display: inline-block;\n\n      background-color: ",";\n      border-bottom: 1px solid rgba(0, 0, 0, 0.5);\n      cursor: pointer;\n      text-align: center;\n      outline: none;\n      color: ",";\n      margin: 0\n        ",";\n      border: 1px solid ",";\n      border-radius: 5px;\n      min-width: 60px;\n      font-size: 0.9em;\n      font-weight: bold;\n\n      &.react-tabs__tab--selected {\n        color: ",";\n        background: ",";\n        &:focus {\n          outline: auto;\n        }\n      }\n\n      &:only-child {\n        flex: none;\n        min-width: 100px;\n      }\n\n      &.tab-success {\n        color: ",";\n      }\n\n      &.tab-redirect {\n        color: ",";\n      }\n\n      &.tab-info {\n        color: ",";\n      }\n\n      &.tab-error {\n        color: ",";\n      }\n    }\n  }\n  > .react-tabs__tab-panel {\n    background: ",";\n    & > div,\n    & > pre {\n      padding: ","px;\n      margin: 0;\n    }\n\n    & > div > pre {\n      padding: 0;\n    }\n  }\n"],["\n  > ul {\n    list-style: none;\n    padding: 0;\n    margin: 0;\n    margin: 0 -5px;\n\n    > li {\n      padding: 5px 10px;\n      display: inline-block;\n\n      background-color: ",";\n      border-bottom: 1px solid rgba(0, 0, 0, 0.5);\n      cursor: pointer;\n      text-align: center;\n      outline: none;\n      color: ",";\n      margin: 0\n        ",";\n      border: 1px solid ",";\n      border-radius: 5px;\n      min-width: 60px;\n      font-size: 0.9em;\n      font-weight: bold;\n\n      &.react-tabs__tab--selected {\n        color: ",";\n        background: ",";\n        &:focus {\n          outline: auto;\n        }\n      }\n\n      &:only-child {\n        flex: none;\n        min-width: 100px;\n      }\n\n      &.tab-success {\n        color: ",";\n      }\n\n      &.tab-redirect {\n        color: ",";\n      }\n\n      &.tab-info {\n        color: ",";\n      }\n\n      &.tab-error {\n        color: ",";\n      }\n    }\n  }\n  > .react-tabs__tab-panel {\n    background: ",";\n    & > div,\n    & > pre {\n      padding: ","px;\n      margin: 0;\n    }\n\n    & > div > pre {\n      padding: 0;\n    }\n  }\n"])),(function(e){return e.theme.codeBlock.backgroundColor}),(function(e){var t=e.theme;return W(t.colors.tonalOffset,t.rightPanel.textColor)}),(function(e){var t=e.theme;return t.spacing.unit+"px "+t.spacing.unit+"px "+t.spacing.unit+"px"}),(function(e){var t=e.theme;return W(.05,t.codeBlock.backgroundColor)}),(function(e){return e.theme.colors.text.primary}),(function(e){return e.theme.rightPanel.textColor}),(function(e){return e.theme.colors.responses.success.color}),(function(e){return e.theme.colors.responses.redirect.color}),(function(e){return e.theme.colors.responses.info.color}),(function(e){return e.theme.colors.responses.error.color}),(function(e){return e.theme.codeBlock.backgroundColor}),(function(e){return 4*e.theme.spacing.unit})),Wo=(Se($o)(Do||(Do=Object(o.__makeTemplateObject)(["\n  > ul {\n    display: block;\n    > li {\n      padding: 2px 5px;\n      min-width: auto;\n      margin: 0 15px 0 0;\n      font-size: 13px;\n      font-weight: normal;\n      border-bottom: 1px dashed;\n      color: ",";\n      border-radius: 0;\n      background: none;\n\n      &:last-child {\n        margin-right: 0;\n      }\n\n      &.react-tabs__tab--selected {\n        color: ",";\n        background: none;\n      }\n    }\n  }\n  > .react-tabs__tab-panel {\n    & > div,\n    & > pre {\n      padding: ","px 0;\n    }\n  }\n"],["\n  > ul {\n    display: block;\n    > li {\n      padding: 2px 5px;\n      min-width: auto;\n      margin: 0 15px 0 0;\n      font-size: 13px;\n      font-weight: normal;\n      border-bottom: 1px dashed;\n      color: ",";\n      border-radius: 0;\n      background: none;\n\n      &:last-child {\n        margin-right: 0;\n      }\n\n      &.react-tabs__tab--selected {\n        color: ",";\n        background: none;\n      }\n    }\n  }\n  > .react-tabs__tab-panel {\n    & > div,\n    & > pre {\n      padding: ","px 0;\n    }\n  }\n"])),(function(e){var t=e.theme;return W(t.colors.tonalOffset,t.rightPanel.textColor)}),(function(e){return e.theme.rightPanel.textColor}),(function(e){return 2*e.theme.spacing.unit})),Se.div(Fo||(Fo=Object(o.__makeTemplateObject)(["\n  /**\n  * Based on prism-dark.css\n  */\n\n  code[class*='language-'],\n  pre[class*='language-'] {\n    /* color: white;\n    background: none; */\n    text-shadow: 0 -0.1em 0.2em black;\n    text-align: left;\n    white-space: pre;\n    word-spacing: normal;\n    word-break: normal;\n    word-wrap: normal;\n    line-height: 1.5;\n\n    -moz-tab-size: 4;\n    -o-tab-size: 4;\n    tab-size: 4;\n\n    -webkit-hyphens: none;\n    -moz-hyphens: none;\n    -ms-hyphens: none;\n    hyphens: none;\n  }\n\n  @media print {\n    code[class*='language-'],\n    pre[class*='language-'] {\n      text-shadow: none;\n    }\n  }\n\n  /* Code blocks */\n  pre[class*='language-'] {\n    padding: 1em;\n    margin: 0.5em 0;\n    overflow: auto;\n  }\n\n  .token.comment,\n  .token.prolog,\n  .token.doctype,\n  .token.cdata {\n    color: hsl(30, 20%, 50%);\n  }\n\n  .token.punctuation {\n    opacity: 0.7;\n  }\n\n  .namespace {\n    opacity: 0.7;\n  }\n\n  .token.property,\n  .token.tag,\n  .token.number,\n  .token.constant,\n  .token.symbol {\n    color: #4a8bb3;\n  }\n\n  .token.boolean {\n    color: firebrick;\n  }\n\n  .token.selector,\n  .token.attr-name,\n  .token.string,\n  .token.char,\n  .token.builtin,\n  .token.inserted {\n    color: #a0fbaa;\n    & + a,\n    & + a:visited {\n      color: #4ed2ba;\n      text-decoration: underline;\n    }\n  }\n\n  .token.property.string {\n    color: white;\n  }\n\n  .token.operator,\n  .token.entity,\n  .token.url,\n  .token.variable {\n    color: hsl(40, 90%, 60%);\n  }\n\n  .token.atrule,\n  .token.attr-value,\n  .token.keyword {\n    color: hsl(350, 40%, 70%);\n  }\n\n  .token.regex,\n  .token.important {\n    color: #e90;\n  }\n\n  .token.important,\n  .token.bold {\n    font-weight: bold;\n  }\n  .token.italic {\n    font-style: italic;\n  }\n\n  .token.entity {\n    cursor: help;\n  }\n\n  .token.deleted {\n    color: red;\n  }\n\n  ",";\n"],["\n  /**\n  * Based on prism-dark.css\n  */\n\n  code[class*='language-'],\n  pre[class*='language-'] {\n    /* color: white;\n    background: none; */\n    text-shadow: 0 -0.1em 0.2em black;\n    text-align: left;\n    white-space: pre;\n    word-spacing: normal;\n    word-break: normal;\n    word-wrap: normal;\n    line-height: 1.5;\n\n    -moz-tab-size: 4;\n    -o-tab-size: 4;\n    tab-size: 4;\n\n    -webkit-hyphens: none;\n    -moz-hyphens: none;\n    -ms-hyphens: none;\n    hyphens: none;\n  }\n\n  @media print {\n    code[class*='language-'],\n    pre[class*='language-'] {\n      text-shadow: none;\n    }\n  }\n\n  /* Code blocks */\n  pre[class*='language-'] {\n    padding: 1em;\n    margin: 0.5em 0;\n    overflow: auto;\n  }\n\n  .token.comment,\n  .token.prolog,\n  .token.doctype,\n  .token.cdata {\n    color: hsl(30, 20%, 50%);\n  }\n\n  .token.punctuation {\n    opacity: 0.7;\n  }\n\n  .namespace {\n    opacity: 0.7;\n  }\n\n  .token.property,\n  .token.tag,\n  .token.number,\n  .token.constant,\n  .token.symbol {\n    color: #4a8bb3;\n  }\n\n  .token.boolean {\n    color: firebrick;\n  }\n\n  .token.selector,\n  .token.attr-name,\n  .token.string,\n  .token.char,\n  .token.builtin,\n  .token.inserted {\n    color: #a0fbaa;\n    & + a,\n    & + a:visited {\n      color: #4ed2ba;\n      text-decoration: underline;\n    }\n  }\n\n  .token.property.string {\n    color: white;\n  }\n\n  .token.operator,\n  .token.entity,\n  .token.url,\n  .token.variable {\n    color: hsl(40, 90%, 60%);\n  }\n\n  .token.atrule,\n  .token.attr-value,\n  .token.keyword {\n    color: hsl(350, 40%, 70%);\n  }\n\n  .token.regex,\n  .token.important {\n    color: #e90;\n  }\n\n  .token.important,\n  .token.bold {\n    font-weight: bold;\n  }\n  .token.italic {\n    font-style: italic;\n  }\n\n  .token.entity {\n    cursor: help;\n  }\n\n  .token.deleted {\n    color: red;\n  }\n\n  ",";\n"])),Te("Prism"))),qo=Se.div(zo||(zo=Object(o.__makeTemplateObject)(["\n  opacity: 0.4;\n  transition: opacity 0.3s ease;\n  text-align: right;\n  &:focus-within {\n    opacity: 1;\n  }\n  > button {\n    background-color: transparent;\n    border: 0;\n    color: inherit;\n    padding: 2px 10px;\n    font-family: ",";\n    font-size: ",";\n    line-height: ",";\n    cursor: pointer;\n    outline: 0;\n\n    :hover,\n    :focus {\n      background: rgba(255, 255, 255, 0.1);\n    }\n  }\n"],["\n  opacity: 0.4;\n  transition: opacity 0.3s ease;\n  text-align: right;\n  &:focus-within {\n    opacity: 1;\n  }\n  > button {\n    background-color: transparent;\n    border: 0;\n    color: inherit;\n    padding: 2px 10px;\n    font-family: ",";\n    font-size: ",";\n    line-height: ",";\n    cursor: pointer;\n    outline: 0;\n\n    :hover,\n    :focus {\n      background: rgba(255, 255, 255, 0.1);\n    }\n  }\n"])),(function(e){return e.theme.typography.fontFamily}),(function(e){return e.theme.typography.fontSize}),(function(e){return e.theme.typography.lineHeight})),Ho=Se.div(Uo||(Uo=Object(o.__makeTemplateObject)(["\n  &:hover "," {\n    opacity: 1;\n  }\n"],["\n  &:hover "," {\n    opacity: 1;\n  }\n"])),qo),Vo=Se(Wo.withComponent("pre"))(Bo||(Bo=Object(o.__makeTemplateObject)(["\n  font-family: ",";\n  font-size: ",";\n  overflow-x: auto;\n  margin: 0;\n\n  white-space: ",";\n"],["\n  font-family: ",";\n  font-size: ",";\n  overflow-x: auto;\n  margin: 0;\n\n  white-space: ",";\n"])),(function(e){return e.theme.typography.code.fontFamily}),(function(e){return e.theme.typography.code.fontSize}),(function(e){return e.theme.typography.code.wrap?"pre-wrap":"pre"}));
+/*!
+ * perfect-scrollbar v1.5.0
+ * Copyright 2020 Hyunje Jun, MDBootstrap and Contributors
+ * Licensed under MIT
+ */
+function Yo(e){return getComputedStyle(e)}function Go(e,t){for(var n in t){var r=t[n];"number"==typeof r&&(r+="px"),e.style[n]=r}return e}function Qo(e){var t=document.createElement("div");return t.className=e,t}var Xo="undefined"!=typeof Element&&(Element.prototype.matches||Element.prototype.webkitMatchesSelector||Element.prototype.mozMatchesSelector||Element.prototype.msMatchesSelector);function Ko(e,t){if(!Xo)throw new Error("No element matching method supported");return Xo.call(e,t)}function Jo(e){e.remove?e.remove():e.parentNode&&e.parentNode.removeChild(e)}function Zo(e,t){return Array.prototype.filter.call(e.children,(function(e){return Ko(e,t)}))}var ei="ps",ti="ps__rtl",ni={thumb:function(e){return"ps__thumb-"+e},rail:function(e){return"ps__rail-"+e},consuming:"ps__child--consume"},ri={focus:"ps--focus",clicking:"ps--clicking",active:function(e){return"ps--active-"+e},scrolling:function(e){return"ps--scrolling-"+e}},oi={x:null,y:null};function ii(e,t){var n=e.element.classList,r=ri.scrolling(t);n.contains(r)?clearTimeout(oi[t]):n.add(r)}function ai(e,t){oi[t]=setTimeout((function(){return e.isAlive&&e.element.classList.remove(ri.scrolling(t))}),e.settings.scrollingThreshold)}var si=function(e){this.element=e,this.handlers={}},li={isEmpty:{configurable:!0}};si.prototype.bind=function(e,t){void 0===this.handlers[e]&&(this.handlers[e]=[]),this.handlers[e].push(t),this.element.addEventListener(e,t,!1)},si.prototype.unbind=function(e,t){var n=this;this.handlers[e]=this.handlers[e].filter((function(r){return!(!t||r===t)||(n.element.removeEventListener(e,r,!1),!1)}))},si.prototype.unbindAll=function(){for(var e in this.handlers)this.unbind(e)},li.isEmpty.get=function(){var e=this;return Object.keys(this.handlers).every((function(t){return 0===e.handlers[t].length}))},Object.defineProperties(si.prototype,li);var ci=function(){this.eventElements=[]};function ui(e){if("function"==typeof window.CustomEvent)return new CustomEvent(e);var t=document.createEvent("CustomEvent");return t.initCustomEvent(e,!1,!1,void 0),t}function pi(e,t,n,r,o){var i;if(void 0===r&&(r=!0),void 0===o&&(o=!1),"top"===t)i=["contentHeight","containerHeight","scrollTop","y","up","down"];else{if("left"!==t)throw new Error("A proper axis should be provided");i=["contentWidth","containerWidth","scrollLeft","x","left","right"]}!function(e,t,n,r,o){var i=n[0],a=n[1],s=n[2],l=n[3],c=n[4],u=n[5];void 0===r&&(r=!0);void 0===o&&(o=!1);var p=e.element;e.reach[l]=null,p[s]<1&&(e.reach[l]="start");p[s]>e[i]-e[a]-1&&(e.reach[l]="end");t&&(p.dispatchEvent(ui("ps-scroll-"+l)),t<0?p.dispatchEvent(ui("ps-scroll-"+c)):t>0&&p.dispatchEvent(ui("ps-scroll-"+u)),r&&function(e,t){ii(e,t),ai(e,t)}(e,l));e.reach[l]&&(t||o)&&p.dispatchEvent(ui("ps-"+l+"-reach-"+e.reach[l]))}(e,n,i,r,o)}function fi(e){return parseInt(e,10)||0}ci.prototype.eventElement=function(e){var t=this.eventElements.filter((function(t){return t.element===e}))[0];return t||(t=new si(e),this.eventElements.push(t)),t},ci.prototype.bind=function(e,t,n){this.eventElement(e).bind(t,n)},ci.prototype.unbind=function(e,t,n){var r=this.eventElement(e);r.unbind(t,n),r.isEmpty&&this.eventElements.splice(this.eventElements.indexOf(r),1)},ci.prototype.unbindAll=function(){this.eventElements.forEach((function(e){return e.unbindAll()})),this.eventElements=[]},ci.prototype.once=function(e,t,n){var r=this.eventElement(e),o=function(e){r.unbind(t,o),n(e)};r.bind(t,o)};var di={isWebKit:"undefined"!=typeof document&&"WebkitAppearance"in document.documentElement.style,supportsTouch:"undefined"!=typeof window&&("ontouchstart"in window||"maxTouchPoints"in window.navigator&&window.navigator.maxTouchPoints>0||window.DocumentTouch&&document instanceof window.DocumentTouch),supportsIePointer:"undefined"!=typeof navigator&&navigator.msMaxTouchPoints,isChrome:"undefined"!=typeof navigator&&/Chrome/i.test(navigator&&navigator.userAgent)};function hi(e){var t=e.element,n=Math.floor(t.scrollTop),r=t.getBoundingClientRect();e.containerWidth=Math.ceil(r.width),e.containerHeight=Math.ceil(r.height),e.contentWidth=t.scrollWidth,e.contentHeight=t.scrollHeight,t.contains(e.scrollbarXRail)||(Zo(t,ni.rail("x")).forEach((function(e){return Jo(e)})),t.appendChild(e.scrollbarXRail)),t.contains(e.scrollbarYRail)||(Zo(t,ni.rail("y")).forEach((function(e){return Jo(e)})),t.appendChild(e.scrollbarYRail)),!e.settings.suppressScrollX&&e.containerWidth+e.settings.scrollXMarginOffset<e.contentWidth?(e.scrollbarXActive=!0,e.railXWidth=e.containerWidth-e.railXMarginWidth,e.railXRatio=e.containerWidth/e.railXWidth,e.scrollbarXWidth=mi(e,fi(e.railXWidth*e.containerWidth/e.contentWidth)),e.scrollbarXLeft=fi((e.negativeScrollAdjustment+t.scrollLeft)*(e.railXWidth-e.scrollbarXWidth)/(e.contentWidth-e.containerWidth))):e.scrollbarXActive=!1,!e.settings.suppressScrollY&&e.containerHeight+e.settings.scrollYMarginOffset<e.contentHeight?(e.scrollbarYActive=!0,e.railYHeight=e.containerHeight-e.railYMarginHeight,e.railYRatio=e.containerHeight/e.railYHeight,e.scrollbarYHeight=mi(e,fi(e.railYHeight*e.containerHeight/e.contentHeight)),e.scrollbarYTop=fi(n*(e.railYHeight-e.scrollbarYHeight)/(e.contentHeight-e.containerHeight))):e.scrollbarYActive=!1,e.scrollbarXLeft>=e.railXWidth-e.scrollbarXWidth&&(e.scrollbarXLeft=e.railXWidth-e.scrollbarXWidth),e.scrollbarYTop>=e.railYHeight-e.scrollbarYHeight&&(e.scrollbarYTop=e.railYHeight-e.scrollbarYHeight),function(e,t){var n={width:t.railXWidth},r=Math.floor(e.scrollTop);t.isRtl?n.left=t.negativeScrollAdjustment+e.scrollLeft+t.containerWidth-t.contentWidth:n.left=e.scrollLeft;t.isScrollbarXUsingBottom?n.bottom=t.scrollbarXBottom-r:n.top=t.scrollbarXTop+r;Go(t.scrollbarXRail,n);var o={top:r,height:t.railYHeight};t.isScrollbarYUsingRight?t.isRtl?o.right=t.contentWidth-(t.negativeScrollAdjustment+e.scrollLeft)-t.scrollbarYRight-t.scrollbarYOuterWidth-9:o.right=t.scrollbarYRight-e.scrollLeft:t.isRtl?o.left=t.negativeScrollAdjustment+e.scrollLeft+2*t.containerWidth-t.contentWidth-t.scrollbarYLeft-t.scrollbarYOuterWidth:o.left=t.scrollbarYLeft+e.scrollLeft;Go(t.scrollbarYRail,o),Go(t.scrollbarX,{left:t.scrollbarXLeft,width:t.scrollbarXWidth-t.railBorderXWidth}),Go(t.scrollbarY,{top:t.scrollbarYTop,height:t.scrollbarYHeight-t.railBorderYWidth})}(t,e),e.scrollbarXActive?t.classList.add(ri.active("x")):(t.classList.remove(ri.active("x")),e.scrollbarXWidth=0,e.scrollbarXLeft=0,t.scrollLeft=!0===e.isRtl?e.contentWidth:0),e.scrollbarYActive?t.classList.add(ri.active("y")):(t.classList.remove(ri.active("y")),e.scrollbarYHeight=0,e.scrollbarYTop=0,t.scrollTop=0)}function mi(e,t){return e.settings.minScrollbarLength&&(t=Math.max(t,e.settings.minScrollbarLength)),e.settings.maxScrollbarLength&&(t=Math.min(t,e.settings.maxScrollbarLength)),t}function gi(e,t){var n=t[0],r=t[1],o=t[2],i=t[3],a=t[4],s=t[5],l=t[6],c=t[7],u=t[8],p=e.element,f=null,d=null,h=null;function m(t){t.touches&&t.touches[0]&&(t[o]=t.touches[0].pageY),p[l]=f+h*(t[o]-d),ii(e,c),hi(e),t.stopPropagation(),t.preventDefault()}function g(){ai(e,c),e[u].classList.remove(ri.clicking),e.event.unbind(e.ownerDocument,"mousemove",m)}function y(t,a){f=p[l],a&&t.touches&&(t[o]=t.touches[0].pageY),d=t[o],h=(e[r]-e[n])/(e[i]-e[s]),a?e.event.bind(e.ownerDocument,"touchmove",m):(e.event.bind(e.ownerDocument,"mousemove",m),e.event.once(e.ownerDocument,"mouseup",g),t.preventDefault()),e[u].classList.add(ri.clicking),t.stopPropagation()}e.event.bind(e[a],"mousedown",(function(e){y(e)})),e.event.bind(e[a],"touchstart",(function(e){y(e,!0)}))}var yi={"click-rail":function(e){e.element,e.event.bind(e.scrollbarY,"mousedown",(function(e){return e.stopPropagation()})),e.event.bind(e.scrollbarYRail,"mousedown",(function(t){var n=t.pageY-window.pageYOffset-e.scrollbarYRail.getBoundingClientRect().top>e.scrollbarYTop?1:-1;e.element.scrollTop+=n*e.containerHeight,hi(e),t.stopPropagation()})),e.event.bind(e.scrollbarX,"mousedown",(function(e){return e.stopPropagation()})),e.event.bind(e.scrollbarXRail,"mousedown",(function(t){var n=t.pageX-window.pageXOffset-e.scrollbarXRail.getBoundingClientRect().left>e.scrollbarXLeft?1:-1;e.element.scrollLeft+=n*e.containerWidth,hi(e),t.stopPropagation()}))},"drag-thumb":function(e){gi(e,["containerWidth","contentWidth","pageX","railXWidth","scrollbarX","scrollbarXWidth","scrollLeft","x","scrollbarXRail"]),gi(e,["containerHeight","contentHeight","pageY","railYHeight","scrollbarY","scrollbarYHeight","scrollTop","y","scrollbarYRail"])},keyboard:function(e){var t=e.element;e.event.bind(e.ownerDocument,"keydown",(function(n){if(!(n.isDefaultPrevented&&n.isDefaultPrevented()||n.defaultPrevented)&&(Ko(t,":hover")||Ko(e.scrollbarX,":focus")||Ko(e.scrollbarY,":focus"))){var r,o=document.activeElement?document.activeElement:e.ownerDocument.activeElement;if(o){if("IFRAME"===o.tagName)o=o.contentDocument.activeElement;else for(;o.shadowRoot;)o=o.shadowRoot.activeElement;if(Ko(r=o,"input,[contenteditable]")||Ko(r,"select,[contenteditable]")||Ko(r,"textarea,[contenteditable]")||Ko(r,"button,[contenteditable]"))return}var i=0,a=0;switch(n.which){case 37:i=n.metaKey?-e.contentWidth:n.altKey?-e.containerWidth:-30;break;case 38:a=n.metaKey?e.contentHeight:n.altKey?e.containerHeight:30;break;case 39:i=n.metaKey?e.contentWidth:n.altKey?e.containerWidth:30;break;case 40:a=n.metaKey?-e.contentHeight:n.altKey?-e.containerHeight:-30;break;case 32:a=n.shiftKey?e.containerHeight:-e.containerHeight;break;case 33:a=e.containerHeight;break;case 34:a=-e.containerHeight;break;case 36:a=e.contentHeight;break;case 35:a=-e.contentHeight;break;default:return}e.settings.suppressScrollX&&0!==i||e.settings.suppressScrollY&&0!==a||(t.scrollTop-=a,t.scrollLeft+=i,hi(e),function(n,r){var o=Math.floor(t.scrollTop);if(0===n){if(!e.scrollbarYActive)return!1;if(0===o&&r>0||o>=e.contentHeight-e.containerHeight&&r<0)return!e.settings.wheelPropagation}var i=t.scrollLeft;if(0===r){if(!e.scrollbarXActive)return!1;if(0===i&&n<0||i>=e.contentWidth-e.containerWidth&&n>0)return!e.settings.wheelPropagation}return!0}(i,a)&&n.preventDefault())}}))},wheel:function(e){var t=e.element;function n(n){var r=function(e){var t=e.deltaX,n=-1*e.deltaY;return void 0!==t&&void 0!==n||(t=-1*e.wheelDeltaX/6,n=e.wheelDeltaY/6),e.deltaMode&&1===e.deltaMode&&(t*=10,n*=10),t!=t&&n!=n&&(t=0,n=e.wheelDelta),e.shiftKey?[-n,-t]:[t,n]}(n),o=r[0],i=r[1];if(!function(e,n,r){if(!di.isWebKit&&t.querySelector("select:focus"))return!0;if(!t.contains(e))return!1;for(var o=e;o&&o!==t;){if(o.classList.contains(ni.consuming))return!0;var i=Yo(o);if(r&&i.overflowY.match(/(scroll|auto)/)){var a=o.scrollHeight-o.clientHeight;if(a>0&&(o.scrollTop>0&&r<0||o.scrollTop<a&&r>0))return!0}if(n&&i.overflowX.match(/(scroll|auto)/)){var s=o.scrollWidth-o.clientWidth;if(s>0&&(o.scrollLeft>0&&n<0||o.scrollLeft<s&&n>0))return!0}o=o.parentNode}return!1}(n.target,o,i)){var a=!1;e.settings.useBothWheelAxes?e.scrollbarYActive&&!e.scrollbarXActive?(i?t.scrollTop-=i*e.settings.wheelSpeed:t.scrollTop+=o*e.settings.wheelSpeed,a=!0):e.scrollbarXActive&&!e.scrollbarYActive&&(o?t.scrollLeft+=o*e.settings.wheelSpeed:t.scrollLeft-=i*e.settings.wheelSpeed,a=!0):(t.scrollTop-=i*e.settings.wheelSpeed,t.scrollLeft+=o*e.settings.wheelSpeed),hi(e),(a=a||function(n,r){var o=Math.floor(t.scrollTop),i=0===t.scrollTop,a=o+t.offsetHeight===t.scrollHeight,s=0===t.scrollLeft,l=t.scrollLeft+t.offsetWidth===t.scrollWidth;return!(Math.abs(r)>Math.abs(n)?i||a:s||l)||!e.settings.wheelPropagation}(o,i))&&!n.ctrlKey&&(n.stopPropagation(),n.preventDefault())}}void 0!==window.onwheel?e.event.bind(t,"wheel",n):void 0!==window.onmousewheel&&e.event.bind(t,"mousewheel",n)},touch:function(e){if(di.supportsTouch||di.supportsIePointer){var t=e.element,n={},r=0,o={},i=null;di.supportsTouch?(e.event.bind(t,"touchstart",c),e.event.bind(t,"touchmove",u),e.event.bind(t,"touchend",p)):di.supportsIePointer&&(window.PointerEvent?(e.event.bind(t,"pointerdown",c),e.event.bind(t,"pointermove",u),e.event.bind(t,"pointerup",p)):window.MSPointerEvent&&(e.event.bind(t,"MSPointerDown",c),e.event.bind(t,"MSPointerMove",u),e.event.bind(t,"MSPointerUp",p)))}function a(n,r){t.scrollTop-=r,t.scrollLeft-=n,hi(e)}function s(e){return e.targetTouches?e.targetTouches[0]:e}function l(e){return(!e.pointerType||"pen"!==e.pointerType||0!==e.buttons)&&(!(!e.targetTouches||1!==e.targetTouches.length)||!(!e.pointerType||"mouse"===e.pointerType||e.pointerType===e.MSPOINTER_TYPE_MOUSE))}function c(e){if(l(e)){var t=s(e);n.pageX=t.pageX,n.pageY=t.pageY,r=(new Date).getTime(),null!==i&&clearInterval(i)}}function u(i){if(l(i)){var c=s(i),u={pageX:c.pageX,pageY:c.pageY},p=u.pageX-n.pageX,f=u.pageY-n.pageY;if(function(e,n,r){if(!t.contains(e))return!1;for(var o=e;o&&o!==t;){if(o.classList.contains(ni.consuming))return!0;var i=Yo(o);if(r&&i.overflowY.match(/(scroll|auto)/)){var a=o.scrollHeight-o.clientHeight;if(a>0&&(o.scrollTop>0&&r<0||o.scrollTop<a&&r>0))return!0}if(n&&i.overflowX.match(/(scroll|auto)/)){var s=o.scrollWidth-o.clientWidth;if(s>0&&(o.scrollLeft>0&&n<0||o.scrollLeft<s&&n>0))return!0}o=o.parentNode}return!1}(i.target,p,f))return;a(p,f),n=u;var d=(new Date).getTime(),h=d-r;h>0&&(o.x=p/h,o.y=f/h,r=d),function(n,r){var o=Math.floor(t.scrollTop),i=t.scrollLeft,a=Math.abs(n),s=Math.abs(r);if(s>a){if(r<0&&o===e.contentHeight-e.containerHeight||r>0&&0===o)return 0===window.scrollY&&r>0&&di.isChrome}else if(a>s&&(n<0&&i===e.contentWidth-e.containerWidth||n>0&&0===i))return!0;return!0}(p,f)&&i.preventDefault()}}function p(){e.settings.swipeEasing&&(clearInterval(i),i=setInterval((function(){e.isInitialized?clearInterval(i):o.x||o.y?Math.abs(o.x)<.01&&Math.abs(o.y)<.01?clearInterval(i):(a(30*o.x,30*o.y),o.x*=.8,o.y*=.8):clearInterval(i)}),10))}}},vi=function(e,t){var n=this;if(void 0===t&&(t={}),"string"==typeof e&&(e=document.querySelector(e)),!e||!e.nodeName)throw new Error("no element is specified to initialize PerfectScrollbar");for(var r in this.element=e,e.classList.add(ei),this.settings={handlers:["click-rail","drag-thumb","keyboard","wheel","touch"],maxScrollbarLength:null,minScrollbarLength:null,scrollingThreshold:1e3,scrollXMarginOffset:0,scrollYMarginOffset:0,suppressScrollX:!1,suppressScrollY:!1,swipeEasing:!0,useBothWheelAxes:!1,wheelPropagation:!0,wheelSpeed:1},t)this.settings[r]=t[r];this.containerWidth=null,this.containerHeight=null,this.contentWidth=null,this.contentHeight=null;var o,i,a=function(){return e.classList.add(ri.focus)},s=function(){return e.classList.remove(ri.focus)};this.isRtl="rtl"===Yo(e).direction,!0===this.isRtl&&e.classList.add(ti),this.isNegativeScroll=(i=e.scrollLeft,e.scrollLeft=-1,o=e.scrollLeft<0,e.scrollLeft=i,o),this.negativeScrollAdjustment=this.isNegativeScroll?e.scrollWidth-e.clientWidth:0,this.event=new ci,this.ownerDocument=e.ownerDocument||document,this.scrollbarXRail=Qo(ni.rail("x")),e.appendChild(this.scrollbarXRail),this.scrollbarX=Qo(ni.thumb("x")),this.scrollbarXRail.appendChild(this.scrollbarX),this.scrollbarX.setAttribute("tabindex",0),this.event.bind(this.scrollbarX,"focus",a),this.event.bind(this.scrollbarX,"blur",s),this.scrollbarXActive=null,this.scrollbarXWidth=null,this.scrollbarXLeft=null;var l=Yo(this.scrollbarXRail);this.scrollbarXBottom=parseInt(l.bottom,10),isNaN(this.scrollbarXBottom)?(this.isScrollbarXUsingBottom=!1,this.scrollbarXTop=fi(l.top)):this.isScrollbarXUsingBottom=!0,this.railBorderXWidth=fi(l.borderLeftWidth)+fi(l.borderRightWidth),Go(this.scrollbarXRail,{display:"block"}),this.railXMarginWidth=fi(l.marginLeft)+fi(l.marginRight),Go(this.scrollbarXRail,{display:""}),this.railXWidth=null,this.railXRatio=null,this.scrollbarYRail=Qo(ni.rail("y")),e.appendChild(this.scrollbarYRail),this.scrollbarY=Qo(ni.thumb("y")),this.scrollbarYRail.appendChild(this.scrollbarY),this.scrollbarY.setAttribute("tabindex",0),this.event.bind(this.scrollbarY,"focus",a),this.event.bind(this.scrollbarY,"blur",s),this.scrollbarYActive=null,this.scrollbarYHeight=null,this.scrollbarYTop=null;var c=Yo(this.scrollbarYRail);this.scrollbarYRight=parseInt(c.right,10),isNaN(this.scrollbarYRight)?(this.isScrollbarYUsingRight=!1,this.scrollbarYLeft=fi(c.left)):this.isScrollbarYUsingRight=!0,this.scrollbarYOuterWidth=this.isRtl?function(e){var t=Yo(e);return fi(t.width)+fi(t.paddingLeft)+fi(t.paddingRight)+fi(t.borderLeftWidth)+fi(t.borderRightWidth)}(this.scrollbarY):null,this.railBorderYWidth=fi(c.borderTopWidth)+fi(c.borderBottomWidth),Go(this.scrollbarYRail,{display:"block"}),this.railYMarginHeight=fi(c.marginTop)+fi(c.marginBottom),Go(this.scrollbarYRail,{display:""}),this.railYHeight=null,this.railYRatio=null,this.reach={x:e.scrollLeft<=0?"start":e.scrollLeft>=this.contentWidth-this.containerWidth?"end":null,y:e.scrollTop<=0?"start":e.scrollTop>=this.contentHeight-this.containerHeight?"end":null},this.isAlive=!0,this.settings.handlers.forEach((function(e){return yi[e](n)})),this.lastScrollTop=Math.floor(e.scrollTop),this.lastScrollLeft=e.scrollLeft,this.event.bind(this.element,"scroll",(function(e){return n.onScroll(e)})),hi(this)};vi.prototype.update=function(){this.isAlive&&(this.negativeScrollAdjustment=this.isNegativeScroll?this.element.scrollWidth-this.element.clientWidth:0,Go(this.scrollbarXRail,{display:"block"}),Go(this.scrollbarYRail,{display:"block"}),this.railXMarginWidth=fi(Yo(this.scrollbarXRail).marginLeft)+fi(Yo(this.scrollbarXRail).marginRight),this.railYMarginHeight=fi(Yo(this.scrollbarYRail).marginTop)+fi(Yo(this.scrollbarYRail).marginBottom),Go(this.scrollbarXRail,{display:"none"}),Go(this.scrollbarYRail,{display:"none"}),hi(this),pi(this,"top",0,!1,!0),pi(this,"left",0,!1,!0),Go(this.scrollbarXRail,{display:""}),Go(this.scrollbarYRail,{display:""}))},vi.prototype.onScroll=function(e){this.isAlive&&(hi(this),pi(this,"top",this.element.scrollTop-this.lastScrollTop),pi(this,"left",this.element.scrollLeft-this.lastScrollLeft),this.lastScrollTop=Math.floor(this.element.scrollTop),this.lastScrollLeft=this.element.scrollLeft)},vi.prototype.destroy=function(){this.isAlive&&(this.event.unbindAll(),Jo(this.scrollbarX),Jo(this.scrollbarY),Jo(this.scrollbarXRail),Jo(this.scrollbarYRail),this.removePsClasses(),this.element=null,this.scrollbarX=null,this.scrollbarY=null,this.scrollbarXRail=null,this.scrollbarYRail=null,this.isAlive=!1)},vi.prototype.removePsClasses=function(){this.element.className=this.element.className.split(" ").filter((function(e){return!e.match(/^ps([-_].+|)$/)})).join(" ")};var bi,xi,wi=vi,ki=n(98),Oi=n.n(ki),Ei=wi||r,_i=ke(bi||(bi=Object(o.__makeTemplateObject)(["",""],["",""])),Oi.a&&Oi.a.toString()),Si=Se.div(xi||(xi=Object(o.__makeTemplateObject)(["\n  position: relative;\n"],["\n  position: relative;\n"]))),Ti=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.handleRef=function(e){t._container=e},t}return Object(o.__extends)(t,e),t.prototype.componentDidMount=function(){var e=this._container.parentElement&&this._container.parentElement.scrollTop||0;this.inst=new Ei(this._container,this.props.options||{}),this._container.scrollTo&&this._container.scrollTo(0,e)},t.prototype.componentDidUpdate=function(){this.inst.update()},t.prototype.componentWillUnmount=function(){this.inst.destroy()},t.prototype.render=function(){var e=this.props,t=e.children,n=e.className,r=e.updateFn;return r&&r(this.componentDidUpdate.bind(this)),i.createElement(i.Fragment,null,i.createElement(_i,null),i.createElement(Si,{className:"scrollbar-container "+n,ref:this.handleRef},t))},t}(i.Component);function ji(e){return i.createElement(Fe.Consumer,null,(function(t){return t.nativeScrollbars?i.createElement("div",{style:{overflow:"auto",overscrollBehavior:"contain",msOverflowStyle:"-ms-autohiding-scrollbar"}},e.children):i.createElement(Ti,Object(o.__assign)({},e),e.children)}))}var Ai=function(e,t,n){this.operations=[];var r=e.deref(n||{});e.exitRef(n);for(var i=0,a=Object.keys(r);i<a.length;i++)for(var s=r[a[i]],l=0,c=Object.keys(s).filter(nt);l<c.length;l++){var u=c[l],p=s[u],f=new mn(e,Object(o.__assign)(Object(o.__assign)({},p),{httpVerb:u}),void 0,t,!1);this.operations.push(f)}},Ci=function(e,t,n){var r=e.deref(n);this.id=t,this.sectionId=gt+t,this.type=r.type,this.description=r.description||"","apiKey"===r.type&&(this.apiKey={name:r.name,in:r.in}),"http"===r.type&&(this.http={scheme:r.scheme,bearerFormat:r.bearerFormat}),"openIdConnect"===r.type&&(this.openId={connectUrl:r.openIdConnectUrl}),"oauth2"===r.type&&r.flows&&(this.flows=r.flows)},Ii=function(e){var t=e.spec.components&&e.spec.components.securitySchemes||{};this.schemes=Object.keys(t).map((function(n){return new Ci(e,n,t[n])}))},Pi=function(){function e(){this._counter={}}return e.prototype.reset=function(){this._counter={}},e.prototype.visit=function(e){this._counter[e]=this._counter[e]?this._counter[e]+1:1},e.prototype.exit=function(e){this._counter[e]=this._counter[e]&&this._counter[e]-1},e.prototype.visited=function(e){return!!this._counter[e]},e}(),Ri=function(){function e(e,t,n){var r=this;void 0===n&&(n=new ye({})),this.options=n,this._refCounter=new Pi,this.byRef=function(e){var t;if(r.spec){"#"!==e.charAt(0)&&(e="#"+e),e=decodeURIComponent(e);try{t=Xe.get(r.spec,e)}catch(e){}return t||{}}},this.validate(e),this.preprocess(e),this.spec=e,this.mergeRefs=new Set;var o=te?window.location.href:"";"string"==typeof t&&(this.specUrl=Object(ie.resolve)(o,t))}return e.prototype.validate=function(e){if(void 0===e.openapi)throw new Error("Document must be valid OpenAPI 3.0.0 definition")},e.prototype.preprocess=function(e){if(!this.options.noAutoAuth&&e.info&&e.components&&e.components.securitySchemes){var t=e.info.description||"";if(!Rt.containsComponent(t,"security-definitions")&&!Rt.containsComponent(t,"SecurityDefinitions")){var n="\x3c!-- ReDoc-Inject: <"+"security-definitions"+"> --\x3e";e.info.description=function(e,t,n){var r=new RegExp("(^|\\n)#\\s?"+t+"\\s*\\n","i"),o=new RegExp("((\\n|^)#\\s*"+t+"\\s*(\\n|$)(?:.|\\n)*?)(\\n#|$)","i");if(r.test(e))return e.replace(o,"$1\n\n"+n+"\n$4");var i=""===e||e.endsWith("\n\n")?"":e.endsWith("\n")?"\n":"\n\n";return""+e+i+"# "+t+"\n\n"+n}(t,"Authentication",n)}}},e.prototype.isRef=function(e){return!!e&&(void 0!==e.$ref&&null!==e.$ref)},e.prototype.resetVisited=function(){this._refCounter=new Pi},e.prototype.exitRef=function(e){this.isRef(e)&&this._refCounter.exit(e.$ref)},e.prototype.deref=function(e,t){if(void 0===t&&(t=!1),this.isRef(e)){var n=this.byRef(e.$ref),r=this._refCounter.visited(e.$ref);if(this._refCounter.visit(e.$ref),r&&!t)return Object.assign({},n,{"x-circular-ref":!0});if(this.isRef(n)){var o=this.deref(n);return this.exitRef(n),o}return n}return e},e.prototype.shalowDeref=function(e){return this.isRef(e)?this.byRef(e.$ref):e},e.prototype.mergeAllOf=function(e,t,n,r){var i=this;if(void 0===n&&(n=!1),void 0===r&&(r=new Set),t&&r.add(t),void 0===(e=this.hoistOneOfs(e)).allOf)return e;var a=Object(o.__assign)(Object(o.__assign)({},e),{allOf:void 0,parentRefs:[],title:e.title||(ut(t)?Xe.baseName(t):void 0)});void 0!==a.properties&&"object"==typeof a.properties&&(a.properties=Object(o.__assign)({},a.properties)),void 0!==a.items&&"object"==typeof a.items&&(a.items=Object(o.__assign)({},a.items));for(var s=0,l=e.allOf.map((function(e){var t;if(!(e&&e.$ref&&r.has(e.$ref))){var o=i.deref(e,n),s=e.$ref||void 0,l=i.mergeAllOf(o,s,n,r);return(t=a.parentRefs).push.apply(t,l.parentRefs||[]),{$ref:s,schema:l}}})).filter((function(e){return void 0!==e}));s<l.length;s++){var c=l[s],u=c.$ref,p=c.schema;if(a.type!==p.type&&void 0!==a.type&&void 0!==p.type&&console.warn('Incompatible types in allOf at "'+t+'": "'+a.type+'" and "'+p.type+'"'),void 0!==p.type&&(a.type=p.type),void 0!==p.properties)for(var f in a.properties=a.properties||{},p.properties)a.properties[f]?a.properties[f]=this.mergeAllOf({allOf:[a.properties[f],p.properties[f]]},t+"/properties/"+f):a.properties[f]=p.properties[f];void 0!==p.items&&(a.items=a.items||{},a.items=this.mergeAllOf({allOf:[a.items,p.items]},t+"/items")),void 0!==p.required&&(a.required=(a.required||[]).concat(p.required)),a=Object(o.__assign)(Object(o.__assign)({},p),a),u&&(a.parentRefs.push(u),void 0===a.title&&ut(u))}return a},e.prototype.findDerived=function(e){var t={},n=this.spec.components&&this.spec.components.schemas||{};for(var r in n){var o=this.deref(n[r]);void 0!==o.allOf&&o.allOf.find((function(t){return void 0!==t.$ref&&e.indexOf(t.$ref)>-1}))&&(t["#/components/schemas/"+r]=[o["x-discriminator-value"]||r])}return t},e.prototype.exitParents=function(e){for(var t=0,n=e.parentRefs||[];t<n.length;t++){var r=n[t];this.exitRef({$ref:r})}},e.prototype.hoistOneOfs=function(e){var t=this;if(void 0===e.allOf)return e;for(var n=e.allOf,r=function(e){var r=n[e];if(Array.isArray(r.oneOf)){var i=n.slice(0,e),a=n.slice(e+1);return{value:{oneOf:r.oneOf.map((function(e){var n=t.mergeAllOf({allOf:Object(o.__spreadArrays)(i,[e],a)});return t.exitParents(n),n}))}}}},i=0;i<n.length;i++){var a=r(i);if("object"==typeof a)return a.value}return e},e}(),Ni=function(e,t,n){this.options=n,this.parser=new Ri(e,t,n),this.info=new Lt(this.parser),this.externalDocs=this.parser.spec.externalDocs,this.contentItems=Mi.buildStructure(this.parser,this.options),this.securitySchemes=new Ii(this.parser),this.webhooks=new Ai(this.parser,n,this.parser.spec["x-webhooks"])},Li=function(){function e(e,t,n){this.items=[],this.active=!1,this.expanded=!1,this.id=t.id||e+"/"+pe(t.name),this.type=e,this.name=t["x-displayName"]||t.name,this.level=t.level||1,this.description=t.description||"";var r=t.items;r&&r.length&&(this.description=Rt.getTextBeforeHading(this.description,r[0].name)),this.parent=n,this.externalDocs=t.externalDocs,"group"===this.type&&(this.expanded=!0)}return e.prototype.activate=function(){this.active=!0},e.prototype.expand=function(){this.parent&&this.parent.expand(),this.expanded=!0},e.prototype.collapse=function(){"group"!==this.type&&(this.expanded=!1)},e.prototype.deactivate=function(){this.active=!1},Object(o.__decorate)([Be.n],e.prototype,"active",void 0),Object(o.__decorate)([Be.n],e.prototype,"expanded",void 0),Object(o.__decorate)([Be.f],e.prototype,"activate",null),Object(o.__decorate)([Be.f],e.prototype,"expand",null),Object(o.__decorate)([Be.f],e.prototype,"collapse",null),Object(o.__decorate)([Be.f],e.prototype,"deactivate",null),e}(),Mi=function(){function e(){}return e.buildStructure=function(t,n){var r=t.spec,o=[],i=e.getTagsWithOperations(r);return o.push.apply(o,e.addMarkdownItems(r.info.description||"",void 0,1,n)),r["x-tagGroups"]&&r["x-tagGroups"].length>0?o.push.apply(o,e.getTagGroupsItems(t,void 0,r["x-tagGroups"],i,n)):o.push.apply(o,e.getTagsItems(t,i,void 0,void 0,n)),o},e.addMarkdownItems=function(e,t,n,r){var o=new Rt(r).extractHeadings(e||"");o.length&&t&&t.description&&(t.description=Rt.getTextBeforeHading(t.description,o[0].name));var i=function(e,t,n){return void 0===n&&(n=1),t.map((function(t){var r,o=new Li("section",t,e);return o.depth=n,t.items&&(o.items=i(o,t.items,n+1)),Rt.containsComponent(o.description||"","security-definitions")&&(r=o.id+"/",gt=r),o}))};return i(t,o,n)},e.getTagGroupsItems=function(t,n,r,o,i){for(var a=[],s=0,l=r;s<l.length;s++){var c=l[s],u=new Li("group",c,n);u.depth=0,u.items=e.getTagsItems(t,o,u,c,i),a.push(u)}return a},e.getTagsItems=function(t,n,r,i,a){for(var s=[],l=0,c=(void 0===i?Object.keys(n):i.tags).map((function(e){return n[e]?(n[e].used=!0,n[e]):(console.warn('Non-existing tag "'+e+'" is added to the group "'+i.name+'"'),null)}));l<c.length;l++){var u=c[l];if(u){var p=new Li("tag",u,r);if(p.depth=1,""!==u.name)p.items=Object(o.__spreadArrays)(e.addMarkdownItems(u.description||"",p,p.depth+1,a),this.getOperationsItems(t,p,u,p.depth+1,a)),s.push(p);else{var f=Object(o.__spreadArrays)(e.addMarkdownItems(u.description||"",p,p.depth+1,a),this.getOperationsItems(t,void 0,u,p.depth+1,a));s.push.apply(s,f)}}}return s},e.getOperationsItems=function(e,t,n,r,o){if(0===n.operations.length)return[];for(var i=[],a=0,s=n.operations;a<s.length;a++){var l=s[a],c=new mn(e,l,t,o);c.depth=r,i.push(c)}return i},e.getTagsWithOperations=function(e){for(var t={},n=0,r=e.tags||[];n<r.length;n++){var i=r[n];t[i.name]=Object(o.__assign)(Object(o.__assign)({},i),{operations:[]})}function a(e,n){for(var r=0,i=Object.keys(e);r<i.length;r++)for(var a=i[r],s=e[a],l=0,c=Object.keys(s).filter(nt);l<c.length;l++){var u=c[l],p=s[u],f=p.tags;f&&f.length||(f=[""]);for(var d=0,h=f;d<h.length;d++){var m=h[d],g=t[m];void 0===g&&(g={name:m,operations:[]},t[m]=g),g["x-traitTag"]||g.operations.push(Object(o.__assign)(Object(o.__assign)({},p),{pathName:a,pointer:Xe.compile(["paths",a,u]),httpVerb:u,pathParameters:s.parameters||[],pathServers:s.servers,isWebhook:!!n}))}}}return a(e.paths),e["x-webhooks"]&&a(e["x-webhooks"],!0),t},e}(),Di="data-section-id",Fi=function(){function e(e,t,n){var r,o,i,a,s=this;this.scroll=t,this.history=n,this.activeItemIdx=-1,this.sideBarOpened=!1,this.updateOnScroll=function(e){for(var t=e?1:-1,n=s.activeItemIdx;(-1!==n||e)&&!(n>=s.flatItems.length-1&&e);){if(e){var r=s.getElementAtOrFirstChild(n+1);if(s.scroll.isElementBellow(r))break}else{r=s.getElementAt(n);if(s.scroll.isElementAbove(r))break}n+=t}s.activate(s.flatItems[n],!0,!0)},this.updateOnHistory=function(e){var t;(void 0===e&&(e=s.history.currentId),e)&&((t=s.flatItems.find((function(t){return t.id===e})))?s.activateAndScroll(t,!1):(e.startsWith(gt)&&(t=s.flatItems.find((function(e){return gt.startsWith(e.id)})),s.activate(t)),s.scroll.scrollIntoViewBySelector("["+Di+'="'+e+'"]')))},this.getItemById=function(e){return s.flatItems.find((function(t){return t.id===e}))},this.items=e.contentItems,this.flatItems=(r=this.items||[],o="items",i=[],(a=function(e){for(var t=0,n=e;t<n.length;t++){var r=n[t];i.push(r),r[o]&&a(r[o])}})(r),i),this.flatItems.forEach((function(e,t){return e.absoluteIdx=t})),this.subscribe()}return e.updateOnHistory=function(e,t){void 0===e&&(e=Tt.currentId),e&&t.scrollIntoViewBySelector("["+Di+'="'+e+'"]')},e.prototype.subscribe=function(){this._unsubscribe=this.scroll.subscribe(this.updateOnScroll),this._hashUnsubscribe=this.history.subscribe(this.updateOnHistory)},e.prototype.toggleSidebar=function(){this.sideBarOpened=!this.sideBarOpened},e.prototype.closeSidebar=function(){this.sideBarOpened=!1},e.prototype.getElementAt=function(e){var t=this.flatItems[e];return t&&ne("["+Di+'="'+t.id+'"]')||null},e.prototype.getElementAtOrFirstChild=function(e){var t=this.flatItems[e];return t&&"group"===t.type&&(t=t.items[0]),t&&ne("["+Di+'="'+t.id+'"]')||null},Object.defineProperty(e.prototype,"activeItem",{get:function(){return this.flatItems[this.activeItemIdx]||void 0},enumerable:!1,configurable:!0}),e.prototype.activate=function(e,t,n){void 0===t&&(t=!0),void 0===n&&(n=!1),(this.activeItem&&this.activeItem.id)!==(e&&e.id)&&(e&&"group"===e.type||(this.deactivate(this.activeItem),e?e.depth<=0||(this.activeItemIdx=e.absoluteIdx,t&&this.history.replace(e.id,n),e.activate(),e.expand()):this.history.replace("",n)))},e.prototype.deactivate=function(e){if(void 0!==e)for(e.deactivate();void 0!==e;)e.collapse(),e=e.parent},e.prototype.activateAndScroll=function(e,t,n){var r=e&&this.getItemById(e.id)||e;this.activate(r,t,n),this.scrollToActive(),r&&r.items.length||this.closeSidebar()},e.prototype.scrollToActive=function(){this.scroll.scrollIntoView(this.getElementAt(this.activeItemIdx))},e.prototype.dispose=function(){this._unsubscribe(),this._hashUnsubscribe()},Object(o.__decorate)([Be.n],e.prototype,"activeItemIdx",void 0),Object(o.__decorate)([Be.n],e.prototype,"sideBarOpened",void 0),Object(o.__decorate)([Be.f],e.prototype,"toggleSidebar",null),Object(o.__decorate)([Be.f],e.prototype,"closeSidebar",null),Object(o.__decorate)([Be.f],e.prototype,"activate",null),Object(o.__decorate)([Be.f.bound],e.prototype,"activateAndScroll",null),e}(),zi=function(){function e(e){this.options=e,this._prevOffsetY=0,this._scrollParent=te?window:void 0,this._emiter=new Ye,this.bind()}return e.prototype.bind=function(){this._prevOffsetY=this.scrollY(),this._scrollParent&&this._scrollParent.addEventListener("scroll",this.handleScroll)},e.prototype.dispose=function(){this._scrollParent&&this._scrollParent.removeEventListener("scroll",this.handleScroll),this._emiter.removeAllListeners("scroll")},e.prototype.scrollY=function(){return"undefined"!=typeof HTMLElement&&this._scrollParent instanceof HTMLElement?this._scrollParent.scrollTop:void 0!==this._scrollParent?this._scrollParent.pageYOffset:0},e.prototype.isElementBellow=function(e){if(null!==e)return e.getBoundingClientRect().top>this.options.scrollYOffset()},e.prototype.isElementAbove=function(e){if(null!==e){var t=e.getBoundingClientRect().top;return(t>0?Math.floor(t):Math.ceil(t))<=this.options.scrollYOffset()}},e.prototype.subscribe=function(e){var t=this._emiter.addListener("scroll",e);return function(){return t.removeListener("scroll",e)}},e.prototype.scrollIntoView=function(e){null!==e&&(e.scrollIntoView(),this._scrollParent&&this._scrollParent.scrollBy&&this._scrollParent.scrollBy(0,1-this.options.scrollYOffset()))},e.prototype.scrollIntoViewBySelector=function(e){var t=ne(e);this.scrollIntoView(t)},e.prototype.handleScroll=function(){var e=this.scrollY()-this._prevOffsetY>0;this._prevOffsetY=this.scrollY(),this._emiter.emit("scroll",e)},Object(o.__decorate)([Ve.bind,wt(100)],e.prototype,"handleScroll",null),e}();var Ui=function(){function e(){this.searchWorker=function(){var e;if(te)try{e=n(314)}catch(t){e=n(149).default}else e=n(149).default;return new e}()}return e.prototype.indexItems=function(e){var t=this,n=function(e){e.forEach((function(e){"group"!==e.type&&t.add(e.name,e.description||"",e.id),n(e.items)}))};n(e),this.searchWorker.done()},e.prototype.add=function(e,t,n){this.searchWorker.add(e,t,n)},e.prototype.dispose=function(){this.searchWorker.terminate(),this.searchWorker.dispose()},e.prototype.search=function(e){return this.searchWorker.search(e)},e.prototype.toJS=function(){return Object(o.__awaiter)(this,void 0,void 0,(function(){return Object(o.__generator)(this,(function(e){return[2,this.searchWorker.toJS()]}))}))},e.prototype.load=function(e){this.searchWorker.load(e)},e}();function Bi(e){var t=e.Label,n=void 0===t?so:t,r=e.Dropdown,a=void 0===r?ao:r;return 1===e.options.length?i.createElement(n,null,e.options[0].value):i.createElement(a,Object(o.__assign)({},e,{searchable:!1}))}var $i,Wi,qi=n(157),Hi=we($i||($i=Object(o.__makeTemplateObject)(["\n  a {\n    text-decoration: none;\n    color: ",";\n\n    &:visited {\n      color: ",";\n    }\n\n    &:hover {\n      color: ",";\n    }\n  }\n"],["\n  a {\n    text-decoration: none;\n    color: ",";\n\n    &:visited {\n      color: ",";\n    }\n\n    &:hover {\n      color: ",";\n    }\n  }\n"])),(function(e){return e.theme.typography.links.color}),(function(e){return e.theme.typography.links.visited}),(function(e){return e.theme.typography.links.hover})),Vi=Se(Wo)(Wi||(Wi=Object(o.__makeTemplateObject)(["\n\n  font-family: ",";\n  font-weight: ",";\n  line-height: ",";\n\n  p {\n    &:last-child {\n      margin-bottom: 0;\n    }\n  }\n\n  ","\n\n  ","\n\n  h1 {\n    ",";\n    color: ",";\n    margin-top: 0;\n  }\n\n  h2 {\n    ",";\n    color: ",";\n  }\n\n  code {\n    color: ",";\n    background-color: ",";\n\n    font-family: ",";\n    border-radius: 2px;\n    border: 1px solid rgba(38, 50, 56, 0.1);\n    padding: 0 ","px;\n    font-size: ",";\n    font-weight: ",";\n\n    word-break: break-word;\n  }\n\n  pre {\n    font-family: ",";\n    white-space:",";\n    background-color: ",";\n    color: white;\n    padding: ","px;\n    overflow-x: auto;\n    line-height: normal;\n    border-radius: 0px\n    border: 1px solid rgba(38, 50, 56, 0.1);\n\n    code {\n      background-color: transparent;\n      color: white;\n      padding: 0;\n\n      &:before,\n      &:after {\n        content: none;\n      }\n    }\n  }\n\n  blockquote {\n    margin: 0;\n    margin-bottom: 1em;\n    padding: 0 15px;\n    color: #777;\n    border-left: 4px solid #ddd;\n  }\n\n  img {\n    max-width: 100%;\n    box-sizing: content-box;\n  }\n\n  ul,\n  ol {\n    padding-left: 2em;\n    margin: 0;\n    margin-bottom: 1em;\n\n    ul, ol {\n      margin-bottom: 0;\n      margin-top: 0;\n    }\n  }\n\n  table {\n    display: block;\n    width: 100%;\n    overflow: auto;\n    word-break: normal;\n    word-break: keep-all;\n    border-collapse: collapse;\n    border-spacing: 0;\n    margin-top: 1.5em;\n    margin-bottom: 1.5em;\n  }\n\n  table tr {\n    background-color: #fff;\n    border-top: 1px solid #ccc;\n\n    &:nth-child(2n) {\n      background-color: ",";\n    }\n  }\n\n  table th,\n  table td {\n    padding: 6px 13px;\n    border: 1px solid #ddd;\n  }\n\n  table th {\n    text-align: left;\n    font-weight: bold;\n  }\n\n  ",";\n\n  ","\n\n  ",";\n"],["\n\n  font-family: ",";\n  font-weight: ",";\n  line-height: ",";\n\n  p {\n    &:last-child {\n      margin-bottom: 0;\n    }\n  }\n\n  ","\n\n  ","\n\n  h1 {\n    ",";\n    color: ",";\n    margin-top: 0;\n  }\n\n  h2 {\n    ",";\n    color: ",";\n  }\n\n  code {\n    color: ",";\n    background-color: ",";\n\n    font-family: ",";\n    border-radius: 2px;\n    border: 1px solid rgba(38, 50, 56, 0.1);\n    padding: 0 ","px;\n    font-size: ",";\n    font-weight: ",";\n\n    word-break: break-word;\n  }\n\n  pre {\n    font-family: ",";\n    white-space:",";\n    background-color: ",";\n    color: white;\n    padding: ","px;\n    overflow-x: auto;\n    line-height: normal;\n    border-radius: 0px\n    border: 1px solid rgba(38, 50, 56, 0.1);\n\n    code {\n      background-color: transparent;\n      color: white;\n      padding: 0;\n\n      &:before,\n      &:after {\n        content: none;\n      }\n    }\n  }\n\n  blockquote {\n    margin: 0;\n    margin-bottom: 1em;\n    padding: 0 15px;\n    color: #777;\n    border-left: 4px solid #ddd;\n  }\n\n  img {\n    max-width: 100%;\n    box-sizing: content-box;\n  }\n\n  ul,\n  ol {\n    padding-left: 2em;\n    margin: 0;\n    margin-bottom: 1em;\n\n    ul, ol {\n      margin-bottom: 0;\n      margin-top: 0;\n    }\n  }\n\n  table {\n    display: block;\n    width: 100%;\n    overflow: auto;\n    word-break: normal;\n    word-break: keep-all;\n    border-collapse: collapse;\n    border-spacing: 0;\n    margin-top: 1.5em;\n    margin-bottom: 1.5em;\n  }\n\n  table tr {\n    background-color: #fff;\n    border-top: 1px solid #ccc;\n\n    &:nth-child(2n) {\n      background-color: ",";\n    }\n  }\n\n  table th,\n  table td {\n    padding: 6px 13px;\n    border: 1px solid #ddd;\n  }\n\n  table th {\n    text-align: left;\n    font-weight: bold;\n  }\n\n  ",";\n\n  ","\n\n  ",";\n"])),(function(e){return e.theme.typography.fontFamily}),(function(e){return e.theme.typography.fontWeightRegular}),(function(e){return e.theme.typography.lineHeight}),(function(e){return e.compact&&"\n    p:first-child {\n      margin-top: 0;\n    }\n    p:last-child {\n      margin-bottom: 0;\n    }\n  "}),(function(e){return e.inline&&" p {\n    display: inline-block;\n  }"}),kn(1),(function(e){return e.theme.colors.primary.main}),kn(2),(function(e){return e.theme.colors.text.primary}),(function(e){return e.theme.typography.code.color}),(function(e){return e.theme.typography.code.backgroundColor}),(function(e){return e.theme.typography.code.fontFamily}),(function(e){return e.theme.spacing.unit}),(function(e){return e.theme.typography.code.fontSize}),(function(e){return e.theme.typography.code.fontWeight}),(function(e){return e.theme.typography.code.fontFamily}),(function(e){return e.theme.typography.code.wrap?"pre-wrap":"pre"}),(function(e){return e.theme.codeBlock.backgroundColor}),(function(e){return 4*e.theme.spacing.unit}),(function(e){return e.theme.schema.nestedBackground}),Pn(".share-link"),Hi,Te("Markdown")),Yi=Vi.withComponent("span");function Gi(e){var t=e.inline?Yi:Vi;return i.createElement(Ue,null,(function(n){return i.createElement(t,Object(o.__assign)({className:"redoc-markdown "+(e.className||""),dangerouslySetInnerHTML:{__html:(r=n.untrustedSpec,a=e.html,r?qi.sanitize(a):a)},"data-role":e["data-role"]},e));var r,a}))}var Qi,Xi,Ki,Ji,Zi,ea=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.source,n=e.inline,r=e.compact,o=e.className,a=e["data-role"],s=new Rt;return i.createElement(Gi,{html:s.renderMd(t),inline:n,compact:r,className:o,"data-role":a})},t}(i.Component),ta=Se.div(Qi||(Qi=Object(o.__makeTemplateObject)(["\n  position: relative;\n"],["\n  position: relative;\n"]))),na=Se.div(Xi||(Xi=Object(o.__makeTemplateObject)(["\n  position: absolute;\n  min-width: 80px;\n  max-width: 500px;\n  background: #fff;\n  bottom: 100%;\n  left: 50%;\n  margin-bottom: 10px;\n  transform: translateX(-50%);\n\n  border-radius: 4px;\n  padding: 0.3em 0.6em;\n  text-align: center;\n  box-shadow: 0px 0px 5px 0px rgba(204, 204, 204, 1);\n"],["\n  position: absolute;\n  min-width: 80px;\n  max-width: 500px;\n  background: #fff;\n  bottom: 100%;\n  left: 50%;\n  margin-bottom: 10px;\n  transform: translateX(-50%);\n\n  border-radius: 4px;\n  padding: 0.3em 0.6em;\n  text-align: center;\n  box-shadow: 0px 0px 5px 0px rgba(204, 204, 204, 1);\n"]))),ra=Se.div(Ki||(Ki=Object(o.__makeTemplateObject)(["\n  background: #fff;\n  color: #000;\n  display: inline;\n  font-size: 0.85em;\n  white-space: nowrap;\n"],["\n  background: #fff;\n  color: #000;\n  display: inline;\n  font-size: 0.85em;\n  white-space: nowrap;\n"]))),oa=Se.div(Ji||(Ji=Object(o.__makeTemplateObject)(["\n  position: absolute;\n  width: 0;\n  height: 0;\n  bottom: -5px;\n  left: 50%;\n  margin-left: -5px;\n  border-left: solid transparent 5px;\n  border-right: solid transparent 5px;\n  border-top: solid #fff 5px;\n"],["\n  position: absolute;\n  width: 0;\n  height: 0;\n  bottom: -5px;\n  left: 50%;\n  margin-left: -5px;\n  border-left: solid transparent 5px;\n  border-right: solid transparent 5px;\n  border-top: solid #fff 5px;\n"]))),ia=Se.div(Zi||(Zi=Object(o.__makeTemplateObject)(["\n  position: absolute;\n  width: 100%;\n  height: 20px;\n  bottom: -20px;\n"],["\n  position: absolute;\n  width: 100%;\n  height: 20px;\n  bottom: -20px;\n"]))),aa=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.open,n=e.title,r=e.children;return i.createElement(ta,null,r,t&&i.createElement(na,null,i.createElement(ra,null,n),i.createElement(oa,null),i.createElement(ia,null)))},t}(i.Component),sa="undefined"!=typeof document&&document.queryCommandSupported&&document.queryCommandSupported("copy"),la=function(){function e(){}return e.isSupported=function(){return sa},e.selectElement=function(e){var t,n;document.body.createTextRange?((t=document.body.createTextRange()).moveToElementText(e),t.select()):document.createRange&&window.getSelection&&(n=window.getSelection(),(t=document.createRange()).selectNodeContents(e),n.removeAllRanges(),n.addRange(t))},e.deselect=function(){if(document.selection)document.selection.empty();else if(window.getSelection){var e=window.getSelection();e&&e.removeAllRanges()}},e.copySelected=function(){var e;try{e=document.execCommand("copy")}catch(t){e=!1}return e},e.copyElement=function(t){e.selectElement(t);var n=e.copySelected();return n&&e.deselect(),n},e.copyCustom=function(t){var n=document.createElement("textarea");n.style.position="fixed",n.style.top="0",n.style.left="0",n.style.width="2em",n.style.height="2em",n.style.padding="0",n.style.border="none",n.style.outline="none",n.style.boxShadow="none",n.style.background="transparent",n.value=t,document.body.appendChild(n),n.select();var r=e.copySelected();return document.body.removeChild(n),r},e}(),ca=function(e){function t(t){var n=e.call(this,t)||this;return n.copy=function(){var e="string"==typeof n.props.data?n.props.data:JSON.stringify(n.props.data,null,2);la.copyCustom(e),n.showTooltip()},n.renderCopyButton=function(){return i.createElement("button",{onClick:n.copy},i.createElement(aa,{title:la.isSupported()?"Copied":"Not supported in your browser",open:n.state.tooltipShown},"Copy"))},n.state={tooltipShown:!1},n}return Object(o.__extends)(t,e),t.prototype.render=function(){return this.props.children({renderCopyButton:this.renderCopyButton})},t.prototype.showTooltip=function(){var e=this;this.setState({tooltipShown:!0}),setTimeout((function(){e.setState({tooltipShown:!1})}),1500)},t}(i.PureComponent),ua=1;function pa(e,t){ua=1;var n="";return n+='<div class="redoc-json">',n+="<code>",n+=ga(e,t),n+="</code>",n+="</div>"}function fa(e){return void 0!==e?e.toString().replace(/&/g,"&amp;").replace(/"/g,"&quot;").replace(/</g,"&lt;").replace(/>/g,"&gt;"):""}function da(e){return JSON.stringify(e).slice(1,-1)}function ha(e,t){return'<span class="'+t+'">'+fa(e)+"</span>"}function ma(e){return'<span class="token punctuation">'+e+"</span>"}function ga(e,t){var n=typeof e,r="";return null==e?r+=ha("null","token keyword"):e&&e.constructor===Array?(ua++,r+=function(e,t){for(var n=ua>t?"collapsed":"",r='<div class="collapser"></div>'+ma("[")+'<span class="ellipsis"></span><ul class="array collapsible">',o=!1,i=e.length,a=0;a<i;a++)o=!0,r+='<li><div class="hoverable '+n+'">',r+=ga(e[a],t),a<i-1&&(r+=","),r+="</div></li>";r+="</ul>"+ma("]"),o||(r=ma("[ ]"));return r}(e,t),ua--):e&&e.constructor===Date?r+=ha('"'+e.toISOString()+'"',"token string"):"object"===n?(ua++,r+=function(e,t){for(var n=ua>t?"collapsed":"",r=Object.keys(e),o=r.length,i='<div class="collapser"></div>'+ma("{")+'<span class="ellipsis"></span><ul class="obj collapsible">',a=!1,s=0;s<o;s++){var l=r[s];a=!0,i+='<li><div class="hoverable '+n+'">',i+='<span class="property token string">"'+fa(l)+'"</span>: ',i+=ga(e[l],t),s<o-1&&(i+=ma(",")),i+="</div></li>"}i+="</ul>"+ma("}"),a||(i=ma("{ }"));return i}(e,t),ua--):"number"===n?r+=ha(e,"token number"):"string"===n?/^(http|https):\/\/[^\s]+$/.test(e)?r+=ha('"',"token string")+'<a href="'+encodeURI(e)+'">'+fa(da(e))+"</a>"+ha('"',"token string"):r+=ha('"'+da(e)+'"',"token string"):"boolean"===n&&(r+=ha(e,"token boolean")),r}var ya,va,ba,xa=we(ya||(ya=Object(o.__makeTemplateObject)(["\n  .redoc-json > .collapser {\n    display: none;\n  }\n\n  font-family: ",";\n  font-size: ",";\n\n  white-space: ",";\n  contain: content;\n  overflow-x: auto;\n\n  .callback-function {\n    color: gray;\n  }\n\n  .collapser:after {\n    content: '-';\n    cursor: pointer;\n  }\n\n  .collapsed > .collapser:after {\n    content: '+';\n    cursor: pointer;\n  }\n\n  .ellipsis:after {\n    content: ' … ';\n  }\n\n  .collapsible {\n    margin-left: 2em;\n  }\n\n  .hoverable {\n    padding-top: 1px;\n    padding-bottom: 1px;\n    padding-left: 2px;\n    padding-right: 2px;\n    border-radius: 2px;\n  }\n\n  .hovered {\n    background-color: rgba(235, 238, 249, 1);\n  }\n\n  .collapser {\n    padding-right: 6px;\n    padding-left: 6px;\n  }\n\n  ul {\n    list-style-type: none;\n    padding: 0px;\n    margin: 0px 0px 0px 26px;\n  }\n\n  li {\n    position: relative;\n    display: block;\n  }\n\n  .hoverable {\n    display: inline-block;\n  }\n\n  .selected {\n    outline-style: solid;\n    outline-width: 1px;\n    outline-style: dotted;\n  }\n\n  .collapsed > .collapsible {\n    display: none;\n  }\n\n  .ellipsis {\n    display: none;\n  }\n\n  .collapsed > .ellipsis {\n    display: inherit;\n  }\n\n  .collapser {\n    position: absolute;\n    top: 1px;\n    left: -1.5em;\n    cursor: default;\n    user-select: none;\n    -webkit-user-select: none;\n  }\n"],["\n  .redoc-json > .collapser {\n    display: none;\n  }\n\n  font-family: ",";\n  font-size: ",";\n\n  white-space: ",";\n  contain: content;\n  overflow-x: auto;\n\n  .callback-function {\n    color: gray;\n  }\n\n  .collapser:after {\n    content: '-';\n    cursor: pointer;\n  }\n\n  .collapsed > .collapser:after {\n    content: '+';\n    cursor: pointer;\n  }\n\n  .ellipsis:after {\n    content: ' … ';\n  }\n\n  .collapsible {\n    margin-left: 2em;\n  }\n\n  .hoverable {\n    padding-top: 1px;\n    padding-bottom: 1px;\n    padding-left: 2px;\n    padding-right: 2px;\n    border-radius: 2px;\n  }\n\n  .hovered {\n    background-color: rgba(235, 238, 249, 1);\n  }\n\n  .collapser {\n    padding-right: 6px;\n    padding-left: 6px;\n  }\n\n  ul {\n    list-style-type: none;\n    padding: 0px;\n    margin: 0px 0px 0px 26px;\n  }\n\n  li {\n    position: relative;\n    display: block;\n  }\n\n  .hoverable {\n    display: inline-block;\n  }\n\n  .selected {\n    outline-style: solid;\n    outline-width: 1px;\n    outline-style: dotted;\n  }\n\n  .collapsed > .collapsible {\n    display: none;\n  }\n\n  .ellipsis {\n    display: none;\n  }\n\n  .collapsed > .ellipsis {\n    display: inherit;\n  }\n\n  .collapser {\n    position: absolute;\n    top: 1px;\n    left: -1.5em;\n    cursor: default;\n    user-select: none;\n    -webkit-user-select: none;\n  }\n"])),(function(e){return e.theme.typography.code.fontFamily}),(function(e){return e.theme.typography.code.fontSize}),(function(e){return e.theme.typography.code.wrap?"pre-wrap":"pre"})),wa=Se.div(va||(va=Object(o.__makeTemplateObject)(["\n  &:hover > "," {\n    opacity: 1;\n  }\n"],["\n  &:hover > "," {\n    opacity: 1;\n  }\n"])),qo),ka=Se(function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.renderInner=function(e){var n=e.renderCopyButton;return i.createElement(wa,null,i.createElement(qo,null,n(),i.createElement("button",{onClick:t.expandAll}," Expand all "),i.createElement("button",{onClick:t.collapseAll}," Collapse all ")),i.createElement(Fe.Consumer,null,(function(e){return i.createElement(Wo,{className:t.props.className,ref:function(e){return t.node=e},dangerouslySetInnerHTML:{__html:pa(t.props.data,e.jsonSampleExpandLevel)}})})))},t.expandAll=function(){for(var e=t.node.getElementsByClassName("collapsible"),n=0,r=Array.prototype.slice.call(e);n<r.length;n++){r[n].parentNode.classList.remove("collapsed")}},t.collapseAll=function(){for(var e=t.node.getElementsByClassName("collapsible"),n=0,r=Array.prototype.slice.call(e,1);n<r.length;n++){r[n].parentNode.classList.add("collapsed")}},t.clickListener=function(e){var t,n=e.target;"collapser"===n.className&&((t=n.parentElement.getElementsByClassName("collapsible")[0]).parentElement.classList.contains("collapsed")?t.parentElement.classList.remove("collapsed"):t.parentElement.classList.add("collapsed"))},t}return Object(o.__extends)(t,e),t.prototype.render=function(){return i.createElement(ca,{data:this.props.data},this.renderInner)},t.prototype.componentDidMount=function(){this.node.addEventListener("click",this.clickListener)},t.prototype.componentWillUnmount=function(){this.node.removeEventListener("click",this.clickListener)},t}(i.PureComponent))(ba||(ba=Object(o.__makeTemplateObject)(["\n  ",";\n"],["\n  ",";\n"])),xa),Oa=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.source,n=e.lang;return i.createElement(Vo,{dangerouslySetInnerHTML:{__html:xt(t,n)}})},t}(i.PureComponent),Ea=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this;return i.createElement(ca,{data:this.props.source},(function(t){var n=t.renderCopyButton;return i.createElement(Ho,null,i.createElement(qo,null,n()),i.createElement(Oa,{lang:e.props.lang,source:e.props.source}))}))},t}(i.PureComponent);function _a(e){var t,n=e.value,r=e.mimeType;return ot(r)?i.createElement(ka,{data:n}):("object"==typeof n&&(n=JSON.stringify(n,null,2)),i.createElement(Ea,{lang:(t=r,-1!==t.search(/xml/i)?"xml":"clike"),source:n}))}function Sa(e){var t=e.example,n=e.mimeType;return void 0===t.value&&t.externalValueUrl?i.createElement(Ta,{example:t,mimeType:n}):i.createElement(_a,{value:t.value,mimeType:n})}function Ta(e){var t=e.example,n=e.mimeType,r=function(e,t){var n=this,r=Object(i.useState)(!0)[1],a=Object(i.useRef)(void 0),s=Object(i.useRef)(void 0);return s.current!==e&&(a.current=void 0),s.current=e,Object(i.useEffect)((function(){Object(o.__awaiter)(n,void 0,void 0,(function(){var n,i;return Object(o.__generator)(this,(function(o){switch(o.label){case 0:r(!0),o.label=1;case 1:return o.trys.push([1,3,,4]),n=a,[4,e.getExternalValue(t)];case 2:return n.current=o.sent(),[3,4];case 3:return i=o.sent(),a.current=i,[3,4];case 4:return r(!1),[2]}}))}))}),[e,t]),a.current}(t,n);return void 0===r?i.createElement("span",null,"Loading..."):r instanceof Error?i.createElement(Vo,null,"Error loading external example: ",i.createElement("br",null),i.createElement("a",{className:"token string",href:t.externalValueUrl,target:"_blank",rel:"noopener noreferrer"},t.externalValueUrl)):i.createElement(_a,{value:r,mimeType:n})}var ja,Aa,Ca,Ia,Pa,Ra,Na=Se.div(ja||(ja=Object(o.__makeTemplateObject)(["\n  padding: 0.9em;\n  background-color: ",";\n  margin: 0 0 10px 0;\n  display: block;\n  font-family: ",";\n  font-size: 0.929em;\n  line-height: 1.5em;\n"],["\n  padding: 0.9em;\n  background-color: ",";\n  margin: 0 0 10px 0;\n  display: block;\n  font-family: ",";\n  font-size: 0.929em;\n  line-height: 1.5em;\n"])),(function(e){var t=e.theme;return J(.6,t.rightPanel.backgroundColor)}),(function(e){return e.theme.typography.headings.fontFamily})),La=Se.span(Aa||(Aa=Object(o.__makeTemplateObject)(["\n  font-family: ",";\n  font-size: 12px;\n  position: absolute;\n  z-index: 1;\n  top: -11px;\n  left: 12px;\n  font-weight: ",";\n  color: ",";\n"],["\n  font-family: ",";\n  font-size: 12px;\n  position: absolute;\n  z-index: 1;\n  top: -11px;\n  left: 12px;\n  font-weight: ",";\n  color: ",";\n"])),(function(e){return e.theme.typography.headings.fontFamily}),(function(e){return e.theme.typography.fontWeightBold}),(function(e){var t=e.theme;return J(.6,t.rightPanel.textColor)})),Ma=Se.div(Ca||(Ca=Object(o.__makeTemplateObject)(["\n  position: relative;\n"],["\n  position: relative;\n"]))),Da=Se(io)(Ia||(Ia=Object(o.__makeTemplateObject)(["\n  && {\n    margin-left: 10px;\n    text-transform: none;\n    font-size: 0.929em;\n    margin: 0 0 10px 0;\n    display: block;\n    background-color: ",";\n    font-size: 1em;\n    border: none;\n    padding: 0.9em 1.6em 0.9em 0.9em;\n    box-shadow: none;\n    &:hover,\n    &:focus-within {\n      border: none;\n      box-shadow: none;\n    }\n    &:focus-within {\n      background-color: ",";\n    }\n\n    .dropdown-arrow {\n      border-top-color: ",";\n    }\n    .dropdown-selector-value {\n      text-overflow: ellipsis;\n      white-space: nowrap;\n      overflow: hidden;\n      color: ",";\n    }\n\n    .dropdown-selector-content {\n      margin: 0;\n      margin-top: 2px;\n      .dropdown-option {\n        text-overflow: ellipsis;\n        white-space: nowrap;\n        overflow: hidden;\n      }\n    }\n  }\n"],["\n  && {\n    margin-left: 10px;\n    text-transform: none;\n    font-size: 0.929em;\n    margin: 0 0 10px 0;\n    display: block;\n    background-color: ",";\n    font-size: 1em;\n    border: none;\n    padding: 0.9em 1.6em 0.9em 0.9em;\n    box-shadow: none;\n    &:hover,\n    &:focus-within {\n      border: none;\n      box-shadow: none;\n    }\n    &:focus-within {\n      background-color: ",";\n    }\n\n    .dropdown-arrow {\n      border-top-color: ",";\n    }\n    .dropdown-selector-value {\n      text-overflow: ellipsis;\n      white-space: nowrap;\n      overflow: hidden;\n      color: ",";\n    }\n\n    .dropdown-selector-content {\n      margin: 0;\n      margin-top: 2px;\n      .dropdown-option {\n        text-overflow: ellipsis;\n        white-space: nowrap;\n        overflow: hidden;\n      }\n    }\n  }\n"])),(function(e){var t=e.theme;return J(.6,t.rightPanel.backgroundColor)}),(function(e){var t=e.theme;return J(.3,t.rightPanel.backgroundColor)}),(function(e){return e.theme.rightPanel.textColor}),(function(e){return e.theme.rightPanel.textColor})),Fa=Se.div(Pa||(Pa=Object(o.__makeTemplateObject)(["\n  font-family: ",";\n  font-size: 12px;\n  color: #ee807f;\n"],["\n  font-family: ",";\n  font-size: 12px;\n  color: #ee807f;\n"])),(function(e){return e.theme.typography.code.fontFamily})),za=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.state={activeIdx:0},t.switchMedia=function(e){var n=e.idx;t.setState({activeIdx:n})},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.state.activeIdx,t=this.props.mediaType.examples||{},n=this.props.mediaType.name,r=i.createElement(Fa,null,"No sample"),o=Object.keys(t);if(0===o.length)return r;if(o.length>1){var a=o.map((function(e,n){return{value:t[e].summary||e,idx:n}})),s=(l=t[o[e]]).description;return i.createElement(Ua,null,i.createElement(Ma,null,i.createElement(La,null,"Example"),this.props.renderDropdown({value:a[e].value,options:a,onChange:this.switchMedia,ariaLabel:"Example"})),i.createElement("div",null,s&&i.createElement(ea,{source:s}),i.createElement(Sa,{example:l,mimeType:n})))}var l=t[o[0]];return i.createElement(Ua,null,l.description&&i.createElement(ea,{source:l.description}),i.createElement(Sa,{example:l,mimeType:n}))},t}(i.Component),Ua=Se.div(Ra||(Ra=Object(o.__makeTemplateObject)(["\n  margin-top: 15px;\n"],["\n  margin-top: 15px;\n"]))),Ba=n(7),$a=0;var Wa={};function qa(e){return Wa[e]||(Wa[e]=function(e){if("function"==typeof Symbol)return Symbol(e);var t="__$mobx-react "+e+" ("+$a+")";return $a++,t}(e)),Wa[e]}function Ha(e,t){if(Va(e,t))return!0;if("object"!=typeof e||null===e||"object"!=typeof t||null===t)return!1;var n=Object.keys(e),r=Object.keys(t);if(n.length!==r.length)return!1;for(var o=0;o<n.length;o++)if(!Object.hasOwnProperty.call(t,n[o])||!Va(e[n[o]],t[n[o]]))return!1;return!0}function Va(e,t){return e===t?0!==e||1/e==1/t:e!=e&&t!=t}function Ya(e,t,n){Object.hasOwnProperty.call(e,t)?e[t]=n:Object.defineProperty(e,t,{enumerable:!1,configurable:!0,writable:!0,value:n})}var Ga=qa("patchMixins"),Qa=qa("patchedDefinition");function Xa(e,t){for(var n=this,r=arguments.length,o=new Array(r>2?r-2:0),i=2;i<r;i++)o[i-2]=arguments[i];t.locks++;try{var a;return null!=e&&(a=e.apply(this,o)),a}finally{t.locks--,0===t.locks&&t.methods.forEach((function(e){e.apply(n,o)}))}}function Ka(e,t){return function(){for(var n=arguments.length,r=new Array(n),o=0;o<n;o++)r[o]=arguments[o];Xa.call.apply(Xa,[this,e,t].concat(r))}}function Ja(e,t,n){var r=function(e,t){var n=e[Ga]=e[Ga]||{},r=n[t]=n[t]||{};return r.locks=r.locks||0,r.methods=r.methods||[],r}(e,t);r.methods.indexOf(n)<0&&r.methods.push(n);var o=Object.getOwnPropertyDescriptor(e,t);if(!o||!o[Qa]){var i=e[t],a=function e(t,n,r,o,i){var a,s=Ka(i,o);return(a={})[Qa]=!0,a.get=function(){return s},a.set=function(i){if(this===t)s=Ka(i,o);else{var a=e(this,n,r,o,i);Object.defineProperty(this,n,a)}},a.configurable=!0,a.enumerable=r,a}(e,t,o?o.enumerable:void 0,r,i);Object.defineProperty(e,t,a)}}var Za=Be.a||"$mobx",es=qa("isUnmounted"),ts=qa("skipRender"),ns=qa("isForcingUpdate");function rs(e){var t=e.prototype;if(t.componentWillReact)throw new Error("The componentWillReact life-cycle event is no longer supported");if(e.__proto__!==i.PureComponent)if(t.shouldComponentUpdate){if(t.shouldComponentUpdate!==is)throw new Error("It is not allowed to use shouldComponentUpdate in observer based components.")}else t.shouldComponentUpdate=is;as(t,"props"),as(t,"state");var n=t.render;return t.render=function(){return os.call(this,n)},Ja(t,"componentWillUnmount",(function(){if(!0!==Object(Ba.b)()){if(this.render[Za])this.render[Za].dispose();else;this[es]=!0}})),e}function os(e){var t=this;if(!0===Object(Ba.b)())return e.call(this);Ya(this,ts,!1),Ya(this,ns,!1);var n,r=(n=this).displayName||n.name||n.constructor&&(n.constructor.displayName||n.constructor.name)||"<component>",o=e.bind(this),a=!1,s=new Be.b(r+".render()",(function(){if(!a&&(a=!0,!0!==t[es])){var e=!0;try{Ya(t,ns,!0),t[ts]||i.Component.prototype.forceUpdate.call(t),e=!1}finally{Ya(t,ns,!1),e&&s.dispose()}}}));function l(){a=!1;var e=void 0,t=void 0;if(s.track((function(){try{t=Object(Be.c)(!1,o)}catch(t){e=t}})),e)throw e;return t}return s.reactComponent=this,l[Za]=s,this.render=l,l.call(this)}function is(e,t){return Object(Ba.b)()&&console.warn("[mobx-react] It seems that a re-rendering of a React component is triggered while in static (server-side) mode. Please make sure components are rendered only once server-side."),this.state!==t||!Ha(this.props,e)}function as(e,t){var n=qa("reactProp_"+t+"_valueHolder"),r=qa("reactProp_"+t+"_atomHolder");function o(){return this[r]||Ya(this,r,Object(Be.i)("reactive "+t)),this[r]}Object.defineProperty(e,t,{configurable:!0,enumerable:!0,get:function(){var e=!1;return Be.e&&Be.d&&(e=Object(Be.e)(!0)),o.call(this).reportObserved(),Be.e&&Be.d&&Object(Be.d)(e),this[n]},set:function(e){this[ns]||Ha(this[n],e)?Ya(this,n,e):(Ya(this,n,e),Ya(this,ts,!0),o.call(this).reportChanged(),Ya(this,ts,!1))}})}var ss="function"==typeof Symbol&&Symbol.for,ls=ss?Symbol.for("react.forward_ref"):"function"==typeof i.forwardRef&&Object(i.forwardRef)((function(e){return null})).$$typeof,cs=ss?Symbol.for("react.memo"):"function"==typeof i.memo&&Object(i.memo)((function(e){return null})).$$typeof;function us(e){if(!0===e.isMobxInjector&&console.warn("Mobx observer: You are trying to use 'observer' on a component that already has 'inject'. Please apply 'observer' before applying 'inject'"),cs&&e.$$typeof===cs)throw new Error("Mobx observer: You are trying to use 'observer' on a function component wrapped in either another observer or 'React.memo'. The observer already applies 'React.memo' for you.");if(ls&&e.$$typeof===ls){var t=e.render;if("function"!=typeof t)throw new Error("render property of ForwardRef was not a function");return Object(i.forwardRef)((function(){var e=arguments;return Object(i.createElement)(Ba.a,null,(function(){return t.apply(void 0,e)}))}))}return"function"!=typeof e||e.prototype&&e.prototype.render||e.isReactClass||Object.prototype.isPrototypeOf.call(i.Component,e)?rs(e):Object(Ba.c)(e)}if(!i.Component)throw new Error("mobx-react requires React to be available");if(!Be.n)throw new Error("mobx-react requires mobx to be available");var ps,fs,ds,hs,ms,gs,ys,vs,bs,xs,ws,ks,Os,Es,_s,Ss,Ts,js,As=Se(cr)(ps||(ps=Object(o.__makeTemplateObject)(["\n  button {\n    background-color: transparent;\n    border: 0;\n    outline: 0;\n    font-size: 13px;\n    font-family: ",";\n    cursor: pointer;\n    padding: 0;\n    color: ",";\n    &:focus {\n      font-weight: ",";\n    }\n  }\n  "," {\n    height: ",";\n    width: ",";\n    polygon {\n      fill: ",";\n    }\n  }\n"],["\n  button {\n    background-color: transparent;\n    border: 0;\n    outline: 0;\n    font-size: 13px;\n    font-family: ",";\n    cursor: pointer;\n    padding: 0;\n    color: ",";\n    &:focus {\n      font-weight: ",";\n    }\n  }\n  "," {\n    height: ",";\n    width: ",";\n    polygon {\n      fill: ",";\n    }\n  }\n"])),(function(e){return e.theme.typography.code.fontFamily}),(function(e){return e.theme.colors.text.primary}),(function(e){return e.theme.typography.fontWeightBold}),rr,(function(e){return e.theme.schema.arrow.size}),(function(e){return e.theme.schema.arrow.size}),(function(e){return e.theme.schema.arrow.color})),Cs=Se.span(fs||(fs=Object(o.__makeTemplateObject)(["\n  vertical-align: middle;\n  font-size: ",";\n  line-height: 20px;\n"],["\n  vertical-align: middle;\n  font-size: ",";\n  line-height: 20px;\n"])),(function(e){return e.theme.typography.code.fontSize})),Is=Se(Cs)(ds||(ds=Object(o.__makeTemplateObject)(["\n  color: ",";\n"],["\n  color: ",";\n"])),(function(e){return J(.2,e.theme.schema.typeNameColor)})),Ps=Se(Cs)(hs||(hs=Object(o.__makeTemplateObject)(["\n  color: ",";\n"],["\n  color: ",";\n"])),(function(e){return e.theme.schema.typeNameColor})),Rs=Se(Cs)(ms||(ms=Object(o.__makeTemplateObject)(["\n  color: ",";\n  word-break: break-word;\n"],["\n  color: ",";\n  word-break: break-word;\n"])),(function(e){return e.theme.schema.typeTitleColor})),Ns=Ps,Ls=Se(Cs.withComponent("div"))(gs||(gs=Object(o.__makeTemplateObject)(["\n  color: ",";\n  font-size: ",";\n  font-weight: normal;\n  margin-left: 20px;\n  line-height: 1;\n"],["\n  color: ",";\n  font-size: ",";\n  font-weight: normal;\n  margin-left: 20px;\n  line-height: 1;\n"])),(function(e){return e.theme.schema.requireLabelColor}),(function(e){return e.theme.schema.labelsTextSize})),Ms=Se(Cs)(ys||(ys=Object(o.__makeTemplateObject)(["\n  color: ",";\n  font-size: 13px;\n"],["\n  color: ",";\n  font-size: 13px;\n"])),(function(e){return e.theme.colors.warning.main})),Ds=Se(Cs)(vs||(vs=Object(o.__makeTemplateObject)(["\n  color: #3195a6;\n  font-size: 13px;\n"],["\n  color: #3195a6;\n  font-size: 13px;\n"]))),Fs=Se(Cs)(bs||(bs=Object(o.__makeTemplateObject)(["\n  color: #3195a6;\n  &::before,\n  &::after {\n    font-weight: bold;\n  }\n"],["\n  color: #3195a6;\n  &::before,\n  &::after {\n    font-weight: bold;\n  }\n"]))),zs=Se(Cs)(xs||(xs=Object(o.__makeTemplateObject)(["\n  border-radius: 2px;\n  ",";\n  & + & {\n    margin-left: 0;\n  }\n  ",";\n"],["\n  border-radius: 2px;\n  ",";\n  & + & {\n    margin-left: 0;\n  }\n  ",";\n"])),(function(e){var t=e.theme;return"\n    background-color: "+J(.95,t.colors.text.primary)+";\n    color: "+J(.1,t.colors.text.primary)+";\n\n    padding: 0 "+t.spacing.unit+"px;\n    border: 1px solid "+J(.9,t.colors.text.primary)+";\n    font-family: "+t.typography.code.fontFamily+";\n}"}),Te("ExampleValue")),Us=Se(zs)(ws||(ws=Object(o.__makeTemplateObject)([""],[""]))),Bs=Se(Cs)(ks||(ks=Object(o.__makeTemplateObject)(["\n  border-radius: 2px;\n  ",";\n  & + & {\n    margin-left: 0;\n  }\n  ",";\n"],["\n  border-radius: 2px;\n  ",";\n  & + & {\n    margin-left: 0;\n  }\n  ",";\n"])),(function(e){var t=e.theme;return"\n    background-color: "+J(.95,t.colors.primary.light)+";\n    color: "+J(.1,t.colors.primary.main)+";\n\n    margin: 0 "+t.spacing.unit+"px;\n    padding: 0 "+t.spacing.unit+"px;\n    border: 1px solid "+J(.9,t.colors.primary.main)+";\n    font-family: "+t.typography.code.fontFamily+";\n}"}),Te("ConstraintItem")),$s=Se.div(Os||(Os=Object(o.__makeTemplateObject)(["\n  ",";\n  ","\n"],["\n  ",";\n  ","\n"])),Hi,(function(e){return e.compact?"":"margin: 1em 0"})),Ws=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.externalDocs;return e&&e.url?i.createElement($s,{compact:this.props.compact},i.createElement("a",{href:e.url},e.description||e.url)):null},t=Object(o.__decorate)([us],t)}(i.Component),qs=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.state={collapsed:!0},t}return Object(o.__extends)(t,e),t.prototype.toggle=function(){this.setState({collapsed:!this.state.collapsed})},t.prototype.render=function(){var e=this,t=this.props,n=t.values,r=t.type,o=this.state.collapsed,a=this.context,s=a.enumSkipQuotes,l=a.maxDisplayedEnumValues;if(!n.length)return null;var c=this.state.collapsed&&l?n.slice(0,l):n,u=!!l&&n.length>l,p=l?o?"… "+(n.length-l)+" more":"Hide":"";return i.createElement("div",null,i.createElement(Cs,null,"array"===r?he("enumArray"):""," ",1===n.length?he("enumSingleValue"):he("enum"),":")," ",c.map((function(e,t){var n=s?e:JSON.stringify(e);return i.createElement(i.Fragment,{key:t},i.createElement(zs,null,n)," ")})),u?i.createElement(Hs,{onClick:function(){e.toggle()}},p):null)},t.contextType=Fe,t}(i.PureComponent),Hs=Se.span(Es||(Es=Object(o.__makeTemplateObject)(["\n  color: ",";\n  vertical-align: middle;\n  font-size: 13px;\n  line-height: 20px;\n  padding: 0 5px;\n  cursor: pointer;\n"],["\n  color: ",";\n  vertical-align: middle;\n  font-size: 13px;\n  line-height: 20px;\n  padding: 0 5px;\n  cursor: pointer;\n"])),(function(e){return e.theme.colors.primary.main})),Vs=Se(Vi)(_s||(_s=Object(o.__makeTemplateObject)(["\n  margin: 2px 0;\n"],["\n  margin: 2px 0;\n"]))),Ys=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.extensions;return i.createElement(Fe.Consumer,null,(function(t){return i.createElement(i.Fragment,null,t.showExtensions&&Object.keys(e).map((function(t){return i.createElement(Vs,{key:t},i.createElement(Cs,null," ",t.substring(2),": ")," ",i.createElement(Us,null,"string"==typeof e[t]?e[t]:JSON.stringify(e[t])))})))}))},t}(i.PureComponent),Gs=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){return 0===this.props.constraints.length?null:i.createElement("span",null," ",this.props.constraints.map((function(e){return i.createElement(Bs,{key:e}," ",e," ")})))},t}(i.PureComponent),Qs=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){if(void 0===this.props.value)return null;var e=this.props.raw?this.props.value:JSON.stringify(this.props.value);return i.createElement("div",null,i.createElement(Cs,null," ",this.props.label," ")," ",i.createElement(zs,null,e))},t}(i.PureComponent),Xs=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.showExamples,n=e.field,r=e.renderDiscriminatorSwitch,a=this.context,s=a.enumSkipQuotes,l=a.hideSchemaTitles,c=n.schema,u=n.description,p=n.example,f=n.deprecated,d=!!s||"header"===n.in,h=null;if(t&&void 0!==p){var m=he("example")+":";if(n.in&&(n.style||n.serializationMime)){var g=decodeURIComponent(ct(n,p));h=i.createElement(Qs,{label:m,value:g,raw:!0})}else h=i.createElement(Qs,{label:m,value:p})}return i.createElement("div",null,i.createElement("div",null,i.createElement(Is,null,c.typePrefix),i.createElement(Ps,null,c.displayType),c.displayFormat&&i.createElement(Ns,null," ","<",c.displayFormat,">"," "),c.title&&!l&&i.createElement(Rs,null," (",c.title,") "),i.createElement(Gs,{constraints:c.constraints}),c.nullable&&i.createElement(Ds,null," ",he("nullable")," "),c.pattern&&c.pattern.length<45&&i.createElement(Fs,null," ",c.pattern," "),c.isCircular&&i.createElement(Ms,null," ",he("recursive")," ")),f&&i.createElement("div",null,i.createElement(or,{type:"warning"}," ",he("deprecated")," ")),i.createElement(Qs,{raw:d,label:he("default")+":",value:c.default}),!r&&i.createElement(qs,{type:c.type,values:c.enum})," ",h,i.createElement(Ys,{extensions:Object(o.__assign)(Object(o.__assign)({},n.extensions),c.extensions)}),i.createElement("div",null,i.createElement(ea,{compact:!0,source:u})),c.externalDocs&&i.createElement(Ws,{externalDocs:c.externalDocs,compact:!0}),r&&r(this.props)||null)},t.contextType=Fe,t}(i.PureComponent),Ks=Se.div(Ss||(Ss=Object(o.__makeTemplateObject)(["\n  padding-left: ","px;\n"],["\n  padding-left: ","px;\n"])),(function(e){return 2*e.theme.spacing.unit})),Js=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.schema.items,t=ft(function(e,t){return void 0===e&&(e=void 0),void 0===t&&(t=void 0),{type:"array",minItems:e,maxItems:t}}(e.schema.minItems,e.schema.maxItems));return i.createElement("div",null,i.createElement(yr,null," Array (",t,")"),i.createElement(Ks,null,i.createElement(ol,Object(o.__assign)({},this.props,{schema:e}))),i.createElement(vr,null))},t}(i.PureComponent),Zs=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.toggle=function(){void 0===t.props.field.expanded&&t.props.expandByDefault?t.props.field.expanded=!1:t.props.field.toggle()},t.handleKeyPress=function(e){"Enter"===e.key&&(e.preventDefault(),t.toggle())},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.className,n=e.field,r=e.isLast,a=e.expandByDefault,s=n.name,l=n.deprecated,c=n.required,u=n.kind,p=!n.schema.isPrimitive&&!n.schema.isCircular,f=void 0===n.expanded?a:n.expanded,d=p?i.createElement(As,{className:l?"deprecated":"",kind:u,title:s},i.createElement(pr,null),i.createElement("button",{onClick:this.toggle,onKeyPress:this.handleKeyPress,"aria-label":"expand properties"},s,i.createElement(rr,{direction:f?"down":"right"})),c&&i.createElement(Ls,null," required ")):i.createElement(cr,{className:l?"deprecated":void 0,kind:u,title:s},i.createElement(pr,null),s,c&&i.createElement(Ls,null," required "));return i.createElement(i.Fragment,null,i.createElement("tr",{className:r?"last "+t:t},d,i.createElement(ur,null,i.createElement(Xs,Object(o.__assign)({},this.props)))),f&&p&&i.createElement("tr",{key:n.name+"inner"},i.createElement(lr,{colSpan:2},i.createElement(fr,null,i.createElement(ol,{schema:n.schema,skipReadOnly:this.props.skipReadOnly,skipWriteOnly:this.props.skipWriteOnly,showTitle:this.props.showTitle})))))},t=Object(o.__decorate)([us],t)}(i.Component),el=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.changeActiveChild=function(e){t.props.parent.activateOneOf(e.idx)},t}return Object(o.__extends)(t,e),t.prototype.sortOptions=function(e,t){if(0!==t.length){var n={};t.forEach((function(e,t){n[e]=t})),e.sort((function(e,t){return n[e.value]>n[t.value]?1:-1}))}},t.prototype.render=function(){var e=this.props,t=e.parent,n=e.enumValues;if(void 0===t.oneOf)return null;var r=t.oneOf.map((function(e,t){return{value:e.title,idx:t}})),o=r[t.activeOneOf].value;return this.sortOptions(r,n),i.createElement(io,{value:o,options:r,onChange:this.changeActiveChild})},t=Object(o.__decorate)([us],t)}(i.Component),tl=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),Object.defineProperty(t.prototype,"parentSchema",{get:function(){return this.props.discriminator.parentSchema},enumerable:!1,configurable:!0}),t.prototype.render=function(){var e=this,t=this.props,n=t.schema.fields,r=void 0===n?[]:n,o=t.showTitle,a=t.discriminator,s=this.props.skipReadOnly||this.props.skipWriteOnly?r.filter((function(t){return!(e.props.skipReadOnly&&t.schema.readOnly||e.props.skipWriteOnly&&t.schema.writeOnly)})):r,l=this.context.expandSingleSchemaField&&1===s.length;return i.createElement(dr,null,o&&i.createElement(ar,null,this.props.schema.title),i.createElement("tbody",null,ae(s,(function(t,n){return i.createElement(Zs,{key:t.name,isLast:n,field:t,expandByDefault:l,renderDiscriminatorSwitch:a&&a.fieldName===t.name&&function(){return i.createElement(el,{parent:e.parentSchema,enumValues:t.schema.enum})}||void 0,className:t.expanded?"expanded":void 0,showExamples:!1,skipReadOnly:e.props.skipReadOnly,skipWriteOnly:e.props.skipWriteOnly,showTitle:e.props.showTitle})}))))},t.contextType=Fe,t=Object(o.__decorate)([us],t)}(i.Component),nl=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.activateOneOf=function(){t.props.schema.activateOneOf(t.props.idx)},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.idx,n=e.schema,r=e.subSchema;return i.createElement(gr,{active:t===n.activeOneOf,onClick:this.activateOneOf},r.title||r.typePrefix+r.displayType)},t=Object(o.__decorate)([us],t)}(i.Component),rl=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.schema.oneOf,n=e.schema;return void 0===t?null:i.createElement("div",null,i.createElement(mr,null," ",n.oneOfType," "),i.createElement(hr,null,t.map((function(e,t){return i.createElement(nl,{key:e.pointer,schema:n,subSchema:e,idx:t})}))),i.createElement(ol,Object(o.__assign)({},this.props,{schema:t[n.activeOneOf]})))},t=Object(o.__decorate)([us],t)}(i.Component),ol=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.schema;if(!e)return i.createElement("em",null," Schema not provided ");var t=e.type,n=e.oneOf,r=e.discriminatorProp;if(e.isCircular)return i.createElement("div",null,i.createElement(Ps,null,e.displayType),e.title&&i.createElement(Rs,null," ",e.title," "),i.createElement(Ms,null," ",he("recursive")," "));if(void 0!==r)return n&&n.length?i.createElement(tl,Object(o.__assign)({},Object(o.__assign)(Object(o.__assign)({},this.props),{schema:n[e.activeOneOf]}),{discriminator:{fieldName:r,parentSchema:e}})):(console.warn("Looks like you are using discriminator wrong: you don't have any definition inherited from the "+e.title),null);if(void 0!==n)return i.createElement(rl,Object(o.__assign)({schema:e},this.props));switch(t){case"object":return i.createElement(tl,Object(o.__assign)({},this.props));case"array":return i.createElement(Js,Object(o.__assign)({},this.props))}var a={schema:e,name:"",required:!1,description:e.description,externalDocs:e.externalDocs,deprecated:!1,toggle:function(){return null},expanded:!1};return i.createElement("div",null,i.createElement(Xs,{field:a}))},t=Object(o.__decorate)([us],t)}(i.Component),il=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.renderDropdown=function(e){return i.createElement(Bi,Object(o.__assign)({Label:so,Dropdown:Da},e))},t}return Object(o.__extends)(t,e),t.getMediaType=function(e,t){if(!e)return{};var n={schema:{$ref:e}};return t&&(n.examples={example:{$ref:t}}),n},Object.defineProperty(t.prototype,"mediaModel",{get:function(){var e=this.props,n=e.parser,r=e.schemaRef,o=e.exampleRef,i=e.options;return this._mediaModel||(this._mediaModel=new Ht(n,"json",!1,t.getMediaType(r,o),i)),this._mediaModel},enumerable:!1,configurable:!0}),t.prototype.render=function(){var e=this.props,t=e.showReadOnly,n=void 0===t||t,r=e.showWriteOnly,o=void 0!==r&&r;return i.createElement(yn,null,i.createElement(xn,null,i.createElement(gn,null,i.createElement(ol,{skipWriteOnly:!o,skipReadOnly:!n,schema:this.mediaModel.schema})),i.createElement(bn,null,i.createElement(al,null,i.createElement(za,{renderDropdown:this.renderDropdown,mediaType:this.mediaModel})))))},t}(i.PureComponent),al=Se.div(Ts||(Ts=Object(o.__makeTemplateObject)(["\n  background: ",";\n  & > div,\n  & > pre {\n    padding: ","px;\n    margin: 0;\n  }\n\n  & > div > pre {\n    padding: 0;\n  }\n"],["\n  background: ",";\n  & > div,\n  & > pre {\n    padding: ","px;\n    margin: 0;\n  }\n\n  & > div > pre {\n    padding: 0;\n  }\n"])),(function(e){return e.theme.codeBlock.backgroundColor}),(function(e){return 4*e.theme.spacing.unit})),sl={oauth2:"OAuth2",apiKey:"API Key",http:"HTTP",openIdConnect:"Open ID Connect"},ll=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.type,n=e.flow;return i.createElement("tr",null,i.createElement("th",null," ",t," OAuth Flow "),i.createElement("td",null,"implicit"===t||"authorizationCode"===t?i.createElement("div",null,i.createElement("strong",null," Authorization URL: "),n.authorizationUrl):null,"password"===t||"clientCredentials"===t||"authorizationCode"===t?i.createElement("div",null,i.createElement("strong",null," Token URL: "),n.tokenUrl):null,n.refreshUrl&&i.createElement("div",null,i.createElement("strong",null," Refresh URL: "),n.refreshUrl),i.createElement("div",null,i.createElement("strong",null," Scopes: ")),i.createElement("ul",null,Object.keys(n.scopes||{}).map((function(e){return i.createElement("li",{key:e},i.createElement("code",null,e)," - ",i.createElement(ea,{inline:!0,source:n.scopes[e]||""}))})))))},t}(i.PureComponent),cl=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){return this.props.securitySchemes.schemes.map((function(e){return i.createElement(yn,{id:e.sectionId,key:e.id},i.createElement(xn,null,i.createElement(gn,null,i.createElement(En,null,i.createElement(Mn,{to:e.sectionId}),e.id),i.createElement(ea,{source:e.description||""}),i.createElement(Vi,null,i.createElement("table",{className:"security-details"},i.createElement("tbody",null,i.createElement("tr",null,i.createElement("th",null," Security Scheme Type "),i.createElement("td",null," ",sl[e.type]||e.type," ")),e.apiKey?i.createElement("tr",null,i.createElement("th",null," ",(t=e.apiKey.in||"").charAt(0).toUpperCase()+t.slice(1)," parameter name:"),i.createElement("td",null," ",e.apiKey.name," ")):e.http?[i.createElement("tr",{key:"scheme"},i.createElement("th",null," HTTP Authorization Scheme "),i.createElement("td",null," ",e.http.scheme," ")),"bearer"===e.http.scheme&&e.http.bearerFormat&&i.createElement("tr",{key:"bearer"},i.createElement("th",null," Bearer format "),i.createElement("td",null,' "',e.http.bearerFormat,'" '))]:e.openId?i.createElement("tr",null,i.createElement("th",null," Connect URL "),i.createElement("td",null,i.createElement("a",{target:"_blank",rel:"noopener noreferrer",href:e.openId.connectUrl},e.openId.connectUrl))):e.flows?Object.keys(e.flows).map((function(t){return i.createElement(ll,{key:t,type:t,flow:e.flows[t]})})):null))))));var t}))},t}(i.PureComponent);var ul,pl,fl,dl,hl,ml,gl,yl,vl=function(){function e(e,t,n,r){var o=this;void 0===n&&(n={}),void 0===r&&(r=!0),this.marker=new At,this.disposer=null,this.rawOptions=n,this.options=new ye(n,bl),this.scroll=new zi(this.options),Fi.updateOnHistory(Tt.currentId,this.scroll),this.spec=new Ni(e,t,this.options),this.menu=new Fi(this.spec,this.scroll,Tt),this.options.disableSearch||(this.search=new Ui,r&&this.search.indexItems(this.menu.items),this.disposer=Object(Be.o)(this.menu,"activeItemIdx",(function(e){o.updateMarkOnMenu(e.newValue)})))}return e.fromJS=function(t){var n=new e(t.spec.data,t.spec.url,t.options,!1);return n.menu.activeItemIdx=t.menu.activeItemIdx||0,n.menu.activate(n.menu.flatItems[n.menu.activeItemIdx]),n.options.disableSearch||n.search.load(t.searchIndex),n},e.prototype.onDidMount=function(){this.menu.updateOnHistory(),this.updateMarkOnMenu(this.menu.activeItemIdx)},e.prototype.dispose=function(){this.scroll.dispose(),this.menu.dispose(),this.search&&this.search.dispose(),null!=this.disposer&&this.disposer()},e.prototype.toJS=function(){return Object(o.__awaiter)(this,void 0,void 0,(function(){var e,t;return Object(o.__generator)(this,(function(n){switch(n.label){case 0:return e={menu:{activeItemIdx:this.menu.activeItemIdx},spec:{url:this.spec.parser.specUrl,data:this.spec.parser.spec}},this.search?[4,this.search.toJS()]:[3,2];case 1:return t=n.sent(),[3,3];case 2:t=void 0,n.label=3;case 3:return[2,(e.searchIndex=t,e.options=this.rawOptions,e)]}}))}))},e.prototype.updateMarkOnMenu=function(e){for(var t=Math.max(0,e),n=Math.min(this.menu.flatItems.length,t+5),r=[],o=t;o<n;o++){var i=this.menu.getElementAt(o);i&&r.push(i)}if(-1===e&&te){var a=document.querySelector('[data-role="redoc-description"]');a&&r.push(a)}this.marker.addOnly(r),this.marker.mark()},e}(),bl={allowedMdComponents:(js={},js["security-definitions"]={component:cl,propsSelector:function(e){return{securitySchemes:e.spec.securitySchemes}}},js.SecurityDefinitions={component:cl,propsSelector:function(e){return{securitySchemes:e.spec.securitySchemes}}},js.SchemaDefinition={component:il,propsSelector:function(e){return{parser:e.spec.parser,options:e.options}}},js)},xl=Se(On)(ul||(ul=Object(o.__makeTemplateObject)(["\n  margin-top: 0;\n  margin-bottom: 0.5em;\n\n  ",";\n"],["\n  margin-top: 0;\n  margin-bottom: 0.5em;\n\n  ",";\n"])),Te("ApiHeader")),wl=Se.a(pl||(pl=Object(o.__makeTemplateObject)(["\n  border: 1px solid ",";\n  color: ",";\n  font-weight: normal;\n  margin-left: 0.5em;\n  padding: 4px 8px 4px;\n  display: inline-block;\n  text-decoration: none;\n  cursor: pointer;\n\n  ",";\n"],["\n  border: 1px solid ",";\n  color: ",";\n  font-weight: normal;\n  margin-left: 0.5em;\n  padding: 4px 8px 4px;\n  display: inline-block;\n  text-decoration: none;\n  cursor: pointer;\n\n  ",";\n"])),(function(e){return e.theme.colors.primary.main}),(function(e){return e.theme.colors.primary.main}),Te("DownloadButton")),kl=Se.span(fl||(fl=Object(o.__makeTemplateObject)(["\n  &::before {\n    content: '|';\n    display: inline-block;\n    opacity: 0.5;\n    width: ","px;\n    text-align: center;\n  }\n\n  &:last-child::after {\n    display: none;\n  }\n"],["\n  &::before {\n    content: '|';\n    display: inline-block;\n    opacity: 0.5;\n    width: ","px;\n    text-align: center;\n  }\n\n  &:last-child::after {\n    display: none;\n  }\n"])),15),Ol=Se.div(dl||(dl=Object(o.__makeTemplateObject)(["\n  overflow: hidden;\n"],["\n  overflow: hidden;\n"]))),El=Se.div(hl||(hl=Object(o.__makeTemplateObject)(["\n  display: flex;\n  flex-wrap: wrap;\n  // hide separator on new lines: idea from https://stackoverflow.com/a/31732902/1749888\n  margin-left: -","px;\n"],["\n  display: flex;\n  flex-wrap: wrap;\n  // hide separator on new lines: idea from https://stackoverflow.com/a/31732902/1749888\n  margin-left: -","px;\n"])),15),_l=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.handleDownloadClick=function(e){e.target.href||(e.target.href=t.props.store.spec.info.downloadLink)},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.store,t=e.spec,n=t.info,r=t.externalDocs,o=e.options.hideDownloadButton,a=n.downloadFileName,s=n.downloadLink,l=n.license&&i.createElement(kl,null,"License: ",i.createElement("a",{href:n.license.url},n.license.name))||null,c=n.contact&&n.contact.url&&i.createElement(kl,null,"URL: ",i.createElement("a",{href:n.contact.url},n.contact.url))||null,u=n.contact&&n.contact.email&&i.createElement(kl,null,n.contact.name||"E-mail",":"," ",i.createElement("a",{href:"mailto:"+n.contact.email},n.contact.email))||null,p=n.termsOfService&&i.createElement(kl,null,i.createElement("a",{href:n.termsOfService},"Terms of Service"))||null,f=n.version&&i.createElement("span",null,"(",n.version,")")||null;return i.createElement(yn,null,i.createElement(xn,null,i.createElement(gn,{className:"api-info"},i.createElement(xl,null,n.title," ",f),!o&&i.createElement("p",null,"Download OpenAPI specification:",i.createElement(wl,{download:a||!0,target:"_blank",href:s,onClick:this.handleDownloadClick},"Download")),i.createElement(Vi,null,(n.license||n.contact||n.termsOfService)&&i.createElement(Ol,null,i.createElement(El,null,u," ",c," ",l," ",p))||null),i.createElement(ea,{source:e.spec.info.description,"data-role":"redoc-description"}),r&&i.createElement(Ws,{externalDocs:r}))))},t=Object(o.__decorate)([us],t)}(i.Component),Sl=Se.img(ml||(ml=Object(o.__makeTemplateObject)(["\n  max-height: ",";\n  max-width: ",";\n  padding: ",";\n  width: 100%;\n  display: block;\n"],["\n  max-height: ",";\n  max-width: ",";\n  padding: ",";\n  width: 100%;\n  display: block;\n"])),(function(e){return e.theme.logo.maxHeight}),(function(e){return e.theme.logo.maxWidth}),(function(e){return e.theme.logo.gutter})),Tl=Se.div(gl||(gl=Object(o.__makeTemplateObject)(["\n  text-align: center;\n"],["\n  text-align: center;\n"]))),jl=Se.a(yl||(yl=Object(o.__makeTemplateObject)(["\n  display: inline-block;\n"],["\n  display: inline-block;\n"]))),Al=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.info,t=e["x-logo"];if(!t||!t.url)return null;var n,r=t.href||e.contact&&e.contact.url,o=t.altText?t.altText:"logo",a=i.createElement(Sl,{src:t.url,alt:o});return i.createElement(Tl,{style:{backgroundColor:t.backgroundColor}},r?(n=r,function(e){return i.createElement(jl,{href:n},e)})(a):a)},t=Object(o.__decorate)([us],t)}(i.Component),Cl=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this;return i.createElement(Ue,null,(function(t){return i.createElement(Cn,null,(function(n){return e.renderWithOptionsAndStore(t,n)}))}))},t.prototype.renderWithOptionsAndStore=function(e,t){var n=this.props,r=n.source,a=n.htmlWrap,s=void 0===a?function(e){return e}:a;if(!t)throw new Error("When using components in markdown, store prop must be provided");var l=new Rt(e).renderMdWithComponents(r);return l.length?l.map((function(e,n){return"string"==typeof e?i.cloneElement(s(i.createElement(Gi,{html:e,inline:!1,compact:!1})),{key:n}):i.createElement(e.component,Object(o.__assign)({key:n},Object(o.__assign)(Object(o.__assign)({},e.props),e.propsSelector(t))))})):null},t}(i.Component),Il=n(158),Pl=Se.span.attrs((function(e){return{className:"operation-type "+e.type}}))(Nl||(Nl=Object(o.__makeTemplateObject)(["\n  width: 9ex;\n  display: inline-block;\n  height: ",";\n  line-height: ",";\n  background-color: #333;\n  border-radius: 3px;\n  background-repeat: no-repeat;\n  background-position: 6px 4px;\n  font-size: 7px;\n  font-family: Verdana, sans-serif; // web-safe\n  color: white;\n  text-transform: uppercase;\n  text-align: center;\n  font-weight: bold;\n  vertical-align: middle;\n  margin-right: 6px;\n  margin-top: 2px;\n\n  &.get {\n    background-color: ",";\n  }\n\n  &.post {\n    background-color: ",";\n  }\n\n  &.put {\n    background-color: ",";\n  }\n\n  &.options {\n    background-color: ",";\n  }\n\n  &.patch {\n    background-color: ",";\n  }\n\n  &.delete {\n    background-color: ",";\n  }\n\n  &.basic {\n    background-color: ",";\n  }\n\n  &.link {\n    background-color: ",";\n  }\n\n  &.head {\n    background-color: ",";\n  }\n\n  &.hook {\n    background-color: ",";\n  }\n"],["\n  width: 9ex;\n  display: inline-block;\n  height: ",";\n  line-height: ",";\n  background-color: #333;\n  border-radius: 3px;\n  background-repeat: no-repeat;\n  background-position: 6px 4px;\n  font-size: 7px;\n  font-family: Verdana, sans-serif; // web-safe\n  color: white;\n  text-transform: uppercase;\n  text-align: center;\n  font-weight: bold;\n  vertical-align: middle;\n  margin-right: 6px;\n  margin-top: 2px;\n\n  &.get {\n    background-color: ",";\n  }\n\n  &.post {\n    background-color: ",";\n  }\n\n  &.put {\n    background-color: ",";\n  }\n\n  &.options {\n    background-color: ",";\n  }\n\n  &.patch {\n    background-color: ",";\n  }\n\n  &.delete {\n    background-color: ",";\n  }\n\n  &.basic {\n    background-color: ",";\n  }\n\n  &.link {\n    background-color: ",";\n  }\n\n  &.head {\n    background-color: ",";\n  }\n\n  &.hook {\n    background-color: ",";\n  }\n"])),(function(e){return e.theme.typography.code.fontSize}),(function(e){return e.theme.typography.code.fontSize}),(function(e){return e.theme.colors.http.get}),(function(e){return e.theme.colors.http.post}),(function(e){return e.theme.colors.http.put}),(function(e){return e.theme.colors.http.options}),(function(e){return e.theme.colors.http.patch}),(function(e){return e.theme.colors.http.delete}),(function(e){return e.theme.colors.http.basic}),(function(e){return e.theme.colors.http.link}),(function(e){return e.theme.colors.http.head}),(function(e){return e.theme.colors.primary.main}));function Rl(e,t){var n=t.theme;return e>1?W(.1,n.sidebar.backgroundColor):1===e?W(.05,n.sidebar.backgroundColor):""}var Nl,Ll,Ml,Dl,Fl,zl,Ul,Bl,$l,Wl,ql,Hl,Vl,Yl,Gl,Ql,Xl,Kl,Jl,Zl,ec,tc=Se.ul(Ll||(Ll=Object(o.__makeTemplateObject)(["\n  margin: 0;\n  padding: 0;\n\n  & & {\n    font-size: 0.929em;\n  }\n\n  ",";\n"],["\n  margin: 0;\n  padding: 0;\n\n  & & {\n    font-size: 0.929em;\n  }\n\n  ",";\n"])),(function(e){return e.expanded?"":"display: none;"})),nc=Se.li(Ml||(Ml=Object(o.__makeTemplateObject)(["\n  list-style: none inside none;\n  overflow: hidden;\n  text-overflow: ellipsis;\n  padding: 0;\n  ",";\n"],["\n  list-style: none inside none;\n  overflow: hidden;\n  text-overflow: ellipsis;\n  padding: 0;\n  ",";\n"])),(function(e){return 0===e.depth?"margin-top: 15px":""})),rc={0:we(Dl||(Dl=Object(o.__makeTemplateObject)(["\n    opacity: 0.7;\n    text-transform: ",";\n    font-size: 0.8em;\n    padding-bottom: 0;\n    cursor: default;\n    color: ",";\n  "],["\n    opacity: 0.7;\n    text-transform: ",";\n    font-size: 0.8em;\n    padding-bottom: 0;\n    cursor: default;\n    color: ",";\n  "])),(function(e){return e.theme.sidebar.groupItems.textTransform}),(function(e){return e.theme.sidebar.textColor})),1:we(Fl||(Fl=Object(o.__makeTemplateObject)(["\n    font-size: 0.929em;\n    text-transform: ",";\n    &:hover {\n      color: ",";\n    }\n  "],["\n    font-size: 0.929em;\n    text-transform: ",";\n    &:hover {\n      color: ",";\n    }\n  "])),(function(e){return e.theme.sidebar.level1Items.textTransform}),(function(e){return e.theme.sidebar.activeTextColor})),2:we(zl||(zl=Object(o.__makeTemplateObject)(["\n    color: ",";\n  "],["\n    color: ",";\n  "])),(function(e){return e.theme.sidebar.textColor}))},oc=Se.label.attrs((function(e){return{role:"menuitem",className:Il("-depth"+e.depth,{active:e.active})}}))(Ul||(Ul=Object(o.__makeTemplateObject)(["\n  cursor: pointer;\n  color: ",";\n  margin: 0;\n  padding: 12.5px ","px;\n  ","\n  display: flex;\n  justify-content: space-between;\n  font-family: ",";\n  ",";\n  background-color: ",";\n\n  ",";\n\n  &:hover {\n    background-color: ",";\n  }\n\n  "," {\n    height: ",";\n    width: ",";\n    polygon {\n      fill: ",";\n    }\n  }\n"],["\n  cursor: pointer;\n  color: ",";\n  margin: 0;\n  padding: 12.5px ","px;\n  ","\n  display: flex;\n  justify-content: space-between;\n  font-family: ",";\n  ",";\n  background-color: ",";\n\n  ",";\n\n  &:hover {\n    background-color: ",";\n  }\n\n  "," {\n    height: ",";\n    width: ",";\n    polygon {\n      fill: ",";\n    }\n  }\n"])),(function(e){return e.active?e.theme.sidebar.activeTextColor:e.theme.sidebar.textColor}),(function(e){return 4*e.theme.spacing.unit}),(function(e){var t=e.depth,n=e.type,r=e.theme;return"section"===n&&t>1&&"padding-left: "+8*r.spacing.unit+"px;"||""}),(function(e){return e.theme.typography.headings.fontFamily}),(function(e){return rc[e.depth]}),(function(e){return e.active?Rl(e.depth,e):""}),(function(e){return e.deprecated&&ir||""}),(function(e){return Rl(e.depth,e)}),rr,(function(e){return e.theme.sidebar.arrow.size}),(function(e){return e.theme.sidebar.arrow.size}),(function(e){return e.theme.sidebar.arrow.color})),ic=Se.span(Bl||(Bl=Object(o.__makeTemplateObject)(["\n  display: inline-block;\n  vertical-align: middle;\n  width: ",";\n  overflow: hidden;\n  text-overflow: ellipsis;\n"],["\n  display: inline-block;\n  vertical-align: middle;\n  width: ",";\n  overflow: hidden;\n  text-overflow: ellipsis;\n"])),(function(e){return e.width?e.width:"auto"})),ac=Se.div($l||($l=Object(o.__makeTemplateObject)(["\n  ",";\n"],["\n  ",";\n"])),(function(e){var t=e.theme;return"\n  font-size: 0.8em;\n  margin-top: "+2*t.spacing.unit+"px;\n  padding: 0 "+4*t.spacing.unit+"px;\n  text-align: left;\n\n  opacity: 0.7;\n\n  a,\n  a:visited,\n  a:hover {\n    color: "+t.sidebar.textColor+" !important;\n    border-top: 1px solid "+W(.1,t.sidebar.backgroundColor)+";\n    padding: "+t.spacing.unit+"px 0;\n    display: block;\n  }\n"})),sc=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.name,n=e.opened,r=e.className,o=e.onClick,a=e.httpVerb,s=e.deprecated;return i.createElement(lc,{className:r,onClick:o||void 0},i.createElement(uc,{type:a},yt(a)),i.createElement(rr,{size:"1.5em",direction:n?"down":"right",float:"left"}),i.createElement(cc,{deprecated:s},t),s?i.createElement(or,{type:"warning"}," ",he("deprecated")," "):null)},t}(i.PureComponent),lc=Se.button(Wl||(Wl=Object(o.__makeTemplateObject)(["\n  border: 0;\n  width: 100%;\n  text-align: left;\n  & > * {\n    vertical-align: middle;\n  }\n\n  "," {\n    polygon {\n      fill: ",";\n    }\n  }\n"],["\n  border: 0;\n  width: 100%;\n  text-align: left;\n  & > * {\n    vertical-align: middle;\n  }\n\n  "," {\n    polygon {\n      fill: ",";\n    }\n  }\n"])),rr,(function(e){var t=e.theme;return W(t.colors.tonalOffset,t.colors.gray[100])})),cc=Se.span(ql||(ql=Object(o.__makeTemplateObject)(["\n  text-decoration: ",";\n  margin-right: 8px;\n"],["\n  text-decoration: ",";\n  margin-right: 8px;\n"])),(function(e){return e.deprecated?"line-through":"none"})),uc=Se(Pl)(Hl||(Hl=Object(o.__makeTemplateObject)(["\n  margin: 0px 5px 0px 0px;\n"],["\n  margin: 0px 5px 0px 0px;\n"]))),pc=Se(sc)(Vl||(Vl=Object(o.__makeTemplateObject)(["\n  padding: 10px;\n  border-radius: 2px;\n  margin-bottom: 4px;\n  line-height: 1.5em;\n  background-color: ",";\n  cursor: pointer;\n  outline-color: ",";\n"],["\n  padding: 10px;\n  border-radius: 2px;\n  margin-bottom: 4px;\n  line-height: 1.5em;\n  background-color: ",";\n  cursor: pointer;\n  outline-color: ",";\n"])),(function(e){return e.theme.colors.gray[100]}),(function(e){var t=e.theme;return W(t.colors.tonalOffset,t.colors.gray[100])})),fc=Se.div(Yl||(Yl=Object(o.__makeTemplateObject)(["\n  padding: 10px 25px;\n  background-color: ",";\n  margin-bottom: 5px;\n  margin-top: 5px;\n"],["\n  padding: 10px 25px;\n  background-color: ",";\n  margin-bottom: 5px;\n  margin-top: 5px;\n"])),(function(e){return e.theme.colors.gray[50]})),dc=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.selectElement=function(){la.selectElement(t.child)},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this,t=this.props.children;return i.createElement("div",{ref:function(t){return e.child=t},onClick:this.selectElement,onFocus:this.selectElement,tabIndex:0,role:"button"},t)},t}(i.PureComponent),hc=Se.div(Gl||(Gl=Object(o.__makeTemplateObject)(["\n  cursor: pointer;\n  position: relative;\n  margin-bottom: 5px;\n"],["\n  cursor: pointer;\n  position: relative;\n  margin-bottom: 5px;\n"]))),mc=Se.span(Ql||(Ql=Object(o.__makeTemplateObject)(["\n  font-family: ",";\n  margin-left: 10px;\n  flex: 1;\n  overflow-x: hidden;\n  text-overflow: ellipsis;\n"],["\n  font-family: ",";\n  margin-left: 10px;\n  flex: 1;\n  overflow-x: hidden;\n  text-overflow: ellipsis;\n"])),(function(e){return e.theme.typography.code.fontFamily})),gc=Se.button(Xl||(Xl=Object(o.__makeTemplateObject)(["\n  outline: 0;\n  color: inherit;\n  width: 100%;\n  text-align: left;\n  cursor: pointer;\n  padding: 10px 30px 10px ",";\n  border-radius: ",";\n  background-color: ",";\n  display: flex;\n  white-space: nowrap;\n  align-items: center;\n  border: ",";\n  border-bottom: ",";\n  transition: border-color 0.25s ease;\n\n  ","\n\n  ."," {\n    color: ","\n  }\n  &:focus {\n    box-shadow: inset 0 2px 2px rgba(0, 0, 0, 0.45), 0 2px 0 rgba(128, 128, 128, 0.25);\n  }\n"],["\n  outline: 0;\n  color: inherit;\n  width: 100%;\n  text-align: left;\n  cursor: pointer;\n  padding: 10px 30px 10px ",";\n  border-radius: ",";\n  background-color: ",";\n  display: flex;\n  white-space: nowrap;\n  align-items: center;\n  border: ",";\n  border-bottom: ",";\n  transition: border-color 0.25s ease;\n\n  ","\n\n  ."," {\n    color: ","\n  }\n  &:focus {\n    box-shadow: inset 0 2px 2px rgba(0, 0, 0, 0.45), 0 2px 0 rgba(128, 128, 128, 0.25);\n  }\n"])),(function(e){return e.inverted?"10px":"20px"}),(function(e){return e.inverted?"0":"4px 4px 0 0"}),(function(e){return e.inverted?"transparent":e.theme.codeBlock.backgroundColor}),(function(e){return e.inverted?"0":"1px solid transparent"}),(function(e){return e.inverted?"1px solid #ccc":"0"}),(function(e){return e.expanded&&!e.inverted&&"border-color: "+e.theme.colors.border.dark+";"||""}),mc,(function(e){return e.inverted?e.theme.colors.text.primary:"#ffffff"})),yc=Se.span.attrs((function(e){return{className:"http-verb "+e.type}}))(Kl||(Kl=Object(o.__makeTemplateObject)(["\n  font-size: ",";\n  line-height: ",";\n  background-color: ",";\n  color: #ffffff;\n  padding: ",";\n  text-transform: uppercase;\n  font-family: ",";\n  margin: 0;\n"],["\n  font-size: ",";\n  line-height: ",";\n  background-color: ",";\n  color: #ffffff;\n  padding: ",";\n  text-transform: uppercase;\n  font-family: ",";\n  margin: 0;\n"])),(function(e){return e.compact?"0.8em":"0.929em"}),(function(e){return e.compact?"18px":"20px"}),(function(e){return e.theme.colors.http[e.type]||"#999999"}),(function(e){return e.compact?"2px 8px":"3px 10px"}),(function(e){return e.theme.typography.headings.fontFamily})),vc=Se.div(Jl||(Jl=Object(o.__makeTemplateObject)(["\n  position: absolute;\n  width: 100%;\n  z-index: 100;\n  background: #fafafa;\n  color: #263238;\n  box-sizing: border-box;\n  box-shadow: 0px 0px 6px rgba(0, 0, 0, 0.33);\n  overflow: hidden;\n  border-bottom-left-radius: 4px;\n  border-bottom-right-radius: 4px;\n  transition: all 0.25s ease;\n  visibility: hidden;\n  ","\n"],["\n  position: absolute;\n  width: 100%;\n  z-index: 100;\n  background: #fafafa;\n  color: #263238;\n  box-sizing: border-box;\n  box-shadow: 0px 0px 6px rgba(0, 0, 0, 0.33);\n  overflow: hidden;\n  border-bottom-left-radius: 4px;\n  border-bottom-right-radius: 4px;\n  transition: all 0.25s ease;\n  visibility: hidden;\n  ","\n"])),(function(e){return e.expanded?"visibility: visible;":"transform: translateY(-50%) scaleY(0);"})),bc=Se.div(Zl||(Zl=Object(o.__makeTemplateObject)(["\n  padding: 10px;\n"],["\n  padding: 10px;\n"]))),xc=Se.div(ec||(ec=Object(o.__makeTemplateObject)(["\n  padding: 5px;\n  border: 1px solid #ccc;\n  background: #fff;\n  word-break: break-all;\n  color: ",";\n  > span {\n    color: ",";\n  }\n"],["\n  padding: 5px;\n  border: 1px solid #ccc;\n  background: #fff;\n  word-break: break-all;\n  color: ",";\n  > span {\n    color: ",";\n  }\n"])),(function(e){return e.theme.colors.primary.main}),(function(e){return e.theme.colors.text.primary})),wc=function(e){function t(t){var n=e.call(this,t)||this;return n.toggle=function(){n.setState({expanded:!n.state.expanded})},n.state={expanded:!1},n}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this,t=this.props,n=t.operation,r=t.inverted,o=t.hideHostname,a=this.state.expanded;return i.createElement(Fe.Consumer,null,(function(t){return i.createElement(hc,null,i.createElement(gc,{onClick:e.toggle,expanded:a,inverted:r},i.createElement(yc,{type:n.httpVerb,compact:e.props.compact},n.httpVerb),i.createElement(mc,null,n.path),i.createElement(rr,{float:"right",color:r?"black":"white",size:"20px",direction:a?"up":"down",style:{marginRight:"-25px"}})),i.createElement(vc,{expanded:a,"aria-hidden":!a},n.servers.map((function(e){var r,a,s=t.expandDefaultServerVariables?(r=e.url,void 0===(a=e.variables)&&(a={}),r.replace(/(?:{)([\w-.]+)(?:})/g,(function(e,t){return a[t]&&a[t].default||e}))):e.url;return i.createElement(bc,{key:s},i.createElement(ea,{source:e.description||"",compact:!0}),i.createElement(dc,null,i.createElement(xc,null,i.createElement("span",null,o||t.hideHostname?function(e){try{return fe(e).pathname}catch(t){return e}}(s):s),n.path)))}))))}))},t}(i.Component),kc=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.place,n=e.parameters;return n&&n.length?i.createElement("div",{key:t},i.createElement(Sn,null,t," Parameters"),i.createElement(dr,null,i.createElement("tbody",null,ae(n,(function(e,t){return i.createElement(Zs,{key:e.name,isLast:t,field:e,showExamples:!0})}))))):null},t}(i.PureComponent),Oc=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.switchMedia=function(e){var n=e.idx;t.props.content&&t.props.content.activate(n)},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this,t=this.props.content;if(!t||!t.mediaTypes||!t.mediaTypes.length)return null;var n=t.activeMimeIdx,r=t.mediaTypes.map((function(e,t){return{value:e.name,idx:t}}));return i.createElement(i.Fragment,null,i.createElement((function(t){var n=t.children;return e.props.withLabel?i.createElement(Ma,null,i.createElement(La,null,"Content type"),n):n}),null,this.props.renderDropdown({value:r[n].value,options:r,onChange:this.switchMedia,ariaLabel:"Content type"})),this.props.children(t.active))},t=Object(o.__decorate)([us],t)}(i.Component);var Ec=["path","query","cookie","header"],_c=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.orderParams=function(e){var t={};return e.forEach((function(e){var n,r,o;n=t,r=e.in,o=e,n[r]||(n[r]=[]),n[r].push(o)})),t},t.prototype.render=function(){var e=this.props,t=e.body,n=e.parameters,r=void 0===n?[]:n;if(void 0===t&&void 0===r)return null;var o=this.orderParams(r),a=r.length>0?Ec:[],s=t&&t.content,l=t&&t.description;return i.createElement(i.Fragment,null,a.map((function(e){return i.createElement(kc,{key:e,place:e,parameters:o[e]})})),s&&i.createElement(Tc,{content:s,description:l}))},t}(i.PureComponent);function Sc(e){return i.createElement(Sn,{key:"header"},"Request Body schema: ",i.createElement(Bi,Object(o.__assign)({},e)))}function Tc(e){var t=e.content,n=e.description;return i.createElement(Oc,{content:t,renderDropdown:Sc},(function(e){var t=e.schema;return i.createElement(i.Fragment,null,void 0!==n&&i.createElement(ea,{source:n}),i.createElement(ol,{skipReadOnly:!0,key:"schema",schema:t}))}))}var jc,Ac,Cc,Ic,Pc,Rc,Nc,Lc,Mc,Dc,Fc,zc,Uc,Bc,$c,Wc,qc,Hc,Vc,Yc=Se(function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.title,n=e.type,r=e.empty,o=e.code,a=e.opened,s=e.className,l=e.onClick;return i.createElement("button",{className:s,onClick:!r&&l||void 0,"aria-expanded":a,disabled:r},!r&&i.createElement(rr,{size:"1.5em",color:n,direction:a?"down":"right",float:"left"}),i.createElement("strong",null,o," "),i.createElement(ea,{compact:!0,inline:!0,source:t}))},t}(i.PureComponent))(jc||(jc=Object(o.__makeTemplateObject)(["\n  display: block;\n  border: 0;\n  width: 100%;\n  text-align: left;\n  padding: 10px;\n  border-radius: 2px;\n  margin-bottom: 4px;\n  line-height: 1.5em;\n  background-color: #f2f2f2;\n  cursor: pointer;\n\n  color: ",";\n  background-color: ",";\n  &:focus {\n    outline: auto;\n    outline-color: ",";\n  }\n  ",";\n"],["\n  display: block;\n  border: 0;\n  width: 100%;\n  text-align: left;\n  padding: 10px;\n  border-radius: 2px;\n  margin-bottom: 4px;\n  line-height: 1.5em;\n  background-color: #f2f2f2;\n  cursor: pointer;\n\n  color: ",";\n  background-color: ",";\n  &:focus {\n    outline: auto;\n    outline-color: ",";\n  }\n  ",";\n"])),(function(e){return e.theme.colors.responses[e.type].color}),(function(e){return e.theme.colors.responses[e.type].backgroundColor}),(function(e){return e.theme.colors.responses[e.type].color}),(function(e){return e.empty?'\ncursor: default;\n&::before {\n  content: "—";\n  font-weight: bold;\n  width: 1.5em;\n  text-align: center;\n  display: inline-block;\n}\n&:focus {\n  outline: 0;\n}\n':""})),Gc=Se.div(Ac||(Ac=Object(o.__makeTemplateObject)(["\n  padding: 10px;\n"],["\n  padding: 10px;\n"]))),Qc=Se(Sn.withComponent("caption"))(Cc||(Cc=Object(o.__makeTemplateObject)(["\n  text-align: left;\n  margin-top: 1em;\n  caption-side: top;\n"],["\n  text-align: left;\n  margin-top: 1em;\n  caption-side: top;\n"]))),Xc=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.headers;return void 0===e||0===e.length?null:i.createElement(dr,null,i.createElement(Qc,null," Response Headers "),i.createElement("tbody",null,ae(e,(function(e,t){return i.createElement(Zs,{isLast:t,key:e.name,field:e,showExamples:!0})}))))},t}(i.PureComponent),Kc=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.renderDropdown=function(e){return i.createElement(Sn,{key:"header"},"Response Schema: ",i.createElement(Bi,Object(o.__assign)({},e)))},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.response,t=e.description,n=e.headers,r=e.content;return i.createElement(i.Fragment,null,t&&i.createElement(ea,{source:t}),i.createElement(Xc,{headers:n}),i.createElement(Oc,{content:r,renderDropdown:this.renderDropdown},(function(e){var t=e.schema;return i.createElement(ol,{skipWriteOnly:!0,key:"schema",schema:t})})))},t}(i.PureComponent),Jc=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.toggle=function(){t.props.response.toggle()},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.response,t=e.headers,n=e.type,r=e.summary,o=e.description,a=e.code,s=e.expanded,l=e.content,c=void 0===l?[]:l.mediaTypes.filter((function(e){return void 0!==e.schema})),u=0===t.length&&0===c.length&&!o;return i.createElement("div",null,i.createElement(Yc,{onClick:this.toggle,type:n,empty:u,title:r||"",code:a,opened:s}),s&&!u&&i.createElement(Gc,null,i.createElement(Kc,{response:this.props.response})))},t=Object(o.__decorate)([us],t)}(i.Component),Zc=Se.h3(Ic||(Ic=Object(o.__makeTemplateObject)(["\n  font-size: 1.3em;\n  padding: 0.2em 0;\n  margin: 3em 0 1.1em;\n  color: ",";\n  font-weight: normal;\n"],["\n  font-size: 1.3em;\n  padding: 0.2em 0;\n  margin: 3em 0 1.1em;\n  color: ",";\n  font-weight: normal;\n"])),(function(e){return e.theme.colors.text.primary})),eu=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.responses,n=e.isCallback;return t&&0!==t.length?i.createElement("div",null,i.createElement(Zc,null,n?"Callback responses":"Responses"),t.map((function(e){return i.createElement(Jc,{key:e.code,response:e})}))):null},t}(i.PureComponent),tu=Se.code(Pc||(Pc=Object(o.__makeTemplateObject)(["\n  font-size: ",";\n  font-family: ",";\n  border: 1px solid ",";\n  margin: 0 3px;\n  padding: 0.2em;\n  display: inline-block;\n  line-height: 1;\n\n  &:after {\n    content: ',';\n  }\n  &:last-child:after {\n    content: none;\n  }\n"],["\n  font-size: ",";\n  font-family: ",";\n  border: 1px solid ",";\n  margin: 0 3px;\n  padding: 0.2em;\n  display: inline-block;\n  line-height: 1;\n\n  &:after {\n    content: ',';\n  }\n  &:last-child:after {\n    content: none;\n  }\n"])),(function(e){return e.theme.typography.code.fontSize}),(function(e){return e.theme.typography.code.fontFamily}),(function(e){return e.theme.colors.border.dark})),nu=Se.span(Rc||(Rc=Object(o.__makeTemplateObject)(["\n  &:after {\n    content: ' AND ';\n    font-weight: bold;\n  }\n\n  &:last-child:after {\n    content: none;\n  }\n\n  ",";\n"],["\n  &:after {\n    content: ' AND ';\n    font-weight: bold;\n  }\n\n  &:last-child:after {\n    content: none;\n  }\n\n  ",";\n"])),Hi),ru=Se.span(Nc||(Nc=Object(o.__makeTemplateObject)(["\n  &:before {\n    content: '( ';\n    font-weight: bold;\n  }\n  &:after {\n    content: ' ) OR ';\n    font-weight: bold;\n  }\n  &:last-child:after {\n    content: ' )';\n  }\n\n  &:only-child:before,\n  &:only-child:after {\n    content: none;\n  }\n\n  ",";\n"],["\n  &:before {\n    content: '( ';\n    font-weight: bold;\n  }\n  &:after {\n    content: ' ) OR ';\n    font-weight: bold;\n  }\n  &:last-child:after {\n    content: ' )';\n  }\n\n  &:only-child:before,\n  &:only-child:after {\n    content: none;\n  }\n\n  ",";\n"])),Hi),ou=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.security;return i.createElement(ru,null,e.schemes.map((function(e){return i.createElement(nu,{key:e.id},i.createElement(Nn,{to:e.sectionId},e.id),e.scopes.length>0&&" (",e.scopes.map((function(e){return i.createElement(tu,{key:e},e)})),e.scopes.length>0&&") ")})))},t}(i.PureComponent),iu=Se.div(Lc||(Lc=Object(o.__makeTemplateObject)(["\n  flex: 1;\n"],["\n  flex: 1;\n"]))),au=Se.div(Mc||(Mc=Object(o.__makeTemplateObject)(["\n  width: ",";\n"],["\n  width: ",";\n"])),(function(e){return e.theme.schema.defaultDetailsWidth})),su=Se(Sn)(Dc||(Dc=Object(o.__makeTemplateObject)(["\n  display: inline-block;\n  margin: 0;\n"],["\n  display: inline-block;\n  margin: 0;\n"]))),lu=Se.div(Fc||(Fc=Object(o.__makeTemplateObject)(["\n  width: 100%;\n  display: flex;\n  margin: 1em 0;\n"],["\n  width: 100%;\n  display: flex;\n  margin: 1em 0;\n"]))),cu=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.securities;return e.length?i.createElement(lu,null,i.createElement(iu,null,i.createElement(su,null,"Authorizations: ")),i.createElement(au,null,e.map((function(e,t){return i.createElement(ou,{key:t,security:e})})))):null},t}(i.PureComponent),uu=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.operation,t=e.description,n=e.externalDocs,r=!(!t&&!n);return i.createElement(fc,null,r&&i.createElement(pu,null,void 0!==t&&i.createElement(ea,{source:t}),n&&i.createElement(Ws,{externalDocs:n})),i.createElement(wc,{operation:this.props.operation,inverted:!0,compact:!0}),i.createElement(Ys,{extensions:e.extensions}),i.createElement(cu,{securities:e.security}),i.createElement(_c,{parameters:e.parameters,body:e.requestBody}),i.createElement(eu,{responses:e.responses,isCallback:e.isCallback}))},t=Object(o.__decorate)([us],t)}(i.Component),pu=Se.div(zc||(zc=Object(o.__makeTemplateObject)(["\n  margin-bottom: ","px;\n"],["\n  margin-bottom: ","px;\n"])),(function(e){return 3*e.theme.spacing.unit})),fu=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.toggle=function(){t.props.callbackOperation.toggle()},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.callbackOperation,t=e.name,n=e.expanded,r=e.httpVerb,o=e.deprecated;return i.createElement(i.Fragment,null,i.createElement(pc,{onClick:this.toggle,name:t,opened:n,httpVerb:r,deprecated:o}),n&&i.createElement(uu,{operation:this.props.callbackOperation}))},t=Object(o.__decorate)([us],t)}(i.Component),du=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.callbacks;return e&&0!==e.length?i.createElement("div",null,i.createElement(hu,null," Callbacks "),e.map((function(e){return e.operations.map((function(t,n){return i.createElement(fu,{key:e.name+"_"+n,callbackOperation:t})}))}))):null},t}(i.PureComponent),hu=Se.h3(Uc||(Uc=Object(o.__makeTemplateObject)(["\n  font-size: 1.3em;\n  padding: 0.2em 0;\n  margin: 3em 0 1.1em;\n  color: ",";\n  font-weight: normal;\n"],["\n  font-size: 1.3em;\n  padding: 0.2em 0;\n  margin: 3em 0 1.1em;\n  color: ",";\n  font-weight: normal;\n"])),(function(e){return e.theme.colors.text.primary})),mu=function(e){function t(t){var n=e.call(this,t)||this;return n.switchItem=function(e){var t=e.idx;n.props.items&&n.setState({activeItemIdx:t})},n.state={activeItemIdx:0},n}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this,t=this.props.items;if(!t||!t.length)return null;return i.createElement(i.Fragment,null,i.createElement((function(t){var n=t.children;return e.props.label?i.createElement(Ma,null,i.createElement(La,null,e.props.label),n):n}),null,this.props.renderDropdown({value:this.props.options[this.state.activeItemIdx].value,options:this.props.options,onChange:this.switchItem,ariaLabel:this.props.label||"Callback"})),this.props.children(t[this.state.activeItemIdx]))},t=Object(o.__decorate)([us],t)}(i.Component),gu=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.renderDropdown=function(e){return i.createElement(Bi,Object(o.__assign)({Label:Na,Dropdown:Da},e))},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this,t=this.props.content;return void 0===t?null:i.createElement(Oc,{content:t,renderDropdown:this.renderDropdown,withLabel:!0},(function(t){return i.createElement(za,{key:"samples",mediaType:t,renderDropdown:e.renderDropdown})}))},t=Object(o.__decorate)([us],t)}(i.Component),yu=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.callback.codeSamples.find((function(e){return Qt(e)}));return e?i.createElement(vu,null,i.createElement(gu,{content:e.requestBodyContent})):null},t}(i.Component),vu=Se.div(Bc||(Bc=Object(o.__makeTemplateObject)(["\n  margin-top: 15px;\n"],["\n  margin-top: 15px;\n"]))),bu=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.renderDropdown=function(e){return i.createElement(Bi,Object(o.__assign)({Label:Na,Dropdown:Da},e))},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this,t=this.props.callbacks;if(!t||0===t.length)return null;var n=t.map((function(e){return e.operations.map((function(e){return e}))})).reduce((function(e,t){return e.concat(t)}),[]);if(!n.some((function(e){return e.codeSamples.length>0})))return null;var r=n.map((function(e,t){return{value:e.httpVerb.toUpperCase()+": "+e.name,idx:t}}));return i.createElement("div",null,i.createElement(_n,null," Callback payload samples "),i.createElement(xu,null,i.createElement(mu,{items:n,renderDropdown:this.renderDropdown,label:"Callback",options:r},(function(t){return i.createElement(yu,{key:"callbackPayloadSample",callback:t,renderDropdown:e.renderDropdown})}))))},t.contextType=Fe,t=Object(o.__decorate)([us],t)}(i.Component),xu=Se.div($c||($c=Object(o.__makeTemplateObject)(["\n  background: ",";\n  padding: ","px;\n"],["\n  background: ",";\n  padding: ","px;\n"])),(function(e){return e.theme.codeBlock.backgroundColor}),(function(e){return 4*e.theme.spacing.unit})),wu=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.operation.codeSamples,t=e.length>0,n=1===e.length&&this.context.hideSingleRequestSampleTab;return t&&i.createElement("div",null,i.createElement(_n,null," Request samples "),i.createElement($o,{defaultIndex:0},i.createElement(Io,{hidden:n},e.map((function(e){return i.createElement(Ro,{key:e.lang+"_"+(e.label||"")},void 0!==e.label?e.label:e.lang)}))),e.map((function(e){return i.createElement(Lo,{key:e.lang+"_"+(e.label||"")},Qt(e)?i.createElement("div",null,i.createElement(gu,{content:e.requestBodyContent})):i.createElement(Ea,{lang:e.lang,source:e.source}))}))))||null},t.contextType=Fe,t=Object(o.__decorate)([us],t)}(i.Component),ku=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.operation.responses.filter((function(e){return e.content&&e.content.hasSample}));return e.length>0&&i.createElement("div",null,i.createElement(_n,null," Response samples "),i.createElement($o,{defaultIndex:0},i.createElement(Io,null,e.map((function(e){return i.createElement(Ro,{className:"tab-"+e.type,key:e.code},e.code)}))),e.map((function(e){return i.createElement(Lo,{key:e.code},i.createElement("div",null,i.createElement(gu,{content:e.content})))}))))||null},t=Object(o.__decorate)([us],t)}(i.Component),Ou=Se(xn)(Wc||(Wc=Object(o.__makeTemplateObject)(["\n  backface-visibility: hidden;\n  contain: content;\n  overflow: hidden;\n"],["\n  backface-visibility: hidden;\n  contain: content;\n  overflow: hidden;\n"]))),Eu=Se.div(qc||(qc=Object(o.__makeTemplateObject)(["\n  margin-bottom: ","px;\n"],["\n  margin-bottom: ","px;\n"])),(function(e){return 6*e.theme.spacing.unit})),_u=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.operation,t=e.name,n=e.description,r=e.deprecated,o=e.externalDocs,a=e.isWebhook,s=!(!n&&!o);return i.createElement(Fe.Consumer,null,(function(l){return i.createElement(Ou,null,i.createElement(gn,null,i.createElement(En,null,i.createElement(Mn,{to:e.id}),t," ",r&&i.createElement(or,{type:"warning"}," Deprecated "),a&&i.createElement(or,{type:"primary"}," Webhook ")),l.pathInMiddlePanel&&!a&&i.createElement(wc,{operation:e,inverted:!0}),s&&i.createElement(Eu,null,void 0!==n&&i.createElement(ea,{source:n}),o&&i.createElement(Ws,{externalDocs:o})),i.createElement(Ys,{extensions:e.extensions}),i.createElement(cu,{securities:e.security}),i.createElement(_c,{parameters:e.parameters,body:e.requestBody}),i.createElement(eu,{responses:e.responses}),i.createElement(du,{callbacks:e.callbacks})),i.createElement(bn,null,!l.pathInMiddlePanel&&!a&&i.createElement(wc,{operation:e}),i.createElement(wu,{operation:e}),i.createElement(ku,{operation:e}),i.createElement(bu,{callbacks:e.callbacks})))}))},t=Object(o.__decorate)([us],t)}(i.Component),Su=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.items;return 0===e.length?null:e.map((function(e){return i.createElement(Tu,{key:e.id,item:e})}))},t=Object(o.__decorate)([us],t)}(i.Component),Tu=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e,t=this.props.item;switch(t.type){case"group":e=null;break;case"tag":case"section":e=i.createElement(Au,Object(o.__assign)({},this.props));break;case"operation":e=i.createElement(Cu,{item:t});break;default:e=i.createElement(Au,Object(o.__assign)({},this.props))}return i.createElement(i.Fragment,null,e&&i.createElement(yn,{id:t.id,underlined:"operation"===t.type},e),t.items&&i.createElement(Su,{items:t.items}))},t=Object(o.__decorate)([us],t)}(i.Component),ju=function(e){return i.createElement(gn,{compact:!0},e)},Au=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.item,t=e.name,n=e.description,r=e.externalDocs,o=2===e.level?En:On;return i.createElement(i.Fragment,null,i.createElement(xn,null,i.createElement(gn,{compact:!1},i.createElement(o,null,i.createElement(Mn,{to:this.props.item.id}),t))),i.createElement(Cl,{source:n||"",htmlWrap:ju}),r&&i.createElement(xn,null,i.createElement(gn,null,i.createElement(Ws,{externalDocs:r}))))},t=Object(o.__decorate)([us],t)}(i.Component),Cu=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){return i.createElement(_u,{operation:this.props.item})},t=Object(o.__decorate)([us],t)}(i.Component),Iu=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.ref=i.createRef(),t.activate=function(e){t.props.onActivate(t.props.item),e.stopPropagation()},t}return Object(o.__extends)(t,e),t.prototype.componentDidMount=function(){this.scrollIntoViewIfActive()},t.prototype.componentDidUpdate=function(){this.scrollIntoViewIfActive()},t.prototype.scrollIntoViewIfActive=function(){this.props.item.active&&this.ref.current&&this.ref.current.scrollIntoViewIfNeeded()},t.prototype.render=function(){var e=this.props,t=e.item,n=e.withoutChildren;return i.createElement(nc,{onClick:this.activate,depth:t.depth,"data-item-id":t.id},"operation"===t.type?i.createElement(Pu,Object(o.__assign)({},this.props,{item:t})):i.createElement(oc,{depth:t.depth,active:t.active,type:t.type,ref:this.ref},i.createElement(ic,{title:t.name},t.name,this.props.children),t.depth>0&&t.items.length>0&&i.createElement(rr,{float:"right",direction:t.expanded?"down":"right"})||null),!n&&t.items&&t.items.length>0&&i.createElement(Ru,{expanded:t.expanded,items:t.items,onActivate:this.props.onActivate}))},t=Object(o.__decorate)([us],t)}(i.Component),Pu=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.ref=i.createRef(),t}return Object(o.__extends)(t,e),t.prototype.componentDidUpdate=function(){this.props.item.active&&this.ref.current&&this.ref.current.scrollIntoViewIfNeeded()},t.prototype.render=function(){var e=this.props.item;return i.createElement(oc,{depth:e.depth,active:e.active,deprecated:e.deprecated,ref:this.ref},e.isWebhook?i.createElement(Pl,{type:"hook"},he("webhook")):i.createElement(Pl,{type:e.httpVerb},yt(e.httpVerb)),i.createElement(ic,{width:"calc(100% - 38px)"},e.name,this.props.children))},t=Object(o.__decorate)([us],t)}(i.Component),Ru=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this,t=this.props,n=t.items,r=t.root,a=t.className,s=null==this.props.expanded||this.props.expanded;return i.createElement(tc,Object(o.__assign)({className:a,style:this.props.style,expanded:s},r?{role:"navigation"}:{}),n.map((function(t,n){return i.createElement(Iu,{key:n,item:t,onActivate:e.props.onActivate})})))},t=Object(o.__decorate)([us],t)}(i.Component),Nu=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.activate=function(e){if(e&&e.active&&t.context.menuToggle)return e.expanded?e.collapse():e.expand();t.props.menu.activateAndScroll(e,!0),setTimeout((function(){t._updateScroll&&t._updateScroll()}))},t.saveScrollUpdate=function(e){t._updateScroll=e},t}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props.menu;return i.createElement(ji,{updateFn:this.saveScrollUpdate,className:this.props.className,options:{wheelPropagation:!1}},i.createElement(Ru,{items:e.items,onActivate:this.activate,root:!0}),i.createElement(ac,null,i.createElement("a",{target:"_blank",rel:"noopener noreferrer",href:"https://github.com/Redocly/redoc"},"Documentation Powered by ReDoc")))},t.contextType=Fe,t=Object(o.__decorate)([us],t)}(i.Component),Lu=function(e){var t=e.open?8:-4;return i.createElement(Du,null,i.createElement(Mu,{size:15,style:{transform:"translate(2px, "+t+"px) rotate(180deg)",transition:"transform 0.2s ease"}}),i.createElement(Mu,{size:15,style:{transform:"translate(2px, "+(0-t)+"px)",transition:"transform 0.2s ease"}}))},Mu=function(e){var t=e.size,n=void 0===t?10:t,r=e.className,o=void 0===r?"":r,a=e.style;return i.createElement("svg",{className:o,style:a||{},viewBox:"0 0 926.23699 573.74994",version:"1.1",x:"0px",y:"0px",width:n,height:n},i.createElement("g",{transform:"translate(904.92214,-879.1482)"},i.createElement("path",{d:"\n          m -673.67664,1221.6502 -231.2455,-231.24803 55.6165,\n          -55.627 c 30.5891,-30.59485 56.1806,-55.627 56.8701,-55.627 0.6894,\n          0 79.8637,78.60862 175.9427,174.68583 l 174.6892,174.6858 174.6892,\n          -174.6858 c 96.079,-96.07721 175.253196,-174.68583 175.942696,\n          -174.68583 0.6895,0 26.281,25.03215 56.8701,\n          55.627 l 55.6165,55.627 -231.245496,231.24803 c -127.185,127.1864\n          -231.5279,231.248 -231.873,231.248 -0.3451,0 -104.688,\n          -104.0616 -231.873,-231.248 z\n        ",fill:"currentColor"})))},Du=Se.div(Hc||(Hc=Object(o.__makeTemplateObject)(["\n  user-select: none;\n  width: 20px;\n  height: 20px;\n  align-self: center;\n  display: flex;\n  flex-direction: column;\n  color: ",";\n"],["\n  user-select: none;\n  width: 20px;\n  height: 20px;\n  align-self: center;\n  display: flex;\n  flex-direction: column;\n  color: ",";\n"])),(function(e){return e.theme.colors.primary.main}));te&&(Vc=n(316));var Fu,zu,Uu,Bu,$u,Wu,qu,Hu,Vu,Yu,Gu,Qu,Xu,Ku,Ju=Vc&&Vc(),Zu=Se.div(zu||(zu=Object(o.__makeTemplateObject)(["\n  width: ",";\n  background-color: ",";\n  overflow: hidden;\n  display: flex;\n  flex-direction: column;\n\n  backface-visibility: hidden;\n  /* contain: strict; TODO: breaks layout since Chrome 80*/\n\n  height: 100vh;\n  position: sticky;\n  position: -webkit-sticky;\n  top: 0;\n\n  ",";\n\n  @media print {\n    display: none;\n  }\n"],["\n  width: ",";\n  background-color: ",";\n  overflow: hidden;\n  display: flex;\n  flex-direction: column;\n\n  backface-visibility: hidden;\n  /* contain: strict; TODO: breaks layout since Chrome 80*/\n\n  height: 100vh;\n  position: sticky;\n  position: -webkit-sticky;\n  top: 0;\n\n  ",";\n\n  @media print {\n    display: none;\n  }\n"])),(function(e){return e.theme.sidebar.width}),(function(e){return e.theme.sidebar.backgroundColor}),_e("small")(Fu||(Fu=Object(o.__makeTemplateObject)(["\n    position: fixed;\n    z-index: 20;\n    width: 100%;\n    background: ",";\n    display: ",";\n  "],["\n    position: fixed;\n    z-index: 20;\n    width: 100%;\n    background: ",";\n    display: ",";\n  "])),(function(e){return e.theme.sidebar.backgroundColor}),(function(e){return e.open?"flex":"none"}))),ep=Se.div(Bu||(Bu=Object(o.__makeTemplateObject)(["\n  outline: none;\n  user-select: none;\n  background-color: #f2f2f2;\n  color: ",";\n  display: none;\n  cursor: pointer;\n  position: fixed;\n  right: 20px;\n  z-index: 100;\n  border-radius: 50%;\n  box-shadow: 0 0 20px rgba(0, 0, 0, 0.3);\n  ",";\n\n  bottom: 44px;\n\n  width: 60px;\n  height: 60px;\n  padding: 0 20px;\n\n  @media print {\n    display: none;\n  }\n"],["\n  outline: none;\n  user-select: none;\n  background-color: #f2f2f2;\n  color: ",";\n  display: none;\n  cursor: pointer;\n  position: fixed;\n  right: 20px;\n  z-index: 100;\n  border-radius: 50%;\n  box-shadow: 0 0 20px rgba(0, 0, 0, 0.3);\n  ",";\n\n  bottom: 44px;\n\n  width: 60px;\n  height: 60px;\n  padding: 0 20px;\n\n  @media print {\n    display: none;\n  }\n"])),(function(e){return e.theme.colors.primary.main}),_e("small")(Uu||(Uu=Object(o.__makeTemplateObject)(["\n    display: flex;\n  "],["\n    display: flex;\n  "])))),tp=function(e){function t(){var t=null!==e&&e.apply(this,arguments)||this;return t.state={offsetTop:"0px"},t.toggleNavMenu=function(){t.props.menu.toggleSidebar()},t}return Object(o.__extends)(t,e),t.prototype.componentDidMount=function(){Ju&&Ju.add(this.stickyElement),this.setState({offsetTop:this.getScrollYOffset(this.context)})},t.prototype.componentWillUnmount=function(){Ju&&Ju.remove(this.stickyElement)},t.prototype.getScrollYOffset=function(e){return(void 0!==this.props.scrollYOffset?ye.normalizeScrollYOffset(this.props.scrollYOffset)():e.scrollYOffset())+"px"},t.prototype.render=function(){var e=this,t=this.props.menu.sideBarOpened,n=this.state.offsetTop;return i.createElement(i.Fragment,null,i.createElement(Zu,{open:t,className:this.props.className,style:{top:n,height:"calc(100vh - "+n+")"},ref:function(t){e.stickyElement=t}},this.props.children),i.createElement(ep,{onClick:this.toggleNavMenu},i.createElement(Lu,{open:t})))},t.contextType=Fe,t=Object(o.__decorate)([us],t)}(i.Component),np=Se.div($u||($u=Object(o.__makeTemplateObject)(["\n  ",";\n"],["\n  ",";\n"])),(function(e){var t=e.theme;return"\n  font-family: "+t.typography.fontFamily+";\n  font-size: "+t.typography.fontSize+";\n  font-weight: "+t.typography.fontWeightRegular+";\n  line-height: "+t.typography.lineHeight+";\n  color: "+t.colors.text.primary+";\n  display: flex;\n  position: relative;\n  text-align: left;\n\n  -webkit-font-smoothing: "+t.typography.smoothing+";\n  font-smoothing: "+t.typography.smoothing+";\n  "+(t.typography.optimizeSpeed?"text-rendering: optimizeSpeed !important":"")+";\n\n  tap-highlight-color: rgba(0, 0, 0, 0);\n  text-size-adjust: 100%;\n\n  * {\n    box-sizing: border-box;\n    -webkit-tap-highlight-color: rgba(255, 255, 255, 0);\n  }\n"})),rp=Se.div(qu||(qu=Object(o.__makeTemplateObject)(["\n  z-index: 1;\n  position: relative;\n  overflow: hidden;\n  width: calc(100% - ",");\n  ",";\n\n  contain: layout;\n"],["\n  z-index: 1;\n  position: relative;\n  overflow: hidden;\n  width: calc(100% - ",");\n  ",";\n\n  contain: layout;\n"])),(function(e){return e.theme.sidebar.width}),_e("small",!0)(Wu||(Wu=Object(o.__makeTemplateObject)(["\n    width: 100%;\n  "],["\n    width: 100%;\n  "])))),op=Se.div(Vu||(Vu=Object(o.__makeTemplateObject)(["\n  background: ",";\n  position: absolute;\n  top: 0;\n  bottom: 0;\n  right: 0;\n  width: ",";\n  ",";\n"],["\n  background: ",";\n  position: absolute;\n  top: 0;\n  bottom: 0;\n  right: 0;\n  width: ",";\n  ",";\n"])),(function(e){return e.theme.rightPanel.backgroundColor}),(function(e){var t=e.theme;if(t.rightPanel.width.endsWith("%")){var n=parseInt(t.rightPanel.width,10);return"calc((100% - "+t.sidebar.width+") * "+n/100+")"}return t.rightPanel.width}),_e("medium",!0)(Hu||(Hu=Object(o.__makeTemplateObject)(["\n    display: none;\n  "],["\n    display: none;\n  "])))),ip=Se.div(Yu||(Yu=Object(o.__makeTemplateObject)(["\n  padding: 5px 0;\n"],["\n  padding: 5px 0;\n"]))),ap=Se.input.attrs((function(){return{className:"search-input"}}))(Gu||(Gu=Object(o.__makeTemplateObject)(["\n  width: calc(100% - ","px);\n  box-sizing: border-box;\n  margin: 0 ","px;\n  padding: 5px ","px 5px\n    ","px;\n  border: 0;\n  border-bottom: 1px solid\n    ",";\n  font-family: ",";\n  font-weight: bold;\n  font-size: 13px;\n  color: ",";\n  background-color: transparent;\n  outline: none;\n"],["\n  width: calc(100% - ","px);\n  box-sizing: border-box;\n  margin: 0 ","px;\n  padding: 5px ","px 5px\n    ","px;\n  border: 0;\n  border-bottom: 1px solid\n    ",";\n  font-family: ",";\n  font-weight: bold;\n  font-size: 13px;\n  color: ",";\n  background-color: transparent;\n  outline: none;\n"])),(function(e){return 8*e.theme.spacing.unit}),(function(e){return 4*e.theme.spacing.unit}),(function(e){return 2*e.theme.spacing.unit}),(function(e){return 4*e.theme.spacing.unit}),(function(e){var t=e.theme;return(V(t.sidebar.backgroundColor)>.5?W:Q)(.1,t.sidebar.backgroundColor)}),(function(e){return e.theme.typography.fontFamily}),(function(e){return e.theme.sidebar.textColor})),sp=Se((function(e){return i.createElement("svg",{className:e.className,version:"1.1",viewBox:"0 0 1000 1000",x:"0px",xmlns:"http://www.w3.org/2000/svg",y:"0px"},i.createElement("path",{d:"M968.2,849.4L667.3,549c83.9-136.5,66.7-317.4-51.7-435.6C477.1-25,252.5-25,113.9,113.4c-138.5,138.3-138.5,362.6,0,501C219.2,730.1,413.2,743,547.6,666.5l301.9,301.4c43.6,43.6,76.9,14.9,104.2-12.4C981,928.3,1011.8,893,968.2,849.4z M524.5,522c-88.9,88.7-233,88.7-321.8,0c-88.9-88.7-88.9-232.6,0-321.3c88.9-88.7,233-88.7,321.8,0C613.4,289.4,613.4,433.3,524.5,522z"}))})).attrs({className:"search-icon"})(Qu||(Qu=Object(o.__makeTemplateObject)(["\n  position: absolute;\n  left: ","px;\n  height: 1.8em;\n  width: 0.9em;\n\n  path {\n    fill: ",";\n  }\n"],["\n  position: absolute;\n  left: ","px;\n  height: 1.8em;\n  width: 0.9em;\n\n  path {\n    fill: ",";\n  }\n"])),(function(e){return 4*e.theme.spacing.unit}),(function(e){return e.theme.sidebar.textColor})),lp=Se.div(Xu||(Xu=Object(o.__makeTemplateObject)(["\n  padding: ","px 0;\n  background-color: ","};\n  color: ",";\n  min-height: 150px;\n  max-height: 250px;\n  border-top: ","};\n  border-bottom: ","};\n  margin-top: 10px;\n  line-height: 1.4;\n  font-size: 0.9em;\n\n  "," {\n    padding-top: 6px;\n    padding-bottom: 6px;\n\n    &:hover,\n    &.active {\n      background-color: ",";\n    }\n\n    > svg {\n      display: none;\n    }\n  }\n"],["\n  padding: ","px 0;\n  background-color: ","};\n  color: ",";\n  min-height: 150px;\n  max-height: 250px;\n  border-top: ","};\n  border-bottom: ","};\n  margin-top: 10px;\n  line-height: 1.4;\n  font-size: 0.9em;\n\n  "," {\n    padding-top: 6px;\n    padding-bottom: 6px;\n\n    &:hover,\n    &.active {\n      background-color: ",";\n    }\n\n    > svg {\n      display: none;\n    }\n  }\n"])),(function(e){return e.theme.spacing.unit}),(function(e){var t=e.theme;return W(.05,t.sidebar.backgroundColor)}),(function(e){return e.theme.sidebar.textColor}),(function(e){var t=e.theme;return W(.1,t.sidebar.backgroundColor)}),(function(e){var t=e.theme;return W(.1,t.sidebar.backgroundColor)}),oc,(function(e){var t=e.theme;return W(.1,t.sidebar.backgroundColor)})),cp=Se.i(Ku||(Ku=Object(o.__makeTemplateObject)(["\n  position: absolute;\n  display: inline-block;\n  width: ","px;\n  text-align: center;\n  right: ","px;\n  line-height: 2em;\n  vertical-align: middle;\n  margin-right: 2px;\n  cursor: pointer;\n  font-style: normal;\n  color: '#666';\n"],["\n  position: absolute;\n  display: inline-block;\n  width: ","px;\n  text-align: center;\n  right: ","px;\n  line-height: 2em;\n  vertical-align: middle;\n  margin-right: 2px;\n  cursor: pointer;\n  font-style: normal;\n  color: '#666';\n"])),(function(e){return 2*e.theme.spacing.unit}),(function(e){return 4*e.theme.spacing.unit})),up=function(e){function t(t){var n=e.call(this,t)||this;return n.activeItemRef=null,n.clear=function(){n.setState({results:[],term:"",activeItemIdx:-1}),n.props.marker.unmark()},n.handleKeyDown=function(e){if(27===e.keyCode&&n.clear(),40===e.keyCode&&(n.setState({activeItemIdx:Math.min(n.state.activeItemIdx+1,n.state.results.length-1)}),e.preventDefault()),38===e.keyCode&&(n.setState({activeItemIdx:Math.max(0,n.state.activeItemIdx-1)}),e.preventDefault()),13===e.keyCode){var t=n.state.results[n.state.activeItemIdx];if(t){var r=n.props.getItemById(t.meta);r&&n.props.onActivate(r)}}},n.search=function(e){var t=e.target.value;t.length<3?n.clearResults(t):n.setState({term:t},(function(){return n.searchCallback(n.state.term)}))},n.state={results:[],term:"",activeItemIdx:-1},n}return Object(o.__extends)(t,e),t.prototype.clearResults=function(e){this.setState({results:[],term:e}),this.props.marker.unmark()},t.prototype.setResults=function(e,t){this.setState({results:e}),this.props.marker.mark(t)},t.prototype.searchCallback=function(e){var t=this;this.props.search.search(e).then((function(n){t.setResults(n,e)}))},t.prototype.render=function(){var e=this,t=this.state.activeItemIdx,n=this.state.results.map((function(t){return{item:e.props.getItemById(t.meta),score:t.score}}));return n.sort((function(e,t){return t.score-e.score})),i.createElement(ip,{role:"search"},this.state.term&&i.createElement(cp,{onClick:this.clear},"×"),i.createElement(sp,null),i.createElement(ap,{value:this.state.term,onKeyDown:this.handleKeyDown,placeholder:"Search...",type:"text",onChange:this.search}),n.length>0&&i.createElement(ji,{options:{wheelPropagation:!1}},i.createElement(lp,{"data-role":"search:results"},n.map((function(n,r){return i.createElement(Iu,{item:Object.create(n.item,{active:{value:r===t}}),onActivate:e.props.onActivate,withoutChildren:!0,key:n.item.id,"data-role":"search:result"})})))))},Object(o.__decorate)([Ve.bind,Object(Ve.debounce)(400)],t.prototype,"searchCallback",null),t}(i.PureComponent),pp=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.componentDidMount=function(){this.props.store.onDidMount()},t.prototype.componentWillUnmount=function(){this.props.store.dispose()},t.prototype.render=function(){var e=this.props.store,t=e.spec,n=e.menu,r=e.options,o=e.search,a=e.marker,s=this.props.store;return i.createElement(Ee,{theme:r.theme},i.createElement(An,{value:this.props.store},i.createElement(ze,{value:r},i.createElement(np,{className:"redoc-wrap"},i.createElement(tp,{menu:n,className:"menu-content"},i.createElement(Al,{info:t.info}),!r.disableSearch&&i.createElement(up,{search:o,marker:a,getItemById:n.getItemById,onActivate:n.activateAndScroll})||null,i.createElement(Nu,{menu:n})),i.createElement(rp,{className:"api-content"},i.createElement(_l,{store:s}),i.createElement(Su,{items:n.items})),i.createElement(op,null)))))},t.propTypes={store:l.instanceOf(vl).isRequired},t}(i.Component),fp=function(e){function t(){return null!==e&&e.apply(this,arguments)||this}return Object(o.__extends)(t,e),t.prototype.render=function(){var e=this.props,t=e.spec,n=e.specUrl,r=e.options,o=void 0===r?{}:r,a=e.onLoaded,s=void 0!==o.hideLoading,l=new ye(o);return i.createElement(Re,null,i.createElement(In,{spec:t,specUrl:n,options:o,onLoaded:a},(function(e){var t=e.loading,n=e.store;return t?s?null:i.createElement(De,{color:l.theme.colors.primary.main}):i.createElement(pp,{store:n})})))},t.propTypes={spec:function(e,t,n){return e.spec||e.specUrl?null:new Error("One of props 'spec' or 'specUrl' was not specified in '"+n+"'.")},specUrl:function(e,t,n){return e.spec||e.specUrl?null:new Error("One of props 'spec' or 'specUrl' was not specified in '"+n+"'.")},options:l.any,onLoaded:l.any},t}(i.PureComponent),dp="2.0.0-rc.40",hp="17b9873";function mp(e){var t=function(e){for(var t={},n=e.attributes,r=0;r<n.length;r++){var o=n[r];t[o.name]=o.value}return t}(e),n={};for(var r in t){n[r.replace(/-(.)/g,(function(e,t){return t.toUpperCase()}))]=t[r]}return n}function gp(e,t,n,r){if(void 0===t&&(t={}),void 0===n&&(n=ne("redoc")),null===n)throw new Error('"element" argument is not provided and <redoc> tag is not found on the page');var a,l;"string"==typeof e?a=e:"object"==typeof e&&(l=e),Object(s.render)(i.createElement(fp,{spec:l,onLoaded:r,specUrl:a,options:Object(o.__assign)(Object(o.__assign)({},t),mp(n))},["Loading..."]),n)}function yp(e,t,n){void 0===t&&(t=ne("redoc")),kt();var r=vl.fromJS(e);Ot(),setTimeout((function(){kt(),Object(s.hydrate)(i.createElement(pp,{store:r}),t,n),Ot()}),0)}!function(){var e=ne("redoc");if(e){var t=e.getAttribute("spec-url");t&&gp(t,{},e)}}()}])}));
+//# sourceMappingURL=redoc.standalone.js.map
\ No newline at end of file
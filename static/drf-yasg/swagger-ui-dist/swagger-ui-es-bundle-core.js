@@ -0,0 +1,3 @@
+/*! For license information please see swagger-ui-es-bundle-core.js.LICENSE.txt */
+module.exports=function(e){var t={};function n(r){if(t[r])return t[r].exports;var a=t[r]={i:r,l:!1,exports:{}};return e[r].call(a.exports,a,a.exports,n),a.l=!0,a.exports}return n.m=e,n.c=t,n.d=function(e,t,r){n.o(e,t)||Object.defineProperty(e,t,{enumerable:!0,get:r})},n.r=function(e){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},n.t=function(e,t){if(1&t&&(e=n(e)),8&t)return e;if(4&t&&"object"==typeof e&&e&&e.__esModule)return e;var r=Object.create(null);if(n.r(r),Object.defineProperty(r,"default",{enumerable:!0,value:e}),2&t&&"string"!=typeof e)for(var a in e)n.d(r,a,function(t){return e[t]}.bind(null,a));return r},n.n=function(e){var t=e&&e.__esModule?function(){return e.default}:function(){return e};return n.d(t,"a",t),t},n.o=function(e,t){return Object.prototype.hasOwnProperty.call(e,t)},n.p="/dist",n(n.s=406)}([function(e,t){e.exports=require("react")},function(e,t){e.exports=require("immutable")},function(e,t,n){e.exports=n(445)},function(e,t,n){var r=n(189);e.exports=function(e,t,n){return t in e?r(e,t,{value:n,enumerable:!0,configurable:!0,writable:!0}):e[t]=n,e}},function(e,t,n){"use strict";(function(e){n.d(t,"t",(function(){return me})),n.d(t,"A",(function(){return ve})),n.d(t,"i",(function(){return ge})),n.d(t,"w",(function(){return ye})),n.d(t,"r",(function(){return be})),n.d(t,"u",(function(){return Ee})),n.d(t,"s",(function(){return xe})),n.d(t,"p",(function(){return Se})),n.d(t,"v",(function(){return we})),n.d(t,"y",(function(){return je})),n.d(t,"z",(function(){return Ce})),n.d(t,"K",(function(){return Oe})),n.d(t,"f",(function(){return _e})),n.d(t,"n",(function(){return Ae})),n.d(t,"h",(function(){return ke})),n.d(t,"E",(function(){return Pe})),n.d(t,"L",(function(){return Fe})),n.d(t,"o",(function(){return Ye})),n.d(t,"D",(function(){return Ke})),n.d(t,"a",(function(){return Ge})),n.d(t,"I",(function(){return Ze})),n.d(t,"b",(function(){return Xe})),n.d(t,"H",(function(){return Qe})),n.d(t,"G",(function(){return et})),n.d(t,"F",(function(){return tt})),n.d(t,"k",(function(){return nt})),n.d(t,"d",(function(){return rt})),n.d(t,"g",(function(){return at})),n.d(t,"m",(function(){return ot})),n.d(t,"l",(function(){return it})),n.d(t,"e",(function(){return ct})),n.d(t,"J",(function(){return st})),n.d(t,"x",(function(){return ut})),n.d(t,"B",(function(){return lt})),n.d(t,"C",(function(){return pt})),n.d(t,"j",(function(){return ft})),n.d(t,"c",(function(){return dt})),n.d(t,"q",(function(){return mt}));var r=n(82),a=n.n(r),o=n(127),i=n.n(o),c=n(50),s=n.n(c),u=n(12),l=n.n(u),p=n(30),f=n.n(p),d=n(17),h=n.n(d),m=(n(34),n(32)),v=n.n(m),g=(n(23),n(18),n(155)),y=n.n(g),b=n(21),E=n.n(b),x=n(22),S=n.n(x),w=(n(29),n(15)),j=n.n(w),C=n(14),O=n.n(C),_=n(16),A=n.n(_),k=n(2),P=n.n(k),I=n(45),T=n.n(I),N=n(71),R=n.n(N),M=n(5),D=n.n(M),q=n(13),L=n.n(q),B=n(20),U=n.n(B),V=n(1),z=n.n(V),F=n(372),J=n(373),W=n.n(J),H=n(206),$=n.n(H),Y=n(207),K=n.n(Y),G=n(156),Z=n.n(G),X=n(265),Q=n.n(X),ee=n(100),te=n.n(ee),ne=n(58),re=n.n(ne),ae=n(111),oe=n(26),ie=n(375),ce=n.n(ie),se=n(113),ue=n(376),le=n.n(ue),pe=n(377),fe=n.n(pe),de="default",he=function(e){return z.a.Iterable.isIterable(e)};function me(e){try{var t=JSON.parse(e);if(t&&"object"===U()(t))return t}catch(e){}return!1}function ve(e){return Ee(e)?he(e)?e.toJS():e:{}}function ge(e){var t,n;if(he(e))return e;if(e instanceof oe.a.File)return e;if(!Ee(e))return e;if(L()(e))return D()(n=z.a.Seq(e)).call(n,ge).toList();if(re()(R()(e))){var r,a=function(e){if(!re()(R()(e)))return e;var t,n={},r="_**[]",a={},o=T()(R()(e).call(e));try{for(o.s();!(t=o.n()).done;){var i=t.value;if(n[i[0]]||a[i[0]]&&a[i[0]].containsMultiple){var c,s,u,l;if(!a[i[0]])a[i[0]]={containsMultiple:!0,length:1},n[P()(u=P()(l="".concat(i[0])).call(l,r)).call(u,a[i[0]].length)]=n[i[0]],delete n[i[0]];a[i[0]].length+=1,n[P()(c=P()(s="".concat(i[0])).call(s,r)).call(c,a[i[0]].length)]=i[1]}else n[i[0]]=i[1]}}catch(e){o.e(e)}finally{o.f()}return n}(e);return D()(r=z.a.OrderedMap(a)).call(r,ge)}return D()(t=z.a.OrderedMap(e)).call(t,ge)}function ye(e){return L()(e)?e:[e]}function be(e){return"function"==typeof e}function Ee(e){return!!e&&"object"===U()(e)}function xe(e){return"function"==typeof e}function Se(e){return L()(e)}var we=K.a;function je(e,t){var n;return S()(n=j()(e)).call(n,(function(n,r){return n[r]=t(e[r],r),n}),{})}function Ce(e,t){var n;return S()(n=j()(e)).call(n,(function(n,r){var a=t(e[r],r);return a&&"object"===U()(a)&&E()(n,a),n}),{})}function Oe(e){return function(t){t.dispatch,t.getState;return function(t){return function(n){return"function"==typeof n?n(e()):t(n)}}}}function _e(e){var t,n=e.keySeq();return n.contains(de)?de:y()(t=O()(n).call(n,(function(e){return"2"===(e+"")[0]}))).call(t).first()}function Ae(e,t){if(!z.a.Iterable.isIterable(e))return z.a.List();var n=e.getIn(L()(t)?t:[t]);return z.a.List.isList(n)?n:z.a.List()}function ke(e){var t,n=[/filename\*=[^']+'\w*'"([^"]+)";?/i,/filename\*=[^']+'\w*'([^;]+);?/i,/filename="([^;]*);?"/i,/filename=([^;]*);?/i];if(v()(n).call(n,(function(n){return null!==(t=n.exec(e))})),null!==t&&t.length>1)try{return decodeURIComponent(t[1])}catch(e){console.error(e)}return null}function Pe(e){return t=e.replace(/\.[^./]*$/,""),$()(W()(t));var t}var Ie=function(e,t){if(e>t)return"Value must be less than ".concat(t)},Te=function(e,t){if(e<t)return"Value must be greater than ".concat(t)},Ne=function(e){if(!/^-?\d+(\.?\d+)?$/.test(e))return"Value must be a number"},Re=function(e){if(!/^-?\d+$/.test(e))return"Value must be an integer"},Me=function(e){if(e&&!(e instanceof oe.a.File))return"Value must be a file"},De=function(e){if("true"!==e&&"false"!==e&&!0!==e&&!1!==e)return"Value must be a boolean"},qe=function(e){if(e&&"string"!=typeof e)return"Value must be a string"},Le=function(e){if(isNaN(Date.parse(e)))return"Value must be a DateTime"},Be=function(e){if(e=e.toString().toLowerCase(),!/^[{(]?[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}[)}]?$/.test(e))return"Value must be a Guid"},Ue=function(e,t){var n;if(e.length>t)return P()(n="Value must be no longer than ".concat(t," character")).call(n,1!==t?"s":"")},Ve=function(e,t){var n;if(e.length<t)return P()(n="Value must be at least ".concat(t," character")).call(n,1!==t?"s":"")},ze=function(e,t){if(!new RegExp(t).test(e))return"Value must follow pattern "+t},Fe=function(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},r=n.isOAS3,a=void 0!==r&&r,o=n.bypassRequiredCheck,i=void 0!==o&&o,c=[],s=e.get("required"),u=Object(se.a)(e,{isOAS3:a}),l=u.schema,p=u.parameterContentMediaType;if(!l)return c;var f=l.get("required"),d=l.get("maximum"),h=l.get("minimum"),m=l.get("type"),g=l.get("format"),y=l.get("maxLength"),b=l.get("minLength"),E=l.get("pattern");if(m&&(s||f||t)){var x="string"===m&&t,S="array"===m&&L()(t)&&t.length,w="array"===m&&z.a.List.isList(t)&&t.count(),j="array"===m&&"string"==typeof t&&t,C="file"===m&&t instanceof oe.a.File,O="boolean"===m&&(t||!1===t),_="number"===m&&(t||0===t),k="integer"===m&&(t||0===t),P="object"===m&&"object"===U()(t)&&null!==t,I="object"===m&&"string"==typeof t&&t,T=[x,S,w,j,C,O,_,k,P,I],N=v()(T).call(T,(function(e){return!!e}));if((s||f)&&!N&&!i)return c.push("Required field is not provided"),c;if("object"===m&&"string"==typeof t&&(null===p||"application/json"===p))try{JSON.parse(t)}catch(e){return c.push("Parameter string value must be valid JSON"),c}if(E){var R=ze(t,E);R&&c.push(R)}if(y||0===y){var M=Ue(t,y);M&&c.push(M)}if(b){var D=Ve(t,b);D&&c.push(D)}if(d||0===d){var q=Ie(t,d);q&&c.push(q)}if(h||0===h){var B=Te(t,h);B&&c.push(B)}if("string"===m){var V;if(!(V="date-time"===g?Le(t):"uuid"===g?Be(t):qe(t)))return c;c.push(V)}else if("boolean"===m){var F=De(t);if(!F)return c;c.push(F)}else if("number"===m){var J=Ne(t);if(!J)return c;c.push(J)}else if("integer"===m){var W=Re(t);if(!W)return c;c.push(W)}else if("array"===m){var H;if(!w||!t.count())return c;H=l.getIn(["items","type"]),A()(t).call(t,(function(e,t){var n;"number"===H?n=Ne(e):"integer"===H?n=Re(e):"string"===H&&(n=qe(e)),n&&c.push({index:t,error:n})}))}else if("file"===m){var $=Me(t);if(!$)return c;c.push($)}}return c},Je=function(e,t){if(!e.xml||!e.xml.name){if(e.xml=e.xml||{},!e.$$ref)return e.type||e.items||e.properties||e.additionalProperties?'<?xml version="1.0" encoding="UTF-8"?>\n\x3c!-- XML example cannot be generated; root element name is undefined --\x3e':null;var n=e.$$ref.match(/\S*\/(\S+)$/);e.xml.name=n[1]}return Object(ae.memoizedCreateXMLExample)(e,t)},We=[{when:/json/,shouldStringifyTypes:["string"]}],He=["object"],$e=function(e,t,n){var r=Object(ae.memoizedSampleFromSchema)(e,t),a=U()(r),o=S()(We).call(We,(function(e,t){var r;return t.when.test(n)?P()(r=[]).call(r,h()(e),h()(t.shouldStringifyTypes)):e}),He);return Q()(o,(function(e){return e===a}))?f()(r,null,2):r},Ye=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"",n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{};return/xml/.test(t)?Je(e,n):$e(e,n,t)},Ke=function(){var e={},t=oe.a.location.search;if(!t)return{};if(""!=t){var n=t.substr(1).split("&");for(var r in n)n.hasOwnProperty(r)&&(r=n[r].split("="),e[decodeURIComponent(r[0])]=r[1]&&decodeURIComponent(r[1])||"")}return e},Ge=function(t){return(t instanceof e?t:e.from(t.toString(),"utf-8")).toString("base64")},Ze={operationsSorter:{alpha:function(e,t){return e.get("path").localeCompare(t.get("path"))},method:function(e,t){return e.get("method").localeCompare(t.get("method"))}},tagsSorter:{alpha:function(e,t){return e.localeCompare(t)}}},Xe=function(e){var t=[];for(var n in e){var r=e[n];void 0!==r&&""!==r&&t.push([n,"=",encodeURIComponent(r).replace(/%20/g,"+")].join(""))}return t.join("&")},Qe=function(e,t,n){return!!Z()(n,(function(n){return te()(e[n],t[n])}))};function et(e){return"string"!=typeof e||""===e?"":Object(F.sanitizeUrl)(e)}function tt(e){return!(!e||l()(e).call(e,"localhost")>=0||l()(e).call(e,"127.0.0.1")>=0||"none"===e)}function nt(e){if(!z.a.OrderedMap.isOrderedMap(e))return null;if(!e.size)return null;var t=s()(e).call(e,(function(e,t){return i()(t).call(t,"2")&&j()(e.get("content")||{}).length>0})),n=e.get("default")||z.a.OrderedMap(),r=(n.get("content")||z.a.OrderedMap()).keySeq().toJS().length?n:null;return t||r}var rt=function(e){return"string"==typeof e||e instanceof String?a()(e).call(e).replace(/\s/g,"%20"):""},at=function(e){return ce()(rt(e).replace(/%20/g,"_"))},ot=function(e){return O()(e).call(e,(function(e,t){return/^x-/.test(t)}))},it=function(e){return O()(e).call(e,(function(e,t){return/^pattern|maxLength|minLength|maximum|minimum/.test(t)}))};function ct(e,t){var n,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:function(){return!0};if("object"!==U()(e)||L()(e)||null===e||!t)return e;var a=E()({},e);return A()(n=j()(a)).call(n,(function(e){e===t&&r(a[e],e)?delete a[e]:a[e]=ct(a[e],t,r)})),a}function st(e){if("string"==typeof e)return e;if(e&&e.toJS&&(e=e.toJS()),"object"===U()(e)&&null!==e)try{return f()(e,null,2)}catch(t){return String(e)}return null==e?"":e.toString()}function ut(e){return"number"==typeof e?e.toString():e}function lt(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.returnAll,r=void 0!==n&&n,a=t.allowHashes,o=void 0===a||a;if(!z.a.Map.isMap(e))throw new Error("paramToIdentifier: received a non-Im.Map parameter as input");var i,c,s,u=e.get("name"),l=e.get("in"),p=[];e&&e.hashCode&&l&&u&&o&&p.push(P()(i=P()(c="".concat(l,".")).call(c,u,".hash-")).call(i,e.hashCode()));l&&u&&p.push(P()(s="".concat(l,".")).call(s,u));return p.push(u),r?p:p[0]||""}function pt(e,t){var n,r=lt(e,{returnAll:!0});return O()(n=D()(r).call(r,(function(e){return t[e]}))).call(n,(function(e){return void 0!==e}))[0]}function ft(){return ht(le()(32).toString("base64"))}function dt(e){return ht(fe()("sha256").update(e).digest("base64"))}function ht(e){return e.replace(/\+/g,"-").replace(/\//g,"_").replace(/=/g,"")}var mt=function(e){return!e||!(!he(e)||!e.isEmpty())}}).call(this,n(470).Buffer)},function(e,t,n){e.exports=n(448)},function(e,t,n){var r=n(189);function a(e,t){for(var n=0;n<t.length;n++){var a=t[n];a.enumerable=a.enumerable||!1,a.configurable=!0,"value"in a&&(a.writable=!0),r(e,a.key,a)}}e.exports=function(e,t,n){return t&&a(e.prototype,t),n&&a(e,n),e}},function(e,t){e.exports=function(e,t){if(!(e instanceof t))throw new TypeError("Cannot call a class as a function")}},function(e,t,n){var r=n(656),a=n(659);e.exports=function(e,t){if("function"!=typeof t&&null!==t)throw new TypeError("Super expression must either be null or a function");e.prototype=r(t&&t.prototype,{constructor:{value:e,writable:!0,configurable:!0}}),t&&a(e,t)}},function(e,t,n){var r=n(359),a=n(153),o=n(670),i=n(671);e.exports=function(e){var t=o();return function(){var n,o=a(e);if(t){var c=a(this).constructor;n=r(o,arguments,c)}else n=o.apply(this,arguments);return i(this,n)}}},function(e,t){e.exports=function(e){if(void 0===e)throw new ReferenceError("this hasn't been initialised - super() hasn't been called");return e}},function(e,t){e.exports=require("prop-types")},function(e,t,n){e.exports=n(489)},function(e,t,n){e.exports=n(457)},function(e,t,n){e.exports=n(442)},function(e,t,n){e.exports=n(410)},function(e,t,n){e.exports=n(317)},function(e,t,n){var r=n(492),a=n(305),o=n(139),i=n(500);e.exports=function(e){return r(e)||a(e)||o(e)||i()}},function(e,t,n){var r=n(313),a=n(511),o=n(139),i=n(316);e.exports=function(e,t){return r(e)||a(e,t)||o(e,t)||i()}},function(e,t){e.exports=require("reselect")},function(e,t,n){var r=n(412),a=n(137);function o(t){return e.exports=o="function"==typeof a&&"symbol"==typeof r?function(e){return typeof e}:function(e){return e&&"function"==typeof a&&e.constructor===a&&e!==a.prototype?"symbol":typeof e},o(t)}e.exports=o},function(e,t,n){e.exports=n(464)},function(e,t,n){e.exports=n(452)},function(e,t,n){e.exports=n(461)},function(e,t,n){"use strict";var r=n(37),a=n(88).f,o=n(278),i=n(31),c=n(91),s=n(60),u=n(46),l=function(e){var t=function(t,n,r){if(this instanceof e){switch(arguments.length){case 0:return new e;case 1:return new e(t);case 2:return new e(t,n)}return new e(t,n,r)}return e.apply(this,arguments)};return t.prototype=e.prototype,t};e.exports=function(e,t){var n,p,f,d,h,m,v,g,y=e.target,b=e.global,E=e.stat,x=e.proto,S=b?r:E?r[y]:(r[y]||{}).prototype,w=b?i:i[y]||(i[y]={}),j=w.prototype;for(f in t)n=!o(b?f:y+(E?".":"#")+f,e.forced)&&S&&u(S,f),h=w[f],n&&(m=e.noTargetGet?(g=a(S,f))&&g.value:S[f]),d=n&&m?m:t[f],n&&typeof h==typeof d||(v=e.bind&&n?c(d,r):e.wrap&&n?l(d):x&&"function"==typeof d?c(Function.call,d):d,(e.sham||d&&d.sham||h&&h.sham)&&s(v,"sham",!0),w[f]=v,x&&(u(i,p=y+"Prototype")||s(i,p,{}),i[p][f]=d,e.real&&j&&!j[f]&&s(j,f,d)))}},function(e,t,n){var r=n(189),a=n(616),o=n(620),i=n(625),c=n(342),s=n(630),u=n(343),l=n(344),p=n(3);function f(e,t){var n=l(e);if(u){var r=u(e);t&&(r=s(r).call(r,(function(t){return c(e,t).enumerable}))),n.push.apply(n,r)}return n}e.exports=function(e){for(var t=1;t<arguments.length;t++){var n,s=null!=arguments[t]?arguments[t]:{};if(t%2)i(n=f(Object(s),!0)).call(n,(function(t){p(e,t,s[t])}));else if(o)a(e,o(s));else{var u;i(u=f(Object(s))).call(u,(function(t){r(e,t,c(s,t))}))}}return e}},function(e,t,n){"use strict";t.a=function(){var e={location:{},history:{},open:function(){},close:function(){},File:function(){}};if("undefined"==typeof window)return e;try{e=window;for(var t=0,n=["File","Blob","FormData"];t<n.length;t++){var r=n[t];r in window&&(e[r]=window[r])}}catch(e){console.error(e)}return e}()},function(e,t){e.exports=require("react-immutable-proptypes")},function(e,t,n){var r=n(654);function a(){return e.exports=a=r||function(e){for(var t=1;t<arguments.length;t++){var n=arguments[t];for(var r in n)Object.prototype.hasOwnProperty.call(n,r)&&(e[r]=n[r])}return e},a.apply(this,arguments)}e.exports=a},function(e,t,n){e.exports=n(466)},function(e,t,n){e.exports=n(407)},function(e,t){e.exports={}},function(e,t,n){e.exports=n(507)},function(e,t){e.exports=function(e){try{return!!e()}catch(e){return!0}}},function(e,t,n){e.exports=n(501)},function(e,t,n){"use strict";n.r(t),n.d(t,"isOAS3",(function(){return u})),n.d(t,"isSwagger2",(function(){return l})),n.d(t,"OAS3ComponentWrapFactory",(function(){return p}));var r=n(28),a=n.n(r),o=n(127),i=n.n(o),c=n(0),s=n.n(c);function u(e){var t=e.get("openapi");return"string"==typeof t&&(i()(t).call(t,"3.0.")&&t.length>4)}function l(e){var t=e.get("swagger");return"string"==typeof t&&i()(t).call(t,"2.0")}function p(e){return function(t,n){return function(r){return n&&n.specSelectors&&n.specSelectors.specJson?u(n.specSelectors.specJson())?s.a.createElement(e,a()({},r,n,{Ori:t})):s.a.createElement(t,r):(console.warn("OAS3 wrapper: couldn't get spec"),null)}}}},function(e,t,n){var r=n(37),a=n(177),o=n(46),i=n(135),c=n(178),s=n(283),u=a("wks"),l=r.Symbol,p=s?l:l&&l.withoutSetter||i;e.exports=function(e){return o(u,e)||(c&&o(l,e)?u[e]=l[e]:u[e]=p("Symbol."+e)),u[e]}},function(e,t,n){(function(t){var n=function(e){return e&&e.Math==Math&&e};e.exports=n("object"==typeof globalThis&&globalThis)||n("object"==typeof window&&window)||n("object"==typeof self&&self)||n("object"==typeof t&&t)||Function("return this")()}).call(this,n(171))},function(e,t,n){var r=n(31);e.exports=function(e){return r[e+"Prototype"]}},function(e,t,n){e.exports=n(645)},function(e,t){e.exports=function(e){return"object"==typeof e?null!==e:"function"==typeof e}},function(e,t,n){var r=n(149);e.exports=function(e,t,n){var a=null==e?void 0:r(e,t);return void 0===a?n:a}},function(e,t,n){"use strict";n.r(t),n.d(t,"UPDATE_SPEC",(function(){return Q})),n.d(t,"UPDATE_URL",(function(){return ee})),n.d(t,"UPDATE_JSON",(function(){return te})),n.d(t,"UPDATE_PARAM",(function(){return ne})),n.d(t,"UPDATE_EMPTY_PARAM_INCLUSION",(function(){return re})),n.d(t,"VALIDATE_PARAMS",(function(){return ae})),n.d(t,"SET_RESPONSE",(function(){return oe})),n.d(t,"SET_REQUEST",(function(){return ie})),n.d(t,"SET_MUTATED_REQUEST",(function(){return ce})),n.d(t,"LOG_REQUEST",(function(){return se})),n.d(t,"CLEAR_RESPONSE",(function(){return ue})),n.d(t,"CLEAR_REQUEST",(function(){return le})),n.d(t,"CLEAR_VALIDATE_PARAMS",(function(){return pe})),n.d(t,"UPDATE_OPERATION_META_VALUE",(function(){return fe})),n.d(t,"UPDATE_RESOLVED",(function(){return de})),n.d(t,"UPDATE_RESOLVED_SUBTREE",(function(){return he})),n.d(t,"SET_SCHEME",(function(){return me})),n.d(t,"updateSpec",(function(){return ve})),n.d(t,"updateResolved",(function(){return ge})),n.d(t,"updateUrl",(function(){return ye})),n.d(t,"updateJsonSpec",(function(){return be})),n.d(t,"parseToJson",(function(){return Ee})),n.d(t,"resolveSpec",(function(){return Se})),n.d(t,"requestResolvedSubtree",(function(){return Ce})),n.d(t,"changeParam",(function(){return Oe})),n.d(t,"changeParamByIdentity",(function(){return _e})),n.d(t,"updateResolvedSubtree",(function(){return Ae})),n.d(t,"invalidateResolvedSubtreeCache",(function(){return ke})),n.d(t,"validateParams",(function(){return Pe})),n.d(t,"updateEmptyParamInclusion",(function(){return Ie})),n.d(t,"clearValidateParams",(function(){return Te})),n.d(t,"changeConsumesValue",(function(){return Ne})),n.d(t,"changeProducesValue",(function(){return Re})),n.d(t,"setResponse",(function(){return Me})),n.d(t,"setRequest",(function(){return De})),n.d(t,"setMutatedRequest",(function(){return qe})),n.d(t,"logRequest",(function(){return Le})),n.d(t,"executeRequest",(function(){return Be})),n.d(t,"execute",(function(){return Ue})),n.d(t,"clearResponse",(function(){return Ve})),n.d(t,"clearRequest",(function(){return ze})),n.d(t,"setScheme",(function(){return Fe}));var r=n(25),a=n.n(r),o=n(49),i=n.n(o),c=n(267),s=n.n(c),u=n(21),l=n.n(u),p=n(15),f=n.n(p),d=n(2),h=n.n(d),m=n(14),v=n.n(m),g=n(16),y=n.n(g),b=n(12),E=n.n(b),x=n(66),S=n.n(x),w=n(39),j=n.n(w),C=n(83),O=n.n(C),_=n(22),A=n.n(_),k=n(69),P=n.n(k),I=n(268),T=n.n(I),N=n(5),R=n.n(N),M=n(13),D=n.n(M),q=n(20),L=n.n(q),B=n(84),U=n.n(B),V=n(1),z=n(79),F=n.n(z),J=n(110),W=n.n(J),H=n(157),$=n.n(H),Y=n(379),K=n.n(Y),G=n(269),Z=n.n(G),X=n(4),Q="spec_update_spec",ee="spec_update_url",te="spec_update_json",ne="spec_update_param",re="spec_update_empty_param_inclusion",ae="spec_validate_param",oe="spec_set_response",ie="spec_set_request",ce="spec_set_mutated_request",se="spec_log_request",ue="spec_clear_response",le="spec_clear_request",pe="spec_clear_validate_param",fe="spec_update_operation_meta_value",de="spec_update_resolved",he="spec_update_resolved_subtree",me="set_scheme";function ve(e){var t,n=(t=e,$()(t)?t:"").replace(/\t/g,"  ");if("string"==typeof e)return{type:Q,payload:n}}function ge(e){return{type:de,payload:e}}function ye(e){return{type:ee,payload:e}}function be(e){return{type:te,payload:e}}var Ee=function(e){return function(t){var n=t.specActions,r=t.specSelectors,a=t.errActions,o=r.specStr,i=null;try{e=e||o(),a.clear({source:"parser"}),i=U.a.safeLoad(e)}catch(e){return console.error(e),a.newSpecErr({source:"parser",level:"error",message:e.reason,line:e.mark&&e.mark.line?e.mark.line+1:void 0})}return i&&"object"===L()(i)?n.updateJsonSpec(i):{}}},xe=!1,Se=function(e,t){return function(n){var r=n.specActions,a=n.specSelectors,o=n.errActions,i=n.fn,c=i.fetch,s=i.resolve,u=i.AST,l=void 0===u?{}:u,p=n.getConfigs;xe||(console.warn("specActions.resolveSpec is deprecated since v3.10.0 and will be removed in v4.0.0; use requestResolvedSubtree instead!"),xe=!0);var f=p(),d=f.modelPropertyMacro,h=f.parameterMacro,m=f.requestInterceptor,v=f.responseInterceptor;void 0===e&&(e=a.specJson()),void 0===t&&(t=a.url());var g=l.getLineNumberForPath?l.getLineNumberForPath:function(){},y=a.specStr();return s({fetch:c,spec:e,baseDoc:t,modelPropertyMacro:d,parameterMacro:h,requestInterceptor:m,responseInterceptor:v}).then((function(e){var t=e.spec,n=e.errors;if(o.clear({type:"thrown"}),D()(n)&&n.length>0){var a=R()(n).call(n,(function(e){return console.error(e),e.line=e.fullPath?g(y,e.fullPath):null,e.path=e.fullPath?e.fullPath.join("."):null,e.level="error",e.type="thrown",e.source="resolver",T()(e,"message",{enumerable:!0,value:e.message}),e}));o.newThrownErrBatch(a)}return r.updateResolved(t)}))}},we=[],je=K()(P()(j.a.mark((function e(){var t,n,r,a,o,i,c,s,u,l,p,f,d,h,m,v,g;return j.a.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(t=we.system){e.next=4;break}return console.error("debResolveSubtrees: don't have a system to operate on, aborting."),e.abrupt("return");case 4:if(n=t.errActions,r=t.errSelectors,a=t.fn,o=a.resolveSubtree,i=a.AST,c=void 0===i?{}:i,s=t.specSelectors,u=t.specActions,o){e.next=8;break}return console.error("Error: Swagger-Client did not provide a `resolveSubtree` method, doing nothing."),e.abrupt("return");case 8:return l=c.getLineNumberForPath?c.getLineNumberForPath:function(){},p=s.specStr(),f=t.getConfigs(),d=f.modelPropertyMacro,h=f.parameterMacro,m=f.requestInterceptor,v=f.responseInterceptor,e.prev=11,e.next=14,A()(we).call(we,function(){var e=P()(j.a.mark((function e(t,a){var i,c,u,f,g,y,b;return j.a.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.next=2,t;case 2:return i=e.sent,c=i.resultMap,u=i.specWithCurrentSubtrees,e.next=7,o(u,a,{baseDoc:s.url(),modelPropertyMacro:d,parameterMacro:h,requestInterceptor:m,responseInterceptor:v});case 7:return f=e.sent,g=f.errors,y=f.spec,r.allErrors().size&&n.clearBy((function(e){var t;return"thrown"!==e.get("type")||"resolver"!==e.get("source")||!O()(t=e.get("fullPath")).call(t,(function(e,t){return e===a[t]||void 0===a[t]}))})),D()(g)&&g.length>0&&(b=R()(g).call(g,(function(e){return e.line=e.fullPath?l(p,e.fullPath):null,e.path=e.fullPath?e.fullPath.join("."):null,e.level="error",e.type="thrown",e.source="resolver",T()(e,"message",{enumerable:!0,value:e.message}),e})),n.newThrownErrBatch(b)),Z()(c,a,y),Z()(u,a,y),e.abrupt("return",{resultMap:c,specWithCurrentSubtrees:u});case 15:case"end":return e.stop()}}),e)})));return function(t,n){return e.apply(this,arguments)}}(),S.a.resolve({resultMap:(s.specResolvedSubtree([])||Object(V.Map)()).toJS(),specWithCurrentSubtrees:s.specJson().toJS()}));case 14:g=e.sent,delete we.system,we=[],e.next=22;break;case 19:e.prev=19,e.t0=e.catch(11),console.error(e.t0);case 22:u.updateResolvedSubtree([],g.resultMap);case 23:case"end":return e.stop()}}),e,null,[[11,19]])}))),35),Ce=function(e){return function(t){var n;E()(n=R()(we).call(we,(function(e){return e.join("@@")}))).call(n,e.join("@@"))>-1||(we.push(e),we.system=t,je())}};function Oe(e,t,n,r,a){return{type:ne,payload:{path:e,value:r,paramName:t,paramIn:n,isXml:a}}}function _e(e,t,n,r){return{type:ne,payload:{path:e,param:t,value:n,isXml:r}}}var Ae=function(e,t){return{type:he,payload:{path:e,value:t}}},ke=function(){return{type:he,payload:{path:[],value:Object(V.Map)()}}},Pe=function(e,t){return{type:ae,payload:{pathMethod:e,isOAS3:t}}},Ie=function(e,t,n,r){return{type:re,payload:{pathMethod:e,paramName:t,paramIn:n,includeEmptyValue:r}}};function Te(e){return{type:pe,payload:{pathMethod:e}}}function Ne(e,t){return{type:fe,payload:{path:e,value:t,key:"consumes_value"}}}function Re(e,t){return{type:fe,payload:{path:e,value:t,key:"produces_value"}}}var Me=function(e,t,n){return{payload:{path:e,method:t,res:n},type:oe}},De=function(e,t,n){return{payload:{path:e,method:t,req:n},type:ie}},qe=function(e,t,n){return{payload:{path:e,method:t,req:n},type:ce}},Le=function(e){return{payload:e,type:se}},Be=function(e){return function(t){var n,r,a=t.fn,o=t.specActions,i=t.specSelectors,c=t.getConfigs,u=t.oas3Selectors,p=e.pathName,d=e.method,m=e.operation,g=c(),b=g.requestInterceptor,E=g.responseInterceptor,x=m.toJS();m&&m.get("parameters")&&y()(n=v()(r=m.get("parameters")).call(r,(function(e){return e&&!0===e.get("allowEmptyValue")}))).call(n,(function(t){if(i.parameterInclusionSettingFor([p,d],t.get("name"),t.get("in"))){e.parameters=e.parameters||{};var n=Object(X.C)(t,e.parameters);(!n||n&&0===n.size)&&(e.parameters[t.get("name")]="")}}));if(e.contextUrl=F()(i.url()).toString(),x&&x.operationId?e.operationId=x.operationId:x&&p&&d&&(e.operationId=a.opId(x,p,d)),i.isOAS3()){var S,w=h()(S="".concat(p,":")).call(S,d);e.server=u.selectedServer(w)||u.selectedServer();var C=u.serverVariables({server:e.server,namespace:w}).toJS(),O=u.serverVariables({server:e.server}).toJS();e.serverVariables=f()(C).length?C:O,e.requestContentType=u.requestContentType(p,d),e.responseContentType=u.responseContentType(p,d)||"*/*";var _=u.requestBodyValue(p,d),A=u.requestBodyInclusionSetting(p,d);if(Object(X.t)(_))e.requestBody=JSON.parse(_);else if(_&&_.toJS){var k;e.requestBody=v()(k=R()(_).call(_,(function(e){return V.Map.isMap(e)?e.get("value"):e}))).call(k,(function(e,t){return(D()(e)?0!==e.length:!Object(X.q)(e))||A.get(t)})).toJS()}else e.requestBody=_}var I=l()({},e);I=a.buildRequest(I),o.setRequest(e.pathName,e.method,I);var T=function(){var t=P()(j.a.mark((function t(n){var r,a;return j.a.wrap((function(t){for(;;)switch(t.prev=t.next){case 0:return t.next=2,b.apply(undefined,[n]);case 2:return r=t.sent,a=l()({},r),o.setMutatedRequest(e.pathName,e.method,a),t.abrupt("return",r);case 6:case"end":return t.stop()}}),t)})));return function(e){return t.apply(this,arguments)}}();e.requestInterceptor=T,e.responseInterceptor=E;var N=s()();return a.execute(e).then((function(t){t.duration=s()()-N,o.setResponse(e.pathName,e.method,t)})).catch((function(t){console.error(t),o.setResponse(e.pathName,e.method,{error:!0,err:W()(t)})}))}},Ue=function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.path,n=e.method,r=i()(e,["path","method"]);return function(e){var o=e.fn.fetch,i=e.specSelectors,c=e.specActions,s=i.specJsonWithResolvedSubtrees().toJS(),u=i.operationScheme(t,n),l=i.contentTypeValues([t,n]).toJS(),p=l.requestContentType,f=l.responseContentType,d=/xml/i.test(p),h=i.parameterValues([t,n],d).toJS();return c.executeRequest(a()(a()({},r),{},{fetch:o,spec:s,pathName:t,method:n,parameters:h,requestContentType:p,scheme:u,responseContentType:f}))}};function Ve(e,t){return{type:ue,payload:{path:e,method:t}}}function ze(e,t){return{type:le,payload:{path:e,method:t}}}function Fe(e,t,n){return{type:me,payload:{scheme:e,path:t,method:n}}}},function(e,t,n){var r=n(33);e.exports=!r((function(){return 7!=Object.defineProperty({},1,{get:function(){return 7}})[1]}))},function(e,t,n){var r=n(31),a=n(46),o=n(176),i=n(55).f;e.exports=function(e){var t=r.Symbol||(r.Symbol={});a(t,e)||i(t,e,{value:o.f(e)})}},function(e,t,n){var r=n(314),a=n(190),o=n(521),i=n(137),c=n(139);e.exports=function(e,t){var n;if(void 0===i||null==o(e)){if(a(e)||(n=c(e))||t&&e&&"number"==typeof e.length){n&&(e=n);var s=0,u=function(){};return{s:u,n:function(){return s>=e.length?{done:!0}:{done:!1,value:e[s++]}},e:function(e){throw e},f:u}}throw new TypeError("Invalid attempt to iterate non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}var l,p=!0,f=!1;return{s:function(){n=r(e)},n:function(){var e=n.next();return p=e.done,e},e:function(e){f=!0,l=e},f:function(){try{p||null==n.return||n.return()}finally{if(f)throw l}}}}},function(e,t){var n={}.hasOwnProperty;e.exports=function(e,t){return n.call(e,t)}},function(e,t,n){var r=n(40);e.exports=function(e){if(!r(e))throw TypeError(String(e)+" is not an object");return e}},function(e,t){var n=Array.isArray;e.exports=n},function(e,t,n){var r=n(345),a=n(343),o=n(636);e.exports=function(e,t){if(null==e)return{};var n,i,c=o(e,t);if(a){var s=a(e);for(i=0;i<s.length;i++)n=s[i],r(t).call(t,n)>=0||Object.prototype.propertyIsEnumerable.call(e,n)&&(c[n]=e[n])}return c}},function(e,t,n){e.exports=n(485)},function(e,t,n){"use strict";n.r(t),n.d(t,"UPDATE_SELECTED_SERVER",(function(){return r})),n.d(t,"UPDATE_REQUEST_BODY_VALUE",(function(){return a})),n.d(t,"UPDATE_REQUEST_BODY_INCLUSION",(function(){return o})),n.d(t,"UPDATE_ACTIVE_EXAMPLES_MEMBER",(function(){return i})),n.d(t,"UPDATE_REQUEST_CONTENT_TYPE",(function(){return c})),n.d(t,"UPDATE_RESPONSE_CONTENT_TYPE",(function(){return s})),n.d(t,"UPDATE_SERVER_VARIABLE_VALUE",(function(){return u})),n.d(t,"SET_REQUEST_BODY_VALIDATE_ERROR",(function(){return l})),n.d(t,"CLEAR_REQUEST_BODY_VALIDATE_ERROR",(function(){return p})),n.d(t,"CLEAR_REQUEST_BODY_VALUE",(function(){return f})),n.d(t,"setSelectedServer",(function(){return d})),n.d(t,"setRequestBodyValue",(function(){return h})),n.d(t,"setRequestBodyInclusion",(function(){return m})),n.d(t,"setActiveExamplesMember",(function(){return v})),n.d(t,"setRequestContentType",(function(){return g})),n.d(t,"setResponseContentType",(function(){return y})),n.d(t,"setServerVariableValue",(function(){return b})),n.d(t,"setRequestBodyValidateError",(function(){return E})),n.d(t,"clearRequestBodyValidateError",(function(){return x})),n.d(t,"initRequestBodyValidateError",(function(){return S})),n.d(t,"clearRequestBodyValue",(function(){return w}));var r="oas3_set_servers",a="oas3_set_request_body_value",o="oas3_set_request_body_inclusion",i="oas3_set_active_examples_member",c="oas3_set_request_content_type",s="oas3_set_response_content_type",u="oas3_set_server_variable_value",l="oas3_set_request_body_validate_error",p="oas3_clear_request_body_validate_error",f="oas3_clear_request_body_value";function d(e,t){return{type:r,payload:{selectedServerUrl:e,namespace:t}}}function h(e){var t=e.value,n=e.pathMethod;return{type:a,payload:{value:t,pathMethod:n}}}function m(e){var t=e.value,n=e.pathMethod,r=e.name;return{type:o,payload:{value:t,pathMethod:n,name:r}}}function v(e){var t=e.name,n=e.pathMethod,r=e.contextType,a=e.contextName;return{type:i,payload:{name:t,pathMethod:n,contextType:r,contextName:a}}}function g(e){var t=e.value,n=e.pathMethod;return{type:c,payload:{value:t,pathMethod:n}}}function y(e){var t=e.value,n=e.path,r=e.method;return{type:s,payload:{value:t,path:n,method:r}}}function b(e){var t=e.server,n=e.namespace,r=e.key,a=e.val;return{type:u,payload:{server:t,namespace:n,key:r,val:a}}}var E=function(e){var t=e.path,n=e.method,r=e.validationErrors;return{type:l,payload:{path:t,method:n,validationErrors:r}}},x=function(e){var t=e.path,n=e.method;return{type:p,payload:{path:t,method:n}}},S=function(e){var t=e.pathMethod;return{type:p,payload:{path:t[0],method:t[1]}}},w=function(e){var t=e.pathMethod;return{type:f,payload:{pathMethod:t}}}},function(e,t){e.exports=function(e){var t=typeof e;return null!=e&&("object"==t||"function"==t)}},function(e,t,n){"use strict";n.d(t,"b",(function(){return b})),n.d(t,"e",(function(){return E})),n.d(t,"c",(function(){return S})),n.d(t,"a",(function(){return w})),n.d(t,"d",(function(){return j}));var r=n(45),a=n.n(r),o=n(16),i=n.n(o),c=n(32),s=n.n(c),u=n(2),l=n.n(u),p=n(20),f=n.n(p),d=n(52),h=n.n(d),m=n(274),v=n.n(m),g=function(e){return String.prototype.toLowerCase.call(e)},y=function(e){return e.replace(/[^\w]/gi,"_")};function b(e){var t=e.openapi;return!!t&&v()(t,"3")}function E(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"",r=arguments.length>3&&void 0!==arguments[3]?arguments[3]:{},a=r.v2OperationIdCompatibilityMode;if(!e||"object"!==f()(e))return null;var o=(e.operationId||"").replace(/\s/g,"");return o.length?y(e.operationId):x(t,n,{v2OperationIdCompatibilityMode:a})}function x(e,t){var n,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},a=r.v2OperationIdCompatibilityMode;if(a){var o,i,c=l()(o="".concat(t.toLowerCase(),"_")).call(o,e).replace(/[\s!@#$%^&*()_+=[{\]};:<>|./?,\\'""-]/g,"_");return(c=c||l()(i="".concat(e.substring(1),"_")).call(i,t)).replace(/((_){2,})/g,"_").replace(/^(_)*/g,"").replace(/([_])*$/g,"")}return l()(n="".concat(g(t))).call(n,y(e))}function S(e,t){var n;return l()(n="".concat(g(t),"-")).call(n,e)}function w(e,t){return e&&e.paths?function(e,t){return function(e,t,n){if(!e||"object"!==f()(e)||!e.paths||"object"!==f()(e.paths))return null;var r=e.paths;for(var a in r)for(var o in r[a])if("PARAMETERS"!==o.toUpperCase()){var i=r[a][o];if(i&&"object"===f()(i)){var c={spec:e,pathName:a,method:o.toUpperCase(),operation:i},s=t(c);if(n&&s)return c}}return}(e,t,!0)||null}(e,(function(e){var n,r=e.pathName,a=e.method,o=e.operation;if(!o||"object"!==f()(o))return!1;var i=o.operationId,c=E(o,r,a),u=S(r,a);return s()(n=[c,u,i]).call(n,(function(e){return e&&e===t}))})):null}function j(e){var t=e.spec,n=t.paths,r={};if(!n||t.$$normalized)return e;for(var o in n){var c=n[o];if(h()(c)){var u=c.parameters,p=function(e){var n=c[e];if(!h()(n))return"continue";var p=E(n,o,e);if(p){r[p]?r[p].push(n):r[p]=[n];var f=r[p];if(f.length>1)i()(f).call(f,(function(e,t){var n;e.__originalOperationId=e.__originalOperationId||e.operationId,e.operationId=l()(n="".concat(p)).call(n,t+1)}));else if(void 0!==n.operationId){var d=f[0];d.__originalOperationId=d.__originalOperationId||n.operationId,d.operationId=p}}if("parameters"!==e){var m=[],v={};for(var g in t)"produces"!==g&&"consumes"!==g&&"security"!==g||(v[g]=t[g],m.push(v));if(u&&(v.parameters=u,m.push(v)),m.length){var y,b=a()(m);try{for(b.s();!(y=b.n()).done;){var x=y.value;for(var S in x)if(n[S]){if("parameters"===S){var w,j=a()(x[S]);try{var C=function(){var e,t=w.value;s()(e=n[S]).call(e,(function(e){return e.name&&e.name===t.name||e.$ref&&e.$ref===t.$ref||e.$$ref&&e.$$ref===t.$$ref||e===t}))||n[S].push(t)};for(j.s();!(w=j.n()).done;)C()}catch(e){j.e(e)}finally{j.f()}}}else n[S]=x[S]}}catch(e){b.e(e)}finally{b.f()}}}};for(var f in c)p(f)}}return t.$$normalized=!0,e}},function(e,t,n){"use strict";n.r(t),n.d(t,"NEW_THROWN_ERR",(function(){return o})),n.d(t,"NEW_THROWN_ERR_BATCH",(function(){return i})),n.d(t,"NEW_SPEC_ERR",(function(){return c})),n.d(t,"NEW_SPEC_ERR_BATCH",(function(){return s})),n.d(t,"NEW_AUTH_ERR",(function(){return u})),n.d(t,"CLEAR",(function(){return l})),n.d(t,"CLEAR_BY",(function(){return p})),n.d(t,"newThrownErr",(function(){return f})),n.d(t,"newThrownErrBatch",(function(){return d})),n.d(t,"newSpecErr",(function(){return h})),n.d(t,"newSpecErrBatch",(function(){return m})),n.d(t,"newAuthErr",(function(){return v})),n.d(t,"clear",(function(){return g})),n.d(t,"clearBy",(function(){return y}));var r=n(110),a=n.n(r),o="err_new_thrown_err",i="err_new_thrown_err_batch",c="err_new_spec_err",s="err_new_spec_err_batch",u="err_new_auth_err",l="err_clear",p="err_clear_by";function f(e){return{type:o,payload:a()(e)}}function d(e){return{type:i,payload:e}}function h(e){return{type:c,payload:e}}function m(e){return{type:s,payload:e}}function v(e){return{type:u,payload:e}}function g(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return{type:l,payload:e}}function y(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:function(){return!0};return{type:p,payload:e}}},function(e,t,n){var r=n(43),a=n(277),o=n(47),i=n(134),c=Object.defineProperty;t.f=r?c:function(e,t,n){if(o(e),t=i(t,!0),o(n),a)try{return c(e,t,n)}catch(e){}if("get"in n||"set"in n)throw TypeError("Accessors not supported");return"value"in n&&(e[t]=n.value),e}},function(e,t,n){var r=n(43),a=n(33),o=n(46),i=Object.defineProperty,c={},s=function(e){throw e};e.exports=function(e,t){if(o(c,e))return c[e];t||(t={});var n=[][e],u=!!o(t,"ACCESSORS")&&t.ACCESSORS,l=o(t,0)?t[0]:s,p=o(t,1)?t[1]:void 0;return c[e]=!!n&&!a((function(){if(u&&!r)return!0;var e={length:-1};u?i(e,1,{enumerable:!0,get:s}):e[1]=1,n.call(e,l,p)}))}},function(e,t){e.exports=require("classnames")},function(e,t,n){var r=n(96),a=n(52);e.exports=function(e){if(!a(e))return!1;var t=r(e);return"[object Function]"==t||"[object GeneratorFunction]"==t||"[object AsyncFunction]"==t||"[object Proxy]"==t}},function(e,t,n){var r=n(133),a=n(103);e.exports=function(e){return r(a(e))}},function(e,t,n){var r=n(43),a=n(55),o=n(89);e.exports=r?function(e,t,n){return a.f(e,t,o(1,n))}:function(e,t,n){return e[t]=n,e}},function(e,t,n){var r=n(31),a=n(37),o=function(e){return"function"==typeof e?e:void 0};e.exports=function(e,t){return arguments.length<2?o(r[e])||o(a[e]):r[e]&&r[e][t]||a[e]&&a[e][t]}},function(e,t,n){var r=n(103);e.exports=function(e){return Object(r(e))}},function(e,t,n){var r,a,o,i=n(285),c=n(37),s=n(40),u=n(60),l=n(46),p=n(136),f=n(117),d=c.WeakMap;if(i){var h=new d,m=h.get,v=h.has,g=h.set;r=function(e,t){return g.call(h,e,t),t},a=function(e){return m.call(h,e)||{}},o=function(e){return v.call(h,e)}}else{var y=p("state");f[y]=!0,r=function(e,t){return u(e,y,t),t},a=function(e){return l(e,y)?e[y]:{}},o=function(e){return l(e,y)}}e.exports={set:r,get:a,has:o,enforce:function(e){return o(e)?a(e):r(e,{})},getterFor:function(e){return function(t){var n;if(!s(t)||(n=a(t)).type!==e)throw TypeError("Incompatible receiver, "+e+" required");return n}}}},function(e,t,n){n(119);var r=n(418),a=n(37),o=n(74),i=n(60),c=n(93),s=n(36)("toStringTag");for(var u in r){var l=a[u],p=l&&l.prototype;p&&o(p)!==s&&i(p,s,u),c[u]=c.Array}},function(e,t,n){var r=n(319),a="object"==typeof self&&self&&self.Object===Object&&self,o=r||a||Function("return this")();e.exports=o},function(e,t,n){e.exports=n(640)},function(e,t){e.exports=function(e){if("function"!=typeof e)throw TypeError(String(e)+" is not a function");return e}},function(e,t,n){var r=n(116),a=Math.min;e.exports=function(e){return e>0?a(r(e),9007199254740991):0}},function(e,t,n){var r=n(646);function a(e,t,n,a,o,i,c){try{var s=e[i](c),u=s.value}catch(e){return void n(e)}s.done?t(u):r.resolve(u).then(a,o)}e.exports=function(e){return function(){var t=this,n=arguments;return new r((function(r,o){var i=e.apply(t,n);function c(e){a(i,r,o,c,s,"next",e)}function s(e){a(i,r,o,c,s,"throw",e)}c(void 0)}))}}},function(e,t){e.exports=require("deep-extend")},function(e,t,n){e.exports=n(523)},function(e,t,n){"use strict";n.r(t),n.d(t,"SHOW_AUTH_POPUP",(function(){return d})),n.d(t,"AUTHORIZE",(function(){return h})),n.d(t,"LOGOUT",(function(){return m})),n.d(t,"PRE_AUTHORIZE_OAUTH2",(function(){return v})),n.d(t,"AUTHORIZE_OAUTH2",(function(){return g})),n.d(t,"VALIDATE",(function(){return y})),n.d(t,"CONFIGURE_AUTH",(function(){return b})),n.d(t,"RESTORE_AUTHORIZATION",(function(){return E})),n.d(t,"showDefinitions",(function(){return x})),n.d(t,"authorize",(function(){return S})),n.d(t,"authorizeWithPersistOption",(function(){return w})),n.d(t,"logout",(function(){return j})),n.d(t,"logoutWithPersistOption",(function(){return C})),n.d(t,"preAuthorizeImplicit",(function(){return O})),n.d(t,"authorizeOauth2",(function(){return _})),n.d(t,"authorizeOauth2WithPersistOption",(function(){return A})),n.d(t,"authorizePassword",(function(){return k})),n.d(t,"authorizeApplication",(function(){return P})),n.d(t,"authorizeAccessCodeWithFormParams",(function(){return I})),n.d(t,"authorizeAccessCodeWithBasicAuthentication",(function(){return T})),n.d(t,"authorizeRequest",(function(){return N})),n.d(t,"configureAuth",(function(){return R})),n.d(t,"restoreAuthorization",(function(){return M})),n.d(t,"persistAuthorizationIfNeeded",(function(){return D}));var r=n(20),a=n.n(r),o=n(21),i=n.n(o),c=n(30),s=n.n(c),u=n(79),l=n.n(u),p=n(26),f=n(4),d="show_popup",h="authorize",m="logout",v="pre_authorize_oauth2",g="authorize_oauth2",y="validate",b="configure_auth",E="restore_authorization";function x(e){return{type:d,payload:e}}function S(e){return{type:h,payload:e}}var w=function(e){return function(t){var n=t.authActions;n.authorize(e),n.persistAuthorizationIfNeeded()}};function j(e){return{type:m,payload:e}}var C=function(e){return function(t){var n=t.authActions;n.logout(e),n.persistAuthorizationIfNeeded()}},O=function(e){return function(t){var n=t.authActions,r=t.errActions,a=e.auth,o=e.token,i=e.isValid,c=a.schema,u=a.name,l=c.get("flow");delete p.a.swaggerUIRedirectOauth2,"accessCode"===l||i||r.newAuthErr({authId:u,source:"auth",level:"warning",message:"Authorization may be unsafe, passed state was changed in server Passed state wasn't returned from auth server"}),o.error?r.newAuthErr({authId:u,source:"auth",level:"error",message:s()(o)}):n.authorizeOauth2WithPersistOption({auth:a,token:o})}};function _(e){return{type:g,payload:e}}var A=function(e){return function(t){var n=t.authActions;n.authorizeOauth2(e),n.persistAuthorizationIfNeeded()}},k=function(e){return function(t){var n=t.authActions,r=e.schema,a=e.name,o=e.username,c=e.password,s=e.passwordType,u=e.clientId,l=e.clientSecret,p={grant_type:"password",scope:e.scopes.join(" "),username:o,password:c},d={};switch(s){case"request-body":!function(e,t,n){t&&i()(e,{client_id:t});n&&i()(e,{client_secret:n})}(p,u,l);break;case"basic":d.Authorization="Basic "+Object(f.a)(u+":"+l);break;default:console.warn("Warning: invalid passwordType ".concat(s," was passed, not including client id and secret"))}return n.authorizeRequest({body:Object(f.b)(p),url:r.get("tokenUrl"),name:a,headers:d,query:{},auth:e})}};var P=function(e){return function(t){var n=t.authActions,r=e.schema,a=e.scopes,o=e.name,i=e.clientId,c=e.clientSecret,s={Authorization:"Basic "+Object(f.a)(i+":"+c)},u={grant_type:"client_credentials",scope:a.join(" ")};return n.authorizeRequest({body:Object(f.b)(u),name:o,url:r.get("tokenUrl"),auth:e,headers:s})}},I=function(e){var t=e.auth,n=e.redirectUrl;return function(e){var r=e.authActions,a=t.schema,o=t.name,i=t.clientId,c=t.clientSecret,s=t.codeVerifier,u={grant_type:"authorization_code",code:t.code,client_id:i,client_secret:c,redirect_uri:n,code_verifier:s};return r.authorizeRequest({body:Object(f.b)(u),name:o,url:a.get("tokenUrl"),auth:t})}},T=function(e){var t=e.auth,n=e.redirectUrl;return function(e){var r=e.authActions,a=t.schema,o=t.name,i=t.clientId,c=t.clientSecret,s={Authorization:"Basic "+Object(f.a)(i+":"+c)},u={grant_type:"authorization_code",code:t.code,client_id:i,redirect_uri:n};return r.authorizeRequest({body:Object(f.b)(u),name:o,url:a.get("tokenUrl"),auth:t,headers:s})}},N=function(e){return function(t){var n,r=t.fn,o=t.getConfigs,c=t.authActions,u=t.errActions,p=t.oas3Selectors,f=t.specSelectors,d=t.authSelectors,h=e.body,m=e.query,v=void 0===m?{}:m,g=e.headers,y=void 0===g?{}:g,b=e.name,E=e.url,x=e.auth,S=(d.getConfigs()||{}).additionalQueryStringParams;if(f.isOAS3()){var w=p.serverEffectiveValue(p.selectedServer());n=l()(E,w,!0)}else n=l()(E,f.url(),!0);"object"===a()(S)&&(n.query=i()({},n.query,S));var j=n.toString(),C=i()({Accept:"application/json, text/plain, */*","Content-Type":"application/x-www-form-urlencoded","X-Requested-With":"XMLHttpRequest"},y);r.fetch({url:j,method:"post",headers:C,query:v,body:h,requestInterceptor:o().requestInterceptor,responseInterceptor:o().responseInterceptor}).then((function(e){var t=JSON.parse(e.data),n=t&&(t.error||""),r=t&&(t.parseError||"");e.ok?n||r?u.newAuthErr({authId:b,level:"error",source:"auth",message:s()(t)}):c.authorizeOauth2WithPersistOption({auth:x,token:t}):u.newAuthErr({authId:b,level:"error",source:"auth",message:e.statusText})})).catch((function(e){var t=new Error(e).message;if(e.response&&e.response.data){var n=e.response.data;try{var r="string"==typeof n?JSON.parse(n):n;r.error&&(t+=", error: ".concat(r.error)),r.error_description&&(t+=", description: ".concat(r.error_description))}catch(e){}}u.newAuthErr({authId:b,level:"error",source:"auth",message:t})}))}};function R(e){return{type:b,payload:e}}function M(e){return{type:E,payload:e}}var D=function(){return function(e){var t=e.authSelectors;if((0,e.getConfigs)().persistAuthorization){var n=t.authorized();localStorage.setItem("authorized",s()(n.toJS()))}}}},function(e,t,n){var r=n(181),a=n(55).f,o=n(60),i=n(46),c=n(416),s=n(36)("toStringTag");e.exports=function(e,t,n,u){if(e){var l=n?e:e.prototype;i(l,s)||a(l,s,{configurable:!0,value:t}),u&&!r&&o(l,"toString",c)}}},function(e,t,n){var r=n(181),a=n(90),o=n(36)("toStringTag"),i="Arguments"==a(function(){return arguments}());e.exports=r?a:function(e){var t,n,r;return void 0===e?"Undefined":null===e?"Null":"string"==typeof(n=function(e,t){try{return e[t]}catch(e){}}(t=Object(e),o))?n:i?a(t):"Object"==(r=a(t))&&"function"==typeof t.callee?"Arguments":r}},function(e,t,n){var r=n(91),a=n(133),o=n(62),i=n(68),c=n(184),s=[].push,u=function(e){var t=1==e,n=2==e,u=3==e,l=4==e,p=6==e,f=5==e||p;return function(d,h,m,v){for(var g,y,b=o(d),E=a(b),x=r(h,m,3),S=i(E.length),w=0,j=v||c,C=t?j(d,S):n?j(d,0):void 0;S>w;w++)if((f||w in E)&&(y=x(g=E[w],w,b),e))if(t)C[w]=y;else if(y)switch(e){case 3:return!0;case 5:return g;case 6:return w;case 2:s.call(C,g)}else if(l)return!1;return p?-1:u||l?l:C}};e.exports={forEach:u(0),map:u(1),filter:u(2),some:u(3),every:u(4),find:u(5),findIndex:u(6)}},function(e,t){e.exports=function(e){return null!=e&&"object"==typeof e}},function(e,t,n){var r=n(318);e.exports=function(e){return null==e?"":r(e)}},function(e,t,n){"use strict";n.r(t),n.d(t,"lastError",(function(){return R})),n.d(t,"url",(function(){return M})),n.d(t,"specStr",(function(){return D})),n.d(t,"specSource",(function(){return q})),n.d(t,"specJson",(function(){return L})),n.d(t,"specResolved",(function(){return B})),n.d(t,"specResolvedSubtree",(function(){return U})),n.d(t,"specJsonWithResolvedSubtrees",(function(){return z})),n.d(t,"spec",(function(){return F})),n.d(t,"isOAS3",(function(){return J})),n.d(t,"info",(function(){return W})),n.d(t,"externalDocs",(function(){return H})),n.d(t,"version",(function(){return $})),n.d(t,"semver",(function(){return Y})),n.d(t,"paths",(function(){return K})),n.d(t,"operations",(function(){return G})),n.d(t,"consumes",(function(){return Z})),n.d(t,"produces",(function(){return X})),n.d(t,"security",(function(){return Q})),n.d(t,"securityDefinitions",(function(){return ee})),n.d(t,"findDefinition",(function(){return te})),n.d(t,"definitions",(function(){return ne})),n.d(t,"basePath",(function(){return re})),n.d(t,"host",(function(){return ae})),n.d(t,"schemes",(function(){return oe})),n.d(t,"operationsWithRootInherited",(function(){return ie})),n.d(t,"tags",(function(){return ce})),n.d(t,"tagDetails",(function(){return se})),n.d(t,"operationsWithTags",(function(){return ue})),n.d(t,"taggedOperations",(function(){return le})),n.d(t,"responses",(function(){return pe})),n.d(t,"requests",(function(){return fe})),n.d(t,"mutatedRequests",(function(){return de})),n.d(t,"responseFor",(function(){return he})),n.d(t,"requestFor",(function(){return me})),n.d(t,"mutatedRequestFor",(function(){return ve})),n.d(t,"allowTryItOutFor",(function(){return ge})),n.d(t,"parameterWithMetaByIdentity",(function(){return ye})),n.d(t,"parameterInclusionSettingFor",(function(){return be})),n.d(t,"parameterWithMeta",(function(){return Ee})),n.d(t,"operationWithMeta",(function(){return xe})),n.d(t,"getParameter",(function(){return Se})),n.d(t,"hasHost",(function(){return we})),n.d(t,"parameterValues",(function(){return je})),n.d(t,"parametersIncludeIn",(function(){return Ce})),n.d(t,"parametersIncludeType",(function(){return Oe})),n.d(t,"contentTypeValues",(function(){return _e})),n.d(t,"currentProducesFor",(function(){return Ae})),n.d(t,"producesOptionsFor",(function(){return ke})),n.d(t,"consumesOptionsFor",(function(){return Pe})),n.d(t,"operationScheme",(function(){return Ie})),n.d(t,"canExecuteScheme",(function(){return Te})),n.d(t,"validateBeforeExecute",(function(){return Ne})),n.d(t,"getOAS3RequiredRequestBodyContentType",(function(){return Re})),n.d(t,"isMediaTypeSchemaPropertiesEqual",(function(){return Me}));var r=n(13),a=n.n(r),o=n(18),i=n.n(o),c=n(32),s=n.n(c),u=n(155),l=n.n(u),p=n(22),f=n.n(p),d=n(50),h=n.n(d),m=n(14),v=n.n(m),g=n(5),y=n.n(g),b=n(12),E=n.n(b),x=n(16),S=n.n(x),w=n(23),j=n.n(w),C=n(2),O=n.n(C),_=n(17),A=n.n(_),k=n(19),P=n(4),I=n(1),T=["get","put","post","delete","options","head","patch","trace"],N=function(e){return e||Object(I.Map)()},R=Object(k.createSelector)(N,(function(e){return e.get("lastError")})),M=Object(k.createSelector)(N,(function(e){return e.get("url")})),D=Object(k.createSelector)(N,(function(e){return e.get("spec")||""})),q=Object(k.createSelector)(N,(function(e){return e.get("specSource")||"not-editor"})),L=Object(k.createSelector)(N,(function(e){return e.get("json",Object(I.Map)())})),B=Object(k.createSelector)(N,(function(e){return e.get("resolved",Object(I.Map)())})),U=function(e,t){var n;return e.getIn(O()(n=["resolvedSubtrees"]).call(n,A()(t)),void 0)},V=function e(t,n){return I.Map.isMap(t)&&I.Map.isMap(n)?n.get("$$ref")?n:Object(I.OrderedMap)().mergeWith(e,t,n):n},z=Object(k.createSelector)(N,(function(e){return Object(I.OrderedMap)().mergeWith(V,e.get("json"),e.get("resolvedSubtrees"))})),F=function(e){return L(e)},J=Object(k.createSelector)(F,(function(){return!1})),W=Object(k.createSelector)(F,(function(e){return De(e&&e.get("info"))})),H=Object(k.createSelector)(F,(function(e){return De(e&&e.get("externalDocs"))})),$=Object(k.createSelector)(W,(function(e){return e&&e.get("version")})),Y=Object(k.createSelector)($,(function(e){var t;return j()(t=/v?([0-9]*)\.([0-9]*)\.([0-9]*)/i.exec(e)).call(t,1)})),K=Object(k.createSelector)(z,(function(e){return e.get("paths")})),G=Object(k.createSelector)(K,(function(e){if(!e||e.size<1)return Object(I.List)();var t=Object(I.List)();return e&&S()(e)?(S()(e).call(e,(function(e,n){if(!e||!S()(e))return{};S()(e).call(e,(function(e,r){var a;E()(T).call(T,r)<0||(t=t.push(Object(I.fromJS)({path:n,method:r,operation:e,id:O()(a="".concat(r,"-")).call(a,n)})))}))})),t):Object(I.List)()})),Z=Object(k.createSelector)(F,(function(e){return Object(I.Set)(e.get("consumes"))})),X=Object(k.createSelector)(F,(function(e){return Object(I.Set)(e.get("produces"))})),Q=Object(k.createSelector)(F,(function(e){return e.get("security",Object(I.List)())})),ee=Object(k.createSelector)(F,(function(e){return e.get("securityDefinitions")})),te=function(e,t){var n=e.getIn(["resolvedSubtrees","definitions",t],null),r=e.getIn(["json","definitions",t],null);return n||r||null},ne=Object(k.createSelector)(F,(function(e){var t=e.get("definitions");return I.Map.isMap(t)?t:Object(I.Map)()})),re=Object(k.createSelector)(F,(function(e){return e.get("basePath")})),ae=Object(k.createSelector)(F,(function(e){return e.get("host")})),oe=Object(k.createSelector)(F,(function(e){return e.get("schemes",Object(I.Map)())})),ie=Object(k.createSelector)(G,Z,X,(function(e,t,n){return y()(e).call(e,(function(e){return e.update("operation",(function(e){if(e){if(!I.Map.isMap(e))return;return e.withMutations((function(e){return e.get("consumes")||e.update("consumes",(function(e){return Object(I.Set)(e).merge(t)})),e.get("produces")||e.update("produces",(function(e){return Object(I.Set)(e).merge(n)})),e}))}return Object(I.Map)()}))}))})),ce=Object(k.createSelector)(F,(function(e){var t=e.get("tags",Object(I.List)());return I.List.isList(t)?v()(t).call(t,(function(e){return I.Map.isMap(e)})):Object(I.List)()})),se=function(e,t){var n,r=ce(e)||Object(I.List)();return h()(n=v()(r).call(r,I.Map.isMap)).call(n,(function(e){return e.get("name")===t}),Object(I.Map)())},ue=Object(k.createSelector)(ie,ce,(function(e,t){return f()(e).call(e,(function(e,t){var n=Object(I.Set)(t.getIn(["operation","tags"]));return n.count()<1?e.update("default",Object(I.List)(),(function(e){return e.push(t)})):f()(n).call(n,(function(e,n){return e.update(n,Object(I.List)(),(function(e){return e.push(t)}))}),e)}),f()(t).call(t,(function(e,t){return e.set(t.get("name"),Object(I.List)())}),Object(I.OrderedMap)()))})),le=function(e){return function(t){var n,r=(0,t.getConfigs)(),a=r.tagsSorter,o=r.operationsSorter;return y()(n=ue(e).sortBy((function(e,t){return t}),(function(e,t){var n="function"==typeof a?a:P.I.tagsSorter[a];return n?n(e,t):null}))).call(n,(function(t,n){var r="function"==typeof o?o:P.I.operationsSorter[o],a=r?l()(t).call(t,r):t;return Object(I.Map)({tagDetails:se(e,n),operations:a})}))}},pe=Object(k.createSelector)(N,(function(e){return e.get("responses",Object(I.Map)())})),fe=Object(k.createSelector)(N,(function(e){return e.get("requests",Object(I.Map)())})),de=Object(k.createSelector)(N,(function(e){return e.get("mutatedRequests",Object(I.Map)())})),he=function(e,t,n){return pe(e).getIn([t,n],null)},me=function(e,t,n){return fe(e).getIn([t,n],null)},ve=function(e,t,n){return de(e).getIn([t,n],null)},ge=function(){return!0},ye=function(e,t,n){var r,a,o=z(e).getIn(O()(r=["paths"]).call(r,A()(t),["parameters"]),Object(I.OrderedMap)()),i=e.getIn(O()(a=["meta","paths"]).call(a,A()(t),["parameters"]),Object(I.OrderedMap)()),c=y()(o).call(o,(function(e){var t,r,a,o=i.get(O()(t="".concat(n.get("in"),".")).call(t,n.get("name"))),c=i.get(O()(r=O()(a="".concat(n.get("in"),".")).call(a,n.get("name"),".hash-")).call(r,n.hashCode()));return Object(I.OrderedMap)().merge(e,o,c)}));return h()(c).call(c,(function(e){return e.get("in")===n.get("in")&&e.get("name")===n.get("name")}),Object(I.OrderedMap)())},be=function(e,t,n,r){var a,o,i=O()(a="".concat(r,".")).call(a,n);return e.getIn(O()(o=["meta","paths"]).call(o,A()(t),["parameter_inclusions",i]),!1)},Ee=function(e,t,n,r){var a,o=z(e).getIn(O()(a=["paths"]).call(a,A()(t),["parameters"]),Object(I.OrderedMap)()),i=h()(o).call(o,(function(e){return e.get("in")===r&&e.get("name")===n}),Object(I.OrderedMap)());return ye(e,t,i)},xe=function(e,t,n){var r,a=z(e).getIn(["paths",t,n],Object(I.OrderedMap)()),o=e.getIn(["meta","paths",t,n],Object(I.OrderedMap)()),i=y()(r=a.get("parameters",Object(I.List)())).call(r,(function(r){return ye(e,[t,n],r)}));return Object(I.OrderedMap)().merge(a,o).set("parameters",i)};function Se(e,t,n,r){var a;t=t||[];var o=e.getIn(O()(a=["meta","paths"]).call(a,A()(t),["parameters"]),Object(I.fromJS)([]));return h()(o).call(o,(function(e){return I.Map.isMap(e)&&e.get("name")===n&&e.get("in")===r}))||Object(I.Map)()}var we=Object(k.createSelector)(F,(function(e){var t=e.get("host");return"string"==typeof t&&t.length>0&&"/"!==t[0]}));function je(e,t,n){var r;t=t||[];var a=xe.apply(void 0,O()(r=[e]).call(r,A()(t))).get("parameters",Object(I.List)());return f()(a).call(a,(function(e,t){var r=n&&"body"===t.get("in")?t.get("value_xml"):t.get("value");return e.set(Object(P.B)(t,{allowHashes:!1}),r)}),Object(I.fromJS)({}))}function Ce(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"";if(I.List.isList(e))return s()(e).call(e,(function(e){return I.Map.isMap(e)&&e.get("in")===t}))}function Oe(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"";if(I.List.isList(e))return s()(e).call(e,(function(e){return I.Map.isMap(e)&&e.get("type")===t}))}function _e(e,t){var n,r;t=t||[];var a=z(e).getIn(O()(n=["paths"]).call(n,A()(t)),Object(I.fromJS)({})),o=e.getIn(O()(r=["meta","paths"]).call(r,A()(t)),Object(I.fromJS)({})),i=Ae(e,t),c=a.get("parameters")||new I.List,s=o.get("consumes_value")?o.get("consumes_value"):Oe(c,"file")?"multipart/form-data":Oe(c,"formData")?"application/x-www-form-urlencoded":void 0;return Object(I.fromJS)({requestContentType:s,responseContentType:i})}function Ae(e,t){var n,r;t=t||[];var a=z(e).getIn(O()(n=["paths"]).call(n,A()(t)),null);if(null!==a){var o=e.getIn(O()(r=["meta","paths"]).call(r,A()(t),["produces_value"]),null),i=a.getIn(["produces",0],null);return o||i||"application/json"}}function ke(e,t){var n;t=t||[];var r=z(e),a=r.getIn(O()(n=["paths"]).call(n,A()(t)),null);if(null!==a){var o=t,c=i()(o,1)[0],s=a.get("produces",null),u=r.getIn(["paths",c,"produces"],null),l=r.getIn(["produces"],null);return s||u||l}}function Pe(e,t){var n;t=t||[];var r=z(e),a=r.getIn(O()(n=["paths"]).call(n,A()(t)),null);if(null!==a){var o=t,c=i()(o,1)[0],s=a.get("consumes",null),u=r.getIn(["paths",c,"consumes"],null),l=r.getIn(["consumes"],null);return s||u||l}}var Ie=function(e,t,n){var r=e.get("url").match(/^([a-z][a-z0-9+\-.]*):/),o=a()(r)?r[1]:null;return e.getIn(["scheme",t,n])||e.getIn(["scheme","_defaultScheme"])||o||""},Te=function(e,t,n){var r;return E()(r=["http","https"]).call(r,Ie(e,t,n))>-1},Ne=function(e,t){var n;t=t||[];var r=e.getIn(O()(n=["meta","paths"]).call(n,A()(t),["parameters"]),Object(I.fromJS)([])),a=!0;return S()(r).call(r,(function(e){var t=e.get("errors");t&&t.count()&&(a=!1)})),a},Re=function(e,t){var n,r,a={requestBody:!1,requestContentType:{}},o=e.getIn(O()(n=["resolvedSubtrees","paths"]).call(n,A()(t),["requestBody"]),Object(I.fromJS)([]));return o.size<1||(o.getIn(["required"])&&(a.requestBody=o.getIn(["required"])),S()(r=o.getIn(["content"]).entrySeq()).call(r,(function(e){var t=e[0];if(e[1].getIn(["schema","required"])){var n=e[1].getIn(["schema","required"]).toJS();a.requestContentType[t]=n}}))),a},Me=function(e,t,n,r){var a,o=e.getIn(O()(a=["resolvedSubtrees","paths"]).call(a,A()(t),["requestBody","content"]),Object(I.fromJS)([]));if(o.size<2||!n||!r)return!1;var i=o.getIn([n,"schema","properties"],Object(I.fromJS)([])),c=o.getIn([r,"schema","properties"],Object(I.fromJS)([]));return!!i.equals(c)};function De(e){return I.Map.isMap(e)?e:new I.Map}},function(e,t){e.exports=require("url-parse")},function(e,t){e.exports=!0},function(e,t,n){"use strict";var r=n(284).charAt,a=n(63),o=n(179),i="String Iterator",c=a.set,s=a.getterFor(i);o(String,"String",(function(e){c(this,{type:i,string:String(e),index:0})}),(function(){var e,t=s(this),n=t.string,a=t.index;return a>=n.length?{value:void 0,done:!0}:(e=r(n,a),t.index+=e.length,{value:e,done:!1})}))},function(e,t,n){e.exports=n(474)},function(e,t,n){e.exports=n(611)},function(e,t){e.exports=require("js-yaml")},function(e,t,n){"use strict";n.r(t),n.d(t,"UPDATE_LAYOUT",(function(){return a})),n.d(t,"UPDATE_FILTER",(function(){return o})),n.d(t,"UPDATE_MODE",(function(){return i})),n.d(t,"SHOW",(function(){return c})),n.d(t,"updateLayout",(function(){return s})),n.d(t,"updateFilter",(function(){return u})),n.d(t,"show",(function(){return l})),n.d(t,"changeMode",(function(){return p}));var r=n(4),a="layout_update_layout",o="layout_update_filter",i="layout_update_mode",c="layout_show";function s(e){return{type:a,payload:e}}function u(e){return{type:o,payload:e}}function l(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1];return e=Object(r.w)(e),{type:c,payload:{thing:e,shown:t}}}function p(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"";return e=Object(r.w)(e),{type:i,payload:{thing:e,mode:t}}}},function(e,t){e.exports=require("url")},function(e,t){e.exports=require("react-syntax-highlighter")},function(e,t,n){var r=n(43),a=n(132),o=n(89),i=n(59),c=n(134),s=n(46),u=n(277),l=Object.getOwnPropertyDescriptor;t.f=r?l:function(e,t){if(e=i(e),t=c(t,!0),u)try{return l(e,t)}catch(e){}if(s(e,t))return o(!a.f.call(e,t),e[t])}},function(e,t){e.exports=function(e,t){return{enumerable:!(1&e),configurable:!(2&e),writable:!(4&e),value:t}}},function(e,t){var n={}.toString;e.exports=function(e){return n.call(e).slice(8,-1)}},function(e,t,n){var r=n(67);e.exports=function(e,t,n){if(r(e),void 0===t)return e;switch(n){case 0:return function(){return e.call(t)};case 1:return function(n){return e.call(t,n)};case 2:return function(n,r){return e.call(t,n,r)};case 3:return function(n,r,a){return e.call(t,n,r,a)}}return function(){return e.apply(t,arguments)}}},function(e,t,n){var r,a=n(47),o=n(180),i=n(175),c=n(117),s=n(290),u=n(172),l=n(136),p=l("IE_PROTO"),f=function(){},d=function(e){return"<script>"+e+"</"+"script>"},h=function(){try{r=document.domain&&new ActiveXObject("htmlfile")}catch(e){}var e,t;h=r?function(e){e.write(d("")),e.close();var t=e.parentWindow.Object;return e=null,t}(r):((t=u("iframe")).style.display="none",s.appendChild(t),t.src=String("javascript:"),(e=t.contentWindow.document).open(),e.write(d("document.F=Object")),e.close(),e.F);for(var n=i.length;n--;)delete h.prototype[i[n]];return h()};c[p]=!0,e.exports=Object.create||function(e,t){var n;return null!==e?(f.prototype=a(e),n=new f,f.prototype=null,n[p]=e):n=h(),void 0===t?n:o(n,t)}},function(e,t){e.exports={}},function(e,t,n){var r=n(60);e.exports=function(e,t,n,a){a&&a.enumerable?e[t]=n:r(e,t,n)}},function(e,t,n){"use strict";var r=n(33);e.exports=function(e,t){var n=[][e];return!!n&&r((function(){n.call(null,t||function(){throw 1},1)}))}},function(e,t,n){var r=n(104),a=n(527),o=n(528),i=r?r.toStringTag:void 0;e.exports=function(e){return null==e?void 0===e?"[object Undefined]":"[object Null]":i&&i in Object(e)?a(e):o(e)}},function(e,t,n){var r=n(545),a=n(548);e.exports=function(e,t){var n=a(e,t);return r(n)?n:void 0}},function(e,t,n){var r=n(332),a=n(585),o=n(105);e.exports=function(e){return o(e)?r(e):a(e)}},function(e,t,n){var r=n(47),a=n(310),o=n(68),i=n(91),c=n(123),s=n(309),u=function(e,t){this.stopped=e,this.result=t};(e.exports=function(e,t,n,l,p){var f,d,h,m,v,g,y,b=i(t,n,l?2:1);if(p)f=e;else{if("function"!=typeof(d=c(e)))throw TypeError("Target is not iterable");if(a(d)){for(h=0,m=o(e.length);m>h;h++)if((v=l?b(r(y=e[h])[0],y[1]):b(e[h]))&&v instanceof u)return v;return new u(!1)}f=d.call(e)}for(g=f.next;!(y=g.call(f)).done;)if("object"==typeof(v=s(f,b,y.value,l))&&v&&v instanceof u)return v;return new u(!1)}).stop=function(e){return new u(!0,e)}},function(e,t){e.exports=function(e,t){return e===t||e!=e&&t!=t}},function(e,t,n){e.exports=n(741)},function(e,t,n){"use strict";n.r(t),n.d(t,"default",(function(){return l}));var r=n(5),a=n.n(r),o=n(14),i=n.n(o),c=n(378),s=n.n(c),u=[n(210),n(211)];function l(e){var t,n={jsSpec:{}},r=s()(u,(function(e,t){try{var r=t.transform(e,n);return i()(r).call(r,(function(e){return!!e}))}catch(t){return console.error("Transformer error:",t),e}}),e);return a()(t=i()(r).call(r,(function(e){return!!e}))).call(t,(function(e){return!e.get("line")&&e.get("path"),e}))}},function(e,t){e.exports=function(e){if(null==e)throw TypeError("Can't call method on "+e);return e}},function(e,t,n){var r=n(65).Symbol;e.exports=r},function(e,t,n){var r=n(58),a=n(199);e.exports=function(e){return null!=e&&a(e.length)&&!r(e)}},function(e,t,n){var r=n(48),a=n(202),o=n(593),i=n(77);e.exports=function(e,t){return r(e)?e:a(e,t)?[e]:o(i(e))}},function(e,t,n){var r=n(140);e.exports=function(e){if("string"==typeof e||r(e))return e;var t=e+"";return"0"==t&&1/e==-Infinity?"-0":t}},function(e,t){e.exports=function(e,t,n){if(!(e instanceof t))throw TypeError("Incorrect "+(n?n+" ":"")+"invocation");return e}},function(e,t,n){var r=n(151),a=n(355);e.exports=function(e,t,n,o){var i=!n;n||(n={});for(var c=-1,s=t.length;++c<s;){var u=t[c],l=o?o(n[u],e[u],u,n,e):void 0;void 0===l&&(l=e[u]),i?a(n,u,l):r(n,u,l)}return n}},function(e,t){e.exports=require("serialize-error")},function(e,t,n){"use strict";n.r(t),n.d(t,"sampleFromSchema",(function(){return S})),n.d(t,"inferSchema",(function(){return w})),n.d(t,"sampleXmlFromSchema",(function(){return j})),n.d(t,"createXMLExample",(function(){return C})),n.d(t,"memoizedCreateXMLExample",(function(){return O})),n.d(t,"memoizedSampleFromSchema",(function(){return _}));var r=n(16),a=n.n(r),o=n(5),i=n.n(o),c=n(13),s=n.n(c),u=n(12),l=n.n(u),p=n(2),f=n.n(p),d=n(4),h=n(374),m=n.n(h),v=n(266),g=n.n(v),y=n(154),b=n.n(y),E={string:function(){return"string"},string_email:function(){return"user@example.com"},"string_date-time":function(){return(new Date).toISOString()},string_date:function(){return(new Date).toISOString().substring(0,10)},string_uuid:function(){return"3fa85f64-5717-4562-b3fc-2c963f66afa6"},string_hostname:function(){return"example.com"},string_ipv4:function(){return"198.51.100.42"},string_ipv6:function(){return"2001:0db8:5b96:0000:0000:426f:8e17:642a"},number:function(){return 0},number_float:function(){return 0},integer:function(){return 0},boolean:function(e){return"boolean"!=typeof e.default||e.default}},x=function(e){var t,n=e=Object(d.A)(e),r=n.type,a=n.format,o=E[f()(t="".concat(r,"_")).call(t,a)]||E[r];return Object(d.s)(o)?o(e):"Unknown Type: "+e.type},S=function e(t){var n,r,a=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},o=Object(d.A)(t),c=o.type,u=o.example,p=o.properties,f=o.additionalProperties,h=o.items,m=a.includeReadOnly,v=a.includeWriteOnly;if(void 0!==u)return Object(d.e)(u,"$$ref",(function(e){return"string"==typeof e&&l()(e).call(e,"#")>-1}));if(!c)if(p)c="object";else{if(!h)return;c="array"}if("object"===c){var g=Object(d.A)(p),y={};for(var b in g)g[b]&&g[b].deprecated||g[b]&&g[b].readOnly&&!m||g[b]&&g[b].writeOnly&&!v||(y[b]=e(g[b],a));if(!0===f)y.additionalProp1={};else if(f)for(var E=Object(d.A)(f),S=e(E,a),w=1;w<4;w++)y["additionalProp"+w]=S;return y}return"array"===c?s()(h.anyOf)?i()(n=h.anyOf).call(n,(function(t){return e(t,a)})):s()(h.oneOf)?i()(r=h.oneOf).call(r,(function(t){return e(t,a)})):[e(h,a)]:t.enum?t.default?t.default:Object(d.w)(t.enum)[0]:"file"!==c?x(t):void 0},w=function(e){return e.schema&&(e=e.schema),e.properties&&(e.type="object"),e},j=function e(t){var n,r,o=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},i=b()({},Object(d.A)(t)),c=i.type,u=i.properties,l=i.additionalProperties,p=i.items,h=i.example,m=o.includeReadOnly,v=o.includeWriteOnly,g=i.default,y={},E={},S=t.xml,w=S.name,j=S.prefix,C=S.namespace,O=i.enum;if(!c)if(u||l)c="object";else{if(!p)return;c="array"}if(n=(j?j+":":"")+(w=w||"notagname"),C){var _=j?"xmlns:"+j:"xmlns";E[_]=C}if("array"===c&&p){if(p.xml=p.xml||S||{},p.xml.name=p.xml.name||S.name,S.wrapped)return y[n]=[],s()(h)?a()(h).call(h,(function(t){p.example=t,y[n].push(e(p,o))})):s()(g)?a()(g).call(g,(function(t){p.default=t,y[n].push(e(p,o))})):y[n]=[e(p,o)],E&&y[n].push({_attr:E}),y;var A=[];return s()(h)?(a()(h).call(h,(function(t){p.example=t,A.push(e(p,o))})),A):s()(g)?(a()(g).call(g,(function(t){p.default=t,A.push(e(p,o))})),A):e(p,o)}if("object"===c){var k=Object(d.A)(u);for(var P in y[n]=[],h=h||{},k)if(k.hasOwnProperty(P)&&(!k[P].readOnly||m)&&(!k[P].writeOnly||v))if(k[P].xml=k[P].xml||{},k[P].xml.attribute){var I=s()(k[P].enum)&&k[P].enum[0],T=k[P].example,N=k[P].default;E[k[P].xml.name||P]=void 0!==T&&T||void 0!==h[P]&&h[P]||void 0!==N&&N||I||x(k[P])}else{k[P].xml.name=k[P].xml.name||P,void 0===k[P].example&&void 0!==h[P]&&(k[P].example=h[P]);var R,M=e(k[P]);if(s()(M))y[n]=f()(R=y[n]).call(R,M);else y[n].push(M)}return!0===l?y[n].push({additionalProp:"Anything can be here"}):l&&y[n].push({additionalProp:x(l)}),E&&y[n].push({_attr:E}),y}return r=void 0!==h?h:void 0!==g?g:s()(O)?O[0]:x(t),y[n]=E?[{_attr:E},r]:r,y};function C(e,t){var n=j(e,t);if(n)return m()(n,{declaration:!0,indent:"\t"})}var O=g()(C),_=g()(S)},function(e,t,n){"use strict";n.r(t),n.d(t,"UPDATE_CONFIGS",(function(){return o})),n.d(t,"TOGGLE_CONFIGS",(function(){return i})),n.d(t,"update",(function(){return c})),n.d(t,"toggle",(function(){return s})),n.d(t,"loaded",(function(){return u}));var r=n(3),a=n.n(r),o="configs_update",i="configs_toggle";function c(e,t){return{type:o,payload:a()({},e,t)}}function s(e){return{type:i,payload:e}}var u=function(){return function(e){var t=e.getConfigs,n=e.authActions;if(t().persistAuthorization){var r=localStorage.getItem("authorized");r&&n.restoreAuthorization({authorized:JSON.parse(r)})}}}},function(e,t,n){"use strict";n.d(t,"a",(function(){return l}));var r=n(34),a=n.n(r),o=n(14),i=n.n(o),c=n(1),s=n.n(c),u=s.a.Set.of("type","format","items","default","maximum","exclusiveMaximum","minimum","exclusiveMinimum","maxLength","minLength","pattern","maxItems","minItems","uniqueItems","enum","multipleOf");function l(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.isOAS3;if(!s.a.Map.isMap(e))return{schema:s.a.Map(),parameterContentMediaType:null};if(!n)return"body"===e.get("in")?{schema:e.get("schema",s.a.Map()),parameterContentMediaType:null}:{schema:i()(e).call(e,(function(e,t){return a()(u).call(u,t)})),parameterContentMediaType:null};if(e.get("content")){var r=e.get("content",s.a.Map({})).keySeq(),o=r.first();return{schema:e.getIn(["content",o,"schema"],s.a.Map()),parameterContentMediaType:o}}return{schema:e.get("schema",s.a.Map()),parameterContentMediaType:null}}},function(e,t){e.exports=require("fast-json-patch")},function(e,t,n){var r=n(280),a=n(175);e.exports=Object.keys||function(e){return r(e,a)}},function(e,t){var n=Math.ceil,r=Math.floor;e.exports=function(e){return isNaN(e=+e)?0:(e>0?r:n)(e)}},function(e,t){e.exports={}},function(e,t,n){var r=n(46),a=n(62),o=n(136),i=n(289),c=o("IE_PROTO"),s=Object.prototype;e.exports=i?Object.getPrototypeOf:function(e){return e=a(e),r(e,c)?e[c]:"function"==typeof e.constructor&&e instanceof e.constructor?e.constructor.prototype:e instanceof Object?s:null}},function(e,t,n){"use strict";var r=n(59),a=n(183),o=n(93),i=n(63),c=n(179),s="Array Iterator",u=i.set,l=i.getterFor(s);e.exports=c(Array,"Array",(function(e,t){u(this,{type:s,target:r(e),index:0,kind:t})}),(function(){var e=l(this),t=e.target,n=e.kind,r=e.index++;return!t||r>=t.length?(e.target=void 0,{value:void 0,done:!0}):"keys"==n?{value:r,done:!1}:"values"==n?{value:t[r],done:!1}:{value:[r,t[r]],done:!1}}),"values"),o.Arguments=o.Array,a("keys"),a("values"),a("entries")},function(e,t,n){var r=n(90);e.exports=Array.isArray||function(e){return"Array"==r(e)}},function(e,t,n){"use strict";var r=n(134),a=n(55),o=n(89);e.exports=function(e,t,n){var i=r(t);i in e?a.f(e,i,o(0,n)):e[i]=n}},function(e,t,n){var r=n(33),a=n(36),o=n(185),i=a("species");e.exports=function(e){return o>=51||!r((function(){var t=[];return(t.constructor={})[i]=function(){return{foo:1}},1!==t[e](Boolean).foo}))}},function(e,t,n){var r=n(74),a=n(93),o=n(36)("iterator");e.exports=function(e){if(null!=e)return e[o]||e["@@iterator"]||a[r(e)]}},function(e,t,n){var r=n(94);e.exports=function(e,t,n){for(var a in t)n&&n.unsafe&&e[a]?e[a]=t[a]:r(e,a,t[a],n);return e}},function(e,t,n){"use strict";var r=n(67),a=function(e){var t,n;this.promise=new e((function(e,r){if(void 0!==t||void 0!==n)throw TypeError("Bad Promise constructor");t=e,n=r})),this.resolve=r(t),this.reject=r(n)};e.exports.f=function(e){return new a(e)}},function(e,t,n){"use strict";n.r(t),n.d(t,"parseYamlConfig",(function(){return o}));var r=n(84),a=n.n(r),o=function(e,t){try{return a.a.safeLoad(e)}catch(e){return t&&t.errActions.newThrownErr(new Error(e)),{}}}},function(e,t,n){e.exports=n(480)},function(e,t,n){"use strict";n.r(t),n.d(t,"makeMappedContainer",(function(){return A})),n.d(t,"render",(function(){return k})),n.d(t,"getComponent",(function(){return T}));var r=n(20),a=n.n(r),o=n(15),i=n.n(o),c=n(21),s=n.n(c),u=n(28),l=n.n(u),p=n(7),f=n.n(p),d=n(6),h=n.n(d),m=n(8),v=n.n(m),g=n(9),y=n.n(g),b=n(0),E=n.n(b),x=n(380),S=n.n(x),w=n(270),j=n(381),C=n.n(j),O=function(e,t,n){var r=function(e,t){return function(n){v()(a,n);var r=y()(a);function a(){return f()(this,a),r.apply(this,arguments)}return h()(a,[{key:"render",value:function(){return E.a.createElement(t,l()({},e(),this.props,this.context))}}]),a}(b.Component)}(e,t),a=Object(w.connect)((function(n,r){var a=s()({},r,e());return(t.prototype.mapStateToProps||function(e){return{state:e}})(n,a)}))(r);return n?function(e,t){return function(n){v()(a,n);var r=y()(a);function a(){return f()(this,a),r.apply(this,arguments)}return h()(a,[{key:"render",value:function(){return E.a.createElement(w.Provider,{store:e},E.a.createElement(t,l()({},this.props,this.context)))}}]),a}(b.Component)}(n,a):a},_=function(e,t,n,r){for(var a in t){var o=t[a];"function"==typeof o&&o(n[a],r[a],e())}},A=function(e,t,n,r,a,o){return function(t){v()(c,t);var r=y()(c);function c(t,n){var a;return f()(this,c),a=r.call(this,t,n),_(e,o,t,{}),a}return h()(c,[{key:"componentWillReceiveProps",value:function(t){_(e,o,t,this.props)}},{key:"render",value:function(){var e=C()(this.props,o?i()(o):[]),t=n(a,"root");return E.a.createElement(t,e)}}]),c}(b.Component)},k=function(e,t,n,r,a){var o=n(e,t,r,"App","root");S.a.render(E.a.createElement(o,null),a)},P=function(e){var t=e.name;return E.a.createElement("div",{className:"fallback"},"😱 ",E.a.createElement("i",null,"Could not render ","t"===t?"this component":t,", see the console."))},I=function(e){var t=function(e){return!(e.prototype&&e.prototype.isReactComponent)}(e)?function(e){return function(t){v()(r,t);var n=y()(r);function r(){return f()(this,r),n.apply(this,arguments)}return h()(r,[{key:"render",value:function(){return e(this.props)}}]),r}(b.Component)}(e):e,n=t.prototype.render;return t.prototype.render=function(){try{for(var e=arguments.length,r=new Array(e),a=0;a<e;a++)r[a]=arguments[a];return n.apply(this,r)}catch(e){return console.error(e),E.a.createElement(P,{error:e,name:t.name})}},t},T=function(e,t,n,r,o){var i=arguments.length>5&&void 0!==arguments[5]?arguments[5]:{};if("string"!=typeof r)throw new TypeError("Need a string, to fetch a component. Was given a "+a()(r));var c=n(r);return c?o?"root"===o?O(e,c,t()):O(e,I(c)):I(c):(i.failSilently||e().log.warn("Could not find component:",r),null)}},function(e,t,n){e.exports=n(730)},function(e,t,n){"use strict";n.r(t),n.d(t,"setHash",(function(){return r}));var r=function(e){return e?history.pushState(null,null,"#".concat(e)):window.location.hash=""}},function(e,t){e.exports=require("redux")},function(e,t,n){"use strict";var r={}.propertyIsEnumerable,a=Object.getOwnPropertyDescriptor,o=a&&!r.call({1:2},1);t.f=o?function(e){var t=a(this,e);return!!t&&t.enumerable}:r},function(e,t,n){var r=n(33),a=n(90),o="".split;e.exports=r((function(){return!Object("z").propertyIsEnumerable(0)}))?function(e){return"String"==a(e)?o.call(e,""):Object(e)}:Object},function(e,t,n){var r=n(40);e.exports=function(e,t){if(!r(e))return e;var n,a;if(t&&"function"==typeof(n=e.toString)&&!r(a=n.call(e)))return a;if("function"==typeof(n=e.valueOf)&&!r(a=n.call(e)))return a;if(!t&&"function"==typeof(n=e.toString)&&!r(a=n.call(e)))return a;throw TypeError("Can't convert object to primitive value")}},function(e,t){var n=0,r=Math.random();e.exports=function(e){return"Symbol("+String(void 0===e?"":e)+")_"+(++n+r).toString(36)}},function(e,t,n){var r=n(177),a=n(135),o=r("keys");e.exports=function(e){return o[e]||(o[e]=a(e))}},function(e,t,n){e.exports=n(419)},function(e,t){},function(e,t,n){var r=n(306),a=n(498),o=n(304);e.exports=function(e,t){var n;if(e){if("string"==typeof e)return o(e,t);var i=a(n=Object.prototype.toString.call(e)).call(n,8,-1);return"Object"===i&&e.constructor&&(i=e.constructor.name),"Map"===i||"Set"===i?r(e):"Arguments"===i||/^(?:Ui|I)nt(?:8|16|32)(?:Clamped)?Array$/.test(i)?o(e,t):void 0}}},function(e,t,n){var r=n(96),a=n(76);e.exports=function(e){return"symbol"==typeof e||a(e)&&"[object Symbol]"==r(e)}},function(e,t,n){var r=n(97)(Object,"create");e.exports=r},function(e,t,n){var r=n(553),a=n(554),o=n(555),i=n(556),c=n(557);function s(e){var t=-1,n=null==e?0:e.length;for(this.clear();++t<n;){var r=e[t];this.set(r[0],r[1])}}s.prototype.clear=r,s.prototype.delete=a,s.prototype.get=o,s.prototype.has=i,s.prototype.set=c,e.exports=s},function(e,t,n){var r=n(100);e.exports=function(e,t){for(var n=e.length;n--;)if(r(e[n][0],t))return n;return-1}},function(e,t,n){var r=n(559);e.exports=function(e,t){var n=e.__data__;return r(t)?n["string"==typeof t?"string":"hash"]:n.map}},function(e,t,n){var r=n(564),a=n(592),o=n(203),i=n(48),c=n(597);e.exports=function(e){return"function"==typeof e?e:null==e?o:"object"==typeof e?i(e)?a(e[0],e[1]):r(e):c(e)}},function(e,t){var n=/^(?:0|[1-9]\d*)$/;e.exports=function(e,t){var r=typeof e;return!!(t=null==t?9007199254740991:t)&&("number"==r||"symbol"!=r&&n.test(e))&&e>-1&&e%1==0&&e<t}},function(e,t){var n=Object.prototype;e.exports=function(e){var t=e&&e.constructor;return e===("function"==typeof t&&t.prototype||n)}},function(e,t,n){var r=n(587),a=n(192),o=n(588),i=n(589),c=n(590),s=n(96),u=n(324),l="[object Map]",p="[object Promise]",f="[object Set]",d="[object WeakMap]",h="[object DataView]",m=u(r),v=u(a),g=u(o),y=u(i),b=u(c),E=s;(r&&E(new r(new ArrayBuffer(1)))!=h||a&&E(new a)!=l||o&&E(o.resolve())!=p||i&&E(new i)!=f||c&&E(new c)!=d)&&(E=function(e){var t=s(e),n="[object Object]"==t?e.constructor:void 0,r=n?u(n):"";if(r)switch(r){case m:return h;case v:return l;case g:return p;case y:return f;case b:return d}return t}),e.exports=E},function(e,t,n){var r=n(106),a=n(107);e.exports=function(e,t){for(var n=0,o=(t=r(t,e)).length;null!=e&&n<o;)e=e[a(t[n++])];return n&&n==o?e:void 0}},function(e,t){e.exports=function(e){try{return{error:!1,value:e()}}catch(e){return{error:!0,value:e}}}},function(e,t,n){var r=n(355),a=n(100),o=Object.prototype.hasOwnProperty;e.exports=function(e,t,n){var i=e[t];o.call(e,t)&&a(i,n)&&(void 0!==n||t in e)||r(e,t,n)}},function(e,t,n){var r=n(117),a=n(40),o=n(46),i=n(55).f,c=n(135),s=n(725),u=c("meta"),l=0,p=Object.isExtensible||function(){return!0},f=function(e){i(e,u,{value:{objectID:"O"+ ++l,weakData:{}}})},d=e.exports={REQUIRED:!1,fastKey:function(e,t){if(!a(e))return"symbol"==typeof e?e:("string"==typeof e?"S":"P")+e;if(!o(e,u)){if(!p(e))return"F";if(!t)return"E";f(e)}return e[u].objectID},getWeakData:function(e,t){if(!o(e,u)){if(!p(e))return!0;if(!t)return!1;f(e)}return e[u].weakData},onFreeze:function(e){return s&&d.REQUIRED&&p(e)&&!o(e,u)&&f(e),e}};r[u]=!0},function(e,t,n){var r=n(666),a=n(358);function o(t){return e.exports=o=a?r:function(e){return e.__proto__||r(e)},o(t)}e.exports=o},function(e,t,n){"use strict";var r="function"==typeof Symbol&&"symbol"==typeof Symbol.iterator?function(e){return typeof e}:function(e){return e&&"function"==typeof Symbol&&e.constructor===Symbol&&e!==Symbol.prototype?"symbol":typeof e};function a(e){return null===e?"null":void 0===e?"undefined":"object"===(void 0===e?"undefined":r(e))?Array.isArray(e)?"array":"object":void 0===e?"undefined":r(e)}function o(e){return"object"===a(e)?c(e):"array"===a(e)?i(e):e}function i(e){return e.map(o)}function c(e){var t={};for(var n in e)e.hasOwnProperty(n)&&(t[n]=o(e[n]));return t}function s(e){for(var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:[],n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},r={arrayBehaviour:n.arrayBehaviour||"replace"},o=t.map((function(e){return e||{}})),u=e||{},l=0;l<o.length;l++)for(var p=o[l],f=Object.keys(p),d=0;d<f.length;d++){var h=f[d],m=p[h],v=a(m),g=a(u[h]);if("object"===v)if("undefined"!==g){var y="object"===g?u[h]:{};u[h]=s({},[y,c(m)],r)}else u[h]=c(m);else if("array"===v)if("array"===g){var b=i(m);u[h]="merge"===r.arrayBehaviour?u[h].concat(b):b}else u[h]=i(m);else u[h]=m}return u}e.exports=function(e){for(var t=arguments.length,n=Array(t>1?t-1:0),r=1;r<t;r++)n[r-1]=arguments[r];return s(e,n)},e.exports.noMutate=function(){for(var e=arguments.length,t=Array(e),n=0;n<e;n++)t[n]=arguments[n];return s({},t)},e.exports.withOptions=function(e,t,n){return s(e,t,n)}},function(e,t,n){e.exports=n(513)},function(e,t,n){var r=n(563)(n(600));e.exports=r},function(e,t,n){var r=n(96),a=n(48),o=n(76);e.exports=function(e){return"string"==typeof e||!a(e)&&o(e)&&"[object String]"==r(e)}},function(e,t,n){e.exports=n(708)},function(e,t,n){var r=n(710),a=n(364)((function(e,t){return null==e?{}:r(e,t)}));e.exports=a},function(e,t){e.exports=require("buffer")},function(e,t,n){var r=n(151),a=n(109),o=n(728),i=n(105),c=n(147),s=n(98),u=Object.prototype.hasOwnProperty,l=o((function(e,t){if(c(t)||i(t))a(t,s(t),e);else for(var n in t)u.call(t,n)&&r(e,n,t[n])}));e.exports=l},function(e,t){e.exports=require("btoa")},function(e,t,n){e.exports=n(735)},function(e,t,n){"use strict";n.d(t,"a",(function(){return _}));var r=n(2),a=n.n(r),o=n(15),i=n.n(o),c=n(20),s=n.n(c),u=n(7),l=n.n(u),p=n(6),f=n.n(p),d=n(10),h=n.n(d),m=n(8),v=n.n(m),g=n(9),y=n.n(g),b=n(3),E=n.n(b),x=n(0),S=n.n(x),w=n(79),j=n.n(w),C=(n(11),n(4)),O=n(26),_=function(e){v()(n,e);var t=y()(n);function n(e,r){var a;l()(this,n),a=t.call(this,e,r),E()(h()(a),"getDefinitionUrl",(function(){var e=a.props.specSelectors;return new j.a(e.url(),O.a.location).toString()}));var o=(0,e.getConfigs)().validatorUrl;return a.state={url:a.getDefinitionUrl(),validatorUrl:void 0===o?"https://validator.swagger.io/validator":o},a}return f()(n,[{key:"componentWillReceiveProps",value:function(e){var t=(0,e.getConfigs)().validatorUrl;this.setState({url:this.getDefinitionUrl(),validatorUrl:void 0===t?"https://validator.swagger.io/validator":t})}},{key:"render",value:function(){var e,t,n=(0,this.props.getConfigs)().spec,r=Object(C.G)(this.state.validatorUrl);return"object"===s()(n)&&i()(n).length?null:this.state.url&&Object(C.F)(this.state.validatorUrl)&&Object(C.F)(this.state.url)?S.a.createElement("span",{className:"float-right"},S.a.createElement("a",{target:"_blank",rel:"noopener noreferrer",href:a()(e="".concat(r,"/debug?url=")).call(e,encodeURIComponent(this.state.url))},S.a.createElement(A,{src:a()(t="".concat(r,"?url=")).call(t,encodeURIComponent(this.state.url)),alt:"Online validator badge"}))):null}}]),n}(S.a.Component),A=function(e){v()(n,e);var t=y()(n);function n(e){var r;return l()(this,n),(r=t.call(this,e)).state={loaded:!1,error:!1},r}return f()(n,[{key:"componentDidMount",value:function(){var e=this,t=new Image;t.onload=function(){e.setState({loaded:!0})},t.onerror=function(){e.setState({error:!0})},t.src=this.props.src}},{key:"componentWillReceiveProps",value:function(e){var t=this;if(e.src!==this.props.src){var n=new Image;n.onload=function(){t.setState({loaded:!0})},n.onerror=function(){t.setState({error:!0})},n.src=e.src}}},{key:"render",value:function(){return this.state.error?S.a.createElement("img",{alt:"Error"}):this.state.loaded?S.a.createElement("img",{src:this.props.src,alt:this.props.alt}):null}}]),n}(S.a.Component)},function(e,t){e.exports=require("react-copy-to-clipboard")},function(e,t,n){"use strict";n.d(t,"a",(function(){return I}));var r=n(5),a=n.n(r),o=n(28),i=n.n(o),c=n(12),s=n.n(c),u=n(2),l=n.n(u),p=n(7),f=n.n(p),d=n(6),h=n.n(d),m=n(10),v=n.n(m),g=n(8),y=n.n(g),b=n(9),E=n.n(b),x=n(3),S=n.n(x),w=n(0),j=n.n(w),C=n(404),O=n.n(C),_=n(27),A=n.n(_),k=n(11),P=n.n(k),I=function(e){y()(r,e);var t=E()(r);function r(){var e,n;f()(this,r);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return n=t.call.apply(t,l()(e=[this]).call(e,o)),S()(v()(n),"getModelName",(function(e){return-1!==s()(e).call(e,"#/definitions/")?e.replace(/^.*#\/definitions\//,""):-1!==s()(e).call(e,"#/components/schemas/")?e.replace(/^.*#\/components\/schemas\//,""):void 0})),S()(v()(n),"getRefSchema",(function(e){return n.props.specSelectors.findDefinition(e)})),n}return h()(r,[{key:"render",value:function(){var e=this.props,t=e.getComponent,r=e.getConfigs,a=e.specSelectors,o=e.schema,c=e.required,s=e.name,u=e.isRef,l=e.specPath,p=e.displayName,f=e.includeReadOnly,d=e.includeWriteOnly,h=t("ObjectModel"),m=t("ArrayModel"),v=t("PrimitiveModel"),g="object",y=o&&o.get("$$ref");if(!s&&y&&(s=this.getModelName(y)),!o&&y&&(o=this.getRefSchema(s)),!o)return j.a.createElement("span",{className:"model model-title"},j.a.createElement("span",{className:"model-title__text"},p||s),j.a.createElement("img",{src:n(370),height:"20px",width:"20px"}));var b=a.isOAS3()&&o.get("deprecated");switch(u=void 0!==u?u:!!y,g=o&&o.get("type")||g){case"object":return j.a.createElement(h,i()({className:"object"},this.props,{specPath:l,getConfigs:r,schema:o,name:s,deprecated:b,isRef:u,includeReadOnly:f,includeWriteOnly:d}));case"array":return j.a.createElement(m,i()({className:"array"},this.props,{getConfigs:r,schema:o,name:s,deprecated:b,required:c,includeReadOnly:f,includeWriteOnly:d}));case"string":case"number":case"integer":case"boolean":default:return j.a.createElement(v,i()({},this.props,{getComponent:t,getConfigs:r,schema:o,name:s,deprecated:b,required:c}))}}}]),r}(O.a);S()(I,"propTypes",{schema:a()(A.a).isRequired,getComponent:P.a.func.isRequired,getConfigs:P.a.func.isRequired,specSelectors:P.a.object.isRequired,name:P.a.string,displayName:P.a.string,isRef:P.a.bool,required:P.a.bool,expandDepth:P.a.number,depth:P.a.number,specPath:A.a.list.isRequired,includeReadOnly:P.a.bool,includeWriteOnly:P.a.bool})},function(e,t){e.exports=require("remarkable")},function(e,t,n){"use strict";n.d(t,"b",(function(){return y}));var r=n(0),a=n.n(r),o=(n(11),n(167)),i=n(405),c=n.n(i),s=/www|@|\:\/\//;function u(e){return/^<\/a\s*>/i.test(e)}function l(){var e=[],t=new c.a({stripPrefix:!1,url:!0,email:!0,replaceFn:function(t){switch(t.getType()){case"url":e.push({text:t.matchedText,url:t.getUrl()});break;case"email":e.push({text:t.matchedText,url:"mailto:"+t.getEmail().replace(/^mailto:/i,"")})}return!1}});return{links:e,autolinker:t}}function p(e){var t,n,r,a,o,i,c,p,f,d,h,m,v,g,y=e.tokens,b=null;for(n=0,r=y.length;n<r;n++)if("inline"===y[n].type)for(h=0,t=(a=y[n].children).length-1;t>=0;t--)if("link_close"!==(o=a[t]).type){if("htmltag"===o.type&&(g=o.content,/^<a[>\s]/i.test(g)&&h>0&&h--,u(o.content)&&h++),!(h>0)&&"text"===o.type&&s.test(o.content)){if(b||(m=(b=l()).links,v=b.autolinker),i=o.content,m.length=0,v.link(i),!m.length)continue;for(c=[],d=o.level,p=0;p<m.length;p++)e.inline.validateLink(m[p].url)&&((f=i.indexOf(m[p].text))&&c.push({type:"text",content:i.slice(0,f),level:d}),c.push({type:"link_open",href:m[p].url,title:"",level:d++}),c.push({type:"text",content:m[p].text,level:d}),c.push({type:"link_close",level:--d}),i=i.slice(f+m[p].text.length));i.length&&c.push({type:"text",content:i,level:d}),y[n].children=a=[].concat(a.slice(0,t),c,a.slice(t+1))}}else for(t--;a[t].level!==o.level&&"link_open"!==a[t].type;)t--}function f(e){e.core.ruler.push("linkify",p)}var d=n(170),h=n.n(d),m=n(57),v=n.n(m);function g(e){var t=e.source,n=e.className,r=void 0===n?"":n,i=e.getConfigs;if("string"!=typeof t)return null;var c=new o.Remarkable({html:!0,typographer:!0,breaks:!0,linkTarget:"_blank"}).use(f);c.core.ruler.disable(["replacements","smartquotes"]);var s=i().useUnsafeMarkdown,u=c.render(t),l=y(u,{useUnsafeMarkdown:s});return t&&u&&l?a.a.createElement("div",{className:v()(r,"markdown"),dangerouslySetInnerHTML:{__html:l}}):null}h.a.addHook&&h.a.addHook("beforeSanitizeElements",(function(e){return e.href&&e.setAttribute("rel","noopener noreferrer"),e})),g.defaultProps={getConfigs:function(){return{useUnsafeMarkdown:!1}}};t.a=g;function y(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.useUnsafeMarkdown,r=void 0!==n&&n,a=r,o=r?[]:["style","class"];return r&&!y.hasWarnedAboutDeprecation&&(console.warn("useUnsafeMarkdown display configuration parameter is deprecated since >3.26.0 and will be removed in v4.0.0."),y.hasWarnedAboutDeprecation=!0),h.a.sanitize(e,{ADD_ATTR:["target"],FORBID_TAGS:["style"],ALLOW_DATA_ATTR:a,FORBID_ATTR:o})}y.hasWarnedAboutDeprecation=!1},function(e,t){e.exports=require("qs")},function(e,t){e.exports=require("dompurify")},function(e,t){var n;n=function(){return this}();try{n=n||new Function("return this")()}catch(e){"object"==typeof window&&(n=window)}e.exports=n},function(e,t,n){var r=n(37),a=n(40),o=r.document,i=a(o)&&a(o.createElement);e.exports=function(e){return i?o.createElement(e):{}}},function(e,t,n){var r=n(59),a=n(68),o=n(174),i=function(e){return function(t,n,i){var c,s=r(t),u=a(s.length),l=o(i,u);if(e&&n!=n){for(;u>l;)if((c=s[l++])!=c)return!0}else for(;u>l;l++)if((e||l in s)&&s[l]===n)return e||l||0;return!e&&-1}};e.exports={includes:i(!0),indexOf:i(!1)}},function(e,t,n){var r=n(116),a=Math.max,o=Math.min;e.exports=function(e,t){var n=r(e);return n<0?a(n+t,0):o(n,t)}},function(e,t){e.exports=["constructor","hasOwnProperty","isPrototypeOf","propertyIsEnumerable","toLocaleString","toString","valueOf"]},function(e,t,n){var r=n(36);t.f=r},function(e,t,n){var r=n(80),a=n(282);(e.exports=function(e,t){return a[e]||(a[e]=void 0!==t?t:{})})("versions",[]).push({version:"3.6.4",mode:r?"pure":"global",copyright:"© 2020 Denis Pushkarev (zloirock.ru)"})},function(e,t,n){var r=n(33);e.exports=!!Object.getOwnPropertySymbols&&!r((function(){return!String(Symbol())}))},function(e,t,n){"use strict";var r=n(24),a=n(287),o=n(118),i=n(182),c=n(73),s=n(60),u=n(94),l=n(36),p=n(80),f=n(93),d=n(288),h=d.IteratorPrototype,m=d.BUGGY_SAFARI_ITERATORS,v=l("iterator"),g="keys",y="values",b="entries",E=function(){return this};e.exports=function(e,t,n,l,d,x,S){a(n,t,l);var w,j,C,O=function(e){if(e===d&&I)return I;if(!m&&e in k)return k[e];switch(e){case g:case y:case b:return function(){return new n(this,e)}}return function(){return new n(this)}},_=t+" Iterator",A=!1,k=e.prototype,P=k[v]||k["@@iterator"]||d&&k[d],I=!m&&P||O(d),T="Array"==t&&k.entries||P;if(T&&(w=o(T.call(new e)),h!==Object.prototype&&w.next&&(p||o(w)===h||(i?i(w,h):"function"!=typeof w[v]&&s(w,v,E)),c(w,_,!0,!0),p&&(f[_]=E))),d==y&&P&&P.name!==y&&(A=!0,I=function(){return P.call(this)}),p&&!S||k[v]===I||s(k,v,I),f[t]=I,d)if(j={values:O(y),keys:x?I:O(g),entries:O(b)},S)for(C in j)(m||A||!(C in k))&&u(k,C,j[C]);else r({target:t,proto:!0,forced:m||A},j);return j}},function(e,t,n){var r=n(43),a=n(55),o=n(47),i=n(115);e.exports=r?Object.defineProperties:function(e,t){o(e);for(var n,r=i(t),c=r.length,s=0;c>s;)a.f(e,n=r[s++],t[n]);return e}},function(e,t,n){var r={};r[n(36)("toStringTag")]="z",e.exports="[object z]"===String(r)},function(e,t,n){var r=n(47),a=n(417);e.exports=Object.setPrototypeOf||("__proto__"in{}?function(){var e,t=!1,n={};try{(e=Object.getOwnPropertyDescriptor(Object.prototype,"__proto__").set).call(n,[]),t=n instanceof Array}catch(e){}return function(n,o){return r(n),a(o),t?e.call(n,o):n.__proto__=o,n}}():void 0)},function(e,t){e.exports=function(){}},function(e,t,n){var r=n(40),a=n(120),o=n(36)("species");e.exports=function(e,t){var n;return a(e)&&("function"!=typeof(n=e.constructor)||n!==Array&&!a(n.prototype)?r(n)&&null===(n=n[o])&&(n=void 0):n=void 0),new(void 0===n?Array:n)(0===t?0:t)}},function(e,t,n){var r,a,o=n(37),i=n(186),c=o.process,s=c&&c.versions,u=s&&s.v8;u?a=(r=u.split("."))[0]+r[1]:i&&(!(r=i.match(/Edge\/(\d+)/))||r[1]>=74)&&(r=i.match(/Chrome\/(\d+)/))&&(a=r[1]),e.exports=a&&+a},function(e,t,n){var r=n(61);e.exports=r("navigator","userAgent")||""},function(e,t,n){var r=n(280),a=n(175).concat("length","prototype");t.f=Object.getOwnPropertyNames||function(e){return r(e,a)}},function(e,t){t.f=Object.getOwnPropertySymbols},function(e,t,n){e.exports=n(459)},function(e,t,n){e.exports=n(493)},function(e,t,n){var r=n(542),a=n(558),o=n(560),i=n(561),c=n(562);function s(e){var t=-1,n=null==e?0:e.length;for(this.clear();++t<n;){var r=e[t];this.set(r[0],r[1])}}s.prototype.clear=r,s.prototype.delete=a,s.prototype.get=o,s.prototype.has=i,s.prototype.set=c,e.exports=s},function(e,t,n){var r=n(97)(n(65),"Map");e.exports=r},function(e,t,n){var r=n(142),a=n(566),o=n(567),i=n(568),c=n(569),s=n(570);function u(e){var t=this.__data__=new r(e);this.size=t.size}u.prototype.clear=a,u.prototype.delete=o,u.prototype.get=i,u.prototype.has=c,u.prototype.set=s,e.exports=u},function(e,t){e.exports=function(e,t){for(var n=-1,r=t.length,a=e.length;++n<r;)e[a+n]=t[n];return e}},function(e,t,n){var r=n(580),a=n(331),o=Object.prototype.propertyIsEnumerable,i=Object.getOwnPropertySymbols,c=i?function(e){return null==e?[]:(e=Object(e),r(i(e),(function(t){return o.call(e,t)})))}:a;e.exports=c},function(e,t,n){var r=n(582),a=n(76),o=Object.prototype,i=o.hasOwnProperty,c=o.propertyIsEnumerable,s=r(function(){return arguments}())?r:function(e){return a(e)&&i.call(e,"callee")&&!c.call(e,"callee")};e.exports=s},function(e,t,n){(function(e){var r=n(65),a=n(583),o=t&&!t.nodeType&&t,i=o&&"object"==typeof e&&e&&!e.nodeType&&e,c=i&&i.exports===o?r.Buffer:void 0,s=(c?c.isBuffer:void 0)||a;e.exports=s}).call(this,n(198)(e))},function(e,t){e.exports=function(e){return e.webpackPolyfill||(e.deprecate=function(){},e.paths=[],e.children||(e.children=[]),Object.defineProperty(e,"loaded",{enumerable:!0,get:function(){return e.l}}),Object.defineProperty(e,"id",{enumerable:!0,get:function(){return e.i}}),e.webpackPolyfill=1),e}},function(e,t){e.exports=function(e){return"number"==typeof e&&e>-1&&e%1==0&&e<=9007199254740991}},function(e,t){e.exports=function(e){return function(t){return e(t)}}},function(e,t,n){(function(e){var r=n(319),a=t&&!t.nodeType&&t,o=a&&"object"==typeof e&&e&&!e.nodeType&&e,i=o&&o.exports===a&&r.process,c=function(){try{var e=o&&o.require&&o.require("util").types;return e||i&&i.binding&&i.binding("util")}catch(e){}}();e.exports=c}).call(this,n(198)(e))},function(e,t,n){var r=n(48),a=n(140),o=/\.|\[(?:[^[\]]*|(["'])(?:(?!\1)[^\\]|\\.)*?\1)\]/,i=/^\w*$/;e.exports=function(e,t){if(r(e))return!1;var n=typeof e;return!("number"!=n&&"symbol"!=n&&"boolean"!=n&&null!=e&&!a(e))||(i.test(e)||!o.test(e)||null!=t&&e in Object(t))}},function(e,t){e.exports=function(e){return e}},function(e,t,n){var r=n(334)(Object.getPrototypeOf,Object);e.exports=r},function(e,t,n){var r=n(328);e.exports=function(e){var t=new e.constructor(e.byteLength);return new r(t).set(new r(e)),t}},function(e,t,n){var r=n(529)("toUpperCase");e.exports=r},function(e,t,n){var r=n(191);function a(e,t){if("function"!=typeof e||null!=t&&"function"!=typeof t)throw new TypeError("Expected a function");var n=function(){var r=arguments,a=t?t.apply(this,r):r[0],o=n.cache;if(o.has(a))return o.get(a);var i=e.apply(this,r);return n.cache=o.set(a,i)||o,i};return n.cache=new(a.Cache||r),n}a.Cache=r,e.exports=a},function(e,t,n){"use strict";n.r(t);var r=n(209),a=n(54),o=n(212);t.default=function(e){return{statePlugins:{err:{reducers:Object(r.default)(e),actions:a,selectors:o}}}}},function(e,t,n){"use strict";n.r(t);var r=n(3),a=n.n(r),o=n(83),i=n.n(o),c=n(14),s=n.n(c),u=n(2),l=n.n(u),p=n(5),f=n.n(p),d=n(21),h=n.n(d),m=n(54),v=n(1),g=n(102),y={line:0,level:"error",message:"Unknown error"};t.default=function(){var e;return e={},a()(e,m.NEW_THROWN_ERR,(function(e,t){var n=t.payload,r=h()(y,n,{type:"thrown"});return e.update("errors",(function(e){return(e||Object(v.List)()).push(Object(v.fromJS)(r))})).update("errors",(function(e){return Object(g.default)(e)}))})),a()(e,m.NEW_THROWN_ERR_BATCH,(function(e,t){var n=t.payload;return n=f()(n).call(n,(function(e){return Object(v.fromJS)(h()(y,e,{type:"thrown"}))})),e.update("errors",(function(e){var t;return l()(t=e||Object(v.List)()).call(t,Object(v.fromJS)(n))})).update("errors",(function(e){return Object(g.default)(e)}))})),a()(e,m.NEW_SPEC_ERR,(function(e,t){var n=t.payload,r=Object(v.fromJS)(n);return r=r.set("type","spec"),e.update("errors",(function(e){return(e||Object(v.List)()).push(Object(v.fromJS)(r)).sortBy((function(e){return e.get("line")}))})).update("errors",(function(e){return Object(g.default)(e)}))})),a()(e,m.NEW_SPEC_ERR_BATCH,(function(e,t){var n=t.payload;return n=f()(n).call(n,(function(e){return Object(v.fromJS)(h()(y,e,{type:"spec"}))})),e.update("errors",(function(e){var t;return l()(t=e||Object(v.List)()).call(t,Object(v.fromJS)(n))})).update("errors",(function(e){return Object(g.default)(e)}))})),a()(e,m.NEW_AUTH_ERR,(function(e,t){var n=t.payload,r=Object(v.fromJS)(h()({},n));return r=r.set("type","auth"),e.update("errors",(function(e){return(e||Object(v.List)()).push(Object(v.fromJS)(r))})).update("errors",(function(e){return Object(g.default)(e)}))})),a()(e,m.CLEAR,(function(e,t){var n,r=t.payload;if(!r||!e.get("errors"))return e;var a=s()(n=e.get("errors")).call(n,(function(e){var t;return i()(t=e.keySeq()).call(t,(function(t){var n=e.get(t),a=r[t];return!a||n!==a}))}));return e.merge({errors:a})})),a()(e,m.CLEAR_BY,(function(e,t){var n,r=t.payload;if(!r||"function"!=typeof r)return e;var a=s()(n=e.get("errors")).call(n,(function(e){return r(e)}));return e.merge({errors:a})})),e}},function(e,t,n){"use strict";n.r(t),n.d(t,"transform",(function(){return p}));var r=n(22),a=n.n(r),o=n(23),i=n.n(o),c=n(12),s=n.n(c),u=n(5),l=n.n(u);function p(e){return l()(e).call(e,(function(e){var t,n="is not of a type(s)",r=s()(t=e.get("message")).call(t,n);if(r>-1){var o,c,u=i()(o=e.get("message")).call(o,r+n.length).split(",");return e.set("message",i()(c=e.get("message")).call(c,0,r)+function(e){return a()(e).call(e,(function(e,t,n,r){return n===r.length-1&&r.length>1?e+"or "+t:r[n+1]&&r.length>2?e+t+", ":r[n+1]?e+t+" ":e+t}),"should be a")}(u))}return e}))}},function(e,t,n){"use strict";n.r(t),n.d(t,"transform",(function(){return r}));n(12),n(5),n(41),n(1);function r(e,t){t.jsSpec;return e}},function(e,t,n){"use strict";n.r(t),n.d(t,"allErrors",(function(){return o})),n.d(t,"lastError",(function(){return i}));var r=n(1),a=n(19),o=Object(a.createSelector)((function(e){return e}),(function(e){return e.get("errors",Object(r.List)())})),i=Object(a.createSelector)(o,(function(e){return e.last()}))},function(e,t,n){"use strict";n.r(t);var r=n(214),a=n(85),o=n(215);t.default=function(){return{statePlugins:{layout:{reducers:r.default,actions:a,selectors:o}}}}},function(e,t,n){"use strict";n.r(t);var r,a=n(3),o=n.n(a),i=n(2),c=n.n(i),s=n(1),u=n(85);t.default=(r={},o()(r,u.UPDATE_LAYOUT,(function(e,t){return e.set("layout",t.payload)})),o()(r,u.UPDATE_FILTER,(function(e,t){return e.set("filter",t.payload)})),o()(r,u.SHOW,(function(e,t){var n=t.payload.shown,r=Object(s.fromJS)(t.payload.thing);return e.update("shown",Object(s.fromJS)({}),(function(e){return e.set(r,n)}))})),o()(r,u.UPDATE_MODE,(function(e,t){var n,r=t.payload.thing,a=t.payload.mode;return e.setIn(c()(n=["modes"]).call(n,r),(a||"")+"")})),r)},function(e,t,n){"use strict";n.r(t),n.d(t,"current",(function(){return l})),n.d(t,"currentFilter",(function(){return p})),n.d(t,"isShown",(function(){return f})),n.d(t,"whatMode",(function(){return d})),n.d(t,"showSummary",(function(){return h}));var r=n(2),a=n.n(r),o=n(17),i=n.n(o),c=n(19),s=n(4),u=n(1),l=function(e){return e.get("layout")},p=function(e){return e.get("filter")},f=function(e,t,n){return t=Object(s.w)(t),e.get("shown",Object(u.fromJS)({})).get(Object(u.fromJS)(t),n)},d=function(e,t){var n,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:"";return t=Object(s.w)(t),e.getIn(a()(n=["modes"]).call(n,i()(t)),r)},h=Object(c.createSelector)((function(e){return e}),(function(e){return!f(e,"editor")}))},function(e,t,n){"use strict";n.r(t);var r=n(217),a=n(42),o=n(78),i=n(218);t.default=function(){return{statePlugins:{spec:{wrapActions:i,reducers:r.default,actions:a,selectors:o}}}}},function(e,t,n){"use strict";n.r(t);var r,a=n(3),o=n.n(a),i=n(21),c=n.n(i),s=n(5),u=n.n(s),l=n(22),p=n.n(l),f=n(2),d=n.n(f),h=n(17),m=n.n(h),v=n(1),g=n(4),y=n(26),b=n(78),E=n(42);t.default=(r={},o()(r,E.UPDATE_SPEC,(function(e,t){return"string"==typeof t.payload?e.set("spec",t.payload):e})),o()(r,E.UPDATE_URL,(function(e,t){return e.set("url",t.payload+"")})),o()(r,E.UPDATE_JSON,(function(e,t){return e.set("json",Object(g.i)(t.payload))})),o()(r,E.UPDATE_RESOLVED,(function(e,t){return e.setIn(["resolved"],Object(g.i)(t.payload))})),o()(r,E.UPDATE_RESOLVED_SUBTREE,(function(e,t){var n,r=t.payload,a=r.value,o=r.path;return e.setIn(d()(n=["resolvedSubtrees"]).call(n,m()(o)),Object(g.i)(a))})),o()(r,E.UPDATE_PARAM,(function(e,t){var n,r,a=t.payload,o=a.path,i=a.paramName,c=a.paramIn,s=a.param,u=a.value,l=a.isXml,p=s?Object(g.B)(s):d()(n="".concat(c,".")).call(n,i),f=l?"value_xml":"value";return e.setIn(d()(r=["meta","paths"]).call(r,m()(o),["parameters",p,f]),u)})),o()(r,E.UPDATE_EMPTY_PARAM_INCLUSION,(function(e,t){var n,r,a=t.payload,o=a.pathMethod,i=a.paramName,c=a.paramIn,s=a.includeEmptyValue;if(!i||!c)return console.warn("Warning: UPDATE_EMPTY_PARAM_INCLUSION could not generate a paramKey."),e;var u=d()(n="".concat(c,".")).call(n,i);return e.setIn(d()(r=["meta","paths"]).call(r,m()(o),["parameter_inclusions",u]),s)})),o()(r,E.VALIDATE_PARAMS,(function(e,t){var n,r,a=t.payload,o=a.pathMethod,i=a.isOAS3,c=Object(b.specJsonWithResolvedSubtrees)(e).getIn(d()(n=["paths"]).call(n,m()(o))),s=Object(b.parameterValues)(e,o).toJS();return e.updateIn(d()(r=["meta","paths"]).call(r,m()(o),["parameters"]),Object(v.fromJS)({}),(function(t){var n;return p()(n=c.get("parameters",Object(v.List)())).call(n,(function(t,n){var r=Object(g.C)(n,s),a=Object(b.parameterInclusionSettingFor)(e,o,n.get("name"),n.get("in")),c=Object(g.L)(n,r,{bypassRequiredCheck:a,isOAS3:i});return t.setIn([Object(g.B)(n),"errors"],Object(v.fromJS)(c))}),t)}))})),o()(r,E.CLEAR_VALIDATE_PARAMS,(function(e,t){var n,r=t.payload.pathMethod;return e.updateIn(d()(n=["meta","paths"]).call(n,m()(r),["parameters"]),Object(v.fromJS)([]),(function(e){return u()(e).call(e,(function(e){return e.set("errors",Object(v.fromJS)([]))}))}))})),o()(r,E.SET_RESPONSE,(function(e,t){var n,r=t.payload,a=r.res,o=r.path,i=r.method;(n=a.error?c()({error:!0,name:a.err.name,message:a.err.message,statusCode:a.err.statusCode},a.err.response):a).headers=n.headers||{};var s=e.setIn(["responses",o,i],Object(g.i)(n));return y.a.Blob&&a.data instanceof y.a.Blob&&(s=s.setIn(["responses",o,i,"text"],a.data)),s})),o()(r,E.SET_REQUEST,(function(e,t){var n=t.payload,r=n.req,a=n.path,o=n.method;return e.setIn(["requests",a,o],Object(g.i)(r))})),o()(r,E.SET_MUTATED_REQUEST,(function(e,t){var n=t.payload,r=n.req,a=n.path,o=n.method;return e.setIn(["mutatedRequests",a,o],Object(g.i)(r))})),o()(r,E.UPDATE_OPERATION_META_VALUE,(function(e,t){var n,r,a,o,i,c,s=t.payload,u=s.path,l=s.value,p=s.key,f=d()(n=["paths"]).call(n,m()(u)),h=d()(r=["meta","paths"]).call(r,m()(u));return e.getIn(d()(a=["json"]).call(a,m()(f)))||e.getIn(d()(o=["resolved"]).call(o,m()(f)))||e.getIn(d()(i=["resolvedSubtrees"]).call(i,m()(f)))?e.setIn(d()(c=[]).call(c,m()(h),[p]),Object(v.fromJS)(l)):e})),o()(r,E.CLEAR_RESPONSE,(function(e,t){var n=t.payload,r=n.path,a=n.method;return e.deleteIn(["responses",r,a])})),o()(r,E.CLEAR_REQUEST,(function(e,t){var n=t.payload,r=n.path,a=n.method;return e.deleteIn(["requests",r,a])})),o()(r,E.SET_SCHEME,(function(e,t){var n=t.payload,r=n.scheme,a=n.path,o=n.method;return a&&o?e.setIn(["scheme",a,o],r):a||o?void 0:e.setIn(["scheme","_defaultScheme"],r)})),r)},function(e,t,n){"use strict";n.r(t),n.d(t,"updateSpec",(function(){return u})),n.d(t,"updateJsonSpec",(function(){return l})),n.d(t,"executeRequest",(function(){return p})),n.d(t,"validateParams",(function(){return f}));var r=n(16),a=n.n(r),o=n(15),i=n.n(o),c=n(41),s=n.n(c),u=function(e,t){var n=t.specActions;return function(){e.apply(void 0,arguments),n.parseToJson.apply(n,arguments)}},l=function(e,t){var n=t.specActions;return function(){for(var t=arguments.length,r=new Array(t),o=0;o<t;o++)r[o]=arguments[o];e.apply(void 0,r),n.invalidateResolvedSubtreeCache();var c=r[0],u=s()(c,["paths"])||{},l=i()(u);a()(l).call(l,(function(e){s()(u,[e]).$ref&&n.requestResolvedSubtree(["paths",e])})),n.requestResolvedSubtree(["components","securitySchemes"])}},p=function(e,t){var n=t.specActions;return function(t){return n.logRequest(t),e(t)}},f=function(e,t){var n=t.specSelectors;return function(t){return e(t,n.isOAS3())}}},function(e,t,n){"use strict";n.r(t);var r=n(29),a=n.n(r),o=n(128),i=n(4);t.default=function(e){var t=e.getComponents,n=e.getStore,r=e.getSystem,c=o.getComponent,s=o.render,u=o.makeMappedContainer,l=Object(i.v)(a()(c).call(c,null,r,n,t));return{rootInjects:{getComponent:l,makeMappedContainer:Object(i.v)(a()(u).call(u,null,r,n,l,t)),render:a()(s).call(s,null,r,n,c,t)}}}},function(e,t,n){var r=n(96),a=n(204),o=n(76),i=Function.prototype,c=Object.prototype,s=i.toString,u=c.hasOwnProperty,l=s.call(Object);e.exports=function(e){if(!o(e)||"[object Object]"!=r(e))return!1;var t=a(e);if(null===t)return!0;var n=u.call(t,"constructor")&&t.constructor;return"function"==typeof n&&n instanceof n&&s.call(n)==l}},function(e,t,n){"use strict";n.r(t);var r=n(111);t.default=function(){return{fn:r}}},function(e,t,n){"use strict";n.r(t);var r=n(29),a=n.n(r);t.default=function(e){var t=e.configs,n={debug:0,info:1,log:2,warn:3,error:4},r=function(e){return n[e]||-1},o=t.logLevel,i=r(o);function c(e){for(var t,n=arguments.length,a=new Array(n>1?n-1:0),o=1;o<n;o++)a[o-1]=arguments[o];r(e)>=i&&(t=console)[e].apply(t,a)}return c.warn=a()(c).call(c,null,"warn"),c.error=a()(c).call(c,null,"error"),c.info=a()(c).call(c,null,"info"),c.debug=a()(c).call(c,null,"debug"),{rootInjects:{log:c}}}},function(e,t,n){"use strict";n.r(t),n.d(t,"loaded",(function(){return r}));var r=function(e,t){return function(){e.apply(void 0,arguments);var n=t.getConfigs().withCredentials;void 0!==n&&(t.fn.fetch.withCredentials="string"==typeof n?"true"===n:!!n)}}},function(e,t,n){"use strict";n.r(t),n.d(t,"preauthorizeBasic",(function(){return d})),n.d(t,"preauthorizeApiKey",(function(){return h}));var r=n(3),a=n.n(r),o=n(2),i=n.n(o),c=n(29),s=n.n(c),u=n(225),l=n(72),p=n(226),f=n(227);function d(e,t,n,r){var o,c=e.authActions.authorize,s=e.specSelectors,u=s.specJson,l=(0,s.isOAS3)()?["components","securitySchemes"]:["securityDefinitions"],p=u().getIn(i()(o=[]).call(o,l,[t]));return p?c(a()({},t,{value:{username:n,password:r},schema:p.toJS()})):null}function h(e,t,n){var r,o=e.authActions.authorize,c=e.specSelectors,s=c.specJson,u=(0,c.isOAS3)()?["components","securitySchemes"]:["securityDefinitions"],l=s().getIn(i()(r=[]).call(r,u,[t]));return l?o(a()({},t,{value:n,schema:l.toJS()})):null}t.default=function(){return{afterLoad:function(e){this.rootInjects=this.rootInjects||{},this.rootInjects.initOAuth=e.authActions.configureAuth,this.rootInjects.preauthorizeApiKey=s()(h).call(h,null,e),this.rootInjects.preauthorizeBasic=s()(d).call(d,null,e)},statePlugins:{auth:{reducers:u.default,actions:l,selectors:p},spec:{wrapActions:f}}}}},function(e,t,n){"use strict";n.r(t);var r,a=n(3),o=n.n(a),i=n(21),c=n.n(i),s=n(18),u=n.n(s),l=n(16),p=n.n(l),f=n(1),d=n(4),h=n(72);t.default=(r={},o()(r,h.SHOW_AUTH_POPUP,(function(e,t){var n=t.payload;return e.set("showDefinitions",n)})),o()(r,h.AUTHORIZE,(function(e,t){var n,r=t.payload,a=Object(f.fromJS)(r),o=e.get("authorized")||Object(f.Map)();return p()(n=a.entrySeq()).call(n,(function(t){var n=u()(t,2),r=n[0],a=n[1];if(!Object(d.s)(a.getIn))return e.set("authorized",o);var i=a.getIn(["schema","type"]);if("apiKey"===i||"http"===i)o=o.set(r,a);else if("basic"===i){var c=a.getIn(["value","username"]),s=a.getIn(["value","password"]);o=(o=o.setIn([r,"value"],{username:c,header:"Basic "+Object(d.a)(c+":"+s)})).setIn([r,"schema"],a.get("schema"))}})),e.set("authorized",o)})),o()(r,h.AUTHORIZE_OAUTH2,(function(e,t){var n,r=t.payload,a=r.auth,o=r.token;a.token=c()({},o),n=Object(f.fromJS)(a);var i=e.get("authorized")||Object(f.Map)();return i=i.set(n.get("name"),n),e.set("authorized",i)})),o()(r,h.LOGOUT,(function(e,t){var n=t.payload,r=e.get("authorized").withMutations((function(e){p()(n).call(n,(function(t){e.delete(t)}))}));return e.set("authorized",r)})),o()(r,h.CONFIGURE_AUTH,(function(e,t){var n=t.payload;return e.set("configs",n)})),o()(r,h.RESTORE_AUTHORIZATION,(function(e,t){var n=t.payload;return e.set("authorized",Object(f.fromJS)(n.authorized))})),r)},function(e,t,n){"use strict";n.r(t),n.d(t,"shownDefinitions",(function(){return E})),n.d(t,"definitionsToAuthorize",(function(){return x})),n.d(t,"getDefinitionsByNames",(function(){return S})),n.d(t,"definitionsForRequirements",(function(){return w})),n.d(t,"authorized",(function(){return j})),n.d(t,"isAuthorized",(function(){return C})),n.d(t,"getConfigs",(function(){return O}));var r=n(15),a=n.n(r),o=n(5),i=n.n(o),c=n(12),s=n.n(c),u=n(32),l=n.n(u),p=n(14),f=n.n(p),d=n(18),h=n.n(d),m=n(16),v=n.n(m),g=n(19),y=n(1),b=function(e){return e},E=Object(g.createSelector)(b,(function(e){return e.get("showDefinitions")})),x=Object(g.createSelector)(b,(function(){return function(e){var t,n=e.specSelectors.securityDefinitions()||Object(y.Map)({}),r=Object(y.List)();return v()(t=n.entrySeq()).call(t,(function(e){var t=h()(e,2),n=t[0],a=t[1],o=Object(y.Map)();o=o.set(n,a),r=r.push(o)})),r}})),S=function(e,t){return function(e){var n,r=e.specSelectors;console.warn("WARNING: getDefinitionsByNames is deprecated and will be removed in the next major version.");var a=r.securityDefinitions(),o=Object(y.List)();return v()(n=t.valueSeq()).call(n,(function(e){var t,n=Object(y.Map)();v()(t=e.entrySeq()).call(t,(function(e){var t,r,o=h()(e,2),i=o[0],c=o[1],s=a.get(i);"oauth2"===s.get("type")&&c.size&&(t=s.get("scopes"),v()(r=t.keySeq()).call(r,(function(e){c.contains(e)||(t=t.delete(e))})),s=s.set("allowedScopes",t));n=n.set(i,s)})),o=o.push(n)})),o}},w=function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:Object(y.List)();return function(e){var n=e.authSelectors.definitionsToAuthorize()||Object(y.List)();return f()(n).call(n,(function(e){return l()(t).call(t,(function(t){return t.get(e.keySeq().first())}))}))}},j=Object(g.createSelector)(b,(function(e){return e.get("authorized")||Object(y.Map)()})),C=function(e,t){return function(e){var n,r=e.authSelectors.authorized();return y.List.isList(t)?!!f()(n=t.toJS()).call(n,(function(e){var t,n;return-1===s()(t=i()(n=a()(e)).call(n,(function(e){return!!r.get(e)}))).call(t,!1)})).length:null}},O=Object(g.createSelector)(b,(function(e){return e.get("configs")}))},function(e,t,n){"use strict";n.r(t),n.d(t,"execute",(function(){return o}));var r=n(25),a=n.n(r),o=function(e,t){var n=t.authSelectors,r=t.specSelectors;return function(t){var o=t.path,i=t.method,c=t.operation,s=t.extras,u={authorized:n.authorized()&&n.authorized().toJS(),definitions:r.securityDefinitions()&&r.securityDefinitions().toJS(),specSecurity:r.security()&&r.security().toJS()};return e(a()({path:o,method:i,operation:c,securities:u},s))}}},function(e,t,n){"use strict";n.r(t);var r=n(4);t.default=function(){return{fn:{shallowEqualKeys:r.H}}}},function(e,t,n){"use strict";n.r(t),n.d(t,"default",(function(){return v}));var r=n(30),a=n.n(r),o=n(12),i=n.n(o),c=n(2),s=n.n(c),u=n(129),l=n.n(u),p=n(21),f=n.n(p),d=n(19),h=n(1),m=n(26);function v(e){var t=e.fn;return{statePlugins:{spec:{actions:{download:function(e){return function(n){var r=n.errActions,a=n.specSelectors,o=n.specActions,i=n.getConfigs,c=t.fetch,u=i();function p(t){if(t instanceof Error||t.status>=400)return o.updateLoadingStatus("failed"),r.newThrownErr(f()(new Error((t.message||t.statusText)+" "+e),{source:"fetch"})),void(!t.status&&t instanceof Error&&function(){try{var t;if("URL"in m.a?t=new l.a(e):(t=document.createElement("a")).href=e,"https:"!==t.protocol&&"https:"===m.a.location.protocol){var n=f()(new Error("Possible mixed-content issue? The page was loaded over https:// but a ".concat(t.protocol,"// URL was specified. Check that you are not attempting to load mixed content.")),{source:"fetch"});return void r.newThrownErr(n)}if(t.origin!==m.a.location.origin){var a,o=f()(new Error(s()(a="Possible cross-origin (CORS) issue? The URL origin (".concat(t.origin,") does not match the page (")).call(a,m.a.location.origin,"). Check the server returns the correct 'Access-Control-Allow-*' headers.")),{source:"fetch"});r.newThrownErr(o)}}catch(e){return}}());o.updateLoadingStatus("success"),o.updateSpec(t.text),a.url()!==e&&o.updateUrl(e)}e=e||a.url(),o.updateLoadingStatus("loading"),r.clear({source:"fetch"}),c({url:e,loadSpec:!0,requestInterceptor:u.requestInterceptor||function(e){return e},responseInterceptor:u.responseInterceptor||function(e){return e},credentials:"same-origin",headers:{Accept:"application/json,*/*"}}).then(p,p)}},updateLoadingStatus:function(e){var t,n=[null,"loading","failed","success","failedConfig"];-1===i()(n).call(n,e)&&console.error(s()(t="Error: ".concat(e," is not one of ")).call(t,a()(n)));return{type:"spec_update_loading_status",payload:e}}},reducers:{spec_update_loading_status:function(e,t){return"string"==typeof t.payload?e.set("loadingStatus",t.payload):e}},selectors:{loadingStatus:Object(d.createSelector)((function(e){return e||Object(h.Map)()}),(function(e){return e.get("loadingStatus")||null}))}}}}}},function(e,t,n){"use strict";n.r(t),n.d(t,"downloadConfig",(function(){return a})),n.d(t,"getConfigByUrl",(function(){return o}));var r=n(126),a=function(e){return function(t){return(0,t.fn.fetch)(e)}},o=function(e,t){return function(n){var a=n.specActions;if(e)return a.downloadConfig(e).then(o,o);function o(n){n instanceof Error||n.status>=400?(a.updateLoadingStatus("failedConfig"),a.updateLoadingStatus("failedConfig"),a.updateUrl(""),console.error(n.statusText+" "+e.url),t(null)):t(Object(r.parseYamlConfig)(n.text))}}}},function(e,t,n){"use strict";n.r(t),n.d(t,"get",(function(){return o}));var r=n(13),a=n.n(r),o=function(e,t){return e.getIn(a()(t)?t:[t])}},function(e,t,n){"use strict";n.r(t);var r,a=n(3),o=n.n(a),i=n(1),c=n(112);t.default=(r={},o()(r,c.UPDATE_CONFIGS,(function(e,t){return e.merge(Object(i.fromJS)(t.payload))})),o()(r,c.TOGGLE_CONFIGS,(function(e,t){var n=t.payload,r=e.get(n);return e.set(n,!r)})),r)},function(e,t,n){"use strict";n.r(t);var r=n(234),a=n(235),o=n(236);t.default=function(){return[r.default,{statePlugins:{configs:{wrapActions:{loaded:function(e,t){return function(){e.apply(void 0,arguments);var n=decodeURIComponent(window.location.hash);t.layoutActions.parseDeepLinkHash(n)}}}}},wrapComponents:{operation:a.default,OperationTag:o.default}}]}},function(e,t,n){"use strict";n.r(t),n.d(t,"show",(function(){return O})),n.d(t,"scrollTo",(function(){return _})),n.d(t,"parseDeepLinkHash",(function(){return A})),n.d(t,"readyToScroll",(function(){return k})),n.d(t,"scrollToElement",(function(){return P})),n.d(t,"clearScrollTo",(function(){return I}));var r,a=n(3),o=n.n(a),i=n(12),c=n.n(i),s=n(5),u=n.n(s),l=n(23),p=n.n(l),f=n(2),d=n.n(f),h=n(18),m=n.n(h),v=n(13),g=n.n(v),y=n(130),b=n(391),E=n.n(b),x=n(4),S=n(1),w=n.n(S),j="layout_scroll_to",C="layout_clear_scroll",O=function(e,t){var n=t.getConfigs,r=t.layoutSelectors;return function(){for(var t=arguments.length,a=new Array(t),o=0;o<t;o++)a[o]=arguments[o];if(e.apply(void 0,a),n().deepLinking)try{var i=a[0],c=a[1];i=g()(i)?i:[i];var s=r.urlHashArrayFromIsShownKey(i);if(!s.length)return;var u,l=m()(s,2),p=l[0],f=l[1];if(!c)return Object(y.setHash)("/");if(2===s.length)Object(y.setHash)(Object(x.d)(d()(u="/".concat(encodeURIComponent(p),"/")).call(u,encodeURIComponent(f))));else 1===s.length&&Object(y.setHash)(Object(x.d)("/".concat(encodeURIComponent(p))))}catch(e){console.error(e)}}},_=function(e){return{type:j,payload:g()(e)?e:[e]}},A=function(e){return function(t){var n=t.layoutActions,r=t.layoutSelectors;if((0,t.getConfigs)().deepLinking&&e){var a,o=p()(e).call(e,1);"!"===o[0]&&(o=p()(o).call(o,1)),"/"===o[0]&&(o=p()(o).call(o,1));var i=u()(a=o.split("/")).call(a,(function(e){return e||""})),s=r.isShownKeyFromUrlHashArray(i),l=m()(s,3),f=l[0],d=l[1],h=void 0===d?"":d,v=l[2],g=void 0===v?"":v;if("operations"===f){var y=r.isShownKeyFromUrlHashArray([h]);c()(h).call(h,"_")>-1&&(console.warn("Warning: escaping deep link whitespace with `_` will be unsupported in v4.0, use `%20` instead."),n.show(u()(y).call(y,(function(e){return e.replace(/_/g," ")})),!0)),n.show(y,!0)}(c()(h).call(h,"_")>-1||c()(g).call(g,"_")>-1)&&(console.warn("Warning: escaping deep link whitespace with `_` will be unsupported in v4.0, use `%20` instead."),n.show(u()(s).call(s,(function(e){return e.replace(/_/g," ")})),!0)),n.show(s,!0),n.scrollTo(s)}}},k=function(e,t){return function(n){var r=n.layoutSelectors.getScrollToKey();w.a.is(r,Object(S.fromJS)(e))&&(n.layoutActions.scrollToElement(t),n.layoutActions.clearScrollTo())}},P=function(e,t){return function(n){try{t=t||n.fn.getScrollParent(e),E.a.createScroller(t).to(e)}catch(e){console.error(e)}}},I=function(){return{type:C}};t.default={fn:{getScrollParent:function(e,t){var n=document.documentElement,r=getComputedStyle(e),a="absolute"===r.position,o=t?/(auto|scroll|hidden)/:/(auto|scroll)/;if("fixed"===r.position)return n;for(var i=e;i=i.parentElement;)if(r=getComputedStyle(i),(!a||"static"!==r.position)&&o.test(r.overflow+r.overflowY+r.overflowX))return i;return n}},statePlugins:{layout:{actions:{scrollToElement:P,scrollTo:_,clearScrollTo:I,readyToScroll:k,parseDeepLinkHash:A},selectors:{getScrollToKey:function(e){return e.get("scrollToKey")},isShownKeyFromUrlHashArray:function(e,t){var n=m()(t,2),r=n[0],a=n[1];return a?["operations",r,a]:r?["operations-tag",r]:[]},urlHashArrayFromIsShownKey:function(e,t){var n=m()(t,3),r=n[0],a=n[1],o=n[2];return"operations"==r?[a,o]:"operations-tag"==r?[a]:[]}},reducers:(r={},o()(r,j,(function(e,t){return e.set("scrollToKey",w.a.fromJS(t.payload))})),o()(r,C,(function(e){return e.delete("scrollToKey")})),r),wrapActions:{show:O}}}}},function(e,t,n){"use strict";n.r(t);var r=n(2),a=n.n(r),o=n(7),i=n.n(o),c=n(6),s=n.n(c),u=n(10),l=n.n(u),p=n(8),f=n.n(p),d=n(9),h=n.n(d),m=n(3),v=n.n(m),g=n(0),y=n.n(g);n(27);t.default=function(e,t){return function(n){f()(o,n);var r=h()(o);function o(){var e,n;i()(this,o);for(var c=arguments.length,s=new Array(c),u=0;u<c;u++)s[u]=arguments[u];return n=r.call.apply(r,a()(e=[this]).call(e,s)),v()(l()(n),"onLoad",(function(e){var r=n.props.operation,a=r.toObject(),o=a.tag,i=a.operationId,c=r.toObject().isShownKey;c=c||["operations",o,i],t.layoutActions.readyToScroll(c,e)})),n}return s()(o,[{key:"render",value:function(){return y.a.createElement("span",{ref:this.onLoad},y.a.createElement(e,this.props))}}]),o}(y.a.Component)}},function(e,t,n){"use strict";n.r(t);var r=n(2),a=n.n(r),o=n(7),i=n.n(o),c=n(6),s=n.n(c),u=n(10),l=n.n(u),p=n(8),f=n.n(p),d=n(9),h=n.n(d),m=n(3),v=n.n(m),g=n(0),y=n.n(g);n(11);t.default=function(e,t){return function(n){f()(o,n);var r=h()(o);function o(){var e,n;i()(this,o);for(var c=arguments.length,s=new Array(c),u=0;u<c;u++)s[u]=arguments[u];return n=r.call.apply(r,a()(e=[this]).call(e,s)),v()(l()(n),"onLoad",(function(e){var r=["operations-tag",n.props.tag];t.layoutActions.readyToScroll(r,e)})),n}return s()(o,[{key:"render",value:function(){return y.a.createElement("span",{ref:this.onLoad},y.a.createElement(e,this.props))}}]),o}(y.a.Component)}},function(e,t,n){"use strict";n.r(t);var r=n(238);t.default=function(){return{fn:{opsFilter:r.default}}}},function(e,t,n){"use strict";n.r(t);var r=n(12),a=n.n(r),o=n(14),i=n.n(o);t.default=function(e,t){return i()(e).call(e,(function(e,n){return-1!==a()(n).call(n,t)}))}},function(e,t,n){"use strict";n.r(t);var r=n(163),a=n.n(r),o=!1;t.default=function(){return{statePlugins:{spec:{wrapActions:{updateSpec:function(e){return function(){return o=!0,e.apply(void 0,arguments)}},updateJsonSpec:function(e,t){return function(){var n=t.getConfigs().onComplete;return o&&"function"==typeof n&&(a()(n,0),o=!1),e.apply(void 0,arguments)}}}}}}}},function(e,t,n){"use strict";n.r(t);var r=n(241),a=n(242),o=n(243),i=n(244),c=n(253),s=n(51),u=n(260),l=n(261);t.default=function(){return{components:i.default,wrapComponents:c.default,statePlugins:{spec:{wrapSelectors:r,selectors:o},auth:{wrapSelectors:a},oas3:{actions:s,reducers:l.default,selectors:u}}}}},function(e,t,n){"use strict";n.r(t),n.d(t,"definitions",(function(){return d})),n.d(t,"hasHost",(function(){return h})),n.d(t,"securityDefinitions",(function(){return m})),n.d(t,"host",(function(){return v})),n.d(t,"basePath",(function(){return g})),n.d(t,"consumes",(function(){return y})),n.d(t,"produces",(function(){return b})),n.d(t,"schemes",(function(){return E})),n.d(t,"servers",(function(){return x})),n.d(t,"isOAS3",(function(){return S})),n.d(t,"isSwagger2",(function(){return w}));var r=n(19),a=n(78),o=n(1),i=n(35);function c(e){return function(t,n){return function(){var r=n.getSystem().specSelectors.specJson();return Object(i.isOAS3)(r)?e.apply(void 0,arguments):t.apply(void 0,arguments)}}}var s=function(e){return e||Object(o.Map)()},u=c(Object(r.createSelector)((function(){return null}))),l=Object(r.createSelector)(s,(function(e){return e.get("json",Object(o.Map)())})),p=Object(r.createSelector)(s,(function(e){return e.get("resolved",Object(o.Map)())})),f=function(e){var t=p(e);return t.count()<1&&(t=l(e)),t},d=c(Object(r.createSelector)(f,(function(e){var t=e.getIn(["components","schemas"]);return o.Map.isMap(t)?t:Object(o.Map)()}))),h=c((function(e){return f(e).hasIn(["servers",0])})),m=c(Object(r.createSelector)(a.specJsonWithResolvedSubtrees,(function(e){return e.getIn(["components","securitySchemes"])||null}))),v=u,g=u,y=u,b=u,E=u,x=c(Object(r.createSelector)(f,(function(e){return e.getIn(["servers"])||Object(o.Map)()}))),S=function(e,t){return function(){var e=t.getSystem().specSelectors.specJson();return Object(i.isOAS3)(o.Map.isMap(e)?e:Object(o.Map)())}},w=function(e,t){return function(){var e=t.getSystem().specSelectors.specJson();return Object(i.isSwagger2)(o.Map.isMap(e)?e:Object(o.Map)())}}},function(e,t,n){"use strict";n.r(t),n.d(t,"definitionsToAuthorize",(function(){return g}));var r=n(3),a=n.n(r),o=n(14),i=n.n(o),c=n(18),s=n.n(c),u=n(16),l=n.n(u),p=n(2),f=n.n(p),d=n(19),h=n(1),m=n(35);var v,g=(v=Object(d.createSelector)((function(e){return e}),(function(e){return e.specSelectors.securityDefinitions()}),(function(e,t){var n,r=Object(h.List)();return t?(l()(n=t.entrySeq()).call(n,(function(e){var t,n=s()(e,2),o=n[0],c=n[1],u=c.get("type");"oauth2"===u&&l()(t=c.get("flows").entrySeq()).call(t,(function(e){var t=s()(e,2),n=t[0],u=t[1],l=Object(h.fromJS)({flow:n,authorizationUrl:u.get("authorizationUrl"),tokenUrl:u.get("tokenUrl"),scopes:u.get("scopes"),type:c.get("type")});r=r.push(new h.Map(a()({},o,i()(l).call(l,(function(e){return void 0!==e})))))})),"http"!==u&&"apiKey"!==u||(r=r.push(new h.Map(a()({},o,c))))})),r):r})),function(e,t){return function(n){for(var r,a=t.getSystem().specSelectors.specJson(),o=arguments.length,i=new Array(o>1?o-1:0),c=1;c<o;c++)i[c-1]=arguments[c];return Object(m.isOAS3)(a)?v.apply(void 0,f()(r=[t]).call(r,i)):e.apply(void 0,i)}})},function(e,t,n){"use strict";n.r(t),n.d(t,"servers",(function(){return l})),n.d(t,"isSwagger2",(function(){return p}));var r=n(19),a=n(1),o=n(35);var i,c=function(e){return e||Object(a.Map)()},s=Object(r.createSelector)(c,(function(e){return e.get("json",Object(a.Map)())})),u=Object(r.createSelector)(c,(function(e){return e.get("resolved",Object(a.Map)())})),l=(i=Object(r.createSelector)((function(e){var t=u(e);return t.count()<1&&(t=s(e)),t}),(function(e){return e.getIn(["servers"])||Object(a.Map)()})),function(){return function(e){var t=e.getSystem().specSelectors.specJson();if(Object(o.isOAS3)(t)){for(var n=arguments.length,r=new Array(n>1?n-1:0),a=1;a<n;a++)r[a-1]=arguments[a];return i.apply(void 0,r)}return null}}),p=function(e,t){return function(){var e=t.getSystem().specSelectors.specJson();return Object(o.isSwagger2)(e)}}},function(e,t,n){"use strict";n.r(t);var r=n(245),a=n(246),o=n(247),i=n(248),c=n(249),s=n(250),u=n(251),l=n(252);t.default={Callbacks:r.default,HttpAuth:u.default,RequestBody:a.default,Servers:i.default,ServersContainer:c.default,RequestBodyEditor:s.default,OperationServers:l.default,operationLink:o.default}},function(e,t,n){"use strict";n.r(t);var r=n(28),a=n.n(r),o=n(18),i=n.n(o),c=n(5),s=n.n(c),u=n(0),l=n.n(u),p=(n(11),n(27),n(1));t.default=function(e){var t,n=e.callbacks,r=e.getComponent,o=e.specPath,c=r("OperationContainer",!0);if(!n)return l.a.createElement("span",null,"No callbacks");var u=s()(t=n.entrySeq()).call(t,(function(t){var n,r=i()(t,2),u=r[0],f=r[1];return l.a.createElement("div",{key:u},l.a.createElement("h2",null,u),s()(n=f.entrySeq()).call(n,(function(t){var n,r=i()(t,2),f=r[0],d=r[1];return"$$ref"===f?null:l.a.createElement("div",{key:f},s()(n=d.entrySeq()).call(n,(function(t){var n=i()(t,2),r=n[0],s=n[1];if("$$ref"===r)return null;var d=Object(p.fromJS)({operation:s});return l.a.createElement(c,a()({},e,{op:d,key:r,tag:"",method:r,path:f,specPath:o.push(u,f,r),allowTryItOut:!1}))})))})))}));return l.a.createElement("div",null,u)}},function(e,t,n){"use strict";n.r(t);var r=n(13),a=n.n(r),o=n(2),i=n.n(o),c=n(34),s=n.n(c),u=n(18),l=n.n(u),p=n(5),f=n.n(p),d=n(12),h=n.n(d),m=n(0),v=n.n(m),g=(n(11),n(27),n(1)),y=n(4);function b(e,t,n){var r=e.getIn(["content",t]),a=r.get("schema").toJS(),o=void 0!==r.get("example")?Object(y.J)(r.get("example")):null,i=r.getIn(["examples",n,"value"]);return r.get("examples")?Object(y.J)(i)||"":Object(y.J)(o||Object(y.o)(a,t,{includeWriteOnly:!0})||"")}t.default=function(e){var t=e.requestBody,n=e.requestBodyValue,r=e.requestBodyInclusionSetting,o=e.requestBodyErrors,c=e.getComponent,u=e.getConfigs,p=e.specSelectors,d=e.fn,m=e.contentType,E=e.isExecute,x=e.specPath,S=e.onChange,w=e.onChangeIncludeEmpty,j=e.activeExamplesKey,C=e.updateActiveExamplesKey,O=function(e){var t={key:e,shouldDispatchInit:!1,defaultValue:!0};return"no value"===r.get(e,"no value")&&(t.shouldDispatchInit=!0),t},_=c("Markdown",!0),A=c("modelExample"),k=c("RequestBodyEditor"),P=c("highlightCode"),I=c("ExamplesSelectValueRetainer"),T=c("Example"),N=c("ParameterIncludeEmpty"),R=u().showCommonExtensions,M=t&&t.get("description")||null,D=t&&t.get("content")||new g.OrderedMap;m=m||D.keySeq().first()||"";var q=D.get(m,Object(g.OrderedMap)()),L=q.get("schema",Object(g.OrderedMap)()),B=q.get("examples",null);if(o=g.List.isList(o)?o:Object(g.List)(),!q.size)return null;var U="object"===q.getIn(["schema","type"]);if("application/octet-stream"===m||0===h()(m).call(m,"image/")||0===h()(m).call(m,"audio/")||0===h()(m).call(m,"video/")){var V=c("Input");return E?v.a.createElement(V,{type:"file",onChange:function(e){S(e.target.files[0])}}):v.a.createElement("i",null,"Example values are not available for ",v.a.createElement("code",null,"application/octet-stream")," media types.")}if(U&&("application/x-www-form-urlencoded"===m||0===h()(m).call(m,"multipart/"))&&L.get("properties",Object(g.OrderedMap)()).size>0){var z,F=c("JsonSchemaForm"),J=c("ParameterExt"),W=L.get("properties",Object(g.OrderedMap)());return n=g.Map.isMap(n)?n:Object(g.OrderedMap)(),v.a.createElement("div",{className:"table-container"},M&&v.a.createElement(_,{source:M}),v.a.createElement("table",null,v.a.createElement("tbody",null,g.Map.isMap(W)&&f()(z=W.entrySeq()).call(z,(function(e){var t,u,p=l()(e,2),h=p[0],m=p[1];if(!m.get("readOnly")){var b=R?Object(y.l)(m):null,x=s()(t=L.get("required",Object(g.List)())).call(t,h),j=m.get("type"),C=m.get("format"),A=m.get("description"),k=n.getIn([h,"value"]),P=n.getIn([h,"errors"])||o,I=m.get("default")||m.get("example")||"";""===I&&("object"===j?I=Object(y.o)(m,!1,{includeWriteOnly:!0}):"array"===j&&(I=[])),"string"!=typeof I&&"object"===j&&(I=Object(y.J)(I));var T="string"===j&&("binary"===C||"base64"===C);return v.a.createElement("tr",{key:h,className:"parameters","data-property-name":h},v.a.createElement("td",{className:"parameters-col_name"},v.a.createElement("div",{className:x?"parameter__name required":"parameter__name"},h,x?v.a.createElement("span",null," *"):null),v.a.createElement("div",{className:"parameter__type"},j,C&&v.a.createElement("span",{className:"prop-format"},"($",C,")"),R&&b.size?f()(u=b.entrySeq()).call(u,(function(e){var t,n=l()(e,2),r=n[0],a=n[1];return v.a.createElement(J,{key:i()(t="".concat(r,"-")).call(t,a),xKey:r,xVal:a})})):null),v.a.createElement("div",{className:"parameter__deprecated"},m.get("deprecated")?"deprecated":null)),v.a.createElement("td",{className:"parameters-col_description"},v.a.createElement(_,{source:A}),E?v.a.createElement("div",null,v.a.createElement(F,{fn:d,dispatchInitialValue:!T,schema:m,description:h,getComponent:c,value:void 0===k?I:k,required:x,errors:P,onChange:function(e){S(e,[h])}}),x?null:v.a.createElement(N,{onChange:function(e){return w(h,e)},isIncluded:r.get(h)||!1,isIncludedOptions:O(h),isDisabled:a()(k)?0!==k.length:!Object(y.q)(k)})):null))}})))))}return v.a.createElement("div",null,M&&v.a.createElement(_,{source:M}),B?v.a.createElement(I,{examples:B,currentKey:j,currentUserInputValue:n,onSelect:function(e){C(e)},updateValue:S,defaultToFirstExample:!0,getComponent:c}):null,E?v.a.createElement("div",null,v.a.createElement(k,{value:n,errors:o,defaultValue:b(t,m,j),onChange:S,getComponent:c})):v.a.createElement(A,{getComponent:c,getConfigs:u,specSelectors:p,expandDepth:1,isExecute:E,schema:q.get("schema"),specPath:x.push("content",m),example:v.a.createElement(P,{className:"body-param__example",getConfigs:u,value:Object(y.J)(n)||b(t,m,j)}),includeWriteOnly:!0}),B?v.a.createElement(T,{example:B.get(j),getComponent:c,getConfigs:u}):null)}},function(e,t,n){"use strict";n.r(t);var r=n(5),a=n.n(r),o=n(30),i=n.n(o),c=n(7),s=n.n(c),u=n(6),l=n.n(u),p=n(8),f=n.n(p),d=n(9),h=n.n(d),m=n(0),v=n.n(m),g=(n(11),n(27),function(e){f()(n,e);var t=h()(n);function n(){return s()(this,n),t.apply(this,arguments)}return l()(n,[{key:"render",value:function(){var e=this.props,t=e.link,n=e.name,r=(0,e.getComponent)("Markdown",!0),o=t.get("operationId")||t.get("operationRef"),c=t.get("parameters")&&t.get("parameters").toJS(),s=t.get("description");return v.a.createElement("div",{className:"operation-link"},v.a.createElement("div",{className:"description"},v.a.createElement("b",null,v.a.createElement("code",null,n)),s?v.a.createElement(r,{source:s}):null),v.a.createElement("pre",null,"Operation `",o,"`",v.a.createElement("br",null),v.a.createElement("br",null),"Parameters ",function(e,t){var n;if("string"!=typeof t)return"";return a()(n=t.split("\n")).call(n,(function(t,n){return n>0?Array(e+1).join(" ")+t:t})).join("\n")}(0,i()(c,null,2))||"{}",v.a.createElement("br",null)))}}]),n}(m.Component));t.default=g},function(e,t,n){"use strict";n.r(t),n.d(t,"default",(function(){return j}));var r=n(5),a=n.n(r),o=n(50),i=n.n(o),c=n(2),s=n.n(c),u=n(7),l=n.n(u),p=n(6),f=n.n(p),d=n(10),h=n.n(d),m=n(8),v=n.n(m),g=n(9),y=n.n(g),b=n(3),E=n.n(b),x=n(0),S=n.n(x),w=n(1),j=(n(11),n(27),function(e){v()(n,e);var t=y()(n);function n(){var e,r;l()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,s()(e=[this]).call(e,o)),E()(h()(r),"onServerChange",(function(e){r.setServer(e.target.value)})),E()(h()(r),"onServerVariableValueChange",(function(e){var t=r.props,n=t.setServerVariableValue,a=t.currentServer,o=e.target.getAttribute("data-variable"),i=e.target.value;"function"==typeof n&&n({server:a,key:o,val:i})})),E()(h()(r),"setServer",(function(e){(0,r.props.setSelectedServer)(e)})),r}return f()(n,[{key:"componentDidMount",value:function(){var e=this.props,t=e.servers;e.currentServer||this.setServer(t.first().get("url"))}},{key:"componentWillReceiveProps",value:function(e){var t=e.servers,n=e.setServerVariableValue,r=e.getServerVariable;if(this.props.currentServer!==e.currentServer||this.props.servers!==e.servers){var o=i()(t).call(t,(function(t){return t.get("url")===e.currentServer}));if(!o)return this.setServer(t.first().get("url"));var c=o.get("variables")||Object(w.OrderedMap)();a()(c).call(c,(function(t,a){r(e.currentServer,a)||n({server:e.currentServer,key:a,val:t.get("default")||""})}))}}},{key:"render",value:function(){var e,t=this,n=this.props,r=n.servers,o=n.currentServer,c=n.getServerVariable,s=n.getEffectiveServerValue,u=(i()(r).call(r,(function(e){return e.get("url")===o}))||Object(w.OrderedMap)()).get("variables")||Object(w.OrderedMap)(),l=0!==u.size;return S.a.createElement("div",{className:"servers"},S.a.createElement("label",{htmlFor:"servers"},S.a.createElement("select",{onChange:this.onServerChange,value:o},a()(e=r.valueSeq()).call(e,(function(e){return S.a.createElement("option",{value:e.get("url"),key:e.get("url")},e.get("url"),e.get("description")&&" - ".concat(e.get("description")))})).toArray())),l?S.a.createElement("div",null,S.a.createElement("div",{className:"computed-url"},"Computed URL:",S.a.createElement("code",null,s(o))),S.a.createElement("h4",null,"Server variables"),S.a.createElement("table",null,S.a.createElement("tbody",null,a()(u).call(u,(function(e,n){var r;return S.a.createElement("tr",{key:n},S.a.createElement("td",null,n),S.a.createElement("td",null,e.get("enum")?S.a.createElement("select",{"data-variable":n,onChange:t.onServerVariableValueChange},a()(r=e.get("enum")).call(r,(function(e){return S.a.createElement("option",{selected:e===c(o,n),key:e,value:e},e)}))):S.a.createElement("input",{type:"text",value:c(o,n)||"",onChange:t.onServerVariableValueChange,"data-variable":n})))}))))):null)}}]),n}(S.a.Component))},function(e,t,n){"use strict";n.r(t),n.d(t,"default",(function(){return d}));var r=n(7),a=n.n(r),o=n(6),i=n.n(o),c=n(8),s=n.n(c),u=n(9),l=n.n(u),p=n(0),f=n.n(p),d=(n(11),function(e){s()(n,e);var t=l()(n);function n(){return a()(this,n),t.apply(this,arguments)}return i()(n,[{key:"render",value:function(){var e=this.props,t=e.specSelectors,n=e.oas3Selectors,r=e.oas3Actions,a=e.getComponent,o=t.servers(),i=a("Servers");return o&&o.size?f.a.createElement("div",null,f.a.createElement("span",{className:"servers-title"},"Servers"),f.a.createElement(i,{servers:o,currentServer:n.selectedServer(),setSelectedServer:r.setSelectedServer,setServerVariableValue:r.setServerVariableValue,getServerVariable:n.serverVariableValue,getEffectiveServerValue:n.serverEffectiveValue})):null}}]),n}(f.a.Component))},function(e,t,n){"use strict";n.r(t),n.d(t,"default",(function(){return x}));var r=n(7),a=n.n(r),o=n(6),i=n.n(o),c=n(10),s=n.n(c),u=n(8),l=n.n(u),p=n(9),f=n.n(p),d=n(3),h=n.n(d),m=n(0),v=n.n(m),g=(n(11),n(57)),y=n.n(g),b=n(4),E=Function.prototype,x=function(e){l()(n,e);var t=f()(n);function n(e,r){var o;return a()(this,n),o=t.call(this,e,r),h()(s()(o),"applyDefaultValue",(function(e){var t=e||o.props,n=t.onChange,r=t.defaultValue;return o.setState({value:r}),n(r)})),h()(s()(o),"onChange",(function(e){o.props.onChange(Object(b.J)(e))})),h()(s()(o),"onDomChange",(function(e){var t=e.target.value;o.setState({value:t},(function(){return o.onChange(t)}))})),o.state={value:Object(b.J)(e.value)||e.defaultValue},e.onChange(e.value),o}return i()(n,[{key:"componentWillReceiveProps",value:function(e){this.props.value!==e.value&&e.value!==this.state.value&&this.setState({value:Object(b.J)(e.value)}),!e.value&&e.defaultValue&&this.state.value&&this.applyDefaultValue(e)}},{key:"render",value:function(){var e=this.props,t=e.getComponent,n=e.errors,r=this.state.value,a=n.size>0,o=t("TextArea");return v.a.createElement("div",{className:"body-param"},v.a.createElement(o,{className:y()("body-param__text",{invalid:a}),title:n.size?n.join(", "):"",value:r,onChange:this.onDomChange}))}}]),n}(m.PureComponent);h()(x,"defaultProps",{onChange:E})},function(e,t,n){"use strict";n.r(t),n.d(t,"default",(function(){return w}));var r=n(5),a=n.n(r),o=n(14),i=n.n(o),c=n(21),s=n.n(c),u=n(7),l=n.n(u),p=n(6),f=n.n(p),d=n(10),h=n.n(d),m=n(8),v=n.n(m),g=n(9),y=n.n(g),b=n(3),E=n.n(b),x=n(0),S=n.n(x),w=(n(11),function(e){v()(n,e);var t=y()(n);function n(e,r){var a;l()(this,n),a=t.call(this,e,r),E()(h()(a),"onChange",(function(e){var t=a.props.onChange,n=e.target,r=n.value,o=n.name,i=s()({},a.state.value);o?i[o]=r:i=r,a.setState({value:i},(function(){return t(a.state)}))}));var o=a.props,i=o.name,c=o.schema,u=a.getValue();return a.state={name:i,schema:c,value:u},a}return f()(n,[{key:"getValue",value:function(){var e=this.props,t=e.name,n=e.authorized;return n&&n.getIn([t,"value"])}},{key:"render",value:function(){var e,t,n=this.props,r=n.schema,o=n.getComponent,c=n.errSelectors,s=n.name,u=o("Input"),l=o("Row"),p=o("Col"),f=o("authError"),d=o("Markdown",!0),h=o("JumpToPath",!0),m=(r.get("scheme")||"").toLowerCase(),v=this.getValue(),g=i()(e=c.allErrors()).call(e,(function(e){return e.get("authId")===s}));if("basic"===m){var y,b=v?v.get("username"):null;return S.a.createElement("div",null,S.a.createElement("h4",null,S.a.createElement("code",null,s||r.get("name")),"  (http, Basic)",S.a.createElement(h,{path:["securityDefinitions",s]})),b&&S.a.createElement("h6",null,"Authorized"),S.a.createElement(l,null,S.a.createElement(d,{source:r.get("description")})),S.a.createElement(l,null,S.a.createElement("label",null,"Username:"),b?S.a.createElement("code",null," ",b," "):S.a.createElement(p,null,S.a.createElement(u,{type:"text",required:"required",name:"username",onChange:this.onChange,autoFocus:!0}))),S.a.createElement(l,null,S.a.createElement("label",null,"Password:"),b?S.a.createElement("code",null," ****** "):S.a.createElement(p,null,S.a.createElement(u,{autoComplete:"new-password",name:"password",type:"password",onChange:this.onChange}))),a()(y=g.valueSeq()).call(y,(function(e,t){return S.a.createElement(f,{error:e,key:t})})))}return"bearer"===m?S.a.createElement("div",null,S.a.createElement("h4",null,S.a.createElement("code",null,s||r.get("name")),"  (http, Bearer)",S.a.createElement(h,{path:["securityDefinitions",s]})),v&&S.a.createElement("h6",null,"Authorized"),S.a.createElement(l,null,S.a.createElement(d,{source:r.get("description")})),S.a.createElement(l,null,S.a.createElement("label",null,"Value:"),v?S.a.createElement("code",null," ****** "):S.a.createElement(p,null,S.a.createElement(u,{type:"text",onChange:this.onChange,autoFocus:!0}))),a()(t=g.valueSeq()).call(t,(function(e,t){return S.a.createElement(f,{error:e,key:t})}))):S.a.createElement("div",null,S.a.createElement("em",null,S.a.createElement("b",null,s)," HTTP authentication: unsupported scheme ","'".concat(m,"'")))}}]),n}(S.a.Component))},function(e,t,n){"use strict";n.r(t),n.d(t,"default",(function(){return x}));var r=n(25),a=n.n(r),o=n(2),i=n.n(o),c=n(7),s=n.n(c),u=n(6),l=n.n(u),p=n(10),f=n.n(p),d=n(8),h=n.n(d),m=n(9),v=n.n(m),g=n(3),y=n.n(g),b=n(0),E=n.n(b),x=(n(11),n(27),function(e){h()(n,e);var t=v()(n);function n(){var e,r;s()(this,n);for(var o=arguments.length,c=new Array(o),u=0;u<o;u++)c[u]=arguments[u];return r=t.call.apply(t,i()(e=[this]).call(e,c)),y()(f()(r),"setSelectedServer",(function(e){var t,n=r.props,a=n.path,o=n.method;return r.forceUpdate(),r.props.setSelectedServer(e,i()(t="".concat(a,":")).call(t,o))})),y()(f()(r),"setServerVariableValue",(function(e){var t,n=r.props,o=n.path,c=n.method;return r.forceUpdate(),r.props.setServerVariableValue(a()(a()({},e),{},{namespace:i()(t="".concat(o,":")).call(t,c)}))})),y()(f()(r),"getSelectedServer",(function(){var e,t=r.props,n=t.path,a=t.method;return r.props.getSelectedServer(i()(e="".concat(n,":")).call(e,a))})),y()(f()(r),"getServerVariable",(function(e,t){var n,a=r.props,o=a.path,c=a.method;return r.props.getServerVariable({namespace:i()(n="".concat(o,":")).call(n,c),server:e},t)})),y()(f()(r),"getEffectiveServerValue",(function(e){var t,n=r.props,a=n.path,o=n.method;return r.props.getEffectiveServerValue({server:e,namespace:i()(t="".concat(a,":")).call(t,o)})})),r}return l()(n,[{key:"render",value:function(){var e=this.props,t=e.operationServers,n=e.pathServers,r=e.getComponent;if(!t&&!n)return null;var a=r("Servers"),o=t||n,i=t?"operation":"path";return E.a.createElement("div",{className:"opblock-section operation-servers"},E.a.createElement("div",{className:"opblock-section-header"},E.a.createElement("div",{className:"tab-header"},E.a.createElement("h4",{className:"opblock-title"},"Servers"))),E.a.createElement("div",{className:"opblock-description-wrapper"},E.a.createElement("h4",{className:"message"},"These ",i,"-level options override the global server options."),E.a.createElement(a,{servers:o,currentServer:this.getSelectedServer(),setSelectedServer:this.setSelectedServer,setServerVariableValue:this.setServerVariableValue,getServerVariable:this.getServerVariable,getEffectiveServerValue:this.getEffectiveServerValue})))}}]),n}(E.a.Component))},function(e,t,n){"use strict";n.r(t);var r=n(254),a=n(255),o=n(256),i=n(257),c=n(258),s=n(259);t.default={Markdown:r.default,AuthItem:a.default,JsonSchema_string:s.default,VersionStamp:o.default,model:c.default,onlineValidatorBadge:i.default}},function(e,t,n){"use strict";n.r(t),n.d(t,"Markdown",(function(){return d}));var r=n(82),a=n.n(r),o=n(0),i=n.n(o),c=(n(11),n(57)),s=n.n(c),u=n(167),l=n(35),p=n(168),f=new u.Remarkable("commonmark");f.block.ruler.enable(["table"]),f.set({linkTarget:"_blank"});var d=function(e){var t=e.source,n=e.className,r=void 0===n?"":n,o=e.getConfigs;if("string"!=typeof t)return null;if(t){var c,u=o().useUnsafeMarkdown,l=f.render(t),d=Object(p.b)(l,{useUnsafeMarkdown:u});return"string"==typeof d&&(c=a()(d).call(d)),i.a.createElement("div",{dangerouslySetInnerHTML:{__html:c},className:s()(r,"renderedMarkdown")})}return null};d.defaultProps={getConfigs:function(){return{useUnsafeMarkdown:!1}}},t.default=Object(l.OAS3ComponentWrapFactory)(d)},function(e,t,n){"use strict";n.r(t);var r=n(49),a=n.n(r),o=n(0),i=n.n(o),c=n(35);t.default=Object(c.OAS3ComponentWrapFactory)((function(e){var t=e.Ori,n=a()(e,["Ori"]),r=n.schema,o=n.getComponent,c=n.errSelectors,s=n.authorized,u=n.onAuthChange,l=n.name,p=o("HttpAuth");return"http"===r.get("type")?i.a.createElement(p,{key:l,schema:r,name:l,errSelectors:c,authorized:s,getComponent:o,onChange:u}):i.a.createElement(t,n)}))},function(e,t,n){"use strict";n.r(t);var r=n(0),a=n.n(r),o=n(35);t.default=Object(o.OAS3ComponentWrapFactory)((function(e){var t=e.Ori;return a.a.createElement("span",null,a.a.createElement(t,e),a.a.createElement("small",{className:"version-stamp"},a.a.createElement("pre",{className:"version"},"OAS3")))}))},function(e,t,n){"use strict";n.r(t);var r=n(35),a=n(164);t.default=Object(r.OAS3ComponentWrapFactory)(a.a)},function(e,t,n){"use strict";n.r(t);var r=n(28),a=n.n(r),o=n(7),i=n.n(o),c=n(6),s=n.n(c),u=n(8),l=n.n(u),p=n(9),f=n.n(p),d=n(0),h=n.n(d),m=(n(11),n(35)),v=n(166),g=function(e){l()(n,e);var t=f()(n);function n(){return i()(this,n),t.apply(this,arguments)}return s()(n,[{key:"render",value:function(){var e=this.props,t=e.getConfigs,n=["model-box"],r=null;return!0===e.schema.get("deprecated")&&(n.push("deprecated"),r=h.a.createElement("span",{className:"model-deprecated-warning"},"Deprecated:")),h.a.createElement("div",{className:n.join(" ")},r,h.a.createElement(v.a,a()({},this.props,{getConfigs:t,depth:1,expandDepth:this.props.expandDepth||0})))}}]),n}(d.Component);t.default=Object(m.OAS3ComponentWrapFactory)(g)},function(e,t,n){"use strict";n.r(t);var r=n(49),a=n.n(r),o=n(0),i=n.n(o),c=n(35);t.default=Object(c.OAS3ComponentWrapFactory)((function(e){var t=e.Ori,n=a()(e,["Ori"]),r=n.schema,o=n.getComponent,c=n.errors,s=n.onChange,u=r&&r.get?r.get("format"):null,l=r&&r.get?r.get("type"):null,p=o("Input");return l&&"string"===l&&u&&("binary"===u||"base64"===u)?i.a.createElement(p,{type:"file",className:c.length?"invalid":"",title:c.length?c:"",onChange:function(e){s(e.target.files[0])},disabled:t.isDisabled}):i.a.createElement(t,n)}))},function(e,t,n){"use strict";n.r(t),n.d(t,"selectedServer",(function(){return b})),n.d(t,"requestBodyValue",(function(){return E})),n.d(t,"requestBodyInclusionSetting",(function(){return x})),n.d(t,"requestBodyErrors",(function(){return S})),n.d(t,"activeExamplesMember",(function(){return w})),n.d(t,"requestContentType",(function(){return j})),n.d(t,"responseContentType",(function(){return C})),n.d(t,"serverVariableValue",(function(){return O})),n.d(t,"serverVariables",(function(){return _})),n.d(t,"serverEffectiveValue",(function(){return A})),n.d(t,"validateBeforeExecute",(function(){return k})),n.d(t,"validateShallowRequired",(function(){return P}));var r=n(12),a=n.n(r),o=n(15),i=n.n(o),c=n(16),s=n.n(c),u=n(5),l=n.n(u),p=n(17),f=n.n(p),d=n(2),h=n.n(d),m=n(1),v=n(35);function g(e){return function(){for(var t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return function(t){var r=t.getSystem().specSelectors.specJson();return Object(v.isOAS3)(r)?e.apply(void 0,n):null}}}var y,b=g((function(e,t){var n=t?[t,"selectedServer"]:["selectedServer"];return e.getIn(n)||""})),E=g((function(e,t,n){return e.getIn(["requestData",t,n,"bodyValue"])||null})),x=g((function(e,t,n){return e.getIn(["requestData",t,n,"bodyInclusion"])||Object(m.Map)()})),S=g((function(e,t,n){return e.getIn(["requestData",t,n,"errors"])||null})),w=g((function(e,t,n,r,a){return e.getIn(["examples",t,n,r,a,"activeExample"])||null})),j=g((function(e,t,n){return e.getIn(["requestData",t,n,"requestContentType"])||null})),C=g((function(e,t,n){return e.getIn(["requestData",t,n,"responseContentType"])||null})),O=g((function(e,t,n){var r;if("string"!=typeof t){var a=t.server,o=t.namespace;r=o?[o,"serverVariableValues",a,n]:["serverVariableValues",a,n]}else{r=["serverVariableValues",t,n]}return e.getIn(r)||null})),_=g((function(e,t){var n;if("string"!=typeof t){var r=t.server,a=t.namespace;n=a?[a,"serverVariableValues",r]:["serverVariableValues",r]}else{n=["serverVariableValues",t]}return e.getIn(n)||Object(m.OrderedMap)()})),A=g((function(e,t){var n,r;if("string"!=typeof t){var a=t.server,o=t.namespace;r=a,n=o?e.getIn([o,"serverVariableValues",r]):e.getIn(["serverVariableValues",r])}else r=t,n=e.getIn(["serverVariableValues",r]);n=n||Object(m.OrderedMap)();var i=r;return l()(n).call(n,(function(e,t){i=i.replace(new RegExp("{".concat(t,"}"),"g"),e)})),i})),k=(y=function(e,t){return function(e,t){var n;return t=t||[],!!e.getIn(h()(n=["requestData"]).call(n,f()(t),["bodyValue"]))}(e,t)},function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];return function(e){var n,r,a=e.getSystem().specSelectors.specJson(),o=h()(n=[]).call(n,t)[1]||[];return!a.getIn(h()(r=["paths"]).call(r,f()(o),["requestBody","required"]))||y.apply(void 0,t)}}),P=function(e,t){var n,r=t.oas3RequiredRequestBodyContentType,o=t.oas3RequestContentType,c=t.oas3RequestBodyValue,u=[];if(!m.Map.isMap(c))return u;var l=[];return s()(n=i()(r.requestContentType)).call(n,(function(e){if(e===o){var t=r.requestContentType[e];s()(t).call(t,(function(e){a()(l).call(l,e)<0&&l.push(e)}))}})),s()(l).call(l,(function(e){c.getIn([e,"value"])||u.push(e)})),u}},function(e,t,n){"use strict";n.r(t);var r,a=n(3),o=n.n(a),i=n(22),c=n.n(i),s=n(16),u=n.n(s),l=n(23),p=n.n(l),f=n(101),d=n.n(f),h=n(276),m=n.n(h),v=n(18),g=n.n(v),y=n(1),b=n(51);t.default=(r={},o()(r,b.UPDATE_SELECTED_SERVER,(function(e,t){var n=t.payload,r=n.selectedServerUrl,a=n.namespace,o=a?[a,"selectedServer"]:["selectedServer"];return e.setIn(o,r)})),o()(r,b.UPDATE_REQUEST_BODY_VALUE,(function(e,t){var n=t.payload,r=n.value,a=n.pathMethod,o=g()(a,2),i=o[0],c=o[1];if(!y.Map.isMap(r))return e.setIn(["requestData",i,c,"bodyValue"],r);var s,l=e.getIn(["requestData",i,c,"bodyValue"])||Object(y.Map)();y.Map.isMap(l)||(l=Object(y.Map)());var f=d()(r).call(r),h=m()(f),v=p()(h).call(h,0);return u()(v).call(v,(function(e){var t=r.getIn([e]);l.has(e)&&y.Map.isMap(t)||(s=l.setIn([e,"value"],t))})),e.setIn(["requestData",i,c,"bodyValue"],s)})),o()(r,b.UPDATE_REQUEST_BODY_INCLUSION,(function(e,t){var n=t.payload,r=n.value,a=n.pathMethod,o=n.name,i=g()(a,2),c=i[0],s=i[1];return e.setIn(["requestData",c,s,"bodyInclusion",o],r)})),o()(r,b.UPDATE_ACTIVE_EXAMPLES_MEMBER,(function(e,t){var n=t.payload,r=n.name,a=n.pathMethod,o=n.contextType,i=n.contextName,c=g()(a,2),s=c[0],u=c[1];return e.setIn(["examples",s,u,o,i,"activeExample"],r)})),o()(r,b.UPDATE_REQUEST_CONTENT_TYPE,(function(e,t){var n=t.payload,r=n.value,a=n.pathMethod,o=g()(a,2),i=o[0],c=o[1];return e.setIn(["requestData",i,c,"requestContentType"],r)})),o()(r,b.UPDATE_RESPONSE_CONTENT_TYPE,(function(e,t){var n=t.payload,r=n.value,a=n.path,o=n.method;return e.setIn(["requestData",a,o,"responseContentType"],r)})),o()(r,b.UPDATE_SERVER_VARIABLE_VALUE,(function(e,t){var n=t.payload,r=n.server,a=n.namespace,o=n.key,i=n.val,c=a?[a,"serverVariableValues",r,o]:["serverVariableValues",r,o];return e.setIn(c,i)})),o()(r,b.SET_REQUEST_BODY_VALIDATE_ERROR,(function(e,t){var n=t.payload,r=n.path,a=n.method,o=n.validationErrors,i=[];if(i.push("Required field is not provided"),o.missingBodyValue)return e.setIn(["requestData",r,a,"errors"],Object(y.fromJS)(i));if(o.missingRequiredKeys&&o.missingRequiredKeys.length>0){var s=o.missingRequiredKeys;return e.updateIn(["requestData",r,a,"bodyValue"],Object(y.fromJS)({}),(function(e){return c()(s).call(s,(function(e,t){return e.setIn([t,"errors"],Object(y.fromJS)(i))}),e)}))}return console.warn("unexpected result: SET_REQUEST_BODY_VALIDATE_ERROR"),e})),o()(r,b.CLEAR_REQUEST_BODY_VALIDATE_ERROR,(function(e,t){var n=t.payload,r=n.path,a=n.method,o=e.getIn(["requestData",r,a,"bodyValue"]);if(!y.Map.isMap(o))return e.setIn(["requestData",r,a,"errors"],Object(y.fromJS)([]));var i=d()(o).call(o),s=m()(i),u=p()(s).call(s,0);return u?e.updateIn(["requestData",r,a,"bodyValue"],Object(y.fromJS)({}),(function(e){return c()(u).call(u,(function(e,t){return e.setIn([t,"errors"],Object(y.fromJS)([]))}),e)})):e})),o()(r,b.CLEAR_REQUEST_BODY_VALUE,(function(e,t){var n=t.payload.pathMethod,r=g()(n,2),a=r[0],o=r[1],i=e.getIn(["requestData",a,o,"bodyValue"]);return i?y.Map.isMap(i)?e.setIn(["requestData",a,o,"bodyValue"],Object(y.Map)()):e.setIn(["requestData",a,o,"bodyValue"],""):e})),r)},function(e,t,n){"use strict";n.r(t);var r,a=n(101),o=n.n(a),i=n(16),c=n.n(i),s=n(4),u=n(752),l={};c()(r=o()(u).call(u)).call(r,(function(e){if("./index.js"!==e){var t=u(e);l[Object(s.E)(e)]=t.default?t.default:t}})),t.default=l},function(e,t,n){"use strict";n.r(t);var r={};n.r(r),n.d(r,"path",(function(){return Nn})),n.d(r,"query",(function(){return Rn})),n.d(r,"header",(function(){return Dn})),n.d(r,"cookie",(function(){return qn}));var a=n(2),o=n.n(a),i=n(39),c=n.n(i),s=n(69),u=n.n(s),l=n(16),p=n.n(l),f=n(14),d=n.n(f),h=n(45),m=n.n(h),v=n(382),g=n.n(v),y=n(15),b=n.n(y),E=n(5),x=n.n(E),S=n(83),w=n.n(S),j=n(30),C=n.n(j),O=n(32),_=n.n(O),A=n(13),k=n.n(A),P=n(20),I=n.n(P),T=n(18),N=n.n(T),R=n(158),M=n.n(R),D=n(22),q=n.n(D),L=n(71),B=n.n(L),U=n(34),V=n.n(U),z=n(12),F=n.n(z),J=(n(709),n(169)),W=n.n(J),H=n(84),$=n.n(H),Y=n(159),K=n.n(Y),G=n(58),Z=n.n(G),X=n(160),Q=n(50),ee=n.n(Q),te=n(7),ne=n.n(te),re=n(6),ae=n.n(re),oe=n(383),ie=n.n(oe),ce=n(153),se=n.n(ce),ue=n(8),le=n.n(ue),pe=n(9),fe=n.n(pe),de=n(384),he=function(e){var t=function(e,t){return{name:e,value:t}};return Z()(e.prototype.set)||Z()(e.prototype.get)||Z()(e.prototype.getAll)||Z()(e.prototype.has)?e:function(e){le()(r,e);var n=fe()(r);function r(e){var t;return ne()(this,r),(t=n.call(this,e)).entryList=[],t}return ae()(r,[{key:"append",value:function(e,n,a){return this.entryList.push(t(e,n)),ie()(se()(r.prototype),"append",this).call(this,e,n,a)}},{key:"set",value:function(e,n){var r,a=t(e,n);this.entryList=d()(r=this.entryList).call(r,(function(t){return t.name!==e})),this.entryList.push(a)}},{key:"get",value:function(e){var t,n=ee()(t=this.entryList).call(t,(function(t){return t.name===e}));return void 0===n?null:n}},{key:"getAll",value:function(e){var t,n;return x()(t=d()(n=this.entryList).call(n,(function(t){return t.name===e}))).call(t,(function(e){return e.value}))}},{key:"has",value:function(e){var t;return _()(t=this.entryList).call(t,(function(t){return t.name===e}))}}]),r}(e)}(n.n(de).a),me=n(23),ve=n.n(me),ge=n(17),ye=n.n(ge),be=n(160).Buffer,Ee=function(e){return F()(":/?#[]@!$&'()*+,;=").call(":/?#[]@!$&'()*+,;=",e)>-1},xe=function(e){return/^[a-z0-9\-._~]+$/i.test(e)};function Se(e){var t,n=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},r=n.escape,a=arguments.length>2?arguments[2]:void 0;return"number"==typeof e&&(e=e.toString()),"string"==typeof e&&e.length&&r?a?JSON.parse(e):x()(t=ye()(e)).call(t,(function(e){var t,n;return xe(e)||Ee(e)&&"unsafe"===r?e:x()(t=x()(n=be.from(e).toJSON().data||[]).call(n,(function(e){var t;return ve()(t="0".concat(e.toString(16).toUpperCase())).call(t,-2)}))).call(t,(function(e){return"%".concat(e)})).join("")})).join(""):e}function we(e){var t=e.value;return k()(t)?function(e){var t,n=e.key,r=e.value,a=e.style,i=e.explode,c=e.escape,s=function(e){return Se(e,{escape:c})};if("simple"===a)return x()(r).call(r,(function(e){return s(e)})).join(",");if("label"===a)return".".concat(x()(r).call(r,(function(e){return s(e)})).join("."));if("matrix"===a)return q()(t=x()(r).call(r,(function(e){return s(e)}))).call(t,(function(e,t){var r,a,c;return!e||i?o()(a=o()(c="".concat(e||"",";")).call(c,n,"=")).call(a,t):o()(r="".concat(e,",")).call(r,t)}),"");if("form"===a){var u=i?"&".concat(n,"="):",";return x()(r).call(r,(function(e){return s(e)})).join(u)}if("spaceDelimited"===a){var l=i?"".concat(n,"="):"";return x()(r).call(r,(function(e){return s(e)})).join(" ".concat(l))}if("pipeDelimited"===a){var p=i?"".concat(n,"="):"";return x()(r).call(r,(function(e){return s(e)})).join("|".concat(p))}return}(e):"object"===I()(t)?function(e){var t=e.key,n=e.value,r=e.style,a=e.explode,i=e.escape,c=function(e){return Se(e,{escape:i})},s=b()(n);if("simple"===r)return q()(s).call(s,(function(e,t){var r,i,s,u=c(n[t]),l=a?"=":",",p=e?"".concat(e,","):"";return o()(r=o()(i=o()(s="".concat(p)).call(s,t)).call(i,l)).call(r,u)}),"");if("label"===r)return q()(s).call(s,(function(e,t){var r,i,s,u=c(n[t]),l=a?"=":".",p=e?"".concat(e,"."):".";return o()(r=o()(i=o()(s="".concat(p)).call(s,t)).call(i,l)).call(r,u)}),"");if("matrix"===r&&a)return q()(s).call(s,(function(e,t){var r,a,i=c(n[t]),s=e?"".concat(e,";"):";";return o()(r=o()(a="".concat(s)).call(a,t,"=")).call(r,i)}),"");if("matrix"===r)return q()(s).call(s,(function(e,r){var a,i,s=c(n[r]),u=e?"".concat(e,","):";".concat(t,"=");return o()(a=o()(i="".concat(u)).call(i,r,",")).call(a,s)}),"");if("form"===r)return q()(s).call(s,(function(e,t){var r,i,s,u,l=c(n[t]),p=e?o()(r="".concat(e)).call(r,a?"&":","):"",f=a?"=":",";return o()(i=o()(s=o()(u="".concat(p)).call(u,t)).call(s,f)).call(i,l)}),"");return}(e):function(e){var t,n=e.key,r=e.value,a=e.style,i=e.escape,c=function(e){return Se(e,{escape:i})};if("simple"===a)return c(r);if("label"===a)return".".concat(c(r));if("matrix"===a)return o()(t=";".concat(n,"=")).call(t,c(r));if("form"===a)return c(r);if("deepObject"===a)return c(r,{},!0);return}(e)}var je={serializeRes:ke,mergeInQueryOrForm:Ue};function Ce(e){return Oe.apply(this,arguments)}function Oe(){return(Oe=u()(c.a.mark((function e(t){var n,r,a,o,i,s,u=arguments;return c.a.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:if(n=u.length>1&&void 0!==u[1]?u[1]:{},"object"===I()(t)&&(t=(n=t).url),n.headers=n.headers||{},je.mergeInQueryOrForm(n),n.headers&&p()(r=b()(n.headers)).call(r,(function(e){var t=n.headers[e];"string"==typeof t&&(n.headers[e]=t.replace(/\n+/g," "))})),!n.requestInterceptor){e.next=12;break}return e.next=8,n.requestInterceptor(n);case 8:if(e.t0=e.sent,e.t0){e.next=11;break}e.t0=n;case 11:n=e.t0;case 12:return a=n.headers["content-type"]||n.headers["Content-Type"],/multipart\/form-data/i.test(a)&&(delete n.headers["content-type"],delete n.headers["Content-Type"]),e.prev=14,e.next=17,(n.userFetch||fetch)(n.url,n);case 17:return o=e.sent,e.next=20,je.serializeRes(o,t,n);case 20:if(o=e.sent,!n.responseInterceptor){e.next=28;break}return e.next=24,n.responseInterceptor(o);case 24:if(e.t1=e.sent,e.t1){e.next=27;break}e.t1=o;case 27:o=e.t1;case 28:e.next=39;break;case 30:if(e.prev=30,e.t2=e.catch(14),o){e.next=34;break}throw e.t2;case 34:throw(i=new Error(o.statusText)).status=o.status,i.statusCode=o.status,i.responseError=e.t2,i;case 39:if(o.ok){e.next=45;break}throw(s=new Error(o.statusText)).status=o.status,s.statusCode=o.status,s.response=o,s;case 45:return e.abrupt("return",o);case 46:case"end":return e.stop()}}),e,null,[[14,30]])})))).apply(this,arguments)}var _e=function(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"";return/(json|xml|yaml|text)\b/.test(e)};function Ae(e,t){return t&&(0===F()(t).call(t,"application/json")||F()(t).call(t,"+json")>0)?JSON.parse(e):$.a.safeLoad(e)}function ke(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},r=n.loadSpec,a=void 0!==r&&r,o={ok:e.ok,url:e.url||t,status:e.status,statusText:e.statusText,headers:Ie(e.headers)},i=o.headers["content-type"],c=a||_e(i),s=c?e.text:e.blob||e.buffer;return s.call(e).then((function(e){if(o.text=e,o.data=e,c)try{var t=Ae(e,i);o.body=t,o.obj=t}catch(e){o.parseError=e}return o}))}function Pe(e){return V()(e).call(e,", ")?e.split(", "):e}function Ie(){var e,t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};return Z()(B()(t))?q()(e=M()(B()(t).call(t))).call(e,(function(e,t){var n=N()(t,2),r=n[0],a=n[1];return e[r]=Pe(a),e}),{}):{}}function Te(e,t){return t||"undefined"==typeof navigator||(t=navigator),t&&"ReactNative"===t.product?!(!e||"object"!==I()(e)||"string"!=typeof e.uri):"undefined"!=typeof File&&e instanceof File||("undefined"!=typeof Blob&&e instanceof Blob||(void 0!==X.Buffer&&e instanceof X.Buffer||null!==e&&"object"===I()(e)&&"function"==typeof e.pipe))}function Ne(e,t){return k()(e)&&_()(e).call(e,(function(e){return Te(e,t)}))}var Re={form:",",spaceDelimited:"%20",pipeDelimited:"|"},Me={csv:",",ssv:"%20",tsv:"%09",pipes:"|"};function De(e,t){var n=arguments.length>2&&void 0!==arguments[2]&&arguments[2],r=t.collectionFormat,a=t.allowEmptyValue,o=t.serializationOption,i=t.encoding,c="object"!==I()(t)||k()(t)?t:t.value,s=n?function(e){return e.toString()}:function(e){return encodeURIComponent(e)},u=s(e);if(void 0===c&&a)return[[u,""]];if(Te(c)||Ne(c))return[[u,c]];if(o)return qe(e,c,n,o);if(i){var l;if(_()(l=[I()(i.style),I()(i.explode),I()(i.allowReserved)]).call(l,(function(e){return"undefined"!==e})))return qe(e,c,n,K()(i,["style","explode","allowReserved"]));if(i.contentType){if("application/json"===i.contentType){var p="string"==typeof c?c:C()(c);return[[u,s(p)]]}return[[u,s(c.toString())]]}return"object"!==I()(c)?[[u,s(c)]]:k()(c)&&w()(c).call(c,(function(e){return"object"!==I()(e)}))?[[u,x()(c).call(c,s).join(",")]]:[[u,s(C()(c))]]}return"object"!==I()(c)?[[u,s(c)]]:k()(c)?"multi"===r?[[u,x()(c).call(c,s)]]:[[u,x()(c).call(c,s).join(Me[r||"csv"])]]:[[u,""]]}function qe(e,t,n,r){var a,i,c,s=r.style||"form",u=void 0===r.explode?"form"===s:r.explode,l=!n&&(r&&r.allowReserved?"unsafe":"reserved"),p=function(e){return Se(e,{escape:l})},f=n?function(e){return e}:function(e){return Se(e,{escape:l})};return"object"!==I()(t)?[[f(e),p(t)]]:k()(t)?u?[[f(e),x()(t).call(t,p)]]:[[f(e),x()(t).call(t,p).join(Re[s])]]:"deepObject"===s?x()(i=b()(t)).call(i,(function(n){var r;return[f(o()(r="".concat(e,"[")).call(r,n,"]")),p(t[n])]})):u?x()(c=b()(t)).call(c,(function(e){return[f(e),p(t[e])]})):[[f(e),x()(a=b()(t)).call(a,(function(e){var n;return[o()(n="".concat(f(e),",")).call(n,p(t[e]))]})).join(",")]]}function Le(e){var t;return q()(t=g()(e)).call(t,(function(e,t){var n,r=N()(t,2),a=r[0],o=r[1],i=m()(De(a,o,!0));try{for(i.s();!(n=i.n()).done;){var c=N()(n.value,2),s=c[0],u=c[1];if(k()(u)){var l,p=m()(u);try{for(p.s();!(l=p.n()).done;){var f=l.value;e.append(s,f)}}catch(e){p.e(e)}finally{p.f()}}else e.append(s,u)}}catch(e){i.e(e)}finally{i.f()}return e}),new he)}function Be(e){var t,n=q()(t=b()(e)).call(t,(function(t,n){var r,a=m()(De(n,e[n]));try{for(a.s();!(r=a.n()).done;){var o=N()(r.value,2),i=o[0],c=o[1];t[i]=c}}catch(e){a.e(e)}finally{a.f()}return t}),{});return W.a.stringify(n,{encode:!1,indices:!1})||""}function Ue(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=e.url,n=void 0===t?"":t,r=e.query,a=e.form,o=function(){for(var e=arguments.length,t=new Array(e),n=0;n<e;n++)t[n]=arguments[n];var r=d()(t).call(t,(function(e){return e})).join("&");return r?"?".concat(r):""};if(a){var i,c=_()(i=b()(a)).call(i,(function(e){var t=a[e].value;return Te(t)||Ne(t)})),s=e.headers["content-type"]||e.headers["Content-Type"];c||/multipart\/form-data/i.test(s)?e.body=Le(e.form):e.body=Be(a),delete e.form}if(r){var u=n.split("?"),l=N()(u,2),f=l[0],h=l[1],m="";if(h){var v=W.a.parse(h),g=b()(r);p()(g).call(g,(function(e){return delete v[e]})),m=W.a.stringify(v,{encode:!0})}var y=o(m,Be(r));e.url=f+y,delete e.query}return e}var Ve=n(385),ze=n.n(Ve),Fe=n(25),Je=n.n(Fe),We=n(66),He=n.n(We),$e=n(29),Ye=n.n($e),Ke=n(271),Ge=n.n(Ke),Ze=n(21),Xe=n.n(Ze),Qe=n(156),et=n.n(Qe),tt=n(272),nt=n.n(tt),rt=n(3),at=n.n(rt),ot=n(114),it=n(70),ct=n.n(it),st=n(386),ut=n.n(st),lt={add:function(e,t){return{op:"add",path:e,value:t}},replace:ft,remove:function(e){return{op:"remove",path:e}},merge:function(e,t){return{type:"mutation",op:"merge",path:e,value:t}},mergeDeep:function(e,t){return{type:"mutation",op:"mergeDeep",path:e,value:t}},context:function(e,t){return{type:"context",path:e,value:t}},getIn:function(e,t){return q()(t).call(t,(function(e,t){return void 0!==t&&e?e[t]:e}),e)},applyPatch:function(e,t,n){if(n=n||{},"merge"===(t=Je()(Je()({},t),{},{path:t.path&&pt(t.path)})).op){var r=Ct(e,t.path);Xe()(r,t.value),ot.applyPatch(e,[ft(t.path,r)])}else if("mergeDeep"===t.op){var a=Ct(e,t.path);for(var i in t.value){var c=t.value[i],s=k()(c);if(s){var u=a[i]||[];a[i]=o()(u).call(u,c)}else if(bt(c)&&!s){var l=Je()({},a[i]);for(var p in c){if(Object.prototype.hasOwnProperty.call(l,p)){l=ct()(ut()(l),c);break}Xe()(l,at()({},p,c[p]))}a[i]=l}else a[i]=c}}else if("add"===t.op&&""===t.path&&bt(t.value)){var f,d=q()(f=b()(t.value)).call(f,(function(e,n){return e.push({op:"add",path:"/".concat(pt(n)),value:t.value[n]}),e}),[]);ot.applyPatch(e,d)}else if("replace"===t.op&&""===t.path){var h=t.value;n.allowMetaPatches&&t.meta&&wt(t)&&(k()(t.value)||bt(t.value))&&(h=Je()(Je()({},h),t.meta)),e=h}else if(ot.applyPatch(e,[t]),n.allowMetaPatches&&t.meta&&wt(t)&&(k()(t.value)||bt(t.value))){var m=Ct(e,t.path),v=Je()(Je()({},m),t.meta);ot.applyPatch(e,[ft(t.path,v)])}return e},parentPathMatch:function(e,t){if(!k()(t))return!1;for(var n=0,r=t.length;n<r;n+=1)if(t[n]!==e[n])return!1;return!0},flatten:gt,fullyNormalizeArray:function(e){return yt(gt(vt(e)))},normalizeArray:vt,isPromise:function(e){return bt(e)&&Et(e.then)},forEachNew:function(e,t){try{return dt(e,mt,t)}catch(e){return e}},forEachNewPrimitive:function(e,t){try{return dt(e,ht,t)}catch(e){return e}},isJsonPatch:xt,isContextPatch:function(e){return jt(e)&&"context"===e.type},isPatch:jt,isMutation:St,isAdditiveMutation:wt,isGenerator:function(e){return"[object GeneratorFunction]"===Object.prototype.toString.call(e)},isFunction:Et,isObject:bt,isError:function(e){return e instanceof Error}};function pt(e){return k()(e)?e.length<1?"":"/".concat(x()(e).call(e,(function(e){return(e+"").replace(/~/g,"~0").replace(/\//g,"~1")})).join("/")):e}function ft(e,t,n){return{op:"replace",path:e,value:t,meta:n}}function dt(e,t,n){var r;return yt(gt(x()(r=d()(e).call(e,wt)).call(r,(function(e){return t(e.value,n,e.path)}))||[]))}function ht(e,t,n){return n=n||[],k()(e)?x()(e).call(e,(function(e,r){return ht(e,t,o()(n).call(n,r))})):bt(e)?x()(r=b()(e)).call(r,(function(r){return ht(e[r],t,o()(n).call(n,r))})):t(e,n[n.length-1],n);var r}function mt(e,t,n){var r=[];if((n=n||[]).length>0){var a=t(e,n[n.length-1],n);a&&(r=o()(r).call(r,a))}if(k()(e)){var i=x()(e).call(e,(function(e,r){return mt(e,t,o()(n).call(n,r))}));i&&(r=o()(r).call(r,i))}else if(bt(e)){var c,s=x()(c=b()(e)).call(c,(function(r){return mt(e[r],t,o()(n).call(n,r))}));s&&(r=o()(r).call(r,s))}return r=gt(r)}function vt(e){return k()(e)?e:[e]}function gt(e){var t,n,r;return(n=o()(t=[])).call.apply(n,o()(r=[t]).call(r,ye()(x()(e).call(e,(function(e){return k()(e)?gt(e):e})))))}function yt(e){return d()(e).call(e,(function(e){return void 0!==e}))}function bt(e){return e&&"object"===I()(e)}function Et(e){return e&&"function"==typeof e}function xt(e){if(jt(e)){var t=e.op;return"add"===t||"remove"===t||"replace"===t}return!1}function St(e){return xt(e)||jt(e)&&"mutation"===e.type}function wt(e){return St(e)&&("add"===e.op||"replace"===e.op||"merge"===e.op||"mergeDeep"===e.op)}function jt(e){return e&&"object"===I()(e)}function Ct(e,t){try{return ot.getValueByPointer(e,t)}catch(e){return console.error(e),{}}}var Ot=n(387),_t=n.n(Ot),At=n(388),kt=n(273),Pt=n.n(kt),It=n(86),Tt=n.n(It);function Nt(e,t){function n(){Error.captureStackTrace?Error.captureStackTrace(this,this.constructor):this.stack=(new Error).stack;for(var e=arguments.length,n=new Array(e),r=0;r<e;r++)n[r]=arguments[r];this.message=n[0],t&&t.apply(this,n)}return n.prototype=new Error,n.prototype.name=e,n.prototype.constructor=n,n}var Rt=n(389),Mt=n.n(Rt),Dt=n(157),qt=n.n(Dt),Lt=["properties"],Bt=["properties"],Ut=["definitions","parameters","responses","securityDefinitions","components/schemas","components/responses","components/parameters","components/securitySchemes"],Vt=["schema/example","items/example"];function zt(e){var t=e[e.length-1],n=e[e.length-2],r=e.join("/");return F()(Lt).call(Lt,t)>-1&&-1===F()(Bt).call(Bt,n)||F()(Ut).call(Ut,r)>-1||_()(Vt).call(Vt,(function(e){return F()(r).call(r,e)>-1}))}function Ft(e,t){var n,r=e.split("#"),a=N()(r,2),i=a[0],c=a[1],s=Tt.a.resolve(i||"",t||"");return c?o()(n="".concat(s,"#")).call(n,c):s}var Jt="application/json, application/yaml",Wt=new RegExp("^([a-z]+://|//)","i"),Ht=Nt("JSONRefError",(function(e,t,n){this.originalError=n,Xe()(this,t||{})})),$t={},Yt=new _t.a,Kt=[function(e){return"paths"===e[0]&&"responses"===e[3]&&"content"===e[5]&&"example"===e[7]},function(e){return"paths"===e[0]&&"requestBody"===e[3]&&"content"===e[4]&&"example"===e[6]}],Gt={key:"$ref",plugin:function(e,t,n,r){var a=r.getInstance(),i=ve()(n).call(n,0,-1);if(!zt(i)&&(c=i,!_()(Kt).call(Kt,(function(e){return e(c)})))){var c,s=r.getContext(n).baseDoc;if("string"!=typeof e)return new Ht("$ref: must be a string (JSON-Ref)",{$ref:e,baseDoc:s,fullPath:n});var u,l,p,f=tn(e),d=f[0],h=f[1]||"";try{u=s||d?Qt(d,s):null}catch(t){return en(t,{pointer:h,$ref:e,basePath:u,fullPath:n})}if(function(e,t,n,r){var a,i,c=Yt.get(r);c||(c={},Yt.set(r,c));var s=function(e){if(0===e.length)return"";return"/".concat(x()(e).call(e,sn).join("/"))}(n),u=o()(a="".concat(t||"<specmap-base>","#")).call(a,e),l=s.replace(/allOf\/\d+\/?/g,""),p=r.contextTree.get([]).baseDoc;if(t==p&&un(l,e))return!0;var f="";if(_()(n).call(n,(function(e){var t,n;return f=o()(t="".concat(f,"/")).call(t,sn(e)),c[f]&&_()(n=c[f]).call(n,(function(e){return un(e,u)||un(u,e)}))})))return!0;return void(c[l]=o()(i=c[l]||[]).call(i,u))}(h,u,i,r)&&!a.useCircularStructures){var m=Ft(e,u);return e===m?null:lt.replace(n,m)}if(null==u?(p=on(h),void 0===(l=r.get(p))&&(l=new Ht("Could not resolve reference: ".concat(e),{pointer:h,$ref:e,baseDoc:s,fullPath:n}))):l=null!=(l=nn(u,h)).__value?l.__value:l.catch((function(t){throw en(t,{pointer:h,$ref:e,baseDoc:s,fullPath:n})})),l instanceof Error)return[lt.remove(n),l];var v=Ft(e,u),g=lt.replace(i,l,{$$ref:v});if(u&&u!==s)return[g,lt.context(i,{baseDoc:u})];try{if(!function(e,t){var n,r=[e];return q()(n=t.path).call(n,(function(e,t){return r.push(e[t]),e[t]}),e),a(t.value);function a(e){var t;return lt.isObject(e)&&(F()(r).call(r,e)>=0||_()(t=b()(e)).call(t,(function(t){return a(e[t])})))}}(r.state,g)||a.useCircularStructures)return g}catch(e){return null}}}},Zt=Xe()(Gt,{docCache:$t,absoluteify:Qt,clearCache:function(e){var t;void 0!==e?delete $t[e]:p()(t=b()($t)).call(t,(function(e){delete $t[e]}))},JSONRefError:Ht,wrapError:en,getDoc:rn,split:tn,extractFromDoc:nn,fetchJSON:function(e){return Object(At.fetch)(e,{headers:{Accept:Jt},loadSpec:!0}).then((function(e){return e.text()})).then((function(e){return $.a.safeLoad(e)}))},extract:an,jsonPointerToArray:on,unescapeJsonPointerToken:cn}),Xt=Zt;function Qt(e,t){if(!Wt.test(e)){var n;if(!t)throw new Ht(o()(n="Tried to resolve a relative URL, without having a basePath. path: '".concat(e,"' basePath: '")).call(n,t,"'"));return Tt.a.resolve(t,e)}return e}function en(e,t){var n,r;e&&e.response&&e.response.body?n=o()(r="".concat(e.response.body.code," ")).call(r,e.response.body.message):n=e.message;return new Ht("Could not resolve reference: ".concat(n),t,e)}function tn(e){return(e+"").split("#")}function nn(e,t){var n=$t[e];if(n&&!lt.isPromise(n))try{var r=an(t,n);return Xe()(He.a.resolve(r),{__value:r})}catch(e){return He.a.reject(e)}return rn(e).then((function(e){return an(t,e)}))}function rn(e){var t=$t[e];return t?lt.isPromise(t)?t:He.a.resolve(t):($t[e]=Zt.fetchJSON(e).then((function(t){return $t[e]=t,t})),$t[e])}function an(e,t){var n=on(e);if(n.length<1)return t;var r=lt.getIn(t,n);if(void 0===r)throw new Ht("Could not resolve pointer: ".concat(e," does not exist in document"),{pointer:e});return r}function on(e){var t;if("string"!=typeof e)throw new TypeError("Expected a string, got a ".concat(I()(e)));return"/"===e[0]&&(e=e.substr(1)),""===e?[]:x()(t=e.split("/")).call(t,cn)}function cn(e){return"string"!=typeof e?e:Pt.a.unescape(e.replace(/~1/g,"/").replace(/~0/g,"~"))}function sn(e){return Pt.a.escape(e.replace(/~/g,"~0").replace(/\//g,"~1"))}function un(e,t){if(!(n=t)||"/"===n||"#"===n)return!0;var n,r=e.charAt(t.length),a=ve()(t).call(t,-1);return 0===F()(e).call(e,t)&&(!r||"/"===r||"#"===r)&&"#"!==a}var ln={key:"allOf",plugin:function(e,t,n,r,a){if(!a.meta||!a.meta.$$ref){var i=ve()(n).call(n,0,-1);if(!zt(i)){if(!k()(e)){var c=new TypeError("allOf must be an array");return c.fullPath=n,c}var s=!1,u=a.value;p()(i).call(i,(function(e){u&&(u=u[e])})),delete(u=Je()({},u)).allOf;var l,f=[];if(f.push(r.replace(i,{})),p()(e).call(e,(function(e,t){if(!r.isObject(e)){if(s)return null;s=!0;var a=new TypeError("Elements in allOf must be objects");return a.fullPath=n,f.push(a)}f.push(r.mergeDeep(i,e));var c=function(e,t){var n,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},a=r.specmap,i=r.getBaseUrlForNodePath,c=void 0===i?function(e){var n;return a.getContext(o()(n=[]).call(n,ye()(t),ye()(e))).baseDoc}:i,s=r.targetKeys,u=void 0===s?["$ref","$$ref"]:s,l=[];return p()(n=Mt()(e)).call(n,(function(){if(V()(u).call(u,this.key)&&qt()(this.node)){var e=this.path,n=o()(t).call(t,this.path),r=Ft(this.node,c(e));l.push(a.replace(n,r))}})),l}(e,ve()(n).call(n,0,-1),{getBaseUrlForNodePath:function(e){var a;return r.getContext(o()(a=[]).call(a,ye()(n),[t],ye()(e))).baseDoc},specmap:r});f.push.apply(f,ye()(c))})),f.push(r.mergeDeep(i,u)),!u.$$ref)f.push(r.remove(o()(l=[]).call(l,i,"$$ref")));return f}}}},pn={key:"parameters",plugin:function(e,t,n,r){if(k()(e)&&e.length){var a=Xe()([],e),o=ve()(n).call(n,0,-1),i=Je()({},lt.getIn(r.spec,o));return p()(e).call(e,(function(e,t){try{a[t].default=r.parameterMacro(i,e)}catch(e){var o=new Error(e);return o.fullPath=n,o}})),lt.replace(n,a)}return lt.replace(n,e)}},fn={key:"properties",plugin:function(e,t,n,r){var a=Je()({},e);for(var o in e)try{a[o].default=r.modelPropertyMacro(a[o])}catch(e){var i=new Error(e);return i.fullPath=n,i}return lt.replace(n,a)}},dn=function(){function e(t){ne()(this,e),this.root=hn(t||{})}return ae()(e,[{key:"set",value:function(e,t){var n=this.getParent(e,!0);if(n){var r=e[e.length-1],a=n.children;a[r]?mn(a[r],t,n):a[r]=hn(t,n)}else mn(this.root,t,null)}},{key:"get",value:function(e){if((e=e||[]).length<1)return this.root.value;for(var t,n,r=this.root,a=0;a<e.length&&(n=e[a],(t=r.children)[n]);a+=1)r=t[n];return r&&r.protoValue}},{key:"getParent",value:function(e,t){var n;return!e||e.length<1?null:e.length<2?this.root:q()(n=ve()(e).call(e,0,-1)).call(n,(function(e,n){if(!e)return e;var r=e.children;return!r[n]&&t&&(r[n]=hn(null,e)),r[n]}),this.root)}}]),e}();function hn(e,t){return mn({children:{}},e,t)}function mn(e,t,n){var r;return e.value=t||{},e.protoValue=n?Je()(Je()({},n.protoValue),e.value):e.value,p()(r=b()(e.children)).call(r,(function(t){var n=e.children[t];e.children[t]=mn(n,n.value,e)})),e}var vn=function(){function e(t){var n,r,a,o,i,c,s=this;ne()(this,e),Xe()(this,{spec:"",debugLevel:"info",plugins:[],pluginHistory:{},errors:[],mutations:[],promisedPatches:[],state:{},patches:[],context:{},contextTree:new dn,showDebug:!1,allPatches:[],pluginProp:"specMap",libMethods:Xe()(Ge()(this),lt,{getInstance:function(){return s}}),allowMetaPatches:!1},t),this.get=Ye()(n=this._get).call(n,this),this.getContext=Ye()(r=this._getContext).call(r,this),this.hasRun=Ye()(a=this._hasRun).call(a,this),this.wrappedPlugins=d()(o=x()(i=this.plugins).call(i,Ye()(c=this.wrapPlugin).call(c,this))).call(o,lt.isFunction),this.patches.push(lt.add([],this.spec)),this.patches.push(lt.context([],this.context)),this.updatePatches(this.patches)}return ae()(e,null,[{key:"getPluginName",value:function(e){return e.pluginName}},{key:"getPatchesOfType",value:function(e,t){return d()(e).call(e,t)}}]),ae()(e,[{key:"debug",value:function(e){if(this.debugLevel===e){for(var t,n=arguments.length,r=new Array(n>1?n-1:0),a=1;a<n;a++)r[a-1]=arguments[a];(t=console).log.apply(t,r)}}},{key:"verbose",value:function(e){if("verbose"===this.debugLevel){for(var t,n,r=arguments.length,a=new Array(r>1?r-1:0),i=1;i<r;i++)a[i-1]=arguments[i];(t=console).log.apply(t,o()(n=["[".concat(e,"]   ")]).call(n,a))}}},{key:"wrapPlugin",value:function(e,t){var n,r,a,i=this.pathDiscriminator,s=null;return e[this.pluginProp]?(s=e,n=e[this.pluginProp]):lt.isFunction(e)?n=e:lt.isObject(e)&&(r=e,a=function(e,t){return!k()(e)||w()(e).call(e,(function(e,n){return e===t[n]}))},n=c.a.mark((function e(t,n){var s,u,l,p,f,h;return c.a.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:h=function(e,t,l){var p,f,d,m,v,g,y,E,x,S,w,j,C;return c.a.wrap((function(c){for(;;)switch(c.prev=c.next){case 0:if(lt.isObject(e)){c.next=6;break}if(r.key!==t[t.length-1]){c.next=4;break}return c.next=4,r.plugin(e,r.key,t,n);case 4:c.next=30;break;case 6:p=t.length-1,f=t[p],d=F()(t).call(t,"properties"),m="properties"===f&&p===d,v=n.allowMetaPatches&&u[e.$$ref],g=0,y=b()(e);case 12:if(!(g<y.length)){c.next=30;break}if(E=y[g],x=e[E],S=o()(t).call(t,E),w=lt.isObject(x),j=e.$$ref,v){c.next=22;break}if(!w){c.next=22;break}return n.allowMetaPatches&&j&&(u[j]=!0),c.delegateYield(h(x,S,l),"t0",22);case 22:if(m||E!==r.key){c.next=27;break}if(C=a(i,t),i&&!C){c.next=27;break}return c.next=27,r.plugin(x,E,S,n,l);case 27:g++,c.next=12;break;case 30:case"end":return c.stop()}}),s)},s=c.a.mark(h),u={},l=m()(d()(t).call(t,lt.isAdditiveMutation)),e.prev=4,l.s();case 6:if((p=l.n()).done){e.next=11;break}return f=p.value,e.delegateYield(h(f.value,f.path,f),"t0",9);case 9:e.next=6;break;case 11:e.next=16;break;case 13:e.prev=13,e.t1=e.catch(4),l.e(e.t1);case 16:return e.prev=16,l.f(),e.finish(16);case 19:case"end":return e.stop()}}),e,null,[[4,13,16,19]])}))),Xe()(Ye()(n).call(n,s),{pluginName:e.name||t,isGenerator:lt.isGenerator(n)})}},{key:"nextPlugin",value:function(){var e=this;return et()(this.wrappedPlugins,(function(t){return e.getMutationsForPlugin(t).length>0}))}},{key:"nextPromisedPatch",value:function(){var e;if(this.promisedPatches.length>0)return He.a.race(x()(e=this.promisedPatches).call(e,(function(e){return e.value})))}},{key:"getPluginHistory",value:function(e){var t=this.constructor.getPluginName(e);return this.pluginHistory[t]||[]}},{key:"getPluginRunCount",value:function(e){return this.getPluginHistory(e).length}},{key:"getPluginHistoryTip",value:function(e){var t=this.getPluginHistory(e);return t&&t[t.length-1]||{}}},{key:"getPluginMutationIndex",value:function(e){var t=this.getPluginHistoryTip(e).mutationIndex;return"number"!=typeof t?-1:t}},{key:"updatePluginHistory",value:function(e,t){var n=this.constructor.getPluginName(e);this.pluginHistory[n]=this.pluginHistory[n]||[],this.pluginHistory[n].push(t)}},{key:"updatePatches",value:function(e){var t,n=this;p()(t=lt.normalizeArray(e)).call(t,(function(e){if(e instanceof Error)n.errors.push(e);else try{if(!lt.isObject(e))return void n.debug("updatePatches","Got a non-object patch",e);if(n.showDebug&&n.allPatches.push(e),lt.isPromise(e.value))return n.promisedPatches.push(e),void n.promisedPatchThen(e);if(lt.isContextPatch(e))return void n.setContext(e.path,e.value);if(lt.isMutation(e))return void n.updateMutations(e)}catch(e){console.error(e),n.errors.push(e)}}))}},{key:"updateMutations",value:function(e){"object"===I()(e.value)&&!k()(e.value)&&this.allowMetaPatches&&(e.value=Je()({},e.value));var t=lt.applyPatch(this.state,e,{allowMetaPatches:this.allowMetaPatches});t&&(this.mutations.push(e),this.state=t)}},{key:"removePromisedPatch",value:function(e){var t,n,r=F()(t=this.promisedPatches).call(t,e);r<0?this.debug("Tried to remove a promisedPatch that isn't there!"):ze()(n=this.promisedPatches).call(n,r,1)}},{key:"promisedPatchThen",value:function(e){var t=this;return e.value=e.value.then((function(n){var r=Je()(Je()({},e),{},{value:n});t.removePromisedPatch(e),t.updatePatches(r)})).catch((function(n){t.removePromisedPatch(e),t.updatePatches(n)})),e.value}},{key:"getMutations",value:function(e,t){var n;return e=e||0,"number"!=typeof t&&(t=this.mutations.length),ve()(n=this.mutations).call(n,e,t)}},{key:"getCurrentMutations",value:function(){return this.getMutationsForPlugin(this.getCurrentPlugin())}},{key:"getMutationsForPlugin",value:function(e){var t=this.getPluginMutationIndex(e);return this.getMutations(t+1)}},{key:"getCurrentPlugin",value:function(){return this.currentPlugin}},{key:"getLib",value:function(){return this.libMethods}},{key:"_get",value:function(e){return lt.getIn(this.state,e)}},{key:"_getContext",value:function(e){return this.contextTree.get(e)}},{key:"setContext",value:function(e,t){return this.contextTree.set(e,t)}},{key:"_hasRun",value:function(e){return this.getPluginRunCount(this.getCurrentPlugin())>(e||0)}},{key:"dispatch",value:function(){var e,t=this,n=this,r=this.nextPlugin();if(!r){var a=this.nextPromisedPatch();if(a)return a.then((function(){return t.dispatch()})).catch((function(){return t.dispatch()}));var i={spec:this.state,errors:this.errors};return this.showDebug&&(i.patches=this.allPatches),He.a.resolve(i)}if(n.pluginCount=n.pluginCount||{},n.pluginCount[r]=(n.pluginCount[r]||0)+1,n.pluginCount[r]>100)return He.a.resolve({spec:n.state,errors:o()(e=n.errors).call(e,new Error("We've reached a hard limit of ".concat(100," plugin runs")))});if(r!==this.currentPlugin&&this.promisedPatches.length){var c,s=x()(c=this.promisedPatches).call(c,(function(e){return e.value}));return He.a.all(x()(s).call(s,(function(e){return e.then(nt.a,nt.a)}))).then((function(){return t.dispatch()}))}return function(){n.currentPlugin=r;var e=n.getCurrentMutations(),t=n.mutations.length-1;try{if(r.isGenerator){var a,o=m()(r(e,n.getLib()));try{for(o.s();!(a=o.n()).done;){u(a.value)}}catch(e){o.e(e)}finally{o.f()}}else{u(r(e,n.getLib()))}}catch(e){console.error(e),u([Xe()(Ge()(e),{plugin:r})])}finally{n.updatePluginHistory(r,{mutationIndex:t})}return n.dispatch()}();function u(e){e&&(e=lt.fullyNormalizeArray(e),n.updatePatches(e,r))}}}]),e}();var gn={refs:Xt,allOf:ln,parameters:pn,properties:fn},yn=n(53);function bn(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.requestInterceptor,r=t.responseInterceptor,a=e.withCredentials?"include":"same-origin";return function(t){return e({url:t,loadSpec:!0,requestInterceptor:n,responseInterceptor:r,headers:{Accept:Jt},credentials:a}).then((function(e){return e.body}))}}function En(e){var t=e.fetch,n=e.spec,r=e.url,a=e.mode,o=e.allowMetaPatches,i=void 0===o||o,s=e.pathDiscriminator,l=e.modelPropertyMacro,p=e.parameterMacro,f=e.requestInterceptor,d=e.responseInterceptor,h=e.skipNormalization,m=e.useCircularStructures,v=e.http,g=e.baseDoc;return g=g||r,v=t||v||Ce,n?y(n):bn(v,{requestInterceptor:f,responseInterceptor:d})(g).then(y);function y(e){g&&(gn.refs.docCache[g]=e),gn.refs.fetchJSON=bn(v,{requestInterceptor:f,responseInterceptor:d});var t,n=[gn.refs];return"function"==typeof p&&n.push(gn.parameters),"function"==typeof l&&n.push(gn.properties),"strict"!==a&&n.push(gn.allOf),(t={spec:e,context:{baseDoc:g},plugins:n,allowMetaPatches:i,pathDiscriminator:s,parameterMacro:p,modelPropertyMacro:l,useCircularStructures:m},new vn(t).dispatch()).then(h?function(){var e=u()(c.a.mark((function e(t){return c.a.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return e.abrupt("return",t);case 1:case"end":return e.stop()}}),e)})));return function(t){return e.apply(this,arguments)}}():yn.d)}}var xn=n(49),Sn=n.n(xn),wn=n(41),jn=n.n(wn),Cn=n(220),On=n.n(Cn),_n=n(48),An=n.n(_n),kn=n(390),Pn=n.n(kn),In={body:function(e){var t=e.req,n=e.value;t.body=n},header:function(e){var t=e.req,n=e.parameter,r=e.value;t.headers=t.headers||{},void 0!==r&&(t.headers[n.name]=r)},query:function(e){var t,n=e.req,r=e.value,a=e.parameter;n.query=n.query||{},!1===r&&"boolean"===a.type&&(r="false");0===r&&F()(t=["number","integer"]).call(t,a.type)>-1&&(r="0");if(r)n.query[a.name]={collectionFormat:a.collectionFormat,value:r};else if(a.allowEmptyValue&&void 0!==r){var o=a.name;n.query[o]=n.query[o]||{},n.query[o].allowEmptyValue=!0}},path:function(e){var t=e.req,n=e.value,r=e.parameter;t.url=t.url.split("{".concat(r.name,"}")).join(encodeURIComponent(n))},formData:function(e){var t=e.req,n=e.value,r=e.parameter;(n||r.allowEmptyValue)&&(t.form=t.form||{},t.form[r.name]={value:n,allowEmptyValue:r.allowEmptyValue,collectionFormat:r.collectionFormat})}};function Tn(e,t){return V()(t).call(t,"application/json")?"string"==typeof e?e:C()(e):e.toString()}function Nn(e){var t=e.req,n=e.value,r=e.parameter,a=r.name,o=r.style,i=r.explode,c=r.content;if(c){var s=b()(c)[0];t.url=t.url.split("{".concat(a,"}")).join(Se(Tn(n,s),{escape:!0}))}else{var u=we({key:r.name,value:n,style:o||"simple",explode:i||!1,escape:!0});t.url=t.url.split("{".concat(a,"}")).join(u)}}function Rn(e){var t=e.req,n=e.value,r=e.parameter;if(t.query=t.query||{},r.content){var a=b()(r.content)[0];t.query[r.name]=Tn(n,a)}else if(!1===n&&(n="false"),0===n&&(n="0"),n)t.query[r.name]={value:n,serializationOption:K()(r,["style","explode","allowReserved"])};else if(r.allowEmptyValue&&void 0!==n){var o=r.name;t.query[o]=t.query[o]||{},t.query[o].allowEmptyValue=!0}}var Mn=["accept","authorization","content-type"];function Dn(e){var t=e.req,n=e.parameter,r=e.value;if(t.headers=t.headers||{},!(F()(Mn).call(Mn,n.name.toLowerCase())>-1))if(n.content){var a=b()(n.content)[0];t.headers[n.name]=Tn(r,a)}else void 0!==r&&(t.headers[n.name]=we({key:n.name,value:r,style:n.style||"simple",explode:void 0!==n.explode&&n.explode,escape:!1}))}function qn(e){var t=e.req,n=e.parameter,r=e.value;t.headers=t.headers||{};var a=I()(r);if(n.content){var i,c=b()(n.content)[0];t.headers.Cookie=o()(i="".concat(n.name,"=")).call(i,Tn(r,c))}else if("undefined"!==a){var s="object"===a&&!k()(r)&&n.explode?"":"".concat(n.name,"=");t.headers.Cookie=s+we({key:n.name,value:r,escape:!1,style:n.style||"form",explode:void 0!==n.explode&&n.explode})}}var Ln=n(161),Bn=n.n(Ln),Un=n(162),Vn=n.n(Un);function zn(e,t){var n=e.operation,r=e.requestBody,a=e.securities,i=e.spec,c=e.attachContentTypeForEmptyPayload,s=e.requestContentType;t=function(e){var t=e.request,n=e.securities,r=void 0===n?{}:n,a=e.operation,i=void 0===a?{}:a,c=e.spec,s=Bn()({},t),u=r.authorized,l=void 0===u?{}:u,f=i.security||c.security||[],d=l&&!!b()(l).length,h=jn()(c,["components","securitySchemes"])||{};if(s.headers=s.headers||{},s.query=s.query||{},!b()(r).length||!d||!f||k()(i.security)&&!i.security.length)return t;return p()(f).call(f,(function(e){var t;p()(t=b()(e)).call(t,(function(e){var t=l[e],n=h[e];if(t){var r=t.value||t,a=n.type;if(t)if("apiKey"===a)"query"===n.in&&(s.query[n.name]=r),"header"===n.in&&(s.headers[n.name]=r),"cookie"===n.in&&(s.cookies[n.name]=r);else if("http"===a){if(/^basic$/i.test(n.scheme)){var i,c=r.username||"",u=r.password||"",p=Vn()(o()(i="".concat(c,":")).call(i,u));s.headers.Authorization="Basic ".concat(p)}/^bearer$/i.test(n.scheme)&&(s.headers.Authorization="Bearer ".concat(r))}else if("oauth2"===a){var f,d=t.token||{},m=d[n["x-tokenName"]||"access_token"],v=d.token_type;v&&"bearer"!==v.toLowerCase()||(v="Bearer"),s.headers.Authorization=o()(f="".concat(v," ")).call(f,m)}}}))})),s}({request:t,securities:a,operation:n,spec:i});var u=n.requestBody||{},l=b()(u.content||{}),f=s&&F()(l).call(l,s)>-1;if(r||c){if(s&&f)t.headers["Content-Type"]=s;else if(!s){var d=l[0];d&&(t.headers["Content-Type"]=d,s=d)}}else s&&f&&(t.headers["Content-Type"]=s);if(r)if(s){if(F()(l).call(l,s)>-1)if("application/x-www-form-urlencoded"===s||"multipart/form-data"===s)if("object"===I()(r)){var h,m=(u.content[s]||{}).encoding||{};t.form={},p()(h=b()(r)).call(h,(function(e){t.form[e]={value:r[e],encoding:m[e]||{}}}))}else t.form=r;else t.body=r}else t.body=r;return t}function Fn(e,t){var n,r,a=e.spec,i=e.operation,c=e.securities,s=e.requestContentType,u=e.attachContentTypeForEmptyPayload;if((t=function(e){var t=e.request,n=e.securities,r=void 0===n?{}:n,a=e.operation,i=void 0===a?{}:a,c=e.spec,s=Bn()({},t),u=r.authorized,l=void 0===u?{}:u,f=r.specSecurity,d=void 0===f?[]:f,h=i.security||d,m=l&&!!b()(l).length,v=c.securityDefinitions;if(s.headers=s.headers||{},s.query=s.query||{},!b()(r).length||!m||!h||k()(i.security)&&!i.security.length)return t;return p()(h).call(h,(function(e){var t;p()(t=b()(e)).call(t,(function(e){var t=l[e];if(t){var n=t.token,r=t.value||t,a=v[e],i=a.type,c=a["x-tokenName"]||"access_token",u=n&&n[c],p=n&&n.token_type;if(t)if("apiKey"===i){var f="query"===a.in?"query":"headers";s[f]=s[f]||{},s[f][a.name]=r}else if("basic"===i)if(r.header)s.headers.authorization=r.header;else{var d,h=r.username||"",m=r.password||"";r.base64=Vn()(o()(d="".concat(h,":")).call(d,m)),s.headers.authorization="Basic ".concat(r.base64)}else if("oauth2"===i&&u){var g;p=p&&"bearer"!==p.toLowerCase()?p:"Bearer",s.headers.authorization=o()(g="".concat(p," ")).call(g,u)}}}))})),s}({request:t,securities:c,operation:i,spec:a})).body||t.form||u)if(s)t.headers["Content-Type"]=s;else if(k()(i.consumes)){var l=N()(i.consumes,1);t.headers["Content-Type"]=l[0]}else if(k()(a.consumes)){var f=N()(a.consumes,1);t.headers["Content-Type"]=f[0]}else i.parameters&&d()(n=i.parameters).call(n,(function(e){return"file"===e.type})).length?t.headers["Content-Type"]="multipart/form-data":i.parameters&&d()(r=i.parameters).call(r,(function(e){return"formData"===e.in})).length&&(t.headers["Content-Type"]="application/x-www-form-urlencoded");else if(s){var h,m,v=i.parameters&&d()(h=i.parameters).call(h,(function(e){return"body"===e.in})).length>0,g=i.parameters&&d()(m=i.parameters).call(m,(function(e){return"formData"===e.in})).length>0;(v||g)&&(t.headers["Content-Type"]=s)}return t}var Jn=function(e){return k()(e)?e:[]},Wn=Nt("OperationNotFoundError",(function(e,t,n){this.originalError=n,Xe()(this,t||{})})),Hn={buildRequest:Yn};function $n(e){var t=e.http,n=e.fetch,r=e.spec,a=e.operationId,o=e.pathName,i=e.method,c=e.parameters,s=e.securities,u=Sn()(e,["http","fetch","spec","operationId","pathName","method","parameters","securities"]),l=t||n||Ce;o&&i&&!a&&(a=Object(yn.c)(o,i));var p=Hn.buildRequest(Je()({spec:r,operationId:a,parameters:c,securities:s,http:l},u));return p.body&&(On()(p.body)||An()(p.body))&&(p.body=C()(p.body)),l(p)}function Yn(e){var t,n,a=e.spec,i=e.operationId,c=e.responseContentType,s=e.scheme,u=e.requestInterceptor,l=e.responseInterceptor,f=e.contextUrl,h=e.userFetch,m=e.server,v=e.serverVariables,g=e.http,y=e.parameters,E=e.parameterBuilders,S=Object(yn.b)(a);E||(E=S?r:In);var w={url:"",credentials:g&&g.withCredentials?"include":"same-origin",headers:{},cookies:{}};u&&(w.requestInterceptor=u),l&&(w.responseInterceptor=l),h&&(w.userFetch=h);var j=Object(yn.a)(a,i);if(!j)throw new Wn("Operation ".concat(i," not found"));var C,O=j.operation,_=void 0===O?{}:O,A=j.method,P=j.pathName;if(w.url+=(C={spec:a,scheme:s,contextUrl:f,server:m,serverVariables:v,pathName:P,method:A},Object(yn.b)(C.spec)?function(e){var t=e.spec,n=e.pathName,r=e.method,a=e.server,i=e.contextUrl,c=e.serverVariables,s=void 0===c?{}:c,u=jn()(t,["paths",n,(r||"").toLowerCase(),"servers"])||jn()(t,["paths",n,"servers"])||jn()(t,["servers"]),l="",f=null;if(a&&u&&u.length){var d=x()(u).call(u,(function(e){return e.url}));F()(d).call(d,a)>-1&&(l=a,f=u[F()(d).call(d,a)])}if(!l&&u&&u.length){l=u[0].url;var h=N()(u,1);f=h[0]}if(F()(l).call(l,"{")>-1){var m=function(e){for(var t,n=[],r=/{([^}]+)}/g;t=r.exec(e);)n.push(t[1]);return n}(l);p()(m).call(m,(function(e){if(f.variables&&f.variables[e]){var t=f.variables[e],n=s[e]||t.default,r=new RegExp("{".concat(e,"}"),"g");l=l.replace(r,n)}}))}return function(){var e,t,n=arguments.length>0&&void 0!==arguments[0]?arguments[0]:"",r=arguments.length>1&&void 0!==arguments[1]?arguments[1]:"",a=Tt.a.parse(n),i=Tt.a.parse(r),c=Kn(a.protocol)||Kn(i.protocol)||"",s=a.host||i.host,u=a.pathname||"";return"/"===(e=c&&s?o()(t="".concat(c,"://")).call(t,s+u):u)[e.length-1]?ve()(e).call(e,0,-1):e}(l,i)}(C):function(e){var t,n,r=e.spec,a=e.scheme,i=e.contextUrl,c=void 0===i?"":i,s=Tt.a.parse(c),u=k()(r.schemes)?r.schemes[0]:null,l=a||u||Kn(s.protocol)||"http",p=r.host||s.host||"",f=r.basePath||"";return"/"===(t=l&&p?o()(n="".concat(l,"://")).call(n,p+f):f)[t.length-1]?ve()(t).call(t,0,-1):t}(C)),!i)return delete w.cookies,w;w.url+=P,w.method="".concat(A).toUpperCase(),y=y||{};var I=a.paths[P]||{};c&&(w.headers.accept=c);var T=function(e){var t,n={};p()(e).call(e,(function(e){n[e.in]||(n[e.in]={}),n[e.in][e.name]=e}));var r=[];return p()(t=b()(n)).call(t,(function(e){var t;p()(t=b()(n[e])).call(t,(function(t){r.push(n[e][t])}))})),r}(o()(t=o()(n=[]).call(n,Jn(_.parameters))).call(t,Jn(I.parameters)));p()(T).call(T,(function(e){var t,n,r=E[e.in];if("body"===e.in&&e.schema&&e.schema.properties&&(t=y),void 0===(t=e&&e.name&&y[e.name]))t=e&&e.name&&y[o()(n="".concat(e.in,".")).call(n,e.name)];else if(function(e,t){return d()(t).call(t,(function(t){return t.name===e}))}(e.name,T).length>1){var i;console.warn(o()(i="Parameter '".concat(e.name,"' is ambiguous because the defined spec has more than one parameter with the name: '")).call(i,e.name,"' and the passed-in parameter values did not define an 'in' value."))}if(null!==t){if(void 0!==e.default&&void 0===t&&(t=e.default),void 0===t&&e.required&&!e.allowEmptyValue)throw new Error("Required parameter ".concat(e.name," is not provided"));if(S&&e.schema&&"object"===e.schema.type&&"string"==typeof t)try{t=JSON.parse(t)}catch(e){throw new Error("Could not parse object parameter value string as JSON")}r&&r({req:w,parameter:e,value:t,operation:_,spec:a})}}));var R=Je()(Je()({},e),{},{operation:_});if((w=S?zn(R,w):Fn(R,w)).cookies&&b()(w.cookies).length){var M,D=q()(M=b()(w.cookies)).call(M,(function(e,t){var n=w.cookies[t];return e+(e?"&":"")+Pn.a.serialize(t,n)}),"");w.headers.Cookie=D}return w.cookies&&delete w.cookies,Ue(w),w}var Kn=function(e){return e?e.replace(/\W/g,""):null};function Gn(e,t){return Zn.apply(this,arguments)}function Zn(){return(Zn=u()(c.a.mark((function e(t,n){var r,a,o,i,s,u,l,p,f,d,h,m,v=arguments;return c.a.wrap((function(e){for(;;)switch(e.prev=e.next){case 0:return r=v.length>2&&void 0!==v[2]?v[2]:{},a=r.returnEntireTree,o=r.baseDoc,i=r.requestInterceptor,s=r.responseInterceptor,u=r.parameterMacro,l=r.modelPropertyMacro,p=r.useCircularStructures,f={pathDiscriminator:n,baseDoc:o,requestInterceptor:i,responseInterceptor:s,parameterMacro:u,modelPropertyMacro:l,useCircularStructures:p},d=Object(yn.d)({spec:t}),h=d.spec,e.next=6,En(Je()(Je()({},f),{},{spec:h,allowMetaPatches:!0,skipNormalization:!0}));case 6:return m=e.sent,!a&&k()(n)&&n.length&&(m.spec=jn()(m.spec,n)||null),e.abrupt("return",m);case 9:case"end":return e.stop()}}),e)})))).apply(this,arguments)}var Xn=n(223);t.default=function(e){var t,n,r,a=e.configs,i=e.getConfigs;return{fn:{fetch:(t=Ce,n=a.preFetch,r=a.postFetch,r=r||function(e){return e},n=n||function(e){return e},function(e){return"string"==typeof e&&(e={url:e}),je.mergeInQueryOrForm(e),e=n(e),r(t(e))}),buildRequest:Yn,execute:$n,resolve:En,resolveSubtree:function(e,t,n){var r;if(void 0===n){var a=i();n={modelPropertyMacro:a.modelPropertyMacro,parameterMacro:a.parameterMacro,requestInterceptor:a.requestInterceptor,responseInterceptor:a.responseInterceptor}}for(var c=arguments.length,s=new Array(c>3?c-3:0),u=3;u<c;u++)s[u-3]=arguments[u];return Gn.apply(void 0,o()(r=[e,t,n]).call(r,s))},serializeRes:ke,opId:yn.e},statePlugins:{configs:{wrapActions:Xn}}}}},function(e,t,n){"use strict";n.r(t),n.d(t,"default",(function(){return u}));var r=n(126),a=n(112),o=n(230),i=n(231),c=n(232),s={getLocalConfig:function(){return Object(r.parseYamlConfig)('---\nurl: "https://petstore.swagger.io/v2/swagger.json"\ndom_id: "#swagger-ui"\nvalidatorUrl: "https://validator.swagger.io/validator"\n')}};function u(){return{statePlugins:{spec:{actions:o,selectors:s},configs:{reducers:c.default,actions:a,selectors:i}}}}},function(e,t,n){var r=n(327),a=n(145),o=n(603),i=n(48),c=n(341);e.exports=function(e,t,n){var s=i(e)?r:o;return n&&c(e,t,n)&&(t=void 0),s(e,a(t,3))}},function(e,t){e.exports=require("memoizee")},function(e,t,n){e.exports=n(637)},function(e,t,n){e.exports=n(652)},function(e,t,n){var r=n(354);e.exports=function(e,t,n){return null==e?e:r(e,t,n)}},function(e,t){e.exports=require("react-redux")},function(e,t,n){e.exports=n(721)},function(e,t){e.exports=function(){}},function(e,t){e.exports=require("querystring-browser")},function(e,t,n){var r=n(727),a=n(318),o=n(338),i=n(77);e.exports=function(e,t,n){return e=i(e),n=null==n?0:r(o(n),0,e.length),t=a(t),e.slice(n,n+t.length)==t}},function(e,t){e.exports=require("react-debounce-input")},function(e,t,n){var r=n(313),a=n(305),o=n(139),i=n(316);e.exports=function(e){return r(e)||a(e)||o(e)||i()}},function(e,t,n){var r=n(43),a=n(33),o=n(172);e.exports=!r&&!a((function(){return 7!=Object.defineProperty(o("div"),"a",{get:function(){return 7}}).a}))},function(e,t,n){var r=n(33),a=/#|\.prototype\./,o=function(e,t){var n=c[i(e)];return n==u||n!=s&&("function"==typeof t?r(t):!!t)},i=o.normalize=function(e){return String(e).replace(a,".").toLowerCase()},c=o.data={},s=o.NATIVE="N",u=o.POLYFILL="P";e.exports=o},function(e,t,n){n(411);var r=n(31);e.exports=r.Object.keys},function(e,t,n){var r=n(46),a=n(59),o=n(173).indexOf,i=n(117);e.exports=function(e,t){var n,c=a(e),s=0,u=[];for(n in c)!r(i,n)&&r(c,n)&&u.push(n);for(;t.length>s;)r(c,n=t[s++])&&(~o(u,n)||u.push(n));return u}},function(e,t,n){n(44)("iterator")},function(e,t,n){var r=n(37),a=n(415),o="__core-js_shared__",i=r[o]||a(o,{});e.exports=i},function(e,t,n){var r=n(178);e.exports=r&&!Symbol.sham&&"symbol"==typeof Symbol.iterator},function(e,t,n){var r=n(116),a=n(103),o=function(e){return function(t,n){var o,i,c=String(a(t)),s=r(n),u=c.length;return s<0||s>=u?e?"":void 0:(o=c.charCodeAt(s))<55296||o>56319||s+1===u||(i=c.charCodeAt(s+1))<56320||i>57343?e?c.charAt(s):o:e?c.slice(s,s+2):i-56320+(o-55296<<10)+65536}};e.exports={codeAt:o(!1),charAt:o(!0)}},function(e,t,n){var r=n(37),a=n(286),o=r.WeakMap;e.exports="function"==typeof o&&/native code/.test(a(o))},function(e,t,n){var r=n(282),a=Function.toString;"function"!=typeof r.inspectSource&&(r.inspectSource=function(e){return a.call(e)}),e.exports=r.inspectSource},function(e,t,n){"use strict";var r=n(288).IteratorPrototype,a=n(92),o=n(89),i=n(73),c=n(93),s=function(){return this};e.exports=function(e,t,n){var u=t+" Iterator";return e.prototype=a(r,{next:o(1,n)}),i(e,u,!1,!0),c[u]=s,e}},function(e,t,n){"use strict";var r,a,o,i=n(118),c=n(60),s=n(46),u=n(36),l=n(80),p=u("iterator"),f=!1;[].keys&&("next"in(o=[].keys())?(a=i(i(o)))!==Object.prototype&&(r=a):f=!0),null==r&&(r={}),l||s(r,p)||c(r,p,(function(){return this})),e.exports={IteratorPrototype:r,BUGGY_SAFARI_ITERATORS:f}},function(e,t,n){var r=n(33);e.exports=!r((function(){function e(){}return e.prototype.constructor=null,Object.getPrototypeOf(new e)!==e.prototype}))},function(e,t,n){var r=n(61);e.exports=r("document","documentElement")},function(e,t,n){"use strict";var r=n(24),a=n(33),o=n(120),i=n(40),c=n(62),s=n(68),u=n(121),l=n(184),p=n(122),f=n(36),d=n(185),h=f("isConcatSpreadable"),m=9007199254740991,v="Maximum allowed index exceeded",g=d>=51||!a((function(){var e=[];return e[h]=!1,e.concat()[0]!==e})),y=p("concat"),b=function(e){if(!i(e))return!1;var t=e[h];return void 0!==t?!!t:o(e)};r({target:"Array",proto:!0,forced:!g||!y},{concat:function(e){var t,n,r,a,o,i=c(this),p=l(i,0),f=0;for(t=-1,r=arguments.length;t<r;t++)if(b(o=-1===t?i:arguments[t])){if(f+(a=s(o.length))>m)throw TypeError(v);for(n=0;n<a;n++,f++)n in o&&u(p,f,o[n])}else{if(f>=m)throw TypeError(v);u(p,f++,o)}return p.length=f,p}})},function(e,t,n){"use strict";var r=n(24),a=n(37),o=n(61),i=n(80),c=n(43),s=n(178),u=n(283),l=n(33),p=n(46),f=n(120),d=n(40),h=n(47),m=n(62),v=n(59),g=n(134),y=n(89),b=n(92),E=n(115),x=n(187),S=n(421),w=n(188),j=n(88),C=n(55),O=n(132),_=n(60),A=n(94),k=n(177),P=n(136),I=n(117),T=n(135),N=n(36),R=n(176),M=n(44),D=n(73),q=n(63),L=n(75).forEach,B=P("hidden"),U="Symbol",V=N("toPrimitive"),z=q.set,F=q.getterFor(U),J=Object.prototype,W=a.Symbol,H=o("JSON","stringify"),$=j.f,Y=C.f,K=S.f,G=O.f,Z=k("symbols"),X=k("op-symbols"),Q=k("string-to-symbol-registry"),ee=k("symbol-to-string-registry"),te=k("wks"),ne=a.QObject,re=!ne||!ne.prototype||!ne.prototype.findChild,ae=c&&l((function(){return 7!=b(Y({},"a",{get:function(){return Y(this,"a",{value:7}).a}})).a}))?function(e,t,n){var r=$(J,t);r&&delete J[t],Y(e,t,n),r&&e!==J&&Y(J,t,r)}:Y,oe=function(e,t){var n=Z[e]=b(W.prototype);return z(n,{type:U,tag:e,description:t}),c||(n.description=t),n},ie=u?function(e){return"symbol"==typeof e}:function(e){return Object(e)instanceof W},ce=function(e,t,n){e===J&&ce(X,t,n),h(e);var r=g(t,!0);return h(n),p(Z,r)?(n.enumerable?(p(e,B)&&e[B][r]&&(e[B][r]=!1),n=b(n,{enumerable:y(0,!1)})):(p(e,B)||Y(e,B,y(1,{})),e[B][r]=!0),ae(e,r,n)):Y(e,r,n)},se=function(e,t){h(e);var n=v(t),r=E(n).concat(fe(n));return L(r,(function(t){c&&!ue.call(n,t)||ce(e,t,n[t])})),e},ue=function(e){var t=g(e,!0),n=G.call(this,t);return!(this===J&&p(Z,t)&&!p(X,t))&&(!(n||!p(this,t)||!p(Z,t)||p(this,B)&&this[B][t])||n)},le=function(e,t){var n=v(e),r=g(t,!0);if(n!==J||!p(Z,r)||p(X,r)){var a=$(n,r);return!a||!p(Z,r)||p(n,B)&&n[B][r]||(a.enumerable=!0),a}},pe=function(e){var t=K(v(e)),n=[];return L(t,(function(e){p(Z,e)||p(I,e)||n.push(e)})),n},fe=function(e){var t=e===J,n=K(t?X:v(e)),r=[];return L(n,(function(e){!p(Z,e)||t&&!p(J,e)||r.push(Z[e])})),r};(s||(A((W=function(){if(this instanceof W)throw TypeError("Symbol is not a constructor");var e=arguments.length&&void 0!==arguments[0]?String(arguments[0]):void 0,t=T(e),n=function(e){this===J&&n.call(X,e),p(this,B)&&p(this[B],t)&&(this[B][t]=!1),ae(this,t,y(1,e))};return c&&re&&ae(J,t,{configurable:!0,set:n}),oe(t,e)}).prototype,"toString",(function(){return F(this).tag})),A(W,"withoutSetter",(function(e){return oe(T(e),e)})),O.f=ue,C.f=ce,j.f=le,x.f=S.f=pe,w.f=fe,R.f=function(e){return oe(N(e),e)},c&&(Y(W.prototype,"description",{configurable:!0,get:function(){return F(this).description}}),i||A(J,"propertyIsEnumerable",ue,{unsafe:!0}))),r({global:!0,wrap:!0,forced:!s,sham:!s},{Symbol:W}),L(E(te),(function(e){M(e)})),r({target:U,stat:!0,forced:!s},{for:function(e){var t=String(e);if(p(Q,t))return Q[t];var n=W(t);return Q[t]=n,ee[n]=t,n},keyFor:function(e){if(!ie(e))throw TypeError(e+" is not a symbol");if(p(ee,e))return ee[e]},useSetter:function(){re=!0},useSimple:function(){re=!1}}),r({target:"Object",stat:!0,forced:!s,sham:!c},{create:function(e,t){return void 0===t?b(e):se(b(e),t)},defineProperty:ce,defineProperties:se,getOwnPropertyDescriptor:le}),r({target:"Object",stat:!0,forced:!s},{getOwnPropertyNames:pe,getOwnPropertySymbols:fe}),r({target:"Object",stat:!0,forced:l((function(){w.f(1)}))},{getOwnPropertySymbols:function(e){return w.f(m(e))}}),H)&&r({target:"JSON",stat:!0,forced:!s||l((function(){var e=W();return"[null]"!=H([e])||"{}"!=H({a:e})||"{}"!=H(Object(e))}))},{stringify:function(e,t,n){for(var r,a=[e],o=1;arguments.length>o;)a.push(arguments[o++]);if(r=t,(d(t)||void 0!==e)&&!ie(e))return f(t)||(t=function(e,t){if("function"==typeof r&&(t=r.call(this,e,t)),!ie(t))return t}),a[1]=t,H.apply(null,a)}});W.prototype[V]||_(W.prototype,V,W.prototype.valueOf),D(W,U),I[B]=!0},function(e,t,n){var r=n(443),a=Array.prototype;e.exports=function(e){var t=e.filter;return e===a||e instanceof Array&&t===a.filter?r:t}},function(e,t,n){n(458);var r=n(31);e.exports=r.Array.isArray},function(e,t,n){n(460);var r=n(31).Object,a=e.exports=function(e,t,n){return r.defineProperty(e,t,n)};r.defineProperty.sham&&(a.sham=!0)},function(e,t,n){var r=n(462),a=Array.prototype;e.exports=function(e){var t=e.slice;return e===a||e instanceof Array&&t===a.slice?r:t}},function(e,t,n){n(465);var r=n(31);e.exports=r.Object.assign},function(e,t,n){"use strict";var r=n(43),a=n(33),o=n(115),i=n(188),c=n(132),s=n(62),u=n(133),l=Object.assign,p=Object.defineProperty;e.exports=!l||a((function(){if(r&&1!==l({b:1},l(p({},"a",{enumerable:!0,get:function(){p(this,"b",{value:3,enumerable:!1})}}),{b:2})).b)return!0;var e={},t={},n=Symbol(),a="abcdefghijklmnopqrst";return e[n]=7,a.split("").forEach((function(e){t[e]=e})),7!=l({},e)[n]||o(l({},t)).join("")!=a}))?function(e,t){for(var n=s(e),a=arguments.length,l=1,p=i.f,f=c.f;a>l;)for(var d,h=u(arguments[l++]),m=p?o(h).concat(p(h)):o(h),v=m.length,g=0;v>g;)d=m[g++],r&&!f.call(h,d)||(n[d]=h[d]);return n}:l},function(e,t,n){"use strict";var r=n(67),a=n(40),o=[].slice,i={},c=function(e,t,n){if(!(t in i)){for(var r=[],a=0;a<t;a++)r[a]="a["+a+"]";i[t]=Function("C,a","return new C("+r.join(",")+")")}return i[t](e,n)};e.exports=Function.bind||function(e){var t=r(this),n=o.call(arguments,1),i=function(){var r=n.concat(o.call(arguments));return this instanceof i?c(t,r.length,r):t.apply(e,r)};return a(t.prototype)&&(i.prototype=t.prototype),i}},function(e,t){e.exports="\t\n\v\f\r                　\u2028\u2029\ufeff"},function(e,t,n){var r=n(484);e.exports=function(e){if(r(e))throw TypeError("The method doesn't accept regular expressions");return e}},function(e,t,n){var r=n(36)("match");e.exports=function(e){var t=/./;try{"/./"[e](t)}catch(n){try{return t[r]=!1,"/./"[e](t)}catch(e){}}return!1}},function(e,t,n){var r=n(490),a=Array.prototype;e.exports=function(e){var t=e.indexOf;return e===a||e instanceof Array&&t===a.indexOf?r:t}},function(e,t){e.exports=function(e,t){(null==t||t>e.length)&&(t=e.length);for(var n=0,r=new Array(t);n<t;n++)r[n]=e[n];return r}},function(e,t,n){var r=n(306),a=n(312),o=n(137);e.exports=function(e){if(void 0!==o&&a(Object(e)))return r(e)}},function(e,t,n){e.exports=n(494)},function(e,t,n){n(81),n(495);var r=n(31);e.exports=r.Array.from},function(e,t,n){"use strict";var r=n(91),a=n(62),o=n(309),i=n(310),c=n(68),s=n(121),u=n(123);e.exports=function(e){var t,n,l,p,f,d,h=a(e),m="function"==typeof this?this:Array,v=arguments.length,g=v>1?arguments[1]:void 0,y=void 0!==g,b=u(h),E=0;if(y&&(g=r(g,v>2?arguments[2]:void 0,2)),null==b||m==Array&&i(b))for(n=new m(t=c(h.length));t>E;E++)d=y?g(h[E],E):h[E],s(n,E,d);else for(f=(p=b.call(h)).next,n=new m;!(l=f.call(p)).done;E++)d=y?o(p,g,[l.value,E],!0):l.value,s(n,E,d);return n.length=E,n}},function(e,t,n){var r=n(47);e.exports=function(e,t,n,a){try{return a?t(r(n)[0],n[1]):t(n)}catch(t){var o=e.return;throw void 0!==o&&r(o.call(e)),t}}},function(e,t,n){var r=n(36),a=n(93),o=r("iterator"),i=Array.prototype;e.exports=function(e){return void 0!==e&&(a.Array===e||i[o]===e)}},function(e,t,n){var r=n(36)("iterator"),a=!1;try{var o=0,i={next:function(){return{done:!!o++}},return:function(){a=!0}};i[r]=function(){return this},Array.from(i,(function(){throw 2}))}catch(e){}e.exports=function(e,t){if(!t&&!a)return!1;var n=!1;try{var o={};o[r]=function(){return{next:function(){return{done:n=!0}}}},e(o)}catch(e){}return n}},function(e,t,n){e.exports=n(496)},function(e,t,n){var r=n(190);e.exports=function(e){if(r(e))return e}},function(e,t,n){e.exports=n(512)},function(e,t,n){var r=n(47),a=n(123);e.exports=function(e){var t=a(e);if("function"!=typeof t)throw TypeError(String(e)+" is not iterable");return r(t.call(e))}},function(e,t){e.exports=function(){throw new TypeError("Invalid attempt to destructure non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}},function(e,t,n){n(64);var r=n(517),a=n(74),o=Array.prototype,i={DOMTokenList:!0,NodeList:!0};e.exports=function(e){var t=e.forEach;return e===o||e instanceof Array&&t===o.forEach||i.hasOwnProperty(a(e))?r:t}},function(e,t,n){var r=n(104),a=n(320),o=n(48),i=n(140),c=r?r.prototype:void 0,s=c?c.toString:void 0;e.exports=function e(t){if("string"==typeof t)return t;if(o(t))return a(t,e)+"";if(i(t))return s?s.call(t):"";var n=t+"";return"0"==n&&1/t==-Infinity?"-0":n}},function(e,t,n){(function(t){var n="object"==typeof t&&t&&t.Object===Object&&t;e.exports=n}).call(this,n(171))},function(e,t){e.exports=function(e,t){for(var n=-1,r=null==e?0:e.length,a=Array(r);++n<r;)a[n]=t(e[n],n,e);return a}},function(e,t){e.exports=function(e,t,n){var r=-1,a=e.length;t<0&&(t=-t>a?0:a+t),(n=n>a?a:n)<0&&(n+=a),a=t>n?0:n-t>>>0,t>>>=0;for(var o=Array(a);++r<a;)o[r]=e[r+t];return o}},function(e,t){var n=RegExp("[\\u200d\\ud800-\\udfff\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff\\ufe0e\\ufe0f]");e.exports=function(e){return n.test(e)}},function(e,t){e.exports=function(e,t,n,r){var a=-1,o=null==e?0:e.length;for(r&&o&&(n=e[++a]);++a<o;)n=t(n,e[a],a,e);return n}},function(e,t){var n=Function.prototype.toString;e.exports=function(e){if(null!=e){try{return n.call(e)}catch(e){}try{return e+""}catch(e){}}return""}},function(e,t,n){var r=n(571),a=n(76);e.exports=function e(t,n,o,i,c){return t===n||(null==t||null==n||!a(t)&&!a(n)?t!=t&&n!=n:r(t,n,o,i,e,c))}},function(e,t,n){var r=n(572),a=n(327),o=n(575);e.exports=function(e,t,n,i,c,s){var u=1&n,l=e.length,p=t.length;if(l!=p&&!(u&&p>l))return!1;var f=s.get(e);if(f&&s.get(t))return f==t;var d=-1,h=!0,m=2&n?new r:void 0;for(s.set(e,t),s.set(t,e);++d<l;){var v=e[d],g=t[d];if(i)var y=u?i(g,v,d,t,e,s):i(v,g,d,e,t,s);if(void 0!==y){if(y)continue;h=!1;break}if(m){if(!a(t,(function(e,t){if(!o(m,t)&&(v===e||c(v,e,n,i,s)))return m.push(t)}))){h=!1;break}}else if(v!==g&&!c(v,g,n,i,s)){h=!1;break}}return s.delete(e),s.delete(t),h}},function(e,t){e.exports=function(e,t){for(var n=-1,r=null==e?0:e.length;++n<r;)if(t(e[n],n,e))return!0;return!1}},function(e,t,n){var r=n(65).Uint8Array;e.exports=r},function(e,t,n){var r=n(330),a=n(195),o=n(98);e.exports=function(e){return r(e,o,a)}},function(e,t,n){var r=n(194),a=n(48);e.exports=function(e,t,n){var o=t(e);return a(e)?o:r(o,n(e))}},function(e,t){e.exports=function(){return[]}},function(e,t,n){var r=n(581),a=n(196),o=n(48),i=n(197),c=n(146),s=n(333),u=Object.prototype.hasOwnProperty;e.exports=function(e,t){var n=o(e),l=!n&&a(e),p=!n&&!l&&i(e),f=!n&&!l&&!p&&s(e),d=n||l||p||f,h=d?r(e.length,String):[],m=h.length;for(var v in e)!t&&!u.call(e,v)||d&&("length"==v||p&&("offset"==v||"parent"==v)||f&&("buffer"==v||"byteLength"==v||"byteOffset"==v)||c(v,m))||h.push(v);return h}},function(e,t,n){var r=n(584),a=n(200),o=n(201),i=o&&o.isTypedArray,c=i?a(i):r;e.exports=c},function(e,t){e.exports=function(e,t){return function(n){return e(t(n))}}},function(e,t,n){var r=n(52);e.exports=function(e){return e==e&&!r(e)}},function(e,t){e.exports=function(e,t){return function(n){return null!=n&&(n[e]===t&&(void 0!==t||e in Object(n)))}}},function(e,t,n){var r=n(595),a=n(596);e.exports=function(e,t){return null!=e&&a(e,t,r)}},function(e,t,n){var r=n(602);e.exports=function(e){var t=r(e),n=t%1;return t==t?n?t-n:t:0}},function(e,t,n){var r=n(52),a=n(140),o=/^\s+|\s+$/g,i=/^[-+]0x[0-9a-f]+$/i,c=/^0b[01]+$/i,s=/^0o[0-7]+$/i,u=parseInt;e.exports=function(e){if("number"==typeof e)return e;if(a(e))return NaN;if(r(e)){var t="function"==typeof e.valueOf?e.valueOf():e;e=r(t)?t+"":t}if("string"!=typeof e)return 0===e?e:+e;e=e.replace(o,"");var n=c.test(e);return n||s.test(e)?u(e.slice(2),n?2:8):i.test(e)?NaN:+e}},function(e,t,n){var r=n(604),a=n(607)(r);e.exports=a},function(e,t,n){var r=n(100),a=n(105),o=n(146),i=n(52);e.exports=function(e,t,n){if(!i(n))return!1;var c=typeof t;return!!("number"==c?a(n)&&o(t,n.length):"string"==c&&t in n)&&r(n[t],e)}},function(e,t,n){e.exports=n(627)},function(e,t,n){e.exports=n(632)},function(e,t,n){e.exports=n(634)},function(e,t,n){e.exports=n(635)},function(e,t,n){n(138),n(81),n(64),n(641),n(353),n(644);var r=n(31);e.exports=r.Promise},function(e,t,n){var r=n(37);e.exports=r.Promise},function(e,t,n){"use strict";var r=n(61),a=n(55),o=n(36),i=n(43),c=o("species");e.exports=function(e){var t=r(e),n=a.f;i&&t&&!t[c]&&n(t,c,{configurable:!0,get:function(){return this}})}},function(e,t,n){var r=n(47),a=n(67),o=n(36)("species");e.exports=function(e,t){var n,i=r(e).constructor;return void 0===i||null==(n=r(i)[o])?t:a(n)}},function(e,t,n){var r,a,o,i=n(37),c=n(33),s=n(90),u=n(91),l=n(290),p=n(172),f=n(351),d=i.location,h=i.setImmediate,m=i.clearImmediate,v=i.process,g=i.MessageChannel,y=i.Dispatch,b=0,E={},x="onreadystatechange",S=function(e){if(E.hasOwnProperty(e)){var t=E[e];delete E[e],t()}},w=function(e){return function(){S(e)}},j=function(e){S(e.data)},C=function(e){i.postMessage(e+"",d.protocol+"//"+d.host)};h&&m||(h=function(e){for(var t=[],n=1;arguments.length>n;)t.push(arguments[n++]);return E[++b]=function(){("function"==typeof e?e:Function(e)).apply(void 0,t)},r(b),b},m=function(e){delete E[e]},"process"==s(v)?r=function(e){v.nextTick(w(e))}:y&&y.now?r=function(e){y.now(w(e))}:g&&!f?(o=(a=new g).port2,a.port1.onmessage=j,r=u(o.postMessage,o,1)):!i.addEventListener||"function"!=typeof postMessage||i.importScripts||c(C)||"file:"===d.protocol?r=x in p("script")?function(e){l.appendChild(p("script")).onreadystatechange=function(){l.removeChild(this),S(e)}}:function(e){setTimeout(w(e),0)}:(r=C,i.addEventListener("message",j,!1))),e.exports={set:h,clear:m}},function(e,t,n){var r=n(186);e.exports=/(iphone|ipod|ipad).*applewebkit/i.test(r)},function(e,t,n){var r=n(47),a=n(40),o=n(125);e.exports=function(e,t){if(r(e),a(t)&&t.constructor===e)return t;var n=o.f(e);return(0,n.resolve)(t),n.promise}},function(e,t,n){"use strict";var r=n(24),a=n(67),o=n(125),i=n(150),c=n(99);r({target:"Promise",stat:!0},{allSettled:function(e){var t=this,n=o.f(t),r=n.resolve,s=n.reject,u=i((function(){var n=a(t.resolve),o=[],i=0,s=1;c(e,(function(e){var a=i++,c=!1;o.push(void 0),s++,n.call(t,e).then((function(e){c||(c=!0,o[a]={status:"fulfilled",value:e},--s||r(o))}),(function(e){c||(c=!0,o[a]={status:"rejected",reason:e},--s||r(o))}))})),--s||r(o)}));return u.error&&s(u.value),n.promise}})},function(e,t,n){var r=n(151),a=n(106),o=n(146),i=n(52),c=n(107);e.exports=function(e,t,n,s){if(!i(e))return e;for(var u=-1,l=(t=a(t,e)).length,p=l-1,f=e;null!=f&&++u<l;){var d=c(t[u]),h=n;if(u!=p){var m=f[d];void 0===(h=s?s(m,d,f):void 0)&&(h=i(m)?m:o(t[u+1])?[]:{})}r(f,d,h),f=f[d]}return e}},function(e,t,n){var r=n(356);e.exports=function(e,t,n){"__proto__"==t&&r?r(e,t,{configurable:!0,enumerable:!0,value:n,writable:!0}):e[t]=n}},function(e,t,n){var r=n(97),a=function(){try{var e=r(Object,"defineProperty");return e({},"",{}),e}catch(e){}}();e.exports=a},function(e,t,n){n(658);var r=n(31).Object;e.exports=function(e,t){return r.create(e,t)}},function(e,t,n){e.exports=n(660)},function(e,t,n){e.exports=n(663)},function(e,t,n){var r=n(193),a=n(672),o=n(151),i=n(673),c=n(674),s=n(677),u=n(678),l=n(679),p=n(680),f=n(329),d=n(363),h=n(148),m=n(681),v=n(682),g=n(687),y=n(48),b=n(197),E=n(689),x=n(52),S=n(691),w=n(98),j="[object Arguments]",C="[object Function]",O="[object Object]",_={};_[j]=_["[object Array]"]=_["[object ArrayBuffer]"]=_["[object DataView]"]=_["[object Boolean]"]=_["[object Date]"]=_["[object Float32Array]"]=_["[object Float64Array]"]=_["[object Int8Array]"]=_["[object Int16Array]"]=_["[object Int32Array]"]=_["[object Map]"]=_["[object Number]"]=_[O]=_["[object RegExp]"]=_["[object Set]"]=_["[object String]"]=_["[object Symbol]"]=_["[object Uint8Array]"]=_["[object Uint8ClampedArray]"]=_["[object Uint16Array]"]=_["[object Uint32Array]"]=!0,_["[object Error]"]=_[C]=_["[object WeakMap]"]=!1,e.exports=function e(t,n,A,k,P,I){var T,N=1&n,R=2&n,M=4&n;if(A&&(T=P?A(t,k,P,I):A(t)),void 0!==T)return T;if(!x(t))return t;var D=y(t);if(D){if(T=m(t),!N)return u(t,T)}else{var q=h(t),L=q==C||"[object GeneratorFunction]"==q;if(b(t))return s(t,N);if(q==O||q==j||L&&!P){if(T=R||L?{}:g(t),!N)return R?p(t,c(T,t)):l(t,i(T,t))}else{if(!_[q])return P?t:{};T=v(t,q,N)}}I||(I=new r);var B=I.get(t);if(B)return B;I.set(t,T),S(t)?t.forEach((function(r){T.add(e(r,n,A,r,t,I))})):E(t)&&t.forEach((function(r,a){T.set(a,e(r,n,A,a,t,I))}));var U=M?R?d:f:R?keysIn:w,V=D?void 0:U(t);return a(V||t,(function(r,a){V&&(r=t[a=r]),o(T,a,e(r,n,A,a,t,I))})),T}},function(e,t,n){var r=n(332),a=n(675),o=n(105);e.exports=function(e){return o(e)?r(e,!0):a(e)}},function(e,t,n){var r=n(194),a=n(204),o=n(195),i=n(331),c=Object.getOwnPropertySymbols?function(e){for(var t=[];e;)r(t,o(e)),e=a(e);return t}:i;e.exports=c},function(e,t,n){var r=n(330),a=n(362),o=n(361);e.exports=function(e){return r(e,o,a)}},function(e,t,n){var r=n(697),a=n(365),o=n(366);e.exports=function(e){return o(a(e,void 0,r),e+"")}},function(e,t,n){var r=n(700),a=Math.max;e.exports=function(e,t,n){return t=a(void 0===t?e.length-1:t,0),function(){for(var o=arguments,i=-1,c=a(o.length-t,0),s=Array(c);++i<c;)s[i]=o[t+i];i=-1;for(var u=Array(t+1);++i<t;)u[i]=o[i];return u[t]=n(s),r(e,this,u)}}},function(e,t,n){var r=n(701),a=n(703)(r);e.exports=a},function(e,t,n){"use strict";var r=n(24),a=n(37),o=n(152),i=n(33),c=n(60),s=n(99),u=n(108),l=n(40),p=n(73),f=n(55).f,d=n(75).forEach,h=n(43),m=n(63),v=m.set,g=m.getterFor;e.exports=function(e,t,n){var m,y=-1!==e.indexOf("Map"),b=-1!==e.indexOf("Weak"),E=y?"set":"add",x=a[e],S=x&&x.prototype,w={};if(h&&"function"==typeof x&&(b||S.forEach&&!i((function(){(new x).entries().next()})))){m=t((function(t,n){v(u(t,m,e),{type:e,collection:new x}),null!=n&&s(n,t[E],t,y)}));var j=g(e);d(["add","clear","delete","forEach","get","has","set","keys","values","entries"],(function(e){var t="add"==e||"set"==e;!(e in S)||b&&"clear"==e||c(m.prototype,e,(function(n,r){var a=j(this).collection;if(!t&&b&&!l(n))return"get"==e&&void 0;var o=a[e](0===n?0:n,r);return t?this:o}))})),b||f(m.prototype,"size",{configurable:!0,get:function(){return j(this).collection.size}})}else m=n.getConstructor(t,e,y,E),o.REQUIRED=!0;return p(m,e,!1,!0),w[e]=m,r({global:!0,forced:!0},w),b||n.setStrong(m,e,y),m}},function(e,t,n){var r=n(33),a=n(36),o=n(80),i=a("iterator");e.exports=!r((function(){var e=new URL("b?a=1&b=2&c=3","http://a"),t=e.searchParams,n="";return e.pathname="c%20d",t.forEach((function(e,r){t.delete("b"),n+=r+e})),o&&!e.toJSON||!t.sort||"http://a/c%20d?a=1&c=3"!==e.href||"3"!==t.get("c")||"a=1"!==String(new URLSearchParams("?a=1"))||!t[i]||"a"!==new URL("https://a@b").username||"b"!==new URLSearchParams(new URLSearchParams("a=b")).get("a")||"xn--e1aybc"!==new URL("http://тест").host||"#%D0%B1"!==new URL("http://a#б").hash||"a1c3"!==n||"x"!==new URL("http://x",void 0).host}))},function(e,t,n){"use strict";n(119);var r=n(24),a=n(61),o=n(368),i=n(94),c=n(124),s=n(73),u=n(287),l=n(63),p=n(108),f=n(46),d=n(91),h=n(74),m=n(47),v=n(40),g=n(92),y=n(89),b=n(315),E=n(123),x=n(36),S=a("fetch"),w=a("Headers"),j=x("iterator"),C="URLSearchParams",O="URLSearchParamsIterator",_=l.set,A=l.getterFor(C),k=l.getterFor(O),P=/\+/g,I=Array(4),T=function(e){return I[e-1]||(I[e-1]=RegExp("((?:%[\\da-f]{2}){"+e+"})","gi"))},N=function(e){try{return decodeURIComponent(e)}catch(t){return e}},R=function(e){var t=e.replace(P," "),n=4;try{return decodeURIComponent(t)}catch(e){for(;n;)t=t.replace(T(n--),N);return t}},M=/[!'()~]|%20/g,D={"!":"%21","'":"%27","(":"%28",")":"%29","~":"%7E","%20":"+"},q=function(e){return D[e]},L=function(e){return encodeURIComponent(e).replace(M,q)},B=function(e,t){if(t)for(var n,r,a=t.split("&"),o=0;o<a.length;)(n=a[o++]).length&&(r=n.split("="),e.push({key:R(r.shift()),value:R(r.join("="))}))},U=function(e){this.entries.length=0,B(this.entries,e)},V=function(e,t){if(e<t)throw TypeError("Not enough arguments")},z=u((function(e,t){_(this,{type:O,iterator:b(A(e).entries),kind:t})}),"Iterator",(function(){var e=k(this),t=e.kind,n=e.iterator.next(),r=n.value;return n.done||(n.value="keys"===t?r.key:"values"===t?r.value:[r.key,r.value]),n})),F=function(){p(this,F,C);var e,t,n,r,a,o,i,c,s,u=arguments.length>0?arguments[0]:void 0,l=this,d=[];if(_(l,{type:C,entries:d,updateURL:function(){},updateSearchParams:U}),void 0!==u)if(v(u))if("function"==typeof(e=E(u)))for(n=(t=e.call(u)).next;!(r=n.call(t)).done;){if((i=(o=(a=b(m(r.value))).next).call(a)).done||(c=o.call(a)).done||!o.call(a).done)throw TypeError("Expected sequence with length 2");d.push({key:i.value+"",value:c.value+""})}else for(s in u)f(u,s)&&d.push({key:s,value:u[s]+""});else B(d,"string"==typeof u?"?"===u.charAt(0)?u.slice(1):u:u+"")},J=F.prototype;c(J,{append:function(e,t){V(arguments.length,2);var n=A(this);n.entries.push({key:e+"",value:t+""}),n.updateURL()},delete:function(e){V(arguments.length,1);for(var t=A(this),n=t.entries,r=e+"",a=0;a<n.length;)n[a].key===r?n.splice(a,1):a++;t.updateURL()},get:function(e){V(arguments.length,1);for(var t=A(this).entries,n=e+"",r=0;r<t.length;r++)if(t[r].key===n)return t[r].value;return null},getAll:function(e){V(arguments.length,1);for(var t=A(this).entries,n=e+"",r=[],a=0;a<t.length;a++)t[a].key===n&&r.push(t[a].value);return r},has:function(e){V(arguments.length,1);for(var t=A(this).entries,n=e+"",r=0;r<t.length;)if(t[r++].key===n)return!0;return!1},set:function(e,t){V(arguments.length,1);for(var n,r=A(this),a=r.entries,o=!1,i=e+"",c=t+"",s=0;s<a.length;s++)(n=a[s]).key===i&&(o?a.splice(s--,1):(o=!0,n.value=c));o||a.push({key:i,value:c}),r.updateURL()},sort:function(){var e,t,n,r=A(this),a=r.entries,o=a.slice();for(a.length=0,n=0;n<o.length;n++){for(e=o[n],t=0;t<n;t++)if(a[t].key>e.key){a.splice(t,0,e);break}t===n&&a.push(e)}r.updateURL()},forEach:function(e){for(var t,n=A(this).entries,r=d(e,arguments.length>1?arguments[1]:void 0,3),a=0;a<n.length;)r((t=n[a++]).value,t.key,this)},keys:function(){return new z(this,"keys")},values:function(){return new z(this,"values")},entries:function(){return new z(this,"entries")}},{enumerable:!0}),i(J,j,J.entries),i(J,"toString",(function(){for(var e,t=A(this).entries,n=[],r=0;r<t.length;)e=t[r++],n.push(L(e.key)+"="+L(e.value));return n.join("&")}),{enumerable:!0}),s(F,C),r({global:!0,forced:!o},{URLSearchParams:F}),o||"function"!=typeof S||"function"!=typeof w||r({global:!0,enumerable:!0,forced:!0},{fetch:function(e){var t,n,r,a=[e];return arguments.length>1&&(v(t=arguments[1])&&(n=t.body,h(n)===C&&((r=t.headers?new w(t.headers):new w).has("content-type")||r.set("content-type","application/x-www-form-urlencoded;charset=UTF-8"),t=g(t,{body:y(0,String(n)),headers:y(0,r)}))),a.push(t)),S.apply(this,a)}}),e.exports={URLSearchParams:F,getState:A}},function(e,t){e.exports="data:image/svg+xml;base64,PHN2ZyB3aWR0aD0iMjAwcHgiICBoZWlnaHQ9IjIwMHB4IiAgeG1sbnM9Imh0dHA6Ly93d3cudzMub3JnLzIwMDAvc3ZnIiB2aWV3Qm94PSIwIDAgMTAwIDEwMCIgcHJlc2VydmVBc3BlY3RSYXRpbz0ieE1pZFlNaWQiIGNsYXNzPSJsZHMtcm9sbGluZyIgc3R5bGU9ImJhY2tncm91bmQtaW1hZ2U6IG5vbmU7IGJhY2tncm91bmQtcG9zaXRpb246IGluaXRpYWwgaW5pdGlhbDsgYmFja2dyb3VuZC1yZXBlYXQ6IGluaXRpYWwgaW5pdGlhbDsiPjxjaXJjbGUgY3g9IjUwIiBjeT0iNTAiIGZpbGw9Im5vbmUiIG5nLWF0dHItc3Ryb2tlPSJ7e2NvbmZpZy5jb2xvcn19IiBuZy1hdHRyLXN0cm9rZS13aWR0aD0ie3tjb25maWcud2lkdGh9fSIgbmctYXR0ci1yPSJ7e2NvbmZpZy5yYWRpdXN9fSIgbmctYXR0ci1zdHJva2UtZGFzaGFycmF5PSJ7e2NvbmZpZy5kYXNoYXJyYXl9fSIgc3Ryb2tlPSIjNTU1NTU1IiBzdHJva2Utd2lkdGg9IjEwIiByPSIzNSIgc3Ryb2tlLWRhc2hhcnJheT0iMTY0LjkzMzYxNDMxMzQ2NDE1IDU2Ljk3Nzg3MTQzNzgyMTM4Ij48YW5pbWF0ZVRyYW5zZm9ybSBhdHRyaWJ1dGVOYW1lPSJ0cmFuc2Zvcm0iIHR5cGU9InJvdGF0ZSIgY2FsY01vZGU9ImxpbmVhciIgdmFsdWVzPSIwIDUwIDUwOzM2MCA1MCA1MCIga2V5VGltZXM9IjA7MSIgZHVyPSIxcyIgYmVnaW49IjBzIiByZXBlYXRDb3VudD0iaW5kZWZpbml0ZSI+PC9hbmltYXRlVHJhbnNmb3JtPjwvY2lyY2xlPjwvc3ZnPgo="},function(e,t){e.exports=require("redux-immutable")},function(e,t,n){"use strict";Object.defineProperty(t,"__esModule",{value:!0}),t.sanitizeUrl=void 0;var r=/^(%20|\s)*(javascript|data|vbscript)/im,a=/[^\x20-\x7EÀ-ž]/gim,o=/^([^:]+):/gm,i=[".","/"];t.sanitizeUrl=function(e){if(!e)return"about:blank";var t=e.replace(a,"").trim();if(function(e){return i.indexOf(e[0])>-1}(t))return t;var n=t.match(o);if(!n)return t;var c=n[0];return r.test(c)?"about:blank":t}},function(e,t,n){var r=n(526),a=n(534)((function(e,t,n){return t=t.toLowerCase(),e+(n?r(t):t)}));e.exports=a},function(e,t,n){(function(t){var r=n(609),a=n(610).Stream;function o(e,t,n){n=n||0;var a,i,c=(a=t,new Array(n||0).join(a||"")),s=e;if("object"==typeof e&&((s=e[i=Object.keys(e)[0]])&&s._elem))return s._elem.name=i,s._elem.icount=n,s._elem.indent=t,s._elem.indents=c,s._elem.interrupt=s,s._elem;var u,l=[],p=[];function f(e){Object.keys(e).forEach((function(t){l.push(function(e,t){return e+'="'+r(t)+'"'}(t,e[t]))}))}switch(typeof s){case"object":if(null===s)break;s._attr&&f(s._attr),s._cdata&&p.push(("<![CDATA["+s._cdata).replace(/\]\]>/g,"]]]]><![CDATA[>")+"]]>"),s.forEach&&(u=!1,p.push(""),s.forEach((function(e){"object"==typeof e?"_attr"==Object.keys(e)[0]?f(e._attr):p.push(o(e,t,n+1)):(p.pop(),u=!0,p.push(r(e)))})),u||p.push(""));break;default:p.push(r(s))}return{name:i,interrupt:!1,attributes:l,content:p,icount:n,indents:c,indent:t}}function i(e,t,n){if("object"!=typeof t)return e(!1,t);var r=t.interrupt?1:t.content.length;function a(){for(;t.content.length;){var a=t.content.shift();if(void 0!==a){if(o(a))return;i(e,a)}}e(!1,(r>1?t.indents:"")+(t.name?"</"+t.name+">":"")+(t.indent&&!n?"\n":"")),n&&n()}function o(t){return!!t.interrupt&&(t.interrupt.append=e,t.interrupt.end=a,t.interrupt=!1,e(!0),!0)}if(e(!1,t.indents+(t.name?"<"+t.name:"")+(t.attributes.length?" "+t.attributes.join(" "):"")+(r?t.name?">":"":t.name?"/>":"")+(t.indent&&r>1?"\n":"")),!r)return e(!1,t.indent?"\n":"");o(t)||a()}e.exports=function(e,n){"object"!=typeof n&&(n={indent:n});var r,c,s=n.stream?new a:null,u="",l=!1,p=n.indent?!0===n.indent?"    ":n.indent:"",f=!0;function d(e){f?t.nextTick(e):e()}function h(e,t){if(void 0!==t&&(u+=t),e&&!l&&(s=s||new a,l=!0),e&&l){var n=u;d((function(){s.emit("data",n)})),u=""}}function m(e,t){i(h,o(e,p,p?1:0),t)}function v(){if(s){var e=u;d((function(){s.emit("data",e),s.emit("end"),s.readable=!1,s.emit("close")}))}}return d((function(){f=!1})),n.declaration&&(r=n.declaration,c={version:"1.0",encoding:r.encoding||"UTF-8"},r.standalone&&(c.standalone=r.standalone),m({"?xml":{_attr:c}}),u=u.replace("/>","?>")),e&&e.forEach?e.forEach((function(t,n){var r;n+1===e.length&&(r=v),m(t,r)})):m(e,v),s?(s.readable=!0,s):u},e.exports.element=e.exports.Element=function(){var e=Array.prototype.slice.call(arguments),t={_elem:o(e),push:function(e){if(!this.append)throw new Error("not assigned to a parent!");var t=this,n=this._elem.indent;i(this.append,o(e,n,this._elem.icount+(n?1:0)),(function(){t.append(!0)}))},close:function(e){void 0!==e&&this.push(e),this.end&&this.end()}};return t}}).call(this,n(608))},function(e,t){e.exports=require("css.escape")},function(e,t){e.exports=require("randombytes")},function(e,t){e.exports=require("sha.js")},function(e,t,n){var r=n(323),a=n(340),o=n(145),i=n(615),c=n(48);e.exports=function(e,t,n){var s=c(e)?r:i,u=arguments.length<3;return s(e,o(t,4),n,u,a)}},function(e,t,n){var r=n(52),a=n(653),o=n(339),i=Math.max,c=Math.min;e.exports=function(e,t,n){var s,u,l,p,f,d,h=0,m=!1,v=!1,g=!0;if("function"!=typeof e)throw new TypeError("Expected a function");function y(t){var n=s,r=u;return s=u=void 0,h=t,p=e.apply(r,n)}function b(e){return h=e,f=setTimeout(x,t),m?y(e):p}function E(e){var n=e-d;return void 0===d||n>=t||n<0||v&&e-h>=l}function x(){var e=a();if(E(e))return S(e);f=setTimeout(x,function(e){var n=t-(e-d);return v?c(n,l-(e-h)):n}(e))}function S(e){return f=void 0,g&&s?y(e):(s=u=void 0,p)}function w(){var e=a(),n=E(e);if(s=arguments,u=this,d=e,n){if(void 0===f)return b(d);if(v)return clearTimeout(f),f=setTimeout(x,t),y(d)}return void 0===f&&(f=setTimeout(x,t)),p}return t=o(t)||0,r(n)&&(m=!!n.leading,l=(v="maxWait"in n)?i(o(n.maxWait)||0,t):l,g="trailing"in n?!!n.trailing:g),w.cancel=function(){void 0!==f&&clearTimeout(f),h=0,s=d=u=f=void 0},w.flush=function(){return void 0===f?p:S(a())},w}},function(e,t){e.exports=require("react-dom")},function(e,t,n){var r=n(320),a=n(360),o=n(693),i=n(106),c=n(109),s=n(696),u=n(364),l=n(363),p=u((function(e,t){var n={};if(null==e)return n;var u=!1;t=r(t,(function(t){return t=i(t,e),u||(u=t.length>1),t})),c(e,l(e),n),u&&(n=a(n,7,s));for(var p=t.length;p--;)o(n,t[p]);return n}));e.exports=p},function(e,t,n){e.exports=n(704)},function(e,t,n){var r=n(342),a=n(712),o=n(716);function i(t,n,c){return"undefined"!=typeof Reflect&&a?e.exports=i=a:e.exports=i=function(e,t,n){var a=o(e,t);if(a){var i=r(a,t);return i.get?i.get.call(n):i.value}},i(t,n,c||t)}e.exports=i},function(e,t){e.exports=require("isomorphic-form-data")},function(e,t,n){e.exports=n(717)},function(e,t,n){var r=n(360);e.exports=function(e){return r(e,5)}},function(e,t,n){e.exports=n(722)},function(e,t){e.exports=require("cross-fetch")},function(e,t){e.exports=require("traverse")},function(e,t){e.exports=require("cookie")},function(e,t){e.exports=require("zenscroll")},function(e,t,n){e.exports=n(737)},function(e,t){e.exports=function(e){var t={literal:"true false null"},n=[e.C_LINE_COMMENT_MODE,e.C_BLOCK_COMMENT_MODE],r=[e.QUOTE_STRING_MODE,e.C_NUMBER_MODE],a={end:",",endsWithParent:!0,excludeEnd:!0,contains:r,keywords:t},o={begin:"{",end:"}",contains:[{className:"attr",begin:/"/,end:/"/,contains:[e.BACKSLASH_ESCAPE],illegal:"\\n"},e.inherit(a,{begin:/:/})].concat(n),illegal:"\\S"},i={begin:"\\[",end:"\\]",contains:[e.inherit(a)],illegal:"\\S"};return r.push(o,i),n.forEach((function(e){r.push(e)})),{name:"JSON",contains:r,keywords:t,illegal:"\\S"}}},function(e,t){const n="[A-Za-z$_][0-9A-Za-z$_]*",r=["as","in","of","if","for","while","finally","var","new","function","do","return","void","else","break","catch","instanceof","with","throw","case","default","try","switch","continue","typeof","delete","let","yield","const","class","debugger","async","await","static","import","from","export","extends"],a=["true","false","null","undefined","NaN","Infinity"],o=[].concat(["setInterval","setTimeout","clearInterval","clearTimeout","require","exports","eval","isFinite","isNaN","parseFloat","parseInt","decodeURI","decodeURIComponent","encodeURI","encodeURIComponent","escape","unescape"],["arguments","this","super","console","window","document","localStorage","module","global"],["Intl","DataView","Number","Math","Date","String","RegExp","Object","Function","Boolean","Error","Symbol","Set","Map","WeakSet","WeakMap","Proxy","Reflect","JSON","Promise","Float64Array","Int16Array","Int32Array","Int8Array","Uint16Array","Uint32Array","Float32Array","Array","Uint8Array","Uint8ClampedArray","ArrayBuffer"],["EvalError","InternalError","RangeError","ReferenceError","SyntaxError","TypeError","URIError"]);function i(e){return c("(?=",e,")")}function c(...e){return e.map((e=>{return(t=e)?"string"==typeof t?t:t.source:null;var t})).join("")}e.exports=function(e){var t=n,s="<>",u="</>",l={begin:/<[A-Za-z0-9\\._:-]+/,end:/\/[A-Za-z0-9\\._:-]+>|\/>/},p={$pattern:n,keyword:r.join(" "),literal:a.join(" "),built_in:o.join(" ")},f={className:"number",variants:[{begin:"\\b(0[bB][01]+)n?"},{begin:"\\b(0[oO][0-7]+)n?"},{begin:e.C_NUMBER_RE+"n?"}],relevance:0},d={className:"subst",begin:"\\$\\{",end:"\\}",keywords:p,contains:[]},h={begin:"html`",end:"",starts:{end:"`",returnEnd:!1,contains:[e.BACKSLASH_ESCAPE,d],subLanguage:"xml"}},m={begin:"css`",end:"",starts:{end:"`",returnEnd:!1,contains:[e.BACKSLASH_ESCAPE,d],subLanguage:"css"}},v={className:"string",begin:"`",end:"`",contains:[e.BACKSLASH_ESCAPE,d]};d.contains=[e.APOS_STRING_MODE,e.QUOTE_STRING_MODE,h,m,v,f,e.REGEXP_MODE];var g=d.contains.concat([{begin:/\(/,end:/\)/,contains:["self"].concat(d.contains,[e.C_BLOCK_COMMENT_MODE,e.C_LINE_COMMENT_MODE])},e.C_BLOCK_COMMENT_MODE,e.C_LINE_COMMENT_MODE]),y={className:"params",begin:/\(/,end:/\)/,excludeBegin:!0,excludeEnd:!0,contains:g};return{name:"JavaScript",aliases:["js","jsx","mjs","cjs"],keywords:p,contains:[e.SHEBANG({binary:"node",relevance:5}),{className:"meta",relevance:10,begin:/^\s*['"]use (strict|asm)['"]/},e.APOS_STRING_MODE,e.QUOTE_STRING_MODE,h,m,v,e.C_LINE_COMMENT_MODE,e.COMMENT("/\\*\\*","\\*/",{relevance:0,contains:[{className:"doctag",begin:"@[A-Za-z]+",contains:[{className:"type",begin:"\\{",end:"\\}",relevance:0},{className:"variable",begin:t+"(?=\\s*(-)|$)",endsParent:!0,relevance:0},{begin:/(?=[^\n])\s/,relevance:0}]}]}),e.C_BLOCK_COMMENT_MODE,f,{begin:c(/[{,\n]\s*/,i(c(/(((\/\/.*)|(\/\*(.|\n)*\*\/))\s*)*/,t+"\\s*:"))),relevance:0,contains:[{className:"attr",begin:t+i("\\s*:"),relevance:0}]},{begin:"("+e.RE_STARTERS_RE+"|\\b(case|return|throw)\\b)\\s*",keywords:"return throw case",contains:[e.C_LINE_COMMENT_MODE,e.C_BLOCK_COMMENT_MODE,e.REGEXP_MODE,{className:"function",begin:"(\\([^(]*(\\([^(]*(\\([^(]*\\))?\\))?\\)|"+e.UNDERSCORE_IDENT_RE+")\\s*=>",returnBegin:!0,end:"\\s*=>",contains:[{className:"params",variants:[{begin:e.UNDERSCORE_IDENT_RE},{className:null,begin:/\(\s*\)/,skip:!0},{begin:/\(/,end:/\)/,excludeBegin:!0,excludeEnd:!0,keywords:p,contains:g}]}]},{begin:/,/,relevance:0},{className:"",begin:/\s/,end:/\s*/,skip:!0},{variants:[{begin:s,end:u},{begin:l.begin,end:l.end}],subLanguage:"xml",contains:[{begin:l.begin,end:l.end,skip:!0,contains:["self"]}]}],relevance:0},{className:"function",beginKeywords:"function",end:/\{/,excludeEnd:!0,contains:[e.inherit(e.TITLE_MODE,{begin:t}),y],illegal:/\[|%/},{begin:/\$[(.]/},e.METHOD_GUARD,{className:"class",beginKeywords:"class",end:/[{;=]/,excludeEnd:!0,illegal:/[:"\[\]]/,contains:[{beginKeywords:"extends"},e.UNDERSCORE_TITLE_MODE]},{beginKeywords:"constructor",end:/\{/,excludeEnd:!0},{begin:"(get|set)\\s+(?="+t+"\\()",end:/{/,keywords:"get set",contains:[e.inherit(e.TITLE_MODE,{begin:t}),{begin:/\(\)/},y]}],illegal:/#(?!!)/}}},function(e,t){e.exports=function(e){var t={className:"symbol",begin:"&[a-z]+;|&#[0-9]+;|&#x[a-f0-9]+;"},n={begin:"\\s",contains:[{className:"meta-keyword",begin:"#?[a-z_][a-z1-9_-]+",illegal:"\\n"}]},r=e.inherit(n,{begin:"\\(",end:"\\)"}),a=e.inherit(e.APOS_STRING_MODE,{className:"meta-string"}),o=e.inherit(e.QUOTE_STRING_MODE,{className:"meta-string"}),i={endsWithParent:!0,illegal:/</,relevance:0,contains:[{className:"attr",begin:"[A-Za-z0-9\\._:-]+",relevance:0},{begin:/=\s*/,relevance:0,contains:[{className:"string",endsParent:!0,variants:[{begin:/"/,end:/"/,contains:[t]},{begin:/'/,end:/'/,contains:[t]},{begin:/[^\s"'=<>`]+/}]}]}]};return{name:"HTML, XML",aliases:["html","xhtml","rss","atom","xjb","xsd","xsl","plist","wsf","svg"],case_insensitive:!0,contains:[{className:"meta",begin:"<![a-z]",end:">",relevance:10,contains:[n,o,a,r,{begin:"\\[",end:"\\]",contains:[{className:"meta",begin:"<![a-z]",end:">",contains:[n,r,o,a]}]}]},e.COMMENT("\x3c!--","--\x3e",{relevance:10}),{begin:"<\\!\\[CDATA\\[",end:"\\]\\]>",relevance:10},t,{className:"meta",begin:/<\?xml/,end:/\?>/,relevance:10},{className:"tag",begin:"<style(?=\\s|>)",end:">",keywords:{name:"style"},contains:[i],starts:{end:"</style>",returnEnd:!0,subLanguage:["css","xml"]}},{className:"tag",begin:"<script(?=\\s|>)",end:">",keywords:{name:"script"},contains:[i],starts:{end:"<\/script>",returnEnd:!0,subLanguage:["javascript","handlebars","xml"]}},{className:"tag",begin:"</?",end:"/?>",contains:[{className:"name",begin:/[^\/><\s]+/,relevance:0},i]}]}}},function(e,t){e.exports=function(e){var t="true false yes no null",n="[\\w#;/?:@&=+$,.~*\\'()[\\]]+",r={className:"string",relevance:0,variants:[{begin:/'/,end:/'/},{begin:/"/,end:/"/},{begin:/\S+/}],contains:[e.BACKSLASH_ESCAPE,{className:"template-variable",variants:[{begin:"{{",end:"}}"},{begin:"%{",end:"}"}]}]},a=e.inherit(r,{variants:[{begin:/'/,end:/'/},{begin:/"/,end:/"/},{begin:/[^\s,{}[\]]+/}]}),o={className:"number",begin:"\\b[0-9]{4}(-[0-9][0-9]){0,2}([Tt \\t][0-9][0-9]?(:[0-9][0-9]){2})?(\\.[0-9]*)?([ \\t])*(Z|[-+][0-9][0-9]?(:[0-9][0-9])?)?\\b"},i={end:",",endsWithParent:!0,excludeEnd:!0,contains:[],keywords:t,relevance:0},c={begin:"{",end:"}",contains:[i],illegal:"\\n",relevance:0},s={begin:"\\[",end:"\\]",contains:[i],illegal:"\\n",relevance:0},u=[{className:"attr",variants:[{begin:"\\w[\\w :\\/.-]*:(?=[ \t]|$)"},{begin:'"\\w[\\w :\\/.-]*":(?=[ \t]|$)'},{begin:"'\\w[\\w :\\/.-]*':(?=[ \t]|$)"}]},{className:"meta",begin:"^---s*$",relevance:10},{className:"string",begin:"[\\|>]([0-9]?[+-])?[ ]*\\n( *)[\\S ]+\\n(\\2[\\S ]+\\n?)*"},{begin:"<%[%=-]?",end:"[%-]?%>",subLanguage:"ruby",excludeBegin:!0,excludeEnd:!0,relevance:0},{className:"type",begin:"!\\w+!"+n},{className:"type",begin:"!<"+n+">"},{className:"type",begin:"!"+n},{className:"type",begin:"!!"+n},{className:"meta",begin:"&"+e.UNDERSCORE_IDENT_RE+"$"},{className:"meta",begin:"\\*"+e.UNDERSCORE_IDENT_RE+"$"},{className:"bullet",begin:"\\-(?=[ ]|$)",relevance:0},e.HASH_COMMENT_MODE,{beginKeywords:t,keywords:{literal:t}},o,{className:"number",begin:e.C_NUMBER_RE+"\\b"},c,s,r],l=[...u];return l.pop(),l.push(a),i.contains=l,{name:"YAML",case_insensitive:!0,aliases:["yml","YAML"],contains:u}}},function(e,t){e.exports=function(e){var t="HTTP/[0-9\\.]+";return{name:"HTTP",aliases:["https"],illegal:"\\S",contains:[{begin:"^"+t,end:"$",contains:[{className:"number",begin:"\\b\\d{3}\\b"}]},{begin:"^[A-Z]+ (.*?) "+t+"$",returnBegin:!0,end:"$",contains:[{className:"string",begin:" ",end:" ",excludeBegin:!0,excludeEnd:!0},{begin:t},{className:"keyword",begin:"[A-Z]+"}]},{className:"attribute",begin:"^\\w",end:": ",excludeEnd:!0,illegal:"\\n|\\s|=",starts:{end:"$",relevance:0}},{begin:"\\n\\n",starts:{subLanguage:[],endsWithParent:!0}}]}}},function(e,t){e.exports=function(e){const t={},n={begin:/\$\{/,end:/\}/,contains:[{begin:/:-/,contains:[t]}]};Object.assign(t,{className:"variable",variants:[{begin:/\$[\w\d#@][\w\d_]*/},n]});const r={className:"subst",begin:/\$\(/,end:/\)/,contains:[e.BACKSLASH_ESCAPE]},a={className:"string",begin:/"/,end:/"/,contains:[e.BACKSLASH_ESCAPE,t,r]};r.contains.push(a);const o={begin:/\$\(\(/,end:/\)\)/,contains:[{begin:/\d+#[0-9a-f]+/,className:"number"},e.NUMBER_MODE,t]},i=e.SHEBANG({binary:`(${["fish","bash","zsh","sh","csh","ksh","tcsh","dash","scsh"].join("|")})`,relevance:10}),c={className:"function",begin:/\w[\w\d_]*\s*\(\s*\)\s*\{/,returnBegin:!0,contains:[e.inherit(e.TITLE_MODE,{begin:/\w[\w\d_]*/})],relevance:0};return{name:"Bash",aliases:["sh","zsh"],keywords:{$pattern:/\b-?[a-z\._]+\b/,keyword:"if then else elif fi for while in do done case esac function",literal:"true false",built_in:"break cd continue eval exec exit export getopts hash pwd readonly return shift test times trap umask unset alias bind builtin caller command declare echo enable help let local logout mapfile printf read readarray source type typeset ulimit unalias set shopt autoload bg bindkey bye cap chdir clone comparguments compcall compctl compdescribe compfiles compgroups compquote comptags comptry compvalues dirs disable disown echotc echoti emulate fc fg float functions getcap getln history integer jobs kill limit log noglob popd print pushd pushln rehash sched setcap setopt stat suspend ttyctl unfunction unhash unlimit unsetopt vared wait whence where which zcompile zformat zftp zle zmodload zparseopts zprof zpty zregexparse zsocket zstyle ztcp",_:"-ne -eq -lt -gt -f -d -e -s -l -a"},contains:[i,e.SHEBANG(),c,o,e.HASH_COMMENT_MODE,a,{className:"",begin:/\\"/},{className:"string",begin:/'/,end:/'/},t]}}},function(e,t){e.exports=require("js-file-download")},function(e,t,n){e.exports=n(744)},function(e,t,n){e.exports=n(747)},function(e,t){e.exports=require("xml-but-prettier")},function(e,t,n){var r=n(77);e.exports=function(e){return r(e).toLowerCase()}},function(e,t){e.exports=require("react-immutable-pure-component")},function(e,t){e.exports=require("autolinker")},function(e,t,n){e.exports=n(753)},function(e,t,n){var r=n(408);e.exports=r},function(e,t,n){n(409);var r=n(31);r.JSON||(r.JSON={stringify:JSON.stringify}),e.exports=function(e,t,n){return r.JSON.stringify.apply(null,arguments)}},function(e,t,n){var r=n(24),a=n(61),o=n(33),i=a("JSON","stringify"),c=/[\uD800-\uDFFF]/g,s=/^[\uD800-\uDBFF]$/,u=/^[\uDC00-\uDFFF]$/,l=function(e,t,n){var r=n.charAt(t-1),a=n.charAt(t+1);return s.test(e)&&!u.test(a)||u.test(e)&&!s.test(r)?"\\u"+e.charCodeAt(0).toString(16):e},p=o((function(){return'"\\udf06\\ud834"'!==i("\udf06\ud834")||'"\\udead"'!==i("\udead")}));i&&r({target:"JSON",stat:!0,forced:p},{stringify:function(e,t,n){var r=i.apply(null,arguments);return"string"==typeof r?r.replace(c,l):r}})},function(e,t,n){var r=n(279);e.exports=r},function(e,t,n){var r=n(24),a=n(62),o=n(115);r({target:"Object",stat:!0,forced:n(33)((function(){o(1)}))},{keys:function(e){return o(a(e))}})},function(e,t,n){e.exports=n(413)},function(e,t,n){var r=n(414);e.exports=r},function(e,t,n){n(281),n(81),n(64);var r=n(176);e.exports=r.f("iterator")},function(e,t,n){var r=n(37),a=n(60);e.exports=function(e,t){try{a(r,e,t)}catch(n){r[e]=t}return t}},function(e,t,n){"use strict";var r=n(181),a=n(74);e.exports=r?{}.toString:function(){return"[object "+a(this)+"]"}},function(e,t,n){var r=n(40);e.exports=function(e){if(!r(e)&&null!==e)throw TypeError("Can't set "+String(e)+" as a prototype");return e}},function(e,t){e.exports={CSSRuleList:0,CSSStyleDeclaration:0,CSSValueList:0,ClientRectList:0,DOMRectList:0,DOMStringList:0,DOMTokenList:1,DataTransferItemList:0,FileList:0,HTMLAllCollection:0,HTMLCollection:0,HTMLFormElement:0,HTMLSelectElement:0,MediaList:0,MimeTypeArray:0,NamedNodeMap:0,NodeList:1,PaintRequestList:0,Plugin:0,PluginArray:0,SVGLengthList:0,SVGNumberList:0,SVGPathSegList:0,SVGPointList:0,SVGStringList:0,SVGTransformList:0,SourceBufferList:0,StyleSheetList:0,TextTrackCueList:0,TextTrackList:0,TouchList:0}},function(e,t,n){var r=n(420);n(437),n(438),n(439),n(440),n(441),e.exports=r},function(e,t,n){n(291),n(138),n(292),n(422),n(423),n(424),n(425),n(281),n(426),n(427),n(428),n(429),n(430),n(431),n(432),n(433),n(434),n(435),n(436);var r=n(31);e.exports=r.Symbol},function(e,t,n){var r=n(59),a=n(187).f,o={}.toString,i="object"==typeof window&&window&&Object.getOwnPropertyNames?Object.getOwnPropertyNames(window):[];e.exports.f=function(e){return i&&"[object Window]"==o.call(e)?function(e){try{return a(e)}catch(e){return i.slice()}}(e):a(r(e))}},function(e,t,n){n(44)("asyncIterator")},function(e,t){},function(e,t,n){n(44)("hasInstance")},function(e,t,n){n(44)("isConcatSpreadable")},function(e,t,n){n(44)("match")},function(e,t,n){n(44)("matchAll")},function(e,t,n){n(44)("replace")},function(e,t,n){n(44)("search")},function(e,t,n){n(44)("species")},function(e,t,n){n(44)("split")},function(e,t,n){n(44)("toPrimitive")},function(e,t,n){n(44)("toStringTag")},function(e,t,n){n(44)("unscopables")},function(e,t,n){n(73)(Math,"Math",!0)},function(e,t,n){var r=n(37);n(73)(r.JSON,"JSON",!0)},function(e,t,n){n(44)("asyncDispose")},function(e,t,n){n(44)("dispose")},function(e,t,n){n(44)("observable")},function(e,t,n){n(44)("patternMatch")},function(e,t,n){n(44)("replaceAll")},function(e,t,n){var r=n(293);e.exports=r},function(e,t,n){n(444);var r=n(38);e.exports=r("Array").filter},function(e,t,n){"use strict";var r=n(24),a=n(75).filter,o=n(122),i=n(56),c=o("filter"),s=i("filter");r({target:"Array",proto:!0,forced:!c||!s},{filter:function(e){return a(this,e,arguments.length>1?arguments[1]:void 0)}})},function(e,t,n){var r=n(446);e.exports=r},function(e,t,n){var r=n(447),a=Array.prototype;e.exports=function(e){var t=e.concat;return e===a||e instanceof Array&&t===a.concat?r:t}},function(e,t,n){n(291);var r=n(38);e.exports=r("Array").concat},function(e,t,n){var r=n(449);e.exports=r},function(e,t,n){var r=n(450),a=Array.prototype;e.exports=function(e){var t=e.map;return e===a||e instanceof Array&&t===a.map?r:t}},function(e,t,n){n(451);var r=n(38);e.exports=r("Array").map},function(e,t,n){"use strict";var r=n(24),a=n(75).map,o=n(122),i=n(56),c=o("map"),s=i("map");r({target:"Array",proto:!0,forced:!c||!s},{map:function(e){return a(this,e,arguments.length>1?arguments[1]:void 0)}})},function(e,t,n){var r=n(453);e.exports=r},function(e,t,n){var r=n(454),a=Array.prototype;e.exports=function(e){var t=e.reduce;return e===a||e instanceof Array&&t===a.reduce?r:t}},function(e,t,n){n(455);var r=n(38);e.exports=r("Array").reduce},function(e,t,n){"use strict";var r=n(24),a=n(456).left,o=n(95),i=n(56),c=o("reduce"),s=i("reduce",{1:0});r({target:"Array",proto:!0,forced:!c||!s},{reduce:function(e){return a(this,e,arguments.length,arguments.length>1?arguments[1]:void 0)}})},function(e,t,n){var r=n(67),a=n(62),o=n(133),i=n(68),c=function(e){return function(t,n,c,s){r(n);var u=a(t),l=o(u),p=i(u.length),f=e?p-1:0,d=e?-1:1;if(c<2)for(;;){if(f in l){s=l[f],f+=d;break}if(f+=d,e?f<0:p<=f)throw TypeError("Reduce of empty array with no initial value")}for(;e?f>=0:p>f;f+=d)f in l&&(s=n(s,l[f],f,u));return s}};e.exports={left:c(!1),right:c(!0)}},function(e,t,n){var r=n(294);e.exports=r},function(e,t,n){n(24)({target:"Array",stat:!0},{isArray:n(120)})},function(e,t,n){var r=n(295);e.exports=r},function(e,t,n){var r=n(24),a=n(43);r({target:"Object",stat:!0,forced:!a,sham:!a},{defineProperty:n(55).f})},function(e,t,n){var r=n(296);e.exports=r},function(e,t,n){n(463);var r=n(38);e.exports=r("Array").slice},function(e,t,n){"use strict";var r=n(24),a=n(40),o=n(120),i=n(174),c=n(68),s=n(59),u=n(121),l=n(36),p=n(122),f=n(56),d=p("slice"),h=f("slice",{ACCESSORS:!0,0:0,1:2}),m=l("species"),v=[].slice,g=Math.max;r({target:"Array",proto:!0,forced:!d||!h},{slice:function(e,t){var n,r,l,p=s(this),f=c(p.length),d=i(e,f),h=i(void 0===t?f:t,f);if(o(p)&&("function"!=typeof(n=p.constructor)||n!==Array&&!o(n.prototype)?a(n)&&null===(n=n[m])&&(n=void 0):n=void 0,n===Array||void 0===n))return v.call(p,d,h);for(r=new(void 0===n?Array:n)(g(h-d,0)),l=0;d<h;d++,l++)d in p&&u(r,l,p[d]);return r.length=l,r}})},function(e,t,n){var r=n(297);e.exports=r},function(e,t,n){var r=n(24),a=n(298);r({target:"Object",stat:!0,forced:Object.assign!==a},{assign:a})},function(e,t,n){var r=n(467);e.exports=r},function(e,t,n){var r=n(468),a=Function.prototype;e.exports=function(e){var t=e.bind;return e===a||e instanceof Function&&t===a.bind?r:t}},function(e,t,n){n(469);var r=n(38);e.exports=r("Function").bind},function(e,t,n){n(24)({target:"Function",proto:!0},{bind:n(299)})},function(e,t,n){"use strict";(function(e){var r=n(471),a=n(472),o=n(473);function i(){return s.TYPED_ARRAY_SUPPORT?2147483647:1073741823}function c(e,t){if(i()<t)throw new RangeError("Invalid typed array length");return s.TYPED_ARRAY_SUPPORT?(e=new Uint8Array(t)).__proto__=s.prototype:(null===e&&(e=new s(t)),e.length=t),e}function s(e,t,n){if(!(s.TYPED_ARRAY_SUPPORT||this instanceof s))return new s(e,t,n);if("number"==typeof e){if("string"==typeof t)throw new Error("If encoding is specified then the first argument must be a string");return p(this,e)}return u(this,e,t,n)}function u(e,t,n,r){if("number"==typeof t)throw new TypeError('"value" argument must not be a number');return"undefined"!=typeof ArrayBuffer&&t instanceof ArrayBuffer?function(e,t,n,r){if(t.byteLength,n<0||t.byteLength<n)throw new RangeError("'offset' is out of bounds");if(t.byteLength<n+(r||0))throw new RangeError("'length' is out of bounds");t=void 0===n&&void 0===r?new Uint8Array(t):void 0===r?new Uint8Array(t,n):new Uint8Array(t,n,r);s.TYPED_ARRAY_SUPPORT?(e=t).__proto__=s.prototype:e=f(e,t);return e}(e,t,n,r):"string"==typeof t?function(e,t,n){"string"==typeof n&&""!==n||(n="utf8");if(!s.isEncoding(n))throw new TypeError('"encoding" must be a valid string encoding');var r=0|h(t,n),a=(e=c(e,r)).write(t,n);a!==r&&(e=e.slice(0,a));return e}(e,t,n):function(e,t){if(s.isBuffer(t)){var n=0|d(t.length);return 0===(e=c(e,n)).length||t.copy(e,0,0,n),e}if(t){if("undefined"!=typeof ArrayBuffer&&t.buffer instanceof ArrayBuffer||"length"in t)return"number"!=typeof t.length||(r=t.length)!=r?c(e,0):f(e,t);if("Buffer"===t.type&&o(t.data))return f(e,t.data)}var r;throw new TypeError("First argument must be a string, Buffer, ArrayBuffer, Array, or array-like object.")}(e,t)}function l(e){if("number"!=typeof e)throw new TypeError('"size" argument must be a number');if(e<0)throw new RangeError('"size" argument must not be negative')}function p(e,t){if(l(t),e=c(e,t<0?0:0|d(t)),!s.TYPED_ARRAY_SUPPORT)for(var n=0;n<t;++n)e[n]=0;return e}function f(e,t){var n=t.length<0?0:0|d(t.length);e=c(e,n);for(var r=0;r<n;r+=1)e[r]=255&t[r];return e}function d(e){if(e>=i())throw new RangeError("Attempt to allocate Buffer larger than maximum size: 0x"+i().toString(16)+" bytes");return 0|e}function h(e,t){if(s.isBuffer(e))return e.length;if("undefined"!=typeof ArrayBuffer&&"function"==typeof ArrayBuffer.isView&&(ArrayBuffer.isView(e)||e instanceof ArrayBuffer))return e.byteLength;"string"!=typeof e&&(e=""+e);var n=e.length;if(0===n)return 0;for(var r=!1;;)switch(t){case"ascii":case"latin1":case"binary":return n;case"utf8":case"utf-8":case void 0:return V(e).length;case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return 2*n;case"hex":return n>>>1;case"base64":return z(e).length;default:if(r)return V(e).length;t=(""+t).toLowerCase(),r=!0}}function m(e,t,n){var r=!1;if((void 0===t||t<0)&&(t=0),t>this.length)return"";if((void 0===n||n>this.length)&&(n=this.length),n<=0)return"";if((n>>>=0)<=(t>>>=0))return"";for(e||(e="utf8");;)switch(e){case"hex":return P(this,t,n);case"utf8":case"utf-8":return O(this,t,n);case"ascii":return A(this,t,n);case"latin1":case"binary":return k(this,t,n);case"base64":return C(this,t,n);case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return I(this,t,n);default:if(r)throw new TypeError("Unknown encoding: "+e);e=(e+"").toLowerCase(),r=!0}}function v(e,t,n){var r=e[t];e[t]=e[n],e[n]=r}function g(e,t,n,r,a){if(0===e.length)return-1;if("string"==typeof n?(r=n,n=0):n>2147483647?n=2147483647:n<-2147483648&&(n=-2147483648),n=+n,isNaN(n)&&(n=a?0:e.length-1),n<0&&(n=e.length+n),n>=e.length){if(a)return-1;n=e.length-1}else if(n<0){if(!a)return-1;n=0}if("string"==typeof t&&(t=s.from(t,r)),s.isBuffer(t))return 0===t.length?-1:y(e,t,n,r,a);if("number"==typeof t)return t&=255,s.TYPED_ARRAY_SUPPORT&&"function"==typeof Uint8Array.prototype.indexOf?a?Uint8Array.prototype.indexOf.call(e,t,n):Uint8Array.prototype.lastIndexOf.call(e,t,n):y(e,[t],n,r,a);throw new TypeError("val must be string, number or Buffer")}function y(e,t,n,r,a){var o,i=1,c=e.length,s=t.length;if(void 0!==r&&("ucs2"===(r=String(r).toLowerCase())||"ucs-2"===r||"utf16le"===r||"utf-16le"===r)){if(e.length<2||t.length<2)return-1;i=2,c/=2,s/=2,n/=2}function u(e,t){return 1===i?e[t]:e.readUInt16BE(t*i)}if(a){var l=-1;for(o=n;o<c;o++)if(u(e,o)===u(t,-1===l?0:o-l)){if(-1===l&&(l=o),o-l+1===s)return l*i}else-1!==l&&(o-=o-l),l=-1}else for(n+s>c&&(n=c-s),o=n;o>=0;o--){for(var p=!0,f=0;f<s;f++)if(u(e,o+f)!==u(t,f)){p=!1;break}if(p)return o}return-1}function b(e,t,n,r){n=Number(n)||0;var a=e.length-n;r?(r=Number(r))>a&&(r=a):r=a;var o=t.length;if(o%2!=0)throw new TypeError("Invalid hex string");r>o/2&&(r=o/2);for(var i=0;i<r;++i){var c=parseInt(t.substr(2*i,2),16);if(isNaN(c))return i;e[n+i]=c}return i}function E(e,t,n,r){return F(V(t,e.length-n),e,n,r)}function x(e,t,n,r){return F(function(e){for(var t=[],n=0;n<e.length;++n)t.push(255&e.charCodeAt(n));return t}(t),e,n,r)}function S(e,t,n,r){return x(e,t,n,r)}function w(e,t,n,r){return F(z(t),e,n,r)}function j(e,t,n,r){return F(function(e,t){for(var n,r,a,o=[],i=0;i<e.length&&!((t-=2)<0);++i)r=(n=e.charCodeAt(i))>>8,a=n%256,o.push(a),o.push(r);return o}(t,e.length-n),e,n,r)}function C(e,t,n){return 0===t&&n===e.length?r.fromByteArray(e):r.fromByteArray(e.slice(t,n))}function O(e,t,n){n=Math.min(e.length,n);for(var r=[],a=t;a<n;){var o,i,c,s,u=e[a],l=null,p=u>239?4:u>223?3:u>191?2:1;if(a+p<=n)switch(p){case 1:u<128&&(l=u);break;case 2:128==(192&(o=e[a+1]))&&(s=(31&u)<<6|63&o)>127&&(l=s);break;case 3:o=e[a+1],i=e[a+2],128==(192&o)&&128==(192&i)&&(s=(15&u)<<12|(63&o)<<6|63&i)>2047&&(s<55296||s>57343)&&(l=s);break;case 4:o=e[a+1],i=e[a+2],c=e[a+3],128==(192&o)&&128==(192&i)&&128==(192&c)&&(s=(15&u)<<18|(63&o)<<12|(63&i)<<6|63&c)>65535&&s<1114112&&(l=s)}null===l?(l=65533,p=1):l>65535&&(l-=65536,r.push(l>>>10&1023|55296),l=56320|1023&l),r.push(l),a+=p}return function(e){var t=e.length;if(t<=_)return String.fromCharCode.apply(String,e);var n="",r=0;for(;r<t;)n+=String.fromCharCode.apply(String,e.slice(r,r+=_));return n}(r)}t.Buffer=s,t.SlowBuffer=function(e){+e!=e&&(e=0);return s.alloc(+e)},t.INSPECT_MAX_BYTES=50,s.TYPED_ARRAY_SUPPORT=void 0!==e.TYPED_ARRAY_SUPPORT?e.TYPED_ARRAY_SUPPORT:function(){try{var e=new Uint8Array(1);return e.__proto__={__proto__:Uint8Array.prototype,foo:function(){return 42}},42===e.foo()&&"function"==typeof e.subarray&&0===e.subarray(1,1).byteLength}catch(e){return!1}}(),t.kMaxLength=i(),s.poolSize=8192,s._augment=function(e){return e.__proto__=s.prototype,e},s.from=function(e,t,n){return u(null,e,t,n)},s.TYPED_ARRAY_SUPPORT&&(s.prototype.__proto__=Uint8Array.prototype,s.__proto__=Uint8Array,"undefined"!=typeof Symbol&&Symbol.species&&s[Symbol.species]===s&&Object.defineProperty(s,Symbol.species,{value:null,configurable:!0})),s.alloc=function(e,t,n){return function(e,t,n,r){return l(t),t<=0?c(e,t):void 0!==n?"string"==typeof r?c(e,t).fill(n,r):c(e,t).fill(n):c(e,t)}(null,e,t,n)},s.allocUnsafe=function(e){return p(null,e)},s.allocUnsafeSlow=function(e){return p(null,e)},s.isBuffer=function(e){return!(null==e||!e._isBuffer)},s.compare=function(e,t){if(!s.isBuffer(e)||!s.isBuffer(t))throw new TypeError("Arguments must be Buffers");if(e===t)return 0;for(var n=e.length,r=t.length,a=0,o=Math.min(n,r);a<o;++a)if(e[a]!==t[a]){n=e[a],r=t[a];break}return n<r?-1:r<n?1:0},s.isEncoding=function(e){switch(String(e).toLowerCase()){case"hex":case"utf8":case"utf-8":case"ascii":case"latin1":case"binary":case"base64":case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return!0;default:return!1}},s.concat=function(e,t){if(!o(e))throw new TypeError('"list" argument must be an Array of Buffers');if(0===e.length)return s.alloc(0);var n;if(void 0===t)for(t=0,n=0;n<e.length;++n)t+=e[n].length;var r=s.allocUnsafe(t),a=0;for(n=0;n<e.length;++n){var i=e[n];if(!s.isBuffer(i))throw new TypeError('"list" argument must be an Array of Buffers');i.copy(r,a),a+=i.length}return r},s.byteLength=h,s.prototype._isBuffer=!0,s.prototype.swap16=function(){var e=this.length;if(e%2!=0)throw new RangeError("Buffer size must be a multiple of 16-bits");for(var t=0;t<e;t+=2)v(this,t,t+1);return this},s.prototype.swap32=function(){var e=this.length;if(e%4!=0)throw new RangeError("Buffer size must be a multiple of 32-bits");for(var t=0;t<e;t+=4)v(this,t,t+3),v(this,t+1,t+2);return this},s.prototype.swap64=function(){var e=this.length;if(e%8!=0)throw new RangeError("Buffer size must be a multiple of 64-bits");for(var t=0;t<e;t+=8)v(this,t,t+7),v(this,t+1,t+6),v(this,t+2,t+5),v(this,t+3,t+4);return this},s.prototype.toString=function(){var e=0|this.length;return 0===e?"":0===arguments.length?O(this,0,e):m.apply(this,arguments)},s.prototype.equals=function(e){if(!s.isBuffer(e))throw new TypeError("Argument must be a Buffer");return this===e||0===s.compare(this,e)},s.prototype.inspect=function(){var e="",n=t.INSPECT_MAX_BYTES;return this.length>0&&(e=this.toString("hex",0,n).match(/.{2}/g).join(" "),this.length>n&&(e+=" ... ")),"<Buffer "+e+">"},s.prototype.compare=function(e,t,n,r,a){if(!s.isBuffer(e))throw new TypeError("Argument must be a Buffer");if(void 0===t&&(t=0),void 0===n&&(n=e?e.length:0),void 0===r&&(r=0),void 0===a&&(a=this.length),t<0||n>e.length||r<0||a>this.length)throw new RangeError("out of range index");if(r>=a&&t>=n)return 0;if(r>=a)return-1;if(t>=n)return 1;if(this===e)return 0;for(var o=(a>>>=0)-(r>>>=0),i=(n>>>=0)-(t>>>=0),c=Math.min(o,i),u=this.slice(r,a),l=e.slice(t,n),p=0;p<c;++p)if(u[p]!==l[p]){o=u[p],i=l[p];break}return o<i?-1:i<o?1:0},s.prototype.includes=function(e,t,n){return-1!==this.indexOf(e,t,n)},s.prototype.indexOf=function(e,t,n){return g(this,e,t,n,!0)},s.prototype.lastIndexOf=function(e,t,n){return g(this,e,t,n,!1)},s.prototype.write=function(e,t,n,r){if(void 0===t)r="utf8",n=this.length,t=0;else if(void 0===n&&"string"==typeof t)r=t,n=this.length,t=0;else{if(!isFinite(t))throw new Error("Buffer.write(string, encoding, offset[, length]) is no longer supported");t|=0,isFinite(n)?(n|=0,void 0===r&&(r="utf8")):(r=n,n=void 0)}var a=this.length-t;if((void 0===n||n>a)&&(n=a),e.length>0&&(n<0||t<0)||t>this.length)throw new RangeError("Attempt to write outside buffer bounds");r||(r="utf8");for(var o=!1;;)switch(r){case"hex":return b(this,e,t,n);case"utf8":case"utf-8":return E(this,e,t,n);case"ascii":return x(this,e,t,n);case"latin1":case"binary":return S(this,e,t,n);case"base64":return w(this,e,t,n);case"ucs2":case"ucs-2":case"utf16le":case"utf-16le":return j(this,e,t,n);default:if(o)throw new TypeError("Unknown encoding: "+r);r=(""+r).toLowerCase(),o=!0}},s.prototype.toJSON=function(){return{type:"Buffer",data:Array.prototype.slice.call(this._arr||this,0)}};var _=4096;function A(e,t,n){var r="";n=Math.min(e.length,n);for(var a=t;a<n;++a)r+=String.fromCharCode(127&e[a]);return r}function k(e,t,n){var r="";n=Math.min(e.length,n);for(var a=t;a<n;++a)r+=String.fromCharCode(e[a]);return r}function P(e,t,n){var r=e.length;(!t||t<0)&&(t=0),(!n||n<0||n>r)&&(n=r);for(var a="",o=t;o<n;++o)a+=U(e[o]);return a}function I(e,t,n){for(var r=e.slice(t,n),a="",o=0;o<r.length;o+=2)a+=String.fromCharCode(r[o]+256*r[o+1]);return a}function T(e,t,n){if(e%1!=0||e<0)throw new RangeError("offset is not uint");if(e+t>n)throw new RangeError("Trying to access beyond buffer length")}function N(e,t,n,r,a,o){if(!s.isBuffer(e))throw new TypeError('"buffer" argument must be a Buffer instance');if(t>a||t<o)throw new RangeError('"value" argument is out of bounds');if(n+r>e.length)throw new RangeError("Index out of range")}function R(e,t,n,r){t<0&&(t=65535+t+1);for(var a=0,o=Math.min(e.length-n,2);a<o;++a)e[n+a]=(t&255<<8*(r?a:1-a))>>>8*(r?a:1-a)}function M(e,t,n,r){t<0&&(t=4294967295+t+1);for(var a=0,o=Math.min(e.length-n,4);a<o;++a)e[n+a]=t>>>8*(r?a:3-a)&255}function D(e,t,n,r,a,o){if(n+r>e.length)throw new RangeError("Index out of range");if(n<0)throw new RangeError("Index out of range")}function q(e,t,n,r,o){return o||D(e,0,n,4),a.write(e,t,n,r,23,4),n+4}function L(e,t,n,r,o){return o||D(e,0,n,8),a.write(e,t,n,r,52,8),n+8}s.prototype.slice=function(e,t){var n,r=this.length;if((e=~~e)<0?(e+=r)<0&&(e=0):e>r&&(e=r),(t=void 0===t?r:~~t)<0?(t+=r)<0&&(t=0):t>r&&(t=r),t<e&&(t=e),s.TYPED_ARRAY_SUPPORT)(n=this.subarray(e,t)).__proto__=s.prototype;else{var a=t-e;n=new s(a,void 0);for(var o=0;o<a;++o)n[o]=this[o+e]}return n},s.prototype.readUIntLE=function(e,t,n){e|=0,t|=0,n||T(e,t,this.length);for(var r=this[e],a=1,o=0;++o<t&&(a*=256);)r+=this[e+o]*a;return r},s.prototype.readUIntBE=function(e,t,n){e|=0,t|=0,n||T(e,t,this.length);for(var r=this[e+--t],a=1;t>0&&(a*=256);)r+=this[e+--t]*a;return r},s.prototype.readUInt8=function(e,t){return t||T(e,1,this.length),this[e]},s.prototype.readUInt16LE=function(e,t){return t||T(e,2,this.length),this[e]|this[e+1]<<8},s.prototype.readUInt16BE=function(e,t){return t||T(e,2,this.length),this[e]<<8|this[e+1]},s.prototype.readUInt32LE=function(e,t){return t||T(e,4,this.length),(this[e]|this[e+1]<<8|this[e+2]<<16)+16777216*this[e+3]},s.prototype.readUInt32BE=function(e,t){return t||T(e,4,this.length),16777216*this[e]+(this[e+1]<<16|this[e+2]<<8|this[e+3])},s.prototype.readIntLE=function(e,t,n){e|=0,t|=0,n||T(e,t,this.length);for(var r=this[e],a=1,o=0;++o<t&&(a*=256);)r+=this[e+o]*a;return r>=(a*=128)&&(r-=Math.pow(2,8*t)),r},s.prototype.readIntBE=function(e,t,n){e|=0,t|=0,n||T(e,t,this.length);for(var r=t,a=1,o=this[e+--r];r>0&&(a*=256);)o+=this[e+--r]*a;return o>=(a*=128)&&(o-=Math.pow(2,8*t)),o},s.prototype.readInt8=function(e,t){return t||T(e,1,this.length),128&this[e]?-1*(255-this[e]+1):this[e]},s.prototype.readInt16LE=function(e,t){t||T(e,2,this.length);var n=this[e]|this[e+1]<<8;return 32768&n?4294901760|n:n},s.prototype.readInt16BE=function(e,t){t||T(e,2,this.length);var n=this[e+1]|this[e]<<8;return 32768&n?4294901760|n:n},s.prototype.readInt32LE=function(e,t){return t||T(e,4,this.length),this[e]|this[e+1]<<8|this[e+2]<<16|this[e+3]<<24},s.prototype.readInt32BE=function(e,t){return t||T(e,4,this.length),this[e]<<24|this[e+1]<<16|this[e+2]<<8|this[e+3]},s.prototype.readFloatLE=function(e,t){return t||T(e,4,this.length),a.read(this,e,!0,23,4)},s.prototype.readFloatBE=function(e,t){return t||T(e,4,this.length),a.read(this,e,!1,23,4)},s.prototype.readDoubleLE=function(e,t){return t||T(e,8,this.length),a.read(this,e,!0,52,8)},s.prototype.readDoubleBE=function(e,t){return t||T(e,8,this.length),a.read(this,e,!1,52,8)},s.prototype.writeUIntLE=function(e,t,n,r){(e=+e,t|=0,n|=0,r)||N(this,e,t,n,Math.pow(2,8*n)-1,0);var a=1,o=0;for(this[t]=255&e;++o<n&&(a*=256);)this[t+o]=e/a&255;return t+n},s.prototype.writeUIntBE=function(e,t,n,r){(e=+e,t|=0,n|=0,r)||N(this,e,t,n,Math.pow(2,8*n)-1,0);var a=n-1,o=1;for(this[t+a]=255&e;--a>=0&&(o*=256);)this[t+a]=e/o&255;return t+n},s.prototype.writeUInt8=function(e,t,n){return e=+e,t|=0,n||N(this,e,t,1,255,0),s.TYPED_ARRAY_SUPPORT||(e=Math.floor(e)),this[t]=255&e,t+1},s.prototype.writeUInt16LE=function(e,t,n){return e=+e,t|=0,n||N(this,e,t,2,65535,0),s.TYPED_ARRAY_SUPPORT?(this[t]=255&e,this[t+1]=e>>>8):R(this,e,t,!0),t+2},s.prototype.writeUInt16BE=function(e,t,n){return e=+e,t|=0,n||N(this,e,t,2,65535,0),s.TYPED_ARRAY_SUPPORT?(this[t]=e>>>8,this[t+1]=255&e):R(this,e,t,!1),t+2},s.prototype.writeUInt32LE=function(e,t,n){return e=+e,t|=0,n||N(this,e,t,4,4294967295,0),s.TYPED_ARRAY_SUPPORT?(this[t+3]=e>>>24,this[t+2]=e>>>16,this[t+1]=e>>>8,this[t]=255&e):M(this,e,t,!0),t+4},s.prototype.writeUInt32BE=function(e,t,n){return e=+e,t|=0,n||N(this,e,t,4,4294967295,0),s.TYPED_ARRAY_SUPPORT?(this[t]=e>>>24,this[t+1]=e>>>16,this[t+2]=e>>>8,this[t+3]=255&e):M(this,e,t,!1),t+4},s.prototype.writeIntLE=function(e,t,n,r){if(e=+e,t|=0,!r){var a=Math.pow(2,8*n-1);N(this,e,t,n,a-1,-a)}var o=0,i=1,c=0;for(this[t]=255&e;++o<n&&(i*=256);)e<0&&0===c&&0!==this[t+o-1]&&(c=1),this[t+o]=(e/i>>0)-c&255;return t+n},s.prototype.writeIntBE=function(e,t,n,r){if(e=+e,t|=0,!r){var a=Math.pow(2,8*n-1);N(this,e,t,n,a-1,-a)}var o=n-1,i=1,c=0;for(this[t+o]=255&e;--o>=0&&(i*=256);)e<0&&0===c&&0!==this[t+o+1]&&(c=1),this[t+o]=(e/i>>0)-c&255;return t+n},s.prototype.writeInt8=function(e,t,n){return e=+e,t|=0,n||N(this,e,t,1,127,-128),s.TYPED_ARRAY_SUPPORT||(e=Math.floor(e)),e<0&&(e=255+e+1),this[t]=255&e,t+1},s.prototype.writeInt16LE=function(e,t,n){return e=+e,t|=0,n||N(this,e,t,2,32767,-32768),s.TYPED_ARRAY_SUPPORT?(this[t]=255&e,this[t+1]=e>>>8):R(this,e,t,!0),t+2},s.prototype.writeInt16BE=function(e,t,n){return e=+e,t|=0,n||N(this,e,t,2,32767,-32768),s.TYPED_ARRAY_SUPPORT?(this[t]=e>>>8,this[t+1]=255&e):R(this,e,t,!1),t+2},s.prototype.writeInt32LE=function(e,t,n){return e=+e,t|=0,n||N(this,e,t,4,2147483647,-2147483648),s.TYPED_ARRAY_SUPPORT?(this[t]=255&e,this[t+1]=e>>>8,this[t+2]=e>>>16,this[t+3]=e>>>24):M(this,e,t,!0),t+4},s.prototype.writeInt32BE=function(e,t,n){return e=+e,t|=0,n||N(this,e,t,4,2147483647,-2147483648),e<0&&(e=4294967295+e+1),s.TYPED_ARRAY_SUPPORT?(this[t]=e>>>24,this[t+1]=e>>>16,this[t+2]=e>>>8,this[t+3]=255&e):M(this,e,t,!1),t+4},s.prototype.writeFloatLE=function(e,t,n){return q(this,e,t,!0,n)},s.prototype.writeFloatBE=function(e,t,n){return q(this,e,t,!1,n)},s.prototype.writeDoubleLE=function(e,t,n){return L(this,e,t,!0,n)},s.prototype.writeDoubleBE=function(e,t,n){return L(this,e,t,!1,n)},s.prototype.copy=function(e,t,n,r){if(n||(n=0),r||0===r||(r=this.length),t>=e.length&&(t=e.length),t||(t=0),r>0&&r<n&&(r=n),r===n)return 0;if(0===e.length||0===this.length)return 0;if(t<0)throw new RangeError("targetStart out of bounds");if(n<0||n>=this.length)throw new RangeError("sourceStart out of bounds");if(r<0)throw new RangeError("sourceEnd out of bounds");r>this.length&&(r=this.length),e.length-t<r-n&&(r=e.length-t+n);var a,o=r-n;if(this===e&&n<t&&t<r)for(a=o-1;a>=0;--a)e[a+t]=this[a+n];else if(o<1e3||!s.TYPED_ARRAY_SUPPORT)for(a=0;a<o;++a)e[a+t]=this[a+n];else Uint8Array.prototype.set.call(e,this.subarray(n,n+o),t);return o},s.prototype.fill=function(e,t,n,r){if("string"==typeof e){if("string"==typeof t?(r=t,t=0,n=this.length):"string"==typeof n&&(r=n,n=this.length),1===e.length){var a=e.charCodeAt(0);a<256&&(e=a)}if(void 0!==r&&"string"!=typeof r)throw new TypeError("encoding must be a string");if("string"==typeof r&&!s.isEncoding(r))throw new TypeError("Unknown encoding: "+r)}else"number"==typeof e&&(e&=255);if(t<0||this.length<t||this.length<n)throw new RangeError("Out of range index");if(n<=t)return this;var o;if(t>>>=0,n=void 0===n?this.length:n>>>0,e||(e=0),"number"==typeof e)for(o=t;o<n;++o)this[o]=e;else{var i=s.isBuffer(e)?e:V(new s(e,r).toString()),c=i.length;for(o=0;o<n-t;++o)this[o+t]=i[o%c]}return this};var B=/[^+\/0-9A-Za-z-_]/g;function U(e){return e<16?"0"+e.toString(16):e.toString(16)}function V(e,t){var n;t=t||1/0;for(var r=e.length,a=null,o=[],i=0;i<r;++i){if((n=e.charCodeAt(i))>55295&&n<57344){if(!a){if(n>56319){(t-=3)>-1&&o.push(239,191,189);continue}if(i+1===r){(t-=3)>-1&&o.push(239,191,189);continue}a=n;continue}if(n<56320){(t-=3)>-1&&o.push(239,191,189),a=n;continue}n=65536+(a-55296<<10|n-56320)}else a&&(t-=3)>-1&&o.push(239,191,189);if(a=null,n<128){if((t-=1)<0)break;o.push(n)}else if(n<2048){if((t-=2)<0)break;o.push(n>>6|192,63&n|128)}else if(n<65536){if((t-=3)<0)break;o.push(n>>12|224,n>>6&63|128,63&n|128)}else{if(!(n<1114112))throw new Error("Invalid code point");if((t-=4)<0)break;o.push(n>>18|240,n>>12&63|128,n>>6&63|128,63&n|128)}}return o}function z(e){return r.toByteArray(function(e){if((e=function(e){return e.trim?e.trim():e.replace(/^\s+|\s+$/g,"")}(e).replace(B,"")).length<2)return"";for(;e.length%4!=0;)e+="=";return e}(e))}function F(e,t,n,r){for(var a=0;a<r&&!(a+n>=t.length||a>=e.length);++a)t[a+n]=e[a];return a}}).call(this,n(171))},function(e,t){e.exports=require("base64-js")},function(e,t){e.exports=require("ieee754")},function(e,t){e.exports=require("isarray")},function(e,t,n){var r=n(475);e.exports=r},function(e,t,n){var r=n(476),a=String.prototype;e.exports=function(e){var t=e.trim;return"string"==typeof e||e===a||e instanceof String&&t===a.trim?r:t}},function(e,t,n){n(477);var r=n(38);e.exports=r("String").trim},function(e,t,n){"use strict";var r=n(24),a=n(478).trim;r({target:"String",proto:!0,forced:n(479)("trim")},{trim:function(){return a(this)}})},function(e,t,n){var r=n(103),a="["+n(300)+"]",o=RegExp("^"+a+a+"*"),i=RegExp(a+a+"*$"),c=function(e){return function(t){var n=String(r(t));return 1&e&&(n=n.replace(o,"")),2&e&&(n=n.replace(i,"")),n}};e.exports={start:c(1),end:c(2),trim:c(3)}},function(e,t,n){var r=n(33),a=n(300);e.exports=function(e){return r((function(){return!!a[e]()||"​᠎"!="​᠎"[e]()||a[e].name!==e}))}},function(e,t,n){var r=n(481);e.exports=r},function(e,t,n){var r=n(482),a=String.prototype;e.exports=function(e){var t=e.startsWith;return"string"==typeof e||e===a||e instanceof String&&t===a.startsWith?r:t}},function(e,t,n){n(483);var r=n(38);e.exports=r("String").startsWith},function(e,t,n){"use strict";var r,a=n(24),o=n(88).f,i=n(68),c=n(301),s=n(103),u=n(302),l=n(80),p="".startsWith,f=Math.min,d=u("startsWith");a({target:"String",proto:!0,forced:!!(l||d||(r=o(String.prototype,"startsWith"),!r||r.writable))&&!d},{startsWith:function(e){var t=String(s(this));c(e);var n=i(f(arguments.length>1?arguments[1]:void 0,t.length)),r=String(e);return p?p.call(t,r,n):t.slice(n,n+r.length)===r}})},function(e,t,n){var r=n(40),a=n(90),o=n(36)("match");e.exports=function(e){var t;return r(e)&&(void 0!==(t=e[o])?!!t:"RegExp"==a(e))}},function(e,t,n){var r=n(486);e.exports=r},function(e,t,n){var r=n(487),a=Array.prototype;e.exports=function(e){var t=e.find;return e===a||e instanceof Array&&t===a.find?r:t}},function(e,t,n){n(488);var r=n(38);e.exports=r("Array").find},function(e,t,n){"use strict";var r=n(24),a=n(75).find,o=n(183),i=n(56),c="find",s=!0,u=i(c);c in[]&&Array(1).find((function(){s=!1})),r({target:"Array",proto:!0,forced:s||!u},{find:function(e){return a(this,e,arguments.length>1?arguments[1]:void 0)}}),o(c)},function(e,t,n){var r=n(303);e.exports=r},function(e,t,n){n(491);var r=n(38);e.exports=r("Array").indexOf},function(e,t,n){"use strict";var r=n(24),a=n(173).indexOf,o=n(95),i=n(56),c=[].indexOf,s=!!c&&1/[1].indexOf(1,-0)<0,u=o("indexOf"),l=i("indexOf",{ACCESSORS:!0,1:0});r({target:"Array",proto:!0,forced:s||!u||!l},{indexOf:function(e){return s?c.apply(this,arguments)||0:a(this,e,arguments.length>1?arguments[1]:void 0)}})},function(e,t,n){var r=n(190),a=n(304);e.exports=function(e){if(r(e))return a(e)}},function(e,t,n){var r=n(294);e.exports=r},function(e,t,n){var r=n(307);e.exports=r},function(e,t,n){var r=n(24),a=n(308);r({target:"Array",stat:!0,forced:!n(311)((function(e){Array.from(e)}))},{from:a})},function(e,t,n){n(64),n(81);var r=n(497);e.exports=r},function(e,t,n){var r=n(74),a=n(36),o=n(93),i=a("iterator");e.exports=function(e){var t=Object(e);return void 0!==t[i]||"@@iterator"in t||o.hasOwnProperty(r(t))}},function(e,t,n){e.exports=n(499)},function(e,t,n){var r=n(296);e.exports=r},function(e,t){e.exports=function(){throw new TypeError("Invalid attempt to spread non-iterable instance.\nIn order to be iterable, non-array objects must have a [Symbol.iterator]() method.")}},function(e,t,n){var r=n(502);e.exports=r},function(e,t,n){var r=n(503),a=n(505),o=Array.prototype,i=String.prototype;e.exports=function(e){var t=e.includes;return e===o||e instanceof Array&&t===o.includes?r:"string"==typeof e||e===i||e instanceof String&&t===i.includes?a:t}},function(e,t,n){n(504);var r=n(38);e.exports=r("Array").includes},function(e,t,n){"use strict";var r=n(24),a=n(173).includes,o=n(183);r({target:"Array",proto:!0,forced:!n(56)("indexOf",{ACCESSORS:!0,1:0})},{includes:function(e){return a(this,e,arguments.length>1?arguments[1]:void 0)}}),o("includes")},function(e,t,n){n(506);var r=n(38);e.exports=r("String").includes},function(e,t,n){"use strict";var r=n(24),a=n(301),o=n(103);r({target:"String",proto:!0,forced:!n(302)("includes")},{includes:function(e){return!!~String(o(this)).indexOf(a(e),arguments.length>1?arguments[1]:void 0)}})},function(e,t,n){var r=n(508);e.exports=r},function(e,t,n){var r=n(509),a=Array.prototype;e.exports=function(e){var t=e.some;return e===a||e instanceof Array&&t===a.some?r:t}},function(e,t,n){n(510);var r=n(38);e.exports=r("Array").some},function(e,t,n){"use strict";var r=n(24),a=n(75).some,o=n(95),i=n(56),c=o("some"),s=i("some");r({target:"Array",proto:!0,forced:!c||!s},{some:function(e){return a(this,e,arguments.length>1?arguments[1]:void 0)}})},function(e,t,n){var r=n(314),a=n(312),o=n(137);e.exports=function(e,t){if(void 0!==o&&a(Object(e))){var n=[],i=!0,c=!1,s=void 0;try{for(var u,l=r(e);!(i=(u=l.next()).done)&&(n.push(u.value),!t||n.length!==t);i=!0);}catch(e){c=!0,s=e}finally{try{i||null==l.return||l.return()}finally{if(c)throw s}}return n}}},function(e,t,n){n(64),n(81);var r=n(315);e.exports=r},function(e,t,n){var r=n(514);e.exports=r},function(e,t,n){var r=n(515),a=Array.prototype;e.exports=function(e){var t=e.sort;return e===a||e instanceof Array&&t===a.sort?r:t}},function(e,t,n){n(516);var r=n(38);e.exports=r("Array").sort},function(e,t,n){"use strict";var r=n(24),a=n(67),o=n(62),i=n(33),c=n(95),s=[],u=s.sort,l=i((function(){s.sort(void 0)})),p=i((function(){s.sort(null)})),f=c("sort");r({target:"Array",proto:!0,forced:l||!p||!f},{sort:function(e){return void 0===e?u.call(o(this)):u.call(o(this),a(e))}})},function(e,t,n){var r=n(518);e.exports=r},function(e,t,n){n(519);var r=n(38);e.exports=r("Array").forEach},function(e,t,n){"use strict";var r=n(24),a=n(520);r({target:"Array",proto:!0,forced:[].forEach!=a},{forEach:a})},function(e,t,n){"use strict";var r=n(75).forEach,a=n(95),o=n(56),i=a("forEach"),c=o("forEach");e.exports=i&&c?[].forEach:function(e){return r(this,e,arguments.length>1?arguments[1]:void 0)}},function(e,t,n){e.exports=n(522)},function(e,t,n){n(64),n(81);var r=n(123);e.exports=r},function(e,t,n){n(64);var r=n(524),a=n(74),o=Array.prototype,i={DOMTokenList:!0,NodeList:!0};e.exports=function(e){var t=e.entries;return e===o||e instanceof Array&&t===o.entries||i.hasOwnProperty(a(e))?r:t}},function(e,t,n){var r=n(525);e.exports=r},function(e,t,n){n(119);var r=n(38);e.exports=r("Array").entries},function(e,t,n){var r=n(77),a=n(206);e.exports=function(e){return a(r(e).toLowerCase())}},function(e,t,n){var r=n(104),a=Object.prototype,o=a.hasOwnProperty,i=a.toString,c=r?r.toStringTag:void 0;e.exports=function(e){var t=o.call(e,c),n=e[c];try{e[c]=void 0;var r=!0}catch(e){}var a=i.call(e);return r&&(t?e[c]=n:delete e[c]),a}},function(e,t){var n=Object.prototype.toString;e.exports=function(e){return n.call(e)}},function(e,t,n){var r=n(530),a=n(322),o=n(531),i=n(77);e.exports=function(e){return function(t){t=i(t);var n=a(t)?o(t):void 0,c=n?n[0]:t.charAt(0),s=n?r(n,1).join(""):t.slice(1);return c[e]()+s}}},function(e,t,n){var r=n(321);e.exports=function(e,t,n){var a=e.length;return n=void 0===n?a:n,!t&&n>=a?e:r(e,t,n)}},function(e,t,n){var r=n(532),a=n(322),o=n(533);e.exports=function(e){return a(e)?o(e):r(e)}},function(e,t){e.exports=function(e){return e.split("")}},function(e,t){var n="[\\ud800-\\udfff]",r="[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]",a="\\ud83c[\\udffb-\\udfff]",o="[^\\ud800-\\udfff]",i="(?:\\ud83c[\\udde6-\\uddff]){2}",c="[\\ud800-\\udbff][\\udc00-\\udfff]",s="(?:"+r+"|"+a+")"+"?",u="[\\ufe0e\\ufe0f]?",l=u+s+("(?:\\u200d(?:"+[o,i,c].join("|")+")"+u+s+")*"),p="(?:"+[o+r+"?",r,i,c,n].join("|")+")",f=RegExp(a+"(?="+a+")|"+p+l,"g");e.exports=function(e){return e.match(f)||[]}},function(e,t,n){var r=n(323),a=n(535),o=n(538),i=RegExp("['’]","g");e.exports=function(e){return function(t){return r(o(a(t).replace(i,"")),e,"")}}},function(e,t,n){var r=n(536),a=n(77),o=/[\xc0-\xd6\xd8-\xf6\xf8-\xff\u0100-\u017f]/g,i=RegExp("[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]","g");e.exports=function(e){return(e=a(e))&&e.replace(o,r).replace(i,"")}},function(e,t,n){var r=n(537)({"À":"A","Á":"A","Â":"A","Ã":"A","Ä":"A","Å":"A","à":"a","á":"a","â":"a","ã":"a","ä":"a","å":"a","Ç":"C","ç":"c","Ð":"D","ð":"d","È":"E","É":"E","Ê":"E","Ë":"E","è":"e","é":"e","ê":"e","ë":"e","Ì":"I","Í":"I","Î":"I","Ï":"I","ì":"i","í":"i","î":"i","ï":"i","Ñ":"N","ñ":"n","Ò":"O","Ó":"O","Ô":"O","Õ":"O","Ö":"O","Ø":"O","ò":"o","ó":"o","ô":"o","õ":"o","ö":"o","ø":"o","Ù":"U","Ú":"U","Û":"U","Ü":"U","ù":"u","ú":"u","û":"u","ü":"u","Ý":"Y","ý":"y","ÿ":"y","Æ":"Ae","æ":"ae","Þ":"Th","þ":"th","ß":"ss","Ā":"A","Ă":"A","Ą":"A","ā":"a","ă":"a","ą":"a","Ć":"C","Ĉ":"C","Ċ":"C","Č":"C","ć":"c","ĉ":"c","ċ":"c","č":"c","Ď":"D","Đ":"D","ď":"d","đ":"d","Ē":"E","Ĕ":"E","Ė":"E","Ę":"E","Ě":"E","ē":"e","ĕ":"e","ė":"e","ę":"e","ě":"e","Ĝ":"G","Ğ":"G","Ġ":"G","Ģ":"G","ĝ":"g","ğ":"g","ġ":"g","ģ":"g","Ĥ":"H","Ħ":"H","ĥ":"h","ħ":"h","Ĩ":"I","Ī":"I","Ĭ":"I","Į":"I","İ":"I","ĩ":"i","ī":"i","ĭ":"i","į":"i","ı":"i","Ĵ":"J","ĵ":"j","Ķ":"K","ķ":"k","ĸ":"k","Ĺ":"L","Ļ":"L","Ľ":"L","Ŀ":"L","Ł":"L","ĺ":"l","ļ":"l","ľ":"l","ŀ":"l","ł":"l","Ń":"N","Ņ":"N","Ň":"N","Ŋ":"N","ń":"n","ņ":"n","ň":"n","ŋ":"n","Ō":"O","Ŏ":"O","Ő":"O","ō":"o","ŏ":"o","ő":"o","Ŕ":"R","Ŗ":"R","Ř":"R","ŕ":"r","ŗ":"r","ř":"r","Ś":"S","Ŝ":"S","Ş":"S","Š":"S","ś":"s","ŝ":"s","ş":"s","š":"s","Ţ":"T","Ť":"T","Ŧ":"T","ţ":"t","ť":"t","ŧ":"t","Ũ":"U","Ū":"U","Ŭ":"U","Ů":"U","Ű":"U","Ų":"U","ũ":"u","ū":"u","ŭ":"u","ů":"u","ű":"u","ų":"u","Ŵ":"W","ŵ":"w","Ŷ":"Y","ŷ":"y","Ÿ":"Y","Ź":"Z","Ż":"Z","Ž":"Z","ź":"z","ż":"z","ž":"z","Ĳ":"IJ","ĳ":"ij","Œ":"Oe","œ":"oe","ŉ":"'n","ſ":"s"});e.exports=r},function(e,t){e.exports=function(e){return function(t){return null==e?void 0:e[t]}}},function(e,t,n){var r=n(539),a=n(540),o=n(77),i=n(541);e.exports=function(e,t,n){return e=o(e),void 0===(t=n?void 0:t)?a(e)?i(e):r(e):e.match(t)||[]}},function(e,t){var n=/[^\x00-\x2f\x3a-\x40\x5b-\x60\x7b-\x7f]+/g;e.exports=function(e){return e.match(n)||[]}},function(e,t){var n=/[a-z][A-Z]|[A-Z]{2}[a-z]|[0-9][a-zA-Z]|[a-zA-Z][0-9]|[^a-zA-Z0-9 ]/;e.exports=function(e){return n.test(e)}},function(e,t){var n="\\u2700-\\u27bf",r="a-z\\xdf-\\xf6\\xf8-\\xff",a="A-Z\\xc0-\\xd6\\xd8-\\xde",o="\\xac\\xb1\\xd7\\xf7\\x00-\\x2f\\x3a-\\x40\\x5b-\\x60\\x7b-\\xbf\\u2000-\\u206f \\t\\x0b\\f\\xa0\\ufeff\\n\\r\\u2028\\u2029\\u1680\\u180e\\u2000\\u2001\\u2002\\u2003\\u2004\\u2005\\u2006\\u2007\\u2008\\u2009\\u200a\\u202f\\u205f\\u3000",i="["+o+"]",c="\\d+",s="[\\u2700-\\u27bf]",u="["+r+"]",l="[^\\ud800-\\udfff"+o+c+n+r+a+"]",p="(?:\\ud83c[\\udde6-\\uddff]){2}",f="[\\ud800-\\udbff][\\udc00-\\udfff]",d="["+a+"]",h="(?:"+u+"|"+l+")",m="(?:"+d+"|"+l+")",v="(?:['’](?:d|ll|m|re|s|t|ve))?",g="(?:['’](?:D|LL|M|RE|S|T|VE))?",y="(?:[\\u0300-\\u036f\\ufe20-\\ufe2f\\u20d0-\\u20ff]|\\ud83c[\\udffb-\\udfff])?",b="[\\ufe0e\\ufe0f]?",E=b+y+("(?:\\u200d(?:"+["[^\\ud800-\\udfff]",p,f].join("|")+")"+b+y+")*"),x="(?:"+[s,p,f].join("|")+")"+E,S=RegExp([d+"?"+u+"+"+v+"(?="+[i,d,"$"].join("|")+")",m+"+"+g+"(?="+[i,d+h,"$"].join("|")+")",d+"?"+h+"+"+v,d+"+"+g,"\\d*(?:1ST|2ND|3RD|(?![123])\\dTH)(?=\\b|[a-z_])","\\d*(?:1st|2nd|3rd|(?![123])\\dth)(?=\\b|[A-Z_])",c,x].join("|"),"g");e.exports=function(e){return e.match(S)||[]}},function(e,t,n){var r=n(543),a=n(142),o=n(192);e.exports=function(){this.size=0,this.__data__={hash:new r,map:new(o||a),string:new r}}},function(e,t,n){var r=n(544),a=n(549),o=n(550),i=n(551),c=n(552);function s(e){var t=-1,n=null==e?0:e.length;for(this.clear();++t<n;){var r=e[t];this.set(r[0],r[1])}}s.prototype.clear=r,s.prototype.delete=a,s.prototype.get=o,s.prototype.has=i,s.prototype.set=c,e.exports=s},function(e,t,n){var r=n(141);e.exports=function(){this.__data__=r?r(null):{},this.size=0}},function(e,t,n){var r=n(58),a=n(546),o=n(52),i=n(324),c=/^\[object .+?Constructor\]$/,s=Function.prototype,u=Object.prototype,l=s.toString,p=u.hasOwnProperty,f=RegExp("^"+l.call(p).replace(/[\\^$.*+?()[\]{}|]/g,"\\$&").replace(/hasOwnProperty|(function).*?(?=\\\()| for .+?(?=\\\])/g,"$1.*?")+"$");e.exports=function(e){return!(!o(e)||a(e))&&(r(e)?f:c).test(i(e))}},function(e,t,n){var r,a=n(547),o=(r=/[^.]+$/.exec(a&&a.keys&&a.keys.IE_PROTO||""))?"Symbol(src)_1."+r:"";e.exports=function(e){return!!o&&o in e}},function(e,t,n){var r=n(65)["__core-js_shared__"];e.exports=r},function(e,t){e.exports=function(e,t){return null==e?void 0:e[t]}},function(e,t){e.exports=function(e){var t=this.has(e)&&delete this.__data__[e];return this.size-=t?1:0,t}},function(e,t,n){var r=n(141),a=Object.prototype.hasOwnProperty;e.exports=function(e){var t=this.__data__;if(r){var n=t[e];return"__lodash_hash_undefined__"===n?void 0:n}return a.call(t,e)?t[e]:void 0}},function(e,t,n){var r=n(141),a=Object.prototype.hasOwnProperty;e.exports=function(e){var t=this.__data__;return r?void 0!==t[e]:a.call(t,e)}},function(e,t,n){var r=n(141);e.exports=function(e,t){var n=this.__data__;return this.size+=this.has(e)?0:1,n[e]=r&&void 0===t?"__lodash_hash_undefined__":t,this}},function(e,t){e.exports=function(){this.__data__=[],this.size=0}},function(e,t,n){var r=n(143),a=Array.prototype.splice;e.exports=function(e){var t=this.__data__,n=r(t,e);return!(n<0)&&(n==t.length-1?t.pop():a.call(t,n,1),--this.size,!0)}},function(e,t,n){var r=n(143);e.exports=function(e){var t=this.__data__,n=r(t,e);return n<0?void 0:t[n][1]}},function(e,t,n){var r=n(143);e.exports=function(e){return r(this.__data__,e)>-1}},function(e,t,n){var r=n(143);e.exports=function(e,t){var n=this.__data__,a=r(n,e);return a<0?(++this.size,n.push([e,t])):n[a][1]=t,this}},function(e,t,n){var r=n(144);e.exports=function(e){var t=r(this,e).delete(e);return this.size-=t?1:0,t}},function(e,t){e.exports=function(e){var t=typeof e;return"string"==t||"number"==t||"symbol"==t||"boolean"==t?"__proto__"!==e:null===e}},function(e,t,n){var r=n(144);e.exports=function(e){return r(this,e).get(e)}},function(e,t,n){var r=n(144);e.exports=function(e){return r(this,e).has(e)}},function(e,t,n){var r=n(144);e.exports=function(e,t){var n=r(this,e),a=n.size;return n.set(e,t),this.size+=n.size==a?0:1,this}},function(e,t,n){var r=n(145),a=n(105),o=n(98);e.exports=function(e){return function(t,n,i){var c=Object(t);if(!a(t)){var s=r(n,3);t=o(t),n=function(e){return s(c[e],e,c)}}var u=e(t,n,i);return u>-1?c[s?t[u]:u]:void 0}}},function(e,t,n){var r=n(565),a=n(591),o=n(336);e.exports=function(e){var t=a(e);return 1==t.length&&t[0][2]?o(t[0][0],t[0][1]):function(n){return n===e||r(n,e,t)}}},function(e,t,n){var r=n(193),a=n(325);e.exports=function(e,t,n,o){var i=n.length,c=i,s=!o;if(null==e)return!c;for(e=Object(e);i--;){var u=n[i];if(s&&u[2]?u[1]!==e[u[0]]:!(u[0]in e))return!1}for(;++i<c;){var l=(u=n[i])[0],p=e[l],f=u[1];if(s&&u[2]){if(void 0===p&&!(l in e))return!1}else{var d=new r;if(o)var h=o(p,f,l,e,t,d);if(!(void 0===h?a(f,p,3,o,d):h))return!1}}return!0}},function(e,t,n){var r=n(142);e.exports=function(){this.__data__=new r,this.size=0}},function(e,t){e.exports=function(e){var t=this.__data__,n=t.delete(e);return this.size=t.size,n}},function(e,t){e.exports=function(e){return this.__data__.get(e)}},function(e,t){e.exports=function(e){return this.__data__.has(e)}},function(e,t,n){var r=n(142),a=n(192),o=n(191);e.exports=function(e,t){var n=this.__data__;if(n instanceof r){var i=n.__data__;if(!a||i.length<199)return i.push([e,t]),this.size=++n.size,this;n=this.__data__=new o(i)}return n.set(e,t),this.size=n.size,this}},function(e,t,n){var r=n(193),a=n(326),o=n(576),i=n(579),c=n(148),s=n(48),u=n(197),l=n(333),p="[object Arguments]",f="[object Array]",d="[object Object]",h=Object.prototype.hasOwnProperty;e.exports=function(e,t,n,m,v,g){var y=s(e),b=s(t),E=y?f:c(e),x=b?f:c(t),S=(E=E==p?d:E)==d,w=(x=x==p?d:x)==d,j=E==x;if(j&&u(e)){if(!u(t))return!1;y=!0,S=!1}if(j&&!S)return g||(g=new r),y||l(e)?a(e,t,n,m,v,g):o(e,t,E,n,m,v,g);if(!(1&n)){var C=S&&h.call(e,"__wrapped__"),O=w&&h.call(t,"__wrapped__");if(C||O){var _=C?e.value():e,A=O?t.value():t;return g||(g=new r),v(_,A,n,m,g)}}return!!j&&(g||(g=new r),i(e,t,n,m,v,g))}},function(e,t,n){var r=n(191),a=n(573),o=n(574);function i(e){var t=-1,n=null==e?0:e.length;for(this.__data__=new r;++t<n;)this.add(e[t])}i.prototype.add=i.prototype.push=a,i.prototype.has=o,e.exports=i},function(e,t){e.exports=function(e){return this.__data__.set(e,"__lodash_hash_undefined__"),this}},function(e,t){e.exports=function(e){return this.__data__.has(e)}},function(e,t){e.exports=function(e,t){return e.has(t)}},function(e,t,n){var r=n(104),a=n(328),o=n(100),i=n(326),c=n(577),s=n(578),u=r?r.prototype:void 0,l=u?u.valueOf:void 0;e.exports=function(e,t,n,r,u,p,f){switch(n){case"[object DataView]":if(e.byteLength!=t.byteLength||e.byteOffset!=t.byteOffset)return!1;e=e.buffer,t=t.buffer;case"[object ArrayBuffer]":return!(e.byteLength!=t.byteLength||!p(new a(e),new a(t)));case"[object Boolean]":case"[object Date]":case"[object Number]":return o(+e,+t);case"[object Error]":return e.name==t.name&&e.message==t.message;case"[object RegExp]":case"[object String]":return e==t+"";case"[object Map]":var d=c;case"[object Set]":var h=1&r;if(d||(d=s),e.size!=t.size&&!h)return!1;var m=f.get(e);if(m)return m==t;r|=2,f.set(e,t);var v=i(d(e),d(t),r,u,p,f);return f.delete(e),v;case"[object Symbol]":if(l)return l.call(e)==l.call(t)}return!1}},function(e,t){e.exports=function(e){var t=-1,n=Array(e.size);return e.forEach((function(e,r){n[++t]=[r,e]})),n}},function(e,t){e.exports=function(e){var t=-1,n=Array(e.size);return e.forEach((function(e){n[++t]=e})),n}},function(e,t,n){var r=n(329),a=Object.prototype.hasOwnProperty;e.exports=function(e,t,n,o,i,c){var s=1&n,u=r(e),l=u.length;if(l!=r(t).length&&!s)return!1;for(var p=l;p--;){var f=u[p];if(!(s?f in t:a.call(t,f)))return!1}var d=c.get(e);if(d&&c.get(t))return d==t;var h=!0;c.set(e,t),c.set(t,e);for(var m=s;++p<l;){var v=e[f=u[p]],g=t[f];if(o)var y=s?o(g,v,f,t,e,c):o(v,g,f,e,t,c);if(!(void 0===y?v===g||i(v,g,n,o,c):y)){h=!1;break}m||(m="constructor"==f)}if(h&&!m){var b=e.constructor,E=t.constructor;b==E||!("constructor"in e)||!("constructor"in t)||"function"==typeof b&&b instanceof b&&"function"==typeof E&&E instanceof E||(h=!1)}return c.delete(e),c.delete(t),h}},function(e,t){e.exports=function(e,t){for(var n=-1,r=null==e?0:e.length,a=0,o=[];++n<r;){var i=e[n];t(i,n,e)&&(o[a++]=i)}return o}},function(e,t){e.exports=function(e,t){for(var n=-1,r=Array(e);++n<e;)r[n]=t(n);return r}},function(e,t,n){var r=n(96),a=n(76);e.exports=function(e){return a(e)&&"[object Arguments]"==r(e)}},function(e,t){e.exports=function(){return!1}},function(e,t,n){var r=n(96),a=n(199),o=n(76),i={};i["[object Float32Array]"]=i["[object Float64Array]"]=i["[object Int8Array]"]=i["[object Int16Array]"]=i["[object Int32Array]"]=i["[object Uint8Array]"]=i["[object Uint8ClampedArray]"]=i["[object Uint16Array]"]=i["[object Uint32Array]"]=!0,i["[object Arguments]"]=i["[object Array]"]=i["[object ArrayBuffer]"]=i["[object Boolean]"]=i["[object DataView]"]=i["[object Date]"]=i["[object Error]"]=i["[object Function]"]=i["[object Map]"]=i["[object Number]"]=i["[object Object]"]=i["[object RegExp]"]=i["[object Set]"]=i["[object String]"]=i["[object WeakMap]"]=!1,e.exports=function(e){return o(e)&&a(e.length)&&!!i[r(e)]}},function(e,t,n){var r=n(147),a=n(586),o=Object.prototype.hasOwnProperty;e.exports=function(e){if(!r(e))return a(e);var t=[];for(var n in Object(e))o.call(e,n)&&"constructor"!=n&&t.push(n);return t}},function(e,t,n){var r=n(334)(Object.keys,Object);e.exports=r},function(e,t,n){var r=n(97)(n(65),"DataView");e.exports=r},function(e,t,n){var r=n(97)(n(65),"Promise");e.exports=r},function(e,t,n){var r=n(97)(n(65),"Set");e.exports=r},function(e,t,n){var r=n(97)(n(65),"WeakMap");e.exports=r},function(e,t,n){var r=n(335),a=n(98);e.exports=function(e){for(var t=a(e),n=t.length;n--;){var o=t[n],i=e[o];t[n]=[o,i,r(i)]}return t}},function(e,t,n){var r=n(325),a=n(41),o=n(337),i=n(202),c=n(335),s=n(336),u=n(107);e.exports=function(e,t){return i(e)&&c(t)?s(u(e),t):function(n){var i=a(n,e);return void 0===i&&i===t?o(n,e):r(t,i,3)}}},function(e,t,n){var r=n(594),a=/[^.[\]]+|\[(?:(-?\d+(?:\.\d+)?)|(["'])((?:(?!\2)[^\\]|\\.)*?)\2)\]|(?=(?:\.|\[\])(?:\.|\[\]|$))/g,o=/\\(\\)?/g,i=r((function(e){var t=[];return 46===e.charCodeAt(0)&&t.push(""),e.replace(a,(function(e,n,r,a){t.push(r?a.replace(o,"$1"):n||e)})),t}));e.exports=i},function(e,t,n){var r=n(207);e.exports=function(e){var t=r(e,(function(e){return 500===n.size&&n.clear(),e})),n=t.cache;return t}},function(e,t){e.exports=function(e,t){return null!=e&&t in Object(e)}},function(e,t,n){var r=n(106),a=n(196),o=n(48),i=n(146),c=n(199),s=n(107);e.exports=function(e,t,n){for(var u=-1,l=(t=r(t,e)).length,p=!1;++u<l;){var f=s(t[u]);if(!(p=null!=e&&n(e,f)))break;e=e[f]}return p||++u!=l?p:!!(l=null==e?0:e.length)&&c(l)&&i(f,l)&&(o(e)||a(e))}},function(e,t,n){var r=n(598),a=n(599),o=n(202),i=n(107);e.exports=function(e){return o(e)?r(i(e)):a(e)}},function(e,t){e.exports=function(e){return function(t){return null==t?void 0:t[e]}}},function(e,t,n){var r=n(149);e.exports=function(e){return function(t){return r(t,e)}}},function(e,t,n){var r=n(601),a=n(145),o=n(338),i=Math.max;e.exports=function(e,t,n){var c=null==e?0:e.length;if(!c)return-1;var s=null==n?0:o(n);return s<0&&(s=i(c+s,0)),r(e,a(t,3),s)}},function(e,t){e.exports=function(e,t,n,r){for(var a=e.length,o=n+(r?1:-1);r?o--:++o<a;)if(t(e[o],o,e))return o;return-1}},function(e,t,n){var r=n(339),a=1/0;e.exports=function(e){return e?(e=r(e))===a||e===-1/0?17976931348623157e292*(e<0?-1:1):e==e?e:0:0===e?e:0}},function(e,t,n){var r=n(340);e.exports=function(e,t){var n;return r(e,(function(e,r,a){return!(n=t(e,r,a))})),!!n}},function(e,t,n){var r=n(605),a=n(98);e.exports=function(e,t){return e&&r(e,t,a)}},function(e,t,n){var r=n(606)();e.exports=r},function(e,t){e.exports=function(e){return function(t,n,r){for(var a=-1,o=Object(t),i=r(t),c=i.length;c--;){var s=i[e?c:++a];if(!1===n(o[s],s,o))break}return t}}},function(e,t,n){var r=n(105);e.exports=function(e,t){return function(n,a){if(null==n)return n;if(!r(n))return e(n,a);for(var o=n.length,i=t?o:-1,c=Object(n);(t?i--:++i<o)&&!1!==a(c[i],i,c););return n}}},function(e,t){var n,r,a=e.exports={};function o(){throw new Error("setTimeout has not been defined")}function i(){throw new Error("clearTimeout has not been defined")}function c(e){if(n===setTimeout)return setTimeout(e,0);if((n===o||!n)&&setTimeout)return n=setTimeout,setTimeout(e,0);try{return n(e,0)}catch(t){try{return n.call(null,e,0)}catch(t){return n.call(this,e,0)}}}!function(){try{n="function"==typeof setTimeout?setTimeout:o}catch(e){n=o}try{r="function"==typeof clearTimeout?clearTimeout:i}catch(e){r=i}}();var s,u=[],l=!1,p=-1;function f(){l&&s&&(l=!1,s.length?u=s.concat(u):p=-1,u.length&&d())}function d(){if(!l){var e=c(f);l=!0;for(var t=u.length;t;){for(s=u,u=[];++p<t;)s&&s[p].run();p=-1,t=u.length}s=null,l=!1,function(e){if(r===clearTimeout)return clearTimeout(e);if((r===i||!r)&&clearTimeout)return r=clearTimeout,clearTimeout(e);try{r(e)}catch(t){try{return r.call(null,e)}catch(t){return r.call(this,e)}}}(e)}}function h(e,t){this.fun=e,this.array=t}function m(){}a.nextTick=function(e){var t=new Array(arguments.length-1);if(arguments.length>1)for(var n=1;n<arguments.length;n++)t[n-1]=arguments[n];u.push(new h(e,t)),1!==u.length||l||c(d)},h.prototype.run=function(){this.fun.apply(null,this.array)},a.title="browser",a.browser=!0,a.env={},a.argv=[],a.version="",a.versions={},a.on=m,a.addListener=m,a.once=m,a.off=m,a.removeListener=m,a.removeAllListeners=m,a.emit=m,a.prependListener=m,a.prependOnceListener=m,a.listeners=function(e){return[]},a.binding=function(e){throw new Error("process.binding is not supported")},a.cwd=function(){return"/"},a.chdir=function(e){throw new Error("process.chdir is not supported")},a.umask=function(){return 0}},function(e,t){var n={"&":"&amp;",'"':"&quot;","'":"&apos;","<":"&lt;",">":"&gt;"};e.exports=function(e){return e&&e.replace?e.replace(/([&"<>'])/g,(function(e,t){return n[t]})):e}},function(e,t){e.exports=require("stream")},function(e,t,n){var r=n(612);e.exports=r},function(e,t,n){var r=n(613),a=Array.prototype;e.exports=function(e){var t=e.every;return e===a||e instanceof Array&&t===a.every?r:t}},function(e,t,n){n(614);var r=n(38);e.exports=r("Array").every},function(e,t,n){"use strict";var r=n(24),a=n(75).every,o=n(95),i=n(56),c=o("every"),s=i("every");r({target:"Array",proto:!0,forced:!c||!s},{every:function(e){return a(this,e,arguments.length>1?arguments[1]:void 0)}})},function(e,t){e.exports=function(e,t,n,r,a){return a(e,(function(e,a,o){n=r?(r=!1,e):t(n,e,a,o)})),n}},function(e,t,n){e.exports=n(617)},function(e,t,n){var r=n(618);e.exports=r},function(e,t,n){n(619);var r=n(31).Object,a=e.exports=function(e,t){return r.defineProperties(e,t)};r.defineProperties.sham&&(a.sham=!0)},function(e,t,n){var r=n(24),a=n(43);r({target:"Object",stat:!0,forced:!a,sham:!a},{defineProperties:n(180)})},function(e,t,n){e.exports=n(621)},function(e,t,n){var r=n(622);e.exports=r},function(e,t,n){n(623);var r=n(31);e.exports=r.Object.getOwnPropertyDescriptors},function(e,t,n){var r=n(24),a=n(43),o=n(624),i=n(59),c=n(88),s=n(121);r({target:"Object",stat:!0,sham:!a},{getOwnPropertyDescriptors:function(e){for(var t,n,r=i(e),a=c.f,u=o(r),l={},p=0;u.length>p;)void 0!==(n=a(r,t=u[p++]))&&s(l,t,n);return l}})},function(e,t,n){var r=n(61),a=n(187),o=n(188),i=n(47);e.exports=r("Reflect","ownKeys")||function(e){var t=a.f(i(e)),n=o.f;return n?t.concat(n(e)):t}},function(e,t,n){e.exports=n(626)},function(e,t,n){var r=n(317);e.exports=r},function(e,t,n){var r=n(628);e.exports=r},function(e,t,n){n(629);var r=n(31).Object,a=e.exports=function(e,t){return r.getOwnPropertyDescriptor(e,t)};r.getOwnPropertyDescriptor.sham&&(a.sham=!0)},function(e,t,n){var r=n(24),a=n(33),o=n(59),i=n(88).f,c=n(43),s=a((function(){i(1)}));r({target:"Object",stat:!0,forced:!c||s,sham:!c},{getOwnPropertyDescriptor:function(e,t){return i(o(e),t)}})},function(e,t,n){e.exports=n(631)},function(e,t,n){var r=n(293);e.exports=r},function(e,t,n){var r=n(633);e.exports=r},function(e,t,n){n(292);var r=n(31);e.exports=r.Object.getOwnPropertySymbols},function(e,t,n){var r=n(279);e.exports=r},function(e,t,n){var r=n(303);e.exports=r},function(e,t,n){var r=n(345),a=n(344);e.exports=function(e,t){if(null==e)return{};var n,o,i={},c=a(e);for(o=0;o<c.length;o++)n=c[o],r(t).call(t,n)>=0||(i[n]=e[n]);return i}},function(e,t,n){var r=n(638);e.exports=r},function(e,t,n){n(639);var r=n(31);e.exports=r.Date.now},function(e,t,n){n(24)({target:"Date",stat:!0},{now:function(){return(new Date).getTime()}})},function(e,t,n){var r=n(346);e.exports=r},function(e,t,n){"use strict";var r,a,o,i,c=n(24),s=n(80),u=n(37),l=n(61),p=n(347),f=n(94),d=n(124),h=n(73),m=n(348),v=n(40),g=n(67),y=n(108),b=n(90),E=n(286),x=n(99),S=n(311),w=n(349),j=n(350).set,C=n(642),O=n(352),_=n(643),A=n(125),k=n(150),P=n(63),I=n(278),T=n(36),N=n(185),R=T("species"),M="Promise",D=P.get,q=P.set,L=P.getterFor(M),B=p,U=u.TypeError,V=u.document,z=u.process,F=l("fetch"),J=A.f,W=J,H="process"==b(z),$=!!(V&&V.createEvent&&u.dispatchEvent),Y="unhandledrejection",K=I(M,(function(){if(!(E(B)!==String(B))){if(66===N)return!0;if(!H&&"function"!=typeof PromiseRejectionEvent)return!0}if(s&&!B.prototype.finally)return!0;if(N>=51&&/native code/.test(B))return!1;var e=B.resolve(1),t=function(e){e((function(){}),(function(){}))};return(e.constructor={})[R]=t,!(e.then((function(){}))instanceof t)})),G=K||!S((function(e){B.all(e).catch((function(){}))})),Z=function(e){var t;return!(!v(e)||"function"!=typeof(t=e.then))&&t},X=function(e,t,n){if(!t.notified){t.notified=!0;var r=t.reactions;C((function(){for(var a=t.value,o=1==t.state,i=0;r.length>i;){var c,s,u,l=r[i++],p=o?l.ok:l.fail,f=l.resolve,d=l.reject,h=l.domain;try{p?(o||(2===t.rejection&&ne(e,t),t.rejection=1),!0===p?c=a:(h&&h.enter(),c=p(a),h&&(h.exit(),u=!0)),c===l.promise?d(U("Promise-chain cycle")):(s=Z(c))?s.call(c,f,d):f(c)):d(a)}catch(e){h&&!u&&h.exit(),d(e)}}t.reactions=[],t.notified=!1,n&&!t.rejection&&ee(e,t)}))}},Q=function(e,t,n){var r,a;$?((r=V.createEvent("Event")).promise=t,r.reason=n,r.initEvent(e,!1,!0),u.dispatchEvent(r)):r={promise:t,reason:n},(a=u["on"+e])?a(r):e===Y&&_("Unhandled promise rejection",n)},ee=function(e,t){j.call(u,(function(){var n,r=t.value;if(te(t)&&(n=k((function(){H?z.emit("unhandledRejection",r,e):Q(Y,e,r)})),t.rejection=H||te(t)?2:1,n.error))throw n.value}))},te=function(e){return 1!==e.rejection&&!e.parent},ne=function(e,t){j.call(u,(function(){H?z.emit("rejectionHandled",e):Q("rejectionhandled",e,t.value)}))},re=function(e,t,n,r){return function(a){e(t,n,a,r)}},ae=function(e,t,n,r){t.done||(t.done=!0,r&&(t=r),t.value=n,t.state=2,X(e,t,!0))},oe=function(e,t,n,r){if(!t.done){t.done=!0,r&&(t=r);try{if(e===n)throw U("Promise can't be resolved itself");var a=Z(n);a?C((function(){var r={done:!1};try{a.call(n,re(oe,e,r,t),re(ae,e,r,t))}catch(n){ae(e,r,n,t)}})):(t.value=n,t.state=1,X(e,t,!1))}catch(n){ae(e,{done:!1},n,t)}}};K&&(B=function(e){y(this,B,M),g(e),r.call(this);var t=D(this);try{e(re(oe,this,t),re(ae,this,t))}catch(e){ae(this,t,e)}},(r=function(e){q(this,{type:M,done:!1,notified:!1,parent:!1,reactions:[],rejection:!1,state:0,value:void 0})}).prototype=d(B.prototype,{then:function(e,t){var n=L(this),r=J(w(this,B));return r.ok="function"!=typeof e||e,r.fail="function"==typeof t&&t,r.domain=H?z.domain:void 0,n.parent=!0,n.reactions.push(r),0!=n.state&&X(this,n,!1),r.promise},catch:function(e){return this.then(void 0,e)}}),a=function(){var e=new r,t=D(e);this.promise=e,this.resolve=re(oe,e,t),this.reject=re(ae,e,t)},A.f=J=function(e){return e===B||e===o?new a(e):W(e)},s||"function"!=typeof p||(i=p.prototype.then,f(p.prototype,"then",(function(e,t){var n=this;return new B((function(e,t){i.call(n,e,t)})).then(e,t)}),{unsafe:!0}),"function"==typeof F&&c({global:!0,enumerable:!0,forced:!0},{fetch:function(e){return O(B,F.apply(u,arguments))}}))),c({global:!0,wrap:!0,forced:K},{Promise:B}),h(B,M,!1,!0),m(M),o=l(M),c({target:M,stat:!0,forced:K},{reject:function(e){var t=J(this);return t.reject.call(void 0,e),t.promise}}),c({target:M,stat:!0,forced:s||K},{resolve:function(e){return O(s&&this===o?B:this,e)}}),c({target:M,stat:!0,forced:G},{all:function(e){var t=this,n=J(t),r=n.resolve,a=n.reject,o=k((function(){var n=g(t.resolve),o=[],i=0,c=1;x(e,(function(e){var s=i++,u=!1;o.push(void 0),c++,n.call(t,e).then((function(e){u||(u=!0,o[s]=e,--c||r(o))}),a)})),--c||r(o)}));return o.error&&a(o.value),n.promise},race:function(e){var t=this,n=J(t),r=n.reject,a=k((function(){var a=g(t.resolve);x(e,(function(e){a.call(t,e).then(n.resolve,r)}))}));return a.error&&r(a.value),n.promise}})},function(e,t,n){var r,a,o,i,c,s,u,l,p=n(37),f=n(88).f,d=n(90),h=n(350).set,m=n(351),v=p.MutationObserver||p.WebKitMutationObserver,g=p.process,y=p.Promise,b="process"==d(g),E=f(p,"queueMicrotask"),x=E&&E.value;x||(r=function(){var e,t;for(b&&(e=g.domain)&&e.exit();a;){t=a.fn,a=a.next;try{t()}catch(e){throw a?i():o=void 0,e}}o=void 0,e&&e.enter()},b?i=function(){g.nextTick(r)}:v&&!m?(c=!0,s=document.createTextNode(""),new v(r).observe(s,{characterData:!0}),i=function(){s.data=c=!c}):y&&y.resolve?(u=y.resolve(void 0),l=u.then,i=function(){l.call(u,r)}):i=function(){h.call(p,r)}),e.exports=x||function(e){var t={fn:e,next:void 0};o&&(o.next=t),a||(a=t,i()),o=t}},function(e,t,n){var r=n(37);e.exports=function(e,t){var n=r.console;n&&n.error&&(1===arguments.length?n.error(e):n.error(e,t))}},function(e,t,n){"use strict";var r=n(24),a=n(80),o=n(347),i=n(33),c=n(61),s=n(349),u=n(352),l=n(94);r({target:"Promise",proto:!0,real:!0,forced:!!o&&i((function(){o.prototype.finally.call({then:function(){}},(function(){}))}))},{finally:function(e){var t=s(this,c("Promise")),n="function"==typeof e;return this.then(n?function(n){return u(t,e()).then((function(){return n}))}:e,n?function(n){return u(t,e()).then((function(){throw n}))}:e)}}),a||"function"!=typeof o||o.prototype.finally||l(o.prototype,"finally",c("Promise").prototype.finally)},function(e,t){e.exports=require("regenerator-runtime")},function(e,t,n){e.exports=n(647)},function(e,t,n){var r=n(346);n(648),n(649),n(650),n(651),e.exports=r},function(e,t,n){"use strict";var r=n(24),a=n(43),o=n(118),i=n(182),c=n(92),s=n(55),u=n(89),l=n(99),p=n(60),f=n(63),d=f.set,h=f.getterFor("AggregateError"),m=function(e,t){var n=this;if(!(n instanceof m))return new m(e,t);i&&(n=i(new Error(t),o(n)));var r=[];return l(e,r.push,r),a?d(n,{errors:r,type:"AggregateError"}):n.errors=r,void 0!==t&&p(n,"message",String(t)),n};m.prototype=c(Error.prototype,{constructor:u(5,m),message:u(5,""),name:u(5,"AggregateError")}),a&&s.f(m.prototype,"errors",{get:function(){return h(this).errors},configurable:!0}),r({global:!0},{AggregateError:m})},function(e,t,n){n(353)},function(e,t,n){"use strict";var r=n(24),a=n(125),o=n(150);r({target:"Promise",stat:!0},{try:function(e){var t=a.f(this),n=o(e);return(n.error?t.reject:t.resolve)(n.value),t.promise}})},function(e,t,n){"use strict";var r=n(24),a=n(67),o=n(61),i=n(125),c=n(150),s=n(99),u="No one promise resolved";r({target:"Promise",stat:!0},{any:function(e){var t=this,n=i.f(t),r=n.resolve,l=n.reject,p=c((function(){var n=a(t.resolve),i=[],c=0,p=1,f=!1;s(e,(function(e){var a=c++,s=!1;i.push(void 0),p++,n.call(t,e).then((function(e){s||f||(f=!0,r(e))}),(function(e){s||f||(s=!0,i[a]=e,--p||l(new(o("AggregateError"))(i,u)))}))})),--p||l(new(o("AggregateError"))(i,u))}));return p.error&&l(p.value),n.promise}})},function(e,t,n){var r=n(295);e.exports=r},function(e,t,n){var r=n(65);e.exports=function(){return r.Date.now()}},function(e,t,n){e.exports=n(655)},function(e,t,n){var r=n(297);e.exports=r},function(e,t,n){e.exports=n(657)},function(e,t,n){var r=n(357);e.exports=r},function(e,t,n){n(24)({target:"Object",stat:!0,sham:!n(43)},{create:n(92)})},function(e,t,n){var r=n(358);function a(t,n){return e.exports=a=r||function(e,t){return e.__proto__=t,e},a(t,n)}e.exports=a},function(e,t,n){var r=n(661);e.exports=r},function(e,t,n){n(662);var r=n(31);e.exports=r.Object.setPrototypeOf},function(e,t,n){n(24)({target:"Object",stat:!0},{setPrototypeOf:n(182)})},function(e,t,n){var r=n(664);e.exports=r},function(e,t,n){n(665);var r=n(31);e.exports=r.Reflect.construct},function(e,t,n){var r=n(24),a=n(61),o=n(67),i=n(47),c=n(40),s=n(92),u=n(299),l=n(33),p=a("Reflect","construct"),f=l((function(){function e(){}return!(p((function(){}),[],e)instanceof e)})),d=!l((function(){p((function(){}))})),h=f||d;r({target:"Reflect",stat:!0,forced:h,sham:h},{construct:function(e,t){o(e),i(t);var n=arguments.length<3?e:o(arguments[2]);if(d&&!f)return p(e,t,n);if(e==n){switch(t.length){case 0:return new e;case 1:return new e(t[0]);case 2:return new e(t[0],t[1]);case 3:return new e(t[0],t[1],t[2]);case 4:return new e(t[0],t[1],t[2],t[3])}var r=[null];return r.push.apply(r,t),new(u.apply(e,r))}var a=n.prototype,l=s(c(a)?a:Object.prototype),h=Function.apply.call(e,l,t);return c(h)?h:l}})},function(e,t,n){e.exports=n(667)},function(e,t,n){var r=n(668);e.exports=r},function(e,t,n){n(669);var r=n(31);e.exports=r.Object.getPrototypeOf},function(e,t,n){var r=n(24),a=n(33),o=n(62),i=n(118),c=n(289);r({target:"Object",stat:!0,forced:a((function(){i(1)})),sham:!c},{getPrototypeOf:function(e){return i(o(e))}})},function(e,t,n){var r=n(359);e.exports=function(){if("undefined"==typeof Reflect||!r)return!1;if(r.sham)return!1;if("function"==typeof Proxy)return!0;try{return Date.prototype.toString.call(r(Date,[],(function(){}))),!0}catch(e){return!1}}},function(e,t,n){var r=n(20),a=n(10);e.exports=function(e,t){return!t||"object"!==r(t)&&"function"!=typeof t?a(e):t}},function(e,t){e.exports=function(e,t){for(var n=-1,r=null==e?0:e.length;++n<r&&!1!==t(e[n],n,e););return e}},function(e,t,n){var r=n(109),a=n(98);e.exports=function(e,t){return e&&r(t,a(t),e)}},function(e,t,n){var r=n(109),a=n(361);e.exports=function(e,t){return e&&r(t,a(t),e)}},function(e,t,n){var r=n(52),a=n(147),o=n(676),i=Object.prototype.hasOwnProperty;e.exports=function(e){if(!r(e))return o(e);var t=a(e),n=[];for(var c in e)("constructor"!=c||!t&&i.call(e,c))&&n.push(c);return n}},function(e,t){e.exports=function(e){var t=[];if(null!=e)for(var n in Object(e))t.push(n);return t}},function(e,t,n){(function(e){var r=n(65),a=t&&!t.nodeType&&t,o=a&&"object"==typeof e&&e&&!e.nodeType&&e,i=o&&o.exports===a?r.Buffer:void 0,c=i?i.allocUnsafe:void 0;e.exports=function(e,t){if(t)return e.slice();var n=e.length,r=c?c(n):new e.constructor(n);return e.copy(r),r}}).call(this,n(198)(e))},function(e,t){e.exports=function(e,t){var n=-1,r=e.length;for(t||(t=Array(r));++n<r;)t[n]=e[n];return t}},function(e,t,n){var r=n(109),a=n(195);e.exports=function(e,t){return r(e,a(e),t)}},function(e,t,n){var r=n(109),a=n(362);e.exports=function(e,t){return r(e,a(e),t)}},function(e,t){var n=Object.prototype.hasOwnProperty;e.exports=function(e){var t=e.length,r=new e.constructor(t);return t&&"string"==typeof e[0]&&n.call(e,"index")&&(r.index=e.index,r.input=e.input),r}},function(e,t,n){var r=n(205),a=n(683),o=n(684),i=n(685),c=n(686);e.exports=function(e,t,n){var s=e.constructor;switch(t){case"[object ArrayBuffer]":return r(e);case"[object Boolean]":case"[object Date]":return new s(+e);case"[object DataView]":return a(e,n);case"[object Float32Array]":case"[object Float64Array]":case"[object Int8Array]":case"[object Int16Array]":case"[object Int32Array]":case"[object Uint8Array]":case"[object Uint8ClampedArray]":case"[object Uint16Array]":case"[object Uint32Array]":return c(e,n);case"[object Map]":return new s;case"[object Number]":case"[object String]":return new s(e);case"[object RegExp]":return o(e);case"[object Set]":return new s;case"[object Symbol]":return i(e)}}},function(e,t,n){var r=n(205);e.exports=function(e,t){var n=t?r(e.buffer):e.buffer;return new e.constructor(n,e.byteOffset,e.byteLength)}},function(e,t){var n=/\w*$/;e.exports=function(e){var t=new e.constructor(e.source,n.exec(e));return t.lastIndex=e.lastIndex,t}},function(e,t,n){var r=n(104),a=r?r.prototype:void 0,o=a?a.valueOf:void 0;e.exports=function(e){return o?Object(o.call(e)):{}}},function(e,t,n){var r=n(205);e.exports=function(e,t){var n=t?r(e.buffer):e.buffer;return new e.constructor(n,e.byteOffset,e.length)}},function(e,t,n){var r=n(688),a=n(204),o=n(147);e.exports=function(e){return"function"!=typeof e.constructor||o(e)?{}:r(a(e))}},function(e,t,n){var r=n(52),a=Object.create,o=function(){function e(){}return function(t){if(!r(t))return{};if(a)return a(t);e.prototype=t;var n=new e;return e.prototype=void 0,n}}();e.exports=o},function(e,t,n){var r=n(690),a=n(200),o=n(201),i=o&&o.isMap,c=i?a(i):r;e.exports=c},function(e,t,n){var r=n(148),a=n(76);e.exports=function(e){return a(e)&&"[object Map]"==r(e)}},function(e,t,n){var r=n(692),a=n(200),o=n(201),i=o&&o.isSet,c=i?a(i):r;e.exports=c},function(e,t,n){var r=n(148),a=n(76);e.exports=function(e){return a(e)&&"[object Set]"==r(e)}},function(e,t,n){var r=n(106),a=n(694),o=n(695),i=n(107);e.exports=function(e,t){return t=r(t,e),null==(e=o(e,t))||delete e[i(a(t))]}},function(e,t){e.exports=function(e){var t=null==e?0:e.length;return t?e[t-1]:void 0}},function(e,t,n){var r=n(149),a=n(321);e.exports=function(e,t){return t.length<2?e:r(e,a(t,0,-1))}},function(e,t,n){var r=n(220);e.exports=function(e){return r(e)?void 0:e}},function(e,t,n){var r=n(698);e.exports=function(e){return(null==e?0:e.length)?r(e,1):[]}},function(e,t,n){var r=n(194),a=n(699);e.exports=function e(t,n,o,i,c){var s=-1,u=t.length;for(o||(o=a),c||(c=[]);++s<u;){var l=t[s];n>0&&o(l)?n>1?e(l,n-1,o,i,c):r(c,l):i||(c[c.length]=l)}return c}},function(e,t,n){var r=n(104),a=n(196),o=n(48),i=r?r.isConcatSpreadable:void 0;e.exports=function(e){return o(e)||a(e)||!!(i&&e&&e[i])}},function(e,t){e.exports=function(e,t,n){switch(n.length){case 0:return e.call(t);case 1:return e.call(t,n[0]);case 2:return e.call(t,n[0],n[1]);case 3:return e.call(t,n[0],n[1],n[2])}return e.apply(t,n)}},function(e,t,n){var r=n(702),a=n(356),o=n(203),i=a?function(e,t){return a(e,"toString",{configurable:!0,enumerable:!1,value:r(t),writable:!0})}:o;e.exports=i},function(e,t){e.exports=function(e){return function(){return e}}},function(e,t){var n=Date.now;e.exports=function(e){var t=0,r=0;return function(){var a=n(),o=16-(a-r);if(r=a,o>0){if(++t>=800)return arguments[0]}else t=0;return e.apply(void 0,arguments)}}},function(e,t,n){var r=n(705);e.exports=r},function(e,t,n){n(706);var r=n(31);e.exports=r.Object.entries},function(e,t,n){var r=n(24),a=n(707).entries;r({target:"Object",stat:!0},{entries:function(e){return a(e)}})},function(e,t,n){var r=n(43),a=n(115),o=n(59),i=n(132).f,c=function(e){return function(t){for(var n,c=o(t),s=a(c),u=s.length,l=0,p=[];u>l;)n=s[l++],r&&!i.call(c,n)||p.push(e?[n,c[n]]:c[n]);return p}};e.exports={entries:c(!0),values:c(!1)}},function(e,t,n){var r=n(307);e.exports=r},function(e,t){!function(e){!function(t){var n="URLSearchParams"in e,r="Symbol"in e&&"iterator"in Symbol,a="FileReader"in e&&"Blob"in e&&function(){try{return new Blob,!0}catch(e){return!1}}(),o="FormData"in e,i="ArrayBuffer"in e;if(i)var c=["[object Int8Array]","[object Uint8Array]","[object Uint8ClampedArray]","[object Int16Array]","[object Uint16Array]","[object Int32Array]","[object Uint32Array]","[object Float32Array]","[object Float64Array]"],s=ArrayBuffer.isView||function(e){return e&&c.indexOf(Object.prototype.toString.call(e))>-1};function u(e){if("string"!=typeof e&&(e=String(e)),/[^a-z0-9\-#$%&'*+.^_`|~]/i.test(e))throw new TypeError("Invalid character in header field name");return e.toLowerCase()}function l(e){return"string"!=typeof e&&(e=String(e)),e}function p(e){var t={next:function(){var t=e.shift();return{done:void 0===t,value:t}}};return r&&(t[Symbol.iterator]=function(){return t}),t}function f(e){this.map={},e instanceof f?e.forEach((function(e,t){this.append(t,e)}),this):Array.isArray(e)?e.forEach((function(e){this.append(e[0],e[1])}),this):e&&Object.getOwnPropertyNames(e).forEach((function(t){this.append(t,e[t])}),this)}function d(e){if(e.bodyUsed)return Promise.reject(new TypeError("Already read"));e.bodyUsed=!0}function h(e){return new Promise((function(t,n){e.onload=function(){t(e.result)},e.onerror=function(){n(e.error)}}))}function m(e){var t=new FileReader,n=h(t);return t.readAsArrayBuffer(e),n}function v(e){if(e.slice)return e.slice(0);var t=new Uint8Array(e.byteLength);return t.set(new Uint8Array(e)),t.buffer}function g(){return this.bodyUsed=!1,this._initBody=function(e){var t;this._bodyInit=e,e?"string"==typeof e?this._bodyText=e:a&&Blob.prototype.isPrototypeOf(e)?this._bodyBlob=e:o&&FormData.prototype.isPrototypeOf(e)?this._bodyFormData=e:n&&URLSearchParams.prototype.isPrototypeOf(e)?this._bodyText=e.toString():i&&a&&((t=e)&&DataView.prototype.isPrototypeOf(t))?(this._bodyArrayBuffer=v(e.buffer),this._bodyInit=new Blob([this._bodyArrayBuffer])):i&&(ArrayBuffer.prototype.isPrototypeOf(e)||s(e))?this._bodyArrayBuffer=v(e):this._bodyText=e=Object.prototype.toString.call(e):this._bodyText="",this.headers.get("content-type")||("string"==typeof e?this.headers.set("content-type","text/plain;charset=UTF-8"):this._bodyBlob&&this._bodyBlob.type?this.headers.set("content-type",this._bodyBlob.type):n&&URLSearchParams.prototype.isPrototypeOf(e)&&this.headers.set("content-type","application/x-www-form-urlencoded;charset=UTF-8"))},a&&(this.blob=function(){var e=d(this);if(e)return e;if(this._bodyBlob)return Promise.resolve(this._bodyBlob);if(this._bodyArrayBuffer)return Promise.resolve(new Blob([this._bodyArrayBuffer]));if(this._bodyFormData)throw new Error("could not read FormData body as blob");return Promise.resolve(new Blob([this._bodyText]))},this.arrayBuffer=function(){return this._bodyArrayBuffer?d(this)||Promise.resolve(this._bodyArrayBuffer):this.blob().then(m)}),this.text=function(){var e,t,n,r=d(this);if(r)return r;if(this._bodyBlob)return e=this._bodyBlob,t=new FileReader,n=h(t),t.readAsText(e),n;if(this._bodyArrayBuffer)return Promise.resolve(function(e){for(var t=new Uint8Array(e),n=new Array(t.length),r=0;r<t.length;r++)n[r]=String.fromCharCode(t[r]);return n.join("")}(this._bodyArrayBuffer));if(this._bodyFormData)throw new Error("could not read FormData body as text");return Promise.resolve(this._bodyText)},o&&(this.formData=function(){return this.text().then(E)}),this.json=function(){return this.text().then(JSON.parse)},this}f.prototype.append=function(e,t){e=u(e),t=l(t);var n=this.map[e];this.map[e]=n?n+", "+t:t},f.prototype.delete=function(e){delete this.map[u(e)]},f.prototype.get=function(e){return e=u(e),this.has(e)?this.map[e]:null},f.prototype.has=function(e){return this.map.hasOwnProperty(u(e))},f.prototype.set=function(e,t){this.map[u(e)]=l(t)},f.prototype.forEach=function(e,t){for(var n in this.map)this.map.hasOwnProperty(n)&&e.call(t,this.map[n],n,this)},f.prototype.keys=function(){var e=[];return this.forEach((function(t,n){e.push(n)})),p(e)},f.prototype.values=function(){var e=[];return this.forEach((function(t){e.push(t)})),p(e)},f.prototype.entries=function(){var e=[];return this.forEach((function(t,n){e.push([n,t])})),p(e)},r&&(f.prototype[Symbol.iterator]=f.prototype.entries);var y=["DELETE","GET","HEAD","OPTIONS","POST","PUT"];function b(e,t){var n,r,a=(t=t||{}).body;if(e instanceof b){if(e.bodyUsed)throw new TypeError("Already read");this.url=e.url,this.credentials=e.credentials,t.headers||(this.headers=new f(e.headers)),this.method=e.method,this.mode=e.mode,this.signal=e.signal,a||null==e._bodyInit||(a=e._bodyInit,e.bodyUsed=!0)}else this.url=String(e);if(this.credentials=t.credentials||this.credentials||"same-origin",!t.headers&&this.headers||(this.headers=new f(t.headers)),this.method=(n=t.method||this.method||"GET",r=n.toUpperCase(),y.indexOf(r)>-1?r:n),this.mode=t.mode||this.mode||null,this.signal=t.signal||this.signal,this.referrer=null,("GET"===this.method||"HEAD"===this.method)&&a)throw new TypeError("Body not allowed for GET or HEAD requests");this._initBody(a)}function E(e){var t=new FormData;return e.trim().split("&").forEach((function(e){if(e){var n=e.split("="),r=n.shift().replace(/\+/g," "),a=n.join("=").replace(/\+/g," ");t.append(decodeURIComponent(r),decodeURIComponent(a))}})),t}function x(e,t){t||(t={}),this.type="default",this.status=void 0===t.status?200:t.status,this.ok=this.status>=200&&this.status<300,this.statusText="statusText"in t?t.statusText:"OK",this.headers=new f(t.headers),this.url=t.url||"",this._initBody(e)}b.prototype.clone=function(){return new b(this,{body:this._bodyInit})},g.call(b.prototype),g.call(x.prototype),x.prototype.clone=function(){return new x(this._bodyInit,{status:this.status,statusText:this.statusText,headers:new f(this.headers),url:this.url})},x.error=function(){var e=new x(null,{status:0,statusText:""});return e.type="error",e};var S=[301,302,303,307,308];x.redirect=function(e,t){if(-1===S.indexOf(t))throw new RangeError("Invalid status code");return new x(null,{status:t,headers:{location:e}})},t.DOMException=e.DOMException;try{new t.DOMException}catch(e){t.DOMException=function(e,t){this.message=e,this.name=t;var n=Error(e);this.stack=n.stack},t.DOMException.prototype=Object.create(Error.prototype),t.DOMException.prototype.constructor=t.DOMException}function w(e,n){return new Promise((function(r,o){var i=new b(e,n);if(i.signal&&i.signal.aborted)return o(new t.DOMException("Aborted","AbortError"));var c=new XMLHttpRequest;function s(){c.abort()}c.onload=function(){var e,t,n={status:c.status,statusText:c.statusText,headers:(e=c.getAllResponseHeaders()||"",t=new f,e.replace(/\r?\n[\t ]+/g," ").split(/\r?\n/).forEach((function(e){var n=e.split(":"),r=n.shift().trim();if(r){var a=n.join(":").trim();t.append(r,a)}})),t)};n.url="responseURL"in c?c.responseURL:n.headers.get("X-Request-URL");var a="response"in c?c.response:c.responseText;r(new x(a,n))},c.onerror=function(){o(new TypeError("Network request failed"))},c.ontimeout=function(){o(new TypeError("Network request failed"))},c.onabort=function(){o(new t.DOMException("Aborted","AbortError"))},c.open(i.method,i.url,!0),"include"===i.credentials?c.withCredentials=!0:"omit"===i.credentials&&(c.withCredentials=!1),"responseType"in c&&a&&(c.responseType="blob"),i.headers.forEach((function(e,t){c.setRequestHeader(t,e)})),i.signal&&(i.signal.addEventListener("abort",s),c.onreadystatechange=function(){4===c.readyState&&i.signal.removeEventListener("abort",s)}),c.send(void 0===i._bodyInit?null:i._bodyInit)}))}w.polyfill=!0,e.fetch||(e.fetch=w,e.Headers=f,e.Request=b,e.Response=x),t.Headers=f,t.Request=b,t.Response=x,t.fetch=w}({})}("undefined"!=typeof self?self:this)},function(e,t,n){var r=n(711),a=n(337);e.exports=function(e,t){return r(e,t,(function(t,n){return a(e,n)}))}},function(e,t,n){var r=n(149),a=n(354),o=n(106);e.exports=function(e,t,n){for(var i=-1,c=t.length,s={};++i<c;){var u=t[i],l=r(e,u);n(l,u)&&a(s,o(u,e),l)}return s}},function(e,t,n){e.exports=n(713)},function(e,t,n){var r=n(714);e.exports=r},function(e,t,n){n(715);var r=n(31);e.exports=r.Reflect.get},function(e,t,n){var r=n(24),a=n(40),o=n(47),i=n(46),c=n(88),s=n(118);r({target:"Reflect",stat:!0},{get:function e(t,n){var r,u,l=arguments.length<3?t:arguments[2];return o(t)===l?t[n]:(r=c.f(t,n))?i(r,"value")?r.value:void 0===r.get?void 0:r.get.call(l):a(u=s(t))?e(u,n,l):void 0}})},function(e,t,n){var r=n(153);e.exports=function(e,t){for(;!Object.prototype.hasOwnProperty.call(e,t)&&null!==(e=r(e)););return e}},function(e,t,n){var r=n(718);e.exports=r},function(e,t,n){var r=n(719),a=Array.prototype;e.exports=function(e){var t=e.splice;return e===a||e instanceof Array&&t===a.splice?r:t}},function(e,t,n){n(720);var r=n(38);e.exports=r("Array").splice},function(e,t,n){"use strict";var r=n(24),a=n(174),o=n(116),i=n(68),c=n(62),s=n(184),u=n(121),l=n(122),p=n(56),f=l("splice"),d=p("splice",{ACCESSORS:!0,0:0,1:2}),h=Math.max,m=Math.min,v=9007199254740991,g="Maximum allowed length exceeded";r({target:"Array",proto:!0,forced:!f||!d},{splice:function(e,t){var n,r,l,p,f,d,y=c(this),b=i(y.length),E=a(e,b),x=arguments.length;if(0===x?n=r=0:1===x?(n=0,r=b-E):(n=x-2,r=m(h(o(t),0),b-E)),b+n-r>v)throw TypeError(g);for(l=s(y,r),p=0;p<r;p++)(f=E+p)in y&&u(l,p,y[f]);if(l.length=r,n<r){for(p=E;p<b-r;p++)d=p+n,(f=p+r)in y?y[d]=y[f]:delete y[d];for(p=b;p>b-r+n;p--)delete y[p-1]}else if(n>r)for(p=b-r;p>E;p--)d=p+n-1,(f=p+r-1)in y?y[d]=y[f]:delete y[d];for(p=0;p<n;p++)y[p+E]=arguments[p+2];return y.length=b-r+n,l}})},function(e,t,n){var r=n(357);e.exports=r},function(e,t,n){var r=n(723);e.exports=r},function(e,t,n){n(138),n(724),n(64);var r=n(31);e.exports=r.WeakMap},function(e,t,n){"use strict";var r,a=n(37),o=n(124),i=n(152),c=n(367),s=n(726),u=n(40),l=n(63).enforce,p=n(285),f=!a.ActiveXObject&&"ActiveXObject"in a,d=Object.isExtensible,h=function(e){return function(){return e(this,arguments.length?arguments[0]:void 0)}},m=e.exports=c("WeakMap",h,s);if(p&&f){r=s.getConstructor(h,"WeakMap",!0),i.REQUIRED=!0;var v=m.prototype,g=v.delete,y=v.has,b=v.get,E=v.set;o(v,{delete:function(e){if(u(e)&&!d(e)){var t=l(this);return t.frozen||(t.frozen=new r),g.call(this,e)||t.frozen.delete(e)}return g.call(this,e)},has:function(e){if(u(e)&&!d(e)){var t=l(this);return t.frozen||(t.frozen=new r),y.call(this,e)||t.frozen.has(e)}return y.call(this,e)},get:function(e){if(u(e)&&!d(e)){var t=l(this);return t.frozen||(t.frozen=new r),y.call(this,e)?b.call(this,e):t.frozen.get(e)}return b.call(this,e)},set:function(e,t){if(u(e)&&!d(e)){var n=l(this);n.frozen||(n.frozen=new r),y.call(this,e)?E.call(this,e,t):n.frozen.set(e,t)}else E.call(this,e,t);return this}})}},function(e,t,n){var r=n(33);e.exports=!r((function(){return Object.isExtensible(Object.preventExtensions({}))}))},function(e,t,n){"use strict";var r=n(124),a=n(152).getWeakData,o=n(47),i=n(40),c=n(108),s=n(99),u=n(75),l=n(46),p=n(63),f=p.set,d=p.getterFor,h=u.find,m=u.findIndex,v=0,g=function(e){return e.frozen||(e.frozen=new y)},y=function(){this.entries=[]},b=function(e,t){return h(e.entries,(function(e){return e[0]===t}))};y.prototype={get:function(e){var t=b(this,e);if(t)return t[1]},has:function(e){return!!b(this,e)},set:function(e,t){var n=b(this,e);n?n[1]=t:this.entries.push([e,t])},delete:function(e){var t=m(this.entries,(function(t){return t[0]===e}));return~t&&this.entries.splice(t,1),!!~t}},e.exports={getConstructor:function(e,t,n,u){var p=e((function(e,r){c(e,p,t),f(e,{type:t,id:v++,frozen:void 0}),null!=r&&s(r,e[u],e,n)})),h=d(t),m=function(e,t,n){var r=h(e),i=a(o(t),!0);return!0===i?g(r).set(t,n):i[r.id]=n,e};return r(p.prototype,{delete:function(e){var t=h(this);if(!i(e))return!1;var n=a(e);return!0===n?g(t).delete(e):n&&l(n,t.id)&&delete n[t.id]},has:function(e){var t=h(this);if(!i(e))return!1;var n=a(e);return!0===n?g(t).has(e):n&&l(n,t.id)}}),r(p.prototype,n?{get:function(e){var t=h(this);if(i(e)){var n=a(e);return!0===n?g(t).get(e):n?n[t.id]:void 0}},set:function(e,t){return m(this,e,t)}}:{add:function(e){return m(this,e,!0)}}),p}}},function(e,t){e.exports=function(e,t,n){return e==e&&(void 0!==n&&(e=e<=n?e:n),void 0!==t&&(e=e>=t?e:t)),e}},function(e,t,n){var r=n(729),a=n(341);e.exports=function(e){return r((function(t,n){var r=-1,o=n.length,i=o>1?n[o-1]:void 0,c=o>2?n[2]:void 0;for(i=e.length>3&&"function"==typeof i?(o--,i):void 0,c&&a(n[0],n[1],c)&&(i=o<3?void 0:i,o=1),t=Object(t);++r<o;){var s=n[r];s&&e(t,s,r,i)}return t}))}},function(e,t,n){var r=n(203),a=n(365),o=n(366);e.exports=function(e,t){return o(a(e,t,r),e+"")}},function(e,t,n){var r=n(731);e.exports=r},function(e,t,n){n(732),n(734),n(369);var r=n(31);e.exports=r.URL},function(e,t,n){"use strict";n(81);var r,a=n(24),o=n(43),i=n(368),c=n(37),s=n(180),u=n(94),l=n(108),p=n(46),f=n(298),d=n(308),h=n(284).codeAt,m=n(733),v=n(73),g=n(369),y=n(63),b=c.URL,E=g.URLSearchParams,x=g.getState,S=y.set,w=y.getterFor("URL"),j=Math.floor,C=Math.pow,O="Invalid scheme",_="Invalid host",A="Invalid port",k=/[A-Za-z]/,P=/[\d+-.A-Za-z]/,I=/\d/,T=/^(0x|0X)/,N=/^[0-7]+$/,R=/^\d+$/,M=/^[\dA-Fa-f]+$/,D=/[\u0000\u0009\u000A\u000D #%/:?@[\\]]/,q=/[\u0000\u0009\u000A\u000D #/:?@[\\]]/,L=/^[\u0000-\u001F ]+|[\u0000-\u001F ]+$/g,B=/[\u0009\u000A\u000D]/g,U=function(e,t){var n,r,a;if("["==t.charAt(0)){if("]"!=t.charAt(t.length-1))return _;if(!(n=z(t.slice(1,-1))))return _;e.host=n}else if(G(e)){if(t=m(t),D.test(t))return _;if(null===(n=V(t)))return _;e.host=n}else{if(q.test(t))return _;for(n="",r=d(t),a=0;a<r.length;a++)n+=Y(r[a],J);e.host=n}},V=function(e){var t,n,r,a,o,i,c,s=e.split(".");if(s.length&&""==s[s.length-1]&&s.pop(),(t=s.length)>4)return e;for(n=[],r=0;r<t;r++){if(""==(a=s[r]))return e;if(o=10,a.length>1&&"0"==a.charAt(0)&&(o=T.test(a)?16:8,a=a.slice(8==o?1:2)),""===a)i=0;else{if(!(10==o?R:8==o?N:M).test(a))return e;i=parseInt(a,o)}n.push(i)}for(r=0;r<t;r++)if(i=n[r],r==t-1){if(i>=C(256,5-t))return null}else if(i>255)return null;for(c=n.pop(),r=0;r<n.length;r++)c+=n[r]*C(256,3-r);return c},z=function(e){var t,n,r,a,o,i,c,s=[0,0,0,0,0,0,0,0],u=0,l=null,p=0,f=function(){return e.charAt(p)};if(":"==f()){if(":"!=e.charAt(1))return;p+=2,l=++u}for(;f();){if(8==u)return;if(":"!=f()){for(t=n=0;n<4&&M.test(f());)t=16*t+parseInt(f(),16),p++,n++;if("."==f()){if(0==n)return;if(p-=n,u>6)return;for(r=0;f();){if(a=null,r>0){if(!("."==f()&&r<4))return;p++}if(!I.test(f()))return;for(;I.test(f());){if(o=parseInt(f(),10),null===a)a=o;else{if(0==a)return;a=10*a+o}if(a>255)return;p++}s[u]=256*s[u]+a,2!=++r&&4!=r||u++}if(4!=r)return;break}if(":"==f()){if(p++,!f())return}else if(f())return;s[u++]=t}else{if(null!==l)return;p++,l=++u}}if(null!==l)for(i=u-l,u=7;0!=u&&i>0;)c=s[u],s[u--]=s[l+i-1],s[l+--i]=c;else if(8!=u)return;return s},F=function(e){var t,n,r,a;if("number"==typeof e){for(t=[],n=0;n<4;n++)t.unshift(e%256),e=j(e/256);return t.join(".")}if("object"==typeof e){for(t="",r=function(e){for(var t=null,n=1,r=null,a=0,o=0;o<8;o++)0!==e[o]?(a>n&&(t=r,n=a),r=null,a=0):(null===r&&(r=o),++a);return a>n&&(t=r,n=a),t}(e),n=0;n<8;n++)a&&0===e[n]||(a&&(a=!1),r===n?(t+=n?":":"::",a=!0):(t+=e[n].toString(16),n<7&&(t+=":")));return"["+t+"]"}return e},J={},W=f({},J,{" ":1,'"':1,"<":1,">":1,"`":1}),H=f({},W,{"#":1,"?":1,"{":1,"}":1}),$=f({},H,{"/":1,":":1,";":1,"=":1,"@":1,"[":1,"\\":1,"]":1,"^":1,"|":1}),Y=function(e,t){var n=h(e,0);return n>32&&n<127&&!p(t,e)?e:encodeURIComponent(e)},K={ftp:21,file:null,http:80,https:443,ws:80,wss:443},G=function(e){return p(K,e.scheme)},Z=function(e){return""!=e.username||""!=e.password},X=function(e){return!e.host||e.cannotBeABaseURL||"file"==e.scheme},Q=function(e,t){var n;return 2==e.length&&k.test(e.charAt(0))&&(":"==(n=e.charAt(1))||!t&&"|"==n)},ee=function(e){var t;return e.length>1&&Q(e.slice(0,2))&&(2==e.length||"/"===(t=e.charAt(2))||"\\"===t||"?"===t||"#"===t)},te=function(e){var t=e.path,n=t.length;!n||"file"==e.scheme&&1==n&&Q(t[0],!0)||t.pop()},ne=function(e){return"."===e||"%2e"===e.toLowerCase()},re={},ae={},oe={},ie={},ce={},se={},ue={},le={},pe={},fe={},de={},he={},me={},ve={},ge={},ye={},be={},Ee={},xe={},Se={},we={},je=function(e,t,n,a){var o,i,c,s,u,l=n||re,f=0,h="",m=!1,v=!1,g=!1;for(n||(e.scheme="",e.username="",e.password="",e.host=null,e.port=null,e.path=[],e.query=null,e.fragment=null,e.cannotBeABaseURL=!1,t=t.replace(L,"")),t=t.replace(B,""),o=d(t);f<=o.length;){switch(i=o[f],l){case re:if(!i||!k.test(i)){if(n)return O;l=oe;continue}h+=i.toLowerCase(),l=ae;break;case ae:if(i&&(P.test(i)||"+"==i||"-"==i||"."==i))h+=i.toLowerCase();else{if(":"!=i){if(n)return O;h="",l=oe,f=0;continue}if(n&&(G(e)!=p(K,h)||"file"==h&&(Z(e)||null!==e.port)||"file"==e.scheme&&!e.host))return;if(e.scheme=h,n)return void(G(e)&&K[e.scheme]==e.port&&(e.port=null));h="","file"==e.scheme?l=ve:G(e)&&a&&a.scheme==e.scheme?l=ie:G(e)?l=le:"/"==o[f+1]?(l=ce,f++):(e.cannotBeABaseURL=!0,e.path.push(""),l=xe)}break;case oe:if(!a||a.cannotBeABaseURL&&"#"!=i)return O;if(a.cannotBeABaseURL&&"#"==i){e.scheme=a.scheme,e.path=a.path.slice(),e.query=a.query,e.fragment="",e.cannotBeABaseURL=!0,l=we;break}l="file"==a.scheme?ve:se;continue;case ie:if("/"!=i||"/"!=o[f+1]){l=se;continue}l=pe,f++;break;case ce:if("/"==i){l=fe;break}l=Ee;continue;case se:if(e.scheme=a.scheme,i==r)e.username=a.username,e.password=a.password,e.host=a.host,e.port=a.port,e.path=a.path.slice(),e.query=a.query;else if("/"==i||"\\"==i&&G(e))l=ue;else if("?"==i)e.username=a.username,e.password=a.password,e.host=a.host,e.port=a.port,e.path=a.path.slice(),e.query="",l=Se;else{if("#"!=i){e.username=a.username,e.password=a.password,e.host=a.host,e.port=a.port,e.path=a.path.slice(),e.path.pop(),l=Ee;continue}e.username=a.username,e.password=a.password,e.host=a.host,e.port=a.port,e.path=a.path.slice(),e.query=a.query,e.fragment="",l=we}break;case ue:if(!G(e)||"/"!=i&&"\\"!=i){if("/"!=i){e.username=a.username,e.password=a.password,e.host=a.host,e.port=a.port,l=Ee;continue}l=fe}else l=pe;break;case le:if(l=pe,"/"!=i||"/"!=h.charAt(f+1))continue;f++;break;case pe:if("/"!=i&&"\\"!=i){l=fe;continue}break;case fe:if("@"==i){m&&(h="%40"+h),m=!0,c=d(h);for(var y=0;y<c.length;y++){var b=c[y];if(":"!=b||g){var E=Y(b,$);g?e.password+=E:e.username+=E}else g=!0}h=""}else if(i==r||"/"==i||"?"==i||"#"==i||"\\"==i&&G(e)){if(m&&""==h)return"Invalid authority";f-=d(h).length+1,h="",l=de}else h+=i;break;case de:case he:if(n&&"file"==e.scheme){l=ye;continue}if(":"!=i||v){if(i==r||"/"==i||"?"==i||"#"==i||"\\"==i&&G(e)){if(G(e)&&""==h)return _;if(n&&""==h&&(Z(e)||null!==e.port))return;if(s=U(e,h))return s;if(h="",l=be,n)return;continue}"["==i?v=!0:"]"==i&&(v=!1),h+=i}else{if(""==h)return _;if(s=U(e,h))return s;if(h="",l=me,n==he)return}break;case me:if(!I.test(i)){if(i==r||"/"==i||"?"==i||"#"==i||"\\"==i&&G(e)||n){if(""!=h){var x=parseInt(h,10);if(x>65535)return A;e.port=G(e)&&x===K[e.scheme]?null:x,h=""}if(n)return;l=be;continue}return A}h+=i;break;case ve:if(e.scheme="file","/"==i||"\\"==i)l=ge;else{if(!a||"file"!=a.scheme){l=Ee;continue}if(i==r)e.host=a.host,e.path=a.path.slice(),e.query=a.query;else if("?"==i)e.host=a.host,e.path=a.path.slice(),e.query="",l=Se;else{if("#"!=i){ee(o.slice(f).join(""))||(e.host=a.host,e.path=a.path.slice(),te(e)),l=Ee;continue}e.host=a.host,e.path=a.path.slice(),e.query=a.query,e.fragment="",l=we}}break;case ge:if("/"==i||"\\"==i){l=ye;break}a&&"file"==a.scheme&&!ee(o.slice(f).join(""))&&(Q(a.path[0],!0)?e.path.push(a.path[0]):e.host=a.host),l=Ee;continue;case ye:if(i==r||"/"==i||"\\"==i||"?"==i||"#"==i){if(!n&&Q(h))l=Ee;else if(""==h){if(e.host="",n)return;l=be}else{if(s=U(e,h))return s;if("localhost"==e.host&&(e.host=""),n)return;h="",l=be}continue}h+=i;break;case be:if(G(e)){if(l=Ee,"/"!=i&&"\\"!=i)continue}else if(n||"?"!=i)if(n||"#"!=i){if(i!=r&&(l=Ee,"/"!=i))continue}else e.fragment="",l=we;else e.query="",l=Se;break;case Ee:if(i==r||"/"==i||"\\"==i&&G(e)||!n&&("?"==i||"#"==i)){if(".."===(u=(u=h).toLowerCase())||"%2e."===u||".%2e"===u||"%2e%2e"===u?(te(e),"/"==i||"\\"==i&&G(e)||e.path.push("")):ne(h)?"/"==i||"\\"==i&&G(e)||e.path.push(""):("file"==e.scheme&&!e.path.length&&Q(h)&&(e.host&&(e.host=""),h=h.charAt(0)+":"),e.path.push(h)),h="","file"==e.scheme&&(i==r||"?"==i||"#"==i))for(;e.path.length>1&&""===e.path[0];)e.path.shift();"?"==i?(e.query="",l=Se):"#"==i&&(e.fragment="",l=we)}else h+=Y(i,H);break;case xe:"?"==i?(e.query="",l=Se):"#"==i?(e.fragment="",l=we):i!=r&&(e.path[0]+=Y(i,J));break;case Se:n||"#"!=i?i!=r&&("'"==i&&G(e)?e.query+="%27":e.query+="#"==i?"%23":Y(i,J)):(e.fragment="",l=we);break;case we:i!=r&&(e.fragment+=Y(i,W))}f++}},Ce=function(e){var t,n,r=l(this,Ce,"URL"),a=arguments.length>1?arguments[1]:void 0,i=String(e),c=S(r,{type:"URL"});if(void 0!==a)if(a instanceof Ce)t=w(a);else if(n=je(t={},String(a)))throw TypeError(n);if(n=je(c,i,null,t))throw TypeError(n);var s=c.searchParams=new E,u=x(s);u.updateSearchParams(c.query),u.updateURL=function(){c.query=String(s)||null},o||(r.href=_e.call(r),r.origin=Ae.call(r),r.protocol=ke.call(r),r.username=Pe.call(r),r.password=Ie.call(r),r.host=Te.call(r),r.hostname=Ne.call(r),r.port=Re.call(r),r.pathname=Me.call(r),r.search=De.call(r),r.searchParams=qe.call(r),r.hash=Le.call(r))},Oe=Ce.prototype,_e=function(){var e=w(this),t=e.scheme,n=e.username,r=e.password,a=e.host,o=e.port,i=e.path,c=e.query,s=e.fragment,u=t+":";return null!==a?(u+="//",Z(e)&&(u+=n+(r?":"+r:"")+"@"),u+=F(a),null!==o&&(u+=":"+o)):"file"==t&&(u+="//"),u+=e.cannotBeABaseURL?i[0]:i.length?"/"+i.join("/"):"",null!==c&&(u+="?"+c),null!==s&&(u+="#"+s),u},Ae=function(){var e=w(this),t=e.scheme,n=e.port;if("blob"==t)try{return new URL(t.path[0]).origin}catch(e){return"null"}return"file"!=t&&G(e)?t+"://"+F(e.host)+(null!==n?":"+n:""):"null"},ke=function(){return w(this).scheme+":"},Pe=function(){return w(this).username},Ie=function(){return w(this).password},Te=function(){var e=w(this),t=e.host,n=e.port;return null===t?"":null===n?F(t):F(t)+":"+n},Ne=function(){var e=w(this).host;return null===e?"":F(e)},Re=function(){var e=w(this).port;return null===e?"":String(e)},Me=function(){var e=w(this),t=e.path;return e.cannotBeABaseURL?t[0]:t.length?"/"+t.join("/"):""},De=function(){var e=w(this).query;return e?"?"+e:""},qe=function(){return w(this).searchParams},Le=function(){var e=w(this).fragment;return e?"#"+e:""},Be=function(e,t){return{get:e,set:t,configurable:!0,enumerable:!0}};if(o&&s(Oe,{href:Be(_e,(function(e){var t=w(this),n=String(e),r=je(t,n);if(r)throw TypeError(r);x(t.searchParams).updateSearchParams(t.query)})),origin:Be(Ae),protocol:Be(ke,(function(e){var t=w(this);je(t,String(e)+":",re)})),username:Be(Pe,(function(e){var t=w(this),n=d(String(e));if(!X(t)){t.username="";for(var r=0;r<n.length;r++)t.username+=Y(n[r],$)}})),password:Be(Ie,(function(e){var t=w(this),n=d(String(e));if(!X(t)){t.password="";for(var r=0;r<n.length;r++)t.password+=Y(n[r],$)}})),host:Be(Te,(function(e){var t=w(this);t.cannotBeABaseURL||je(t,String(e),de)})),hostname:Be(Ne,(function(e){var t=w(this);t.cannotBeABaseURL||je(t,String(e),he)})),port:Be(Re,(function(e){var t=w(this);X(t)||(""==(e=String(e))?t.port=null:je(t,e,me))})),pathname:Be(Me,(function(e){var t=w(this);t.cannotBeABaseURL||(t.path=[],je(t,e+"",be))})),search:Be(De,(function(e){var t=w(this);""==(e=String(e))?t.query=null:("?"==e.charAt(0)&&(e=e.slice(1)),t.query="",je(t,e,Se)),x(t.searchParams).updateSearchParams(t.query)})),searchParams:Be(qe),hash:Be(Le,(function(e){var t=w(this);""!=(e=String(e))?("#"==e.charAt(0)&&(e=e.slice(1)),t.fragment="",je(t,e,we)):t.fragment=null}))}),u(Oe,"toJSON",(function(){return _e.call(this)}),{enumerable:!0}),u(Oe,"toString",(function(){return _e.call(this)}),{enumerable:!0}),b){var Ue=b.createObjectURL,Ve=b.revokeObjectURL;Ue&&u(Ce,"createObjectURL",(function(e){return Ue.apply(b,arguments)})),Ve&&u(Ce,"revokeObjectURL",(function(e){return Ve.apply(b,arguments)}))}v(Ce,"URL"),a({global:!0,forced:!i,sham:!o},{URL:Ce})},function(e,t,n){"use strict";var r=2147483647,a=/[^\0-\u007E]/,o=/[.\u3002\uFF0E\uFF61]/g,i="Overflow: input needs wider integers to process",c=Math.floor,s=String.fromCharCode,u=function(e){return e+22+75*(e<26)},l=function(e,t,n){var r=0;for(e=n?c(e/700):e>>1,e+=c(e/t);e>455;r+=36)e=c(e/35);return c(r+36*e/(e+38))},p=function(e){var t,n,a=[],o=(e=function(e){for(var t=[],n=0,r=e.length;n<r;){var a=e.charCodeAt(n++);if(a>=55296&&a<=56319&&n<r){var o=e.charCodeAt(n++);56320==(64512&o)?t.push(((1023&a)<<10)+(1023&o)+65536):(t.push(a),n--)}else t.push(a)}return t}(e)).length,p=128,f=0,d=72;for(t=0;t<e.length;t++)(n=e[t])<128&&a.push(s(n));var h=a.length,m=h;for(h&&a.push("-");m<o;){var v=r;for(t=0;t<e.length;t++)(n=e[t])>=p&&n<v&&(v=n);var g=m+1;if(v-p>c((r-f)/g))throw RangeError(i);for(f+=(v-p)*g,p=v,t=0;t<e.length;t++){if((n=e[t])<p&&++f>r)throw RangeError(i);if(n==p){for(var y=f,b=36;;b+=36){var E=b<=d?1:b>=d+26?26:b-d;if(y<E)break;var x=y-E,S=36-E;a.push(s(u(E+x%S))),y=c(x/S)}a.push(s(u(y))),d=l(f,g,m==h),f=0,++m}}++f,++p}return a.join("")};e.exports=function(e){var t,n,r=[],i=e.toLowerCase().replace(o,".").split(".");for(t=0;t<i.length;t++)n=i[t],r.push(a.test(n)?"xn--"+p(n):n);return r.join(".")}},function(e,t){},function(e,t,n){n(736);var r=n(31);e.exports=r.setTimeout},function(e,t,n){var r=n(24),a=n(37),o=n(186),i=[].slice,c=function(e){return function(t,n){var r=arguments.length>2,a=r?i.call(arguments,2):void 0;return e(r?function(){("function"==typeof t?t:Function(t)).apply(this,a)}:t,n)}};r({global:!0,bind:!0,forced:/MSIE .\./.test(o)},{setTimeout:c(a.setTimeout),setInterval:c(a.setInterval)})},function(e,t,n){var r=n(738);e.exports=r},function(e,t,n){n(739),n(138),n(81),n(64);var r=n(31);e.exports=r.Map},function(e,t,n){"use strict";var r=n(367),a=n(740);e.exports=r("Map",(function(e){return function(){return e(this,arguments.length?arguments[0]:void 0)}}),a)},function(e,t,n){"use strict";var r=n(55).f,a=n(92),o=n(124),i=n(91),c=n(108),s=n(99),u=n(179),l=n(348),p=n(43),f=n(152).fastKey,d=n(63),h=d.set,m=d.getterFor;e.exports={getConstructor:function(e,t,n,u){var l=e((function(e,r){c(e,l,t),h(e,{type:t,index:a(null),first:void 0,last:void 0,size:0}),p||(e.size=0),null!=r&&s(r,e[u],e,n)})),d=m(t),v=function(e,t,n){var r,a,o=d(e),i=g(e,t);return i?i.value=n:(o.last=i={index:a=f(t,!0),key:t,value:n,previous:r=o.last,next:void 0,removed:!1},o.first||(o.first=i),r&&(r.next=i),p?o.size++:e.size++,"F"!==a&&(o.index[a]=i)),e},g=function(e,t){var n,r=d(e),a=f(t);if("F"!==a)return r.index[a];for(n=r.first;n;n=n.next)if(n.key==t)return n};return o(l.prototype,{clear:function(){for(var e=d(this),t=e.index,n=e.first;n;)n.removed=!0,n.previous&&(n.previous=n.previous.next=void 0),delete t[n.index],n=n.next;e.first=e.last=void 0,p?e.size=0:this.size=0},delete:function(e){var t=this,n=d(t),r=g(t,e);if(r){var a=r.next,o=r.previous;delete n.index[r.index],r.removed=!0,o&&(o.next=a),a&&(a.previous=o),n.first==r&&(n.first=a),n.last==r&&(n.last=o),p?n.size--:t.size--}return!!r},forEach:function(e){for(var t,n=d(this),r=i(e,arguments.length>1?arguments[1]:void 0,3);t=t?t.next:n.first;)for(r(t.value,t.key,this);t&&t.removed;)t=t.previous},has:function(e){return!!g(this,e)}}),o(l.prototype,n?{get:function(e){var t=g(this,e);return t&&t.value},set:function(e,t){return v(this,0===e?0:e,t)}}:{add:function(e){return v(this,e=0===e?0:e,e)}}),p&&r(l.prototype,"size",{get:function(){return d(this).size}}),l},setStrong:function(e,t,n){var r=t+" Iterator",a=m(t),o=m(r);u(e,t,(function(e,t){h(this,{type:r,target:e,state:a(e),kind:t,last:void 0})}),(function(){for(var e=o(this),t=e.kind,n=e.last;n&&n.removed;)n=n.previous;return e.target&&(e.last=n=n?n.next:e.state.first)?"keys"==t?{value:n.key,done:!1}:"values"==t?{value:n.value,done:!1}:{value:[n.key,n.value],done:!1}:(e.target=void 0,{value:void 0,done:!0})}),n?"entries":"values",!n,!0),l(t)}}},function(e,t,n){n(64);var r=n(742),a=n(74),o=Array.prototype,i={DOMTokenList:!0,NodeList:!0};e.exports=function(e){var t=e.keys;return e===o||e instanceof Array&&t===o.keys||i.hasOwnProperty(a(e))?r:t}},function(e,t,n){var r=n(743);e.exports=r},function(e,t,n){n(119);var r=n(38);e.exports=r("Array").keys},function(e,t,n){n(64);var r=n(745),a=n(74),o=Array.prototype,i={DOMTokenList:!0,NodeList:!0};e.exports=function(e){var t=e.values;return e===o||e instanceof Array&&t===o.values||i.hasOwnProperty(a(e))?r:t}},function(e,t,n){var r=n(746);e.exports=r},function(e,t,n){n(119);var r=n(38);e.exports=r("Array").values},function(e,t,n){var r=n(748);e.exports=r},function(e,t,n){var r=n(749),a=Array.prototype;e.exports=function(e){var t=e.lastIndexOf;return e===a||e instanceof Array&&t===a.lastIndexOf?r:t}},function(e,t,n){n(750);var r=n(38);e.exports=r("Array").lastIndexOf},function(e,t,n){var r=n(24),a=n(751);r({target:"Array",proto:!0,forced:a!==[].lastIndexOf},{lastIndexOf:a})},function(e,t,n){"use strict";var r=n(59),a=n(116),o=n(68),i=n(95),c=n(56),s=Math.min,u=[].lastIndexOf,l=!!u&&1/[1].lastIndexOf(1,-0)<0,p=i("lastIndexOf"),f=c("indexOf",{ACCESSORS:!0,1:0}),d=l||!p||!f;e.exports=d?function(e){if(l)return u.apply(this,arguments)||0;var t=r(this),n=o(t.length),i=n-1;for(arguments.length>1&&(i=s(i,a(arguments[1]))),i<0&&(i=n+i);i>=0;i--)if(i in t&&t[i]===e)return i||0;return-1}:u},function(e,t,n){var r={"./all.js":262,"./auth/actions.js":72,"./auth/index.js":224,"./auth/reducers.js":225,"./auth/selectors.js":226,"./auth/spec-wrap-actions.js":227,"./configs/actions.js":112,"./configs/helpers.js":126,"./configs/index.js":264,"./configs/reducers.js":232,"./configs/selectors.js":231,"./configs/spec-actions.js":230,"./deep-linking/helpers.js":130,"./deep-linking/index.js":233,"./deep-linking/layout.js":234,"./deep-linking/operation-tag-wrapper.jsx":236,"./deep-linking/operation-wrapper.jsx":235,"./download-url.js":229,"./err/actions.js":54,"./err/error-transformers/hook.js":102,"./err/error-transformers/transformers/not-of-type.js":210,"./err/error-transformers/transformers/parameter-oneof.js":211,"./err/index.js":208,"./err/reducers.js":209,"./err/selectors.js":212,"./filter/index.js":237,"./filter/opsFilter.js":238,"./layout/actions.js":85,"./layout/index.js":213,"./layout/reducers.js":214,"./layout/selectors.js":215,"./logs/index.js":222,"./oas3/actions.js":51,"./oas3/auth-extensions/wrap-selectors.js":242,"./oas3/components/callbacks.jsx":245,"./oas3/components/http-auth.jsx":251,"./oas3/components/index.js":244,"./oas3/components/operation-link.jsx":247,"./oas3/components/operation-servers.jsx":252,"./oas3/components/request-body-editor.jsx":250,"./oas3/components/request-body.jsx":246,"./oas3/components/servers-container.jsx":249,"./oas3/components/servers.jsx":248,"./oas3/helpers.jsx":35,"./oas3/index.js":240,"./oas3/reducers.js":261,"./oas3/selectors.js":260,"./oas3/spec-extensions/selectors.js":243,"./oas3/spec-extensions/wrap-selectors.js":241,"./oas3/wrap-components/auth-item.jsx":255,"./oas3/wrap-components/index.js":253,"./oas3/wrap-components/json-schema-string.jsx":259,"./oas3/wrap-components/markdown.jsx":254,"./oas3/wrap-components/model.jsx":258,"./oas3/wrap-components/online-validator-badge.js":257,"./oas3/wrap-components/version-stamp.jsx":256,"./on-complete/index.js":239,"./samples/fn.js":111,"./samples/index.js":221,"./spec/actions.js":42,"./spec/index.js":216,"./spec/reducers.js":217,"./spec/selectors.js":78,"./spec/wrap-actions.js":218,"./swagger-js/configs-wrap-actions.js":223,"./swagger-js/index.js":263,"./util/index.js":228,"./view/index.js":219,"./view/root-injects.jsx":128};function a(e){var t=o(e);return n(t)}function o(e){if(!n.o(r,e)){var t=new Error("Cannot find module '"+e+"'");throw t.code="MODULE_NOT_FOUND",t}return r[e]}a.keys=function(){return Object.keys(r)},a.resolve=o,e.exports=a,a.id=752},function(e,t,n){"use strict";n.r(t);var r={};n.r(r),n.d(r,"Container",(function(){return Rn})),n.d(r,"Col",(function(){return Dn})),n.d(r,"Row",(function(){return qn})),n.d(r,"Button",(function(){return Ln})),n.d(r,"TextArea",(function(){return Bn})),n.d(r,"Input",(function(){return Un})),n.d(r,"Select",(function(){return Vn})),n.d(r,"Link",(function(){return zn})),n.d(r,"Collapse",(function(){return Jn}));var a={};n.r(a),n.d(a,"JsonSchemaForm",(function(){return Rr})),n.d(a,"JsonSchema_string",(function(){return Mr})),n.d(a,"JsonSchema_array",(function(){return Dr})),n.d(a,"JsonSchemaArrayItemText",(function(){return qr})),n.d(a,"JsonSchemaArrayItemFile",(function(){return Lr})),n.d(a,"JsonSchema_boolean",(function(){return Br})),n.d(a,"JsonSchema_object",(function(){return Ur}));var o=n(30),i=n.n(o),c=n(15),s=n.n(c),u=n(20),l=n.n(u),p=n(14),f=n.n(p),d=n(2),h=n.n(d),m=n(70),v=n.n(m),g=n(5),y=n.n(g),b=n(22),E=n.n(b),x=n(13),S=n.n(x),w=n(3),j=n.n(w),C=n(23),O=n.n(C),_=n(21),A=n.n(_),k=n(29),P=n.n(k),I=n(7),T=n.n(I),N=n(6),R=n.n(N),M=n(0),D=n.n(M),q=n(131),L=n(1),B=n.n(L),U=n(371),V=n(110),z=n.n(V),F=n(154),J=n.n(F),W=n(54),H=n(26),$=n(4),Y=function(e){return e};var K=function(){function e(){var t,n=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{};T()(this,e),v()(this,{state:{},plugins:[],system:{configs:{},fn:{},components:{},rootInjects:{},statePlugins:{}},boundSystem:{},toolbox:{}},n),this.getSystem=P()(t=this._getSystem).call(t,this),this.store=ee(Y,Object(L.fromJS)(this.state),this.getSystem),this.buildSystem(!1),this.register(this.plugins)}return R()(e,[{key:"getStore",value:function(){return this.store}},{key:"register",value:function(e){var t=!(arguments.length>1&&void 0!==arguments[1])||arguments[1],n=G(e,this.getSystem());X(this.system,n),t&&this.buildSystem();var r=Z.call(this.system,e,this.getSystem());r&&this.buildSystem()}},{key:"buildSystem",value:function(){var e=!(arguments.length>0&&void 0!==arguments[0])||arguments[0],t=this.getStore().dispatch,n=this.getStore().getState;this.boundSystem=A()({},this.getRootInjects(),this.getWrappedAndBoundActions(t),this.getWrappedAndBoundSelectors(n,this.getSystem),this.getStateThunks(n),this.getFn(),this.getConfigs()),e&&this.rebuildReducer()}},{key:"_getSystem",value:function(){return this.boundSystem}},{key:"getRootInjects",value:function(){var e,t,n;return A()({getSystem:this.getSystem,getStore:P()(e=this.getStore).call(e,this),getComponents:P()(t=this.getComponents).call(t,this),getState:this.getStore().getState,getConfigs:P()(n=this._getConfigs).call(n,this),Im:B.a,React:D.a},this.system.rootInjects||{})}},{key:"_getConfigs",value:function(){return this.system.configs}},{key:"getConfigs",value:function(){return{configs:this.system.configs}}},{key:"setConfigs",value:function(e){this.system.configs=e}},{key:"rebuildReducer",value:function(){var e,t,n,r;this.store.replaceReducer((r=this.system.statePlugins,e=Object($.y)(r,(function(e){return e.reducers})),n=E()(t=s()(e)).call(t,(function(t,n){return t[n]=function(e){return function(){var t=arguments.length>0&&void 0!==arguments[0]?arguments[0]:new L.Map,n=arguments.length>1?arguments[1]:void 0;if(!e)return t;var r=e[n.type];if(r){var a=Q(r)(t,n);return null===a?t:a}return t}}(e[n]),t}),{}),s()(n).length?Object(U.combineReducers)(n):Y))}},{key:"getType",value:function(e){var t=e[0].toUpperCase()+O()(e).call(e,1);return Object($.z)(this.system.statePlugins,(function(n,r){var a=n[e];if(a)return j()({},r+t,a)}))}},{key:"getSelectors",value:function(){return this.getType("selectors")}},{key:"getActions",value:function(){var e=this.getType("actions");return Object($.y)(e,(function(e){return Object($.z)(e,(function(e,t){if(Object($.r)(e))return j()({},t,e)}))}))}},{key:"getWrappedAndBoundActions",value:function(e){var t=this,n=this.getBoundActions(e);return Object($.y)(n,(function(e,n){var r=t.system.statePlugins[O()(n).call(n,0,-7)].wrapActions;return r?Object($.y)(e,(function(e,n){var a=r[n];return a?(S()(a)||(a=[a]),E()(a).call(a,(function(e,n){var r=function(){return n(e,t.getSystem()).apply(void 0,arguments)};if(!Object($.r)(r))throw new TypeError("wrapActions needs to return a function that returns a new function (ie the wrapped action)");return Q(r)}),e||Function.prototype)):e})):e}))}},{key:"getWrappedAndBoundSelectors",value:function(e,t){var n=this,r=this.getBoundSelectors(e,t);return Object($.y)(r,(function(t,r){var a=[O()(r).call(r,0,-9)],o=n.system.statePlugins[a].wrapSelectors;return o?Object($.y)(t,(function(t,r){var i=o[r];return i?(S()(i)||(i=[i]),E()(i).call(i,(function(t,r){var o=function(){for(var o,i=arguments.length,c=new Array(i),s=0;s<i;s++)c[s]=arguments[s];return r(t,n.getSystem()).apply(void 0,h()(o=[e().getIn(a)]).call(o,c))};if(!Object($.r)(o))throw new TypeError("wrapSelector needs to return a function that returns a new function (ie the wrapped action)");return o}),t||Function.prototype)):t})):t}))}},{key:"getStates",value:function(e){var t;return E()(t=s()(this.system.statePlugins)).call(t,(function(t,n){return t[n]=e.get(n),t}),{})}},{key:"getStateThunks",value:function(e){var t;return E()(t=s()(this.system.statePlugins)).call(t,(function(t,n){return t[n]=function(){return e().get(n)},t}),{})}},{key:"getFn",value:function(){return{fn:this.system.fn}}},{key:"getComponents",value:function(e){var t=this,n=this.system.components[e];return S()(n)?E()(n).call(n,(function(e,n){return n(e,t.getSystem())})):void 0!==e?this.system.components[e]:this.system.components}},{key:"getBoundSelectors",value:function(e,t){return Object($.y)(this.getSelectors(),(function(n,r){var a=[O()(r).call(r,0,-9)],o=function(){return e().getIn(a)};return Object($.y)(n,(function(e){return function(){for(var n,r=arguments.length,a=new Array(r),i=0;i<r;i++)a[i]=arguments[i];var c=Q(e).apply(null,h()(n=[o()]).call(n,a));return"function"==typeof c&&(c=Q(c)(t())),c}}))}))}},{key:"getBoundActions",value:function(e){e=e||this.getStore().dispatch;var t=this.getActions(),n=function e(t){return"function"!=typeof t?Object($.y)(t,(function(t){return e(t)})):function(){var e=null;try{e=t.apply(void 0,arguments)}catch(t){e={type:W.NEW_THROWN_ERR,error:!0,payload:z()(t)}}finally{return e}}};return Object($.y)(t,(function(t){return Object(q.bindActionCreators)(n(t),e)}))}},{key:"getMapStateToProps",value:function(){var e=this;return function(){return A()({},e.getSystem())}}},{key:"getMapDispatchToProps",value:function(e){var t=this;return function(n){return v()({},t.getWrappedAndBoundActions(n),t.getFn(),e)}}}]),e}();function G(e,t){return Object($.u)(e)&&!Object($.p)(e)?J()({},e):Object($.s)(e)?G(e(t),t):Object($.p)(e)?E()(n=y()(e).call(e,(function(e){return G(e,t)}))).call(n,X,{}):{};var n}function Z(e,t){var n=this,r=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},a=r.hasLoaded,o=a;return Object($.u)(e)&&!Object($.p)(e)&&"function"==typeof e.afterLoad&&(o=!0,Q(e.afterLoad).call(this,t)),Object($.s)(e)?Z.call(this,e(t),t,{hasLoaded:o}):Object($.p)(e)?y()(e).call(e,(function(e){return Z.call(n,e,t,{hasLoaded:o})})):o}function X(){var e=arguments.length>0&&void 0!==arguments[0]?arguments[0]:{},t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{};if(!Object($.u)(e))return{};if(!Object($.u)(t))return e;t.wrapComponents&&(Object($.y)(t.wrapComponents,(function(n,r){var a=e.components&&e.components[r];a&&S()(a)?(e.components[r]=h()(a).call(a,[n]),delete t.wrapComponents[r]):a&&(e.components[r]=[a,n],delete t.wrapComponents[r])})),s()(t.wrapComponents).length||delete t.wrapComponents);var n=e.statePlugins;if(Object($.u)(n))for(var r in n){var a=n[r];if(Object($.u)(a)&&Object($.u)(a.wrapActions)){var o=a.wrapActions;for(var i in o){var c,u=o[i];if(S()(u)||(u=[u],o[i]=u),t&&t.statePlugins&&t.statePlugins[r]&&t.statePlugins[r].wrapActions&&t.statePlugins[r].wrapActions[i])t.statePlugins[r].wrapActions[i]=h()(c=o[i]).call(c,t.statePlugins[r].wrapActions[i])}}}return v()(e,t)}function Q(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.logErrors,r=void 0===n||n;return"function"!=typeof e?e:function(){try{for(var t,n=arguments.length,a=new Array(n),o=0;o<n;o++)a[o]=arguments[o];return e.call.apply(e,h()(t=[this]).call(t,a))}catch(e){return r&&console.error(e),null}}}function ee(e,t,n){return function(e,t,n){var r=[Object($.K)(n)],a=H.a.__REDUX_DEVTOOLS_EXTENSION_COMPOSE__||q.compose;return Object(q.createStore)(e,t,a(q.applyMiddleware.apply(void 0,r)))}(e,t,n)}var te=n(208),ne=n(213),re=n(216),ae=n(219),oe=n(221),ie=n(222),ce=n(263),se=n(224),ue=n(228),le=n(229),pe=n(264),fe=n(233),de=n(237),he=n(239),me=n(12),ve=n.n(me),ge=n(10),ye=n.n(ge),be=n(8),Ee=n.n(be),xe=n(9),Se=n.n(xe),we=(n(11),n(27),n(53)),je=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a;return T()(this,n),a=t.call(this,e,r),j()(ye()(a),"toggleShown",(function(){var e=a.props,t=e.layoutActions,n=e.tag,r=e.operationId,o=e.isShown,i=a.getResolvedSubtree();o||void 0!==i||a.requestResolvedSubtree(),t.show(["operations",n,r],!o)})),j()(ye()(a),"onCancelClick",(function(){a.setState({tryItOutEnabled:!a.state.tryItOutEnabled})})),j()(ye()(a),"onTryoutClick",(function(){a.setState({tryItOutEnabled:!a.state.tryItOutEnabled})})),j()(ye()(a),"onExecute",(function(){a.setState({executeInProgress:!0})})),j()(ye()(a),"getResolvedSubtree",(function(){var e=a.props,t=e.specSelectors,n=e.path,r=e.method,o=e.specPath;return o?t.specResolvedSubtree(o.toJS()):t.specResolvedSubtree(["paths",n,r])})),j()(ye()(a),"requestResolvedSubtree",(function(){var e=a.props,t=e.specActions,n=e.path,r=e.method,o=e.specPath;return o?t.requestResolvedSubtree(o.toJS()):t.requestResolvedSubtree(["paths",n,r])})),a.state={tryItOutEnabled:!1,executeInProgress:!1},a}return R()(n,[{key:"mapStateToProps",value:function(e,t){var n,r=t.op,a=t.layoutSelectors,o=(0,t.getConfigs)(),i=o.docExpansion,c=o.deepLinking,s=o.displayOperationId,u=o.displayRequestDuration,l=o.supportedSubmitMethods,p=a.showSummary(),f=r.getIn(["operation","__originalOperationId"])||r.getIn(["operation","operationId"])||Object(we.e)(r.get("operation"),t.path,t.method)||r.get("id"),d=["operations",t.tag,f],m=c&&"false"!==c,v=ve()(l).call(l,t.method)>=0&&(void 0===t.allowTryItOut?t.specSelectors.allowTryItOutFor(t.path,t.method):t.allowTryItOut),g=r.getIn(["operation","security"])||t.specSelectors.security();return{operationId:f,isDeepLinkingEnabled:m,showSummary:p,displayOperationId:s,displayRequestDuration:u,allowTryItOut:v,security:g,isAuthorized:t.authSelectors.isAuthorized(g),isShown:a.isShown(d,"full"===i),jumpToKey:h()(n="paths.".concat(t.path,".")).call(n,t.method),response:t.specSelectors.responseFor(t.path,t.method),request:t.specSelectors.requestFor(t.path,t.method)}}},{key:"componentDidMount",value:function(){var e=this.props.isShown,t=this.getResolvedSubtree();e&&void 0===t&&this.requestResolvedSubtree()}},{key:"componentWillReceiveProps",value:function(e){var t=e.response,n=e.isShown,r=this.getResolvedSubtree();t!==this.props.response&&this.setState({executeInProgress:!1}),n&&void 0===r&&this.requestResolvedSubtree()}},{key:"render",value:function(){var e=this.props,t=e.op,n=e.tag,r=e.path,a=e.method,o=e.security,i=e.isAuthorized,c=e.operationId,s=e.showSummary,u=e.isShown,l=e.jumpToKey,p=e.allowTryItOut,f=e.response,d=e.request,h=e.displayOperationId,m=e.displayRequestDuration,v=e.isDeepLinkingEnabled,g=e.specPath,y=e.specSelectors,b=e.specActions,E=e.getComponent,x=e.getConfigs,S=e.layoutSelectors,w=e.layoutActions,j=e.authActions,C=e.authSelectors,O=e.oas3Actions,_=e.oas3Selectors,A=e.fn,k=E("operation"),P=this.getResolvedSubtree()||Object(L.Map)(),I=Object(L.fromJS)({op:P,tag:n,path:r,summary:t.getIn(["operation","summary"])||"",deprecated:P.get("deprecated")||t.getIn(["operation","deprecated"])||!1,method:a,security:o,isAuthorized:i,operationId:c,originalOperationId:P.getIn(["operation","__originalOperationId"]),showSummary:s,isShown:u,jumpToKey:l,allowTryItOut:p,request:d,displayOperationId:h,displayRequestDuration:m,isDeepLinkingEnabled:v,executeInProgress:this.state.executeInProgress,tryItOutEnabled:this.state.tryItOutEnabled});return D.a.createElement(k,{operation:I,response:f,request:d,isShown:u,toggleShown:this.toggleShown,onTryoutClick:this.onTryoutClick,onCancelClick:this.onCancelClick,onExecute:this.onExecute,specPath:g,specActions:b,specSelectors:y,oas3Actions:O,oas3Selectors:_,layoutActions:w,layoutSelectors:S,authActions:j,authSelectors:C,getComponent:E,getConfigs:x,fn:A})}}]),n}(M.PureComponent);j()(je,"defaultProps",{showSummary:!0,response:null,allowTryItOut:!0,displayOperationId:!1,displayRequestDuration:!1});var Ce=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"getLayout",value:function(){var e=this.props,t=e.getComponent,n=e.layoutSelectors.current(),r=t(n,!0);return r||function(){return D.a.createElement("h1",null,' No layout defined for "',n,'" ')}}},{key:"render",value:function(){var e=this.getLayout();return D.a.createElement(e,null)}}]),n}(D.a.Component);Ce.defaultProps={};var Oe=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"close",(function(){r.props.authActions.showDefinitions(!1)})),r}return R()(n,[{key:"render",value:function(){var e,t=this.props,n=t.authSelectors,r=t.authActions,a=t.getComponent,o=t.errSelectors,i=t.specSelectors,c=t.fn.AST,s=void 0===c?{}:c,u=n.shownDefinitions(),l=a("auths");return D.a.createElement("div",{className:"dialog-ux"},D.a.createElement("div",{className:"backdrop-ux"}),D.a.createElement("div",{className:"modal-ux"},D.a.createElement("div",{className:"modal-dialog-ux"},D.a.createElement("div",{className:"modal-ux-inner"},D.a.createElement("div",{className:"modal-ux-header"},D.a.createElement("h3",null,"Available authorizations"),D.a.createElement("button",{type:"button",className:"close-modal",onClick:this.close},D.a.createElement("svg",{width:"20",height:"20"},D.a.createElement("use",{href:"#close",xlinkHref:"#close"})))),D.a.createElement("div",{className:"modal-ux-content"},y()(e=u.valueSeq()).call(e,(function(e,t){return D.a.createElement(l,{key:t,AST:s,definitions:e,getComponent:a,errSelectors:o,authSelectors:n,authActions:r,specSelectors:i})})))))))}}]),n}(D.a.Component),_e=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.isAuthorized,n=e.showPopup,r=e.onClick,a=(0,e.getComponent)("authorizationPopup",!0);return D.a.createElement("div",{className:"auth-wrapper"},D.a.createElement("button",{className:t?"btn authorize locked":"btn authorize unlocked",onClick:r},D.a.createElement("span",null,"Authorize"),D.a.createElement("svg",{width:"20",height:"20"},D.a.createElement("use",{href:t?"#locked":"#unlocked",xlinkHref:t?"#locked":"#unlocked"}))),n&&D.a.createElement(a,null))}}]),n}(D.a.Component),Ae=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.authActions,n=e.authSelectors,r=e.specSelectors,a=e.getComponent,o=r.securityDefinitions(),i=n.definitionsToAuthorize(),c=a("authorizeBtn");return o?D.a.createElement(c,{onClick:function(){return t.showDefinitions(i)},isAuthorized:!!n.authorized().size,showPopup:!!n.shownDefinitions(),getComponent:a}):null}}]),n}(D.a.Component),ke=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onClick",(function(e){e.stopPropagation();var t=r.props.onClick;t&&t()})),r}return R()(n,[{key:"render",value:function(){var e=this.props.isAuthorized;return D.a.createElement("button",{className:e?"authorization__btn locked":"authorization__btn unlocked","aria-label":e?"authorization button locked":"authorization button unlocked",onClick:this.onClick},D.a.createElement("svg",{width:"20",height:"20"},D.a.createElement("use",{href:e?"#locked":"#unlocked",xlinkHref:e?"#locked":"#unlocked"})))}}]),n}(D.a.Component),Pe=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a;return T()(this,n),a=t.call(this,e,r),j()(ye()(a),"onAuthChange",(function(e){var t=e.name;a.setState(j()({},t,e))})),j()(ye()(a),"submitAuth",(function(e){e.preventDefault(),a.props.authActions.authorizeWithPersistOption(a.state)})),j()(ye()(a),"logoutClick",(function(e){e.preventDefault();var t=a.props,n=t.authActions,r=t.definitions,o=y()(r).call(r,(function(e,t){return t})).toArray();a.setState(E()(o).call(o,(function(e,t){return e[t]="",e}),{})),n.logoutWithPersistOption(o)})),j()(ye()(a),"close",(function(e){e.preventDefault(),a.props.authActions.showDefinitions(!1)})),a.state={},a}return R()(n,[{key:"render",value:function(){var e,t=this,n=this.props,r=n.definitions,a=n.getComponent,o=n.authSelectors,i=n.errSelectors,c=a("AuthItem"),s=a("oauth2",!0),u=a("Button"),l=o.authorized(),p=f()(r).call(r,(function(e,t){return!!l.get(t)})),d=f()(r).call(r,(function(e){return"oauth2"!==e.get("type")})),h=f()(r).call(r,(function(e){return"oauth2"===e.get("type")}));return D.a.createElement("div",{className:"auth-container"},!!d.size&&D.a.createElement("form",{onSubmit:this.submitAuth},y()(d).call(d,(function(e,n){return D.a.createElement(c,{key:n,schema:e,name:n,getComponent:a,onAuthChange:t.onAuthChange,authorized:l,errSelectors:i})})).toArray(),D.a.createElement("div",{className:"auth-btn-wrapper"},d.size===p.size?D.a.createElement(u,{className:"btn modal-btn auth",onClick:this.logoutClick},"Logout"):D.a.createElement(u,{type:"submit",className:"btn modal-btn auth authorize"},"Authorize"),D.a.createElement(u,{className:"btn modal-btn auth btn-done",onClick:this.close},"Close"))),h&&h.size?D.a.createElement("div",null,D.a.createElement("div",{className:"scope-def"},D.a.createElement("p",null,"Scopes are used to grant an application different levels of access to data on behalf of the end user. Each API may declare one or more scopes."),D.a.createElement("p",null,"API requires the following scopes. Select which ones you want to grant to Swagger UI.")),y()(e=f()(r).call(r,(function(e){return"oauth2"===e.get("type")}))).call(e,(function(e,t){return D.a.createElement("div",{key:t},D.a.createElement(s,{authorized:l,schema:e,name:t}))})).toArray()):null)}}]),n}(D.a.Component),Ie=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e,t=this.props,n=t.schema,r=t.name,a=t.getComponent,o=t.onAuthChange,i=t.authorized,c=t.errSelectors,s=a("apiKeyAuth"),u=a("basicAuth"),l=n.get("type");switch(l){case"apiKey":e=D.a.createElement(s,{key:r,schema:n,name:r,errSelectors:c,authorized:i,getComponent:a,onChange:o});break;case"basic":e=D.a.createElement(u,{key:r,schema:n,name:r,errSelectors:c,authorized:i,getComponent:a,onChange:o});break;default:e=D.a.createElement("div",{key:r},"Unknown security definition type ",l)}return D.a.createElement("div",{key:"".concat(r,"-jump")},e)}}]),n}(D.a.Component),Te=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props.error,t=e.get("level"),n=e.get("message"),r=e.get("source");return D.a.createElement("div",{className:"errors"},D.a.createElement("b",null,r," ",t),D.a.createElement("span",null,n))}}]),n}(D.a.Component),Ne=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a;T()(this,n),a=t.call(this,e,r),j()(ye()(a),"onChange",(function(e){var t=a.props.onChange,n=e.target.value,r=A()({},a.state,{value:n});a.setState(r),t(r)}));var o=a.props,i=o.name,c=o.schema,s=a.getValue();return a.state={name:i,schema:c,value:s},a}return R()(n,[{key:"getValue",value:function(){var e=this.props,t=e.name,n=e.authorized;return n&&n.getIn([t,"value"])}},{key:"render",value:function(){var e,t,n=this.props,r=n.schema,a=n.getComponent,o=n.errSelectors,i=n.name,c=a("Input"),s=a("Row"),u=a("Col"),l=a("authError"),p=a("Markdown",!0),d=a("JumpToPath",!0),h=this.getValue(),m=f()(e=o.allErrors()).call(e,(function(e){return e.get("authId")===i}));return D.a.createElement("div",null,D.a.createElement("h4",null,D.a.createElement("code",null,i||r.get("name")),"  (apiKey)",D.a.createElement(d,{path:["securityDefinitions",i]})),h&&D.a.createElement("h6",null,"Authorized"),D.a.createElement(s,null,D.a.createElement(p,{source:r.get("description")})),D.a.createElement(s,null,D.a.createElement("p",null,"Name: ",D.a.createElement("code",null,r.get("name")))),D.a.createElement(s,null,D.a.createElement("p",null,"In: ",D.a.createElement("code",null,r.get("in")))),D.a.createElement(s,null,D.a.createElement("label",null,"Value:"),h?D.a.createElement("code",null," ****** "):D.a.createElement(u,null,D.a.createElement(c,{type:"text",onChange:this.onChange,autoFocus:!0}))),y()(t=m.valueSeq()).call(t,(function(e,t){return D.a.createElement(l,{error:e,key:t})})))}}]),n}(D.a.Component),Re=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a;T()(this,n),a=t.call(this,e,r),j()(ye()(a),"onChange",(function(e){var t=a.props.onChange,n=e.target,r=n.value,o=n.name,i=a.state.value;i[o]=r,a.setState({value:i}),t(a.state)}));var o=a.props,i=o.schema,c=o.name,s=a.getValue().username;return a.state={name:c,schema:i,value:s?{username:s}:{}},a}return R()(n,[{key:"getValue",value:function(){var e=this.props,t=e.authorized,n=e.name;return t&&t.getIn([n,"value"])||{}}},{key:"render",value:function(){var e,t,n=this.props,r=n.schema,a=n.getComponent,o=n.name,i=n.errSelectors,c=a("Input"),s=a("Row"),u=a("Col"),l=a("authError"),p=a("JumpToPath",!0),d=a("Markdown",!0),h=this.getValue().username,m=f()(e=i.allErrors()).call(e,(function(e){return e.get("authId")===o}));return D.a.createElement("div",null,D.a.createElement("h4",null,"Basic authorization",D.a.createElement(p,{path:["securityDefinitions",o]})),h&&D.a.createElement("h6",null,"Authorized"),D.a.createElement(s,null,D.a.createElement(d,{source:r.get("description")})),D.a.createElement(s,null,D.a.createElement("label",null,"Username:"),h?D.a.createElement("code",null," ",h," "):D.a.createElement(u,null,D.a.createElement(c,{type:"text",required:"required",name:"username",onChange:this.onChange,autoFocus:!0}))),D.a.createElement(s,null,D.a.createElement("label",null,"Password:"),h?D.a.createElement("code",null," ****** "):D.a.createElement(u,null,D.a.createElement(c,{autoComplete:"new-password",name:"password",type:"password",onChange:this.onChange}))),y()(t=m.valueSeq()).call(t,(function(e,t){return D.a.createElement(l,{error:e,key:t})})))}}]),n}(D.a.Component);function Me(e){var t=e.example,n=e.showValue,r=e.getComponent,a=e.getConfigs,o=r("Markdown",!0),i=r("highlightCode");return t?D.a.createElement("div",{className:"example"},t.get("description")?D.a.createElement("section",{className:"example__section"},D.a.createElement("div",{className:"example__section-header"},"Example Description"),D.a.createElement("p",null,D.a.createElement(o,{source:t.get("description")}))):null,n&&t.has("value")?D.a.createElement("section",{className:"example__section"},D.a.createElement("div",{className:"example__section-header"},"Example Value"),D.a.createElement(i,{getConfigs:a,value:Object($.J)(t.get("value"))})):null):null}var De=n(392),qe=n.n(De),Le=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"_onSelect",(function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.isSyntheticChange,a=void 0!==n&&n;"function"==typeof r.props.onSelect&&r.props.onSelect(e,{isSyntheticChange:a})})),j()(ye()(r),"_onDomSelect",(function(e){if("function"==typeof r.props.onSelect){var t=e.target.selectedOptions[0].getAttribute("value");r._onSelect(t,{isSyntheticChange:!1})}})),j()(ye()(r),"getCurrentExample",(function(){var e=r.props,t=e.examples,n=e.currentExampleKey,a=t.get(n),o=t.keySeq().first(),i=t.get(o);return a||i||qe()({})})),r}return R()(n,[{key:"componentDidMount",value:function(){var e=this.props,t=e.onSelect,n=e.examples;if("function"==typeof t){var r=n.first(),a=n.keyOf(r);this._onSelect(a,{isSyntheticChange:!0})}}},{key:"componentWillReceiveProps",value:function(e){var t=e.currentExampleKey,n=e.examples;if(n!==this.props.examples&&!n.has(t)){var r=n.first(),a=n.keyOf(r);this._onSelect(a,{isSyntheticChange:!0})}}},{key:"render",value:function(){var e=this.props,t=e.examples,n=e.currentExampleKey,r=e.isValueModified,a=e.isModifiedValueAvailable,o=e.showLabels;return D.a.createElement("div",{className:"examples-select"},o?D.a.createElement("span",{className:"examples-select__section-label"},"Examples: "):null,D.a.createElement("select",{onChange:this._onDomSelect,value:a&&r?"__MODIFIED__VALUE__":n||""},a?D.a.createElement("option",{value:"__MODIFIED__VALUE__"},"[Modified value]"):null,y()(t).call(t,(function(e,t){return D.a.createElement("option",{key:t,value:t},e.get("summary")||t)})).valueSeq()))}}]),n}(D.a.PureComponent);j()(Le,"defaultProps",{examples:B.a.Map({}),onSelect:function(){for(var e,t,n=arguments.length,r=new Array(n),a=0;a<n;a++)r[a]=arguments[a];return(e=console).log.apply(e,h()(t=["DEBUG: ExamplesSelect was not given an onSelect callback"]).call(t,r))},currentExampleKey:null,showLabels:!0});var Be=n(50),Ue=n.n(Be),Ve=function(e){return L.List.isList(e)?e:Object($.J)(e)},ze=function(e){Ee()(n,e);var t=Se()(n);function n(e){var r;T()(this,n),r=t.call(this,e),j()(ye()(r),"_getStateForCurrentNamespace",(function(){var e=r.props.currentNamespace;return(r.state[e]||Object(L.Map)()).toObject()})),j()(ye()(r),"_setStateForCurrentNamespace",(function(e){var t=r.props.currentNamespace;return r._setStateForNamespace(t,e)})),j()(ye()(r),"_setStateForNamespace",(function(e,t){var n=(r.state[e]||Object(L.Map)()).mergeDeep(t);return r.setState(j()({},e,n))})),j()(ye()(r),"_isCurrentUserInputSameAsExampleValue",(function(){var e=r.props.currentUserInputValue;return r._getCurrentExampleValue()===e})),j()(ye()(r),"_getValueForExample",(function(e,t){var n=(t||r.props).examples;return Ve((n||Object(L.Map)({})).getIn([e,"value"]))})),j()(ye()(r),"_getCurrentExampleValue",(function(e){var t=(e||r.props).currentKey;return r._getValueForExample(t,e||r.props)})),j()(ye()(r),"_onExamplesSelect",(function(e){var t=arguments.length>1&&void 0!==arguments[1]?arguments[1]:{},n=t.isSyntheticChange,a=r.props,o=a.onSelect,i=a.updateValue,c=a.currentUserInputValue,s=r._getStateForCurrentNamespace(),u=s.lastUserEditedValue,l=r._getValueForExample(e);if("__MODIFIED__VALUE__"===e)return i(Ve(u)),r._setStateForCurrentNamespace({isModifiedValueSelected:!0});if("function"==typeof o){for(var p,f=arguments.length,d=new Array(f>2?f-2:0),m=2;m<f;m++)d[m-2]=arguments[m];o.apply(void 0,h()(p=[e,{isSyntheticChange:n}]).call(p,d))}r._setStateForCurrentNamespace({lastDownstreamValue:l,isModifiedValueSelected:n&&!!c&&c!==l}),n||"function"==typeof i&&i(Ve(l))}));var a=r._getCurrentExampleValue();return r.state=j()({},e.currentNamespace,Object(L.Map)({lastUserEditedValue:r.props.currentUserInputValue,lastDownstreamValue:a,isModifiedValueSelected:r.props.currentUserInputValue!==a})),r}return R()(n,[{key:"componentWillReceiveProps",value:function(e){var t=e.currentUserInputValue,n=e.examples,r=e.onSelect,a=this._getStateForCurrentNamespace(),o=a.lastUserEditedValue,i=a.lastDownstreamValue,c=this._getValueForExample(e.currentKey,e),s=Ue()(n).call(n,(function(e){return e.get("value")===t||Object($.J)(e.get("value"))===t}));s?r(n.keyOf(s),{isSyntheticChange:!0}):t!==this.props.currentUserInputValue&&t!==o&&t!==i&&this._setStateForNamespace(e.currentNamespace,{lastUserEditedValue:e.currentUserInputValue,isModifiedValueSelected:t!==c})}},{key:"render",value:function(){var e=this.props,t=e.currentUserInputValue,n=e.examples,r=e.currentKey,a=e.getComponent,o=this._getStateForCurrentNamespace(),i=o.lastDownstreamValue,c=o.lastUserEditedValue,s=o.isModifiedValueSelected,u=a("ExamplesSelect");return D.a.createElement(u,{examples:n,currentExampleKey:r,onSelect:this._onExamplesSelect,isModifiedValueAvailable:!!c&&c!==i,isValueModified:void 0!==t&&s&&t!==this._getCurrentExampleValue()})}}]),n}(D.a.PureComponent);j()(ze,"defaultProps",{examples:Object(L.Map)({}),currentNamespace:"__DEFAULT__NAMESPACE__",onSelect:function(){for(var e,t,n=arguments.length,r=new Array(n),a=0;a<n;a++)r[a]=arguments[a];return(e=console).log.apply(e,h()(t=["ExamplesSelectValueRetainer: no `onSelect` function was provided"]).call(t,r))},updateValue:function(){for(var e,t,n=arguments.length,r=new Array(n),a=0;a<n;a++)r[a]=arguments[a];return(e=console).log.apply(e,h()(t=["ExamplesSelectValueRetainer: no `updateValue` function was provided"]).call(t,r))}});var Fe=n(34),Je=n.n(Fe),We=n(101),He=n.n(We),$e=n(158),Ye=n.n($e),Ke=n(79),Ge=n.n(Ke);var Ze=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a;T()(this,n),a=t.call(this,e,r),j()(ye()(a),"close",(function(e){e.preventDefault(),a.props.authActions.showDefinitions(!1)})),j()(ye()(a),"authorize",(function(){var e=a.props,t=e.authActions,n=e.errActions,r=e.getConfigs,o=e.authSelectors,i=e.oas3Selectors,c=r(),s=o.getConfigs();n.clear({authId:name,type:"auth",source:"auth"}),function(e){var t=e.auth,n=e.authActions,r=e.errActions,a=e.configs,o=e.authConfigs,i=void 0===o?{}:o,c=e.currentServer,s=t.schema,u=t.scopes,l=t.name,p=t.clientId,f=s.get("flow"),d=[];switch(f){case"password":return void n.authorizePassword(t);case"application":return void n.authorizeApplication(t);case"accessCode":d.push("response_type=code");break;case"implicit":d.push("response_type=token");break;case"clientCredentials":return void n.authorizeApplication(t);case"authorizationCode":d.push("response_type=code")}"string"==typeof p&&d.push("client_id="+encodeURIComponent(p));var h=a.oauth2RedirectUrl;if(void 0!==h){d.push("redirect_uri="+encodeURIComponent(h));var m=[];if(S()(u)?m=u:B.a.List.isList(u)&&(m=u.toArray()),m.length>0){var v=i.scopeSeparator||" ";d.push("scope="+encodeURIComponent(m.join(v)))}var g=Object($.a)(new Date);if(d.push("state="+encodeURIComponent(g)),void 0!==i.realm&&d.push("realm="+encodeURIComponent(i.realm)),("authorizationCode"===f||"accessCode"===f)&&i.usePkceWithAuthorizationCodeGrant){var b=Object($.j)(),E=Object($.c)(b);d.push("code_challenge="+E),d.push("code_challenge_method=S256"),t.codeVerifier=b}var x=i.additionalQueryStringParams;for(var w in x){var j;void 0!==x[w]&&d.push(y()(j=[w,x[w]]).call(j,encodeURIComponent).join("="))}var C,O=s.get("authorizationUrl"),_=[c?Ge()(Object($.G)(O),c,!0).toString():Object($.G)(O),d.join("&")].join(-1===ve()(O).call(O,"?")?"?":"&");C="implicit"===f?n.preAuthorizeImplicit:i.useBasicAuthenticationWithAccessCodeGrant?n.authorizeAccessCodeWithBasicAuthentication:n.authorizeAccessCodeWithFormParams,H.a.swaggerUIRedirectOauth2={auth:t,state:g,redirectUrl:h,callback:C,errCb:r.newAuthErr},H.a.open(_)}else r.newAuthErr({authId:l,source:"validation",level:"error",message:"oauth2RedirectUrl configuration is not passed. Oauth2 authorization cannot be performed."})}({auth:a.state,currentServer:i.serverEffectiveValue(i.selectedServer()),authActions:t,errActions:n,configs:c,authConfigs:s})})),j()(ye()(a),"onScopeChange",(function(e){var t,n,r=e.target,o=r.checked,i=r.dataset.value;if(o&&-1===ve()(t=a.state.scopes).call(t,i)){var c,s=h()(c=a.state.scopes).call(c,[i]);a.setState({scopes:s})}else if(!o&&ve()(n=a.state.scopes).call(n,i)>-1){var u;a.setState({scopes:f()(u=a.state.scopes).call(u,(function(e){return e!==i}))})}})),j()(ye()(a),"onInputChange",(function(e){var t=e.target,n=t.dataset.name,r=t.value,o=j()({},n,r);a.setState(o)})),j()(ye()(a),"selectScopes",(function(e){var t;e.target.dataset.all?a.setState({scopes:Ye()(He()(t=a.props.schema.get("allowedScopes")||a.props.schema.get("scopes")).call(t))}):a.setState({scopes:[]})})),j()(ye()(a),"logout",(function(e){e.preventDefault();var t=a.props,n=t.authActions,r=t.errActions,o=t.name;r.clear({authId:o,type:"auth",source:"auth"}),n.logoutWithPersistOption([o])}));var o=a.props,i=o.name,c=o.schema,s=o.authorized,u=o.authSelectors,l=s&&s.get(i),p=u.getConfigs()||{},d=l&&l.get("username")||"",m=l&&l.get("clientId")||p.clientId||"",v=l&&l.get("clientSecret")||p.clientSecret||"",g=l&&l.get("passwordType")||"basic",b=l&&l.get("scopes")||p.scopes||[];return"string"==typeof b&&(b=b.split(p.scopeSeparator||" ")),a.state={appName:p.appName,name:i,schema:c,scopes:b,clientId:m,clientSecret:v,username:d,password:"",passwordType:g},a}return R()(n,[{key:"render",value:function(){var e,t,n=this,r=this.props,a=r.schema,o=r.getComponent,i=r.authSelectors,c=r.errSelectors,s=r.name,u=r.specSelectors,l=o("Input"),p=o("Row"),d=o("Col"),m=o("Button"),v=o("authError"),g=o("JumpToPath",!0),b=o("Markdown",!0),E=o("InitializedInput"),x=u.isOAS3,S="implicit",w="password",j=x()?"authorizationCode":"accessCode",C=x()?"clientCredentials":"application",O=a.get("flow"),_=a.get("allowedScopes")||a.get("scopes"),A=!!i.authorized().get(s),k=f()(e=c.allErrors()).call(e,(function(e){return e.get("authId")===s})),P=!f()(k).call(k,(function(e){return"validation"===e.get("source")})).size,I=a.get("description");return D.a.createElement("div",null,D.a.createElement("h4",null,s," (OAuth2, ",a.get("flow"),") ",D.a.createElement(g,{path:["securityDefinitions",s]})),this.state.appName?D.a.createElement("h5",null,"Application: ",this.state.appName," "):null,I&&D.a.createElement(b,{source:a.get("description")}),A&&D.a.createElement("h6",null,"Authorized"),(O===S||O===j)&&D.a.createElement("p",null,"Authorization URL: ",D.a.createElement("code",null,a.get("authorizationUrl"))),(O===w||O===j||O===C)&&D.a.createElement("p",null,"Token URL:",D.a.createElement("code",null," ",a.get("tokenUrl"))),D.a.createElement("p",{className:"flow"},"Flow: ",D.a.createElement("code",null,a.get("flow"))),O!==w?null:D.a.createElement(p,null,D.a.createElement(p,null,D.a.createElement("label",{htmlFor:"oauth_username"},"username:"),A?D.a.createElement("code",null," ",this.state.username," "):D.a.createElement(d,{tablet:10,desktop:10},D.a.createElement("input",{id:"oauth_username",type:"text","data-name":"username",onChange:this.onInputChange,autoFocus:!0}))),D.a.createElement(p,null,D.a.createElement("label",{htmlFor:"oauth_password"},"password:"),A?D.a.createElement("code",null," ****** "):D.a.createElement(d,{tablet:10,desktop:10},D.a.createElement("input",{id:"oauth_password",type:"password","data-name":"password",onChange:this.onInputChange}))),D.a.createElement(p,null,D.a.createElement("label",{htmlFor:"password_type"},"Client credentials location:"),A?D.a.createElement("code",null," ",this.state.passwordType," "):D.a.createElement(d,{tablet:10,desktop:10},D.a.createElement("select",{id:"password_type","data-name":"passwordType",onChange:this.onInputChange},D.a.createElement("option",{value:"basic"},"Authorization header"),D.a.createElement("option",{value:"request-body"},"Request body"))))),(O===C||O===S||O===j||O===w)&&(!A||A&&this.state.clientId)&&D.a.createElement(p,null,D.a.createElement("label",{htmlFor:"client_id"},"client_id:"),A?D.a.createElement("code",null," ****** "):D.a.createElement(d,{tablet:10,desktop:10},D.a.createElement(E,{id:"client_id",type:"text",required:O===w,initialValue:this.state.clientId,"data-name":"clientId",onChange:this.onInputChange}))),(O===C||O===j||O===w)&&D.a.createElement(p,null,D.a.createElement("label",{htmlFor:"client_secret"},"client_secret:"),A?D.a.createElement("code",null," ****** "):D.a.createElement(d,{tablet:10,desktop:10},D.a.createElement(E,{id:"client_secret",initialValue:this.state.clientSecret,type:"password","data-name":"clientSecret",onChange:this.onInputChange}))),!A&&_&&_.size?D.a.createElement("div",{className:"scopes"},D.a.createElement("h2",null,"Scopes:",D.a.createElement("a",{onClick:this.selectScopes,"data-all":!0},"select all"),D.a.createElement("a",{onClick:this.selectScopes},"select none")),y()(_).call(_,(function(e,t){var r,a,o,i,c;return D.a.createElement(p,{key:t},D.a.createElement("div",{className:"checkbox"},D.a.createElement(l,{"data-value":t,id:h()(r=h()(a="".concat(t,"-")).call(a,O,"-checkbox-")).call(r,n.state.name),disabled:A,checked:Je()(o=n.state.scopes).call(o,t),type:"checkbox",onChange:n.onScopeChange}),D.a.createElement("label",{htmlFor:h()(i=h()(c="".concat(t,"-")).call(c,O,"-checkbox-")).call(i,n.state.name)},D.a.createElement("span",{className:"item"}),D.a.createElement("div",{className:"text"},D.a.createElement("p",{className:"name"},t),D.a.createElement("p",{className:"description"},e)))))})).toArray()):null,y()(t=k.valueSeq()).call(t,(function(e,t){return D.a.createElement(v,{error:e,key:t})})),D.a.createElement("div",{className:"auth-btn-wrapper"},P&&(A?D.a.createElement(m,{className:"btn modal-btn auth authorize",onClick:this.logout},"Logout"):D.a.createElement(m,{className:"btn modal-btn auth authorize",onClick:this.authorize},"Authorize")),D.a.createElement(m,{className:"btn modal-btn auth btn-done",onClick:this.close},"Close")))}}]),n}(D.a.Component),Xe=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onClick",(function(){var e=r.props,t=e.specActions,n=e.path,a=e.method;t.clearResponse(n,a),t.clearRequest(n,a)})),r}return R()(n,[{key:"render",value:function(){return D.a.createElement("button",{className:"btn btn-clear opblock-control__btn",onClick:this.onClick},"Clear")}}]),n}(M.Component),Qe=function(e){var t=e.headers;return D.a.createElement("div",null,D.a.createElement("h5",null,"Response headers"),D.a.createElement("pre",{className:"microlight"},t))},et=function(e){var t=e.duration;return D.a.createElement("div",null,D.a.createElement("h5",null,"Request duration"),D.a.createElement("pre",{className:"microlight"},t," ms"))},tt=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"shouldComponentUpdate",value:function(e){return this.props.response!==e.response||this.props.path!==e.path||this.props.method!==e.method||this.props.displayRequestDuration!==e.displayRequestDuration}},{key:"render",value:function(){var e,t=this.props,n=t.response,r=t.getComponent,a=t.getConfigs,o=t.displayRequestDuration,i=t.specSelectors,c=t.path,u=t.method,l=a().showMutatedRequest?i.mutatedRequestFor(c,u):i.requestFor(c,u),p=n.get("status"),f=l.get("url"),d=n.get("headers").toJS(),m=n.get("notDocumented"),v=n.get("error"),g=n.get("text"),b=n.get("duration"),E=s()(d),x=d["content-type"]||d["Content-Type"],w=r("curl"),j=r("responseBody"),C=y()(E).call(E,(function(e){var t=S()(d[e])?d[e].join():d[e];return D.a.createElement("span",{className:"headerline",key:e}," ",e,": ",t," ")})),O=0!==C.length;return D.a.createElement("div",null,l&&D.a.createElement(w,{request:l,getConfigs:a}),f&&D.a.createElement("div",null,D.a.createElement("h4",null,"Request URL"),D.a.createElement("div",{className:"request-url"},D.a.createElement("pre",{className:"microlight"},f))),D.a.createElement("h4",null,"Server response"),D.a.createElement("table",{className:"responses-table live-responses-table"},D.a.createElement("thead",null,D.a.createElement("tr",{className:"responses-header"},D.a.createElement("td",{className:"col_header response-col_status"},"Code"),D.a.createElement("td",{className:"col_header response-col_description"},"Details"))),D.a.createElement("tbody",null,D.a.createElement("tr",{className:"response"},D.a.createElement("td",{className:"response-col_status"},p,m?D.a.createElement("div",{className:"response-undocumented"},D.a.createElement("i",null," Undocumented ")):null),D.a.createElement("td",{className:"response-col_description"},v?D.a.createElement("span",null,h()(e="".concat(n.get("name"),": ")).call(e,n.get("message"))):null,g?D.a.createElement(j,{content:g,contentType:x,url:f,headers:d,getConfigs:a,getComponent:r}):null,O?D.a.createElement(Qe,{headers:C}):null,o&&b?D.a.createElement(et,{duration:b}):null)))))}}]),n}(D.a.Component),nt=n(164),rt=["get","put","post","delete","options","head","patch"],at=h()(rt).call(rt,["trace"]),ot=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.specSelectors,n=e.getComponent,r=e.oas3Selectors,a=e.layoutSelectors,o=e.layoutActions,i=e.getConfigs,c=e.fn,s=t.taggedOperations(),u=n("OperationContainer",!0),l=n("OperationTag"),p=i().maxDisplayedTags,f=a.currentFilter();return f&&!0!==f&&"true"!==f&&"false"!==f&&(s=c.opsFilter(s,f)),p&&!isNaN(p)&&p>=0&&(s=O()(s).call(s,0,p)),D.a.createElement("div",null,y()(s).call(s,(function(e,c){var s=e.get("operations");return D.a.createElement(l,{key:"operation-"+c,tagObj:e,tag:c,oas3Selectors:r,layoutSelectors:a,layoutActions:o,getConfigs:i,getComponent:n,specUrl:t.url()},y()(s).call(s,(function(e){var n,r=e.get("path"),a=e.get("method"),o=B.a.List(["paths",r,a]),i=t.isOAS3()?at:rt;return-1===ve()(i).call(i,a)?null:D.a.createElement(u,{key:h()(n="".concat(r,"-")).call(n,a),specPath:o,op:e,path:r,method:a,tag:c})})).toArray())})).toArray(),s.size<1?D.a.createElement("h3",null," No operations defined in spec! "):null)}}]),n}(D.a.Component),it=n(129),ct=n.n(it);function st(e){return e.match(/^(?:[a-z]+:)?\/\//i)}function ut(e,t){return e?st(e)?(n=e).match(/^\/\//i)?h()(r="".concat(window.location.protocol)).call(r,n):n:new ct.a(e,t).href:t;var n,r}function lt(e,t){var n=arguments.length>2&&void 0!==arguments[2]?arguments[2]:{},r=n.selectedServer,a=void 0===r?"":r;if(e){if(st(e))return e;var o=ut(a,t);return new ct.a(e,o).href}}var pt=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e,t=this.props,n=t.tagObj,r=t.tag,a=t.children,o=t.oas3Selectors,i=t.layoutSelectors,c=t.layoutActions,s=t.getConfigs,u=t.getComponent,l=t.specUrl,p=s(),f=p.docExpansion,d=p.deepLinking,h=d&&"false"!==d,m=u("Collapse"),v=u("Markdown",!0),g=u("DeepLink"),b=u("Link"),E=n.getIn(["tagDetails","description"],null),x=n.getIn(["tagDetails","externalDocs","description"]),S=n.getIn(["tagDetails","externalDocs","url"]);Object($.s)(o)&&Object($.s)(o.selectedServer)&&(e=lt(S,l,{selectedServer:o.selectedServer()}));var w=["operations-tag",r],j=i.isShown(w,"full"===f||"list"===f);return D.a.createElement("div",{className:j?"opblock-tag-section is-open":"opblock-tag-section"},D.a.createElement("h4",{onClick:function(){return c.show(w,!j)},className:E?"opblock-tag":"opblock-tag no-desc",id:y()(w).call(w,(function(e){return Object($.g)(e)})).join("-"),"data-tag":r,"data-is-open":j},D.a.createElement(g,{enabled:h,isShown:j,path:Object($.d)(r),text:r}),E?D.a.createElement("small",null,D.a.createElement(v,{source:E})):D.a.createElement("small",null),D.a.createElement("div",null,x?D.a.createElement("small",null,x,e?": ":null,e?D.a.createElement(b,{href:Object($.G)(e),onClick:function(e){return e.stopPropagation()},target:"_blank"},e):null):null),D.a.createElement("button",{className:"expand-operation",title:j?"Collapse operation":"Expand operation",onClick:function(){return c.show(w,!j)}},D.a.createElement("svg",{className:"arrow",width:"20",height:"20"},D.a.createElement("use",{href:j?"#large-arrow-down":"#large-arrow",xlinkHref:j?"#large-arrow-down":"#large-arrow"})))),D.a.createElement(m,{isOpened:j},a))}}]),n}(D.a.Component);j()(pt,"defaultProps",{tagObj:B.a.fromJS({}),tag:""});var ft=function(e){Ee()(r,e);var t=Se()(r);function r(){return T()(this,r),t.apply(this,arguments)}return R()(r,[{key:"render",value:function(){var e=this.props,t=e.specPath,r=e.response,a=e.request,o=e.toggleShown,i=e.onTryoutClick,c=e.onCancelClick,s=e.onExecute,u=e.fn,l=e.getComponent,p=e.getConfigs,f=e.specActions,d=e.specSelectors,h=e.authActions,m=e.authSelectors,v=e.oas3Actions,g=e.oas3Selectors,y=this.props.operation,b=y.toJS(),E=b.deprecated,x=b.isShown,S=b.path,w=b.method,j=b.op,C=b.tag,O=b.operationId,_=b.allowTryItOut,A=b.displayRequestDuration,k=b.tryItOutEnabled,P=b.executeInProgress,I=j.description,T=j.externalDocs,N=j.schemes,R=T?lt(T.url,d.url(),{selectedServer:g.selectedServer()}):"",M=y.getIn(["op"]),q=M.get("responses"),L=Object($.n)(M,["parameters"]),B=d.operationScheme(S,w),U=["operations",C,O],V=Object($.m)(M),z=l("responses"),F=l("parameters"),J=l("execute"),W=l("clear"),H=l("Collapse"),Y=l("Markdown",!0),K=l("schemes"),G=l("OperationServers"),Z=l("OperationExt"),X=l("OperationSummary"),Q=l("Link"),ee=p().showExtensions;if(q&&r&&r.size>0){var te=!q.get(String(r.get("status")))&&!q.get("default");r=r.set("notDocumented",te)}var ne=[S,w];return D.a.createElement("div",{className:E?"opblock opblock-deprecated":x?"opblock opblock-".concat(w," is-open"):"opblock opblock-".concat(w),id:Object($.g)(U.join("-"))},D.a.createElement(X,{operationProps:y,toggleShown:o,getComponent:l,authActions:h,authSelectors:m,specPath:t}),D.a.createElement(H,{isOpened:x},D.a.createElement("div",{className:"opblock-body"},M&&M.size||null===M?null:D.a.createElement("img",{height:"32px",width:"32px",src:n(370),className:"opblock-loading-animation"}),E&&D.a.createElement("h4",{className:"opblock-title_normal"}," Warning: Deprecated"),I&&D.a.createElement("div",{className:"opblock-description-wrapper"},D.a.createElement("div",{className:"opblock-description"},D.a.createElement(Y,{source:I}))),R?D.a.createElement("div",{className:"opblock-external-docs-wrapper"},D.a.createElement("h4",{className:"opblock-title_normal"},"Find more details"),D.a.createElement("div",{className:"opblock-external-docs"},D.a.createElement("span",{className:"opblock-external-docs__description"},D.a.createElement(Y,{source:T.description})),D.a.createElement(Q,{target:"_blank",className:"opblock-external-docs__link",href:Object($.G)(R)},R))):null,M&&M.size?D.a.createElement(F,{parameters:L,specPath:t.push("parameters"),operation:M,onChangeKey:ne,onTryoutClick:i,onCancelClick:c,tryItOutEnabled:k,allowTryItOut:_,fn:u,getComponent:l,specActions:f,specSelectors:d,pathMethod:[S,w],getConfigs:p,oas3Actions:v,oas3Selectors:g}):null,k?D.a.createElement(G,{getComponent:l,path:S,method:w,operationServers:M.get("servers"),pathServers:d.paths().getIn([S,"servers"]),getSelectedServer:g.selectedServer,setSelectedServer:v.setSelectedServer,setServerVariableValue:v.setServerVariableValue,getServerVariable:g.serverVariableValue,getEffectiveServerValue:g.serverEffectiveValue}):null,k&&_&&N&&N.size?D.a.createElement("div",{className:"opblock-schemes"},D.a.createElement(K,{schemes:N,path:S,method:w,specActions:f,currentScheme:B})):null,D.a.createElement("div",{className:k&&r&&_?"btn-group":"execute-wrapper"},k&&_?D.a.createElement(J,{operation:M,specActions:f,specSelectors:d,oas3Selectors:g,oas3Actions:v,path:S,method:w,onExecute:s}):null,k&&r&&_?D.a.createElement(W,{specActions:f,path:S,method:w}):null),P?D.a.createElement("div",{className:"loading-container"},D.a.createElement("div",{className:"loading"})):null,q?D.a.createElement(z,{responses:q,request:a,tryItOutResponse:r,getComponent:l,getConfigs:p,specSelectors:d,oas3Actions:v,oas3Selectors:g,specActions:f,produces:d.producesOptionsFor([S,w]),producesValue:d.currentProducesFor([S,w]),specPath:t.push("responses"),path:S,method:w,displayRequestDuration:A,fn:u}):null,ee&&V.size?D.a.createElement(Z,{extensions:V,getComponent:l}):null)))}}]),r}(M.PureComponent);j()(ft,"defaultProps",{operation:null,response:null,request:null,specPath:Object(L.List)(),summary:""});var dt=n(77),ht=n.n(dt),mt=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.toggleShown,n=e.getComponent,r=e.authActions,a=e.authSelectors,o=e.operationProps,i=e.specPath,c=o.toJS(),s=c.summary,u=c.isAuthorized,l=c.method,p=c.op,f=c.showSummary,d=c.operationId,h=c.originalOperationId,m=c.displayOperationId,v=p.summary,g=o.get("security"),y=n("authorizeOperationBtn"),b=n("OperationSummaryMethod"),E=n("OperationSummaryPath"),x=n("JumpToPath",!0);return D.a.createElement("div",{className:"opblock-summary opblock-summary-".concat(l),onClick:t},D.a.createElement(b,{method:l}),D.a.createElement(E,{getComponent:n,operationProps:o,specPath:i}),f?D.a.createElement("div",{className:"opblock-summary-description"},ht()(v||s)):null,m&&(h||d)?D.a.createElement("span",{className:"opblock-summary-operation-id"},h||d):null,g&&g.count()?D.a.createElement(y,{isAuthorized:u,onClick:function(){var e=a.definitionsForRequirements(g);r.showDefinitions(e)}}):null,D.a.createElement(x,{path:i}))}}]),n}(M.PureComponent);j()(mt,"defaultProps",{operationProps:null,specPath:Object(L.List)(),summary:""});var vt=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props.method;return D.a.createElement("span",{className:"opblock-summary-method"},e.toUpperCase())}}]),n}(M.PureComponent);j()(vt,"defaultProps",{operationProps:null});var gt=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onCopyCapture",(function(e){e.clipboardData.setData("text/plain",r.props.operationProps.get("path")),e.preventDefault()})),r}return R()(n,[{key:"render",value:function(){var e,t=this.props,n=t.getComponent,r=t.operationProps.toJS(),a=r.deprecated,o=r.isShown,i=r.path,c=r.tag,s=r.operationId,u=r.isDeepLinkingEnabled,l=n("DeepLink");return D.a.createElement("span",{className:a?"opblock-summary-path__deprecated":"opblock-summary-path",onCopyCapture:this.onCopyCapture,"data-path":i},D.a.createElement(l,{enabled:u,isShown:o,path:Object($.d)(h()(e="".concat(c,"/")).call(e,s)),text:i.replace(/\//g,"​/")}))}}]),n}(M.PureComponent),yt=n(18),bt=n.n(yt),Et=function(e){var t,n=e.extensions,r=(0,e.getComponent)("OperationExtRow");return D.a.createElement("div",{className:"opblock-section"},D.a.createElement("div",{className:"opblock-section-header"},D.a.createElement("h4",null,"Extensions")),D.a.createElement("div",{className:"table-container"},D.a.createElement("table",null,D.a.createElement("thead",null,D.a.createElement("tr",null,D.a.createElement("td",{className:"col_header"},"Field"),D.a.createElement("td",{className:"col_header"},"Value"))),D.a.createElement("tbody",null,y()(t=n.entrySeq()).call(t,(function(e){var t,n=bt()(e,2),a=n[0],o=n[1];return D.a.createElement(r,{key:h()(t="".concat(a,"-")).call(t,o),xKey:a,xVal:o})}))))))},xt=function(e){var t=e.xKey,n=e.xVal,r=n?n.toJS?n.toJS():n:null;return D.a.createElement("tr",null,D.a.createElement("td",null,t),D.a.createElement("td",null,i()(r)))},St=n(87),wt=n(394),jt=n.n(wt).a,Ct=n(393),Ot=n.n(Ct).a,_t=n(395),At=n.n(_t).a,kt=n(398),Pt=n.n(kt).a,It=n(396),Tt=n.n(It).a,Nt=n(397),Rt=n.n(Nt).a,Mt={hljs:{display:"block",overflowX:"auto",padding:"0.5em",background:"#333",color:"white"},"hljs-name":{fontWeight:"bold"},"hljs-strong":{fontWeight:"bold"},"hljs-code":{fontStyle:"italic",color:"#888"},"hljs-emphasis":{fontStyle:"italic"},"hljs-tag":{color:"#62c8f3"},"hljs-variable":{color:"#ade5fc"},"hljs-template-variable":{color:"#ade5fc"},"hljs-selector-id":{color:"#ade5fc"},"hljs-selector-class":{color:"#ade5fc"},"hljs-string":{color:"#a2fca2"},"hljs-bullet":{color:"#d36363"},"hljs-type":{color:"#ffa"},"hljs-title":{color:"#ffa"},"hljs-section":{color:"#ffa"},"hljs-attribute":{color:"#ffa"},"hljs-quote":{color:"#ffa"},"hljs-built_in":{color:"#ffa"},"hljs-builtin-name":{color:"#ffa"},"hljs-number":{color:"#d36363"},"hljs-symbol":{color:"#d36363"},"hljs-keyword":{color:"#fcc28c"},"hljs-selector-tag":{color:"#fcc28c"},"hljs-literal":{color:"#fcc28c"},"hljs-comment":{color:"#888"},"hljs-deletion":{color:"#333",backgroundColor:"#fc9b9b"},"hljs-regexp":{color:"#c6b4f0"},"hljs-link":{color:"#c6b4f0"},"hljs-meta":{color:"#fc9b9b"},"hljs-addition":{backgroundColor:"#a2fca2",color:"#333"}};St.Light.registerLanguage("json",Ot),St.Light.registerLanguage("js",jt),St.Light.registerLanguage("xml",At),St.Light.registerLanguage("yaml",Tt),St.Light.registerLanguage("http",Rt),St.Light.registerLanguage("bash",Pt);var Dt={agate:Mt,arta:{hljs:{display:"block",overflowX:"auto",padding:"0.5em",background:"#222",color:"#aaa"},"hljs-subst":{color:"#aaa"},"hljs-section":{color:"#fff",fontWeight:"bold"},"hljs-comment":{color:"#444"},"hljs-quote":{color:"#444"},"hljs-meta":{color:"#444"},"hljs-string":{color:"#ffcc33"},"hljs-symbol":{color:"#ffcc33"},"hljs-bullet":{color:"#ffcc33"},"hljs-regexp":{color:"#ffcc33"},"hljs-number":{color:"#00cc66"},"hljs-addition":{color:"#00cc66"},"hljs-built_in":{color:"#32aaee"},"hljs-builtin-name":{color:"#32aaee"},"hljs-literal":{color:"#32aaee"},"hljs-type":{color:"#32aaee"},"hljs-template-variable":{color:"#32aaee"},"hljs-attribute":{color:"#32aaee"},"hljs-link":{color:"#32aaee"},"hljs-keyword":{color:"#6644aa"},"hljs-selector-tag":{color:"#6644aa"},"hljs-name":{color:"#6644aa"},"hljs-selector-id":{color:"#6644aa"},"hljs-selector-class":{color:"#6644aa"},"hljs-title":{color:"#bb1166"},"hljs-variable":{color:"#bb1166"},"hljs-deletion":{color:"#bb1166"},"hljs-template-tag":{color:"#bb1166"},"hljs-doctag":{fontWeight:"bold"},"hljs-strong":{fontWeight:"bold"},"hljs-emphasis":{fontStyle:"italic"}},monokai:{hljs:{display:"block",overflowX:"auto",padding:"0.5em",background:"#272822",color:"#ddd"},"hljs-tag":{color:"#f92672"},"hljs-keyword":{color:"#f92672",fontWeight:"bold"},"hljs-selector-tag":{color:"#f92672",fontWeight:"bold"},"hljs-literal":{color:"#f92672",fontWeight:"bold"},"hljs-strong":{color:"#f92672"},"hljs-name":{color:"#f92672"},"hljs-code":{color:"#66d9ef"},"hljs-class .hljs-title":{color:"white"},"hljs-attribute":{color:"#bf79db"},"hljs-symbol":{color:"#bf79db"},"hljs-regexp":{color:"#bf79db"},"hljs-link":{color:"#bf79db"},"hljs-string":{color:"#a6e22e"},"hljs-bullet":{color:"#a6e22e"},"hljs-subst":{color:"#a6e22e"},"hljs-title":{color:"#a6e22e",fontWeight:"bold"},"hljs-section":{color:"#a6e22e",fontWeight:"bold"},"hljs-emphasis":{color:"#a6e22e"},"hljs-type":{color:"#a6e22e",fontWeight:"bold"},"hljs-built_in":{color:"#a6e22e"},"hljs-builtin-name":{color:"#a6e22e"},"hljs-selector-attr":{color:"#a6e22e"},"hljs-selector-pseudo":{color:"#a6e22e"},"hljs-addition":{color:"#a6e22e"},"hljs-variable":{color:"#a6e22e"},"hljs-template-tag":{color:"#a6e22e"},"hljs-template-variable":{color:"#a6e22e"},"hljs-comment":{color:"#75715e"},"hljs-quote":{color:"#75715e"},"hljs-deletion":{color:"#75715e"},"hljs-meta":{color:"#75715e"},"hljs-doctag":{fontWeight:"bold"},"hljs-selector-id":{fontWeight:"bold"}},nord:{hljs:{display:"block",overflowX:"auto",padding:"0.5em",background:"#2E3440",color:"#D8DEE9"},"hljs-subst":{color:"#D8DEE9"},"hljs-selector-tag":{color:"#81A1C1"},"hljs-selector-id":{color:"#8FBCBB",fontWeight:"bold"},"hljs-selector-class":{color:"#8FBCBB"},"hljs-selector-attr":{color:"#8FBCBB"},"hljs-selector-pseudo":{color:"#88C0D0"},"hljs-addition":{backgroundColor:"rgba(163, 190, 140, 0.5)"},"hljs-deletion":{backgroundColor:"rgba(191, 97, 106, 0.5)"},"hljs-built_in":{color:"#8FBCBB"},"hljs-type":{color:"#8FBCBB"},"hljs-class":{color:"#8FBCBB"},"hljs-function":{color:"#88C0D0"},"hljs-function > .hljs-title":{color:"#88C0D0"},"hljs-keyword":{color:"#81A1C1"},"hljs-literal":{color:"#81A1C1"},"hljs-symbol":{color:"#81A1C1"},"hljs-number":{color:"#B48EAD"},"hljs-regexp":{color:"#EBCB8B"},"hljs-string":{color:"#A3BE8C"},"hljs-title":{color:"#8FBCBB"},"hljs-params":{color:"#D8DEE9"},"hljs-bullet":{color:"#81A1C1"},"hljs-code":{color:"#8FBCBB"},"hljs-emphasis":{fontStyle:"italic"},"hljs-formula":{color:"#8FBCBB"},"hljs-strong":{fontWeight:"bold"},"hljs-link:hover":{textDecoration:"underline"},"hljs-quote":{color:"#4C566A"},"hljs-comment":{color:"#4C566A"},"hljs-doctag":{color:"#8FBCBB"},"hljs-meta":{color:"#5E81AC"},"hljs-meta-keyword":{color:"#5E81AC"},"hljs-meta-string":{color:"#A3BE8C"},"hljs-attr":{color:"#8FBCBB"},"hljs-attribute":{color:"#D8DEE9"},"hljs-builtin-name":{color:"#81A1C1"},"hljs-name":{color:"#81A1C1"},"hljs-section":{color:"#88C0D0"},"hljs-tag":{color:"#81A1C1"},"hljs-variable":{color:"#D8DEE9"},"hljs-template-variable":{color:"#D8DEE9"},"hljs-template-tag":{color:"#5E81AC"},"abnf .hljs-attribute":{color:"#88C0D0"},"abnf .hljs-symbol":{color:"#EBCB8B"},"apache .hljs-attribute":{color:"#88C0D0"},"apache .hljs-section":{color:"#81A1C1"},"arduino .hljs-built_in":{color:"#88C0D0"},"aspectj .hljs-meta":{color:"#D08770"},"aspectj > .hljs-title":{color:"#88C0D0"},"bnf .hljs-attribute":{color:"#8FBCBB"},"clojure .hljs-name":{color:"#88C0D0"},"clojure .hljs-symbol":{color:"#EBCB8B"},"coq .hljs-built_in":{color:"#88C0D0"},"cpp .hljs-meta-string":{color:"#8FBCBB"},"css .hljs-built_in":{color:"#88C0D0"},"css .hljs-keyword":{color:"#D08770"},"diff .hljs-meta":{color:"#8FBCBB"},"ebnf .hljs-attribute":{color:"#8FBCBB"},"glsl .hljs-built_in":{color:"#88C0D0"},"groovy .hljs-meta:not(:first-child)":{color:"#D08770"},"haxe .hljs-meta":{color:"#D08770"},"java .hljs-meta":{color:"#D08770"},"ldif .hljs-attribute":{color:"#8FBCBB"},"lisp .hljs-name":{color:"#88C0D0"},"lua .hljs-built_in":{color:"#88C0D0"},"moonscript .hljs-built_in":{color:"#88C0D0"},"nginx .hljs-attribute":{color:"#88C0D0"},"nginx .hljs-section":{color:"#5E81AC"},"pf .hljs-built_in":{color:"#88C0D0"},"processing .hljs-built_in":{color:"#88C0D0"},"scss .hljs-keyword":{color:"#81A1C1"},"stylus .hljs-keyword":{color:"#81A1C1"},"swift .hljs-meta":{color:"#D08770"},"vim .hljs-built_in":{color:"#88C0D0",fontStyle:"italic"},"yaml .hljs-meta":{color:"#D08770"}},obsidian:{hljs:{display:"block",overflowX:"auto",padding:"0.5em",background:"#282b2e",color:"#e0e2e4"},"hljs-keyword":{color:"#93c763",fontWeight:"bold"},"hljs-selector-tag":{color:"#93c763",fontWeight:"bold"},"hljs-literal":{color:"#93c763",fontWeight:"bold"},"hljs-selector-id":{color:"#93c763"},"hljs-number":{color:"#ffcd22"},"hljs-attribute":{color:"#668bb0"},"hljs-code":{color:"white"},"hljs-class .hljs-title":{color:"white"},"hljs-section":{color:"white",fontWeight:"bold"},"hljs-regexp":{color:"#d39745"},"hljs-link":{color:"#d39745"},"hljs-meta":{color:"#557182"},"hljs-tag":{color:"#8cbbad"},"hljs-name":{color:"#8cbbad",fontWeight:"bold"},"hljs-bullet":{color:"#8cbbad"},"hljs-subst":{color:"#8cbbad"},"hljs-emphasis":{color:"#8cbbad"},"hljs-type":{color:"#8cbbad",fontWeight:"bold"},"hljs-built_in":{color:"#8cbbad"},"hljs-selector-attr":{color:"#8cbbad"},"hljs-selector-pseudo":{color:"#8cbbad"},"hljs-addition":{color:"#8cbbad"},"hljs-variable":{color:"#8cbbad"},"hljs-template-tag":{color:"#8cbbad"},"hljs-template-variable":{color:"#8cbbad"},"hljs-string":{color:"#ec7600"},"hljs-symbol":{color:"#ec7600"},"hljs-comment":{color:"#818e96"},"hljs-quote":{color:"#818e96"},"hljs-deletion":{color:"#818e96"},"hljs-selector-class":{color:"#A082BD"},"hljs-doctag":{fontWeight:"bold"},"hljs-title":{fontWeight:"bold"},"hljs-strong":{fontWeight:"bold"}},"tomorrow-night":{"hljs-comment":{color:"#969896"},"hljs-quote":{color:"#969896"},"hljs-variable":{color:"#cc6666"},"hljs-template-variable":{color:"#cc6666"},"hljs-tag":{color:"#cc6666"},"hljs-name":{color:"#cc6666"},"hljs-selector-id":{color:"#cc6666"},"hljs-selector-class":{color:"#cc6666"},"hljs-regexp":{color:"#cc6666"},"hljs-deletion":{color:"#cc6666"},"hljs-number":{color:"#de935f"},"hljs-built_in":{color:"#de935f"},"hljs-builtin-name":{color:"#de935f"},"hljs-literal":{color:"#de935f"},"hljs-type":{color:"#de935f"},"hljs-params":{color:"#de935f"},"hljs-meta":{color:"#de935f"},"hljs-link":{color:"#de935f"},"hljs-attribute":{color:"#f0c674"},"hljs-string":{color:"#b5bd68"},"hljs-symbol":{color:"#b5bd68"},"hljs-bullet":{color:"#b5bd68"},"hljs-addition":{color:"#b5bd68"},"hljs-title":{color:"#81a2be"},"hljs-section":{color:"#81a2be"},"hljs-keyword":{color:"#b294bb"},"hljs-selector-tag":{color:"#b294bb"},hljs:{display:"block",overflowX:"auto",background:"#1d1f21",color:"#c5c8c6",padding:"0.5em"},"hljs-emphasis":{fontStyle:"italic"},"hljs-strong":{fontWeight:"bold"}}},qt=s()(Dt),Lt=function(e){return Je()(qt).call(qt,e)?Dt[e]:(console.warn("Request style '".concat(e,"' is not available, returning default instead")),Mt)},Bt=n(41),Ut=n.n(Bt),Vt=n(399),zt=n.n(Vt),Ft=n(165),Jt=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"downloadText",(function(){zt()(r.props.value,r.props.fileName||"response.txt")})),j()(ye()(r),"preventYScrollingBeyondElement",(function(e){var t=e.target,n=e.nativeEvent.deltaY,r=t.scrollHeight,a=t.offsetHeight,o=t.scrollTop;r>a&&(0===o&&n<0||a+o>=r&&n>0)&&e.preventDefault()})),r}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.value,n=e.className,r=e.downloadable,a=e.getConfigs,o=e.canCopy,i=a?a():{syntaxHighlight:{activated:!0,theme:"agate"}};n=n||"";var c=Ut()(i,"syntaxHighlight.activated")?D.a.createElement(St.Light,{className:n+" microlight",onWheel:this.preventYScrollingBeyondElement,style:Lt(Ut()(i,"syntaxHighlight.theme"))},t):D.a.createElement("pre",{onWheel:this.preventYScrollingBeyondElement,className:n+" microlight"},t);return D.a.createElement("div",{className:"highlight-code"},r?D.a.createElement("div",{className:"download-contents",onClick:this.downloadText},"Download"):null,o?D.a.createElement("div",{className:"copy-to-clipboard"},D.a.createElement(Ft.CopyToClipboard,{text:t},D.a.createElement("button",null))):null,c)}}]),n}(M.Component),Wt=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onChangeProducesWrapper",(function(e){return r.props.specActions.changeProducesValue([r.props.path,r.props.method],e)})),j()(ye()(r),"onResponseContentTypeChange",(function(e){var t=e.controlsAcceptHeader,n=e.value,a=r.props,o=a.oas3Actions,i=a.path,c=a.method;t&&o.setResponseContentType({value:n,path:i,method:c})})),r}return R()(n,[{key:"render",value:function(){var e,t=this,r=this.props,a=r.responses,o=r.tryItOutResponse,i=r.getComponent,c=r.getConfigs,s=r.specSelectors,u=r.fn,l=r.producesValue,p=r.displayRequestDuration,f=r.specPath,d=r.path,h=r.method,m=r.oas3Selectors,v=r.oas3Actions,g=Object($.f)(a),b=i("contentType"),E=i("liveResponse"),x=i("response"),S=this.props.produces&&this.props.produces.size?this.props.produces:n.defaultProps.produces,w=s.isOAS3()?Object($.k)(a):null;return D.a.createElement("div",{className:"responses-wrapper"},D.a.createElement("div",{className:"opblock-section-header"},D.a.createElement("h4",null,"Responses"),s.isOAS3()?null:D.a.createElement("label",null,D.a.createElement("span",null,"Response content type"),D.a.createElement(b,{value:l,onChange:this.onChangeProducesWrapper,contentTypes:S,className:"execute-content-type"}))),D.a.createElement("div",{className:"responses-inner"},o?D.a.createElement("div",null,D.a.createElement(E,{response:o,getComponent:i,getConfigs:c,specSelectors:s,path:this.props.path,method:this.props.method,displayRequestDuration:p}),D.a.createElement("h4",null,"Responses")):null,D.a.createElement("table",{className:"responses-table"},D.a.createElement("thead",null,D.a.createElement("tr",{className:"responses-header"},D.a.createElement("td",{className:"col_header response-col_status"},"Code"),D.a.createElement("td",{className:"col_header response-col_description"},"Description"),s.isOAS3()?D.a.createElement("td",{className:"col col_header response-col_links"},"Links"):null)),D.a.createElement("tbody",null,y()(e=a.entrySeq()).call(e,(function(e){var n=bt()(e,2),r=n[0],a=n[1],p=o&&o.get("status")==r?"response_current":"";return D.a.createElement(x,{key:r,path:d,method:h,specPath:f.push(r),isDefault:g===r,fn:u,className:p,code:r,response:a,specSelectors:s,controlsAcceptHeader:a===w,onContentTypeChange:t.onResponseContentTypeChange,contentType:l,getConfigs:c,activeExamplesKey:m.activeExamplesMember(d,h,"responses",r),oas3Actions:v,getComponent:i})})).toArray()))))}}]),n}(D.a.Component);j()(Wt,"defaultProps",{tryItOutResponse:null,produces:Object(L.fromJS)(["application/json"]),displayRequestDuration:!1});var Ht=n(25),$t=n.n(Ht),Yt=n(400),Kt=n.n(Yt),Gt=n(57),Zt=n.n(Gt),Xt=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a;return T()(this,n),a=t.call(this,e,r),j()(ye()(a),"_onContentTypeChange",(function(e){var t=a.props,n=t.onContentTypeChange,r=t.controlsAcceptHeader;a.setState({responseContentType:e}),n({value:e,controlsAcceptHeader:r})})),j()(ye()(a),"getTargetExamplesKey",(function(){var e=a.props,t=e.response,n=e.contentType,r=e.activeExamplesKey,o=a.state.responseContentType||n,i=t.getIn(["content",o],Object(L.Map)({})).get("examples",null).keySeq().first();return r||i})),a.state={responseContentType:""},a}return R()(n,[{key:"render",value:function(){var e,t,n,r=this.props,a=r.path,o=r.method,i=r.code,c=r.response,s=r.className,u=r.specPath,l=r.fn,p=r.getComponent,f=r.getConfigs,d=r.specSelectors,m=r.contentType,v=r.controlsAcceptHeader,g=r.oas3Actions,b=l.inferSchema,E=d.isOAS3(),x=f().showExtensions,S=x?Object($.m)(c):null,w=c.get("headers"),j=c.get("links"),C=p("ResponseExtension"),O=p("headers"),_=p("highlightCode"),A=p("modelExample"),k=p("Markdown",!0),P=p("operationLink"),I=p("contentType"),T=p("ExamplesSelect"),N=p("Example"),R=this.state.responseContentType||m,M=c.getIn(["content",R],Object(L.Map)({})),q=M.get("examples",null);if(E){var B=M.get("schema");t=B?b(B.toJS()):null,n=B?Object(L.List)(["content",this.state.responseContentType,"schema"]):u}else t=c.get("schema"),n=c.has("schema")?u.push("schema"):u;var U,V,z=!1,F={includeReadOnly:!0};if(E)if(V=M.get("schema",Object(L.Map)({})).toJS(),q){var J=this.getTargetExamplesKey();void 0===(U=q.get(J,Object(L.Map)({})).get("value"))&&(U=Kt()(q).call(q).next().value),z=!0}else void 0!==M.get("example")&&(U=M.get("example"),z=!0);else{V=t,F=$t()($t()({},F),{},{includeWriteOnly:!0});var W=c.getIn(["examples",R]);W&&(U=W,z=!0)}var H,Y,K=z?(H=V,void 0===(Y=U)||(H||(H={}),Object($.s)(H.toJS)&&(H=H.toJS()),H.example=Y&&Object($.s)(Y.toJS)?Y.toJS():Y),H):V,G=function(e,t,n){return null!=e?D.a.createElement("div",null,D.a.createElement(t,{className:"example",getConfigs:n,value:Object($.J)(e)})):null}(K?Object($.o)(K,R,F):null,_,f);return D.a.createElement("tr",{className:"response "+(s||""),"data-code":i},D.a.createElement("td",{className:"response-col_status"},i),D.a.createElement("td",{className:"response-col_description"},D.a.createElement("div",{className:"response-col_description__inner"},D.a.createElement(k,{source:c.get("description")})),x&&S.size?y()(S).call(S,(function(e,t){var n;return D.a.createElement(C,{key:h()(n="".concat(t,"-")).call(n,e),xKey:t,xVal:e})})):null,E&&c.get("content")?D.a.createElement("section",{className:"response-controls"},D.a.createElement("div",{className:Zt()("response-control-media-type",{"response-control-media-type--accept-controller":v})},D.a.createElement("small",{className:"response-control-media-type__title"},"Media type"),D.a.createElement(I,{value:this.state.responseContentType,contentTypes:c.get("content")?c.get("content").keySeq():Object(L.Seq)(),onChange:this._onContentTypeChange}),v?D.a.createElement("small",{className:"response-control-media-type__accept-message"},"Controls ",D.a.createElement("code",null,"Accept")," header."):null),q?D.a.createElement("div",{className:"response-control-examples"},D.a.createElement("small",{className:"response-control-examples__title"},"Examples"),D.a.createElement(T,{examples:q,currentExampleKey:this.getTargetExamplesKey(),onSelect:function(e){return g.setActiveExamplesMember({name:e,pathMethod:[a,o],contextType:"responses",contextName:i})},showLabels:!1})):null):null,G||t?D.a.createElement(A,{specPath:n,getComponent:p,getConfigs:f,specSelectors:d,schema:Object($.i)(t),example:G,includeReadOnly:!0}):null,E&&q?D.a.createElement(N,{example:q.get(this.getTargetExamplesKey(),Object(L.Map)({})),getComponent:p,getConfigs:f,omitValue:!0}):null,w?D.a.createElement(O,{headers:w,getComponent:p}):null),E?D.a.createElement("td",{className:"response-col_links"},j?y()(e=j.toSeq()).call(e,(function(e,t){return D.a.createElement(P,{key:t,name:t,link:e,getComponent:p})})):D.a.createElement("i",null,"No links")):null)}}]),n}(D.a.Component);j()(Xt,"defaultProps",{response:Object(L.fromJS)({}),onContentTypeChange:function(){}});var Qt=function(e){var t=e.xKey,n=e.xVal;return D.a.createElement("div",{className:"response__extension"},t,": ",String(n))},en=n(401),tn=n.n(en),nn=n(402),rn=n.n(nn),an=n(403),on=n.n(an),cn=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"state",{parsedContent:null}),j()(ye()(r),"updateParsedContent",(function(e){var t=r.props.content;if(e!==t)if(t&&t instanceof Blob){var n=new FileReader;n.onload=function(){r.setState({parsedContent:n.result})},n.readAsText(t)}else r.setState({parsedContent:t.toString()})})),r}return R()(n,[{key:"componentDidMount",value:function(){this.updateParsedContent(null)}},{key:"componentDidUpdate",value:function(e){this.updateParsedContent(e.content)}},{key:"render",value:function(){var e,t,n=this.props,r=n.content,a=n.contentType,o=n.url,c=n.headers,s=void 0===c?{}:c,u=n.getConfigs,l=n.getComponent,p=this.state.parsedContent,f=l("highlightCode"),d="response_"+(new Date).getTime();if(o=o||"",/^application\/octet-stream/i.test(a)||s["Content-Disposition"]&&/attachment/i.test(s["Content-Disposition"])||s["content-disposition"]&&/attachment/i.test(s["content-disposition"])||s["Content-Description"]&&/File Transfer/i.test(s["Content-Description"])||s["content-description"]&&/File Transfer/i.test(s["content-description"]))if("Blob"in window){var h=a||"text/html",m=r instanceof Blob?r:new Blob([r],{type:h}),v=window.URL.createObjectURL(m),g=[h,o.substr(tn()(o).call(o,"/")+1),v].join(":"),y=s["content-disposition"]||s["Content-Disposition"];if(void 0!==y){var b=Object($.h)(y);null!==b&&(g=b)}t=H.a.navigator&&H.a.navigator.msSaveOrOpenBlob?D.a.createElement("div",null,D.a.createElement("a",{href:v,onClick:function(){return H.a.navigator.msSaveOrOpenBlob(m,g)}},"Download file")):D.a.createElement("div",null,D.a.createElement("a",{href:v,download:g},"Download file"))}else t=D.a.createElement("pre",{className:"microlight"},"Download headers detected but your browser does not support downloading binary via XHR (Blob).");else if(/json/i.test(a)){try{e=i()(JSON.parse(r),null,"  ")}catch(t){e="can't parse JSON.  Raw result:\n\n"+r}t=D.a.createElement(f,{downloadable:!0,fileName:"".concat(d,".json"),value:e,getConfigs:u,canCopy:!0})}else/xml/i.test(a)?(e=rn()(r,{textNodesOnSameLine:!0,indentor:"  "}),t=D.a.createElement(f,{downloadable:!0,fileName:"".concat(d,".xml"),value:e,getConfigs:u,canCopy:!0})):t="text/html"===on()(a)||/text\/plain/.test(a)?D.a.createElement(f,{downloadable:!0,fileName:"".concat(d,".html"),value:r,getConfigs:u,canCopy:!0}):/^image\//i.test(a)?Je()(a).call(a,"svg")?D.a.createElement("div",null," ",r," "):D.a.createElement("img",{className:"full-width",src:window.URL.createObjectURL(r)}):/^audio\//i.test(a)?D.a.createElement("pre",{className:"microlight"},D.a.createElement("audio",{controls:!0},D.a.createElement("source",{src:o,type:a}))):"string"==typeof r?D.a.createElement(f,{downloadable:!0,fileName:"".concat(d,".txt"),value:r,getConfigs:u,canCopy:!0}):r.size>0?p?D.a.createElement("div",null,D.a.createElement("p",{className:"i"},"Unrecognized response type; displaying content as text."),D.a.createElement(f,{downloadable:!0,fileName:"".concat(d,".txt"),value:p,getConfigs:u,canCopy:!0})):D.a.createElement("p",{className:"i"},"Unrecognized response type; unable to display."):null;return t?D.a.createElement("div",null,D.a.createElement("h5",null,"Response body"),t):null}}]),n}(D.a.PureComponent),sn=n(17),un=n.n(sn),ln=function(e){Ee()(n,e);var t=Se()(n);function n(e){var r;return T()(this,n),r=t.call(this,e),j()(ye()(r),"onChange",(function(e,t,n){var a=r.props;(0,a.specActions.changeParamByIdentity)(a.onChangeKey,e,t,n)})),j()(ye()(r),"onChangeConsumesWrapper",(function(e){var t=r.props;(0,t.specActions.changeConsumesValue)(t.onChangeKey,e)})),j()(ye()(r),"toggleTab",(function(e){return"parameters"===e?r.setState({parametersVisible:!0,callbackVisible:!1}):"callbacks"===e?r.setState({callbackVisible:!0,parametersVisible:!1}):void 0})),j()(ye()(r),"onChangeMediaType",(function(e){var t=e.value,n=e.pathMethod,a=r.props,o=a.specSelectors,i=a.specActions,c=a.oas3Selectors,s=a.oas3Actions,u=t,l=c.requestContentType.apply(c,un()(n));o.isMediaTypeSchemaPropertiesEqual(n,l,u)||(s.clearRequestBodyValue({pathMethod:n}),i.clearResponse.apply(i,un()(n)),i.clearRequest.apply(i,un()(n)),i.clearValidateParams(n)),s.setRequestContentType({value:t,pathMethod:n}),s.initRequestBodyValidateError({pathMethod:n})})),r.state={callbackVisible:!1,parametersVisible:!0},r}return R()(n,[{key:"render",value:function(){var e,t=this,n=this.props,r=n.onTryoutClick,a=n.onCancelClick,o=n.parameters,i=n.allowTryItOut,c=n.tryItOutEnabled,s=n.specPath,u=n.fn,l=n.getComponent,p=n.getConfigs,d=n.specSelectors,m=n.specActions,v=n.pathMethod,g=n.oas3Actions,b=n.oas3Selectors,E=n.operation,x=l("parameterRow"),S=l("TryItOutButton"),w=l("contentType"),j=l("Callbacks",!0),C=l("RequestBody",!0),_=c&&i,A=d.isOAS3(),k=E.get("requestBody");return D.a.createElement("div",{className:"opblock-section"},D.a.createElement("div",{className:"opblock-section-header"},A?D.a.createElement("div",{className:"tab-header"},D.a.createElement("div",{onClick:function(){return t.toggleTab("parameters")},className:"tab-item ".concat(this.state.parametersVisible&&"active")},D.a.createElement("h4",{className:"opblock-title"},D.a.createElement("span",null,"Parameters"))),E.get("callbacks")?D.a.createElement("div",{onClick:function(){return t.toggleTab("callbacks")},className:"tab-item ".concat(this.state.callbackVisible&&"active")},D.a.createElement("h4",{className:"opblock-title"},D.a.createElement("span",null,"Callbacks"))):null):D.a.createElement("div",{className:"tab-header"},D.a.createElement("h4",{className:"opblock-title"},"Parameters")),i?D.a.createElement(S,{enabled:c,onCancelClick:a,onTryoutClick:r}):null),this.state.parametersVisible?D.a.createElement("div",{className:"parameters-container"},o.count()?D.a.createElement("div",{className:"table-container"},D.a.createElement("table",{className:"parameters"},D.a.createElement("thead",null,D.a.createElement("tr",null,D.a.createElement("th",{className:"col_header parameters-col_name"},"Name"),D.a.createElement("th",{className:"col_header parameters-col_description"},"Description"))),D.a.createElement("tbody",null,function(e,t){var n,r;return y()(n=f()(r=e.valueSeq()).call(r,B.a.Map.isMap)).call(n,t)}(o,(function(e,n){var r;return D.a.createElement(x,{fn:u,specPath:s.push(n.toString()),getComponent:l,getConfigs:p,rawParam:e,param:d.parameterWithMetaByIdentity(v,e),key:h()(r="".concat(e.get("in"),".")).call(r,e.get("name")),onChange:t.onChange,onChangeConsumes:t.onChangeConsumesWrapper,specSelectors:d,specActions:m,oas3Actions:g,oas3Selectors:b,pathMethod:v,isExecute:_})})).toArray()))):D.a.createElement("div",{className:"opblock-description-wrapper"},D.a.createElement("p",null,"No parameters"))):null,this.state.callbackVisible?D.a.createElement("div",{className:"callbacks-container opblock-description-wrapper"},D.a.createElement(j,{callbacks:Object(L.Map)(E.get("callbacks")),specPath:O()(s).call(s,0,-1).push("callbacks")})):null,A&&k&&this.state.parametersVisible&&D.a.createElement("div",{className:"opblock-section opblock-section-request-body"},D.a.createElement("div",{className:"opblock-section-header"},D.a.createElement("h4",{className:"opblock-title parameter__name ".concat(k.get("required")&&"required")},"Request body"),D.a.createElement("label",null,D.a.createElement(w,{value:b.requestContentType.apply(b,un()(v)),contentTypes:k.get("content",Object(L.List)()).keySeq(),onChange:function(e){t.onChangeMediaType({value:e,pathMethod:v})},className:"body-param-content-type"}))),D.a.createElement("div",{className:"opblock-description-wrapper"},D.a.createElement(C,{specPath:O()(s).call(s,0,-1).push("requestBody"),requestBody:k,requestBodyValue:b.requestBodyValue.apply(b,un()(v)),requestBodyInclusionSetting:b.requestBodyInclusionSetting.apply(b,un()(v)),requestBodyErrors:b.requestBodyErrors.apply(b,un()(v)),isExecute:_,getConfigs:p,activeExamplesKey:b.activeExamplesMember.apply(b,h()(e=un()(v)).call(e,["requestBody","requestBody"])),updateActiveExamplesKey:function(e){t.props.oas3Actions.setActiveExamplesMember({name:e,pathMethod:t.props.pathMethod,contextType:"requestBody",contextName:"requestBody"})},onChange:function(e,t){if(t){var n=b.requestBodyValue.apply(b,un()(v)),r=L.Map.isMap(n)?n:Object(L.Map)();return g.setRequestBodyValue({pathMethod:v,value:r.setIn(t,e)})}g.setRequestBodyValue({value:e,pathMethod:v})},onChangeIncludeEmpty:function(e,t){g.setRequestBodyInclusion({pathMethod:v,value:t,name:e})},contentType:b.requestContentType.apply(b,un()(v))}))))}}]),n}(M.Component);j()(ln,"defaultProps",{onTryoutClick:Function.prototype,onCancelClick:Function.prototype,tryItOutEnabled:!1,allowTryItOut:!0,onChangeKey:[],specPath:[]});var pn=function(e){var t=e.xKey,n=e.xVal;return D.a.createElement("div",{className:"parameter__extension"},t,": ",String(n))},fn={onChange:function(){},isIncludedOptions:{}},dn=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onCheckboxChange",(function(e){(0,r.props.onChange)(e.target.checked)})),r}return R()(n,[{key:"componentDidMount",value:function(){var e=this.props,t=e.isIncludedOptions,n=e.onChange,r=t.shouldDispatchInit,a=t.defaultValue;r&&n(a)}},{key:"render",value:function(){var e=this.props,t=e.isIncluded,n=e.isDisabled;return D.a.createElement("div",null,D.a.createElement("label",{className:Zt()("parameter__empty_value_toggle",{disabled:n})},D.a.createElement("input",{type:"checkbox",disabled:n,checked:!n&&t,onChange:this.onCheckboxChange}),"Send empty value"))}}]),n}(M.Component);j()(dn,"defaultProps",fn);var hn=n(113),mn=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a;return T()(this,n),a=t.call(this,e,r),j()(ye()(a),"onChangeWrapper",(function(e){var t=arguments.length>1&&void 0!==arguments[1]&&arguments[1],n=a.props,r=n.onChange,o=n.rawParam;return r(o,""===e||e&&0===e.size?null:e,t)})),j()(ye()(a),"_onExampleSelect",(function(e){a.props.oas3Actions.setActiveExamplesMember({name:e,pathMethod:a.props.pathMethod,contextType:"parameters",contextName:a.getParamKey()})})),j()(ye()(a),"onChangeIncludeEmpty",(function(e){var t=a.props,n=t.specActions,r=t.param,o=t.pathMethod,i=r.get("name"),c=r.get("in");return n.updateEmptyParamInclusion(o,i,c,e)})),j()(ye()(a),"setDefaultValue",(function(){var e=a.props,t=e.specSelectors,n=e.pathMethod,r=e.rawParam,o=e.oas3Selectors,i=t.parameterWithMetaByIdentity(n,r)||Object(L.Map)(),c=Object(hn.a)(i,{isOAS3:t.isOAS3()}).schema,s=i.get("content",Object(L.Map)()).keySeq().first(),u=c?Object($.o)(c.toJS(),s,{includeWriteOnly:!0}):null;if(i&&void 0===i.get("value")&&"body"!==i.get("in")){var l;if(t.isSwagger2())l=void 0!==i.get("x-example")?i.get("x-example"):void 0!==i.getIn(["schema","example"])?i.getIn(["schema","example"]):c&&c.getIn(["default"]);else if(t.isOAS3()){var p,f=o.activeExamplesMember.apply(o,h()(p=un()(n)).call(p,["parameters",a.getParamKey()]));l=void 0!==i.getIn(["examples",f,"value"])?i.getIn(["examples",f,"value"]):void 0!==i.getIn(["content",s,"example"])?i.getIn(["content",s,"example"]):void 0!==i.get("example")?i.get("example"):void 0!==(c&&c.get("example"))?c&&c.get("example"):void 0!==(c&&c.get("default"))?c&&c.get("default"):i.get("default")}void 0===l||L.List.isList(l)||(l=Object($.J)(l)),void 0!==l?a.onChangeWrapper(l):c&&"object"===c.get("type")&&u&&!i.get("examples")&&a.onChangeWrapper(L.List.isList(u)?u:Object($.J)(u))}})),a.setDefaultValue(),a}return R()(n,[{key:"componentWillReceiveProps",value:function(e){var t,n=e.specSelectors,r=e.pathMethod,a=e.rawParam,o=n.isOAS3(),i=n.parameterWithMetaByIdentity(r,a)||new L.Map;if(i=i.isEmpty()?a:i,o){var c=Object(hn.a)(i,{isOAS3:o}).schema;t=c?c.get("enum"):void 0}else t=i?i.get("enum"):void 0;var s,u=i?i.get("value"):void 0;void 0!==u?s=u:a.get("required")&&t&&t.size&&(s=t.first()),void 0!==s&&s!==u&&this.onChangeWrapper(Object($.x)(s)),this.setDefaultValue()}},{key:"getParamKey",value:function(){var e,t=this.props.param;return t?h()(e="".concat(t.get("name"),"-")).call(e,t.get("in")):null}},{key:"render",value:function(){var e,t,n,r,a=this.props,o=a.param,i=a.rawParam,c=a.getComponent,s=a.getConfigs,u=a.isExecute,l=a.fn,p=a.onChangeConsumes,f=a.specSelectors,d=a.pathMethod,m=a.specPath,v=a.oas3Selectors,g=f.isOAS3(),b=s(),E=b.showExtensions,x=b.showCommonExtensions;if(o||(o=i),!i)return null;var S,w,j,C,O=c("JsonSchemaForm"),_=c("ParamBody"),A=o.get("in"),k="body"!==A?null:D.a.createElement(_,{getComponent:c,getConfigs:s,fn:l,param:o,consumes:f.consumesOptionsFor(d),consumesValue:f.contentTypeValues(d).get("requestContentType"),onChange:this.onChangeWrapper,onChangeConsumes:p,isExecute:u,specSelectors:f,pathMethod:d}),P=c("modelExample"),I=c("Markdown",!0),T=c("ParameterExt"),N=c("ParameterIncludeEmpty"),R=c("ExamplesSelectValueRetainer"),M=c("Example"),q=Object(hn.a)(o,{isOAS3:g}).schema,B=f.parameterWithMetaByIdentity(d,i)||Object(L.Map)(),U=q?q.get("format"):null,V=q?q.get("type"):null,z=q?q.getIn(["items","type"]):null,F="formData"===A,J="FormData"in H.a,W=o.get("required"),Y=B?B.get("value"):"",K=x?Object($.l)(q):null,G=E?Object($.m)(o):null,Z=!1;return void 0!==o&&q&&(S=q.get("items")),void 0!==S?(w=S.get("enum"),j=S.get("default")):q&&(w=q.get("enum")),w&&w.size&&w.size>0&&(Z=!0),void 0!==o&&(q&&(j=q.get("default")),void 0===j&&(j=o.get("default")),void 0===(C=o.get("example"))&&(C=o.get("x-example"))),D.a.createElement("tr",{"data-param-name":o.get("name"),"data-param-in":o.get("in")},D.a.createElement("td",{className:"parameters-col_name"},D.a.createElement("div",{className:W?"parameter__name required":"parameter__name"},o.get("name"),W?D.a.createElement("span",null," *"):null),D.a.createElement("div",{className:"parameter__type"},V,z&&"[".concat(z,"]"),U&&D.a.createElement("span",{className:"prop-format"},"($",U,")")),D.a.createElement("div",{className:"parameter__deprecated"},g&&o.get("deprecated")?"deprecated":null),D.a.createElement("div",{className:"parameter__in"},"(",o.get("in"),")"),x&&K.size?y()(e=K.entrySeq()).call(e,(function(e){var t,n=bt()(e,2),r=n[0],a=n[1];return D.a.createElement(T,{key:h()(t="".concat(r,"-")).call(t,a),xKey:r,xVal:a})})):null,E&&G.size?y()(G).call(G,(function(e,t){var n;return D.a.createElement(T,{key:h()(n="".concat(t,"-")).call(n,e),xKey:t,xVal:e})})):null),D.a.createElement("td",{className:"parameters-col_description"},o.get("description")?D.a.createElement(I,{source:o.get("description")}):null,!k&&u||!Z?null:D.a.createElement(I,{className:"parameter__enum",source:"<i>Available values</i> : "+y()(w).call(w,(function(e){return e})).toArray().join(", ")}),!k&&u||void 0===j?null:D.a.createElement(I,{className:"parameter__default",source:"<i>Default value</i> : "+j}),!k&&u||void 0===C?null:D.a.createElement(I,{source:"<i>Example</i> : "+C}),F&&!J&&D.a.createElement("div",null,"Error: your browser does not support FormData"),g&&o.get("examples")?D.a.createElement("section",{className:"parameter-controls"},D.a.createElement(R,{examples:o.get("examples"),onSelect:this._onExampleSelect,updateValue:this.onChangeWrapper,getComponent:c,defaultToFirstExample:!0,currentKey:v.activeExamplesMember.apply(v,h()(t=un()(d)).call(t,["parameters",this.getParamKey()])),currentUserInputValue:Y})):null,k?null:D.a.createElement(O,{fn:l,getComponent:c,value:Y,required:W,disabled:!u,description:o.get("description")?h()(n="".concat(o.get("name")," - ")).call(n,o.get("description")):"".concat(o.get("name")),onChange:this.onChangeWrapper,errors:B.get("errors"),schema:q}),k&&q?D.a.createElement(P,{getComponent:c,specPath:m.push("schema"),getConfigs:s,isExecute:u,specSelectors:f,schema:q,example:k,includeWriteOnly:!0}):null,!k&&u&&o.get("allowEmptyValue")?D.a.createElement(N,{onChange:this.onChangeIncludeEmpty,isIncluded:f.parameterInclusionSettingFor(d,o.get("name"),o.get("in")),isDisabled:!Object($.q)(Y)}):null,g&&o.get("examples")?D.a.createElement(M,{example:o.getIn(["examples",v.activeExamplesMember.apply(v,h()(r=un()(d)).call(r,["parameters",this.getParamKey()]))]),getComponent:c,getConfigs:s}):null))}}]),n}(M.Component),vn=n(163),gn=n.n(vn),yn=n(16),bn=n.n(yn),En=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"handleValidateParameters",(function(){var e=r.props,t=e.specSelectors,n=e.specActions,a=e.path,o=e.method;return n.validateParams([a,o]),t.validateBeforeExecute([a,o])})),j()(ye()(r),"handleValidateRequestBody",(function(){var e=r.props,t=e.path,n=e.method,a=e.specSelectors,o=e.oas3Selectors,i=e.oas3Actions,c={missingBodyValue:!1,missingRequiredKeys:[]};i.clearRequestBodyValidateError({path:t,method:n});var s=a.getOAS3RequiredRequestBodyContentType([t,n]),u=o.requestBodyValue(t,n),l=o.validateBeforeExecute([t,n]),p=o.requestContentType(t,n);if(!l)return c.missingBodyValue=!0,i.setRequestBodyValidateError({path:t,method:n,validationErrors:c}),!1;if(!s)return!0;var f=o.validateShallowRequired({oas3RequiredRequestBodyContentType:s,oas3RequestContentType:p,oas3RequestBodyValue:u});return!f||f.length<1||(bn()(f).call(f,(function(e){c.missingRequiredKeys.push(e)})),i.setRequestBodyValidateError({path:t,method:n,validationErrors:c}),!1)})),j()(ye()(r),"handleValidationResultPass",(function(){var e=r.props,t=e.specActions,n=e.operation,a=e.path,o=e.method;r.props.onExecute&&r.props.onExecute(),t.execute({operation:n,path:a,method:o})})),j()(ye()(r),"handleValidationResultFail",(function(){var e=r.props,t=e.specActions,n=e.path,a=e.method;t.clearValidateParams([n,a]),gn()((function(){t.validateParams([n,a])}),40)})),j()(ye()(r),"handleValidationResult",(function(e){e?r.handleValidationResultPass():r.handleValidationResultFail()})),j()(ye()(r),"onClick",(function(){var e=r.handleValidateParameters(),t=r.handleValidateRequestBody(),n=e&&t;r.handleValidationResult(n)})),j()(ye()(r),"onChangeProducesWrapper",(function(e){return r.props.specActions.changeProducesValue([r.props.path,r.props.method],e)})),r}return R()(n,[{key:"render",value:function(){return D.a.createElement("button",{className:"btn execute opblock-control__btn",onClick:this.onClick},"Execute")}}]),n}(M.Component),xn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e,t=this.props,n=t.headers,r=t.getComponent,a=r("Property"),o=r("Markdown",!0);return n&&n.size?D.a.createElement("div",{className:"headers-wrapper"},D.a.createElement("h4",{className:"headers__title"},"Headers:"),D.a.createElement("table",{className:"headers"},D.a.createElement("thead",null,D.a.createElement("tr",{className:"header-row"},D.a.createElement("th",{className:"header-col"},"Name"),D.a.createElement("th",{className:"header-col"},"Description"),D.a.createElement("th",{className:"header-col"},"Type"))),D.a.createElement("tbody",null,y()(e=n.entrySeq()).call(e,(function(e){var t=bt()(e,2),n=t[0],r=t[1];if(!B.a.Map.isMap(r))return null;var i=r.get("description"),c=r.getIn(["schema"])?r.getIn(["schema","type"]):r.getIn(["type"]),s=r.getIn(["schema","example"]);return D.a.createElement("tr",{key:n},D.a.createElement("td",{className:"header-col"},n),D.a.createElement("td",{className:"header-col"},i?D.a.createElement(o,{source:i}):null),D.a.createElement("td",{className:"header-col"},c," ",s?D.a.createElement(a,{propKey:"Example",propVal:s,propClass:"header-example"}):null))})).toArray()))):null}}]),n}(D.a.Component),Sn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.editorActions,n=e.errSelectors,r=e.layoutSelectors,a=e.layoutActions,o=(0,e.getComponent)("Collapse");if(t&&t.jumpToLine)var i=t.jumpToLine;var c=n.allErrors(),s=f()(c).call(c,(function(e){return"thrown"===e.get("type")||"error"===e.get("level")}));if(!s||s.count()<1)return null;var u=r.isShown(["errorPane"],!0),l=s.sortBy((function(e){return e.get("line")}));return D.a.createElement("pre",{className:"errors-wrapper"},D.a.createElement("hgroup",{className:"error"},D.a.createElement("h4",{className:"errors__title"},"Errors"),D.a.createElement("button",{className:"btn errors__clear-btn",onClick:function(){return a.show(["errorPane"],!u)}},u?"Hide":"Show")),D.a.createElement(o,{isOpened:u,animated:!0},D.a.createElement("div",{className:"errors"},y()(l).call(l,(function(e,t){var n=e.get("type");return"thrown"===n||"auth"===n?D.a.createElement(wn,{key:t,error:e.get("error")||e,jumpToLine:i}):"spec"===n?D.a.createElement(jn,{key:t,error:e,jumpToLine:i}):void 0})))))}}]),n}(D.a.Component),wn=function(e){var t=e.error,n=e.jumpToLine;if(!t)return null;var r=t.get("line");return D.a.createElement("div",{className:"error-wrapper"},t?D.a.createElement("div",null,D.a.createElement("h4",null,t.get("source")&&t.get("level")?Cn(t.get("source"))+" "+t.get("level"):"",t.get("path")?D.a.createElement("small",null," at ",t.get("path")):null),D.a.createElement("span",{className:"message thrown"},t.get("message")),D.a.createElement("div",{className:"error-line"},r&&n?D.a.createElement("a",{onClick:P()(n).call(n,null,r)},"Jump to line ",r):null)):null)},jn=function(e){var t=e.error,n=e.jumpToLine,r=null;return t.get("path")?r=L.List.isList(t.get("path"))?D.a.createElement("small",null,"at ",t.get("path").join(".")):D.a.createElement("small",null,"at ",t.get("path")):t.get("line")&&!n&&(r=D.a.createElement("small",null,"on line ",t.get("line"))),D.a.createElement("div",{className:"error-wrapper"},t?D.a.createElement("div",null,D.a.createElement("h4",null,Cn(t.get("source"))+" "+t.get("level")," ",r),D.a.createElement("span",{className:"message"},t.get("message")),D.a.createElement("div",{className:"error-line"},n?D.a.createElement("a",{onClick:P()(n).call(n,null,t.get("line"))},"Jump to line ",t.get("line")):null)):null)};function Cn(e){var t;return y()(t=(e||"").split(" ")).call(t,(function(e){return e[0].toUpperCase()+O()(e).call(e,1)})).join(" ")}wn.defaultProps={jumpToLine:null};var On=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onChangeWrapper",(function(e){return r.props.onChange(e.target.value)})),r}return R()(n,[{key:"componentDidMount",value:function(){this.props.contentTypes&&this.props.onChange(this.props.contentTypes.first())}},{key:"componentWillReceiveProps",value:function(e){var t;e.contentTypes&&e.contentTypes.size&&(Je()(t=e.contentTypes).call(t,e.value)||e.onChange(e.contentTypes.first()))}},{key:"render",value:function(){var e=this.props,t=e.contentTypes,n=e.className,r=e.value;return t&&t.size?D.a.createElement("div",{className:"content-type-wrapper "+(n||"")},D.a.createElement("select",{className:"content-type",value:r||"",onChange:this.onChangeWrapper},y()(t).call(t,(function(e){return D.a.createElement("option",{key:e,value:e},e)})).toArray())):null}}]),n}(D.a.Component);j()(On,"defaultProps",{onChange:function(){},value:null,contentTypes:Object(L.fromJS)(["application/json"])});var _n=n(28),An=n.n(_n),kn=n(49),Pn=n.n(kn),In=n(82),Tn=n.n(In);function Nn(){for(var e,t=arguments.length,n=new Array(t),r=0;r<t;r++)n[r]=arguments[r];return Tn()(e=f()(n).call(n,(function(e){return!!e})).join(" ")).call(e)}var Rn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.fullscreen,n=e.full,r=Pn()(e,["fullscreen","full"]);if(t)return D.a.createElement("section",r);var a="swagger-container"+(n?"-full":"");return D.a.createElement("section",An()({},r,{className:Nn(r.className,a)}))}}]),n}(D.a.Component),Mn={mobile:"",tablet:"-tablet",desktop:"-desktop",large:"-hd"},Dn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e,t=this.props,n=t.hide,r=t.keepContents,a=(t.mobile,t.tablet,t.desktop,t.large,Pn()(t,["hide","keepContents","mobile","tablet","desktop","large"]));if(n&&!r)return D.a.createElement("span",null);var o=[];for(var i in Mn)if(Mn.hasOwnProperty(i)){var c=Mn[i];if(i in this.props){var s=this.props[i];if(s<1){o.push("none"+c);continue}o.push("block"+c),o.push("col-"+s+c)}}n&&o.push("hidden");var u=Nn.apply(void 0,h()(e=[a.className]).call(e,o));return D.a.createElement("section",An()({},a,{className:u}))}}]),n}(D.a.Component),qn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){return D.a.createElement("div",An()({},this.props,{className:Nn(this.props.className,"wrapper")}))}}]),n}(D.a.Component),Ln=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){return D.a.createElement("button",An()({},this.props,{className:Nn(this.props.className,"button")}))}}]),n}(D.a.Component);j()(Ln,"defaultProps",{className:""});var Bn=function(e){return D.a.createElement("textarea",e)},Un=function(e){return D.a.createElement("input",e)},Vn=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a,o;return T()(this,n),a=t.call(this,e,r),j()(ye()(a),"onChange",(function(e){var t,n,r=a.props,o=r.onChange,i=r.multiple,c=O()([]).call(e.target.options);i?t=y()(n=f()(c).call(c,(function(e){return e.selected}))).call(n,(function(e){return e.value})):t=e.target.value;a.setState({value:t}),o&&o(t)})),o=e.value?e.value:e.multiple?[""]:"",a.state={value:o},a}return R()(n,[{key:"componentWillReceiveProps",value:function(e){e.value!==this.props.value&&this.setState({value:e.value})}},{key:"render",value:function(){var e,t,n=this.props,r=n.allowedValues,a=n.multiple,o=n.allowEmptyValue,i=n.disabled,c=(null===(e=this.state.value)||void 0===e||null===(t=e.toJS)||void 0===t?void 0:t.call(e))||this.state.value;return D.a.createElement("select",{className:this.props.className,multiple:a,value:c,onChange:this.onChange,disabled:i},o?D.a.createElement("option",{value:""},"--"):null,y()(r).call(r,(function(e,t){return D.a.createElement("option",{key:t,value:String(e)},String(e))})))}}]),n}(D.a.Component);j()(Vn,"defaultProps",{multiple:!1,allowEmptyValue:!0});var zn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){return D.a.createElement("a",An()({},this.props,{rel:"noopener noreferrer",className:Nn(this.props.className,"link")}))}}]),n}(D.a.Component),Fn=function(e){var t=e.children;return D.a.createElement("div",{className:"no-margin"}," ",t," ")},Jn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"renderNotAnimated",value:function(){return this.props.isOpened?D.a.createElement(Fn,null,this.props.children):D.a.createElement("noscript",null)}},{key:"render",value:function(){var e=this.props,t=e.animated,n=e.isOpened,r=e.children;return t?(r=n?r:null,D.a.createElement(Fn,null,r)):this.renderNotAnimated()}}]),n}(D.a.Component);j()(Jn,"defaultProps",{isOpened:!1,animated:!1});var Wn=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r,a;T()(this,n);for(var o=arguments.length,i=new Array(o),c=0;c<o;c++)i[c]=arguments[c];return(a=t.call.apply(t,h()(e=[this]).call(e,i))).setTagShown=P()(r=a._setTagShown).call(r,ye()(a)),a}return R()(n,[{key:"_setTagShown",value:function(e,t){this.props.layoutActions.show(e,t)}},{key:"showOp",value:function(e,t){this.props.layoutActions.show(e,t)}},{key:"render",value:function(){var e=this.props,t=e.specSelectors,n=e.layoutSelectors,r=e.layoutActions,a=e.getComponent,o=t.taggedOperations(),i=a("Collapse");return D.a.createElement("div",null,D.a.createElement("h4",{className:"overview-title"},"Overview"),y()(o).call(o,(function(e,t){var a=e.get("operations"),o=["overview-tags",t],c=n.isShown(o,!0);return D.a.createElement("div",{key:"overview-"+t},D.a.createElement("h4",{onClick:function(){return r.show(o,!c)},className:"link overview-tag"}," ",c?"-":"+",t),D.a.createElement(i,{isOpened:c,animated:!0},y()(a).call(a,(function(e){var t=e.toObject(),a=t.path,o=t.method,i=t.id,c="operations",s=i,u=n.isShown([c,s]);return D.a.createElement(Hn,{key:i,path:a,method:o,id:a+"-"+o,shown:u,showOpId:s,showOpIdPrefix:c,href:"#operation-".concat(s),onClick:r.show})})).toArray()))})).toArray(),o.size<1&&D.a.createElement("h3",null," No operations defined in spec! "))}}]),n}(D.a.Component),Hn=function(e){Ee()(n,e);var t=Se()(n);function n(e){var r,a;return T()(this,n),(a=t.call(this,e)).onClick=P()(r=a._onClick).call(r,ye()(a)),a}return R()(n,[{key:"_onClick",value:function(){var e=this.props,t=e.showOpId,n=e.showOpIdPrefix;(0,e.onClick)([n,t],!e.shown)}},{key:"render",value:function(){var e=this.props,t=e.id,n=e.method,r=e.shown,a=e.href;return D.a.createElement(zn,{href:a,onClick:this.onClick,className:"block opblock-link ".concat(r?"shown":"")},D.a.createElement("div",null,D.a.createElement("small",{className:"bold-label-".concat(n)},n.toUpperCase()),D.a.createElement("span",{className:"bold-label"},t)))}}]),n}(D.a.Component),$n=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"componentDidMount",value:function(){this.props.initialValue&&(this.inputRef.value=this.props.initialValue)}},{key:"render",value:function(){var e=this,t=this.props,n=(t.value,t.defaultValue,t.initialValue,Pn()(t,["value","defaultValue","initialValue"]));return D.a.createElement("input",An()({},n,{ref:function(t){return e.inputRef=t}}))}}]),n}(D.a.Component),Yn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.host,n=e.basePath;return D.a.createElement("pre",{className:"base-url"},"[ Base URL: ",t,n," ]")}}]),n}(D.a.Component),Kn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.data,n=e.getComponent,r=e.selectedServer,a=e.url,o=t.get("name")||"the developer",i=lt(t.get("url"),a,{selectedServer:r}),c=t.get("email"),s=n("Link");return D.a.createElement("div",{className:"info__contact"},i&&D.a.createElement("div",null,D.a.createElement(s,{href:Object($.G)(i),target:"_blank"},o," - Website")),c&&D.a.createElement(s,{href:Object($.G)("mailto:".concat(c))},i?"Send email to ".concat(o):"Contact ".concat(o)))}}]),n}(D.a.Component),Gn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.license,n=e.getComponent,r=e.selectedServer,a=e.url,o=n("Link"),i=t.get("name")||"License",c=lt(t.get("url"),a,{selectedServer:r});return D.a.createElement("div",{className:"info__license"},c?D.a.createElement(o,{target:"_blank",href:Object($.G)(c)},i):D.a.createElement("span",null,i))}}]),n}(D.a.Component),Zn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.url,n=(0,e.getComponent)("Link");return D.a.createElement(n,{target:"_blank",href:Object($.G)(t)},D.a.createElement("span",{className:"url"}," ",t))}}]),n}(D.a.PureComponent),Xn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.info,n=e.url,r=e.host,a=e.basePath,o=e.getComponent,i=e.externalDocs,c=e.selectedServer,s=e.url,u=t.get("version"),l=t.get("description"),p=t.get("title"),f=lt(t.get("termsOfService"),s,{selectedServer:c}),d=t.get("contact"),h=t.get("license"),m=lt(i&&i.get("url"),s,{selectedServer:c}),v=i&&i.get("description"),g=o("Markdown",!0),y=o("Link"),b=o("VersionStamp"),E=o("InfoUrl"),x=o("InfoBasePath");return D.a.createElement("div",{className:"info"},D.a.createElement("hgroup",{className:"main"},D.a.createElement("h2",{className:"title"},p,u&&D.a.createElement(b,{version:u})),r||a?D.a.createElement(x,{host:r,basePath:a}):null,n&&D.a.createElement(E,{getComponent:o,url:n})),D.a.createElement("div",{className:"description"},D.a.createElement(g,{source:l})),f&&D.a.createElement("div",{className:"info__tos"},D.a.createElement(y,{target:"_blank",href:Object($.G)(f)},"Terms of service")),d&&d.size?D.a.createElement(Kn,{getComponent:o,data:d,selectedServer:c,url:n}):null,h&&h.size?D.a.createElement(Gn,{getComponent:o,license:h,selectedServer:c,url:n}):null,i?D.a.createElement(y,{className:"info__extdocs",target:"_blank",href:Object($.G)(m)},v||m):null)}}]),n}(D.a.Component),Qn=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.specSelectors,n=e.getComponent,r=e.oas3Selectors,a=t.info(),o=t.url(),i=t.basePath(),c=t.host(),s=t.externalDocs(),u=r.selectedServer(),l=n("info");return D.a.createElement("div",null,a&&a.count()?D.a.createElement(l,{info:a,url:o,host:c,basePath:i,externalDocs:s,getComponent:n,selectedServer:u}):null)}}]),n}(D.a.Component),er=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){return null}}]),n}(D.a.Component),tr=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){return D.a.createElement("div",{className:"footer"})}}]),n}(D.a.Component),nr=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onFilterChange",(function(e){var t=e.target.value;r.props.layoutActions.updateFilter(t)})),r}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.specSelectors,n=e.layoutSelectors,r=(0,e.getComponent)("Col"),a="loading"===t.loadingStatus(),o="failed"===t.loadingStatus(),i=n.currentFilter(),c=["operation-filter-input"];return o&&c.push("failed"),a&&c.push("loading"),D.a.createElement("div",null,null===i||!1===i||"false"===i?null:D.a.createElement("div",{className:"filter-container"},D.a.createElement(r,{className:"filter wrapper",mobile:12},D.a.createElement("input",{className:c.join(" "),placeholder:"Filter by tag",type:"text",onChange:this.onFilterChange,value:!0===i||"true"===i?"":i,disabled:a}))))}}]),n}(D.a.Component),rr=Function.prototype,ar=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a;return T()(this,n),a=t.call(this,e,r),j()(ye()(a),"updateValues",(function(e){var t=e.param,n=e.isExecute,r=e.consumesValue,o=void 0===r?"":r,i=/xml/i.test(o),c=/json/i.test(o),s=i?t.get("value_xml"):t.get("value");if(void 0!==s){var u=!s&&c?"{}":s;a.setState({value:u}),a.onChange(u,{isXml:i,isEditBox:n})}else i?a.onChange(a.sample("xml"),{isXml:i,isEditBox:n}):a.onChange(a.sample(),{isEditBox:n})})),j()(ye()(a),"sample",(function(e){var t=a.props,n=t.param,r=(0,t.fn.inferSchema)(n.toJS());return Object($.o)(r,e,{includeWriteOnly:!0})})),j()(ye()(a),"onChange",(function(e,t){var n=t.isEditBox,r=t.isXml;a.setState({value:e,isEditBox:n}),a._onChange(e,r)})),j()(ye()(a),"_onChange",(function(e,t){(a.props.onChange||rr)(e,t)})),j()(ye()(a),"handleOnChange",(function(e){var t=a.props.consumesValue,n=/xml/i.test(t),r=e.target.value;a.onChange(r,{isXml:n})})),j()(ye()(a),"toggleIsEditBox",(function(){return a.setState((function(e){return{isEditBox:!e.isEditBox}}))})),a.state={isEditBox:!1,value:""},a}return R()(n,[{key:"componentDidMount",value:function(){this.updateValues.call(this,this.props)}},{key:"componentWillReceiveProps",value:function(e){this.updateValues.call(this,e)}},{key:"render",value:function(){var e=this.props,t=e.onChangeConsumes,r=e.param,a=e.isExecute,o=e.specSelectors,i=e.pathMethod,c=e.getConfigs,s=e.getComponent,u=s("Button"),l=s("TextArea"),p=s("highlightCode"),f=s("contentType"),d=(o?o.parameterWithMetaByIdentity(i,r):r).get("errors",Object(L.List)()),h=o.contentTypeValues(i).get("requestContentType"),m=this.props.consumes&&this.props.consumes.size?this.props.consumes:n.defaultProp.consumes,v=this.state,g=v.value,y=v.isEditBox;return D.a.createElement("div",{className:"body-param","data-param-name":r.get("name"),"data-param-in":r.get("in")},y&&a?D.a.createElement(l,{className:"body-param__text"+(d.count()?" invalid":""),value:g,onChange:this.handleOnChange}):g&&D.a.createElement(p,{className:"body-param__example",getConfigs:c,value:g}),D.a.createElement("div",{className:"body-param-options"},a?D.a.createElement("div",{className:"body-param-edit"},D.a.createElement(u,{className:y?"btn cancel body-param__example-edit":"btn edit body-param__example-edit",onClick:this.toggleIsEditBox},y?"Cancel":"Edit")):null,D.a.createElement("label",{htmlFor:""},D.a.createElement("span",null,"Parameter content type"),D.a.createElement(f,{value:h,contentTypes:m,onChange:t,className:"body-param-content-type"}))))}}]),n}(M.PureComponent);j()(ar,"defaultProp",{consumes:Object(L.fromJS)(["application/json"]),param:Object(L.fromJS)({}),onChange:rr,onChangeConsumes:rr});var or=n(71),ir=n.n(or),cr=n(45),sr=n.n(cr),ur=function(e){var t,n="_**[]";return ve()(e).call(e,n)<0?e:Tn()(t=e.split(n)[0]).call(t)};var lr=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.request,n=e.getConfigs,r=function(e){var t,n=[],r=!1,a=e.get("headers");if(n.push("curl"),e.get("curlOptions")&&n.push.apply(n,un()(e.get("curlOptions"))),n.push("-X",e.get("method")),n.push('"'.concat(e.get("url"),'"')),a&&a.size){var o,c,s=sr()(ir()(o=e.get("headers")).call(o));try{for(s.s();!(c=s.n()).done;){var u,l=c.value,p=bt()(l,2),f=p[0],d=p[1];n.push("-H "),n.push(h()(u='"'.concat(f,": ")).call(u,d.replace(/\$/g,"\\$"),'"')),r=r||/^content-type$/i.test(f)&&/^multipart\/form-data$/i.test(d)}}catch(e){s.e(e)}finally{s.f()}}if(e.get("body"))if(r&&Je()(t=["POST","PUT","PATCH"]).call(t,e.get("method"))){var m,v=sr()(e.get("body").entrySeq());try{for(v.s();!(m=v.n()).done;){var g,y,b,E=bt()(m.value,2),x=E[0],S=E[1],w=ur(x);n.push("-F"),S instanceof H.a.File?n.push(h()(g=h()(y='"'.concat(w,"=@")).call(y,S.name)).call(g,S.type?";type=".concat(S.type):"",'"')):n.push(h()(b='"'.concat(w,"=")).call(b,S,'"'))}}catch(e){v.e(e)}finally{v.f()}}else{n.push("-d");var j=e.get("body");if(L.Map.isMap(j)){var C,O=[],_=sr()(e.get("body").entrySeq());try{for(_.s();!(C=_.n()).done;){var A,k,P,I=bt()(C.value,2),T=I[0],N=I[1],R=ur(T);N instanceof H.a.File?O.push(h()(A=h()(k='"'.concat(R,'":{"name":"')).call(k,N.name,'"')).call(A,N.type?',"type":"'.concat(N.type,'"'):"","}")):O.push(h()(P='"'.concat(R,'":')).call(P,i()(N).replace(/\\n/g,"").replace("$","\\$")))}}catch(e){_.e(e)}finally{_.f()}n.push("{".concat(O.join(),"}"))}else n.push(i()(e.get("body")).replace(/\\n/g,"").replace(/\$/g,"\\$"))}else e.get("body")||"POST"!==e.get("method")||(n.push("-d"),n.push('""'));return n.join(" ")}(t),a=n(),o=Ut()(a,"syntaxHighlight.activated")?D.a.createElement(St.Light,{language:"bash",className:"curl microlight",onWheel:this.preventYScrollingBeyondElement,style:Lt(Ut()(a,"syntaxHighlight.theme"))},r):D.a.createElement("textarea",{readOnly:!0,className:"curl",value:r});return D.a.createElement("div",{className:"curl-command"},D.a.createElement("h4",null,"Curl"),D.a.createElement("div",{className:"copy-to-clipboard"},D.a.createElement(Ft.CopyToClipboard,{text:r},D.a.createElement("button",null))),D.a.createElement("div",null,o))}}]),n}(D.a.Component),pr=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onChange",(function(e){r.setScheme(e.target.value)})),j()(ye()(r),"setScheme",(function(e){var t=r.props,n=t.path,a=t.method;t.specActions.setScheme(e,n,a)})),r}return R()(n,[{key:"componentWillMount",value:function(){var e=this.props.schemes;this.setScheme(e.first())}},{key:"componentWillReceiveProps",value:function(e){var t;this.props.currentScheme&&Je()(t=e.schemes).call(t,this.props.currentScheme)||this.setScheme(e.schemes.first())}},{key:"render",value:function(){var e,t=this.props,n=t.schemes,r=t.currentScheme;return D.a.createElement("label",{htmlFor:"schemes"},D.a.createElement("span",{className:"schemes-title"},"Schemes"),D.a.createElement("select",{onChange:this.onChange,value:r},y()(e=n.valueSeq()).call(e,(function(e){return D.a.createElement("option",{value:e,key:e},e)})).toArray()))}}]),n}(D.a.Component),fr=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.specActions,n=e.specSelectors,r=e.getComponent,a=n.operationScheme(),o=n.schemes(),i=r("schemes");return o&&o.size?D.a.createElement(i,{currentScheme:a,schemes:o,specActions:t}):null}}]),n}(D.a.Component),dr=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a;T()(this,n),a=t.call(this,e,r),j()(ye()(a),"toggleCollapsed",(function(){a.props.onToggle&&a.props.onToggle(a.props.modelName,!a.state.expanded),a.setState({expanded:!a.state.expanded})})),j()(ye()(a),"onLoad",(function(e){if(e&&a.props.layoutSelectors){var t=a.props.layoutSelectors.getScrollToKey();B.a.is(t,a.props.specPath)&&a.toggleCollapsed(),a.props.layoutActions.readyToScroll(a.props.specPath,e.parentElement)}}));var o=a.props,i=o.expanded,c=o.collapsedContent;return a.state={expanded:i,collapsedContent:c||n.defaultProps.collapsedContent},a}return R()(n,[{key:"componentDidMount",value:function(){var e=this.props,t=e.hideSelfOnExpand,n=e.expanded,r=e.modelName;t&&n&&this.props.onToggle(r,n)}},{key:"componentWillReceiveProps",value:function(e){this.props.expanded!==e.expanded&&this.setState({expanded:e.expanded})}},{key:"render",value:function(){var e=this.props,t=e.title,n=e.classes;return this.state.expanded&&this.props.hideSelfOnExpand?D.a.createElement("span",{className:n||""},this.props.children):D.a.createElement("span",{className:n||"",ref:this.onLoad},t&&D.a.createElement("span",{onClick:this.toggleCollapsed,className:"pointer"},t),D.a.createElement("span",{onClick:this.toggleCollapsed,className:"pointer"},D.a.createElement("span",{className:"model-toggle"+(this.state.expanded?"":" collapsed")})),this.state.expanded?this.props.children:this.state.collapsedContent)}}]),n}(M.Component);j()(dr,"defaultProps",{collapsedContent:"{...}",expanded:!1,title:null,onToggle:function(){},hideSelfOnExpand:!1,specPath:B.a.List([])});var hr=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a;T()(this,n),a=t.call(this,e,r),j()(ye()(a),"activeTab",(function(e){var t=e.target.dataset.name;a.setState({activeTab:t})}));var o=a.props,i=o.getConfigs,c=o.isExecute,s=i().defaultModelRendering,u=s;return"example"!==s&&"model"!==s&&(u="example"),c&&(u="example"),a.state={activeTab:u},a}return R()(n,[{key:"componentWillReceiveProps",value:function(e){e.isExecute&&!this.props.isExecute&&this.props.example&&this.setState({activeTab:"example"})}},{key:"render",value:function(){var e=this.props,t=e.getComponent,n=e.specSelectors,r=e.schema,a=e.example,o=e.isExecute,i=e.getConfigs,c=e.specPath,s=e.includeReadOnly,u=e.includeWriteOnly,l=i().defaultModelExpandDepth,p=t("ModelWrapper"),f=t("highlightCode"),d=n.isOAS3();return D.a.createElement("div",{className:"model-example"},D.a.createElement("ul",{className:"tab"},D.a.createElement("li",{className:"tabitem"+("example"===this.state.activeTab?" active":"")},D.a.createElement("a",{className:"tablinks","data-name":"example",onClick:this.activeTab},o?"Edit Value":"Example Value")),r?D.a.createElement("li",{className:"tabitem"+("model"===this.state.activeTab?" active":"")},D.a.createElement("a",{className:"tablinks"+(o?" inactive":""),"data-name":"model",onClick:this.activeTab},d?"Schema":"Model")):null),D.a.createElement("div",null,"example"===this.state.activeTab?a||D.a.createElement(f,{value:"(no example available)",getConfigs:i}):null,"model"===this.state.activeTab&&D.a.createElement(p,{schema:r,getComponent:t,getConfigs:i,specSelectors:n,expandDepth:l,specPath:c,includeReadOnly:s,includeWriteOnly:u})))}}]),n}(D.a.Component),mr=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onToggle",(function(e,t){r.props.layoutActions&&r.props.layoutActions.show(r.props.fullPath,t)})),r}return R()(n,[{key:"render",value:function(){var e,t=this.props,n=t.getComponent,r=t.getConfigs,a=n("Model");return this.props.layoutSelectors&&(e=this.props.layoutSelectors.isShown(this.props.fullPath)),D.a.createElement("div",{className:"model-box"},D.a.createElement(a,An()({},this.props,{getConfigs:r,expanded:e,depth:1,onToggle:this.onToggle,expandDepth:this.props.expandDepth||0})))}}]),n}(M.Component),vr=n(166),gr=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"getSchemaBasePath",(function(){return r.props.specSelectors.isOAS3()?["components","schemas"]:["definitions"]})),j()(ye()(r),"getCollapsedContent",(function(){return" "})),j()(ye()(r),"handleToggle",(function(e,t){var n,a;(r.props.layoutActions.show(h()(n=[]).call(n,un()(r.getSchemaBasePath()),[e]),t),t)&&r.props.specActions.requestResolvedSubtree(h()(a=[]).call(a,un()(r.getSchemaBasePath()),[e]))})),j()(ye()(r),"onLoadModels",(function(e){e&&r.props.layoutActions.readyToScroll(r.getSchemaBasePath(),e)})),j()(ye()(r),"onLoadModel",(function(e){if(e){var t,n=e.getAttribute("data-name");r.props.layoutActions.readyToScroll(h()(t=[]).call(t,un()(r.getSchemaBasePath()),[n]),e)}})),r}return R()(n,[{key:"render",value:function(){var e,t=this,n=this.props,r=n.specSelectors,a=n.getComponent,o=n.layoutSelectors,i=n.layoutActions,c=n.getConfigs,s=r.definitions(),u=c(),l=u.docExpansion,p=u.defaultModelsExpandDepth;if(!s.size||p<0)return null;var f=this.getSchemaBasePath(),d=o.isShown(f,p>0&&"none"!==l),m=r.isOAS3(),v=a("ModelWrapper"),g=a("Collapse"),b=a("ModelCollapse"),E=a("JumpToPath");return D.a.createElement("section",{className:d?"models is-open":"models",ref:this.onLoadModels},D.a.createElement("h4",{onClick:function(){return i.show(f,!d)}},D.a.createElement("span",null,m?"Schemas":"Models"),D.a.createElement("svg",{width:"20",height:"20"},D.a.createElement("use",{xlinkHref:d?"#large-arrow-down":"#large-arrow"}))),D.a.createElement(g,{isOpened:d},y()(e=s.entrySeq()).call(e,(function(e){var n,s=bt()(e,1)[0],u=h()(n=[]).call(n,un()(f),[s]),l=B.a.List(u),d=r.specResolvedSubtree(u),m=r.specJson().getIn(u),g=L.Map.isMap(d)?d:B.a.Map(),y=L.Map.isMap(m)?m:B.a.Map(),x=g.get("title")||y.get("title")||s,S=o.isShown(u,!1);S&&0===g.size&&y.size>0&&t.props.specActions.requestResolvedSubtree(u);var w=D.a.createElement(v,{name:s,expandDepth:p,schema:g||B.a.Map(),displayName:x,fullPath:u,specPath:l,getComponent:a,specSelectors:r,getConfigs:c,layoutSelectors:o,layoutActions:i,includeReadOnly:!0,includeWriteOnly:!0}),j=D.a.createElement("span",{className:"model-box"},D.a.createElement("span",{className:"model model-title"},x));return D.a.createElement("div",{id:"model-".concat(s),className:"model-container",key:"models-section-".concat(s),"data-name":s,ref:t.onLoadModel},D.a.createElement("span",{className:"models-jump-to-path"},D.a.createElement(E,{specPath:l})),D.a.createElement(b,{classes:"model-box",collapsedContent:t.getCollapsedContent(s),onToggle:t.handleToggle,title:j,displayName:x,modelName:s,specPath:l,layoutSelectors:o,layoutActions:i,hideSelfOnExpand:!0,expanded:p>0&&S},w))})).toArray()))}}]),n}(M.Component),yr=function(e){var t=e.value,n=(0,e.getComponent)("ModelCollapse"),r=D.a.createElement("span",null,"Array [ ",t.count()," ]");return D.a.createElement("span",{className:"prop-enum"},"Enum:",D.a.createElement("br",null),D.a.createElement(n,{collapsedContent:r},"[ ",t.join(", ")," ]"))},br=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e,t,n,r,a=this.props,o=a.schema,c=a.name,s=a.displayName,u=a.isRef,l=a.getComponent,p=a.getConfigs,d=a.depth,m=a.onToggle,v=a.expanded,g=a.specPath,b=Pn()(a,["schema","name","displayName","isRef","getComponent","getConfigs","depth","onToggle","expanded","specPath"]),E=b.specSelectors,x=b.expandDepth,S=b.includeReadOnly,w=b.includeWriteOnly,j=E.isOAS3;if(!o)return null;var C=p().showExtensions,_=o.get("description"),A=o.get("properties"),k=o.get("additionalProperties"),P=o.get("title")||s||c,I=o.get("required"),T=f()(o).call(o,(function(e,t){var n;return-1!==ve()(n=["maxProperties","minProperties","nullable","example"]).call(n,t)})),N=o.get("deprecated"),R=l("JumpToPath",!0),M=l("Markdown",!0),q=l("Model"),B=l("ModelCollapse"),U=l("Property"),V=function(){return D.a.createElement("span",{className:"model-jump-to-path"},D.a.createElement(R,{specPath:g}))},z=D.a.createElement("span",null,D.a.createElement("span",null,"{"),"...",D.a.createElement("span",null,"}"),u?D.a.createElement(V,null):""),F=E.isOAS3()?o.get("anyOf"):null,J=E.isOAS3()?o.get("oneOf"):null,W=E.isOAS3()?o.get("not"):null,H=P&&D.a.createElement("span",{className:"model-title"},u&&o.get("$$ref")&&D.a.createElement("span",{className:"model-hint"},o.get("$$ref")),D.a.createElement("span",{className:"model-title__text"},P));return D.a.createElement("span",{className:"model"},D.a.createElement(B,{modelName:c,title:H,onToggle:m,expanded:!!v||d<=x,collapsedContent:z},D.a.createElement("span",{className:"brace-open object"},"{"),u?D.a.createElement(V,null):null,D.a.createElement("span",{className:"inner-object"},D.a.createElement("table",{className:"model"},D.a.createElement("tbody",null,_?D.a.createElement("tr",{className:"description"},D.a.createElement("td",null,"description:"),D.a.createElement("td",null,D.a.createElement(M,{source:_}))):null,N?D.a.createElement("tr",{className:"property"},D.a.createElement("td",null,"deprecated:"),D.a.createElement("td",null,"true")):null,A&&A.size?y()(e=f()(t=A.entrySeq()).call(t,(function(e){var t=bt()(e,2)[1];return(!t.get("readOnly")||S)&&(!t.get("writeOnly")||w)}))).call(e,(function(e){var t,n,r=bt()(e,2),a=r[0],o=r[1],i=j()&&o.get("deprecated"),s=L.List.isList(I)&&I.contains(a),u=["property-row"];return i&&u.push("deprecated"),s&&u.push("required"),D.a.createElement("tr",{key:a,className:u.join(" ")},D.a.createElement("td",null,a,s&&D.a.createElement("span",{className:"star"},"*")),D.a.createElement("td",null,D.a.createElement(q,An()({key:h()(t=h()(n="object-".concat(c,"-")).call(n,a,"_")).call(t,o)},b,{required:s,getComponent:l,specPath:g.push("properties",a),getConfigs:p,schema:o,depth:d+1}))))})).toArray():null,C?D.a.createElement("tr",null,D.a.createElement("td",null," ")):null,C?y()(n=o.entrySeq()).call(n,(function(e){var t=bt()(e,2),n=t[0],r=t[1];if("x-"===O()(n).call(n,0,2)){var a=r?r.toJS?r.toJS():r:null;return D.a.createElement("tr",{key:n,className:"extension"},D.a.createElement("td",null,n),D.a.createElement("td",null,i()(a)))}})).toArray():null,k&&k.size?D.a.createElement("tr",null,D.a.createElement("td",null,"< * >:"),D.a.createElement("td",null,D.a.createElement(q,An()({},b,{required:!1,getComponent:l,specPath:g.push("additionalProperties"),getConfigs:p,schema:k,depth:d+1})))):null,F?D.a.createElement("tr",null,D.a.createElement("td",null,"anyOf ->"),D.a.createElement("td",null,y()(F).call(F,(function(e,t){return D.a.createElement("div",{key:t},D.a.createElement(q,An()({},b,{required:!1,getComponent:l,specPath:g.push("anyOf",t),getConfigs:p,schema:e,depth:d+1})))})))):null,J?D.a.createElement("tr",null,D.a.createElement("td",null,"oneOf ->"),D.a.createElement("td",null,y()(J).call(J,(function(e,t){return D.a.createElement("div",{key:t},D.a.createElement(q,An()({},b,{required:!1,getComponent:l,specPath:g.push("oneOf",t),getConfigs:p,schema:e,depth:d+1})))})))):null,W?D.a.createElement("tr",null,D.a.createElement("td",null,"not ->"),D.a.createElement("td",null,D.a.createElement("div",null,D.a.createElement(q,An()({},b,{required:!1,getComponent:l,specPath:g.push("not"),getConfigs:p,schema:W,depth:d+1}))))):null))),D.a.createElement("span",{className:"brace-close"},"}")),T.size?y()(r=T.entrySeq()).call(r,(function(e){var t,n=bt()(e,2),r=n[0],a=n[1];return D.a.createElement(U,{key:h()(t="".concat(r,"-")).call(t,a),propKey:r,propVal:a,propClass:"property"})})):null)}}]),n}(M.Component),Er=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e,t=this.props,n=t.getComponent,r=t.getConfigs,a=t.schema,o=t.depth,i=t.expandDepth,c=t.name,s=t.displayName,u=t.specPath,l=a.get("description"),p=a.get("items"),d=a.get("title")||s||c,m=f()(a).call(a,(function(e,t){var n;return-1===ve()(n=["type","items","description","$$ref"]).call(n,t)})),v=n("Markdown",!0),g=n("ModelCollapse"),b=n("Model"),E=n("Property"),x=d&&D.a.createElement("span",{className:"model-title"},D.a.createElement("span",{className:"model-title__text"},d));return D.a.createElement("span",{className:"model"},D.a.createElement(g,{title:x,expanded:o<=i,collapsedContent:"[...]"},"[",m.size?y()(e=m.entrySeq()).call(e,(function(e){var t,n=bt()(e,2),r=n[0],a=n[1];return D.a.createElement(E,{key:h()(t="".concat(r,"-")).call(t,a),propKey:r,propVal:a,propClass:"property"})})):null,l?D.a.createElement(v,{source:l}):m.size?D.a.createElement("div",{className:"markdown"}):null,D.a.createElement("span",null,D.a.createElement(b,An()({},this.props,{getConfigs:r,specPath:u.push("items"),name:null,schema:p,required:!1,depth:o+1}))),"]"))}}]),n}(M.Component),xr="property primitive",Sr=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e,t,n,r=this.props,a=r.schema,o=r.getComponent,i=r.getConfigs,c=r.name,s=r.displayName,u=r.depth,l=i().showExtensions;if(!a||!a.get)return D.a.createElement("div",null);var p=a.get("type"),d=a.get("format"),m=a.get("xml"),v=a.get("enum"),g=a.get("title")||s||c,b=a.get("description"),E=Object($.m)(a),x=f()(a).call(a,(function(e,t){var n;return-1===ve()(n=["enum","type","format","description","$$ref"]).call(n,t)})).filterNot((function(e,t){return E.has(t)})),S=o("Markdown",!0),w=o("EnumModel"),j=o("Property");return D.a.createElement("span",{className:"model"},D.a.createElement("span",{className:"prop"},c&&D.a.createElement("span",{className:"".concat(1===u&&"model-title"," prop-name")},g),D.a.createElement("span",{className:"prop-type"},p),d&&D.a.createElement("span",{className:"prop-format"},"($",d,")"),x.size?y()(e=x.entrySeq()).call(e,(function(e){var t,n=bt()(e,2),r=n[0],a=n[1];return D.a.createElement(j,{key:h()(t="".concat(r,"-")).call(t,a),propKey:r,propVal:a,propClass:xr})})):null,l&&E.size?y()(t=E.entrySeq()).call(t,(function(e){var t,n=bt()(e,2),r=n[0],a=n[1];return D.a.createElement(j,{key:h()(t="".concat(r,"-")).call(t,a),propKey:r,propVal:a,propClass:xr})})):null,b?D.a.createElement(S,{source:b}):null,m&&m.size?D.a.createElement("span",null,D.a.createElement("br",null),D.a.createElement("span",{className:xr},"xml:"),y()(n=m.entrySeq()).call(n,(function(e){var t,n=bt()(e,2),r=n[0],a=n[1];return D.a.createElement("span",{key:h()(t="".concat(r,"-")).call(t,a),className:xr},D.a.createElement("br",null),"   ",r,": ",String(a))})).toArray()):null,v&&D.a.createElement(w,{value:v,getComponent:o})))}}]),n}(M.Component),wr=function(e){var t=e.propKey,n=e.propVal,r=e.propClass;return D.a.createElement("span",{className:r},D.a.createElement("br",null),t,": ",String(n))},jr=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.onTryoutClick,n=e.onCancelClick,r=e.enabled;return D.a.createElement("div",{className:"try-out"},r?D.a.createElement("button",{className:"btn try-out__btn cancel",onClick:n},"Cancel"):D.a.createElement("button",{className:"btn try-out__btn",onClick:t},"Try it out "))}}]),n}(D.a.Component);j()(jr,"defaultProps",{onTryoutClick:Function.prototype,onCancelClick:Function.prototype,enabled:!1});var Cr=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.bypass,n=e.isSwagger2,r=e.isOAS3,a=e.alsoShow;return t?D.a.createElement("div",null,this.props.children):n&&r?D.a.createElement("div",{className:"version-pragma"},a,D.a.createElement("div",{className:"version-pragma__message version-pragma__message--ambiguous"},D.a.createElement("div",null,D.a.createElement("h3",null,"Unable to render this definition"),D.a.createElement("p",null,D.a.createElement("code",null,"swagger")," and ",D.a.createElement("code",null,"openapi")," fields cannot be present in the same Swagger or OpenAPI definition. Please remove one of the fields."),D.a.createElement("p",null,"Supported version fields are ",D.a.createElement("code",null,"swagger: ",'"2.0"')," and those that match ",D.a.createElement("code",null,"openapi: 3.0.n")," (for example, ",D.a.createElement("code",null,"openapi: 3.0.0"),").")))):n||r?D.a.createElement("div",null,this.props.children):D.a.createElement("div",{className:"version-pragma"},a,D.a.createElement("div",{className:"version-pragma__message version-pragma__message--missing"},D.a.createElement("div",null,D.a.createElement("h3",null,"Unable to render this definition"),D.a.createElement("p",null,"The provided definition does not specify a valid version field."),D.a.createElement("p",null,"Please indicate a valid Swagger or OpenAPI version field. Supported version fields are ",D.a.createElement("code",null,"swagger: ",'"2.0"')," and those that match ",D.a.createElement("code",null,"openapi: 3.0.n")," (for example, ",D.a.createElement("code",null,"openapi: 3.0.0"),")."))))}}]),n}(D.a.PureComponent);j()(Cr,"defaultProps",{alsoShow:null,children:null,bypass:!1});var Or=function(e){var t=e.version;return D.a.createElement("small",null,D.a.createElement("pre",{className:"version"}," ",t," "))},_r=function(e){var t=e.enabled,n=e.path,r=e.text;return D.a.createElement("a",{className:"nostyle",onClick:t?function(e){return e.preventDefault()}:null,href:t?"#/".concat(n):null},D.a.createElement("span",null,r))},Ar=function(){return D.a.createElement("div",null,D.a.createElement("svg",{xmlns:"http://www.w3.org/2000/svg",xmlnsXlink:"http://www.w3.org/1999/xlink",className:"svg-assets"},D.a.createElement("defs",null,D.a.createElement("symbol",{viewBox:"0 0 20 20",id:"unlocked"},D.a.createElement("path",{d:"M15.8 8H14V5.6C14 2.703 12.665 1 10 1 7.334 1 6 2.703 6 5.6V6h2v-.801C8 3.754 8.797 3 10 3c1.203 0 2 .754 2 2.199V8H4c-.553 0-1 .646-1 1.199V17c0 .549.428 1.139.951 1.307l1.197.387C5.672 18.861 6.55 19 7.1 19h5.8c.549 0 1.428-.139 1.951-.307l1.196-.387c.524-.167.953-.757.953-1.306V9.199C17 8.646 16.352 8 15.8 8z"})),D.a.createElement("symbol",{viewBox:"0 0 20 20",id:"locked"},D.a.createElement("path",{d:"M15.8 8H14V5.6C14 2.703 12.665 1 10 1 7.334 1 6 2.703 6 5.6V8H4c-.553 0-1 .646-1 1.199V17c0 .549.428 1.139.951 1.307l1.197.387C5.672 18.861 6.55 19 7.1 19h5.8c.549 0 1.428-.139 1.951-.307l1.196-.387c.524-.167.953-.757.953-1.306V9.199C17 8.646 16.352 8 15.8 8zM12 8H8V5.199C8 3.754 8.797 3 10 3c1.203 0 2 .754 2 2.199V8z"})),D.a.createElement("symbol",{viewBox:"0 0 20 20",id:"close"},D.a.createElement("path",{d:"M14.348 14.849c-.469.469-1.229.469-1.697 0L10 11.819l-2.651 3.029c-.469.469-1.229.469-1.697 0-.469-.469-.469-1.229 0-1.697l2.758-3.15-2.759-3.152c-.469-.469-.469-1.228 0-1.697.469-.469 1.228-.469 1.697 0L10 8.183l2.651-3.031c.469-.469 1.228-.469 1.697 0 .469.469.469 1.229 0 1.697l-2.758 3.152 2.758 3.15c.469.469.469 1.229 0 1.698z"})),D.a.createElement("symbol",{viewBox:"0 0 20 20",id:"large-arrow"},D.a.createElement("path",{d:"M13.25 10L6.109 2.58c-.268-.27-.268-.707 0-.979.268-.27.701-.27.969 0l7.83 7.908c.268.271.268.709 0 .979l-7.83 7.908c-.268.271-.701.27-.969 0-.268-.269-.268-.707 0-.979L13.25 10z"})),D.a.createElement("symbol",{viewBox:"0 0 20 20",id:"large-arrow-down"},D.a.createElement("path",{d:"M17.418 6.109c.272-.268.709-.268.979 0s.271.701 0 .969l-7.908 7.83c-.27.268-.707.268-.979 0l-7.908-7.83c-.27-.268-.27-.701 0-.969.271-.268.709-.268.979 0L10 13.25l7.418-7.141z"})),D.a.createElement("symbol",{viewBox:"0 0 24 24",id:"jump-to"},D.a.createElement("path",{d:"M19 7v4H5.83l3.58-3.59L8 6l-6 6 6 6 1.41-1.41L5.83 13H21V7z"})),D.a.createElement("symbol",{viewBox:"0 0 24 24",id:"expand"},D.a.createElement("path",{d:"M10 18h4v-2h-4v2zM3 6v2h18V6H3zm3 7h12v-2H6v2z"})))))},kr=n(168),Pr=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.errSelectors,n=e.specSelectors,r=e.getComponent,a=r("SvgAssets"),o=r("InfoContainer",!0),i=r("VersionPragmaFilter"),c=r("operations",!0),s=r("Models",!0),u=r("Row"),l=r("Col"),p=r("errors",!0),f=r("ServersContainer",!0),d=r("SchemesContainer",!0),h=r("AuthorizeBtnContainer",!0),m=r("FilterContainer",!0),v=n.isSwagger2(),g=n.isOAS3(),y=!n.specStr(),b=n.loadingStatus(),E=null;if("loading"===b&&(E=D.a.createElement("div",{className:"info"},D.a.createElement("div",{className:"loading-container"},D.a.createElement("div",{className:"loading"})))),"failed"===b&&(E=D.a.createElement("div",{className:"info"},D.a.createElement("div",{className:"loading-container"},D.a.createElement("h4",{className:"title"},"Failed to load API definition."),D.a.createElement(p,null)))),"failedConfig"===b){var x=t.lastError(),S=x?x.get("message"):"";E=D.a.createElement("div",{className:"info failed-config"},D.a.createElement("div",{className:"loading-container"},D.a.createElement("h4",{className:"title"},"Failed to load remote configuration."),D.a.createElement("p",null,S)))}if(!E&&y&&(E=D.a.createElement("h4",null,"No API definition provided.")),E)return D.a.createElement("div",{className:"swagger-ui"},D.a.createElement("div",{className:"loading-container"},E));var w=n.servers(),j=n.schemes(),C=w&&w.size,O=j&&j.size,_=!!n.securityDefinitions();return D.a.createElement("div",{className:"swagger-ui"},D.a.createElement(a,null),D.a.createElement(i,{isSwagger2:v,isOAS3:g,alsoShow:D.a.createElement(p,null)},D.a.createElement(p,null),D.a.createElement(u,{className:"information-container"},D.a.createElement(l,{mobile:12},D.a.createElement(o,null))),C||O||_?D.a.createElement("div",{className:"scheme-container"},D.a.createElement(l,{className:"schemes wrapper",mobile:12},C?D.a.createElement(f,null):null,O?D.a.createElement(d,null):null,_?D.a.createElement(h,null):null)):null,D.a.createElement(m,null),D.a.createElement(u,null,D.a.createElement(l,{mobile:12,desktop:12},D.a.createElement(c,null))),D.a.createElement(u,null,D.a.createElement(l,{mobile:12,desktop:12},D.a.createElement(s,null)))))}}]),n}(D.a.Component),Ir=n(275),Tr=n.n(Ir),Nr={value:"",onChange:function(){},schema:{},keyName:"",required:!1,errors:Object(L.List)()},Rr=function(e){Ee()(n,e);var t=Se()(n);function n(){return T()(this,n),t.apply(this,arguments)}return R()(n,[{key:"componentDidMount",value:function(){var e=this.props,t=e.dispatchInitialValue,n=e.value,r=e.onChange;t&&r(n)}},{key:"render",value:function(){var e,t=this.props,n=t.schema,r=t.errors,a=t.value,o=t.onChange,i=t.getComponent,c=t.fn,s=t.disabled,u=n&&n.get?n.get("format"):null,l=n&&n.get?n.get("type"):null,p=function(e){return i(e,!1,{failSilently:!0})},f=l?p(u?h()(e="JsonSchema_".concat(l,"_")).call(e,u):"JsonSchema_".concat(l)):i("JsonSchema_string");return f||(f=i("JsonSchema_string")),D.a.createElement(f,An()({},this.props,{errors:r,fn:c,getComponent:i,value:a,onChange:o,schema:n,disabled:s}))}}]),n}(M.Component);j()(Rr,"defaultProps",Nr);var Mr=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onChange",(function(e){var t=r.props.schema&&"file"===r.props.schema.get("type")?e.target.files[0]:e.target.value;r.props.onChange(t,r.props.keyName)})),j()(ye()(r),"onEnumChange",(function(e){return r.props.onChange(e)})),r}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.getComponent,n=e.value,r=e.schema,a=e.errors,o=e.required,i=e.description,c=e.disabled,s=r&&r.get?r.get("enum"):null,u=r&&r.get?r.get("format"):null,l=r&&r.get?r.get("type"):null,p=r&&r.get?r.get("in"):null;if(n||(n=""),a=a.toJS?a.toJS():[],s){var f=t("Select");return D.a.createElement(f,{className:a.length?"invalid":"",title:a.length?a:"",allowedValues:s,value:n,allowEmptyValue:!o,disabled:c,onChange:this.onEnumChange})}var d=c||p&&"formData"===p&&!("FormData"in window),h=t("Input");return l&&"file"===l?D.a.createElement(h,{type:"file",className:a.length?"invalid":"",title:a.length?a:"",onChange:this.onChange,disabled:d}):D.a.createElement(Tr.a,{type:u&&"password"===u?"password":"text",className:a.length?"invalid":"",title:a.length?a:"",value:n,minLength:0,debounceTimeout:350,placeholder:i,onChange:this.onChange,disabled:d})}}]),n}(M.Component);j()(Mr,"defaultProps",Nr);var Dr=function(e){Ee()(n,e);var t=Se()(n);function n(e,r){var a;return T()(this,n),a=t.call(this,e,r),j()(ye()(a),"onChange",(function(){a.props.onChange(a.state.value)})),j()(ye()(a),"onItemChange",(function(e,t){a.setState((function(n){return{value:n.value.set(t,e)}}),a.onChange)})),j()(ye()(a),"removeItem",(function(e){a.setState((function(t){return{value:t.value.delete(e)}}),a.onChange)})),j()(ye()(a),"addItem",(function(){var e=Vr(a.state.value);a.setState((function(){return{value:e.push(Object($.o)(a.state.schema.get("items"),!1,{includeWriteOnly:!0}))}}),a.onChange)})),j()(ye()(a),"onEnumChange",(function(e){a.setState((function(){return{value:e}}),a.onChange)})),a.state={value:Vr(e.value),schema:e.schema},a}return R()(n,[{key:"componentWillReceiveProps",value:function(e){e.value!==this.state.value&&this.setState({value:e.value}),e.schema!==this.state.schema&&this.setState({schema:e.schema})}},{key:"render",value:function(){var e=this,t=this.props,n=t.getComponent,r=t.required,a=t.schema,o=t.errors,i=t.fn,c=t.disabled;o=o.toJS?o.toJS():[];var s,u,l=this.state.value,p=!!(l&&l.count&&l.count()>0),d=a.getIn(["items","enum"]),m=a.getIn(["items","type"]),v=a.getIn(["items","format"]),g=a.getIn(["items","schema"]),b=!1,E="file"===m||"string"===m&&"binary"===v;m&&v?s=n(h()(u="JsonSchema_".concat(m,"_")).call(u,v)):"boolean"!==m&&"array"!==m&&"object"!==m||(s=n("JsonSchema_".concat(m)));if(s||E||(b=!0),d){var x=n("Select");return D.a.createElement(x,{className:o.length?"invalid":"",title:o.length?o:"",multiple:!0,value:l,disabled:c,allowedValues:d,allowEmptyValue:!r,onChange:this.onEnumChange})}var S=n("Button");return D.a.createElement("div",{className:"json-schema-array"},p?y()(l).call(l,(function(t,r){if(o.length){var a=f()(o).call(o,(function(e){return e.index===r}));a.length&&(o=[a[0].error+r])}return D.a.createElement("div",{key:r,className:"json-schema-form-item"},E?D.a.createElement(Lr,{value:t,onChange:function(t){return e.onItemChange(t,r)},disabled:c,errors:o,getComponent:n}):b?D.a.createElement(qr,{value:t,onChange:function(t){return e.onItemChange(t,r)},disabled:c,errors:o}):D.a.createElement(s,An()({},e.props,{value:t,onChange:function(t){return e.onItemChange(t,r)},disabled:c,errors:o,schema:g,getComponent:n,fn:i})),c?null:D.a.createElement(S,{className:"btn btn-sm json-schema-form-item-remove",onClick:function(){return e.removeItem(r)}}," - "))})):null,c?null:D.a.createElement(S,{className:"btn btn-sm json-schema-form-item-add ".concat(o.length?"invalid":null),onClick:this.addItem},"Add item"))}}]),n}(M.PureComponent);j()(Dr,"defaultProps",Nr);var qr=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onChange",(function(e){var t=e.target.value;r.props.onChange(t,r.props.keyName)})),r}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.value,n=e.errors,r=e.description,a=e.disabled;return t||(t=""),n=n.toJS?n.toJS():[],D.a.createElement(Tr.a,{type:"text",className:n.length?"invalid":"",title:n.length?n:"",value:t,minLength:0,debounceTimeout:350,placeholder:r,onChange:this.onChange,disabled:a})}}]),n}(M.Component);j()(qr,"defaultProps",Nr);var Lr=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onFileChange",(function(e){var t=e.target.files[0];r.props.onChange(t,r.props.keyName)})),r}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.getComponent,n=e.errors,r=e.disabled,a=t("Input"),o=r||!("FormData"in window);return D.a.createElement(a,{type:"file",className:n.length?"invalid":"",title:n.length?n:"",onChange:this.onFileChange,disabled:o})}}]),n}(M.Component);j()(Lr,"defaultProps",Nr);var Br=function(e){Ee()(n,e);var t=Se()(n);function n(){var e,r;T()(this,n);for(var a=arguments.length,o=new Array(a),i=0;i<a;i++)o[i]=arguments[i];return r=t.call.apply(t,h()(e=[this]).call(e,o)),j()(ye()(r),"onEnumChange",(function(e){return r.props.onChange(e)})),r}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.getComponent,n=e.value,r=e.errors,a=e.schema,o=e.required,i=e.disabled;r=r.toJS?r.toJS():[];var c=a&&a.get?a.get("enum"):null,s=!c||!o,u=!c&&Object(L.fromJS)(["true","false"]),l=t("Select");return D.a.createElement(l,{className:r.length?"invalid":"",title:r.length?r:"",value:String(n),disabled:i,allowedValues:c||u,allowEmptyValue:s,onChange:this.onEnumChange})}}]),n}(M.Component);j()(Br,"defaultProps",Nr);var Ur=function(e){Ee()(n,e);var t=Se()(n);function n(){var e;return T()(this,n),e=t.call(this),j()(ye()(e),"onChange",(function(t){e.props.onChange(t)})),j()(ye()(e),"handleOnChange",(function(t){var n=t.target.value;e.onChange(n)})),e}return R()(n,[{key:"render",value:function(){var e=this.props,t=e.getComponent,n=e.value,r=e.errors,a=e.disabled,o=t("TextArea");return D.a.createElement("div",null,D.a.createElement(o,{className:Zt()({invalid:r.size}),title:r.size?r.join(", "):"",value:Object($.J)(n),disabled:a,onChange:this.handleOnChange}))}}]),n}(M.PureComponent);function Vr(e){return L.List.isList(e)?e:Object(L.List)()}j()(Ur,"defaultProps",Nr);var zr=function(){var e={components:{App:Ce,authorizationPopup:Oe,authorizeBtn:_e,AuthorizeBtnContainer:Ae,authorizeOperationBtn:ke,auths:Pe,AuthItem:Ie,authError:Te,oauth2:Ze,apiKeyAuth:Ne,basicAuth:Re,clear:Xe,liveResponse:tt,InitializedInput:$n,info:Xn,InfoContainer:Qn,JumpToPath:er,onlineValidatorBadge:nt.a,operations:ot,operation:ft,OperationSummary:mt,OperationSummaryMethod:vt,OperationSummaryPath:gt,highlightCode:Jt,responses:Wt,response:Xt,ResponseExtension:Qt,responseBody:cn,parameters:ln,parameterRow:mn,execute:En,headers:xn,errors:Sn,contentType:On,overview:Wn,footer:tr,FilterContainer:nr,ParamBody:ar,curl:lr,schemes:pr,SchemesContainer:fr,modelExample:hr,ModelWrapper:mr,ModelCollapse:dr,Model:vr.a,Models:gr,EnumModel:yr,ObjectModel:br,ArrayModel:Er,PrimitiveModel:Sr,Property:wr,TryItOutButton:jr,Markdown:kr.a,BaseLayout:Pr,VersionPragmaFilter:Cr,VersionStamp:Or,OperationExt:Et,OperationExtRow:xt,ParameterExt:pn,ParameterIncludeEmpty:dn,OperationTag:pt,OperationContainer:je,DeepLink:_r,InfoUrl:Zn,InfoBasePath:Yn,SvgAssets:Ar,Example:Me,ExamplesSelect:Le,ExamplesSelectValueRetainer:ze}},t={components:r},n={components:a};return[pe.default,ue.default,ie.default,ae.default,re.default,te.default,ne.default,oe.default,e,t,ce.default,n,se.default,le.default,fe.default,de.default,he.default]},Fr=n(240);function Jr(){return[zr,Fr.default]}var Wr=n(262);var Hr=!0,$r="g248cf86",Yr="3.36.0",Kr="ip-172-31-21-173",Gr="Thu, 22 Oct 2020 17:41:07 GMT";function Zr(e){var t;H.a.versions=H.a.versions||{},H.a.versions.swaggerUi={version:Yr,gitRevision:$r,gitDirty:Hr,buildTimestamp:Gr,machine:Kr};var n={dom_id:null,domNode:null,spec:{},url:"",urls:null,layout:"BaseLayout",docExpansion:"list",maxDisplayedTags:null,filter:null,validatorUrl:"https://validator.swagger.io/validator",oauth2RedirectUrl:h()(t="".concat(window.location.protocol,"//")).call(t,window.location.host,"/oauth2-redirect.html"),persistAuthorization:!1,configs:{},custom:{},displayOperationId:!1,displayRequestDuration:!1,deepLinking:!1,requestInterceptor:function(e){return e},responseInterceptor:function(e){return e},showMutatedRequest:!0,defaultModelRendering:"example",defaultModelExpandDepth:1,defaultModelsExpandDepth:1,showExtensions:!1,showCommonExtensions:!1,withCredentials:void 0,supportedSubmitMethods:["get","put","post","delete","options","head","patch","trace"],presets:[Jr],plugins:[],initialState:{},fn:{},components:{},syntaxHighlight:{activated:!0,theme:"agate"}},r=Object($.D)(),a=e.domNode;delete e.domNode;var o=v()({},n,e,r),c={system:{configs:o.configs},plugins:o.presets,state:v()({layout:{layout:o.layout,filter:f()(o)},spec:{spec:"",url:o.url}},o.initialState)};if(o.initialState)for(var u in o.initialState)o.initialState.hasOwnProperty(u)&&void 0===o.initialState[u]&&delete c.state[u];var p=new K(c);p.register([o.plugins,function(){return{fn:o.fn,components:o.components,state:o.state}}]);var d=p.getSystem(),m=function(e){var t=d.specSelectors.getLocalConfig?d.specSelectors.getLocalConfig():{},n=v()({},t,o,e||{},r);if(a&&(n.domNode=a),p.setConfigs(n),d.configsActions.loaded(),null!==e&&(!r.url&&"object"===l()(n.spec)&&s()(n.spec).length?(d.specActions.updateUrl(""),d.specActions.updateLoadingStatus("success"),d.specActions.updateSpec(i()(n.spec))):d.specActions.download&&n.url&&!n.urls&&(d.specActions.updateUrl(n.url),d.specActions.download(n.url))),n.domNode)d.render(n.domNode,"App");else if(n.dom_id){var c=document.querySelector(n.dom_id);d.render(c,"App")}else null===n.dom_id||null===n.domNode||console.error("Skipped rendering: no `dom_id` or `domNode` was specified");return d},g=r.config||o.configUrl;return g&&d.specActions&&d.specActions.getConfigByUrl?(d.specActions.getConfigByUrl({url:g,loadRemoteConfig:!0,requestInterceptor:o.requestInterceptor,responseInterceptor:o.responseInterceptor},m),d):m()}Zr.presets={apis:Jr},Zr.plugins=Wr.default;t.default=Zr}]).default;
+//# sourceMappingURL=swagger-ui-es-bundle-core.js.map
\ No newline at end of file